@@ -0,0 +1,188 @@
+#!/usr/bin/python -B
+
+# Regeneration benchmark
+#
+# Times a full Export.py run into a temporary directory, and each
+# generator within it using Export.py --profile.  The output is
+# checked to be byte-identical to the checked-in sources, and the
+# timings are compared with a baseline saved by an earlier run.
+#
+#   python scripts/Benchmark.py --save          # record a baseline
+#   python scripts/Benchmark.py                 # compare with it
+
+from optparse import OptionParser
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+scripts = os.path.dirname(os.path.abspath(__file__))
+root    = os.path.dirname(scripts)
+
+exportArgs = [ '--api', 'gl', '4.4', '--api', 'wgl', '4.4', '--api', 'glx', '4.4', '--api', 'cgl', '1.4', '--api', 'egl', '1.0' ]
+
+# Generated files, relative to <outdir>
+
+outputDirs = [ 'src', 'include', 'tests' ]
+
+def outputFiles(outdir):
+
+  files = []
+  for i in outputDirs:
+    for path, dirs, names in os.walk(os.path.join(outdir, i)):
+      files.extend([ os.path.relpath(os.path.join(path, j), outdir) for j in names ])
+  return sorted(files)
+
+# Run Export.py into <outdir>, returning the wall time and the profile.
+#
+# Export.py runs in <outdir> with --outdir . so that the autogenerated
+# message matches that of the checked-in sources.
+
+def export(python, outdir, jobs):
+
+  profile = os.path.join(outdir, 'profile.json')
+  args = [ python, '-B', os.path.join(scripts, 'Export.py') ] + exportArgs + [ '--outdir', '.', '--profile', profile ]
+  if jobs:
+    args += [ '-j', str(jobs) ]
+
+  log = open(os.path.join(outdir, 'export.log'), 'w')
+  start = time.time()
+  status = subprocess.call(args, cwd = outdir, stdout = log, stderr = subprocess.STDOUT)
+  wall = time.time() - start
+  log.close()
+
+  if status:
+    print 'Export.py failed, see %s' % os.path.join(outdir, 'export.log')
+    sys.exit(status)
+
+  f = open(profile, 'r')
+  generators = json.load(f)['generators']
+  f.close()
+
+  return wall, generators
+
+# Files of <outdir> that differ from, or are missing in <root>
+
+def compareOutputs(outdir):
+
+  differ = []
+  for i in outputFiles(outdir):
+    try:
+      f = open(os.path.join(outdir, i), 'rb')
+      output = f.read()
+      f.close()
+      f = open(os.path.join(root, i), 'rb')
+      golden = f.read()
+      f.close()
+      if output != golden:
+        differ.append(i)
+    except IOError:
+      differ.append(i)
+  return differ
+
+# Best of <repeat> runs, for the total and each generator
+
+def benchmark(python, repeat, jobs, keep):
+
+  results = { 'total' : None, 'generators' : {}, 'peakRSS' : None, 'bytes' : 0, 'jobs' : jobs }
+  differ = []
+
+  for run in range(repeat):
+
+    outdir = tempfile.mkdtemp('', 'regal-benchmark-')
+    try:
+      wall, generators = export(python, outdir, jobs)
+
+      if results['total'] is None or wall < results['total']:
+        results['total'] = wall
+
+      for i in generators:
+        best = results['generators'].get(i['name'])
+        if best is None or i['time'] < best:
+          results['generators'][i['name']] = i['time']
+        results['peakRSS'] = max(results['peakRSS'], i['peakRSS'])
+
+      results['bytes'] = sum([ i['bytes'] for i in generators ])
+
+      if run == 0:
+        differ = compareOutputs(outdir)
+
+    finally:
+      if keep:
+        print 'Output kept: %s' % outdir
+      else:
+        shutil.rmtree(outdir, True)
+
+  return results, differ
+
+def delta(current, baseline):
+
+  if current is None or baseline is None:
+    return '%8s %7s' % ('', '')
+  return '%+8.3f %+6.1f%%' % (current - baseline, baseline and 100.0*(current - baseline)/baseline or 0.0)
+
+def time3(t):
+  if t is None:
+    return '%8s' % '-'
+  return '%8.3f' % t
+
+def report(results, baseline):
+
+  generators = results['generators']
+  before     = baseline and baseline['generators'] or {}
+  names      = sorted(set(generators.keys() + before.keys()), key = lambda i : -generators.get(i, 0))
+
+  print '%-32s %8s %8s %8s %7s' % ('Generator', 'Baseline', 'Time', 'Delta', '')
+  for i in names:
+    print '%-32s %s %s %s' % (i, time3(before.get(i)), time3(generators.get(i)), delta(generators.get(i), before.get(i)))
+  print '%-32s %s %s %s' % ('Export.py', time3(baseline and baseline['total']), time3(results['total']), delta(results['total'], baseline and baseline['total']))
+  print
+  if baseline and baseline.get('jobs') != results['jobs']:
+    print 'Note: baseline was run with -j %s' % baseline.get('jobs')
+  print 'Peak RSS: %s KB' % results['peakRSS']
+  print 'Output:   %d bytes' % results['bytes']
+
+if __name__ == '__main__':
+
+  parser = OptionParser('usage: %prog [options]')
+  parser.add_option('-n', '--repeat',   dest = 'repeat',   metavar = 'N',    type = 'int',         help = 'best of N runs')
+  parser.add_option('-j', '--jobs',     dest = 'jobs',     metavar = 'N',    type = 'int',         help = 'run N generators in parallel')
+  parser.add_option(      '--baseline', dest = 'baseline', metavar = 'FILE',                       help = 'baseline timings, default tmp/benchmark.json')
+  parser.add_option(      '--save',     dest = 'save',     action = 'store_true',                  help = 'save timings as the baseline')
+  parser.add_option(      '--keep',     dest = 'keep',     action = 'store_true',                  help = 'keep the output directory')
+  parser.add_option(      '--python',   dest = 'python',   metavar = 'PATH',                       help = 'python interpreter for Export.py')
+  parser.set_defaults(repeat = 1, jobs = 0, baseline = os.path.join(root, 'tmp', 'benchmark.json'), python = sys.executable)
+  (options, args) = parser.parse_args()
+
+  results, differ = benchmark(options.python, max(options.repeat, 1), options.jobs, options.keep)
+
+  baseline = None
+  try:
+    f = open(options.baseline, 'r')
+    baseline = json.load(f)
+    f.close()
+  except (IOError, ValueError):
+    pass
+
+  report(results, baseline)
+
+  if options.save:
+    if not os.path.exists(os.path.dirname(options.baseline)):
+      os.makedirs(os.path.dirname(options.baseline))
+    f = open(options.baseline, 'w')
+    json.dump(results, f, indent = 2, sort_keys = True)
+    f.close()
+    print 'Baseline saved: %s' % options.baseline
+
+  # Output must match the checked-in sources
+
+  if len(differ):
+    print
+    for i in differ:
+      print 'Output differs: %s' % i
+    sys.exit(1)
+
+  print 'Output matches: %s' % ', '.join(outputDirs)
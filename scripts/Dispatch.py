@@ -3,7 +3,8 @@
 import re
 from string import Template
 from string import join
-from copy import deepcopy
+
+from Emu import formulaeMatch, argSubstitutions
 
 #
 # Apply per-section substitutions
@@ -37,51 +38,15 @@ def dispatchGenCode(func, formulae):
 
   name = func.name
 
-  # list of function parameter names
-
-  arglist = [ i.name.strip() for i in func.parameters ]
-
-  # arg is a mapping from arg0 to function parameter name...
-
-  arg = {}
-  for i in range(len(arglist)):
-    arg['arg%d' % i] = arglist[i]
-
-  # ... and mappings from arg0plus to lists of function parameters
-
-  for i in range(0,5):
-    label = 'arg%dplus' % i;
-    if len(arglist) > 0 :
-      arg[label] = ', '.join(arglist)
-      arglist.pop(0)
-    else :
-      arg[label] = ''
-
-  # Iterate over the formulae
-  #
-  # k is the key
-  # i is the formula
-
-  for k,i in formulae.iteritems():
-
-    # Cache the compiled regular expressions, as needed
-
-    if 'entries_re' not in i:
-      i['entries_re'] = [ re.compile( '^%s$' % j ) for j in i['entries'] ]
-
-  # A list of matches containing (match object, formula name, formula)
   # Look for matches, ideally only one
 
-  m = [ [j.match(name),k,i] for k,i in formulae.iteritems() for j in i['entries_re'] ]
-  m = [ j for j in m if j[0] ]
-
-  assert len(m)<=1, 'Ambiguous match (%s) for %s - giving up.'%(', '.join([j[1] for j in m]),name)
+  m = formulaeMatch(name, formulae)
 
   if len(m):
     match   = m[0][0]
     formula = m[0][2]
     code = { 'name' : name }
-    subs = deepcopy(arg)
+    subs = argSubstitutions(func)
     for l in range( len(match.groups()) + 1):
       subs['m%d' % l] = match.group( l )
     subs['name'] = name
@@ -95,24 +95,126 @@ def addSubstitution(name, formula, subs):
   r = Template( r ).substitute( s )
   subs[newdef]= r
 
+#
+# Literal prefix of an entry regular expression
+#
+# Any name matched by the entry must start with the prefix.
+# Top-level alternation means there is no common prefix.
+#
+
+def entryPrefix(entry):
+
+  depth = 0
+  escape = False
+  charset = False
+  for i in entry:
+    if escape:
+      escape = False
+    elif i=='\\':
+      escape = True
+    elif charset:
+      charset = i!=']'
+    elif i=='[':
+      charset = True
+    elif i=='(':
+      depth += 1
+    elif i==')':
+      depth -= 1
+    elif i=='|' and depth==0:
+      return ''
+
+  prefix = ''
+  for i in entry:
+    if i in '.^$*+?{}[]\\|()':
+      if i in '*?{':
+        prefix = prefix[:-1]
+      break
+    prefix += i
+  return prefix
+
+#
+# Index of the entries of a set of formulae, by literal prefix
+#
+#   keys     - formula names, to detect changes to the formulae
+#   lengths  - distinct prefix lengths, longest first
+#   prefixes - mapping from prefix to a list of (order, compiled regex, formula name, formula)
+#   matches  - memoized mapping from function name to matches
+#
+
+class FormulaeIndex:
+
+  def __init__(self, formulae):
+
+    self.keys     = formulae.keys()
+    self.prefixes = {}
+    self.matches  = {}
+
+    order = 0
+    for k,i in formulae.iteritems():
+
+      # Cache the compiled regular expressions, as needed
+
+      if 'entries_re' not in i:
+        i['entries_re'] = [ re.compile( '^%s$' % j ) for j in i['entries'] ]
+
+      for j in range(len(i['entries'])):
+        prefix = entryPrefix(i['entries'][j])
+        self.prefixes.setdefault(prefix, []).append((order, i['entries_re'][j], k, i))
+        order += 1
+
+    self.lengths = sorted(set([ len(j) for j in self.prefixes ]), reverse = True)
+
+  # A list of matches containing (match object, formula name, formula)
+  # in the same order as a scan over all formulae and entries
+
+  def match(self, name):
+
+    if name not in self.matches:
+      candidates = []
+      for l in self.lengths:
+        if l<=len(name):
+          candidates.extend(self.prefixes.get(name[:l], []))
+      m = [ (j[0], j[1].match(name), j[2], j[3]) for j in candidates ]
+      self.matches[name] = [ j[1:] for j in sorted(m) if j[1] ]
+
+    return self.matches[name]
+
+formulaeIndices = {}
+
+#
+# Look up the formulae matching an entry point name
 #
 # Inputs:
 #
-#   func        - Api function to match
-#   emuFormulae - Emulation formulae (list?)
-#   member      - Name of the RegalContext member to check for not-NULL
+#   name     - entry point name
+#   formulae - formulae dictionary
 #
 # Output:
 #
-#   A dictionary of stuff, the "emue"
-#   { 'name' : name, 'member' : member, 'impl' : { ... }, ... }
+#   A list of matches containing (match object, formula name, formula)
+#
 
-def emuFindEntry(func, emuFormulae, member, ifdef = None):
+def formulaeMatch(name, formulae):
 
-  if emuFormulae==None:
-    return None
+  index = formulaeIndices.get(id(formulae))
+  if index==None or index[0] is not formulae or index[1].keys!=formulae.keys():
+    index = (formulae, FormulaeIndex(formulae))
+    formulaeIndices[id(formulae)] = index
 
-  name = func.name
+  m = index[1].match(name)
+
+  assert len(m)<=1, 'Ambiguous match (%s) for %s - giving up.'%(', '.join([j[1] for j in m]),name)
+
+  return m
+
+#
+# Function parameter substitutions
+#
+# arg0, arg1, ... map to function parameter names
+# arg0plus, arg1plus, ... map to lists of function parameters
+#
+
+def argSubstitutions(func):
 
   # list of function parameter names
 
@@ -134,25 +236,30 @@ def emuFindEntry(func, emuFormulae, member, ifdef = None):
     else :
       arg[label] = ''
 
-  # Iterator over the formulae
-  #
-  # k is the key
-  # i is the formula
+  return arg
 
-  for k,i in emuFormulae.iteritems():
+#
+# Inputs:
+#
+#   func        - Api function to match
+#   emuFormulae - Emulation formulae (list?)
+#   member      - Name of the RegalContext member to check for not-NULL
+#
+# Output:
+#
+#   A dictionary of stuff, the "emue"
+#   { 'name' : name, 'member' : member, 'impl' : { ... }, ... }
 
-    # Cache the compiled regular expressions, as needed
+def emuFindEntry(func, emuFormulae, member, ifdef = None):
 
-    if 'entries_re' not in i:
-      i['entries_re'] = [ re.compile( '^%s$' % j ) for j in i['entries'] ]
+  if emuFormulae==None:
+    return None
 
-  # A list of matches containing (match object, formula name, formula)
-  # Look for matches, ideally only one
+  name = func.name
 
-  m = [ [j.match(name),k,i] for k,i in emuFormulae.iteritems() for j in i['entries_re'] ]
-  m = [ j for j in m if j[0] ]
+  # Look for matches, ideally only one
 
-  assert len(m)<=1, 'Ambiguous match (%s) for %s - giving up.'%(', '.join([j[1] for j in m]),name)
+  m = formulaeMatch(name, emuFormulae)
 
   if len(m):
     match   = m[0][0]
@@ -162,7 +269,7 @@ def emuFindEntry(func, emuFormulae, member, ifdef = None):
     if not typeIsVoid(rType):
       dummyRetVal = '(( %s )0)' % rType
     emue = { 'name' : name, 'member' : member, 'ifdef' : ifdef, 'dummyretval' : dummyRetVal }
-    subs = deepcopy(arg)
+    subs = argSubstitutions(func)
     for l in range( len(match.groups()) + 1):
       subs['m%d' % l] = match.group( l )
     subs['name'] = name
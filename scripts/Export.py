@@ -9,7 +9,9 @@
 
 from string import Template, upper, replace
 from optparse import OptionParser
-from copy import deepcopy
+from functools import partial
+from multiprocessing import Pool
+import glob
 import os
 import re
 
@@ -18,6 +20,14 @@ scripts = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, scripts+'/api')
 sys.path.insert(0, scripts+'/regal')
 
+import ApiUtil
+import ApiManifest
+import ApiProfile
+import ApiSubset
+
+from ApiIndex import ApiIndex
+from Emu      import emuFindEntry
+
 from ApiUtil import validVersion
 from ApiUtil import outputCode
 from ApiUtil import importAttr
@@ -53,6 +63,7 @@ from RegalDispatchStatistics import *
 from RegalDispatchStaticEGL  import *
 from RegalDispatchStaticES2  import *
 from RegalDispatchTrace      import *
+from RegalDispatchShared     import dispatchLayers
 
 regalLicense = '''
 /*
@@ -132,6 +143,20 @@ def cmpCategoryName(a,b):
   if b.category.startswith('CGL_VERSION'):                                          return 1
   return cmp(a.category,b.category)
 
+# Names the emulation formulae of <api> refer to, which may be
+# other functions, such as gl${m1}Program${m2}Parameter${m3}NV
+
+def emuReferences(api):
+
+  names = set()
+  for function in api.functions:
+    for i in emu + emuRegal:
+      e = emuFindEntry(function, i['formulae'], i['member'])
+      if e:
+        for j in e.values():
+          names.update(ApiSubset.identifiers(j))
+  return names
+
 def traverse(apis, args):
 
     for i in range( len( emu ) ) :
@@ -181,6 +206,23 @@ def traverse(apis, args):
         for function in toRemove:
           api.functions.remove(function)
 
+        # Derived values common to the generators
+
+        for function in api.functions:
+            function.view = FunctionView(function)
+
+        # Prune to the --subset, if any, then keep whatever the
+        # emulation formulae of the remaining functions refer to
+
+        subset = getattr(args, 'subset', None)
+        ApiSubset.apiSubset(api, subset)
+        while subset and api.name in subset.versions:
+          references = emuReferences(api) - subset.references
+          if not len(references):
+            break
+          subset.references.update(references)
+          ApiSubset.apiSubset(api, subset)
+
         # In the database, typedefs can be disabled one-by-one
 
         toRemove = set()
@@ -202,50 +244,133 @@ def traverse(apis, args):
         api.defaults['HDC']   = 'NULL';
         api.defaults['HGLRC'] = 'NULL';
 
+        # Reverse indexes for the generators
+
+        api.index = ApiIndex(api)
+
     traverseContextInfo(apis,args)
 
+# Generators run after traverse(), each writing its own output file(s).
+#
+# They only read the traversed database, so they may run in any order,
+# or concurrently via --jobs.
+
+additionalExports = ['RegalSetErrorCallback', 'RegalShareContext', 'RegalMakeCurrent', 'RegalDestroyContext']
+
+generators = [
+  generateLoaderSource,
+  generateMissingSource,
+  generateContextHeader,
+  generateContextSource,
+  generateContextInfoHeader,
+  generateContextInfoSource,
+  generateEmuInfoHeader,
+  generateEmuInfoSource,
+  generateDispatchGLX,
+  generateTraceSource,
+  generatePublicHeader,
+  generatePluginSource,
+  generateDispatchStatistics,
+  generateStatisticsHeader,
+  generateStatisticsSource,
+  generateSource,
+  generateSystemHeader,
+  generateEmuSource,
+  generateDispatchLog,
+  generateDispatchHttp,
+  generateDispatchCode,
+  generateErrorSource,
+  generateDebugSource,
+  generatePpapiSource,
+  generateStaticES2Source,
+  generateStaticEGLSource,
+  generateDispatchHeader,
+  generateLookupSource,
+  generateLookupHeader,
+  generateTokenSource,
+  generateTokenHeader,
+  generateEnumHeader,
+  generateGMockHeader,
+  generateGmockSource,
+  partial(generateDefFile, additional_exports = additionalExports),
+]
+
+# Run a generator, returning the list of files it output
+# and the profiling statistics, if any
+
+def runGenerator(generator, apis, args):
+  del ApiUtil.outputFiles[:]
+  ApiProfile.begin(ApiManifest.generatorName(generator))
+  generator(apis, args)
+  return list(ApiUtil.outputFiles), ApiProfile.end()
+
+# Worker state for parallel generation, inherited by the forked pool
+
+jobGenerators = None
+jobApis       = None
+jobArgs       = None
+
+def generateJob(index):
+  results = runGenerator(jobGenerators[index], jobApis, jobArgs)
+  sys.stdout.flush()
+  return results
+
+def generateParallel(todo, apis, args, jobs):
+
+  global jobGenerators, jobApis, jobArgs
+  jobGenerators = todo
+  jobApis       = apis
+  jobArgs       = args
+
+  pool = Pool(jobs)
+  try:
+    return pool.map(generateJob, range(len(todo)), 1)
+  finally:
+    pool.close()
+    pool.join()
+
 def generate(apis, args):
 
+  # With a manifest, only run the generators with modified inputs or outputs
+
+  manifest = getattr(args, 'manifest', None)
+
+  todo = generators
+  if manifest:
+    todo = [ i for i in generators if manifest.stale(i) ]
+    for i in generators:
+      if i not in todo:
+        print 'Generator skipped: %s' % ApiManifest.generatorName(i)
+
+  if not len(todo):
+    return
+
+  ApiProfile.begin('traverse')
   traverse(apis, args)
-  generateLoaderSource( apis, args )
-  generateMissingSource( apis, args )
-  generateContextHeader(apis, args)
-  generateContextSource(apis, args)
-  generateContextInfoHeader(apis, args)
-  generateContextInfoSource(apis, args)
-  generateEmuInfoHeader(apis, args)
-  generateEmuInfoSource(apis, args)
-  generateDispatchGLX(apis, args)
-  generateTraceSource( apis, args )
-  generatePublicHeader(apis, args)
-  generatePluginSource(apis,args)
-  generateDispatchStatistics( apis, args )
-  generateStatisticsHeader(apis, args)
-  generateStatisticsSource(apis, args)
-  generateSource(apis, args)
-  generateSystemHeader(apis, args)
-  generateEmuSource( apis, args )
-  generateDispatchLog( apis, args )
-  generateDispatchHttp( apis, args )
-  generateDispatchCode( apis, args )
-  generateErrorSource( apis, args )
-  generateDebugSource( apis, args )
-  generatePpapiSource( apis, args )
-  generateStaticES2Source( apis, args )
-  generateStaticEGLSource( apis, args )
-  generateDispatchHeader(apis, args)
-  generateLookupSource(apis, args)
-  generateLookupHeader(apis, args)
-  generateTokenSource(apis, args)
-  generateTokenHeader(apis, args)
-  generateEnumHeader(apis, args)
-
-  generateGMockHeader(apis, args)
-  generateGmockSource(apis, args)
-
-  additional_exports = ['RegalSetErrorCallback', 'RegalShareContext', 'RegalMakeCurrent', 'RegalDestroyContext']
-
-  generateDefFile( apis, args, additional_exports)
+  profile = [ ApiProfile.end() ]
+
+  if ApiProfile.enabled:
+    ApiProfile.countFunctions(apis)
+
+  # The traversed database is shared with the workers by fork(),
+  # fall back to serial generation where that is not available.
+
+  jobs = getattr(args, 'jobs', 1)
+  if jobs>1 and len(todo)>1 and hasattr(os, 'fork'):
+    results = generateParallel(todo, apis, args, jobs)
+  else:
+    results = [ runGenerator(i, apis, args) for i in todo ]
+
+  outputs = [ i[0] for i in results ]
+  profile.extend([ i[1] for i in results ])
+
+  if ApiProfile.enabled:
+    ApiProfile.report(profile, args.profile)
+
+  if manifest:
+    for i in range(len(todo)):
+      manifest.update(*manifest.entry(todo[i], outputs[i]))
+    manifest.save()
 
 ##############################################################################################
 
@@ -256,7 +381,14 @@ def main():
     parser.add_option('-a', '--api',       dest = 'apis',      metavar = 'API VERSION', action = 'append', nargs = 2, help = 'generate loader for API and VERSION')
     parser.add_option('-c', '--copyright', dest = 'copyright',                          action = 'store_true',        help = 'include copyright notice')
     parser.add_option(      '--outdir',    dest = 'outdir',    metavar = 'DIR',                                       help = 'output directory')
-    parser.set_defaults(apis = [])
+    parser.add_option('-j', '--jobs',      dest = 'jobs',      metavar = 'N',           type = 'int',                 help = 'run N generators in parallel')
+    parser.add_option(      '--manifest',  dest = 'manifest',  metavar = 'FILE',                                      help = 'skip generators with inputs unchanged since FILE was written')
+    parser.add_option(      '--check-filters', dest = 'checkFilters',                   action = 'store_true',        help = 'check single-pass output filter against separate passes')
+    parser.add_option(      '--profile',   dest = 'profile',   metavar = 'FILE',                                      help = 'report time, memory and output of each generator, as JSON to FILE')
+    parser.add_option(      '--subset',    dest = 'subset',    metavar = 'FILE',                                      help = 'generate only the versions and extensions listed in FILE')
+    parser.add_option(      '--shards',    dest = 'shards',    metavar = 'N',           type = 'int',                 help = 'split Regal.cpp and each dispatch layer into N source files')
+    parser.add_option(      '--layers',    dest = 'layers',    metavar = 'LIST',                                      help = 'dispatch layers compiled in, such as emu,driver')
+    parser.set_defaults(apis = [], jobs = 1, shards = 1)
     (options, args) = parser.parse_args()
 
     if not len(options.apis):
@@ -265,16 +397,29 @@ def main():
     if not options.outdir:
       parser.error('Specify output directory.\n  See Export.py --help')
 
+    layers = None
+    if options.layers:
+      layers = [ i.strip() for i in options.layers.split(',') if len(i.strip()) ]
+      for i in layers:
+        if i not in [ j[0] for j in dispatchLayers ]:
+          parser.error('Unknown layer: %s\n  Expecting %s' % (i, ', '.join([ j[0] for j in dispatchLayers ])))
+
+    ApiUtil.checkFilters = options.checkFilters
+    ApiProfile.enabled   = bool(options.profile)
+
     apis = []
+    databases = set()
     for apiItem in options.apis:
 
       # Some fakery for gles - use the gl database
 
       if apiItem[0]=='gles':
-        api = deepcopy(importAttr('gl'))
+        api = importAttr('gl')
         api.name = 'gles'
+        databases.add('gl')
       else:
         api = importAttr(apiItem[0])
+        databases.add(apiItem[0])
 
       api.version = float(apiItem[1])
       api.name = '%s' % apiItem[0]
@@ -287,17 +432,48 @@ def main():
     if options.copyright:
       genArgs.copyright = copyrightMessage
 
+    genArgs.jobs      = options.jobs
+    genArgs.profile   = options.profile
+    genArgs.shards    = max(options.shards, 1)
+    genArgs.layers    = layers
+    genArgs.subset    = None
     genArgs.license   = regalLicense
     genArgs.generated = autoGeneratedMessage
     genArgs.srcdir    = options.outdir + '/src/regal'
     genArgs.testdir   = options.outdir + '/tests'
     genArgs.incdir    = options.outdir + '/include/GL'
 
+    # Keep whatever the hand-written sources and the formulae
+    # refer to by name, when generating a subset
+
+    handWritten = []
+    if options.subset:
+      root = os.path.dirname(scripts)
+      for i in [ 'src/regal/*.h', 'src/regal/*.cpp', 'src/regal/*.inl', 'tests/*.h', 'tests/*.cpp', 'scripts/*.py', 'scripts/regal/*.py' ]:
+        handWritten.extend([ j for j in sorted(glob.glob(os.path.join(root, i))) if not ApiSubset.generated(j) ])
+      try:
+        genArgs.subset = ApiSubset.readSubset(options.subset)
+      except (IOError, ValueError), e:
+        parser.error(str(e))
+      genArgs.subset.references = ApiSubset.references(handWritten)
+
     for path in (genArgs.incdir, genArgs.srcdir):
       if not os.path.exists(path):
         os.makedirs(path)
         print 'Directory created: %s' % path
 
+    # Every generator depends on the database and on traverse()
+
+    genArgs.manifest = None
+    if options.manifest:
+      common = set([ os.path.abspath(__file__) ] + handWritten)
+      for i in list(databases) + [ 'ApiIndex' ]:
+        common.update(ApiManifest.moduleDepends(i))
+      extra  = [ genArgs.generated, genArgs.copyright, genArgs.license, 'shards %d' % genArgs.shards, 'layers %s' % layers ]
+      if options.subset:
+        common.add(os.path.abspath(options.subset))
+      genArgs.manifest = ApiManifest.Manifest(options.manifest, common, extra)
+
     generate(apis, genArgs)
 
 if __name__ == '__main__':
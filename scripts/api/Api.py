@@ -33,7 +33,14 @@ class Api:
     else:
       raise TypeError, 'Unsupported Api type'
 
-class Extension:
+# The database classes declare their attributes via __slots__, for
+# compactness and so that a misspelled attribute in the database is
+# an error rather than silently ignored.  Optional attributes are
+# declared but not initialised, use getattr with a default to read.
+
+class Extension(object):
+
+  __slots__ = [ 'name', 'url', 'category', 'functions', 'enumerants', 'emulatedBy', 'emulatedIf' ]
 
   def __init__(self, name = '', url = ''):
 
@@ -45,7 +52,16 @@ class Extension:
     self.emulatedBy = ''        # Regal emulation layer that adds support for this extension
     self.emulatedIf = ''        # optional condition determing if extension can be emulated
 
-class Function:
+class Function(object):
+
+  __slots__ = [ 'name', 'ret', 'parameters', 'version', 'extension', 'deprecated', 'category', 'public', 'trace', 'play',
+                # Optional
+                'regal',              # Include in Regal
+                'regalOnly',          # Regal-specific, not dispatched to the driver
+                'regalRemap',         # Call this function instead, in the driver
+                'esVersions',         # ES versions providing this function
+                # Set by Export.py
+                'loadFunction', 'loadGetProcAddress', 'loadFuncPtrDeclare', 'loadFuncPtrLoad', 'needsContext', 'view' ]
 
   def __init__(self, name = ''):
 
@@ -67,7 +83,12 @@ class Function:
     else:
       raise TypeError, 'Invalid Parameter type'
 
-class Typedef:
+class Typedef(object):
+
+  __slots__ = [ 'name', 'type', 'function', 'parameters', 'version', 'extension', 'deprecated', 'category',
+                # Optional
+                'regal',              # Include in Regal
+                'default' ]           # Default value, e.g. 0
 
   def __init__(self, name = '', type = ''):
 
@@ -87,7 +108,9 @@ class Typedef:
     else:
       raise TypeError, 'Invalid Parameter type'
 
-class Return:
+class Return(object):
+
+  __slots__ = [ 'name', 'type', 'default', 'cast', 'binary', 'size', 'maxSize', 'intercept', 'trace', 'play', 'filter', 'regalLog' ]
 
   def __init__(self, type = '', default = '', cast = None, binary = False, size = None, maxSize = None, intercept = None, trace = True, play = True, filter = None, regalLog = None):
 
@@ -103,7 +126,11 @@ class Return:
     self.filter    = filter         # Filtering function
     self.regalLog  = None           # Function for Regal logging purposes
 
-class Parameter:
+class Parameter(object):
+
+  __slots__ = [ 'name', 'type', 'default', 'cast', 'binary', 'size', 'maxSize', 'input', 'output', 'trace', 'play', 'filter', 'regalLog',
+                # Optional, see Input, Output and InputOutput
+                'lookup', 'intercept' ]
 
   def __init__(self, name = '', type = '', default = '', cast = None, binary = False, size = None, maxSize = None, trace = True, play = True, filter = None, regalLog = None):
 
@@ -147,7 +174,11 @@ def InputOutput(name = '', type = '', default = '', cast = None, binary = False,
   parameter.intercept = None        # Intercept the value
   return parameter
 
-class Enum:
+class Enum(object):
+
+  __slots__ = [ 'name', 'enumerants', 'version', 'extension', 'deprecated', 'category', 'default',
+                # Set by Export.py
+                'enumerantsByName' ]
 
   def __init__(self, name = ''):
 
@@ -166,7 +197,17 @@ class Enum:
     else:
       raise TypeError, 'Invalid Enumerant type'
 
-class Enumerant:
+class Enumerant(object):
+
+  __slots__ = [ 'name', 'value', 'version', 'extension', 'deprecated', 'category', 'group', 'alias', 'public',
+                # Optional
+                'gles',
+                'esVersions',         # ES versions providing this enumerant
+                'enableCap',          # glEnable/glDisable capability
+                'bindTexture',        # glBindTexture target
+                'texImage',           # glTexImage target
+                'internalformat',     # Texture internal format
+                'gluErrorString' ]    # gluErrorString message
 
   def __init__(self, name = '', value = '', category = '', group = []):
 
@@ -7,6 +7,8 @@
 import re
 import sys
 
+from collections import deque
+
 # Expand tab characters into spaces
 
 def expandtabs(code, tabsize = 2):
@@ -140,3 +142,150 @@ def foldRedundantCase(code):
     else:
       i = i + 1
   return '\n'.join(tmp) + '\n'
+
+# The filters above, in order, each as a separate pass
+
+def filterPasses(code):
+  code = expandtabs(code)
+  code = trim(code)
+  code = foldIfs(code)
+  code = foldPreprocessorIfs(code)
+  code = foldEmptyLines(code)
+  code = foldImpossibleBreak(code)
+  code = foldImpossibleReturn(code)
+  code = foldRedundantCase(code)
+  return code
+
+# Streaming equivalents of the filters above
+#
+# Each stage is a generator over lines, so the whole pipeline
+# is a single pass with a small lookahead window, rather than
+# splitting and joining the code for each filter.  Lines are
+# passed along as (line, stripped line) pairs.
+
+class Lookahead:
+
+  def __init__(self, lines):
+    self.lines = iter(lines)
+    self.window = deque()
+
+  # Ensure there are at least n lines in the window, if possible
+
+  def fill(self, n):
+    while len(self.window)<n:
+      try:
+        self.window.append(self.lines.next())
+      except StopIteration:
+        return False
+    return True
+
+def streamTrim(lines, tabsize = 2):
+  for i in lines:
+    i = i.expandtabs(tabsize).rstrip()
+    yield i, i.lstrip()
+
+def streamFoldIfs(lines):
+  la = Lookahead(lines)
+  w = la.window
+  while w or la.fill(1):
+    if w[0][1].startswith('if ('):
+      indent = w[0][0].find('if (')
+      j = 2
+      while la.fill(j+1) and w[j][0]==w[0][0]:
+        j = j + 2
+      if j>2:
+        la.fill(j)
+        c = [ ('%s{'%(' '*indent), '{') ]
+        c.extend([ w[k] for k in range(1,j,2) ])
+        c.append(('%s}'%(' '*indent), '}'))
+        line = w[0]
+        for k in range(j):
+          w.popleft()
+        w.extendleft(reversed(c))
+        yield line
+        continue
+    yield w.popleft()
+
+def streamFoldPreprocessorIfs(lines):
+  pending = []
+  for i in lines:
+    if len(pending) and i[1].startswith('#endif'):
+      pending.pop()
+      continue
+    if i[1].startswith('#if'):
+      pending.append(i)
+      continue
+    for j in pending:
+      yield j
+    pending = []
+    yield i
+  for j in pending:
+    yield j
+
+# foldEmptyLines, foldImpossibleBreak and foldImpossibleReturn
+
+def streamFoldLines(lines):
+  empty = False
+  breakPrev = False
+  returnPrev = False
+  for i in lines:
+    if len(i[1])==0:
+      if empty:
+        continue
+      empty = True
+    else:
+      empty = False
+    if breakPrev and i[1]=='break;':
+      continue
+    breakPrev = i[1].startswith('return')
+    if returnPrev and i[1]=='return;':
+      continue
+    returnPrev = breakPrev
+    yield i
+
+def isCase(line):
+  return line[1].startswith('case ') and line[1].endswith(':')
+
+def streamFoldRedundantCase(lines):
+  la = Lookahead(lines)
+  w = la.window
+  first = True
+  while len(w)>=2 or la.fill(2):
+    if not isCase(w[0]) and not w[0][1].startswith('default:'):
+      yield w.popleft()
+      first = False
+      continue
+    j = 0
+    while la.fill(j+2) and isCase(w[j]):
+      j = j + 1
+    if la.fill(j+2) and w[j][1].startswith('default:'):
+
+      # As for foldRedundantCase, a leading default
+      # deletes all but the last line
+
+      if first and j==0:
+        while la.fill(len(w)+1):
+          pass
+        yield w[-1]
+        return
+
+      for k in range(j-1):
+        w.popleft()
+      la.fill(j+1)
+      for k in range(min(j+1,len(w))):
+        yield w.popleft()
+    else:
+      yield w.popleft()
+    first = False
+  while len(w):
+    yield w.popleft()
+
+# All of the filters, in a single pass
+
+def filterCode(code):
+  lines = streamTrim(code.splitlines())
+  lines = streamFoldIfs(lines)
+  lines = streamFoldPreprocessorIfs(lines)
+  lines = streamFoldLines(lines)
+  lines = streamFoldRedundantCase(lines)
+  return '\n'.join([ i[0] for i in lines ]) + '\n'
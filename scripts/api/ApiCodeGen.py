@@ -11,19 +11,35 @@ from inspect import isfunction
 from ApiUtil import validVersion
 from ApiUtil import maxLength
 
+from ApiHash import perfectHash, nameHash
+
 def pathBasename(path):
 
   # When gmake on Cygwin is used with Cygwin python, the path contains '\'
   return os.path.basename(os.sep.join(path.split('\\')))
 
+# Options that do not affect the generated code, omitted from the message
+
+argsNoOutput      = ['-j', '--jobs', '--manifest', '--profile']
+argsNoOutputFlags = ['--check-filters']
+
 def autoGeneratedCode(argv):
 
   argIsFile = False
+  argIsSkipped = False
   message = pathBasename(argv[0])
   for i in range(1, len(argv)):
     if argIsFile:
       message += ' ' + pathBasename(argv[i])
       argIsFile = False
+    elif argIsSkipped:
+      argIsSkipped = False
+    elif argv[i] in argsNoOutputFlags:
+      continue
+    elif argv[i] in argsNoOutput:
+      argIsSkipped = True
+    elif argv[i].split('=')[0] in argsNoOutput or argv[i][:2] in argsNoOutput:
+      continue
     else:
       message += ' ' + argv[i]
       if argv[i] in ['-o', '--output', '--header', '--source']:
@@ -293,6 +309,45 @@ def typeCode(pType):
 
   return rType
 
+# Derived values of an Api function common to the generators,
+# computed once by Export.py traverse() as function.view
+#
+#   params       - parameter types and names, C mode
+#   callParams   - parameter names
+#   rType        - return type
+#   category     - category, or GL_VERSION_x_y if none
+#   regalOnly    - Regal-specific, not dispatched to the driver
+#   needsContext - dispatched via the per-context dispatcher
+#   pruned       - outside the --subset, a public entry point only
+
+def functionCategory(function):
+
+  category = getattr(function, 'category', None)
+  version  = getattr(function, 'version', None)
+
+  if category:
+    category = category.replace('_DEPRECATED', '')
+  elif version:
+    category = version.replace('.', '_')
+    category = 'GL_VERSION_' + category
+
+  return category
+
+class FunctionView(object):
+
+  __slots__ = [ 'name', 'params', 'callParams', 'rType', 'category', 'regalOnly', 'needsContext', 'pruned' ]
+
+  def __init__(self, function):
+
+    self.name         = function.name
+    self.params       = paramsDefaultCode(function.parameters, True)
+    self.callParams   = paramsNameCode(function.parameters)
+    self.rType        = typeCode(function.ret.type)
+    self.category     = functionCategory(function)
+    self.regalOnly    = getattr(function, 'regalOnly', False)==True
+    self.needsContext = getattr(function, 'needsContext', False)
+    self.pruned       = False
+
 # Code generation for non-array and array parts of type.
 
 reArray = re.compile('\[.*\]$')
@@ -356,6 +411,31 @@ def pointerLookupByNameCode(values, names, valueType = 'void *', valueCast = 're
 
   return code
 
+# Minimal perfect hash of <names> for Lookup::NameIndex, as
+# sorted by pointerLookupByNameCode.  Seeds and slots arrays,
+# sixteen values per line.  Enum values use hash = valueHash.
+# There are no zero length arrays in C++, and NameIndex takes the
+# hash modulo the size, so an empty <names> is an error.
+
+def perfectHashCode(names, arrays, hash = nameHash):
+
+  assert len(names), 'perfectHashCode: no names for %s and %s' % arrays
+
+  seeds, slots = perfectHash(sorted(names), hash)
+  assert max([ abs(i) for i in seeds ]) < 32768   # const short
+  assert len(slots) <= 65536                      # const unsigned short
+
+  code = []
+  for name, type, values in [ (arrays[0], 'short', seeds), (arrays[1], 'unsigned short', slots) ]:
+    code.append( 'const %s %s[%d] = {' % (type, name, len(values)) )
+    for i in range(0, len(values), 16):
+      code.append( '  ' + ' '.join([ '%d,' % j for j in values[i:i+16] ]) )
+    code[-1] = code[-1][:-1]
+    code.append('};')
+    code.append('')
+
+  return code
+
 #
 # CodeGen for:
 #
@@ -653,6 +733,98 @@ def unfoldCategory(code, format = '/* %s */', sortCategory = None, sortWithin =
 
   return res
 
+#
+# Buffered code emitter
+#
+#   w = CodeWriter()
+#   with w.condition('REGAL_SYS_WGL'):   # #if REGAL_SYS_WGL ... #endif // REGAL_SYS_WGL
+#     w.category(function.category)      # // GL_VERSION_1_0 comments between categories
+#     w('static void foo()')             # a line, at the current indentation
+#     w('{')
+#     with w.indent():
+#       w.lines(code)                    # list of lines, at the current indentation
+#     w('}')
+#   code = w.text()
+#
+# Code is accumulated as a list of chunks and joined once.
+
+class CodeWriter(object):
+
+  def __init__(self, prefix = ''):
+    self.chunks       = []
+    self.prefix       = prefix
+    self.scopes       = []
+    self.categoryPrev = None
+
+    # Text, as-is
+
+    self.write        = self.chunks.append
+
+  # Lines at the current indentation, an empty line by default
+
+  def __call__(self, *lines):
+    if not lines:
+      self.chunks.append('\n')
+      return
+    append = self.chunks.append
+    prefix = self.prefix
+    for i in lines:
+      if i:
+        append(prefix + i + '\n')
+      else:
+        append('\n')
+
+  # Lines at the current indentation, a list or multi-line string
+
+  def lines(self, code):
+    if not isinstance(code,list):
+      code = code.split('\n')
+    for i in code:
+      for j in i.split('\n'):
+        self.chunks.append(('%s%s'%(self.prefix,j)).rstrip() + '\n')
+
+  # Indentation and #if scopes, for use with the with statement
+
+  def indent(self, ind = '  '):
+    self.scopes.append((self.prefix, None))
+    self.prefix += ind
+    return self
+
+  # Preprocessor #if scope, nothing for an empty condition
+
+  def condition(self, exp):
+    if exp:
+      self.chunks.append('#if %s\n'%(exp))
+      self.scopes.append((self.prefix, '#endif // %s\n'%(exp)))
+    else:
+      self.scopes.append((self.prefix, None))
+    return self
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, type, value, traceback):
+    self.prefix, end = self.scopes.pop()
+    if end:
+      self.chunks.append(end)
+
+  # Comment and spacing for a change of category, and
+  # spacing after the last category
+
+  def category(self, category):
+    if self.categoryPrev and not (category == self.categoryPrev):
+      self.chunks.append('\n')
+    if category and not (category == self.categoryPrev):
+      self.chunks.append('%s// %s\n\n'%(self.prefix,category))
+    self.categoryPrev = category
+
+  def endCategory(self):
+    if self.categoryPrev:
+      self.chunks.append('\n')
+
+  def text(self):
+    return ''.join(self.chunks)
+
 #
 # CodeGen for:
 #
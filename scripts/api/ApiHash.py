@@ -0,0 +1,77 @@
+#!/usr/bin/python
+
+# ApiHash.py
+#
+# Minimal perfect hashing of names, for generated lookup tables
+#
+# Each name hashes to a bucket, and each bucket has a seed so that
+# the names in it hash to distinct free slots.  Buckets of one name
+# are placed directly in a free slot instead, stored as -slot-1.
+#
+#   seed  = seeds[nameHash(0, name) % n]
+#   slot  = seed < 0 ? -seed-1 : nameHash(seed, name) % n
+#   index = slots[slot]
+#
+# A name not in the table also maps to some index, so the name at
+# that index is compared to confirm.  nameHash is 32-bit FNV-1a,
+# as Lookup::NameHash in RegalLookup.h
+#
+# Integer keys, such as enum values, use valueHash instead: a
+# single multiply by the 32-bit golden ratio and a shift, as
+# Token::ValueHash in RegalToken.cpp
+
+def nameHash(seed, name):
+
+  h = (seed ^ 2166136261) & 0xffffffff
+  for c in name:
+    h = ((h ^ ord(c)) * 16777619) & 0xffffffff
+  return h
+
+def valueHash(seed, value):
+
+  h = ((value ^ seed) * 2654435761) & 0xffffffff
+  return h ^ (h >> 16)
+
+# Seeds and slots for <names>, which must be unique.
+# The slots are indexes into <names>.
+
+def perfectHash(names, hash = nameHash):
+
+  n = len(names)
+  assert len(set(names))==n
+
+  buckets = [ [] for i in range(n) ]
+  for i in range(n):
+    buckets[hash(0, names[i]) % n].append(i)
+
+  seeds = [ 0 ] * n
+  slots = [ None ] * n
+
+  # Largest buckets first, while most slots are free
+
+  order = sorted(range(n), key = lambda i : -len(buckets[i]))
+
+  for i in order:
+    bucket = buckets[i]
+    if len(bucket) < 2:
+      break
+    seed = 1
+    while True:
+      tmp = [ hash(seed, names[j]) % n for j in bucket ]
+      if len(set(tmp))==len(tmp) and not [ j for j in tmp if slots[j]!=None ]:
+        break
+      seed += 1
+    seeds[i] = seed
+    for j, k in zip(bucket, tmp):
+      slots[k] = j
+
+  free = [ j for j in range(n) if slots[j]==None ]
+  free.reverse()
+
+  for i in order:
+    if len(buckets[i])==1:
+      j = free.pop()
+      seeds[i] = -j - 1
+      slots[j] = buckets[i][0]
+
+  return seeds, slots
@@ -0,0 +1,52 @@
+#!/usr/bin/python
+
+# ApiIndex.py
+#
+# Reverse indexes over an Api database, built once by Export.py
+# traverse() and available to the generators as api.index
+#
+#   extensions  - function name to the extensions providing it
+#   values      - enum value to the sorted names of the defines
+#   enumerants  - the defines, in order of name
+
+from ApiUtil import toLong
+
+class ApiIndex:
+
+  def __init__(self, api):
+
+    self.extensions = {}
+    self.values     = {}
+    self.enumerants = []
+    self.flagged    = {}
+
+    for i in api.extensions:
+      for j in i.functions:
+        self.extensions.setdefault(j, []).append(i)
+
+    for i in api.enums:
+      if i.name=='defines':
+        self.enumerants.extend(getattr(i, 'enumerantsByName', i.enumerants))
+
+    values = {}
+    for i in self.enumerants:
+      value = toLong(i.value)
+      if value != None:
+        values.setdefault(value, set()).add(i.name)
+
+    for i in values:
+      self.values[i] = sorted(values[i])
+
+  # Defines with the optional attribute <attr> set, in order of name,
+  # such as enableCap.  Optionally limited to an ES version.
+
+  def enumerantsWith(self, attr, esVersion = None):
+
+    key = (attr, esVersion)
+    if key not in self.flagged:
+      tmp = [ i for i in self.enumerants if getattr(i, attr, None) == True ]
+      if esVersion != None:
+        tmp = [ i for i in tmp if esVersion in getattr(i, 'esVersions', []) ]
+      self.flagged[key] = tmp
+
+    return self.flagged[key]
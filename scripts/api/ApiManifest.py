@@ -0,0 +1,179 @@
+#!/usr/bin/python
+
+# ApiManifest.py
+#
+# Dependency manifest for incremental code generation.
+#
+# For each generator the manifest records a hash of its inputs:
+# the database modules, the generator module and everything it
+# imports (formulae, templates, code generation helpers), plus
+# the output files and their content hashes.  A generator can be
+# skipped if neither its inputs nor its outputs have changed.
+
+import ast
+import hashlib
+import json
+import os
+import sys
+
+# Hash of file contents, cached for the lifetime of the process
+
+fileHashes = {}
+
+def fileHash(filename):
+
+  if filename not in fileHashes:
+    try:
+      f = open(filename, 'rb')
+      fileHashes[filename] = hashlib.sha1(f.read()).hexdigest()
+      f.close()
+    except IOError:
+      fileHashes[filename] = None
+
+  return fileHashes[filename]
+
+# Locate the source file of module <name>, searching sys.path.
+# Only modules in the scripts tree are of interest, None otherwise.
+
+scripts = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def moduleFile(name):
+
+  module = sys.modules.get(name)
+  filename = getattr(module, '__file__', None)
+  if filename:
+    filename = os.path.abspath(filename)
+    if filename.endswith('.pyc') or filename.endswith('.pyo'):
+      filename = filename[:-1]
+    if filename.startswith(scripts):
+      return filename
+    return None
+
+  for path in sys.path:
+    filename = os.path.abspath(os.path.join(path, name + '.py'))
+    if filename.startswith(scripts) and os.path.isfile(filename):
+      return filename
+
+  return None
+
+# Names of the modules imported by a source file
+
+def moduleImports(filename):
+
+  f = open(filename, 'r')
+  tree = ast.parse(f.read(), filename)
+  f.close()
+
+  names = set()
+  for node in ast.walk(tree):
+    if isinstance(node, ast.Import):
+      names.update([ i.name for i in node.names ])
+    elif isinstance(node, ast.ImportFrom) and node.module:
+      names.add(node.module)
+  return names
+
+# Source files of module <name> and all the scripts modules it
+# imports, directly or indirectly.
+
+moduleDependsCache = {}
+
+def moduleDepends(name):
+
+  if name in moduleDependsCache:
+    return moduleDependsCache[name]
+
+  depends = set()
+  pending = [ name ]
+  seen = set()
+  while len(pending):
+    i = pending.pop()
+    if i in seen:
+      continue
+    seen.add(i)
+    filename = moduleFile(i)
+    if filename:
+      depends.add(filename)
+      pending.extend(moduleImports(filename))
+
+  moduleDependsCache[name] = depends
+  return depends
+
+# Hash of the inputs of <generator>
+#
+#   common  - files every generator depends on (database, Export.py)
+#   extra   - strings that affect the output, such as the license
+
+def inputHash(generator, common, extra = []):
+
+  func = getattr(generator, 'func', generator)
+  files = set(common)
+  files.update(moduleDepends(func.__module__))
+
+  h = hashlib.sha1()
+  h.update(func.__name__)
+  for i in sorted(files):
+    h.update('%s %s\n' % (os.path.basename(i), fileHash(i)))
+  for i in extra:
+    h.update(i)
+  return h.hexdigest()
+
+def generatorName(generator):
+  return getattr(generator, 'func', generator).__name__
+
+class Manifest:
+
+  def __init__(self, filename, common, extra = []):
+
+    self.filename = filename
+    self.common   = common
+    self.extra    = extra
+    self.entries  = {}
+
+    try:
+      f = open(filename, 'r')
+      self.entries = json.load(f)
+      f.close()
+    except (IOError, ValueError):
+      pass
+
+  # Generator needs to run if the inputs have changed,
+  # or any of the outputs has been modified or removed.
+
+  def stale(self, generator):
+
+    entry = self.entries.get(generatorName(generator))
+    if not entry:
+      return True
+
+    if entry['inputs'] != inputHash(generator, self.common, self.extra):
+      return True
+
+    for i in entry['outputs']:
+      if fileHash(i) != entry['outputs'][i]:
+        return True
+
+    return False
+
+  # Entry for <generator> after writing <outputs>
+
+  def entry(self, generator, outputs):
+
+    for i in outputs:
+      fileHashes.pop(i, None)
+
+    return generatorName(generator), {
+      'inputs'  : inputHash(generator, self.common, self.extra),
+      'outputs' : dict([ (i, fileHash(i)) for i in outputs ])
+    }
+
+  def update(self, name, entry):
+    self.entries[name] = entry
+
+  def save(self):
+
+    try:
+      f = open(self.filename, 'w')
+      json.dump(self.entries, f, indent = 2, sort_keys = True)
+      f.close()
+    except IOError:
+      print 'File read-only: %s' % self.filename
@@ -0,0 +1,105 @@
+#!/usr/bin/python
+
+# ApiProfile.py
+#
+# Per-generator profiling, for Export.py --profile
+#
+#   time      - wall time, in seconds
+#   filter    - time spent filtering output in outputCode, in seconds
+#   compare   - time spent comparing output with the current file, in seconds
+#   functions - functions visited, each iteration over api.functions
+#   bytes     - bytes of code output
+#   peakRSS   - peak resident set size of the process so far, in KB
+
+import json
+import sys
+import time
+
+try:
+  import resource
+except ImportError:
+  resource = None
+
+enabled = False
+
+# Statistics of the generator currently running, updated by outputCode
+
+current = None
+
+def peakRSS():
+
+  if not resource:
+    return None
+
+  rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  if sys.platform == 'darwin':
+    rss /= 1024
+  return rss
+
+# List of functions counting each item visited, for the generator
+# currently running
+
+class FunctionList(list):
+
+  def __iter__(self):
+    for i in list.__iter__(self):
+      if current:
+        current['functions'] += 1
+      yield i
+
+def countFunctions(apis):
+
+  for api in apis:
+    if not isinstance(api.functions, FunctionList):
+      api.functions = FunctionList(api.functions)
+
+def begin(name):
+
+  global current
+
+  if not enabled:
+    return
+
+  current = {
+    'name'      : name,
+    'time'      : time.time(),
+    'filter'    : 0.0,
+    'compare'   : 0.0,
+    'functions' : 0,
+    'bytes'     : 0,
+    'peakRSS'   : None
+  }
+
+def end():
+
+  global current
+
+  if not current:
+    return None
+
+  stats = current
+  stats['time']    = time.time() - stats['time']
+  stats['peakRSS'] = peakRSS()
+  current = None
+  return stats
+
+# Table to stdout, slowest first, and JSON to <filename>
+
+def report(results, filename):
+
+  results = sorted(results, key = lambda i : i['time'], reverse = True)
+
+  total = { 'name' : 'total', 'peakRSS' : max([ i['peakRSS'] for i in results ] or [ None ]) }
+  for i in [ 'time', 'filter', 'compare', 'functions', 'bytes' ]:
+    total[i] = sum([ j[i] for j in results ])
+
+  print '%-32s %8s %8s %8s %10s %10s %10s' % ('Generator', 'Time', 'Filter', 'Compare', 'Functions', 'Bytes', 'Peak RSS')
+  for i in results + [ total ]:
+    print '%-32s %8.3f %8.3f %8.3f %10d %10d %10s' % (i['name'], i['time'], i['filter'], i['compare'], i['functions'], i['bytes'], i['peakRSS'])
+
+  try:
+    f = open(filename, 'w')
+    json.dump({ 'generators' : results, 'total' : total }, f, indent = 2, sort_keys = True)
+    f.close()
+  except IOError:
+    print 'File read-only: %s' % filename
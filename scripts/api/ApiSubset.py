@@ -0,0 +1,168 @@
+#!/usr/bin/python
+
+# ApiSubset.py
+#
+# API subsetting, for Export.py --subset FILE
+#
+# The subset file lists what to keep, one item per line:
+#
+#   <api> <version>  - core of <api> up to <version>, such as gl 3.3
+#   <category>       - an extension, such as GL_ARB_debug_output
+#
+# Blank lines and # comments are ignored.  APIs not listed are
+# kept in full.
+#
+# Functions, enums and extensions outside the subset are pruned
+# from the database before generation, unless referenced by name
+# from the hand-written sources.  The full lists remain available
+# as api.allFunctions and api.allEnums for the public header,
+# exports and lookup, so that pruned entry points still exist.
+
+import copy
+import re
+
+class Subset:
+
+  def __init__(self):
+    self.versions   = {}     # api name to (major, minor)
+    self.categories = set()
+    self.references = set()
+
+reVersion    = re.compile(r'^(\d+)\.(\d+)$')
+reCategory   = re.compile(r'^[A-Z]+_VERSION_(\d+)_(\d+)$')
+reIdentifier = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+def readSubset(filename):
+
+  subset = Subset()
+
+  f = open(filename, 'r')
+  lines = f.readlines()
+  f.close()
+
+  for i in range(len(lines)):
+    line = lines[i].split('#', 1)[0].split()
+    if not len(line):
+      continue
+    if len(line)==2 and reVersion.match(line[1]):
+      m = reVersion.match(line[1])
+      subset.versions[line[0]] = (int(m.group(1)), int(m.group(2)))
+    elif len(line)==1:
+      subset.categories.add(line[0])
+    else:
+      raise ValueError('%s:%d: expecting <api> <version> or <category>' % (filename, i + 1))
+
+  return subset
+
+# Whether <filename> was output by a generator
+
+def generated(filename):
+
+  f = open(filename, 'r')
+  code = f.read(256)
+  f.close()
+  return code.find('it is generated by a script')!=-1
+
+# Identifiers in <filenames>
+
+def references(filenames):
+
+  names = set()
+  for i in filenames:
+    f = open(i, 'r')
+    names.update(reIdentifier.findall(f.read()))
+    f.close()
+  return names
+
+# Identifiers in <code>, a string or a list of them
+
+def identifiers(code):
+
+  if isinstance(code, list):
+    code = '\n'.join([ i for i in code if isinstance(i, basestring) ])
+  if not isinstance(code, basestring):
+    return set()
+  return set(reIdentifier.findall(code))
+
+# Categories kept for <api>: versions up to the subset, Regal
+# extensions, those listed and those referenced, by name or
+# as the lower case flag of RegalContextInfo.
+
+def keepCategory(subset, api, category):
+
+  version = subset.versions.get(api.name)
+  if version==None or not category:
+    return True
+
+  m = reCategory.match(category)
+  if m:
+    return (int(m.group(1)), int(m.group(2))) <= version
+
+  if category.startswith('GL_REGAL_') or category.endswith('_core'):
+    return True
+
+  return category in subset.categories or category in subset.references or category.lower() in subset.references
+
+# ARB extensions promoted to the core have functions and enums
+# without the ARB suffix, such as glBindVertexArray in
+# GL_ARB_vertex_array_object.  The functions give the version.
+
+def coreFunction(subset, api, function):
+
+  if not function.view.category.startswith('GL_ARB_') or function.name.endswith('ARB'):
+    return False
+  m = reVersion.match(getattr(function, 'version', '') or '')
+  return m!=None and (int(m.group(1)), int(m.group(2))) <= subset.versions[api.name]
+
+def coreEnumerant(subset, api, enumerant):
+  return enumerant.category.startswith('GL_ARB_') and not enumerant.name.endswith('_ARB')
+
+def keepFunction(subset, api, function):
+  return function.view.regalOnly or function.name in subset.references or keepCategory(subset, api, function.view.category) or coreFunction(subset, api, function)
+
+def keepEnumerant(subset, api, enumerant):
+  return enumerant.name in subset.references or keepCategory(subset, api, enumerant.category) or coreEnumerant(subset, api, enumerant)
+
+# Prune <api> to <subset>, starting from the full lists each time.
+# Functions outside the subset are marked as pruned in their view.
+
+def apiSubset(api, subset):
+
+  if getattr(api, 'allFunctions', None)==None:
+    api.allFunctions  = api.functions
+    api.allEnums      = api.enums
+    api.allExtensions = api.extensions
+
+  if subset==None or api.name not in subset.versions:
+    return
+
+  api.functions = []
+  for i in api.allFunctions:
+    i.view.pruned = not keepFunction(subset, api, i)
+    if not i.view.pruned:
+      api.functions.append(i)
+
+  api.enums = []
+  for i in api.allEnums:
+    enum = copy.copy(i)
+    enum.enumerants = [ j for j in i.enumerants if keepEnumerant(subset, api, j) ]
+    if getattr(i, 'enumerantsByName', None)!=None:
+      enum.enumerantsByName = [ j for j in i.enumerantsByName if keepEnumerant(subset, api, j) ]
+    api.enums.append(enum)
+
+  api.extensions = [ i for i in api.allExtensions if keepCategory(subset, api, i.name) ]
+
+# Api with the functions and enums before pruning
+
+class ApiFull:
+
+  def __init__(self, api):
+    self.api       = api
+    self.functions = getattr(api, 'allFunctions', api.functions)
+    self.enums     = getattr(api, 'allEnums',     api.enums)
+
+  def __getattr__(self, name):
+    return getattr(self.api, name)
+
+def fullApis(apis):
+  return [ ApiFull(i) for i in apis ]
@@ -6,6 +6,7 @@ import sys
 
 from ApiType import findType
 from ApiType import typesBasic
+from ApiType import typesCache
 from ApiType import typeStrip
 
 from ApiCodeGen import typeCode
@@ -258,30 +259,64 @@ def paramCast(parameter):
 
   return None
 
+# Class ParamType:
+#   cType:     parameter cast, or None.
+#   pType:     parameter type.
+#   aType:     Type found using parameter cast or parameter type.
+#   mType:     parameter cast or parameter type, as matched by aType.
+#   castType:  Type found using aType cast.
+#   proxyType: Type found using aType proxyType in place of the core type of mType.
+
+class ParamType:
+
+  def __init__(self, parameter, types):
+
+    self.cType     = paramCast(parameter)
+    self.pType     = parameter.type.strip()
+    self.aType     = findType(self.cType or self.pType, types)
+    self.mType     = None
+    self.castType  = None
+    self.proxyType = None
+
+    aType = self.aType
+    if not aType:
+      return
+
+    self.mType = aType.regexc.match(self.cType or self.pType).group(0)
+
+    if aType.cast and len(aType.cast.strip()):
+      self.castType = findType(aType.cast, types)
+
+    if aType.proxyType and len(aType.proxyType.strip()):
+      self.proxyType = findType(self.mType.replace(typeStrip(self.mType), aType.proxyType.strip()), types)
+
+# ParamType for <parameter>, shared by parameters of the same cast and type.
+
+def paramType(parameter, types = typesBasic):
+
+  cache = typesCache(types, 'paramType')
+  key = (parameter.cast, parameter.type)
+  if key not in cache:
+    cache[key] = ParamType(parameter, types)
+
+  return cache[key]
+
 # Code generation for parameter cast.
 #    This function uses parameter cast and Type cast.
 #    This is useful for casting an entire array of elements.
 
 def paramCastCode(parameter, types = typesBasic):
 
-  cType = paramCast(parameter)
-
   # Find Type using parameter cast or parameter type.
-  if cType:
-    aType = findType(cType, types)
-  else:
-    pType = parameter.type.strip()
-    aType = findType(pType, types)
+  t = paramType(parameter, types)
+  cType, pType, aType = t.cType, t.pType, t.aType
   if not aType:
     return ''
 
   code = ''
   if aType.cast and len(aType.cast.strip()):
     # If Type has a cast, use that to derive a cast.
-    if cType:
-      mType = aType.regexc.match(cType).group(0)
-    else:
-      mType = aType.regexc.match(pType).group(0)
+    mType = t.mType
     code  = '(%s) ' % mType.replace(typeStrip(mType), aType.cast.strip())
   elif cType:
     # If parameter has a cast, use that as cast.
@@ -295,14 +330,9 @@ def paramCastCode(parameter, types = typesBasic):
 
 def paramCastTypeCode(parameter, types = typesBasic):
 
-  cType = paramCast(parameter)
-
   # Find Type using parameter cast or parameter type.
-  if cType:
-    aType = findType(cType, types)
-  else:
-    pType = parameter.type.strip()
-    aType = findType(pType, types)
+  t = paramType(parameter, types)
+  cType, pType, aType = t.cType, t.pType, t.aType
   if not aType:
     return ''
 
@@ -317,21 +347,16 @@ def paramCastTypeCode(parameter, types = typesBasic):
 
 def paramCastFormatCode(parameter, types = typesBasic):
 
-  cType = paramCast(parameter)
-
   # Find Type using parameter cast or parameter type.
-  if cType:
-    aType = findType(cType, types)
-  else:
-    pType = parameter.type.strip()
-    aType = findType(pType, types)
+  t = paramType(parameter, types)
+  cType, pType, aType = t.cType, t.pType, t.aType
   if not aType:
     return None
 
   format = None
   if aType.cast and len(aType.cast.strip()):
     # If Type has a cast, use that cast's Type format.
-    castType = findType(aType.cast, types)
+    castType = t.castType
     if castType and castType.format and len(castType.format.strip()):
       format = castType.format.strip()
   elif cType:
@@ -346,21 +371,16 @@ def paramCastFormatCode(parameter, types = typesBasic):
 
 def paramTraceFormatCode(parameter, types = typesBasic):
 
-  cType = paramCast(parameter)
-
   # Find Type using parameter cast or parameter type.
-  if cType:
-    aType = findType(cType, types)
-  else:
-    pType = parameter.type.strip()
-    aType = findType(pType, types)
+  t = paramType(parameter, types)
+  cType, pType, aType = t.cType, t.pType, t.aType
   if not aType:
     return None
 
   format = None
   if aType.cast and len(aType.cast.strip()):
     # If Type has a cast, use that cast's Type format.
-    castType = findType(aType.cast, types)
+    castType = t.castType
     if castType and castType.format and len(castType.format.strip()):
       format = castType.format.strip()
   else:
@@ -418,24 +438,16 @@ def paramTraceFormatCode(parameter, types = typesBasic):
 
 def paramTraceCastCode(parameter, types = typesBasic):
 
-  cType = paramCast(parameter)
-
   # Find Type using parameter cast or parameter type.
-  if cType:
-    aType = findType(cType, types)
-  else:
-    pType = parameter.type.strip()
-    aType = findType(pType, types)
+  t = paramType(parameter, types)
+  cType, pType, aType = t.cType, t.pType, t.aType
   if not aType:
     return ''
 
   code = ''
   if aType.cast and len(aType.cast.strip()):
     # If Type has a cast, use that to derive a cast.
-    if cType:
-      mType = aType.regexc.match(cType).group(0)
-    else:
-      mType = aType.regexc.match(pType).group(0)
+    mType = t.mType
     code = '(%s) ' % mType.replace(typeStrip(mType), aType.cast.strip())
   elif cType:
     # If parameter has a cast, use that as cast.
@@ -485,14 +497,9 @@ def paramDefaultCode(pType, types = typesBasic):
 
 def paramBaseTypeCode(parameter, types = typesBasic):
 
-  cType = paramCast(parameter)
-
   # Find Type using parameter cast or parameter type.
-  if cType:
-    aType = findType(cType, types)
-  else:
-    pType = parameter.type.strip()
-    aType = findType(pType, types)
+  t = paramType(parameter, types)
+  cType, pType, aType = t.cType, t.pType, t.aType
   if not aType:
     return ''
 
@@ -523,25 +530,17 @@ def paramBaseTypeCode(parameter, types = typesBasic):
 
 def paramProxyBaseTypeCode(parameter, types = typesBasic):
 
-  cType = paramCast(parameter)
-
   # Find Type using parameter cast or parameter type.
-  if cType:
-    aType = findType(cType, types)
-  else:
-    pType = parameter.type.strip()
-    aType = findType(pType, types)
+  t = paramType(parameter, types)
+  cType, pType, aType = t.cType, t.pType, t.aType
   if not aType:
     return ''
 
   code = ''
   if aType.proxyType and len(aType.proxyType.strip()):
     # If Type has a proxyType, use that proxyType.
-    if cType:
-      mType = aType.regexc.match(cType).group(0)
-    else:
-      mType = aType.regexc.match(pType).group(0)
-    proxyType = findType(mType.replace(typeStrip(mType), aType.proxyType.strip()), types)
+    mType = t.mType
+    proxyType = t.proxyType
     if proxyType:
       # If proxyType Type found, use that Type's baseType.
       code = proxyType.baseType.strip()
@@ -582,25 +581,17 @@ def paramProxyBaseTypeCode(parameter, types = typesBasic):
 
 def paramProxyFormatCode(parameter, types = typesBasic):
 
-  cType = paramCast(parameter)
-
   # Find Type using parameter cast or parameter type.
-  if cType:
-    aType = findType(cType, types)
-  else:
-    pType = parameter.type.strip()
-    aType = findType(pType, types)
+  t = paramType(parameter, types)
+  cType, pType, aType = t.cType, t.pType, t.aType
   if not aType:
     return None
 
   format = None
   if aType.proxyType and len(aType.proxyType.strip()):
     # If Type has a proxyType, use that proxyType's Type format.
-    if cType:
-      mType = aType.regexc.match(cType).group(0)
-    else:
-      mType = aType.regexc.match(pType).group(0)
-    proxyType = findType(mType.replace(typeStrip(mType), aType.proxyType.strip()), types)
+    mType = t.mType
+    proxyType = t.proxyType
     if proxyType and proxyType.format and len(proxyType.format.strip()):
       format = proxyType.format.strip()
   else:
@@ -616,24 +607,16 @@ def paramProxyFormatCode(parameter, types = typesBasic):
 
 def paramProxyTypeCode(parameter, types = typesBasic):
 
-  cType = paramCast(parameter)
-
   # Find Type using parameter cast or parameter type.
-  if cType:
-    aType = findType(cType, types)
-  else:
-    pType = parameter.type.strip()
-    aType = findType(pType, types)
+  t = paramType(parameter, types)
+  cType, pType, aType = t.cType, t.pType, t.aType
   if not aType:
     return ''
 
   code = ''
   if aType.proxyType and len(aType.proxyType.strip()):
     # If Type has a proxyType, use that to derive a proxy type.
-    if cType:
-      mType = aType.regexc.match(cType).group(0)
-    else:
-      mType = aType.regexc.match(pType).group(0)
+    mType = t.mType
     code = mType.replace(typeStrip(mType), aType.proxyType.strip())
   elif cType:
     # If parameter has a cast, use that as proxy type.
@@ -209,16 +209,41 @@ def apiTypes(apis, states = None):
 
     api.types = types
 
+# Lookups cached per list of types, by <name>.
+#   The cache for a list is discarded when the list is replaced
+#   or extended, as apiTypes does while adding typedef types.
+
+typesCaches = {}
+
+def typesCache(types, name):
+
+  cache = typesCaches.get(id(types))
+  if not cache or cache[0] is not types or cache[1] != len(types):
+    cache = (types, len(types), {})
+    typesCaches[id(types)] = cache
+
+  return cache[2].setdefault(name, {})
+
 # Find type using <typeFormat> match with regex expressions for <types>.
+#   Results are cached by <typeFormat> with whitespace normalized,
+#   the regex expressions match any amount of whitespace.
 
 def findType(typeFormat, types = typesBasic):
 
-  if typeFormat:
+  if not typeFormat:
+    return None
+
+  typeFormat = ' '.join(typeFormat.split())
+
+  found = typesCache(types, 'findType')
+  if typeFormat not in found:
+    found[typeFormat] = None
     for aType in types:
-      if aType.regexc.match(typeFormat.strip()):
-        return aType
+      if aType.regexc.match(typeFormat):
+        found[typeFormat] = aType
+        break
 
-  return None
+  return found[typeFormat]
 
 # Strip typeFormat to the core type.
 
@@ -1,28 +1,125 @@
 #!/usr/bin/python
 
 import ApiCodeFilter
+import ApiProfile
+
+import cPickle
+import hashlib
+import imp
+import os
+import sys
+import tempfile
+import time
+
+from copy import deepcopy
 
 # Import attribute <name> from module <name>
+#
+# Database modules such as gl.py are slow to import, so the attribute
+# is also cached in pickled form as <name>.pickle alongside the module.
+# The cache is keyed by a hash of the module source and Api.py, and
+# is rewritten whenever either changes.
+#
+# Each call returns a separate copy, so the caller may modify it.
+
+importAttrReturned = set()
+
+def importAttrKey(name, filename):
+
+  h = hashlib.sha1()
+  h.update('%s %d.%d\n' % (name, sys.version_info[0], sys.version_info[1]))
+  for i in [ filename, os.path.join(os.path.dirname(filename), 'Api.py') ]:
+    try:
+      f = open(i, 'rb')
+      h.update(f.read())
+      f.close()
+    except IOError:
+      pass
+  return h.hexdigest()
 
 def importAttr(name):
 
+  try:
+    f, filename, description = imp.find_module(name)
+    if f:
+      f.close()
+  except ImportError:
+    filename = None
+
+  if not filename or not filename.endswith('.py'):
+    return getattr(__import__(name), name)
+
+  key = importAttrKey(name, filename)
+  cache = filename[:-3] + '.pickle'
+
+  # Load from the cache, if current
+
+  try:
+    f = open(cache, 'rb')
+    try:
+      if f.readline().strip() == key:
+        attr = cPickle.load(f)
+        importAttrReturned.add(name)
+        return attr
+    finally:
+      f.close()
+  except (IOError, EOFError, cPickle.UnpicklingError):
+    pass
+
+  # Otherwise import the module and update the cache
+
   attr = getattr(__import__(name), name)
+
+  try:
+    fd, tmp = tempfile.mkstemp('.tmp', os.path.basename(cache), os.path.dirname(cache))
+    f = os.fdopen(fd, 'wb')
+    f.write(key + '\n')
+    cPickle.dump(attr, f, cPickle.HIGHEST_PROTOCOL)
+    f.close()
+    os.chmod(tmp, 0644)
+    if os.path.exists(cache):
+      os.remove(cache)
+    os.rename(tmp, cache)
+  except (IOError, OSError):
+    pass
+
+  # The module attribute itself is only returned once
+
+  if name in importAttrReturned:
+    return deepcopy(attr)
+
+  importAttrReturned.add(name)
   return attr
 
 # Output code to output file.
+#
+# outputFiles records the filenames, for dependency tracking purposes.
+
+outputFiles = []
+
+# Check the single-pass filter against the separate filter passes
+
+checkFilters = False
 
 def outputCode(filename, code):
 
+  outputFiles.append(filename)
+
+  stats = ApiProfile.current
+  if stats:
+    start = time.time()
+
   code = codeJoin(code)
 
-  code = ApiCodeFilter.expandtabs(code)
-  code = ApiCodeFilter.trim(code)
-  code = ApiCodeFilter.foldIfs(code)
-  code = ApiCodeFilter.foldPreprocessorIfs(code)
-  code = ApiCodeFilter.foldEmptyLines(code)
-  code = ApiCodeFilter.foldImpossibleBreak(code)
-  code = ApiCodeFilter.foldImpossibleReturn(code)
-  code = ApiCodeFilter.foldRedundantCase(code)
+  filtered = ApiCodeFilter.filterCode(code)
+  if checkFilters:
+    assert filtered == ApiCodeFilter.filterPasses(code), 'Filter mismatch for %s' % filename
+  code = filtered
+
+  if stats:
+    stats['bytes']  += len(code)
+    stats['filter'] += time.time() - start
+    start = time.time()
 
   # Compare code with current file.
 
@@ -36,7 +133,11 @@ def outputCode(filename, code):
 
     # Compare code.
 
-    if currentCode == code:
+    same = currentCode == code
+    if stats:
+      stats['compare'] += time.time() - start
+
+    if same:
       print 'File skipped: %s' % filename
       return
 
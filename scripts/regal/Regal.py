@@ -8,12 +8,17 @@ from ApiUtil      import toLong
 from ApiUtil      import hexValue
 from ApiCodeGen   import *
 from ApiRegal     import logFunction
+from ApiSubset    import fullApis
 from Emu          import emuFindEntry, emuCodeGen
 
 from RegalContext     import emuRegal
 from RegalContextInfo import cond
 from RegalSystem      import regalSys
 
+from RegalDispatchMissing import missingFuncBodyCode
+from RegalDispatchShared  import dispatchLayers, cacheFunctions, apiShards, removeShards
+from RegalDispatchEmu     import emuIntercepts
+
 publicHeaderTemplate = Template( '''${AUTOGENERATED}
 ${LICENSE}
 
@@ -316,6 +321,8 @@ REGAL_DECL void RegalDestroyContext(RegalSystemContext ctx);
 
 def generatePublicHeader(apis, args):
 
+  apis = fullApis(apis)
+
   apiTypedef     = apiTypedefCode( apis, args )
   apiEnum        = apiEnumCode(apis, args)                 # CodeGen for API enums
   apiFuncDeclare = apiFuncDeclareCode( apis, args )        # CodeGen for API functions
@@ -334,6 +341,24 @@ def generatePublicHeader(apis, args):
 
   outputCode( '%s/Regal.h' % args.incdir, publicHeaderTemplate.substitute(substitute))
 
+# Whether <function> passes through each of <layers> to the driver,
+# for Export.py --layers.  None for all the layers.
+
+def passThrough(function, layers):
+
+  if layers==None or 'driver' not in layers:
+    return False
+
+  for i in layers:
+    if i=='emu' and emuIntercepts(function):
+      return False
+    if i=='cache' and function.name in cacheFunctions:
+      return False
+    if i not in [ 'emu', 'cache', 'driver', 'missing' ]:
+      return False
+
+  return True
+
 def apiFuncDefineCode(apis, args):
 
   #
@@ -344,30 +369,34 @@ def apiFuncDefineCode(apis, args):
     tmp = []
     for function in api.functions:
 
-      name       = function.name
-      params     = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType      = typeCode(function.ret.type)
+      view       = function.view
+      name       = view.name
+      params     = view.params
+      callParams = view.callParams
+      rType      = view.rType
       rTypes     = rType.strip()
-      category   = getattr(function, 'category', None)
-      version    = getattr(function, 'version', None)
-
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+      category   = view.category
 
       c = ''
       c += 'REGAL_DECL %sREGAL_CALL %s(%s) \n{\n' % (rType, name, params)
 
+      # Pruned by --subset, as for the missing layer
+
+      if function.view.pruned:
+        c += listToString(indent(missingFuncBodyCode(api, function),'  '))
+        c += '}\n\n'
+        tmp.append( (category, indent(c,'  ') ) )
+        continue
+
       emue = [ emuFindEntry( function, i['formulae'], i['member'], i['ifdef'] ) for i in emuRegal ]
 
-      if function.needsContext:
-        c += '  RegalContext *_context = REGAL_GET_CONTEXT();\n'
+      if function.view.needsContext:
+        c += '  Thread::ThreadLocal &_instance = Thread::ThreadLocal::instance();\n'
+        c += '  RegalContext *_context = _instance.currentContext;\n'
         c += listToString(indent(stripVertical(emuCodeGen(emue,'prefix')),'  '))
         c += '  #if REGAL_HTTP\n'
-        c += '  _context->http.callString = %s;\n' % logFunction( function, 'print_string' )
+        c += '  if (_context && _context->http.logCalls)\n'
+        c += '    _context->http.callString = %s;\n' % logFunction( function, 'print_string' )
         c += '  #endif\n'
         c += '  %s\n' % logFunction( function, 'App' )
         c += '  if (!_context) return'
@@ -392,7 +421,7 @@ def apiFuncDefineCode(apis, args):
             c += '  #if REGAL_SYS_ES1\n'
             c += '  if (_context->isES1()) // Pass-through for ES1 only\n'
             c += '  {\n'
-            c += '    DispatchTableGL *_next = &_context->dispatcher.front();\n'
+            c += '    DispatchTableGL *_next = _instance.currentDispatchTable;\n'
             c += '    RegalAssert(_next);\n    '
             if not typeIsVoid(rType):
               c += 'return '
@@ -412,9 +441,16 @@ def apiFuncDefineCode(apis, args):
           else:
             c += '%s;\n'%(function.regalRemap)
         else:
-          if not getattr(function,'regalOnly',False):
+          if not function.view.regalOnly:
             t = ''
-            t += 'DispatchTableGL *_next = &_context->dispatcher.front();\n'
+            if passThrough(function, args.layers):
+              t += '#if REGAL_DIRECT_DRIVER\n'
+              t += 'DispatchTableGL *_next = &_context->dispatcher.driver;\n'
+              t += '#else\n'
+              t += 'DispatchTableGL *_next = _instance.currentDispatchTable;\n'
+              t += '#endif\n'
+            else:
+              t += 'DispatchTableGL *_next = _instance.currentDispatchTable;\n'
             t += 'RegalAssert(_next);\n'
 
             t += listToString(indent(stripVertical(emuCodeGen(emue,'pre')),''))
@@ -437,18 +473,14 @@ def apiFuncDefineCode(apis, args):
         c += '  #if REGAL_HTTP\n'
         c += '  {\n'
         c += '    RegalContext *_context = REGAL_GET_CONTEXT();\n'
-        c += '    std::string params = %s\n' % logFunction( function, 'print_string', True, False, False, True)
-        c += '    if( _context ) {\n'
-        c += '      _context->http.callString = print_string( "%s", %s );\n' % ( function.name, 'params' )
-        c += '    }\n'
-        c += '    App( "%s", %s );\n' % (function.name, 'params')
+        c += '    if (_context && _context->http.logCalls)\n'
+        c += '      _context->http.callString = %s;\n' % logFunction( function, 'print_string' )
         c += '  }\n'
-        c += '  #else\n'
-        c += '  %s\n' % logFunction(function, 'App' )
         c += '  #endif\n'
+        c += '  %s\n' % logFunction(function, 'App' )
         c += listToString(indent(stripVertical(emuCodeGen(emue,'prefix')),'  '))
 
-        if not getattr(function,'regalOnly',False):
+        if not function.view.regalOnly:
           c += '  DispatchTableGlobal *_next = &dispatcherGlobal.front();\n'
           c += '  RegalAssert(_next);\n'
 
@@ -591,17 +623,12 @@ def apiFuncDeclareCode(apis, args):
 
     for function in api.functions:
 
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
-
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+      view      = function.view
+      name      = view.name
+      params    = view.params
+      rType     = view.rType
+      category  = view.category
+      version   = function.version
 
       t.append((category,funcProtoCode(function, version, 'REGAL_CALL', True)))
       m.append((category,'#define %-35s r%-35s' % (name, name) ))
@@ -730,21 +757,15 @@ def apiGlobalDispatchFuncInitCode(apis, args):
       code += '#if %s\n' % cond[api.name]
 
     for function in api.functions:
-      if function.needsContext:
+      if function.view.needsContext:
         continue
 
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
-
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+      view       = function.view
+      name       = view.name
+      params     = view.params
+      callParams = view.callParams
+      rType      = view.rType
+      category   = view.category
 
       # Close prev category block.
       if categoryPrev and not (category == categoryPrev):
@@ -803,7 +824,7 @@ using namespace ::REGAL_NAMESPACE_INTERNAL::Logging;
 using namespace ::REGAL_NAMESPACE_INTERNAL::Token;
 using namespace boost::print;
 
-extern "C" {
+${DIRECT_DRIVER}extern "C" {
 
 ${API_FUNC_DEFINE}
 
@@ -812,8 +833,73 @@ ${API_FUNC_DEFINE}
 REGAL_GLOBAL_END
 ''')
 
+directDriverTemplate = Template('''// Export.py --layers ${LAYERS}
+//
+// Entry points that none of these layers intercept call the driver
+// dispatch table directly, unless other layers are compiled in.
+
+#if ${CONDITION}
+#define REGAL_DIRECT_DRIVER 1
+#else
+#define REGAL_DIRECT_DRIVER 0
+#endif
+
+''')
+
+def directDriverCode(layers):
+
+  if layers==None:
+    return ''
+
+  condition = [ '%s==0' % macro for name, macro in dispatchLayers if name not in layers and name not in [ 'driver', 'missing' ] ]
+  condition.append('REGAL_DRIVER')
+
+  substitute = {}
+  substitute['LAYERS']    = ','.join(layers)
+  substitute['CONDITION'] = ' && '.join(condition)
+  return directDriverTemplate.substitute(substitute)
+
+# Regal.cpp with --shards N, the entry points being in RegalShard<i>.cpp
+
+shardsSourceTemplate = Template('''${AUTOGENERATED}
+${LICENSE}
+
+// Export.py --shards ${SHARDS}
+//
+// The API entry points are split by category into
+// RegalShard0.cpp to RegalShard${LAST}.cpp
+
+#include "pch.h" /* For MS precompiled header support */
+
+#include "RegalUtil.h"
+''')
+
 def generateSource(apis, args):
 
+  filename = '%s/Regal.cpp' % args.srcdir
+  shards = getattr(args, 'shards', 1)
+
+  if shards <= 1:
+    removeShards(filename, 0)
+    outputCode(filename, apiSourceCode(fullApis(apis), args))
+    return
+
+  removeShards(filename, shards)
+
+  for i, shard in enumerate(apiShards(fullApis(apis), shards)):
+    outputCode('%s/RegalShard%d.cpp' % (args.srcdir, i), apiSourceCode(shard, args))
+
+  substitute = {}
+  substitute['LICENSE']       = args.license
+  substitute['AUTOGENERATED'] = args.generated
+  substitute['SHARDS']        = shards
+  substitute['LAST']          = shards - 1
+  outputCode(filename, shardsSourceTemplate.substitute(substitute))
+
+# Entry points of <apis>, for Regal.cpp or a shard of it
+
+def apiSourceCode(apis, args):
+
   # CodeGen for API functions.
 
   apiFuncDefine = apiFuncDefineCode( apis, args )
@@ -827,13 +913,16 @@ def generateSource(apis, args):
   substitute['COPYRIGHT']       = args.copyright
   substitute['API_FUNC_DEFINE'] = apiFuncDefine
   substitute['API_GLOBAL_DISPATCH_INIT'] = globalDispatch
+  substitute['DIRECT_DRIVER']   = directDriverCode(args.layers)
 
-  outputCode( '%s/Regal.cpp' % args.srcdir, sourceTemplate.substitute(substitute))
+  return sourceTemplate.substitute(substitute)
 
 ##############################################################################################
 
 def generateDefFile(apis, args, additional_exports):
 
+  apis = fullApis(apis)
+
   code1 = []
   code2 = []
   code3 = []
@@ -317,6 +317,15 @@ RegalContext::Init()
   RegalAssert(!initialized);
 
   RegalAssert(this);
+
+#if REGAL_DRIVER && REGAL_LOADER
+  if (Config::loadEager)
+  {
+    Loader::Eager(dispatcher.driver);
+    Loader::Eager(dispatcherGlobal.driver);
+  }
+#endif
+
   if (!info)
   {
     info = new ContextInfo();
@@ -472,6 +481,7 @@ def generateContextHeader(apis, args):
 
     emuMemberDeclare += '  // Fixed function emulation\n'
     emuMemberDeclare += '  int emuLevel;\n'
+    emuMemberDeclare += '  unsigned int emuMask;      // Emulation layers enabled, bit 1<<level of each\n'
 
     for i in emu:
       if i.get('member')!=None:
@@ -545,6 +555,7 @@ def generateContextSource(apis, args):
         memberInit      += indent(wrapIf(i['ifdef'],wrapCIf('!%s' % i['member'],'%s = new %s;\n'%(i['member'],i['type']))),'  ')
 
     emuMemberConstruct += '  emuLevel(0),\n'
+    emuMemberConstruct += '  emuMask(0),\n'
 
     emuMemberInit += '    // emu\n'
     emuMemberInit += '    emuLevel = %d;\n' % ( len( emu ) - 1 )
@@ -562,6 +573,7 @@ def generateContextSource(apis, args):
         cleanup += 'emuLevel = %d;\n' % ( int(emu[i]['level']) - 1)
         cleanup += '%s->Cleanup(*this);\n' % emu[i]['member']
         cleanup += '%s.reset(NULL);\n' % emu[i]['member']
+        cleanup += 'emuMask &= ~(1u << %d);\n' % int(emu[i]['level'])
         emuMemberCleanup += indent(wrapIf(emu[i]['ifdef'],wrapCIf(emu[i]['member'],cleanup)),'  ')
 
       revi = len( emu ) - 2 - i;
@@ -582,6 +594,7 @@ def generateContextSource(apis, args):
         if len(emu[revi]['ifdef']):
           init += '    Info("Activating emulation layer %s");\n'%(emu[revi]['ifdef'])
         init += '    %s = new %s;\n' % ( emu[revi]['member'], emu[revi]['type'] )
+        init += '    emuMask |= 1u << %d;\n' % int(emu[revi]['level'])
         init += '    emuLevel = %d;\n' % ( int(emu[revi]['level']) - 1)
         init += '    %s->Init(*this);\n' % emu[revi]['member']
         init += '  }\n'
@@ -3,7 +3,7 @@
 from string import Template, upper, replace
 
 from ApiUtil    import outputCode
-from ApiCodeGen import wrapIf
+from ApiCodeGen import wrapIf, perfectHashCode
 
 cond = { 'wgl' : 'REGAL_SYS_WGL', 'glx' : 'REGAL_SYS_GLX', 'cgl' : 'REGAL_SYS_OSX', 'egl' : 'REGAL_SYS_EGL' }
 
@@ -38,6 +38,16 @@ struct ContextInfo
   // glewGetExtension
 
   bool getExtension(const char *ext) const;
+  bool getExtension(const size_t i) const;
+  void setExtension(const size_t i, const bool value);
+
+  // Index of extension name, as used by getExtension
+
+  static size_t extensionIndex(const char *ext);
+
+  // Extension name of index, or NULL past the last one
+
+  static const char *extensionName(const size_t i);
 
   // As reported by OpenGL implementation
 
@@ -57,9 +67,6 @@ ${VERSION_DECLARE}
   // Driver context limits
 
 ${IMPL_DECLARE}
-
-private:
-  static bool stringSetFind(const std::set<std::string> &stringSet, const std::string &val);
 };
 
 REGAL_NAMESPACE_END
@@ -89,6 +96,7 @@ using namespace boost::print;
 #include "RegalToken.h"
 #include "RegalContext.h"
 #include "RegalContextInfo.h"
+#include "RegalLookup.h"
 
 REGAL_GLOBAL_END
 
@@ -284,10 +292,8 @@ ${VERSION_DETECT}
 
   // Driver extensions, etc detected by Regal
 
-  set<string> e;
-  e.insert(driverExtensions.begin(),driverExtensions.end());
-
-${EXT_INIT}
+  for (string_list<string>::const_iterator i=driverExtensions.begin(); i!=driverExtensions.end(); ++i)
+    setExtension(extensionIndex(i->c_str()),true);
 
   RegalAssert(context.dispatcher.driver.glGetIntegerv);
   RegalAssert(context.dispatcher.driver.glGetBooleanv);
@@ -299,12 +305,6 @@ ${IMPL_GET}
   warnGLError(context,"querying context information.");
 }
 
-bool
-ContextInfo::stringSetFind(const std::set<std::string> &stringSet, const std::string &val)
-{
-  return stringSet.find(val)!=stringSet.end();
-}
-
 ${EXT_CODE}
 
 REGAL_NAMESPACE_END
@@ -623,41 +623,90 @@ def originalImplGetCode(apis, args):
 
   return code
 
-def extensionStringCode(apis, args):
+# Extension names of all the apis, in sorted order.
+# ContextInfo::extensionIndex is the index into this list.
 
-  code = ''
+def extensionNames(apis):
 
+  names = []
   for api in apis:
-    tmp = ''
-    for c in sorted(api.categories):
-      tmp += '  %-50s = stringSetFind(e,"%s");\n' % (c.lower(),c)
+    names.extend(api.categories)
+  return sorted(names)
 
-    tmp = wrapIf(cond.get(api.name.lower()),tmp)
-
-    code += tmp + '\n'
+def getExtensionCode(apis, args):
 
-  return code
+  names = extensionNames(apis)
+  index = dict([ (names[i], i) for i in range(len(names)) ])
+
+  code = []
+  code.append('// Extension names in sorted order, and minimal perfect hash')
+  code.append('')
+  code.append('const char * const extensionNames[%d] = {' % len(names))
+  code.extend([ '  "%s",' % i for i in names ])
+  code[-1] = code[-1][:-1]
+  code.append('};')
+  code.append('')
+  code.extend(perfectHashCode(names,('extensionSeed','extensionSlot')))
+  code = '\n'.join(code) + '\n'
+
+  code += 'size_t\n'
+  code += 'ContextInfo::extensionIndex(const char *ext)\n'
+  code += '{\n'
+  code += '  return Lookup::NameIndex(ext, extensionNames, extensionSeed, extensionSlot, %d);\n' % len(names)
+  code += '}\n\n'
 
-def getExtensionCode(apis, args):
+  code += 'const char *\n'
+  code += 'ContextInfo::extensionName(const size_t i)\n'
+  code += '{\n'
+  code += '  return i<%d ? extensionNames[i] : NULL;\n' % len(names)
+  code += '}\n\n'
 
-  code = ''
   code += 'bool\n'
   code += 'ContextInfo::getExtension(const char *ext) const\n'
   code += '{\n'
   code += '  Internal("ContextInfo::getExtension ",boost::print::quote(ext,\'"\'));\n'
   code += '\n'
+  code += '  return getExtension(extensionIndex(ext));\n'
+  code += '}\n\n'
+
+  code += 'bool\n'
+  code += 'ContextInfo::getExtension(const size_t i) const\n'
+  code += '{\n'
+  code += '  switch (i)\n'
+  code += '  {\n'
+
+  for api in apis:
+
+    tmp = ''
+    for c in sorted(api.categories):
+      tmp += '    %-12s return %s;\n'%('case %d:'%index[c],c.lower())
+
+    tmp = wrapIf(cond.get(api.name.lower()),tmp)
+
+    code += tmp + '\n'
+
+  code += '    default:     return false;\n'
+  code += '  }\n'
+  code += '}\n\n'
+
+  code += 'void\n'
+  code += 'ContextInfo::setExtension(const size_t i, const bool value)\n'
+  code += '{\n'
+  code += '  switch (i)\n'
+  code += '  {\n'
 
   for api in apis:
 
     tmp = ''
     for c in sorted(api.categories):
-      tmp += '  %-60s %s;\n'%('if (!strcmp(ext,"%s"))'%c,'return %s'%c.lower())
+      tmp += '    %-12s %s = value; break;\n'%('case %d:'%index[c],c.lower())
 
     tmp = wrapIf(cond.get(api.name.lower()),tmp)
 
     code += tmp + '\n'
 
-  code += '  return false;\n'
+  code += '    default:     break;\n'
+  code += '  }\n'
   code += '}\n\n'
 
   return code
@@ -681,7 +730,6 @@ def generateContextInfoSource(apis, args):
     substitute['COPYRIGHT']      = args.copyright
     substitute['VERSION_INIT']   = versionInitCode(apis,args)
     substitute['VERSION_DETECT'] = versionDetectCode(apis,args)
-    substitute['EXT_INIT']       = extensionStringCode(apis,args)
     substitute['EXT_CODE']       = getExtensionCode(apis,args)
     substitute['IMPL_INIT']      = implInitCode(apis,args)
     substitute['IMPL_GET']       = implGetCode(apis,args)
@@ -8,14 +8,13 @@ from ApiUtil import typeIsVoid
 from ApiCodeGen import *
 
 from RegalDispatchShared import dispatchSourceTemplate
-#from RegalDispatchLog import apiDispatchFuncInitCode
-from RegalDispatchEmu import dispatchSourceTemplate
 from RegalContextInfo import cond
 
 ##############################################################################################
 
 def apiDispatchTableDefineCode(apis, args, apiNames, structName):
-  code = '''
+  w = CodeWriter()
+  w.write('''
   struct %s
   {
     inline void setFunction(const size_t offset, void *func)
@@ -23,60 +22,42 @@ def apiDispatchTableDefineCode(apis, args, apiNames, structName):
       RegalAssert((offset*sizeof(void *))<sizeof(*this));
       ((void **)(this))[offset] = func;
     }
-'''%(structName)
+'''%(structName))
 
-  for api in apis:
+  with w.indent('    '):
 
-    if not api.name in apiNames:
-      continue
+    for api in apis:
 
-    code += '\n'
-    if api.name in cond:
-      code += '#if %s\n' % cond[api.name]
-
-    categoryPrev = None
-
-    for function in api.functions:
-
-      if getattr(function,'regalOnly',False)==True:
+      if not api.name in apiNames:
         continue
 
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
+      w()
+      with w.condition(cond.get(api.name)):
 
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+        w.categoryPrev = None
 
-      # Close prev if block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
+        for function in api.functions:
 
-      # Begin new if block.
-      if category and not (category == categoryPrev):
-        code += '    // %s\n\n' % category
+          if function.view.regalOnly:
+            continue
 
-      code += '    %s(REGAL_CALL *%s)(%s);\n' % (rType, name, params)
+          view      = function.view
+          name      = view.name
+          params    = view.params
+          rType     = view.rType
+          category  = view.category
 
-      categoryPrev = category
+          w.category(category)
 
-    if api.name in cond:
-      code += '#endif // %s\n' % cond[api.name]
-    code += '\n'
+          w('%s(REGAL_CALL *%s)(%s);' % (rType, name, params))
 
+      w()
 
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
+    w.endCategory()
 
-  code += '  };\n'
+  w('  };')
 
-  return code
+  return w.text()
 
 dispatchHeaderTemplate = Template( '''${AUTOGENERATED}
 ${LICENSE}
@@ -102,6 +83,7 @@ ${API_DISPATCH_TABLE_DEFINE}
 
   // Lookup a function pointer from the table,
   // or deeper in the stack as necessary.
+  // For tables outside a Dispatcher, such as for testing.
 
   template<typename T, typename F>
   F call(T &table, F *func)
@@ -136,6 +118,19 @@ ${API_DISPATCH_TABLE_DEFINE}
     return f;
   }
 
+  // Lookup a function pointer from the flattened stack
+  // of a table in a Dispatcher, see Dispatcher::resolve
+
+  template<typename T, typename F>
+  inline F resolved(T &table, F *func)
+  {
+    RegalAssert(func);
+    RegalAssert(table._resolved);
+
+    const std::size_t offset = reinterpret_cast<char *>(func) - reinterpret_cast<char *>(&table);
+    return *reinterpret_cast<F *>(reinterpret_cast<void *>(table._resolved + offset/sizeof(void *)));
+  }
+
 }
 
 struct DispatchTable
@@ -143,12 +138,13 @@ struct DispatchTable
   bool           _enabled;
   DispatchTable *_prev;
   DispatchTable *_next;
+  void         **_resolved;   // Function pointers resolved by the Dispatcher, or NULL
 };
 
 struct DispatchTableGL : public DispatchTable, Dispatch::GL
 {
 public:
-  template<typename T> T call(T *func) { return reinterpret_cast<T>(doCall(reinterpret_cast<void **>(func))); }
+  template<typename T> T call(T *func) { return _resolved ? Dispatch::resolved(*this,func) : reinterpret_cast<T>(doCall(reinterpret_cast<void **>(func))); }
   inline DispatchTableGL *next()       { return reinterpret_cast<DispatchTableGL *>(DispatchTable::_next);    }
 
 private:
@@ -160,7 +156,7 @@ struct DispatchTableGlobal : public DispatchTable, Dispatch::Global
   DispatchTableGlobal();
   ~DispatchTableGlobal();
 
-  template<typename T> T call(T *func) { return reinterpret_cast<T>(doCall(reinterpret_cast<void **>(func)));  }
+  template<typename T> T call(T *func) { return _resolved ? Dispatch::resolved(*this,func) : reinterpret_cast<T>(doCall(reinterpret_cast<void **>(func)));  }
   inline DispatchTableGlobal *next()   { return reinterpret_cast<DispatchTableGlobal *>(DispatchTable::_next); }
 
 private:
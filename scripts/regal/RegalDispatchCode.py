@@ -18,6 +18,8 @@ from ApiRegal     import helperMap
 
 from RegalContextInfo import cond
 
+from RegalDispatchShared import outputDispatchSource
+
 # Exclude some functions from the output
 
 exclude = set(['glGetString','glGetIntegerv','glGetError','glGetGraphicsResetStatusARB', 'glGetProgramInfoLog'])
@@ -27,27 +29,26 @@ exclude.update(['glGetTexLevelParameteriv','glGetTexImage'])
 # Code generation for dispatch table init.
 
 def apiDispatchCodeInitCode(apis, args, dispatchName):
-
-  code = ''
+  w = CodeWriter()
 
   for api in apis:
     if api.name=='gl':
 
       for function in api.functions:
 
-        if not function.needsContext:
+        if not function.view.needsContext:
           continue
 
-        if getattr(function,'regalOnly',False)==True:
+        if function.view.regalOnly:
           continue
 
         if function.name in exclude:
           continue
 
         name = function.name
-        code += '  tbl.%s = %s_%s;\n' % ( name, dispatchName, name )
+        w('  tbl.%s = %s_%s;' % ( name, dispatchName, name ))
 
-  return code
+  return w.text()
 
 # Template for RegalDispatchCode.cpp
 
@@ -83,7 +84,7 @@ using namespace ::boost::print;
 
 ${API_FUNC_DEFINE}
 
-void InitDispatchTableCode(DispatchTableGL &tbl)
+void InitDispatchTable${DISPATCH_NAME}(DispatchTableGL &tbl)
 {
 ${API_GLOBAL_DISPATCH_INIT}
 }
@@ -95,19 +96,18 @@ REGAL_NAMESPACE_END
 
 # Code generation for generating C code from GL API calls
 
-def generateDispatchCode(apis, args):
-
-  code = ''
+def codeSource(apis, args, dispatchName):
+  w = CodeWriter()
 
   for api in apis:
     if api.name=='gl':
 
       for function in api.functions:
 
-        if not function.needsContext:
+        if not function.view.needsContext:
           continue
 
-        if getattr(function,'regalOnly',False)==True:
+        if function.view.regalOnly:
           continue
 
         if function.name in exclude:
@@ -121,17 +121,17 @@ def generateDispatchCode(apis, args):
         callParams = paramsNameCode(f.parameters)
         rType  = typeCode(f.ret.type)
 
-        code += 'static %sREGAL_CALL %s%s(%s) \n{\n' % (rType, 'code_', name, params)
-
-        code += '    RegalContext *_context = REGAL_GET_CONTEXT();\n'
-        code += '    RegalAssert(_context);\n'
-        code += '    DispatchTableGL *_next = _context->dispatcher.code.next();\n'
-        code += '    RegalAssert(_next);\n'
-        code += '    '
+        w('static %sREGAL_CALL %s%s(%s) ' % (rType, 'code_', name, params),
+          '{',
+          '    RegalContext *_context = REGAL_GET_CONTEXT();',
+          '    RegalAssert(_context);',
+          '    DispatchTableGL *_next = _context->dispatcher.code.next();',
+          '    RegalAssert(_next);')
 
         if not typeIsVoid(rType):
-          code += '%s _ret = '%(rType)
-        code += '_next->call(&_next->%s)(%s);\n' % ( name, callParams )
+          w('    %s _ret = _next->call(&_next->%s)(%s);' % ( rType, name, callParams ))
+        else:
+          w('    _next->call(&_next->%s)(%s);' % ( name, callParams ))
 
         # comment-out calls to functions flagged as trace = False
 
@@ -141,44 +141,45 @@ def generateDispatchCode(apis, args):
           prefix += '/* '
           suffix += ' */'
 
+        # Declarations, then the body, for each function
+
         h      = False
-        h1 =  '    std::string indent((_context->depthBeginEnd + _context->depthPushAttrib + 1)*2,\' \');\n'
-        h2 =  ''
-        body   =  ''
+        h2     = CodeWriter()
+        body   = CodeWriter()
 
         ret = ''
         if not typeIsVoid(rType):
           if   f.name in [ 'glCreateShader','glCreateShaderObjectARB' ]:
-            h2 += '    size_t _retIndex = _context->codeShaderNext++;\n'
+            h2('    size_t _retIndex = _context->codeShaderNext++;')
             ret = 'const %s shader\" << _retIndex << \" = '%typeStrip(rType)
           elif f.name in [ 'glCreateProgram','glCreateProgramObjectARB']:
-            h2 += '    size_t _retIndex = _context->codeProgramNext++;\n'
+            h2('    size_t _retIndex = _context->codeProgramNext++;')
             ret = 'const %s program\" << _retIndex << \" = '%typeStrip(rType)
           else:
-            h2 += '    size_t _retIndex = _context->codeOutputNext++;\n'
+            h2('    size_t _retIndex = _context->codeOutputNext++;')
             ret = 'const %s o\" << _retIndex << \" = '%typeStrip(rType)
 
         if len(f.parameters)==0:
-          body += '    %s_code << indent << "%s%s();%s\\n";\n'%(prefix,ret,f.name,suffix)
+          body('    %s_code << indent << "%s%s();%s\\n";'%(prefix,ret,f.name,suffix))
         else:
-          body += '    %s_code << indent << "%s%s(";\n'%(prefix,ret,f.name)
+          body('    %s_code << indent << "%s%s(";'%(prefix,ret,f.name))
 
           if f.name.startswith('glShaderSource'):
-            h2 += '    std::string _delim = print_string("\\\\n\\"\\n",indent,"  \\"");\n'
-            h2 += '    size_t _stringIndex = _context->codeInputNext++;\n'
-            h2 += '    _code << indent << \"const char *i\" << _stringIndex << \" =\\n\";\n'
-            h2 += '    _code << indent << "  \\\"" << string_list< ::std::string >(string_list< ::std::string >(count,string,length).str(),\'\\n\').join(_delim) << "\\";\\n";\n'
-            body   += '    _code << %s << ",1,&i" <<_stringIndex << ",NULL);\\n";\n'%(f.parameters[0].name)
+            h2('    std::string _delim = print_string("\\\\n\\"\\n",indent,"  \\"");',
+               '    size_t _stringIndex = _context->codeInputNext++;',
+               '    _code << indent << \"const char *i\" << _stringIndex << \" =\\n\";',
+               '    _code << indent << "  \\\"" << string_list< ::std::string >(string_list< ::std::string >(count,string,length).str(),\'\\n\').join(_delim) << "\\";\\n";')
+            body('    _code << %s << ",1,&i" <<_stringIndex << ",NULL);\\n";'%(f.parameters[0].name))
 
           else:
             delim = False
             for i in f.parameters:
               if delim:
-                body += '    _code << ", "; '
+                lead = '    _code << ", "; '
               elif len(f.parameters)>1:
-                body += '                   '
+                lead = '                   '
               else:
-                body += '    '
+                lead = '    '
 
 #             p = cCodeParameter(f,i)
               p = logParameter(f,i)
@@ -186,7 +187,7 @@ def generateDispatchCode(apis, args):
               # For parameters not handled yet...
 
               if p==None:
-                  body += '_code << "/* %s = ?? */";\n'%(i.name)
+                  body(lead + '_code << "/* %s = ?? */";'%(i.name))
 
               # Special handling for input or output arrays
 
@@ -197,70 +198,74 @@ def generateDispatchCode(apis, args):
                     size = i.maxSize
                   if i.input:
                     if p.find('helper')==-1 and type!='GLchar' and type!='GLcharARB':
-                      h2 += '    size_t _%sIndex = _context->codeInputNext++;\n'%(i.name)
-                      h2 += '    _code << indent << \"const %s i\" << _%sIndex << \"[\" << %s << \"] = \" '%(type,i.name,expressionSimplify('(%s)'%size))
-                      h2 += '<< array<%s,const char * const>(%s,%s,\"\",\"{ \",\" };\",\", \") '%(type,i.name,size)
-                      h2 += '<< \"\\n\";\n'
-                      body += '_code << \"i\" << _%sIndex;\n'%(i.name)
+                      h2('    size_t _%sIndex = _context->codeInputNext++;'%(i.name),
+                         '    _code << indent << \"const %s i\" << _%sIndex << \"[\" << %s << \"] = \" '%(type,i.name,expressionSimplify('(%s)'%size)) +
+                         '<< array<%s,const char * const>(%s,%s,\"\",\"{ \",\" };\",\", \") '%(type,i.name,size) +
+                         '<< \"\\n\";')
+                      body(lead + '_code << \"i\" << _%sIndex;'%(i.name))
                     else:
-                      body += '_code << "/* %s = ?? */";\n'%(i.name)
+                      body(lead + '_code << "/* %s = ?? */";'%(i.name))
                   else:
                     if p.find('helper')==-1 and type!='GLchar' and type!='GLcharARB':
-                      h2 += '    size_t _%sIndex = _context->codeOutputNext++;\n'%(i.name)
-                      h2 += '    _code << indent << \"%s o\" << _%sIndex << \"[\" << %s << \"];\\n";\n'%(type,i.name,expressionSimplify('(%s)'%size))
-                      body += '_code << \"o\" << _%sIndex;\n'%(i.name)
+                      h2('    size_t _%sIndex = _context->codeOutputNext++;'%(i.name),
+                         '    _code << indent << \"%s o\" << _%sIndex << \"[\" << %s << \"];\\n";'%(type,i.name,expressionSimplify('(%s)'%size)))
+                      body(lead + '_code << \"o\" << _%sIndex;'%(i.name))
                     else:
-                      body += '_code << "/* %s = ?? */";\n'%(i.name)
+                      body(lead + '_code << "/* %s = ?? */";'%(i.name))
 
               # glTexImage2D etc
 
               elif i.input and i.size != None and (isinstance(i.size, str) or isinstance(i.size, unicode)) and i.size.startswith('helperGLPixelImageSize'):
-                h2 += '    size_t _%sIndex = _context->codeTextureNext++;\n'%(i.name)
-                h2 += '    _header << indent << \"const GLubyte texture\" << _%sIndex << \"[\" << helper::size::pixelImage(%s << \"] = \" '%(i.name,i.size.split('(',1)[1])
-                h2 += '<< array<GLubyte,const char * const>(static_cast<const GLubyte *>(%s),helper::size::pixelImage(%s,\"\",\"{ \",\" }\",\",\") '%(i.name,i.size.split('(',1)[1])
-                h2 += '<< \";\\n\";\n'
+                h2('    size_t _%sIndex = _context->codeTextureNext++;'%(i.name),
+                   '    _header << indent << \"const GLubyte texture\" << _%sIndex << \"[\" << helper::size::pixelImage(%s << \"] = \" '%(i.name,i.size.split('(',1)[1]) +
+                   '<< array<GLubyte,const char * const>(static_cast<const GLubyte *>(%s),helper::size::pixelImage(%s,\"\",\"{ \",\" }\",\",\") '%(i.name,i.size.split('(',1)[1]) +
+                   '<< \";\\n\";')
                 h = True
-                body += '_code << \"texture\" << _%sIndex;\n'%(i.name)
+                body(lead + '_code << \"texture\" << _%sIndex;'%(i.name))
 
               elif p.startswith('boost::print::optional'):
                 if i.cast != None:
-                  body += '_code << reinterpret_cast<%s>(%s);\n'%(i.cast,i.name)
+                  body(lead + '_code << reinterpret_cast<%s>(%s);'%(i.cast,i.name))
                 else:
-                  body += '_code << %s;\n'%(i.name)
+                  body(lead + '_code << %s;'%(i.name))
 
               # 0x prefix for hex output
 
               elif p.startswith('boost::print::hex'):
-                body += '_code << \"0x\" << %s;\n'%(p)
+                body(lead + '_code << \"0x\" << %s;'%(p))
 
               elif p.startswith('boost::print::raw'):   # Buffer data needs better handling, revisit
-                  body += '_code << "NULL";\n'
+                  body(lead + '_code << "NULL";')
 
               else:
-                  body += '_code << %s;\n'%(p)
+                  body(lead + '_code << %s;'%(p))
 
               delim = True
 
-            body += '    _code << ");%s\\n";\n'%(suffix)
+            body('    _code << ");%s\\n";'%(suffix))
 
-        h1 += '    string_list< ::std::string > _code;\n'
-        body += '    if (_context->codeSource)\n'
-        body += '      fprintf(_context->codeSource,"%s",_code.str().c_str());\n'
+        body('    if (_context->codeSource)',
+             '      fprintf(_context->codeSource,"%s",_code.str().c_str());')
 
         if h:
-          h1 += '    string_list< ::std::string > _header;\n'
-          body += '    if (_context->codeHeader)\n'
-          body += '      fprintf(_context->codeHeader,"%s",_header.str().c_str());\n'
+          body('    if (_context->codeHeader)',
+               '      fprintf(_context->codeHeader,"%s",_header.str().c_str());')
 
-#         body += '    Internal("code_%s",_code);\n'%name
+#         body('    Internal("code_%s",_code);'%name)
 
-        code += h1 + h2 + body
+        w('    std::string indent((_context->depthBeginEnd + _context->depthPushAttrib + 1)*2,\' \');',
+          '    string_list< ::std::string > _code;')
+        if h:
+          w('    string_list< ::std::string > _header;')
+        w.write(h2.text())
+        w.write(body.text())
 
         if not typeIsVoid(rType):
-          code += '    return _ret;\n'
-        code += '}\n\n'
+          w('    return _ret;')
+        w('}')
+        w()
 
-    code += '\n'
+    w()
 
   funcInit   = apiDispatchCodeInitCode( apis, args, 'code' )
 
@@ -270,7 +275,11 @@ def generateDispatchCode(apis, args):
   substitute['LICENSE']         = args.license
   substitute['AUTOGENERATED']   = args.generated
   substitute['COPYRIGHT']       = args.copyright
-  substitute['API_FUNC_DEFINE'] = code
+  substitute['DISPATCH_NAME']   = dispatchName
+  substitute['API_FUNC_DEFINE'] = w.text()
   substitute['API_GLOBAL_DISPATCH_INIT'] = funcInit
 
-  outputCode( '%s/RegalDispatchCode.cpp' % args.srcdir, dispatchCodeTemplate.substitute(substitute))
+  return dispatchCodeTemplate.substitute(substitute)
+
+def generateDispatchCode(apis, args):
+  outputDispatchSource(apis, args, 'Code', codeSource, '#if REGAL_CODE\n\n', '#endif\n')
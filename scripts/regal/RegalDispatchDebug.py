@@ -9,7 +9,8 @@ from ApiCodeGen import *
 
 from RegalContextInfo import cond
 
-from RegalDispatchShared import dispatchSourceTemplate, apiDispatchFuncInitCode
+from RegalDispatchShared import dispatchSourceTemplate, apiDispatchFuncInitCode, outputDispatchSource
+from RegalDispatchShared import DispatchThunks
 
 from Emu       import emuFindEntry, emuCodeGen
 
@@ -17,85 +18,87 @@ from DispatchDebug import debugDispatchFormulae
 
 ##############################################################################################
 
+# Functions dispatched by the debug layer
+
+def debugFunctions(api):
+  return [ i for i in api.functions if i.view.needsContext and not i.view.regalOnly ]
+
+# Functions without a debug prefix, dispatched by thunks
+
+def debugPassThrough(function):
+  e = emuFindEntry( function, debugDispatchFormulae, '' )
+  return e == None or 'prefix' not in e
+
 # CodeGen for API debug function definition.
 
-def apiDebugFuncDefineCode(apis, args):
-  categoryPrev = None
-  code = ''
+def apiDebugFuncDefineCode(apis, args, thunks):
+  w = CodeWriter()
 
   for api in apis:
 
-    code += '\n'
-    if api.name in cond:
-      code += '#if %s\n' % cond[api.name]
-
-    for function in api.functions:
-      if not function.needsContext:
-        continue
-      if getattr(function,'regalOnly',False)==True:
-        continue
-
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
-
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
-
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
-
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '// %s\n\n' % category
-
-      categoryPrev = category
-
-      code += 'static %sREGAL_CALL %s%s(%s) \n{\n' % (rType, 'debug_', name, params)
-      code += '  RegalContext *_context = REGAL_GET_CONTEXT();\n'
-      code += '  RegalAssert(_context);\n'
-      code += '  DispatchTableGL *_next = _context->dispatcher.debug.next();\n'
-      code += '  RegalAssert(_next);\n'
-      e = emuFindEntry( function, debugDispatchFormulae, '' )
-      if e != None and 'prefix' in e :
-        for l in e['prefix'] :
-          code += '  %s\n' % l
-      code += '  '
-      if not typeIsVoid(rType):
-        code += '%s ret = ' % rType
-      code += '_next->call(&_next->%s)(%s);\n' % ( name, callParams )
-      if not typeIsVoid(rType):
-        code += '  return ret;\n'
-      code += '}\n\n'
-
-    if api.name in cond:
-      code += '#endif // %s\n' % cond[api.name]
-    code += '\n'
-
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
-
-  return code
+    w()
+    with w.condition(cond.get(api.name)):
+
+      functions = debugFunctions(api)
+      thunks.code(w, [ i for i in functions if debugPassThrough(i) ])
+
+      for function in functions:
+        if function.name in thunks.init:
+          continue
+
+        view       = function.view
+        name       = view.name
+        params     = view.params
+        callParams = view.callParams
+        rType      = view.rType
+        category   = view.category
+
+        w.category(category)
+
+        w('static %sREGAL_CALL %s%s(%s) ' % (rType, 'debug_', name, params),
+          '{')
+        with w.indent():
+          w('RegalContext *_context = REGAL_GET_CONTEXT();',
+            'RegalAssert(_context);',
+            'DispatchTableGL *_next = _context->dispatcher.debug.next();',
+            'RegalAssert(_next);')
+          e = emuFindEntry( function, debugDispatchFormulae, '' )
+          if e != None and 'prefix' in e :
+            w.lines(e['prefix'])
+          if not typeIsVoid(rType):
+            w('%s ret = _next->call(&_next->%s)(%s);' % ( rType, name, callParams ),
+              'return ret;')
+          else:
+            w('_next->call(&_next->%s)(%s);' % ( name, callParams ))
+        w('}')
+        w()
+
+    w()
+
+  w.endCategory()
+
+  return w.text()
 
 debugGlobalCode = '''
 #include "RegalDebugInfo.h"
 '''
 
 debugLocalCode = '''
+static DispatchTableGL *debug_next()
+{
+  RegalContext *_context = REGAL_GET_CONTEXT();
+  RegalAssert(_context);
+  DispatchTableGL *_next = _context->dispatcher.debug.next();
+  RegalAssert(_next);
+  return _next;
+}
 '''
 
-def generateDebugSource(apis, args):
+def debugSource(apis, args, name):
 
-  funcDefine = apiDebugFuncDefineCode( apis, args )
-  funcInit   = apiDispatchFuncInitCode( apis, args, 'debug' )
+  thunks     = DispatchThunks('debug_')
+  funcDefine = apiDebugFuncDefineCode( apis, args, thunks )
+  funcInit   = apiDispatchFuncInitCode( apis, args, 'debug', thunks = thunks )
 
   # Output
 
@@ -104,14 +107,17 @@ def generateDebugSource(apis, args):
   substitute['LICENSE']         = args.license
   substitute['AUTOGENERATED']   = args.generated
   substitute['COPYRIGHT']       = args.copyright
-  substitute['DISPATCH_NAME']   = 'Debug'
+  substitute['DISPATCH_NAME']   = name
   substitute['LOCAL_INCLUDE']   = debugGlobalCode
-  substitute['LOCAL_CODE']      = debugLocalCode
+  substitute['LOCAL_CODE']      = thunks.count and debugLocalCode or ''
   substitute['API_DISPATCH_FUNC_DEFINE'] = funcDefine
   substitute['API_DISPATCH_FUNC_INIT'] = funcInit
   substitute['API_DISPATCH_GLOBAL_FUNC_INIT'] = ''
   substitute['IFDEF'] = '#if REGAL_DEBUG\n\n'
   substitute['ENDIF'] = '#endif\n'
 
-  outputCode( '%s/RegalDispatchDebug.cpp' % args.srcdir, dispatchSourceTemplate.substitute(substitute))
+  return dispatchSourceTemplate.substitute(substitute)
+
+def generateDebugSource(apis, args):
+  outputDispatchSource(apis, args, 'Debug', debugSource, '#if REGAL_DEBUG\n\n', '#endif\n')
 
@@ -9,356 +9,300 @@ from ApiCodeGen import *
 
 from RegalContext     import emu
 from RegalContextInfo import cond
-from RegalDispatchShared import dispatchSourceTemplate
+from RegalDispatchShared import dispatchSourceTemplate, outputDispatchSource
 
 from Emu       import emuFindEntry, emuCodeGen
 
 ##############################################################################################
 
 
+# Bits of the emulation layers in <level>, as in _context->emuMask
+
+def emuMask(level):
+  mask = 0
+  for l,e in level:
+    mask |= 1 << int(l['level'])
+  return mask
+
 # CodeGen for API emu function definition.
 
 def apiEmuFuncDefineCode(apis, args):
-    categoryPrev = None
-    code = ''
+    w = CodeWriter()
 
     for api in apis:
 
-        code += '\n'
-        if api.name in cond:
-            code += '#if %s\n' % cond[api.name]
-
-        for function in api.functions:
-            if not function.needsContext:
-                continue
-            if getattr(function,'regalOnly',False)==True:
-              continue
-
-            name   = function.name
-            params = paramsDefaultCode(function.parameters, True)
-            callParams = paramsNameCode(function.parameters)
-            rType  = typeCode(function.ret.type)
-            category  = getattr(function, 'category', None)
-            version   = getattr(function, 'version', None)
-
-            if category:
-                category = category.replace('_DEPRECATED', '')
-            elif version:
-                category = version.replace('.', '_')
-                category = 'GL_VERSION_' + category
-
-            # Close prev category block.
-            if categoryPrev and not (category == categoryPrev):
-                code += '\n'
-
-            # Begin new category block.
-            if category and not (category == categoryPrev):
-                code += '// %s\n\n' % category
-
-            categoryPrev = category
-
-            emue = [ emuFindEntry( function, i['formulae'], i['member'] ) for i in emu ]
-
-            if all(i is None for i in emue) and (getattr(function,'regalRemap',None)==None or isinstance(function.regalRemap, str) or isinstance(function.regalRemap, unicode)):
-                continue
-
-            code += '\nstatic %sREGAL_CALL %s%s(%s) \n{\n' % (rType, 'emu_', name, params)
-            code += '  RegalContext *_context = REGAL_GET_CONTEXT();\n'
-            code += '  RegalAssert(_context);\n'
-            code += '  DispatchTableGL &_dispatch = _context->dispatcher.emulation;\n'
-            code += '\n'
-
-            level = [ (emu[i], emuFindEntry( function, emu[i]['formulae'], emu[i]['member'] )) for i in range( len( emue ) - 1 ) ]
-
-            # PREFIX
-
-            if not all(i[1]==None or not 'prefix' in i[1] and not 'impl' in i[1] for i in level):
-              code += '  // prefix\n'
-              code += '  switch( _context->emuLevel )\n'
-              code += '  {\n'
-              for i in level:
-                  l,e = i[0], i[1]
-                  code += '    case %d :\n' % l['level']
-                  if l['ifdef']:
-                      code += '      #if %s\n' % l['ifdef']
-                  if e != None and 'prefix' in e and len(e['prefix']):
-
-                      if l['member']:
-                        code += '      if (_context->%s)\n' % l['member']
-                        code += '      {\n'
-                        code += '        Push<int> pushLevel(_context->emuLevel);\n'
-                        code += '        _context->emuLevel = %d;\n' %( int(l['level']) - 1 )
+        w()
+        with w.condition(cond.get(api.name)):
+
+            for function in api.functions:
+                if not function.view.needsContext:
+                    continue
+                if function.view.regalOnly:
+                  continue
+
+                view       = function.view
+                name       = view.name
+                params     = view.params
+                callParams = view.callParams
+                rType      = view.rType
+                category   = view.category
+
+                w.category(category)
+
+                emue = [ emuFindEntry( function, i['formulae'], i['member'] ) for i in emu ]
+
+                if all(i is None for i in emue) and (getattr(function,'regalRemap',None)==None or isinstance(function.regalRemap, str) or isinstance(function.regalRemap, unicode)):
+                    continue
+
+                w()
+                w('static %sREGAL_CALL %s%s(%s)' % (rType, 'emu_', name, params),
+                  '{',
+                  '  RegalContext *_context = REGAL_GET_CONTEXT();',
+                  '  RegalAssert(_context);',
+                  '  DispatchTableGL &_dispatch = _context->dispatcher.emulation;')
+                w()
+
+                level = [ (emu[i], emuFindEntry( function, emu[i]['formulae'], emu[i]['member'] )) for i in range( len( emue ) - 1 ) ]
+
+                # Each emulation layer is bit 1<<level of _context->emuMask,
+                # those at or below the current level are active.
+
+                prefix = [ i for i in level if i[1]!=None and ('prefix' in i[1] and len(i[1]['prefix']) or 'impl' in i[1]) ]
+                impl   = [ i for i in level if i[1]!=None and 'impl' in i[1] and len(i[1]['impl']) ]
+
+                if len(prefix) or len(impl):
+                  w('  const unsigned int _active = _context->emuMask & ((2u << _context->emuLevel) - 1);')
+                  w()
+
+                # PREFIX
+
+                if len(prefix):
+                  brk = [ i for i in prefix if 'impl' in i[1] ]
+                  w('  // prefix',
+                    '  if (_active & 0x%05xu)' % emuMask(prefix))
+                  if len(brk):
+                    w('  do')
+                  w('  {')
+                  for i in prefix:
+                      l,e = i[0], i[1]
+                      if l['ifdef']:
+                          w('    #if %s' % l['ifdef'])
+                      if 'prefix' in e and len(e['prefix']):
+
+                          w('    if (_active & 0x%05xu)' % emuMask([i]),
+                            '    {',
+                            '      Push<int> pushLevel(_context->emuLevel);',
+                            '      _context->emuLevel = %d;' %( int(l['level']) - 1 ))
+
+                          if l['plugin']:
+                            w('      #if REGAL_PLUGIN',
+                              '      Thread::ThreadLocal &_instance = Thread::ThreadLocal::instance();',
+                              '      Push<DispatchTableGL *> pushDispatchTable(_instance.nextDispatchTable);',
+                              '      _instance.nextDispatchTable = &_context->dispatcher.emulation;',
+                              '      #endif')
+
+                          with w.indent('      '):
+                            w.lines(e['prefix'])
+                          w('    }')
+                      if 'impl' in e:
+                          w('    if (_active & 0x%05xu) break;' % emuMask([i]))
+                      if l['ifdef']:
+                          w('    #endif')
+                  if len(brk):
+                    w('  } while (0);')
+                  else:
+                    w('  }')
+                  w()
+
+                # Remap, as necessary
+                remap = getattr(function, 'regalRemap', None)
+                es2Name = None
+                if remap!=None and isinstance(remap, dict):
+                  es2Name = remap.get('ES2.0',None)
+                  es2Params = callParams
+                  if es2Name != None:
+                    j = es2Name.find('(')
+                    if j!=-1:
+                      es2Params = es2Name[j+1:-1]
+                      es2Name   = es2Name[0:j]
+
+                ret = ''
+                if not typeIsVoid(rType):
+                  ret = 'return '
 
-                      if l['plugin']:
-                        code += '        #if REGAL_PLUGIN\n'
-                        code += '        Thread::ThreadLocal &_instance = Thread::ThreadLocal::instance();\n'
-                        code += '        Push<DispatchTableGL *> pushDispatchTable(_instance.nextDispatchTable);\n'
-                        code += '        _instance.nextDispatchTable = &_context->dispatcher.emulation;\n'
-                        code += '        #endif\n'
-
-                      code += listToString(indent(e['prefix'],'        '))
-                      if l['member'] :
-                          code += '      }\n'
-                  if e!= None and 'impl' in e and l['member']:
-                      code += '      if (_context->%s) break;\n' % l['member'];
-                  if l['ifdef']:
-                      code += '      #endif\n'
-              code += '    default:\n'
-              code += '      break;\n'
-              code += '  }\n\n'
-
-            # Remap, as necessary
-            remap = getattr(function, 'regalRemap', None)
-            es2Name = None
-            if remap!=None and isinstance(remap, dict):
-              es2Name = remap.get('ES2.0',None)
-              es2Params = callParams
-              if es2Name != None:
-                j = es2Name.find('(')
-                if j!=-1:
-                  es2Params = es2Name[j+1:-1]
-                  es2Name   = es2Name[0:j]
-
-            # IMPL
-
-            if not all(i[1]==None or not 'impl' in i[1] for i in level):
-              code += '  // impl\n'
-              code += '  switch( _context->emuLevel )\n'
-              code += '  {\n'
-              for i in level:
-                  l,e = i[0], i[1]
-                  code += '    case %d :\n' % l['level']
-                  if l['ifdef']:
-                      code += '      #if %s\n' % l['ifdef']
-                  if e != None and 'impl' in e and len(e['impl']):
-
-                      if l['member'] :
-                        code += '      if (_context->%s)\n' % l['member']
-                        code += '      {\n'
-                        code += '        Push<int> pushLevel(_context->emuLevel);\n'
-                        code += '        _context->emuLevel = %d;\n' %( int(l['level']) - 1 )
+                # IMPL
+
+                if len(impl):
+                  w('  // impl',
+                    '  if (_active & 0x%05xu)' % emuMask(impl),
+                    '  {')
+                  for i in impl:
+                      l,e = i[0], i[1]
+                      if l['ifdef']:
+                          w('    #if %s' % l['ifdef'])
+
+                      w('    if (_active & 0x%05xu)' % emuMask([i]),
+                        '    {',
+                        '      Push<int> pushLevel(_context->emuLevel);',
+                        '      _context->emuLevel = %d;' %( int(l['level']) - 1 ))
 
                       if l['plugin']:
-                        code += '        #if REGAL_PLUGIN\n'
-                        code += '        Thread::ThreadLocal &_instance = Thread::ThreadLocal::instance();\n'
-                        code += '        Push<DispatchTableGL *> pushDispatchTable(_instance.nextDispatchTable);\n'
-                        code += '        _instance.nextDispatchTable = &_context->dispatcher.emulation;\n'
-                        code += '        #endif\n'
-
-                      code += listToString(indent(e['impl'],'        '))
-                      if l['member'] :
-                          if l['member'] != "filt" and typeIsVoid(rType):
-                              code += '        return;\n'
-                          code += '      }\n'
-                  if l['ifdef']:
-                      code += '      #endif\n'
-              code += '    default: \n'
-              code += '    {\n'
-
-              # glEnable/glDisable/glIsEnabled constraints for ES 2.0
-              # http://www.khronos.org/opengles/sdk/docs/man/xhtml/glEnable.xml
-
-              if name=='glEnable' or name=='glDisable' or name=='glIsEnabled':
-                code += '       if (_context->isES2())\n'
-                code += '         switch (cap)\n'
-                code += '         {\n'
-                for i in api.enums:
-                  if i.name=='defines':
-                    for j in i.enumerantsByName:
-                      if getattr(j,'esVersions',None) != None and getattr(j,'enableCap',None) != None and 2.0 in j.esVersions and j.enableCap == True:
-                        code += '           case %s:\n'%(j.name)
-                code += '             break;\n'
-                code += '           default:\n'
-                code += '             Warning("%s does not support ",GLenumToString(cap)," for ES 2.0.");\n'%(name)
-                if name=='glIsEnabled':
-                  code += '             return GL_FALSE;\n'
+                        w('      #if REGAL_PLUGIN',
+                          '      Thread::ThreadLocal &_instance = Thread::ThreadLocal::instance();',
+                          '      Push<DispatchTableGL *> pushDispatchTable(_instance.nextDispatchTable);',
+                          '      _instance.nextDispatchTable = &_context->dispatcher.emulation;',
+                          '      #endif')
+
+                      with w.indent('      '):
+                        w.lines(e['impl'])
+                      if l['member'] != "filt" and typeIsVoid(rType):
+                          w('      return;')
+                      w('    }')
+                      if l['ifdef']:
+                          w('    #endif')
+                  w('  }')
+                  w()
+
+                # ES 2.0 constraints, for layers with an impl, or otherwise
+
+                hasImpl = not all(i[1]==None or not 'impl' in i[1] for i in level)
+
+                # glEnable/glDisable/glIsEnabled constraints for ES 2.0
+                # http://www.khronos.org/opengles/sdk/docs/man/xhtml/glEnable.xml
+
+                if hasImpl and name in [ 'glEnable', 'glDisable', 'glIsEnabled' ]:
+                  w('  if (_context->isES2())',
+                    '    switch (cap)',
+                    '    {')
+                  for j in api.index.enumerantsWith('enableCap', 2.0):
+                    w('      case %s:' %(j.name))
+                  w('        break;',
+                    '      default:',
+                    '        Warning("%s does not support ",GLenumToString(cap)," for ES 2.0.");' %(name))
+                  if name=='glIsEnabled':
+                    w('        return GL_FALSE;')
+                  else:
+                    w('        return;')
+                  w('    }')
+
+                # glBindTexture constraints for ES 2.0
+                # http://www.khronos.org/opengles/sdk/docs/man/xhtml/glBindTexture.xml
+
+                if hasImpl and name=='glBindTexture':
+                  w('  if (_context->isES2())',
+                    '    switch (target)',
+                    '    {')
+                  for j in api.index.enumerantsWith('bindTexture', 2.0):
+                    w('      case %s:' %(j.name))
+                  w('        break;',
+                    '      default:',
+                    '        Warning("%s does not support ",GLenumToString(target)," for ES 2.0.");' %(name),
+                    '        return;',
+                    '    }')
+
+                # glTexSubImage2D constraints for ES 2.0
+                # http://www.khronos.org/opengles/sdk/docs/man/xhtml/glTexSubImage2D.xml
+
+                if hasImpl and name=='glTexSubImage2D':
+                  w('  if (_context->isES2())',
+                    '    switch (target)',
+                    '    {')
+                  for j in api.index.enumerantsWith('texImage', 2.0):
+                    w('      case %s:' %(j.name))
+                  w('        break;',
+                    '      default:',
+                    '        Warning("%s does not support ",GLenumToString(target)," for ES 2.0.");' %(name),
+                    '        return;',
+                    '    }')
+
+                # glTexImage2D internalformat constraints for ES 2.0
+                # http://www.khronos.org/opengles/sdk/docs/man/xhtml/glTexImage2D.xml
+
+                if not hasImpl and name=='glTexImage2D':
+                  w('  if (_context->isES2())',
+                    '  {',
+                    '    switch (internalformat)',
+                    '    {')
+                  for j in api.index.enumerantsWith('internalformat', 2.0):
+                    w('      case %s:' %(j.name))
+                  w('        break;',
+                    '      default:',
+                    '        Warning("%s does not support ",GLenumToString(internalformat)," for ES 2.0.");' %(name),
+                    '        return;',
+                    '    }',
+                    '    if (format!=GLenum(internalformat))',
+                    '    {',
+                    '        Warning("%s does not support mismatching format and internalformat ",GLenumToString(format),"!=",GLenumToString(internalformat)," for ES 2.0.");' %(name),
+                    '        return;',
+                    '    }',
+                    '  }')
+
+                w('  DispatchTableGL *_next = _dispatch.next();',
+                  '  RegalAssert(_next);')
+
+                if es2Name != None:
+                  w('  if (_context->isES2())',
+                    '    %s_next->call(&_next->%s)(%s);' % ( ret, es2Name, es2Params ),
+                    '  else',
+                    '    %s_next->call(&_next->%s)(%s);' % ( ret, name, callParams ))
                 else:
-                  code += '             return;\n'
-                code += '         }\n'
-
-              # glBindTexture constraints for ES 2.0
-              # http://www.khronos.org/opengles/sdk/docs/man/xhtml/glBindTexture.xml
-
-              if name=='glBindTexture':
-                code += '       if (_context->isES2())\n'
-                code += '         switch (target)\n'
-                code += '         {\n'
-                for i in api.enums:
-                  if i.name=='defines':
-                    for j in i.enumerantsByName:
-                      if getattr(j,'esVersions',None)==None:
-                        continue
-                      if getattr(j,'bindTexture',None)==None:
-                        continue
-                      if 2.0 in j.esVersions and j.bindTexture == True:
-                        code += '           case %s:\n'%(j.name)
-                code += '             break;\n'
-                code += '           default:\n'
-                code += '             Warning("%s does not support ",GLenumToString(target)," for ES 2.0.");\n'%(name)
-                code += '             return;\n'
-                code += '         }\n'
-
-              # glTexSubImage2D constraints for ES 2.0
-              # http://www.khronos.org/opengles/sdk/docs/man/xhtml/glTexSubImage2D.xml
-
-              if name=='glTexSubImage2D':
-                code += '       if (_context->isES2())\n'
-                code += '         switch (target)\n'
-                code += '         {\n'
-                for i in api.enums:
-                  if i.name=='defines':
-                    for j in i.enumerantsByName:
-                      if getattr(j,'esVersions',None)==None:
-                        continue
-                      if getattr(j,'texImage',None)==None:
-                        continue
-                      if 2.0 in j.esVersions and j.texImage:
-                        code += '           case %s:\n'%(j.name)
-                code += '             break;\n'
-                code += '           default:\n'
-                code += '             Warning("%s does not support ",GLenumToString(target)," for ES 2.0.");\n'%(name)
-                code += '             return;\n'
-                code += '         }\n'
-
-              code += '      DispatchTableGL *_next = _dispatch.next();\n'
-              code += '      RegalAssert(_next);\n'
-
-              if es2Name != None:
-                code += '      '
-                code += 'if (_context->isES2())\n'
-                code += '        '
-                if not typeIsVoid(rType):
-                    code += 'return '
-                code += '_next->call(&_next->%s)(%s);\n' % ( es2Name, es2Params )
-                code += '      else\n  '
-
-              code += '      '
-              if not typeIsVoid(rType):
-                  code += 'return '
-              code += '_next->call(&_next->%s)(%s);\n' % ( name, callParams )
-
-              code += '      break;\n'
-              code += '    }\n\n'
-              code += '  }\n\n'
-            else:
-
-              # glTexImage2D internalformat constraints for ES 2.0
-              # http://www.khronos.org/opengles/sdk/docs/man/xhtml/glTexImage2D.xml
-
-              if name=='glTexImage2D':
-                code += '  if (_context->isES2())\n'
-                code += '  {\n'
-                code += '    switch (internalformat)\n'
-                code += '    {\n'
-                for i in api.enums:
-                  if i.name=='defines':
-                    for j in i.enumerantsByName:
-                      if getattr(j,'esVersions',None)==None:
-                        continue
-                      if getattr(j,'internalformat',None)==None:
-                        continue
-                      if 2.0 in j.esVersions and j.internalformat == True:
-                        code += '      case %s:\n'%(j.name)
-                code += '        break;\n'
-                code += '      default:\n'
-                code += '        Warning("%s does not support ",GLenumToString(internalformat)," for ES 2.0.");\n'%(name)
-                code += '        return;\n'
-                code += '    }\n'
-                code += '    if (format!=GLenum(internalformat))\n'
-                code += '    {\n'
-                code += '        Warning("%s does not support mismatching format and internalformat ",GLenumToString(format),"!=",GLenumToString(internalformat)," for ES 2.0.");\n'%(name)
-                code += '        return;\n'
-                code += '    }\n'
-                code += '  }\n'
-
-              code += '  DispatchTableGL *_next = _dispatch.next();\n'
-              code += '  RegalAssert(_next);\n'
-              code += '  '
-
-              if es2Name != None:
-                code += 'if (_context->isES2())\n'
-                code += '    '
-                if not typeIsVoid(rType):
-                    code += 'return '
-                code += '_next->call(& _next->%s)(%s);\n' % ( es2Name, es2Params )
-                code += '   else\n     '
+                  w('  %s_next->call(&_next->%s)(%s);' % ( ret, name, callParams ))
+                w('}')
+                w()
+
+        w()
 
-              if not typeIsVoid(rType):
-                  code += 'return '
-              code += '_next->call(& _next->%s)(%s);\n' % ( name, callParams )
-            code += '}\n\n'
+    w.endCategory()
 
-        if api.name in cond:
-            code += '#endif // %s\n' % cond[api.name]
-        code += '\n'
+    return w.text()
 
-    # Close pending if block.
-    if categoryPrev:
-        code += '\n'
+# Whether the emu dispatch table has an entry for <function>
 
-    return code
+def emuIntercepts(function):
+
+  emue = [ None ]
+  for i in range( len( emu ) - 1 ) :
+    emue.append( emuFindEntry( function, emu[i]['formulae'], emu[i]['member'] ) )
+
+  return not all(i is None for i in emue) or not (getattr(function,'regalRemap',None)==None or isinstance(function.regalRemap, str) or isinstance(function.regalRemap, unicode))
 
 # CodeGen for dispatch table init.
 
 def apiEmuDispatchFuncInitCode(apis, args):
   dispatchName = 'emu'
-  categoryPrev = None
-  code = ''
+  w = CodeWriter()
 
   for api in apis:
 
-    code += '\n'
-    if api.name in cond:
-      code += '#if %s\n' % cond[api.name]
-
-    for function in api.functions:
-      if not function.needsContext:
-        continue
-      if getattr(function,'regalOnly',False)==True:
-        continue
-
-      name   = function.name
-
-      emue = [ None ]
-      for i in range( len( emu ) - 1 ) :
-        emue.append( emuFindEntry( function, emu[i]['formulae'], emu[i]['member'] ) )
+    w()
+    with w.condition(cond.get(api.name)):
 
-      if all(i is None for i in emue) and (getattr(function,'regalRemap',None)==None or isinstance(function.regalRemap, str) or isinstance(function.regalRemap, unicode)):
-        continue
+      for function in api.functions:
+        if not function.view.needsContext:
+          continue
+        if function.view.regalOnly:
+          continue
 
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
+        name   = function.name
 
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+        if not emuIntercepts(function):
+          continue
 
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
+        view       = function.view
+        params     = view.params
+        callParams = view.callParams
+        rType      = view.rType
+        category   = view.category
 
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '// %s\n\n' % category
+        w.category(category)
 
-      categoryPrev = category
+        w('   tbl.%s = %s_%s;' % ( name, dispatchName, name ))
 
-      code += '   tbl.%s = %s_%s;\n' % ( name, dispatchName, name )
+    w()
 
-    if api.name in cond:
-      code += '#endif // %s\n' % cond[api.name]
-    code += '\n'
+  w.endCategory()
 
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
-
-  return code
+  return w.text()
 
 emuLocalCode = '''
 
@@ -367,7 +311,7 @@ emuLocalCode = '''
 
 
 
-def generateEmuSource(apis, args):
+def emuSource(apis, args, name):
 
   funcDefine = apiEmuFuncDefineCode( apis, args )
   funcInit   = apiEmuDispatchFuncInitCode( apis, args )
@@ -400,7 +344,7 @@ def generateEmuSource(apis, args):
   substitute['LICENSE']         = args.license
   substitute['AUTOGENERATED']   = args.generated
   substitute['COPYRIGHT']       = args.copyright
-  substitute['DISPATCH_NAME']   = 'Emu'
+  substitute['DISPATCH_NAME']   = name
   substitute['LOCAL_CODE']      = emuLocalCode
   substitute['LOCAL_INCLUDE']   = emuLocalInclude
   substitute['API_DISPATCH_FUNC_DEFINE'] = funcDefine
@@ -409,4 +353,7 @@ def generateEmuSource(apis, args):
   substitute['IFDEF'] = '#if REGAL_EMULATION\n\n'
   substitute['ENDIF'] = '#endif\n'
 
-  outputCode( '%s/RegalDispatchEmu.cpp' % args.srcdir, dispatchSourceTemplate.substitute(substitute))
+  return dispatchSourceTemplate.substitute(substitute)
+
+def generateEmuSource(apis, args):
+  outputDispatchSource(apis, args, 'Emu', emuSource, '#if REGAL_EMULATION\n\n', '#endif\n')
@@ -65,70 +65,54 @@ def generateDispatchGLX(apis, args):
 
   # CodeGen for API functions.
 
-  code = ''
-  categoryPrev = None
+  w = CodeWriter()
 
   for api in apis:
 
     if api.name != 'glx':
       continue
 
-    code += '\n'
+    w()
 
     for function in api.functions:
 
-      if getattr(function,'regalOnly',False)==True:
+      if function.view.regalOnly:
         continue
 
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
+      view       = function.view
+      name       = view.name
+      params     = view.params
+      callParams = view.callParams
+      rType      = view.rType
+      category   = view.category
 
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+      w.category(category)
 
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
+      w('static %sREGAL_CALL %s%s(%s)' % (rType, 'GLX_', name, params),
+        '{')
 
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '// %s\n\n' % category
+      if not function.view.needsContext:
+        w('    DispatchTableGlobal *_next = dispatcherGlobal.glx.next();')
 
-      categoryPrev = category
-
-      code += 'static %sREGAL_CALL %s%s(%s) \n{\n' % (rType, 'GLX_', name, params)
-
-      if not function.needsContext:
-        code += '    DispatchTableGlobal *_next = dispatcherGlobal.glx.next();\n'
-
-      code += '    RegalAssert(_next);\n'
+      w('    RegalAssert(_next);')
 
       match = emuFindEntry(function,formulae,None)
       if match and 'impl' in match:
 #       print match
-        code += listToString(indent(match['impl'],'    '))
-
-      code += '    '
-      if not typeIsVoid(rType):
-        code += '%s ret = '%(rType)
-      code += '_next->call(&_next->%s)(%s);\n' % ( name, callParams )
+        with w.indent('    '):
+          w.lines(match['impl'])
 
       if not typeIsVoid(rType):
-        code += '    return ret;\n'
-      code += '}\n\n'
+        w('    %s ret = _next->call(&_next->%s)(%s);' % ( rType, name, callParams ),
+          '    return ret;')
+      else:
+        w('    _next->call(&_next->%s)(%s);' % ( name, callParams ))
+      w('}')
+      w()
 
-    code += '\n'
+    w()
 
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
+  w.endCategory()
 
   # Output
 
@@ -136,7 +120,7 @@ def generateDispatchGLX(apis, args):
   substitute['LICENSE']         = args.license
   substitute['AUTOGENERATED']   = args.generated
   substitute['COPYRIGHT']       = args.copyright
-  substitute['API_FUNC_DEFINE'] = code
+  substitute['API_FUNC_DEFINE'] = w.text()
   substitute['API_GL_DISPATCH_INIT']     = apiDispatchFuncInitCode( apis, args, 'GLX', [], filterGLX )
   substitute['API_GLOBAL_DISPATCH_INIT'] = apiDispatchGlobalFuncInitCode( apis, args, 'GLX', [], filterGLX )
 
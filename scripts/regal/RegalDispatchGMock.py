@@ -173,9 +173,9 @@ def generateGMockFunctionApi(apis):
       continue
 
     for function in api.functions:
-      if not function.needsContext:
+      if not function.view.needsContext:
         continue
-      if getattr(function, 'regalOnly', False):
+      if function.view.regalOnly:
         continue
       if (function.category not in functionCategoriesToMock and
           function.name not in explicitFunctionsToMock):
@@ -184,11 +184,11 @@ def generateGMockFunctionApi(apis):
       yield dict(
           PREFIX="gmock_",
           NAME=function.name,
-          RTYPE=typeCode(function.ret.type).strip(),
+          RTYPE=function.view.rType.strip(),
           PARAM_COUNT=len(function.parameters),
           PARAM_TYPES=paramsTypeCode(function.parameters, True),
-          PARAM_NAMES=paramsNameCode(function.parameters),
-          PARAM_TYPES_NAMES=paramsDefaultCode(function.parameters, True))
+          PARAM_NAMES=function.view.callParams,
+          PARAM_TYPES_NAMES=function.view.params)
 
 
 def generateGMockHeader(apis, args):
@@ -14,6 +14,8 @@ from RegalContextInfo import cond
 
 from RegalDispatchShared import apiDispatchFuncInitCode
 from RegalDispatchShared import apiDispatchGlobalFuncInitCode
+from RegalDispatchShared import outputDispatchSource
+from RegalDispatchShared import DispatchThunks
 
 formulae = {
   'bindtexture' : {
@@ -274,9 +276,10 @@ REGAL_GLOBAL_END
 
 REGAL_NAMESPACE_BEGIN
 
+${LOCAL_CODE}
 ${API_FUNC_DEFINE}
 
-void InitDispatchTableHttp(DispatchTableGL &tbl)
+void InitDispatchTable${DISPATCH_NAME}(DispatchTableGL &tbl)
 {
 ${API_GL_DISPATCH_INIT}
 }
@@ -288,118 +291,129 @@ REGAL_NAMESPACE_END
 #endif
 ''')
 
+httpLocalCode = '''
+static DispatchTableGL *http_next()
+{
+  RegalContext *_context = REGAL_GET_CONTEXT();
+  RegalAssert( _context );
+  if( _context ) {
+    if( _context->http.runState == RS_Next ) {
+      _context->http.runState = RS_Pause;
+    }
+    _context->http.YieldToHttpServer( _context );
+  }
+  DispatchTableGL *_next = _context ? _context->dispatcher.http.next() : NULL;
+  RegalAssert(_next);
+  return _next;
+}
+'''
 
-def generateDispatchHttp(apis, args):
+# Functions with no http formulae, dispatched by thunks
+
+def httpPassThrough(function):
+  if not function.view.needsContext or function.view.regalOnly:
+    return False
+  generated = dispatchGenCode( function, formulae )
+  return not generated or ('pre' not in generated and 'post' not in generated)
+
+def httpSource(apis, args, dispatchName):
 
   # CodeGen for API functions.
 
-  code = ''
-  categoryPrev = None
+  thunks = DispatchThunks('http_')
+  w = CodeWriter()
 
   for api in apis:
 
-    code += '\n'
-    if api.name in cond:
-      code += '#if %s\n' % cond[api.name]
+    w()
+    with w.condition(cond.get(api.name)):
 
-    for function in api.functions:
+      thunks.code(w, [ i for i in api.functions if httpPassThrough(i) ])
 
-      if getattr(function,'regalOnly',False)==True:
-        continue
+      for function in api.functions:
 
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      rTypes    = rType.strip()
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
+        if function.view.regalOnly:
+          continue
 
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+        if function.name in thunks.init:
+          continue
 
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
+        view       = function.view
+        name       = view.name
+        params     = view.params
+        callParams = view.callParams
+        rType      = view.rType
+        rTypes     = rType.strip()
+        category   = view.category
 
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '// %s\n\n' % category
+        w.category(category)
 
-      categoryPrev = category
+        w('static %sREGAL_CALL %s%s(%s)' % (rType, 'http_', name, params),
+          '{')
 
-      code += 'static %sREGAL_CALL %s%s(%s) \n{\n' % (rType, 'http_', name, params)
+        generated = dispatchGenCode( function, formulae )
 
-      generated = dispatchGenCode( function, formulae )
-
-      retInit = ''
-      if not typeIsVoid(rType):
-        if rTypes in api.defaults:
-          retInit += '%s' % ( api.defaults[rTypes] )
-        else:
-          if rType[-1]=='*' or typeIsVoidPointer(rType):
-            retInit += 'NULL'
+        retInit = ''
+        if not typeIsVoid(rType):
+          if rTypes in api.defaults:
+            retInit += '%s' % ( api.defaults[rTypes] )
           else:
-            retInit += '(%s) 0' % ( rTypes )
-
-      if not typeIsVoid(rType):
-        code += '    %s ret = %s;\n' % (rType, retInit)
-      code += '    RegalContext *_context = REGAL_GET_CONTEXT();\n'
-      if function.needsContext:
-        code += '    RegalAssert( _context );\n'
-
-      code += '    if( _context ) {\n'
-      if generated and 'pre' in generated:
-        for i in generated['pre']:
-          code += '      %s\n' % i
-
-      code += '#if REGAL_HTTP\n'
-      code += '      if( _context->http.runState == RS_Next ) {\n'
-      code += '        _context->http.runState = RS_Pause;\n'
-      code += '      }\n'
-      code += '      _context->http.YieldToHttpServer( _context );\n'
-      code += '#endif\n'
-
-      code += '    }\n'
-
-      code += '#if REGAL_HTTP\n'
-
-      if function.needsContext:
-        code += '    DispatchTableGL *_next = _context ? _context->dispatcher.http.next() : NULL;\n'
-      else:
-        code += '    DispatchTableGlobal *_next = dispatcherGlobal.http.next();\n'
-
-      code += '    RegalAssert(_next);\n'
+            if rType[-1]=='*' or typeIsVoidPointer(rType):
+              retInit += 'NULL'
+            else:
+              retInit += '(%s) 0' % ( rTypes )
+
+        if not typeIsVoid(rType):
+          w('    %s ret = %s;' % (rType, retInit))
+        w('    RegalContext *_context = REGAL_GET_CONTEXT();')
+        if function.view.needsContext:
+          w('    RegalAssert( _context );')
+
+        w('    if( _context ) {')
+        if generated and 'pre' in generated:
+          for i in generated['pre']:
+            w('      %s' % i)
+
+        w('#if REGAL_HTTP',
+          '      if( _context->http.runState == RS_Next ) {',
+          '        _context->http.runState = RS_Pause;',
+          '      }',
+          '      _context->http.YieldToHttpServer( _context );',
+          '#endif')
+
+        w('    }')
+
+        w('#if REGAL_HTTP')
+
+        if function.view.needsContext:
+          w('    DispatchTableGL *_next = _context ? _context->dispatcher.http.next() : NULL;')
+        else:
+          w('    DispatchTableGlobal *_next = dispatcherGlobal.http.next();')
 
-      code += '    '
+        w('    RegalAssert(_next);')
 
-      if not typeIsVoid(rType):
-        code += 'ret = '
-      code += '_next->call(&_next->%s)(%s);\n' % ( name, callParams )
+        if not typeIsVoid(rType):
+          w('    ret = _next->call(&_next->%s)(%s);' % ( name, callParams ))
+        else:
+          w('    _next->call(&_next->%s)(%s);' % ( name, callParams ))
 
-      code += '#endif\n'
+        w('#endif')
 
 
-      if generated and 'post' in generated:
-        code += '    if( _context ) {\n'
-        for i in generated['post']:
-          code += '      %s\n' % i
-        code += '    }\n'
+        if generated and 'post' in generated:
+          w('    if( _context ) {')
+          for i in generated['post']:
+            w('      %s' % i)
+          w('    }')
 
-      if not typeIsVoid(rType):
-        code += '    return ret;\n'
-      code += '}\n\n'
+        if not typeIsVoid(rType):
+          w('    return ret;')
+        w('}')
+        w()
 
-    if api.name in cond:
-      code += '#endif // %s\n' % cond[api.name]
-    code += '\n'
+    w()
 
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
+  w.endCategory()
 
   # Output
 
@@ -407,8 +421,13 @@ def generateDispatchHttp(apis, args):
   substitute['LICENSE']         = args.license
   substitute['AUTOGENERATED']   = args.generated
   substitute['COPYRIGHT']       = args.copyright
-  substitute['API_FUNC_DEFINE'] = code
-  substitute['API_GL_DISPATCH_INIT']     = apiDispatchFuncInitCode( apis, args, 'http' )
-  substitute['API_GLOBAL_DISPATCH_INIT'] = apiDispatchGlobalFuncInitCode( apis, args, 'http' )
+  substitute['DISPATCH_NAME']   = dispatchName
+  substitute['LOCAL_CODE']      = thunks.count and httpLocalCode or ''
+  substitute['API_FUNC_DEFINE'] = w.text()
+  substitute['API_GL_DISPATCH_INIT']     = apiDispatchFuncInitCode( apis, args, 'http', thunks = thunks )
+  substitute['API_GLOBAL_DISPATCH_INIT'] = apiDispatchGlobalFuncInitCode( apis, args, 'http', initName = dispatchName )
 
-  outputCode( '%s/RegalDispatchHttp.cpp' % args.srcdir, dispatchHttpTemplate.substitute(substitute))
+  return dispatchHttpTemplate.substitute(substitute)
+
+def generateDispatchHttp(apis, args):
+  outputDispatchSource(apis, args, 'Http', httpSource, '#if REGAL_HTTP\n\n', '#endif\n', globalInit = True)
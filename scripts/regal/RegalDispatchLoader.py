@@ -28,8 +28,11 @@ using namespace std;
 #include "RegalLog.h"
 #include "RegalBreak.h"
 #include "RegalPush.h"
+#include "RegalTimer.h"
 #include "RegalToken.h"
+#include "RegalConfig.h"
 #include "RegalHelper.h"
+#include "RegalLoader.h"
 #include "RegalPrivate.h"
 #include "RegalContext.h"
 #include "RegalDispatcherGL.h"
@@ -55,12 +58,52 @@ ${LOCAL_CODE}
     return _context->dispatcher.driver;
   }
 
-  static void _getProcAddress(void (**func)(), void (*funcRegal)(), const char *name)
+  static inline void _resolve(DispatchTable &table, void (**func)(), void (*funcRegal)(), const char *name)
   {
     GetProcAddress(*func, name);
     RegalAssert(*func!=funcRegal);
     if (*func==funcRegal)
       *func = NULL;
+    Dispatcher::refresh(table, reinterpret_cast<void **>(func));
+  }
+
+  // Timed only when internal logging is enabled, to keep the
+  // first call of each lazy entry point cheap.
+
+  static void _getProcAddress(DispatchTable &table, void (**func)(), void (*funcRegal)(), const char *name)
+  {
+#if REGAL_LOG_INTERNAL
+    if (Logging::enableInternal)
+    {
+      Timer timer;
+      timer.restart();
+      _resolve(table,func,funcRegal,name);
+      Internal("Loader::_getProcAddress ",name," ",timer.elapsed()," us");
+      return;
+    }
+#endif
+    _resolve(table,func,funcRegal,name);
+  }
+
+  // Eager loading, for REGAL_LOAD_EAGER
+  //
+  // The driver entry points are resolved in one pass at context
+  // initialization, rather than on first call.  Optionally only
+  // those listed in the REGAL_LOAD_PROFILE file, one per line.
+  // Others remain lazy.
+
+  static void _eager(DispatchTable &table, void *funcs, const Entry *entry)
+  {
+    Timer timer;
+    timer.restart();
+
+    size_t total = 0;
+    for (const Entry *i = entry; i->name; ++i)
+      ++total;
+
+    size_t count = Resolve(table,funcs,entry,Config::loadProfileNames,_getProcAddress);
+
+    Info("Loader resolved ",count," of ",total," entry points in ",timer.elapsed()," us");
   }
 
 ${API_DISPATCH_FUNC_DEFINE}
@@ -72,6 +115,8 @@ ${API_DISPATCH_FUNC_INIT}
 
 ${API_DISPATCH_GLOBAL_FUNC_INIT}
 
+${API_DISPATCH_ENTRY}
+
 } // namespace Loader
 
 REGAL_NAMESPACE_END
@@ -83,67 +128,82 @@ ${ENDIF}''')
 # CodeGen for API loader function definition.
 
 def apiLoaderFuncDefineCode(apis, args):
-  categoryPrev = None
-  code = ''
+  w = CodeWriter()
 
   for api in apis:
 
-    code += '\n'
-    if api.name in cond:
-      code += '#if %s\n' % cond[api.name]
+    w()
+    with w.condition(cond.get(api.name)):
+
+      for function in api.functions:
+        if function.view.regalOnly:
+          continue
+
+        view       = function.view
+        name       = view.name
+        params     = view.params
+        callParams = view.callParams
+        rType      = view.rType
+
+        w.category(view.category)
+
+        with w.indent():
+
+          w('static %sREGAL_CALL %s(%s) ' % (rType, name, params),
+            '{')
+
+          with w.indent():
+
+            # Get a reference to the appropriate dispatch table and attempt GetProcAddress
 
-    for function in api.functions:
-      if getattr(function,'regalOnly',False)==True:
-        continue
+            if view.needsContext:
+              w('DispatchTableGL &_driver = _getDispatchGL();')
+            else:
+              w('DispatchTableGlobal &_driver = dispatcherGlobal.driver;')
 
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
+            w('_getProcAddress(_driver,reinterpret_cast<void (**)()>(&_driver.%s),reinterpret_cast<void (*)()>(%s),"%s");'%(name,name,name))
+            if not typeIsVoid(rType):
+              w('return _driver.call(&_driver.%s)(%s);'%(name, callParams))
+            else:
+              w('_driver.call(&_driver.%s)(%s);'%(name, callParams))
 
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+          w('}')
+          w()
 
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
+    w()
 
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '// %s\n\n' % category
+  w.endCategory()
 
-      categoryPrev = category
+  return w.text()
 
-      code += '  static %sREGAL_CALL %s(%s) \n  {\n' % (rType, name, params)
+# Table of entry points for eager loading
 
-      # Get a reference to the appropriate dispatch table and attempt GetProcAddress
+def apiLoaderEntryCode(apis, args):
+  w = CodeWriter()
 
-      if function.needsContext:
-        code += '    DispatchTableGL &_driver = _getDispatchGL();\n'
-      else:
-        code += '    DispatchTableGlobal &_driver = dispatcherGlobal.driver;\n'
+  for needsContext, table in [ (True, 'GL'), (False, 'Global') ]:
 
-      code += '    _getProcAddress(reinterpret_cast<void (**)()>(&_driver.%s),reinterpret_cast<void (*)()>(%s),"%s");\n'%(name,name,name)
-      code += '    '
-      if not typeIsVoid(rType):
-        code += 'return '
-      code += '_driver.call(&_driver.%s)(%s);\n'%(name, callParams)
-      code += '  }\n\n'
+    w('  static const Entry _entry%s[] =' % table,
+      '  {')
 
-    if api.name in cond:
-      code += '#endif // %s\n' % cond[api.name]
-    code += '\n'
+    for api in apis:
+      with w.condition(cond.get(api.name)):
+        for function in api.functions:
+          if function.view.regalOnly or function.view.needsContext!=needsContext:
+            continue
+          name = function.view.name
+          w('    { "%s", offsetof(Dispatch::%s,%s), reinterpret_cast<void (*)()>(%s) },' % (name, table, name, name))
 
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
+    w('    { NULL, 0, NULL }',
+      '  };',
+      '',
+      '  void Eager(DispatchTable%s &tbl)' % table,
+      '  {',
+      '    _eager(tbl,static_cast<Dispatch::%s *>(&tbl),_entry%s);' % (table, table),
+      '  }',
+      '')
 
-  return code
+  return w.text()
 
 def generateLoaderSource(apis, args):
 
@@ -164,6 +224,7 @@ def generateLoaderSource(apis, args):
   substitute['API_DISPATCH_FUNC_DEFINE'] = funcDefine
   substitute['API_DISPATCH_FUNC_INIT'] = funcInit
   substitute['API_DISPATCH_GLOBAL_FUNC_INIT'] = globalFuncInit
+  substitute['API_DISPATCH_ENTRY'] = apiLoaderEntryCode( apis, args )
   substitute['IFDEF'] = '#if REGAL_DRIVER && REGAL_LOADER\n\n'
   substitute['ENDIF'] = '#endif\n'
 
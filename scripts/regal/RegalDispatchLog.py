@@ -60,113 +60,97 @@ def generateDispatchLog(apis, args):
 
   # CodeGen for API functions.
 
-  code = ''
-  categoryPrev = None
+  w = CodeWriter()
 
   for api in apis:
 
-    code += '\n'
-    if api.name in cond:
-      code += '#if %s\n' % cond[api.name]
-
-    for function in api.functions:
-
-      if getattr(function,'regalOnly',False)==True:
-        continue
-
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
-
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
-
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
-
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '// %s\n\n' % category
-
-      categoryPrev = category
-
-      code += 'static %sREGAL_CALL %s%s(%s) \n{\n' % (rType, 'log_', name, params)
-#     code += '    %s\n' % logFunction( function, 'Driver', True, False )
-
-      if function.needsContext:
-        code += '    RegalContext *_context = REGAL_GET_CONTEXT();\n'
-        code += '    RegalAssert(_context);\n'
-
-      # Temporarily adjust the context begin/end depth for proper indentation
-      # of the glBegin call
-
-      if name=='glBegin':
-        code += '    RegalAssert(_context->depthBeginEnd>0);\n'
-        code += '    Push<size_t> pushDepth(_context->depthBeginEnd);\n'
-        code += '    _context->depthBeginEnd--;\n'
-
-      # Temporarily adjust the context push/pop matrix depth for proper indentation
-      # of the glPushMatrix call
-
-      if name=='glPushMatrix':
-        code += '    RegalAssert(_context->depthPushMatrix>0);\n'
-        code += '    Push<size_t> pushDepth(_context->depthPushMatrix);\n'
-        code += '    _context->depthPushMatrix--;\n'
-
-      # Temporarily adjust the depth for proper indentation
-      # of the glNewList call
-
-      if name=='glNewList':
-        code += '    RegalAssert(_context->depthNewList>0);\n'
-        code += '    Push<size_t> pushDepth(_context->depthNewList);\n'
-        code += '    _context->depthNewList--;\n'
-
-      if function.needsContext:
-        code += '    DispatchTableGL *_next = _context->dispatcher.logging.next();\n'
-      else:
-        code += '    DispatchTableGlobal *_next = dispatcherGlobal.logging.next();\n'
-
-      code += '    RegalAssert(_next);\n'
-      code += '    '
-      if not typeIsVoid(rType):
-        code += '%s ret = '%(rType)
-      code += '_next->call(&_next->%s)(%s);\n' % ( name, callParams )
-
-      if typeIsVoid(rType):
-        code += '    %s\n' % logFunction( function, 'Driver', True, True )
-      else:
-        code += '    %s\n' % logFunction( function, 'Driver', True, True, True )
-
-      # Special handling for glUseProgram - log the attached shaders.
-
-      if name=='glUseProgram':
-        code += '    #if !REGAL_SYS_PPAPI\n'
-        code += '    if (Logging::enableDriver && program && log_glIsProgram(program))\n'
-        code += '    {\n'
-        code += '      GLuint  _shaders[16];\n'
-        code += '      GLsizei _count;\n'
-        code += '      log_glGetAttachedShaders(program,16,&_count,_shaders);\n'
-        code += '    }\n'
-        code += '    #endif // REGAL_SYS_PPAPI\n'
-
-      if not typeIsVoid(rType):
-        code += '    return ret;\n'
-      code += '}\n\n'
-
-    if api.name in cond:
-      code += '#endif // %s\n' % cond[api.name]
-    code += '\n'
-
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
+    w()
+    with w.condition(cond.get(api.name)):
+
+      for function in api.functions:
+
+        if function.view.regalOnly:
+          continue
+
+        view       = function.view
+        name       = view.name
+        params     = view.params
+        callParams = view.callParams
+        rType      = view.rType
+
+        w.category(view.category)
+
+        w('static %sREGAL_CALL %s%s(%s) ' % (rType, 'log_', name, params),
+          '{')
+#       w('    %s' % logFunction( function, 'Driver', True, False ))
+
+        with w.indent('    '):
+
+          if view.needsContext:
+            w('RegalContext *_context = REGAL_GET_CONTEXT();',
+              'RegalAssert(_context);')
+
+          # Temporarily adjust the context begin/end depth for proper indentation
+          # of the glBegin call
+
+          if name=='glBegin':
+            w('RegalAssert(_context->depthBeginEnd>0);',
+              'Push<size_t> pushDepth(_context->depthBeginEnd);',
+              '_context->depthBeginEnd--;')
+
+          # Temporarily adjust the context push/pop matrix depth for proper indentation
+          # of the glPushMatrix call
+
+          if name=='glPushMatrix':
+            w('RegalAssert(_context->depthPushMatrix>0);',
+              'Push<size_t> pushDepth(_context->depthPushMatrix);',
+              '_context->depthPushMatrix--;')
+
+          # Temporarily adjust the depth for proper indentation
+          # of the glNewList call
+
+          if name=='glNewList':
+            w('RegalAssert(_context->depthNewList>0);',
+              'Push<size_t> pushDepth(_context->depthNewList);',
+              '_context->depthNewList--;')
+
+          if view.needsContext:
+            w('DispatchTableGL *_next = _context->dispatcher.logging.next();')
+          else:
+            w('DispatchTableGlobal *_next = dispatcherGlobal.logging.next();')
+
+          w('RegalAssert(_next);')
+          if not typeIsVoid(rType):
+            w('%s ret = _next->call(&_next->%s)(%s);' % ( rType, name, callParams ))
+          else:
+            w('_next->call(&_next->%s)(%s);' % ( name, callParams ))
+
+          if typeIsVoid(rType):
+            w(logFunction( function, 'Driver', True, True ))
+          else:
+            w(logFunction( function, 'Driver', True, True, True ))
+
+          # Special handling for glUseProgram - log the attached shaders.
+
+          if name=='glUseProgram':
+            w('#if !REGAL_SYS_PPAPI',
+              'if (Logging::enableDriver && program && log_glIsProgram(program))',
+              '{',
+              '  GLuint  _shaders[16];',
+              '  GLsizei _count;',
+              '  log_glGetAttachedShaders(program,16,&_count,_shaders);',
+              '}',
+              '#endif // REGAL_SYS_PPAPI')
+
+          if not typeIsVoid(rType):
+            w('return ret;')
+
+        w('}')
+        w()
+
+    w()
+
+  w.endCategory()
 
   # Output
 
@@ -174,7 +158,7 @@ def generateDispatchLog(apis, args):
   substitute['LICENSE']         = args.license
   substitute['AUTOGENERATED']   = args.generated
   substitute['COPYRIGHT']       = args.copyright
-  substitute['API_FUNC_DEFINE'] = code
+  substitute['API_FUNC_DEFINE'] = w.text()
   substitute['API_GL_DISPATCH_INIT']     = apiDispatchFuncInitCode( apis, args, 'log' )
   substitute['API_GLOBAL_DISPATCH_INIT'] = apiDispatchGlobalFuncInitCode( apis, args, 'log' )
 
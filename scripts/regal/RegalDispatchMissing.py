@@ -65,69 +65,66 @@ ${ENDIF}''')
 
 ##############################################################################################
 
-# CodeGen for missing dispatch functions
+# Body of a missing function, also for the entry points
+# of functions pruned by --subset
 
-def apiMissingFuncDefineCode(apis, args):
+def missingFuncBodyCode(api, function):
 
-  code = ''
-  categoryPrev = None
+  rType  = function.view.rType
+  rTypes = rType.strip()
 
-  for api in apis:
+  code = []
+  for param in function.parameters:
+    code.append('UNUSED_PARAMETER(%s);' % param.name)
+  code.append('Warning( "%s", " not available." );' % function.name)
 
-    code += '\n'
-    if api.name in cond:
-      code += '#if %s\n' % cond[api.name]
+  if not typeIsVoid(rType):
+    if rTypes in api.defaults:
+      code.append('return %s;' % ( api.defaults[rTypes] ))
+    else:
+      if rType[-1]=='*' or typeIsVoidPointer(rType):
+        code.append('return NULL;')
+      else:
+        code.append('return (%s) 0;' % ( rTypes ))
 
-    for function in api.functions:
+  return code
 
-      if getattr(function,'regalOnly',False)==True:
-        continue
+# CodeGen for missing dispatch functions
 
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType     = typeCode(function.ret.type)
-      rTypes    = rType.strip()
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
+def apiMissingFuncDefineCode(apis, args):
+
+  w = CodeWriter()
 
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+  for api in apis:
 
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
+    w()
+    with w.condition(cond.get(api.name)):
 
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '// %s\n\n' % category
+      for function in api.functions:
 
-      categoryPrev = category
+        if function.view.regalOnly:
+          continue
 
-      code += '  static %sREGAL_CALL %s(%s) \n{\n' % (rType, name, params)
-      for param in function.parameters:
-        code += '    UNUSED_PARAMETER(%s);\n' % param.name
-      code += '    Warning( "%s", " not available." );\n' % name
+        view       = function.view
+        name       = view.name
+        params     = view.params
+        callParams = view.callParams
+        rType      = view.rType
+        rTypes     = rType.strip()
+        category   = view.category
 
-      if not typeIsVoid(rType):
-        if rTypes in api.defaults:
-          code += '    return %s;\n' % ( api.defaults[rTypes] )
-        else:
-          if rType[-1]=='*' or typeIsVoidPointer(rType):
-            code += '    return NULL;\n'
-          else:
-            code += '    return (%s) 0;\n' % ( rTypes )
+        w.category(category)
 
-      code += '  }\n\n'
+        w('  static %sREGAL_CALL %s(%s)' % (rType, name, params),
+          '{')
+        for i in missingFuncBodyCode(api, function):
+          w('    %s' % i)
+        w('  }')
+        w()
 
-    if api.name in cond:
-      code += '#endif // %s\n' % cond[api.name]
-    code += '\n'
+    w()
 
-  return code
+  return w.text()
 
 def generateMissingSource(apis, args):
 
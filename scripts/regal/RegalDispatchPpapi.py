@@ -16,79 +16,79 @@ from RegalDispatchShared import dispatchSourceTemplate, apiDispatchFuncInitCode
 # CodeGen for PPAPI dispatch functions
 
 def apiPpapiFuncDefineCode(apis, args):
-
-  code = ''
+  w = CodeWriter()
 
   for api in apis:
 
     if api.name=='gl':
 
       for function in api.functions:
-        if not function.needsContext:
+        if not function.view.needsContext:
           continue
         if getattr(function,'esVersions',None)==None or 2.0 not in function.esVersions:
           continue
-        if getattr(function,'regalOnly',False)==True:
+        if function.view.regalOnly:
           continue
 
         name   = function.name
-        params = paramsDefaultCode(function.parameters, True)
-        callParams = paramsNameCode(function.parameters)
+        params = function.view.params
+        callParams = function.view.callParams
 
         # Workaround for const difference between Regal.h and Pepper API
 
         if function.name=='glShaderSource':
           callParams = callParams.replace(', string,',',const_cast<const GLchar **>(string),')
 
-        rType  = typeCode(function.ret.type)
+        rType  = function.view.rType
         ppapiName = name
         if ppapiName.startswith('gl'):
           ppapiName = ppapiName[2:]
 
-        code += 'static %sREGAL_CALL %s%s(%s) \n{\n' % (rType, 'ppapi_', name, params)
-        code += '  Internal("ppapi_%s","()");\n' % name
-        code += '  RegalContext * rCtx = REGAL_GET_CONTEXT();\n'
-        code += '  RegalAssert(rCtx)\n'
-        code += '  RegalAssert(rCtx->ppapiES2)\n'
-        code += '  RegalAssert(rCtx->ppapiES2->%s)\n'%(ppapiName)
-        code += '  RegalAssert(rCtx->ppapiResource)\n'
-        if not typeIsVoid(rType):
-          code += '  %s ret = ' % rType
-        else:
-          code += '  '
+        w('static %sREGAL_CALL %s%s(%s) ' % (rType, 'ppapi_', name, params),
+          '{',
+          '  Internal("ppapi_%s","()");' % name,
+          '  RegalContext * rCtx = REGAL_GET_CONTEXT();',
+          '  RegalAssert(rCtx)',
+          '  RegalAssert(rCtx->ppapiES2)',
+          '  RegalAssert(rCtx->ppapiES2->%s)'%(ppapiName),
+          '  RegalAssert(rCtx->ppapiResource)')
         if len(callParams):
           callParams = 'rCtx->ppapiResource, %s'%callParams
         else:
           callParams = 'rCtx->ppapiResource'
-        code += 'rCtx->ppapiES2->%s(%s);\n' % ( ppapiName, callParams )
         if not typeIsVoid(rType):
-          code += '  return ret;\n'
-        code += '}\n\n'
+          w('  %s ret = rCtx->ppapiES2->%s(%s);' % ( rType, ppapiName, callParams ),
+            '  return ret;')
+        else:
+          w('  rCtx->ppapiES2->%s(%s);' % ( ppapiName, callParams ))
+        w('}')
+        w()
 
-  return code
+  return w.text()
 
 def apiPpapiFuncInitCode(apis, args):
+  w = CodeWriter()
 
-  code = '// OpenGL ES 2.0 only\n'
+  w('// OpenGL ES 2.0 only')
 
   for api in apis:
 
     if api.name=='gl':
 
       for function in api.functions:
-        if not function.needsContext:
+        if not function.view.needsContext:
           continue
         if getattr(function,'esVersions',None)==None or 2.0 not in function.esVersions:
           continue
 
         name   = function.name
-        params = paramsDefaultCode(function.parameters, True)
-        callParams = paramsNameCode(function.parameters)
-        rType  = typeCode(function.ret.type)
+        params = function.view.params
+        callParams = function.view.callParams
+        rType  = function.view.rType
 
-        code += '  tbl.%s = %s_%s;\n' % ( name, 'ppapi', name )
+        w('  tbl.%s = %s_%s;' % ( name, 'ppapi', name ))
 
-  return code
+  return w.text()
 
 def generatePpapiSource(apis, args):
 
@@ -2,13 +2,42 @@
 
 from string import Template, upper, replace
 
+import glob
+import os
+import re
+
+from ApiUtil    import outputCode, typeIsVoid
 from ApiCodeGen import paramsDefaultCode
 from ApiCodeGen import paramsNameCode, typeCode
+from ApiCodeGen import CodeWriter
 
 from RegalContextInfo import cond as condDefault
 
 ############################################################################
 
+# Dispatch layers in the order of DispatcherGL, and their build macros,
+# for Export.py --layers
+
+dispatchLayers = [
+  ( 'trace',      'REGAL_TRACE'      ),
+  ( 'http',       'REGAL_HTTP'       ),
+  ( 'debug',      'REGAL_DEBUG'      ),
+  ( 'error',      'REGAL_ERROR'      ),
+  ( 'emu',        'REGAL_EMULATION'  ),
+  ( 'cache',      'REGAL_CACHE'      ),
+  ( 'code',       'REGAL_CODE'       ),
+  ( 'statistics', 'REGAL_STATISTICS' ),
+  ( 'log',        'REGAL_LOG'        ),
+  ( 'driver',     'REGAL_DRIVER'     ),
+  ( 'missing',    'REGAL_MISSING'    )
+]
+
+# Functions of the hand-written RegalDispatchCache.cpp
+
+cacheFunctions = [ 'glShaderSource' ]
+
+############################################################################
+
 dispatchSourceTemplate = Template('''${AUTOGENERATED}
 ${LICENSE}
 
@@ -52,146 +81,295 @@ REGAL_NAMESPACE_END
 
 ${ENDIF}''')
 
-def apiDispatchFuncInitCode(apis, args, dispatchName, exclude=[], filter = lambda x : True, cond = None):
+def apiDispatchFuncInitCode(apis, args, dispatchName, exclude=[], filter = lambda x : True, cond = None, thunks = None):
 
   if not cond:
     cond = condDefault
 
-  categoryPrev = None
-  code = ''
+  w = CodeWriter('  ')
 
   for api in apis:
 
-    code += '\n'
-    if api.name in cond:
-      code += '#if %s\n' % cond[api.name]
+    w()
+    with w.condition(cond.get(api.name)):
 
-    for function in api.functions:
+      for function in api.functions:
 
-      if not function.needsContext:
-        continue
+        if not function.view.needsContext:
+          continue
 
-      if not filter(function):
-        continue
+        if not filter(function):
+          continue
 
-      if getattr(function,'regalOnly',False)==True:
-        continue
+        if function.view.regalOnly:
+          continue
 
-      if function.name in exclude or function.category in exclude:
-        continue
+        if function.name in exclude or function.category in exclude:
+          continue
 
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
+        view       = function.view
+        name       = view.name
+        params     = view.params
+        callParams = view.callParams
+        rType      = view.rType
+        category   = view.category
 
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+        w.category(category)
 
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
+        if thunks and name in thunks.init:
+          w('tbl.%s = %s;' % ( name, thunks.init[name] ))
+        elif dispatchName!=None:
+          w('tbl.%s = %s_%s;' % ( name, dispatchName, name ))
+        else:
+          w('  tbl.%s = %s;' % ( name, name ))
 
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '  // %s\n\n' % category
+    w()
 
-      categoryPrev = category
+  w.endCategory()
 
-      if dispatchName!=None:
-        code += '  tbl.%s = %s_%s;\n' % ( name, dispatchName, name )
-      else:
-        code += '    tbl.%s = %s;\n' % ( name, name )
+  return w.text()
 
-    if api.name in cond:
-      code += '#endif // %s\n' % cond[api.name]
-    code += '\n'
-
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
-
-  return code
-
-def apiDispatchGlobalFuncInitCode(apis, args, dispatchName, exclude=[], filter = lambda x : True, cond = None):
+def apiDispatchGlobalFuncInitCode(apis, args, dispatchName, exclude=[], filter = lambda x : True, cond = None, initName = None):
 
   if not cond:
     cond = condDefault
 
-  categoryPrev = None
+  if dispatchName!=None and initName==None:
+    initName = dispatchName[0:1].upper() + dispatchName[1:]
+
+  w = CodeWriter()
   if dispatchName!= None:
-    code = '''
-void InitDispatchTableGlobal%s%s(DispatchTableGlobal &tbl)
+    w.write('''
+void InitDispatchTableGlobal%s(DispatchTableGlobal &tbl)
 {
-'''%(dispatchName[0:1].upper(),dispatchName[1:])
+'''%(initName))
   else:
-    code = '''
+    w.write('''
 void Init(DispatchTableGlobal &tbl)
 {
-'''
+''')
 
-  for api in apis:
+  with w.indent():
 
-    code += '\n'
-    if api.name in cond:
-      code += '#if %s\n' % cond[api.name]
+    for api in apis:
 
-    for function in api.functions:
+      w()
+      with w.condition(cond.get(api.name)):
 
-      if function.needsContext:
-        continue
+        for function in api.functions:
 
-      if not filter(function):
-        continue
+          if function.view.needsContext:
+            continue
 
-      if getattr(function,'regalOnly',False)==True:
-        continue
+          if not filter(function):
+            continue
 
-      if function.name in exclude or function.category in exclude:
-        continue
+          if function.view.regalOnly:
+            continue
 
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
+          if function.name in exclude or function.category in exclude:
+            continue
 
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+          view       = function.view
+          name       = view.name
+          params     = view.params
+          callParams = view.callParams
+          rType      = view.rType
+          category   = view.category
 
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
+          w.category(category)
 
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '  // %s\n\n' % category
+          if dispatchName!=None:
+            w('tbl.%s = %s_%s;' % ( name, dispatchName, name ))
+          else:
+            w('  tbl.%s = %s;' % ( name, name ))
 
-      categoryPrev = category
+      w()
 
-      if dispatchName!=None:
-        code += '  tbl.%s = %s_%s;\n' % ( name, dispatchName, name )
-      else:
-        code += '    tbl.%s = %s;\n' % ( name, name )
+    w.endCategory()
 
-    if api.name in cond:
-      code += '#endif // %s\n' % cond[api.name]
-    code += '\n'
+  w('}')
 
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
+  return w.text()
 
-  code += '}\n'
 
-  return code
+############################################################################
+
+# Pass-through thunks, shared by functions of the same signature
+#
+# Functions with no per-function logic in a dispatch layer can use
+# a template per signature, instantiated with the member of the
+# dispatch table to call, rather than a function of their own.
+# The layer provides <prefix>next(), returning the next dispatch
+# table after anything common to all calls.
+
+class DispatchThunks:
+
+  def __init__(self, prefix):
+    self.prefix = prefix
+    self.count  = 0
+    self.init   = {}   # function name to thunk instance
+
+  # Thunk templates for the signatures of <functions>, for each
+  # api separately, since types may depend on the platform.
+
+  def code(self, w, functions):
+
+    signatures = {}
+
+    for function in functions:
+
+      view       = function.view
+      name       = view.name
+      params     = view.params
+      callParams = view.callParams
+      rType      = view.rType
+
+      signature = (rType.strip(), tuple([ i.type.strip() for i in function.parameters ]))
+      thunk = signatures.get(signature)
+
+      if not thunk:
+        thunk = '%sthunk%d' % (self.prefix, self.count)
+        self.count += 1
+        signatures[signature] = thunk
+
+        w('template<%s(REGAL_CALL *Dispatch::GL::*_func)(%s)>' % (rType, params),
+          'static %sREGAL_CALL %s(%s)' % (rType, thunk, params),
+          '{',
+          '  DispatchTableGL *_next = %snext();' % self.prefix)
+        if typeIsVoid(rType):
+          w('  _next->call(&(_next->*_func))(%s);' % callParams)
+        else:
+          w('  return _next->call(&(_next->*_func))(%s);' % callParams)
+        w('}',
+          '')
+
+      self.init[name] = '%s<&Dispatch::GL::%s>' % (thunk, name)
+
+############################################################################
 
+# Shards of a dispatch layer, for parallel compilation
+#
+# With --shards N the functions of a dispatch layer are split by
+# category into RegalDispatch<Name>Shard<i>.cpp, each initializing
+# its part of the dispatch table in InitDispatchTable<Name><i>.
+# RegalDispatch<Name>.cpp then initializes the whole table.
+
+dispatchShardsTemplate = Template('''${AUTOGENERATED}
+${LICENSE}
+
+#include "pch.h" /* For MS precompiled header support */
+
+#include "RegalUtil.h"
+
+${IFDEF}REGAL_GLOBAL_BEGIN
+
+#include "RegalDispatch.h"
+
+REGAL_GLOBAL_END
+
+REGAL_NAMESPACE_BEGIN
+
+${SHARD_DECLARE}
+void InitDispatchTable${DISPATCH_NAME}(DispatchTableGL &tbl)
+{
+${SHARD_INIT}}
+${SHARD_GLOBAL_INIT}
+REGAL_NAMESPACE_END
+
+${ENDIF}''')
+
+# Api with a subset of the functions
+
+class ApiShard:
+
+  def __init__(self, api, functions):
+    self.api       = api
+    self.functions = functions
+
+  def __getattr__(self, name):
+    return getattr(self.api, name)
+
+# Split <apis> into <shards>, each with consecutive categories
+# of about the same number of functions.
+
+def apiShards(apis, shards):
+
+  categories = []
+  count = {}
+  for api in apis:
+    for function in api.functions:
+      category = function.view.category
+      if category not in count:
+        categories.append(category)
+        count[category] = 0
+      count[category] += 1
+
+  total = max(sum(count.values()), 1)
+  shard = {}
+  n = 0
+  for category in categories:
+    shard[category] = min(shards - 1, n * shards / total)
+    n += count[category]
+
+  return [ [ ApiShard(api, [ j for j in api.functions if shard[j.view.category]==i ]) for api in apis ] for i in range(shards) ]
+
+# Remove shards of <filename> numbered <shards> or more,
+# left over from an earlier run
+
+def removeShards(filename, shards):
+
+  base = os.path.splitext(filename)[0]
+  for i in glob.glob('%sShard*.cpp' % base):
+    m = re.match(r'^Shard(\d+)\.cpp$', i[len(base):])
+    if m and int(m.group(1)) >= shards:
+      os.remove(i)
+      print 'File removed: %s' % i
+
+# Output dispatch layer <name>, as RegalDispatch<name>.cpp or as shards.
+#
+#   source(apis, args, name) - source code initializing the functions
+#                              of <apis> in InitDispatchTable<name>,
+#                              and InitDispatchTableGlobal<name> if
+#                              <globalInit>
+#   ifdef, endif             - condition for the layer
+
+def outputDispatchSource(apis, args, name, source, ifdef = '', endif = '', globalInit = False):
+
+  filename = '%s/RegalDispatch%s.cpp' % (args.srcdir, name)
+  shards = getattr(args, 'shards', 1)
+
+  if shards <= 1:
+    removeShards(filename, 0)
+    outputCode(filename, source(apis, args, name))
+    return
+
+  removeShards(filename, shards)
+
+  shardDeclare = ''
+  shardInit = ''
+  shardGlobalInit = ''
+
+  for i, shard in enumerate(apiShards(apis, shards)):
+    outputCode('%sShard%d.cpp' % (os.path.splitext(filename)[0], i), source(shard, args, '%s%d' % (name, i)))
+    shardDeclare += 'void InitDispatchTable%s%d(DispatchTableGL &tbl);\n' % (name, i)
+    shardInit    += '  InitDispatchTable%s%d(tbl);\n' % (name, i)
+    if globalInit:
+      shardDeclare    += 'void InitDispatchTableGlobal%s%d(DispatchTableGlobal &tbl);\n' % (name, i)
+      shardGlobalInit += '  InitDispatchTableGlobal%s%d(tbl);\n' % (name, i)
+
+  if globalInit:
+    shardGlobalInit = '\nvoid InitDispatchTableGlobal%s(DispatchTableGlobal &tbl)\n{\n%s}\n' % (name, shardGlobalInit)
+
+  substitute = {}
+  substitute['LICENSE']           = args.license
+  substitute['AUTOGENERATED']     = args.generated
+  substitute['COPYRIGHT']         = args.copyright
+  substitute['DISPATCH_NAME']     = name
+  substitute['SHARD_DECLARE']     = shardDeclare
+  substitute['SHARD_INIT']        = shardInit
+  substitute['SHARD_GLOBAL_INIT'] = shardGlobalInit
+  substitute['IFDEF']             = ifdef
+  substitute['ENDIF']             = endif
+
+  outputCode(filename, dispatchShardsTemplate.substitute(substitute))
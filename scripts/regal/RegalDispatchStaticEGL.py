@@ -46,54 +46,53 @@ REGAL_NAMESPACE_END
 ${ENDIF}''')
 
 def apiStaticEGLFuncInitCode(apis, args):
+  w = CodeWriter()
 
-  code = ''
-
-  code += '// EGL global dispatch\n'
+  w('// EGL global dispatch')
 
   for api in apis:
     if api.name=='egl':
       for function in api.functions:
         if not ("KHR" in function.name or "NV" in function.name or "MESA" in function.name or "ANGLE" in function.name):
           name   = function.name
-          code += '  tbl.r%s = ::%s;\n' % ( name, name )
+          w('  tbl.r%s = ::%s;' % ( name, name ))
 
-      code += "\n#if !REGAL_SYS_EMSCRIPTEN\n"
+      w()
+      with w.condition('!REGAL_SYS_EMSCRIPTEN'):
 
-      for function in api.functions:
-        if "KHR" in function.name or "NV" in function.name or "MESA" in function.name or "ANGLE" in function.name:
-          name   = function.name
-          code += '  tbl.r%s = ::%s;\n' % ( name, name )
+        for function in api.functions:
+          if "KHR" in function.name or "NV" in function.name or "MESA" in function.name or "ANGLE" in function.name:
+            name   = function.name
+            w('  tbl.r%s = ::%s;' % ( name, name ))
 
-      code += "#endif // !REGAL_SYS_EMSCRIPTEN\n"
-
-  return code
+  return w.text()
 
 def generateStaticEGLSource(apis, args):
+  w = CodeWriter()
 
-  code  = '\n'
-
-  code += '#ifndef REGAL_NAMESPACE\n'
-  code += '#error REGAL_STATIC_EGL requires REGAL_NAMESPACE\n'
-  code += '#endif\n\n'
+  w()
+  w('#ifndef REGAL_NAMESPACE',
+    '#error REGAL_STATIC_EGL requires REGAL_NAMESPACE',
+    '#endif',
+    '')
 
   for api in apis:
     if api.name=='egl':
 
       for function in api.functions:
         name   = function.name
-        code += '#undef %s\n' % ( name )
+        w('#undef %s' % ( name ))
 
-      code += '\n'
-      code += 'extern "C"\n'
-      code += '{\n'
+      w()
+      w('extern "C"',
+        '{')
 
       for function in api.functions:
-        params = paramsDefaultCode(function.parameters, True)
-        rType  = typeCode(function.ret.type)
-        code += '  extern %s REGAL_CALL %s(%s);\n' % (rType, function.name, params)
+        params = function.view.params
+        rType  = function.view.rType
+        w('  extern %s REGAL_CALL %s(%s);' % (rType, function.name, params))
 
-      code += '}\n'
+      w('}')
 
   substitute = {}
 
@@ -101,7 +100,7 @@ def generateStaticEGLSource(apis, args):
   substitute['AUTOGENERATED'] = args.generated
   substitute['COPYRIGHT']     = args.copyright
   substitute['DISPATCH_NAME'] = 'StaticEGL'
-  substitute['LOCAL_INCLUDE'] = code
+  substitute['LOCAL_INCLUDE'] = w.text()
   substitute['LOCAL_CODE']    = ''
   substitute['API_DISPATCH_FUNC_DEFINE'] = ''
   substitute['API_DISPATCH_FUNC_INIT'] = apiStaticEGLFuncInitCode( apis, args )
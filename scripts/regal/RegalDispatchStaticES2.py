@@ -14,54 +14,57 @@ from RegalDispatchShared import dispatchSourceTemplate, apiDispatchFuncInitCode
 ##############################################################################################
 
 def apiStaticES2FuncInitCode(apis, args):
+  w = CodeWriter()
 
-  code = '// OpenGL ES 2.0 only\n\n'
+  w('// OpenGL ES 2.0 only',
+    '')
 
   for api in apis:
     if api.name=='gl':
       for function in api.functions:
-        if not function.needsContext:
+        if not function.view.needsContext:
           continue
         if getattr(function,'esVersions',None)==None or 2.0 not in function.esVersions:
           continue
         name   = function.name
-        code += '  tbl.r%s = %s;\n' % ( name, name )
+        w('  tbl.r%s = %s;' % ( name, name ))
 
-  return code
+  return w.text()
 
 def generateStaticES2Source(apis, args):
+  w = CodeWriter()
 
-  code  = '\n'
-
-  code += '#ifndef REGAL_NAMESPACE\n'
-  code += '#error REGAL_STATIC_ES2 requires REGAL_NAMESPACE\n'
-  code += '#endif\n\n'
+  w()
+  w('#ifndef REGAL_NAMESPACE',
+    '#error REGAL_STATIC_ES2 requires REGAL_NAMESPACE',
+    '#endif',
+    '')
 
   for api in apis:
     if api.name=='gl':
 
       for function in api.functions:
-        if not function.needsContext:
+        if not function.view.needsContext:
           continue
         if getattr(function,'esVersions',None)==None or 2.0 not in function.esVersions:
           continue
         name   = function.name
-        code += '#undef %s\n' % ( name )
+        w('#undef %s' % ( name ))
 
-      code += '\n'
-      code += 'extern "C"\n'
-      code += '{\n'
+      w()
+      w('extern "C"',
+        '{')
 
       for function in api.functions:
-        if not function.needsContext:
+        if not function.view.needsContext:
           continue
         if getattr(function,'esVersions',None)==None or 2.0 not in function.esVersions:
           continue
-        params = paramsDefaultCode(function.parameters, True)
-        rType  = typeCode(function.ret.type)
-        code += '  extern %s REGAL_CALL %s(%s);\n' % (rType, function.name, params)
+        params = function.view.params
+        rType  = function.view.rType
+        w('  extern %s REGAL_CALL %s(%s);' % (rType, function.name, params))
 
-      code += '}\n'
+      w('}')
 
   substitute = {}
 
@@ -69,7 +72,7 @@ def generateStaticES2Source(apis, args):
   substitute['AUTOGENERATED'] = args.generated
   substitute['COPYRIGHT']     = args.copyright
   substitute['DISPATCH_NAME'] = 'StaticES2'
-  substitute['LOCAL_INCLUDE'] = code
+  substitute['LOCAL_INCLUDE'] = w.text()
   substitute['LOCAL_CODE']    = ''
   substitute['API_DISPATCH_FUNC_DEFINE'] = ''
   substitute['API_DISPATCH_FUNC_INIT'] = apiStaticES2FuncInitCode( apis, args )
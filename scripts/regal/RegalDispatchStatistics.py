@@ -7,126 +7,99 @@ from ApiUtil import typeIsVoid
 
 from ApiCodeGen import *
 
-from RegalDispatchLog import apiDispatchFuncInitCode
-from RegalDispatchEmu import dispatchSourceTemplate
 from RegalContextInfo import cond
 
-from RegalDispatchShared import dispatchSourceTemplate
+from RegalDispatchShared import dispatchSourceTemplate, outputDispatchSource
 from RegalDispatchShared import apiDispatchFuncInitCode
 from RegalDispatchShared import apiDispatchGlobalFuncInitCode
 
-from Emu       import emuFindEntry, emuCodeGen
-
 ##############################################################################################
 
 def apiStatisticsFuncDefineCode(apis, args):
-  categoryPrev = None
-  code = ''
+  w = CodeWriter()
 
   for api in apis:
 
-    code += '\n'
-    if api.name in cond:
-      code += '#if %s\n' % cond[api.name]
-
-    for function in api.functions:
-
-      if getattr(function,'regalOnly',False)==True:
-        continue
-
-      if not function.needsContext:
-        continue
-
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
-
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
-
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
-
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '// %s\n\n' % category
-
-      categoryPrev = category
-
-      code += 'static %sREGAL_CALL %s%s(%s) \n{\n' % (rType, 'statistics_', name, params)
-      code += '  RegalContext *_context = REGAL_GET_CONTEXT();\n'
-      code += '  RegalAssert(_context);\n'
-      code += '\n'
-      code += '  RegalAssert(_context->statistics);\n'
-      code += '  Statistics &statistics = *_context->statistics;\n'
-      code += '  statistics.%s++;\n'%(name)
-      code += '\n'
-
-      # Extension
-
-      for i in api.extensions:
-        if name in i.functions:
-          code += '  statistics.%s++;\n'%(i.name.lower())
-        code += '\n'
-
-      # glEnable
-
-      if name=='glEnable':
-        code += '  switch (cap)\n'
-        code += '  {\n'
-        for i in api.enums:
-          if i.name=='defines':
-            for j in i.enumerantsByName:
-              if getattr(j,'enableCap',False) == True:
-                code += '    case %-40s %-60s break;\n'%(j.name+':','statistics.enable_%s++;'%j.name)
-        code += '    default: break;\n'
-        code += '  }\n\n'
-
-      # glDisable
-
-      if name=='glDisable':
-        code += '  switch (cap)\n'
-        code += '  {\n'
-        for i in api.enums:
-          if i.name=='defines':
-            for j in i.enumerantsByName:
-              if getattr(j,'enableCap',False) == True:
-                code += '    case %-40s %-60s break;\n'%(j.name+':','statistics.disable_%s++;'%j.name)
-        code += '    default: break;\n'
-        code += '  }\n\n'
-
-      if function.needsContext:
-        code += '  DispatchTableGL *_next = _context->dispatcher.statistics.next();\n'
-      else:
-        code += '  DispatchTableGlobal *_next = dispatcherGlobal.statistics.next();\n'
-      code += '  RegalAssert(_next);\n'
-
-      code += '  '
-      if not typeIsVoid(rType):
-        code += '%s ret = ' % rType
-      code += '_next->call(&_next->%s)(%s);\n' % ( name, callParams )
-      if not typeIsVoid(rType):
-        code += '  return ret;\n'
-      code += '}\n\n'
-
-    if api.name in cond:
-      code += '#endif // %s\n' % cond[api.name]
-    code += '\n'
-
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
-
-  return code
+    w()
+    with w.condition(cond.get(api.name)):
 
-def generateDispatchStatistics(apis, args):
+      for function in api.functions:
+
+        if function.view.regalOnly:
+          continue
+
+        if not function.view.needsContext:
+          continue
+
+        view       = function.view
+        name       = view.name
+        params     = view.params
+        callParams = view.callParams
+        rType      = view.rType
+        category   = view.category
+
+        w.category(category)
+
+        w('static %sREGAL_CALL %s%s(%s)' % (rType, 'statistics_', name, params),
+          '{',
+          '  RegalContext *_context = REGAL_GET_CONTEXT();',
+          '  RegalAssert(_context);')
+        w()
+        w('  RegalAssert(_context->statistics);',
+          '  Statistics &statistics = *_context->statistics;',
+          '  statistics.%s++;' %(name))
+        w()
+
+        # Extension
+
+        for i in api.index.extensions.get(name, []):
+          w('  statistics.%s++;'%(i.name.lower()))
+          w()
+        w()
+
+        # glEnable
+
+        if name=='glEnable':
+          w('  switch (cap)',
+            '  {')
+          for j in api.index.enumerantsWith('enableCap'):
+            w('    case %-40s %-60s break;' %(j.name+':','statistics.enable_%s++;'%j.name))
+          w('    default: break;',
+            '  }')
+          w()
+
+        # glDisable
+
+        if name=='glDisable':
+          w('  switch (cap)',
+            '  {')
+          for j in api.index.enumerantsWith('enableCap'):
+            w('    case %-40s %-60s break;' %(j.name+':','statistics.disable_%s++;'%j.name))
+          w('    default: break;',
+            '  }')
+          w()
+
+        if function.view.needsContext:
+          w('  DispatchTableGL *_next = _context->dispatcher.statistics.next();')
+        else:
+          w('  DispatchTableGlobal *_next = dispatcherGlobal.statistics.next();')
+        w('  RegalAssert(_next);')
+
+        if not typeIsVoid(rType):
+          w('  %s ret = _next->call(&_next->%s)(%s);' % ( rType, name, callParams ),
+            '  return ret;')
+        else:
+          w('  _next->call(&_next->%s)(%s);' % ( name, callParams ))
+        w('}')
+        w()
+
+    w()
+
+  w.endCategory()
+
+  return w.text()
+
+def statisticsSource(apis, args, name):
 
   funcDefine     = apiStatisticsFuncDefineCode( apis, args )
   funcInit       = apiDispatchFuncInitCode( apis, args, 'statistics' )
@@ -138,7 +111,7 @@ def generateDispatchStatistics(apis, args):
   substitute['LICENSE']         = args.license
   substitute['AUTOGENERATED']   = args.generated
   substitute['COPYRIGHT']       = args.copyright
-  substitute['DISPATCH_NAME']   = 'Statistics'
+  substitute['DISPATCH_NAME']   = name
   substitute['LOCAL_INCLUDE']   = '#include "RegalStatistics.h"'
   substitute['LOCAL_CODE']      = ''
   substitute['API_DISPATCH_FUNC_DEFINE']      = funcDefine
@@ -147,5 +120,8 @@ def generateDispatchStatistics(apis, args):
   substitute['IFDEF'] = '#if REGAL_STATISTICS\n\n'
   substitute['ENDIF'] = '#endif\n'
 
-  outputCode( '%s/RegalDispatchStatistics.cpp' % args.srcdir, dispatchSourceTemplate.substitute(substitute))
+  return dispatchSourceTemplate.substitute(substitute)
+
+def generateDispatchStatistics(apis, args):
+  outputDispatchSource(apis, args, 'Statistics', statisticsSource, '#if REGAL_STATISTICS\n\n', '#endif\n')
 
@@ -22,122 +22,84 @@ traceCond['glx'] = 'REGAL_SYS_GLX && REGAL_SYS_X11'
 # CodeGen for apitrace integration
 
 def apiTraceFuncDefineCode(apis, args):
-  categoryPrev = None
-  code = ''
+  w = CodeWriter()
 
-  code += 'namespace Trace\n'
-  code += '{\n'
+  w('namespace Trace',
+    '{')
 
   for api in apis:
 
-    code += '\n'
-    if api.name in traceCond:
-      code += '#if %s\n' % traceCond[api.name]
+    w()
+    with w.condition(traceCond.get(api.name)):
 
-    for function in api.functions:
-      if getattr(function,'regalOnly',False)==True:
-        continue
-      if function.name in exclude or function.category in exclude:
-        continue
+      for function in api.functions:
+        if function.view.regalOnly:
+          continue
+        if function.name in exclude or function.category in exclude:
+          continue
 
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
+        view       = function.view
+        name       = view.name
+        params     = view.params
+        callParams = view.callParams
+        rType      = view.rType
+        category   = view.category
 
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+        w.category(category)
 
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
+        w('  %s %s(%s);' % (rType, name, params))
 
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '// %s\n\n' % category
+    w()
 
-      categoryPrev = category
+  w.endCategory()
 
-      code += '  %s %s(%s);\n' % (rType, name, params)
-
-    if api.name in traceCond:
-      code += '#endif // %s\n' % traceCond[api.name]
-    code += '\n'
-
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
-
-  code += '} // namespace Trace \n\n'
+  w('} // namespace Trace')
+  w()
 
   for api in apis:
 
-    code += '\n'
-    if api.name in traceCond:
-      code += '#if %s\n' % traceCond[api.name]
-
-    for function in api.functions:
-      if getattr(function,'regalOnly',False)==True:
-        continue
-      if function.name in exclude or function.category in exclude:
-        continue
-
-      name   = function.name
-      params = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType  = typeCode(function.ret.type)
-      category  = getattr(function, 'category', None)
-      version   = getattr(function, 'version', None)
-
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
-
-      # Close prev category block.
-      if categoryPrev and not (category == categoryPrev):
-        code += '\n'
-
-      # Begin new category block.
-      if category and not (category == categoryPrev):
-        code += '// %s\n\n' % category
-
-      categoryPrev = category
-
-      code += 'static %sREGAL_CALL %s%s(%s) \n{\n' % (rType, 'trace_', name, params)
-      code += '  Internal("trace_%s","()");\n' % name
-      code += '  Thread::ThreadLocal &_instance = Thread::ThreadLocal::instance();\n'
-      if function.needsContext:
-        code += '  RegalAssert(_instance.currentContext);\n'
-        code += '  Push<DispatchTableGL *> _push(_instance.nextDispatchTable);\n'
-        code += '  _instance.nextDispatchTable = _instance.currentContext->dispatcher.trace.next();\n'
-      else:
-        code += '  Push<DispatchTableGlobal *> _push(_instance.nextDispatchTableGlobal);\n'
-        code += '  _instance.nextDispatchTableGlobal = dispatcherGlobal.trace.next();\n'
-      code += '  '
-      if not typeIsVoid(rType):
-        code += '%s ret = ' % rType
-      #code += '_next->call(&_next->%s)(%s);\n' % ( name, callParams )
-      code += 'Trace::%s(%s);\n' % ( name, callParams )
-      if not typeIsVoid(rType):
-        code += '  return ret;\n'
-      code += '}\n\n'
-
-    if api.name in traceCond:
-      code += '#endif // %s\n' % traceCond[api.name]
-    code += '\n'
-
-  # Close pending if block.
-  if categoryPrev:
-    code += '\n'
-
-  return code
+    w()
+    with w.condition(traceCond.get(api.name)):
+
+      for function in api.functions:
+        if function.view.regalOnly:
+          continue
+        if function.name in exclude or function.category in exclude:
+          continue
+
+        view       = function.view
+        name       = view.name
+        params     = view.params
+        callParams = view.callParams
+        rType      = view.rType
+        category   = view.category
+
+        w.category(category)
+
+        w('static %sREGAL_CALL %s%s(%s)' % (rType, 'trace_', name, params),
+          '{',
+          '  Internal("trace_%s","()");' % name,
+          '  Thread::ThreadLocal &_instance = Thread::ThreadLocal::instance();')
+        if function.view.needsContext:
+          w('  RegalAssert(_instance.currentContext);',
+            '  Push<DispatchTableGL *> _push(_instance.nextDispatchTable);',
+            '  _instance.nextDispatchTable = _instance.currentContext->dispatcher.trace.next();')
+        else:
+          w('  Push<DispatchTableGlobal *> _push(_instance.nextDispatchTableGlobal);',
+            '  _instance.nextDispatchTableGlobal = dispatcherGlobal.trace.next();')
+        if not typeIsVoid(rType):
+          w('  %s ret = Trace::%s(%s);' % ( rType, name, callParams ),
+            '  return ret;')
+        else:
+          w('  Trace::%s(%s);' % ( name, callParams ))
+        w('}')
+        w()
+
+    w()
+
+  w.endCategory()
+
+  return w.text()
 
 def generateTraceSource(apis, args):
 
@@ -4,6 +4,8 @@ from string import Template, upper, replace
 
 from ApiUtil import outputCode
 
+from RegalContextInfo import extensionNames
+
 cond = { 'wgl' : 'REGAL_SYS_WGL', 'glx' : 'REGAL_SYS_GLX', 'cgl' : 'REGAL_SYS_OSX', 'egl' : 'REGAL_SYS_EGL' }
 
 emuInfoHeaderTemplate = Template( '''${AUTOGENERATED}
@@ -285,11 +287,17 @@ EmuInfo::getExtension(const ContextInfo &contextInfo, const char *ext) const
 
   // If the context supports it, we're done.
 
-  if (contextInfo.getExtension(ext))
+  const size_t i = contextInfo.extensionIndex(ext);
+  if (contextInfo.getExtension(i))
     return true;
 
+  switch (i)
+  {
 '''
 
+  names = extensionNames(apis)
+  index = dict([ (names[i], i) for i in range(len(names)) ])
+
   for api in apis:
 
     emulatedExtensions = [extension.name for extension in api.extensions if len(extension.emulatedBy)]
@@ -299,15 +307,15 @@ EmuInfo::getExtension(const ContextInfo &contextInfo, const char *ext) const
       code += '#if %s\n'%cond[name]
     for c in sorted(api.categories):
       if c.startswith('GL_REGAL_') or c=='GL_EXT_debug_marker':
-        code += '  if %-50s return true;\n' % ('(!strcmp(ext,"%s"))'%c)
+        code += '    %-12s return true;\n' % ('case %d:'%index[c])
       elif c in emulatedExtensions:
-        code += '  if %-50s return %s;\n' % ('(!strcmp(ext,"%s"))'%c,c.lower())
+        code += '    %-12s return %s;\n' % ('case %d:'%index[c],c.lower())
     if name in cond:
       code += '#endif\n'
     code += '\n'
 
-  code += '''
-  return false;
+  code += '''    default:     return false;
+  }
 }
 '''
 
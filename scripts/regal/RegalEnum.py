@@ -4,6 +4,7 @@ from string import Template, upper, replace
 
 from ApiUtil    import outputCode
 from ApiCodeGen import *
+from ApiSubset  import fullApis
 
 from RegalContextInfo import cond
 
@@ -71,6 +72,8 @@ REGAL_NAMESPACE_END
 
 def generateEnumHeader(apis, args):
 
+  apis = fullApis(apis)
+
   regalEnumSet = set()
   regalEnum = []
 
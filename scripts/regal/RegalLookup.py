@@ -3,6 +3,7 @@
 from string           import Template, upper, replace
 from ApiUtil          import outputCode
 from ApiCodeGen       import *
+from ApiSubset        import fullApis
 from RegalContextInfo import cond
 
 lookupSourceTemplate = Template( '''${AUTOGENERATED}
@@ -32,7 +33,9 @@ REGAL_NAMESPACE_END
 ''')
 
 def pointerLookupSource(api = None, names = []):
-  return pointerLookupByNameCode([ (j,j) for j in names ],("%s_Name"%api,"%s_Value"%api),valueCast = '(void *)(%s)')
+  code = pointerLookupByNameCode([ (j,j) for j in names ],("%s_Name"%api,"%s_Value"%api),valueCast = '(void *)(%s)')
+  code.extend(perfectHashCode(names,("%s_Seed"%api,"%s_Slot"%api)))
+  return code
 
 def offsetLookupSource(api = None, names = [], table = None, exclude = set()):
   names.sort()
@@ -48,19 +51,22 @@ def offsetLookupSource(api = None, names = [], table = None, exclude = set()):
   ret.append('')
   return ret
 
+# Functions pruned by --subset are looked up by name, as their entry
+# points remain, but have no offset in the dispatch table.
+
 def generateLookupSource(apis, args):
 
   ret = []
 
-  for i in apis:
+  for i in fullApis(apis):
 
     code = []
 
-    regalOnly = set( [ j.name for j in i.functions if getattr(j,'regalOnly',False)==True ] )
+    regalOnly = set( [ j.name for j in i.functions if j.view.regalOnly or j.view.pruned ] )
 
     # Special handling for Regal-only function lookup
     if i.name=='gl':
-      names = [ j.name for j in i.functions if getattr(j,'regalOnly',False)==True or j.category=='GL_REGAL_ES1_0_compatibility']
+      names = [ j.name for j in i.functions if j.view.regalOnly or j.category=='GL_REGAL_ES1_0_compatibility']
 #      code.extend(pointerLookupSource('regal',names))
 #      code.extend(offsetLookupSource('regal',names,"Dispatch::GL",regalOnly))
 
@@ -104,7 +110,6 @@ ${LICENSE}
 
 REGAL_GLOBAL_BEGIN
 
-#include <cstdlib>
 #include <cstring>
 
 REGAL_GLOBAL_END
@@ -113,9 +118,27 @@ REGAL_NAMESPACE_BEGIN
 
 namespace Lookup {
 
-inline int NameCmp(const void *a, const void *b)
+// 32-bit FNV-1a hash of name, as nameHash in scripts/api/ApiHash.py
+
+inline unsigned int NameHash(unsigned int seed, const char *name)
+{
+  unsigned int h = seed ^ 2166136261u;
+  for (; *name; ++name)
+  {
+    h ^= static_cast<unsigned char>(*name);
+    h *= 16777619u;
+  }
+  return h;
+}
+
+// Index of name in the sorted names, or size if not found.
+// A minimal perfect hash, then a strcmp to confirm.
+
+inline size_t NameIndex(const char *name, const char * const *names, const short *seeds, const unsigned short *slots, const size_t size)
 {
-  return std::strcmp(*(const char **) a, *(const char **) b);
+  const int    seed = seeds[NameHash(0,name)%size];
+  const size_t i    = slots[seed<0 ? -seed-1 : NameHash(seed,name)%size];
+  return std::strcmp(names[i],name) ? size : i;
 }
 
 ${CODE}
@@ -132,17 +155,19 @@ def pointerLookupHeader(api = None, names = []):
   ret.append( '' )
   ret.append( 'extern const char * const %s_Name[%d];'%(api,len(names)+1) )
   ret.append( 'extern const void *%s_Value[%d];'%(api,len(names)+1) )
+  ret.append( 'extern const short %s_Seed[%d];'%(api,len(names)) )
+  ret.append( 'extern const unsigned short %s_Slot[%d];'%(api,len(names)) )
   ret.append('''
 
 template<typename T>
 T
 %s(const char *name, T def = NULL)
 {
-  const char **res = (const char **) std::bsearch(&name, %s_Name, %d, sizeof(const char *), NameCmp);
-  return res ? reinterpret_cast<T>(const_cast<void *>(%s_Value[(size_t) (res - %s_Name)])) : def;
+  const size_t i = NameIndex(name, %s_Name, %s_Seed, %s_Slot, %d);
+  return i<%d ? reinterpret_cast<T>(const_cast<void *>(%s_Value[i])) : def;
 }
 
-'''%('%s_Lookup'%api,api,len(names),api,api))
+'''%('%s_Lookup'%api,api,api,api,len(names),len(names),api))
 
   return ret
 
@@ -154,11 +179,11 @@ def offsetLookupHeader(api = None, names = [], table = None, exclude = set()):
 
 inline size_t %s(const char *name)
 {
-  const char **res = (const char **) std::bsearch(&name, %s_Name, %d, sizeof(const char *), NameCmp);
-  return res ? %s_Offset[(size_t) (res - %s_Name)] : 0;
+  const size_t i = NameIndex(name, %s_Name, %s_Seed, %s_Slot, %d);
+  return i<%d ? %s_Offset[i] : 0;
 }
 
-'''%('%s_LookupOffset'%api,api,len(names),api,api))
+'''%('%s_LookupOffset'%api,api,api,api,len(names),len(names),api))
 
   return ret
 
@@ -166,13 +191,13 @@ def generateLookupHeader(apis, args, offsetLookup = True, ifFunction = lambda i
 
   ret = []
 
-  for i in apis:
+  for i in fullApis(apis):
 
     code = []
 
     # Special handling for Regal-only function lookup
     if i.name=='gl':
-      names = [ j.name for j in i.functions if getattr(j,'regalOnly',False)==True or j.category=='GL_REGAL_ES1_0_compatibility']
+      names = [ j.name for j in i.functions if j.view.regalOnly or j.category=='GL_REGAL_ES1_0_compatibility']
 #      code.extend(pointerLookupHeader('regal',names))
 #      code.extend(offsetLookupHeader('regal',names))
 
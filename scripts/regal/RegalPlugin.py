@@ -77,28 +77,22 @@ def generatePluginSource(apis, args):
     tmp = []
     for function in api.functions:
 
-      if getattr(function,'regalOnly',False):
+      if function.view.regalOnly:
         continue
 
-      name       = function.name
-      params     = paramsDefaultCode(function.parameters, True)
-      callParams = paramsNameCode(function.parameters)
-      rType      = typeCode(function.ret.type)
+      view       = function.view
+      name       = view.name
+      params     = view.params
+      callParams = view.callParams
+      rType      = view.rType
       rTypes     = rType.strip()
-      category   = getattr(function, 'category', None)
-      version    = getattr(function, 'version', None)
-
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+      category   = view.category
 
       c = ''
       c += '%sREGAL_CALL plugin_%s(%s) \n{\n' % (rType, name, params)
 
       c += '  ::REGAL_NAMESPACE_INTERNAL::Thread::ThreadLocal &_instance = ::REGAL_NAMESPACE_INTERNAL::Thread::ThreadLocal::instance();\n'
-      if function.needsContext:
+      if function.view.needsContext:
         c += '  ::REGAL_NAMESPACE_INTERNAL::DispatchTableGL *_next = _instance.nextDispatchTable;\n'
       else:
         c += '  ::REGAL_NAMESPACE_INTERNAL::DispatchTableGlobal *_next = _instance.nextDispatchTableGlobal;\n'
@@ -127,12 +121,13 @@ def generatePluginSource(apis, args):
 
     names = []
     for j in i.functions:
-      if getattr(j,'regalOnly',False):
+      if j.view.regalOnly:
         continue
       names.append(j.name)
 
     size[i.name] = len(names)
     tmp.extend(pointerLookupByNameCode([ (j,'plugin_%s'%j) for j in names ],("lookup_%s_Name"%i.name,"lookup_%s_Value"%i.name),valueCast = '(void *)(%s)'))
+    tmp.extend(perfectHashCode(names,("lookup_%s_Seed"%i.name,"lookup_%s_Slot"%i.name)))
 
     tmp = '\n'.join(tmp)
     if i.name in cond:
@@ -149,12 +144,12 @@ def generatePluginSource(apis, args):
   void * REGAL_CALL
   plugin_glGetProcAddress(const char *name)
   {
-    const char **res;
+    size_t i;
 '''
 
   for i in apis:
-    tmp =  '    res = (const char **) std::bsearch(&name, %s, %d, sizeof(const char *), NameCmp);\n'%('lookup_%s_Name'%i.name,size[i.name]-1)
-    tmp += '    if (res) return const_cast<void *>(%s[(size_t) (res - %s)]);\n'%('lookup_%s_Value'%i.name,'lookup_%s_Name'%i.name)
+    tmp =  '    i = NameIndex(name, lookup_%s_Name, lookup_%s_Seed, lookup_%s_Slot, %d);\n'%(i.name,i.name,i.name,size[i.name])
+    tmp += '    if (i<%d) return const_cast<void *>(lookup_%s_Value[i]);\n'%(size[i.name],i.name)
     if i.name in cond:
       tmp = wrapIf(cond[i.name], tmp)
     code3 += '\n' + tmp
@@ -149,18 +149,12 @@ def versionDeclareCode(apis, args):
     tmp = []
     for function in api.functions:
 
-      if getattr(function,'regalOnly',False):
+      if function.view.regalOnly:
         continue
 
-      name       = function.name
-      category   = getattr(function, 'category', None)
-      version    = getattr(function, 'version', None)
-
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+      view       = function.view
+      name       = view.name
+      category   = view.category
 
       c = 'GLuint %s;'%(name)
 
@@ -179,12 +173,9 @@ def versionDeclareCode(apis, args):
   disable = ''
 
   for api in apis:
-    for i in api.enums:
-      if i.name=='defines':
-        for j in i.enumerantsByName:
-          if getattr(j,'enableCap',False) == True:
-            enable  += '  GLuint enable_%s;\n'%(j.name)
-            disable += '  GLuint disable_%s;\n'%(j.name)
+    for j in api.index.enumerantsWith('enableCap'):
+      enable  += '  GLuint enable_%s;\n'%(j.name)
+      disable += '  GLuint disable_%s;\n'%(j.name)
 
   code += '\n' + enable + '\n' + disable
 
@@ -217,18 +208,12 @@ def versionLogCode(apis, args):
     tmp = []
     for function in api.functions:
 
-      if getattr(function,'regalOnly',False):
+      if function.view.regalOnly:
         continue
 
-      name       = function.name
-      category   = getattr(function, 'category', None)
-      version    = getattr(function, 'version', None)
-
-      if category:
-        category = category.replace('_DEPRECATED', '')
-      elif version:
-        category = version.replace('.', '_')
-        category = 'GL_VERSION_' + category
+      view       = function.view
+      name       = view.name
+      category   = view.category
 
       c = 'log("%s",%s);'%(name,name)
 
@@ -247,12 +232,9 @@ def versionLogCode(apis, args):
   disable = ''
 
   for api in apis:
-    for i in api.enums:
-      if i.name=='defines':
-        for j in i.enumerantsByName:
-          if getattr(j,'enableCap',False) == True:
-            enable  += '  log("glEnable(%s)",enable_%s);\n'%(j.name,j.name)
-            disable += '  log("glDisable(%s)",disable_%s);\n'%(j.name,j.name)
+    for j in api.index.enumerantsWith('enableCap'):
+      enable  += '  log("glEnable(%s)",enable_%s);\n'%(j.name,j.name)
+      disable += '  log("glDisable(%s)",disable_%s);\n'%(j.name,j.name)
 
   code += '\n' + enable + '\n' + disable
 
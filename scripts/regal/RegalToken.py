@@ -3,8 +3,9 @@
 from string import Template, upper, replace
 
 from ApiUtil import outputCode
-from ApiUtil import toLong
 from ApiUtil import hexValue
+from ApiHash import valueHash
+from ApiCodeGen import perfectHashCode
 
 tokenSourceTemplate = Template( '''${AUTOGENERATED}
 ${LICENSE}
@@ -18,6 +19,8 @@ REGAL_GLOBAL_BEGIN
 #include "RegalPrivate.h"
 #include "RegalToken.h"
 
+#include <cstddef>
+
 #include <boost/print/string_list.hpp>
 #include <boost/print/print_string.hpp>
 
@@ -29,6 +32,29 @@ REGAL_NAMESPACE_BEGIN
 
 namespace Token {
 
+  #if REGAL_ENUM_TO_STRING
+
+  // Multiplicative hash of v, as valueHash in scripts/api/ApiHash.py
+
+  static inline unsigned int ValueHash(unsigned int seed, GLuint v)
+  {
+    const unsigned int h = (v ^ seed) * 2654435761u;
+    return h ^ (h >> 16);
+  }
+
+  // Name of v in the sorted values, or NULL if not found.
+  // A minimal perfect hash, then a compare to confirm.
+  // The names are offsets into a pool of strings.
+
+  static inline const char *enumToString(GLuint v, const GLuint *values, const unsigned int *names, const void *pool, const short *seeds, const unsigned short *slots, const size_t size)
+  {
+    const int    seed = seeds[ValueHash(0,v)%size];
+    const size_t i    = slots[seed<0 ? -seed-1 : ValueHash(seed,v)%size];
+    return values[i]==v ? reinterpret_cast<const char *>(pool) + names[i] : NULL;
+  }
+
+  #endif // REGAL_ENUM_TO_STRING
+
   const char * GLbooleanToString(GLboolean v)
   {
     return v==GL_FALSE ? "GL_FALSE" : "GL_TRUE";
@@ -787,15 +813,12 @@ def groupToStringCodeGen(apis, group, name, default = 'NULL', type = 'GLenum', f
   for i in apis:
     if i.name != 'gl':
       continue
-    for j in i.enums:
-      if j.name != 'defines':
-        continue
-      enums = [k for k in j.enumerantsByName if group in k.group ]
-      enums = sorted(enums,key=lambda k : k.value)
-      for k in enums:
-        for l in k.alias:
-          tmp.append('      case \'%s\':'%(l))
-        tmp.append('      case %s: return "%s";'%(hexValue(k.value,format),k.name))
+    enums = [k for k in i.index.enumerants if group in k.group ]
+    enums = sorted(enums,key=lambda k : k.value)
+    for k in enums:
+      for l in k.alias:
+        tmp.append('      case \'%s\':'%(l))
+      tmp.append('      case %s: return "%s";'%(hexValue(k.value,format),k.name))
   tmp.append('      default: break;')
   tmp.append('    }')
   tmp.append('    #endif // REGAL_ENUM_TO_STRING')
@@ -804,52 +827,99 @@ def groupToStringCodeGen(apis, group, name, default = 'NULL', type = 'GLenum', f
 
   return tmp
 
-def generateTokenSource(apis, args):
+# Value and preferred name of each enum of <api>, sorted by value
+
+def enumNames(api, zero = None, one = None):
+
+  e = sorted(api.index.values.items())
+  e = [ i for i in e if i[0] < 0xfffffffff ]
+  e = filterTokens(e)
+
+  names = []
+  for i in e:
+    value = i[0]
+    if len(i[1]):
+      name = i[1][0]
+    else:
+      name = i[2][0]
+
+    if value==0 and zero:
+      name = zero
+    if value==1 and one:
+      name = one
+
+    names.append((value, name))
+
+  return names
+
+# Tables for Token::enumToString, sorted by value.  The names are
+# offsets into a pool struct of char arrays, rather than a string
+# literal that compilers limit in length, or an array of pointers
+# needing relocation.
+
+def enumTableCode(prefix, type, names):
+
+  assert len(set([ i[1] for i in names ]))==len(names)
 
   code = []
 
-  code.append('  const char * GLenumToString( GLenum e ) {')
-  code.append('    #if REGAL_ENUM_TO_STRING')
-  code.append('    switch( e ) {')
+  code.append('  struct %sEnumPool {' % type)
+  for i in names:
+    code.append('    char n_%s[%d];' % (i[1], len(i[1]) + 1))
+  code.append('  };')
+  code.append('')
 
-  for i in apis:
-    if i.name != 'gl':
-      continue
-    e = {}
-    for j in i.enums:
-      if j.name != 'defines':
-        continue
-      for k in j.enumerantsByName:
-        value = toLong(k.value)
-        if value != None:
-          if not value in e:
-            e[value] = set()
-          e[value].add(k.name)
-
-    e = sorted([ (i,sorted(list(e[i]))) for i in e.iterkeys() ])
-    e = [ i for i in e if i[0] < 0xfffffffff ]
-    e = filterTokens(e)
-
-    for i in e:
-      value = i[0]
-      if len(i[1]):
-        name = i[1][0]
-      else:
-        name = i[2][0]
+  code.append('  const %sEnumPool %sEnumPool = {' % (type, prefix))
+  code.extend([ '    "%s",' % i[1] for i in names ])
+  code[-1] = code[-1][:-1]
+  code.append('  };')
+  code.append('')
+
+  code.append('  const GLuint %sEnumValue[%d] = {' % (prefix, len(names)))
+  for i in range(0, len(names), 8):
+    code.append('    ' + ' '.join([ '%s,' % hexValue(j[0],'0x%08x') for j in names[i:i+8] ]))
+  code[-1] = code[-1][:-1]
+  code.append('  };')
+  code.append('')
 
-      if value==0:
-        name = 'GL_ZERO'
-      if value==1:
-        name = 'GL_ONE'
+  code.append('  const unsigned int %sEnumName[%d] = {' % (prefix, len(names)))
+  code.extend([ '    offsetof(%sEnumPool,n_%s),' % (type, i[1]) for i in names ])
+  code[-1] = code[-1][:-1]
+  code.append('  };')
+  code.append('')
 
-      code.append('      case %s: return "%s";'%(hexValue(value,'0x%08x'),name))
+  for i in perfectHashCode([ j[0] for j in names ], ('%sEnumSeed' % prefix, '%sEnumSlot' % prefix), valueHash):
+    code.append(len(i) and '  ' + i or i)
 
-  code.append('      default: break;')
-  code.append('    }')
+  return code
+
+def enumToStringCode(prefix, type, names, function, default):
+
+  code = []
+  code.append('  #if REGAL_ENUM_TO_STRING')
+  code.append('')
+  code.extend(enumTableCode(prefix, type, names))
+  code.append('  #endif // REGAL_ENUM_TO_STRING')
+  code.append('')
+  code.append('  const char * %s {' % function)
+  code.append('    #if REGAL_ENUM_TO_STRING')
+  code.append('    const char *name = enumToString(static_cast<GLuint>(v), %sEnumValue, %sEnumName, &%sEnumPool, %sEnumSeed, %sEnumSlot, %d);' % (prefix, prefix, prefix, prefix, prefix, len(names)))
+  code.append('    if (name)')
+  code.append('      return name;')
   code.append('    #endif // REGAL_ENUM_TO_STRING')
-  code.append('    return "unknown_gl_enum";')
+  code.append('    return "%s";' % default)
   code.append('  }')
 
+  return code
+
+def generateTokenSource(apis, args):
+
+  code = []
+
+  for i in apis:
+    if i.name == 'gl':
+      code.extend(enumToStringCode('gl', 'GL', enumNames(i, 'GL_ZERO', 'GL_ONE'), 'GLenumToString( GLenum v )', 'unknown_gl_enum'))
+
   # NV_path_rendering related
 
   code.extend(groupToStringCodeGen(apis,'pathCoord',   'GLpathCoordToString',   'unknown'))
@@ -864,12 +934,9 @@ def generateTokenSource(apis, args):
   for i in apis:
     if i.name != 'gl':
       continue
-    for j in i.enums:
-      if j.name != 'defines':
-        continue
-      for k in j.enumerantsByName:
-        if getattr(k,'gluErrorString',None):
-          code.append('      case %s: return "%s";'%(k.name,k.gluErrorString))
+    for k in i.index.enumerants:
+      if getattr(k,'gluErrorString',None):
+        code.append('      case %s: return "%s";'%(k.name,k.gluErrorString))
   code.append('      default: break;')
   code.append('    }')
   code.append('    #endif // REGAL_ENUM_TO_STRING')
@@ -880,89 +947,18 @@ def generateTokenSource(apis, args):
 
   code.append('')
   code.append('#if REGAL_SYS_GLX')
-  code.append('  const char * GLXenumToString(int v) {')
-  code.append('    #if REGAL_ENUM_TO_STRING')
-  code.append('    switch( v ) {')
-
   for i in apis:
-    if i.name != 'glx':
-      continue
-    e = {}
-    for j in i.enums:
-      if j.name != 'defines':
-        continue
-      for k in j.enumerants:
-        value = toLong(k.value)
-        if value != None:
-          if not value in e:
-            e[value] = set()
-          e[value].add(k.name)
-
-    e = sorted([ (i,sorted(list(e[i]))) for i in e.iterkeys() ])
-    e = [ i for i in e if i[0] < 0xfffffffff ]
-    e = filterTokens(e)
-
-    for i in e:
-      value = i[0]
-      if len(i[1]):
-        name = i[1][0]
-      else:
-        name = i[2][0]
-
-      code.append('      case %s: return "%s";'%(hexValue(value,'0x%08x'),name))
-
-  code.append('      default: break;')
-  code.append('    }')
-  code.append('    #endif // REGAL_ENUM_TO_STRING')
-  code.append('    return "unknown_glx_enum";')
-  code.append('  }')
+    if i.name == 'glx':
+      code.extend(enumToStringCode('glx', 'GLX', enumNames(i), 'GLXenumToString(int v)', 'unknown_glx_enum'))
   code.append('#endif // REGAL_SYS_GLX')
 
   # EGL version
 
   code.append('')
   code.append('#if REGAL_SYS_EGL')
-  code.append('  const char * EGLenumToString(int v) {')
-  code.append('    #if REGAL_ENUM_TO_STRING')
-  code.append('    switch( v ) {')
-
   for i in apis:
-    if i.name != 'egl':
-      continue
-    e = {}
-    for j in i.enums:
-      if j.name != 'defines':
-        continue
-      for k in j.enumerantsByName:
-        value = toLong(k.value)
-        if value != None:
-          if not value in e:
-            e[value] = set()
-          e[value].add(k.name)
-
-    e = sorted([ (i,sorted(list(e[i]))) for i in e.iterkeys() ])
-    e = [ i for i in e if i[0] < 0xfffffffff ]
-    e = filterTokens(e)
-
-    for i in e:
-      value = i[0]
-      if len(i[1]):
-        name = i[1][0]
-      else:
-        name = i[2][0]
-
-      if value==0:
-        name = 'EGL_FALSE'
-      if value==1:
-        name = 'EGL_TRUE'
-
-      code.append('      case %s: return "%s";'%(hexValue(value,'0x%08x'),name))
-
-  code.append('      default: break;')
-  code.append('    }')
-  code.append('    #endif // REGAL_ENUM_TO_STRING')
-  code.append('    return "unknown_egl_enum";')
-  code.append('  }')
+    if i.name == 'egl':
+      code.extend(enumToStringCode('egl', 'EGL', enumNames(i, 'EGL_FALSE', 'EGL_TRUE'), 'EGLenumToString(int v)', 'unknown_egl_enum'))
   code.append('#endif // REGAL_SYS_EGL')
 
   substitute = {}
@@ -41,6 +41,7 @@ REGAL_GLOBAL_BEGIN
 
 #include "RegalLog.h"
 #include "RegalConfig.h"
+#include "RegalLoader.h"
 #include "RegalSystem.h"
 
 REGAL_GLOBAL_END
@@ -59,6 +60,10 @@ namespace Config {
 //::std::string loadWGL ("");    // Default to auto-detect
   ::std::string loadEGL ("");    // Default to auto-detect
 
+  bool          loadEager = false; // Default to lazy loading
+  ::std::string loadProfile;
+  ::std::set< ::std::string > loadProfileNames;
+
   bool forceES1Profile     = REGAL_FORCE_ES1_PROFILE;
   bool forceES2Profile     = REGAL_FORCE_ES2_PROFILE;
   bool forceCoreProfile    = REGAL_FORCE_CORE_PROFILE;
@@ -167,6 +172,9 @@ namespace Config {
 //  getEnv( "REGAL_LOAD_WGL", loadWGL);
     getEnv( "REGAL_LOAD_EGL", loadEGL);
 
+    getEnv( "REGAL_LOAD_EAGER",   loadEager,   REGAL_LOADER);
+    getEnv( "REGAL_LOAD_PROFILE", loadProfile, REGAL_LOADER);
+
     getEnv( "REGAL_SYS_ES2", sysES2, REGAL_SYS_ES2);
     getEnv( "REGAL_SYS_GL",  sysGL,  REGAL_SYS_GL);
 
@@ -328,6 +336,23 @@ namespace Config {
     enableThreadLocking = false;
 #endif
 
+#endif
+
+    // REGAL_LOAD_PROFILE is read once, rather than for each context
+
+#if REGAL_LOADER
+    loadProfileNames.clear();
+    if (loadProfile.length())
+    {
+      FILE *file = fileOpen(loadProfile.c_str(),"rt");
+      if (file)
+      {
+        Loader::ParseProfile(loadProfileNames,fileRead(file));
+        fileClose(&file);
+      }
+      else
+        Warning("Loader profile ",loadProfile," not found.");
+    }
 #endif
 
     // REGAL_NO_EMULATION is deprecated, use REGAL_EMULATION=0 instead.
@@ -447,6 +472,11 @@ namespace Config {
     Info("REGAL_TRACE_FILE          ", traceFile                                   );
 #endif
 
+#if REGAL_LOADER
+    Info("REGAL_LOAD_EAGER          ", loadEager           ? "enabled" : "disabled");
+    Info("REGAL_LOAD_PROFILE        ", loadProfile                                 );
+#endif
+
     Info("REGAL_THREAD_LOCKING      ", enableThreadLocking ? "enabled" : "disabled");
   }
 
@@ -36,6 +36,7 @@
 
 REGAL_GLOBAL_BEGIN
 
+#include <set>
 #include <string>
 
 REGAL_GLOBAL_END
@@ -60,6 +61,10 @@ namespace Config
 //extern ::std::string loadWGL;      // REGAL_LOAD_WGL
   extern ::std::string loadEGL;      // REGAL_LOAD_EGL
 
+  extern bool          loadEager;    // REGAL_LOAD_EAGER   - resolve driver entry points at context initialization
+  extern ::std::string loadProfile;  // REGAL_LOAD_PROFILE - only those listed in this file
+  extern ::std::set< ::std::string > loadProfileNames; // REGAL_LOAD_PROFILE entry points, read at Init
+
   //
 
   extern bool forceES1Profile;
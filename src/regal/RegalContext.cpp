@@ -93,6 +93,7 @@ RegalContext::RegalContext()
 #endif /* REGAL_FRAME */
 #if REGAL_EMULATION
   emuLevel(0),
+  emuMask(0),
   obj(NULL),
   hint(NULL),
   ppa(NULL),
@@ -162,6 +163,15 @@ RegalContext::Init()
   RegalAssert(!initialized);
 
   RegalAssert(this);
+
+#if REGAL_DRIVER && REGAL_LOADER
+  if (Config::loadEager)
+  {
+    Loader::Eager(dispatcher.driver);
+    Loader::Eager(dispatcherGlobal.driver);
+  }
+#endif
+
   if (!info)
   {
     info = new ContextInfo();
@@ -205,6 +215,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_FILTER");
           filt = new Emu::Filt;
+          emuMask |= 1u << 1;
           emuLevel = 0;
           filt->Init(*this);
         }
@@ -222,6 +233,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_TEXC");
           texc = new Emu::TexC;
+          emuMask |= 1u << 2;
           emuLevel = 1;
           texc->Init(*this);
         }
@@ -239,6 +251,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_VAO");
           vao = new Emu::Vao;
+          emuMask |= 1u << 3;
           emuLevel = 2;
           vao->Init(*this);
         }
@@ -256,6 +269,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_DSA");
           dsa = new Emu::Dsa;
+          emuMask |= 1u << 4;
           emuLevel = 3;
           dsa->Init(*this);
         }
@@ -273,6 +287,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_SO");
           so = new Emu::So;
+          emuMask |= 1u << 5;
           emuLevel = 4;
           so->Init(*this);
         }
@@ -290,6 +305,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_QUADS");
           quads = new Emu::Quads;
+          emuMask |= 1u << 6;
           emuLevel = 5;
           quads->Init(*this);
         }
@@ -307,6 +323,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_IFF");
           iff = new Emu::Iff;
+          emuMask |= 1u << 7;
           emuLevel = 6;
           iff->Init(*this);
         }
@@ -324,6 +341,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_RECT");
           rect = new Emu::Rect;
+          emuMask |= 1u << 8;
           emuLevel = 7;
           rect->Init(*this);
         }
@@ -341,6 +359,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_BASEVERTEX");
           bv = new Emu::BaseVertex;
+          emuMask |= 1u << 9;
           emuLevel = 8;
           bv->Init(*this);
         }
@@ -358,6 +377,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_TEXSTO");
           texsto = new Emu::TexSto;
+          emuMask |= 1u << 10;
           emuLevel = 9;
           texsto->Init(*this);
         }
@@ -375,6 +395,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_XFER");
           xfer = new Emu::Xfer;
+          emuMask |= 1u << 11;
           emuLevel = 10;
           xfer->Init(*this);
         }
@@ -392,6 +413,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_BIN");
           bin = new Emu::Bin;
+          emuMask |= 1u << 12;
           emuLevel = 11;
           bin->Init(*this);
         }
@@ -409,6 +431,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_PPCA");
           ppca = new Emu::Ppca;
+          emuMask |= 1u << 13;
           emuLevel = 12;
           ppca->Init(*this);
         }
@@ -426,6 +449,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_PPA");
           ppa = new Emu::Ppa;
+          emuMask |= 1u << 14;
           emuLevel = 13;
           ppa->Init(*this);
         }
@@ -443,6 +467,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_HINT");
           hint = new Emu::Hint;
+          emuMask |= 1u << 15;
           emuLevel = 14;
           hint->Init(*this);
         }
@@ -460,6 +485,7 @@ RegalContext::Init()
         if( enable ) {
           Info("Activating emulation layer REGAL_EMU_OBJ");
           obj = new Emu::Obj;
+          emuMask |= 1u << 16;
           emuLevel = 15;
           obj->Init(*this);
         }
@@ -543,6 +569,7 @@ RegalContext::Cleanup()
     emuLevel = 15;
     obj->Cleanup(*this);
     obj.reset(NULL);
+    emuMask &= ~(1u << 16);
   }
   #endif /* REGAL_EMU_OBJ */
   #if REGAL_EMU_HINT
@@ -551,6 +578,7 @@ RegalContext::Cleanup()
     emuLevel = 14;
     hint->Cleanup(*this);
     hint.reset(NULL);
+    emuMask &= ~(1u << 15);
   }
   #endif /* REGAL_EMU_HINT */
   #if REGAL_EMU_PPA
@@ -559,6 +587,7 @@ RegalContext::Cleanup()
     emuLevel = 13;
     ppa->Cleanup(*this);
     ppa.reset(NULL);
+    emuMask &= ~(1u << 14);
   }
   #endif /* REGAL_EMU_PPA */
   #if REGAL_EMU_PPCA
@@ -567,6 +596,7 @@ RegalContext::Cleanup()
     emuLevel = 12;
     ppca->Cleanup(*this);
     ppca.reset(NULL);
+    emuMask &= ~(1u << 13);
   }
   #endif /* REGAL_EMU_PPCA */
   #if REGAL_EMU_BIN
@@ -575,6 +605,7 @@ RegalContext::Cleanup()
     emuLevel = 11;
     bin->Cleanup(*this);
     bin.reset(NULL);
+    emuMask &= ~(1u << 12);
   }
   #endif /* REGAL_EMU_BIN */
   #if REGAL_EMU_XFER
@@ -583,6 +614,7 @@ RegalContext::Cleanup()
     emuLevel = 10;
     xfer->Cleanup(*this);
     xfer.reset(NULL);
+    emuMask &= ~(1u << 11);
   }
   #endif /* REGAL_EMU_XFER */
   #if REGAL_EMU_TEXSTO
@@ -591,6 +623,7 @@ RegalContext::Cleanup()
     emuLevel = 9;
     texsto->Cleanup(*this);
     texsto.reset(NULL);
+    emuMask &= ~(1u << 10);
   }
   #endif /* REGAL_EMU_TEXSTO */
   #if REGAL_EMU_BASEVERTEX
@@ -599,6 +632,7 @@ RegalContext::Cleanup()
     emuLevel = 8;
     bv->Cleanup(*this);
     bv.reset(NULL);
+    emuMask &= ~(1u << 9);
   }
   #endif /* REGAL_EMU_BASEVERTEX */
   #if REGAL_EMU_RECT
@@ -607,6 +641,7 @@ RegalContext::Cleanup()
     emuLevel = 7;
     rect->Cleanup(*this);
     rect.reset(NULL);
+    emuMask &= ~(1u << 8);
   }
   #endif /* REGAL_EMU_RECT */
   #if REGAL_EMU_IFF
@@ -615,6 +650,7 @@ RegalContext::Cleanup()
     emuLevel = 6;
     iff->Cleanup(*this);
     iff.reset(NULL);
+    emuMask &= ~(1u << 7);
   }
   #endif /* REGAL_EMU_IFF */
   #if REGAL_EMU_QUADS
@@ -623,6 +659,7 @@ RegalContext::Cleanup()
     emuLevel = 5;
     quads->Cleanup(*this);
     quads.reset(NULL);
+    emuMask &= ~(1u << 6);
   }
   #endif /* REGAL_EMU_QUADS */
   #if REGAL_EMU_SO
@@ -631,6 +668,7 @@ RegalContext::Cleanup()
     emuLevel = 4;
     so->Cleanup(*this);
     so.reset(NULL);
+    emuMask &= ~(1u << 5);
   }
   #endif /* REGAL_EMU_SO */
   #if REGAL_EMU_DSA
@@ -639,6 +677,7 @@ RegalContext::Cleanup()
     emuLevel = 3;
     dsa->Cleanup(*this);
     dsa.reset(NULL);
+    emuMask &= ~(1u << 4);
   }
   #endif /* REGAL_EMU_DSA */
   #if REGAL_EMU_VAO
@@ -647,6 +686,7 @@ RegalContext::Cleanup()
     emuLevel = 2;
     vao->Cleanup(*this);
     vao.reset(NULL);
+    emuMask &= ~(1u << 3);
   }
   #endif /* REGAL_EMU_VAO */
   #if REGAL_EMU_TEXC
@@ -655,6 +695,7 @@ RegalContext::Cleanup()
     emuLevel = 1;
     texc->Cleanup(*this);
     texc.reset(NULL);
+    emuMask &= ~(1u << 2);
   }
   #endif /* REGAL_EMU_TEXC */
   #if REGAL_EMU_FILTER
@@ -663,6 +704,7 @@ RegalContext::Cleanup()
     emuLevel = 0;
     filt->Cleanup(*this);
     filt.reset(NULL);
+    emuMask &= ~(1u << 1);
   }
   #endif /* REGAL_EMU_FILTER */
 #endif
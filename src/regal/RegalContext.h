@@ -132,6 +132,7 @@ struct RegalContext
 #if REGAL_EMULATION
   // Fixed function emulation
   int emuLevel;
+  unsigned int emuMask;      // Emulation layers enabled, bit 1<<level of each
   scoped_ptr<Emu::Obj          > obj;
   scoped_ptr<Emu::Hint         > hint;
   scoped_ptr<Emu::Ppa          > ppa;
@@ -57,6 +57,7 @@ using namespace boost::print;
 #include "RegalToken.h"
 #include "RegalContext.h"
 #include "RegalContextInfo.h"
+#include "RegalLookup.h"
 
 REGAL_GLOBAL_END
 
@@ -1004,683 +1005,8 @@ ContextInfo::init(const RegalContext &context)
 
   // Driver extensions, etc detected by Regal
 
-  set<string> e;
-  e.insert(driverExtensions.begin(),driverExtensions.end());
-
-  gl_3dfx_multisample                                = stringSetFind(e,"GL_3DFX_multisample");
-  gl_3dfx_tbuffer                                    = stringSetFind(e,"GL_3DFX_tbuffer");
-  gl_3dfx_texture_compression_fxt1                   = stringSetFind(e,"GL_3DFX_texture_compression_FXT1");
-  gl_amd_blend_minmax_factor                         = stringSetFind(e,"GL_AMD_blend_minmax_factor");
-  gl_amd_compressed_3dc_texture                      = stringSetFind(e,"GL_AMD_compressed_3DC_texture");
-  gl_amd_compressed_atc_texture                      = stringSetFind(e,"GL_AMD_compressed_ATC_texture");
-  gl_amd_debug_output                                = stringSetFind(e,"GL_AMD_debug_output");
-  gl_amd_depth_clamp_separate                        = stringSetFind(e,"GL_AMD_depth_clamp_separate");
-  gl_amd_draw_buffers_blend                          = stringSetFind(e,"GL_AMD_draw_buffers_blend");
-  gl_amd_interleaved_elements                        = stringSetFind(e,"GL_AMD_interleaved_elements");
-  gl_amd_multi_draw_indirect                         = stringSetFind(e,"GL_AMD_multi_draw_indirect");
-  gl_amd_name_gen_delete                             = stringSetFind(e,"GL_AMD_name_gen_delete");
-  gl_amd_performance_monitor                         = stringSetFind(e,"GL_AMD_performance_monitor");
-  gl_amd_pinned_memory                               = stringSetFind(e,"GL_AMD_pinned_memory");
-  gl_amd_program_binary_z400                         = stringSetFind(e,"GL_AMD_program_binary_Z400");
-  gl_amd_query_buffer_object                         = stringSetFind(e,"GL_AMD_query_buffer_object");
-  gl_amd_sample_positions                            = stringSetFind(e,"GL_AMD_sample_positions");
-  gl_amd_seamless_cubemap_per_texture                = stringSetFind(e,"GL_AMD_seamless_cubemap_per_texture");
-  gl_amd_sparse_texture                              = stringSetFind(e,"GL_AMD_sparse_texture");
-  gl_amd_stencil_operation_extended                  = stringSetFind(e,"GL_AMD_stencil_operation_extended");
-  gl_amd_vertex_shader_tessellator                   = stringSetFind(e,"GL_AMD_vertex_shader_tessellator");
-  gl_angle_framebuffer_blit                          = stringSetFind(e,"GL_ANGLE_framebuffer_blit");
-  gl_angle_framebuffer_multisample                   = stringSetFind(e,"GL_ANGLE_framebuffer_multisample");
-  gl_angle_instanced_arrays                          = stringSetFind(e,"GL_ANGLE_instanced_arrays");
-  gl_angle_pack_reverse_row_order                    = stringSetFind(e,"GL_ANGLE_pack_reverse_row_order");
-  gl_angle_program_binary                            = stringSetFind(e,"GL_ANGLE_program_binary");
-  gl_angle_texture_compression_dxt1                  = stringSetFind(e,"GL_ANGLE_texture_compression_dxt1");
-  gl_angle_texture_compression_dxt3                  = stringSetFind(e,"GL_ANGLE_texture_compression_dxt3");
-  gl_angle_texture_compression_dxt5                  = stringSetFind(e,"GL_ANGLE_texture_compression_dxt5");
-  gl_angle_texture_usage                             = stringSetFind(e,"GL_ANGLE_texture_usage");
-  gl_angle_timer_query                               = stringSetFind(e,"GL_ANGLE_timer_query");
-  gl_angle_translated_shader_source                  = stringSetFind(e,"GL_ANGLE_translated_shader_source");
-  gl_apple_aux_depth_stencil                         = stringSetFind(e,"GL_APPLE_aux_depth_stencil");
-  gl_apple_client_storage                            = stringSetFind(e,"GL_APPLE_client_storage");
-  gl_apple_copy_texture_levels                       = stringSetFind(e,"GL_APPLE_copy_texture_levels");
-  gl_apple_element_array                             = stringSetFind(e,"GL_APPLE_element_array");
-  gl_apple_fence                                     = stringSetFind(e,"GL_APPLE_fence");
-  gl_apple_float_pixels                              = stringSetFind(e,"GL_APPLE_float_pixels");
-  gl_apple_flush_buffer_range                        = stringSetFind(e,"GL_APPLE_flush_buffer_range");
-  gl_apple_flush_render                              = stringSetFind(e,"GL_APPLE_flush_render");
-  gl_apple_framebuffer_multisample                   = stringSetFind(e,"GL_APPLE_framebuffer_multisample");
-  gl_apple_object_purgeable                          = stringSetFind(e,"GL_APPLE_object_purgeable");
-  gl_apple_pixel_buffer                              = stringSetFind(e,"GL_APPLE_pixel_buffer");
-  gl_apple_rgb_422                                   = stringSetFind(e,"GL_APPLE_rgb_422");
-  gl_apple_row_bytes                                 = stringSetFind(e,"GL_APPLE_row_bytes");
-  gl_apple_specular_vector                           = stringSetFind(e,"GL_APPLE_specular_vector");
-  gl_apple_sync                                      = stringSetFind(e,"GL_APPLE_sync");
-  gl_apple_texture_max_level                         = stringSetFind(e,"GL_APPLE_texture_max_level");
-  gl_apple_texture_range                             = stringSetFind(e,"GL_APPLE_texture_range");
-  gl_apple_transform_hint                            = stringSetFind(e,"GL_APPLE_transform_hint");
-  gl_apple_vertex_array_object                       = stringSetFind(e,"GL_APPLE_vertex_array_object");
-  gl_apple_vertex_array_range                        = stringSetFind(e,"GL_APPLE_vertex_array_range");
-  gl_apple_vertex_program_evaluators                 = stringSetFind(e,"GL_APPLE_vertex_program_evaluators");
-  gl_apple_ycbcr_422                                 = stringSetFind(e,"GL_APPLE_ycbcr_422");
-  gl_arb_es2_compatibility                           = stringSetFind(e,"GL_ARB_ES2_compatibility");
-  gl_arb_es3_compatibility                           = stringSetFind(e,"GL_ARB_ES3_compatibility");
-  gl_arb_base_instance                               = stringSetFind(e,"GL_ARB_base_instance");
-  gl_arb_bindless_texture                            = stringSetFind(e,"GL_ARB_bindless_texture");
-  gl_arb_blend_func_extended                         = stringSetFind(e,"GL_ARB_blend_func_extended");
-  gl_arb_buffer_storage                              = stringSetFind(e,"GL_ARB_buffer_storage");
-  gl_arb_cl_event                                    = stringSetFind(e,"GL_ARB_cl_event");
-  gl_arb_clear_buffer_object                         = stringSetFind(e,"GL_ARB_clear_buffer_object");
-  gl_arb_clear_texture                               = stringSetFind(e,"GL_ARB_clear_texture");
-  gl_arb_color_buffer_float                          = stringSetFind(e,"GL_ARB_color_buffer_float");
-  gl_arb_compressed_texture_pixel_storage            = stringSetFind(e,"GL_ARB_compressed_texture_pixel_storage");
-  gl_arb_compute_shader                              = stringSetFind(e,"GL_ARB_compute_shader");
-  gl_arb_compute_variable_group_size                 = stringSetFind(e,"GL_ARB_compute_variable_group_size");
-  gl_arb_copy_buffer                                 = stringSetFind(e,"GL_ARB_copy_buffer");
-  gl_arb_copy_image                                  = stringSetFind(e,"GL_ARB_copy_image");
-  gl_arb_debug_output                                = stringSetFind(e,"GL_ARB_debug_output");
-  gl_arb_depth_buffer_float                          = stringSetFind(e,"GL_ARB_depth_buffer_float");
-  gl_arb_depth_clamp                                 = stringSetFind(e,"GL_ARB_depth_clamp");
-  gl_arb_depth_texture                               = stringSetFind(e,"GL_ARB_depth_texture");
-  gl_arb_draw_buffers                                = stringSetFind(e,"GL_ARB_draw_buffers");
-  gl_arb_draw_buffers_blend                          = stringSetFind(e,"GL_ARB_draw_buffers_blend");
-  gl_arb_draw_elements_base_vertex                   = stringSetFind(e,"GL_ARB_draw_elements_base_vertex");
-  gl_arb_draw_indirect                               = stringSetFind(e,"GL_ARB_draw_indirect");
-  gl_arb_draw_instanced                              = stringSetFind(e,"GL_ARB_draw_instanced");
-  gl_arb_enhanced_layouts                            = stringSetFind(e,"GL_ARB_enhanced_layouts");
-  gl_arb_explicit_uniform_location                   = stringSetFind(e,"GL_ARB_explicit_uniform_location");
-  gl_arb_fragment_program                            = stringSetFind(e,"GL_ARB_fragment_program");
-  gl_arb_fragment_shader                             = stringSetFind(e,"GL_ARB_fragment_shader");
-  gl_arb_framebuffer_no_attachments                  = stringSetFind(e,"GL_ARB_framebuffer_no_attachments");
-  gl_arb_framebuffer_object                          = stringSetFind(e,"GL_ARB_framebuffer_object");
-  gl_arb_framebuffer_srgb                            = stringSetFind(e,"GL_ARB_framebuffer_sRGB");
-  gl_arb_geometry_shader4                            = stringSetFind(e,"GL_ARB_geometry_shader4");
-  gl_arb_get_program_binary                          = stringSetFind(e,"GL_ARB_get_program_binary");
-  gl_arb_gpu_shader5                                 = stringSetFind(e,"GL_ARB_gpu_shader5");
-  gl_arb_gpu_shader_fp64                             = stringSetFind(e,"GL_ARB_gpu_shader_fp64");
-  gl_arb_half_float_pixel                            = stringSetFind(e,"GL_ARB_half_float_pixel");
-  gl_arb_half_float_vertex                           = stringSetFind(e,"GL_ARB_half_float_vertex");
-  gl_arb_imaging                                     = stringSetFind(e,"GL_ARB_imaging");
-  gl_arb_indirect_parameters                         = stringSetFind(e,"GL_ARB_indirect_parameters");
-  gl_arb_instanced_arrays                            = stringSetFind(e,"GL_ARB_instanced_arrays");
-  gl_arb_internalformat_query                        = stringSetFind(e,"GL_ARB_internalformat_query");
-  gl_arb_internalformat_query2                       = stringSetFind(e,"GL_ARB_internalformat_query2");
-  gl_arb_invalidate_subdata                          = stringSetFind(e,"GL_ARB_invalidate_subdata");
-  gl_arb_map_buffer_alignment                        = stringSetFind(e,"GL_ARB_map_buffer_alignment");
-  gl_arb_map_buffer_range                            = stringSetFind(e,"GL_ARB_map_buffer_range");
-  gl_arb_matrix_palette                              = stringSetFind(e,"GL_ARB_matrix_palette");
-  gl_arb_multi_bind                                  = stringSetFind(e,"GL_ARB_multi_bind");
-  gl_arb_multi_draw_indirect                         = stringSetFind(e,"GL_ARB_multi_draw_indirect");
-  gl_arb_multisample                                 = stringSetFind(e,"GL_ARB_multisample");
-  gl_arb_multitexture                                = stringSetFind(e,"GL_ARB_multitexture");
-  gl_arb_occlusion_query                             = stringSetFind(e,"GL_ARB_occlusion_query");
-  gl_arb_occlusion_query2                            = stringSetFind(e,"GL_ARB_occlusion_query2");
-  gl_arb_pixel_buffer_object                         = stringSetFind(e,"GL_ARB_pixel_buffer_object");
-  gl_arb_point_parameters                            = stringSetFind(e,"GL_ARB_point_parameters");
-  gl_arb_point_sprite                                = stringSetFind(e,"GL_ARB_point_sprite");
-  gl_arb_program_interface_query                     = stringSetFind(e,"GL_ARB_program_interface_query");
-  gl_arb_provoking_vertex                            = stringSetFind(e,"GL_ARB_provoking_vertex");
-  gl_arb_query_buffer_object                         = stringSetFind(e,"GL_ARB_query_buffer_object");
-  gl_arb_robustness                                  = stringSetFind(e,"GL_ARB_robustness");
-  gl_arb_sample_shading                              = stringSetFind(e,"GL_ARB_sample_shading");
-  gl_arb_sampler_objects                             = stringSetFind(e,"GL_ARB_sampler_objects");
-  gl_arb_seamless_cube_map                           = stringSetFind(e,"GL_ARB_seamless_cube_map");
-  gl_arb_separate_shader_objects                     = stringSetFind(e,"GL_ARB_separate_shader_objects");
-  gl_arb_shader_atomic_counters                      = stringSetFind(e,"GL_ARB_shader_atomic_counters");
-  gl_arb_shader_image_load_store                     = stringSetFind(e,"GL_ARB_shader_image_load_store");
-  gl_arb_shader_objects                              = stringSetFind(e,"GL_ARB_shader_objects");
-  gl_arb_shader_storage_buffer_object                = stringSetFind(e,"GL_ARB_shader_storage_buffer_object");
-  gl_arb_shader_subroutine                           = stringSetFind(e,"GL_ARB_shader_subroutine");
-  gl_arb_shading_language_100                        = stringSetFind(e,"GL_ARB_shading_language_100");
-  gl_arb_shading_language_include                    = stringSetFind(e,"GL_ARB_shading_language_include");
-  gl_arb_shadow                                      = stringSetFind(e,"GL_ARB_shadow");
-  gl_arb_shadow_ambient                              = stringSetFind(e,"GL_ARB_shadow_ambient");
-  gl_arb_sparse_texture                              = stringSetFind(e,"GL_ARB_sparse_texture");
-  gl_arb_stencil_texturing                           = stringSetFind(e,"GL_ARB_stencil_texturing");
-  gl_arb_sync                                        = stringSetFind(e,"GL_ARB_sync");
-  gl_arb_tessellation_shader                         = stringSetFind(e,"GL_ARB_tessellation_shader");
-  gl_arb_texture_border_clamp                        = stringSetFind(e,"GL_ARB_texture_border_clamp");
-  gl_arb_texture_buffer_object                       = stringSetFind(e,"GL_ARB_texture_buffer_object");
-  gl_arb_texture_buffer_range                        = stringSetFind(e,"GL_ARB_texture_buffer_range");
-  gl_arb_texture_compression                         = stringSetFind(e,"GL_ARB_texture_compression");
-  gl_arb_texture_compression_bptc                    = stringSetFind(e,"GL_ARB_texture_compression_bptc");
-  gl_arb_texture_compression_rgtc                    = stringSetFind(e,"GL_ARB_texture_compression_rgtc");
-  gl_arb_texture_cube_map                            = stringSetFind(e,"GL_ARB_texture_cube_map");
-  gl_arb_texture_cube_map_array                      = stringSetFind(e,"GL_ARB_texture_cube_map_array");
-  gl_arb_texture_env_combine                         = stringSetFind(e,"GL_ARB_texture_env_combine");
-  gl_arb_texture_env_dot3                            = stringSetFind(e,"GL_ARB_texture_env_dot3");
-  gl_arb_texture_float                               = stringSetFind(e,"GL_ARB_texture_float");
-  gl_arb_texture_gather                              = stringSetFind(e,"GL_ARB_texture_gather");
-  gl_arb_texture_mirror_clamp_to_edge                = stringSetFind(e,"GL_ARB_texture_mirror_clamp_to_edge");
-  gl_arb_texture_mirrored_repeat                     = stringSetFind(e,"GL_ARB_texture_mirrored_repeat");
-  gl_arb_texture_multisample                         = stringSetFind(e,"GL_ARB_texture_multisample");
-  gl_arb_texture_rectangle                           = stringSetFind(e,"GL_ARB_texture_rectangle");
-  gl_arb_texture_rg                                  = stringSetFind(e,"GL_ARB_texture_rg");
-  gl_arb_texture_rgb10_a2ui                          = stringSetFind(e,"GL_ARB_texture_rgb10_a2ui");
-  gl_arb_texture_storage                             = stringSetFind(e,"GL_ARB_texture_storage");
-  gl_arb_texture_storage_multisample                 = stringSetFind(e,"GL_ARB_texture_storage_multisample");
-  gl_arb_texture_swizzle                             = stringSetFind(e,"GL_ARB_texture_swizzle");
-  gl_arb_texture_view                                = stringSetFind(e,"GL_ARB_texture_view");
-  gl_arb_timer_query                                 = stringSetFind(e,"GL_ARB_timer_query");
-  gl_arb_transform_feedback2                         = stringSetFind(e,"GL_ARB_transform_feedback2");
-  gl_arb_transform_feedback3                         = stringSetFind(e,"GL_ARB_transform_feedback3");
-  gl_arb_transform_feedback_instanced                = stringSetFind(e,"GL_ARB_transform_feedback_instanced");
-  gl_arb_transpose_matrix                            = stringSetFind(e,"GL_ARB_transpose_matrix");
-  gl_arb_uniform_buffer_object                       = stringSetFind(e,"GL_ARB_uniform_buffer_object");
-  gl_arb_vertex_array_object                         = stringSetFind(e,"GL_ARB_vertex_array_object");
-  gl_arb_vertex_attrib_64bit                         = stringSetFind(e,"GL_ARB_vertex_attrib_64bit");
-  gl_arb_vertex_attrib_binding                       = stringSetFind(e,"GL_ARB_vertex_attrib_binding");
-  gl_arb_vertex_blend                                = stringSetFind(e,"GL_ARB_vertex_blend");
-  gl_arb_vertex_buffer_object                        = stringSetFind(e,"GL_ARB_vertex_buffer_object");
-  gl_arb_vertex_program                              = stringSetFind(e,"GL_ARB_vertex_program");
-  gl_arb_vertex_shader                               = stringSetFind(e,"GL_ARB_vertex_shader");
-  gl_arb_vertex_type_2_10_10_10_rev                  = stringSetFind(e,"GL_ARB_vertex_type_2_10_10_10_rev");
-  gl_arb_viewport_array                              = stringSetFind(e,"GL_ARB_viewport_array");
-  gl_arb_window_pos                                  = stringSetFind(e,"GL_ARB_window_pos");
-  gl_arm_mali_program_binary                         = stringSetFind(e,"GL_ARM_mali_program_binary");
-  gl_arm_mali_shader_binary                          = stringSetFind(e,"GL_ARM_mali_shader_binary");
-  gl_ati_draw_buffers                                = stringSetFind(e,"GL_ATI_draw_buffers");
-  gl_ati_element_array                               = stringSetFind(e,"GL_ATI_element_array");
-  gl_ati_envmap_bumpmap                              = stringSetFind(e,"GL_ATI_envmap_bumpmap");
-  gl_ati_fragment_shader                             = stringSetFind(e,"GL_ATI_fragment_shader");
-  gl_ati_map_object_buffer                           = stringSetFind(e,"GL_ATI_map_object_buffer");
-  gl_ati_meminfo                                     = stringSetFind(e,"GL_ATI_meminfo");
-  gl_ati_pn_triangles                                = stringSetFind(e,"GL_ATI_pn_triangles");
-  gl_ati_separate_stencil                            = stringSetFind(e,"GL_ATI_separate_stencil");
-  gl_ati_text_fragment_shader                        = stringSetFind(e,"GL_ATI_text_fragment_shader");
-  gl_ati_texture_compression_3dc                     = stringSetFind(e,"GL_ATI_texture_compression_3dc");
-  gl_ati_texture_env_combine3                        = stringSetFind(e,"GL_ATI_texture_env_combine3");
-  gl_ati_texture_float                               = stringSetFind(e,"GL_ATI_texture_float");
-  gl_ati_texture_mirror_once                         = stringSetFind(e,"GL_ATI_texture_mirror_once");
-  gl_ati_vertex_array_object                         = stringSetFind(e,"GL_ATI_vertex_array_object");
-  gl_ati_vertex_attrib_array_object                  = stringSetFind(e,"GL_ATI_vertex_attrib_array_object");
-  gl_ati_vertex_streams                              = stringSetFind(e,"GL_ATI_vertex_streams");
-  gl_dmp_shader_binary                               = stringSetFind(e,"GL_DMP_shader_binary");
-  gl_ext_422_pixels                                  = stringSetFind(e,"GL_EXT_422_pixels");
-  gl_ext_cg_shader                                   = stringSetFind(e,"GL_EXT_Cg_shader");
-  gl_ext_abgr                                        = stringSetFind(e,"GL_EXT_abgr");
-  gl_ext_bgra                                        = stringSetFind(e,"GL_EXT_bgra");
-  gl_ext_bindable_uniform                            = stringSetFind(e,"GL_EXT_bindable_uniform");
-  gl_ext_blend_color                                 = stringSetFind(e,"GL_EXT_blend_color");
-  gl_ext_blend_equation_separate                     = stringSetFind(e,"GL_EXT_blend_equation_separate");
-  gl_ext_blend_func_separate                         = stringSetFind(e,"GL_EXT_blend_func_separate");
-  gl_ext_blend_minmax                                = stringSetFind(e,"GL_EXT_blend_minmax");
-  gl_ext_blend_subtract                              = stringSetFind(e,"GL_EXT_blend_subtract");
-  gl_ext_clip_volume_hint                            = stringSetFind(e,"GL_EXT_clip_volume_hint");
-  gl_ext_cmyka                                       = stringSetFind(e,"GL_EXT_cmyka");
-  gl_ext_color_buffer_half_float                     = stringSetFind(e,"GL_EXT_color_buffer_half_float");
-  gl_ext_color_subtable                              = stringSetFind(e,"GL_EXT_color_subtable");
-  gl_ext_compiled_vertex_array                       = stringSetFind(e,"GL_EXT_compiled_vertex_array");
-  gl_ext_convolution                                 = stringSetFind(e,"GL_EXT_convolution");
-  gl_ext_coordinate_frame                            = stringSetFind(e,"GL_EXT_coordinate_frame");
-  gl_ext_copy_texture                                = stringSetFind(e,"GL_EXT_copy_texture");
-  gl_ext_cull_vertex                                 = stringSetFind(e,"GL_EXT_cull_vertex");
-  gl_ext_debug_label                                 = stringSetFind(e,"GL_EXT_debug_label");
-  gl_ext_debug_marker                                = stringSetFind(e,"GL_EXT_debug_marker");
-  gl_ext_depth_bounds_test                           = stringSetFind(e,"GL_EXT_depth_bounds_test");
-  gl_ext_direct_state_access                         = stringSetFind(e,"GL_EXT_direct_state_access");
-  gl_ext_discard_framebuffer                         = stringSetFind(e,"GL_EXT_discard_framebuffer");
-  gl_ext_disjoint_timer_query                        = stringSetFind(e,"GL_EXT_disjoint_timer_query");
-  gl_ext_draw_buffers2                               = stringSetFind(e,"GL_EXT_draw_buffers2");
-  gl_ext_draw_instanced                              = stringSetFind(e,"GL_EXT_draw_instanced");
-  gl_ext_draw_range_elements                         = stringSetFind(e,"GL_EXT_draw_range_elements");
-  gl_ext_fog_coord                                   = stringSetFind(e,"GL_EXT_fog_coord");
-  gl_ext_fragment_lighting                           = stringSetFind(e,"GL_EXT_fragment_lighting");
-  gl_ext_framebuffer_blit                            = stringSetFind(e,"GL_EXT_framebuffer_blit");
-  gl_ext_framebuffer_multisample                     = stringSetFind(e,"GL_EXT_framebuffer_multisample");
-  gl_ext_framebuffer_multisample_blit_scaled         = stringSetFind(e,"GL_EXT_framebuffer_multisample_blit_scaled");
-  gl_ext_framebuffer_object                          = stringSetFind(e,"GL_EXT_framebuffer_object");
-  gl_ext_framebuffer_srgb                            = stringSetFind(e,"GL_EXT_framebuffer_sRGB");
-  gl_ext_geometry_shader4                            = stringSetFind(e,"GL_EXT_geometry_shader4");
-  gl_ext_gpu_program_parameters                      = stringSetFind(e,"GL_EXT_gpu_program_parameters");
-  gl_ext_gpu_shader4                                 = stringSetFind(e,"GL_EXT_gpu_shader4");
-  gl_ext_histogram                                   = stringSetFind(e,"GL_EXT_histogram");
-  gl_ext_index_func                                  = stringSetFind(e,"GL_EXT_index_func");
-  gl_ext_index_material                              = stringSetFind(e,"GL_EXT_index_material");
-  gl_ext_light_texture                               = stringSetFind(e,"GL_EXT_light_texture");
-  gl_ext_map_buffer_range                            = stringSetFind(e,"GL_EXT_map_buffer_range");
-  gl_ext_multi_draw_arrays                           = stringSetFind(e,"GL_EXT_multi_draw_arrays");
-  gl_ext_multisample                                 = stringSetFind(e,"GL_EXT_multisample");
-  gl_ext_multisampled_render_to_texture              = stringSetFind(e,"GL_EXT_multisampled_render_to_texture");
-  gl_ext_multiview_draw_buffers                      = stringSetFind(e,"GL_EXT_multiview_draw_buffers");
-  gl_ext_occlusion_query_boolean                     = stringSetFind(e,"GL_EXT_occlusion_query_boolean");
-  gl_ext_packed_depth_stencil                        = stringSetFind(e,"GL_EXT_packed_depth_stencil");
-  gl_ext_packed_float                                = stringSetFind(e,"GL_EXT_packed_float");
-  gl_ext_packed_pixels                               = stringSetFind(e,"GL_EXT_packed_pixels");
-  gl_ext_paletted_texture                            = stringSetFind(e,"GL_EXT_paletted_texture");
-  gl_ext_pixel_buffer_object                         = stringSetFind(e,"GL_EXT_pixel_buffer_object");
-  gl_ext_pixel_transform                             = stringSetFind(e,"GL_EXT_pixel_transform");
-  gl_ext_point_parameters                            = stringSetFind(e,"GL_EXT_point_parameters");
-  gl_ext_polygon_offset                              = stringSetFind(e,"GL_EXT_polygon_offset");
-  gl_ext_provoking_vertex                            = stringSetFind(e,"GL_EXT_provoking_vertex");
-  gl_ext_read_format_bgra                            = stringSetFind(e,"GL_EXT_read_format_bgra");
-  gl_ext_rescale_normal                              = stringSetFind(e,"GL_EXT_rescale_normal");
-  gl_ext_robustness                                  = stringSetFind(e,"GL_EXT_robustness");
-  gl_ext_srgb                                        = stringSetFind(e,"GL_EXT_sRGB");
-  gl_ext_scene_marker                                = stringSetFind(e,"GL_EXT_scene_marker");
-  gl_ext_secondary_color                             = stringSetFind(e,"GL_EXT_secondary_color");
-  gl_ext_separate_shader_objects                     = stringSetFind(e,"GL_EXT_separate_shader_objects");
-  gl_ext_separate_specular_color                     = stringSetFind(e,"GL_EXT_separate_specular_color");
-  gl_ext_shader_framebuffer_fetch                    = stringSetFind(e,"GL_EXT_shader_framebuffer_fetch");
-  gl_ext_shader_image_load_store                     = stringSetFind(e,"GL_EXT_shader_image_load_store");
-  gl_ext_shadow_samplers                             = stringSetFind(e,"GL_EXT_shadow_samplers");
-  gl_ext_shared_texture_palette                      = stringSetFind(e,"GL_EXT_shared_texture_palette");
-  gl_ext_stencil_clear_tag                           = stringSetFind(e,"GL_EXT_stencil_clear_tag");
-  gl_ext_stencil_two_side                            = stringSetFind(e,"GL_EXT_stencil_two_side");
-  gl_ext_stencil_wrap                                = stringSetFind(e,"GL_EXT_stencil_wrap");
-  gl_ext_subtexture                                  = stringSetFind(e,"GL_EXT_subtexture");
-  gl_ext_texture                                     = stringSetFind(e,"GL_EXT_texture");
-  gl_ext_texture3d                                   = stringSetFind(e,"GL_EXT_texture3D");
-  gl_ext_texture_array                               = stringSetFind(e,"GL_EXT_texture_array");
-  gl_ext_texture_buffer_object                       = stringSetFind(e,"GL_EXT_texture_buffer_object");
-  gl_ext_texture_compression_latc                    = stringSetFind(e,"GL_EXT_texture_compression_latc");
-  gl_ext_texture_compression_rgtc                    = stringSetFind(e,"GL_EXT_texture_compression_rgtc");
-  gl_ext_texture_compression_s3tc                    = stringSetFind(e,"GL_EXT_texture_compression_s3tc");
-  gl_ext_texture_cube_map                            = stringSetFind(e,"GL_EXT_texture_cube_map");
-  gl_ext_texture_edge_clamp                          = stringSetFind(e,"GL_EXT_texture_edge_clamp");
-  gl_ext_texture_env_combine                         = stringSetFind(e,"GL_EXT_texture_env_combine");
-  gl_ext_texture_env_dot3                            = stringSetFind(e,"GL_EXT_texture_env_dot3");
-  gl_ext_texture_filter_anisotropic                  = stringSetFind(e,"GL_EXT_texture_filter_anisotropic");
-  gl_ext_texture_format_bgra8888                     = stringSetFind(e,"GL_EXT_texture_format_BGRA8888");
-  gl_ext_texture_integer                             = stringSetFind(e,"GL_EXT_texture_integer");
-  gl_ext_texture_lod_bias                            = stringSetFind(e,"GL_EXT_texture_lod_bias");
-  gl_ext_texture_mirror_clamp                        = stringSetFind(e,"GL_EXT_texture_mirror_clamp");
-  gl_ext_texture_object                              = stringSetFind(e,"GL_EXT_texture_object");
-  gl_ext_texture_perturb_normal                      = stringSetFind(e,"GL_EXT_texture_perturb_normal");
-  gl_ext_texture_rectangle                           = stringSetFind(e,"GL_EXT_texture_rectangle");
-  gl_ext_texture_rg                                  = stringSetFind(e,"GL_EXT_texture_rg");
-  gl_ext_texture_srgb                                = stringSetFind(e,"GL_EXT_texture_sRGB");
-  gl_ext_texture_srgb_decode                         = stringSetFind(e,"GL_EXT_texture_sRGB_decode");
-  gl_ext_texture_shared_exponent                     = stringSetFind(e,"GL_EXT_texture_shared_exponent");
-  gl_ext_texture_snorm                               = stringSetFind(e,"GL_EXT_texture_snorm");
-  gl_ext_texture_storage                             = stringSetFind(e,"GL_EXT_texture_storage");
-  gl_ext_texture_swizzle                             = stringSetFind(e,"GL_EXT_texture_swizzle");
-  gl_ext_texture_type_2_10_10_10_rev                 = stringSetFind(e,"GL_EXT_texture_type_2_10_10_10_REV");
-  gl_ext_timer_query                                 = stringSetFind(e,"GL_EXT_timer_query");
-  gl_ext_transform_feedback                          = stringSetFind(e,"GL_EXT_transform_feedback");
-  gl_ext_unpack_subimage                             = stringSetFind(e,"GL_EXT_unpack_subimage");
-  gl_ext_vertex_array                                = stringSetFind(e,"GL_EXT_vertex_array");
-  gl_ext_vertex_attrib_64bit                         = stringSetFind(e,"GL_EXT_vertex_attrib_64bit");
-  gl_ext_vertex_shader                               = stringSetFind(e,"GL_EXT_vertex_shader");
-  gl_ext_vertex_weighting                            = stringSetFind(e,"GL_EXT_vertex_weighting");
-  gl_ext_x11_sync_object                             = stringSetFind(e,"GL_EXT_x11_sync_object");
-  gl_fj_shader_binary_gccso                          = stringSetFind(e,"GL_FJ_shader_binary_GCCSO");
-  gl_gremedy_frame_terminator                        = stringSetFind(e,"GL_GREMEDY_frame_terminator");
-  gl_gremedy_string_marker                           = stringSetFind(e,"GL_GREMEDY_string_marker");
-  gl_hp_image_transform                              = stringSetFind(e,"GL_HP_image_transform");
-  gl_hp_occlusion_test                               = stringSetFind(e,"GL_HP_occlusion_test");
-  gl_ibm_cull_vertex                                 = stringSetFind(e,"GL_IBM_cull_vertex");
-  gl_ibm_multimode_draw_arrays                       = stringSetFind(e,"GL_IBM_multimode_draw_arrays");
-  gl_ibm_rasterpos_clip                              = stringSetFind(e,"GL_IBM_rasterpos_clip");
-  gl_ibm_static_data                                 = stringSetFind(e,"GL_IBM_static_data");
-  gl_ibm_texture_mirrored_repeat                     = stringSetFind(e,"GL_IBM_texture_mirrored_repeat");
-  gl_ibm_vertex_array_lists                          = stringSetFind(e,"GL_IBM_vertex_array_lists");
-  gl_img_multisampled_render_to_texture              = stringSetFind(e,"GL_IMG_multisampled_render_to_texture");
-  gl_img_program_binary                              = stringSetFind(e,"GL_IMG_program_binary");
-  gl_img_read_format                                 = stringSetFind(e,"GL_IMG_read_format");
-  gl_img_shader_binary                               = stringSetFind(e,"GL_IMG_shader_binary");
-  gl_img_texture_compression_pvrtc                   = stringSetFind(e,"GL_IMG_texture_compression_pvrtc");
-  gl_img_texture_compression_pvrtc2                  = stringSetFind(e,"GL_IMG_texture_compression_pvrtc2");
-  gl_img_texture_env_enhanced_fixed_function         = stringSetFind(e,"GL_IMG_texture_env_enhanced_fixed_function");
-  gl_img_user_clip_plane                             = stringSetFind(e,"GL_IMG_user_clip_plane");
-  gl_ingr_blend_func_separate                        = stringSetFind(e,"GL_INGR_blend_func_separate");
-  gl_ingr_color_clamp                                = stringSetFind(e,"GL_INGR_color_clamp");
-  gl_ingr_interlace_read                             = stringSetFind(e,"GL_INGR_interlace_read");
-  gl_intel_map_texture                               = stringSetFind(e,"GL_INTEL_map_texture");
-  gl_intel_parallel_arrays                           = stringSetFind(e,"GL_INTEL_parallel_arrays");
-  gl_intel_texture_scissor                           = stringSetFind(e,"GL_INTEL_texture_scissor");
-  gl_khr_debug                                       = stringSetFind(e,"GL_KHR_debug");
-  gl_khr_texture_compression_astc_ldr                = stringSetFind(e,"GL_KHR_texture_compression_astc_ldr");
-  gl_ktx_buffer_region                               = stringSetFind(e,"GL_KTX_buffer_region");
-  gl_mesax_texture_stack                             = stringSetFind(e,"GL_MESAX_texture_stack");
-  gl_mesa_pack_invert                                = stringSetFind(e,"GL_MESA_pack_invert");
-  gl_mesa_resize_buffers                             = stringSetFind(e,"GL_MESA_resize_buffers");
-  gl_mesa_window_pos                                 = stringSetFind(e,"GL_MESA_window_pos");
-  gl_mesa_ycbcr_texture                              = stringSetFind(e,"GL_MESA_ycbcr_texture");
-  gl_nvx_conditional_render                          = stringSetFind(e,"GL_NVX_conditional_render");
-  gl_nvx_gpu_memory_info                             = stringSetFind(e,"GL_NVX_gpu_memory_info");
-  gl_nv_3dvision_settings                            = stringSetFind(e,"GL_NV_3dvision_settings");
-  gl_nv_bgr                                          = stringSetFind(e,"GL_NV_bgr");
-  gl_nv_bindless_texture                             = stringSetFind(e,"GL_NV_bindless_texture");
-  gl_nv_blend_equation_advanced                      = stringSetFind(e,"GL_NV_blend_equation_advanced");
-  gl_nv_blend_square                                 = stringSetFind(e,"GL_NV_blend_square");
-  gl_nv_compute_program5                             = stringSetFind(e,"GL_NV_compute_program5");
-  gl_nv_conditional_render                           = stringSetFind(e,"GL_NV_conditional_render");
-  gl_nv_copy_buffer                                  = stringSetFind(e,"GL_NV_copy_buffer");
-  gl_nv_copy_depth_to_color                          = stringSetFind(e,"GL_NV_copy_depth_to_color");
-  gl_nv_copy_image                                   = stringSetFind(e,"GL_NV_copy_image");
-  gl_nv_coverage_sample                              = stringSetFind(e,"GL_NV_coverage_sample");
-  gl_nv_deep_texture3d                               = stringSetFind(e,"GL_NV_deep_texture3D");
-  gl_nv_depth_buffer_float                           = stringSetFind(e,"GL_NV_depth_buffer_float");
-  gl_nv_depth_clamp                                  = stringSetFind(e,"GL_NV_depth_clamp");
-  gl_nv_depth_nonlinear                              = stringSetFind(e,"GL_NV_depth_nonlinear");
-  gl_nv_depth_range_unclamped                        = stringSetFind(e,"GL_NV_depth_range_unclamped");
-  gl_nv_draw_buffers                                 = stringSetFind(e,"GL_NV_draw_buffers");
-  gl_nv_draw_texture                                 = stringSetFind(e,"GL_NV_draw_texture");
-  gl_nv_evaluators                                   = stringSetFind(e,"GL_NV_evaluators");
-  gl_nv_explicit_multisample                         = stringSetFind(e,"GL_NV_explicit_multisample");
-  gl_nv_fbo_color_attachments                        = stringSetFind(e,"GL_NV_fbo_color_attachments");
-  gl_nv_fence                                        = stringSetFind(e,"GL_NV_fence");
-  gl_nv_float_buffer                                 = stringSetFind(e,"GL_NV_float_buffer");
-  gl_nv_fog_distance                                 = stringSetFind(e,"GL_NV_fog_distance");
-  gl_nv_fragment_program                             = stringSetFind(e,"GL_NV_fragment_program");
-  gl_nv_fragment_program2                            = stringSetFind(e,"GL_NV_fragment_program2");
-  gl_nv_framebuffer_blit                             = stringSetFind(e,"GL_NV_framebuffer_blit");
-  gl_nv_framebuffer_multisample                      = stringSetFind(e,"GL_NV_framebuffer_multisample");
-  gl_nv_framebuffer_multisample_coverage             = stringSetFind(e,"GL_NV_framebuffer_multisample_coverage");
-  gl_nv_geometry_program4                            = stringSetFind(e,"GL_NV_geometry_program4");
-  gl_nv_gpu_program4                                 = stringSetFind(e,"GL_NV_gpu_program4");
-  gl_nv_gpu_program5                                 = stringSetFind(e,"GL_NV_gpu_program5");
-  gl_nv_gpu_shader5                                  = stringSetFind(e,"GL_NV_gpu_shader5");
-  gl_nv_half_float                                   = stringSetFind(e,"GL_NV_half_float");
-  gl_nv_instanced_arrays                             = stringSetFind(e,"GL_NV_instanced_arrays");
-  gl_nv_light_max_exponent                           = stringSetFind(e,"GL_NV_light_max_exponent");
-  gl_nv_multisample_coverage                         = stringSetFind(e,"GL_NV_multisample_coverage");
-  gl_nv_multisample_filter_hint                      = stringSetFind(e,"GL_NV_multisample_filter_hint");
-  gl_nv_non_square_matrices                          = stringSetFind(e,"GL_NV_non_square_matrices");
-  gl_nv_occlusion_query                              = stringSetFind(e,"GL_NV_occlusion_query");
-  gl_nv_pack_subimage                                = stringSetFind(e,"GL_NV_pack_subimage");
-  gl_nv_packed_depth_stencil                         = stringSetFind(e,"GL_NV_packed_depth_stencil");
-  gl_nv_packed_float_linear                          = stringSetFind(e,"GL_NV_packed_float_linear");
-  gl_nv_parameter_buffer_object                      = stringSetFind(e,"GL_NV_parameter_buffer_object");
-  gl_nv_path_rendering                               = stringSetFind(e,"GL_NV_path_rendering");
-  gl_nv_pixel_buffer_object                          = stringSetFind(e,"GL_NV_pixel_buffer_object");
-  gl_nv_pixel_data_range                             = stringSetFind(e,"GL_NV_pixel_data_range");
-  gl_nv_platform_binary                              = stringSetFind(e,"GL_NV_platform_binary");
-  gl_nv_point_sprite                                 = stringSetFind(e,"GL_NV_point_sprite");
-  gl_nv_present_video                                = stringSetFind(e,"GL_NV_present_video");
-  gl_nv_primitive_restart                            = stringSetFind(e,"GL_NV_primitive_restart");
-  gl_nv_read_buffer                                  = stringSetFind(e,"GL_NV_read_buffer");
-  gl_nv_read_buffer_front                            = stringSetFind(e,"GL_NV_read_buffer_front");
-  gl_nv_register_combiners                           = stringSetFind(e,"GL_NV_register_combiners");
-  gl_nv_register_combiners2                          = stringSetFind(e,"GL_NV_register_combiners2");
-  gl_nv_srgb_formats                                 = stringSetFind(e,"GL_NV_sRGB_formats");
-  gl_nv_shader_buffer_load                           = stringSetFind(e,"GL_NV_shader_buffer_load");
-  gl_nv_shadow_samplers_array                        = stringSetFind(e,"GL_NV_shadow_samplers_array");
-  gl_nv_shadow_samplers_cube                         = stringSetFind(e,"GL_NV_shadow_samplers_cube");
-  gl_nv_tessellation_program5                        = stringSetFind(e,"GL_NV_tessellation_program5");
-  gl_nv_texgen_emboss                                = stringSetFind(e,"GL_NV_texgen_emboss");
-  gl_nv_texgen_reflection                            = stringSetFind(e,"GL_NV_texgen_reflection");
-  gl_nv_texture_array                                = stringSetFind(e,"GL_NV_texture_array");
-  gl_nv_texture_barrier                              = stringSetFind(e,"GL_NV_texture_barrier");
-  gl_nv_texture_border_clamp                         = stringSetFind(e,"GL_NV_texture_border_clamp");
-  gl_nv_texture_compression_latc                     = stringSetFind(e,"GL_NV_texture_compression_latc");
-  gl_nv_texture_compression_s3tc                     = stringSetFind(e,"GL_NV_texture_compression_s3tc");
-  gl_nv_texture_env_combine4                         = stringSetFind(e,"GL_NV_texture_env_combine4");
-  gl_nv_texture_expand_normal                        = stringSetFind(e,"GL_NV_texture_expand_normal");
-  gl_nv_texture_multisample                          = stringSetFind(e,"GL_NV_texture_multisample");
-  gl_nv_texture_rectangle                            = stringSetFind(e,"GL_NV_texture_rectangle");
-  gl_nv_texture_shader                               = stringSetFind(e,"GL_NV_texture_shader");
-  gl_nv_texture_shader2                              = stringSetFind(e,"GL_NV_texture_shader2");
-  gl_nv_texture_shader3                              = stringSetFind(e,"GL_NV_texture_shader3");
-  gl_nv_transform_feedback                           = stringSetFind(e,"GL_NV_transform_feedback");
-  gl_nv_transform_feedback2                          = stringSetFind(e,"GL_NV_transform_feedback2");
-  gl_nv_vdpau_interop                                = stringSetFind(e,"GL_NV_vdpau_interop");
-  gl_nv_vertex_array_range                           = stringSetFind(e,"GL_NV_vertex_array_range");
-  gl_nv_vertex_array_range2                          = stringSetFind(e,"GL_NV_vertex_array_range2");
-  gl_nv_vertex_attrib_integer_64bit                  = stringSetFind(e,"GL_NV_vertex_attrib_integer_64bit");
-  gl_nv_vertex_buffer_unified_memory                 = stringSetFind(e,"GL_NV_vertex_buffer_unified_memory");
-  gl_nv_vertex_program                               = stringSetFind(e,"GL_NV_vertex_program");
-  gl_nv_vertex_program2_option                       = stringSetFind(e,"GL_NV_vertex_program2_option");
-  gl_nv_vertex_program3                              = stringSetFind(e,"GL_NV_vertex_program3");
-  gl_nv_vertex_program4                              = stringSetFind(e,"GL_NV_vertex_program4");
-  gl_nv_video_capture                                = stringSetFind(e,"GL_NV_video_capture");
-  gl_oes_egl_image_external                          = stringSetFind(e,"GL_OES_EGL_image_external");
-  gl_oes_blend_equation_separate                     = stringSetFind(e,"GL_OES_blend_equation_separate");
-  gl_oes_blend_func_separate                         = stringSetFind(e,"GL_OES_blend_func_separate");
-  gl_oes_blend_subtract                              = stringSetFind(e,"GL_OES_blend_subtract");
-  gl_oes_compressed_etc1_rgb8_texture                = stringSetFind(e,"GL_OES_compressed_ETC1_RGB8_texture");
-  gl_oes_compressed_paletted_texture                 = stringSetFind(e,"GL_OES_compressed_paletted_texture");
-  gl_oes_depth_texture                               = stringSetFind(e,"GL_OES_depth_texture");
-  gl_oes_draw_texture                                = stringSetFind(e,"GL_OES_draw_texture");
-  gl_oes_element_index_uint                          = stringSetFind(e,"GL_OES_element_index_uint");
-  gl_oes_fbo_render_mipmap                           = stringSetFind(e,"GL_OES_fbo_render_mipmap");
-  gl_oes_framebuffer_object                          = stringSetFind(e,"GL_OES_framebuffer_object");
-  gl_oes_get_program_binary                          = stringSetFind(e,"GL_OES_get_program_binary");
-  gl_oes_mapbuffer                                   = stringSetFind(e,"GL_OES_mapbuffer");
-  gl_oes_matrix_get                                  = stringSetFind(e,"GL_OES_matrix_get");
-  gl_oes_matrix_palette                              = stringSetFind(e,"GL_OES_matrix_palette");
-  gl_oes_packed_depth_stencil                        = stringSetFind(e,"GL_OES_packed_depth_stencil");
-  gl_oes_point_size_array                            = stringSetFind(e,"GL_OES_point_size_array");
-  gl_oes_point_sprite                                = stringSetFind(e,"GL_OES_point_sprite");
-  gl_oes_read_format                                 = stringSetFind(e,"GL_OES_read_format");
-  gl_oes_required_internalformat                     = stringSetFind(e,"GL_OES_required_internalformat");
-  gl_oes_rgb8_rgba8                                  = stringSetFind(e,"GL_OES_rgb8_rgba8");
-  gl_oes_single_precision                            = stringSetFind(e,"GL_OES_single_precision");
-  gl_oes_standard_derivatives                        = stringSetFind(e,"GL_OES_standard_derivatives");
-  gl_oes_stencil1                                    = stringSetFind(e,"GL_OES_stencil1");
-  gl_oes_stencil4                                    = stringSetFind(e,"GL_OES_stencil4");
-  gl_oes_stencil8                                    = stringSetFind(e,"GL_OES_stencil8");
-  gl_oes_surfaceless_context                         = stringSetFind(e,"GL_OES_surfaceless_context");
-  gl_oes_texture_3d                                  = stringSetFind(e,"GL_OES_texture_3D");
-  gl_oes_texture_cube_map                            = stringSetFind(e,"GL_OES_texture_cube_map");
-  gl_oes_texture_mirrored_repeat                     = stringSetFind(e,"GL_OES_texture_mirrored_repeat");
-  gl_oes_vertex_array_object                         = stringSetFind(e,"GL_OES_vertex_array_object");
-  gl_oes_vertex_half_float                           = stringSetFind(e,"GL_OES_vertex_half_float");
-  gl_oes_vertex_type_10_10_10_2                      = stringSetFind(e,"GL_OES_vertex_type_10_10_10_2");
-  gl_oml_interlace                                   = stringSetFind(e,"GL_OML_interlace");
-  gl_oml_resample                                    = stringSetFind(e,"GL_OML_resample");
-  gl_oml_subsample                                   = stringSetFind(e,"GL_OML_subsample");
-  gl_pgi_misc_hints                                  = stringSetFind(e,"GL_PGI_misc_hints");
-  gl_pgi_vertex_hints                                = stringSetFind(e,"GL_PGI_vertex_hints");
-  gl_qcom_alpha_test                                 = stringSetFind(e,"GL_QCOM_alpha_test");
-  gl_qcom_binning_control                            = stringSetFind(e,"GL_QCOM_binning_control");
-  gl_qcom_driver_control                             = stringSetFind(e,"GL_QCOM_driver_control");
-  gl_qcom_extended_get                               = stringSetFind(e,"GL_QCOM_extended_get");
-  gl_qcom_extended_get2                              = stringSetFind(e,"GL_QCOM_extended_get2");
-  gl_qcom_perfmon_global_mode                        = stringSetFind(e,"GL_QCOM_perfmon_global_mode");
-  gl_qcom_tiled_rendering                            = stringSetFind(e,"GL_QCOM_tiled_rendering");
-  gl_qcom_writeonly_rendering                        = stringSetFind(e,"GL_QCOM_writeonly_rendering");
-  gl_regal_es1_0_compatibility                       = stringSetFind(e,"GL_REGAL_ES1_0_compatibility");
-  gl_regal_es1_1_compatibility                       = stringSetFind(e,"GL_REGAL_ES1_1_compatibility");
-  gl_regal_enable                                    = stringSetFind(e,"GL_REGAL_enable");
-  gl_regal_error_string                              = stringSetFind(e,"GL_REGAL_error_string");
-  gl_regal_extension_query                           = stringSetFind(e,"GL_REGAL_extension_query");
-  gl_regal_log                                       = stringSetFind(e,"GL_REGAL_log");
-  gl_regal_proc_address                              = stringSetFind(e,"GL_REGAL_proc_address");
-  gl_rend_screen_coordinates                         = stringSetFind(e,"GL_REND_screen_coordinates");
-  gl_s3_s3tc                                         = stringSetFind(e,"GL_S3_s3tc");
-  gl_sgis_color_range                                = stringSetFind(e,"GL_SGIS_color_range");
-  gl_sgis_detail_texture                             = stringSetFind(e,"GL_SGIS_detail_texture");
-  gl_sgis_fog_function                               = stringSetFind(e,"GL_SGIS_fog_function");
-  gl_sgis_generate_mipmap                            = stringSetFind(e,"GL_SGIS_generate_mipmap");
-  gl_sgis_multisample                                = stringSetFind(e,"GL_SGIS_multisample");
-  gl_sgis_pixel_texture                              = stringSetFind(e,"GL_SGIS_pixel_texture");
-  gl_sgis_point_line_texgen                          = stringSetFind(e,"GL_SGIS_point_line_texgen");
-  gl_sgis_point_parameters                           = stringSetFind(e,"GL_SGIS_point_parameters");
-  gl_sgis_sharpen_texture                            = stringSetFind(e,"GL_SGIS_sharpen_texture");
-  gl_sgis_texture4d                                  = stringSetFind(e,"GL_SGIS_texture4D");
-  gl_sgis_texture_border_clamp                       = stringSetFind(e,"GL_SGIS_texture_border_clamp");
-  gl_sgis_texture_color_mask                         = stringSetFind(e,"GL_SGIS_texture_color_mask");
-  gl_sgis_texture_edge_clamp                         = stringSetFind(e,"GL_SGIS_texture_edge_clamp");
-  gl_sgis_texture_filter4                            = stringSetFind(e,"GL_SGIS_texture_filter4");
-  gl_sgis_texture_lod                                = stringSetFind(e,"GL_SGIS_texture_lod");
-  gl_sgix_async                                      = stringSetFind(e,"GL_SGIX_async");
-  gl_sgix_async_histogram                            = stringSetFind(e,"GL_SGIX_async_histogram");
-  gl_sgix_async_pixel                                = stringSetFind(e,"GL_SGIX_async_pixel");
-  gl_sgix_blend_alpha_minmax                         = stringSetFind(e,"GL_SGIX_blend_alpha_minmax");
-  gl_sgix_convolution_accuracy                       = stringSetFind(e,"GL_SGIX_convolution_accuracy");
-  gl_sgix_depth_texture                              = stringSetFind(e,"GL_SGIX_depth_texture");
-  gl_sgix_flush_raster                               = stringSetFind(e,"GL_SGIX_flush_raster");
-  gl_sgix_fog_offset                                 = stringSetFind(e,"GL_SGIX_fog_offset");
-  gl_sgix_fog_texture                                = stringSetFind(e,"GL_SGIX_fog_texture");
-  gl_sgix_fragment_lighting                          = stringSetFind(e,"GL_SGIX_fragment_lighting");
-  gl_sgix_fragment_specular_lighting                 = stringSetFind(e,"GL_SGIX_fragment_specular_lighting");
-  gl_sgix_framezoom                                  = stringSetFind(e,"GL_SGIX_framezoom");
-  gl_sgix_igloo_interface                            = stringSetFind(e,"GL_SGIX_igloo_interface");
-  gl_sgix_instruments                                = stringSetFind(e,"GL_SGIX_instruments");
-  gl_sgix_interlace                                  = stringSetFind(e,"GL_SGIX_interlace");
-  gl_sgix_list_priority                              = stringSetFind(e,"GL_SGIX_list_priority");
-  gl_sgix_pixel_texture                              = stringSetFind(e,"GL_SGIX_pixel_texture");
-  gl_sgix_polynomial_ffd                             = stringSetFind(e,"GL_SGIX_polynomial_ffd");
-  gl_sgix_reference_plane                            = stringSetFind(e,"GL_SGIX_reference_plane");
-  gl_sgix_resample                                   = stringSetFind(e,"GL_SGIX_resample");
-  gl_sgix_shadow                                     = stringSetFind(e,"GL_SGIX_shadow");
-  gl_sgix_shadow_ambient                             = stringSetFind(e,"GL_SGIX_shadow_ambient");
-  gl_sgix_sprite                                     = stringSetFind(e,"GL_SGIX_sprite");
-  gl_sgix_tag_sample_buffer                          = stringSetFind(e,"GL_SGIX_tag_sample_buffer");
-  gl_sgix_texture_coordinate_clamp                   = stringSetFind(e,"GL_SGIX_texture_coordinate_clamp");
-  gl_sgix_texture_multi_buffer                       = stringSetFind(e,"GL_SGIX_texture_multi_buffer");
-  gl_sgix_texture_range                              = stringSetFind(e,"GL_SGIX_texture_range");
-  gl_sgix_texture_scale_bias                         = stringSetFind(e,"GL_SGIX_texture_scale_bias");
-  gl_sgix_vertex_preclip_hint                        = stringSetFind(e,"GL_SGIX_vertex_preclip_hint");
-  gl_sgix_ycrcb                                      = stringSetFind(e,"GL_SGIX_ycrcb");
-  gl_sgi_color_matrix                                = stringSetFind(e,"GL_SGI_color_matrix");
-  gl_sgi_color_table                                 = stringSetFind(e,"GL_SGI_color_table");
-  gl_sgi_texture_color_table                         = stringSetFind(e,"GL_SGI_texture_color_table");
-  gl_sunx_constant_data                              = stringSetFind(e,"GL_SUNX_constant_data");
-  gl_sun_convolution_border_modes                    = stringSetFind(e,"GL_SUN_convolution_border_modes");
-  gl_sun_global_alpha                                = stringSetFind(e,"GL_SUN_global_alpha");
-  gl_sun_mesh_array                                  = stringSetFind(e,"GL_SUN_mesh_array");
-  gl_sun_read_video_pixels                           = stringSetFind(e,"GL_SUN_read_video_pixels");
-  gl_sun_slice_accum                                 = stringSetFind(e,"GL_SUN_slice_accum");
-  gl_sun_triangle_list                               = stringSetFind(e,"GL_SUN_triangle_list");
-  gl_sun_vertex                                      = stringSetFind(e,"GL_SUN_vertex");
-  gl_viv_shader_binary                               = stringSetFind(e,"GL_VIV_shader_binary");
-  gl_win_phong_shading                               = stringSetFind(e,"GL_WIN_phong_shading");
-  gl_win_specular_fog                                = stringSetFind(e,"GL_WIN_specular_fog");
-  gl_win_swap_hint                                   = stringSetFind(e,"GL_WIN_swap_hint");
-
-#if REGAL_SYS_WGL
-  wgl_3dl_stereo_control                             = stringSetFind(e,"WGL_3DL_stereo_control");
-  wgl_amd_gpu_association                            = stringSetFind(e,"WGL_AMD_gpu_association");
-  wgl_arb_buffer_region                              = stringSetFind(e,"WGL_ARB_buffer_region");
-  wgl_arb_create_context                             = stringSetFind(e,"WGL_ARB_create_context");
-  wgl_arb_create_context_profile                     = stringSetFind(e,"WGL_ARB_create_context_profile");
-  wgl_arb_create_context_robustness                  = stringSetFind(e,"WGL_ARB_create_context_robustness");
-  wgl_arb_extensions_string                          = stringSetFind(e,"WGL_ARB_extensions_string");
-  wgl_arb_framebuffer_srgb                           = stringSetFind(e,"WGL_ARB_framebuffer_sRGB");
-  wgl_arb_make_current_read                          = stringSetFind(e,"WGL_ARB_make_current_read");
-  wgl_arb_multisample                                = stringSetFind(e,"WGL_ARB_multisample");
-  wgl_arb_pbuffer                                    = stringSetFind(e,"WGL_ARB_pbuffer");
-  wgl_arb_pixel_format                               = stringSetFind(e,"WGL_ARB_pixel_format");
-  wgl_arb_pixel_format_float                         = stringSetFind(e,"WGL_ARB_pixel_format_float");
-  wgl_arb_render_texture                             = stringSetFind(e,"WGL_ARB_render_texture");
-  wgl_arb_robustness_share_group_isolation           = stringSetFind(e,"WGL_ARB_robustness_share_group_isolation");
-  wgl_ati_pixel_format_float                         = stringSetFind(e,"WGL_ATI_pixel_format_float");
-  wgl_ati_render_texture_rectangle                   = stringSetFind(e,"WGL_ATI_render_texture_rectangle");
-  wgl_ext_create_context_es2_profile                 = stringSetFind(e,"WGL_EXT_create_context_es2_profile");
-  wgl_ext_create_context_es_profile                  = stringSetFind(e,"WGL_EXT_create_context_es_profile");
-  wgl_ext_depth_float                                = stringSetFind(e,"WGL_EXT_depth_float");
-  wgl_ext_display_color_table                        = stringSetFind(e,"WGL_EXT_display_color_table");
-  wgl_ext_extensions_string                          = stringSetFind(e,"WGL_EXT_extensions_string");
-  wgl_ext_framebuffer_srgb                           = stringSetFind(e,"WGL_EXT_framebuffer_sRGB");
-  wgl_ext_make_current_read                          = stringSetFind(e,"WGL_EXT_make_current_read");
-  wgl_ext_multisample                                = stringSetFind(e,"WGL_EXT_multisample");
-  wgl_ext_pbuffer                                    = stringSetFind(e,"WGL_EXT_pbuffer");
-  wgl_ext_pixel_format                               = stringSetFind(e,"WGL_EXT_pixel_format");
-  wgl_ext_pixel_format_packed_float                  = stringSetFind(e,"WGL_EXT_pixel_format_packed_float");
-  wgl_ext_swap_control                               = stringSetFind(e,"WGL_EXT_swap_control");
-  wgl_gdi                                            = stringSetFind(e,"WGL_GDI");
-  wgl_i3d_digital_video_control                      = stringSetFind(e,"WGL_I3D_digital_video_control");
-  wgl_i3d_gamma                                      = stringSetFind(e,"WGL_I3D_gamma");
-  wgl_i3d_genlock                                    = stringSetFind(e,"WGL_I3D_genlock");
-  wgl_i3d_image_buffer                               = stringSetFind(e,"WGL_I3D_image_buffer");
-  wgl_i3d_swap_frame_lock                            = stringSetFind(e,"WGL_I3D_swap_frame_lock");
-  wgl_i3d_swap_frame_usage                           = stringSetFind(e,"WGL_I3D_swap_frame_usage");
-  wgl_nv_dx_interop                                  = stringSetFind(e,"WGL_NV_DX_interop");
-  wgl_nv_copy_image                                  = stringSetFind(e,"WGL_NV_copy_image");
-  wgl_nv_float_buffer                                = stringSetFind(e,"WGL_NV_float_buffer");
-  wgl_nv_gpu_affinity                                = stringSetFind(e,"WGL_NV_gpu_affinity");
-  wgl_nv_multisample_coverage                        = stringSetFind(e,"WGL_NV_multisample_coverage");
-  wgl_nv_present_video                               = stringSetFind(e,"WGL_NV_present_video");
-  wgl_nv_render_depth_texture                        = stringSetFind(e,"WGL_NV_render_depth_texture");
-  wgl_nv_render_texture_rectangle                    = stringSetFind(e,"WGL_NV_render_texture_rectangle");
-  wgl_nv_swap_group                                  = stringSetFind(e,"WGL_NV_swap_group");
-  wgl_nv_vertex_array_range                          = stringSetFind(e,"WGL_NV_vertex_array_range");
-  wgl_nv_video_capture                               = stringSetFind(e,"WGL_NV_video_capture");
-  wgl_nv_video_output                                = stringSetFind(e,"WGL_NV_video_output");
-  wgl_oml_sync_control                               = stringSetFind(e,"WGL_OML_sync_control");
-#endif /* REGAL_SYS_WGL */
-
-#if REGAL_SYS_GLX
-  glx_3dfx_multisample                               = stringSetFind(e,"GLX_3DFX_multisample");
-  glx_amd_gpu_association                            = stringSetFind(e,"GLX_AMD_gpu_association");
-  glx_arb_create_context                             = stringSetFind(e,"GLX_ARB_create_context");
-  glx_arb_create_context_profile                     = stringSetFind(e,"GLX_ARB_create_context_profile");
-  glx_arb_create_context_robustness                  = stringSetFind(e,"GLX_ARB_create_context_robustness");
-  glx_arb_fbconfig_float                             = stringSetFind(e,"GLX_ARB_fbconfig_float");
-  glx_arb_framebuffer_srgb                           = stringSetFind(e,"GLX_ARB_framebuffer_sRGB");
-  glx_arb_get_proc_address                           = stringSetFind(e,"GLX_ARB_get_proc_address");
-  glx_arb_multisample                                = stringSetFind(e,"GLX_ARB_multisample");
-  glx_arb_robustness_share_group_isolation           = stringSetFind(e,"GLX_ARB_robustness_share_group_isolation");
-  glx_arb_vertex_buffer_object                       = stringSetFind(e,"GLX_ARB_vertex_buffer_object");
-  glx_ati_pixel_format_float                         = stringSetFind(e,"GLX_ATI_pixel_format_float");
-  glx_ati_render_texture                             = stringSetFind(e,"GLX_ATI_render_texture");
-  glx_ext_create_context_es2_profile                 = stringSetFind(e,"GLX_EXT_create_context_es2_profile");
-  glx_ext_create_context_es_profile                  = stringSetFind(e,"GLX_EXT_create_context_es_profile");
-  glx_ext_fbconfig_packed_float                      = stringSetFind(e,"GLX_EXT_fbconfig_packed_float");
-  glx_ext_framebuffer_srgb                           = stringSetFind(e,"GLX_EXT_framebuffer_sRGB");
-  glx_ext_import_context                             = stringSetFind(e,"GLX_EXT_import_context");
-  glx_ext_swap_control                               = stringSetFind(e,"GLX_EXT_swap_control");
-  glx_ext_swap_control_tear                          = stringSetFind(e,"GLX_EXT_swap_control_tear");
-  glx_ext_texture_from_pixmap                        = stringSetFind(e,"GLX_EXT_texture_from_pixmap");
-  glx_ext_visual_info                                = stringSetFind(e,"GLX_EXT_visual_info");
-  glx_ext_visual_rating                              = stringSetFind(e,"GLX_EXT_visual_rating");
-  glx_intel_swap_event                               = stringSetFind(e,"GLX_INTEL_swap_event");
-  glx_mesa_agp_offset                                = stringSetFind(e,"GLX_MESA_agp_offset");
-  glx_mesa_copy_sub_buffer                           = stringSetFind(e,"GLX_MESA_copy_sub_buffer");
-  glx_mesa_pixmap_colormap                           = stringSetFind(e,"GLX_MESA_pixmap_colormap");
-  glx_mesa_release_buffers                           = stringSetFind(e,"GLX_MESA_release_buffers");
-  glx_mesa_set_3dfx_mode                             = stringSetFind(e,"GLX_MESA_set_3dfx_mode");
-  glx_mesa_swap_control                              = stringSetFind(e,"GLX_MESA_swap_control");
-  glx_nv_copy_image                                  = stringSetFind(e,"GLX_NV_copy_image");
-  glx_nv_float_buffer                                = stringSetFind(e,"GLX_NV_float_buffer");
-  glx_nv_multisample_coverage                        = stringSetFind(e,"GLX_NV_multisample_coverage");
-  glx_nv_present_video                               = stringSetFind(e,"GLX_NV_present_video");
-  glx_nv_swap_group                                  = stringSetFind(e,"GLX_NV_swap_group");
-  glx_nv_vertex_array_range                          = stringSetFind(e,"GLX_NV_vertex_array_range");
-  glx_nv_video_capture                               = stringSetFind(e,"GLX_NV_video_capture");
-  glx_nv_video_output                                = stringSetFind(e,"GLX_NV_video_output");
-  glx_oml_swap_method                                = stringSetFind(e,"GLX_OML_swap_method");
-  glx_oml_sync_control                               = stringSetFind(e,"GLX_OML_sync_control");
-  glx_sgis_blended_overlay                           = stringSetFind(e,"GLX_SGIS_blended_overlay");
-  glx_sgis_color_range                               = stringSetFind(e,"GLX_SGIS_color_range");
-  glx_sgis_multisample                               = stringSetFind(e,"GLX_SGIS_multisample");
-  glx_sgis_shared_multisample                        = stringSetFind(e,"GLX_SGIS_shared_multisample");
-  glx_sgix_fbconfig                                  = stringSetFind(e,"GLX_SGIX_fbconfig");
-  glx_sgix_hyperpipe                                 = stringSetFind(e,"GLX_SGIX_hyperpipe");
-  glx_sgix_pbuffer                                   = stringSetFind(e,"GLX_SGIX_pbuffer");
-  glx_sgix_swap_barrier                              = stringSetFind(e,"GLX_SGIX_swap_barrier");
-  glx_sgix_swap_group                                = stringSetFind(e,"GLX_SGIX_swap_group");
-  glx_sgix_video_resize                              = stringSetFind(e,"GLX_SGIX_video_resize");
-  glx_sgix_visual_select_group                       = stringSetFind(e,"GLX_SGIX_visual_select_group");
-  glx_sgi_cushion                                    = stringSetFind(e,"GLX_SGI_cushion");
-  glx_sgi_make_current_read                          = stringSetFind(e,"GLX_SGI_make_current_read");
-  glx_sgi_swap_control                               = stringSetFind(e,"GLX_SGI_swap_control");
-  glx_sgi_video_sync                                 = stringSetFind(e,"GLX_SGI_video_sync");
-  glx_sun_get_transparent_index                      = stringSetFind(e,"GLX_SUN_get_transparent_index");
-  glx_sun_video_resize                               = stringSetFind(e,"GLX_SUN_video_resize");
-#endif /* REGAL_SYS_GLX */
-
-#if REGAL_SYS_EGL
-  egl_angle_query_surface_pointer                    = stringSetFind(e,"EGL_ANGLE_query_surface_pointer");
-  egl_angle_surface_d3d_texture_2d_share_handle      = stringSetFind(e,"EGL_ANGLE_surface_d3d_texture_2d_share_handle");
-  egl_ext_create_context_robustness                  = stringSetFind(e,"EGL_EXT_create_context_robustness");
-  egl_ext_multiview_window                           = stringSetFind(e,"EGL_EXT_multiview_window");
-  egl_hi_colorformats                                = stringSetFind(e,"EGL_HI_colorformats");
-  egl_img_context_priority                           = stringSetFind(e,"EGL_IMG_context_priority");
-  egl_khr_config_attribs                             = stringSetFind(e,"EGL_KHR_config_attribs");
-  egl_khr_create_context                             = stringSetFind(e,"EGL_KHR_create_context");
-  egl_khr_fence_sync                                 = stringSetFind(e,"EGL_KHR_fence_sync");
-  egl_khr_gl_texture_cubemap_image                   = stringSetFind(e,"EGL_KHR_gl_texture_cubemap_image");
-  egl_khr_image_base                                 = stringSetFind(e,"EGL_KHR_image_base");
-  egl_khr_image_pixmap                               = stringSetFind(e,"EGL_KHR_image_pixmap");
-  egl_khr_lock_surface                               = stringSetFind(e,"EGL_KHR_lock_surface");
-  egl_khr_lock_surface2                              = stringSetFind(e,"EGL_KHR_lock_surface2");
-  egl_khr_reusable_sync                              = stringSetFind(e,"EGL_KHR_reusable_sync");
-  egl_khr_stream                                     = stringSetFind(e,"EGL_KHR_stream");
-  egl_khr_stream_consumer_gltexture                  = stringSetFind(e,"EGL_KHR_stream_consumer_gltexture");
-  egl_khr_stream_cross_process_fd                    = stringSetFind(e,"EGL_KHR_stream_cross_process_fd");
-  egl_khr_stream_fifo                                = stringSetFind(e,"EGL_KHR_stream_fifo");
-  egl_khr_stream_producer_eglsurface                 = stringSetFind(e,"EGL_KHR_stream_producer_eglsurface");
-  egl_khr_vg_parent_image                            = stringSetFind(e,"EGL_KHR_vg_parent_image");
-  egl_khr_wait_sync                                  = stringSetFind(e,"EGL_KHR_wait_sync");
-  egl_mesa_drm_image                                 = stringSetFind(e,"EGL_MESA_drm_image");
-  egl_nv_coverage_sample                             = stringSetFind(e,"EGL_NV_coverage_sample");
-  egl_nv_coverage_sample_resolve                     = stringSetFind(e,"EGL_NV_coverage_sample_resolve");
-  egl_nv_post_sub_buffer                             = stringSetFind(e,"EGL_NV_post_sub_buffer");
-  egl_nv_sync                                        = stringSetFind(e,"EGL_NV_sync");
-  egl_nv_system_time                                 = stringSetFind(e,"EGL_NV_system_time");
-#endif /* REGAL_SYS_EGL */
+  for (string_list<string>::const_iterator i=driverExtensions.begin(); i!=driverExtensions.end(); ++i)
+    setExtension(extensionIndex(i->c_str()),true);
 
   RegalAssert(context.dispatcher.driver.glGetIntegerv);
   RegalAssert(context.dispatcher.driver.glGetBooleanv);
@@ -1762,10 +1088,776 @@ ContextInfo::init(const RegalContext &context)
   warnGLError(context,"querying context information.");
 }
 
-bool
-ContextInfo::stringSetFind(const std::set<std::string> &stringSet, const std::string &val)
+// Extension names in sorted order, and minimal perfect hash
+
+const char * const extensionNames[665] = {
+  "EGL_ANGLE_query_surface_pointer",
+  "EGL_ANGLE_surface_d3d_texture_2d_share_handle",
+  "EGL_EXT_create_context_robustness",
+  "EGL_EXT_multiview_window",
+  "EGL_HI_colorformats",
+  "EGL_IMG_context_priority",
+  "EGL_KHR_config_attribs",
+  "EGL_KHR_create_context",
+  "EGL_KHR_fence_sync",
+  "EGL_KHR_gl_texture_cubemap_image",
+  "EGL_KHR_image_base",
+  "EGL_KHR_image_pixmap",
+  "EGL_KHR_lock_surface",
+  "EGL_KHR_lock_surface2",
+  "EGL_KHR_reusable_sync",
+  "EGL_KHR_stream",
+  "EGL_KHR_stream_consumer_gltexture",
+  "EGL_KHR_stream_cross_process_fd",
+  "EGL_KHR_stream_fifo",
+  "EGL_KHR_stream_producer_eglsurface",
+  "EGL_KHR_vg_parent_image",
+  "EGL_KHR_wait_sync",
+  "EGL_MESA_drm_image",
+  "EGL_NV_coverage_sample",
+  "EGL_NV_coverage_sample_resolve",
+  "EGL_NV_post_sub_buffer",
+  "EGL_NV_sync",
+  "EGL_NV_system_time",
+  "GLX_3DFX_multisample",
+  "GLX_AMD_gpu_association",
+  "GLX_ARB_create_context",
+  "GLX_ARB_create_context_profile",
+  "GLX_ARB_create_context_robustness",
+  "GLX_ARB_fbconfig_float",
+  "GLX_ARB_framebuffer_sRGB",
+  "GLX_ARB_get_proc_address",
+  "GLX_ARB_multisample",
+  "GLX_ARB_robustness_share_group_isolation",
+  "GLX_ARB_vertex_buffer_object",
+  "GLX_ATI_pixel_format_float",
+  "GLX_ATI_render_texture",
+  "GLX_EXT_create_context_es2_profile",
+  "GLX_EXT_create_context_es_profile",
+  "GLX_EXT_fbconfig_packed_float",
+  "GLX_EXT_framebuffer_sRGB",
+  "GLX_EXT_import_context",
+  "GLX_EXT_swap_control",
+  "GLX_EXT_swap_control_tear",
+  "GLX_EXT_texture_from_pixmap",
+  "GLX_EXT_visual_info",
+  "GLX_EXT_visual_rating",
+  "GLX_INTEL_swap_event",
+  "GLX_MESA_agp_offset",
+  "GLX_MESA_copy_sub_buffer",
+  "GLX_MESA_pixmap_colormap",
+  "GLX_MESA_release_buffers",
+  "GLX_MESA_set_3dfx_mode",
+  "GLX_MESA_swap_control",
+  "GLX_NV_copy_image",
+  "GLX_NV_float_buffer",
+  "GLX_NV_multisample_coverage",
+  "GLX_NV_present_video",
+  "GLX_NV_swap_group",
+  "GLX_NV_vertex_array_range",
+  "GLX_NV_video_capture",
+  "GLX_NV_video_output",
+  "GLX_OML_swap_method",
+  "GLX_OML_sync_control",
+  "GLX_SGIS_blended_overlay",
+  "GLX_SGIS_color_range",
+  "GLX_SGIS_multisample",
+  "GLX_SGIS_shared_multisample",
+  "GLX_SGIX_fbconfig",
+  "GLX_SGIX_hyperpipe",
+  "GLX_SGIX_pbuffer",
+  "GLX_SGIX_swap_barrier",
+  "GLX_SGIX_swap_group",
+  "GLX_SGIX_video_resize",
+  "GLX_SGIX_visual_select_group",
+  "GLX_SGI_cushion",
+  "GLX_SGI_make_current_read",
+  "GLX_SGI_swap_control",
+  "GLX_SGI_video_sync",
+  "GLX_SUN_get_transparent_index",
+  "GLX_SUN_video_resize",
+  "GL_3DFX_multisample",
+  "GL_3DFX_tbuffer",
+  "GL_3DFX_texture_compression_FXT1",
+  "GL_AMD_blend_minmax_factor",
+  "GL_AMD_compressed_3DC_texture",
+  "GL_AMD_compressed_ATC_texture",
+  "GL_AMD_debug_output",
+  "GL_AMD_depth_clamp_separate",
+  "GL_AMD_draw_buffers_blend",
+  "GL_AMD_interleaved_elements",
+  "GL_AMD_multi_draw_indirect",
+  "GL_AMD_name_gen_delete",
+  "GL_AMD_performance_monitor",
+  "GL_AMD_pinned_memory",
+  "GL_AMD_program_binary_Z400",
+  "GL_AMD_query_buffer_object",
+  "GL_AMD_sample_positions",
+  "GL_AMD_seamless_cubemap_per_texture",
+  "GL_AMD_sparse_texture",
+  "GL_AMD_stencil_operation_extended",
+  "GL_AMD_vertex_shader_tessellator",
+  "GL_ANGLE_framebuffer_blit",
+  "GL_ANGLE_framebuffer_multisample",
+  "GL_ANGLE_instanced_arrays",
+  "GL_ANGLE_pack_reverse_row_order",
+  "GL_ANGLE_program_binary",
+  "GL_ANGLE_texture_compression_dxt1",
+  "GL_ANGLE_texture_compression_dxt3",
+  "GL_ANGLE_texture_compression_dxt5",
+  "GL_ANGLE_texture_usage",
+  "GL_ANGLE_timer_query",
+  "GL_ANGLE_translated_shader_source",
+  "GL_APPLE_aux_depth_stencil",
+  "GL_APPLE_client_storage",
+  "GL_APPLE_copy_texture_levels",
+  "GL_APPLE_element_array",
+  "GL_APPLE_fence",
+  "GL_APPLE_float_pixels",
+  "GL_APPLE_flush_buffer_range",
+  "GL_APPLE_flush_render",
+  "GL_APPLE_framebuffer_multisample",
+  "GL_APPLE_object_purgeable",
+  "GL_APPLE_pixel_buffer",
+  "GL_APPLE_rgb_422",
+  "GL_APPLE_row_bytes",
+  "GL_APPLE_specular_vector",
+  "GL_APPLE_sync",
+  "GL_APPLE_texture_max_level",
+  "GL_APPLE_texture_range",
+  "GL_APPLE_transform_hint",
+  "GL_APPLE_vertex_array_object",
+  "GL_APPLE_vertex_array_range",
+  "GL_APPLE_vertex_program_evaluators",
+  "GL_APPLE_ycbcr_422",
+  "GL_ARB_ES2_compatibility",
+  "GL_ARB_ES3_compatibility",
+  "GL_ARB_base_instance",
+  "GL_ARB_bindless_texture",
+  "GL_ARB_blend_func_extended",
+  "GL_ARB_buffer_storage",
+  "GL_ARB_cl_event",
+  "GL_ARB_clear_buffer_object",
+  "GL_ARB_clear_texture",
+  "GL_ARB_color_buffer_float",
+  "GL_ARB_compressed_texture_pixel_storage",
+  "GL_ARB_compute_shader",
+  "GL_ARB_compute_variable_group_size",
+  "GL_ARB_copy_buffer",
+  "GL_ARB_copy_image",
+  "GL_ARB_debug_output",
+  "GL_ARB_depth_buffer_float",
+  "GL_ARB_depth_clamp",
+  "GL_ARB_depth_texture",
+  "GL_ARB_draw_buffers",
+  "GL_ARB_draw_buffers_blend",
+  "GL_ARB_draw_elements_base_vertex",
+  "GL_ARB_draw_indirect",
+  "GL_ARB_draw_instanced",
+  "GL_ARB_enhanced_layouts",
+  "GL_ARB_explicit_uniform_location",
+  "GL_ARB_fragment_program",
+  "GL_ARB_fragment_shader",
+  "GL_ARB_framebuffer_no_attachments",
+  "GL_ARB_framebuffer_object",
+  "GL_ARB_framebuffer_sRGB",
+  "GL_ARB_geometry_shader4",
+  "GL_ARB_get_program_binary",
+  "GL_ARB_gpu_shader5",
+  "GL_ARB_gpu_shader_fp64",
+  "GL_ARB_half_float_pixel",
+  "GL_ARB_half_float_vertex",
+  "GL_ARB_imaging",
+  "GL_ARB_indirect_parameters",
+  "GL_ARB_instanced_arrays",
+  "GL_ARB_internalformat_query",
+  "GL_ARB_internalformat_query2",
+  "GL_ARB_invalidate_subdata",
+  "GL_ARB_map_buffer_alignment",
+  "GL_ARB_map_buffer_range",
+  "GL_ARB_matrix_palette",
+  "GL_ARB_multi_bind",
+  "GL_ARB_multi_draw_indirect",
+  "GL_ARB_multisample",
+  "GL_ARB_multitexture",
+  "GL_ARB_occlusion_query",
+  "GL_ARB_occlusion_query2",
+  "GL_ARB_pixel_buffer_object",
+  "GL_ARB_point_parameters",
+  "GL_ARB_point_sprite",
+  "GL_ARB_program_interface_query",
+  "GL_ARB_provoking_vertex",
+  "GL_ARB_query_buffer_object",
+  "GL_ARB_robustness",
+  "GL_ARB_sample_shading",
+  "GL_ARB_sampler_objects",
+  "GL_ARB_seamless_cube_map",
+  "GL_ARB_separate_shader_objects",
+  "GL_ARB_shader_atomic_counters",
+  "GL_ARB_shader_image_load_store",
+  "GL_ARB_shader_objects",
+  "GL_ARB_shader_storage_buffer_object",
+  "GL_ARB_shader_subroutine",
+  "GL_ARB_shading_language_100",
+  "GL_ARB_shading_language_include",
+  "GL_ARB_shadow",
+  "GL_ARB_shadow_ambient",
+  "GL_ARB_sparse_texture",
+  "GL_ARB_stencil_texturing",
+  "GL_ARB_sync",
+  "GL_ARB_tessellation_shader",
+  "GL_ARB_texture_border_clamp",
+  "GL_ARB_texture_buffer_object",
+  "GL_ARB_texture_buffer_range",
+  "GL_ARB_texture_compression",
+  "GL_ARB_texture_compression_bptc",
+  "GL_ARB_texture_compression_rgtc",
+  "GL_ARB_texture_cube_map",
+  "GL_ARB_texture_cube_map_array",
+  "GL_ARB_texture_env_combine",
+  "GL_ARB_texture_env_dot3",
+  "GL_ARB_texture_float",
+  "GL_ARB_texture_gather",
+  "GL_ARB_texture_mirror_clamp_to_edge",
+  "GL_ARB_texture_mirrored_repeat",
+  "GL_ARB_texture_multisample",
+  "GL_ARB_texture_rectangle",
+  "GL_ARB_texture_rg",
+  "GL_ARB_texture_rgb10_a2ui",
+  "GL_ARB_texture_storage",
+  "GL_ARB_texture_storage_multisample",
+  "GL_ARB_texture_swizzle",
+  "GL_ARB_texture_view",
+  "GL_ARB_timer_query",
+  "GL_ARB_transform_feedback2",
+  "GL_ARB_transform_feedback3",
+  "GL_ARB_transform_feedback_instanced",
+  "GL_ARB_transpose_matrix",
+  "GL_ARB_uniform_buffer_object",
+  "GL_ARB_vertex_array_object",
+  "GL_ARB_vertex_attrib_64bit",
+  "GL_ARB_vertex_attrib_binding",
+  "GL_ARB_vertex_blend",
+  "GL_ARB_vertex_buffer_object",
+  "GL_ARB_vertex_program",
+  "GL_ARB_vertex_shader",
+  "GL_ARB_vertex_type_2_10_10_10_rev",
+  "GL_ARB_viewport_array",
+  "GL_ARB_window_pos",
+  "GL_ARM_mali_program_binary",
+  "GL_ARM_mali_shader_binary",
+  "GL_ATI_draw_buffers",
+  "GL_ATI_element_array",
+  "GL_ATI_envmap_bumpmap",
+  "GL_ATI_fragment_shader",
+  "GL_ATI_map_object_buffer",
+  "GL_ATI_meminfo",
+  "GL_ATI_pn_triangles",
+  "GL_ATI_separate_stencil",
+  "GL_ATI_text_fragment_shader",
+  "GL_ATI_texture_compression_3dc",
+  "GL_ATI_texture_env_combine3",
+  "GL_ATI_texture_float",
+  "GL_ATI_texture_mirror_once",
+  "GL_ATI_vertex_array_object",
+  "GL_ATI_vertex_attrib_array_object",
+  "GL_ATI_vertex_streams",
+  "GL_DMP_shader_binary",
+  "GL_EXT_422_pixels",
+  "GL_EXT_Cg_shader",
+  "GL_EXT_abgr",
+  "GL_EXT_bgra",
+  "GL_EXT_bindable_uniform",
+  "GL_EXT_blend_color",
+  "GL_EXT_blend_equation_separate",
+  "GL_EXT_blend_func_separate",
+  "GL_EXT_blend_minmax",
+  "GL_EXT_blend_subtract",
+  "GL_EXT_clip_volume_hint",
+  "GL_EXT_cmyka",
+  "GL_EXT_color_buffer_half_float",
+  "GL_EXT_color_subtable",
+  "GL_EXT_compiled_vertex_array",
+  "GL_EXT_convolution",
+  "GL_EXT_coordinate_frame",
+  "GL_EXT_copy_texture",
+  "GL_EXT_cull_vertex",
+  "GL_EXT_debug_label",
+  "GL_EXT_debug_marker",
+  "GL_EXT_depth_bounds_test",
+  "GL_EXT_direct_state_access",
+  "GL_EXT_discard_framebuffer",
+  "GL_EXT_disjoint_timer_query",
+  "GL_EXT_draw_buffers2",
+  "GL_EXT_draw_instanced",
+  "GL_EXT_draw_range_elements",
+  "GL_EXT_fog_coord",
+  "GL_EXT_fragment_lighting",
+  "GL_EXT_framebuffer_blit",
+  "GL_EXT_framebuffer_multisample",
+  "GL_EXT_framebuffer_multisample_blit_scaled",
+  "GL_EXT_framebuffer_object",
+  "GL_EXT_framebuffer_sRGB",
+  "GL_EXT_geometry_shader4",
+  "GL_EXT_gpu_program_parameters",
+  "GL_EXT_gpu_shader4",
+  "GL_EXT_histogram",
+  "GL_EXT_index_func",
+  "GL_EXT_index_material",
+  "GL_EXT_light_texture",
+  "GL_EXT_map_buffer_range",
+  "GL_EXT_multi_draw_arrays",
+  "GL_EXT_multisample",
+  "GL_EXT_multisampled_render_to_texture",
+  "GL_EXT_multiview_draw_buffers",
+  "GL_EXT_occlusion_query_boolean",
+  "GL_EXT_packed_depth_stencil",
+  "GL_EXT_packed_float",
+  "GL_EXT_packed_pixels",
+  "GL_EXT_paletted_texture",
+  "GL_EXT_pixel_buffer_object",
+  "GL_EXT_pixel_transform",
+  "GL_EXT_point_parameters",
+  "GL_EXT_polygon_offset",
+  "GL_EXT_provoking_vertex",
+  "GL_EXT_read_format_bgra",
+  "GL_EXT_rescale_normal",
+  "GL_EXT_robustness",
+  "GL_EXT_sRGB",
+  "GL_EXT_scene_marker",
+  "GL_EXT_secondary_color",
+  "GL_EXT_separate_shader_objects",
+  "GL_EXT_separate_specular_color",
+  "GL_EXT_shader_framebuffer_fetch",
+  "GL_EXT_shader_image_load_store",
+  "GL_EXT_shadow_samplers",
+  "GL_EXT_shared_texture_palette",
+  "GL_EXT_stencil_clear_tag",
+  "GL_EXT_stencil_two_side",
+  "GL_EXT_stencil_wrap",
+  "GL_EXT_subtexture",
+  "GL_EXT_texture",
+  "GL_EXT_texture3D",
+  "GL_EXT_texture_array",
+  "GL_EXT_texture_buffer_object",
+  "GL_EXT_texture_compression_latc",
+  "GL_EXT_texture_compression_rgtc",
+  "GL_EXT_texture_compression_s3tc",
+  "GL_EXT_texture_cube_map",
+  "GL_EXT_texture_edge_clamp",
+  "GL_EXT_texture_env_combine",
+  "GL_EXT_texture_env_dot3",
+  "GL_EXT_texture_filter_anisotropic",
+  "GL_EXT_texture_format_BGRA8888",
+  "GL_EXT_texture_integer",
+  "GL_EXT_texture_lod_bias",
+  "GL_EXT_texture_mirror_clamp",
+  "GL_EXT_texture_object",
+  "GL_EXT_texture_perturb_normal",
+  "GL_EXT_texture_rectangle",
+  "GL_EXT_texture_rg",
+  "GL_EXT_texture_sRGB",
+  "GL_EXT_texture_sRGB_decode",
+  "GL_EXT_texture_shared_exponent",
+  "GL_EXT_texture_snorm",
+  "GL_EXT_texture_storage",
+  "GL_EXT_texture_swizzle",
+  "GL_EXT_texture_type_2_10_10_10_REV",
+  "GL_EXT_timer_query",
+  "GL_EXT_transform_feedback",
+  "GL_EXT_unpack_subimage",
+  "GL_EXT_vertex_array",
+  "GL_EXT_vertex_attrib_64bit",
+  "GL_EXT_vertex_shader",
+  "GL_EXT_vertex_weighting",
+  "GL_EXT_x11_sync_object",
+  "GL_FJ_shader_binary_GCCSO",
+  "GL_GREMEDY_frame_terminator",
+  "GL_GREMEDY_string_marker",
+  "GL_HP_image_transform",
+  "GL_HP_occlusion_test",
+  "GL_IBM_cull_vertex",
+  "GL_IBM_multimode_draw_arrays",
+  "GL_IBM_rasterpos_clip",
+  "GL_IBM_static_data",
+  "GL_IBM_texture_mirrored_repeat",
+  "GL_IBM_vertex_array_lists",
+  "GL_IMG_multisampled_render_to_texture",
+  "GL_IMG_program_binary",
+  "GL_IMG_read_format",
+  "GL_IMG_shader_binary",
+  "GL_IMG_texture_compression_pvrtc",
+  "GL_IMG_texture_compression_pvrtc2",
+  "GL_IMG_texture_env_enhanced_fixed_function",
+  "GL_IMG_user_clip_plane",
+  "GL_INGR_blend_func_separate",
+  "GL_INGR_color_clamp",
+  "GL_INGR_interlace_read",
+  "GL_INTEL_map_texture",
+  "GL_INTEL_parallel_arrays",
+  "GL_INTEL_texture_scissor",
+  "GL_KHR_debug",
+  "GL_KHR_texture_compression_astc_ldr",
+  "GL_KTX_buffer_region",
+  "GL_MESAX_texture_stack",
+  "GL_MESA_pack_invert",
+  "GL_MESA_resize_buffers",
+  "GL_MESA_window_pos",
+  "GL_MESA_ycbcr_texture",
+  "GL_NVX_conditional_render",
+  "GL_NVX_gpu_memory_info",
+  "GL_NV_3dvision_settings",
+  "GL_NV_bgr",
+  "GL_NV_bindless_texture",
+  "GL_NV_blend_equation_advanced",
+  "GL_NV_blend_square",
+  "GL_NV_compute_program5",
+  "GL_NV_conditional_render",
+  "GL_NV_copy_buffer",
+  "GL_NV_copy_depth_to_color",
+  "GL_NV_copy_image",
+  "GL_NV_coverage_sample",
+  "GL_NV_deep_texture3D",
+  "GL_NV_depth_buffer_float",
+  "GL_NV_depth_clamp",
+  "GL_NV_depth_nonlinear",
+  "GL_NV_depth_range_unclamped",
+  "GL_NV_draw_buffers",
+  "GL_NV_draw_texture",
+  "GL_NV_evaluators",
+  "GL_NV_explicit_multisample",
+  "GL_NV_fbo_color_attachments",
+  "GL_NV_fence",
+  "GL_NV_float_buffer",
+  "GL_NV_fog_distance",
+  "GL_NV_fragment_program",
+  "GL_NV_fragment_program2",
+  "GL_NV_framebuffer_blit",
+  "GL_NV_framebuffer_multisample",
+  "GL_NV_framebuffer_multisample_coverage",
+  "GL_NV_geometry_program4",
+  "GL_NV_gpu_program4",
+  "GL_NV_gpu_program5",
+  "GL_NV_gpu_shader5",
+  "GL_NV_half_float",
+  "GL_NV_instanced_arrays",
+  "GL_NV_light_max_exponent",
+  "GL_NV_multisample_coverage",
+  "GL_NV_multisample_filter_hint",
+  "GL_NV_non_square_matrices",
+  "GL_NV_occlusion_query",
+  "GL_NV_pack_subimage",
+  "GL_NV_packed_depth_stencil",
+  "GL_NV_packed_float_linear",
+  "GL_NV_parameter_buffer_object",
+  "GL_NV_path_rendering",
+  "GL_NV_pixel_buffer_object",
+  "GL_NV_pixel_data_range",
+  "GL_NV_platform_binary",
+  "GL_NV_point_sprite",
+  "GL_NV_present_video",
+  "GL_NV_primitive_restart",
+  "GL_NV_read_buffer",
+  "GL_NV_read_buffer_front",
+  "GL_NV_register_combiners",
+  "GL_NV_register_combiners2",
+  "GL_NV_sRGB_formats",
+  "GL_NV_shader_buffer_load",
+  "GL_NV_shadow_samplers_array",
+  "GL_NV_shadow_samplers_cube",
+  "GL_NV_tessellation_program5",
+  "GL_NV_texgen_emboss",
+  "GL_NV_texgen_reflection",
+  "GL_NV_texture_array",
+  "GL_NV_texture_barrier",
+  "GL_NV_texture_border_clamp",
+  "GL_NV_texture_compression_latc",
+  "GL_NV_texture_compression_s3tc",
+  "GL_NV_texture_env_combine4",
+  "GL_NV_texture_expand_normal",
+  "GL_NV_texture_multisample",
+  "GL_NV_texture_rectangle",
+  "GL_NV_texture_shader",
+  "GL_NV_texture_shader2",
+  "GL_NV_texture_shader3",
+  "GL_NV_transform_feedback",
+  "GL_NV_transform_feedback2",
+  "GL_NV_vdpau_interop",
+  "GL_NV_vertex_array_range",
+  "GL_NV_vertex_array_range2",
+  "GL_NV_vertex_attrib_integer_64bit",
+  "GL_NV_vertex_buffer_unified_memory",
+  "GL_NV_vertex_program",
+  "GL_NV_vertex_program2_option",
+  "GL_NV_vertex_program3",
+  "GL_NV_vertex_program4",
+  "GL_NV_video_capture",
+  "GL_OES_EGL_image_external",
+  "GL_OES_blend_equation_separate",
+  "GL_OES_blend_func_separate",
+  "GL_OES_blend_subtract",
+  "GL_OES_compressed_ETC1_RGB8_texture",
+  "GL_OES_compressed_paletted_texture",
+  "GL_OES_depth_texture",
+  "GL_OES_draw_texture",
+  "GL_OES_element_index_uint",
+  "GL_OES_fbo_render_mipmap",
+  "GL_OES_framebuffer_object",
+  "GL_OES_get_program_binary",
+  "GL_OES_mapbuffer",
+  "GL_OES_matrix_get",
+  "GL_OES_matrix_palette",
+  "GL_OES_packed_depth_stencil",
+  "GL_OES_point_size_array",
+  "GL_OES_point_sprite",
+  "GL_OES_read_format",
+  "GL_OES_required_internalformat",
+  "GL_OES_rgb8_rgba8",
+  "GL_OES_single_precision",
+  "GL_OES_standard_derivatives",
+  "GL_OES_stencil1",
+  "GL_OES_stencil4",
+  "GL_OES_stencil8",
+  "GL_OES_surfaceless_context",
+  "GL_OES_texture_3D",
+  "GL_OES_texture_cube_map",
+  "GL_OES_texture_mirrored_repeat",
+  "GL_OES_vertex_array_object",
+  "GL_OES_vertex_half_float",
+  "GL_OES_vertex_type_10_10_10_2",
+  "GL_OML_interlace",
+  "GL_OML_resample",
+  "GL_OML_subsample",
+  "GL_PGI_misc_hints",
+  "GL_PGI_vertex_hints",
+  "GL_QCOM_alpha_test",
+  "GL_QCOM_binning_control",
+  "GL_QCOM_driver_control",
+  "GL_QCOM_extended_get",
+  "GL_QCOM_extended_get2",
+  "GL_QCOM_perfmon_global_mode",
+  "GL_QCOM_tiled_rendering",
+  "GL_QCOM_writeonly_rendering",
+  "GL_REGAL_ES1_0_compatibility",
+  "GL_REGAL_ES1_1_compatibility",
+  "GL_REGAL_enable",
+  "GL_REGAL_error_string",
+  "GL_REGAL_extension_query",
+  "GL_REGAL_log",
+  "GL_REGAL_proc_address",
+  "GL_REND_screen_coordinates",
+  "GL_S3_s3tc",
+  "GL_SGIS_color_range",
+  "GL_SGIS_detail_texture",
+  "GL_SGIS_fog_function",
+  "GL_SGIS_generate_mipmap",
+  "GL_SGIS_multisample",
+  "GL_SGIS_pixel_texture",
+  "GL_SGIS_point_line_texgen",
+  "GL_SGIS_point_parameters",
+  "GL_SGIS_sharpen_texture",
+  "GL_SGIS_texture4D",
+  "GL_SGIS_texture_border_clamp",
+  "GL_SGIS_texture_color_mask",
+  "GL_SGIS_texture_edge_clamp",
+  "GL_SGIS_texture_filter4",
+  "GL_SGIS_texture_lod",
+  "GL_SGIX_async",
+  "GL_SGIX_async_histogram",
+  "GL_SGIX_async_pixel",
+  "GL_SGIX_blend_alpha_minmax",
+  "GL_SGIX_convolution_accuracy",
+  "GL_SGIX_depth_texture",
+  "GL_SGIX_flush_raster",
+  "GL_SGIX_fog_offset",
+  "GL_SGIX_fog_texture",
+  "GL_SGIX_fragment_lighting",
+  "GL_SGIX_fragment_specular_lighting",
+  "GL_SGIX_framezoom",
+  "GL_SGIX_igloo_interface",
+  "GL_SGIX_instruments",
+  "GL_SGIX_interlace",
+  "GL_SGIX_list_priority",
+  "GL_SGIX_pixel_texture",
+  "GL_SGIX_polynomial_ffd",
+  "GL_SGIX_reference_plane",
+  "GL_SGIX_resample",
+  "GL_SGIX_shadow",
+  "GL_SGIX_shadow_ambient",
+  "GL_SGIX_sprite",
+  "GL_SGIX_tag_sample_buffer",
+  "GL_SGIX_texture_coordinate_clamp",
+  "GL_SGIX_texture_multi_buffer",
+  "GL_SGIX_texture_range",
+  "GL_SGIX_texture_scale_bias",
+  "GL_SGIX_vertex_preclip_hint",
+  "GL_SGIX_ycrcb",
+  "GL_SGI_color_matrix",
+  "GL_SGI_color_table",
+  "GL_SGI_texture_color_table",
+  "GL_SUNX_constant_data",
+  "GL_SUN_convolution_border_modes",
+  "GL_SUN_global_alpha",
+  "GL_SUN_mesh_array",
+  "GL_SUN_read_video_pixels",
+  "GL_SUN_slice_accum",
+  "GL_SUN_triangle_list",
+  "GL_SUN_vertex",
+  "GL_VIV_shader_binary",
+  "GL_WIN_phong_shading",
+  "GL_WIN_specular_fog",
+  "GL_WIN_swap_hint",
+  "WGL_3DL_stereo_control",
+  "WGL_AMD_gpu_association",
+  "WGL_ARB_buffer_region",
+  "WGL_ARB_create_context",
+  "WGL_ARB_create_context_profile",
+  "WGL_ARB_create_context_robustness",
+  "WGL_ARB_extensions_string",
+  "WGL_ARB_framebuffer_sRGB",
+  "WGL_ARB_make_current_read",
+  "WGL_ARB_multisample",
+  "WGL_ARB_pbuffer",
+  "WGL_ARB_pixel_format",
+  "WGL_ARB_pixel_format_float",
+  "WGL_ARB_render_texture",
+  "WGL_ARB_robustness_share_group_isolation",
+  "WGL_ATI_pixel_format_float",
+  "WGL_ATI_render_texture_rectangle",
+  "WGL_EXT_create_context_es2_profile",
+  "WGL_EXT_create_context_es_profile",
+  "WGL_EXT_depth_float",
+  "WGL_EXT_display_color_table",
+  "WGL_EXT_extensions_string",
+  "WGL_EXT_framebuffer_sRGB",
+  "WGL_EXT_make_current_read",
+  "WGL_EXT_multisample",
+  "WGL_EXT_pbuffer",
+  "WGL_EXT_pixel_format",
+  "WGL_EXT_pixel_format_packed_float",
+  "WGL_EXT_swap_control",
+  "WGL_GDI",
+  "WGL_I3D_digital_video_control",
+  "WGL_I3D_gamma",
+  "WGL_I3D_genlock",
+  "WGL_I3D_image_buffer",
+  "WGL_I3D_swap_frame_lock",
+  "WGL_I3D_swap_frame_usage",
+  "WGL_NV_DX_interop",
+  "WGL_NV_copy_image",
+  "WGL_NV_float_buffer",
+  "WGL_NV_gpu_affinity",
+  "WGL_NV_multisample_coverage",
+  "WGL_NV_present_video",
+  "WGL_NV_render_depth_texture",
+  "WGL_NV_render_texture_rectangle",
+  "WGL_NV_swap_group",
+  "WGL_NV_vertex_array_range",
+  "WGL_NV_video_capture",
+  "WGL_NV_video_output",
+  "WGL_OML_sync_control"
+};
+
+const short extensionSeed[665] = {
+  0, 1, 0, -2, 0, 0, 0, 0, 3, 0, -8, 1, -9, 1, 1, 0,
+  0, 0, 0, 1, 1, 1, -13, 0, 0, 0, 1, 1, 2, 1, 0, 0,
+  -16, 0, 0, 0, 2, 0, 1, -23, 4, -27, -34, 0, -35, -36, 0, 0,
+  -37, -39, -42, 0, 1, 3, 0, 0, 0, -45, 1, 3, -47, -48, 0, 2,
+  1, 0, -52, -53, 1, 2, 1, 0, 0, -55, -58, -63, 0, 0, -65, 0,
+  0, 1, 1, -69, -71, 2, -77, 1, 3, 0, -82, 0, 0, 0, 0, 0,
+  2, 1, 0, 0, -86, 0, 0, 1, -87, -88, 0, 0, 0, -89, -90, 1,
+  -95, 0, -96, 0, 1, -98, 0, 0, 0, 0, -99, -101, 0, 0, -102, -105,
+  2, 2, 0, 1, 0, -109, 0, 0, 2, -110, -113, -114, 2, -117, 0, -120,
+  0, 3, 0, -123, 1, 0, 5, 1, -125, 0, 2, 3, 3, 10, -129, 3,
+  -131, -136, 0, 1, -142, -145, -146, -151, 1, 1, 5, 0, -153, 0, -155, 0,
+  -156, -157, 0, 0, -160, 0, -166, 0, 4, 3, 0, 1, 1, -167, -170, -174,
+  -177, -178, -189, 0, 0, -193, -196, 0, 0, -204, 2, -207, 0, 3, 0, -212,
+  0, 0, 0, -213, 0, 1, 2, 0, 4, 2, 0, 0, 1, 1, 0, 0,
+  -215, 0, 2, -217, 0, 0, 1, 2, 8, 0, -218, 2, 1, 1, -223, 2,
+  0, -225, 0, 0, 0, 0, -234, 2, 1, -235, 0, 2, 2, -236, 0, 0,
+  0, 0, -237, 2, 0, -238, 1, 0, -240, 0, -241, -244, -249, 2, -250, -252,
+  2, -257, -259, -261, -264, -266, 0, -267, 0, 2, 1, 1, 4, -268, -270, 0,
+  0, 0, 1, 1, -271, 0, 0, 0, 0, -272, -274, 0, 0, 0, 0, -276,
+  0, 0, 0, -277, -278, 0, 0, -280, 6, -283, 0, 0, -285, 3, 0, -286,
+  -288, 0, -293, 2, 4, 1, 0, -294, 2, 0, 1, 1, 0, 0, 2, 4,
+  0, -299, -305, -306, 0, 4, 0, 2, -307, 0, 2, -311, 2, -318, -320, -321,
+  -322, -323, -327, 0, -328, 0, -330, 5, -331, -332, -334, 0, 0, 0, 0, 2,
+  -335, 2, 2, 5, -336, 0, 1, -340, 2, 0, 0, 3, 0, -343, -346, -350,
+  2, -356, 4, -358, -360, 0, 0, -361, 0, -365, 0, 1, 0, 0, 0, -366,
+  0, 1, 7, 0, -372, -376, 0, 6, 2, -382, 0, 1, -384, 2, -389, 2,
+  -391, 0, -395, 0, 0, 1, -399, 0, 0, 0, -402, -409, 0, 0, -412, 4,
+  0, 0, 0, 0, 0, 0, 0, 1, -414, 0, 0, -417, -419, 0, 0, 0,
+  -421, 0, 0, -425, -428, 0, 5, -446, 0, 0, 0, -449, 0, 2, 0, 1,
+  -453, 4, 0, 0, 1, -457, 0, 1, -466, 1, 3, 0, 1, 0, 0, 0,
+  0, -467, -474, -477, 1, 0, 0, 20, 0, -478, 5, 5, -479, 3, 0, 2,
+  0, 20, 2, 0, 0, 0, 1, 0, 0, 10, 0, 11, 0, 3, 3, 0,
+  0, 6, -481, 0, 0, -484, 1, 0, 3, -487, 1, 0, -489, -496, -497, -498,
+  6, 2, 5, 0, 0, 0, -500, -501, 0, 3, 3, 2, 0, -502, -511, 0,
+  0, 6, 0, 2, 0, 35, 0, -512, 0, -518, 0, -520, 0, 0, 1, -524,
+  -528, -538, -542, 1, 1, -545, -546, 1, -547, -549, 3, -554, 2, 1, 9, 3,
+  -557, 6, 0, 1, 0, -558, -562, -565, -567, -572, -586, 1, -588, 1, 0, 0,
+  1, -590, 0, 0, 1, 0, 5, 4, 0, -598, 0, -600, 1, 4, -601, -609,
+  -613, -614, 1, -616, 0, 2, -618, 0, 0, 6, 0, -622, 2, -623, -625, 0,
+  -626, -628, 2, 0, -633, 0, 0, 0, -638, -640, 0, -641, 6, 0, 0, -643,
+  6, 13, 1, 0, -646, -649, 1, 3, 0, 0, 19, 1, -655, 7, 0, 0,
+  0, -656, 16, 0, 0, 0, -659, -662, -664
+};
+
+const unsigned short extensionSlot[665] = {
+  608, 607, 367, 223, 615, 11, 134, 96, 603, 317, 167, 426, 428, 16, 661, 53,
+  404, 391, 543, 182, 455, 421, 474, 30, 226, 36, 627, 102, 8, 260, 483, 648,
+  170, 646, 245, 354, 195, 587, 400, 504, 412, 125, 157, 458, 537, 506, 558, 318,
+  476, 183, 290, 268, 651, 488, 35, 377, 40, 647, 275, 463, 613, 2, 601, 573,
+  97, 127, 516, 107, 328, 534, 232, 49, 218, 489, 649, 250, 240, 529, 132, 485,
+  105, 466, 390, 315, 384, 219, 131, 113, 313, 660, 171, 444, 332, 76, 304, 112,
+  359, 225, 13, 239, 9, 154, 274, 368, 74, 531, 518, 70, 322, 452, 540, 550,
+  187, 360, 658, 326, 564, 18, 594, 386, 427, 293, 500, 461, 484, 253, 324, 571,
+  215, 109, 28, 422, 233, 657, 259, 162, 229, 578, 611, 432, 617, 656, 246, 176,
+  334, 75, 169, 623, 234, 409, 305, 286, 451, 42, 130, 496, 256, 197, 448, 347,
+  147, 136, 205, 424, 15, 306, 370, 459, 449, 456, 559, 43, 151, 114, 120, 614,
+  610, 25, 278, 446, 168, 39, 57, 164, 78, 655, 511, 438, 172, 56, 639, 508,
+  408, 440, 52, 393, 294, 583, 436, 527, 330, 473, 397, 602, 465, 566, 557, 194,
+  499, 469, 82, 507, 69, 192, 282, 664, 336, 217, 211, 528, 374, 335, 4, 515,
+  410, 634, 89, 321, 576, 593, 591, 222, 567, 513, 54, 547, 453, 486, 365, 166,
+  160, 68, 633, 311, 509, 650, 612, 584, 236, 341, 200, 477, 577, 582, 521, 373,
+  375, 645, 353, 385, 126, 475, 73, 83, 524, 364, 443, 320, 622, 575, 626, 556,
+  546, 266, 150, 152, 579, 429, 108, 22, 478, 460, 517, 277, 285, 445, 99, 544,
+  230, 519, 553, 344, 434, 467, 522, 349, 619, 457, 77, 32, 0, 356, 206, 495,
+  501, 415, 411, 163, 316, 273, 55, 180, 3, 482, 175, 414, 88, 271, 468, 178,
+  441, 12, 283, 284, 616, 221, 201, 447, 10, 103, 94, 604, 628, 303, 196, 430,
+  264, 560, 586, 258, 598, 490, 21, 342, 143, 401, 7, 419, 472, 618, 640, 302,
+  158, 174, 23, 431, 156, 505, 574, 138, 237, 115, 31, 361, 416, 216, 554, 562,
+  129, 63, 193, 91, 512, 209, 343, 319, 71, 254, 62, 38, 339, 542, 406, 662,
+  155, 80, 207, 487, 133, 439, 481, 122, 644, 128, 228, 145, 188, 621, 203, 549,
+  159, 67, 248, 492, 394, 144, 227, 58, 624, 184, 1, 139, 372, 61, 34, 279,
+  33, 351, 214, 541, 362, 340, 310, 179, 243, 338, 173, 471, 79, 142, 101, 585,
+  213, 592, 589, 536, 398, 580, 261, 435, 363, 636, 329, 252, 532, 355, 199, 244,
+  348, 450, 357, 153, 314, 605, 491, 423, 92, 189, 190, 263, 420, 60, 539, 510,
+  20, 641, 14, 331, 90, 535, 413, 123, 630, 595, 272, 270, 308, 269, 41, 117,
+  561, 298, 140, 629, 5, 525, 392, 358, 86, 659, 116, 381, 247, 563, 526, 251,
+  379, 620, 523, 425, 165, 402, 47, 352, 437, 296, 19, 220, 653, 110, 121, 312,
+  26, 600, 480, 141, 545, 538, 599, 382, 502, 464, 307, 378, 551, 588, 625, 337,
+  470, 66, 98, 241, 520, 124, 29, 148, 276, 235, 45, 280, 249, 24, 533, 111,
+  242, 631, 590, 81, 72, 281, 48, 309, 289, 350, 6, 462, 204, 642, 181, 396,
+  366, 380, 572, 295, 643, 291, 654, 635, 301, 333, 403, 161, 191, 323, 369, 376,
+  548, 95, 104, 570, 407, 137, 371, 493, 388, 87, 292, 208, 118, 44, 212, 399,
+  387, 238, 345, 287, 231, 581, 135, 267, 300, 100, 65, 597, 652, 596, 417, 418,
+  395, 265, 177, 530, 202, 498, 454, 433, 46, 84, 325, 185, 85, 606, 503, 494,
+  638, 255, 552, 37, 149, 637, 119, 555, 198, 663, 93, 146, 64, 569, 389, 27,
+  106, 50, 609, 224, 299, 186, 442, 262, 405, 210, 288, 257, 514, 568, 383, 17,
+  51, 497, 479, 346, 59, 297, 327, 565, 632
+};
+
+size_t
+ContextInfo::extensionIndex(const char *ext)
 {
-  return stringSet.find(val)!=stringSet.end();
+  return Lookup::NameIndex(ext, extensionNames, extensionSeed, extensionSlot, 665);
+}
+
+const char *
+ContextInfo::extensionName(const size_t i)
+{
+  return i<665 ? extensionNames[i] : NULL;
 }
 
 bool
@@ -1773,682 +1865,1375 @@ ContextInfo::getExtension(const char *ext) const
 {
   Internal("ContextInfo::getExtension ",boost::print::quote(ext,'"'));
 
-  if (!strcmp(ext,"GL_3DFX_multisample"))                      return gl_3dfx_multisample;
-  if (!strcmp(ext,"GL_3DFX_tbuffer"))                          return gl_3dfx_tbuffer;
-  if (!strcmp(ext,"GL_3DFX_texture_compression_FXT1"))         return gl_3dfx_texture_compression_fxt1;
-  if (!strcmp(ext,"GL_AMD_blend_minmax_factor"))               return gl_amd_blend_minmax_factor;
-  if (!strcmp(ext,"GL_AMD_compressed_3DC_texture"))            return gl_amd_compressed_3dc_texture;
-  if (!strcmp(ext,"GL_AMD_compressed_ATC_texture"))            return gl_amd_compressed_atc_texture;
-  if (!strcmp(ext,"GL_AMD_debug_output"))                      return gl_amd_debug_output;
-  if (!strcmp(ext,"GL_AMD_depth_clamp_separate"))              return gl_amd_depth_clamp_separate;
-  if (!strcmp(ext,"GL_AMD_draw_buffers_blend"))                return gl_amd_draw_buffers_blend;
-  if (!strcmp(ext,"GL_AMD_interleaved_elements"))              return gl_amd_interleaved_elements;
-  if (!strcmp(ext,"GL_AMD_multi_draw_indirect"))               return gl_amd_multi_draw_indirect;
-  if (!strcmp(ext,"GL_AMD_name_gen_delete"))                   return gl_amd_name_gen_delete;
-  if (!strcmp(ext,"GL_AMD_performance_monitor"))               return gl_amd_performance_monitor;
-  if (!strcmp(ext,"GL_AMD_pinned_memory"))                     return gl_amd_pinned_memory;
-  if (!strcmp(ext,"GL_AMD_program_binary_Z400"))               return gl_amd_program_binary_z400;
-  if (!strcmp(ext,"GL_AMD_query_buffer_object"))               return gl_amd_query_buffer_object;
-  if (!strcmp(ext,"GL_AMD_sample_positions"))                  return gl_amd_sample_positions;
-  if (!strcmp(ext,"GL_AMD_seamless_cubemap_per_texture"))      return gl_amd_seamless_cubemap_per_texture;
-  if (!strcmp(ext,"GL_AMD_sparse_texture"))                    return gl_amd_sparse_texture;
-  if (!strcmp(ext,"GL_AMD_stencil_operation_extended"))        return gl_amd_stencil_operation_extended;
-  if (!strcmp(ext,"GL_AMD_vertex_shader_tessellator"))         return gl_amd_vertex_shader_tessellator;
-  if (!strcmp(ext,"GL_ANGLE_framebuffer_blit"))                return gl_angle_framebuffer_blit;
-  if (!strcmp(ext,"GL_ANGLE_framebuffer_multisample"))         return gl_angle_framebuffer_multisample;
-  if (!strcmp(ext,"GL_ANGLE_instanced_arrays"))                return gl_angle_instanced_arrays;
-  if (!strcmp(ext,"GL_ANGLE_pack_reverse_row_order"))          return gl_angle_pack_reverse_row_order;
-  if (!strcmp(ext,"GL_ANGLE_program_binary"))                  return gl_angle_program_binary;
-  if (!strcmp(ext,"GL_ANGLE_texture_compression_dxt1"))        return gl_angle_texture_compression_dxt1;
-  if (!strcmp(ext,"GL_ANGLE_texture_compression_dxt3"))        return gl_angle_texture_compression_dxt3;
-  if (!strcmp(ext,"GL_ANGLE_texture_compression_dxt5"))        return gl_angle_texture_compression_dxt5;
-  if (!strcmp(ext,"GL_ANGLE_texture_usage"))                   return gl_angle_texture_usage;
-  if (!strcmp(ext,"GL_ANGLE_timer_query"))                     return gl_angle_timer_query;
-  if (!strcmp(ext,"GL_ANGLE_translated_shader_source"))        return gl_angle_translated_shader_source;
-  if (!strcmp(ext,"GL_APPLE_aux_depth_stencil"))               return gl_apple_aux_depth_stencil;
-  if (!strcmp(ext,"GL_APPLE_client_storage"))                  return gl_apple_client_storage;
-  if (!strcmp(ext,"GL_APPLE_copy_texture_levels"))             return gl_apple_copy_texture_levels;
-  if (!strcmp(ext,"GL_APPLE_element_array"))                   return gl_apple_element_array;
-  if (!strcmp(ext,"GL_APPLE_fence"))                           return gl_apple_fence;
-  if (!strcmp(ext,"GL_APPLE_float_pixels"))                    return gl_apple_float_pixels;
-  if (!strcmp(ext,"GL_APPLE_flush_buffer_range"))              return gl_apple_flush_buffer_range;
-  if (!strcmp(ext,"GL_APPLE_flush_render"))                    return gl_apple_flush_render;
-  if (!strcmp(ext,"GL_APPLE_framebuffer_multisample"))         return gl_apple_framebuffer_multisample;
-  if (!strcmp(ext,"GL_APPLE_object_purgeable"))                return gl_apple_object_purgeable;
-  if (!strcmp(ext,"GL_APPLE_pixel_buffer"))                    return gl_apple_pixel_buffer;
-  if (!strcmp(ext,"GL_APPLE_rgb_422"))                         return gl_apple_rgb_422;
-  if (!strcmp(ext,"GL_APPLE_row_bytes"))                       return gl_apple_row_bytes;
-  if (!strcmp(ext,"GL_APPLE_specular_vector"))                 return gl_apple_specular_vector;
-  if (!strcmp(ext,"GL_APPLE_sync"))                            return gl_apple_sync;
-  if (!strcmp(ext,"GL_APPLE_texture_max_level"))               return gl_apple_texture_max_level;
-  if (!strcmp(ext,"GL_APPLE_texture_range"))                   return gl_apple_texture_range;
-  if (!strcmp(ext,"GL_APPLE_transform_hint"))                  return gl_apple_transform_hint;
-  if (!strcmp(ext,"GL_APPLE_vertex_array_object"))             return gl_apple_vertex_array_object;
-  if (!strcmp(ext,"GL_APPLE_vertex_array_range"))              return gl_apple_vertex_array_range;
-  if (!strcmp(ext,"GL_APPLE_vertex_program_evaluators"))       return gl_apple_vertex_program_evaluators;
-  if (!strcmp(ext,"GL_APPLE_ycbcr_422"))                       return gl_apple_ycbcr_422;
-  if (!strcmp(ext,"GL_ARB_ES2_compatibility"))                 return gl_arb_es2_compatibility;
-  if (!strcmp(ext,"GL_ARB_ES3_compatibility"))                 return gl_arb_es3_compatibility;
-  if (!strcmp(ext,"GL_ARB_base_instance"))                     return gl_arb_base_instance;
-  if (!strcmp(ext,"GL_ARB_bindless_texture"))                  return gl_arb_bindless_texture;
-  if (!strcmp(ext,"GL_ARB_blend_func_extended"))               return gl_arb_blend_func_extended;
-  if (!strcmp(ext,"GL_ARB_buffer_storage"))                    return gl_arb_buffer_storage;
-  if (!strcmp(ext,"GL_ARB_cl_event"))                          return gl_arb_cl_event;
-  if (!strcmp(ext,"GL_ARB_clear_buffer_object"))               return gl_arb_clear_buffer_object;
-  if (!strcmp(ext,"GL_ARB_clear_texture"))                     return gl_arb_clear_texture;
-  if (!strcmp(ext,"GL_ARB_color_buffer_float"))                return gl_arb_color_buffer_float;
-  if (!strcmp(ext,"GL_ARB_compressed_texture_pixel_storage"))  return gl_arb_compressed_texture_pixel_storage;
-  if (!strcmp(ext,"GL_ARB_compute_shader"))                    return gl_arb_compute_shader;
-  if (!strcmp(ext,"GL_ARB_compute_variable_group_size"))       return gl_arb_compute_variable_group_size;
-  if (!strcmp(ext,"GL_ARB_copy_buffer"))                       return gl_arb_copy_buffer;
-  if (!strcmp(ext,"GL_ARB_copy_image"))                        return gl_arb_copy_image;
-  if (!strcmp(ext,"GL_ARB_debug_output"))                      return gl_arb_debug_output;
-  if (!strcmp(ext,"GL_ARB_depth_buffer_float"))                return gl_arb_depth_buffer_float;
-  if (!strcmp(ext,"GL_ARB_depth_clamp"))                       return gl_arb_depth_clamp;
-  if (!strcmp(ext,"GL_ARB_depth_texture"))                     return gl_arb_depth_texture;
-  if (!strcmp(ext,"GL_ARB_draw_buffers"))                      return gl_arb_draw_buffers;
-  if (!strcmp(ext,"GL_ARB_draw_buffers_blend"))                return gl_arb_draw_buffers_blend;
-  if (!strcmp(ext,"GL_ARB_draw_elements_base_vertex"))         return gl_arb_draw_elements_base_vertex;
-  if (!strcmp(ext,"GL_ARB_draw_indirect"))                     return gl_arb_draw_indirect;
-  if (!strcmp(ext,"GL_ARB_draw_instanced"))                    return gl_arb_draw_instanced;
-  if (!strcmp(ext,"GL_ARB_enhanced_layouts"))                  return gl_arb_enhanced_layouts;
-  if (!strcmp(ext,"GL_ARB_explicit_uniform_location"))         return gl_arb_explicit_uniform_location;
-  if (!strcmp(ext,"GL_ARB_fragment_program"))                  return gl_arb_fragment_program;
-  if (!strcmp(ext,"GL_ARB_fragment_shader"))                   return gl_arb_fragment_shader;
-  if (!strcmp(ext,"GL_ARB_framebuffer_no_attachments"))        return gl_arb_framebuffer_no_attachments;
-  if (!strcmp(ext,"GL_ARB_framebuffer_object"))                return gl_arb_framebuffer_object;
-  if (!strcmp(ext,"GL_ARB_framebuffer_sRGB"))                  return gl_arb_framebuffer_srgb;
-  if (!strcmp(ext,"GL_ARB_geometry_shader4"))                  return gl_arb_geometry_shader4;
-  if (!strcmp(ext,"GL_ARB_get_program_binary"))                return gl_arb_get_program_binary;
-  if (!strcmp(ext,"GL_ARB_gpu_shader5"))                       return gl_arb_gpu_shader5;
-  if (!strcmp(ext,"GL_ARB_gpu_shader_fp64"))                   return gl_arb_gpu_shader_fp64;
-  if (!strcmp(ext,"GL_ARB_half_float_pixel"))                  return gl_arb_half_float_pixel;
-  if (!strcmp(ext,"GL_ARB_half_float_vertex"))                 return gl_arb_half_float_vertex;
-  if (!strcmp(ext,"GL_ARB_imaging"))                           return gl_arb_imaging;
-  if (!strcmp(ext,"GL_ARB_indirect_parameters"))               return gl_arb_indirect_parameters;
-  if (!strcmp(ext,"GL_ARB_instanced_arrays"))                  return gl_arb_instanced_arrays;
-  if (!strcmp(ext,"GL_ARB_internalformat_query"))              return gl_arb_internalformat_query;
-  if (!strcmp(ext,"GL_ARB_internalformat_query2"))             return gl_arb_internalformat_query2;
-  if (!strcmp(ext,"GL_ARB_invalidate_subdata"))                return gl_arb_invalidate_subdata;
-  if (!strcmp(ext,"GL_ARB_map_buffer_alignment"))              return gl_arb_map_buffer_alignment;
-  if (!strcmp(ext,"GL_ARB_map_buffer_range"))                  return gl_arb_map_buffer_range;
-  if (!strcmp(ext,"GL_ARB_matrix_palette"))                    return gl_arb_matrix_palette;
-  if (!strcmp(ext,"GL_ARB_multi_bind"))                        return gl_arb_multi_bind;
-  if (!strcmp(ext,"GL_ARB_multi_draw_indirect"))               return gl_arb_multi_draw_indirect;
-  if (!strcmp(ext,"GL_ARB_multisample"))                       return gl_arb_multisample;
-  if (!strcmp(ext,"GL_ARB_multitexture"))                      return gl_arb_multitexture;
-  if (!strcmp(ext,"GL_ARB_occlusion_query"))                   return gl_arb_occlusion_query;
-  if (!strcmp(ext,"GL_ARB_occlusion_query2"))                  return gl_arb_occlusion_query2;
-  if (!strcmp(ext,"GL_ARB_pixel_buffer_object"))               return gl_arb_pixel_buffer_object;
-  if (!strcmp(ext,"GL_ARB_point_parameters"))                  return gl_arb_point_parameters;
-  if (!strcmp(ext,"GL_ARB_point_sprite"))                      return gl_arb_point_sprite;
-  if (!strcmp(ext,"GL_ARB_program_interface_query"))           return gl_arb_program_interface_query;
-  if (!strcmp(ext,"GL_ARB_provoking_vertex"))                  return gl_arb_provoking_vertex;
-  if (!strcmp(ext,"GL_ARB_query_buffer_object"))               return gl_arb_query_buffer_object;
-  if (!strcmp(ext,"GL_ARB_robustness"))                        return gl_arb_robustness;
-  if (!strcmp(ext,"GL_ARB_sample_shading"))                    return gl_arb_sample_shading;
-  if (!strcmp(ext,"GL_ARB_sampler_objects"))                   return gl_arb_sampler_objects;
-  if (!strcmp(ext,"GL_ARB_seamless_cube_map"))                 return gl_arb_seamless_cube_map;
-  if (!strcmp(ext,"GL_ARB_separate_shader_objects"))           return gl_arb_separate_shader_objects;
-  if (!strcmp(ext,"GL_ARB_shader_atomic_counters"))            return gl_arb_shader_atomic_counters;
-  if (!strcmp(ext,"GL_ARB_shader_image_load_store"))           return gl_arb_shader_image_load_store;
-  if (!strcmp(ext,"GL_ARB_shader_objects"))                    return gl_arb_shader_objects;
-  if (!strcmp(ext,"GL_ARB_shader_storage_buffer_object"))      return gl_arb_shader_storage_buffer_object;
-  if (!strcmp(ext,"GL_ARB_shader_subroutine"))                 return gl_arb_shader_subroutine;
-  if (!strcmp(ext,"GL_ARB_shading_language_100"))              return gl_arb_shading_language_100;
-  if (!strcmp(ext,"GL_ARB_shading_language_include"))          return gl_arb_shading_language_include;
-  if (!strcmp(ext,"GL_ARB_shadow"))                            return gl_arb_shadow;
-  if (!strcmp(ext,"GL_ARB_shadow_ambient"))                    return gl_arb_shadow_ambient;
-  if (!strcmp(ext,"GL_ARB_sparse_texture"))                    return gl_arb_sparse_texture;
-  if (!strcmp(ext,"GL_ARB_stencil_texturing"))                 return gl_arb_stencil_texturing;
-  if (!strcmp(ext,"GL_ARB_sync"))                              return gl_arb_sync;
-  if (!strcmp(ext,"GL_ARB_tessellation_shader"))               return gl_arb_tessellation_shader;
-  if (!strcmp(ext,"GL_ARB_texture_border_clamp"))              return gl_arb_texture_border_clamp;
-  if (!strcmp(ext,"GL_ARB_texture_buffer_object"))             return gl_arb_texture_buffer_object;
-  if (!strcmp(ext,"GL_ARB_texture_buffer_range"))              return gl_arb_texture_buffer_range;
-  if (!strcmp(ext,"GL_ARB_texture_compression"))               return gl_arb_texture_compression;
-  if (!strcmp(ext,"GL_ARB_texture_compression_bptc"))          return gl_arb_texture_compression_bptc;
-  if (!strcmp(ext,"GL_ARB_texture_compression_rgtc"))          return gl_arb_texture_compression_rgtc;
-  if (!strcmp(ext,"GL_ARB_texture_cube_map"))                  return gl_arb_texture_cube_map;
-  if (!strcmp(ext,"GL_ARB_texture_cube_map_array"))            return gl_arb_texture_cube_map_array;
-  if (!strcmp(ext,"GL_ARB_texture_env_combine"))               return gl_arb_texture_env_combine;
-  if (!strcmp(ext,"GL_ARB_texture_env_dot3"))                  return gl_arb_texture_env_dot3;
-  if (!strcmp(ext,"GL_ARB_texture_float"))                     return gl_arb_texture_float;
-  if (!strcmp(ext,"GL_ARB_texture_gather"))                    return gl_arb_texture_gather;
-  if (!strcmp(ext,"GL_ARB_texture_mirror_clamp_to_edge"))      return gl_arb_texture_mirror_clamp_to_edge;
-  if (!strcmp(ext,"GL_ARB_texture_mirrored_repeat"))           return gl_arb_texture_mirrored_repeat;
-  if (!strcmp(ext,"GL_ARB_texture_multisample"))               return gl_arb_texture_multisample;
-  if (!strcmp(ext,"GL_ARB_texture_rectangle"))                 return gl_arb_texture_rectangle;
-  if (!strcmp(ext,"GL_ARB_texture_rg"))                        return gl_arb_texture_rg;
-  if (!strcmp(ext,"GL_ARB_texture_rgb10_a2ui"))                return gl_arb_texture_rgb10_a2ui;
-  if (!strcmp(ext,"GL_ARB_texture_storage"))                   return gl_arb_texture_storage;
-  if (!strcmp(ext,"GL_ARB_texture_storage_multisample"))       return gl_arb_texture_storage_multisample;
-  if (!strcmp(ext,"GL_ARB_texture_swizzle"))                   return gl_arb_texture_swizzle;
-  if (!strcmp(ext,"GL_ARB_texture_view"))                      return gl_arb_texture_view;
-  if (!strcmp(ext,"GL_ARB_timer_query"))                       return gl_arb_timer_query;
-  if (!strcmp(ext,"GL_ARB_transform_feedback2"))               return gl_arb_transform_feedback2;
-  if (!strcmp(ext,"GL_ARB_transform_feedback3"))               return gl_arb_transform_feedback3;
-  if (!strcmp(ext,"GL_ARB_transform_feedback_instanced"))      return gl_arb_transform_feedback_instanced;
-  if (!strcmp(ext,"GL_ARB_transpose_matrix"))                  return gl_arb_transpose_matrix;
-  if (!strcmp(ext,"GL_ARB_uniform_buffer_object"))             return gl_arb_uniform_buffer_object;
-  if (!strcmp(ext,"GL_ARB_vertex_array_object"))               return gl_arb_vertex_array_object;
-  if (!strcmp(ext,"GL_ARB_vertex_attrib_64bit"))               return gl_arb_vertex_attrib_64bit;
-  if (!strcmp(ext,"GL_ARB_vertex_attrib_binding"))             return gl_arb_vertex_attrib_binding;
-  if (!strcmp(ext,"GL_ARB_vertex_blend"))                      return gl_arb_vertex_blend;
-  if (!strcmp(ext,"GL_ARB_vertex_buffer_object"))              return gl_arb_vertex_buffer_object;
-  if (!strcmp(ext,"GL_ARB_vertex_program"))                    return gl_arb_vertex_program;
-  if (!strcmp(ext,"GL_ARB_vertex_shader"))                     return gl_arb_vertex_shader;
-  if (!strcmp(ext,"GL_ARB_vertex_type_2_10_10_10_rev"))        return gl_arb_vertex_type_2_10_10_10_rev;
-  if (!strcmp(ext,"GL_ARB_viewport_array"))                    return gl_arb_viewport_array;
-  if (!strcmp(ext,"GL_ARB_window_pos"))                        return gl_arb_window_pos;
-  if (!strcmp(ext,"GL_ARM_mali_program_binary"))               return gl_arm_mali_program_binary;
-  if (!strcmp(ext,"GL_ARM_mali_shader_binary"))                return gl_arm_mali_shader_binary;
-  if (!strcmp(ext,"GL_ATI_draw_buffers"))                      return gl_ati_draw_buffers;
-  if (!strcmp(ext,"GL_ATI_element_array"))                     return gl_ati_element_array;
-  if (!strcmp(ext,"GL_ATI_envmap_bumpmap"))                    return gl_ati_envmap_bumpmap;
-  if (!strcmp(ext,"GL_ATI_fragment_shader"))                   return gl_ati_fragment_shader;
-  if (!strcmp(ext,"GL_ATI_map_object_buffer"))                 return gl_ati_map_object_buffer;
-  if (!strcmp(ext,"GL_ATI_meminfo"))                           return gl_ati_meminfo;
-  if (!strcmp(ext,"GL_ATI_pn_triangles"))                      return gl_ati_pn_triangles;
-  if (!strcmp(ext,"GL_ATI_separate_stencil"))                  return gl_ati_separate_stencil;
-  if (!strcmp(ext,"GL_ATI_text_fragment_shader"))              return gl_ati_text_fragment_shader;
-  if (!strcmp(ext,"GL_ATI_texture_compression_3dc"))           return gl_ati_texture_compression_3dc;
-  if (!strcmp(ext,"GL_ATI_texture_env_combine3"))              return gl_ati_texture_env_combine3;
-  if (!strcmp(ext,"GL_ATI_texture_float"))                     return gl_ati_texture_float;
-  if (!strcmp(ext,"GL_ATI_texture_mirror_once"))               return gl_ati_texture_mirror_once;
-  if (!strcmp(ext,"GL_ATI_vertex_array_object"))               return gl_ati_vertex_array_object;
-  if (!strcmp(ext,"GL_ATI_vertex_attrib_array_object"))        return gl_ati_vertex_attrib_array_object;
-  if (!strcmp(ext,"GL_ATI_vertex_streams"))                    return gl_ati_vertex_streams;
-  if (!strcmp(ext,"GL_DMP_shader_binary"))                     return gl_dmp_shader_binary;
-  if (!strcmp(ext,"GL_EXT_422_pixels"))                        return gl_ext_422_pixels;
-  if (!strcmp(ext,"GL_EXT_Cg_shader"))                         return gl_ext_cg_shader;
-  if (!strcmp(ext,"GL_EXT_abgr"))                              return gl_ext_abgr;
-  if (!strcmp(ext,"GL_EXT_bgra"))                              return gl_ext_bgra;
-  if (!strcmp(ext,"GL_EXT_bindable_uniform"))                  return gl_ext_bindable_uniform;
-  if (!strcmp(ext,"GL_EXT_blend_color"))                       return gl_ext_blend_color;
-  if (!strcmp(ext,"GL_EXT_blend_equation_separate"))           return gl_ext_blend_equation_separate;
-  if (!strcmp(ext,"GL_EXT_blend_func_separate"))               return gl_ext_blend_func_separate;
-  if (!strcmp(ext,"GL_EXT_blend_minmax"))                      return gl_ext_blend_minmax;
-  if (!strcmp(ext,"GL_EXT_blend_subtract"))                    return gl_ext_blend_subtract;
-  if (!strcmp(ext,"GL_EXT_clip_volume_hint"))                  return gl_ext_clip_volume_hint;
-  if (!strcmp(ext,"GL_EXT_cmyka"))                             return gl_ext_cmyka;
-  if (!strcmp(ext,"GL_EXT_color_buffer_half_float"))           return gl_ext_color_buffer_half_float;
-  if (!strcmp(ext,"GL_EXT_color_subtable"))                    return gl_ext_color_subtable;
-  if (!strcmp(ext,"GL_EXT_compiled_vertex_array"))             return gl_ext_compiled_vertex_array;
-  if (!strcmp(ext,"GL_EXT_convolution"))                       return gl_ext_convolution;
-  if (!strcmp(ext,"GL_EXT_coordinate_frame"))                  return gl_ext_coordinate_frame;
-  if (!strcmp(ext,"GL_EXT_copy_texture"))                      return gl_ext_copy_texture;
-  if (!strcmp(ext,"GL_EXT_cull_vertex"))                       return gl_ext_cull_vertex;
-  if (!strcmp(ext,"GL_EXT_debug_label"))                       return gl_ext_debug_label;
-  if (!strcmp(ext,"GL_EXT_debug_marker"))                      return gl_ext_debug_marker;
-  if (!strcmp(ext,"GL_EXT_depth_bounds_test"))                 return gl_ext_depth_bounds_test;
-  if (!strcmp(ext,"GL_EXT_direct_state_access"))               return gl_ext_direct_state_access;
-  if (!strcmp(ext,"GL_EXT_discard_framebuffer"))               return gl_ext_discard_framebuffer;
-  if (!strcmp(ext,"GL_EXT_disjoint_timer_query"))              return gl_ext_disjoint_timer_query;
-  if (!strcmp(ext,"GL_EXT_draw_buffers2"))                     return gl_ext_draw_buffers2;
-  if (!strcmp(ext,"GL_EXT_draw_instanced"))                    return gl_ext_draw_instanced;
-  if (!strcmp(ext,"GL_EXT_draw_range_elements"))               return gl_ext_draw_range_elements;
-  if (!strcmp(ext,"GL_EXT_fog_coord"))                         return gl_ext_fog_coord;
-  if (!strcmp(ext,"GL_EXT_fragment_lighting"))                 return gl_ext_fragment_lighting;
-  if (!strcmp(ext,"GL_EXT_framebuffer_blit"))                  return gl_ext_framebuffer_blit;
-  if (!strcmp(ext,"GL_EXT_framebuffer_multisample"))           return gl_ext_framebuffer_multisample;
-  if (!strcmp(ext,"GL_EXT_framebuffer_multisample_blit_scaled")) return gl_ext_framebuffer_multisample_blit_scaled;
-  if (!strcmp(ext,"GL_EXT_framebuffer_object"))                return gl_ext_framebuffer_object;
-  if (!strcmp(ext,"GL_EXT_framebuffer_sRGB"))                  return gl_ext_framebuffer_srgb;
-  if (!strcmp(ext,"GL_EXT_geometry_shader4"))                  return gl_ext_geometry_shader4;
-  if (!strcmp(ext,"GL_EXT_gpu_program_parameters"))            return gl_ext_gpu_program_parameters;
-  if (!strcmp(ext,"GL_EXT_gpu_shader4"))                       return gl_ext_gpu_shader4;
-  if (!strcmp(ext,"GL_EXT_histogram"))                         return gl_ext_histogram;
-  if (!strcmp(ext,"GL_EXT_index_func"))                        return gl_ext_index_func;
-  if (!strcmp(ext,"GL_EXT_index_material"))                    return gl_ext_index_material;
-  if (!strcmp(ext,"GL_EXT_light_texture"))                     return gl_ext_light_texture;
-  if (!strcmp(ext,"GL_EXT_map_buffer_range"))                  return gl_ext_map_buffer_range;
-  if (!strcmp(ext,"GL_EXT_multi_draw_arrays"))                 return gl_ext_multi_draw_arrays;
-  if (!strcmp(ext,"GL_EXT_multisample"))                       return gl_ext_multisample;
-  if (!strcmp(ext,"GL_EXT_multisampled_render_to_texture"))    return gl_ext_multisampled_render_to_texture;
-  if (!strcmp(ext,"GL_EXT_multiview_draw_buffers"))            return gl_ext_multiview_draw_buffers;
-  if (!strcmp(ext,"GL_EXT_occlusion_query_boolean"))           return gl_ext_occlusion_query_boolean;
-  if (!strcmp(ext,"GL_EXT_packed_depth_stencil"))              return gl_ext_packed_depth_stencil;
-  if (!strcmp(ext,"GL_EXT_packed_float"))                      return gl_ext_packed_float;
-  if (!strcmp(ext,"GL_EXT_packed_pixels"))                     return gl_ext_packed_pixels;
-  if (!strcmp(ext,"GL_EXT_paletted_texture"))                  return gl_ext_paletted_texture;
-  if (!strcmp(ext,"GL_EXT_pixel_buffer_object"))               return gl_ext_pixel_buffer_object;
-  if (!strcmp(ext,"GL_EXT_pixel_transform"))                   return gl_ext_pixel_transform;
-  if (!strcmp(ext,"GL_EXT_point_parameters"))                  return gl_ext_point_parameters;
-  if (!strcmp(ext,"GL_EXT_polygon_offset"))                    return gl_ext_polygon_offset;
-  if (!strcmp(ext,"GL_EXT_provoking_vertex"))                  return gl_ext_provoking_vertex;
-  if (!strcmp(ext,"GL_EXT_read_format_bgra"))                  return gl_ext_read_format_bgra;
-  if (!strcmp(ext,"GL_EXT_rescale_normal"))                    return gl_ext_rescale_normal;
-  if (!strcmp(ext,"GL_EXT_robustness"))                        return gl_ext_robustness;
-  if (!strcmp(ext,"GL_EXT_sRGB"))                              return gl_ext_srgb;
-  if (!strcmp(ext,"GL_EXT_scene_marker"))                      return gl_ext_scene_marker;
-  if (!strcmp(ext,"GL_EXT_secondary_color"))                   return gl_ext_secondary_color;
-  if (!strcmp(ext,"GL_EXT_separate_shader_objects"))           return gl_ext_separate_shader_objects;
-  if (!strcmp(ext,"GL_EXT_separate_specular_color"))           return gl_ext_separate_specular_color;
-  if (!strcmp(ext,"GL_EXT_shader_framebuffer_fetch"))          return gl_ext_shader_framebuffer_fetch;
-  if (!strcmp(ext,"GL_EXT_shader_image_load_store"))           return gl_ext_shader_image_load_store;
-  if (!strcmp(ext,"GL_EXT_shadow_samplers"))                   return gl_ext_shadow_samplers;
-  if (!strcmp(ext,"GL_EXT_shared_texture_palette"))            return gl_ext_shared_texture_palette;
-  if (!strcmp(ext,"GL_EXT_stencil_clear_tag"))                 return gl_ext_stencil_clear_tag;
-  if (!strcmp(ext,"GL_EXT_stencil_two_side"))                  return gl_ext_stencil_two_side;
-  if (!strcmp(ext,"GL_EXT_stencil_wrap"))                      return gl_ext_stencil_wrap;
-  if (!strcmp(ext,"GL_EXT_subtexture"))                        return gl_ext_subtexture;
-  if (!strcmp(ext,"GL_EXT_texture"))                           return gl_ext_texture;
-  if (!strcmp(ext,"GL_EXT_texture3D"))                         return gl_ext_texture3d;
-  if (!strcmp(ext,"GL_EXT_texture_array"))                     return gl_ext_texture_array;
-  if (!strcmp(ext,"GL_EXT_texture_buffer_object"))             return gl_ext_texture_buffer_object;
-  if (!strcmp(ext,"GL_EXT_texture_compression_latc"))          return gl_ext_texture_compression_latc;
-  if (!strcmp(ext,"GL_EXT_texture_compression_rgtc"))          return gl_ext_texture_compression_rgtc;
-  if (!strcmp(ext,"GL_EXT_texture_compression_s3tc"))          return gl_ext_texture_compression_s3tc;
-  if (!strcmp(ext,"GL_EXT_texture_cube_map"))                  return gl_ext_texture_cube_map;
-  if (!strcmp(ext,"GL_EXT_texture_edge_clamp"))                return gl_ext_texture_edge_clamp;
-  if (!strcmp(ext,"GL_EXT_texture_env_combine"))               return gl_ext_texture_env_combine;
-  if (!strcmp(ext,"GL_EXT_texture_env_dot3"))                  return gl_ext_texture_env_dot3;
-  if (!strcmp(ext,"GL_EXT_texture_filter_anisotropic"))        return gl_ext_texture_filter_anisotropic;
-  if (!strcmp(ext,"GL_EXT_texture_format_BGRA8888"))           return gl_ext_texture_format_bgra8888;
-  if (!strcmp(ext,"GL_EXT_texture_integer"))                   return gl_ext_texture_integer;
-  if (!strcmp(ext,"GL_EXT_texture_lod_bias"))                  return gl_ext_texture_lod_bias;
-  if (!strcmp(ext,"GL_EXT_texture_mirror_clamp"))              return gl_ext_texture_mirror_clamp;
-  if (!strcmp(ext,"GL_EXT_texture_object"))                    return gl_ext_texture_object;
-  if (!strcmp(ext,"GL_EXT_texture_perturb_normal"))            return gl_ext_texture_perturb_normal;
-  if (!strcmp(ext,"GL_EXT_texture_rectangle"))                 return gl_ext_texture_rectangle;
-  if (!strcmp(ext,"GL_EXT_texture_rg"))                        return gl_ext_texture_rg;
-  if (!strcmp(ext,"GL_EXT_texture_sRGB"))                      return gl_ext_texture_srgb;
-  if (!strcmp(ext,"GL_EXT_texture_sRGB_decode"))               return gl_ext_texture_srgb_decode;
-  if (!strcmp(ext,"GL_EXT_texture_shared_exponent"))           return gl_ext_texture_shared_exponent;
-  if (!strcmp(ext,"GL_EXT_texture_snorm"))                     return gl_ext_texture_snorm;
-  if (!strcmp(ext,"GL_EXT_texture_storage"))                   return gl_ext_texture_storage;
-  if (!strcmp(ext,"GL_EXT_texture_swizzle"))                   return gl_ext_texture_swizzle;
-  if (!strcmp(ext,"GL_EXT_texture_type_2_10_10_10_REV"))       return gl_ext_texture_type_2_10_10_10_rev;
-  if (!strcmp(ext,"GL_EXT_timer_query"))                       return gl_ext_timer_query;
-  if (!strcmp(ext,"GL_EXT_transform_feedback"))                return gl_ext_transform_feedback;
-  if (!strcmp(ext,"GL_EXT_unpack_subimage"))                   return gl_ext_unpack_subimage;
-  if (!strcmp(ext,"GL_EXT_vertex_array"))                      return gl_ext_vertex_array;
-  if (!strcmp(ext,"GL_EXT_vertex_attrib_64bit"))               return gl_ext_vertex_attrib_64bit;
-  if (!strcmp(ext,"GL_EXT_vertex_shader"))                     return gl_ext_vertex_shader;
-  if (!strcmp(ext,"GL_EXT_vertex_weighting"))                  return gl_ext_vertex_weighting;
-  if (!strcmp(ext,"GL_EXT_x11_sync_object"))                   return gl_ext_x11_sync_object;
-  if (!strcmp(ext,"GL_FJ_shader_binary_GCCSO"))                return gl_fj_shader_binary_gccso;
-  if (!strcmp(ext,"GL_GREMEDY_frame_terminator"))              return gl_gremedy_frame_terminator;
-  if (!strcmp(ext,"GL_GREMEDY_string_marker"))                 return gl_gremedy_string_marker;
-  if (!strcmp(ext,"GL_HP_image_transform"))                    return gl_hp_image_transform;
-  if (!strcmp(ext,"GL_HP_occlusion_test"))                     return gl_hp_occlusion_test;
-  if (!strcmp(ext,"GL_IBM_cull_vertex"))                       return gl_ibm_cull_vertex;
-  if (!strcmp(ext,"GL_IBM_multimode_draw_arrays"))             return gl_ibm_multimode_draw_arrays;
-  if (!strcmp(ext,"GL_IBM_rasterpos_clip"))                    return gl_ibm_rasterpos_clip;
-  if (!strcmp(ext,"GL_IBM_static_data"))                       return gl_ibm_static_data;
-  if (!strcmp(ext,"GL_IBM_texture_mirrored_repeat"))           return gl_ibm_texture_mirrored_repeat;
-  if (!strcmp(ext,"GL_IBM_vertex_array_lists"))                return gl_ibm_vertex_array_lists;
-  if (!strcmp(ext,"GL_IMG_multisampled_render_to_texture"))    return gl_img_multisampled_render_to_texture;
-  if (!strcmp(ext,"GL_IMG_program_binary"))                    return gl_img_program_binary;
-  if (!strcmp(ext,"GL_IMG_read_format"))                       return gl_img_read_format;
-  if (!strcmp(ext,"GL_IMG_shader_binary"))                     return gl_img_shader_binary;
-  if (!strcmp(ext,"GL_IMG_texture_compression_pvrtc"))         return gl_img_texture_compression_pvrtc;
-  if (!strcmp(ext,"GL_IMG_texture_compression_pvrtc2"))        return gl_img_texture_compression_pvrtc2;
-  if (!strcmp(ext,"GL_IMG_texture_env_enhanced_fixed_function")) return gl_img_texture_env_enhanced_fixed_function;
-  if (!strcmp(ext,"GL_IMG_user_clip_plane"))                   return gl_img_user_clip_plane;
-  if (!strcmp(ext,"GL_INGR_blend_func_separate"))              return gl_ingr_blend_func_separate;
-  if (!strcmp(ext,"GL_INGR_color_clamp"))                      return gl_ingr_color_clamp;
-  if (!strcmp(ext,"GL_INGR_interlace_read"))                   return gl_ingr_interlace_read;
-  if (!strcmp(ext,"GL_INTEL_map_texture"))                     return gl_intel_map_texture;
-  if (!strcmp(ext,"GL_INTEL_parallel_arrays"))                 return gl_intel_parallel_arrays;
-  if (!strcmp(ext,"GL_INTEL_texture_scissor"))                 return gl_intel_texture_scissor;
-  if (!strcmp(ext,"GL_KHR_debug"))                             return gl_khr_debug;
-  if (!strcmp(ext,"GL_KHR_texture_compression_astc_ldr"))      return gl_khr_texture_compression_astc_ldr;
-  if (!strcmp(ext,"GL_KTX_buffer_region"))                     return gl_ktx_buffer_region;
-  if (!strcmp(ext,"GL_MESAX_texture_stack"))                   return gl_mesax_texture_stack;
-  if (!strcmp(ext,"GL_MESA_pack_invert"))                      return gl_mesa_pack_invert;
-  if (!strcmp(ext,"GL_MESA_resize_buffers"))                   return gl_mesa_resize_buffers;
-  if (!strcmp(ext,"GL_MESA_window_pos"))                       return gl_mesa_window_pos;
-  if (!strcmp(ext,"GL_MESA_ycbcr_texture"))                    return gl_mesa_ycbcr_texture;
-  if (!strcmp(ext,"GL_NVX_conditional_render"))                return gl_nvx_conditional_render;
-  if (!strcmp(ext,"GL_NVX_gpu_memory_info"))                   return gl_nvx_gpu_memory_info;
-  if (!strcmp(ext,"GL_NV_3dvision_settings"))                  return gl_nv_3dvision_settings;
-  if (!strcmp(ext,"GL_NV_bgr"))                                return gl_nv_bgr;
-  if (!strcmp(ext,"GL_NV_bindless_texture"))                   return gl_nv_bindless_texture;
-  if (!strcmp(ext,"GL_NV_blend_equation_advanced"))            return gl_nv_blend_equation_advanced;
-  if (!strcmp(ext,"GL_NV_blend_square"))                       return gl_nv_blend_square;
-  if (!strcmp(ext,"GL_NV_compute_program5"))                   return gl_nv_compute_program5;
-  if (!strcmp(ext,"GL_NV_conditional_render"))                 return gl_nv_conditional_render;
-  if (!strcmp(ext,"GL_NV_copy_buffer"))                        return gl_nv_copy_buffer;
-  if (!strcmp(ext,"GL_NV_copy_depth_to_color"))                return gl_nv_copy_depth_to_color;
-  if (!strcmp(ext,"GL_NV_copy_image"))                         return gl_nv_copy_image;
-  if (!strcmp(ext,"GL_NV_coverage_sample"))                    return gl_nv_coverage_sample;
-  if (!strcmp(ext,"GL_NV_deep_texture3D"))                     return gl_nv_deep_texture3d;
-  if (!strcmp(ext,"GL_NV_depth_buffer_float"))                 return gl_nv_depth_buffer_float;
-  if (!strcmp(ext,"GL_NV_depth_clamp"))                        return gl_nv_depth_clamp;
-  if (!strcmp(ext,"GL_NV_depth_nonlinear"))                    return gl_nv_depth_nonlinear;
-  if (!strcmp(ext,"GL_NV_depth_range_unclamped"))              return gl_nv_depth_range_unclamped;
-  if (!strcmp(ext,"GL_NV_draw_buffers"))                       return gl_nv_draw_buffers;
-  if (!strcmp(ext,"GL_NV_draw_texture"))                       return gl_nv_draw_texture;
-  if (!strcmp(ext,"GL_NV_evaluators"))                         return gl_nv_evaluators;
-  if (!strcmp(ext,"GL_NV_explicit_multisample"))               return gl_nv_explicit_multisample;
-  if (!strcmp(ext,"GL_NV_fbo_color_attachments"))              return gl_nv_fbo_color_attachments;
-  if (!strcmp(ext,"GL_NV_fence"))                              return gl_nv_fence;
-  if (!strcmp(ext,"GL_NV_float_buffer"))                       return gl_nv_float_buffer;
-  if (!strcmp(ext,"GL_NV_fog_distance"))                       return gl_nv_fog_distance;
-  if (!strcmp(ext,"GL_NV_fragment_program"))                   return gl_nv_fragment_program;
-  if (!strcmp(ext,"GL_NV_fragment_program2"))                  return gl_nv_fragment_program2;
-  if (!strcmp(ext,"GL_NV_framebuffer_blit"))                   return gl_nv_framebuffer_blit;
-  if (!strcmp(ext,"GL_NV_framebuffer_multisample"))            return gl_nv_framebuffer_multisample;
-  if (!strcmp(ext,"GL_NV_framebuffer_multisample_coverage"))   return gl_nv_framebuffer_multisample_coverage;
-  if (!strcmp(ext,"GL_NV_geometry_program4"))                  return gl_nv_geometry_program4;
-  if (!strcmp(ext,"GL_NV_gpu_program4"))                       return gl_nv_gpu_program4;
-  if (!strcmp(ext,"GL_NV_gpu_program5"))                       return gl_nv_gpu_program5;
-  if (!strcmp(ext,"GL_NV_gpu_shader5"))                        return gl_nv_gpu_shader5;
-  if (!strcmp(ext,"GL_NV_half_float"))                         return gl_nv_half_float;
-  if (!strcmp(ext,"GL_NV_instanced_arrays"))                   return gl_nv_instanced_arrays;
-  if (!strcmp(ext,"GL_NV_light_max_exponent"))                 return gl_nv_light_max_exponent;
-  if (!strcmp(ext,"GL_NV_multisample_coverage"))               return gl_nv_multisample_coverage;
-  if (!strcmp(ext,"GL_NV_multisample_filter_hint"))            return gl_nv_multisample_filter_hint;
-  if (!strcmp(ext,"GL_NV_non_square_matrices"))                return gl_nv_non_square_matrices;
-  if (!strcmp(ext,"GL_NV_occlusion_query"))                    return gl_nv_occlusion_query;
-  if (!strcmp(ext,"GL_NV_pack_subimage"))                      return gl_nv_pack_subimage;
-  if (!strcmp(ext,"GL_NV_packed_depth_stencil"))               return gl_nv_packed_depth_stencil;
-  if (!strcmp(ext,"GL_NV_packed_float_linear"))                return gl_nv_packed_float_linear;
-  if (!strcmp(ext,"GL_NV_parameter_buffer_object"))            return gl_nv_parameter_buffer_object;
-  if (!strcmp(ext,"GL_NV_path_rendering"))                     return gl_nv_path_rendering;
-  if (!strcmp(ext,"GL_NV_pixel_buffer_object"))                return gl_nv_pixel_buffer_object;
-  if (!strcmp(ext,"GL_NV_pixel_data_range"))                   return gl_nv_pixel_data_range;
-  if (!strcmp(ext,"GL_NV_platform_binary"))                    return gl_nv_platform_binary;
-  if (!strcmp(ext,"GL_NV_point_sprite"))                       return gl_nv_point_sprite;
-  if (!strcmp(ext,"GL_NV_present_video"))                      return gl_nv_present_video;
-  if (!strcmp(ext,"GL_NV_primitive_restart"))                  return gl_nv_primitive_restart;
-  if (!strcmp(ext,"GL_NV_read_buffer"))                        return gl_nv_read_buffer;
-  if (!strcmp(ext,"GL_NV_read_buffer_front"))                  return gl_nv_read_buffer_front;
-  if (!strcmp(ext,"GL_NV_register_combiners"))                 return gl_nv_register_combiners;
-  if (!strcmp(ext,"GL_NV_register_combiners2"))                return gl_nv_register_combiners2;
-  if (!strcmp(ext,"GL_NV_sRGB_formats"))                       return gl_nv_srgb_formats;
-  if (!strcmp(ext,"GL_NV_shader_buffer_load"))                 return gl_nv_shader_buffer_load;
-  if (!strcmp(ext,"GL_NV_shadow_samplers_array"))              return gl_nv_shadow_samplers_array;
-  if (!strcmp(ext,"GL_NV_shadow_samplers_cube"))               return gl_nv_shadow_samplers_cube;
-  if (!strcmp(ext,"GL_NV_tessellation_program5"))              return gl_nv_tessellation_program5;
-  if (!strcmp(ext,"GL_NV_texgen_emboss"))                      return gl_nv_texgen_emboss;
-  if (!strcmp(ext,"GL_NV_texgen_reflection"))                  return gl_nv_texgen_reflection;
-  if (!strcmp(ext,"GL_NV_texture_array"))                      return gl_nv_texture_array;
-  if (!strcmp(ext,"GL_NV_texture_barrier"))                    return gl_nv_texture_barrier;
-  if (!strcmp(ext,"GL_NV_texture_border_clamp"))               return gl_nv_texture_border_clamp;
-  if (!strcmp(ext,"GL_NV_texture_compression_latc"))           return gl_nv_texture_compression_latc;
-  if (!strcmp(ext,"GL_NV_texture_compression_s3tc"))           return gl_nv_texture_compression_s3tc;
-  if (!strcmp(ext,"GL_NV_texture_env_combine4"))               return gl_nv_texture_env_combine4;
-  if (!strcmp(ext,"GL_NV_texture_expand_normal"))              return gl_nv_texture_expand_normal;
-  if (!strcmp(ext,"GL_NV_texture_multisample"))                return gl_nv_texture_multisample;
-  if (!strcmp(ext,"GL_NV_texture_rectangle"))                  return gl_nv_texture_rectangle;
-  if (!strcmp(ext,"GL_NV_texture_shader"))                     return gl_nv_texture_shader;
-  if (!strcmp(ext,"GL_NV_texture_shader2"))                    return gl_nv_texture_shader2;
-  if (!strcmp(ext,"GL_NV_texture_shader3"))                    return gl_nv_texture_shader3;
-  if (!strcmp(ext,"GL_NV_transform_feedback"))                 return gl_nv_transform_feedback;
-  if (!strcmp(ext,"GL_NV_transform_feedback2"))                return gl_nv_transform_feedback2;
-  if (!strcmp(ext,"GL_NV_vdpau_interop"))                      return gl_nv_vdpau_interop;
-  if (!strcmp(ext,"GL_NV_vertex_array_range"))                 return gl_nv_vertex_array_range;
-  if (!strcmp(ext,"GL_NV_vertex_array_range2"))                return gl_nv_vertex_array_range2;
-  if (!strcmp(ext,"GL_NV_vertex_attrib_integer_64bit"))        return gl_nv_vertex_attrib_integer_64bit;
-  if (!strcmp(ext,"GL_NV_vertex_buffer_unified_memory"))       return gl_nv_vertex_buffer_unified_memory;
-  if (!strcmp(ext,"GL_NV_vertex_program"))                     return gl_nv_vertex_program;
-  if (!strcmp(ext,"GL_NV_vertex_program2_option"))             return gl_nv_vertex_program2_option;
-  if (!strcmp(ext,"GL_NV_vertex_program3"))                    return gl_nv_vertex_program3;
-  if (!strcmp(ext,"GL_NV_vertex_program4"))                    return gl_nv_vertex_program4;
-  if (!strcmp(ext,"GL_NV_video_capture"))                      return gl_nv_video_capture;
-  if (!strcmp(ext,"GL_OES_EGL_image_external"))                return gl_oes_egl_image_external;
-  if (!strcmp(ext,"GL_OES_blend_equation_separate"))           return gl_oes_blend_equation_separate;
-  if (!strcmp(ext,"GL_OES_blend_func_separate"))               return gl_oes_blend_func_separate;
-  if (!strcmp(ext,"GL_OES_blend_subtract"))                    return gl_oes_blend_subtract;
-  if (!strcmp(ext,"GL_OES_compressed_ETC1_RGB8_texture"))      return gl_oes_compressed_etc1_rgb8_texture;
-  if (!strcmp(ext,"GL_OES_compressed_paletted_texture"))       return gl_oes_compressed_paletted_texture;
-  if (!strcmp(ext,"GL_OES_depth_texture"))                     return gl_oes_depth_texture;
-  if (!strcmp(ext,"GL_OES_draw_texture"))                      return gl_oes_draw_texture;
-  if (!strcmp(ext,"GL_OES_element_index_uint"))                return gl_oes_element_index_uint;
-  if (!strcmp(ext,"GL_OES_fbo_render_mipmap"))                 return gl_oes_fbo_render_mipmap;
-  if (!strcmp(ext,"GL_OES_framebuffer_object"))                return gl_oes_framebuffer_object;
-  if (!strcmp(ext,"GL_OES_get_program_binary"))                return gl_oes_get_program_binary;
-  if (!strcmp(ext,"GL_OES_mapbuffer"))                         return gl_oes_mapbuffer;
-  if (!strcmp(ext,"GL_OES_matrix_get"))                        return gl_oes_matrix_get;
-  if (!strcmp(ext,"GL_OES_matrix_palette"))                    return gl_oes_matrix_palette;
-  if (!strcmp(ext,"GL_OES_packed_depth_stencil"))              return gl_oes_packed_depth_stencil;
-  if (!strcmp(ext,"GL_OES_point_size_array"))                  return gl_oes_point_size_array;
-  if (!strcmp(ext,"GL_OES_point_sprite"))                      return gl_oes_point_sprite;
-  if (!strcmp(ext,"GL_OES_read_format"))                       return gl_oes_read_format;
-  if (!strcmp(ext,"GL_OES_required_internalformat"))           return gl_oes_required_internalformat;
-  if (!strcmp(ext,"GL_OES_rgb8_rgba8"))                        return gl_oes_rgb8_rgba8;
-  if (!strcmp(ext,"GL_OES_single_precision"))                  return gl_oes_single_precision;
-  if (!strcmp(ext,"GL_OES_standard_derivatives"))              return gl_oes_standard_derivatives;
-  if (!strcmp(ext,"GL_OES_stencil1"))                          return gl_oes_stencil1;
-  if (!strcmp(ext,"GL_OES_stencil4"))                          return gl_oes_stencil4;
-  if (!strcmp(ext,"GL_OES_stencil8"))                          return gl_oes_stencil8;
-  if (!strcmp(ext,"GL_OES_surfaceless_context"))               return gl_oes_surfaceless_context;
-  if (!strcmp(ext,"GL_OES_texture_3D"))                        return gl_oes_texture_3d;
-  if (!strcmp(ext,"GL_OES_texture_cube_map"))                  return gl_oes_texture_cube_map;
-  if (!strcmp(ext,"GL_OES_texture_mirrored_repeat"))           return gl_oes_texture_mirrored_repeat;
-  if (!strcmp(ext,"GL_OES_vertex_array_object"))               return gl_oes_vertex_array_object;
-  if (!strcmp(ext,"GL_OES_vertex_half_float"))                 return gl_oes_vertex_half_float;
-  if (!strcmp(ext,"GL_OES_vertex_type_10_10_10_2"))            return gl_oes_vertex_type_10_10_10_2;
-  if (!strcmp(ext,"GL_OML_interlace"))                         return gl_oml_interlace;
-  if (!strcmp(ext,"GL_OML_resample"))                          return gl_oml_resample;
-  if (!strcmp(ext,"GL_OML_subsample"))                         return gl_oml_subsample;
-  if (!strcmp(ext,"GL_PGI_misc_hints"))                        return gl_pgi_misc_hints;
-  if (!strcmp(ext,"GL_PGI_vertex_hints"))                      return gl_pgi_vertex_hints;
-  if (!strcmp(ext,"GL_QCOM_alpha_test"))                       return gl_qcom_alpha_test;
-  if (!strcmp(ext,"GL_QCOM_binning_control"))                  return gl_qcom_binning_control;
-  if (!strcmp(ext,"GL_QCOM_driver_control"))                   return gl_qcom_driver_control;
-  if (!strcmp(ext,"GL_QCOM_extended_get"))                     return gl_qcom_extended_get;
-  if (!strcmp(ext,"GL_QCOM_extended_get2"))                    return gl_qcom_extended_get2;
-  if (!strcmp(ext,"GL_QCOM_perfmon_global_mode"))              return gl_qcom_perfmon_global_mode;
-  if (!strcmp(ext,"GL_QCOM_tiled_rendering"))                  return gl_qcom_tiled_rendering;
-  if (!strcmp(ext,"GL_QCOM_writeonly_rendering"))              return gl_qcom_writeonly_rendering;
-  if (!strcmp(ext,"GL_REGAL_ES1_0_compatibility"))             return gl_regal_es1_0_compatibility;
-  if (!strcmp(ext,"GL_REGAL_ES1_1_compatibility"))             return gl_regal_es1_1_compatibility;
-  if (!strcmp(ext,"GL_REGAL_enable"))                          return gl_regal_enable;
-  if (!strcmp(ext,"GL_REGAL_error_string"))                    return gl_regal_error_string;
-  if (!strcmp(ext,"GL_REGAL_extension_query"))                 return gl_regal_extension_query;
-  if (!strcmp(ext,"GL_REGAL_log"))                             return gl_regal_log;
-  if (!strcmp(ext,"GL_REGAL_proc_address"))                    return gl_regal_proc_address;
-  if (!strcmp(ext,"GL_REND_screen_coordinates"))               return gl_rend_screen_coordinates;
-  if (!strcmp(ext,"GL_S3_s3tc"))                               return gl_s3_s3tc;
-  if (!strcmp(ext,"GL_SGIS_color_range"))                      return gl_sgis_color_range;
-  if (!strcmp(ext,"GL_SGIS_detail_texture"))                   return gl_sgis_detail_texture;
-  if (!strcmp(ext,"GL_SGIS_fog_function"))                     return gl_sgis_fog_function;
-  if (!strcmp(ext,"GL_SGIS_generate_mipmap"))                  return gl_sgis_generate_mipmap;
-  if (!strcmp(ext,"GL_SGIS_multisample"))                      return gl_sgis_multisample;
-  if (!strcmp(ext,"GL_SGIS_pixel_texture"))                    return gl_sgis_pixel_texture;
-  if (!strcmp(ext,"GL_SGIS_point_line_texgen"))                return gl_sgis_point_line_texgen;
-  if (!strcmp(ext,"GL_SGIS_point_parameters"))                 return gl_sgis_point_parameters;
-  if (!strcmp(ext,"GL_SGIS_sharpen_texture"))                  return gl_sgis_sharpen_texture;
-  if (!strcmp(ext,"GL_SGIS_texture4D"))                        return gl_sgis_texture4d;
-  if (!strcmp(ext,"GL_SGIS_texture_border_clamp"))             return gl_sgis_texture_border_clamp;
-  if (!strcmp(ext,"GL_SGIS_texture_color_mask"))               return gl_sgis_texture_color_mask;
-  if (!strcmp(ext,"GL_SGIS_texture_edge_clamp"))               return gl_sgis_texture_edge_clamp;
-  if (!strcmp(ext,"GL_SGIS_texture_filter4"))                  return gl_sgis_texture_filter4;
-  if (!strcmp(ext,"GL_SGIS_texture_lod"))                      return gl_sgis_texture_lod;
-  if (!strcmp(ext,"GL_SGIX_async"))                            return gl_sgix_async;
-  if (!strcmp(ext,"GL_SGIX_async_histogram"))                  return gl_sgix_async_histogram;
-  if (!strcmp(ext,"GL_SGIX_async_pixel"))                      return gl_sgix_async_pixel;
-  if (!strcmp(ext,"GL_SGIX_blend_alpha_minmax"))               return gl_sgix_blend_alpha_minmax;
-  if (!strcmp(ext,"GL_SGIX_convolution_accuracy"))             return gl_sgix_convolution_accuracy;
-  if (!strcmp(ext,"GL_SGIX_depth_texture"))                    return gl_sgix_depth_texture;
-  if (!strcmp(ext,"GL_SGIX_flush_raster"))                     return gl_sgix_flush_raster;
-  if (!strcmp(ext,"GL_SGIX_fog_offset"))                       return gl_sgix_fog_offset;
-  if (!strcmp(ext,"GL_SGIX_fog_texture"))                      return gl_sgix_fog_texture;
-  if (!strcmp(ext,"GL_SGIX_fragment_lighting"))                return gl_sgix_fragment_lighting;
-  if (!strcmp(ext,"GL_SGIX_fragment_specular_lighting"))       return gl_sgix_fragment_specular_lighting;
-  if (!strcmp(ext,"GL_SGIX_framezoom"))                        return gl_sgix_framezoom;
-  if (!strcmp(ext,"GL_SGIX_igloo_interface"))                  return gl_sgix_igloo_interface;
-  if (!strcmp(ext,"GL_SGIX_instruments"))                      return gl_sgix_instruments;
-  if (!strcmp(ext,"GL_SGIX_interlace"))                        return gl_sgix_interlace;
-  if (!strcmp(ext,"GL_SGIX_list_priority"))                    return gl_sgix_list_priority;
-  if (!strcmp(ext,"GL_SGIX_pixel_texture"))                    return gl_sgix_pixel_texture;
-  if (!strcmp(ext,"GL_SGIX_polynomial_ffd"))                   return gl_sgix_polynomial_ffd;
-  if (!strcmp(ext,"GL_SGIX_reference_plane"))                  return gl_sgix_reference_plane;
-  if (!strcmp(ext,"GL_SGIX_resample"))                         return gl_sgix_resample;
-  if (!strcmp(ext,"GL_SGIX_shadow"))                           return gl_sgix_shadow;
-  if (!strcmp(ext,"GL_SGIX_shadow_ambient"))                   return gl_sgix_shadow_ambient;
-  if (!strcmp(ext,"GL_SGIX_sprite"))                           return gl_sgix_sprite;
-  if (!strcmp(ext,"GL_SGIX_tag_sample_buffer"))                return gl_sgix_tag_sample_buffer;
-  if (!strcmp(ext,"GL_SGIX_texture_coordinate_clamp"))         return gl_sgix_texture_coordinate_clamp;
-  if (!strcmp(ext,"GL_SGIX_texture_multi_buffer"))             return gl_sgix_texture_multi_buffer;
-  if (!strcmp(ext,"GL_SGIX_texture_range"))                    return gl_sgix_texture_range;
-  if (!strcmp(ext,"GL_SGIX_texture_scale_bias"))               return gl_sgix_texture_scale_bias;
-  if (!strcmp(ext,"GL_SGIX_vertex_preclip_hint"))              return gl_sgix_vertex_preclip_hint;
-  if (!strcmp(ext,"GL_SGIX_ycrcb"))                            return gl_sgix_ycrcb;
-  if (!strcmp(ext,"GL_SGI_color_matrix"))                      return gl_sgi_color_matrix;
-  if (!strcmp(ext,"GL_SGI_color_table"))                       return gl_sgi_color_table;
-  if (!strcmp(ext,"GL_SGI_texture_color_table"))               return gl_sgi_texture_color_table;
-  if (!strcmp(ext,"GL_SUNX_constant_data"))                    return gl_sunx_constant_data;
-  if (!strcmp(ext,"GL_SUN_convolution_border_modes"))          return gl_sun_convolution_border_modes;
-  if (!strcmp(ext,"GL_SUN_global_alpha"))                      return gl_sun_global_alpha;
-  if (!strcmp(ext,"GL_SUN_mesh_array"))                        return gl_sun_mesh_array;
-  if (!strcmp(ext,"GL_SUN_read_video_pixels"))                 return gl_sun_read_video_pixels;
-  if (!strcmp(ext,"GL_SUN_slice_accum"))                       return gl_sun_slice_accum;
-  if (!strcmp(ext,"GL_SUN_triangle_list"))                     return gl_sun_triangle_list;
-  if (!strcmp(ext,"GL_SUN_vertex"))                            return gl_sun_vertex;
-  if (!strcmp(ext,"GL_VIV_shader_binary"))                     return gl_viv_shader_binary;
-  if (!strcmp(ext,"GL_WIN_phong_shading"))                     return gl_win_phong_shading;
-  if (!strcmp(ext,"GL_WIN_specular_fog"))                      return gl_win_specular_fog;
-  if (!strcmp(ext,"GL_WIN_swap_hint"))                         return gl_win_swap_hint;
+  return getExtension(extensionIndex(ext));
+}
+
+bool
+ContextInfo::getExtension(const size_t i) const
+{
+  switch (i)
+  {
+    case 85:     return gl_3dfx_multisample;
+    case 86:     return gl_3dfx_tbuffer;
+    case 87:     return gl_3dfx_texture_compression_fxt1;
+    case 88:     return gl_amd_blend_minmax_factor;
+    case 89:     return gl_amd_compressed_3dc_texture;
+    case 90:     return gl_amd_compressed_atc_texture;
+    case 91:     return gl_amd_debug_output;
+    case 92:     return gl_amd_depth_clamp_separate;
+    case 93:     return gl_amd_draw_buffers_blend;
+    case 94:     return gl_amd_interleaved_elements;
+    case 95:     return gl_amd_multi_draw_indirect;
+    case 96:     return gl_amd_name_gen_delete;
+    case 97:     return gl_amd_performance_monitor;
+    case 98:     return gl_amd_pinned_memory;
+    case 99:     return gl_amd_program_binary_z400;
+    case 100:    return gl_amd_query_buffer_object;
+    case 101:    return gl_amd_sample_positions;
+    case 102:    return gl_amd_seamless_cubemap_per_texture;
+    case 103:    return gl_amd_sparse_texture;
+    case 104:    return gl_amd_stencil_operation_extended;
+    case 105:    return gl_amd_vertex_shader_tessellator;
+    case 106:    return gl_angle_framebuffer_blit;
+    case 107:    return gl_angle_framebuffer_multisample;
+    case 108:    return gl_angle_instanced_arrays;
+    case 109:    return gl_angle_pack_reverse_row_order;
+    case 110:    return gl_angle_program_binary;
+    case 111:    return gl_angle_texture_compression_dxt1;
+    case 112:    return gl_angle_texture_compression_dxt3;
+    case 113:    return gl_angle_texture_compression_dxt5;
+    case 114:    return gl_angle_texture_usage;
+    case 115:    return gl_angle_timer_query;
+    case 116:    return gl_angle_translated_shader_source;
+    case 117:    return gl_apple_aux_depth_stencil;
+    case 118:    return gl_apple_client_storage;
+    case 119:    return gl_apple_copy_texture_levels;
+    case 120:    return gl_apple_element_array;
+    case 121:    return gl_apple_fence;
+    case 122:    return gl_apple_float_pixels;
+    case 123:    return gl_apple_flush_buffer_range;
+    case 124:    return gl_apple_flush_render;
+    case 125:    return gl_apple_framebuffer_multisample;
+    case 126:    return gl_apple_object_purgeable;
+    case 127:    return gl_apple_pixel_buffer;
+    case 128:    return gl_apple_rgb_422;
+    case 129:    return gl_apple_row_bytes;
+    case 130:    return gl_apple_specular_vector;
+    case 131:    return gl_apple_sync;
+    case 132:    return gl_apple_texture_max_level;
+    case 133:    return gl_apple_texture_range;
+    case 134:    return gl_apple_transform_hint;
+    case 135:    return gl_apple_vertex_array_object;
+    case 136:    return gl_apple_vertex_array_range;
+    case 137:    return gl_apple_vertex_program_evaluators;
+    case 138:    return gl_apple_ycbcr_422;
+    case 139:    return gl_arb_es2_compatibility;
+    case 140:    return gl_arb_es3_compatibility;
+    case 141:    return gl_arb_base_instance;
+    case 142:    return gl_arb_bindless_texture;
+    case 143:    return gl_arb_blend_func_extended;
+    case 144:    return gl_arb_buffer_storage;
+    case 145:    return gl_arb_cl_event;
+    case 146:    return gl_arb_clear_buffer_object;
+    case 147:    return gl_arb_clear_texture;
+    case 148:    return gl_arb_color_buffer_float;
+    case 149:    return gl_arb_compressed_texture_pixel_storage;
+    case 150:    return gl_arb_compute_shader;
+    case 151:    return gl_arb_compute_variable_group_size;
+    case 152:    return gl_arb_copy_buffer;
+    case 153:    return gl_arb_copy_image;
+    case 154:    return gl_arb_debug_output;
+    case 155:    return gl_arb_depth_buffer_float;
+    case 156:    return gl_arb_depth_clamp;
+    case 157:    return gl_arb_depth_texture;
+    case 158:    return gl_arb_draw_buffers;
+    case 159:    return gl_arb_draw_buffers_blend;
+    case 160:    return gl_arb_draw_elements_base_vertex;
+    case 161:    return gl_arb_draw_indirect;
+    case 162:    return gl_arb_draw_instanced;
+    case 163:    return gl_arb_enhanced_layouts;
+    case 164:    return gl_arb_explicit_uniform_location;
+    case 165:    return gl_arb_fragment_program;
+    case 166:    return gl_arb_fragment_shader;
+    case 167:    return gl_arb_framebuffer_no_attachments;
+    case 168:    return gl_arb_framebuffer_object;
+    case 169:    return gl_arb_framebuffer_srgb;
+    case 170:    return gl_arb_geometry_shader4;
+    case 171:    return gl_arb_get_program_binary;
+    case 172:    return gl_arb_gpu_shader5;
+    case 173:    return gl_arb_gpu_shader_fp64;
+    case 174:    return gl_arb_half_float_pixel;
+    case 175:    return gl_arb_half_float_vertex;
+    case 176:    return gl_arb_imaging;
+    case 177:    return gl_arb_indirect_parameters;
+    case 178:    return gl_arb_instanced_arrays;
+    case 179:    return gl_arb_internalformat_query;
+    case 180:    return gl_arb_internalformat_query2;
+    case 181:    return gl_arb_invalidate_subdata;
+    case 182:    return gl_arb_map_buffer_alignment;
+    case 183:    return gl_arb_map_buffer_range;
+    case 184:    return gl_arb_matrix_palette;
+    case 185:    return gl_arb_multi_bind;
+    case 186:    return gl_arb_multi_draw_indirect;
+    case 187:    return gl_arb_multisample;
+    case 188:    return gl_arb_multitexture;
+    case 189:    return gl_arb_occlusion_query;
+    case 190:    return gl_arb_occlusion_query2;
+    case 191:    return gl_arb_pixel_buffer_object;
+    case 192:    return gl_arb_point_parameters;
+    case 193:    return gl_arb_point_sprite;
+    case 194:    return gl_arb_program_interface_query;
+    case 195:    return gl_arb_provoking_vertex;
+    case 196:    return gl_arb_query_buffer_object;
+    case 197:    return gl_arb_robustness;
+    case 198:    return gl_arb_sample_shading;
+    case 199:    return gl_arb_sampler_objects;
+    case 200:    return gl_arb_seamless_cube_map;
+    case 201:    return gl_arb_separate_shader_objects;
+    case 202:    return gl_arb_shader_atomic_counters;
+    case 203:    return gl_arb_shader_image_load_store;
+    case 204:    return gl_arb_shader_objects;
+    case 205:    return gl_arb_shader_storage_buffer_object;
+    case 206:    return gl_arb_shader_subroutine;
+    case 207:    return gl_arb_shading_language_100;
+    case 208:    return gl_arb_shading_language_include;
+    case 209:    return gl_arb_shadow;
+    case 210:    return gl_arb_shadow_ambient;
+    case 211:    return gl_arb_sparse_texture;
+    case 212:    return gl_arb_stencil_texturing;
+    case 213:    return gl_arb_sync;
+    case 214:    return gl_arb_tessellation_shader;
+    case 215:    return gl_arb_texture_border_clamp;
+    case 216:    return gl_arb_texture_buffer_object;
+    case 217:    return gl_arb_texture_buffer_range;
+    case 218:    return gl_arb_texture_compression;
+    case 219:    return gl_arb_texture_compression_bptc;
+    case 220:    return gl_arb_texture_compression_rgtc;
+    case 221:    return gl_arb_texture_cube_map;
+    case 222:    return gl_arb_texture_cube_map_array;
+    case 223:    return gl_arb_texture_env_combine;
+    case 224:    return gl_arb_texture_env_dot3;
+    case 225:    return gl_arb_texture_float;
+    case 226:    return gl_arb_texture_gather;
+    case 227:    return gl_arb_texture_mirror_clamp_to_edge;
+    case 228:    return gl_arb_texture_mirrored_repeat;
+    case 229:    return gl_arb_texture_multisample;
+    case 230:    return gl_arb_texture_rectangle;
+    case 231:    return gl_arb_texture_rg;
+    case 232:    return gl_arb_texture_rgb10_a2ui;
+    case 233:    return gl_arb_texture_storage;
+    case 234:    return gl_arb_texture_storage_multisample;
+    case 235:    return gl_arb_texture_swizzle;
+    case 236:    return gl_arb_texture_view;
+    case 237:    return gl_arb_timer_query;
+    case 238:    return gl_arb_transform_feedback2;
+    case 239:    return gl_arb_transform_feedback3;
+    case 240:    return gl_arb_transform_feedback_instanced;
+    case 241:    return gl_arb_transpose_matrix;
+    case 242:    return gl_arb_uniform_buffer_object;
+    case 243:    return gl_arb_vertex_array_object;
+    case 244:    return gl_arb_vertex_attrib_64bit;
+    case 245:    return gl_arb_vertex_attrib_binding;
+    case 246:    return gl_arb_vertex_blend;
+    case 247:    return gl_arb_vertex_buffer_object;
+    case 248:    return gl_arb_vertex_program;
+    case 249:    return gl_arb_vertex_shader;
+    case 250:    return gl_arb_vertex_type_2_10_10_10_rev;
+    case 251:    return gl_arb_viewport_array;
+    case 252:    return gl_arb_window_pos;
+    case 253:    return gl_arm_mali_program_binary;
+    case 254:    return gl_arm_mali_shader_binary;
+    case 255:    return gl_ati_draw_buffers;
+    case 256:    return gl_ati_element_array;
+    case 257:    return gl_ati_envmap_bumpmap;
+    case 258:    return gl_ati_fragment_shader;
+    case 259:    return gl_ati_map_object_buffer;
+    case 260:    return gl_ati_meminfo;
+    case 261:    return gl_ati_pn_triangles;
+    case 262:    return gl_ati_separate_stencil;
+    case 263:    return gl_ati_text_fragment_shader;
+    case 264:    return gl_ati_texture_compression_3dc;
+    case 265:    return gl_ati_texture_env_combine3;
+    case 266:    return gl_ati_texture_float;
+    case 267:    return gl_ati_texture_mirror_once;
+    case 268:    return gl_ati_vertex_array_object;
+    case 269:    return gl_ati_vertex_attrib_array_object;
+    case 270:    return gl_ati_vertex_streams;
+    case 271:    return gl_dmp_shader_binary;
+    case 272:    return gl_ext_422_pixels;
+    case 273:    return gl_ext_cg_shader;
+    case 274:    return gl_ext_abgr;
+    case 275:    return gl_ext_bgra;
+    case 276:    return gl_ext_bindable_uniform;
+    case 277:    return gl_ext_blend_color;
+    case 278:    return gl_ext_blend_equation_separate;
+    case 279:    return gl_ext_blend_func_separate;
+    case 280:    return gl_ext_blend_minmax;
+    case 281:    return gl_ext_blend_subtract;
+    case 282:    return gl_ext_clip_volume_hint;
+    case 283:    return gl_ext_cmyka;
+    case 284:    return gl_ext_color_buffer_half_float;
+    case 285:    return gl_ext_color_subtable;
+    case 286:    return gl_ext_compiled_vertex_array;
+    case 287:    return gl_ext_convolution;
+    case 288:    return gl_ext_coordinate_frame;
+    case 289:    return gl_ext_copy_texture;
+    case 290:    return gl_ext_cull_vertex;
+    case 291:    return gl_ext_debug_label;
+    case 292:    return gl_ext_debug_marker;
+    case 293:    return gl_ext_depth_bounds_test;
+    case 294:    return gl_ext_direct_state_access;
+    case 295:    return gl_ext_discard_framebuffer;
+    case 296:    return gl_ext_disjoint_timer_query;
+    case 297:    return gl_ext_draw_buffers2;
+    case 298:    return gl_ext_draw_instanced;
+    case 299:    return gl_ext_draw_range_elements;
+    case 300:    return gl_ext_fog_coord;
+    case 301:    return gl_ext_fragment_lighting;
+    case 302:    return gl_ext_framebuffer_blit;
+    case 303:    return gl_ext_framebuffer_multisample;
+    case 304:    return gl_ext_framebuffer_multisample_blit_scaled;
+    case 305:    return gl_ext_framebuffer_object;
+    case 306:    return gl_ext_framebuffer_srgb;
+    case 307:    return gl_ext_geometry_shader4;
+    case 308:    return gl_ext_gpu_program_parameters;
+    case 309:    return gl_ext_gpu_shader4;
+    case 310:    return gl_ext_histogram;
+    case 311:    return gl_ext_index_func;
+    case 312:    return gl_ext_index_material;
+    case 313:    return gl_ext_light_texture;
+    case 314:    return gl_ext_map_buffer_range;
+    case 315:    return gl_ext_multi_draw_arrays;
+    case 316:    return gl_ext_multisample;
+    case 317:    return gl_ext_multisampled_render_to_texture;
+    case 318:    return gl_ext_multiview_draw_buffers;
+    case 319:    return gl_ext_occlusion_query_boolean;
+    case 320:    return gl_ext_packed_depth_stencil;
+    case 321:    return gl_ext_packed_float;
+    case 322:    return gl_ext_packed_pixels;
+    case 323:    return gl_ext_paletted_texture;
+    case 324:    return gl_ext_pixel_buffer_object;
+    case 325:    return gl_ext_pixel_transform;
+    case 326:    return gl_ext_point_parameters;
+    case 327:    return gl_ext_polygon_offset;
+    case 328:    return gl_ext_provoking_vertex;
+    case 329:    return gl_ext_read_format_bgra;
+    case 330:    return gl_ext_rescale_normal;
+    case 331:    return gl_ext_robustness;
+    case 332:    return gl_ext_srgb;
+    case 333:    return gl_ext_scene_marker;
+    case 334:    return gl_ext_secondary_color;
+    case 335:    return gl_ext_separate_shader_objects;
+    case 336:    return gl_ext_separate_specular_color;
+    case 337:    return gl_ext_shader_framebuffer_fetch;
+    case 338:    return gl_ext_shader_image_load_store;
+    case 339:    return gl_ext_shadow_samplers;
+    case 340:    return gl_ext_shared_texture_palette;
+    case 341:    return gl_ext_stencil_clear_tag;
+    case 342:    return gl_ext_stencil_two_side;
+    case 343:    return gl_ext_stencil_wrap;
+    case 344:    return gl_ext_subtexture;
+    case 345:    return gl_ext_texture;
+    case 346:    return gl_ext_texture3d;
+    case 347:    return gl_ext_texture_array;
+    case 348:    return gl_ext_texture_buffer_object;
+    case 349:    return gl_ext_texture_compression_latc;
+    case 350:    return gl_ext_texture_compression_rgtc;
+    case 351:    return gl_ext_texture_compression_s3tc;
+    case 352:    return gl_ext_texture_cube_map;
+    case 353:    return gl_ext_texture_edge_clamp;
+    case 354:    return gl_ext_texture_env_combine;
+    case 355:    return gl_ext_texture_env_dot3;
+    case 356:    return gl_ext_texture_filter_anisotropic;
+    case 357:    return gl_ext_texture_format_bgra8888;
+    case 358:    return gl_ext_texture_integer;
+    case 359:    return gl_ext_texture_lod_bias;
+    case 360:    return gl_ext_texture_mirror_clamp;
+    case 361:    return gl_ext_texture_object;
+    case 362:    return gl_ext_texture_perturb_normal;
+    case 363:    return gl_ext_texture_rectangle;
+    case 364:    return gl_ext_texture_rg;
+    case 365:    return gl_ext_texture_srgb;
+    case 366:    return gl_ext_texture_srgb_decode;
+    case 367:    return gl_ext_texture_shared_exponent;
+    case 368:    return gl_ext_texture_snorm;
+    case 369:    return gl_ext_texture_storage;
+    case 370:    return gl_ext_texture_swizzle;
+    case 371:    return gl_ext_texture_type_2_10_10_10_rev;
+    case 372:    return gl_ext_timer_query;
+    case 373:    return gl_ext_transform_feedback;
+    case 374:    return gl_ext_unpack_subimage;
+    case 375:    return gl_ext_vertex_array;
+    case 376:    return gl_ext_vertex_attrib_64bit;
+    case 377:    return gl_ext_vertex_shader;
+    case 378:    return gl_ext_vertex_weighting;
+    case 379:    return gl_ext_x11_sync_object;
+    case 380:    return gl_fj_shader_binary_gccso;
+    case 381:    return gl_gremedy_frame_terminator;
+    case 382:    return gl_gremedy_string_marker;
+    case 383:    return gl_hp_image_transform;
+    case 384:    return gl_hp_occlusion_test;
+    case 385:    return gl_ibm_cull_vertex;
+    case 386:    return gl_ibm_multimode_draw_arrays;
+    case 387:    return gl_ibm_rasterpos_clip;
+    case 388:    return gl_ibm_static_data;
+    case 389:    return gl_ibm_texture_mirrored_repeat;
+    case 390:    return gl_ibm_vertex_array_lists;
+    case 391:    return gl_img_multisampled_render_to_texture;
+    case 392:    return gl_img_program_binary;
+    case 393:    return gl_img_read_format;
+    case 394:    return gl_img_shader_binary;
+    case 395:    return gl_img_texture_compression_pvrtc;
+    case 396:    return gl_img_texture_compression_pvrtc2;
+    case 397:    return gl_img_texture_env_enhanced_fixed_function;
+    case 398:    return gl_img_user_clip_plane;
+    case 399:    return gl_ingr_blend_func_separate;
+    case 400:    return gl_ingr_color_clamp;
+    case 401:    return gl_ingr_interlace_read;
+    case 402:    return gl_intel_map_texture;
+    case 403:    return gl_intel_parallel_arrays;
+    case 404:    return gl_intel_texture_scissor;
+    case 405:    return gl_khr_debug;
+    case 406:    return gl_khr_texture_compression_astc_ldr;
+    case 407:    return gl_ktx_buffer_region;
+    case 408:    return gl_mesax_texture_stack;
+    case 409:    return gl_mesa_pack_invert;
+    case 410:    return gl_mesa_resize_buffers;
+    case 411:    return gl_mesa_window_pos;
+    case 412:    return gl_mesa_ycbcr_texture;
+    case 413:    return gl_nvx_conditional_render;
+    case 414:    return gl_nvx_gpu_memory_info;
+    case 415:    return gl_nv_3dvision_settings;
+    case 416:    return gl_nv_bgr;
+    case 417:    return gl_nv_bindless_texture;
+    case 418:    return gl_nv_blend_equation_advanced;
+    case 419:    return gl_nv_blend_square;
+    case 420:    return gl_nv_compute_program5;
+    case 421:    return gl_nv_conditional_render;
+    case 422:    return gl_nv_copy_buffer;
+    case 423:    return gl_nv_copy_depth_to_color;
+    case 424:    return gl_nv_copy_image;
+    case 425:    return gl_nv_coverage_sample;
+    case 426:    return gl_nv_deep_texture3d;
+    case 427:    return gl_nv_depth_buffer_float;
+    case 428:    return gl_nv_depth_clamp;
+    case 429:    return gl_nv_depth_nonlinear;
+    case 430:    return gl_nv_depth_range_unclamped;
+    case 431:    return gl_nv_draw_buffers;
+    case 432:    return gl_nv_draw_texture;
+    case 433:    return gl_nv_evaluators;
+    case 434:    return gl_nv_explicit_multisample;
+    case 435:    return gl_nv_fbo_color_attachments;
+    case 436:    return gl_nv_fence;
+    case 437:    return gl_nv_float_buffer;
+    case 438:    return gl_nv_fog_distance;
+    case 439:    return gl_nv_fragment_program;
+    case 440:    return gl_nv_fragment_program2;
+    case 441:    return gl_nv_framebuffer_blit;
+    case 442:    return gl_nv_framebuffer_multisample;
+    case 443:    return gl_nv_framebuffer_multisample_coverage;
+    case 444:    return gl_nv_geometry_program4;
+    case 445:    return gl_nv_gpu_program4;
+    case 446:    return gl_nv_gpu_program5;
+    case 447:    return gl_nv_gpu_shader5;
+    case 448:    return gl_nv_half_float;
+    case 449:    return gl_nv_instanced_arrays;
+    case 450:    return gl_nv_light_max_exponent;
+    case 451:    return gl_nv_multisample_coverage;
+    case 452:    return gl_nv_multisample_filter_hint;
+    case 453:    return gl_nv_non_square_matrices;
+    case 454:    return gl_nv_occlusion_query;
+    case 455:    return gl_nv_pack_subimage;
+    case 456:    return gl_nv_packed_depth_stencil;
+    case 457:    return gl_nv_packed_float_linear;
+    case 458:    return gl_nv_parameter_buffer_object;
+    case 459:    return gl_nv_path_rendering;
+    case 460:    return gl_nv_pixel_buffer_object;
+    case 461:    return gl_nv_pixel_data_range;
+    case 462:    return gl_nv_platform_binary;
+    case 463:    return gl_nv_point_sprite;
+    case 464:    return gl_nv_present_video;
+    case 465:    return gl_nv_primitive_restart;
+    case 466:    return gl_nv_read_buffer;
+    case 467:    return gl_nv_read_buffer_front;
+    case 468:    return gl_nv_register_combiners;
+    case 469:    return gl_nv_register_combiners2;
+    case 470:    return gl_nv_srgb_formats;
+    case 471:    return gl_nv_shader_buffer_load;
+    case 472:    return gl_nv_shadow_samplers_array;
+    case 473:    return gl_nv_shadow_samplers_cube;
+    case 474:    return gl_nv_tessellation_program5;
+    case 475:    return gl_nv_texgen_emboss;
+    case 476:    return gl_nv_texgen_reflection;
+    case 477:    return gl_nv_texture_array;
+    case 478:    return gl_nv_texture_barrier;
+    case 479:    return gl_nv_texture_border_clamp;
+    case 480:    return gl_nv_texture_compression_latc;
+    case 481:    return gl_nv_texture_compression_s3tc;
+    case 482:    return gl_nv_texture_env_combine4;
+    case 483:    return gl_nv_texture_expand_normal;
+    case 484:    return gl_nv_texture_multisample;
+    case 485:    return gl_nv_texture_rectangle;
+    case 486:    return gl_nv_texture_shader;
+    case 487:    return gl_nv_texture_shader2;
+    case 488:    return gl_nv_texture_shader3;
+    case 489:    return gl_nv_transform_feedback;
+    case 490:    return gl_nv_transform_feedback2;
+    case 491:    return gl_nv_vdpau_interop;
+    case 492:    return gl_nv_vertex_array_range;
+    case 493:    return gl_nv_vertex_array_range2;
+    case 494:    return gl_nv_vertex_attrib_integer_64bit;
+    case 495:    return gl_nv_vertex_buffer_unified_memory;
+    case 496:    return gl_nv_vertex_program;
+    case 497:    return gl_nv_vertex_program2_option;
+    case 498:    return gl_nv_vertex_program3;
+    case 499:    return gl_nv_vertex_program4;
+    case 500:    return gl_nv_video_capture;
+    case 501:    return gl_oes_egl_image_external;
+    case 502:    return gl_oes_blend_equation_separate;
+    case 503:    return gl_oes_blend_func_separate;
+    case 504:    return gl_oes_blend_subtract;
+    case 505:    return gl_oes_compressed_etc1_rgb8_texture;
+    case 506:    return gl_oes_compressed_paletted_texture;
+    case 507:    return gl_oes_depth_texture;
+    case 508:    return gl_oes_draw_texture;
+    case 509:    return gl_oes_element_index_uint;
+    case 510:    return gl_oes_fbo_render_mipmap;
+    case 511:    return gl_oes_framebuffer_object;
+    case 512:    return gl_oes_get_program_binary;
+    case 513:    return gl_oes_mapbuffer;
+    case 514:    return gl_oes_matrix_get;
+    case 515:    return gl_oes_matrix_palette;
+    case 516:    return gl_oes_packed_depth_stencil;
+    case 517:    return gl_oes_point_size_array;
+    case 518:    return gl_oes_point_sprite;
+    case 519:    return gl_oes_read_format;
+    case 520:    return gl_oes_required_internalformat;
+    case 521:    return gl_oes_rgb8_rgba8;
+    case 522:    return gl_oes_single_precision;
+    case 523:    return gl_oes_standard_derivatives;
+    case 524:    return gl_oes_stencil1;
+    case 525:    return gl_oes_stencil4;
+    case 526:    return gl_oes_stencil8;
+    case 527:    return gl_oes_surfaceless_context;
+    case 528:    return gl_oes_texture_3d;
+    case 529:    return gl_oes_texture_cube_map;
+    case 530:    return gl_oes_texture_mirrored_repeat;
+    case 531:    return gl_oes_vertex_array_object;
+    case 532:    return gl_oes_vertex_half_float;
+    case 533:    return gl_oes_vertex_type_10_10_10_2;
+    case 534:    return gl_oml_interlace;
+    case 535:    return gl_oml_resample;
+    case 536:    return gl_oml_subsample;
+    case 537:    return gl_pgi_misc_hints;
+    case 538:    return gl_pgi_vertex_hints;
+    case 539:    return gl_qcom_alpha_test;
+    case 540:    return gl_qcom_binning_control;
+    case 541:    return gl_qcom_driver_control;
+    case 542:    return gl_qcom_extended_get;
+    case 543:    return gl_qcom_extended_get2;
+    case 544:    return gl_qcom_perfmon_global_mode;
+    case 545:    return gl_qcom_tiled_rendering;
+    case 546:    return gl_qcom_writeonly_rendering;
+    case 547:    return gl_regal_es1_0_compatibility;
+    case 548:    return gl_regal_es1_1_compatibility;
+    case 549:    return gl_regal_enable;
+    case 550:    return gl_regal_error_string;
+    case 551:    return gl_regal_extension_query;
+    case 552:    return gl_regal_log;
+    case 553:    return gl_regal_proc_address;
+    case 554:    return gl_rend_screen_coordinates;
+    case 555:    return gl_s3_s3tc;
+    case 556:    return gl_sgis_color_range;
+    case 557:    return gl_sgis_detail_texture;
+    case 558:    return gl_sgis_fog_function;
+    case 559:    return gl_sgis_generate_mipmap;
+    case 560:    return gl_sgis_multisample;
+    case 561:    return gl_sgis_pixel_texture;
+    case 562:    return gl_sgis_point_line_texgen;
+    case 563:    return gl_sgis_point_parameters;
+    case 564:    return gl_sgis_sharpen_texture;
+    case 565:    return gl_sgis_texture4d;
+    case 566:    return gl_sgis_texture_border_clamp;
+    case 567:    return gl_sgis_texture_color_mask;
+    case 568:    return gl_sgis_texture_edge_clamp;
+    case 569:    return gl_sgis_texture_filter4;
+    case 570:    return gl_sgis_texture_lod;
+    case 571:    return gl_sgix_async;
+    case 572:    return gl_sgix_async_histogram;
+    case 573:    return gl_sgix_async_pixel;
+    case 574:    return gl_sgix_blend_alpha_minmax;
+    case 575:    return gl_sgix_convolution_accuracy;
+    case 576:    return gl_sgix_depth_texture;
+    case 577:    return gl_sgix_flush_raster;
+    case 578:    return gl_sgix_fog_offset;
+    case 579:    return gl_sgix_fog_texture;
+    case 580:    return gl_sgix_fragment_lighting;
+    case 581:    return gl_sgix_fragment_specular_lighting;
+    case 582:    return gl_sgix_framezoom;
+    case 583:    return gl_sgix_igloo_interface;
+    case 584:    return gl_sgix_instruments;
+    case 585:    return gl_sgix_interlace;
+    case 586:    return gl_sgix_list_priority;
+    case 587:    return gl_sgix_pixel_texture;
+    case 588:    return gl_sgix_polynomial_ffd;
+    case 589:    return gl_sgix_reference_plane;
+    case 590:    return gl_sgix_resample;
+    case 591:    return gl_sgix_shadow;
+    case 592:    return gl_sgix_shadow_ambient;
+    case 593:    return gl_sgix_sprite;
+    case 594:    return gl_sgix_tag_sample_buffer;
+    case 595:    return gl_sgix_texture_coordinate_clamp;
+    case 596:    return gl_sgix_texture_multi_buffer;
+    case 597:    return gl_sgix_texture_range;
+    case 598:    return gl_sgix_texture_scale_bias;
+    case 599:    return gl_sgix_vertex_preclip_hint;
+    case 600:    return gl_sgix_ycrcb;
+    case 601:    return gl_sgi_color_matrix;
+    case 602:    return gl_sgi_color_table;
+    case 603:    return gl_sgi_texture_color_table;
+    case 604:    return gl_sunx_constant_data;
+    case 605:    return gl_sun_convolution_border_modes;
+    case 606:    return gl_sun_global_alpha;
+    case 607:    return gl_sun_mesh_array;
+    case 608:    return gl_sun_read_video_pixels;
+    case 609:    return gl_sun_slice_accum;
+    case 610:    return gl_sun_triangle_list;
+    case 611:    return gl_sun_vertex;
+    case 612:    return gl_viv_shader_binary;
+    case 613:    return gl_win_phong_shading;
+    case 614:    return gl_win_specular_fog;
+    case 615:    return gl_win_swap_hint;
 
 #if REGAL_SYS_WGL
-  if (!strcmp(ext,"WGL_3DL_stereo_control"))                   return wgl_3dl_stereo_control;
-  if (!strcmp(ext,"WGL_AMD_gpu_association"))                  return wgl_amd_gpu_association;
-  if (!strcmp(ext,"WGL_ARB_buffer_region"))                    return wgl_arb_buffer_region;
-  if (!strcmp(ext,"WGL_ARB_create_context"))                   return wgl_arb_create_context;
-  if (!strcmp(ext,"WGL_ARB_create_context_profile"))           return wgl_arb_create_context_profile;
-  if (!strcmp(ext,"WGL_ARB_create_context_robustness"))        return wgl_arb_create_context_robustness;
-  if (!strcmp(ext,"WGL_ARB_extensions_string"))                return wgl_arb_extensions_string;
-  if (!strcmp(ext,"WGL_ARB_framebuffer_sRGB"))                 return wgl_arb_framebuffer_srgb;
-  if (!strcmp(ext,"WGL_ARB_make_current_read"))                return wgl_arb_make_current_read;
-  if (!strcmp(ext,"WGL_ARB_multisample"))                      return wgl_arb_multisample;
-  if (!strcmp(ext,"WGL_ARB_pbuffer"))                          return wgl_arb_pbuffer;
-  if (!strcmp(ext,"WGL_ARB_pixel_format"))                     return wgl_arb_pixel_format;
-  if (!strcmp(ext,"WGL_ARB_pixel_format_float"))               return wgl_arb_pixel_format_float;
-  if (!strcmp(ext,"WGL_ARB_render_texture"))                   return wgl_arb_render_texture;
-  if (!strcmp(ext,"WGL_ARB_robustness_share_group_isolation")) return wgl_arb_robustness_share_group_isolation;
-  if (!strcmp(ext,"WGL_ATI_pixel_format_float"))               return wgl_ati_pixel_format_float;
-  if (!strcmp(ext,"WGL_ATI_render_texture_rectangle"))         return wgl_ati_render_texture_rectangle;
-  if (!strcmp(ext,"WGL_EXT_create_context_es2_profile"))       return wgl_ext_create_context_es2_profile;
-  if (!strcmp(ext,"WGL_EXT_create_context_es_profile"))        return wgl_ext_create_context_es_profile;
-  if (!strcmp(ext,"WGL_EXT_depth_float"))                      return wgl_ext_depth_float;
-  if (!strcmp(ext,"WGL_EXT_display_color_table"))              return wgl_ext_display_color_table;
-  if (!strcmp(ext,"WGL_EXT_extensions_string"))                return wgl_ext_extensions_string;
-  if (!strcmp(ext,"WGL_EXT_framebuffer_sRGB"))                 return wgl_ext_framebuffer_srgb;
-  if (!strcmp(ext,"WGL_EXT_make_current_read"))                return wgl_ext_make_current_read;
-  if (!strcmp(ext,"WGL_EXT_multisample"))                      return wgl_ext_multisample;
-  if (!strcmp(ext,"WGL_EXT_pbuffer"))                          return wgl_ext_pbuffer;
-  if (!strcmp(ext,"WGL_EXT_pixel_format"))                     return wgl_ext_pixel_format;
-  if (!strcmp(ext,"WGL_EXT_pixel_format_packed_float"))        return wgl_ext_pixel_format_packed_float;
-  if (!strcmp(ext,"WGL_EXT_swap_control"))                     return wgl_ext_swap_control;
-  if (!strcmp(ext,"WGL_GDI"))                                  return wgl_gdi;
-  if (!strcmp(ext,"WGL_I3D_digital_video_control"))            return wgl_i3d_digital_video_control;
-  if (!strcmp(ext,"WGL_I3D_gamma"))                            return wgl_i3d_gamma;
-  if (!strcmp(ext,"WGL_I3D_genlock"))                          return wgl_i3d_genlock;
-  if (!strcmp(ext,"WGL_I3D_image_buffer"))                     return wgl_i3d_image_buffer;
-  if (!strcmp(ext,"WGL_I3D_swap_frame_lock"))                  return wgl_i3d_swap_frame_lock;
-  if (!strcmp(ext,"WGL_I3D_swap_frame_usage"))                 return wgl_i3d_swap_frame_usage;
-  if (!strcmp(ext,"WGL_NV_DX_interop"))                        return wgl_nv_dx_interop;
-  if (!strcmp(ext,"WGL_NV_copy_image"))                        return wgl_nv_copy_image;
-  if (!strcmp(ext,"WGL_NV_float_buffer"))                      return wgl_nv_float_buffer;
-  if (!strcmp(ext,"WGL_NV_gpu_affinity"))                      return wgl_nv_gpu_affinity;
-  if (!strcmp(ext,"WGL_NV_multisample_coverage"))              return wgl_nv_multisample_coverage;
-  if (!strcmp(ext,"WGL_NV_present_video"))                     return wgl_nv_present_video;
-  if (!strcmp(ext,"WGL_NV_render_depth_texture"))              return wgl_nv_render_depth_texture;
-  if (!strcmp(ext,"WGL_NV_render_texture_rectangle"))          return wgl_nv_render_texture_rectangle;
-  if (!strcmp(ext,"WGL_NV_swap_group"))                        return wgl_nv_swap_group;
-  if (!strcmp(ext,"WGL_NV_vertex_array_range"))                return wgl_nv_vertex_array_range;
-  if (!strcmp(ext,"WGL_NV_video_capture"))                     return wgl_nv_video_capture;
-  if (!strcmp(ext,"WGL_NV_video_output"))                      return wgl_nv_video_output;
-  if (!strcmp(ext,"WGL_OML_sync_control"))                     return wgl_oml_sync_control;
+    case 616:    return wgl_3dl_stereo_control;
+    case 617:    return wgl_amd_gpu_association;
+    case 618:    return wgl_arb_buffer_region;
+    case 619:    return wgl_arb_create_context;
+    case 620:    return wgl_arb_create_context_profile;
+    case 621:    return wgl_arb_create_context_robustness;
+    case 622:    return wgl_arb_extensions_string;
+    case 623:    return wgl_arb_framebuffer_srgb;
+    case 624:    return wgl_arb_make_current_read;
+    case 625:    return wgl_arb_multisample;
+    case 626:    return wgl_arb_pbuffer;
+    case 627:    return wgl_arb_pixel_format;
+    case 628:    return wgl_arb_pixel_format_float;
+    case 629:    return wgl_arb_render_texture;
+    case 630:    return wgl_arb_robustness_share_group_isolation;
+    case 631:    return wgl_ati_pixel_format_float;
+    case 632:    return wgl_ati_render_texture_rectangle;
+    case 633:    return wgl_ext_create_context_es2_profile;
+    case 634:    return wgl_ext_create_context_es_profile;
+    case 635:    return wgl_ext_depth_float;
+    case 636:    return wgl_ext_display_color_table;
+    case 637:    return wgl_ext_extensions_string;
+    case 638:    return wgl_ext_framebuffer_srgb;
+    case 639:    return wgl_ext_make_current_read;
+    case 640:    return wgl_ext_multisample;
+    case 641:    return wgl_ext_pbuffer;
+    case 642:    return wgl_ext_pixel_format;
+    case 643:    return wgl_ext_pixel_format_packed_float;
+    case 644:    return wgl_ext_swap_control;
+    case 645:    return wgl_gdi;
+    case 646:    return wgl_i3d_digital_video_control;
+    case 647:    return wgl_i3d_gamma;
+    case 648:    return wgl_i3d_genlock;
+    case 649:    return wgl_i3d_image_buffer;
+    case 650:    return wgl_i3d_swap_frame_lock;
+    case 651:    return wgl_i3d_swap_frame_usage;
+    case 652:    return wgl_nv_dx_interop;
+    case 653:    return wgl_nv_copy_image;
+    case 654:    return wgl_nv_float_buffer;
+    case 655:    return wgl_nv_gpu_affinity;
+    case 656:    return wgl_nv_multisample_coverage;
+    case 657:    return wgl_nv_present_video;
+    case 658:    return wgl_nv_render_depth_texture;
+    case 659:    return wgl_nv_render_texture_rectangle;
+    case 660:    return wgl_nv_swap_group;
+    case 661:    return wgl_nv_vertex_array_range;
+    case 662:    return wgl_nv_video_capture;
+    case 663:    return wgl_nv_video_output;
+    case 664:    return wgl_oml_sync_control;
 #endif /* REGAL_SYS_WGL */
 
 #if REGAL_SYS_GLX
-  if (!strcmp(ext,"GLX_3DFX_multisample"))                     return glx_3dfx_multisample;
-  if (!strcmp(ext,"GLX_AMD_gpu_association"))                  return glx_amd_gpu_association;
-  if (!strcmp(ext,"GLX_ARB_create_context"))                   return glx_arb_create_context;
-  if (!strcmp(ext,"GLX_ARB_create_context_profile"))           return glx_arb_create_context_profile;
-  if (!strcmp(ext,"GLX_ARB_create_context_robustness"))        return glx_arb_create_context_robustness;
-  if (!strcmp(ext,"GLX_ARB_fbconfig_float"))                   return glx_arb_fbconfig_float;
-  if (!strcmp(ext,"GLX_ARB_framebuffer_sRGB"))                 return glx_arb_framebuffer_srgb;
-  if (!strcmp(ext,"GLX_ARB_get_proc_address"))                 return glx_arb_get_proc_address;
-  if (!strcmp(ext,"GLX_ARB_multisample"))                      return glx_arb_multisample;
-  if (!strcmp(ext,"GLX_ARB_robustness_share_group_isolation")) return glx_arb_robustness_share_group_isolation;
-  if (!strcmp(ext,"GLX_ARB_vertex_buffer_object"))             return glx_arb_vertex_buffer_object;
-  if (!strcmp(ext,"GLX_ATI_pixel_format_float"))               return glx_ati_pixel_format_float;
-  if (!strcmp(ext,"GLX_ATI_render_texture"))                   return glx_ati_render_texture;
-  if (!strcmp(ext,"GLX_EXT_create_context_es2_profile"))       return glx_ext_create_context_es2_profile;
-  if (!strcmp(ext,"GLX_EXT_create_context_es_profile"))        return glx_ext_create_context_es_profile;
-  if (!strcmp(ext,"GLX_EXT_fbconfig_packed_float"))            return glx_ext_fbconfig_packed_float;
-  if (!strcmp(ext,"GLX_EXT_framebuffer_sRGB"))                 return glx_ext_framebuffer_srgb;
-  if (!strcmp(ext,"GLX_EXT_import_context"))                   return glx_ext_import_context;
-  if (!strcmp(ext,"GLX_EXT_swap_control"))                     return glx_ext_swap_control;
-  if (!strcmp(ext,"GLX_EXT_swap_control_tear"))                return glx_ext_swap_control_tear;
-  if (!strcmp(ext,"GLX_EXT_texture_from_pixmap"))              return glx_ext_texture_from_pixmap;
-  if (!strcmp(ext,"GLX_EXT_visual_info"))                      return glx_ext_visual_info;
-  if (!strcmp(ext,"GLX_EXT_visual_rating"))                    return glx_ext_visual_rating;
-  if (!strcmp(ext,"GLX_INTEL_swap_event"))                     return glx_intel_swap_event;
-  if (!strcmp(ext,"GLX_MESA_agp_offset"))                      return glx_mesa_agp_offset;
-  if (!strcmp(ext,"GLX_MESA_copy_sub_buffer"))                 return glx_mesa_copy_sub_buffer;
-  if (!strcmp(ext,"GLX_MESA_pixmap_colormap"))                 return glx_mesa_pixmap_colormap;
-  if (!strcmp(ext,"GLX_MESA_release_buffers"))                 return glx_mesa_release_buffers;
-  if (!strcmp(ext,"GLX_MESA_set_3dfx_mode"))                   return glx_mesa_set_3dfx_mode;
-  if (!strcmp(ext,"GLX_MESA_swap_control"))                    return glx_mesa_swap_control;
-  if (!strcmp(ext,"GLX_NV_copy_image"))                        return glx_nv_copy_image;
-  if (!strcmp(ext,"GLX_NV_float_buffer"))                      return glx_nv_float_buffer;
-  if (!strcmp(ext,"GLX_NV_multisample_coverage"))              return glx_nv_multisample_coverage;
-  if (!strcmp(ext,"GLX_NV_present_video"))                     return glx_nv_present_video;
-  if (!strcmp(ext,"GLX_NV_swap_group"))                        return glx_nv_swap_group;
-  if (!strcmp(ext,"GLX_NV_vertex_array_range"))                return glx_nv_vertex_array_range;
-  if (!strcmp(ext,"GLX_NV_video_capture"))                     return glx_nv_video_capture;
-  if (!strcmp(ext,"GLX_NV_video_output"))                      return glx_nv_video_output;
-  if (!strcmp(ext,"GLX_OML_swap_method"))                      return glx_oml_swap_method;
-  if (!strcmp(ext,"GLX_OML_sync_control"))                     return glx_oml_sync_control;
-  if (!strcmp(ext,"GLX_SGIS_blended_overlay"))                 return glx_sgis_blended_overlay;
-  if (!strcmp(ext,"GLX_SGIS_color_range"))                     return glx_sgis_color_range;
-  if (!strcmp(ext,"GLX_SGIS_multisample"))                     return glx_sgis_multisample;
-  if (!strcmp(ext,"GLX_SGIS_shared_multisample"))              return glx_sgis_shared_multisample;
-  if (!strcmp(ext,"GLX_SGIX_fbconfig"))                        return glx_sgix_fbconfig;
-  if (!strcmp(ext,"GLX_SGIX_hyperpipe"))                       return glx_sgix_hyperpipe;
-  if (!strcmp(ext,"GLX_SGIX_pbuffer"))                         return glx_sgix_pbuffer;
-  if (!strcmp(ext,"GLX_SGIX_swap_barrier"))                    return glx_sgix_swap_barrier;
-  if (!strcmp(ext,"GLX_SGIX_swap_group"))                      return glx_sgix_swap_group;
-  if (!strcmp(ext,"GLX_SGIX_video_resize"))                    return glx_sgix_video_resize;
-  if (!strcmp(ext,"GLX_SGIX_visual_select_group"))             return glx_sgix_visual_select_group;
-  if (!strcmp(ext,"GLX_SGI_cushion"))                          return glx_sgi_cushion;
-  if (!strcmp(ext,"GLX_SGI_make_current_read"))                return glx_sgi_make_current_read;
-  if (!strcmp(ext,"GLX_SGI_swap_control"))                     return glx_sgi_swap_control;
-  if (!strcmp(ext,"GLX_SGI_video_sync"))                       return glx_sgi_video_sync;
-  if (!strcmp(ext,"GLX_SUN_get_transparent_index"))            return glx_sun_get_transparent_index;
-  if (!strcmp(ext,"GLX_SUN_video_resize"))                     return glx_sun_video_resize;
+    case 28:     return glx_3dfx_multisample;
+    case 29:     return glx_amd_gpu_association;
+    case 30:     return glx_arb_create_context;
+    case 31:     return glx_arb_create_context_profile;
+    case 32:     return glx_arb_create_context_robustness;
+    case 33:     return glx_arb_fbconfig_float;
+    case 34:     return glx_arb_framebuffer_srgb;
+    case 35:     return glx_arb_get_proc_address;
+    case 36:     return glx_arb_multisample;
+    case 37:     return glx_arb_robustness_share_group_isolation;
+    case 38:     return glx_arb_vertex_buffer_object;
+    case 39:     return glx_ati_pixel_format_float;
+    case 40:     return glx_ati_render_texture;
+    case 41:     return glx_ext_create_context_es2_profile;
+    case 42:     return glx_ext_create_context_es_profile;
+    case 43:     return glx_ext_fbconfig_packed_float;
+    case 44:     return glx_ext_framebuffer_srgb;
+    case 45:     return glx_ext_import_context;
+    case 46:     return glx_ext_swap_control;
+    case 47:     return glx_ext_swap_control_tear;
+    case 48:     return glx_ext_texture_from_pixmap;
+    case 49:     return glx_ext_visual_info;
+    case 50:     return glx_ext_visual_rating;
+    case 51:     return glx_intel_swap_event;
+    case 52:     return glx_mesa_agp_offset;
+    case 53:     return glx_mesa_copy_sub_buffer;
+    case 54:     return glx_mesa_pixmap_colormap;
+    case 55:     return glx_mesa_release_buffers;
+    case 56:     return glx_mesa_set_3dfx_mode;
+    case 57:     return glx_mesa_swap_control;
+    case 58:     return glx_nv_copy_image;
+    case 59:     return glx_nv_float_buffer;
+    case 60:     return glx_nv_multisample_coverage;
+    case 61:     return glx_nv_present_video;
+    case 62:     return glx_nv_swap_group;
+    case 63:     return glx_nv_vertex_array_range;
+    case 64:     return glx_nv_video_capture;
+    case 65:     return glx_nv_video_output;
+    case 66:     return glx_oml_swap_method;
+    case 67:     return glx_oml_sync_control;
+    case 68:     return glx_sgis_blended_overlay;
+    case 69:     return glx_sgis_color_range;
+    case 70:     return glx_sgis_multisample;
+    case 71:     return glx_sgis_shared_multisample;
+    case 72:     return glx_sgix_fbconfig;
+    case 73:     return glx_sgix_hyperpipe;
+    case 74:     return glx_sgix_pbuffer;
+    case 75:     return glx_sgix_swap_barrier;
+    case 76:     return glx_sgix_swap_group;
+    case 77:     return glx_sgix_video_resize;
+    case 78:     return glx_sgix_visual_select_group;
+    case 79:     return glx_sgi_cushion;
+    case 80:     return glx_sgi_make_current_read;
+    case 81:     return glx_sgi_swap_control;
+    case 82:     return glx_sgi_video_sync;
+    case 83:     return glx_sun_get_transparent_index;
+    case 84:     return glx_sun_video_resize;
 #endif /* REGAL_SYS_GLX */
 
 #if REGAL_SYS_EGL
-  if (!strcmp(ext,"EGL_ANGLE_query_surface_pointer"))          return egl_angle_query_surface_pointer;
-  if (!strcmp(ext,"EGL_ANGLE_surface_d3d_texture_2d_share_handle")) return egl_angle_surface_d3d_texture_2d_share_handle;
-  if (!strcmp(ext,"EGL_EXT_create_context_robustness"))        return egl_ext_create_context_robustness;
-  if (!strcmp(ext,"EGL_EXT_multiview_window"))                 return egl_ext_multiview_window;
-  if (!strcmp(ext,"EGL_HI_colorformats"))                      return egl_hi_colorformats;
-  if (!strcmp(ext,"EGL_IMG_context_priority"))                 return egl_img_context_priority;
-  if (!strcmp(ext,"EGL_KHR_config_attribs"))                   return egl_khr_config_attribs;
-  if (!strcmp(ext,"EGL_KHR_create_context"))                   return egl_khr_create_context;
-  if (!strcmp(ext,"EGL_KHR_fence_sync"))                       return egl_khr_fence_sync;
-  if (!strcmp(ext,"EGL_KHR_gl_texture_cubemap_image"))         return egl_khr_gl_texture_cubemap_image;
-  if (!strcmp(ext,"EGL_KHR_image_base"))                       return egl_khr_image_base;
-  if (!strcmp(ext,"EGL_KHR_image_pixmap"))                     return egl_khr_image_pixmap;
-  if (!strcmp(ext,"EGL_KHR_lock_surface"))                     return egl_khr_lock_surface;
-  if (!strcmp(ext,"EGL_KHR_lock_surface2"))                    return egl_khr_lock_surface2;
-  if (!strcmp(ext,"EGL_KHR_reusable_sync"))                    return egl_khr_reusable_sync;
-  if (!strcmp(ext,"EGL_KHR_stream"))                           return egl_khr_stream;
-  if (!strcmp(ext,"EGL_KHR_stream_consumer_gltexture"))        return egl_khr_stream_consumer_gltexture;
-  if (!strcmp(ext,"EGL_KHR_stream_cross_process_fd"))          return egl_khr_stream_cross_process_fd;
-  if (!strcmp(ext,"EGL_KHR_stream_fifo"))                      return egl_khr_stream_fifo;
-  if (!strcmp(ext,"EGL_KHR_stream_producer_eglsurface"))       return egl_khr_stream_producer_eglsurface;
-  if (!strcmp(ext,"EGL_KHR_vg_parent_image"))                  return egl_khr_vg_parent_image;
-  if (!strcmp(ext,"EGL_KHR_wait_sync"))                        return egl_khr_wait_sync;
-  if (!strcmp(ext,"EGL_MESA_drm_image"))                       return egl_mesa_drm_image;
-  if (!strcmp(ext,"EGL_NV_coverage_sample"))                   return egl_nv_coverage_sample;
-  if (!strcmp(ext,"EGL_NV_coverage_sample_resolve"))           return egl_nv_coverage_sample_resolve;
-  if (!strcmp(ext,"EGL_NV_post_sub_buffer"))                   return egl_nv_post_sub_buffer;
-  if (!strcmp(ext,"EGL_NV_sync"))                              return egl_nv_sync;
-  if (!strcmp(ext,"EGL_NV_system_time"))                       return egl_nv_system_time;
+    case 0:      return egl_angle_query_surface_pointer;
+    case 1:      return egl_angle_surface_d3d_texture_2d_share_handle;
+    case 2:      return egl_ext_create_context_robustness;
+    case 3:      return egl_ext_multiview_window;
+    case 4:      return egl_hi_colorformats;
+    case 5:      return egl_img_context_priority;
+    case 6:      return egl_khr_config_attribs;
+    case 7:      return egl_khr_create_context;
+    case 8:      return egl_khr_fence_sync;
+    case 9:      return egl_khr_gl_texture_cubemap_image;
+    case 10:     return egl_khr_image_base;
+    case 11:     return egl_khr_image_pixmap;
+    case 12:     return egl_khr_lock_surface;
+    case 13:     return egl_khr_lock_surface2;
+    case 14:     return egl_khr_reusable_sync;
+    case 15:     return egl_khr_stream;
+    case 16:     return egl_khr_stream_consumer_gltexture;
+    case 17:     return egl_khr_stream_cross_process_fd;
+    case 18:     return egl_khr_stream_fifo;
+    case 19:     return egl_khr_stream_producer_eglsurface;
+    case 20:     return egl_khr_vg_parent_image;
+    case 21:     return egl_khr_wait_sync;
+    case 22:     return egl_mesa_drm_image;
+    case 23:     return egl_nv_coverage_sample;
+    case 24:     return egl_nv_coverage_sample_resolve;
+    case 25:     return egl_nv_post_sub_buffer;
+    case 26:     return egl_nv_sync;
+    case 27:     return egl_nv_system_time;
 #endif /* REGAL_SYS_EGL */
 
-  return false;
+    default:     return false;
+  }
+}
+
+void
+ContextInfo::setExtension(const size_t i, const bool value)
+{
+  switch (i)
+  {
+    case 85:     gl_3dfx_multisample = value; break;
+    case 86:     gl_3dfx_tbuffer = value; break;
+    case 87:     gl_3dfx_texture_compression_fxt1 = value; break;
+    case 88:     gl_amd_blend_minmax_factor = value; break;
+    case 89:     gl_amd_compressed_3dc_texture = value; break;
+    case 90:     gl_amd_compressed_atc_texture = value; break;
+    case 91:     gl_amd_debug_output = value; break;
+    case 92:     gl_amd_depth_clamp_separate = value; break;
+    case 93:     gl_amd_draw_buffers_blend = value; break;
+    case 94:     gl_amd_interleaved_elements = value; break;
+    case 95:     gl_amd_multi_draw_indirect = value; break;
+    case 96:     gl_amd_name_gen_delete = value; break;
+    case 97:     gl_amd_performance_monitor = value; break;
+    case 98:     gl_amd_pinned_memory = value; break;
+    case 99:     gl_amd_program_binary_z400 = value; break;
+    case 100:    gl_amd_query_buffer_object = value; break;
+    case 101:    gl_amd_sample_positions = value; break;
+    case 102:    gl_amd_seamless_cubemap_per_texture = value; break;
+    case 103:    gl_amd_sparse_texture = value; break;
+    case 104:    gl_amd_stencil_operation_extended = value; break;
+    case 105:    gl_amd_vertex_shader_tessellator = value; break;
+    case 106:    gl_angle_framebuffer_blit = value; break;
+    case 107:    gl_angle_framebuffer_multisample = value; break;
+    case 108:    gl_angle_instanced_arrays = value; break;
+    case 109:    gl_angle_pack_reverse_row_order = value; break;
+    case 110:    gl_angle_program_binary = value; break;
+    case 111:    gl_angle_texture_compression_dxt1 = value; break;
+    case 112:    gl_angle_texture_compression_dxt3 = value; break;
+    case 113:    gl_angle_texture_compression_dxt5 = value; break;
+    case 114:    gl_angle_texture_usage = value; break;
+    case 115:    gl_angle_timer_query = value; break;
+    case 116:    gl_angle_translated_shader_source = value; break;
+    case 117:    gl_apple_aux_depth_stencil = value; break;
+    case 118:    gl_apple_client_storage = value; break;
+    case 119:    gl_apple_copy_texture_levels = value; break;
+    case 120:    gl_apple_element_array = value; break;
+    case 121:    gl_apple_fence = value; break;
+    case 122:    gl_apple_float_pixels = value; break;
+    case 123:    gl_apple_flush_buffer_range = value; break;
+    case 124:    gl_apple_flush_render = value; break;
+    case 125:    gl_apple_framebuffer_multisample = value; break;
+    case 126:    gl_apple_object_purgeable = value; break;
+    case 127:    gl_apple_pixel_buffer = value; break;
+    case 128:    gl_apple_rgb_422 = value; break;
+    case 129:    gl_apple_row_bytes = value; break;
+    case 130:    gl_apple_specular_vector = value; break;
+    case 131:    gl_apple_sync = value; break;
+    case 132:    gl_apple_texture_max_level = value; break;
+    case 133:    gl_apple_texture_range = value; break;
+    case 134:    gl_apple_transform_hint = value; break;
+    case 135:    gl_apple_vertex_array_object = value; break;
+    case 136:    gl_apple_vertex_array_range = value; break;
+    case 137:    gl_apple_vertex_program_evaluators = value; break;
+    case 138:    gl_apple_ycbcr_422 = value; break;
+    case 139:    gl_arb_es2_compatibility = value; break;
+    case 140:    gl_arb_es3_compatibility = value; break;
+    case 141:    gl_arb_base_instance = value; break;
+    case 142:    gl_arb_bindless_texture = value; break;
+    case 143:    gl_arb_blend_func_extended = value; break;
+    case 144:    gl_arb_buffer_storage = value; break;
+    case 145:    gl_arb_cl_event = value; break;
+    case 146:    gl_arb_clear_buffer_object = value; break;
+    case 147:    gl_arb_clear_texture = value; break;
+    case 148:    gl_arb_color_buffer_float = value; break;
+    case 149:    gl_arb_compressed_texture_pixel_storage = value; break;
+    case 150:    gl_arb_compute_shader = value; break;
+    case 151:    gl_arb_compute_variable_group_size = value; break;
+    case 152:    gl_arb_copy_buffer = value; break;
+    case 153:    gl_arb_copy_image = value; break;
+    case 154:    gl_arb_debug_output = value; break;
+    case 155:    gl_arb_depth_buffer_float = value; break;
+    case 156:    gl_arb_depth_clamp = value; break;
+    case 157:    gl_arb_depth_texture = value; break;
+    case 158:    gl_arb_draw_buffers = value; break;
+    case 159:    gl_arb_draw_buffers_blend = value; break;
+    case 160:    gl_arb_draw_elements_base_vertex = value; break;
+    case 161:    gl_arb_draw_indirect = value; break;
+    case 162:    gl_arb_draw_instanced = value; break;
+    case 163:    gl_arb_enhanced_layouts = value; break;
+    case 164:    gl_arb_explicit_uniform_location = value; break;
+    case 165:    gl_arb_fragment_program = value; break;
+    case 166:    gl_arb_fragment_shader = value; break;
+    case 167:    gl_arb_framebuffer_no_attachments = value; break;
+    case 168:    gl_arb_framebuffer_object = value; break;
+    case 169:    gl_arb_framebuffer_srgb = value; break;
+    case 170:    gl_arb_geometry_shader4 = value; break;
+    case 171:    gl_arb_get_program_binary = value; break;
+    case 172:    gl_arb_gpu_shader5 = value; break;
+    case 173:    gl_arb_gpu_shader_fp64 = value; break;
+    case 174:    gl_arb_half_float_pixel = value; break;
+    case 175:    gl_arb_half_float_vertex = value; break;
+    case 176:    gl_arb_imaging = value; break;
+    case 177:    gl_arb_indirect_parameters = value; break;
+    case 178:    gl_arb_instanced_arrays = value; break;
+    case 179:    gl_arb_internalformat_query = value; break;
+    case 180:    gl_arb_internalformat_query2 = value; break;
+    case 181:    gl_arb_invalidate_subdata = value; break;
+    case 182:    gl_arb_map_buffer_alignment = value; break;
+    case 183:    gl_arb_map_buffer_range = value; break;
+    case 184:    gl_arb_matrix_palette = value; break;
+    case 185:    gl_arb_multi_bind = value; break;
+    case 186:    gl_arb_multi_draw_indirect = value; break;
+    case 187:    gl_arb_multisample = value; break;
+    case 188:    gl_arb_multitexture = value; break;
+    case 189:    gl_arb_occlusion_query = value; break;
+    case 190:    gl_arb_occlusion_query2 = value; break;
+    case 191:    gl_arb_pixel_buffer_object = value; break;
+    case 192:    gl_arb_point_parameters = value; break;
+    case 193:    gl_arb_point_sprite = value; break;
+    case 194:    gl_arb_program_interface_query = value; break;
+    case 195:    gl_arb_provoking_vertex = value; break;
+    case 196:    gl_arb_query_buffer_object = value; break;
+    case 197:    gl_arb_robustness = value; break;
+    case 198:    gl_arb_sample_shading = value; break;
+    case 199:    gl_arb_sampler_objects = value; break;
+    case 200:    gl_arb_seamless_cube_map = value; break;
+    case 201:    gl_arb_separate_shader_objects = value; break;
+    case 202:    gl_arb_shader_atomic_counters = value; break;
+    case 203:    gl_arb_shader_image_load_store = value; break;
+    case 204:    gl_arb_shader_objects = value; break;
+    case 205:    gl_arb_shader_storage_buffer_object = value; break;
+    case 206:    gl_arb_shader_subroutine = value; break;
+    case 207:    gl_arb_shading_language_100 = value; break;
+    case 208:    gl_arb_shading_language_include = value; break;
+    case 209:    gl_arb_shadow = value; break;
+    case 210:    gl_arb_shadow_ambient = value; break;
+    case 211:    gl_arb_sparse_texture = value; break;
+    case 212:    gl_arb_stencil_texturing = value; break;
+    case 213:    gl_arb_sync = value; break;
+    case 214:    gl_arb_tessellation_shader = value; break;
+    case 215:    gl_arb_texture_border_clamp = value; break;
+    case 216:    gl_arb_texture_buffer_object = value; break;
+    case 217:    gl_arb_texture_buffer_range = value; break;
+    case 218:    gl_arb_texture_compression = value; break;
+    case 219:    gl_arb_texture_compression_bptc = value; break;
+    case 220:    gl_arb_texture_compression_rgtc = value; break;
+    case 221:    gl_arb_texture_cube_map = value; break;
+    case 222:    gl_arb_texture_cube_map_array = value; break;
+    case 223:    gl_arb_texture_env_combine = value; break;
+    case 224:    gl_arb_texture_env_dot3 = value; break;
+    case 225:    gl_arb_texture_float = value; break;
+    case 226:    gl_arb_texture_gather = value; break;
+    case 227:    gl_arb_texture_mirror_clamp_to_edge = value; break;
+    case 228:    gl_arb_texture_mirrored_repeat = value; break;
+    case 229:    gl_arb_texture_multisample = value; break;
+    case 230:    gl_arb_texture_rectangle = value; break;
+    case 231:    gl_arb_texture_rg = value; break;
+    case 232:    gl_arb_texture_rgb10_a2ui = value; break;
+    case 233:    gl_arb_texture_storage = value; break;
+    case 234:    gl_arb_texture_storage_multisample = value; break;
+    case 235:    gl_arb_texture_swizzle = value; break;
+    case 236:    gl_arb_texture_view = value; break;
+    case 237:    gl_arb_timer_query = value; break;
+    case 238:    gl_arb_transform_feedback2 = value; break;
+    case 239:    gl_arb_transform_feedback3 = value; break;
+    case 240:    gl_arb_transform_feedback_instanced = value; break;
+    case 241:    gl_arb_transpose_matrix = value; break;
+    case 242:    gl_arb_uniform_buffer_object = value; break;
+    case 243:    gl_arb_vertex_array_object = value; break;
+    case 244:    gl_arb_vertex_attrib_64bit = value; break;
+    case 245:    gl_arb_vertex_attrib_binding = value; break;
+    case 246:    gl_arb_vertex_blend = value; break;
+    case 247:    gl_arb_vertex_buffer_object = value; break;
+    case 248:    gl_arb_vertex_program = value; break;
+    case 249:    gl_arb_vertex_shader = value; break;
+    case 250:    gl_arb_vertex_type_2_10_10_10_rev = value; break;
+    case 251:    gl_arb_viewport_array = value; break;
+    case 252:    gl_arb_window_pos = value; break;
+    case 253:    gl_arm_mali_program_binary = value; break;
+    case 254:    gl_arm_mali_shader_binary = value; break;
+    case 255:    gl_ati_draw_buffers = value; break;
+    case 256:    gl_ati_element_array = value; break;
+    case 257:    gl_ati_envmap_bumpmap = value; break;
+    case 258:    gl_ati_fragment_shader = value; break;
+    case 259:    gl_ati_map_object_buffer = value; break;
+    case 260:    gl_ati_meminfo = value; break;
+    case 261:    gl_ati_pn_triangles = value; break;
+    case 262:    gl_ati_separate_stencil = value; break;
+    case 263:    gl_ati_text_fragment_shader = value; break;
+    case 264:    gl_ati_texture_compression_3dc = value; break;
+    case 265:    gl_ati_texture_env_combine3 = value; break;
+    case 266:    gl_ati_texture_float = value; break;
+    case 267:    gl_ati_texture_mirror_once = value; break;
+    case 268:    gl_ati_vertex_array_object = value; break;
+    case 269:    gl_ati_vertex_attrib_array_object = value; break;
+    case 270:    gl_ati_vertex_streams = value; break;
+    case 271:    gl_dmp_shader_binary = value; break;
+    case 272:    gl_ext_422_pixels = value; break;
+    case 273:    gl_ext_cg_shader = value; break;
+    case 274:    gl_ext_abgr = value; break;
+    case 275:    gl_ext_bgra = value; break;
+    case 276:    gl_ext_bindable_uniform = value; break;
+    case 277:    gl_ext_blend_color = value; break;
+    case 278:    gl_ext_blend_equation_separate = value; break;
+    case 279:    gl_ext_blend_func_separate = value; break;
+    case 280:    gl_ext_blend_minmax = value; break;
+    case 281:    gl_ext_blend_subtract = value; break;
+    case 282:    gl_ext_clip_volume_hint = value; break;
+    case 283:    gl_ext_cmyka = value; break;
+    case 284:    gl_ext_color_buffer_half_float = value; break;
+    case 285:    gl_ext_color_subtable = value; break;
+    case 286:    gl_ext_compiled_vertex_array = value; break;
+    case 287:    gl_ext_convolution = value; break;
+    case 288:    gl_ext_coordinate_frame = value; break;
+    case 289:    gl_ext_copy_texture = value; break;
+    case 290:    gl_ext_cull_vertex = value; break;
+    case 291:    gl_ext_debug_label = value; break;
+    case 292:    gl_ext_debug_marker = value; break;
+    case 293:    gl_ext_depth_bounds_test = value; break;
+    case 294:    gl_ext_direct_state_access = value; break;
+    case 295:    gl_ext_discard_framebuffer = value; break;
+    case 296:    gl_ext_disjoint_timer_query = value; break;
+    case 297:    gl_ext_draw_buffers2 = value; break;
+    case 298:    gl_ext_draw_instanced = value; break;
+    case 299:    gl_ext_draw_range_elements = value; break;
+    case 300:    gl_ext_fog_coord = value; break;
+    case 301:    gl_ext_fragment_lighting = value; break;
+    case 302:    gl_ext_framebuffer_blit = value; break;
+    case 303:    gl_ext_framebuffer_multisample = value; break;
+    case 304:    gl_ext_framebuffer_multisample_blit_scaled = value; break;
+    case 305:    gl_ext_framebuffer_object = value; break;
+    case 306:    gl_ext_framebuffer_srgb = value; break;
+    case 307:    gl_ext_geometry_shader4 = value; break;
+    case 308:    gl_ext_gpu_program_parameters = value; break;
+    case 309:    gl_ext_gpu_shader4 = value; break;
+    case 310:    gl_ext_histogram = value; break;
+    case 311:    gl_ext_index_func = value; break;
+    case 312:    gl_ext_index_material = value; break;
+    case 313:    gl_ext_light_texture = value; break;
+    case 314:    gl_ext_map_buffer_range = value; break;
+    case 315:    gl_ext_multi_draw_arrays = value; break;
+    case 316:    gl_ext_multisample = value; break;
+    case 317:    gl_ext_multisampled_render_to_texture = value; break;
+    case 318:    gl_ext_multiview_draw_buffers = value; break;
+    case 319:    gl_ext_occlusion_query_boolean = value; break;
+    case 320:    gl_ext_packed_depth_stencil = value; break;
+    case 321:    gl_ext_packed_float = value; break;
+    case 322:    gl_ext_packed_pixels = value; break;
+    case 323:    gl_ext_paletted_texture = value; break;
+    case 324:    gl_ext_pixel_buffer_object = value; break;
+    case 325:    gl_ext_pixel_transform = value; break;
+    case 326:    gl_ext_point_parameters = value; break;
+    case 327:    gl_ext_polygon_offset = value; break;
+    case 328:    gl_ext_provoking_vertex = value; break;
+    case 329:    gl_ext_read_format_bgra = value; break;
+    case 330:    gl_ext_rescale_normal = value; break;
+    case 331:    gl_ext_robustness = value; break;
+    case 332:    gl_ext_srgb = value; break;
+    case 333:    gl_ext_scene_marker = value; break;
+    case 334:    gl_ext_secondary_color = value; break;
+    case 335:    gl_ext_separate_shader_objects = value; break;
+    case 336:    gl_ext_separate_specular_color = value; break;
+    case 337:    gl_ext_shader_framebuffer_fetch = value; break;
+    case 338:    gl_ext_shader_image_load_store = value; break;
+    case 339:    gl_ext_shadow_samplers = value; break;
+    case 340:    gl_ext_shared_texture_palette = value; break;
+    case 341:    gl_ext_stencil_clear_tag = value; break;
+    case 342:    gl_ext_stencil_two_side = value; break;
+    case 343:    gl_ext_stencil_wrap = value; break;
+    case 344:    gl_ext_subtexture = value; break;
+    case 345:    gl_ext_texture = value; break;
+    case 346:    gl_ext_texture3d = value; break;
+    case 347:    gl_ext_texture_array = value; break;
+    case 348:    gl_ext_texture_buffer_object = value; break;
+    case 349:    gl_ext_texture_compression_latc = value; break;
+    case 350:    gl_ext_texture_compression_rgtc = value; break;
+    case 351:    gl_ext_texture_compression_s3tc = value; break;
+    case 352:    gl_ext_texture_cube_map = value; break;
+    case 353:    gl_ext_texture_edge_clamp = value; break;
+    case 354:    gl_ext_texture_env_combine = value; break;
+    case 355:    gl_ext_texture_env_dot3 = value; break;
+    case 356:    gl_ext_texture_filter_anisotropic = value; break;
+    case 357:    gl_ext_texture_format_bgra8888 = value; break;
+    case 358:    gl_ext_texture_integer = value; break;
+    case 359:    gl_ext_texture_lod_bias = value; break;
+    case 360:    gl_ext_texture_mirror_clamp = value; break;
+    case 361:    gl_ext_texture_object = value; break;
+    case 362:    gl_ext_texture_perturb_normal = value; break;
+    case 363:    gl_ext_texture_rectangle = value; break;
+    case 364:    gl_ext_texture_rg = value; break;
+    case 365:    gl_ext_texture_srgb = value; break;
+    case 366:    gl_ext_texture_srgb_decode = value; break;
+    case 367:    gl_ext_texture_shared_exponent = value; break;
+    case 368:    gl_ext_texture_snorm = value; break;
+    case 369:    gl_ext_texture_storage = value; break;
+    case 370:    gl_ext_texture_swizzle = value; break;
+    case 371:    gl_ext_texture_type_2_10_10_10_rev = value; break;
+    case 372:    gl_ext_timer_query = value; break;
+    case 373:    gl_ext_transform_feedback = value; break;
+    case 374:    gl_ext_unpack_subimage = value; break;
+    case 375:    gl_ext_vertex_array = value; break;
+    case 376:    gl_ext_vertex_attrib_64bit = value; break;
+    case 377:    gl_ext_vertex_shader = value; break;
+    case 378:    gl_ext_vertex_weighting = value; break;
+    case 379:    gl_ext_x11_sync_object = value; break;
+    case 380:    gl_fj_shader_binary_gccso = value; break;
+    case 381:    gl_gremedy_frame_terminator = value; break;
+    case 382:    gl_gremedy_string_marker = value; break;
+    case 383:    gl_hp_image_transform = value; break;
+    case 384:    gl_hp_occlusion_test = value; break;
+    case 385:    gl_ibm_cull_vertex = value; break;
+    case 386:    gl_ibm_multimode_draw_arrays = value; break;
+    case 387:    gl_ibm_rasterpos_clip = value; break;
+    case 388:    gl_ibm_static_data = value; break;
+    case 389:    gl_ibm_texture_mirrored_repeat = value; break;
+    case 390:    gl_ibm_vertex_array_lists = value; break;
+    case 391:    gl_img_multisampled_render_to_texture = value; break;
+    case 392:    gl_img_program_binary = value; break;
+    case 393:    gl_img_read_format = value; break;
+    case 394:    gl_img_shader_binary = value; break;
+    case 395:    gl_img_texture_compression_pvrtc = value; break;
+    case 396:    gl_img_texture_compression_pvrtc2 = value; break;
+    case 397:    gl_img_texture_env_enhanced_fixed_function = value; break;
+    case 398:    gl_img_user_clip_plane = value; break;
+    case 399:    gl_ingr_blend_func_separate = value; break;
+    case 400:    gl_ingr_color_clamp = value; break;
+    case 401:    gl_ingr_interlace_read = value; break;
+    case 402:    gl_intel_map_texture = value; break;
+    case 403:    gl_intel_parallel_arrays = value; break;
+    case 404:    gl_intel_texture_scissor = value; break;
+    case 405:    gl_khr_debug = value; break;
+    case 406:    gl_khr_texture_compression_astc_ldr = value; break;
+    case 407:    gl_ktx_buffer_region = value; break;
+    case 408:    gl_mesax_texture_stack = value; break;
+    case 409:    gl_mesa_pack_invert = value; break;
+    case 410:    gl_mesa_resize_buffers = value; break;
+    case 411:    gl_mesa_window_pos = value; break;
+    case 412:    gl_mesa_ycbcr_texture = value; break;
+    case 413:    gl_nvx_conditional_render = value; break;
+    case 414:    gl_nvx_gpu_memory_info = value; break;
+    case 415:    gl_nv_3dvision_settings = value; break;
+    case 416:    gl_nv_bgr = value; break;
+    case 417:    gl_nv_bindless_texture = value; break;
+    case 418:    gl_nv_blend_equation_advanced = value; break;
+    case 419:    gl_nv_blend_square = value; break;
+    case 420:    gl_nv_compute_program5 = value; break;
+    case 421:    gl_nv_conditional_render = value; break;
+    case 422:    gl_nv_copy_buffer = value; break;
+    case 423:    gl_nv_copy_depth_to_color = value; break;
+    case 424:    gl_nv_copy_image = value; break;
+    case 425:    gl_nv_coverage_sample = value; break;
+    case 426:    gl_nv_deep_texture3d = value; break;
+    case 427:    gl_nv_depth_buffer_float = value; break;
+    case 428:    gl_nv_depth_clamp = value; break;
+    case 429:    gl_nv_depth_nonlinear = value; break;
+    case 430:    gl_nv_depth_range_unclamped = value; break;
+    case 431:    gl_nv_draw_buffers = value; break;
+    case 432:    gl_nv_draw_texture = value; break;
+    case 433:    gl_nv_evaluators = value; break;
+    case 434:    gl_nv_explicit_multisample = value; break;
+    case 435:    gl_nv_fbo_color_attachments = value; break;
+    case 436:    gl_nv_fence = value; break;
+    case 437:    gl_nv_float_buffer = value; break;
+    case 438:    gl_nv_fog_distance = value; break;
+    case 439:    gl_nv_fragment_program = value; break;
+    case 440:    gl_nv_fragment_program2 = value; break;
+    case 441:    gl_nv_framebuffer_blit = value; break;
+    case 442:    gl_nv_framebuffer_multisample = value; break;
+    case 443:    gl_nv_framebuffer_multisample_coverage = value; break;
+    case 444:    gl_nv_geometry_program4 = value; break;
+    case 445:    gl_nv_gpu_program4 = value; break;
+    case 446:    gl_nv_gpu_program5 = value; break;
+    case 447:    gl_nv_gpu_shader5 = value; break;
+    case 448:    gl_nv_half_float = value; break;
+    case 449:    gl_nv_instanced_arrays = value; break;
+    case 450:    gl_nv_light_max_exponent = value; break;
+    case 451:    gl_nv_multisample_coverage = value; break;
+    case 452:    gl_nv_multisample_filter_hint = value; break;
+    case 453:    gl_nv_non_square_matrices = value; break;
+    case 454:    gl_nv_occlusion_query = value; break;
+    case 455:    gl_nv_pack_subimage = value; break;
+    case 456:    gl_nv_packed_depth_stencil = value; break;
+    case 457:    gl_nv_packed_float_linear = value; break;
+    case 458:    gl_nv_parameter_buffer_object = value; break;
+    case 459:    gl_nv_path_rendering = value; break;
+    case 460:    gl_nv_pixel_buffer_object = value; break;
+    case 461:    gl_nv_pixel_data_range = value; break;
+    case 462:    gl_nv_platform_binary = value; break;
+    case 463:    gl_nv_point_sprite = value; break;
+    case 464:    gl_nv_present_video = value; break;
+    case 465:    gl_nv_primitive_restart = value; break;
+    case 466:    gl_nv_read_buffer = value; break;
+    case 467:    gl_nv_read_buffer_front = value; break;
+    case 468:    gl_nv_register_combiners = value; break;
+    case 469:    gl_nv_register_combiners2 = value; break;
+    case 470:    gl_nv_srgb_formats = value; break;
+    case 471:    gl_nv_shader_buffer_load = value; break;
+    case 472:    gl_nv_shadow_samplers_array = value; break;
+    case 473:    gl_nv_shadow_samplers_cube = value; break;
+    case 474:    gl_nv_tessellation_program5 = value; break;
+    case 475:    gl_nv_texgen_emboss = value; break;
+    case 476:    gl_nv_texgen_reflection = value; break;
+    case 477:    gl_nv_texture_array = value; break;
+    case 478:    gl_nv_texture_barrier = value; break;
+    case 479:    gl_nv_texture_border_clamp = value; break;
+    case 480:    gl_nv_texture_compression_latc = value; break;
+    case 481:    gl_nv_texture_compression_s3tc = value; break;
+    case 482:    gl_nv_texture_env_combine4 = value; break;
+    case 483:    gl_nv_texture_expand_normal = value; break;
+    case 484:    gl_nv_texture_multisample = value; break;
+    case 485:    gl_nv_texture_rectangle = value; break;
+    case 486:    gl_nv_texture_shader = value; break;
+    case 487:    gl_nv_texture_shader2 = value; break;
+    case 488:    gl_nv_texture_shader3 = value; break;
+    case 489:    gl_nv_transform_feedback = value; break;
+    case 490:    gl_nv_transform_feedback2 = value; break;
+    case 491:    gl_nv_vdpau_interop = value; break;
+    case 492:    gl_nv_vertex_array_range = value; break;
+    case 493:    gl_nv_vertex_array_range2 = value; break;
+    case 494:    gl_nv_vertex_attrib_integer_64bit = value; break;
+    case 495:    gl_nv_vertex_buffer_unified_memory = value; break;
+    case 496:    gl_nv_vertex_program = value; break;
+    case 497:    gl_nv_vertex_program2_option = value; break;
+    case 498:    gl_nv_vertex_program3 = value; break;
+    case 499:    gl_nv_vertex_program4 = value; break;
+    case 500:    gl_nv_video_capture = value; break;
+    case 501:    gl_oes_egl_image_external = value; break;
+    case 502:    gl_oes_blend_equation_separate = value; break;
+    case 503:    gl_oes_blend_func_separate = value; break;
+    case 504:    gl_oes_blend_subtract = value; break;
+    case 505:    gl_oes_compressed_etc1_rgb8_texture = value; break;
+    case 506:    gl_oes_compressed_paletted_texture = value; break;
+    case 507:    gl_oes_depth_texture = value; break;
+    case 508:    gl_oes_draw_texture = value; break;
+    case 509:    gl_oes_element_index_uint = value; break;
+    case 510:    gl_oes_fbo_render_mipmap = value; break;
+    case 511:    gl_oes_framebuffer_object = value; break;
+    case 512:    gl_oes_get_program_binary = value; break;
+    case 513:    gl_oes_mapbuffer = value; break;
+    case 514:    gl_oes_matrix_get = value; break;
+    case 515:    gl_oes_matrix_palette = value; break;
+    case 516:    gl_oes_packed_depth_stencil = value; break;
+    case 517:    gl_oes_point_size_array = value; break;
+    case 518:    gl_oes_point_sprite = value; break;
+    case 519:    gl_oes_read_format = value; break;
+    case 520:    gl_oes_required_internalformat = value; break;
+    case 521:    gl_oes_rgb8_rgba8 = value; break;
+    case 522:    gl_oes_single_precision = value; break;
+    case 523:    gl_oes_standard_derivatives = value; break;
+    case 524:    gl_oes_stencil1 = value; break;
+    case 525:    gl_oes_stencil4 = value; break;
+    case 526:    gl_oes_stencil8 = value; break;
+    case 527:    gl_oes_surfaceless_context = value; break;
+    case 528:    gl_oes_texture_3d = value; break;
+    case 529:    gl_oes_texture_cube_map = value; break;
+    case 530:    gl_oes_texture_mirrored_repeat = value; break;
+    case 531:    gl_oes_vertex_array_object = value; break;
+    case 532:    gl_oes_vertex_half_float = value; break;
+    case 533:    gl_oes_vertex_type_10_10_10_2 = value; break;
+    case 534:    gl_oml_interlace = value; break;
+    case 535:    gl_oml_resample = value; break;
+    case 536:    gl_oml_subsample = value; break;
+    case 537:    gl_pgi_misc_hints = value; break;
+    case 538:    gl_pgi_vertex_hints = value; break;
+    case 539:    gl_qcom_alpha_test = value; break;
+    case 540:    gl_qcom_binning_control = value; break;
+    case 541:    gl_qcom_driver_control = value; break;
+    case 542:    gl_qcom_extended_get = value; break;
+    case 543:    gl_qcom_extended_get2 = value; break;
+    case 544:    gl_qcom_perfmon_global_mode = value; break;
+    case 545:    gl_qcom_tiled_rendering = value; break;
+    case 546:    gl_qcom_writeonly_rendering = value; break;
+    case 547:    gl_regal_es1_0_compatibility = value; break;
+    case 548:    gl_regal_es1_1_compatibility = value; break;
+    case 549:    gl_regal_enable = value; break;
+    case 550:    gl_regal_error_string = value; break;
+    case 551:    gl_regal_extension_query = value; break;
+    case 552:    gl_regal_log = value; break;
+    case 553:    gl_regal_proc_address = value; break;
+    case 554:    gl_rend_screen_coordinates = value; break;
+    case 555:    gl_s3_s3tc = value; break;
+    case 556:    gl_sgis_color_range = value; break;
+    case 557:    gl_sgis_detail_texture = value; break;
+    case 558:    gl_sgis_fog_function = value; break;
+    case 559:    gl_sgis_generate_mipmap = value; break;
+    case 560:    gl_sgis_multisample = value; break;
+    case 561:    gl_sgis_pixel_texture = value; break;
+    case 562:    gl_sgis_point_line_texgen = value; break;
+    case 563:    gl_sgis_point_parameters = value; break;
+    case 564:    gl_sgis_sharpen_texture = value; break;
+    case 565:    gl_sgis_texture4d = value; break;
+    case 566:    gl_sgis_texture_border_clamp = value; break;
+    case 567:    gl_sgis_texture_color_mask = value; break;
+    case 568:    gl_sgis_texture_edge_clamp = value; break;
+    case 569:    gl_sgis_texture_filter4 = value; break;
+    case 570:    gl_sgis_texture_lod = value; break;
+    case 571:    gl_sgix_async = value; break;
+    case 572:    gl_sgix_async_histogram = value; break;
+    case 573:    gl_sgix_async_pixel = value; break;
+    case 574:    gl_sgix_blend_alpha_minmax = value; break;
+    case 575:    gl_sgix_convolution_accuracy = value; break;
+    case 576:    gl_sgix_depth_texture = value; break;
+    case 577:    gl_sgix_flush_raster = value; break;
+    case 578:    gl_sgix_fog_offset = value; break;
+    case 579:    gl_sgix_fog_texture = value; break;
+    case 580:    gl_sgix_fragment_lighting = value; break;
+    case 581:    gl_sgix_fragment_specular_lighting = value; break;
+    case 582:    gl_sgix_framezoom = value; break;
+    case 583:    gl_sgix_igloo_interface = value; break;
+    case 584:    gl_sgix_instruments = value; break;
+    case 585:    gl_sgix_interlace = value; break;
+    case 586:    gl_sgix_list_priority = value; break;
+    case 587:    gl_sgix_pixel_texture = value; break;
+    case 588:    gl_sgix_polynomial_ffd = value; break;
+    case 589:    gl_sgix_reference_plane = value; break;
+    case 590:    gl_sgix_resample = value; break;
+    case 591:    gl_sgix_shadow = value; break;
+    case 592:    gl_sgix_shadow_ambient = value; break;
+    case 593:    gl_sgix_sprite = value; break;
+    case 594:    gl_sgix_tag_sample_buffer = value; break;
+    case 595:    gl_sgix_texture_coordinate_clamp = value; break;
+    case 596:    gl_sgix_texture_multi_buffer = value; break;
+    case 597:    gl_sgix_texture_range = value; break;
+    case 598:    gl_sgix_texture_scale_bias = value; break;
+    case 599:    gl_sgix_vertex_preclip_hint = value; break;
+    case 600:    gl_sgix_ycrcb = value; break;
+    case 601:    gl_sgi_color_matrix = value; break;
+    case 602:    gl_sgi_color_table = value; break;
+    case 603:    gl_sgi_texture_color_table = value; break;
+    case 604:    gl_sunx_constant_data = value; break;
+    case 605:    gl_sun_convolution_border_modes = value; break;
+    case 606:    gl_sun_global_alpha = value; break;
+    case 607:    gl_sun_mesh_array = value; break;
+    case 608:    gl_sun_read_video_pixels = value; break;
+    case 609:    gl_sun_slice_accum = value; break;
+    case 610:    gl_sun_triangle_list = value; break;
+    case 611:    gl_sun_vertex = value; break;
+    case 612:    gl_viv_shader_binary = value; break;
+    case 613:    gl_win_phong_shading = value; break;
+    case 614:    gl_win_specular_fog = value; break;
+    case 615:    gl_win_swap_hint = value; break;
+
+#if REGAL_SYS_WGL
+    case 616:    wgl_3dl_stereo_control = value; break;
+    case 617:    wgl_amd_gpu_association = value; break;
+    case 618:    wgl_arb_buffer_region = value; break;
+    case 619:    wgl_arb_create_context = value; break;
+    case 620:    wgl_arb_create_context_profile = value; break;
+    case 621:    wgl_arb_create_context_robustness = value; break;
+    case 622:    wgl_arb_extensions_string = value; break;
+    case 623:    wgl_arb_framebuffer_srgb = value; break;
+    case 624:    wgl_arb_make_current_read = value; break;
+    case 625:    wgl_arb_multisample = value; break;
+    case 626:    wgl_arb_pbuffer = value; break;
+    case 627:    wgl_arb_pixel_format = value; break;
+    case 628:    wgl_arb_pixel_format_float = value; break;
+    case 629:    wgl_arb_render_texture = value; break;
+    case 630:    wgl_arb_robustness_share_group_isolation = value; break;
+    case 631:    wgl_ati_pixel_format_float = value; break;
+    case 632:    wgl_ati_render_texture_rectangle = value; break;
+    case 633:    wgl_ext_create_context_es2_profile = value; break;
+    case 634:    wgl_ext_create_context_es_profile = value; break;
+    case 635:    wgl_ext_depth_float = value; break;
+    case 636:    wgl_ext_display_color_table = value; break;
+    case 637:    wgl_ext_extensions_string = value; break;
+    case 638:    wgl_ext_framebuffer_srgb = value; break;
+    case 639:    wgl_ext_make_current_read = value; break;
+    case 640:    wgl_ext_multisample = value; break;
+    case 641:    wgl_ext_pbuffer = value; break;
+    case 642:    wgl_ext_pixel_format = value; break;
+    case 643:    wgl_ext_pixel_format_packed_float = value; break;
+    case 644:    wgl_ext_swap_control = value; break;
+    case 645:    wgl_gdi = value; break;
+    case 646:    wgl_i3d_digital_video_control = value; break;
+    case 647:    wgl_i3d_gamma = value; break;
+    case 648:    wgl_i3d_genlock = value; break;
+    case 649:    wgl_i3d_image_buffer = value; break;
+    case 650:    wgl_i3d_swap_frame_lock = value; break;
+    case 651:    wgl_i3d_swap_frame_usage = value; break;
+    case 652:    wgl_nv_dx_interop = value; break;
+    case 653:    wgl_nv_copy_image = value; break;
+    case 654:    wgl_nv_float_buffer = value; break;
+    case 655:    wgl_nv_gpu_affinity = value; break;
+    case 656:    wgl_nv_multisample_coverage = value; break;
+    case 657:    wgl_nv_present_video = value; break;
+    case 658:    wgl_nv_render_depth_texture = value; break;
+    case 659:    wgl_nv_render_texture_rectangle = value; break;
+    case 660:    wgl_nv_swap_group = value; break;
+    case 661:    wgl_nv_vertex_array_range = value; break;
+    case 662:    wgl_nv_video_capture = value; break;
+    case 663:    wgl_nv_video_output = value; break;
+    case 664:    wgl_oml_sync_control = value; break;
+#endif /* REGAL_SYS_WGL */
+
+#if REGAL_SYS_GLX
+    case 28:     glx_3dfx_multisample = value; break;
+    case 29:     glx_amd_gpu_association = value; break;
+    case 30:     glx_arb_create_context = value; break;
+    case 31:     glx_arb_create_context_profile = value; break;
+    case 32:     glx_arb_create_context_robustness = value; break;
+    case 33:     glx_arb_fbconfig_float = value; break;
+    case 34:     glx_arb_framebuffer_srgb = value; break;
+    case 35:     glx_arb_get_proc_address = value; break;
+    case 36:     glx_arb_multisample = value; break;
+    case 37:     glx_arb_robustness_share_group_isolation = value; break;
+    case 38:     glx_arb_vertex_buffer_object = value; break;
+    case 39:     glx_ati_pixel_format_float = value; break;
+    case 40:     glx_ati_render_texture = value; break;
+    case 41:     glx_ext_create_context_es2_profile = value; break;
+    case 42:     glx_ext_create_context_es_profile = value; break;
+    case 43:     glx_ext_fbconfig_packed_float = value; break;
+    case 44:     glx_ext_framebuffer_srgb = value; break;
+    case 45:     glx_ext_import_context = value; break;
+    case 46:     glx_ext_swap_control = value; break;
+    case 47:     glx_ext_swap_control_tear = value; break;
+    case 48:     glx_ext_texture_from_pixmap = value; break;
+    case 49:     glx_ext_visual_info = value; break;
+    case 50:     glx_ext_visual_rating = value; break;
+    case 51:     glx_intel_swap_event = value; break;
+    case 52:     glx_mesa_agp_offset = value; break;
+    case 53:     glx_mesa_copy_sub_buffer = value; break;
+    case 54:     glx_mesa_pixmap_colormap = value; break;
+    case 55:     glx_mesa_release_buffers = value; break;
+    case 56:     glx_mesa_set_3dfx_mode = value; break;
+    case 57:     glx_mesa_swap_control = value; break;
+    case 58:     glx_nv_copy_image = value; break;
+    case 59:     glx_nv_float_buffer = value; break;
+    case 60:     glx_nv_multisample_coverage = value; break;
+    case 61:     glx_nv_present_video = value; break;
+    case 62:     glx_nv_swap_group = value; break;
+    case 63:     glx_nv_vertex_array_range = value; break;
+    case 64:     glx_nv_video_capture = value; break;
+    case 65:     glx_nv_video_output = value; break;
+    case 66:     glx_oml_swap_method = value; break;
+    case 67:     glx_oml_sync_control = value; break;
+    case 68:     glx_sgis_blended_overlay = value; break;
+    case 69:     glx_sgis_color_range = value; break;
+    case 70:     glx_sgis_multisample = value; break;
+    case 71:     glx_sgis_shared_multisample = value; break;
+    case 72:     glx_sgix_fbconfig = value; break;
+    case 73:     glx_sgix_hyperpipe = value; break;
+    case 74:     glx_sgix_pbuffer = value; break;
+    case 75:     glx_sgix_swap_barrier = value; break;
+    case 76:     glx_sgix_swap_group = value; break;
+    case 77:     glx_sgix_video_resize = value; break;
+    case 78:     glx_sgix_visual_select_group = value; break;
+    case 79:     glx_sgi_cushion = value; break;
+    case 80:     glx_sgi_make_current_read = value; break;
+    case 81:     glx_sgi_swap_control = value; break;
+    case 82:     glx_sgi_video_sync = value; break;
+    case 83:     glx_sun_get_transparent_index = value; break;
+    case 84:     glx_sun_video_resize = value; break;
+#endif /* REGAL_SYS_GLX */
+
+#if REGAL_SYS_EGL
+    case 0:      egl_angle_query_surface_pointer = value; break;
+    case 1:      egl_angle_surface_d3d_texture_2d_share_handle = value; break;
+    case 2:      egl_ext_create_context_robustness = value; break;
+    case 3:      egl_ext_multiview_window = value; break;
+    case 4:      egl_hi_colorformats = value; break;
+    case 5:      egl_img_context_priority = value; break;
+    case 6:      egl_khr_config_attribs = value; break;
+    case 7:      egl_khr_create_context = value; break;
+    case 8:      egl_khr_fence_sync = value; break;
+    case 9:      egl_khr_gl_texture_cubemap_image = value; break;
+    case 10:     egl_khr_image_base = value; break;
+    case 11:     egl_khr_image_pixmap = value; break;
+    case 12:     egl_khr_lock_surface = value; break;
+    case 13:     egl_khr_lock_surface2 = value; break;
+    case 14:     egl_khr_reusable_sync = value; break;
+    case 15:     egl_khr_stream = value; break;
+    case 16:     egl_khr_stream_consumer_gltexture = value; break;
+    case 17:     egl_khr_stream_cross_process_fd = value; break;
+    case 18:     egl_khr_stream_fifo = value; break;
+    case 19:     egl_khr_stream_producer_eglsurface = value; break;
+    case 20:     egl_khr_vg_parent_image = value; break;
+    case 21:     egl_khr_wait_sync = value; break;
+    case 22:     egl_mesa_drm_image = value; break;
+    case 23:     egl_nv_coverage_sample = value; break;
+    case 24:     egl_nv_coverage_sample_resolve = value; break;
+    case 25:     egl_nv_post_sub_buffer = value; break;
+    case 26:     egl_nv_sync = value; break;
+    case 27:     egl_nv_system_time = value; break;
+#endif /* REGAL_SYS_EGL */
+
+    default:     break;
+  }
 }
 
 REGAL_NAMESPACE_END
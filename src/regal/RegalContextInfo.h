@@ -66,6 +66,16 @@ struct ContextInfo
   // glewGetExtension
 
   bool getExtension(const char *ext) const;
+  bool getExtension(const size_t i) const;
+  void setExtension(const size_t i, const bool value);
+
+  // Index of extension name, as used by getExtension
+
+  static size_t extensionIndex(const char *ext);
+
+  // Extension name of index, or NULL past the last one
+
+  static const char *extensionName(const size_t i);
 
   // As reported by OpenGL implementation
 
@@ -821,8 +831,6 @@ struct ContextInfo
 
   GLboolean gl_quads_follow_provoking_vertex_convention;
 
-private:
-  static bool stringSetFind(const std::set<std::string> &stringSet, const std::string &val);
 };
 
 REGAL_NAMESPACE_END
@@ -4318,6 +4318,7 @@ namespace Dispatch
 
   // Lookup a function pointer from the table,
   // or deeper in the stack as necessary.
+  // For tables outside a Dispatcher, such as for testing.
 
   template<typename T, typename F>
   F call(T &table, F *func)
@@ -4352,6 +4353,19 @@ namespace Dispatch
     return f;
   }
 
+  // Lookup a function pointer from the flattened stack
+  // of a table in a Dispatcher, see Dispatcher::resolve
+
+  template<typename T, typename F>
+  inline F resolved(T &table, F *func)
+  {
+    RegalAssert(func);
+    RegalAssert(table._resolved);
+
+    const std::size_t offset = reinterpret_cast<char *>(func) - reinterpret_cast<char *>(&table);
+    return *reinterpret_cast<F *>(reinterpret_cast<void *>(table._resolved + offset/sizeof(void *)));
+  }
+
 }
 
 struct DispatchTable
@@ -4359,12 +4373,13 @@ struct DispatchTable
   bool           _enabled;
   DispatchTable *_prev;
   DispatchTable *_next;
+  void         **_resolved;   // Function pointers resolved by the Dispatcher, or NULL
 };
 
 struct DispatchTableGL : public DispatchTable, Dispatch::GL
 {
 public:
-  template<typename T> T call(T *func) { return reinterpret_cast<T>(doCall(reinterpret_cast<void **>(func))); }
+  template<typename T> T call(T *func) { return _resolved ? Dispatch::resolved(*this,func) : reinterpret_cast<T>(doCall(reinterpret_cast<void **>(func))); }
   inline DispatchTableGL *next()       { return reinterpret_cast<DispatchTableGL *>(DispatchTable::_next);    }
 
 private:
@@ -4376,7 +4391,7 @@ struct DispatchTableGlobal : public DispatchTable, Dispatch::Global
   DispatchTableGlobal();
   ~DispatchTableGlobal();
 
-  template<typename T> T call(T *func) { return reinterpret_cast<T>(doCall(reinterpret_cast<void **>(func)));  }
+  template<typename T> T call(T *func) { return _resolved ? Dispatch::resolved(*this,func) : reinterpret_cast<T>(doCall(reinterpret_cast<void **>(func)));  }
   inline DispatchTableGlobal *next()   { return reinterpret_cast<DispatchTableGlobal *>(DispatchTable::_next); }
 
 private:
@@ -44,6 +44,7 @@ REGAL_GLOBAL_BEGIN
 #endif
 
 #include "RegalMutex.h"
+#include "RegalTimer.h"
 
 REGAL_GLOBAL_END
 
@@ -145,6 +146,7 @@ public:
   void AcquireAppContext( RegalContext * ctx );      // called by http server
   void ReleaseAppContext( RegalContext * ctx );      // called by http server
   void ContinueFromBreakpoint( RegalContext * ctx, HttpRunState rs ); // called by http server
+  void ClientRequest();                              // called by http server, for each request
 
   Thread::Mutex *contextMutex;
   Thread::Mutex *breakpointMutex;
@@ -153,6 +155,9 @@ public:
   int debugGroupStackDepth;
   int stepOverGroupDepth;
   int inBeginEnd;
+  bool logCalls;                                 // format calls for the log, while an http client is active
+  Timer clientTimer;                             // since the last http request
+  GLuint64 clientFrame;                          // frame of the last check for an active client
   std::string callString;
   std::deque<std::string> callLog;
 
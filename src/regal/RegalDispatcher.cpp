@@ -45,9 +45,10 @@ REGAL_GLOBAL_END
 
 REGAL_NAMESPACE_BEGIN
 
-Dispatcher::Dispatcher()
+Dispatcher::Dispatcher(const size_t tableSize)
 : _front(NULL),
-  _size(0)
+  _size(0),
+  _tableSize(tableSize)
 {
 }
 
@@ -74,6 +75,8 @@ Dispatcher::push_back(DispatchTable &table, bool enabled)
 
   if (!_size++)
     _front = &table;
+
+  resolve();
 }
 
 bool
@@ -92,11 +95,13 @@ Dispatcher::erase(DispatchTable &table)
       table._prev->_next = table._next;
     table._next = NULL;
     table._prev = NULL;
+    table._resolved = NULL;
 
     _table.erase(i);
 
     _size--;
     _front = _size ? _table.front() : NULL;
+    resolve();
     return true;
   }
 
@@ -120,9 +125,53 @@ Dispatcher::insert(DispatchTable &other, DispatchTable &table)
 
     _size++;
     _front = _table.front();
+    resolve();
     return true;
   }
   return false;
 }
 
+// For each table in the stack, the first function pointer that
+// is not NULL in an enabled table, from that table down.  This is
+// what Dispatch::call would otherwise step down the stack for.
+
+void
+Dispatcher::resolve()
+{
+  const size_t words = _tableSize/sizeof(void *);
+  const size_t first = sizeof(DispatchTable)/sizeof(void *);
+
+  _resolved.resize(_size*words);
+
+  for (size_t i = _size; i--; )
+  {
+    DispatchTable &table = *_table[i];
+    void **func     = reinterpret_cast<void **>(&table);
+    void **resolved = &_resolved[i*words];
+    void **below    = i+1<_size ? resolved + words : NULL;
+
+    for (size_t j = first; j<words; ++j)
+      resolved[j] = table._enabled && func[j] ? func[j] : (below ? below[j] : NULL);
+
+    table._resolved = resolved;
+  }
+}
+
+void
+Dispatcher::refresh(DispatchTable &table, void **func)
+{
+  // Not in a Dispatcher
+
+  if (!table._resolved)
+    return;
+
+  const size_t j = func - reinterpret_cast<void **>(&table);
+
+  for (DispatchTable *i = &table; i; i = i->_prev)
+  {
+    void **f = reinterpret_cast<void **>(i);
+    i->_resolved[j] = i->_enabled && f[j] ? f[j] : (i->_next ? i->_next->_resolved[j] : NULL);
+  }
+}
+
 REGAL_NAMESPACE_END
@@ -47,7 +47,7 @@ REGAL_NAMESPACE_BEGIN
 struct Dispatcher
 {
 public:
-  Dispatcher();
+  Dispatcher(const std::size_t tableSize);    // sizeof DispatchTableGL or DispatchTableGlobal
   ~Dispatcher();
 
   inline std::size_t size() const
@@ -55,6 +55,11 @@ public:
     return _size;
   }
 
+  // Update the flattened stack for a function pointer
+  // set after push_back, such as by the lazy loader
+
+  static void refresh(DispatchTable &table, void **func);
+
 protected:
   void push_back(DispatchTable &table, bool enable);           // Push to the back of the stack
   bool erase    (DispatchTable &table);                        // Remove from dispatch stack
@@ -64,12 +69,14 @@ protected:
   enable(DispatchTable &table)
   {
     table._enabled = true;
+    resolve();
   }
 
   inline void
   disable(DispatchTable &table)
   {
     table._enabled = false;
+    resolve();
   }
 
   inline bool isEnabled(DispatchTable &table) const
@@ -96,9 +103,13 @@ protected:
   }
 
 private:
+  void resolve();                                              // Flatten the dispatch stack
+
   std::vector<DispatchTable *>  _table;
   DispatchTable                *_front;
   std::size_t                   _size;
+  std::size_t                   _tableSize;
+  std::vector<void *>           _resolved;                     // Function pointers for each table
 };
 
 REGAL_NAMESPACE_END
@@ -38,6 +38,8 @@ REGAL_GLOBAL_BEGIN
 #include <algorithm>
 
 #include "RegalConfig.h"
+#include "RegalThread.h"
+#include "RegalContext.h"
 #include "RegalDispatcherGL.h"
 
 using namespace ::std;
@@ -47,7 +49,7 @@ REGAL_GLOBAL_END
 REGAL_NAMESPACE_BEGIN
 
 DispatcherGL::DispatcherGL()
-: Dispatcher()
+: Dispatcher(sizeof(DispatchTableGL))
 {
   #if REGAL_TRACE
   ::memset(&trace,0,sizeof(DispatchTableGL));
@@ -131,4 +133,16 @@ DispatcherGL::~DispatcherGL()
 {
 }
 
+// Layers are enabled and disabled by the thread the context
+// is current to, such as for glEnable(GL_LOG_REGAL), so only
+// the TLS of this thread needs updating.
+
+void
+DispatcherGL::current()
+{
+  Thread::ThreadLocal &instance = Thread::ThreadLocal::instance();
+  if (instance.currentContext && &instance.currentContext->dispatcher==this)
+    instance.currentDispatchTable = size() ? &front() : NULL;
+}
+
 REGAL_NAMESPACE_END
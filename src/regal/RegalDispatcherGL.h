@@ -102,17 +102,20 @@ public:
     Dispatcher::push_back(table,enable);
   }
 
-  inline bool erase    (DispatchTableGL &table)                         { return Dispatcher::erase(table); }
-  inline bool insert   (DispatchTableGL &other, DispatchTableGL &table) { return Dispatcher::insert(other,table); }
+  inline bool erase    (DispatchTableGL &table)                         { bool ret = Dispatcher::erase(table);        current(); return ret; }
+  inline bool insert   (DispatchTableGL &other, DispatchTableGL &table) { bool ret = Dispatcher::insert(other,table); current(); return ret; }
 
-  inline void enable (DispatchTableGL &table)             { Dispatcher::enable (table); }
-  inline void disable(DispatchTableGL &table)             { Dispatcher::disable(table); }
+  inline void enable (DispatchTableGL &table)             { Dispatcher::enable (table); current(); }
+  inline void disable(DispatchTableGL &table)             { Dispatcher::disable(table); current(); }
 
   inline bool isEnabled(DispatchTableGL &table) const     { return Dispatcher::isEnabled(table); }
 
   inline DispatchTableGL &operator[](const std::size_t i) { return reinterpret_cast<DispatchTableGL &>(Dispatcher::operator[](i)); }
   inline DispatchTableGL &front()                         { return reinterpret_cast<DispatchTableGL &>(Dispatcher::front());       }
   inline DispatchTableGL &back()                          { return reinterpret_cast<DispatchTableGL &>(Dispatcher::back());        }
+
+private:
+  void current();                                         // Update the front of the stack cached in TLS
 };
 
 // regaltest needs these declarations too
@@ -129,7 +132,7 @@ extern void InitDispatchTableCache     (DispatchTableGL &tbl);
 extern void InitDispatchTableTrace     (DispatchTableGL &tbl);
 extern void InitDispatchTableHttp     (DispatchTableGL &tbl);
 
-namespace Loader  { extern void Init(DispatchTableGL &tbl); }
+namespace Loader  { extern void Init(DispatchTableGL &tbl); extern void Eager(DispatchTableGL &tbl); }
 namespace Missing { extern void Init(DispatchTableGL &tbl); }
 
 REGAL_NAMESPACE_END
@@ -49,7 +49,7 @@ REGAL_NAMESPACE_BEGIN
 DispatcherGlobal dispatcherGlobal;
 
 DispatcherGlobal::DispatcherGlobal()
-: Dispatcher()
+: Dispatcher(sizeof(DispatchTableGlobal))
 {
   #if REGAL_HTTP
   InitDispatchTableGlobalHttp(http);
@@ -108,7 +108,7 @@ extern void InitDispatchTableGlobalLog       (DispatchTableGlobal &tbl);
 extern void InitDispatchTableGlobalGLX       (DispatchTableGlobal &tbl);
 extern void InitDispatchTableGlobalTrace     (DispatchTableGlobal &tbl);
 
-namespace Loader  { extern void Init(DispatchTableGlobal &tbl); }
+namespace Loader  { extern void Init(DispatchTableGlobal &tbl); extern void Eager(DispatchTableGlobal &tbl); }
 namespace Missing { extern void Init(DispatchTableGlobal &tbl); }
 
 REGAL_NAMESPACE_END
@@ -245,41 +245,45 @@ EmuInfo::getExtension(const ContextInfo &contextInfo, const char *ext) const
 
   // If the context supports it, we're done.
 
-  if (contextInfo.getExtension(ext))
+  const size_t i = contextInfo.extensionIndex(ext);
+  if (contextInfo.getExtension(i))
     return true;
 
-  if (!strcmp(ext,"GL_ARB_draw_buffers"))               return gl_arb_draw_buffers;
-  if (!strcmp(ext,"GL_ARB_draw_elements_base_vertex"))  return gl_arb_draw_elements_base_vertex;
-  if (!strcmp(ext,"GL_ARB_multitexture"))               return gl_arb_multitexture;
-  if (!strcmp(ext,"GL_ARB_sampler_objects"))            return gl_arb_sampler_objects;
-  if (!strcmp(ext,"GL_ARB_texture_cube_map"))           return gl_arb_texture_cube_map;
-  if (!strcmp(ext,"GL_ARB_texture_env_combine"))        return gl_arb_texture_env_combine;
-  if (!strcmp(ext,"GL_ARB_texture_env_dot3"))           return gl_arb_texture_env_dot3;
-  if (!strcmp(ext,"GL_ARB_texture_storage"))            return gl_arb_texture_storage;
-  if (!strcmp(ext,"GL_ARB_vertex_array_object"))        return gl_arb_vertex_array_object;
-  if (!strcmp(ext,"GL_ATI_draw_buffers"))               return gl_ati_draw_buffers;
-  if (!strcmp(ext,"GL_EXT_blend_color"))                return gl_ext_blend_color;
-  if (!strcmp(ext,"GL_EXT_blend_subtract"))             return gl_ext_blend_subtract;
-  if (!strcmp(ext,"GL_EXT_debug_marker"))               return true;
-  if (!strcmp(ext,"GL_EXT_direct_state_access"))        return gl_ext_direct_state_access;
-  if (!strcmp(ext,"GL_EXT_framebuffer_blit"))           return gl_ext_framebuffer_blit;
-  if (!strcmp(ext,"GL_EXT_framebuffer_object"))         return gl_ext_framebuffer_object;
-  if (!strcmp(ext,"GL_EXT_texture_cube_map"))           return gl_ext_texture_cube_map;
-  if (!strcmp(ext,"GL_EXT_texture_edge_clamp"))         return gl_ext_texture_edge_clamp;
-  if (!strcmp(ext,"GL_EXT_texture_env_combine"))        return gl_ext_texture_env_combine;
-  if (!strcmp(ext,"GL_EXT_texture_env_dot3"))           return gl_ext_texture_env_dot3;
-  if (!strcmp(ext,"GL_IBM_texture_mirrored_repeat"))    return gl_ibm_texture_mirrored_repeat;
-  if (!strcmp(ext,"GL_NV_blend_square"))                return gl_nv_blend_square;
-  if (!strcmp(ext,"GL_NV_path_rendering"))              return gl_nv_path_rendering;
-  if (!strcmp(ext,"GL_REGAL_ES1_0_compatibility"))      return true;
-  if (!strcmp(ext,"GL_REGAL_ES1_1_compatibility"))      return true;
-  if (!strcmp(ext,"GL_REGAL_enable"))                   return true;
-  if (!strcmp(ext,"GL_REGAL_error_string"))             return true;
-  if (!strcmp(ext,"GL_REGAL_extension_query"))          return true;
-  if (!strcmp(ext,"GL_REGAL_log"))                      return true;
-  if (!strcmp(ext,"GL_REGAL_proc_address"))             return true;
-
-  return false;
+  switch (i)
+  {
+    case 158:    return gl_arb_draw_buffers;
+    case 160:    return gl_arb_draw_elements_base_vertex;
+    case 188:    return gl_arb_multitexture;
+    case 199:    return gl_arb_sampler_objects;
+    case 221:    return gl_arb_texture_cube_map;
+    case 223:    return gl_arb_texture_env_combine;
+    case 224:    return gl_arb_texture_env_dot3;
+    case 233:    return gl_arb_texture_storage;
+    case 243:    return gl_arb_vertex_array_object;
+    case 255:    return gl_ati_draw_buffers;
+    case 277:    return gl_ext_blend_color;
+    case 281:    return gl_ext_blend_subtract;
+    case 292:    return true;
+    case 294:    return gl_ext_direct_state_access;
+    case 302:    return gl_ext_framebuffer_blit;
+    case 305:    return gl_ext_framebuffer_object;
+    case 352:    return gl_ext_texture_cube_map;
+    case 353:    return gl_ext_texture_edge_clamp;
+    case 354:    return gl_ext_texture_env_combine;
+    case 355:    return gl_ext_texture_env_dot3;
+    case 389:    return gl_ibm_texture_mirrored_repeat;
+    case 419:    return gl_nv_blend_square;
+    case 459:    return gl_nv_path_rendering;
+    case 547:    return true;
+    case 548:    return true;
+    case 549:    return true;
+    case 550:    return true;
+    case 551:    return true;
+    case 552:    return true;
+    case 553:    return true;
+
+    default:     return false;
+  }
 }
 
 bool
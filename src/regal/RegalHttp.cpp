@@ -115,6 +115,11 @@ namespace Http
   mg_callbacks callbacks;         // Callbacks
   mg_context   *ctx = NULL;       // civetweb context
 
+  // Calls are formatted for the log from the first request,
+  // until there has been no request for ten seconds
+
+  const Timer::Value clientTimeout = 10000000;
+
   struct Connection {
     Connection( mg_connection * conn ) : connection( conn ) {
       request_info = mg_get_request_info( conn );
@@ -218,6 +223,11 @@ namespace Http
            request_info->query_string   ? request_info->query_string   : "");
 #endif
 
+    RegalContext * ctx = ::REGAL_NAMESPACE_INTERNAL::Init::getContextByIndex( 0 );
+    if( ctx ) {
+      ctx->http.ClientRequest();
+    }
+
     Connection connection( conn );
 
     if( connection.path.size() > 0 ) {
@@ -1377,7 +1387,7 @@ namespace Http
 
 }
 
-DispatchHttpState::DispatchHttpState() : runState( RS_Run ), debugGroupStackDepth( -1 ), stepOverGroupDepth( -1 ), inBeginEnd( 0 )
+DispatchHttpState::DispatchHttpState() : runState( RS_Run ), debugGroupStackDepth( -1 ), stepOverGroupDepth( -1 ), inBeginEnd( 0 ), logCalls( false ), clientFrame( 0 )
 {
   contextMutex = new Thread::Mutex();
   breakpointMutex = new Thread::Mutex( Thread::MT_Normal );
@@ -1408,7 +1418,17 @@ DispatchHttpState::~DispatchHttpState()
 
 void DispatchHttpState::YieldToHttpServer( RegalContext * ctx, bool log )
 {
-  if( log ) {
+  // once per frame, stop logging calls if the clients have gone away
+
+  if( logCalls && count.frame != clientFrame ) {
+    clientFrame = count.frame;
+    if( clientTimer.elapsed() > Http::clientTimeout ) {
+      logCalls = false;
+      callLog.clear();
+    }
+  }
+
+  if( log && logCalls ) {
     callLog.push_back( callString );
     static GLuint64 sz = 0;
     sz = max( sz, ( count.call - count.lastFrame + 1 ) );
@@ -1480,6 +1500,12 @@ void DispatchHttpState::ReleaseAppContext( RegalContext * ctx )
   ctx->http.contextMutex->release();
 }
 
+void DispatchHttpState::ClientRequest()
+{
+  clientTimer.restart();
+  logCalls = true;
+}
+
 void DispatchHttpState::ContinueFromBreakpoint( RegalContext * ctx, HttpRunState rs )
 {
   UNUSED_PARAMETER(ctx);
@@ -308,6 +308,8 @@ ThreadLocal ThreadLocal::_instance;
     #else
       __declspec(thread) ThreadLocal ThreadLocal::_instance;
     #endif
+  #elif REGAL_GCC_TLS
+    __thread ThreadLocal ThreadLocal::_instance REGAL_TLS_ATTRIBUTE;
   #else
     pthread_key_t ThreadLocal::_instanceKey(~0);
   #endif
@@ -322,7 +324,7 @@ struct ThreadLocalInit
         #if REGAL_WIN_TLS
           ThreadLocal::_instanceIndex = TlsAlloc();
         #endif
-      #else
+      #elif !REGAL_GCC_TLS
         pthread_key_create(&ThreadLocal::_instanceKey, NULL);
       #endif
     #endif
@@ -334,7 +336,7 @@ struct ThreadLocalInit
         #if REGAL_WIN_TLS
           TlsFree(ThreadLocal::_instanceIndex);
         #endif
-      #else
+      #elif !REGAL_GCC_TLS
         // TODO ThreadLocal::_instanceKey
       #endif
     #endif
@@ -351,7 +353,8 @@ Init::setContextTLS(RegalContext *context)
   Internal("Init::setContextTLS","thread=",boost::print::optional(::boost::print::hex(Thread::threadId()),Logging::thread)," context=",boost::print::optional(context,Logging::pointers));
 
   Thread::ThreadLocal &instance = Thread::ThreadLocal::instance();
-  instance.currentContext = context;
+  instance.currentContext       = context;
+  instance.currentDispatchTable = context && context->dispatcher.size() ? &context->dispatcher.front() : NULL;
 }
 
 void
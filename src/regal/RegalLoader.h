@@ -0,0 +1,103 @@
+/*
+  Copyright (c) 2011 NVIDIA Corporation
+  Copyright (c) 2011-2012 Cass Everitt
+  Copyright (c) 2012 Scott Nations
+  Copyright (c) 2012 Mathias Schott
+  Copyright (c) 2012 Nigel Stewart
+  All rights reserved.
+
+  Redistribution and use in source and binary forms, with or without modification,
+  are permitted provided that the following conditions are met:
+
+    Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+  IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT,
+  INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+  DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE
+  OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
+  OF THE POSSIBILITY OF SUCH DAMAGE.
+*/
+
+#ifndef __REGAL_LOADER_H__
+#define __REGAL_LOADER_H__
+
+#include "RegalUtil.h"
+
+REGAL_GLOBAL_BEGIN
+
+#include <set>
+#include <string>
+#include <cstddef>
+
+REGAL_GLOBAL_END
+
+REGAL_NAMESPACE_BEGIN
+
+struct DispatchTable;
+
+namespace Loader
+{
+  // Generated table of driver entry points, for eager loading
+
+  struct Entry
+  {
+    const char   *name;
+    std::size_t   offset;     // In Dispatch::GL or Dispatch::Global
+    void        (*lazy)();    // Loader, until resolved
+  };
+
+  // REGAL_LOAD_PROFILE names, one per line.
+  // Either \n or \r\n line endings, blank lines ignored.
+
+  inline void ParseProfile(std::set<std::string> &profile, const std::string &text)
+  {
+    std::size_t begin = 0;
+    while (begin<text.length())
+    {
+      std::size_t end = text.find('\n',begin);
+      if (end==std::string::npos)
+        end = text.length();
+
+      std::size_t last = end;
+      if (last>begin && text[last-1]=='\r')
+        --last;
+      if (last>begin)
+        profile.insert(text.substr(begin,last-begin));
+
+      begin = end + 1;
+    }
+  }
+
+  typedef void (*ResolveProc)(DispatchTable &table, void (**func)(), void (*funcRegal)(), const char *name);
+
+  // Resolve the entries still lazy, and listed in the profile
+  // unless it is empty.  Returns the number resolved.
+
+  inline std::size_t Resolve(DispatchTable &table, void *funcs, const Entry *entry, const std::set<std::string> &profile, ResolveProc resolve)
+  {
+    std::size_t count = 0;
+    for (; entry->name; ++entry)
+    {
+      void (**func)() = reinterpret_cast<void (**)()>(reinterpret_cast<char *>(funcs) + entry->offset);
+      if (*func!=entry->lazy || (profile.size() && profile.find(entry->name)==profile.end()))
+        continue;
+      resolve(table,func,entry->lazy,entry->name);
+      ++count;
+    }
+    return count;
+  }
+}
+
+REGAL_NAMESPACE_END
+
+#endif
@@ -330,7 +330,7 @@ namespace Logging {
     // trying to create a RegalContext and triggering more
     // (recursive) logging.
 
-#if !REGAL_SYS_WGL && !REGAL_NO_TLS
+#if !REGAL_SYS_WGL && !REGAL_NO_TLS && !REGAL_GCC_TLS
     if (!Thread::ThreadLocal::_instanceKey || !pthread_getspecific(Thread::ThreadLocal::_instanceKey))
       return 0;
 #endif
@@ -583,7 +583,7 @@ namespace Logging {
 
       RegalContext *rCtx = NULL;
 
-#if !REGAL_SYS_WGL && !REGAL_NO_TLS
+#if !REGAL_SYS_WGL && !REGAL_NO_TLS && !REGAL_GCC_TLS
       if (Thread::ThreadLocal::_instanceKey && pthread_getspecific(Thread::ThreadLocal::_instanceKey))
         rCtx = REGAL_GET_CONTEXT();
 #else
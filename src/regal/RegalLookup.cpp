@@ -5461,6 +5461,350 @@ const void *gl_Value[2701] = {
   NULL
 };
 
+const short gl_Seed[2700] = {
+  0, 0, -1, 0, -5, 0, 0, -7, 1, 1, 3, 0, 0, 0, -9, -10,
+  0, 4, -12, -14, 0, 0, -16, 1, 3, -17, 2, -18, 1, 0, 0, 0,
+  1, -20, 0, 1, 0, -22, -25, 0, 9, 0, -27, 1, 1, -29, 3, -30,
+  1, 0, -34, 1, 1, -36, 1, 0, 0, -43, -50, 2, 2, 0, 0, -51,
+  -52, -53, 8, 0, 0, 0, 0, 2, 0, 0, -54, -59, 0, 0, -64, 1,
+  1, -65, 0, 0, -67, 0, 1, -69, 0, -70, -73, 2, 1, -78, 1, -79,
+  1, -81, 2, 4, 1, 0, -82, 0, 0, 2, 0, -83, -94, -96, -97, 0,
+  -102, -109, 1, 0, 0, 0, 4, 0, 0, 0, -115, -121, -124, 0, 1, 0,
+  0, -125, -126, -127, 0, 0, 0, -129, 0, 1, 0, 1, -131, 0, 3, 0,
+  0, 0, 0, -136, -138, 0, 0, -139, 0, 1, -144, -146, -150, 0, 0, 4,
+  -151, -152, -153, -156, 0, -157, -158, 0, 0, 1, 0, -159, -161, 0, 0, -162,
+  -163, -165, 0, -167, -168, 0, 1, 0, -173, -174, 0, -175, 2, -180, 0, -181,
+  0, 0, 0, -182, 1, -185, 0, -186, 1, 0, 0, 0, 1, 0, -188, -190,
+  0, 0, 0, 1, 0, 0, 3, 2, -192, 0, -193, 0, 0, 1, -194, -196,
+  1, -199, -200, -204, 0, 0, 0, 0, -206, 1, 0, 0, -207, 3, 1, 0,
+  -209, 1, 0, 0, -210, -211, 0, 0, 0, 0, 0, 1, 0, 0, 2, 0,
+  3, -212, -214, 0, -216, -217, -219, 0, -225, 1, -226, 1, 0, 1, 0, 0,
+  2, -227, -228, -232, 0, -235, -236, -240, 0, -241, 0, 3, 0, -247, 0, 0,
+  0, -252, -255, -258, -259, -260, 1, 3, 0, -262, 0, -265, 0, -268, 0, 0,
+  -271, 1, -272, 0, 0, 1, -281, -283, 0, -285, 1, -286, -292, 5, 1, 0,
+  2, 0, 0, -294, 0, -296, -298, -301, 0, -303, -304, 0, 0, 0, 1, 0,
+  0, 0, 0, 0, 3, 0, 2, -308, 3, -312, 1, -313, 0, 1, 1, 0,
+  -315, -319, -321, 0, -324, 0, 6, 0, -327, 0, 0, -328, 0, 1, 1, 1,
+  5, 1, 0, -332, 1, 0, -333, -334, -343, 0, -344, 0, 1, 0, -350, 1,
+  -351, 1, 0, 2, 0, -352, 0, 0, 0, -353, 2, -355, 0, -359, 0, 0,
+  0, -362, 4, 0, 1, 1, 0, 0, 1, -366, 1, 1, 0, -367, 0, 0,
+  4, 2, 0, 0, 1, 1, -369, -378, 2, 2, 0, -379, 1, 0, -380, 1,
+  0, -386, -390, -394, -395, -396, 0, -398, -399, 0, 4, 0, 2, -401, 0, 1,
+  -402, 0, 0, 0, -404, -411, 0, 0, 1, -413, 0, 0, 6, 0, 0, 2,
+  -414, -415, 2, -417, 0, 0, -419, 0, 1, 1, 0, 1, -420, 0, -423, 2,
+  -430, 2, 0, -432, 0, 0, 0, -435, -436, -445, 0, -446, 2, -449, -450, 0,
+  0, 1, -452, 2, 9, 4, 0, 1, 0, 2, 0, 1, 1, -453, 1, 0,
+  -454, 1, -456, -457, 0, 0, -458, -461, -466, 2, -473, 1, 1, 0, 1, -477,
+  1, 1, 0, -478, 1, -480, 3, 1, -482, 1, -486, -488, 0, 1, -490, -491,
+  0, 3, -493, 0, 1, 0, -499, 0, 1, 0, -501, -503, 1, 1, 1, 0,
+  0, 0, 1, -505, 1, 0, -507, -509, 0, -511, -512, 2, 0, 1, 0, 4,
+  0, -513, -515, -518, -519, -521, 5, 1, -522, -523, -529, 0, 0, 3, 1, 1,
+  -531, -535, 0, -538, 0, 2, 0, 0, -547, 0, 0, 0, 0, 2, 0, -548,
+  -549, -550, 1, -553, -554, -557, 0, -564, 1, -566, 0, 1, 0, 0, 2, 0,
+  -570, 3, -575, 1, -580, 0, 2, 1, 1, -585, 0, 1, -587, -588, -589, 1,
+  3, 1, -590, 0, 0, -591, 0, -596, 2, 0, -601, 0, 0, -610, -616, 3,
+  -617, -619, 0, 1, 1, -628, -630, 0, -631, -637, -639, 1, 0, 3, 0, 3,
+  3, -649, -657, 0, 0, 0, -658, 4, 0, -659, 2, 0, 0, -660, 0, 0,
+  -663, 1, 2, -664, 2, 0, 1, -665, 4, 1, 0, 0, 0, -667, 0, 1,
+  -669, -670, -671, 2, -676, 0, -683, 0, 0, -685, -686, -689, -691, -693, 1, 2,
+  0, 0, 0, 0, 1, -694, -696, 6, 4, -699, 0, 0, -700, -703, 1, -705,
+  2, 0, 0, 4, -708, -718, 0, 0, -722, 0, 1, 1, 0, 0, -723, 0,
+  -725, 0, 2, 0, 0, 13, 0, -728, 1, 0, 0, 1, 0, -733, 0, 1,
+  0, -734, -735, 0, -736, -737, 4, 0, -741, 0, -745, -746, -747, 0, 0, 1,
+  -749, 0, -757, -759, -762, 0, 1, 0, 0, -763, -766, 1, 3, 0, -769, 2,
+  -770, 0, 3, 0, 0, -771, -777, 0, 2, 0, 0, 2, 1, 0, 1, 2,
+  -778, 0, 0, 9, -780, 3, -784, -786, 0, -790, -791, 5, 0, -792, 7, 0,
+  0, -793, -797, -799, 2, 2, -803, 1, 0, -808, 0, 1, -810, -812, 0, 6,
+  0, 1, 0, 2, 0, 5, 0, -816, 0, 0, -817, -818, -820, -830, 0, -836,
+  0, -838, 0, 0, -839, -840, 1, 0, 1, 12, 0, -843, 0, 0, -845, -846,
+  -847, -849, -853, -856, 0, -858, -862, -863, 3, 0, -869, -875, -877, 1, 0, 0,
+  1, 1, 0, -886, -887, 0, -890, -891, -894, 0, -895, 2, 2, 4, 0, 0,
+  -897, 2, 1, -898, 0, 2, 0, -902, 1, 0, 2, 0, -903, 0, 0, 0,
+  0, 1, 1, 0, 0, 1, 0, 2, -905, 0, 2, -906, -910, 1, 0, -915,
+  0, -925, 0, 3, -927, 0, -928, 1, 0, 0, 6, 2, 0, 4, 0, 0,
+  6, 0, -930, -937, 2, 0, 1, -939, 1, 4, 0, 0, 2, -942, 0, 0,
+  0, 1, 7, 4, -943, 0, 0, -945, 0, 0, 0, 0, 0, 0, 0, 1,
+  3, 0, 0, -949, -951, 5, 0, 1, 0, -957, -958, 0, 0, 0, 0, 1,
+  6, 1, -960, 1, -961, 0, 0, -963, -964, -965, -966, -967, 0, 0, 0, -968,
+  0, 2, 0, -973, -974, 2, -975, -976, -980, -983, 0, -984, -987, 0, -989, 3,
+  1, -991, 3, 0, 0, 1, 0, 2, 2, -992, 2, 4, 4, 0, 3, 4,
+  -999, -1001, 1, 0, 1, 1, 0, -1002, -1005, 0, 0, 2, 0, -1006, -1009, 0,
+  0, -1011, -1017, 0, -1019, -1021, 1, -1024, -1026, 0, 0, 0, 0, 1, 0, -1027,
+  2, 0, 3, 1, 0, 2, -1028, 0, 0, 0, 0, -1030, 1, -1031, 1, -1032,
+  -1035, 0, -1037, 0, 1, 0, 3, 0, 0, 0, -1038, -1043, 0, 0, 1, -1044,
+  -1046, -1051, 1, 0, -1058, -1059, -1060, 1, 0, 6, 0, -1064, -1076, 0, 0, -1080,
+  -1085, -1089, 0, 6, 0, 3, 1, -1095, -1101, -1103, 0, -1113, 0, 2, 0, 0,
+  0, 1, -1114, -1118, 1, -1119, -1122, -1128, -1129, 0, 4, 0, -1133, 3, -1134, 0,
+  0, -1138, -1142, 0, -1144, 0, -1145, -1147, 2, 0, -1150, -1151, -1152, 2, 3, 2,
+  0, 0, 4, -1154, 4, -1156, -1158, 4, -1161, -1169, -1170, 0, 0, 2, 0, 5,
+  -1172, 0, -1176, -1180, 2, 0, 0, -1181, 2, -1183, -1185, -1190, 3, 3, -1191, 0,
+  0, 0, 5, 1, 4, -1192, 0, -1197, 0, 0, 0, 2, 0, -1201, 0, -1205,
+  1, -1206, 0, 0, 0, 0, -1210, 0, 10, 0, -1211, 0, 6, 0, -1213, -1214,
+  -1218, -1227, 0, 1, 0, 0, 0, 5, 1, 0, 0, 3, -1232, 1, -1234, -1246,
+  0, -1248, -1250, 5, -1252, 0, 3, 0, 0, -1255, -1256, -1257, 0, 0, 0, 2,
+  -1262, 0, 0, 2, 1, -1267, 0, 1, 0, 0, 6, 0, 2, -1268, 0, 1,
+  2, 0, -1269, 1, 0, 2, -1270, 0, 0, 2, 0, -1271, -1273, 2, 0, 0,
+  -1277, -1280, -1285, 0, 4, 15, -1286, -1289, 9, 2, 0, 0, 0, -1291, 0, 2,
+  0, -1292, -1293, -1296, 0, 1, 6, 1, -1299, 1, 0, 0, -1300, -1303, 0, 0,
+  0, 0, 0, 2, 1, -1310, -1312, -1315, -1317, 1, -1320, 6, 2, -1321, 0, -1322,
+  0, -1323, -1325, 0, 6, 0, 1, -1327, 0, -1329, -1331, 1, -1332, 0, 0, -1334,
+  0, -1337, 1, 0, 1, 1, 1, 2, 1, -1339, 1, 5, 2, 0, 2, 3,
+  0, 0, -1341, -1344, 1, 0, 7, 0, -1345, -1349, -1356, 0, -1357, 0, 1, -1358,
+  -1361, 0, 4, 2, 0, 3, 0, -1363, -1364, 1, 0, -1366, 2, -1368, -1370, 0,
+  -1371, 6, -1374, 1, 1, 0, 0, -1378, 1, 0, -1381, 4, -1385, -1388, 1, 2,
+  1, 0, 7, -1389, -1390, -1392, 1, 0, -1393, 0, -1397, 0, 0, -1402, 0, 0,
+  4, 4, 0, 0, 0, 1, 0, -1403, -1404, -1411, -1412, 0, 1, 0, 1, 0,
+  -1413, 0, -1416, 0, 0, 0, 2, 0, 0, 5, 2, 0, 0, 0, 4, -1417,
+  5, -1419, 8, 1, 2, 5, 0, -1420, 4, 0, -1422, 1, 3, -1423, 0, -1426,
+  -1427, 0, 1, 3, 1, -1435, 0, 0, -1439, 0, 3, 0, 0, -1446, 0, -1448,
+  -1451, 1, 0, 0, 0, -1453, 5, 0, 7, -1455, 6, 0, 2, -1456, 1, -1461,
+  0, -1462, 0, -1471, 0, 0, -1473, -1476, -1479, 0, 0, -1481, -1482, -1486, 1, -1487,
+  -1488, 3, -1492, 2, 3, 0, -1494, 0, 0, 0, 1, -1495, -1497, 0, 0, -1498,
+  -1503, 0, 0, -1504, 1, -1508, 1, -1513, 0, -1518, 0, 5, 0, 2, 4, 0,
+  0, -1527, -1531, -1532, 6, 2, 7, 3, -1533, -1535, 7, 0, -1539, 0, 2, 5,
+  1, -1540, 0, 0, 0, 0, -1546, 0, 0, -1550, 5, 0, 2, 0, 0, -1551,
+  -1556, -1561, 1, -1562, 4, -1563, 18, -1565, -1566, 0, -1568, -1569, -1573, -1576, 5, -1578,
+  -1581, 0, 0, 0, 0, -1584, 0, 2, -1585, 1, -1589, -1592, 4, 0, 1, 0,
+  0, -1594, -1595, 0, 5, 1, 0, 3, 2, 0, -1597, -1599, 0, 0, 0, -1602,
+  6, -1603, 2, 2, -1605, 0, 1, 0, 0, 0, 0, -1617, -1619, -1620, 0, 0,
+  -1622, 3, -1623, -1625, 0, -1632, 0, 1, 0, -1633, 1, 0, 0, 2, 0, 0,
+  1, -1634, 0, 2, 2, -1638, -1639, 17, 0, 0, 0, 10, 3, -1643, 0, -1645,
+  0, 2, 2, 4, -1649, 3, -1650, -1653, -1656, 0, 0, -1659, 0, -1661, 0, 5,
+  -1666, 0, 6, 1, 1, -1672, 0, 0, 1, 3, 0, 0, 0, -1675, 2, -1677,
+  -1694, -1695, 4, 1, 0, 0, 0, 0, -1697, 0, 2, 5, -1701, 0, 3, 0,
+  -1704, 0, -1707, -1712, -1714, 0, 0, 2, 2, 1, 5, 0, -1717, -1718, 1, -1724,
+  -1731, -1735, 7, 0, -1736, 0, 0, 0, -1737, -1743, -1746, 1, -1752, -1753, 1, 0,
+  1, -1754, 0, 11, -1758, -1759, 4, 8, 0, 0, 2, 1, -1761, 0, -1764, -1768,
+  2, -1774, 0, -1776, 0, -1778, -1785, 0, -1786, -1788, -1794, 0, 0, 3, -1795, 1,
+  -1796, 0, 0, -1799, 4, -1801, -1802, 1, 0, -1808, -1813, -1815, -1818, -1824, -1826, 3,
+  -1827, 0, 6, -1828, 3, 0, 0, -1834, 6, 3, -1838, 0, 11, 1, -1839, 0,
+  3, 0, 1, 0, 1, 1, -1840, -1841, -1846, -1848, -1850, 0, 0, 2, 1, 5,
+  0, 3, 2, 0, -1851, 0, 0, 5, 0, 0, -1857, 3, 6, 0, 0, -1858,
+  1, 0, 0, 0, -1864, 0, -1868, -1871, 13, 0, 0, 0, 0, 0, -1872, 0,
+  -1880, 0, 0, -1883, 0, 0, 4, 0, 1, -1886, 2, -1890, 3, 0, 0, -1894,
+  0, 2, -1898, -1906, 0, -1910, 17, 0, -1911, -1913, 0, 0, 0, -1914, 0, 0,
+  -1916, -1917, 0, -1919, 3, 1, 0, -1925, 2, -1929, -1932, 0, 0, 7, 0, -1933,
+  -1936, 0, 1, 0, 1, -1940, -1942, 0, 2, -1943, 6, -1945, 1, -1948, 0, 0,
+  0, 0, 1, 0, 2, -1949, 5, 0, 1, 0, 0, 1, -1950, 0, -1951, -1956,
+  0, 0, 0, -1962, 0, 0, -1964, -1969, 2, 2, -1971, 0, 0, 2, -1973, -1974,
+  1, 0, 3, 8, -1975, 1, -1977, -1978, -1979, -1980, 0, 1, 0, 0, -1989, 4,
+  9, -1990, -1991, -1995, 0, 2, 0, 1, 2, -1997, 0, -1999, 0, -2004, 0, -2007,
+  -2013, 0, 17, -2014, 3, 11, -2015, 0, 2, -2018, 0, 0, 0, 0, -2023, 0,
+  0, -2025, -2029, 4, -2031, -2033, -2034, 0, 0, -2038, -2041, 0, 3, -2049, 0, 1,
+  -2050, -2051, 0, -2053, 0, -2056, 7, 3, -2057, -2059, -2061, 3, 6, -2065, 0, 0,
+  0, -2067, 0, -2068, 0, 0, -2071, 0, -2073, -2074, -2076, 5, 1, -2082, 0, -2085,
+  2, 0, -2089, 0, -2093, -2096, 1, 0, 1, -2099, 0, 0, 0, -2100, 0, -2103,
+  0, 0, 1, 0, 0, 0, -2104, -2111, -2112, 2, -2113, 2, 0, -2115, -2117, -2118,
+  0, -2119, -2126, 0, -2127, -2128, 7, 0, 3, 0, -2129, -2130, 0, -2134, -2139, -2140,
+  -2143, 7, 0, -2150, 0, 1, 0, -2152, -2153, 0, -2154, 0, 0, -2156, 1, 5,
+  -2161, -2163, 1, -2164, 0, -2167, -2168, 0, -2172, 0, 0, -2173, 0, 1, 1, 0,
+  -2176, 13, 0, -2182, 1, 0, -2183, 2, -2186, 3, 0, -2187, 5, 0, 2, 6,
+  -2189, -2190, 0, -2192, -2193, 2, -2201, -2206, 0, 0, 0, 8, -2216, 0, -2217, 0,
+  5, 0, 1, -2219, 2, -2228, 0, 3, 6, 33, 0, 0, -2229, -2232, 0, -2234,
+  5, 0, 0, -2241, -2244, 0, 1, -2245, 0, -2248, 0, 0, 0, 0, 1, 0,
+  0, 0, 1, -2250, -2253, 0, 2, 0, 0, -2254, 0, 0, 14, 1, 0, -2256,
+  -2258, -2261, -2262, 0, 0, 4, 16, 4, 15, -2263, 0, -2272, 0, -2277, -2279, 0,
+  0, 2, -2280, 1, 2, 4, 13, -2283, -2293, 0, -2294, 0, 0, -2296, -2299, -2300,
+  3, 0, 0, 4, -2302, -2304, -2305, 0, -2306, 1, 5, -2307, 0, -2311, 0, 4,
+  0, -2312, 3, 3, 4, 0, 0, -2313, 3, 0, 0, -2314, 0, 4, 1, -2315,
+  -2320, 3, 3, 0, -2324, 0, 0, 0, 0, 0, 0, 9, 1, 0, -2331, 6,
+  1, 0, -2333, 8, -2334, -2337, -2339, 0, 0, 1, -2344, -2347, -2348, -2349, 0, 0,
+  0, -2353, 4, 0, -2354, 0, 8, 0, -2355, 1, -2358, -2359, -2362, -2363, 0, 5,
+  12, 0, 0, 6, -2364, 2, -2365, -2368, 1, 0, -2372, 0, -2373, -2375, -2376, 0,
+  0, -2381, -2383, 0, 0, 11, 1, 0, 1, 6, 0, 0, 0, 1, -2384, 0,
+  0, -2387, -2388, 0, 0, 1, -2393, 0, -2396, -2398, 0, -2400, 0, 4, -2402, -2404,
+  2, 6, 0, 0, 6, -2408, -2410, -2417, 2, -2424, 0, 1, -2427, -2435, 0, 0,
+  -2442, 0, -2445, 1, -2448, -2449, 10, -2450, 0, 0, 0, -2451, 0, 1, -2452, 0,
+  0, 3, 0, -2453, 0, -2454, -2457, -2459, -2461, 0, -2466, 2, 1, 0, 7, 0,
+  -2468, -2470, 0, -2472, 0, 21, 0, 0, -2473, 0, -2474, 0, 0, -2477, 5, 0,
+  -2478, 0, 0, 5, -2481, 0, 1, 0, 2, 0, -2482, -2485, -2486, -2494, 0, 14,
+  0, 6, 1, 2, -2495, 0, 0, 0, 4, 1, -2496, -2497, 0, -2501, 1, 0,
+  1, -2502, 0, 0, 0, -2503, 0, -2504, -2505, 0, 3, 0, 0, 0, 0, 6,
+  -2509, -2512, -2514, 0, 2, 3, 0, 0, -2524, -2525, -2530, -2532, -2538, 3, -2541, -2542,
+  0, -2543, 0, -2544, 0, 0, -2546, 23, -2550, -2556, 0, 0, 0, -2559, 1, -2560,
+  -2563, 0, 0, 0, -2568, -2570, -2573, 0, 0, 10, -2578, -2582, 0, -2583, 0, 4,
+  -2585, 0, -2586, 1, -2589, -2597, -2599, 1, 0, 0, -2601, 1, 0, 5, 0, 0,
+  0, 3, 3, 0, 0, -2603, -2611, 5, 2, 5, -2613, -2618, 0, -2619, -2623, 0,
+  2, 5, 0, 8, 0, -2627, 7, 3, -2628, 0, 1, 10, 1, 0, 0, 0,
+  0, 1, -2629, 1, 2, 0, 0, -2630, 0, -2631, -2634, 0, -2636, 0, -2638, 0,
+  -2639, 0, 0, 0, 0, -2642, 2, 2, 0, 0, 4, -2647, 0, 4, 0, -2652,
+  4, -2654, 0, -2655, 2, -2656, 0, -2657, -2668, 1, 0, 0, 0, 0, -2671, 0,
+  0, 0, -2674, 0, -2675, 0, -2679, 1, 0, 0, 2, -2680, 0, -2681, -2682, -2684,
+  -2687, 2, -2693, 3, -2698, -2700, 0, 0, 4, 6, 0, 1
+};
+
+const unsigned short gl_Slot[2700] = {
+  2465, 1352, 1697, 509, 2147, 2232, 2060, 327, 2694, 1112, 1762, 218, 1453, 2657, 2646, 848,
+  1186, 384, 368, 863, 2383, 2542, 1309, 2387, 803, 2651, 23, 2503, 719, 900, 693, 2200,
+  1973, 711, 1847, 1430, 2512, 1809, 1217, 419, 2566, 1703, 414, 165, 1344, 2162, 141, 47,
+  912, 353, 1655, 1011, 1342, 1935, 1259, 2426, 2244, 1242, 670, 1930, 2191, 536, 2250, 2129,
+  127, 103, 1383, 1236, 809, 172, 284, 1690, 566, 626, 1326, 1500, 1068, 235, 1192, 2029,
+  715, 2284, 151, 1507, 1487, 2120, 1531, 1174, 773, 1218, 609, 2631, 178, 1285, 1589, 2581,
+  2553, 1634, 434, 180, 916, 1739, 1828, 1891, 931, 311, 729, 988, 1138, 543, 1680, 8,
+  1207, 510, 383, 1104, 472, 1427, 690, 2076, 1974, 194, 1845, 716, 851, 445, 2041, 1832,
+  876, 999, 2319, 308, 2307, 940, 2637, 2048, 107, 2157, 1277, 872, 478, 1877, 2135, 1087,
+  263, 310, 1114, 1817, 279, 746, 94, 2014, 2596, 551, 523, 2650, 743, 974, 1506, 242,
+  1486, 781, 2018, 1336, 1916, 1497, 1766, 1122, 2556, 2422, 2342, 780, 413, 31, 2382, 2339,
+  176, 1676, 2081, 2292, 1080, 2399, 965, 2196, 2085, 1800, 2032, 1724, 1005, 2436, 1728, 1423,
+  1516, 425, 675, 114, 452, 2498, 1927, 2313, 1488, 261, 1619, 753, 163, 2195, 1199, 951,
+  1968, 416, 2228, 468, 282, 826, 2126, 594, 1778, 2615, 1820, 1854, 1117, 77, 2379, 1746,
+  1353, 1906, 722, 2648, 859, 1957, 1234, 1175, 2289, 1292, 2280, 1897, 1504, 775, 1194, 2664,
+  1422, 1373, 2445, 1505, 957, 779, 865, 1325, 1437, 1966, 882, 2443, 864, 324, 1551, 129,
+  1379, 1564, 2448, 2188, 579, 2658, 1988, 2522, 2545, 1187, 1624, 867, 580, 1145, 1318, 1706,
+  2241, 2458, 2397, 1446, 435, 1527, 207, 1951, 1168, 442, 1822, 1925, 1049, 2180, 1856, 1893,
+  2117, 1903, 983, 1636, 1658, 1792, 2231, 1150, 1940, 1637, 2137, 1597, 209, 1926, 2346, 2130,
+  1046, 2039, 2371, 2419, 126, 880, 616, 461, 1335, 1578, 132, 1884, 1630, 2172, 427, 1232,
+  2511, 1867, 2693, 740, 2385, 655, 30, 99, 631, 581, 1843, 798, 629, 1525, 1289, 2166,
+  1751, 2688, 1110, 2243, 2197, 619, 1418, 2287, 918, 2149, 1763, 1731, 877, 1426, 2677, 812,
+  1918, 2393, 40, 703, 2667, 355, 1079, 1485, 1203, 1474, 270, 97, 2269, 1523, 1987, 1450,
+  367, 75, 1403, 2476, 1549, 2569, 395, 2347, 941, 475, 2457, 776, 2210, 1241, 680, 2110,
+  1014, 1208, 57, 1616, 879, 2435, 124, 374, 998, 1219, 1577, 264, 1172, 602, 1799, 407,
+  488, 1096, 1768, 1633, 2642, 2086, 1121, 1411, 1273, 862, 1604, 584, 1827, 64, 503, 128,
+  1984, 2594, 162, 2170, 2332, 1185, 2478, 2521, 797, 50, 111, 2109, 2423, 1704, 1662, 248,
+  1986, 1084, 2678, 570, 2199, 1901, 1844, 2479, 1698, 464, 2555, 825, 985, 1539, 2036, 1811,
+  229, 482, 681, 1364, 0, 366, 1553, 268, 1722, 2074, 1078, 2343, 456, 341, 13, 1460,
+  928, 830, 2400, 731, 481, 1041, 2012, 44, 449, 1092, 843, 1003, 1428, 1961, 968, 446,
+  241, 309, 1522, 1100, 318, 653, 84, 2306, 1816, 887, 2574, 642, 2235, 1360, 2224, 554,
+  884, 1685, 1797, 640, 1059, 1941, 24, 2390, 474, 1582, 2508, 1272, 73, 1377, 1081, 1501,
+  2123, 499, 2671, 1541, 88, 149, 1050, 689, 1962, 1977, 1125, 2098, 2571, 789, 874, 970,
+  160, 2679, 2434, 706, 1526, 112, 226, 1982, 881, 412, 799, 822, 995, 824, 1902, 823,
+  463, 281, 1503, 1075, 2247, 2480, 2414, 2055, 2355, 426, 2557, 117, 2686, 2535, 1091, 2050,
+  1557, 1270, 572, 2268, 1774, 2394, 2051, 2663, 996, 1638, 2324, 1960, 1483, 138, 2378, 1337,
+  1268, 2100, 909, 2318, 1370, 2053, 6, 990, 63, 1442, 2215, 1475, 2005, 2547, 2056, 1206,
+  923, 1248, 2201, 714, 1189, 2218, 1393, 275, 1392, 2662, 2550, 53, 1608, 349, 2008, 1165,
+  1640, 2505, 1028, 48, 815, 2000, 919, 1410, 844, 891, 2301, 1030, 2579, 1188, 1682, 898,
+  2052, 2353, 328, 1547, 1027, 1313, 1726, 1528, 857, 346, 530, 406, 1400, 1605, 2181, 1572,
+  1846, 1324, 2354, 2598, 2603, 1900, 2429, 42, 351, 156, 2472, 1391, 2578, 2406, 1852, 2334,
+  1214, 2333, 1004, 466, 2440, 78, 1024, 2352, 206, 1721, 944, 1910, 476, 2367, 2690, 721,
+  1231, 2632, 1434, 2575, 1257, 1116, 1343, 813, 544, 1224, 818, 2369, 2291, 2411, 1339, 1620,
+  1683, 2042, 827, 979, 2034, 1563, 1546, 37, 174, 1440, 1934, 921, 1479, 668, 1417, 586,
+  1492, 1914, 846, 1489, 1765, 2362, 1592, 1874, 27, 1681, 2349, 1908, 840, 984, 1842, 255,
+  816, 733, 1533, 649, 685, 1694, 2554, 545, 2144, 299, 1983, 2496, 938, 100, 835, 257,
+  376, 1839, 2338, 305, 271, 1788, 2453, 1929, 1478, 2310, 987, 645, 1144, 22, 167, 701,
+  2189, 1296, 1111, 2587, 2682, 2073, 348, 333, 2562, 1490, 196, 2240, 352, 1868, 2107, 702,
+  1514, 293, 208, 5, 1029, 1550, 1873, 1855, 28, 470, 1603, 361, 1784, 2360, 228, 1661,
+  1596, 190, 765, 588, 2304, 1441, 2643, 2407, 1764, 236, 1781, 2618, 2023, 2087, 1143, 2066,
+  1607, 1322, 1659, 2177, 1290, 875, 1062, 1970, 2464, 2630, 2624, 808, 952, 2119, 906, 1380,
+  541, 1628, 758, 1368, 1775, 215, 2533, 858, 1151, 1369, 2418, 1543, 1890, 2683, 1907, 7,
+  2257, 1239, 2520, 1197, 1458, 304, 245, 280, 145, 2576, 734, 2088, 46, 21, 1419, 1233,
+  1249, 1614, 1699, 429, 853, 971, 415, 889, 2475, 344, 1012, 817, 2534, 1675, 2134, 359,
+  358, 1879, 1183, 289, 893, 1420, 528, 613, 1282, 2380, 788, 2002, 1663, 1569, 628, 2281,
+  1554, 698, 2127, 1064, 1288, 2011, 1904, 1123, 287, 559, 644, 2220, 498, 975, 2536, 565,
+  2061, 648, 1244, 2300, 735, 171, 662, 2384, 1072, 1717, 2163, 2007, 1946, 2491, 522, 591,
+  1304, 2221, 465, 845, 403, 981, 1801, 1819, 1286, 949, 497, 1585, 396, 2607, 771, 460,
+  1612, 2234, 1651, 2408, 704, 2374, 2006, 185, 618, 1166, 755, 2302, 1747, 2047, 508, 2376,
+  372, 2121, 751, 484, 2373, 14, 2350, 2035, 2267, 1515, 2463, 784, 533, 1170, 964, 175,
+  1025, 495, 134, 2409, 1129, 230, 1622, 2010, 1785, 1623, 91, 883, 2357, 749, 927, 1545,
+  2623, 537, 2604, 41, 1237, 2344, 641, 747, 177, 2484, 394, 1133, 436, 2259, 666, 2441,
+  904, 2549, 553, 2487, 1996, 2616, 2551, 70, 2599, 76, 2238, 1865, 254, 1254, 728, 2239,
+  393, 1431, 119, 1163, 493, 1795, 1443, 627, 1980, 821, 571, 890, 1618, 133, 2027, 677,
+  1562, 1202, 2125, 1688, 2017, 2523, 907, 1115, 1783, 2540, 665, 292, 1936, 1301, 1338, 1157,
+  2639, 1744, 2482, 335, 1384, 1870, 1905, 2254, 1387, 158, 487, 1830, 1171, 1965, 1013, 1769,
+  1806, 756, 1132, 1071, 2013, 525, 199, 617, 1667, 1320, 772, 2075, 513, 1886, 1156, 1247,
+  420, 1955, 2552, 1401, 552, 2003, 1394, 2072, 2124, 1945, 2225, 1653, 1928, 1580, 727, 441,
+  1829, 1190, 345, 694, 1932, 1761, 1511, 585, 1521, 744, 1131, 1140, 1942, 1530, 183, 2021,
+  2202, 524, 705, 1561, 1158, 2370, 1687, 430, 1691, 1866, 1040, 1738, 2253, 2192, 954, 750,
+  1395, 1109, 1330, 49, 1366, 2452, 1883, 1512, 515, 2633, 428, 1201, 892, 1332, 1070, 1444,
+  1584, 1720, 267, 1837, 1552, 2028, 2500, 2145, 1835, 1649, 2625, 12, 143, 992, 699, 2183,
+  1538, 2404, 1126, 1134, 576, 1381, 860, 422, 2413, 1529, 1594, 1824, 225, 1944, 960, 587,
+  1382, 2326, 314, 856, 1954, 563, 707, 325, 2628, 1805, 213, 1415, 1416, 2153, 1871, 2433,
+  337, 1895, 1057, 1524, 1745, 920, 1599, 604, 2111, 2432, 782, 244, 1118, 1405, 2263, 130,
+  1700, 1750, 946, 2495, 1179, 1302, 285, 736, 621, 555, 556, 2696, 2131, 2585, 1120, 33,
+  1032, 560, 1576, 240, 1924, 2294, 2489, 1626, 2057, 101, 1331, 2112, 2527, 723, 2431, 646,
+  2336, 1857, 600, 2330, 87, 1615, 2516, 2105, 2438, 1678, 1, 2089, 1570, 1656, 2216, 2148,
+  1425, 122, 1508, 1786, 2187, 1328, 2091, 1915, 1044, 222, 832, 334, 1245, 939, 80, 1019,
+  2412, 2151, 2230, 2173, 2320, 1177, 2391, 1402, 2205, 294, 1090, 2272, 2288, 547, 2118, 405,
+  1872, 958, 1894, 1548, 611, 1815, 10, 1345, 713, 1341, 1399, 1327, 96, 1470, 688, 2410,
+  1315, 187, 2327, 29, 567, 2525, 1021, 431, 2622, 2175, 2584, 486, 1363, 770, 365, 2084,
+  197, 453, 2538, 492, 1106, 1119, 933, 2062, 1429, 961, 92, 1625, 1610, 2233, 2309, 330,
+  2655, 2305, 1992, 610, 1240, 69, 1565, 68, 252, 866, 1212, 1220, 1038, 2266, 1355, 362,
+  1669, 1953, 1161, 1826, 574, 1677, 1863, 2606, 1997, 636, 1173, 1073, 86, 2071, 1409, 2223,
+  643, 102, 2447, 1323, 1838, 2033, 1646, 1657, 2514, 2132, 678, 2317, 1767, 2024, 1178, 1759,
+  669, 1255, 546, 2640, 326, 1291, 1849, 819, 787, 277, 2454, 2101, 131, 2674, 2439, 494,
+  1210, 2698, 2174, 1712, 321, 2675, 2395, 768, 273, 847, 297, 2083, 455, 159, 871, 1047,
+  676, 1922, 982, 1191, 1468, 932, 1834, 1812, 2214, 2681, 924, 1148, 1670, 1491, 659, 978,
+  1069, 1791, 220, 2043, 2649, 1386, 1648, 377, 2156, 2608, 2558, 1348, 371, 1467, 896, 286,
+  2264, 2652, 2203, 518, 1229, 1864, 1714, 1499, 404, 1385, 2158, 2468, 766, 410, 1921, 598,
+  1054, 535, 695, 32, 762, 902, 1000, 1086, 1920, 897, 1484, 1299, 1510, 790, 2286, 1787,
+  2019, 1776, 1937, 1346, 989, 557, 534, 1435, 2490, 760, 2116, 2446, 2389, 408, 1591, 656,
+  2092, 1471, 2046, 769, 2067, 1358, 2115, 1094, 356, 657, 1878, 791, 1099, 2416, 2207, 1196,
+  380, 2261, 1213, 1679, 291, 125, 1351, 1412, 2518, 2626, 485, 2182, 36, 154, 2204, 997,
+  256, 1705, 2398, 1693, 2377, 1246, 1755, 312, 1950, 121, 1278, 1964, 150, 2198, 603, 1026,
+  1632, 521, 520, 1160, 1095, 1991, 1556, 1716, 2, 2691, 947, 720, 1875, 1740, 246, 424,
+  168, 852, 1238, 2507, 2277, 1559, 2059, 529, 373, 120, 2096, 1074, 1397, 2499, 1611, 725,
+  926, 1065, 104, 2020, 2529, 795, 1275, 2644, 2656, 295, 870, 1749, 1317, 388, 2070, 2653,
+  2186, 634, 801, 2212, 391, 1389, 1287, 2636, 2275, 1643, 593, 243, 315, 1298, 386, 140,
+  2528, 959, 2601, 2171, 1989, 2427, 2256, 564, 661, 212, 303, 2530, 506, 1002, 2265, 438,
+  2444, 595, 2687, 259, 1814, 1303, 2365, 577, 786, 400, 1260, 1652, 1307, 2363, 479, 1686,
+  908, 1376, 834, 144, 1880, 2154, 925, 2481, 1810, 329, 1306, 1645, 1263, 700, 800, 745,
+  1590, 1472, 1375, 526, 1311, 2460, 2467, 2314, 635, 651, 1975, 2093, 1782, 1627, 2217, 935,
+  757, 2297, 805, 730, 1316, 161, 1155, 2602, 2194, 568, 2009, 504, 1388, 1517, 239, 250,
+  2358, 298, 61, 2229, 658, 1097, 2054, 2589, 2425, 2595, 531, 1130, 2359, 2293, 385, 660,
+  1734, 607, 2583, 2695, 2506, 2591, 1205, 2049, 1321, 1262, 2069, 471, 1180, 1853, 796, 578,
+  1639, 511, 1498, 1154, 2485, 483, 674, 2179, 1949, 2509, 878, 2510, 2249, 810, 679, 1438,
+  1621, 652, 512, 1887, 1361, 217, 2627, 2605, 514, 320, 915, 1295, 2037, 2245, 2417, 2405,
+  1848, 2611, 2001, 748, 1034, 2612, 1371, 2022, 1668, 2456, 16, 1195, 1135, 1146, 136, 562,
+  1595, 1748, 956, 2094, 606, 2684, 1056, 223, 184, 1445, 2246, 942, 905, 1457, 2420, 2252,
+  1334, 2497, 155, 684, 1480, 379, 671, 182, 2544, 1808, 1836, 582, 2155, 193, 712, 290,
+  2152, 2150, 922, 1671, 2517, 2040, 58, 1911, 913, 2159, 2345, 1284, 123, 2619, 1340, 1617,
+  763, 342, 1735, 2136, 2356, 1756, 1230, 1859, 2308, 1473, 1414, 1753, 929, 2543, 1600, 2323,
+  2025, 2167, 2311, 1779, 2140, 1466, 2142, 620, 2065, 2537, 624, 855, 2299, 265, 1613, 718,
+  1142, 1758, 1365, 2295, 1692, 2113, 696, 170, 2486, 139, 2634, 2488, 2613, 632, 2160, 1939,
+  1461, 1736, 963, 1793, 1534, 885, 1909, 1654, 583, 2270, 955, 737, 861, 1899, 792, 1715,
+  759, 1124, 804, 1036, 2058, 469, 108, 343, 622, 575, 1602, 135, 389, 1840, 2539, 1350,
+  39, 1451, 233, 90, 589, 390, 2572, 1647, 54, 392, 1876, 2483, 1708, 1108, 2146, 1152,
+  1016, 1113, 20, 561, 2614, 794, 2462, 278, 2348, 409, 1305, 1031, 2165, 496, 1858, 451,
+  238, 1077, 1408, 605, 347, 667, 1579, 507, 2095, 807, 2577, 1913, 331, 2469, 2208, 1702,
+  1378, 1684, 2274, 276, 615, 2312, 752, 258, 1888, 142, 2283, 1105, 2080, 1225, 1711, 2548,
+  399, 231, 1222, 316, 1586, 1293, 2248, 1862, 2672, 1456, 1449, 74, 2592, 2396, 1729, 1673,
+  2573, 2673, 1798, 2494, 2437, 2388, 868, 417, 166, 980, 189, 1294, 973, 266, 1093, 527,
+  339, 2685, 45, 590, 1055, 1754, 1629, 1555, 2258, 1009, 1912, 1725, 2236, 1198, 2421, 1509,
+  1372, 1184, 1789, 1053, 38, 828, 1780, 573, 1276, 837, 519, 1010, 2501, 2586, 1235, 2368,
+  1861, 1995, 1076, 650, 1308, 2372, 1772, 1103, 1665, 2026, 1818, 993, 1583, 2044, 1519, 232,
+  18, 1037, 664, 1757, 972, 738, 375, 1227, 1732, 2513, 1347, 1532, 986, 1455, 1737, 994,
+  116, 1998, 930, 2532, 336, 549, 227, 1452, 1567, 948, 1644, 1851, 1465, 2415, 1153, 83,
+  62, 1513, 2455, 52, 2647, 219, 1149, 911, 1860, 43, 1520, 262, 1963, 1367, 1802, 2168,
+  2541, 1710, 886, 1404, 592, 2524, 146, 1664, 977, 1216, 1493, 56, 1833, 283, 1536, 1719,
+  2470, 1889, 2459, 457, 686, 1709, 2122, 1045, 313, 839, 421, 1356, 360, 1581, 2492, 1433,
+  1760, 1215, 480, 888, 2375, 269, 1200, 2340, 1253, 95, 2670, 195, 1813, 247, 550, 2045,
+  1193, 473, 2271, 1274, 2564, 2570, 2185, 72, 1718, 2531, 806, 272, 1938, 2206, 1362, 1571,
+  1777, 1310, 966, 1841, 761, 1181, 2451, 1672, 836, 647, 517, 614, 2565, 1994, 2064, 1790,
+  2659, 110, 597, 1269, 1033, 1271, 539, 2262, 501, 2526, 1807, 1967, 306, 378, 2386, 802,
+  849, 1573, 1228, 2178, 2213, 450, 1823, 1979, 1223, 899, 599, 153, 625, 1060, 1587, 2004,
+  1464, 1566, 1039, 741, 477, 1447, 1164, 192, 1650, 147, 462, 2504, 402, 1127, 2473, 2638,
+  214, 1537, 93, 11, 459, 708, 1066, 569, 1931, 2474, 1476, 1631, 71, 1574, 2138, 639,
+  2697, 2329, 17, 1182, 34, 152, 381, 850, 489, 2660, 2226, 2079, 811, 663, 2641, 953,
+  833, 2016, 2078, 2255, 1017, 2102, 1881, 169, 467, 783, 1243, 205, 204, 15, 200, 683,
+  1923, 81, 1850, 115, 2666, 672, 1159, 793, 1020, 502, 2351, 59, 1727, 2661, 1978, 2597,
+  724, 691, 251, 490, 1052, 673, 2568, 2099, 319, 179, 9, 1743, 838, 2617, 370, 777,
+  1424, 1312, 2143, 60, 188, 2610, 1083, 437, 2068, 1972, 447, 1048, 1176, 1023, 1421, 1374,
+  1015, 19, 854, 962, 682, 2635, 1359, 1999, 2097, 1357, 1107, 638, 401, 2114, 1601, 85,
+  363, 323, 1898, 820, 2260, 2298, 2321, 2222, 1976, 2424, 1256, 296, 1752, 1035, 2209, 1956,
+  2104, 1258, 2082, 2593, 260, 67, 1141, 726, 357, 2519, 2546, 1540, 1058, 1917, 2237, 937,
+  2588, 1796, 1635, 841, 1089, 65, 1985, 1162, 2461, 2560, 739, 1283, 2621, 2164, 2279, 2090,
+  439, 2654, 288, 2366, 1169, 2341, 2211, 1825, 300, 216, 1042, 1390, 548, 2559, 754, 2139,
+  1598, 1279, 1707, 742, 687, 1701, 2563, 440, 540, 1971, 1436, 1741, 2337, 113, 1713, 558,
+  66, 458, 2278, 1147, 1349, 274, 633, 173, 1558, 1535, 1102, 774, 945, 1770, 2141, 829,
+  4, 943, 1947, 1958, 2669, 2620, 2063, 2038, 2600, 1413, 917, 1593, 1396, 105, 1518, 709,
+  785, 51, 82, 387, 338, 2316, 1251, 637, 1896, 1948, 2290, 332, 2428, 697, 2692, 500,
+  692, 1407, 2502, 2668, 1981, 1495, 1300, 2680, 109, 831, 950, 630, 1280, 2219, 1575, 1264,
+  1821, 2193, 1869, 2315, 2689, 2251, 1209, 2176, 2331, 2430, 301, 1689, 491, 432, 910, 717,
+  2282, 608, 234, 1022, 1674, 3, 1265, 302, 1432, 98, 1943, 307, 1007, 895, 106, 2103,
+  1463, 191, 137, 2169, 2325, 1204, 2401, 538, 2242, 322, 1542, 237, 2590, 1560, 2580, 1494,
+  2128, 444, 612, 1482, 1969, 1742, 2161, 767, 894, 1730, 2477, 398, 1641, 2676, 1990, 2582,
+  1696, 2381, 976, 1063, 2364, 2442, 2190, 1314, 2392, 2699, 79, 1136, 186, 914, 1803, 340,
+  454, 211, 2645, 2493, 2077, 2276, 2227, 2285, 1919, 1354, 2322, 1695, 157, 623, 1733, 1101,
+  2449, 1226, 842, 2403, 1609, 2361, 1804, 2561, 732, 2466, 55, 2450, 2184, 1319, 1250, 1773,
+  1018, 2106, 1333, 89, 2303, 1933, 1454, 25, 1666, 2665, 2609, 433, 201, 2515, 364, 1098,
+  1252, 2273, 210, 1137, 532, 1266, 118, 901, 2133, 350, 903, 601, 1462, 1831, 1297, 1952,
+  354, 2108, 224, 1502, 221, 1128, 1459, 1771, 35, 418, 369, 1496, 1067, 1606, 253, 654,
+  1267, 1008, 2567, 2030, 1061, 1469, 382, 2296, 1082, 505, 1281, 148, 26, 1139, 1544, 1167,
+  936, 2015, 1398, 448, 1329, 249, 198, 2328, 1221, 2031, 1406, 1660, 1477, 1892, 1043, 2629,
+  1642, 1088, 1885, 1993, 991, 873, 164, 710, 443, 1794, 397, 1001, 181, 1261, 1006, 2402,
+  2471, 516, 1588, 869, 2335, 934, 202, 778, 1959, 1051, 423, 967, 814, 969, 764, 1882,
+  1085, 542, 1211, 1481, 1723, 1448, 1568, 203, 317, 596, 1439, 411
+};
+
 const size_t gl_Offset[2701] = {
   offsetof(Dispatch::GL,glAccum)/sizeof(void *),
   offsetof(Dispatch::GL,glActiveProgramEXT)/sizeof(void *),
@@ -8460,6 +8804,30 @@ const void *wgl_Value[144] = {
   NULL
 };
 
+const short wgl_Seed[143] = {
+  1, -1, -3, 1, -5, -6, 0, 1, 1, -8, 1, 1, -10, -15, 0, 1,
+  0, 2, 2, -16, 0, 1, 1, 0, 0, 0, 0, -17, 0, 1, 2, 3,
+  0, 2, 0, 0, 0, 2, -20, 1, 1, -29, 2, -33, 0, 2, 1, -35,
+  -36, 0, 0, 0, 0, 0, 0, -39, 0, -41, 0, -42, 0, 1, 0, 0,
+  2, 1, 0, -44, 1, -46, -48, 0, 0, 4, 4, -49, -52, 0, -54, -55,
+  -63, -65, -71, -72, 0, 0, -73, 3, -75, -76, -77, 8, 0, 0, -86, -87,
+  0, 0, -89, 0, -91, 0, 1, 3, -92, 0, 1, -95, 0, 0, -97, 0,
+  -99, -105, 0, 0, 0, -110, -115, -118, 0, -121, 4, -122, 3, -123, 2, 0,
+  -126, -127, -129, 12, -133, -134, 0, 0, -135, 0, -136, 9, 0, 4, 0
+};
+
+const unsigned short wgl_Slot[143] = {
+  117, 70, 21, 124, 104, 95, 68, 90, 126, 58, 3, 76, 131, 35, 63, 83,
+  133, 37, 82, 41, 33, 40, 91, 80, 62, 13, 30, 8, 93, 105, 100, 43,
+  17, 32, 27, 134, 97, 48, 39, 137, 139, 29, 132, 140, 56, 5, 110, 53,
+  20, 22, 107, 36, 59, 19, 85, 109, 7, 31, 15, 6, 47, 10, 71, 142,
+  102, 86, 54, 4, 116, 122, 18, 61, 112, 14, 73, 114, 1, 66, 2, 101,
+  127, 51, 65, 24, 123, 78, 34, 94, 98, 11, 119, 125, 64, 89, 118, 23,
+  49, 115, 42, 60, 79, 74, 77, 16, 84, 138, 96, 69, 108, 26, 136, 72,
+  103, 44, 9, 113, 121, 52, 81, 57, 120, 106, 0, 75, 12, 88, 92, 67,
+  141, 135, 87, 111, 28, 55, 38, 130, 50, 25, 46, 128, 99, 45, 129
+};
+
 const size_t wgl_Offset[144] = {
   offsetof(Dispatch::Global,wglAllocateMemoryNV)/sizeof(void *),
   offsetof(Dispatch::Global,wglAssociateImageBufferEventsI3D)/sizeof(void *),
@@ -8861,6 +9229,28 @@ const void *glx_Value[123] = {
   NULL
 };
 
+const short glx_Seed[122] = {
+  -2, 0, -3, 2, -7, -10, -17, 1, -18, 0, -21, 0, -22, 0, 0, -24,
+  0, 1, 2, 0, 1, 0, 0, 2, 3, -25, 1, 0, 0, -27, 0, -28,
+  4, 4, 0, -30, 0, -31, 0, 0, 0, -32, 1, 1, 0, -42, 2, -49,
+  -53, -58, -59, 0, 0, 0, 4, 0, 5, 7, -64, 0, -65, -68, -70, 6,
+  0, 3, -73, -74, -76, -77, -79, 0, 1, -80, -82, 0, -83, 0, 1, 5,
+  -90, 4, 1, 0, -92, 0, -93, 0, 0, -94, 8, -95, -102, -106, 2, 0,
+  0, -107, 2, -109, 1, 0, -111, -113, -116, 0, 3, 0, 2, 0, 0, 2,
+  2, 1, 0, -117, 0, 5, 0, -120, 0, 0
+};
+
+const unsigned short glx_Slot[122] = {
+  71, 96, 24, 90, 99, 80, 46, 52, 101, 111, 54, 97, 68, 83, 51, 85,
+  73, 6, 11, 45, 34, 103, 41, 67, 89, 104, 44, 82, 63, 48, 74, 26,
+  19, 17, 102, 60, 43, 39, 115, 91, 32, 4, 105, 65, 16, 18, 118, 0,
+  121, 110, 47, 93, 38, 86, 112, 81, 42, 84, 28, 113, 20, 50, 62, 119,
+  77, 59, 58, 98, 1, 22, 57, 33, 49, 61, 108, 88, 75, 120, 36, 27,
+  15, 35, 106, 40, 69, 25, 116, 64, 87, 3, 66, 13, 79, 76, 94, 30,
+  100, 10, 31, 107, 5, 109, 21, 29, 95, 56, 117, 92, 72, 53, 7, 14,
+  78, 12, 8, 55, 114, 70, 2, 9, 37, 23
+};
+
 const size_t glx_Offset[123] = {
   offsetof(Dispatch::Global,glXAllocateMemoryNV)/sizeof(void *),
   offsetof(Dispatch::Global,glXBindChannelToWindowSGIX)/sizeof(void *),
@@ -9101,6 +9491,20 @@ const void *cgl_Value[53] = {
   NULL
 };
 
+const short cgl_Seed[52] = {
+  -1, -6, 0, 1, -8, -14, 0, 0, 0, 1, 3, -15, 1, 0, 2, 1,
+  0, 0, 3, -16, -25, -26, 0, 0, -27, 0, 1, -29, -31, 1, 9, -36,
+  0, 0, 0, -44, -47, 3, 2, 1, -48, 0, 1, -49, 0, 0, -50, -51,
+  3, -52, 0, 0
+};
+
+const unsigned short cgl_Slot[52] = {
+  3, 50, 28, 16, 21, 18, 15, 10, 31, 8, 41, 5, 40, 22, 36, 38,
+  44, 34, 51, 20, 24, 27, 6, 43, 19, 9, 14, 47, 17, 25, 42, 13,
+  7, 23, 33, 0, 29, 45, 49, 30, 4, 11, 26, 39, 46, 48, 32, 1,
+  12, 37, 2, 35
+};
+
 const size_t cgl_Offset[53] = {
   offsetof(Dispatch::Global,CGLChoosePixelFormat)/sizeof(void *),
   offsetof(Dispatch::Global,CGLClearDrawable)/sizeof(void *),
@@ -9293,6 +9697,20 @@ const void *egl_Value[64] = {
   NULL
 };
 
+const short egl_Seed[63] = {
+  -3, -4, 0, -8, -11, 0, 0, 1, 3, -15, 0, -22, 0, -24, 0, 1,
+  -25, -28, 3, 0, -30, 3, 1, 0, 1, 0, 0, 0, 1, -31, 6, -33,
+  -34, -38, 5, 0, -41, 1, -42, 0, -43, 0, -45, -46, 2, -47, -50, 0,
+  0, 4, -53, 0, 0, -55, 1, -57, -59, -60, -62, 2, -63, 0, 0
+};
+
+const unsigned short egl_Slot[63] = {
+  37, 26, 7, 61, 42, 59, 39, 54, 45, 62, 29, 58, 25, 14, 51, 32,
+  56, 16, 49, 60, 33, 22, 34, 6, 18, 2, 38, 1, 24, 35, 8, 36,
+  52, 28, 43, 47, 31, 50, 41, 46, 48, 13, 17, 53, 0, 10, 44, 20,
+  15, 5, 4, 12, 23, 40, 55, 19, 3, 27, 21, 57, 9, 11, 30
+};
+
 const size_t egl_Offset[64] = {
   offsetof(Dispatch::Global,eglBindAPI)/sizeof(void *),
   offsetof(Dispatch::Global,eglBindTexImage)/sizeof(void *),
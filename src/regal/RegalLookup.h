@@ -45,7 +45,6 @@
 
 REGAL_GLOBAL_BEGIN
 
-#include <cstdlib>
 #include <cstring>
 
 REGAL_GLOBAL_END
@@ -54,49 +53,71 @@ REGAL_NAMESPACE_BEGIN
 
 namespace Lookup {
 
-inline int NameCmp(const void *a, const void *b)
+// 32-bit FNV-1a hash of name, as nameHash in scripts/api/ApiHash.py
+
+inline unsigned int NameHash(unsigned int seed, const char *name)
+{
+  unsigned int h = seed ^ 2166136261u;
+  for (; *name; ++name)
+  {
+    h ^= static_cast<unsigned char>(*name);
+    h *= 16777619u;
+  }
+  return h;
+}
+
+// Index of name in the sorted names, or size if not found.
+// A minimal perfect hash, then a strcmp to confirm.
+
+inline size_t NameIndex(const char *name, const char * const *names, const short *seeds, const unsigned short *slots, const size_t size)
 {
-  return std::strcmp(*(const char **) a, *(const char **) b);
+  const int    seed = seeds[NameHash(0,name)%size];
+  const size_t i    = slots[seed<0 ? -seed-1 : NameHash(seed,name)%size];
+  return std::strcmp(names[i],name) ? size : i;
 }
 
 extern const char * const gl_Name[2701];
 extern const void *gl_Value[2701];
+extern const short gl_Seed[2700];
+extern const unsigned short gl_Slot[2700];
 
 template<typename T>
 T
 gl_Lookup(const char *name, T def = NULL)
 {
-  const char **res = (const char **) std::bsearch(&name, gl_Name, 2700, sizeof(const char *), NameCmp);
-  return res ? reinterpret_cast<T>(const_cast<void *>(gl_Value[(size_t) (res - gl_Name)])) : def;
+  const size_t i = NameIndex(name, gl_Name, gl_Seed, gl_Slot, 2700);
+  return i<2700 ? reinterpret_cast<T>(const_cast<void *>(gl_Value[i])) : def;
 }
 
 extern const size_t gl_Offset[2701];
 
 inline size_t gl_LookupOffset(const char *name)
 {
-  const char **res = (const char **) std::bsearch(&name, gl_Name, 2700, sizeof(const char *), NameCmp);
-  return res ? gl_Offset[(size_t) (res - gl_Name)] : 0;
+  const size_t i = NameIndex(name, gl_Name, gl_Seed, gl_Slot, 2700);
+  return i<2700 ? gl_Offset[i] : 0;
 }
 
 #if REGAL_SYS_WGL
 
 extern const char * const wgl_Name[144];
 extern const void *wgl_Value[144];
+extern const short wgl_Seed[143];
+extern const unsigned short wgl_Slot[143];
 
 template<typename T>
 T
 wgl_Lookup(const char *name, T def = NULL)
 {
-  const char **res = (const char **) std::bsearch(&name, wgl_Name, 143, sizeof(const char *), NameCmp);
-  return res ? reinterpret_cast<T>(const_cast<void *>(wgl_Value[(size_t) (res - wgl_Name)])) : def;
+  const size_t i = NameIndex(name, wgl_Name, wgl_Seed, wgl_Slot, 143);
+  return i<143 ? reinterpret_cast<T>(const_cast<void *>(wgl_Value[i])) : def;
 }
 
 extern const size_t wgl_Offset[144];
 
 inline size_t wgl_LookupOffset(const char *name)
 {
-  const char **res = (const char **) std::bsearch(&name, wgl_Name, 143, sizeof(const char *), NameCmp);
-  return res ? wgl_Offset[(size_t) (res - wgl_Name)] : 0;
+  const size_t i = NameIndex(name, wgl_Name, wgl_Seed, wgl_Slot, 143);
+  return i<143 ? wgl_Offset[i] : 0;
 }
 
 #endif /* REGAL_SYS_WGL */
@@ -104,21 +125,23 @@ inline size_t wgl_LookupOffset(const char *name)
 
 extern const char * const glx_Name[123];
 extern const void *glx_Value[123];
+extern const short glx_Seed[122];
+extern const unsigned short glx_Slot[122];
 
 template<typename T>
 T
 glx_Lookup(const char *name, T def = NULL)
 {
-  const char **res = (const char **) std::bsearch(&name, glx_Name, 122, sizeof(const char *), NameCmp);
-  return res ? reinterpret_cast<T>(const_cast<void *>(glx_Value[(size_t) (res - glx_Name)])) : def;
+  const size_t i = NameIndex(name, glx_Name, glx_Seed, glx_Slot, 122);
+  return i<122 ? reinterpret_cast<T>(const_cast<void *>(glx_Value[i])) : def;
 }
 
 extern const size_t glx_Offset[123];
 
 inline size_t glx_LookupOffset(const char *name)
 {
-  const char **res = (const char **) std::bsearch(&name, glx_Name, 122, sizeof(const char *), NameCmp);
-  return res ? glx_Offset[(size_t) (res - glx_Name)] : 0;
+  const size_t i = NameIndex(name, glx_Name, glx_Seed, glx_Slot, 122);
+  return i<122 ? glx_Offset[i] : 0;
 }
 
 #endif /* REGAL_SYS_GLX */
@@ -126,21 +149,23 @@ inline size_t glx_LookupOffset(const char *name)
 
 extern const char * const cgl_Name[53];
 extern const void *cgl_Value[53];
+extern const short cgl_Seed[52];
+extern const unsigned short cgl_Slot[52];
 
 template<typename T>
 T
 cgl_Lookup(const char *name, T def = NULL)
 {
-  const char **res = (const char **) std::bsearch(&name, cgl_Name, 52, sizeof(const char *), NameCmp);
-  return res ? reinterpret_cast<T>(const_cast<void *>(cgl_Value[(size_t) (res - cgl_Name)])) : def;
+  const size_t i = NameIndex(name, cgl_Name, cgl_Seed, cgl_Slot, 52);
+  return i<52 ? reinterpret_cast<T>(const_cast<void *>(cgl_Value[i])) : def;
 }
 
 extern const size_t cgl_Offset[53];
 
 inline size_t cgl_LookupOffset(const char *name)
 {
-  const char **res = (const char **) std::bsearch(&name, cgl_Name, 52, sizeof(const char *), NameCmp);
-  return res ? cgl_Offset[(size_t) (res - cgl_Name)] : 0;
+  const size_t i = NameIndex(name, cgl_Name, cgl_Seed, cgl_Slot, 52);
+  return i<52 ? cgl_Offset[i] : 0;
 }
 
 #endif /* REGAL_SYS_OSX */
@@ -148,21 +173,23 @@ inline size_t cgl_LookupOffset(const char *name)
 
 extern const char * const egl_Name[64];
 extern const void *egl_Value[64];
+extern const short egl_Seed[63];
+extern const unsigned short egl_Slot[63];
 
 template<typename T>
 T
 egl_Lookup(const char *name, T def = NULL)
 {
-  const char **res = (const char **) std::bsearch(&name, egl_Name, 63, sizeof(const char *), NameCmp);
-  return res ? reinterpret_cast<T>(const_cast<void *>(egl_Value[(size_t) (res - egl_Name)])) : def;
+  const size_t i = NameIndex(name, egl_Name, egl_Seed, egl_Slot, 63);
+  return i<63 ? reinterpret_cast<T>(const_cast<void *>(egl_Value[i])) : def;
 }
 
 extern const size_t egl_Offset[64];
 
 inline size_t egl_LookupOffset(const char *name)
 {
-  const char **res = (const char **) std::bsearch(&name, egl_Name, 63, sizeof(const char *), NameCmp);
-  return res ? egl_Offset[(size_t) (res - egl_Name)] : 0;
+  const size_t i = NameIndex(name, egl_Name, egl_Seed, egl_Slot, 63);
+  return i<63 ? egl_Offset[i] : 0;
 }
 
 #endif /* REGAL_SYS_EGL */
@@ -30855,6 +30855,350 @@ namespace Plugin {
     NULL
   };
 
+  const short lookup_gl_Seed[2696] = {
+    0, 0, -1, -2, 0, 0, -12, -13, -16, 1, 0, -22, 0, -27, 6, -28,
+    1, 2, -29, -34, 1, 0, 0, -39, 0, 0, 0, 0, -40, -41, -47, 0,
+    1, 1, 6, 0, 1, 0, 0, 4, 4, 0, 0, -48, -49, 1, 1, -51,
+    -57, -61, 0, -63, 0, 0, 0, -64, -65, -76, -81, 0, 1, -84, -92, 0,
+    0, -95, 2, 1, 1, 0, 0, 1, 0, -99, 1, 0, 0, -100, -101, 0,
+    0, -102, 4, -103, 0, 0, 0, 1, 1, -107, 1, 1, 0, 0, -110, 1,
+    3, -113, -116, 1, -117, -118, 1, -120, -122, 1, 1, 2, 1, -128, -132, -133,
+    5, -134, -138, -139, 0, -143, 0, 0, -144, 0, -147, 0, -148, -151, -157, 0,
+    1, 0, 3, 1, 2, -158, 0, -161, -164, -165, 0, 0, 0, -168, 8, -169,
+    0, 0, 0, 0, 1, -177, 0, 0, -180, 0, 0, 2, 0, -184, 2, 1,
+    -185, -186, 0, 1, -187, 0, -191, -192, 0, 2, 0, 0, 1, -200, 0, 0,
+    1, -201, -203, 2, 2, -204, 1, 5, 0, -205, 1, 0, 1, 0, 0, 0,
+    0, 3, 0, 0, 1, -210, -212, 0, 2, 1, 0, 3, 1, 0, 0, -214,
+    0, 0, 2, 0, 3, -219, -223, 0, -225, 0, 0, 0, -226, -227, -228, 0,
+    0, 0, 3, 0, 0, 0, 1, -233, 0, 0, 0, 1, -234, 2, 1, 1,
+    0, 2, -235, 1, 0, -236, 5, 2, 1, -237, -239, -243, 2, -244, 3, 0,
+    0, 1, -248, 9, -252, 1, 0, 1, -253, 0, -255, 0, -256, -257, 0, -261,
+    0, 0, -263, -264, -266, 2, 0, 3, 0, 0, -267, 2, -269, -270, -274, 0,
+    -275, 0, 0, 0, 0, 0, 1, 2, -277, -278, -283, -287, 2, -288, 0, 0,
+    2, -290, 1, -292, 0, -296, 2, -299, -301, 1, -303, 0, 2, 2, 0, 0,
+    0, 0, -306, 1, 1, -312, 0, -314, 0, -320, 0, 5, -323, 4, 3, 0,
+    1, -325, -326, 0, 1, 2, 2, 0, 0, 4, 0, -329, 0, -331, -333, 2,
+    0, 0, 0, 0, 1, 0, -334, -335, 0, 0, 1, 2, 4, -336, -344, 0,
+    -351, 1, -358, -360, 0, -368, 3, 1, -370, -371, 0, 1, 0, -372, 0, 1,
+    0, 1, 1, 0, -375, 0, -376, 1, 0, -378, 0, 1, -379, -380, -381, -383,
+    6, 0, -384, -390, 0, 1, 1, -397, 2, -400, 1, 0, -401, -405, -407, 1,
+    0, -409, 0, -410, 0, 0, 0, 0, 0, 0, -411, -413, 1, 0, -414, 0,
+    -419, 0, 0, -420, 0, 0, 0, -421, -430, 0, -431, -434, 0, 0, 1, 1,
+    -436, 0, -441, -442, 0, 2, -443, -446, 2, 0, 0, 3, 0, -447, -453, -455,
+    -456, -459, -468, 2, -469, -470, -473, -474, -475, 1, 0, 0, 2, 2, 0, 0,
+    3, -476, 0, 1, -481, 0, 0, 0, 6, -482, 0, -484, 2, 0, 2, 0,
+    3, 2, -489, -490, 1, 0, 0, -492, 1, 1, -496, -497, 0, 1, 1, 0,
+    -502, -507, 0, 0, -508, -519, 0, -526, 1, 0, 0, 1, 0, 0, 0, 0,
+    7, 0, -528, 0, 1, 0, -530, -533, 1, 0, -534, 0, -536, -537, -539, 0,
+    0, 0, 0, -541, -543, -545, -546, 5, 0, 0, 2, 0, 1, -549, 4, 0,
+    3, -552, -557, 0, -558, 6, 2, -560, 2, 1, -562, -564, -565, -566, 0, -567,
+    1, -568, -572, -573, -575, 3, 1, 1, -578, 0, -579, 1, 1, -582, -585, 9,
+    -597, 0, 0, -603, 0, 0, 0, -604, 0, -605, 0, -607, 1, -608, 0, 0,
+    1, 1, 1, 2, -609, 0, 0, 0, -624, 0, 0, -626, 0, -629, -635, 1,
+    -640, -645, -646, -649, 0, 1, -650, 1, -652, 1, -653, -655, -659, 0, 4, 1,
+    -662, 0, 0, 5, -663, 3, -666, 0, 1, 0, 3, -671, 0, 0, -676, 2,
+    -683, 1, 0, 0, 0, -689, -692, 0, 0, -697, -698, -699, 0, -700, 4, -701,
+    -706, 2, 0, 0, 0, -709, 1, 0, 4, 3, 0, 2, -712, 2, 0, 1,
+    -713, 0, 0, 1, 0, -719, -720, 0, 2, 0, -726, 1, 0, -727, -728, 0,
+    0, 0, 0, -734, -735, 2, -744, -745, -746, -749, 0, -750, 0, 0, 0, 0,
+    3, 0, 0, 1, 0, 0, 0, -756, 0, 1, -758, -761, 0, 0, -764, 0,
+    -766, 0, 5, -768, 3, -770, 3, 0, 0, 0, 0, 0, 0, 0, 0, 1,
+    0, -774, 1, 0, 1, 1, -776, -777, 0, -782, 0, 3, -786, 0, -787, 0,
+    1, -790, 1, 0, 1, 0, -792, 2, -798, -800, 4, 0, -803, -804, 0, 0,
+    1, 1, -806, 0, 0, -810, -814, 3, 2, 0, 0, 0, 0, -815, 1, -816,
+    -818, 0, -820, 0, -826, 0, -827, 0, 7, 2, -831, 3, 1, -832, 0, -833,
+    0, 3, -835, -841, -844, 0, -845, 0, 0, -847, 0, 0, -850, -851, -852, 0,
+    0, 0, 4, 2, 0, -857, 5, 0, -858, 0, -862, 0, 0, 0, -866, 0,
+    1, -868, 0, 0, 1, 1, 0, -869, 0, 1, 1, 2, 0, -878, 1, 0,
+    0, 1, 0, -880, -885, 0, 0, -887, -889, 0, 0, -894, -901, 0, 1, 0,
+    -905, -911, 0, 0, 0, 0, -921, -922, 0, 4, 3, 0, -923, 0, -924, 1,
+    -928, -929, -931, 0, 0, -934, -939, 6, -943, -945, 0, -949, 0, 0, 0, 0,
+    0, 0, -952, 1, -956, 2, 0, 0, 0, -962, 1, 2, -965, 1, -966, 0,
+    3, -968, -973, 0, -977, 1, -978, 0, -983, 0, 4, -984, 0, 0, 0, 3,
+    1, -985, -986, 0, 0, -989, 0, 2, 2, 0, 3, 0, 3, 0, -995, 1,
+    1, -997, -1000, -1004, -1006, -1007, -1008, -1011, 0, -1014, -1022, -1023, 0, -1025, 1, 0,
+    1, 0, -1026, 0, 0, 3, 0, 0, -1027, 2, 1, 13, -1028, 0, 0, -1029,
+    1, 0, 0, 0, 0, 4, 1, 0, 4, -1030, 0, 0, 0, -1034, 1, 1,
+    0, 0, 2, 0, -1035, 0, 0, -1037, 0, 1, 0, -1038, 0, -1040, 13, -1041,
+    2, 0, -1042, 2, -1046, 1, -1049, -1053, 0, -1060, 0, 1, 2, 0, -1061, 9,
+    0, 5, 3, 0, 4, 3, 0, 3, -1062, 1, 0, 4, 1, 0, 2, 2,
+    0, -1063, -1064, 0, -1065, 3, -1075, 0, 0, -1077, 0, 0, -1078, -1079, -1083, -1086,
+    -1087, 0, -1091, -1096, 3, 2, 0, 0, 0, 0, 0, -1098, 7, 0, 4, 0,
+    2, -1099, -1101, -1104, 2, -1105, 1, -1106, 3, 4, 0, 3, 0, 0, -1111, -1113,
+    -1114, 0, 0, 0, -1118, -1121, 0, 1, -1125, -1128, 10, 0, -1133, 1, -1134, 0,
+    -1137, 3, 0, 1, 1, 0, 1, 0, -1139, 1, 0, 0, -1140, 0, 0, -1145,
+    -1152, 5, 1, -1161, -1164, -1165, 0, 0, 0, 2, 1, -1166, 0, 0, -1167, -1169,
+    1, 1, -1171, 0, -1176, 2, 0, 0, -1186, 0, -1187, 0, 0, -1189, 0, -1190,
+    2, 1, 7, 0, -1195, 1, 6, 15, 0, -1201, 1, 2, -1205, -1209, 1, 10,
+    3, 0, -1210, -1212, 0, -1213, -1215, 0, 0, -1216, -1217, -1218, -1220, 0, 0, 10,
+    0, 0, -1221, 0, -1229, -1232, 0, 1, 0, 0, 2, 0, -1233, -1239, -1242, 0,
+    2, -1244, -1246, -1249, 0, 0, 2, 0, -1250, 0, 3, 0, 1, -1251, -1254, 0,
+    -1256, -1258, -1259, -1260, -1262, 2, -1264, 2, 7, 2, -1267, 1, 0, -1270, -1271, -1273,
+    -1277, -1279, -1281, -1282, -1285, 0, -1286, 1, 1, 0, -1291, 0, 5, 0, -1293, 0,
+    0, 1, -1299, 1, -1307, -1309, 0, 1, 0, -1310, 0, 1, -1312, 1, 0, 0,
+    1, 0, 1, 2, 0, 3, 0, -1316, 3, 3, 0, -1317, 0, -1319, -1330, -1333,
+    0, 1, -1335, -1337, 1, 0, -1341, -1342, 0, -1343, 0, 1, 0, -1344, -1345, -1347,
+    -1348, 2, 2, 0, 0, 0, 3, -1349, -1352, 2, -1356, 0, -1357, -1362, -1364, -1367,
+    0, -1371, 0, 0, 0, 0, 1, 0, 0, -1374, 1, 0, 0, 8, -1383, 4,
+    1, -1387, 0, 1, 1, 0, -1388, -1389, -1390, 0, 0, 4, 0, 7, 4, 0,
+    8, -1391, -1393, -1394, 0, 0, 0, 2, 2, 3, -1397, 0, 0, 2, 2, 1,
+    -1403, 0, 3, -1405, 5, 0, 5, -1410, 0, 0, 0, -1411, 1, 0, 2, 3,
+    6, 2, 0, -1412, -1423, 0, -1424, 0, 0, -1425, 0, -1426, 0, -1428, 0, -1430,
+    2, -1431, -1434, 1, 0, -1436, 0, 4, 1, -1437, 0, 0, 1, 11, 0, -1442,
+    0, 0, 0, 0, 5, 0, 0, 0, -1447, 1, 2, -1448, 1, 5, 0, 1,
+    -1450, -1451, 0, 1, -1453, 2, 4, 2, -1455, -1457, 11, 0, 0, -1459, 1, 0,
+    -1461, 0, 0, 0, -1464, 3, 0, 0, -1467, 0, 0, -1469, 0, 0, 3, -1470,
+    -1471, 3, 0, -1474, 3, 0, -1475, -1479, -1484, 1, 1, 0, 3, 0, 0, -1485,
+    -1487, 1, 0, -1494, 1, 0, 0, -1495, 2, 1, -1498, 1, 0, 0, -1500, -1516,
+    0, 0, 0, 2, 3, 1, -1520, -1521, 0, 2, 0, 0, 2, -1522, 0, 0,
+    -1523, 0, 0, 0, 0, 1, -1527, -1530, 0, 0, 0, 2, -1531, -1533, 0, -1534,
+    0, 4, -1541, 0, -1543, -1544, 0, 9, 2, -1548, -1549, 0, 0, 1, 0, -1552,
+    1, 0, -1555, -1556, 0, 0, 0, -1558, 0, 16, -1559, -1560, 0, 15, -1563, 0,
+    1, 0, 0, -1566, -1575, 0, 5, 0, -1577, -1578, -1583, 15, -1585, 1, 0, -1591,
+    1, 3, -1595, 4, -1596, 0, 1, -1599, -1600, -1601, 5, -1603, 3, -1604, 0, 0,
+    3, 1, -1607, 0, 5, 0, -1616, 0, 0, 4, -1617, -1618, 0, -1626, -1628, 0,
+    1, 0, 0, -1632, -1634, -1635, 2, 0, -1636, 0, -1639, 2, 7, 0, -1640, 2,
+    0, 0, 3, -1646, -1648, 0, 1, -1649, -1653, -1658, -1664, 0, -1665, 2, 0, 0,
+    -1666, 0, 0, 0, -1670, 1, -1671, 0, 3, -1672, 2, -1674, 0, 3, 0, 0,
+    -1677, -1681, -1682, 0, 0, 0, -1684, -1685, -1686, 1, -1691, 5, 2, 0, 0, 0,
+    -1698, -1700, -1702, -1706, 4, -1707, 2, 2, -1710, 0, -1711, 1, 3, -1714, -1722, 2,
+    0, 0, 0, -1723, 0, -1725, 4, 0, -1726, 0, 1, 2, -1730, -1731, 0, 0,
+    9, 0, 0, 0, -1732, -1734, 1, -1737, 0, -1742, 0, 1, -1743, 3, 0, 0,
+    0, -1750, -1754, -1757, -1758, 0, 3, 5, -1759, 0, 2, -1760, 4, 0, -1761, 5,
+    0, -1763, 0, -1764, 0, -1767, -1770, 0, 8, -1775, 4, 9, 0, 0, 1, -1778,
+    1, 0, 1, 2, -1783, 0, -1785, -1786, 0, -1791, -1793, 0, 0, 0, 2, 0,
+    -1797, 0, -1801, -1803, 0, 0, 0, -1804, 0, 0, 1, 2, 0, -1809, 10, -1812,
+    0, 0, -1815, 1, 4, -1816, -1821, -1822, 0, -1825, 0, 0, -1827, 0, -1829, 0,
+    0, 0, -1830, 2, -1831, -1832, -1835, -1841, -1842, -1843, 0, 0, 1, 1, -1844, 0,
+    -1848, 0, -1850, 1, 2, 0, 10, 0, -1854, 1, -1855, -1856, 0, -1860, -1861, 1,
+    -1862, 2, -1866, -1868, 2, -1869, 0, -1871, 9, 1, 0, 0, 0, 6, -1873, 0,
+    7, 0, -1874, 6, -1875, 2, 0, 4, -1877, 1, 0, 0, -1881, -1884, -1885, 1,
+    -1888, 3, -1890, -1891, 0, 6, -1898, -1900, -1901, 11, 0, 2, -1903, 7, -1904, 1,
+    4, -1911, -1919, 0, -1920, 1, -1921, -1926, 0, 0, 0, 0, -1928, 0, 0, 1,
+    -1931, -1933, 0, -1936, 6, 0, 0, 5, 0, 3, -1937, 0, 0, 0, 1, 1,
+    0, -1938, 0, -1939, 1, 3, 0, 0, -1942, -1944, 0, -1946, 0, 0, -1948, 0,
+    0, -1953, 8, 0, 1, -1955, 0, 0, -1957, 0, 0, 2, 2, 0, 1, 0,
+    0, -1959, 4, -1961, 21, -1963, -1966, -1971, 0, -1972, 0, -1974, 0, -1975, -1976, -1980,
+    -1981, 4, 0, 2, 2, 0, -1982, -1986, -1987, -1988, 1, -1997, 10, -1998, 6, 0,
+    -1999, -2000, 4, 1, -2005, -2006, -2010, 0, -2011, -2012, 0, -2014, -2017, -2018, 1, 6,
+    0, 0, 0, 1, 0, 0, 0, -2025, 0, -2028, -2029, 1, -2032, -2033, 0, 6,
+    -2036, -2037, 0, 0, -2041, -2043, -2044, 0, -2047, -2048, -2049, -2053, 0, 0, -2056, 2,
+    6, 2, 1, 0, 0, -2058, -2059, 0, 0, -2061, 0, 1, -2063, 1, -2067, -2070,
+    -2071, 6, 0, 0, 0, -2072, -2074, 0, -2075, 6, 0, -2078, 0, 0, -2080, 0,
+    -2082, -2083, 2, 8, 0, 0, 0, -2084, 0, 0, 4, 0, -2085, 2, -2086, 0,
+    0, 0, -2089, 0, -2092, 0, 1, 0, 0, 1, 0, 2, -2100, 0, -2109, 0,
+    5, -2110, -2118, 0, 0, -2120, -2123, 2, -2129, 13, -2130, -2133, 0, 0, 0, 1,
+    7, 0, -2135, -2145, -2147, 1, 5, 0, 0, -2149, 0, 0, -2152, 5, -2157, 0,
+    5, -2166, -2167, 0, 0, 0, 0, 3, 4, 0, -2169, 1, 0, -2178, -2183, 0,
+    1, -2186, -2187, 0, 0, 0, -2189, 0, 0, -2193, -2195, 0, 10, 2, -2203, -2204,
+    0, 1, 4, -2207, 3, 0, 1, -2208, -2225, -2228, 0, 9, 1, 0, 0, 1,
+    0, 1, -2229, 2, -2231, -2232, 1, 0, -2236, 0, 3, -2237, -2238, 1, -2241, 0,
+    -2244, -2251, 0, 3, 0, 1, 0, 0, 0, 1, 0, 2, 5, 6, 0, -2256,
+    12, 0, -2273, 0, -2279, 0, 0, 0, 2, -2284, 1, 1, 1, -2288, -2292, -2293,
+    0, -2294, 0, 0, 2, 0, 3, 2, -2297, -2300, -2309, -2318, -2325, 0, 1, 0,
+    0, 0, 2, 0, 2, 0, 0, -2326, 0, 0, 0, -2327, 4, 7, 2, -2329,
+    2, -2330, 0, -2333, -2336, 0, 6, 0, 0, -2337, 0, 0, 0, 0, 1, 7,
+    0, 0, -2338, 0, 0, 0, -2342, -2349, 2, 0, -2352, -2353, -2358, 3, -2360, 4,
+    6, 0, 0, 7, -2361, -2365, -2369, 5, -2370, -2375, -2378, -2380, 4, -2381, -2382, -2384,
+    4, -2387, -2388, 0, 5, -2389, -2392, 4, 1, 3, 7, 0, 2, 8, 0, -2399,
+    -2400, 9, -2403, 6, 0, -2404, 0, 0, 0, 0, 0, 0, 1, -2406, 0, 0,
+    -2410, 0, 2, 6, 0, -2411, -2414, 0, -2415, 0, -2421, 0, -2423, 1, 0, 8,
+    -2424, -2425, 0, 0, -2426, 0, -2427, 3, 1, 0, 2, 0, 0, 0, 0, 1,
+    2, 0, 12, 1, 11, 1, -2432, 4, 0, 9, 1, 0, -2433, -2437, -2438, 0,
+    0, 0, 2, 0, -2439, 0, 0, 8, 0, 0, -2443, 0, 4, 17, -2444, 0,
+    0, 0, -2446, 5, 0, -2447, 0, -2449, 0, -2453, -2454, 10, -2457, 0, 1, 0,
+    0, 8, 0, 1, 13, 2, 0, -2460, 0, 3, 7, -2462, 0, 0, 0, 0,
+    1, -2463, 0, 0, -2465, 4, 5, -2468, 2, 0, 5, 17, -2469, 3, 1, 0,
+    0, 0, 2, -2470, 0, 3, -2471, -2472, -2473, 5, 0, -2474, 0, 2, -2477, 3,
+    -2478, -2480, -2483, -2484, -2486, 0, 0, 6, 0, 0, -2488, 4, 0, 0, 0, 0,
+    0, -2490, -2493, -2496, -2501, 0, -2504, 6, -2505, -2506, 0, 4, 0, 0, 1, 16,
+    -2507, 0, 32, 1, 0, -2508, -2509, -2510, 1, -2511, 0, 0, 0, 0, -2512, 0,
+    -2514, 0, 3, 0, 17, 0, 1, 0, 0, 0, -2515, -2518, -2521, -2523, -2524, 5,
+    -2526, -2527, 6, 4, 0, 0, -2530, -2536, 0, 0, 0, 4, -2538, 0, -2540, -2544,
+    16, -2545, -2550, -2553, -2554, 6, -2558, 0, -2563, -2567, 0, 0, -2572, 0, 3, 0,
+    0, 0, -2573, 0, 0, 2, 5, -2574, -2575, 0, -2580, 0, 0, -2582, -2586, -2587,
+    0, -2588, -2593, 0, -2601, 3, 8, 0, 2, 5, -2605, 0, -2611, 2, 0, 0,
+    -2612, 0, 2, -2613, -2614, 0, 0, 0, -2615, 0, -2617, 35, 4, 0, 3, 1,
+    0, 11, 1, 4, -2618, 0, 0, 0, 0, -2619, 0, -2622, 0, -2628, -2630, 0,
+    3, 0, 0, 0, 5, 0, 1, 2, -2633, -2635, 0, 1, -2638, 1, -2639, 0,
+    0, 0, -2640, 0, 10, 0, 0, -2641, 9, 1, 16, -2642, -2643, 0, 0, -2644,
+    -2646, -2650, 9, 0, -2652, -2653, -2654, 0, 0, 0, -2659, 18, 10, 1, 2, 8,
+    -2666, -2667, 0, 10, -2671, -2673, 0, 0, 0, 0, 1, 13, 0, -2679, 0, 0,
+    12, -2683, 0, 0, 0, -2684, -2690, -2696
+  };
+
+  const unsigned short lookup_gl_Slot[2696] = {
+    816, 1838, 187, 1166, 2373, 700, 1349, 649, 1984, 542, 1696, 1467, 1747, 2376, 2414, 75,
+    806, 1136, 1453, 2579, 1426, 622, 1211, 59, 2478, 1626, 1378, 273, 451, 1973, 2071, 1530,
+    509, 1679, 1393, 1755, 933, 736, 2028, 748, 673, 1505, 1326, 2262, 1235, 1799, 2588, 1452,
+    1920, 2358, 1488, 431, 947, 1252, 888, 1153, 678, 638, 644, 1503, 1131, 544, 251, 126,
+    1253, 2104, 1435, 2090, 1117, 1331, 404, 1791, 1572, 1583, 1367, 603, 1177, 2286, 2520, 1566,
+    2215, 283, 2454, 140, 136, 111, 944, 1842, 2682, 1065, 874, 717, 1257, 1183, 2081, 391,
+    2393, 407, 1051, 764, 1167, 100, 2237, 2289, 1046, 696, 1430, 1497, 612, 2120, 1814, 2033,
+    2245, 2599, 167, 1094, 438, 1277, 2261, 541, 7, 1752, 2191, 493, 1138, 1778, 1884, 619,
+    2565, 2395, 1198, 1821, 1011, 2499, 1237, 1879, 2272, 1876, 454, 942, 1969, 2179, 252, 267,
+    246, 2387, 1780, 2370, 1967, 1806, 2047, 919, 340, 1987, 1255, 2504, 1862, 385, 1396, 709,
+    76, 2430, 1631, 1431, 207, 325, 1314, 491, 1915, 857, 1979, 2040, 962, 1291, 691, 1646,
+    2631, 2251, 1666, 798, 768, 377, 159, 225, 168, 1156, 1918, 2665, 1942, 1206, 1728, 2417,
+    1794, 2124, 697, 189, 1017, 799, 760, 1196, 2159, 2014, 1067, 1568, 1327, 2093, 955, 2065,
+    1988, 280, 1213, 2126, 1357, 1980, 2689, 761, 1220, 2253, 1078, 60, 2222, 1785, 1225, 2629,
+    1415, 1573, 1703, 56, 67, 2622, 1397, 2516, 676, 1358, 2661, 260, 2274, 2400, 2431, 2386,
+    891, 2170, 17, 2030, 2349, 1172, 1535, 289, 1334, 2172, 538, 2485, 825, 718, 2070, 1362,
+    2298, 976, 985, 1118, 2176, 2369, 2678, 324, 1347, 1904, 871, 337, 533, 1338, 2153, 1577,
+    898, 2190, 330, 535, 1935, 1958, 1559, 1048, 956, 2304, 873, 859, 1885, 245, 1772, 2388,
+    112, 1055, 2428, 2299, 2640, 1826, 1805, 2082, 2691, 607, 1145, 1210, 2194, 1099, 556, 2389,
+    647, 192, 704, 872, 877, 2318, 1087, 213, 62, 1191, 1298, 1443, 695, 222, 1615, 951,
+    1293, 2589, 135, 949, 1992, 1756, 757, 413, 1351, 1330, 1216, 1130, 1451, 139, 1264, 1066,
+    141, 2647, 1531, 1392, 21, 1441, 979, 763, 42, 57, 1966, 2583, 2560, 343, 1946, 575,
+    1925, 2476, 83, 2606, 2330, 2175, 64, 1642, 2668, 1288, 154, 908, 205, 2312, 1444, 1260,
+    152, 2252, 2672, 1639, 687, 631, 611, 449, 1050, 1661, 1822, 1305, 296, 2479, 2482, 2677,
+    2686, 2256, 906, 1440, 1382, 69, 1863, 2675, 664, 2255, 2171, 2184, 832, 1241, 194, 2548,
+    1688, 571, 744, 902, 2363, 2129, 265, 101, 18, 1788, 2280, 286, 931, 1950, 97, 2576,
+    1502, 274, 2098, 615, 1663, 2633, 656, 1548, 1116, 2568, 2077, 2451, 1342, 1515, 1674, 2132,
+    932, 198, 778, 820, 2080, 513, 2182, 2564, 1468, 2553, 686, 95, 1024, 294, 2651, 89,
+    2282, 253, 1855, 2061, 1474, 2450, 1509, 729, 667, 2019, 1129, 559, 2073, 442, 1601, 143,
+    1690, 1906, 2031, 608, 1371, 411, 886, 514, 2146, 668, 1597, 1031, 995, 455, 1137, 1628,
+    828, 304, 117, 1064, 1553, 2602, 480, 818, 628, 2440, 1482, 1518, 350, 2004, 421, 2225,
+    1981, 1306, 1044, 507, 1582, 2084, 1908, 2314, 1418, 1742, 2649, 1866, 807, 675, 270, 2627,
+    2009, 169, 854, 1676, 679, 1297, 1250, 953, 138, 2424, 2594, 1246, 1521, 1580, 1848, 961,
+    1691, 1154, 1939, 2049, 1596, 1007, 2466, 216, 1329, 769, 1398, 511, 1215, 1494, 2134, 1938,
+    176, 1457, 537, 1013, 1798, 614, 2422, 1751, 1085, 555, 459, 1965, 2352, 2057, 945, 1956,
+    2381, 965, 1617, 2621, 210, 364, 1851, 2181, 1308, 460, 1598, 2690, 439, 2465, 1455, 1837,
+    2426, 2458, 1850, 1660, 1082, 1741, 2151, 319, 1781, 634, 2646, 2279, 2111, 1905, 2347, 856,
+    2692, 91, 551, 916, 132, 1721, 735, 1501, 597, 2268, 323, 2302, 264, 1035, 1545, 1097,
+    2292, 1687, 1933, 483, 1348, 2015, 2099, 954, 557, 804, 1736, 1454, 2411, 58, 2378, 618,
+    2534, 2333, 86, 646, 839, 1782, 1360, 1669, 1160, 45, 767, 1159, 771, 1345, 2169, 1974,
+    554, 1927, 1624, 684, 1111, 1309, 703, 1811, 406, 2362, 1614, 1032, 1883, 35, 501, 2402,
+    811, 2368, 349, 2475, 558, 2435, 32, 2297, 1603, 153, 815, 2187, 1514, 2284, 1732, 2354,
+    1400, 1765, 2277, 1739, 1015, 808, 889, 5, 1469, 1406, 2026, 2096, 1169, 1711, 215, 934,
+    1715, 2060, 2624, 2326, 392, 651, 1190, 732, 2041, 1163, 384, 234, 2210, 1083, 1818, 688,
+    1641, 520, 901, 1807, 1919, 959, 897, 2420, 1779, 590, 2616, 1712, 913, 1266, 1410, 482,
+    2101, 887, 2345, 1373, 393, 1146, 2484, 885, 2025, 429, 2438, 1070, 831, 983, 677, 232,
+    110, 2050, 2547, 2258, 2107, 2512, 179, 447, 2671, 2684, 978, 782, 235, 1952, 2322, 1917,
+    4, 633, 25, 663, 786, 1658, 1899, 2527, 1960, 574, 923, 307, 290, 11, 2526, 938,
+    2535, 1912, 2332, 853, 1016, 2623, 1762, 203, 776, 448, 1090, 1606, 2598, 123, 1402, 1916,
+    2581, 398, 2290, 2575, 2580, 1036, 1713, 924, 1158, 345, 2199, 1126, 1110, 322, 456, 468,
+    869, 1054, 2242, 2174, 427, 2380, 587, 516, 450, 2355, 1102, 1240, 1725, 2558, 104, 1473,
+    339, 1898, 2188, 2461, 99, 1489, 661, 2674, 1726, 2511, 1962, 950, 465, 2323, 2371, 1080,
+    318, 1891, 2667, 2021, 1767, 2542, 381, 52, 2445, 1561, 2498, 988, 2206, 1465, 1890, 1268,
+    672, 1907, 285, 2442, 506, 1594, 1394, 1416, 2328, 1429, 335, 2044, 1604, 1385, 548, 478,
+    1844, 2016, 2600, 1613, 1433, 1039, 2267, 2434, 1859, 545, 640, 1202, 1517, 1825, 116, 1738,
+    2276, 797, 577, 1746, 1061, 2470, 529, 1983, 2645, 436, 2006, 1852, 1668, 2197, 1316, 766,
+    1616, 2638, 2549, 890, 641, 1446, 1771, 530, 1735, 2086, 1857, 755, 904, 2563, 2510, 858,
+    759, 24, 2455, 1957, 849, 2306, 1845, 1619, 1401, 1704, 524, 218, 1004, 2582, 1490, 750,
+    1230, 1555, 1578, 65, 2574, 172, 720, 2517, 781, 866, 1442, 2074, 2617, 272, 1238, 2223,
+    581, 166, 412, 1168, 2249, 1534, 2443, 1012, 1803, 1328, 2634, 1644, 1911, 1701, 379, 2017,
+    2446, 38, 105, 1332, 500, 1714, 2541, 409, 1635, 2157, 316, 1686, 2128, 813, 1014, 160,
+    33, 1975, 1507, 2659, 415, 2497, 1379, 1227, 1161, 1194, 2334, 1165, 1135, 648, 495, 2140,
+    517, 341, 1808, 2410, 127, 2063, 1599, 1921, 1375, 779, 2221, 2508, 1875, 1120, 1399, 987,
+    363, 1819, 2611, 1931, 2463, 226, 613, 1249, 369, 489, 1472, 14, 796, 536, 2460, 974,
+    2524, 1180, 980, 301, 1971, 2321, 1990, 868, 1522, 1914, 645, 531, 390, 125, 754, 749,
+    2257, 1484, 2394, 1122, 1763, 2401, 1185, 827, 518, 423, 2139, 1223, 1977, 1951, 2500, 2587,
+    881, 2311, 1346, 1361, 1232, 1318, 457, 2492, 366, 298, 1680, 2502, 2344, 922, 2543, 119,
+    504, 1913, 1643, 710, 1877, 639, 1018, 1245, 1425, 1214, 1254, 1719, 2119, 1403, 34, 2551,
+    1282, 1261, 1562, 2688, 1336, 1045, 320, 2415, 1593, 311, 2637, 2167, 722, 2168, 984, 1693,
+    2288, 177, 2201, 1352, 2270, 321, 540, 1008, 601, 576, 2100, 338, 2636, 1861, 2091, 2509,
+    2287, 44, 1104, 716, 624, 131, 2341, 263, 2419, 9, 1124, 1623, 1281, 2269, 2406, 2038,
+    731, 610, 434, 1620, 1792, 652, 1630, 569, 819, 77, 1, 93, 909, 134, 122, 2365,
+    1710, 740, 1586, 1228, 629, 2578, 2519, 241, 1222, 1449, 2285, 128, 582, 2676, 653, 2045,
+    1077, 1272, 685, 1552, 862, 1302, 2367, 1665, 812, 2487, 702, 635, 2538, 1733, 1271, 1659,
+    1086, 1880, 2448, 546, 66, 1259, 163, 627, 157, 2260, 1804, 670, 1776, 730, 2329, 171,
+    92, 2113, 130, 1993, 1608, 1554, 2155, 94, 1219, 1462, 1193, 970, 2397, 1602, 2567, 2173,
+    181, 1560, 484, 79, 765, 471, 344, 1461, 1233, 1761, 1587, 2310, 567, 164, 2307, 87,
+    758, 2189, 1532, 204, 403, 1072, 72, 1510, 2346, 1512, 90, 2679, 1448, 2585, 146, 602,
+    617, 98, 2088, 1038, 22, 2117, 2118, 936, 2109, 1053, 1684, 2666, 2577, 271, 376, 417,
+    2300, 1591, 129, 2521, 2067, 284, 1388, 2658, 1508, 834, 616, 1750, 1611, 230, 1149, 1381,
+    1699, 929, 566, 2641, 1364, 1074, 1030, 46, 2471, 2264, 1793, 1025, 1084, 1743, 809, 1887,
+    1809, 347, 2106, 2230, 383, 1655, 1539, 1629, 1889, 1790, 6, 2115, 2609, 2112, 1881, 2238,
+    560, 1236, 1543, 1010, 1670, 788, 1557, 494, 852, 917, 2429, 1369, 1656, 175, 2022, 156,
+    487, 662, 2408, 2555, 2183, 1695, 2192, 31, 357, 659, 1247, 1537, 410, 1651, 2319, 195,
+    2374, 2383, 727, 830, 525, 1354, 694, 937, 2657, 182, 1471, 523, 53, 580, 2456, 430,
+    2653, 1355, 1006, 2331, 1513, 1275, 2533, 85, 1372, 1052, 1955, 354, 1777, 1926, 221, 1081,
+    1434, 1796, 2208, 1483, 712, 912, 2532, 133, 2474, 1192, 1569, 539, 669, 2642, 333, 2507,
+    238, 1892, 1634, 927, 23, 1835, 30, 657, 2177, 1475, 604, 1447, 519, 2351, 1810, 408,
+    2515, 1002, 1115, 240, 879, 1770, 1813, 2404, 209, 1028, 1797, 1589, 1692, 918, 305, 2250,
+    2546, 1754, 382, 1269, 2693, 197, 1283, 851, 878, 724, 845, 2144, 170, 2663, 466, 282,
+    453, 1833, 2121, 674, 738, 2027, 12, 348, 228, 257, 867, 1320, 593, 1312, 1717, 1148,
+    870, 1847, 2464, 1243, 1924, 39, 960, 946, 2303, 2204, 914, 1407, 374, 2013, 968, 1832,
+    847, 2660, 2681, 728, 2449, 1374, 2148, 481, 926, 1096, 957, 745, 2348, 1673, 1882, 1267,
+    2572, 884, 636, 2473, 1307, 822, 1344, 1749, 1188, 1546, 2605, 312, 145, 2615, 1697, 1943,
+    2265, 1092, 1108, 433, 1057, 1538, 1466, 2447, 1366, 2036, 287, 1605, 0, 1994, 2493, 121,
+    370, 532, 1496, 1519, 1125, 470, 940, 242, 255, 860, 479, 2544, 742, 650, 1439, 1020,
+    178, 1152, 1485, 843, 1003, 584, 2613, 2123, 1107, 2149, 1079, 2554, 1244, 883, 360, 973,
+    1954, 1391, 2687, 1322, 1023, 1043, 355, 1184, 475, 2444, 78, 247, 2604, 939, 1256, 2043,
+    1978, 342, 1009, 2072, 2603, 2407, 655, 29, 1667, 1420, 1239, 462, 981, 1999, 850, 1801,
+    1005, 1564, 1323, 2283, 1849, 2459, 2068, 1853, 1119, 969, 1789, 841, 1073, 1068, 1359, 402,
+    855, 326, 1411, 1708, 1493, 1310, 211, 2477, 2561, 2570, 863, 2525, 183, 2094, 435, 2039,
+    1902, 2656, 1311, 1682, 1491, 1437, 910, 1317, 1140, 1930, 161, 747, 701, 1901, 227, 295,
+    2029, 2214, 1998, 2399, 1718, 1504, 1961, 2102, 1657, 2569, 351, 184, 365, 977, 2254, 2138,
+    120, 1276, 373, 2154, 1964, 690, 2398, 1419, 1886, 303, 488, 774, 1827, 400, 1089, 2433,
+    625, 1632, 2012, 1093, 1201, 2495, 109, 1653, 1132, 2379, 1409, 521, 2243, 588, 2320, 1576,
+    528, 2127, 498, 699, 958, 570, 654, 1123, 543, 2626, 2313, 1506, 1363, 2539, 2557, 752,
+    1157, 2670, 2317, 2467, 925, 1551, 1678, 425, 1982, 40, 562, 1113, 2552, 2116, 836, 1324,
+    621, 2403, 464, 1091, 356, 2305, 1730, 907, 1181, 2639, 474, 1724, 1076, 1523, 1910, 823,
+    1700, 237, 2085, 2655, 359, 2010, 2232, 1563, 2227, 1170, 1438, 2324, 2596, 2360, 840, 68,
+    1893, 2266, 1934, 96, 1022, 2662, 2087, 440, 787, 930, 243, 328, 2488, 217, 389, 660,
+    2078, 2244, 1176, 151, 1109, 190, 1729, 623, 88, 522, 310, 2664, 1612, 3, 1197, 810,
+    2211, 288, 1549, 2573, 313, 814, 1650, 2291, 2180, 2198, 2586, 775, 1226, 137, 1204, 1748,
+    1744, 1144, 1595, 329, 19, 1784, 1683, 1189, 1581, 2652, 2357, 80, 428, 1652, 81, 1723,
+    54, 362, 13, 1949, 1062, 762, 1544, 461, 2591, 1128, 334, 2224, 2294, 2486, 1689, 1783,
+    2162, 753, 817, 609, 2518, 2178, 1872, 1037, 214, 2089, 1579, 444, 380, 1133, 706, 1103,
+    2593, 1445, 1903, 1769, 1585, 861, 626, 2042, 865, 292, 180, 2620, 1600, 1069, 801, 443,
+    503, 1495, 1894, 279, 1671, 785, 1325, 2385, 2185, 1812, 1731, 1315, 2501, 142, 713, 2489,
+    875, 2058, 2556, 1098, 2327, 1570, 1295, 1820, 2229, 469, 992, 1664, 1828, 1500, 1840, 1533,
+    1839, 48, 206, 971, 27, 999, 1370, 1333, 259, 2002, 10, 352, 1843, 2453, 2147, 399,
+    2076, 2608, 2166, 1258, 943, 526, 552, 395, 208, 723, 880, 1019, 2209, 1404, 2108, 394,
+    1187, 1830, 2694, 773, 2635, 1541, 1319, 1829, 905, 1846, 1499, 1389, 2051, 1313, 2052, 2054,
+    824, 405, 71, 1341, 1638, 41, 1929, 1386, 2643, 2513, 876, 1436, 268, 1041, 1059, 1878,
+    1972, 2571, 1588, 1928, 103, 739, 737, 1251, 418, 2416, 1542, 1477, 1229, 2483, 1353, 1870,
+    2023, 1706, 1854, 2271, 2457, 1565, 1134, 2241, 1640, 1896, 2219, 2384, 1390, 966, 714, 821,
+    848, 1365, 2213, 780, 297, 378, 1075, 1095, 515, 733, 1383, 1675, 2133, 1178, 1205, 446,
+    2528, 426, 2545, 1480, 2695, 2212, 2338, 2601, 1042, 314, 1150, 1218, 596, 1516, 599, 1174,
+    2536, 573, 1304, 882, 1280, 368, 2650, 155, 1212, 445, 2008, 2391, 1968, 2356, 2340, 422,
+    751, 1195, 683, 1171, 726, 1339, 2130, 1027, 715, 585, 2669, 1574, 2413, 2203, 2003, 1200,
+    1248, 756, 2205, 1224, 2032, 952, 2064, 707, 2506, 1869, 803, 692, 1575, 1207, 293, 1151,
+    783, 1412, 896, 997, 437, 837, 375, 1836, 2614, 74, 36, 1991, 1923, 336, 47, 1270,
+    1049, 361, 173, 1817, 2405, 2020, 784, 2165, 2231, 2233, 1525, 1865, 1868, 188, 1758, 2472,
+    2421, 499, 2200, 2481, 2164, 1047, 1745, 2469, 2390, 1527, 229, 1263, 2592, 43, 746, 1672,
+    2673, 2540, 512, 202, 1026, 258, 964, 2034, 327, 108, 1922, 1705, 1989, 1547, 2046, 2062,
+    1681, 458, 666, 2059, 231, 1142, 1056, 2007, 2226, 2531, 2160, 201, 549, 600, 497, 2523,
+    743, 1460, 1709, 1722, 1395, 1932, 432, 2278, 637, 1408, 1155, 2425, 162, 583, 698, 492,
+    2607, 1800, 2281, 921, 2619, 502, 2125, 967, 2235, 2248, 2382, 1427, 1300, 84, 1479, 2114,
+    721, 527, 278, 2462, 563, 158, 592, 236, 1421, 1757, 594, 1033, 1909, 1618, 1296, 223,
+    2011, 317, 1720, 2337, 2654, 387, 262, 792, 1464, 467, 1702, 1273, 990, 2491, 1175, 1498,
+    1511, 2141, 1487, 1321, 2537, 1888, 1405, 1945, 1648, 2217, 1423, 2295, 802, 332, 200, 61,
+    1105, 1209, 397, 196, 1274, 239, 185, 2207, 795, 589, 1492, 1610, 2301, 1414, 1871, 708,
+    2110, 1795, 1948, 1944, 490, 996, 414, 463, 2, 1526, 829, 941, 2152, 833, 682, 291,
+    277, 606, 1841, 791, 1774, 1649, 681, 2339, 1864, 642, 2441, 2550, 892, 1058, 1424, 1622,
+    2359, 1262, 1873, 2343, 1775, 2315, 219, 220, 191, 1242, 2056, 982, 1760, 1524, 928, 276,
+    2610, 1279, 2161, 1034, 1217, 2618, 1867, 1766, 1285, 472, 1101, 665, 26, 2035, 2366, 51,
+    256, 2566, 2437, 1470, 1976, 1940, 1677, 772, 903, 643, 8, 1584, 1637, 1265, 82, 2648,
+    1164, 2514, 2432, 991, 124, 1376, 826, 989, 790, 1450, 2122, 1021, 1607, 1063, 1786, 553,
+    1716, 1417, 2683, 1647, 986, 741, 2097, 2530, 1114, 1802, 486, 2392, 114, 770, 725, 994,
+    2195, 844, 2559, 2625, 2412, 1953, 1071, 2308, 972, 2316, 565, 416, 1727, 2263, 711, 1997,
+    1740, 2375, 1463, 2480, 37, 805, 2529, 261, 2452, 2202, 693, 174, 2150, 1199, 1995, 1303,
+    1970, 671, 900, 2095, 2342, 680, 842, 975, 1106, 2055, 473, 2418, 49, 2083, 993, 2103,
+    719, 308, 2240, 1860, 1768, 2595, 2193, 485, 2377, 281, 1208, 789, 1609, 2131, 2145, 846,
+    107, 1895, 476, 186, 1636, 2496, 2296, 2156, 199, 2630, 249, 2427, 1621, 496, 591, 2218,
+    510, 1520, 113, 505, 547, 1550, 2503, 144, 165, 2005, 1478, 1633, 2353, 561, 564, 16,
+    212, 1141, 63, 233, 1685, 2001, 1356, 70, 1540, 1335, 2236, 372, 1823, 579, 1127, 948,
+    1937, 630, 2234, 302, 1764, 2136, 2396, 1350, 2105, 266, 2000, 1815, 2239, 1900, 920, 1380,
+    269, 2228, 1292, 2275, 605, 244, 2439, 2364, 1428, 1824, 2590, 148, 1337, 1143, 306, 102,
+    911, 106, 2024, 2325, 1179, 299, 689, 2423, 899, 1340, 150, 1959, 1422, 598, 300, 118,
+    1590, 508, 2163, 1556, 1121, 248, 2612, 2053, 998, 115, 1897, 1476, 1387, 1528, 2247, 353,
+    620, 1284, 193, 1996, 315, 2628, 800, 386, 2196, 1299, 346, 2505, 1290, 794, 1060, 2350,
+    2372, 50, 2436, 1753, 1029, 1343, 2142, 2409, 477, 2246, 1289, 1694, 309, 275, 1707, 28,
+    2584, 2361, 1221, 2220, 358, 1571, 441, 734, 864, 1625, 2066, 2216, 1100, 1186, 1985, 550,
+    534, 1486, 73, 2075, 2685, 586, 2037, 452, 2259, 1592, 835, 15, 2562, 1278, 1536, 793,
+    572, 632, 2137, 1936, 1301, 1831, 1963, 254, 2079, 1816, 1856, 420, 1941, 2293, 1986, 2597,
+    1627, 2158, 1698, 2335, 331, 2522, 1458, 149, 2069, 2143, 1147, 55, 1234, 1459, 705, 224,
+    595, 777, 1377, 1654, 1001, 2490, 568, 2644, 1162, 1040, 1413, 1737, 1759, 1481, 1286, 147,
+    1645, 1834, 419, 1112, 1558, 1203, 1734, 894, 2186, 1182, 1432, 1662, 1456, 250, 1947, 2309,
+    915, 1088, 963, 2048, 2632, 2018, 658, 401, 424, 1874, 2273, 2336, 1567, 2494, 371, 935,
+    2092, 1368, 2680, 1858, 388, 20, 396, 1529, 1287, 1139, 1173, 1773, 1384, 2468, 1294, 1231,
+    578, 2135, 1000, 895, 838, 367, 893, 1787
+  };
+
   #if REGAL_SYS_WGL
   const char * const lookup_wgl_Name[144] = {
     "wglAllocateMemoryNV",
@@ -31149,6 +31493,30 @@ namespace Plugin {
     (void *)(plugin_wglWaitForSbcOML),
     NULL
   };
+
+  const short lookup_wgl_Seed[143] = {
+    1, -1, -3, 1, -5, -6, 0, 1, 1, -8, 1, 1, -10, -15, 0, 1,
+    0, 2, 2, -16, 0, 1, 1, 0, 0, 0, 0, -17, 0, 1, 2, 3,
+    0, 2, 0, 0, 0, 2, -20, 1, 1, -29, 2, -33, 0, 2, 1, -35,
+    -36, 0, 0, 0, 0, 0, 0, -39, 0, -41, 0, -42, 0, 1, 0, 0,
+    2, 1, 0, -44, 1, -46, -48, 0, 0, 4, 4, -49, -52, 0, -54, -55,
+    -63, -65, -71, -72, 0, 0, -73, 3, -75, -76, -77, 8, 0, 0, -86, -87,
+    0, 0, -89, 0, -91, 0, 1, 3, -92, 0, 1, -95, 0, 0, -97, 0,
+    -99, -105, 0, 0, 0, -110, -115, -118, 0, -121, 4, -122, 3, -123, 2, 0,
+    -126, -127, -129, 12, -133, -134, 0, 0, -135, 0, -136, 9, 0, 4, 0
+  };
+
+  const unsigned short lookup_wgl_Slot[143] = {
+    117, 70, 21, 124, 104, 95, 68, 90, 126, 58, 3, 76, 131, 35, 63, 83,
+    133, 37, 82, 41, 33, 40, 91, 80, 62, 13, 30, 8, 93, 105, 100, 43,
+    17, 32, 27, 134, 97, 48, 39, 137, 139, 29, 132, 140, 56, 5, 110, 53,
+    20, 22, 107, 36, 59, 19, 85, 109, 7, 31, 15, 6, 47, 10, 71, 142,
+    102, 86, 54, 4, 116, 122, 18, 61, 112, 14, 73, 114, 1, 66, 2, 101,
+    127, 51, 65, 24, 123, 78, 34, 94, 98, 11, 119, 125, 64, 89, 118, 23,
+    49, 115, 42, 60, 79, 74, 77, 16, 84, 138, 96, 69, 108, 26, 136, 72,
+    103, 44, 9, 113, 121, 52, 81, 57, 120, 106, 0, 75, 12, 88, 92, 67,
+    141, 135, 87, 111, 28, 55, 38, 130, 50, 25, 46, 128, 99, 45, 129
+  };
   #endif /* REGAL_SYS_WGL */
 
   #if REGAL_SYS_GLX
@@ -31403,6 +31771,28 @@ namespace Plugin {
     (void *)(plugin_glXWaitX),
     NULL
   };
+
+  const short lookup_glx_Seed[122] = {
+    -2, 0, -3, 2, -7, -10, -17, 1, -18, 0, -21, 0, -22, 0, 0, -24,
+    0, 1, 2, 0, 1, 0, 0, 2, 3, -25, 1, 0, 0, -27, 0, -28,
+    4, 4, 0, -30, 0, -31, 0, 0, 0, -32, 1, 1, 0, -42, 2, -49,
+    -53, -58, -59, 0, 0, 0, 4, 0, 5, 7, -64, 0, -65, -68, -70, 6,
+    0, 3, -73, -74, -76, -77, -79, 0, 1, -80, -82, 0, -83, 0, 1, 5,
+    -90, 4, 1, 0, -92, 0, -93, 0, 0, -94, 8, -95, -102, -106, 2, 0,
+    0, -107, 2, -109, 1, 0, -111, -113, -116, 0, 3, 0, 2, 0, 0, 2,
+    2, 1, 0, -117, 0, 5, 0, -120, 0, 0
+  };
+
+  const unsigned short lookup_glx_Slot[122] = {
+    71, 96, 24, 90, 99, 80, 46, 52, 101, 111, 54, 97, 68, 83, 51, 85,
+    73, 6, 11, 45, 34, 103, 41, 67, 89, 104, 44, 82, 63, 48, 74, 26,
+    19, 17, 102, 60, 43, 39, 115, 91, 32, 4, 105, 65, 16, 18, 118, 0,
+    121, 110, 47, 93, 38, 86, 112, 81, 42, 84, 28, 113, 20, 50, 62, 119,
+    77, 59, 58, 98, 1, 22, 57, 33, 49, 61, 108, 88, 75, 120, 36, 27,
+    15, 35, 106, 40, 69, 25, 116, 64, 87, 3, 66, 13, 79, 76, 94, 30,
+    100, 10, 31, 107, 5, 109, 21, 29, 95, 56, 117, 92, 72, 53, 7, 14,
+    78, 12, 8, 55, 114, 70, 2, 9, 37, 23
+  };
   #endif /* REGAL_SYS_GLX */
 
   #if REGAL_SYS_OSX
@@ -31517,6 +31907,20 @@ namespace Plugin {
     (void *)(plugin_CGLUpdateContext),
     NULL
   };
+
+  const short lookup_cgl_Seed[52] = {
+    -1, -6, 0, 1, -8, -14, 0, 0, 0, 1, 3, -15, 1, 0, 2, 1,
+    0, 0, 3, -16, -25, -26, 0, 0, -27, 0, 1, -29, -31, 1, 9, -36,
+    0, 0, 0, -44, -47, 3, 2, 1, -48, 0, 1, -49, 0, 0, -50, -51,
+    3, -52, 0, 0
+  };
+
+  const unsigned short lookup_cgl_Slot[52] = {
+    3, 50, 28, 16, 21, 18, 15, 10, 31, 8, 41, 5, 40, 22, 36, 38,
+    44, 34, 51, 20, 24, 27, 6, 43, 19, 9, 14, 47, 17, 25, 42, 13,
+    7, 23, 33, 0, 29, 45, 49, 30, 4, 11, 26, 39, 46, 48, 32, 1,
+    12, 37, 2, 35
+  };
   #endif /* REGAL_SYS_OSX */
 
   #if REGAL_SYS_EGL
@@ -31653,6 +32057,20 @@ namespace Plugin {
     (void *)(plugin_eglWaitSyncKHR),
     NULL
   };
+
+  const short lookup_egl_Seed[63] = {
+    -3, -4, 0, -8, -11, 0, 0, 1, 3, -15, 0, -22, 0, -24, 0, 1,
+    -25, -28, 3, 0, -30, 3, 1, 0, 1, 0, 0, 0, 1, -31, 6, -33,
+    -34, -38, 5, 0, -41, 1, -42, 0, -43, 0, -45, -46, 2, -47, -50, 0,
+    0, 4, -53, 0, 0, -55, 1, -57, -59, -60, -62, 2, -63, 0, 0
+  };
+
+  const unsigned short lookup_egl_Slot[63] = {
+    37, 26, 7, 61, 42, 59, 39, 54, 45, 62, 29, 58, 25, 14, 51, 32,
+    56, 16, 49, 60, 33, 22, 34, 6, 18, 2, 38, 1, 24, 35, 8, 36,
+    52, 28, 43, 47, 31, 50, 41, 46, 48, 13, 17, 53, 0, 10, 44, 20,
+    15, 5, 4, 12, 23, 40, 55, 19, 3, 27, 21, 57, 9, 11, 30
+  };
   #endif /* REGAL_SYS_EGL */
 
 }
@@ -31669,29 +32087,29 @@ extern "C" {
   void * REGAL_CALL
   plugin_glGetProcAddress(const char *name)
   {
-    const char **res;
+    size_t i;
 
-    res = (const char **) std::bsearch(&name, lookup_gl_Name, 2695, sizeof(const char *), NameCmp);
-    if (res) return const_cast<void *>(lookup_gl_Value[(size_t) (res - lookup_gl_Name)]);
+    i = NameIndex(name, lookup_gl_Name, lookup_gl_Seed, lookup_gl_Slot, 2696);
+    if (i<2696) return const_cast<void *>(lookup_gl_Value[i]);
 
 #if REGAL_SYS_WGL
-    res = (const char **) std::bsearch(&name, lookup_wgl_Name, 142, sizeof(const char *), NameCmp);
-    if (res) return const_cast<void *>(lookup_wgl_Value[(size_t) (res - lookup_wgl_Name)]);
+    i = NameIndex(name, lookup_wgl_Name, lookup_wgl_Seed, lookup_wgl_Slot, 143);
+    if (i<143) return const_cast<void *>(lookup_wgl_Value[i]);
 #endif /* REGAL_SYS_WGL */
 
 #if REGAL_SYS_GLX
-    res = (const char **) std::bsearch(&name, lookup_glx_Name, 121, sizeof(const char *), NameCmp);
-    if (res) return const_cast<void *>(lookup_glx_Value[(size_t) (res - lookup_glx_Name)]);
+    i = NameIndex(name, lookup_glx_Name, lookup_glx_Seed, lookup_glx_Slot, 122);
+    if (i<122) return const_cast<void *>(lookup_glx_Value[i]);
 #endif /* REGAL_SYS_GLX */
 
 #if REGAL_SYS_OSX
-    res = (const char **) std::bsearch(&name, lookup_cgl_Name, 51, sizeof(const char *), NameCmp);
-    if (res) return const_cast<void *>(lookup_cgl_Value[(size_t) (res - lookup_cgl_Name)]);
+    i = NameIndex(name, lookup_cgl_Name, lookup_cgl_Seed, lookup_cgl_Slot, 52);
+    if (i<52) return const_cast<void *>(lookup_cgl_Value[i]);
 #endif /* REGAL_SYS_OSX */
 
 #if REGAL_SYS_EGL
-    res = (const char **) std::bsearch(&name, lookup_egl_Name, 62, sizeof(const char *), NameCmp);
-    if (res) return const_cast<void *>(lookup_egl_Value[(size_t) (res - lookup_egl_Name)]);
+    i = NameIndex(name, lookup_egl_Name, lookup_egl_Seed, lookup_egl_Slot, 63);
+    if (i<63) return const_cast<void *>(lookup_egl_Value[i]);
 #endif /* REGAL_SYS_EGL */
 
     return NULL;
@@ -95,20 +95,28 @@ inline Thread Self()
 #endif
 }
 
-// Three TLS items - the current RegalContext,
-// and the dispatch table pointers for plugins
+// Four TLS items - the current RegalContext,
+// the front of its dispatch stack, and the
+// dispatch table pointers for plugins
 // calling back into Regal.
+//
+// Compiler TLS needs no dynamic initialization,
+// the storage is zero-initialized for each thread.
 
 struct ThreadLocal
 {
+  #if REGAL_NO_TLS || REGAL_SYS_WGL || !REGAL_GCC_TLS
   inline ThreadLocal()
   : currentContext(NULL),
+    currentDispatchTable(NULL),
     nextDispatchTable(NULL),
     nextDispatchTableGlobal(NULL)
   {
   }
+  #endif
 
   RegalContext        *currentContext;
+  DispatchTableGL     *currentDispatchTable;
   DispatchTableGL     *nextDispatchTable;
   DispatchTableGlobal *nextDispatchTableGlobal;
 
@@ -123,6 +131,8 @@ struct ThreadLocal
       #else
         static __declspec(thread) ThreadLocal _instance;
       #endif
+    #elif REGAL_GCC_TLS
+      static __thread ThreadLocal _instance REGAL_TLS_ATTRIBUTE;
     #else
       static pthread_key_t _instanceKey;
     #endif
@@ -147,6 +157,8 @@ struct ThreadLocal
       #else
         return _instance;
       #endif
+    #elif REGAL_GCC_TLS
+      return _instance;
     #else
       ThreadLocal *i = static_cast<ThreadLocal *>(pthread_getspecific(_instanceKey));
       if (!i)
@@ -171,6 +183,17 @@ inline RegalContext *CurrentContext()
   return instance.currentContext;
 }
 
+//
+// Thread::CurrentDispatchTable()
+// - front of the dispatch stack of the current context
+//
+
+inline DispatchTableGL *CurrentDispatchTable()
+{
+  ThreadLocal &instance = ThreadLocal::instance();
+  return instance.currentDispatchTable;
+}
+
 //
 // Thread::procID()
 // - current process ID
@@ -47,6 +47,8 @@ REGAL_GLOBAL_BEGIN
 #include "RegalPrivate.h"
 #include "RegalToken.h"
 
+#include <cstddef>
+
 #include <boost/print/string_list.hpp>
 #include <boost/print/print_string.hpp>
 
@@ -58,6 +60,29 @@ REGAL_NAMESPACE_BEGIN
 
 namespace Token {
 
+  #if REGAL_ENUM_TO_STRING
+
+  // Multiplicative hash of v, as valueHash in scripts/api/ApiHash.py
+
+  static inline unsigned int ValueHash(unsigned int seed, GLuint v)
+  {
+    const unsigned int h = (v ^ seed) * 2654435761u;
+    return h ^ (h >> 16);
+  }
+
+  // Name of v in the sorted values, or NULL if not found.
+  // A minimal perfect hash, then a compare to confirm.
+  // The names are offsets into a pool of strings.
+
+  static inline const char *enumToString(GLuint v, const GLuint *values, const unsigned int *names, const void *pool, const short *seeds, const unsigned short *slots, const size_t size)
+  {
+    const int    seed = seeds[ValueHash(0,v)%size];
+    const size_t i    = slots[seed<0 ? -seed-1 : ValueHash(seed,v)%size];
+    return values[i]==v ? reinterpret_cast<const char *>(pool) + names[i] : NULL;
+  }
+
+  #endif // REGAL_ENUM_TO_STRING
+
   const char * GLbooleanToString(GLboolean v)
   {
     return v==GL_FALSE ? "GL_FALSE" : "GL_TRUE";
@@ -733,3324 +758,10803 @@ namespace Token {
     }
   }
 
-  const char * GLenumToString( GLenum e ) {
+  #if REGAL_ENUM_TO_STRING
+
+  struct GLEnumPool {
+    char n_GL_ZERO[8];
+    char n_GL_ONE[7];
+    char n_GL_LINE_LOOP[13];
+    char n_GL_LINE_STRIP[14];
+    char n_GL_TRIANGLES[13];
+    char n_GL_TRIANGLE_STRIP[18];
+    char n_GL_TRIANGLE_FAN[16];
+    char n_GL_QUADS[9];
+    char n_GL_QUAD_STRIP[14];
+    char n_GL_POLYGON[11];
+    char n_GL_LINES_ADJACENCY[19];
+    char n_GL_LINE_STRIP_ADJACENCY[24];
+    char n_GL_TRIANGLES_ADJACENCY[23];
+    char n_GL_TRIANGLE_STRIP_ADJACENCY[28];
+    char n_GL_PATCHES[11];
+    char n_GL_RELATIVE_SMOOTH_QUADRATIC_CURVE_TO_NV[41];
+    char n_GL_SMOOTH_CUBIC_CURVE_TO_NV[28];
+    char n_GL_RELATIVE_SMOOTH_CUBIC_CURVE_TO_NV[37];
+    char n_GL_SMALL_CCW_ARC_TO_NV[23];
+    char n_GL_RELATIVE_SMALL_CCW_ARC_TO_NV[32];
+    char n_GL_SMALL_CW_ARC_TO_NV[22];
+    char n_GL_RELATIVE_SMALL_CW_ARC_TO_NV[31];
+    char n_GL_LARGE_CCW_ARC_TO_NV[23];
+    char n_GL_RELATIVE_LARGE_CCW_ARC_TO_NV[32];
+    char n_GL_LARGE_CW_ARC_TO_NV[22];
+    char n_GL_RELATIVE_LARGE_CW_ARC_TO_NV[31];
+    char n_GL_EIGHTH_BIT_ATI[18];
+    char n_GL_SATURATE_BIT_ATI[20];
+    char n_GL_COLOR_BUFFER_BIT7_QCOM[26];
+    char n_GL_RESTART_PATH_NV[19];
+    char n_GL_DUP_FIRST_CUBIC_CURVE_TO_NV[31];
+    char n_GL_DUP_LAST_CUBIC_CURVE_TO_NV[30];
+    char n_GL_RECT_NV[11];
+    char n_GL_CIRCULAR_CCW_ARC_TO_NV[26];
+    char n_GL_CIRCULAR_CW_ARC_TO_NV[25];
+    char n_GL_CIRCULAR_TANGENT_ARC_TO_NV[30];
+    char n_GL_ARC_TO_NV[13];
+    char n_GL_RELATIVE_ARC_TO_NV[22];
+    char n_GL_ACCUM[9];
+    char n_GL_LOAD[8];
+    char n_GL_RETURN[10];
+    char n_GL_MULT[8];
+    char n_GL_ADD[7];
+    char n_GL_NEVER[9];
+    char n_GL_LESS[8];
+    char n_GL_EQUAL[9];
+    char n_GL_LEQUAL[10];
+    char n_GL_GREATER[11];
+    char n_GL_NOTEQUAL[12];
+    char n_GL_GEQUAL[10];
+    char n_GL_ALWAYS[10];
+    char n_GL_SRC_COLOR[13];
+    char n_GL_ONE_MINUS_SRC_COLOR[23];
+    char n_GL_SRC_ALPHA[13];
+    char n_GL_ONE_MINUS_SRC_ALPHA[23];
+    char n_GL_DST_ALPHA[13];
+    char n_GL_ONE_MINUS_DST_ALPHA[23];
+    char n_GL_DST_COLOR[13];
+    char n_GL_ONE_MINUS_DST_COLOR[23];
+    char n_GL_SRC_ALPHA_SATURATE[22];
+    char n_GL_FRONT_LEFT[14];
+    char n_GL_FRONT_RIGHT[15];
+    char n_GL_BACK_LEFT[13];
+    char n_GL_BACK_RIGHT[14];
+    char n_GL_FRONT[9];
+    char n_GL_BACK[8];
+    char n_GL_LEFT[8];
+    char n_GL_RIGHT[9];
+    char n_GL_FRONT_AND_BACK[18];
+    char n_GL_AUX0[8];
+    char n_GL_AUX1[8];
+    char n_GL_AUX2[8];
+    char n_GL_AUX3[8];
+    char n_GL_INVALID_ENUM[16];
+    char n_GL_INVALID_VALUE[17];
+    char n_GL_INVALID_OPERATION[21];
+    char n_GL_STACK_OVERFLOW[18];
+    char n_GL_STACK_UNDERFLOW[19];
+    char n_GL_OUT_OF_MEMORY[17];
+    char n_GL_INVALID_FRAMEBUFFER_OPERATION[33];
+    char n_GL_2D[6];
+    char n_GL_3D[6];
+    char n_GL_3D_COLOR[12];
+    char n_GL_3D_COLOR_TEXTURE[20];
+    char n_GL_4D_COLOR_TEXTURE[20];
+    char n_GL_PASS_THROUGH_TOKEN[22];
+    char n_GL_POINT_TOKEN[15];
+    char n_GL_LINE_TOKEN[14];
+    char n_GL_POLYGON_TOKEN[17];
+    char n_GL_BITMAP_TOKEN[16];
+    char n_GL_DRAW_PIXEL_TOKEN[20];
+    char n_GL_COPY_PIXEL_TOKEN[20];
+    char n_GL_LINE_RESET_TOKEN[20];
+    char n_GL_EXP[7];
+    char n_GL_EXP2[8];
+    char n_GL_MODELVIEW_MATRIX_FLOAT_AS_INT_BITS_OES[42];
+    char n_GL_CW[6];
+    char n_GL_CCW[7];
+    char n_GL_COEFF[9];
+    char n_GL_ORDER[9];
+    char n_GL_DOMAIN[10];
+    char n_GL_CURRENT_COLOR[17];
+    char n_GL_CURRENT_INDEX[17];
+    char n_GL_CURRENT_NORMAL[18];
+    char n_GL_CURRENT_TEXTURE_COORDS[26];
+    char n_GL_CURRENT_RASTER_COLOR[24];
+    char n_GL_CURRENT_RASTER_INDEX[24];
+    char n_GL_CURRENT_RASTER_TEXTURE_COORDS[33];
+    char n_GL_CURRENT_RASTER_POSITION[27];
+    char n_GL_CURRENT_RASTER_POSITION_VALID[33];
+    char n_GL_CURRENT_RASTER_DISTANCE[27];
+    char n_GL_POINT_SMOOTH[16];
+    char n_GL_POINT_SIZE[14];
+    char n_GL_POINT_SIZE_RANGE[20];
+    char n_GL_POINT_SIZE_GRANULARITY[26];
+    char n_GL_LINE_SMOOTH[15];
+    char n_GL_LINE_WIDTH[14];
+    char n_GL_LINE_WIDTH_RANGE[20];
+    char n_GL_LINE_WIDTH_GRANULARITY[26];
+    char n_GL_LINE_STIPPLE[16];
+    char n_GL_LINE_STIPPLE_PATTERN[24];
+    char n_GL_LINE_STIPPLE_REPEAT[23];
+    char n_GL_LIST_MODE[13];
+    char n_GL_MAX_LIST_NESTING[20];
+    char n_GL_LIST_BASE[13];
+    char n_GL_LIST_INDEX[14];
+    char n_GL_POLYGON_MODE[16];
+    char n_GL_POLYGON_SMOOTH[18];
+    char n_GL_POLYGON_STIPPLE[19];
+    char n_GL_EDGE_FLAG[13];
+    char n_GL_CULL_FACE[13];
+    char n_GL_CULL_FACE_MODE[18];
+    char n_GL_FRONT_FACE[14];
+    char n_GL_LIGHTING[12];
+    char n_GL_LIGHT_MODEL_LOCAL_VIEWER[28];
+    char n_GL_LIGHT_MODEL_TWO_SIDE[24];
+    char n_GL_LIGHT_MODEL_AMBIENT[23];
+    char n_GL_SHADE_MODEL[15];
+    char n_GL_COLOR_MATERIAL_FACE[23];
+    char n_GL_COLOR_MATERIAL_PARAMETER[28];
+    char n_GL_COLOR_MATERIAL[18];
+    char n_GL_FOG[7];
+    char n_GL_FOG_INDEX[13];
+    char n_GL_FOG_DENSITY[15];
+    char n_GL_FOG_START[13];
+    char n_GL_FOG_END[11];
+    char n_GL_FOG_MODE[12];
+    char n_GL_FOG_COLOR[13];
+    char n_GL_DEPTH_RANGE[15];
+    char n_GL_DEPTH_TEST[14];
+    char n_GL_DEPTH_WRITEMASK[19];
+    char n_GL_DEPTH_CLEAR_VALUE[21];
+    char n_GL_DEPTH_FUNC[14];
+    char n_GL_ACCUM_CLEAR_VALUE[21];
+    char n_GL_STENCIL_TEST[16];
+    char n_GL_STENCIL_CLEAR_VALUE[23];
+    char n_GL_STENCIL_FUNC[16];
+    char n_GL_STENCIL_VALUE_MASK[22];
+    char n_GL_STENCIL_FAIL[16];
+    char n_GL_STENCIL_PASS_DEPTH_FAIL[27];
+    char n_GL_STENCIL_PASS_DEPTH_PASS[27];
+    char n_GL_STENCIL_REF[15];
+    char n_GL_STENCIL_WRITEMASK[21];
+    char n_GL_MATRIX_MODE[15];
+    char n_GL_NORMALIZE[13];
+    char n_GL_VIEWPORT[12];
+    char n_GL_MODELVIEW_STACK_DEPTH[25];
+    char n_GL_PROJECTION_STACK_DEPTH[26];
+    char n_GL_TEXTURE_STACK_DEPTH[23];
+    char n_GL_MODELVIEW_MATRIX[20];
+    char n_GL_PROJECTION_MATRIX[21];
+    char n_GL_TEXTURE_MATRIX[18];
+    char n_GL_ATTRIB_STACK_DEPTH[22];
+    char n_GL_CLIENT_ATTRIB_STACK_DEPTH[29];
+    char n_GL_ALPHA_TEST[14];
+    char n_GL_ALPHA_TEST_FUNC[19];
+    char n_GL_ALPHA_TEST_REF[18];
+    char n_GL_DITHER[10];
+    char n_GL_BLEND_DST[13];
+    char n_GL_BLEND_SRC[13];
+    char n_GL_BLEND[9];
+    char n_GL_LOGIC_OP_MODE[17];
+    char n_GL_INDEX_LOGIC_OP[18];
+    char n_GL_COLOR_LOGIC_OP[18];
+    char n_GL_AUX_BUFFERS[15];
+    char n_GL_DRAW_BUFFER[15];
+    char n_GL_READ_BUFFER[15];
+    char n_GL_SCISSOR_BOX[15];
+    char n_GL_SCISSOR_TEST[16];
+    char n_GL_INDEX_CLEAR_VALUE[21];
+    char n_GL_INDEX_WRITEMASK[19];
+    char n_GL_COLOR_CLEAR_VALUE[21];
+    char n_GL_COLOR_WRITEMASK[19];
+    char n_GL_INDEX_MODE[14];
+    char n_GL_RGBA_MODE[13];
+    char n_GL_DOUBLEBUFFER[16];
+    char n_GL_STEREO[10];
+    char n_GL_RENDER_MODE[15];
+    char n_GL_PERSPECTIVE_CORRECTION_HINT[31];
+    char n_GL_POINT_SMOOTH_HINT[21];
+    char n_GL_LINE_SMOOTH_HINT[20];
+    char n_GL_POLYGON_SMOOTH_HINT[23];
+    char n_GL_FOG_HINT[12];
+    char n_GL_TEXTURE_GEN_S[17];
+    char n_GL_TEXTURE_GEN_T[17];
+    char n_GL_TEXTURE_GEN_R[17];
+    char n_GL_TEXTURE_GEN_Q[17];
+    char n_GL_PIXEL_MAP_I_TO_I[20];
+    char n_GL_PIXEL_MAP_S_TO_S[20];
+    char n_GL_PIXEL_MAP_I_TO_R[20];
+    char n_GL_PIXEL_MAP_I_TO_G[20];
+    char n_GL_PIXEL_MAP_I_TO_B[20];
+    char n_GL_PIXEL_MAP_I_TO_A[20];
+    char n_GL_PIXEL_MAP_R_TO_R[20];
+    char n_GL_PIXEL_MAP_G_TO_G[20];
+    char n_GL_PIXEL_MAP_B_TO_B[20];
+    char n_GL_PIXEL_MAP_A_TO_A[20];
+    char n_GL_PIXEL_MAP_I_TO_I_SIZE[25];
+    char n_GL_PIXEL_MAP_S_TO_S_SIZE[25];
+    char n_GL_PIXEL_MAP_I_TO_R_SIZE[25];
+    char n_GL_PIXEL_MAP_I_TO_G_SIZE[25];
+    char n_GL_PIXEL_MAP_I_TO_B_SIZE[25];
+    char n_GL_PIXEL_MAP_I_TO_A_SIZE[25];
+    char n_GL_PIXEL_MAP_R_TO_R_SIZE[25];
+    char n_GL_PIXEL_MAP_G_TO_G_SIZE[25];
+    char n_GL_PIXEL_MAP_B_TO_B_SIZE[25];
+    char n_GL_PIXEL_MAP_A_TO_A_SIZE[25];
+    char n_GL_UNPACK_SWAP_BYTES[21];
+    char n_GL_UNPACK_LSB_FIRST[20];
+    char n_GL_UNPACK_ROW_LENGTH[21];
+    char n_GL_UNPACK_SKIP_ROWS[20];
+    char n_GL_UNPACK_SKIP_PIXELS[22];
+    char n_GL_UNPACK_ALIGNMENT[20];
+    char n_GL_PACK_SWAP_BYTES[19];
+    char n_GL_PACK_LSB_FIRST[18];
+    char n_GL_PACK_ROW_LENGTH[19];
+    char n_GL_PACK_SKIP_ROWS[18];
+    char n_GL_PACK_SKIP_PIXELS[20];
+    char n_GL_PACK_ALIGNMENT[18];
+    char n_GL_MAP_COLOR[13];
+    char n_GL_MAP_STENCIL[15];
+    char n_GL_INDEX_SHIFT[15];
+    char n_GL_INDEX_OFFSET[16];
+    char n_GL_RED_SCALE[13];
+    char n_GL_RED_BIAS[12];
+    char n_GL_ZOOM_X[10];
+    char n_GL_ZOOM_Y[10];
+    char n_GL_GREEN_SCALE[15];
+    char n_GL_GREEN_BIAS[14];
+    char n_GL_BLUE_SCALE[14];
+    char n_GL_BLUE_BIAS[13];
+    char n_GL_ALPHA_SCALE[15];
+    char n_GL_ALPHA_BIAS[14];
+    char n_GL_DEPTH_SCALE[15];
+    char n_GL_DEPTH_BIAS[14];
+    char n_GL_MAX_EVAL_ORDER[18];
+    char n_GL_MAX_LIGHTS[14];
+    char n_GL_MAX_CLIP_PLANES[19];
+    char n_GL_MAX_TEXTURE_SIZE[20];
+    char n_GL_MAX_PIXEL_MAP_TABLE[23];
+    char n_GL_MAX_ATTRIB_STACK_DEPTH[26];
+    char n_GL_MAX_MODELVIEW_STACK_DEPTH[29];
+    char n_GL_MAX_NAME_STACK_DEPTH[24];
+    char n_GL_MAX_PROJECTION_STACK_DEPTH[30];
+    char n_GL_MAX_TEXTURE_STACK_DEPTH[27];
+    char n_GL_MAX_VIEWPORT_DIMS[21];
+    char n_GL_MAX_CLIENT_ATTRIB_STACK_DEPTH[33];
+    char n_GL_SUBPIXEL_BITS[17];
+    char n_GL_INDEX_BITS[14];
+    char n_GL_RED_BITS[12];
+    char n_GL_GREEN_BITS[14];
+    char n_GL_BLUE_BITS[13];
+    char n_GL_ALPHA_BITS[14];
+    char n_GL_DEPTH_BITS[14];
+    char n_GL_STENCIL_BITS[16];
+    char n_GL_ACCUM_RED_BITS[18];
+    char n_GL_ACCUM_GREEN_BITS[20];
+    char n_GL_ACCUM_BLUE_BITS[19];
+    char n_GL_ACCUM_ALPHA_BITS[20];
+    char n_GL_NAME_STACK_DEPTH[20];
+    char n_GL_AUTO_NORMAL[15];
+    char n_GL_MAP1_COLOR_4[16];
+    char n_GL_MAP1_INDEX[14];
+    char n_GL_MAP1_NORMAL[15];
+    char n_GL_MAP1_TEXTURE_COORD_1[24];
+    char n_GL_MAP1_TEXTURE_COORD_2[24];
+    char n_GL_MAP1_TEXTURE_COORD_3[24];
+    char n_GL_MAP1_TEXTURE_COORD_4[24];
+    char n_GL_MAP1_VERTEX_3[17];
+    char n_GL_MAP1_VERTEX_4[17];
+    char n_GL_MAP2_COLOR_4[16];
+    char n_GL_MAP2_INDEX[14];
+    char n_GL_MAP2_NORMAL[15];
+    char n_GL_MAP2_TEXTURE_COORD_1[24];
+    char n_GL_MAP2_TEXTURE_COORD_2[24];
+    char n_GL_MAP2_TEXTURE_COORD_3[24];
+    char n_GL_MAP2_TEXTURE_COORD_4[24];
+    char n_GL_MAP2_VERTEX_3[17];
+    char n_GL_MAP2_VERTEX_4[17];
+    char n_GL_MAP1_GRID_DOMAIN[20];
+    char n_GL_MAP1_GRID_SEGMENTS[22];
+    char n_GL_MAP2_GRID_DOMAIN[20];
+    char n_GL_MAP2_GRID_SEGMENTS[22];
+    char n_GL_TEXTURE_1D[14];
+    char n_GL_TEXTURE_2D[14];
+    char n_GL_FEEDBACK_BUFFER_POINTER[27];
+    char n_GL_FEEDBACK_BUFFER_SIZE[24];
+    char n_GL_FEEDBACK_BUFFER_TYPE[24];
+    char n_GL_SELECTION_BUFFER_POINTER[28];
+    char n_GL_SELECTION_BUFFER_SIZE[25];
+    char n_GL_TEXTURE_WIDTH[17];
+    char n_GL_TEXTURE_HEIGHT[18];
+    char n_GL_TEXTURE_INTERNAL_FORMAT[27];
+    char n_GL_TEXTURE_BORDER_COLOR[24];
+    char n_GL_TEXTURE_BORDER[18];
+    char n_GL_DONT_CARE[13];
+    char n_GL_FASTEST[11];
+    char n_GL_NICEST[10];
+    char n_GL_AMBIENT[11];
+    char n_GL_DIFFUSE[11];
+    char n_GL_SPECULAR[12];
+    char n_GL_POSITION[12];
+    char n_GL_SPOT_DIRECTION[18];
+    char n_GL_SPOT_EXPONENT[17];
+    char n_GL_SPOT_CUTOFF[15];
+    char n_GL_CONSTANT_ATTENUATION[24];
+    char n_GL_LINEAR_ATTENUATION[22];
+    char n_GL_QUADRATIC_ATTENUATION[25];
+    char n_GL_COMPILE[11];
+    char n_GL_COMPILE_AND_EXECUTE[23];
+    char n_GL_BYTE[8];
+    char n_GL_UNSIGNED_BYTE[17];
+    char n_GL_SHORT[9];
+    char n_GL_UNSIGNED_SHORT[18];
+    char n_GL_INT[7];
+    char n_GL_UNSIGNED_INT[16];
+    char n_GL_FLOAT[9];
+    char n_GL_2_BYTES[11];
+    char n_GL_3_BYTES[11];
+    char n_GL_4_BYTES[11];
+    char n_GL_DOUBLE[10];
+    char n_GL_HALF_FLOAT[14];
+    char n_GL_FIXED[9];
+    char n_GL_INT64_NV[12];
+    char n_GL_UNSIGNED_INT64_ARB[22];
+    char n_GL_CLEAR[9];
+    char n_GL_AND[7];
+    char n_GL_AND_REVERSE[15];
+    char n_GL_COPY[8];
+    char n_GL_AND_INVERTED[16];
+    char n_GL_NOOP[8];
+    char n_GL_XOR[7];
+    char n_GL_OR[6];
+    char n_GL_NOR[7];
+    char n_GL_EQUIV[9];
+    char n_GL_INVERT[10];
+    char n_GL_OR_REVERSE[14];
+    char n_GL_COPY_INVERTED[17];
+    char n_GL_OR_INVERTED[15];
+    char n_GL_NAND[8];
+    char n_GL_SET[7];
+    char n_GL_EMISSION[12];
+    char n_GL_SHININESS[13];
+    char n_GL_AMBIENT_AND_DIFFUSE[23];
+    char n_GL_COLOR_INDEXES[17];
+    char n_GL_MODELVIEW[13];
+    char n_GL_PROJECTION[14];
+    char n_GL_TEXTURE[11];
+    char n_GL_COLOR[9];
+    char n_GL_DEPTH[9];
+    char n_GL_STENCIL[11];
+    char n_GL_COLOR_INDEX[15];
+    char n_GL_STENCIL_INDEX[17];
+    char n_GL_DEPTH_COMPONENT[19];
+    char n_GL_RED[7];
+    char n_GL_GREEN[9];
+    char n_GL_BLUE[8];
+    char n_GL_ALPHA[9];
+    char n_GL_RGB[7];
+    char n_GL_RGBA[8];
+    char n_GL_LUMINANCE[13];
+    char n_GL_LUMINANCE_ALPHA[19];
+    char n_GL_BITMAP[10];
+    char n_GL_POINT[9];
+    char n_GL_LINE[8];
+    char n_GL_FILL[8];
+    char n_GL_RENDER[10];
+    char n_GL_FEEDBACK[12];
+    char n_GL_SELECT[10];
+    char n_GL_FLAT[8];
+    char n_GL_SMOOTH[10];
+    char n_GL_KEEP[8];
+    char n_GL_REPLACE[11];
+    char n_GL_INCR[8];
+    char n_GL_DECR[8];
+    char n_GL_VENDOR[10];
+    char n_GL_RENDERER[12];
+    char n_GL_VERSION[11];
+    char n_GL_EXTENSIONS[14];
+    char n_GL_S[5];
+    char n_GL_T[5];
+    char n_GL_R[5];
+    char n_GL_Q[5];
+    char n_GL_MODULATE[12];
+    char n_GL_DECAL[9];
+    char n_GL_TEXTURE_ENV_MODE[20];
+    char n_GL_TEXTURE_ENV_COLOR[21];
+    char n_GL_TEXTURE_ENV[15];
+    char n_GL_EYE_LINEAR[14];
+    char n_GL_OBJECT_LINEAR[17];
+    char n_GL_SPHERE_MAP[14];
+    char n_GL_TEXTURE_GEN_MODE[20];
+    char n_GL_OBJECT_PLANE[16];
+    char n_GL_EYE_PLANE[13];
+    char n_GL_NEAREST[11];
+    char n_GL_LINEAR[10];
+    char n_GL_NEAREST_MIPMAP_NEAREST[26];
+    char n_GL_LINEAR_MIPMAP_NEAREST[25];
+    char n_GL_NEAREST_MIPMAP_LINEAR[25];
+    char n_GL_LINEAR_MIPMAP_LINEAR[24];
+    char n_GL_TEXTURE_MAG_FILTER[22];
+    char n_GL_TEXTURE_MIN_FILTER[22];
+    char n_GL_TEXTURE_WRAP_S[18];
+    char n_GL_TEXTURE_WRAP_T[18];
+    char n_GL_CLAMP[9];
+    char n_GL_REPEAT[10];
+    char n_GL_POLYGON_OFFSET_UNITS[24];
+    char n_GL_POLYGON_OFFSET_POINT[24];
+    char n_GL_POLYGON_OFFSET_LINE[23];
+    char n_GL_R3_G3_B2[12];
+    char n_GL_V2F[7];
+    char n_GL_V3F[7];
+    char n_GL_C4UB_V2F[12];
+    char n_GL_C4UB_V3F[12];
+    char n_GL_C3F_V3F[11];
+    char n_GL_N3F_V3F[11];
+    char n_GL_C4F_N3F_V3F[15];
+    char n_GL_T2F_V3F[11];
+    char n_GL_T4F_V4F[11];
+    char n_GL_T2F_C4UB_V3F[16];
+    char n_GL_T2F_C3F_V3F[15];
+    char n_GL_T2F_N3F_V3F[15];
+    char n_GL_T2F_C4F_N3F_V3F[19];
+    char n_GL_T4F_C4F_N3F_V4F[19];
+    char n_GL_CLIP_PLANE0[15];
+    char n_GL_CLIP_PLANE1[15];
+    char n_GL_CLIP_PLANE2[15];
+    char n_GL_CLIP_PLANE3[15];
+    char n_GL_CLIP_PLANE4[15];
+    char n_GL_CLIP_PLANE5[15];
+    char n_GL_CLIP_PLANE6[15];
+    char n_GL_CLIP_PLANE7[15];
+    char n_GL_EGL_COVERAGE_BUFFERS_NV[27];
+    char n_GL_EGL_COVERAGE_SAMPLES_NV[27];
+    char n_GL_EGL_DEPTH_ENCODING_NV[25];
+    char n_GL_EGL_DEPTH_ENCODING_NONLINEAR_NV[35];
+    char n_GL_LIGHT0[10];
+    char n_GL_LIGHT1[10];
+    char n_GL_LIGHT2[10];
+    char n_GL_LIGHT3[10];
+    char n_GL_LIGHT4[10];
+    char n_GL_LIGHT5[10];
+    char n_GL_LIGHT6[10];
+    char n_GL_LIGHT7[10];
+    char n_GL_ABGR_EXT[12];
+    char n_GL_CONSTANT_COLOR[18];
+    char n_GL_ONE_MINUS_CONSTANT_COLOR[28];
+    char n_GL_CONSTANT_ALPHA[18];
+    char n_GL_ONE_MINUS_CONSTANT_ALPHA[28];
+    char n_GL_BLEND_COLOR[15];
+    char n_GL_FUNC_ADD[12];
+    char n_GL_MIN[7];
+    char n_GL_MAX[7];
+    char n_GL_BLEND_EQUATION[18];
+    char n_GL_FUNC_SUBTRACT[17];
+    char n_GL_FUNC_REVERSE_SUBTRACT[25];
+    char n_GL_CMYK_EXT[12];
+    char n_GL_CMYKA_EXT[13];
+    char n_GL_PACK_CMYK_HINT_EXT[22];
+    char n_GL_UNPACK_CMYK_HINT_EXT[24];
+    char n_GL_CONVOLUTION_1D[18];
+    char n_GL_CONVOLUTION_2D[18];
+    char n_GL_SEPARABLE_2D[16];
+    char n_GL_CONVOLUTION_BORDER_MODE[27];
+    char n_GL_CONVOLUTION_FILTER_SCALE[28];
+    char n_GL_CONVOLUTION_FILTER_BIAS[27];
+    char n_GL_REDUCE[10];
+    char n_GL_CONVOLUTION_FORMAT[22];
+    char n_GL_CONVOLUTION_WIDTH[21];
+    char n_GL_CONVOLUTION_HEIGHT[22];
+    char n_GL_MAX_CONVOLUTION_WIDTH[25];
+    char n_GL_MAX_CONVOLUTION_HEIGHT[26];
+    char n_GL_POST_CONVOLUTION_RED_SCALE[30];
+    char n_GL_POST_CONVOLUTION_GREEN_SCALE[32];
+    char n_GL_POST_CONVOLUTION_BLUE_SCALE[31];
+    char n_GL_POST_CONVOLUTION_ALPHA_SCALE[32];
+    char n_GL_POST_CONVOLUTION_RED_BIAS[29];
+    char n_GL_POST_CONVOLUTION_GREEN_BIAS[31];
+    char n_GL_POST_CONVOLUTION_BLUE_BIAS[30];
+    char n_GL_POST_CONVOLUTION_ALPHA_BIAS[31];
+    char n_GL_HISTOGRAM[13];
+    char n_GL_PROXY_HISTOGRAM[19];
+    char n_GL_HISTOGRAM_WIDTH[19];
+    char n_GL_HISTOGRAM_FORMAT[20];
+    char n_GL_HISTOGRAM_RED_SIZE[22];
+    char n_GL_HISTOGRAM_GREEN_SIZE[24];
+    char n_GL_HISTOGRAM_BLUE_SIZE[23];
+    char n_GL_HISTOGRAM_ALPHA_SIZE[24];
+    char n_GL_HISTOGRAM_LUMINANCE_SIZE[28];
+    char n_GL_HISTOGRAM_SINK[18];
+    char n_GL_MINMAX[10];
+    char n_GL_MINMAX_FORMAT[17];
+    char n_GL_MINMAX_SINK[15];
+    char n_GL_TABLE_TOO_LARGE[19];
+    char n_GL_UNSIGNED_BYTE_3_3_2[23];
+    char n_GL_UNSIGNED_SHORT_4_4_4_4[26];
+    char n_GL_UNSIGNED_SHORT_5_5_5_1[26];
+    char n_GL_UNSIGNED_INT_8_8_8_8[24];
+    char n_GL_UNSIGNED_INT_10_10_10_2[27];
+    char n_GL_POLYGON_OFFSET_FILL[23];
+    char n_GL_POLYGON_OFFSET_FACTOR[25];
+    char n_GL_POLYGON_OFFSET_BIAS_EXT[27];
+    char n_GL_RESCALE_NORMAL[18];
+    char n_GL_ALPHA4[10];
+    char n_GL_ALPHA8[10];
+    char n_GL_ALPHA12[11];
+    char n_GL_ALPHA16[11];
+    char n_GL_LUMINANCE4[14];
+    char n_GL_LUMINANCE8[14];
+    char n_GL_LUMINANCE12[15];
+    char n_GL_LUMINANCE16[15];
+    char n_GL_LUMINANCE4_ALPHA4[21];
+    char n_GL_LUMINANCE6_ALPHA2[21];
+    char n_GL_LUMINANCE8_ALPHA8[21];
+    char n_GL_LUMINANCE12_ALPHA4[22];
+    char n_GL_LUMINANCE12_ALPHA12[23];
+    char n_GL_LUMINANCE16_ALPHA16[23];
+    char n_GL_INTENSITY[13];
+    char n_GL_INTENSITY4[14];
+    char n_GL_INTENSITY8[14];
+    char n_GL_INTENSITY12[15];
+    char n_GL_INTENSITY16[15];
+    char n_GL_RGB2_EXT[12];
+    char n_GL_RGB4[8];
+    char n_GL_RGB5[8];
+    char n_GL_RGB8[8];
+    char n_GL_RGB10[9];
+    char n_GL_RGB12[9];
+    char n_GL_RGB16[9];
+    char n_GL_RGBA2[9];
+    char n_GL_RGBA4[9];
+    char n_GL_RGB5_A1[11];
+    char n_GL_RGBA8[9];
+    char n_GL_RGB10_A2[12];
+    char n_GL_RGBA12[10];
+    char n_GL_RGBA16[10];
+    char n_GL_TEXTURE_RED_SIZE[20];
+    char n_GL_TEXTURE_GREEN_SIZE[22];
+    char n_GL_TEXTURE_BLUE_SIZE[21];
+    char n_GL_TEXTURE_ALPHA_SIZE[22];
+    char n_GL_TEXTURE_LUMINANCE_SIZE[26];
+    char n_GL_TEXTURE_INTENSITY_SIZE[26];
+    char n_GL_REPLACE_EXT[15];
+    char n_GL_PROXY_TEXTURE_1D[20];
+    char n_GL_PROXY_TEXTURE_2D[20];
+    char n_GL_TEXTURE_PRIORITY[20];
+    char n_GL_TEXTURE_RESIDENT[20];
+    char n_GL_TEXTURE_BINDING_1D[22];
+    char n_GL_TEXTURE_BINDING_2D[22];
+    char n_GL_TEXTURE_BINDING_3D[22];
+    char n_GL_PACK_SKIP_IMAGES[20];
+    char n_GL_PACK_IMAGE_HEIGHT[21];
+    char n_GL_UNPACK_SKIP_IMAGES[22];
+    char n_GL_UNPACK_IMAGE_HEIGHT[23];
+    char n_GL_TEXTURE_3D[14];
+    char n_GL_PROXY_TEXTURE_3D[20];
+    char n_GL_TEXTURE_DEPTH[17];
+    char n_GL_TEXTURE_WRAP_R[18];
+    char n_GL_MAX_3D_TEXTURE_SIZE[23];
+    char n_GL_VERTEX_ARRAY[16];
+    char n_GL_NORMAL_ARRAY[16];
+    char n_GL_COLOR_ARRAY[15];
+    char n_GL_INDEX_ARRAY[15];
+    char n_GL_TEXTURE_COORD_ARRAY[23];
+    char n_GL_EDGE_FLAG_ARRAY[19];
+    char n_GL_VERTEX_ARRAY_SIZE[21];
+    char n_GL_VERTEX_ARRAY_TYPE[21];
+    char n_GL_VERTEX_ARRAY_STRIDE[23];
+    char n_GL_VERTEX_ARRAY_COUNT_EXT[26];
+    char n_GL_NORMAL_ARRAY_TYPE[21];
+    char n_GL_NORMAL_ARRAY_STRIDE[23];
+    char n_GL_NORMAL_ARRAY_COUNT_EXT[26];
+    char n_GL_COLOR_ARRAY_SIZE[20];
+    char n_GL_COLOR_ARRAY_TYPE[20];
+    char n_GL_COLOR_ARRAY_STRIDE[22];
+    char n_GL_COLOR_ARRAY_COUNT_EXT[25];
+    char n_GL_INDEX_ARRAY_TYPE[20];
+    char n_GL_INDEX_ARRAY_STRIDE[22];
+    char n_GL_INDEX_ARRAY_COUNT_EXT[25];
+    char n_GL_TEXTURE_COORD_ARRAY_SIZE[28];
+    char n_GL_TEXTURE_COORD_ARRAY_TYPE[28];
+    char n_GL_TEXTURE_COORD_ARRAY_STRIDE[30];
+    char n_GL_TEXTURE_COORD_ARRAY_COUNT_EXT[33];
+    char n_GL_EDGE_FLAG_ARRAY_STRIDE[26];
+    char n_GL_EDGE_FLAG_ARRAY_COUNT_EXT[29];
+    char n_GL_VERTEX_ARRAY_POINTER[24];
+    char n_GL_NORMAL_ARRAY_POINTER[24];
+    char n_GL_COLOR_ARRAY_POINTER[23];
+    char n_GL_INDEX_ARRAY_POINTER[23];
+    char n_GL_TEXTURE_COORD_ARRAY_POINTER[31];
+    char n_GL_EDGE_FLAG_ARRAY_POINTER[27];
+    char n_GL_INTERLACE_SGIX[18];
+    char n_GL_DETAIL_TEXTURE_2D_SGIS[26];
+    char n_GL_DETAIL_TEXTURE_2D_BINDING_SGIS[34];
+    char n_GL_LINEAR_DETAIL_SGIS[22];
+    char n_GL_LINEAR_DETAIL_ALPHA_SGIS[28];
+    char n_GL_LINEAR_DETAIL_COLOR_SGIS[28];
+    char n_GL_DETAIL_TEXTURE_LEVEL_SGIS[29];
+    char n_GL_DETAIL_TEXTURE_MODE_SGIS[28];
+    char n_GL_DETAIL_TEXTURE_FUNC_POINTS_SGIS[35];
+    char n_GL_MULTISAMPLE[15];
+    char n_GL_SAMPLE_ALPHA_TO_COVERAGE[28];
+    char n_GL_SAMPLE_ALPHA_TO_ONE[23];
+    char n_GL_SAMPLE_COVERAGE[19];
+    char n_GL_1PASS_EXT[13];
+    char n_GL_2PASS_0_EXT[15];
+    char n_GL_2PASS_1_EXT[15];
+    char n_GL_4PASS_0_EXT[15];
+    char n_GL_4PASS_1_EXT[15];
+    char n_GL_4PASS_2_EXT[15];
+    char n_GL_4PASS_3_EXT[15];
+    char n_GL_SAMPLE_BUFFERS[18];
+    char n_GL_SAMPLES[11];
+    char n_GL_SAMPLE_COVERAGE_VALUE[25];
+    char n_GL_SAMPLE_COVERAGE_INVERT[26];
+    char n_GL_SAMPLE_PATTERN_EXT[22];
+    char n_GL_COLOR_MATRIX[16];
+    char n_GL_COLOR_MATRIX_STACK_DEPTH[28];
+    char n_GL_MAX_COLOR_MATRIX_STACK_DEPTH[32];
+    char n_GL_POST_COLOR_MATRIX_RED_SCALE[31];
+    char n_GL_POST_COLOR_MATRIX_GREEN_SCALE[33];
+    char n_GL_POST_COLOR_MATRIX_BLUE_SCALE[32];
+    char n_GL_POST_COLOR_MATRIX_ALPHA_SCALE[33];
+    char n_GL_POST_COLOR_MATRIX_RED_BIAS[30];
+    char n_GL_POST_COLOR_MATRIX_GREEN_BIAS[32];
+    char n_GL_POST_COLOR_MATRIX_BLUE_BIAS[31];
+    char n_GL_POST_COLOR_MATRIX_ALPHA_BIAS[32];
+    char n_GL_TEXTURE_COLOR_TABLE_SGI[27];
+    char n_GL_PROXY_TEXTURE_COLOR_TABLE_SGI[33];
+    char n_GL_TEXTURE_COMPARE_FAIL_VALUE_ARB[34];
+    char n_GL_BLEND_DST_RGB[17];
+    char n_GL_BLEND_SRC_RGB[17];
+    char n_GL_BLEND_DST_ALPHA[19];
+    char n_GL_BLEND_SRC_ALPHA[19];
+    char n_GL_422_EXT[11];
+    char n_GL_422_REV_EXT[15];
+    char n_GL_422_AVERAGE_EXT[19];
+    char n_GL_422_REV_AVERAGE_EXT[23];
+    char n_GL_COLOR_TABLE[15];
+    char n_GL_POST_CONVOLUTION_COLOR_TABLE[32];
+    char n_GL_POST_COLOR_MATRIX_COLOR_TABLE[33];
+    char n_GL_PROXY_COLOR_TABLE[21];
+    char n_GL_PROXY_POST_CONVOLUTION_COLOR_TABLE[38];
+    char n_GL_PROXY_POST_COLOR_MATRIX_COLOR_TABLE[39];
+    char n_GL_COLOR_TABLE_SCALE[21];
+    char n_GL_COLOR_TABLE_BIAS[20];
+    char n_GL_COLOR_TABLE_FORMAT[22];
+    char n_GL_COLOR_TABLE_WIDTH[21];
+    char n_GL_COLOR_TABLE_RED_SIZE[24];
+    char n_GL_COLOR_TABLE_GREEN_SIZE[26];
+    char n_GL_COLOR_TABLE_BLUE_SIZE[25];
+    char n_GL_COLOR_TABLE_ALPHA_SIZE[26];
+    char n_GL_COLOR_TABLE_LUMINANCE_SIZE[30];
+    char n_GL_COLOR_TABLE_INTENSITY_SIZE[30];
+    char n_GL_BGR[7];
+    char n_GL_BGRA[8];
+    char n_GL_COLOR_INDEX1_EXT[20];
+    char n_GL_COLOR_INDEX2_EXT[20];
+    char n_GL_COLOR_INDEX4_EXT[20];
+    char n_GL_COLOR_INDEX8_EXT[20];
+    char n_GL_COLOR_INDEX12_EXT[21];
+    char n_GL_COLOR_INDEX16_EXT[21];
+    char n_GL_MAX_ELEMENTS_VERTICES[25];
+    char n_GL_MAX_ELEMENTS_INDICES[24];
+    char n_GL_PHONG_WIN[13];
+    char n_GL_PHONG_HINT_WIN[18];
+    char n_GL_FOG_SPECULAR_TEXTURE_WIN[28];
+    char n_GL_TEXTURE_INDEX_SIZE_EXT[26];
+    char n_GL_PARAMETER_BUFFER_ARB[24];
+    char n_GL_PARAMETER_BUFFER_BINDING_ARB[32];
+    char n_GL_CLIP_VOLUME_CLIPPING_HINT_EXT[33];
+    char n_GL_POINT_SIZE_MIN[18];
+    char n_GL_POINT_SIZE_MAX[18];
+    char n_GL_POINT_FADE_THRESHOLD_SIZE[29];
+    char n_GL_POINT_DISTANCE_ATTENUATION[30];
+    char n_GL_CLAMP_TO_BORDER[19];
+    char n_GL_TEXTURE_MULTI_BUFFER_HINT_SGIX[34];
+    char n_GL_CLAMP_TO_EDGE[17];
+    char n_GL_TEXTURE_MIN_LOD[19];
+    char n_GL_TEXTURE_MAX_LOD[19];
+    char n_GL_TEXTURE_BASE_LEVEL[22];
+    char n_GL_TEXTURE_MAX_LEVEL[21];
+    char n_GL_IGNORE_BORDER[17];
+    char n_GL_CONSTANT_BORDER[19];
+    char n_GL_WRAP_BORDER[15];
+    char n_GL_REPLICATE_BORDER[20];
+    char n_GL_CONVOLUTION_BORDER_COLOR[28];
+    char n_GL_IMAGE_SCALE_X_HP[20];
+    char n_GL_IMAGE_SCALE_Y_HP[20];
+    char n_GL_IMAGE_TRANSLATE_X_HP[24];
+    char n_GL_IMAGE_TRANSLATE_Y_HP[24];
+    char n_GL_IMAGE_ROTATE_ANGLE_HP[25];
+    char n_GL_IMAGE_ROTATE_ORIGIN_X_HP[28];
+    char n_GL_IMAGE_ROTATE_ORIGIN_Y_HP[28];
+    char n_GL_IMAGE_MAG_FILTER_HP[23];
+    char n_GL_IMAGE_MIN_FILTER_HP[23];
+    char n_GL_IMAGE_CUBIC_WEIGHT_HP[25];
+    char n_GL_CUBIC_HP[12];
+    char n_GL_AVERAGE_HP[14];
+    char n_GL_IMAGE_TRANSFORM_2D_HP[25];
+    char n_GL_POST_IMAGE_TRANSFORM_COLOR_TABLE_HP[39];
+    char n_GL_PROXY_POST_IMAGE_TRANSFORM_COLOR_TABLE_HP[45];
+    char n_GL_OCCLUSION_TEST_HP[21];
+    char n_GL_OCCLUSION_TEST_RESULT_HP[28];
+    char n_GL_POST_TEXTURE_FILTER_BIAS_SGIX[33];
+    char n_GL_POST_TEXTURE_FILTER_SCALE_SGIX[34];
+    char n_GL_POST_TEXTURE_FILTER_BIAS_RANGE_SGIX[39];
+    char n_GL_POST_TEXTURE_FILTER_SCALE_RANGE_SGIX[40];
+    char n_GL_GENERATE_MIPMAP[19];
+    char n_GL_GENERATE_MIPMAP_HINT[24];
+    char n_GL_FOG_OFFSET_SGIX[19];
+    char n_GL_FOG_OFFSET_VALUE_SGIX[25];
+    char n_GL_TEXTURE_COMPARE_SGIX[24];
+    char n_GL_TEXTURE_COMPARE_OPERATOR_SGIX[33];
+    char n_GL_TEXTURE_LEQUAL_R_SGIX[25];
+    char n_GL_TEXTURE_GEQUAL_R_SGIX[25];
+    char n_GL_DEPTH_COMPONENT16[21];
+    char n_GL_DEPTH_COMPONENT24[21];
+    char n_GL_DEPTH_COMPONENT32[21];
+    char n_GL_ARRAY_ELEMENT_LOCK_FIRST_EXT[32];
+    char n_GL_ARRAY_ELEMENT_LOCK_COUNT_EXT[32];
+    char n_GL_CULL_VERTEX_EXT[19];
+    char n_GL_CULL_VERTEX_EYE_POSITION_EXT[32];
+    char n_GL_CULL_VERTEX_OBJECT_POSITION_EXT[35];
+    char n_GL_YCRCB_422_SGIX[18];
+    char n_GL_YCRCB_444_SGIX[18];
+    char n_GL_WRAP_BORDER_SUN[19];
+    char n_GL_UNPACK_CONSTANT_DATA_SUNX[29];
+    char n_GL_TEXTURE_CONSTANT_DATA_SUNX[30];
+    char n_GL_TRIANGLE_LIST_SUN[21];
+    char n_GL_REPLACEMENT_CODE_SUN[24];
+    char n_GL_GLOBAL_ALPHA_SUN[20];
+    char n_GL_GLOBAL_ALPHA_FACTOR_SUN[27];
+    char n_GL_EYE_DISTANCE_TO_POINT_SGIS[30];
+    char n_GL_OBJECT_DISTANCE_TO_POINT_SGIS[33];
+    char n_GL_EYE_DISTANCE_TO_LINE_SGIS[29];
+    char n_GL_OBJECT_DISTANCE_TO_LINE_SGIS[32];
+    char n_GL_EYE_POINT_SGIS[18];
+    char n_GL_OBJECT_POINT_SGIS[21];
+    char n_GL_EYE_LINE_SGIS[17];
+    char n_GL_OBJECT_LINE_SGIS[20];
+    char n_GL_LIGHT_MODEL_COLOR_CONTROL[29];
+    char n_GL_SINGLE_COLOR[16];
+    char n_GL_SEPARATE_SPECULAR_COLOR[27];
+    char n_GL_SHARED_TEXTURE_PALETTE_EXT[30];
+    char n_GL_TEXT_FRAGMENT_SHADER_ATI[28];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING[41];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE[41];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE[35];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE[37];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE[36];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE[37];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE[37];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE[39];
+    char n_GL_FRAMEBUFFER_DEFAULT[23];
+    char n_GL_FRAMEBUFFER_UNDEFINED[25];
+    char n_GL_DEPTH_STENCIL_ATTACHMENT[28];
+    char n_GL_MAJOR_VERSION[17];
+    char n_GL_MINOR_VERSION[17];
+    char n_GL_NUM_EXTENSIONS[18];
+    char n_GL_CONTEXT_FLAGS[17];
+    char n_GL_BUFFER_IMMUTABLE_STORAGE[28];
+    char n_GL_BUFFER_STORAGE_FLAGS[24];
+    char n_GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED[43];
+    char n_GL_INDEX[9];
+    char n_GL_DEPTH_BUFFER[16];
+    char n_GL_STENCIL_BUFFER[18];
+    char n_GL_COMPRESSED_RED[18];
+    char n_GL_COMPRESSED_RG[17];
+    char n_GL_RG[6];
+    char n_GL_RG_INTEGER[14];
+    char n_GL_R8[6];
+    char n_GL_R16[7];
+    char n_GL_RG8[7];
+    char n_GL_RG16[8];
+    char n_GL_R16F[8];
+    char n_GL_R32F[8];
+    char n_GL_RG16F[9];
+    char n_GL_RG32F[9];
+    char n_GL_R8I[7];
+    char n_GL_R8UI[8];
+    char n_GL_R16I[8];
+    char n_GL_R16UI[9];
+    char n_GL_R32I[8];
+    char n_GL_R32UI[9];
+    char n_GL_RG8I[8];
+    char n_GL_RG8UI[9];
+    char n_GL_RG16I[9];
+    char n_GL_RG16UI[10];
+    char n_GL_RG32I[9];
+    char n_GL_RG32UI[10];
+    char n_GL_SYNC_CL_EVENT_ARB[21];
+    char n_GL_SYNC_CL_EVENT_COMPLETE_ARB[30];
+    char n_GL_DEBUG_OUTPUT_SYNCHRONOUS[28];
+    char n_GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH[36];
+    char n_GL_DEBUG_CALLBACK_FUNCTION[27];
+    char n_GL_DEBUG_CALLBACK_USER_PARAM[29];
+    char n_GL_DEBUG_SOURCE_API[20];
+    char n_GL_DEBUG_SOURCE_WINDOW_SYSTEM[30];
+    char n_GL_DEBUG_SOURCE_SHADER_COMPILER[32];
+    char n_GL_DEBUG_SOURCE_THIRD_PARTY[28];
+    char n_GL_DEBUG_SOURCE_APPLICATION[28];
+    char n_GL_DEBUG_SOURCE_OTHER[22];
+    char n_GL_DEBUG_TYPE_ERROR[20];
+    char n_GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR[34];
+    char n_GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR[33];
+    char n_GL_DEBUG_TYPE_PORTABILITY[26];
+    char n_GL_DEBUG_TYPE_PERFORMANCE[26];
+    char n_GL_DEBUG_TYPE_OTHER[20];
+    char n_GL_LOSE_CONTEXT_ON_RESET_ARB[29];
+    char n_GL_GUILTY_CONTEXT_RESET_ARB[28];
+    char n_GL_INNOCENT_CONTEXT_RESET_ARB[30];
+    char n_GL_UNKNOWN_CONTEXT_RESET_ARB[29];
+    char n_GL_RESET_NOTIFICATION_STRATEGY_ARB[35];
+    char n_GL_PROGRAM_BINARY_RETRIEVABLE_HINT[35];
+    char n_GL_PROGRAM_SEPARABLE[21];
+    char n_GL_ACTIVE_PROGRAM[18];
+    char n_GL_PROGRAM_PIPELINE_BINDING[28];
+    char n_GL_MAX_VIEWPORTS[17];
+    char n_GL_VIEWPORT_SUBPIXEL_BITS[26];
+    char n_GL_VIEWPORT_BOUNDS_RANGE[25];
+    char n_GL_LAYER_PROVOKING_VERTEX[26];
+    char n_GL_VIEWPORT_INDEX_PROVOKING_VERTEX[35];
+    char n_GL_UNDEFINED_VERTEX[20];
+    char n_GL_NO_RESET_NOTIFICATION_ARB[29];
+    char n_GL_MAX_COMPUTE_SHARED_MEMORY_SIZE[34];
+    char n_GL_MAX_COMPUTE_UNIFORM_COMPONENTS[34];
+    char n_GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS[38];
+    char n_GL_MAX_COMPUTE_ATOMIC_COUNTERS[31];
+    char n_GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS[43];
+    char n_GL_COMPUTE_WORK_GROUP_SIZE[27];
+    char n_GL_DEBUG_TYPE_MARKER[21];
+    char n_GL_DEBUG_TYPE_PUSH_GROUP[25];
+    char n_GL_DEBUG_TYPE_POP_GROUP[24];
+    char n_GL_DEBUG_SEVERITY_NOTIFICATION[31];
+    char n_GL_MAX_DEBUG_GROUP_STACK_DEPTH[31];
+    char n_GL_DEBUG_GROUP_STACK_DEPTH[27];
+    char n_GL_MAX_UNIFORM_LOCATIONS[25];
+    char n_GL_INTERNALFORMAT_SUPPORTED[28];
+    char n_GL_INTERNALFORMAT_PREFERRED[28];
+    char n_GL_INTERNALFORMAT_RED_SIZE[27];
+    char n_GL_INTERNALFORMAT_GREEN_SIZE[29];
+    char n_GL_INTERNALFORMAT_BLUE_SIZE[28];
+    char n_GL_INTERNALFORMAT_ALPHA_SIZE[29];
+    char n_GL_INTERNALFORMAT_DEPTH_SIZE[29];
+    char n_GL_INTERNALFORMAT_STENCIL_SIZE[31];
+    char n_GL_INTERNALFORMAT_SHARED_SIZE[30];
+    char n_GL_INTERNALFORMAT_RED_TYPE[27];
+    char n_GL_INTERNALFORMAT_GREEN_TYPE[29];
+    char n_GL_INTERNALFORMAT_BLUE_TYPE[28];
+    char n_GL_INTERNALFORMAT_ALPHA_TYPE[29];
+    char n_GL_INTERNALFORMAT_DEPTH_TYPE[29];
+    char n_GL_INTERNALFORMAT_STENCIL_TYPE[31];
+    char n_GL_MAX_WIDTH[13];
+    char n_GL_MAX_HEIGHT[14];
+    char n_GL_MAX_DEPTH[13];
+    char n_GL_MAX_LAYERS[14];
+    char n_GL_MAX_COMBINED_DIMENSIONS[27];
+    char n_GL_COLOR_COMPONENTS[20];
+    char n_GL_DEPTH_COMPONENTS[20];
+    char n_GL_STENCIL_COMPONENTS[22];
+    char n_GL_COLOR_RENDERABLE[20];
+    char n_GL_DEPTH_RENDERABLE[20];
+    char n_GL_STENCIL_RENDERABLE[22];
+    char n_GL_FRAMEBUFFER_RENDERABLE[26];
+    char n_GL_FRAMEBUFFER_RENDERABLE_LAYERED[34];
+    char n_GL_FRAMEBUFFER_BLEND[21];
+    char n_GL_READ_PIXELS[15];
+    char n_GL_READ_PIXELS_FORMAT[22];
+    char n_GL_READ_PIXELS_TYPE[20];
+    char n_GL_TEXTURE_IMAGE_FORMAT[24];
+    char n_GL_TEXTURE_IMAGE_TYPE[22];
+    char n_GL_GET_TEXTURE_IMAGE_FORMAT[28];
+    char n_GL_GET_TEXTURE_IMAGE_TYPE[26];
+    char n_GL_MIPMAP[10];
+    char n_GL_MANUAL_GENERATE_MIPMAP[26];
+    char n_GL_AUTO_GENERATE_MIPMAP[24];
+    char n_GL_COLOR_ENCODING[18];
+    char n_GL_SRGB_READ[13];
+    char n_GL_SRGB_WRITE[14];
+    char n_GL_SRGB_DECODE_ARB[19];
+    char n_GL_FILTER[10];
+    char n_GL_VERTEX_TEXTURE[18];
+    char n_GL_TESS_CONTROL_TEXTURE[24];
+    char n_GL_TESS_EVALUATION_TEXTURE[27];
+    char n_GL_GEOMETRY_TEXTURE[20];
+    char n_GL_FRAGMENT_TEXTURE[20];
+    char n_GL_COMPUTE_TEXTURE[19];
+    char n_GL_TEXTURE_SHADOW[18];
+    char n_GL_TEXTURE_GATHER[18];
+    char n_GL_TEXTURE_GATHER_SHADOW[25];
+    char n_GL_SHADER_IMAGE_LOAD[21];
+    char n_GL_SHADER_IMAGE_STORE[22];
+    char n_GL_SHADER_IMAGE_ATOMIC[23];
+    char n_GL_IMAGE_TEXEL_SIZE[20];
+    char n_GL_IMAGE_COMPATIBILITY_CLASS[29];
+    char n_GL_IMAGE_PIXEL_FORMAT[22];
+    char n_GL_IMAGE_PIXEL_TYPE[20];
+    char n_GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_TEST[39];
+    char n_GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_TEST[41];
+    char n_GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_WRITE[40];
+    char n_GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_WRITE[42];
+    char n_GL_TEXTURE_COMPRESSED_BLOCK_WIDTH[34];
+    char n_GL_TEXTURE_COMPRESSED_BLOCK_HEIGHT[35];
+    char n_GL_TEXTURE_COMPRESSED_BLOCK_SIZE[33];
+    char n_GL_CLEAR_BUFFER[16];
+    char n_GL_TEXTURE_VIEW[16];
+    char n_GL_VIEW_COMPATIBILITY_CLASS[28];
+    char n_GL_FULL_SUPPORT[16];
+    char n_GL_CAVEAT_SUPPORT[18];
+    char n_GL_IMAGE_CLASS_4_X_32[22];
+    char n_GL_IMAGE_CLASS_2_X_32[22];
+    char n_GL_IMAGE_CLASS_1_X_32[22];
+    char n_GL_IMAGE_CLASS_4_X_16[22];
+    char n_GL_IMAGE_CLASS_2_X_16[22];
+    char n_GL_IMAGE_CLASS_1_X_16[22];
+    char n_GL_IMAGE_CLASS_4_X_8[21];
+    char n_GL_IMAGE_CLASS_2_X_8[21];
+    char n_GL_IMAGE_CLASS_1_X_8[21];
+    char n_GL_IMAGE_CLASS_11_11_10[24];
+    char n_GL_IMAGE_CLASS_10_10_10_2[26];
+    char n_GL_VIEW_CLASS_128_BITS[23];
+    char n_GL_VIEW_CLASS_96_BITS[22];
+    char n_GL_VIEW_CLASS_64_BITS[22];
+    char n_GL_VIEW_CLASS_48_BITS[22];
+    char n_GL_VIEW_CLASS_32_BITS[22];
+    char n_GL_VIEW_CLASS_24_BITS[22];
+    char n_GL_VIEW_CLASS_16_BITS[22];
+    char n_GL_VIEW_CLASS_8_BITS[21];
+    char n_GL_VIEW_CLASS_S3TC_DXT1_RGB[28];
+    char n_GL_VIEW_CLASS_S3TC_DXT1_RGBA[29];
+    char n_GL_VIEW_CLASS_S3TC_DXT3_RGBA[29];
+    char n_GL_VIEW_CLASS_S3TC_DXT5_RGBA[29];
+    char n_GL_VIEW_CLASS_RGTC1_RED[24];
+    char n_GL_VIEW_CLASS_RGTC2_RG[23];
+    char n_GL_VIEW_CLASS_BPTC_UNORM[25];
+    char n_GL_VIEW_CLASS_BPTC_FLOAT[25];
+    char n_GL_VERTEX_ATTRIB_BINDING[25];
+    char n_GL_VERTEX_ATTRIB_RELATIVE_OFFSET[33];
+    char n_GL_VERTEX_BINDING_DIVISOR[26];
+    char n_GL_VERTEX_BINDING_OFFSET[25];
+    char n_GL_VERTEX_BINDING_STRIDE[25];
+    char n_GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET[37];
+    char n_GL_MAX_VERTEX_ATTRIB_BINDINGS[30];
+    char n_GL_TEXTURE_VIEW_MIN_LEVEL[26];
+    char n_GL_TEXTURE_VIEW_NUM_LEVELS[27];
+    char n_GL_TEXTURE_VIEW_MIN_LAYER[26];
+    char n_GL_TEXTURE_VIEW_NUM_LAYERS[27];
+    char n_GL_TEXTURE_IMMUTABLE_LEVELS[28];
+    char n_GL_BUFFER[10];
+    char n_GL_SHADER[10];
+    char n_GL_PROGRAM[11];
+    char n_GL_QUERY[9];
+    char n_GL_PROGRAM_PIPELINE[20];
+    char n_GL_MAX_VERTEX_ATTRIB_STRIDE[28];
+    char n_GL_SAMPLER[11];
+    char n_GL_DISPLAY_LIST[16];
+    char n_GL_MAX_LABEL_LENGTH[20];
+    char n_GL_NUM_SHADING_LANGUAGE_VERSIONS[33];
+    char n_GL_CONVOLUTION_HINT_SGIX[25];
+    char n_GL_ALPHA_MIN_SGIX[18];
+    char n_GL_ALPHA_MAX_SGIX[18];
+    char n_GL_ASYNC_MARKER_SGIX[21];
+    char n_GL_ASYNC_HISTOGRAM_SGIX[24];
+    char n_GL_MAX_ASYNC_HISTOGRAM_SGIX[28];
+    char n_GL_PIXEL_TRANSFORM_2D_EXT[26];
+    char n_GL_PIXEL_MAG_FILTER_EXT[24];
+    char n_GL_PIXEL_MIN_FILTER_EXT[24];
+    char n_GL_PIXEL_CUBIC_WEIGHT_EXT[26];
+    char n_GL_CUBIC_EXT[13];
+    char n_GL_AVERAGE_EXT[15];
+    char n_GL_PIXEL_TRANSFORM_2D_STACK_DEPTH_EXT[38];
+    char n_GL_MAX_PIXEL_TRANSFORM_2D_STACK_DEPTH_EXT[42];
+    char n_GL_PIXEL_TRANSFORM_2D_MATRIX_EXT[33];
+    char n_GL_FRAGMENT_MATERIAL_EXT[25];
+    char n_GL_FRAGMENT_NORMAL_EXT[23];
+    char n_GL_FRAGMENT_COLOR_EXT[22];
+    char n_GL_ATTENUATION_EXT[19];
+    char n_GL_SHADOW_ATTENUATION_EXT[26];
+    char n_GL_TEXTURE_APPLICATION_MODE_EXT[32];
+    char n_GL_TEXTURE_LIGHT_EXT[21];
+    char n_GL_TEXTURE_MATERIAL_FACE_EXT[29];
+    char n_GL_TEXTURE_MATERIAL_PARAMETER_EXT[34];
+    char n_GL_ASYNC_TEX_IMAGE_SGIX[24];
+    char n_GL_ASYNC_DRAW_PIXELS_SGIX[26];
+    char n_GL_ASYNC_READ_PIXELS_SGIX[26];
+    char n_GL_MAX_ASYNC_TEX_IMAGE_SGIX[28];
+    char n_GL_MAX_ASYNC_DRAW_PIXELS_SGIX[30];
+    char n_GL_MAX_ASYNC_READ_PIXELS_SGIX[30];
+    char n_GL_UNSIGNED_BYTE_2_3_3_REV[27];
+    char n_GL_UNSIGNED_SHORT_5_6_5[24];
+    char n_GL_UNSIGNED_SHORT_5_6_5_REV[28];
+    char n_GL_UNSIGNED_SHORT_4_4_4_4_REV[30];
+    char n_GL_UNSIGNED_SHORT_1_5_5_5_REV[30];
+    char n_GL_UNSIGNED_INT_8_8_8_8_REV[28];
+    char n_GL_UNSIGNED_INT_2_10_10_10_REV[31];
+    char n_GL_TEXTURE_MAX_CLAMP_S_SGIX[28];
+    char n_GL_TEXTURE_MAX_CLAMP_T_SGIX[28];
+    char n_GL_TEXTURE_MAX_CLAMP_R_SGIX[28];
+    char n_GL_MIRRORED_REPEAT[19];
+    char n_GL_RGB_S3TC[12];
+    char n_GL_RGB4_S3TC[13];
+    char n_GL_RGBA_S3TC[13];
+    char n_GL_RGBA4_S3TC[14];
+    char n_GL_RGBA_DXT5_S3TC[18];
+    char n_GL_RGBA4_DXT5_S3TC[19];
+    char n_GL_VERTEX_PRECLIP_SGIX[23];
+    char n_GL_VERTEX_PRECLIP_HINT_SGIX[28];
+    char n_GL_COMPRESSED_RGB_S3TC_DXT1_EXT[32];
+    char n_GL_COMPRESSED_RGBA_S3TC_DXT1_EXT[33];
+    char n_GL_COMPRESSED_RGBA_S3TC_DXT3_EXT[33];
+    char n_GL_COMPRESSED_RGBA_S3TC_DXT5_EXT[33];
+    char n_GL_PARALLEL_ARRAYS_INTEL[25];
+    char n_GL_VERTEX_ARRAY_PARALLEL_POINTERS_INTEL[40];
+    char n_GL_NORMAL_ARRAY_PARALLEL_POINTERS_INTEL[40];
+    char n_GL_COLOR_ARRAY_PARALLEL_POINTERS_INTEL[39];
+    char n_GL_TEXTURE_COORD_ARRAY_PARALLEL_POINTERS_INTEL[47];
+    char n_GL_TEXTURE_MEMORY_LAYOUT_INTEL[31];
+    char n_GL_FRAGMENT_LIGHTING_EXT[25];
+    char n_GL_FRAGMENT_COLOR_MATERIAL_EXT[31];
+    char n_GL_FRAGMENT_COLOR_MATERIAL_FACE_EXT[36];
+    char n_GL_FRAGMENT_COLOR_MATERIAL_PARAMETER_EXT[41];
+    char n_GL_MAX_FRAGMENT_LIGHTS_EXT[27];
+    char n_GL_MAX_ACTIVE_LIGHTS_EXT[25];
+    char n_GL_CURRENT_RASTER_NORMAL_EXT[29];
+    char n_GL_LIGHT_ENV_MODE_EXT[22];
+    char n_GL_FRAGMENT_LIGHT_MODEL_LOCAL_VIEWER_EXT[41];
+    char n_GL_FRAGMENT_LIGHT_MODEL_TWO_SIDE_EXT[37];
+    char n_GL_FRAGMENT_LIGHT_MODEL_AMBIENT_EXT[36];
+    char n_GL_FRAGMENT_LIGHT_MODEL_NORMAL_INTERPOLATION_EXT[49];
+    char n_GL_FRAGMENT_LIGHT0_EXT[23];
+    char n_GL_FRAGMENT_LIGHT1_EXT[23];
+    char n_GL_FRAGMENT_LIGHT2_EXT[23];
+    char n_GL_FRAGMENT_LIGHT3_EXT[23];
+    char n_GL_FRAGMENT_LIGHT4_EXT[23];
+    char n_GL_FRAGMENT_LIGHT5_EXT[23];
+    char n_GL_FRAGMENT_LIGHT6_EXT[23];
+    char n_GL_FRAGMENT_LIGHT7_EXT[23];
+    char n_GL_PACK_RESAMPLE_SGIX[22];
+    char n_GL_UNPACK_RESAMPLE_SGIX[24];
+    char n_GL_RESAMPLE_DECIMATE_SGIX[26];
+    char n_GL_RESAMPLE_REPLICATE_SGIX[27];
+    char n_GL_RESAMPLE_ZERO_FILL_SGIX[27];
+    char n_GL_TANGENT_ARRAY_EXT[21];
+    char n_GL_BINORMAL_ARRAY_EXT[22];
+    char n_GL_CURRENT_TANGENT_EXT[23];
+    char n_GL_CURRENT_BINORMAL_EXT[24];
+    char n_GL_TANGENT_ARRAY_TYPE_EXT[26];
+    char n_GL_TANGENT_ARRAY_STRIDE_EXT[28];
+    char n_GL_BINORMAL_ARRAY_TYPE_EXT[27];
+    char n_GL_BINORMAL_ARRAY_STRIDE_EXT[29];
+    char n_GL_TANGENT_ARRAY_POINTER_EXT[29];
+    char n_GL_BINORMAL_ARRAY_POINTER_EXT[30];
+    char n_GL_MAP1_TANGENT_EXT[20];
+    char n_GL_MAP2_TANGENT_EXT[20];
+    char n_GL_MAP1_BINORMAL_EXT[21];
+    char n_GL_MAP2_BINORMAL_EXT[21];
+    char n_GL_FOG_COORDINATE_SOURCE[25];
+    char n_GL_FOG_COORDINATE[18];
+    char n_GL_FRAGMENT_DEPTH[18];
+    char n_GL_CURRENT_FOG_COORDINATE[26];
+    char n_GL_FOG_COORDINATE_ARRAY_TYPE[29];
+    char n_GL_FOG_COORDINATE_ARRAY_STRIDE[31];
+    char n_GL_FOG_COORDINATE_ARRAY_POINTER[32];
+    char n_GL_FOG_COORDINATE_ARRAY[24];
+    char n_GL_COLOR_SUM[13];
+    char n_GL_CURRENT_SECONDARY_COLOR[27];
+    char n_GL_SECONDARY_COLOR_ARRAY_SIZE[30];
+    char n_GL_SECONDARY_COLOR_ARRAY_TYPE[30];
+    char n_GL_SECONDARY_COLOR_ARRAY_STRIDE[32];
+    char n_GL_SECONDARY_COLOR_ARRAY_POINTER[33];
+    char n_GL_SECONDARY_COLOR_ARRAY[25];
+    char n_GL_CURRENT_RASTER_SECONDARY_COLOR[34];
+    char n_GL_ALIASED_POINT_SIZE_RANGE[28];
+    char n_GL_ALIASED_LINE_WIDTH_RANGE[28];
+    char n_GL_SCREEN_COORDINATES_REND[27];
+    char n_GL_INVERTED_SCREEN_W_REND[26];
+    char n_GL_TEXTURE0[12];
+    char n_GL_TEXTURE1[12];
+    char n_GL_TEXTURE2[12];
+    char n_GL_TEXTURE3[12];
+    char n_GL_TEXTURE4[12];
+    char n_GL_TEXTURE5[12];
+    char n_GL_TEXTURE6[12];
+    char n_GL_TEXTURE7[12];
+    char n_GL_TEXTURE8[12];
+    char n_GL_TEXTURE9[12];
+    char n_GL_TEXTURE10[13];
+    char n_GL_TEXTURE11[13];
+    char n_GL_TEXTURE12[13];
+    char n_GL_TEXTURE13[13];
+    char n_GL_TEXTURE14[13];
+    char n_GL_TEXTURE15[13];
+    char n_GL_TEXTURE16[13];
+    char n_GL_TEXTURE17[13];
+    char n_GL_TEXTURE18[13];
+    char n_GL_TEXTURE19[13];
+    char n_GL_TEXTURE20[13];
+    char n_GL_TEXTURE21[13];
+    char n_GL_TEXTURE22[13];
+    char n_GL_TEXTURE23[13];
+    char n_GL_TEXTURE24[13];
+    char n_GL_TEXTURE25[13];
+    char n_GL_TEXTURE26[13];
+    char n_GL_TEXTURE27[13];
+    char n_GL_TEXTURE28[13];
+    char n_GL_TEXTURE29[13];
+    char n_GL_TEXTURE30[13];
+    char n_GL_TEXTURE31[13];
+    char n_GL_ACTIVE_TEXTURE[18];
+    char n_GL_CLIENT_ACTIVE_TEXTURE[25];
+    char n_GL_MAX_TEXTURE_UNITS[21];
+    char n_GL_TRANSPOSE_MODELVIEW_MATRIX[30];
+    char n_GL_TRANSPOSE_PROJECTION_MATRIX[31];
+    char n_GL_TRANSPOSE_TEXTURE_MATRIX[28];
+    char n_GL_TRANSPOSE_COLOR_MATRIX[26];
+    char n_GL_SUBTRACT[12];
+    char n_GL_MAX_RENDERBUFFER_SIZE[25];
+    char n_GL_COMPRESSED_ALPHA[20];
+    char n_GL_COMPRESSED_LUMINANCE[24];
+    char n_GL_COMPRESSED_LUMINANCE_ALPHA[30];
+    char n_GL_COMPRESSED_INTENSITY[24];
+    char n_GL_COMPRESSED_RGB[18];
+    char n_GL_COMPRESSED_RGBA[19];
+    char n_GL_TEXTURE_COMPRESSION_HINT[28];
+    char n_GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_CONTROL_SHADER[51];
+    char n_GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_EVALUATION_SHADER[54];
+    char n_GL_ALL_COMPLETED_NV[20];
+    char n_GL_FENCE_STATUS_NV[19];
+    char n_GL_FENCE_CONDITION_NV[22];
+    char n_GL_TEXTURE_RECTANGLE[21];
+    char n_GL_TEXTURE_BINDING_RECTANGLE[29];
+    char n_GL_PROXY_TEXTURE_RECTANGLE[27];
+    char n_GL_MAX_RECTANGLE_TEXTURE_SIZE[30];
+    char n_GL_DEPTH_STENCIL[17];
+    char n_GL_UNSIGNED_INT_24_8[21];
+    char n_GL_MAX_TEXTURE_LOD_BIAS[24];
+    char n_GL_TEXTURE_MAX_ANISOTROPY_EXT[30];
+    char n_GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT[34];
+    char n_GL_TEXTURE_FILTER_CONTROL[26];
+    char n_GL_TEXTURE_LOD_BIAS[20];
+    char n_GL_MODELVIEW1_STACK_DEPTH_EXT[30];
+    char n_GL_COMBINE4_NV[15];
+    char n_GL_MAX_SHININESS_NV[20];
+    char n_GL_MAX_SPOT_EXPONENT_NV[24];
+    char n_GL_MODELVIEW1_MATRIX_EXT[25];
+    char n_GL_INCR_WRAP[13];
+    char n_GL_DECR_WRAP[13];
+    char n_GL_VERTEX_WEIGHTING_EXT[24];
+    char n_GL_MODELVIEW1_ARB[18];
+    char n_GL_CURRENT_VERTEX_WEIGHT_EXT[29];
+    char n_GL_VERTEX_WEIGHT_ARRAY_EXT[27];
+    char n_GL_VERTEX_WEIGHT_ARRAY_SIZE_EXT[32];
+    char n_GL_VERTEX_WEIGHT_ARRAY_TYPE_EXT[32];
+    char n_GL_VERTEX_WEIGHT_ARRAY_STRIDE_EXT[34];
+    char n_GL_VERTEX_WEIGHT_ARRAY_POINTER_EXT[35];
+    char n_GL_NORMAL_MAP[14];
+    char n_GL_REFLECTION_MAP[18];
+    char n_GL_TEXTURE_CUBE_MAP[20];
+    char n_GL_TEXTURE_BINDING_CUBE_MAP[28];
+    char n_GL_TEXTURE_CUBE_MAP_POSITIVE_X[31];
+    char n_GL_TEXTURE_CUBE_MAP_NEGATIVE_X[31];
+    char n_GL_TEXTURE_CUBE_MAP_POSITIVE_Y[31];
+    char n_GL_TEXTURE_CUBE_MAP_NEGATIVE_Y[31];
+    char n_GL_TEXTURE_CUBE_MAP_POSITIVE_Z[31];
+    char n_GL_TEXTURE_CUBE_MAP_NEGATIVE_Z[31];
+    char n_GL_PROXY_TEXTURE_CUBE_MAP[26];
+    char n_GL_MAX_CUBE_MAP_TEXTURE_SIZE[29];
+    char n_GL_VERTEX_ARRAY_RANGE_NV[25];
+    char n_GL_VERTEX_ARRAY_RANGE_LENGTH_NV[32];
+    char n_GL_VERTEX_ARRAY_RANGE_VALID_NV[31];
+    char n_GL_MAX_VERTEX_ARRAY_RANGE_ELEMENT_NV[37];
+    char n_GL_VERTEX_ARRAY_RANGE_POINTER_NV[33];
+    char n_GL_REGISTER_COMBINERS_NV[25];
+    char n_GL_VARIABLE_A_NV[17];
+    char n_GL_VARIABLE_B_NV[17];
+    char n_GL_VARIABLE_C_NV[17];
+    char n_GL_VARIABLE_D_NV[17];
+    char n_GL_VARIABLE_E_NV[17];
+    char n_GL_VARIABLE_F_NV[17];
+    char n_GL_VARIABLE_G_NV[17];
+    char n_GL_CONSTANT_COLOR0_NV[22];
+    char n_GL_CONSTANT_COLOR1_NV[22];
+    char n_GL_PRIMARY_COLOR_NV[20];
+    char n_GL_SECONDARY_COLOR_NV[22];
+    char n_GL_SPARE0_NV[13];
+    char n_GL_SPARE1_NV[13];
+    char n_GL_DISCARD_NV[14];
+    char n_GL_E_TIMES_F_NV[16];
+    char n_GL_SPARE0_PLUS_SECONDARY_COLOR_NV[34];
+    char n_GL_VERTEX_ARRAY_RANGE_WITHOUT_FLUSH_NV[39];
+    char n_GL_MULTISAMPLE_FILTER_HINT_NV[30];
+    char n_GL_PER_STAGE_CONSTANTS_NV[26];
+    char n_GL_UNSIGNED_IDENTITY_NV[24];
+    char n_GL_UNSIGNED_INVERT_NV[22];
+    char n_GL_EXPAND_NORMAL_NV[20];
+    char n_GL_EXPAND_NEGATE_NV[20];
+    char n_GL_HALF_BIAS_NORMAL_NV[23];
+    char n_GL_HALF_BIAS_NEGATE_NV[23];
+    char n_GL_SIGNED_IDENTITY_NV[22];
+    char n_GL_SIGNED_NEGATE_NV[20];
+    char n_GL_SCALE_BY_TWO_NV[19];
+    char n_GL_SCALE_BY_FOUR_NV[20];
+    char n_GL_SCALE_BY_ONE_HALF_NV[24];
+    char n_GL_BIAS_BY_NEGATIVE_ONE_HALF_NV[32];
+    char n_GL_COMBINER_INPUT_NV[21];
+    char n_GL_COMBINER_MAPPING_NV[23];
+    char n_GL_COMBINER_COMPONENT_USAGE_NV[31];
+    char n_GL_COMBINER_AB_DOT_PRODUCT_NV[30];
+    char n_GL_COMBINER_CD_DOT_PRODUCT_NV[30];
+    char n_GL_COMBINER_MUX_SUM_NV[23];
+    char n_GL_COMBINER_SCALE_NV[21];
+    char n_GL_COMBINER_BIAS_NV[20];
+    char n_GL_COMBINER_AB_OUTPUT_NV[25];
+    char n_GL_COMBINER_CD_OUTPUT_NV[25];
+    char n_GL_COMBINER_SUM_OUTPUT_NV[26];
+    char n_GL_MAX_GENERAL_COMBINERS_NV[28];
+    char n_GL_NUM_GENERAL_COMBINERS_NV[28];
+    char n_GL_COLOR_SUM_CLAMP_NV[22];
+    char n_GL_COMBINER0_NV[16];
+    char n_GL_COMBINER1_NV[16];
+    char n_GL_COMBINER2_NV[16];
+    char n_GL_COMBINER3_NV[16];
+    char n_GL_COMBINER4_NV[16];
+    char n_GL_COMBINER5_NV[16];
+    char n_GL_COMBINER6_NV[16];
+    char n_GL_COMBINER7_NV[16];
+    char n_GL_PRIMITIVE_RESTART_NV[24];
+    char n_GL_PRIMITIVE_RESTART_INDEX_NV[30];
+    char n_GL_FOG_DISTANCE_MODE_NV[24];
+    char n_GL_EYE_RADIAL_NV[17];
+    char n_GL_EYE_PLANE_ABSOLUTE_NV[25];
+    char n_GL_EMBOSS_LIGHT_NV[19];
+    char n_GL_EMBOSS_CONSTANT_NV[22];
+    char n_GL_EMBOSS_MAP_NV[17];
+    char n_GL_RED_MIN_CLAMP_INGR[22];
+    char n_GL_GREEN_MIN_CLAMP_INGR[24];
+    char n_GL_BLUE_MIN_CLAMP_INGR[23];
+    char n_GL_ALPHA_MIN_CLAMP_INGR[24];
+    char n_GL_RED_MAX_CLAMP_INGR[22];
+    char n_GL_GREEN_MAX_CLAMP_INGR[24];
+    char n_GL_BLUE_MAX_CLAMP_INGR[23];
+    char n_GL_ALPHA_MAX_CLAMP_INGR[24];
+    char n_GL_INTERLACE_READ_INGR[23];
+    char n_GL_COMBINE[11];
+    char n_GL_COMBINE_RGB[15];
+    char n_GL_COMBINE_ALPHA[17];
+    char n_GL_RGB_SCALE[13];
+    char n_GL_ADD_SIGNED[14];
+    char n_GL_INTERPOLATE[15];
+    char n_GL_CONSTANT[12];
+    char n_GL_PRIMARY_COLOR[17];
+    char n_GL_PREVIOUS[12];
+    char n_GL_SOURCE0_RGB[15];
+    char n_GL_SOURCE1_RGB[15];
+    char n_GL_SOURCE2_RGB[15];
+    char n_GL_SOURCE3_RGB_NV[18];
+    char n_GL_SOURCE0_ALPHA[17];
+    char n_GL_SOURCE1_ALPHA[17];
+    char n_GL_SOURCE2_ALPHA[17];
+    char n_GL_SOURCE3_ALPHA_NV[20];
+    char n_GL_OPERAND0_RGB[16];
+    char n_GL_OPERAND1_RGB[16];
+    char n_GL_OPERAND2_RGB[16];
+    char n_GL_OPERAND3_RGB_NV[19];
+    char n_GL_OPERAND0_ALPHA[18];
+    char n_GL_OPERAND1_ALPHA[18];
+    char n_GL_OPERAND2_ALPHA[18];
+    char n_GL_OPERAND3_ALPHA_NV[21];
+    char n_GL_EXTENDED_RANGE_SGIS[23];
+    char n_GL_MIN_RED_SGIS[16];
+    char n_GL_MAX_RED_SGIS[16];
+    char n_GL_MIN_GREEN_SGIS[18];
+    char n_GL_MAX_GREEN_SGIS[18];
+    char n_GL_MIN_BLUE_SGIS[17];
+    char n_GL_MAX_BLUE_SGIS[17];
+    char n_GL_MIN_ALPHA_SGIS[18];
+    char n_GL_MAX_ALPHA_SGIS[18];
+    char n_GL_PERTURB_EXT[15];
+    char n_GL_TEXTURE_NORMAL_EXT[22];
+    char n_GL_LIGHT_MODEL_SPECULAR_VECTOR_APPLE[37];
+    char n_GL_TRANSFORM_HINT_APPLE[24];
+    char n_GL_UNPACK_CLIENT_STORAGE_APPLE[31];
+    char n_GL_BUFFER_OBJECT_APPLE[23];
+    char n_GL_STORAGE_CLIENT_APPLE[24];
+    char n_GL_VERTEX_ARRAY_BINDING[24];
+    char n_GL_TEXTURE_RANGE_LENGTH_APPLE[30];
+    char n_GL_TEXTURE_RANGE_POINTER_APPLE[31];
+    char n_GL_YCBCR_422_APPLE[19];
+    char n_GL_UNSIGNED_SHORT_8_8_MESA[27];
+    char n_GL_UNSIGNED_SHORT_8_8_REV_MESA[31];
+    char n_GL_TEXTURE_STORAGE_HINT_APPLE[30];
+    char n_GL_STORAGE_PRIVATE_APPLE[25];
+    char n_GL_STORAGE_CACHED_APPLE[24];
+    char n_GL_STORAGE_SHARED_APPLE[24];
+    char n_GL_REPLACEMENT_CODE_ARRAY_SUN[30];
+    char n_GL_REPLACEMENT_CODE_ARRAY_TYPE_SUN[35];
+    char n_GL_REPLACEMENT_CODE_ARRAY_STRIDE_SUN[37];
+    char n_GL_REPLACEMENT_CODE_ARRAY_POINTER_SUN[38];
+    char n_GL_R1UI_V3F_SUN[16];
+    char n_GL_R1UI_C4UB_V3F_SUN[21];
+    char n_GL_R1UI_C3F_V3F_SUN[20];
+    char n_GL_R1UI_N3F_V3F_SUN[20];
+    char n_GL_R1UI_C4F_N3F_V3F_SUN[24];
+    char n_GL_R1UI_T2F_V3F_SUN[20];
+    char n_GL_R1UI_T2F_N3F_V3F_SUN[24];
+    char n_GL_R1UI_T2F_C4F_N3F_V3F_SUN[28];
+    char n_GL_SLICE_ACCUM_SUN[19];
+    char n_GL_RGB_SIGNED_SGIX[19];
+    char n_GL_RGBA_SIGNED_SGIX[20];
+    char n_GL_ALPHA_SIGNED_SGIX[21];
+    char n_GL_LUMINANCE_SIGNED_SGIX[25];
+    char n_GL_INTENSITY_SIGNED_SGIX[25];
+    char n_GL_LUMINANCE_ALPHA_SIGNED_SGIX[31];
+    char n_GL_RGB16_SIGNED_SGIX[21];
+    char n_GL_RGBA16_SIGNED_SGIX[22];
+    char n_GL_ALPHA16_SIGNED_SGIX[23];
+    char n_GL_LUMINANCE16_SIGNED_SGIX[27];
+    char n_GL_INTENSITY16_SIGNED_SGIX[27];
+    char n_GL_LUMINANCE16_ALPHA16_SIGNED_SGIX[35];
+    char n_GL_RGB_EXTENDED_RANGE_SGIX[27];
+    char n_GL_RGBA_EXTENDED_RANGE_SGIX[28];
+    char n_GL_ALPHA_EXTENDED_RANGE_SGIX[29];
+    char n_GL_LUMINANCE_EXTENDED_RANGE_SGIX[33];
+    char n_GL_INTENSITY_EXTENDED_RANGE_SGIX[33];
+    char n_GL_LUMINANCE_ALPHA_EXTENDED_RANGE_SGIX[39];
+    char n_GL_RGB16_EXTENDED_RANGE_SGIX[29];
+    char n_GL_RGBA16_EXTENDED_RANGE_SGIX[30];
+    char n_GL_ALPHA16_EXTENDED_RANGE_SGIX[31];
+    char n_GL_LUMINANCE16_EXTENDED_RANGE_SGIX[35];
+    char n_GL_INTENSITY16_EXTENDED_RANGE_SGIX[35];
+    char n_GL_LUMINANCE16_ALPHA16_EXTENDED_RANGE_SGIX[43];
+    char n_GL_MIN_LUMINANCE_SGIS[22];
+    char n_GL_MAX_LUMINANCE_SGIS[22];
+    char n_GL_MIN_INTENSITY_SGIS[22];
+    char n_GL_MAX_INTENSITY_SGIS[22];
+    char n_GL_QUAD_MESH_SUN[17];
+    char n_GL_TRIANGLE_MESH_SUN[21];
+    char n_GL_VERTEX_PROGRAM_ARB[22];
+    char n_GL_VERTEX_STATE_PROGRAM_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY_ENABLED[31];
+    char n_GL_VERTEX_ATTRIB_ARRAY_SIZE[28];
+    char n_GL_VERTEX_ATTRIB_ARRAY_STRIDE[30];
+    char n_GL_VERTEX_ATTRIB_ARRAY_TYPE[28];
+    char n_GL_CURRENT_VERTEX_ATTRIB[25];
+    char n_GL_PROGRAM_LENGTH_ARB[22];
+    char n_GL_PROGRAM_STRING_ARB[22];
+    char n_GL_MODELVIEW_PROJECTION_NV[27];
+    char n_GL_IDENTITY_NV[15];
+    char n_GL_INVERSE_NV[14];
+    char n_GL_TRANSPOSE_NV[16];
+    char n_GL_INVERSE_TRANSPOSE_NV[24];
+    char n_GL_MAX_PROGRAM_MATRIX_STACK_DEPTH_ARB[38];
+    char n_GL_MAX_PROGRAM_MATRICES_ARB[28];
+    char n_GL_MATRIX0_NV[14];
+    char n_GL_MATRIX1_NV[14];
+    char n_GL_MATRIX2_NV[14];
+    char n_GL_MATRIX3_NV[14];
+    char n_GL_MATRIX4_NV[14];
+    char n_GL_MATRIX5_NV[14];
+    char n_GL_MATRIX6_NV[14];
+    char n_GL_MATRIX7_NV[14];
+    char n_GL_CURRENT_MATRIX_STACK_DEPTH_ARB[34];
+    char n_GL_CURRENT_MATRIX_ARB[22];
+    char n_GL_PROGRAM_POINT_SIZE[22];
+    char n_GL_VERTEX_PROGRAM_TWO_SIDE[27];
+    char n_GL_PROGRAM_PARAMETER_NV[24];
+    char n_GL_VERTEX_ATTRIB_ARRAY_POINTER[31];
+    char n_GL_PROGRAM_TARGET_NV[21];
+    char n_GL_PROGRAM_RESIDENT_NV[23];
+    char n_GL_TRACK_MATRIX_NV[19];
+    char n_GL_TRACK_MATRIX_TRANSFORM_NV[29];
+    char n_GL_VERTEX_PROGRAM_BINDING_NV[29];
+    char n_GL_PROGRAM_ERROR_POSITION_ARB[30];
+    char n_GL_OFFSET_TEXTURE_RECTANGLE_NV[31];
+    char n_GL_OFFSET_TEXTURE_RECTANGLE_SCALE_NV[37];
+    char n_GL_DOT_PRODUCT_TEXTURE_RECTANGLE_NV[36];
+    char n_GL_DEPTH_CLAMP[15];
+    char n_GL_VERTEX_ATTRIB_ARRAY0_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY1_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY2_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY3_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY4_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY5_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY6_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY7_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY8_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY9_NV[27];
+    char n_GL_VERTEX_ATTRIB_ARRAY10_NV[28];
+    char n_GL_VERTEX_ATTRIB_ARRAY11_NV[28];
+    char n_GL_VERTEX_ATTRIB_ARRAY12_NV[28];
+    char n_GL_VERTEX_ATTRIB_ARRAY13_NV[28];
+    char n_GL_VERTEX_ATTRIB_ARRAY14_NV[28];
+    char n_GL_VERTEX_ATTRIB_ARRAY15_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB0_4_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB1_4_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB2_4_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB3_4_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB4_4_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB5_4_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB6_4_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB7_4_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB8_4_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB9_4_NV[28];
+    char n_GL_MAP1_VERTEX_ATTRIB10_4_NV[29];
+    char n_GL_MAP1_VERTEX_ATTRIB11_4_NV[29];
+    char n_GL_MAP1_VERTEX_ATTRIB12_4_NV[29];
+    char n_GL_MAP1_VERTEX_ATTRIB13_4_NV[29];
+    char n_GL_MAP1_VERTEX_ATTRIB14_4_NV[29];
+    char n_GL_MAP1_VERTEX_ATTRIB15_4_NV[29];
+    char n_GL_MAP2_VERTEX_ATTRIB0_4_NV[28];
+    char n_GL_MAP2_VERTEX_ATTRIB1_4_NV[28];
+    char n_GL_MAP2_VERTEX_ATTRIB2_4_NV[28];
+    char n_GL_MAP2_VERTEX_ATTRIB3_4_NV[28];
+    char n_GL_MAP2_VERTEX_ATTRIB4_4_NV[28];
+    char n_GL_MAP2_VERTEX_ATTRIB5_4_NV[28];
+    char n_GL_MAP2_VERTEX_ATTRIB6_4_NV[28];
+    char n_GL_PROGRAM_BINDING_ARB[23];
+    char n_GL_MAP2_VERTEX_ATTRIB8_4_NV[28];
+    char n_GL_MAP2_VERTEX_ATTRIB9_4_NV[28];
+    char n_GL_MAP2_VERTEX_ATTRIB10_4_NV[29];
+    char n_GL_MAP2_VERTEX_ATTRIB11_4_NV[29];
+    char n_GL_MAP2_VERTEX_ATTRIB12_4_NV[29];
+    char n_GL_MAP2_VERTEX_ATTRIB13_4_NV[29];
+    char n_GL_MAP2_VERTEX_ATTRIB14_4_NV[29];
+    char n_GL_MAP2_VERTEX_ATTRIB15_4_NV[29];
+    char n_GL_TEXTURE_COMPRESSED_IMAGE_SIZE[33];
+    char n_GL_TEXTURE_COMPRESSED[22];
+    char n_GL_NUM_COMPRESSED_TEXTURE_FORMATS[34];
+    char n_GL_COMPRESSED_TEXTURE_FORMATS[30];
+    char n_GL_MAX_VERTEX_UNITS_ARB[24];
+    char n_GL_ACTIVE_VERTEX_UNITS_ARB[27];
+    char n_GL_WEIGHT_SUM_UNITY_ARB[24];
+    char n_GL_VERTEX_BLEND_ARB[20];
+    char n_GL_CURRENT_WEIGHT_ARB[22];
+    char n_GL_WEIGHT_ARRAY_TYPE_ARB[25];
+    char n_GL_WEIGHT_ARRAY_STRIDE_ARB[27];
+    char n_GL_WEIGHT_ARRAY_SIZE_ARB[25];
+    char n_GL_WEIGHT_ARRAY_POINTER_ARB[28];
+    char n_GL_WEIGHT_ARRAY_ARB[20];
+    char n_GL_DOT3_RGB[12];
+    char n_GL_DOT3_RGBA[13];
+    char n_GL_COMPRESSED_RGB_FXT1_3DFX[28];
+    char n_GL_COMPRESSED_RGBA_FXT1_3DFX[29];
+    char n_GL_MULTISAMPLE_3DFX[20];
+    char n_GL_SAMPLE_BUFFERS_3DFX[23];
+    char n_GL_SAMPLES_3DFX[16];
+    char n_GL_EVAL_2D_NV[14];
+    char n_GL_EVAL_TRIANGULAR_2D_NV[25];
+    char n_GL_MAP_TESSELLATION_NV[23];
+    char n_GL_MAP_ATTRIB_U_ORDER_NV[25];
+    char n_GL_MAP_ATTRIB_V_ORDER_NV[25];
+    char n_GL_EVAL_FRACTIONAL_TESSELLATION_NV[35];
+    char n_GL_EVAL_VERTEX_ATTRIB0_NV[26];
+    char n_GL_EVAL_VERTEX_ATTRIB1_NV[26];
+    char n_GL_EVAL_VERTEX_ATTRIB2_NV[26];
+    char n_GL_EVAL_VERTEX_ATTRIB3_NV[26];
+    char n_GL_EVAL_VERTEX_ATTRIB4_NV[26];
+    char n_GL_EVAL_VERTEX_ATTRIB5_NV[26];
+    char n_GL_EVAL_VERTEX_ATTRIB6_NV[26];
+    char n_GL_EVAL_VERTEX_ATTRIB7_NV[26];
+    char n_GL_EVAL_VERTEX_ATTRIB8_NV[26];
+    char n_GL_EVAL_VERTEX_ATTRIB9_NV[26];
+    char n_GL_EVAL_VERTEX_ATTRIB10_NV[27];
+    char n_GL_EVAL_VERTEX_ATTRIB11_NV[27];
+    char n_GL_EVAL_VERTEX_ATTRIB12_NV[27];
+    char n_GL_EVAL_VERTEX_ATTRIB13_NV[27];
+    char n_GL_EVAL_VERTEX_ATTRIB14_NV[27];
+    char n_GL_EVAL_VERTEX_ATTRIB15_NV[27];
+    char n_GL_MAX_MAP_TESSELLATION_NV[27];
+    char n_GL_MAX_RATIONAL_EVAL_ORDER_NV[30];
+    char n_GL_MAX_PROGRAM_PATCH_ATTRIBS_NV[32];
+    char n_GL_RGBA_UNSIGNED_DOT_PRODUCT_MAPPING_NV[40];
+    char n_GL_UNSIGNED_INT_S8_S8_8_8_NV[29];
+    char n_GL_UNSIGNED_INT_8_8_S8_S8_REV_NV[33];
+    char n_GL_DSDT_MAG_INTENSITY_NV[25];
+    char n_GL_SHADER_CONSISTENT_NV[24];
+    char n_GL_TEXTURE_SHADER_NV[21];
+    char n_GL_SHADER_OPERATION_NV[23];
+    char n_GL_CULL_MODES_NV[17];
+    char n_GL_OFFSET_TEXTURE_2D_MATRIX_NV[31];
+    char n_GL_OFFSET_TEXTURE_2D_SCALE_NV[30];
+    char n_GL_OFFSET_TEXTURE_2D_BIAS_NV[29];
+    char n_GL_PREVIOUS_TEXTURE_INPUT_NV[29];
+    char n_GL_CONST_EYE_NV[16];
+    char n_GL_PASS_THROUGH_NV[19];
+    char n_GL_CULL_FRAGMENT_NV[20];
+    char n_GL_OFFSET_TEXTURE_2D_NV[24];
+    char n_GL_DEPENDENT_AR_TEXTURE_2D_NV[30];
+    char n_GL_DEPENDENT_GB_TEXTURE_2D_NV[30];
+    char n_GL_SURFACE_STATE_NV[20];
+    char n_GL_DOT_PRODUCT_NV[18];
+    char n_GL_DOT_PRODUCT_DEPTH_REPLACE_NV[32];
+    char n_GL_DOT_PRODUCT_TEXTURE_2D_NV[29];
+    char n_GL_DOT_PRODUCT_TEXTURE_3D_NV[29];
+    char n_GL_DOT_PRODUCT_TEXTURE_CUBE_MAP_NV[35];
+    char n_GL_DOT_PRODUCT_DIFFUSE_CUBE_MAP_NV[35];
+    char n_GL_DOT_PRODUCT_REFLECT_CUBE_MAP_NV[35];
+    char n_GL_DOT_PRODUCT_CONST_EYE_REFLECT_CUBE_MAP_NV[45];
+    char n_GL_HILO_NV[11];
+    char n_GL_DSDT_NV[11];
+    char n_GL_DSDT_MAG_NV[15];
+    char n_GL_DSDT_MAG_VIB_NV[19];
+    char n_GL_HILO16_NV[13];
+    char n_GL_SIGNED_HILO_NV[18];
+    char n_GL_SIGNED_HILO16_NV[20];
+    char n_GL_SIGNED_RGBA_NV[18];
+    char n_GL_SIGNED_RGBA8_NV[19];
+    char n_GL_SURFACE_REGISTERED_NV[25];
+    char n_GL_SIGNED_RGB_NV[17];
+    char n_GL_SIGNED_RGB8_NV[18];
+    char n_GL_SURFACE_MAPPED_NV[21];
+    char n_GL_SIGNED_LUMINANCE_NV[23];
+    char n_GL_SIGNED_LUMINANCE8_NV[24];
+    char n_GL_SIGNED_LUMINANCE_ALPHA_NV[29];
+    char n_GL_SIGNED_LUMINANCE8_ALPHA8_NV[31];
+    char n_GL_SIGNED_ALPHA_NV[19];
+    char n_GL_SIGNED_ALPHA8_NV[20];
+    char n_GL_SIGNED_INTENSITY_NV[23];
+    char n_GL_SIGNED_INTENSITY8_NV[24];
+    char n_GL_DSDT8_NV[12];
+    char n_GL_DSDT8_MAG8_NV[17];
+    char n_GL_DSDT8_MAG8_INTENSITY8_NV[28];
+    char n_GL_SIGNED_RGB_UNSIGNED_ALPHA_NV[32];
+    char n_GL_SIGNED_RGB8_UNSIGNED_ALPHA8_NV[34];
+    char n_GL_HI_SCALE_NV[15];
+    char n_GL_LO_SCALE_NV[15];
+    char n_GL_DS_SCALE_NV[15];
+    char n_GL_DT_SCALE_NV[15];
+    char n_GL_MAGNITUDE_SCALE_NV[22];
+    char n_GL_VIBRANCE_SCALE_NV[21];
+    char n_GL_HI_BIAS_NV[14];
+    char n_GL_LO_BIAS_NV[14];
+    char n_GL_DS_BIAS_NV[14];
+    char n_GL_DT_BIAS_NV[14];
+    char n_GL_MAGNITUDE_BIAS_NV[21];
+    char n_GL_VIBRANCE_BIAS_NV[20];
+    char n_GL_TEXTURE_BORDER_VALUES_NV[28];
+    char n_GL_TEXTURE_HI_SIZE_NV[22];
+    char n_GL_TEXTURE_LO_SIZE_NV[22];
+    char n_GL_TEXTURE_DS_SIZE_NV[22];
+    char n_GL_TEXTURE_DT_SIZE_NV[22];
+    char n_GL_TEXTURE_MAG_SIZE_NV[23];
+    char n_GL_MODELVIEW2_ARB[18];
+    char n_GL_MODELVIEW3_ARB[18];
+    char n_GL_MODELVIEW4_ARB[18];
+    char n_GL_MODELVIEW5_ARB[18];
+    char n_GL_MODELVIEW6_ARB[18];
+    char n_GL_MODELVIEW7_ARB[18];
+    char n_GL_MODELVIEW8_ARB[18];
+    char n_GL_MODELVIEW9_ARB[18];
+    char n_GL_MODELVIEW10_ARB[19];
+    char n_GL_MODELVIEW11_ARB[19];
+    char n_GL_MODELVIEW12_ARB[19];
+    char n_GL_MODELVIEW13_ARB[19];
+    char n_GL_MODELVIEW14_ARB[19];
+    char n_GL_MODELVIEW15_ARB[19];
+    char n_GL_MODELVIEW16_ARB[19];
+    char n_GL_MODELVIEW17_ARB[19];
+    char n_GL_MODELVIEW18_ARB[19];
+    char n_GL_MODELVIEW19_ARB[19];
+    char n_GL_MODELVIEW20_ARB[19];
+    char n_GL_MODELVIEW21_ARB[19];
+    char n_GL_MODELVIEW22_ARB[19];
+    char n_GL_MODELVIEW23_ARB[19];
+    char n_GL_MODELVIEW24_ARB[19];
+    char n_GL_MODELVIEW25_ARB[19];
+    char n_GL_MODELVIEW26_ARB[19];
+    char n_GL_MODELVIEW27_ARB[19];
+    char n_GL_MODELVIEW28_ARB[19];
+    char n_GL_MODELVIEW29_ARB[19];
+    char n_GL_MODELVIEW30_ARB[19];
+    char n_GL_MODELVIEW31_ARB[19];
+    char n_GL_Z400_BINARY_AMD[19];
+    char n_GL_PROGRAM_BINARY_LENGTH[25];
+    char n_GL_MIRROR_CLAMP_EXT[20];
+    char n_GL_MIRROR_CLAMP_TO_EDGE[24];
+    char n_GL_MODULATE_ADD_ATI[20];
+    char n_GL_MODULATE_SIGNED_ADD_ATI[27];
+    char n_GL_MODULATE_SUBTRACT_ATI[25];
+    char n_GL_SET_AMD[11];
+    char n_GL_REPLACE_VALUE_AMD[21];
+    char n_GL_STENCIL_OP_VALUE_AMD[24];
+    char n_GL_STENCIL_BACK_OP_VALUE_AMD[29];
+    char n_GL_VERTEX_ATTRIB_ARRAY_LONG[28];
+    char n_GL_YCBCR_MESA[14];
+    char n_GL_PACK_INVERT_MESA[20];
+    char n_GL_TEXTURE_1D_STACK_MESAX[26];
+    char n_GL_TEXTURE_2D_STACK_MESAX[26];
+    char n_GL_PROXY_TEXTURE_1D_STACK_MESAX[32];
+    char n_GL_PROXY_TEXTURE_2D_STACK_MESAX[32];
+    char n_GL_TEXTURE_1D_STACK_BINDING_MESAX[34];
+    char n_GL_TEXTURE_2D_STACK_BINDING_MESAX[34];
+    char n_GL_STATIC_ATI[14];
+    char n_GL_DYNAMIC_ATI[15];
+    char n_GL_PRESERVE_ATI[16];
+    char n_GL_DISCARD_ATI[15];
+    char n_GL_BUFFER_SIZE[15];
+    char n_GL_BUFFER_USAGE[16];
+    char n_GL_ARRAY_OBJECT_BUFFER_ATI[27];
+    char n_GL_ARRAY_OBJECT_OFFSET_ATI[27];
+    char n_GL_ELEMENT_ARRAY_ATI[21];
+    char n_GL_ELEMENT_ARRAY_TYPE_ATI[26];
+    char n_GL_ELEMENT_ARRAY_POINTER_ATI[29];
+    char n_GL_MAX_VERTEX_STREAMS_ATI[26];
+    char n_GL_VERTEX_SOURCE_ATI[21];
+    char n_GL_VERTEX_STREAM0_ATI[22];
+    char n_GL_VERTEX_STREAM1_ATI[22];
+    char n_GL_VERTEX_STREAM2_ATI[22];
+    char n_GL_VERTEX_STREAM3_ATI[22];
+    char n_GL_VERTEX_STREAM4_ATI[22];
+    char n_GL_VERTEX_STREAM5_ATI[22];
+    char n_GL_VERTEX_STREAM6_ATI[22];
+    char n_GL_VERTEX_STREAM7_ATI[22];
+    char n_GL_BUMP_ROT_MATRIX_ATI[23];
+    char n_GL_BUMP_ROT_MATRIX_SIZE_ATI[28];
+    char n_GL_BUMP_NUM_TEX_UNITS_ATI[26];
+    char n_GL_BUMP_TEX_UNITS_ATI[22];
+    char n_GL_DUDV_ATI[12];
+    char n_GL_DU8DV8_ATI[14];
+    char n_GL_BUMP_ENVMAP_ATI[19];
+    char n_GL_BUMP_TARGET_ATI[19];
+    char n_GL_VERTEX_SHADER_EXT[21];
+    char n_GL_VERTEX_SHADER_BINDING_EXT[29];
+    char n_GL_OP_INDEX_EXT[16];
+    char n_GL_OP_NEGATE_EXT[17];
+    char n_GL_OP_DOT3_EXT[15];
+    char n_GL_OP_DOT4_EXT[15];
+    char n_GL_OP_MUL_EXT[14];
+    char n_GL_OP_ADD_EXT[14];
+    char n_GL_OP_MADD_EXT[15];
+    char n_GL_OP_FRAC_EXT[15];
+    char n_GL_OP_MAX_EXT[14];
+    char n_GL_OP_MIN_EXT[14];
+    char n_GL_OP_SET_GE_EXT[17];
+    char n_GL_OP_SET_LT_EXT[17];
+    char n_GL_OP_CLAMP_EXT[16];
+    char n_GL_OP_FLOOR_EXT[16];
+    char n_GL_OP_ROUND_EXT[16];
+    char n_GL_OP_EXP_BASE_2_EXT[21];
+    char n_GL_OP_LOG_BASE_2_EXT[21];
+    char n_GL_OP_POWER_EXT[16];
+    char n_GL_OP_RECIP_EXT[16];
+    char n_GL_OP_RECIP_SQRT_EXT[21];
+    char n_GL_OP_SUB_EXT[14];
+    char n_GL_OP_CROSS_PRODUCT_EXT[24];
+    char n_GL_OP_MULTIPLY_MATRIX_EXT[26];
+    char n_GL_OP_MOV_EXT[14];
+    char n_GL_OUTPUT_VERTEX_EXT[21];
+    char n_GL_OUTPUT_COLOR0_EXT[21];
+    char n_GL_OUTPUT_COLOR1_EXT[21];
+    char n_GL_OUTPUT_TEXTURE_COORD0_EXT[29];
+    char n_GL_OUTPUT_TEXTURE_COORD1_EXT[29];
+    char n_GL_OUTPUT_TEXTURE_COORD2_EXT[29];
+    char n_GL_OUTPUT_TEXTURE_COORD3_EXT[29];
+    char n_GL_OUTPUT_TEXTURE_COORD4_EXT[29];
+    char n_GL_OUTPUT_TEXTURE_COORD5_EXT[29];
+    char n_GL_OUTPUT_TEXTURE_COORD6_EXT[29];
+    char n_GL_OUTPUT_TEXTURE_COORD7_EXT[29];
+    char n_GL_OUTPUT_TEXTURE_COORD8_EXT[29];
+    char n_GL_OUTPUT_TEXTURE_COORD9_EXT[29];
+    char n_GL_OUTPUT_TEXTURE_COORD10_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD11_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD12_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD13_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD14_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD15_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD16_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD17_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD18_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD19_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD20_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD21_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD22_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD23_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD24_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD25_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD26_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD27_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD28_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD29_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD30_EXT[30];
+    char n_GL_OUTPUT_TEXTURE_COORD31_EXT[30];
+    char n_GL_OUTPUT_FOG_EXT[18];
+    char n_GL_SCALAR_EXT[14];
+    char n_GL_VECTOR_EXT[14];
+    char n_GL_MATRIX_EXT[14];
+    char n_GL_VARIANT_EXT[15];
+    char n_GL_INVARIANT_EXT[17];
+    char n_GL_LOCAL_CONSTANT_EXT[22];
+    char n_GL_LOCAL_EXT[13];
+    char n_GL_MAX_VERTEX_SHADER_INSTRUCTIONS_EXT[38];
+    char n_GL_MAX_VERTEX_SHADER_VARIANTS_EXT[34];
+    char n_GL_MAX_VERTEX_SHADER_INVARIANTS_EXT[36];
+    char n_GL_MAX_VERTEX_SHADER_LOCAL_CONSTANTS_EXT[41];
+    char n_GL_MAX_VERTEX_SHADER_LOCALS_EXT[32];
+    char n_GL_MAX_OPTIMIZED_VERTEX_SHADER_INSTRUCTIONS_EXT[48];
+    char n_GL_MAX_OPTIMIZED_VERTEX_SHADER_VARIANTS_EXT[44];
+    char n_GL_MAX_OPTIMIZED_VERTEX_SHADER_INVARIANTS_EXT[46];
+    char n_GL_MAX_OPTIMIZED_VERTEX_SHADER_LOCAL_CONSTANTS_EXT[51];
+    char n_GL_MAX_OPTIMIZED_VERTEX_SHADER_LOCALS_EXT[42];
+    char n_GL_VERTEX_SHADER_INSTRUCTIONS_EXT[34];
+    char n_GL_VERTEX_SHADER_VARIANTS_EXT[30];
+    char n_GL_VERTEX_SHADER_INVARIANTS_EXT[32];
+    char n_GL_VERTEX_SHADER_LOCAL_CONSTANTS_EXT[37];
+    char n_GL_VERTEX_SHADER_LOCALS_EXT[28];
+    char n_GL_VERTEX_SHADER_OPTIMIZED_EXT[31];
+    char n_GL_X_EXT[9];
+    char n_GL_Y_EXT[9];
+    char n_GL_Z_EXT[9];
+    char n_GL_W_EXT[9];
+    char n_GL_NEGATIVE_X_EXT[18];
+    char n_GL_NEGATIVE_Y_EXT[18];
+    char n_GL_NEGATIVE_Z_EXT[18];
+    char n_GL_NEGATIVE_W_EXT[18];
+    char n_GL_ZERO_EXT[12];
+    char n_GL_ONE_EXT[11];
+    char n_GL_NEGATIVE_ONE_EXT[20];
+    char n_GL_NORMALIZED_RANGE_EXT[24];
+    char n_GL_FULL_RANGE_EXT[18];
+    char n_GL_CURRENT_VERTEX_EXT[22];
+    char n_GL_MVP_MATRIX_EXT[18];
+    char n_GL_VARIANT_VALUE_EXT[21];
+    char n_GL_VARIANT_DATATYPE_EXT[24];
+    char n_GL_VARIANT_ARRAY_STRIDE_EXT[28];
+    char n_GL_VARIANT_ARRAY_TYPE_EXT[26];
+    char n_GL_VARIANT_ARRAY_EXT[21];
+    char n_GL_VARIANT_ARRAY_POINTER_EXT[29];
+    char n_GL_INVARIANT_VALUE_EXT[23];
+    char n_GL_INVARIANT_DATATYPE_EXT[26];
+    char n_GL_LOCAL_CONSTANT_VALUE_EXT[28];
+    char n_GL_LOCAL_CONSTANT_DATATYPE_EXT[31];
+    char n_GL_ATC_RGBA_INTERPOLATED_ALPHA_AMD[35];
+    char n_GL_PN_TRIANGLES_ATI[20];
+    char n_GL_MAX_PN_TRIANGLES_TESSELATION_LEVEL_ATI[42];
+    char n_GL_PN_TRIANGLES_POINT_MODE_ATI[31];
+    char n_GL_PN_TRIANGLES_NORMAL_MODE_ATI[32];
+    char n_GL_PN_TRIANGLES_TESSELATION_LEVEL_ATI[38];
+    char n_GL_PN_TRIANGLES_POINT_MODE_LINEAR_ATI[38];
+    char n_GL_PN_TRIANGLES_POINT_MODE_CUBIC_ATI[37];
+    char n_GL_PN_TRIANGLES_NORMAL_MODE_LINEAR_ATI[39];
+    char n_GL_PN_TRIANGLES_NORMAL_MODE_QUADRATIC_ATI[42];
+    char n_GL_3DC_X_AMD[13];
+    char n_GL_3DC_XY_AMD[14];
+    char n_GL_VBO_FREE_MEMORY_ATI[23];
+    char n_GL_TEXTURE_FREE_MEMORY_ATI[27];
+    char n_GL_RENDERBUFFER_FREE_MEMORY_ATI[32];
+    char n_GL_NUM_PROGRAM_BINARY_FORMATS[30];
+    char n_GL_PROGRAM_BINARY_FORMATS[26];
+    char n_GL_STENCIL_BACK_FUNC[21];
+    char n_GL_STENCIL_BACK_FAIL[21];
+    char n_GL_STENCIL_BACK_PASS_DEPTH_FAIL[32];
+    char n_GL_STENCIL_BACK_PASS_DEPTH_PASS[32];
+    char n_GL_FRAGMENT_PROGRAM_ARB[24];
+    char n_GL_PROGRAM_ALU_INSTRUCTIONS_ARB[32];
+    char n_GL_PROGRAM_TEX_INSTRUCTIONS_ARB[32];
+    char n_GL_PROGRAM_TEX_INDIRECTIONS_ARB[32];
+    char n_GL_PROGRAM_NATIVE_ALU_INSTRUCTIONS_ARB[39];
+    char n_GL_PROGRAM_NATIVE_TEX_INSTRUCTIONS_ARB[39];
+    char n_GL_PROGRAM_NATIVE_TEX_INDIRECTIONS_ARB[39];
+    char n_GL_MAX_PROGRAM_ALU_INSTRUCTIONS_ARB[36];
+    char n_GL_MAX_PROGRAM_TEX_INSTRUCTIONS_ARB[36];
+    char n_GL_MAX_PROGRAM_TEX_INDIRECTIONS_ARB[36];
+    char n_GL_MAX_PROGRAM_NATIVE_ALU_INSTRUCTIONS_ARB[43];
+    char n_GL_MAX_PROGRAM_NATIVE_TEX_INSTRUCTIONS_ARB[43];
+    char n_GL_MAX_PROGRAM_NATIVE_TEX_INDIRECTIONS_ARB[43];
+    char n_GL_RGBA32F[11];
+    char n_GL_RGB32F[10];
+    char n_GL_ALPHA32F_ARB[16];
+    char n_GL_INTENSITY32F_ARB[20];
+    char n_GL_LUMINANCE32F_ARB[20];
+    char n_GL_LUMINANCE_ALPHA32F_ARB[26];
+    char n_GL_RGBA16F[11];
+    char n_GL_RGB16F[10];
+    char n_GL_ALPHA16F_ARB[16];
+    char n_GL_INTENSITY16F_ARB[20];
+    char n_GL_LUMINANCE16F_ARB[20];
+    char n_GL_LUMINANCE_ALPHA16F_ARB[26];
+    char n_GL_RGBA_FLOAT_MODE_ARB[23];
+    char n_GL_WRITEONLY_RENDERING_QCOM[28];
+    char n_GL_MAX_DRAW_BUFFERS[20];
+    char n_GL_DRAW_BUFFER0[16];
+    char n_GL_DRAW_BUFFER1[16];
+    char n_GL_DRAW_BUFFER2[16];
+    char n_GL_DRAW_BUFFER3[16];
+    char n_GL_DRAW_BUFFER4[16];
+    char n_GL_DRAW_BUFFER5[16];
+    char n_GL_DRAW_BUFFER6[16];
+    char n_GL_DRAW_BUFFER7[16];
+    char n_GL_DRAW_BUFFER8[16];
+    char n_GL_DRAW_BUFFER9[16];
+    char n_GL_DRAW_BUFFER10[17];
+    char n_GL_DRAW_BUFFER11[17];
+    char n_GL_DRAW_BUFFER12[17];
+    char n_GL_DRAW_BUFFER13[17];
+    char n_GL_DRAW_BUFFER14[17];
+    char n_GL_DRAW_BUFFER15[17];
+    char n_GL_COMPRESSED_LUMINANCE_ALPHA_3DC_ATI[38];
+    char n_GL_BLEND_EQUATION_ALPHA[24];
+    char n_GL_SUBSAMPLE_DISTANCE_AMD[26];
+    char n_GL_MATRIX_PALETTE_ARB[22];
+    char n_GL_MAX_MATRIX_PALETTE_STACK_DEPTH_ARB[38];
+    char n_GL_MAX_PALETTE_MATRICES_ARB[28];
+    char n_GL_CURRENT_PALETTE_MATRIX_ARB[30];
+    char n_GL_MATRIX_INDEX_ARRAY_ARB[26];
+    char n_GL_CURRENT_MATRIX_INDEX_ARB[28];
+    char n_GL_MATRIX_INDEX_ARRAY_SIZE_ARB[31];
+    char n_GL_MATRIX_INDEX_ARRAY_TYPE_ARB[31];
+    char n_GL_MATRIX_INDEX_ARRAY_STRIDE_ARB[33];
+    char n_GL_MATRIX_INDEX_ARRAY_POINTER_ARB[34];
+    char n_GL_TEXTURE_DEPTH_SIZE[22];
+    char n_GL_DEPTH_TEXTURE_MODE[22];
+    char n_GL_TEXTURE_COMPARE_MODE[24];
+    char n_GL_TEXTURE_COMPARE_FUNC[24];
+    char n_GL_COMPARE_R_TO_TEXTURE[24];
+    char n_GL_TEXTURE_CUBE_MAP_SEAMLESS[29];
+    char n_GL_OFFSET_PROJECTIVE_TEXTURE_2D_NV[35];
+    char n_GL_OFFSET_PROJECTIVE_TEXTURE_2D_SCALE_NV[41];
+    char n_GL_OFFSET_PROJECTIVE_TEXTURE_RECTANGLE_NV[42];
+    char n_GL_OFFSET_PROJECTIVE_TEXTURE_RECTANGLE_SCALE_NV[48];
+    char n_GL_OFFSET_HILO_TEXTURE_2D_NV[29];
+    char n_GL_OFFSET_HILO_TEXTURE_RECTANGLE_NV[36];
+    char n_GL_OFFSET_HILO_PROJECTIVE_TEXTURE_2D_NV[40];
+    char n_GL_OFFSET_HILO_PROJECTIVE_TEXTURE_RECTANGLE_NV[47];
+    char n_GL_DEPENDENT_HILO_TEXTURE_2D_NV[32];
+    char n_GL_DEPENDENT_RGB_TEXTURE_3D_NV[31];
+    char n_GL_DEPENDENT_RGB_TEXTURE_CUBE_MAP_NV[37];
+    char n_GL_DOT_PRODUCT_PASS_THROUGH_NV[31];
+    char n_GL_DOT_PRODUCT_TEXTURE_1D_NV[29];
+    char n_GL_DOT_PRODUCT_AFFINE_DEPTH_REPLACE_NV[39];
+    char n_GL_HILO8_NV[12];
+    char n_GL_SIGNED_HILO8_NV[19];
+    char n_GL_FORCE_BLUE_TO_ONE_NV[24];
+    char n_GL_POINT_SPRITE[16];
+    char n_GL_COORD_REPLACE[17];
+    char n_GL_POINT_SPRITE_R_MODE_NV[26];
+    char n_GL_QUERY_COUNTER_BITS_ARB[26];
+    char n_GL_CURRENT_QUERY[17];
+    char n_GL_QUERY_RESULT[16];
+    char n_GL_QUERY_RESULT_AVAILABLE[26];
+    char n_GL_MAX_FRAGMENT_PROGRAM_LOCAL_PARAMETERS_NV[44];
+    char n_GL_MAX_VERTEX_ATTRIBS[22];
+    char n_GL_VERTEX_ATTRIB_ARRAY_NORMALIZED[34];
+    char n_GL_MAX_TESS_CONTROL_INPUT_COMPONENTS[37];
+    char n_GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS[40];
+    char n_GL_DEPTH_STENCIL_TO_RGBA_NV[28];
+    char n_GL_DEPTH_STENCIL_TO_BGRA_NV[28];
+    char n_GL_FRAGMENT_PROGRAM_NV[23];
+    char n_GL_MAX_TEXTURE_COORDS[22];
+    char n_GL_MAX_TEXTURE_IMAGE_UNITS[27];
+    char n_GL_FRAGMENT_PROGRAM_BINDING_NV[31];
+    char n_GL_PROGRAM_ERROR_STRING_ARB[28];
+    char n_GL_PROGRAM_FORMAT_ASCII_ARB[28];
+    char n_GL_PROGRAM_FORMAT_ARB[22];
+    char n_GL_WRITE_PIXEL_DATA_RANGE_NV[29];
+    char n_GL_READ_PIXEL_DATA_RANGE_NV[28];
+    char n_GL_WRITE_PIXEL_DATA_RANGE_LENGTH_NV[36];
+    char n_GL_READ_PIXEL_DATA_RANGE_LENGTH_NV[35];
+    char n_GL_WRITE_PIXEL_DATA_RANGE_POINTER_NV[37];
+    char n_GL_READ_PIXEL_DATA_RANGE_POINTER_NV[36];
+    char n_GL_GEOMETRY_SHADER_INVOCATIONS[31];
+    char n_GL_FLOAT_R_NV[14];
+    char n_GL_FLOAT_RG_NV[15];
+    char n_GL_FLOAT_RGB_NV[16];
+    char n_GL_FLOAT_RGBA_NV[17];
+    char n_GL_FLOAT_R16_NV[16];
+    char n_GL_FLOAT_R32_NV[16];
+    char n_GL_FLOAT_RG16_NV[17];
+    char n_GL_FLOAT_RG32_NV[17];
+    char n_GL_FLOAT_RGB16_NV[18];
+    char n_GL_FLOAT_RGB32_NV[18];
+    char n_GL_FLOAT_RGBA16_NV[19];
+    char n_GL_FLOAT_RGBA32_NV[19];
+    char n_GL_TEXTURE_FLOAT_COMPONENTS_NV[31];
+    char n_GL_FLOAT_CLEAR_COLOR_VALUE_NV[30];
+    char n_GL_FLOAT_RGBA_MODE_NV[22];
+    char n_GL_TEXTURE_UNSIGNED_REMAP_MODE_NV[34];
+    char n_GL_DEPTH_BOUNDS_TEST_EXT[25];
+    char n_GL_DEPTH_BOUNDS_EXT[20];
+    char n_GL_ARRAY_BUFFER[16];
+    char n_GL_ELEMENT_ARRAY_BUFFER[24];
+    char n_GL_ARRAY_BUFFER_BINDING[24];
+    char n_GL_ELEMENT_ARRAY_BUFFER_BINDING[32];
+    char n_GL_VERTEX_ARRAY_BUFFER_BINDING[31];
+    char n_GL_NORMAL_ARRAY_BUFFER_BINDING[31];
+    char n_GL_COLOR_ARRAY_BUFFER_BINDING[30];
+    char n_GL_INDEX_ARRAY_BUFFER_BINDING[30];
+    char n_GL_TEXTURE_COORD_ARRAY_BUFFER_BINDING[38];
+    char n_GL_EDGE_FLAG_ARRAY_BUFFER_BINDING[34];
+    char n_GL_SECONDARY_COLOR_ARRAY_BUFFER_BINDING[40];
+    char n_GL_FOG_COORDINATE_ARRAY_BUFFER_BINDING[39];
+    char n_GL_WEIGHT_ARRAY_BUFFER_BINDING[31];
+    char n_GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING[38];
+    char n_GL_PROGRAM_INSTRUCTIONS_ARB[28];
+    char n_GL_MAX_PROGRAM_INSTRUCTIONS_ARB[32];
+    char n_GL_PROGRAM_NATIVE_INSTRUCTIONS_ARB[35];
+    char n_GL_MAX_PROGRAM_NATIVE_INSTRUCTIONS_ARB[39];
+    char n_GL_PROGRAM_TEMPORARIES_ARB[27];
+    char n_GL_MAX_PROGRAM_TEMPORARIES_ARB[31];
+    char n_GL_PROGRAM_NATIVE_TEMPORARIES_ARB[34];
+    char n_GL_MAX_PROGRAM_NATIVE_TEMPORARIES_ARB[38];
+    char n_GL_PROGRAM_PARAMETERS_ARB[26];
+    char n_GL_MAX_PROGRAM_PARAMETERS_ARB[30];
+    char n_GL_PROGRAM_NATIVE_PARAMETERS_ARB[33];
+    char n_GL_MAX_PROGRAM_NATIVE_PARAMETERS_ARB[37];
+    char n_GL_PROGRAM_ATTRIBS_ARB[23];
+    char n_GL_MAX_PROGRAM_ATTRIBS_ARB[27];
+    char n_GL_PROGRAM_NATIVE_ATTRIBS_ARB[30];
+    char n_GL_MAX_PROGRAM_NATIVE_ATTRIBS_ARB[34];
+    char n_GL_PROGRAM_ADDRESS_REGISTERS_ARB[33];
+    char n_GL_MAX_PROGRAM_ADDRESS_REGISTERS_ARB[37];
+    char n_GL_PROGRAM_NATIVE_ADDRESS_REGISTERS_ARB[40];
+    char n_GL_MAX_PROGRAM_NATIVE_ADDRESS_REGISTERS_ARB[44];
+    char n_GL_MAX_PROGRAM_LOCAL_PARAMETERS_ARB[36];
+    char n_GL_MAX_PROGRAM_ENV_PARAMETERS_ARB[34];
+    char n_GL_PROGRAM_UNDER_NATIVE_LIMITS_ARB[35];
+    char n_GL_TRANSPOSE_CURRENT_MATRIX_ARB[32];
+    char n_GL_READ_ONLY[13];
+    char n_GL_WRITE_ONLY[14];
+    char n_GL_READ_WRITE[14];
+    char n_GL_BUFFER_ACCESS[17];
+    char n_GL_BUFFER_MAPPED[17];
+    char n_GL_BUFFER_MAP_POINTER[22];
+    char n_GL_WRITE_DISCARD_NV[20];
+    char n_GL_TIME_ELAPSED[16];
+    char n_GL_MATRIX0_ARB[15];
+    char n_GL_MATRIX1_ARB[15];
+    char n_GL_MATRIX2_ARB[15];
+    char n_GL_MATRIX3_ARB[15];
+    char n_GL_MATRIX4_ARB[15];
+    char n_GL_MATRIX5_ARB[15];
+    char n_GL_MATRIX6_ARB[15];
+    char n_GL_MATRIX7_ARB[15];
+    char n_GL_MATRIX8_ARB[15];
+    char n_GL_MATRIX9_ARB[15];
+    char n_GL_MATRIX10_ARB[16];
+    char n_GL_MATRIX11_ARB[16];
+    char n_GL_MATRIX12_ARB[16];
+    char n_GL_MATRIX13_ARB[16];
+    char n_GL_MATRIX14_ARB[16];
+    char n_GL_MATRIX15_ARB[16];
+    char n_GL_MATRIX16_ARB[16];
+    char n_GL_MATRIX17_ARB[16];
+    char n_GL_MATRIX18_ARB[16];
+    char n_GL_MATRIX19_ARB[16];
+    char n_GL_MATRIX20_ARB[16];
+    char n_GL_MATRIX21_ARB[16];
+    char n_GL_MATRIX22_ARB[16];
+    char n_GL_MATRIX23_ARB[16];
+    char n_GL_MATRIX24_ARB[16];
+    char n_GL_MATRIX25_ARB[16];
+    char n_GL_MATRIX26_ARB[16];
+    char n_GL_MATRIX27_ARB[16];
+    char n_GL_MATRIX28_ARB[16];
+    char n_GL_MATRIX29_ARB[16];
+    char n_GL_MATRIX30_ARB[16];
+    char n_GL_MATRIX31_ARB[16];
+    char n_GL_STREAM_DRAW[15];
+    char n_GL_STREAM_READ[15];
+    char n_GL_STREAM_COPY[15];
+    char n_GL_STATIC_DRAW[15];
+    char n_GL_STATIC_READ[15];
+    char n_GL_STATIC_COPY[15];
+    char n_GL_DYNAMIC_DRAW[16];
+    char n_GL_DYNAMIC_READ[16];
+    char n_GL_DYNAMIC_COPY[16];
+    char n_GL_PIXEL_PACK_BUFFER[21];
+    char n_GL_PIXEL_UNPACK_BUFFER[23];
+    char n_GL_PIXEL_PACK_BUFFER_BINDING[29];
+    char n_GL_ETC1_SRGB8_NV[17];
+    char n_GL_PIXEL_UNPACK_BUFFER_BINDING[31];
+    char n_GL_DEPTH24_STENCIL8[20];
+    char n_GL_TEXTURE_STENCIL_SIZE[24];
+    char n_GL_STENCIL_TAG_BITS_EXT[24];
+    char n_GL_STENCIL_CLEAR_TAG_VALUE_EXT[31];
+    char n_GL_MAX_PROGRAM_EXEC_INSTRUCTIONS_NV[36];
+    char n_GL_MAX_PROGRAM_CALL_DEPTH_NV[29];
+    char n_GL_MAX_PROGRAM_IF_DEPTH_NV[27];
+    char n_GL_MAX_PROGRAM_LOOP_DEPTH_NV[29];
+    char n_GL_MAX_PROGRAM_LOOP_COUNT_NV[29];
+    char n_GL_SRC1_COLOR[14];
+    char n_GL_ONE_MINUS_SRC1_COLOR[24];
+    char n_GL_ONE_MINUS_SRC1_ALPHA[24];
+    char n_GL_MAX_DUAL_SOURCE_DRAW_BUFFERS[32];
+    char n_GL_VERTEX_ATTRIB_ARRAY_INTEGER[31];
+    char n_GL_VERTEX_ATTRIB_ARRAY_DIVISOR[31];
+    char n_GL_MAX_ARRAY_TEXTURE_LAYERS[28];
+    char n_GL_MIN_PROGRAM_TEXEL_OFFSET[28];
+    char n_GL_MAX_PROGRAM_TEXEL_OFFSET[28];
+    char n_GL_PROGRAM_ATTRIB_COMPONENTS_NV[32];
+    char n_GL_PROGRAM_RESULT_COMPONENTS_NV[32];
+    char n_GL_MAX_PROGRAM_ATTRIB_COMPONENTS_NV[36];
+    char n_GL_MAX_PROGRAM_RESULT_COMPONENTS_NV[36];
+    char n_GL_NVIDIA_PLATFORM_BINARY_NV[29];
+    char n_GL_CG_VERTEX_SHADER_EXT[24];
+    char n_GL_CG_FRAGMENT_SHADER_EXT[26];
+    char n_GL_STENCIL_TEST_TWO_SIDE_EXT[29];
+    char n_GL_ACTIVE_STENCIL_FACE_EXT[27];
+    char n_GL_MIRROR_CLAMP_TO_BORDER_EXT[30];
+    char n_GL_SAMPLES_PASSED[18];
+    char n_GL_GEOMETRY_VERTICES_OUT[25];
+    char n_GL_GEOMETRY_INPUT_TYPE[23];
+    char n_GL_GEOMETRY_OUTPUT_TYPE[24];
+    char n_GL_SAMPLER_BINDING[19];
+    char n_GL_CLAMP_VERTEX_COLOR[22];
+    char n_GL_CLAMP_FRAGMENT_COLOR[24];
+    char n_GL_CLAMP_READ_COLOR[20];
+    char n_GL_FIXED_ONLY[14];
+    char n_GL_TESS_CONTROL_PROGRAM_NV[27];
+    char n_GL_TESS_EVALUATION_PROGRAM_NV[30];
+    char n_GL_FRAGMENT_SHADER_ATI[23];
+    char n_GL_REG_0_ATI[13];
+    char n_GL_REG_1_ATI[13];
+    char n_GL_REG_2_ATI[13];
+    char n_GL_REG_3_ATI[13];
+    char n_GL_REG_4_ATI[13];
+    char n_GL_REG_5_ATI[13];
+    char n_GL_CON_0_ATI[13];
+    char n_GL_CON_1_ATI[13];
+    char n_GL_CON_2_ATI[13];
+    char n_GL_CON_3_ATI[13];
+    char n_GL_CON_4_ATI[13];
+    char n_GL_CON_5_ATI[13];
+    char n_GL_CON_6_ATI[13];
+    char n_GL_CON_7_ATI[13];
+    char n_GL_MOV_ATI[11];
+    char n_GL_ADD_ATI[11];
+    char n_GL_MUL_ATI[11];
+    char n_GL_SUB_ATI[11];
+    char n_GL_DOT3_ATI[12];
+    char n_GL_DOT4_ATI[12];
+    char n_GL_MAD_ATI[11];
+    char n_GL_LERP_ATI[12];
+    char n_GL_CND_ATI[11];
+    char n_GL_CND0_ATI[12];
+    char n_GL_DOT2_ADD_ATI[16];
+    char n_GL_SECONDARY_INTERPOLATOR_ATI[30];
+    char n_GL_NUM_FRAGMENT_REGISTERS_ATI[30];
+    char n_GL_NUM_FRAGMENT_CONSTANTS_ATI[30];
+    char n_GL_NUM_PASSES_ATI[18];
+    char n_GL_NUM_INSTRUCTIONS_PER_PASS_ATI[33];
+    char n_GL_NUM_INSTRUCTIONS_TOTAL_ATI[30];
+    char n_GL_NUM_INPUT_INTERPOLATOR_COMPONENTS_ATI[41];
+    char n_GL_NUM_LOOPBACK_COMPONENTS_ATI[31];
+    char n_GL_COLOR_ALPHA_PAIRING_ATI[27];
+    char n_GL_SWIZZLE_STR_ATI[19];
+    char n_GL_SWIZZLE_STQ_ATI[19];
+    char n_GL_SWIZZLE_STR_DR_ATI[22];
+    char n_GL_SWIZZLE_STQ_DQ_ATI[22];
+    char n_GL_SWIZZLE_STRQ_ATI[20];
+    char n_GL_SWIZZLE_STRQ_DQ_ATI[23];
+    char n_GL_INTERLACE_OML[17];
+    char n_GL_INTERLACE_READ_OML[22];
+    char n_GL_FORMAT_SUBSAMPLE_24_24_OML[30];
+    char n_GL_FORMAT_SUBSAMPLE_244_244_OML[32];
+    char n_GL_PACK_RESAMPLE_OML[21];
+    char n_GL_UNPACK_RESAMPLE_OML[23];
+    char n_GL_RESAMPLE_REPLICATE_OML[26];
+    char n_GL_RESAMPLE_ZERO_FILL_OML[26];
+    char n_GL_RESAMPLE_AVERAGE_OML[24];
+    char n_GL_RESAMPLE_DECIMATE_OML[25];
+    char n_GL_POINT_SIZE_ARRAY_TYPE_OES[29];
+    char n_GL_POINT_SIZE_ARRAY_STRIDE_OES[31];
+    char n_GL_POINT_SIZE_ARRAY_POINTER_OES[32];
+    char n_GL_VERTEX_ATTRIB_MAP1_APPLE[28];
+    char n_GL_VERTEX_ATTRIB_MAP2_APPLE[28];
+    char n_GL_VERTEX_ATTRIB_MAP1_SIZE_APPLE[33];
+    char n_GL_VERTEX_ATTRIB_MAP1_COEFF_APPLE[34];
+    char n_GL_VERTEX_ATTRIB_MAP1_ORDER_APPLE[34];
+    char n_GL_VERTEX_ATTRIB_MAP1_DOMAIN_APPLE[35];
+    char n_GL_VERTEX_ATTRIB_MAP2_SIZE_APPLE[33];
+    char n_GL_VERTEX_ATTRIB_MAP2_COEFF_APPLE[34];
+    char n_GL_VERTEX_ATTRIB_MAP2_ORDER_APPLE[34];
+    char n_GL_VERTEX_ATTRIB_MAP2_DOMAIN_APPLE[35];
+    char n_GL_DRAW_PIXELS_APPLE[21];
+    char n_GL_FENCE_APPLE[15];
+    char n_GL_ELEMENT_ARRAY_APPLE[23];
+    char n_GL_ELEMENT_ARRAY_TYPE_APPLE[28];
+    char n_GL_ELEMENT_ARRAY_POINTER_APPLE[31];
+    char n_GL_COLOR_FLOAT_APPLE[21];
+    char n_GL_MIN_PBUFFER_VIEWPORT_DIMS_APPLE[35];
+    char n_GL_UNIFORM_BUFFER[18];
+    char n_GL_BUFFER_SERIALIZED_MODIFY_APPLE[34];
+    char n_GL_BUFFER_FLUSHING_UNMAP_APPLE[31];
+    char n_GL_AUX_DEPTH_STENCIL_APPLE[27];
+    char n_GL_PACK_ROW_BYTES_APPLE[24];
+    char n_GL_UNPACK_ROW_BYTES_APPLE[26];
+    char n_GL_RELEASED_APPLE[18];
+    char n_GL_VOLATILE_APPLE[18];
+    char n_GL_RETAINED_APPLE[18];
+    char n_GL_UNDEFINED_APPLE[19];
+    char n_GL_PURGEABLE_APPLE[19];
+    char n_GL_RGB_422_APPLE[17];
+    char n_GL_UNIFORM_BUFFER_BINDING[26];
+    char n_GL_UNIFORM_BUFFER_START[24];
+    char n_GL_UNIFORM_BUFFER_SIZE[23];
+    char n_GL_MAX_VERTEX_UNIFORM_BLOCKS[29];
+    char n_GL_MAX_GEOMETRY_UNIFORM_BLOCKS[31];
+    char n_GL_MAX_FRAGMENT_UNIFORM_BLOCKS[31];
+    char n_GL_MAX_COMBINED_UNIFORM_BLOCKS[31];
+    char n_GL_MAX_UNIFORM_BUFFER_BINDINGS[31];
+    char n_GL_MAX_UNIFORM_BLOCK_SIZE[26];
+    char n_GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS[42];
+    char n_GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS[44];
+    char n_GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS[44];
+    char n_GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT[35];
+    char n_GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH[40];
+    char n_GL_ACTIVE_UNIFORM_BLOCKS[25];
+    char n_GL_UNIFORM_TYPE[16];
+    char n_GL_UNIFORM_SIZE[16];
+    char n_GL_UNIFORM_NAME_LENGTH[23];
+    char n_GL_UNIFORM_BLOCK_INDEX[23];
+    char n_GL_UNIFORM_OFFSET[18];
+    char n_GL_UNIFORM_ARRAY_STRIDE[24];
+    char n_GL_UNIFORM_MATRIX_STRIDE[25];
+    char n_GL_UNIFORM_IS_ROW_MAJOR[24];
+    char n_GL_UNIFORM_BLOCK_BINDING[25];
+    char n_GL_UNIFORM_BLOCK_DATA_SIZE[27];
+    char n_GL_UNIFORM_BLOCK_NAME_LENGTH[29];
+    char n_GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS[33];
+    char n_GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES[40];
+    char n_GL_UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER[45];
+    char n_GL_UNIFORM_BLOCK_REFERENCED_BY_GEOMETRY_SHADER[47];
+    char n_GL_UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER[47];
+    char n_GL_TEXTURE_SRGB_DECODE_EXT[27];
+    char n_GL_DECODE_EXT[14];
+    char n_GL_SKIP_DECODE_EXT[19];
+    char n_GL_PROGRAM_PIPELINE_OBJECT_EXT[31];
+    char n_GL_FRAGMENT_SHADER_DISCARDS_SAMPLES_EXT[40];
+    char n_GL_SYNC_OBJECT_APPLE[21];
+    char n_GL_FRAGMENT_SHADER[19];
+    char n_GL_VERTEX_SHADER[17];
+    char n_GL_PROGRAM_OBJECT_ARB[22];
+    char n_GL_SHADER_OBJECT_ARB[21];
+    char n_GL_MAX_FRAGMENT_UNIFORM_COMPONENTS[35];
+    char n_GL_MAX_VERTEX_UNIFORM_COMPONENTS[33];
+    char n_GL_MAX_VARYING_FLOATS[22];
+    char n_GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS[34];
+    char n_GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS[36];
+    char n_GL_OBJECT_TYPE_ARB[19];
+    char n_GL_SHADER_TYPE[15];
+    char n_GL_FLOAT_VEC2[14];
+    char n_GL_FLOAT_VEC3[14];
+    char n_GL_FLOAT_VEC4[14];
+    char n_GL_INT_VEC2[12];
+    char n_GL_INT_VEC3[12];
+    char n_GL_INT_VEC4[12];
+    char n_GL_BOOL[8];
+    char n_GL_BOOL_VEC2[13];
+    char n_GL_BOOL_VEC3[13];
+    char n_GL_BOOL_VEC4[13];
+    char n_GL_FLOAT_MAT2[14];
+    char n_GL_FLOAT_MAT3[14];
+    char n_GL_FLOAT_MAT4[14];
+    char n_GL_SAMPLER_1D[14];
+    char n_GL_SAMPLER_2D[14];
+    char n_GL_SAMPLER_3D[14];
+    char n_GL_SAMPLER_CUBE[16];
+    char n_GL_SAMPLER_1D_SHADOW[21];
+    char n_GL_SAMPLER_2D_SHADOW[21];
+    char n_GL_SAMPLER_2D_RECT[19];
+    char n_GL_SAMPLER_2D_RECT_SHADOW[26];
+    char n_GL_FLOAT_MAT2x3[16];
+    char n_GL_FLOAT_MAT2x4[16];
+    char n_GL_FLOAT_MAT3x2[16];
+    char n_GL_FLOAT_MAT3x4[16];
+    char n_GL_FLOAT_MAT4x2[16];
+    char n_GL_FLOAT_MAT4x3[16];
+    char n_GL_DELETE_STATUS[17];
+    char n_GL_COMPILE_STATUS[18];
+    char n_GL_LINK_STATUS[15];
+    char n_GL_VALIDATE_STATUS[19];
+    char n_GL_INFO_LOG_LENGTH[19];
+    char n_GL_ATTACHED_SHADERS[20];
+    char n_GL_ACTIVE_UNIFORMS[19];
+    char n_GL_ACTIVE_UNIFORM_MAX_LENGTH[29];
+    char n_GL_SHADER_SOURCE_LENGTH[24];
+    char n_GL_ACTIVE_ATTRIBUTES[21];
+    char n_GL_ACTIVE_ATTRIBUTE_MAX_LENGTH[31];
+    char n_GL_FRAGMENT_SHADER_DERIVATIVE_HINT[35];
+    char n_GL_SHADING_LANGUAGE_VERSION[28];
+    char n_GL_CURRENT_PROGRAM[19];
+    char n_GL_PALETTE4_RGB8_OES[21];
+    char n_GL_PALETTE4_RGBA8_OES[22];
+    char n_GL_PALETTE4_R5_G6_B5_OES[25];
+    char n_GL_PALETTE4_RGBA4_OES[22];
+    char n_GL_PALETTE4_RGB5_A1_OES[24];
+    char n_GL_PALETTE8_RGB8_OES[21];
+    char n_GL_PALETTE8_RGBA8_OES[22];
+    char n_GL_PALETTE8_R5_G6_B5_OES[25];
+    char n_GL_PALETTE8_RGBA4_OES[22];
+    char n_GL_PALETTE8_RGB5_A1_OES[24];
+    char n_GL_IMPLEMENTATION_COLOR_READ_TYPE[34];
+    char n_GL_IMPLEMENTATION_COLOR_READ_FORMAT[36];
+    char n_GL_POINT_SIZE_ARRAY_OES[24];
+    char n_GL_TEXTURE_CROP_RECT_OES[25];
+    char n_GL_MATRIX_INDEX_ARRAY_BUFFER_BINDING_OES[41];
+    char n_GL_POINT_SIZE_ARRAY_BUFFER_BINDING_OES[39];
+    char n_GL_COUNTER_TYPE_AMD[20];
+    char n_GL_COUNTER_RANGE_AMD[21];
+    char n_GL_UNSIGNED_INT64_AMD[22];
+    char n_GL_PERCENTAGE_AMD[18];
+    char n_GL_PERFMON_RESULT_AVAILABLE_AMD[32];
+    char n_GL_PERFMON_RESULT_SIZE_AMD[27];
+    char n_GL_PERFMON_RESULT_AMD[22];
+    char n_GL_TEXTURE_WIDTH_QCOM[22];
+    char n_GL_TEXTURE_HEIGHT_QCOM[23];
+    char n_GL_TEXTURE_DEPTH_QCOM[22];
+    char n_GL_TEXTURE_INTERNAL_FORMAT_QCOM[32];
+    char n_GL_TEXTURE_FORMAT_QCOM[23];
+    char n_GL_TEXTURE_TYPE_QCOM[21];
+    char n_GL_TEXTURE_IMAGE_VALID_QCOM[28];
+    char n_GL_TEXTURE_NUM_LEVELS_QCOM[27];
+    char n_GL_TEXTURE_TARGET_QCOM[23];
+    char n_GL_TEXTURE_OBJECT_VALID_QCOM[29];
+    char n_GL_STATE_RESTORE[17];
+    char n_GL_COMPRESSED_RGB_PVRTC_4BPPV1_IMG[35];
+    char n_GL_COMPRESSED_RGB_PVRTC_2BPPV1_IMG[35];
+    char n_GL_COMPRESSED_RGBA_PVRTC_4BPPV1_IMG[36];
+    char n_GL_COMPRESSED_RGBA_PVRTC_2BPPV1_IMG[36];
+    char n_GL_MODULATE_COLOR_IMG[22];
+    char n_GL_RECIP_ADD_SIGNED_ALPHA_IMG[30];
+    char n_GL_TEXTURE_ALPHA_MODULATE_IMG[30];
+    char n_GL_FACTOR_ALPHA_MODULATE_IMG[29];
+    char n_GL_FRAGMENT_ALPHA_MODULATE_IMG[31];
+    char n_GL_ADD_BLEND_IMG[17];
+    char n_GL_SGX_BINARY_IMG[18];
+    char n_GL_TEXTURE_RED_TYPE[20];
+    char n_GL_TEXTURE_GREEN_TYPE[22];
+    char n_GL_TEXTURE_BLUE_TYPE[21];
+    char n_GL_TEXTURE_ALPHA_TYPE[22];
+    char n_GL_TEXTURE_LUMINANCE_TYPE[26];
+    char n_GL_TEXTURE_INTENSITY_TYPE[26];
+    char n_GL_TEXTURE_DEPTH_TYPE[22];
+    char n_GL_UNSIGNED_NORMALIZED[23];
+    char n_GL_TEXTURE_1D_ARRAY[20];
+    char n_GL_PROXY_TEXTURE_1D_ARRAY[26];
+    char n_GL_TEXTURE_2D_ARRAY[20];
+    char n_GL_PROXY_TEXTURE_2D_ARRAY[26];
+    char n_GL_TEXTURE_BINDING_1D_ARRAY[28];
+    char n_GL_TEXTURE_BINDING_2D_ARRAY[28];
+    char n_GL_GEOMETRY_PROGRAM_NV[23];
+    char n_GL_MAX_PROGRAM_OUTPUT_VERTICES_NV[34];
+    char n_GL_MAX_PROGRAM_TOTAL_OUTPUT_COMPONENTS_NV[42];
+    char n_GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS[36];
+    char n_GL_TEXTURE_BUFFER[18];
+    char n_GL_MAX_TEXTURE_BUFFER_SIZE[27];
+    char n_GL_TEXTURE_BINDING_BUFFER[26];
+    char n_GL_TEXTURE_BUFFER_DATA_STORE_BINDING[37];
+    char n_GL_TEXTURE_BUFFER_FORMAT[25];
+    char n_GL_ANY_SAMPLES_PASSED[22];
+    char n_GL_SAMPLE_SHADING[18];
+    char n_GL_MIN_SAMPLE_SHADING_VALUE[28];
+    char n_GL_R11F_G11F_B10F[18];
+    char n_GL_UNSIGNED_INT_10F_11F_11F_REV[32];
+    char n_GL_RGBA_SIGNED_COMPONENTS_EXT[30];
+    char n_GL_RGB9_E5[11];
+    char n_GL_UNSIGNED_INT_5_9_9_9_REV[28];
+    char n_GL_TEXTURE_SHARED_SIZE[23];
+    char n_GL_SRGB[8];
+    char n_GL_SRGB8[9];
+    char n_GL_SRGB_ALPHA[14];
+    char n_GL_SRGB8_ALPHA8[16];
+    char n_GL_SLUMINANCE_ALPHA[20];
+    char n_GL_SLUMINANCE8_ALPHA8[22];
+    char n_GL_SLUMINANCE[14];
+    char n_GL_SLUMINANCE8[15];
+    char n_GL_COMPRESSED_SRGB[19];
+    char n_GL_COMPRESSED_SRGB_ALPHA[25];
+    char n_GL_COMPRESSED_SLUMINANCE[25];
+    char n_GL_COMPRESSED_SLUMINANCE_ALPHA[31];
+    char n_GL_COMPRESSED_SRGB_S3TC_DXT1_EXT[33];
+    char n_GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT[39];
+    char n_GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT[39];
+    char n_GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT[39];
+    char n_GL_COMPRESSED_LUMINANCE_LATC1_EXT[34];
+    char n_GL_COMPRESSED_SIGNED_LUMINANCE_LATC1_EXT[41];
+    char n_GL_COMPRESSED_LUMINANCE_ALPHA_LATC2_EXT[40];
+    char n_GL_COMPRESSED_SIGNED_LUMINANCE_ALPHA_LATC2_EXT[47];
+    char n_GL_TESS_CONTROL_PROGRAM_PARAMETER_BUFFER_NV[44];
+    char n_GL_TESS_EVALUATION_PROGRAM_PARAMETER_BUFFER_NV[47];
+    char n_GL_TRANSFORM_FEEDBACK_VARYING_MAX_LENGTH[41];
+    char n_GL_BACK_PRIMARY_COLOR_NV[25];
+    char n_GL_BACK_SECONDARY_COLOR_NV[27];
+    char n_GL_TEXTURE_COORD_NV[20];
+    char n_GL_CLIP_DISTANCE_NV[20];
+    char n_GL_VERTEX_ID_NV[16];
+    char n_GL_PRIMITIVE_ID_NV[19];
+    char n_GL_GENERIC_ATTRIB_NV[21];
+    char n_GL_TRANSFORM_FEEDBACK_ATTRIBS_NV[33];
+    char n_GL_TRANSFORM_FEEDBACK_BUFFER_MODE[34];
+    char n_GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS[46];
+    char n_GL_ACTIVE_VARYINGS_NV[22];
+    char n_GL_ACTIVE_VARYING_MAX_LENGTH_NV[32];
+    char n_GL_TRANSFORM_FEEDBACK_VARYINGS[31];
+    char n_GL_TRANSFORM_FEEDBACK_BUFFER_START[35];
+    char n_GL_TRANSFORM_FEEDBACK_BUFFER_SIZE[34];
+    char n_GL_TRANSFORM_FEEDBACK_RECORD_NV[32];
+    char n_GL_PRIMITIVES_GENERATED[24];
+    char n_GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN[41];
+    char n_GL_RASTERIZER_DISCARD[22];
+    char n_GL_MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS[49];
+    char n_GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS[43];
+    char n_GL_INTERLEAVED_ATTRIBS[23];
+    char n_GL_SEPARATE_ATTRIBS[20];
+    char n_GL_TRANSFORM_FEEDBACK_BUFFER[29];
+    char n_GL_TRANSFORM_FEEDBACK_BUFFER_BINDING[37];
+    char n_GL_ATC_RGB_AMD[15];
+    char n_GL_ATC_RGBA_EXPLICIT_ALPHA_AMD[31];
+    char n_GL_POINT_SPRITE_COORD_ORIGIN[29];
+    char n_GL_LOWER_LEFT[14];
+    char n_GL_UPPER_LEFT[14];
+    char n_GL_STENCIL_BACK_REF[20];
+    char n_GL_STENCIL_BACK_VALUE_MASK[27];
+    char n_GL_STENCIL_BACK_WRITEMASK[26];
+    char n_GL_DRAW_FRAMEBUFFER_BINDING[28];
+    char n_GL_RENDERBUFFER_BINDING[24];
+    char n_GL_READ_FRAMEBUFFER[20];
+    char n_GL_DRAW_FRAMEBUFFER[20];
+    char n_GL_READ_FRAMEBUFFER_BINDING[28];
+    char n_GL_RENDERBUFFER_SAMPLES[24];
+    char n_GL_DEPTH_COMPONENT32F[22];
+    char n_GL_DEPTH32F_STENCIL8[21];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE[38];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME[38];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL[40];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE[48];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER[40];
+    char n_GL_FRAMEBUFFER_COMPLETE[24];
+    char n_GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT[37];
+    char n_GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT[45];
+    char n_GL_FRAMEBUFFER_INCOMPLETE_DIMENSIONS_EXT[41];
+    char n_GL_FRAMEBUFFER_INCOMPLETE_FORMATS_EXT[38];
+    char n_GL_FRAMEBUFFER_INCOMPLETE_DRAW_BUFFER[38];
+    char n_GL_FRAMEBUFFER_INCOMPLETE_READ_BUFFER[38];
+    char n_GL_FRAMEBUFFER_UNSUPPORTED[27];
+    char n_GL_MAX_COLOR_ATTACHMENTS[25];
+    char n_GL_COLOR_ATTACHMENT0[21];
+    char n_GL_COLOR_ATTACHMENT1[21];
+    char n_GL_COLOR_ATTACHMENT2[21];
+    char n_GL_COLOR_ATTACHMENT3[21];
+    char n_GL_COLOR_ATTACHMENT4[21];
+    char n_GL_COLOR_ATTACHMENT5[21];
+    char n_GL_COLOR_ATTACHMENT6[21];
+    char n_GL_COLOR_ATTACHMENT7[21];
+    char n_GL_COLOR_ATTACHMENT8[21];
+    char n_GL_COLOR_ATTACHMENT9[21];
+    char n_GL_COLOR_ATTACHMENT10[22];
+    char n_GL_COLOR_ATTACHMENT11[22];
+    char n_GL_COLOR_ATTACHMENT12[22];
+    char n_GL_COLOR_ATTACHMENT13[22];
+    char n_GL_COLOR_ATTACHMENT14[22];
+    char n_GL_COLOR_ATTACHMENT15[22];
+    char n_GL_DEPTH_ATTACHMENT[20];
+    char n_GL_STENCIL_ATTACHMENT[22];
+    char n_GL_FRAMEBUFFER[15];
+    char n_GL_RENDERBUFFER[16];
+    char n_GL_RENDERBUFFER_WIDTH[22];
+    char n_GL_RENDERBUFFER_HEIGHT[23];
+    char n_GL_RENDERBUFFER_INTERNAL_FORMAT[32];
+    char n_GL_STENCIL_INDEX1[18];
+    char n_GL_STENCIL_INDEX4[18];
+    char n_GL_STENCIL_INDEX8[18];
+    char n_GL_STENCIL_INDEX16[19];
+    char n_GL_RENDERBUFFER_RED_SIZE[25];
+    char n_GL_RENDERBUFFER_GREEN_SIZE[27];
+    char n_GL_RENDERBUFFER_BLUE_SIZE[26];
+    char n_GL_RENDERBUFFER_ALPHA_SIZE[27];
+    char n_GL_RENDERBUFFER_DEPTH_SIZE[27];
+    char n_GL_RENDERBUFFER_STENCIL_SIZE[29];
+    char n_GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE[38];
+    char n_GL_MAX_SAMPLES[15];
+    char n_GL_TEXTURE_GEN_STR_OES[23];
+    char n_GL_HALF_FLOAT_OES[18];
+    char n_GL_RGB565[10];
+    char n_GL_ETC1_RGB8_OES[17];
+    char n_GL_TEXTURE_EXTERNAL_OES[24];
+    char n_GL_SAMPLER_EXTERNAL_OES[24];
+    char n_GL_TEXTURE_BINDING_EXTERNAL_OES[32];
+    char n_GL_REQUIRED_TEXTURE_IMAGE_UNITS_OES[36];
+    char n_GL_PRIMITIVE_RESTART_FIXED_INDEX[33];
+    char n_GL_ANY_SAMPLES_PASSED_CONSERVATIVE[35];
+    char n_GL_MAX_ELEMENT_INDEX[21];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SAMPLES_EXT[46];
+    char n_GL_RGBA32UI[12];
+    char n_GL_RGB32UI[11];
+    char n_GL_ALPHA32UI_EXT[17];
+    char n_GL_INTENSITY32UI_EXT[21];
+    char n_GL_LUMINANCE32UI_EXT[21];
+    char n_GL_LUMINANCE_ALPHA32UI_EXT[27];
+    char n_GL_RGBA16UI[12];
+    char n_GL_RGB16UI[11];
+    char n_GL_ALPHA16UI_EXT[17];
+    char n_GL_INTENSITY16UI_EXT[21];
+    char n_GL_LUMINANCE16UI_EXT[21];
+    char n_GL_LUMINANCE_ALPHA16UI_EXT[27];
+    char n_GL_RGBA8UI[11];
+    char n_GL_RGB8UI[10];
+    char n_GL_ALPHA8UI_EXT[16];
+    char n_GL_INTENSITY8UI_EXT[20];
+    char n_GL_LUMINANCE8UI_EXT[20];
+    char n_GL_LUMINANCE_ALPHA8UI_EXT[26];
+    char n_GL_RGBA32I[11];
+    char n_GL_RGB32I[10];
+    char n_GL_ALPHA32I_EXT[16];
+    char n_GL_INTENSITY32I_EXT[20];
+    char n_GL_LUMINANCE32I_EXT[20];
+    char n_GL_LUMINANCE_ALPHA32I_EXT[26];
+    char n_GL_RGBA16I[11];
+    char n_GL_RGB16I[10];
+    char n_GL_ALPHA16I_EXT[16];
+    char n_GL_INTENSITY16I_EXT[20];
+    char n_GL_LUMINANCE16I_EXT[20];
+    char n_GL_LUMINANCE_ALPHA16I_EXT[26];
+    char n_GL_RGBA8I[10];
+    char n_GL_RGB8I[9];
+    char n_GL_ALPHA8I_EXT[15];
+    char n_GL_INTENSITY8I_EXT[19];
+    char n_GL_LUMINANCE8I_EXT[19];
+    char n_GL_LUMINANCE_ALPHA8I_EXT[25];
+    char n_GL_RED_INTEGER[15];
+    char n_GL_GREEN_INTEGER[17];
+    char n_GL_BLUE_INTEGER[16];
+    char n_GL_ALPHA_INTEGER[17];
+    char n_GL_RGB_INTEGER[15];
+    char n_GL_RGBA_INTEGER[16];
+    char n_GL_BGR_INTEGER[15];
+    char n_GL_BGRA_INTEGER[16];
+    char n_GL_LUMINANCE_INTEGER_EXT[25];
+    char n_GL_LUMINANCE_ALPHA_INTEGER_EXT[31];
+    char n_GL_RGBA_INTEGER_MODE_EXT[25];
+    char n_GL_INT_2_10_10_10_REV[22];
+    char n_GL_MAX_PROGRAM_PARAMETER_BUFFER_BINDINGS_NV[44];
+    char n_GL_MAX_PROGRAM_PARAMETER_BUFFER_SIZE_NV[40];
+    char n_GL_VERTEX_PROGRAM_PARAMETER_BUFFER_NV[38];
+    char n_GL_GEOMETRY_PROGRAM_PARAMETER_BUFFER_NV[40];
+    char n_GL_FRAGMENT_PROGRAM_PARAMETER_BUFFER_NV[40];
+    char n_GL_MAX_PROGRAM_GENERIC_ATTRIBS_NV[34];
+    char n_GL_MAX_PROGRAM_GENERIC_RESULTS_NV[34];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_LAYERED[34];
+    char n_GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS[40];
+    char n_GL_FRAMEBUFFER_INCOMPLETE_LAYER_COUNT_ARB[42];
+    char n_GL_DEPTH_COMPONENT32F_NV[25];
+    char n_GL_DEPTH32F_STENCIL8_NV[24];
+    char n_GL_FLOAT_32_UNSIGNED_INT_24_8_REV[34];
+    char n_GL_SHADER_INCLUDE_ARB[22];
+    char n_GL_DEPTH_BUFFER_FLOAT_MODE_NV[30];
+    char n_GL_FRAMEBUFFER_SRGB[20];
+    char n_GL_FRAMEBUFFER_SRGB_CAPABLE_EXT[32];
+    char n_GL_COMPRESSED_RED_RGTC1[24];
+    char n_GL_COMPRESSED_SIGNED_RED_RGTC1[31];
+    char n_GL_COMPRESSED_RG_RGTC2[23];
+    char n_GL_COMPRESSED_SIGNED_RG_RGTC2[30];
+    char n_GL_SAMPLER_1D_ARRAY[20];
+    char n_GL_SAMPLER_2D_ARRAY[20];
+    char n_GL_SAMPLER_BUFFER[18];
+    char n_GL_SAMPLER_1D_ARRAY_SHADOW[27];
+    char n_GL_SAMPLER_2D_ARRAY_SHADOW[27];
+    char n_GL_SAMPLER_CUBE_SHADOW[23];
+    char n_GL_UNSIGNED_INT_VEC2[21];
+    char n_GL_UNSIGNED_INT_VEC3[21];
+    char n_GL_UNSIGNED_INT_VEC4[21];
+    char n_GL_INT_SAMPLER_1D[18];
+    char n_GL_INT_SAMPLER_2D[18];
+    char n_GL_INT_SAMPLER_3D[18];
+    char n_GL_INT_SAMPLER_CUBE[20];
+    char n_GL_INT_SAMPLER_2D_RECT[23];
+    char n_GL_INT_SAMPLER_1D_ARRAY[24];
+    char n_GL_INT_SAMPLER_2D_ARRAY[24];
+    char n_GL_INT_SAMPLER_BUFFER[22];
+    char n_GL_UNSIGNED_INT_SAMPLER_1D[27];
+    char n_GL_UNSIGNED_INT_SAMPLER_2D[27];
+    char n_GL_UNSIGNED_INT_SAMPLER_3D[27];
+    char n_GL_UNSIGNED_INT_SAMPLER_CUBE[29];
+    char n_GL_UNSIGNED_INT_SAMPLER_2D_RECT[32];
+    char n_GL_UNSIGNED_INT_SAMPLER_1D_ARRAY[33];
+    char n_GL_UNSIGNED_INT_SAMPLER_2D_ARRAY[33];
+    char n_GL_UNSIGNED_INT_SAMPLER_BUFFER[31];
+    char n_GL_GEOMETRY_SHADER[19];
+    char n_GL_GEOMETRY_VERTICES_OUT_ARB[29];
+    char n_GL_GEOMETRY_INPUT_TYPE_ARB[27];
+    char n_GL_GEOMETRY_OUTPUT_TYPE_ARB[28];
+    char n_GL_MAX_GEOMETRY_VARYING_COMPONENTS_ARB[39];
+    char n_GL_MAX_VERTEX_VARYING_COMPONENTS_ARB[37];
+    char n_GL_MAX_GEOMETRY_UNIFORM_COMPONENTS[35];
+    char n_GL_MAX_GEOMETRY_OUTPUT_VERTICES[32];
+    char n_GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS[40];
+    char n_GL_MAX_VERTEX_BINDABLE_UNIFORMS_EXT[36];
+    char n_GL_MAX_FRAGMENT_BINDABLE_UNIFORMS_EXT[38];
+    char n_GL_MAX_GEOMETRY_BINDABLE_UNIFORMS_EXT[38];
+    char n_GL_ACTIVE_SUBROUTINES[22];
+    char n_GL_ACTIVE_SUBROUTINE_UNIFORMS[30];
+    char n_GL_MAX_SUBROUTINES[19];
+    char n_GL_MAX_SUBROUTINE_UNIFORM_LOCATIONS[36];
+    char n_GL_NAMED_STRING_LENGTH_ARB[27];
+    char n_GL_NAMED_STRING_TYPE_ARB[25];
+    char n_GL_MAX_BINDABLE_UNIFORM_SIZE_EXT[33];
+    char n_GL_UNIFORM_BUFFER_EXT[22];
+    char n_GL_UNIFORM_BUFFER_BINDING_EXT[30];
+    char n_GL_LOW_FLOAT[13];
+    char n_GL_MEDIUM_FLOAT[16];
+    char n_GL_HIGH_FLOAT[14];
+    char n_GL_LOW_INT[11];
+    char n_GL_MEDIUM_INT[14];
+    char n_GL_HIGH_INT[12];
+    char n_GL_UNSIGNED_INT_10_10_10_2_OES[31];
+    char n_GL_INT_10_10_10_2_OES[22];
+    char n_GL_SHADER_BINARY_FORMATS[25];
+    char n_GL_NUM_SHADER_BINARY_FORMATS[29];
+    char n_GL_SHADER_COMPILER[19];
+    char n_GL_MAX_VERTEX_UNIFORM_VECTORS[30];
+    char n_GL_MAX_VARYING_VECTORS[23];
+    char n_GL_MAX_FRAGMENT_UNIFORM_VECTORS[32];
+    char n_GL_RENDERBUFFER_COLOR_SAMPLES_NV[33];
+    char n_GL_MAX_MULTISAMPLE_COVERAGE_MODES_NV[37];
+    char n_GL_MULTISAMPLE_COVERAGE_MODES_NV[33];
+    char n_GL_QUERY_WAIT[14];
+    char n_GL_QUERY_NO_WAIT[17];
+    char n_GL_QUERY_BY_REGION_WAIT[24];
+    char n_GL_QUERY_BY_REGION_NO_WAIT[27];
+    char n_GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS[48];
+    char n_GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS[51];
+    char n_GL_COLOR_SAMPLES_NV[20];
+    char n_GL_TRANSFORM_FEEDBACK[22];
+    char n_GL_TRANSFORM_FEEDBACK_BUFFER_PAUSED[36];
+    char n_GL_TRANSFORM_FEEDBACK_BUFFER_ACTIVE[36];
+    char n_GL_TRANSFORM_FEEDBACK_BINDING[30];
+    char n_GL_FRAME_NV[12];
+    char n_GL_FIELDS_NV[13];
+    char n_GL_TIMESTAMP[13];
+    char n_GL_NUM_FILL_STREAMS_NV[23];
+    char n_GL_PRESENT_TIME_NV[19];
+    char n_GL_PRESENT_DURATION_NV[23];
+    char n_GL_DEPTH_COMPONENT16_NONLINEAR_NV[34];
+    char n_GL_PROGRAM_MATRIX_EXT[22];
+    char n_GL_TRANSPOSE_PROGRAM_MATRIX_EXT[32];
+    char n_GL_PROGRAM_MATRIX_STACK_DEPTH_EXT[34];
+    char n_GL_TEXTURE_SWIZZLE_R[21];
+    char n_GL_TEXTURE_SWIZZLE_G[21];
+    char n_GL_TEXTURE_SWIZZLE_B[21];
+    char n_GL_TEXTURE_SWIZZLE_A[21];
+    char n_GL_TEXTURE_SWIZZLE_RGBA[24];
+    char n_GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS[39];
+    char n_GL_ACTIVE_SUBROUTINE_MAX_LENGTH[32];
+    char n_GL_ACTIVE_SUBROUTINE_UNIFORM_MAX_LENGTH[40];
+    char n_GL_NUM_COMPATIBLE_SUBROUTINES[30];
+    char n_GL_COMPATIBLE_SUBROUTINES[26];
+    char n_GL_QUADS_FOLLOW_PROVOKING_VERTEX_CONVENTION[44];
+    char n_GL_FIRST_VERTEX_CONVENTION[27];
+    char n_GL_LAST_VERTEX_CONVENTION[26];
+    char n_GL_PROVOKING_VERTEX[20];
+    char n_GL_SAMPLE_POSITION[19];
+    char n_GL_SAMPLE_MASK[15];
+    char n_GL_SAMPLE_MASK_VALUE[21];
+    char n_GL_TEXTURE_BINDING_RENDERBUFFER_NV[35];
+    char n_GL_TEXTURE_RENDERBUFFER_DATA_STORE_BINDING_NV[46];
+    char n_GL_TEXTURE_RENDERBUFFER_NV[27];
+    char n_GL_SAMPLER_RENDERBUFFER_NV[27];
+    char n_GL_INT_SAMPLER_RENDERBUFFER_NV[31];
+    char n_GL_UNSIGNED_INT_SAMPLER_RENDERBUFFER_NV[40];
+    char n_GL_MAX_SAMPLE_MASK_WORDS[25];
+    char n_GL_MAX_GEOMETRY_SHADER_INVOCATIONS[35];
+    char n_GL_MIN_FRAGMENT_INTERPOLATION_OFFSET[37];
+    char n_GL_MAX_FRAGMENT_INTERPOLATION_OFFSET[37];
+    char n_GL_FRAGMENT_INTERPOLATION_OFFSET_BITS[38];
+    char n_GL_MIN_PROGRAM_TEXTURE_GATHER_OFFSET[37];
+    char n_GL_MAX_PROGRAM_TEXTURE_GATHER_OFFSET[37];
+    char n_GL_MAX_TRANSFORM_FEEDBACK_BUFFERS[34];
+    char n_GL_MAX_VERTEX_STREAMS[22];
+    char n_GL_PATCH_VERTICES[18];
+    char n_GL_PATCH_DEFAULT_INNER_LEVEL[29];
+    char n_GL_PATCH_DEFAULT_OUTER_LEVEL[29];
+    char n_GL_TESS_CONTROL_OUTPUT_VERTICES[32];
+    char n_GL_TESS_GEN_MODE[17];
+    char n_GL_TESS_GEN_SPACING[20];
+    char n_GL_TESS_GEN_VERTEX_ORDER[25];
+    char n_GL_TESS_GEN_POINT_MODE[23];
+    char n_GL_ISOLINES[12];
+    char n_GL_FRACTIONAL_ODD[18];
+    char n_GL_FRACTIONAL_EVEN[19];
+    char n_GL_MAX_PATCH_VERTICES[22];
+    char n_GL_MAX_TESS_GEN_LEVEL[22];
+    char n_GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS[39];
+    char n_GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS[42];
+    char n_GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS[40];
+    char n_GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS[43];
+    char n_GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS[38];
+    char n_GL_MAX_TESS_PATCH_COMPONENTS[29];
+    char n_GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS[44];
+    char n_GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS[41];
+    char n_GL_TESS_EVALUATION_SHADER[26];
+    char n_GL_TESS_CONTROL_SHADER[23];
+    char n_GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS[35];
+    char n_GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS[38];
+    char n_GL_COMPRESSED_RGBA_BPTC_UNORM[30];
+    char n_GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM[36];
+    char n_GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT[36];
+    char n_GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT[38];
+    char n_GL_COVERAGE_COMPONENT_NV[25];
+    char n_GL_COVERAGE_COMPONENT4_NV[26];
+    char n_GL_COVERAGE_ATTACHMENT_NV[26];
+    char n_GL_COVERAGE_BUFFERS_NV[23];
+    char n_GL_COVERAGE_ALL_FRAGMENTS_NV[29];
+    char n_GL_COVERAGE_EDGE_FRAGMENTS_NV[30];
+    char n_GL_COVERAGE_AUTOMATIC_NV[25];
+    char n_GL_BUFFER_GPU_ADDRESS_NV[25];
+    char n_GL_VERTEX_ATTRIB_ARRAY_UNIFIED_NV[34];
+    char n_GL_ELEMENT_ARRAY_UNIFIED_NV[28];
+    char n_GL_VERTEX_ATTRIB_ARRAY_ADDRESS_NV[34];
+    char n_GL_VERTEX_ARRAY_ADDRESS_NV[27];
+    char n_GL_NORMAL_ARRAY_ADDRESS_NV[27];
+    char n_GL_COLOR_ARRAY_ADDRESS_NV[26];
+    char n_GL_INDEX_ARRAY_ADDRESS_NV[26];
+    char n_GL_TEXTURE_COORD_ARRAY_ADDRESS_NV[34];
+    char n_GL_EDGE_FLAG_ARRAY_ADDRESS_NV[30];
+    char n_GL_SECONDARY_COLOR_ARRAY_ADDRESS_NV[36];
+    char n_GL_FOG_COORD_ARRAY_ADDRESS_NV[30];
+    char n_GL_ELEMENT_ARRAY_ADDRESS_NV[28];
+    char n_GL_VERTEX_ATTRIB_ARRAY_LENGTH_NV[33];
+    char n_GL_VERTEX_ARRAY_LENGTH_NV[26];
+    char n_GL_NORMAL_ARRAY_LENGTH_NV[26];
+    char n_GL_COLOR_ARRAY_LENGTH_NV[25];
+    char n_GL_INDEX_ARRAY_LENGTH_NV[25];
+    char n_GL_TEXTURE_COORD_ARRAY_LENGTH_NV[33];
+    char n_GL_EDGE_FLAG_ARRAY_LENGTH_NV[29];
+    char n_GL_SECONDARY_COLOR_ARRAY_LENGTH_NV[35];
+    char n_GL_FOG_COORD_ARRAY_LENGTH_NV[29];
+    char n_GL_ELEMENT_ARRAY_LENGTH_NV[27];
+    char n_GL_GPU_ADDRESS_NV[18];
+    char n_GL_MAX_SHADER_BUFFER_ADDRESS_NV[32];
+    char n_GL_COPY_READ_BUFFER[20];
+    char n_GL_COPY_WRITE_BUFFER[21];
+    char n_GL_MAX_IMAGE_UNITS[19];
+    char n_GL_MAX_COMBINED_IMAGE_UNITS_AND_FRAGMENT_OUTPUTS[49];
+    char n_GL_IMAGE_BINDING_NAME[22];
+    char n_GL_IMAGE_BINDING_LEVEL[23];
+    char n_GL_IMAGE_BINDING_LAYERED[25];
+    char n_GL_IMAGE_BINDING_LAYER[23];
+    char n_GL_IMAGE_BINDING_ACCESS[24];
+    char n_GL_DRAW_INDIRECT_BUFFER[24];
+    char n_GL_DRAW_INDIRECT_UNIFIED_NV[28];
+    char n_GL_DRAW_INDIRECT_ADDRESS_NV[28];
+    char n_GL_DRAW_INDIRECT_LENGTH_NV[27];
+    char n_GL_DRAW_INDIRECT_BUFFER_BINDING[32];
+    char n_GL_DOUBLE_MAT2[15];
+    char n_GL_DOUBLE_MAT3[15];
+    char n_GL_DOUBLE_MAT4[15];
+    char n_GL_DOUBLE_MAT2x3[17];
+    char n_GL_DOUBLE_MAT2x4[17];
+    char n_GL_DOUBLE_MAT3x2[17];
+    char n_GL_DOUBLE_MAT3x4[17];
+    char n_GL_DOUBLE_MAT4x2[17];
+    char n_GL_DOUBLE_MAT4x3[17];
+    char n_GL_MALI_SHADER_BINARY_ARM[26];
+    char n_GL_MALI_PROGRAM_BINARY_ARM[27];
+    char n_GL_RED_SNORM[13];
+    char n_GL_RG_SNORM[12];
+    char n_GL_RGB_SNORM[13];
+    char n_GL_RGBA_SNORM[14];
+    char n_GL_R8_SNORM[12];
+    char n_GL_RG8_SNORM[13];
+    char n_GL_RGB8_SNORM[14];
+    char n_GL_RGBA8_SNORM[15];
+    char n_GL_R16_SNORM[13];
+    char n_GL_RG16_SNORM[14];
+    char n_GL_RGB16_SNORM[15];
+    char n_GL_RGBA16_SNORM[16];
+    char n_GL_SIGNED_NORMALIZED[21];
+    char n_GL_PRIMITIVE_RESTART[21];
+    char n_GL_PRIMITIVE_RESTART_INDEX[27];
+    char n_GL_MAX_PROGRAM_TEXTURE_GATHER_COMPONENTS[41];
+    char n_GL_PERFMON_GLOBAL_MODE_QCOM[28];
+    char n_GL_BINNING_CONTROL_HINT_QCOM[29];
+    char n_GL_CPU_OPTIMIZED_QCOM[22];
+    char n_GL_GPU_OPTIMIZED_QCOM[22];
+    char n_GL_RENDER_DIRECT_TO_FRAMEBUFFER_QCOM[37];
+    char n_GL_GPU_DISJOINT_EXT[20];
+    char n_GL_SHADER_BINARY_VIV[21];
+    char n_GL_INT8_NV[11];
+    char n_GL_INT8_VEC2_NV[16];
+    char n_GL_INT8_VEC3_NV[16];
+    char n_GL_INT8_VEC4_NV[16];
+    char n_GL_INT16_NV[12];
+    char n_GL_INT16_VEC2_NV[17];
+    char n_GL_INT16_VEC3_NV[17];
+    char n_GL_INT16_VEC4_NV[17];
+    char n_GL_INT64_VEC2_NV[17];
+    char n_GL_INT64_VEC3_NV[17];
+    char n_GL_INT64_VEC4_NV[17];
+    char n_GL_UNSIGNED_INT8_NV[20];
+    char n_GL_UNSIGNED_INT8_VEC2_NV[25];
+    char n_GL_UNSIGNED_INT8_VEC3_NV[25];
+    char n_GL_UNSIGNED_INT8_VEC4_NV[25];
+    char n_GL_UNSIGNED_INT16_NV[21];
+    char n_GL_UNSIGNED_INT16_VEC2_NV[26];
+    char n_GL_UNSIGNED_INT16_VEC3_NV[26];
+    char n_GL_UNSIGNED_INT16_VEC4_NV[26];
+    char n_GL_UNSIGNED_INT64_VEC2_NV[26];
+    char n_GL_UNSIGNED_INT64_VEC3_NV[26];
+    char n_GL_UNSIGNED_INT64_VEC4_NV[26];
+    char n_GL_FLOAT16_NV[14];
+    char n_GL_FLOAT16_VEC2_NV[19];
+    char n_GL_FLOAT16_VEC3_NV[19];
+    char n_GL_FLOAT16_VEC4_NV[19];
+    char n_GL_DOUBLE_VEC2[15];
+    char n_GL_DOUBLE_VEC3[15];
+    char n_GL_DOUBLE_VEC4[15];
+    char n_GL_SAMPLER_BUFFER_AMD[22];
+    char n_GL_INT_SAMPLER_BUFFER_AMD[26];
+    char n_GL_UNSIGNED_INT_SAMPLER_BUFFER_AMD[35];
+    char n_GL_TESSELLATION_MODE_AMD[25];
+    char n_GL_TESSELLATION_FACTOR_AMD[27];
+    char n_GL_DISCRETE_AMD[16];
+    char n_GL_CONTINUOUS_AMD[18];
+    char n_GL_TEXTURE_CUBE_MAP_ARRAY[26];
+    char n_GL_TEXTURE_BINDING_CUBE_MAP_ARRAY[34];
+    char n_GL_PROXY_TEXTURE_CUBE_MAP_ARRAY[32];
+    char n_GL_SAMPLER_CUBE_MAP_ARRAY[26];
+    char n_GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW[33];
+    char n_GL_INT_SAMPLER_CUBE_MAP_ARRAY[30];
+    char n_GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY[39];
+    char n_GL_ALPHA_SNORM[15];
+    char n_GL_LUMINANCE_SNORM[19];
+    char n_GL_LUMINANCE_ALPHA_SNORM[25];
+    char n_GL_INTENSITY_SNORM[19];
+    char n_GL_ALPHA8_SNORM[16];
+    char n_GL_LUMINANCE8_SNORM[20];
+    char n_GL_LUMINANCE8_ALPHA8_SNORM[27];
+    char n_GL_INTENSITY8_SNORM[20];
+    char n_GL_ALPHA16_SNORM[17];
+    char n_GL_LUMINANCE16_SNORM[21];
+    char n_GL_LUMINANCE16_ALPHA16_SNORM[29];
+    char n_GL_INTENSITY16_SNORM[21];
+    char n_GL_FACTOR_MIN_AMD[18];
+    char n_GL_FACTOR_MAX_AMD[18];
+    char n_GL_DEPTH_CLAMP_NEAR_AMD[24];
+    char n_GL_DEPTH_CLAMP_FAR_AMD[23];
+    char n_GL_VIDEO_BUFFER_NV[19];
+    char n_GL_VIDEO_BUFFER_BINDING_NV[27];
+    char n_GL_FIELD_UPPER_NV[18];
+    char n_GL_FIELD_LOWER_NV[18];
+    char n_GL_NUM_VIDEO_CAPTURE_STREAMS_NV[32];
+    char n_GL_NEXT_VIDEO_CAPTURE_BUFFER_STATUS_NV[39];
+    char n_GL_VIDEO_CAPTURE_TO_422_SUPPORTED_NV[37];
+    char n_GL_LAST_VIDEO_CAPTURE_STATUS_NV[32];
+    char n_GL_VIDEO_BUFFER_PITCH_NV[25];
+    char n_GL_VIDEO_COLOR_CONVERSION_MATRIX_NV[36];
+    char n_GL_VIDEO_COLOR_CONVERSION_MAX_NV[33];
+    char n_GL_VIDEO_COLOR_CONVERSION_MIN_NV[33];
+    char n_GL_VIDEO_COLOR_CONVERSION_OFFSET_NV[36];
+    char n_GL_VIDEO_BUFFER_INTERNAL_FORMAT_NV[35];
+    char n_GL_PARTIAL_SUCCESS_NV[22];
+    char n_GL_SUCCESS_NV[14];
+    char n_GL_FAILURE_NV[14];
+    char n_GL_YCBYCR8_422_NV[18];
+    char n_GL_YCBAYCR8A_4224_NV[21];
+    char n_GL_Z6Y10Z6CB10Z6Y10Z6CR10_422_NV[33];
+    char n_GL_Z6Y10Z6CB10Z6A10Z6Y10Z6CR10Z6A10_4224_NV[44];
+    char n_GL_Z4Y12Z4CB12Z4Y12Z4CR12_422_NV[33];
+    char n_GL_Z4Y12Z4CB12Z4A12Z4Y12Z4CR12Z4A12_4224_NV[44];
+    char n_GL_Z4Y12Z4CB12Z4CR12_444_NV[28];
+    char n_GL_VIDEO_CAPTURE_FRAME_WIDTH_NV[32];
+    char n_GL_VIDEO_CAPTURE_FRAME_HEIGHT_NV[33];
+    char n_GL_VIDEO_CAPTURE_FIELD_UPPER_HEIGHT_NV[39];
+    char n_GL_VIDEO_CAPTURE_FIELD_LOWER_HEIGHT_NV[39];
+    char n_GL_VIDEO_CAPTURE_SURFACE_ORIGIN_NV[35];
+    char n_GL_TEXTURE_COVERAGE_SAMPLES_NV[31];
+    char n_GL_TEXTURE_COLOR_SAMPLES_NV[28];
+    char n_GL_GPU_MEMORY_INFO_DEDICATED_VIDMEM_NVX[40];
+    char n_GL_GPU_MEMORY_INFO_TOTAL_AVAILABLE_MEMORY_NVX[46];
+    char n_GL_GPU_MEMORY_INFO_CURRENT_AVAILABLE_VIDMEM_NVX[48];
+    char n_GL_GPU_MEMORY_INFO_EVICTION_COUNT_NVX[38];
+    char n_GL_GPU_MEMORY_INFO_EVICTED_MEMORY_NVX[38];
+    char n_GL_IMAGE_1D[12];
+    char n_GL_IMAGE_2D[12];
+    char n_GL_IMAGE_3D[12];
+    char n_GL_IMAGE_2D_RECT[17];
+    char n_GL_IMAGE_CUBE[14];
+    char n_GL_IMAGE_BUFFER[16];
+    char n_GL_IMAGE_1D_ARRAY[18];
+    char n_GL_IMAGE_2D_ARRAY[18];
+    char n_GL_IMAGE_CUBE_MAP_ARRAY[24];
+    char n_GL_IMAGE_2D_MULTISAMPLE[24];
+    char n_GL_IMAGE_2D_MULTISAMPLE_ARRAY[30];
+    char n_GL_INT_IMAGE_1D[16];
+    char n_GL_INT_IMAGE_2D[16];
+    char n_GL_INT_IMAGE_3D[16];
+    char n_GL_INT_IMAGE_2D_RECT[21];
+    char n_GL_INT_IMAGE_CUBE[18];
+    char n_GL_INT_IMAGE_BUFFER[20];
+    char n_GL_INT_IMAGE_1D_ARRAY[22];
+    char n_GL_INT_IMAGE_2D_ARRAY[22];
+    char n_GL_INT_IMAGE_CUBE_MAP_ARRAY[28];
+    char n_GL_INT_IMAGE_2D_MULTISAMPLE[28];
+    char n_GL_INT_IMAGE_2D_MULTISAMPLE_ARRAY[34];
+    char n_GL_UNSIGNED_INT_IMAGE_1D[25];
+    char n_GL_UNSIGNED_INT_IMAGE_2D[25];
+    char n_GL_UNSIGNED_INT_IMAGE_3D[25];
+    char n_GL_UNSIGNED_INT_IMAGE_2D_RECT[30];
+    char n_GL_UNSIGNED_INT_IMAGE_CUBE[27];
+    char n_GL_UNSIGNED_INT_IMAGE_BUFFER[29];
+    char n_GL_UNSIGNED_INT_IMAGE_1D_ARRAY[31];
+    char n_GL_UNSIGNED_INT_IMAGE_2D_ARRAY[31];
+    char n_GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY[37];
+    char n_GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE[37];
+    char n_GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE_ARRAY[43];
+    char n_GL_MAX_IMAGE_SAMPLES[21];
+    char n_GL_IMAGE_BINDING_FORMAT[24];
+    char n_GL_RGB10_A2UI[14];
+    char n_GL_PATH_FORMAT_SVG_NV[22];
+    char n_GL_PATH_FORMAT_PS_NV[21];
+    char n_GL_STANDARD_FONT_NAME_NV[25];
+    char n_GL_SYSTEM_FONT_NAME_NV[23];
+    char n_GL_FILE_NAME_NV[16];
+    char n_GL_PATH_STROKE_WIDTH_NV[24];
+    char n_GL_PATH_END_CAPS_NV[20];
+    char n_GL_PATH_INITIAL_END_CAP_NV[27];
+    char n_GL_PATH_TERMINAL_END_CAP_NV[28];
+    char n_GL_PATH_JOIN_STYLE_NV[22];
+    char n_GL_PATH_MITER_LIMIT_NV[23];
+    char n_GL_PATH_DASH_CAPS_NV[21];
+    char n_GL_PATH_INITIAL_DASH_CAP_NV[28];
+    char n_GL_PATH_TERMINAL_DASH_CAP_NV[29];
+    char n_GL_PATH_DASH_OFFSET_NV[23];
+    char n_GL_PATH_CLIENT_LENGTH_NV[25];
+    char n_GL_PATH_FILL_MODE_NV[21];
+    char n_GL_PATH_FILL_MASK_NV[21];
+    char n_GL_PATH_FILL_COVER_MODE_NV[27];
+    char n_GL_PATH_STROKE_COVER_MODE_NV[29];
+    char n_GL_PATH_STROKE_MASK_NV[23];
+    char n_GL_COUNT_UP_NV[15];
+    char n_GL_COUNT_DOWN_NV[17];
+    char n_GL_PATH_OBJECT_BOUNDING_BOX_NV[31];
+    char n_GL_CONVEX_HULL_NV[18];
+    char n_GL_BOUNDING_BOX_NV[19];
+    char n_GL_TRANSLATE_X_NV[18];
+    char n_GL_TRANSLATE_Y_NV[18];
+    char n_GL_TRANSLATE_2D_NV[19];
+    char n_GL_TRANSLATE_3D_NV[19];
+    char n_GL_AFFINE_2D_NV[16];
+    char n_GL_AFFINE_3D_NV[16];
+    char n_GL_TRANSPOSE_AFFINE_2D_NV[26];
+    char n_GL_TRANSPOSE_AFFINE_3D_NV[26];
+    char n_GL_UTF8_NV[11];
+    char n_GL_UTF16_NV[12];
+    char n_GL_BOUNDING_BOX_OF_BOUNDING_BOXES_NV[37];
+    char n_GL_PATH_COMMAND_COUNT_NV[25];
+    char n_GL_PATH_COORD_COUNT_NV[23];
+    char n_GL_PATH_DASH_ARRAY_COUNT_NV[28];
+    char n_GL_PATH_COMPUTED_LENGTH_NV[27];
+    char n_GL_PATH_FILL_BOUNDING_BOX_NV[29];
+    char n_GL_PATH_STROKE_BOUNDING_BOX_NV[31];
+    char n_GL_SQUARE_NV[13];
+    char n_GL_ROUND_NV[12];
+    char n_GL_TRIANGULAR_NV[17];
+    char n_GL_BEVEL_NV[12];
+    char n_GL_MITER_REVERT_NV[19];
+    char n_GL_MITER_TRUNCATE_NV[21];
+    char n_GL_SKIP_MISSING_GLYPH_NV[25];
+    char n_GL_USE_MISSING_GLYPH_NV[24];
+    char n_GL_PATH_ERROR_POSITION_NV[26];
+    char n_GL_PATH_FOG_GEN_MODE_NV[24];
+    char n_GL_ACCUM_ADJACENT_PAIRS_NV[27];
+    char n_GL_ADJACENT_PAIRS_NV[21];
+    char n_GL_FIRST_TO_REST_NV[20];
+    char n_GL_PATH_GEN_MODE_NV[20];
+    char n_GL_PATH_GEN_COEFF_NV[21];
+    char n_GL_PATH_GEN_COLOR_FORMAT_NV[28];
+    char n_GL_PATH_GEN_COMPONENTS_NV[26];
+    char n_GL_PATH_DASH_OFFSET_RESET_NV[29];
+    char n_GL_MOVE_TO_RESETS_NV[21];
+    char n_GL_MOVE_TO_CONTINUES_NV[24];
+    char n_GL_PATH_STENCIL_FUNC_NV[24];
+    char n_GL_PATH_STENCIL_REF_NV[23];
+    char n_GL_PATH_STENCIL_VALUE_MASK_NV[30];
+    char n_GL_SCALED_RESOLVE_FASTEST_EXT[30];
+    char n_GL_SCALED_RESOLVE_NICEST_EXT[29];
+    char n_GL_MIN_MAP_BUFFER_ALIGNMENT[28];
+    char n_GL_PATH_STENCIL_DEPTH_OFFSET_FACTOR_NV[39];
+    char n_GL_PATH_STENCIL_DEPTH_OFFSET_UNITS_NV[38];
+    char n_GL_PATH_COVER_DEPTH_FUNC_NV[28];
+    char n_GL_IMAGE_FORMAT_COMPATIBILITY_TYPE[35];
+    char n_GL_IMAGE_FORMAT_COMPATIBILITY_BY_SIZE[38];
+    char n_GL_IMAGE_FORMAT_COMPATIBILITY_BY_CLASS[39];
+    char n_GL_MAX_VERTEX_IMAGE_UNIFORMS[29];
+    char n_GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS[35];
+    char n_GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS[38];
+    char n_GL_MAX_GEOMETRY_IMAGE_UNIFORMS[31];
+    char n_GL_MAX_FRAGMENT_IMAGE_UNIFORMS[31];
+    char n_GL_MAX_COMBINED_IMAGE_UNIFORMS[31];
+    char n_GL_MAX_DEEP_3D_TEXTURE_WIDTH_HEIGHT_NV[39];
+    char n_GL_MAX_DEEP_3D_TEXTURE_DEPTH_NV[32];
+    char n_GL_SHADER_STORAGE_BUFFER[25];
+    char n_GL_SHADER_STORAGE_BUFFER_BINDING[33];
+    char n_GL_SHADER_STORAGE_BUFFER_START[31];
+    char n_GL_SHADER_STORAGE_BUFFER_SIZE[30];
+    char n_GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS[36];
+    char n_GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS[38];
+    char n_GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS[42];
+    char n_GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS[45];
+    char n_GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS[38];
+    char n_GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS[37];
+    char n_GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS[38];
+    char n_GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS[38];
+    char n_GL_MAX_SHADER_STORAGE_BLOCK_SIZE[33];
+    char n_GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT[42];
+    char n_GL_SYNC_X11_FENCE_EXT[22];
+    char n_GL_DEPTH_STENCIL_TEXTURE_MODE[30];
+    char n_GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS[38];
+    char n_GL_UNIFORM_BLOCK_REFERENCED_BY_COMPUTE_SHADER[46];
+    char n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_COMPUTE_SHADER[54];
+    char n_GL_DISPATCH_INDIRECT_BUFFER[28];
+    char n_GL_DISPATCH_INDIRECT_BUFFER_BINDING[36];
+    char n_GL_COLOR_ATTACHMENT_EXT[24];
+    char n_GL_MULTIVIEW_EXT[17];
+    char n_GL_MAX_MULTIVIEW_BUFFERS_EXT[29];
+    char n_GL_CONTEXT_ROBUST_ACCESS_EXT[29];
+    char n_GL_3DVISION_STEREO_NV[22];
+    char n_GL_STEREO_SEPARATION_NV[24];
+    char n_GL_STEREO_CONVERGENCE_NV[25];
+    char n_GL_STEREO_CUTOFF_NV[20];
+    char n_GL_STEREO_PROJECTION_NV[24];
+    char n_GL_STEREO_PROJECTION_PERSPECTIVE_NV[36];
+    char n_GL_STEREO_PROJECTION_ORTHO_NV[30];
+    char n_GL_COMPUTE_PROGRAM_NV[22];
+    char n_GL_COMPUTE_PROGRAM_PARAMETER_BUFFER_NV[39];
+    char n_GL_TEXTURE_2D_MULTISAMPLE[26];
+    char n_GL_PROXY_TEXTURE_2D_MULTISAMPLE[32];
+    char n_GL_TEXTURE_2D_MULTISAMPLE_ARRAY[32];
+    char n_GL_PROXY_TEXTURE_2D_MULTISAMPLE_ARRAY[38];
+    char n_GL_TEXTURE_BINDING_2D_MULTISAMPLE[34];
+    char n_GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY[40];
+    char n_GL_TEXTURE_SAMPLES[19];
+    char n_GL_TEXTURE_FIXED_SAMPLE_LOCATIONS[34];
+    char n_GL_SAMPLER_2D_MULTISAMPLE[26];
+    char n_GL_INT_SAMPLER_2D_MULTISAMPLE[30];
+    char n_GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE[39];
+    char n_GL_SAMPLER_2D_MULTISAMPLE_ARRAY[32];
+    char n_GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY[36];
+    char n_GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY[45];
+    char n_GL_MAX_COLOR_TEXTURE_SAMPLES[29];
+    char n_GL_MAX_DEPTH_TEXTURE_SAMPLES[29];
+    char n_GL_MAX_INTEGER_SAMPLES[23];
+    char n_GL_MAX_SERVER_WAIT_TIMEOUT[27];
+    char n_GL_OBJECT_TYPE[15];
+    char n_GL_SYNC_CONDITION[18];
+    char n_GL_SYNC_STATUS[15];
+    char n_GL_SYNC_FLAGS[14];
+    char n_GL_SYNC_FENCE[14];
+    char n_GL_SYNC_GPU_COMMANDS_COMPLETE[30];
+    char n_GL_UNSIGNALED[14];
+    char n_GL_SIGNALED[12];
+    char n_GL_ALREADY_SIGNALED[20];
+    char n_GL_TIMEOUT_EXPIRED[19];
+    char n_GL_CONDITION_SATISFIED[23];
+    char n_GL_WAIT_FAILED[15];
+    char n_GL_BUFFER_ACCESS_FLAGS[23];
+    char n_GL_BUFFER_MAP_LENGTH[21];
+    char n_GL_BUFFER_MAP_OFFSET[21];
+    char n_GL_MAX_VERTEX_OUTPUT_COMPONENTS[32];
+    char n_GL_MAX_GEOMETRY_INPUT_COMPONENTS[33];
+    char n_GL_MAX_GEOMETRY_OUTPUT_COMPONENTS[34];
+    char n_GL_MAX_FRAGMENT_INPUT_COMPONENTS[33];
+    char n_GL_CONTEXT_PROFILE_MASK[24];
+    char n_GL_UNPACK_COMPRESSED_BLOCK_WIDTH[33];
+    char n_GL_UNPACK_COMPRESSED_BLOCK_HEIGHT[34];
+    char n_GL_UNPACK_COMPRESSED_BLOCK_DEPTH[33];
+    char n_GL_UNPACK_COMPRESSED_BLOCK_SIZE[32];
+    char n_GL_PACK_COMPRESSED_BLOCK_WIDTH[31];
+    char n_GL_PACK_COMPRESSED_BLOCK_HEIGHT[32];
+    char n_GL_PACK_COMPRESSED_BLOCK_DEPTH[31];
+    char n_GL_PACK_COMPRESSED_BLOCK_SIZE[30];
+    char n_GL_TEXTURE_IMMUTABLE_FORMAT[28];
+    char n_GL_SGX_PROGRAM_BINARY_IMG[26];
+    char n_GL_RENDERBUFFER_SAMPLES_IMG[28];
+    char n_GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_IMG[42];
+    char n_GL_MAX_SAMPLES_IMG[19];
+    char n_GL_TEXTURE_SAMPLES_IMG[23];
+    char n_GL_COMPRESSED_RGBA_PVRTC_2BPPV2_IMG[36];
+    char n_GL_COMPRESSED_RGBA_PVRTC_4BPPV2_IMG[36];
+    char n_GL_MAX_DEBUG_MESSAGE_LENGTH[28];
+    char n_GL_MAX_DEBUG_LOGGED_MESSAGES[29];
+    char n_GL_DEBUG_LOGGED_MESSAGES[25];
+    char n_GL_DEBUG_SEVERITY_HIGH[23];
+    char n_GL_DEBUG_SEVERITY_MEDIUM[25];
+    char n_GL_DEBUG_SEVERITY_LOW[22];
+    char n_GL_DEBUG_CATEGORY_API_ERROR_AMD[32];
+    char n_GL_DEBUG_CATEGORY_WINDOW_SYSTEM_AMD[36];
+    char n_GL_DEBUG_CATEGORY_DEPRECATION_AMD[34];
+    char n_GL_DEBUG_CATEGORY_UNDEFINED_BEHAVIOR_AMD[41];
+    char n_GL_DEBUG_CATEGORY_PERFORMANCE_AMD[34];
+    char n_GL_DEBUG_CATEGORY_SHADER_COMPILER_AMD[38];
+    char n_GL_DEBUG_CATEGORY_APPLICATION_AMD[34];
+    char n_GL_DEBUG_CATEGORY_OTHER_AMD[28];
+    char n_GL_DATA_BUFFER_AMD[19];
+    char n_GL_PERFORMANCE_MONITOR_AMD[27];
+    char n_GL_QUERY_OBJECT_AMD[20];
+    char n_GL_VERTEX_ARRAY_OBJECT_AMD[27];
+    char n_GL_SAMPLER_OBJECT_AMD[22];
+    char n_GL_EXTERNAL_VIRTUAL_MEMORY_BUFFER_AMD[38];
+    char n_GL_QUERY_BUFFER[16];
+    char n_GL_QUERY_BUFFER_BINDING[24];
+    char n_GL_QUERY_RESULT_NO_WAIT[24];
+    char n_GL_VIRTUAL_PAGE_SIZE_X_AMD[27];
+    char n_GL_VIRTUAL_PAGE_SIZE_Y_AMD[27];
+    char n_GL_VIRTUAL_PAGE_SIZE_Z_AMD[27];
+    char n_GL_MAX_SPARSE_TEXTURE_SIZE_AMD[31];
+    char n_GL_MAX_SPARSE_3D_TEXTURE_SIZE_AMD[34];
+    char n_GL_MAX_SPARSE_ARRAY_TEXTURE_LAYERS[35];
+    char n_GL_MIN_SPARSE_LEVEL_AMD[24];
+    char n_GL_MIN_LOD_WARNING_AMD[23];
+    char n_GL_TEXTURE_BUFFER_OFFSET[25];
+    char n_GL_TEXTURE_BUFFER_SIZE[23];
+    char n_GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT[35];
+    char n_GL_VERTEX_ELEMENT_SWIZZLE_AMD[30];
+    char n_GL_VERTEX_ID_SWIZZLE_AMD[25];
+    char n_GL_TEXTURE_SPARSE_ARB[22];
+    char n_GL_VIRTUAL_PAGE_SIZE_INDEX_ARB[31];
+    char n_GL_NUM_VIRTUAL_PAGE_SIZES_ARB[30];
+    char n_GL_SPARSE_TEXTURE_FULL_ARRAY_CUBE_MIPMAPS_ARB[46];
+    char n_GL_NUM_SPARSE_LEVELS_ARB[25];
+    char n_GL_COMPUTE_SHADER[18];
+    char n_GL_MAX_COMPUTE_UNIFORM_BLOCKS[30];
+    char n_GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS[35];
+    char n_GL_MAX_COMPUTE_IMAGE_UNIFORMS[30];
+    char n_GL_MAX_COMPUTE_WORK_GROUP_COUNT[32];
+    char n_GL_MAX_COMPUTE_WORK_GROUP_SIZE[31];
+    char n_GL_SHADER_BINARY_DMP[21];
+    char n_GL_GCCSO_SHADER_BINARY_FJ[26];
+    char n_GL_COMPRESSED_R11_EAC[22];
+    char n_GL_COMPRESSED_SIGNED_R11_EAC[29];
+    char n_GL_COMPRESSED_RG11_EAC[23];
+    char n_GL_COMPRESSED_SIGNED_RG11_EAC[30];
+    char n_GL_COMPRESSED_RGB8_ETC2[24];
+    char n_GL_COMPRESSED_SRGB8_ETC2[25];
+    char n_GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2[44];
+    char n_GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2[45];
+    char n_GL_COMPRESSED_RGBA8_ETC2_EAC[29];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC[36];
+    char n_GL_BLEND_PREMULTIPLIED_SRC_NV[30];
+    char n_GL_BLEND_OVERLAP_NV[20];
+    char n_GL_UNCORRELATED_NV[19];
+    char n_GL_DISJOINT_NV[15];
+    char n_GL_CONJOINT_NV[15];
+    char n_GL_BLEND_ADVANCED_COHERENT_NV[30];
+    char n_GL_SRC_NV[10];
+    char n_GL_DST_NV[10];
+    char n_GL_SRC_OVER_NV[15];
+    char n_GL_DST_OVER_NV[15];
+    char n_GL_SRC_IN_NV[13];
+    char n_GL_DST_IN_NV[13];
+    char n_GL_SRC_OUT_NV[14];
+    char n_GL_DST_OUT_NV[14];
+    char n_GL_SRC_ATOP_NV[15];
+    char n_GL_DST_ATOP_NV[15];
+    char n_GL_PLUS_NV[11];
+    char n_GL_PLUS_DARKER_NV[18];
+    char n_GL_MULTIPLY_NV[15];
+    char n_GL_SCREEN_NV[13];
+    char n_GL_OVERLAY_NV[14];
+    char n_GL_DARKEN_NV[13];
+    char n_GL_LIGHTEN_NV[14];
+    char n_GL_COLORDODGE_NV[17];
+    char n_GL_COLORBURN_NV[16];
+    char n_GL_HARDLIGHT_NV[16];
+    char n_GL_SOFTLIGHT_NV[16];
+    char n_GL_DIFFERENCE_NV[17];
+    char n_GL_MINUS_NV[12];
+    char n_GL_EXCLUSION_NV[16];
+    char n_GL_CONTRAST_NV[15];
+    char n_GL_INVERT_RGB_NV[17];
+    char n_GL_LINEARDODGE_NV[18];
+    char n_GL_LINEARBURN_NV[17];
+    char n_GL_VIVIDLIGHT_NV[17];
+    char n_GL_LINEARLIGHT_NV[18];
+    char n_GL_PINLIGHT_NV[15];
+    char n_GL_HARDMIX_NV[14];
+    char n_GL_HSL_HUE_NV[14];
+    char n_GL_HSL_SATURATION_NV[21];
+    char n_GL_HSL_COLOR_NV[16];
+    char n_GL_HSL_LUMINOSITY_NV[21];
+    char n_GL_PLUS_CLAMPED_NV[19];
+    char n_GL_PLUS_CLAMPED_ALPHA_NV[25];
+    char n_GL_MINUS_CLAMPED_NV[20];
+    char n_GL_INVERT_OVG_NV[17];
+    char n_GL_ATOMIC_COUNTER_BUFFER[25];
+    char n_GL_ATOMIC_COUNTER_BUFFER_BINDING[33];
+    char n_GL_ATOMIC_COUNTER_BUFFER_START[31];
+    char n_GL_ATOMIC_COUNTER_BUFFER_SIZE[30];
+    char n_GL_ATOMIC_COUNTER_BUFFER_DATA_SIZE[35];
+    char n_GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTERS[48];
+    char n_GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTER_INDICES[55];
+    char n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_VERTEX_SHADER[53];
+    char n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_CONTROL_SHADER[59];
+    char n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_EVALUATION_SHADER[62];
+    char n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_GEOMETRY_SHADER[55];
+    char n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_FRAGMENT_SHADER[55];
+    char n_GL_MAX_VERTEX_ATOMIC_COUNTER_BUFFERS[37];
+    char n_GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS[43];
+    char n_GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS[46];
+    char n_GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS[39];
+    char n_GL_MAX_FRAGMENT_ATOMIC_COUNTER_BUFFERS[39];
+    char n_GL_MAX_COMBINED_ATOMIC_COUNTER_BUFFERS[39];
+    char n_GL_MAX_VERTEX_ATOMIC_COUNTERS[30];
+    char n_GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS[36];
+    char n_GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS[39];
+    char n_GL_MAX_GEOMETRY_ATOMIC_COUNTERS[32];
+    char n_GL_MAX_FRAGMENT_ATOMIC_COUNTERS[32];
+    char n_GL_MAX_COMBINED_ATOMIC_COUNTERS[32];
+    char n_GL_MAX_ATOMIC_COUNTER_BUFFER_SIZE[34];
+    char n_GL_ACTIVE_ATOMIC_COUNTER_BUFFERS[33];
+    char n_GL_UNIFORM_ATOMIC_COUNTER_BUFFER_INDEX[39];
+    char n_GL_UNSIGNED_INT_ATOMIC_COUNTER[31];
+    char n_GL_MAX_ATOMIC_COUNTER_BUFFER_BINDINGS[38];
+    char n_GL_DEBUG_OUTPUT[16];
+    char n_GL_UNIFORM[11];
+    char n_GL_UNIFORM_BLOCK[17];
+    char n_GL_PROGRAM_INPUT[17];
+    char n_GL_PROGRAM_OUTPUT[18];
+    char n_GL_BUFFER_VARIABLE[19];
+    char n_GL_SHADER_STORAGE_BLOCK[24];
+    char n_GL_IS_PER_PATCH[16];
+    char n_GL_VERTEX_SUBROUTINE[21];
+    char n_GL_TESS_CONTROL_SUBROUTINE[27];
+    char n_GL_TESS_EVALUATION_SUBROUTINE[30];
+    char n_GL_GEOMETRY_SUBROUTINE[23];
+    char n_GL_FRAGMENT_SUBROUTINE[23];
+    char n_GL_COMPUTE_SUBROUTINE[22];
+    char n_GL_VERTEX_SUBROUTINE_UNIFORM[29];
+    char n_GL_TESS_CONTROL_SUBROUTINE_UNIFORM[35];
+    char n_GL_TESS_EVALUATION_SUBROUTINE_UNIFORM[38];
+    char n_GL_GEOMETRY_SUBROUTINE_UNIFORM[31];
+    char n_GL_FRAGMENT_SUBROUTINE_UNIFORM[31];
+    char n_GL_COMPUTE_SUBROUTINE_UNIFORM[30];
+    char n_GL_TRANSFORM_FEEDBACK_VARYING[30];
+    char n_GL_ACTIVE_RESOURCES[20];
+    char n_GL_MAX_NAME_LENGTH[19];
+    char n_GL_MAX_NUM_ACTIVE_VARIABLES[28];
+    char n_GL_MAX_NUM_COMPATIBLE_SUBROUTINES[34];
+    char n_GL_NAME_LENGTH[15];
+    char n_GL_TYPE[8];
+    char n_GL_ARRAY_SIZE[14];
+    char n_GL_OFFSET[10];
+    char n_GL_BLOCK_INDEX[15];
+    char n_GL_ARRAY_STRIDE[16];
+    char n_GL_MATRIX_STRIDE[17];
+    char n_GL_IS_ROW_MAJOR[16];
+    char n_GL_ATOMIC_COUNTER_BUFFER_INDEX[31];
+    char n_GL_BUFFER_BINDING[18];
+    char n_GL_BUFFER_DATA_SIZE[20];
+    char n_GL_NUM_ACTIVE_VARIABLES[24];
+    char n_GL_ACTIVE_VARIABLES[20];
+    char n_GL_REFERENCED_BY_VERTEX_SHADER[31];
+    char n_GL_REFERENCED_BY_TESS_CONTROL_SHADER[37];
+    char n_GL_REFERENCED_BY_TESS_EVALUATION_SHADER[40];
+    char n_GL_REFERENCED_BY_GEOMETRY_SHADER[33];
+    char n_GL_REFERENCED_BY_FRAGMENT_SHADER[33];
+    char n_GL_REFERENCED_BY_COMPUTE_SHADER[32];
+    char n_GL_TOP_LEVEL_ARRAY_SIZE[24];
+    char n_GL_TOP_LEVEL_ARRAY_STRIDE[26];
+    char n_GL_LOCATION[12];
+    char n_GL_LOCATION_INDEX[18];
+    char n_GL_FRAMEBUFFER_DEFAULT_WIDTH[29];
+    char n_GL_FRAMEBUFFER_DEFAULT_HEIGHT[30];
+    char n_GL_FRAMEBUFFER_DEFAULT_LAYERS[30];
+    char n_GL_FRAMEBUFFER_DEFAULT_SAMPLES[31];
+    char n_GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS[46];
+    char n_GL_MAX_FRAMEBUFFER_WIDTH[25];
+    char n_GL_MAX_FRAMEBUFFER_HEIGHT[26];
+    char n_GL_MAX_FRAMEBUFFER_LAYERS[26];
+    char n_GL_MAX_FRAMEBUFFER_SAMPLES[27];
+    char n_GL_LOG_ERROR_REGAL[19];
+    char n_GL_LOG_WARNING_REGAL[21];
+    char n_GL_LOG_INFO_REGAL[18];
+    char n_GL_LOG_APP_REGAL[17];
+    char n_GL_LOG_DRIVER_REGAL[20];
+    char n_GL_LOG_INTERNAL_REGAL[22];
+    char n_GL_LOG_DEBUG_REGAL[19];
+    char n_GL_LOG_STATUS_REGAL[20];
+    char n_GL_LOG_HTTP_REGAL[18];
+    char n_GL_ERROR_REGAL[15];
+    char n_GL_DEBUG_REGAL[15];
+    char n_GL_LOG_REGAL[13];
+    char n_GL_EMULATION_REGAL[19];
+    char n_GL_DRIVER_REGAL[16];
+    char n_GL_MAX_COMPUTE_VARIABLE_GROUP_INVOCATIONS_ARB[46];
+    char n_GL_MAX_COMPUTE_VARIABLE_GROUP_SIZE_ARB[39];
+    char n_GL_LOCATION_COMPONENT[22];
+    char n_GL_TRANSFORM_FEEDBACK_BUFFER_INDEX[35];
+    char n_GL_TRANSFORM_FEEDBACK_BUFFER_STRIDE[36];
+    char n_GL_MISSING_REGAL[17];
+    char n_GL_TRACE_REGAL[15];
+    char n_GL_CACHE_REGAL[15];
+    char n_GL_CODE_REGAL[14];
+    char n_GL_STATISTICS_REGAL[20];
+    char n_GL_CLEAR_TEXTURE[17];
+    char n_GL_NUM_SAMPLE_COUNTS[21];
+    char n_GL_TRANSLATED_SHADER_SOURCE_LENGTH_ANGLE[41];
+    char n_GL_BGRA8_EXT[13];
+    char n_GL_TEXTURE_USAGE_ANGLE[23];
+    char n_GL_FRAMEBUFFER_ATTACHMENT_ANGLE[32];
+    char n_GL_PACK_REVERSE_ROW_ORDER_ANGLE[32];
+    char n_GL_PROGRAM_BINARY_ANGLE[24];
+    char n_GL_COMPRESSED_RGBA_ASTC_4x4_KHR[32];
+    char n_GL_COMPRESSED_RGBA_ASTC_5x4_KHR[32];
+    char n_GL_COMPRESSED_RGBA_ASTC_5x5_KHR[32];
+    char n_GL_COMPRESSED_RGBA_ASTC_6x5_KHR[32];
+    char n_GL_COMPRESSED_RGBA_ASTC_6x6_KHR[32];
+    char n_GL_COMPRESSED_RGBA_ASTC_8x5_KHR[32];
+    char n_GL_COMPRESSED_RGBA_ASTC_8x6_KHR[32];
+    char n_GL_COMPRESSED_RGBA_ASTC_8x8_KHR[32];
+    char n_GL_COMPRESSED_RGBA_ASTC_10x5_KHR[33];
+    char n_GL_COMPRESSED_RGBA_ASTC_10x6_KHR[33];
+    char n_GL_COMPRESSED_RGBA_ASTC_10x8_KHR[33];
+    char n_GL_COMPRESSED_RGBA_ASTC_10x10_KHR[34];
+    char n_GL_COMPRESSED_RGBA_ASTC_12x10_KHR[34];
+    char n_GL_COMPRESSED_RGBA_ASTC_12x12_KHR[34];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4_KHR[40];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4_KHR[40];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5_KHR[40];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5_KHR[40];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6_KHR[40];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5_KHR[40];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6_KHR[40];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8_KHR[40];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5_KHR[41];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6_KHR[41];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8_KHR[41];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10_KHR[42];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10_KHR[42];
+    char n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12_KHR[42];
+    char n_GL_STENCIL_BUFFER_BIT0_QCOM[28];
+    char n_GL_RASTER_POSITION_UNCLIPPED_IBM[33];
+    char n_GL_CULL_VERTEX_IBM[19];
+    char n_GL_ALL_STATIC_DATA_IBM[23];
+    char n_GL_STATIC_VERTEX_ARRAY_IBM[27];
+    char n_GL_VERTEX_ARRAY_LIST_IBM[25];
+    char n_GL_NORMAL_ARRAY_LIST_IBM[25];
+    char n_GL_COLOR_ARRAY_LIST_IBM[24];
+    char n_GL_INDEX_ARRAY_LIST_IBM[24];
+    char n_GL_TEXTURE_COORD_ARRAY_LIST_IBM[32];
+    char n_GL_EDGE_FLAG_ARRAY_LIST_IBM[28];
+    char n_GL_FOG_COORDINATE_ARRAY_LIST_IBM[33];
+    char n_GL_SECONDARY_COLOR_ARRAY_LIST_IBM[34];
+    char n_GL_VERTEX_ARRAY_LIST_STRIDE_IBM[32];
+    char n_GL_NORMAL_ARRAY_LIST_STRIDE_IBM[32];
+    char n_GL_COLOR_ARRAY_LIST_STRIDE_IBM[31];
+    char n_GL_INDEX_ARRAY_LIST_STRIDE_IBM[31];
+    char n_GL_TEXTURE_COORD_ARRAY_LIST_STRIDE_IBM[39];
+    char n_GL_EDGE_FLAG_ARRAY_LIST_STRIDE_IBM[35];
+    char n_GL_FOG_COORDINATE_ARRAY_LIST_STRIDE_IBM[40];
+    char n_GL_SECONDARY_COLOR_ARRAY_LIST_STRIDE_IBM[41];
+    char n_GL_PREFER_DOUBLEBUFFER_HINT_PGI[32];
+    char n_GL_CONSERVE_MEMORY_HINT_PGI[28];
+    char n_GL_RECLAIM_MEMORY_HINT_PGI[27];
+    char n_GL_NATIVE_GRAPHICS_HANDLE_PGI[30];
+    char n_GL_NATIVE_GRAPHICS_BEGIN_HINT_PGI[34];
+    char n_GL_NATIVE_GRAPHICS_END_HINT_PGI[32];
+    char n_GL_ALWAYS_FAST_HINT_PGI[24];
+    char n_GL_ALWAYS_SOFT_HINT_PGI[24];
+    char n_GL_ALLOW_DRAW_OBJ_HINT_PGI[27];
+    char n_GL_ALLOW_DRAW_WIN_HINT_PGI[27];
+    char n_GL_ALLOW_DRAW_FRG_HINT_PGI[27];
+    char n_GL_ALLOW_DRAW_MEM_HINT_PGI[27];
+    char n_GL_STRICT_DEPTHFUNC_HINT_PGI[29];
+    char n_GL_STRICT_LIGHTING_HINT_PGI[28];
+    char n_GL_STRICT_SCISSOR_HINT_PGI[27];
+    char n_GL_FULL_STIPPLE_HINT_PGI[25];
+    char n_GL_CLIP_NEAR_HINT_PGI[22];
+    char n_GL_CLIP_FAR_HINT_PGI[21];
+    char n_GL_WIDE_LINE_HINT_PGI[22];
+    char n_GL_BACK_NORMALS_HINT_PGI[25];
+    char n_GL_VERTEX_DATA_HINT_PGI[24];
+    char n_GL_VERTEX_CONSISTENT_HINT_PGI[30];
+    char n_GL_MATERIAL_SIDE_HINT_PGI[26];
+    char n_GL_MAX_VERTEX_HINT_PGI[23];
+    char n_GL_STENCIL_BUFFER_BIT1_QCOM[28];
+    char n_GL_STENCIL_BUFFER_BIT2_QCOM[28];
+    char n_GL_STENCIL_BUFFER_BIT3_QCOM[28];
+    char n_GL_ALL_ATTRIB_BITS[19];
+    char n_GL_STENCIL_BUFFER_BIT4_QCOM[28];
+    char n_GL_STENCIL_BUFFER_BIT5_QCOM[28];
+    char n_GL_STENCIL_BUFFER_BIT6_QCOM[28];
+    char n_GL_STENCIL_BUFFER_BIT7_QCOM[28];
+    char n_GL_MULTISAMPLE_BUFFER_BIT0_QCOM[32];
+    char n_GL_MULTISAMPLE_BUFFER_BIT1_QCOM[32];
+    char n_GL_MULTISAMPLE_BUFFER_BIT2_QCOM[32];
+    char n_GL_MULTISAMPLE_BUFFER_BIT3_QCOM[32];
+    char n_GL_MULTISAMPLE_BUFFER_BIT4_QCOM[32];
+    char n_GL_MULTISAMPLE_BIT_3DFX[24];
+    char n_GL_MULTISAMPLE_BUFFER_BIT6_QCOM[32];
+    char n_GL_MULTISAMPLE_BUFFER_BIT7_QCOM[32];
+    char n_GL_INVALID_INDEX[17];
+  };
+
+  const GLEnumPool glEnumPool = {
+    "GL_ZERO",
+    "GL_ONE",
+    "GL_LINE_LOOP",
+    "GL_LINE_STRIP",
+    "GL_TRIANGLES",
+    "GL_TRIANGLE_STRIP",
+    "GL_TRIANGLE_FAN",
+    "GL_QUADS",
+    "GL_QUAD_STRIP",
+    "GL_POLYGON",
+    "GL_LINES_ADJACENCY",
+    "GL_LINE_STRIP_ADJACENCY",
+    "GL_TRIANGLES_ADJACENCY",
+    "GL_TRIANGLE_STRIP_ADJACENCY",
+    "GL_PATCHES",
+    "GL_RELATIVE_SMOOTH_QUADRATIC_CURVE_TO_NV",
+    "GL_SMOOTH_CUBIC_CURVE_TO_NV",
+    "GL_RELATIVE_SMOOTH_CUBIC_CURVE_TO_NV",
+    "GL_SMALL_CCW_ARC_TO_NV",
+    "GL_RELATIVE_SMALL_CCW_ARC_TO_NV",
+    "GL_SMALL_CW_ARC_TO_NV",
+    "GL_RELATIVE_SMALL_CW_ARC_TO_NV",
+    "GL_LARGE_CCW_ARC_TO_NV",
+    "GL_RELATIVE_LARGE_CCW_ARC_TO_NV",
+    "GL_LARGE_CW_ARC_TO_NV",
+    "GL_RELATIVE_LARGE_CW_ARC_TO_NV",
+    "GL_EIGHTH_BIT_ATI",
+    "GL_SATURATE_BIT_ATI",
+    "GL_COLOR_BUFFER_BIT7_QCOM",
+    "GL_RESTART_PATH_NV",
+    "GL_DUP_FIRST_CUBIC_CURVE_TO_NV",
+    "GL_DUP_LAST_CUBIC_CURVE_TO_NV",
+    "GL_RECT_NV",
+    "GL_CIRCULAR_CCW_ARC_TO_NV",
+    "GL_CIRCULAR_CW_ARC_TO_NV",
+    "GL_CIRCULAR_TANGENT_ARC_TO_NV",
+    "GL_ARC_TO_NV",
+    "GL_RELATIVE_ARC_TO_NV",
+    "GL_ACCUM",
+    "GL_LOAD",
+    "GL_RETURN",
+    "GL_MULT",
+    "GL_ADD",
+    "GL_NEVER",
+    "GL_LESS",
+    "GL_EQUAL",
+    "GL_LEQUAL",
+    "GL_GREATER",
+    "GL_NOTEQUAL",
+    "GL_GEQUAL",
+    "GL_ALWAYS",
+    "GL_SRC_COLOR",
+    "GL_ONE_MINUS_SRC_COLOR",
+    "GL_SRC_ALPHA",
+    "GL_ONE_MINUS_SRC_ALPHA",
+    "GL_DST_ALPHA",
+    "GL_ONE_MINUS_DST_ALPHA",
+    "GL_DST_COLOR",
+    "GL_ONE_MINUS_DST_COLOR",
+    "GL_SRC_ALPHA_SATURATE",
+    "GL_FRONT_LEFT",
+    "GL_FRONT_RIGHT",
+    "GL_BACK_LEFT",
+    "GL_BACK_RIGHT",
+    "GL_FRONT",
+    "GL_BACK",
+    "GL_LEFT",
+    "GL_RIGHT",
+    "GL_FRONT_AND_BACK",
+    "GL_AUX0",
+    "GL_AUX1",
+    "GL_AUX2",
+    "GL_AUX3",
+    "GL_INVALID_ENUM",
+    "GL_INVALID_VALUE",
+    "GL_INVALID_OPERATION",
+    "GL_STACK_OVERFLOW",
+    "GL_STACK_UNDERFLOW",
+    "GL_OUT_OF_MEMORY",
+    "GL_INVALID_FRAMEBUFFER_OPERATION",
+    "GL_2D",
+    "GL_3D",
+    "GL_3D_COLOR",
+    "GL_3D_COLOR_TEXTURE",
+    "GL_4D_COLOR_TEXTURE",
+    "GL_PASS_THROUGH_TOKEN",
+    "GL_POINT_TOKEN",
+    "GL_LINE_TOKEN",
+    "GL_POLYGON_TOKEN",
+    "GL_BITMAP_TOKEN",
+    "GL_DRAW_PIXEL_TOKEN",
+    "GL_COPY_PIXEL_TOKEN",
+    "GL_LINE_RESET_TOKEN",
+    "GL_EXP",
+    "GL_EXP2",
+    "GL_MODELVIEW_MATRIX_FLOAT_AS_INT_BITS_OES",
+    "GL_CW",
+    "GL_CCW",
+    "GL_COEFF",
+    "GL_ORDER",
+    "GL_DOMAIN",
+    "GL_CURRENT_COLOR",
+    "GL_CURRENT_INDEX",
+    "GL_CURRENT_NORMAL",
+    "GL_CURRENT_TEXTURE_COORDS",
+    "GL_CURRENT_RASTER_COLOR",
+    "GL_CURRENT_RASTER_INDEX",
+    "GL_CURRENT_RASTER_TEXTURE_COORDS",
+    "GL_CURRENT_RASTER_POSITION",
+    "GL_CURRENT_RASTER_POSITION_VALID",
+    "GL_CURRENT_RASTER_DISTANCE",
+    "GL_POINT_SMOOTH",
+    "GL_POINT_SIZE",
+    "GL_POINT_SIZE_RANGE",
+    "GL_POINT_SIZE_GRANULARITY",
+    "GL_LINE_SMOOTH",
+    "GL_LINE_WIDTH",
+    "GL_LINE_WIDTH_RANGE",
+    "GL_LINE_WIDTH_GRANULARITY",
+    "GL_LINE_STIPPLE",
+    "GL_LINE_STIPPLE_PATTERN",
+    "GL_LINE_STIPPLE_REPEAT",
+    "GL_LIST_MODE",
+    "GL_MAX_LIST_NESTING",
+    "GL_LIST_BASE",
+    "GL_LIST_INDEX",
+    "GL_POLYGON_MODE",
+    "GL_POLYGON_SMOOTH",
+    "GL_POLYGON_STIPPLE",
+    "GL_EDGE_FLAG",
+    "GL_CULL_FACE",
+    "GL_CULL_FACE_MODE",
+    "GL_FRONT_FACE",
+    "GL_LIGHTING",
+    "GL_LIGHT_MODEL_LOCAL_VIEWER",
+    "GL_LIGHT_MODEL_TWO_SIDE",
+    "GL_LIGHT_MODEL_AMBIENT",
+    "GL_SHADE_MODEL",
+    "GL_COLOR_MATERIAL_FACE",
+    "GL_COLOR_MATERIAL_PARAMETER",
+    "GL_COLOR_MATERIAL",
+    "GL_FOG",
+    "GL_FOG_INDEX",
+    "GL_FOG_DENSITY",
+    "GL_FOG_START",
+    "GL_FOG_END",
+    "GL_FOG_MODE",
+    "GL_FOG_COLOR",
+    "GL_DEPTH_RANGE",
+    "GL_DEPTH_TEST",
+    "GL_DEPTH_WRITEMASK",
+    "GL_DEPTH_CLEAR_VALUE",
+    "GL_DEPTH_FUNC",
+    "GL_ACCUM_CLEAR_VALUE",
+    "GL_STENCIL_TEST",
+    "GL_STENCIL_CLEAR_VALUE",
+    "GL_STENCIL_FUNC",
+    "GL_STENCIL_VALUE_MASK",
+    "GL_STENCIL_FAIL",
+    "GL_STENCIL_PASS_DEPTH_FAIL",
+    "GL_STENCIL_PASS_DEPTH_PASS",
+    "GL_STENCIL_REF",
+    "GL_STENCIL_WRITEMASK",
+    "GL_MATRIX_MODE",
+    "GL_NORMALIZE",
+    "GL_VIEWPORT",
+    "GL_MODELVIEW_STACK_DEPTH",
+    "GL_PROJECTION_STACK_DEPTH",
+    "GL_TEXTURE_STACK_DEPTH",
+    "GL_MODELVIEW_MATRIX",
+    "GL_PROJECTION_MATRIX",
+    "GL_TEXTURE_MATRIX",
+    "GL_ATTRIB_STACK_DEPTH",
+    "GL_CLIENT_ATTRIB_STACK_DEPTH",
+    "GL_ALPHA_TEST",
+    "GL_ALPHA_TEST_FUNC",
+    "GL_ALPHA_TEST_REF",
+    "GL_DITHER",
+    "GL_BLEND_DST",
+    "GL_BLEND_SRC",
+    "GL_BLEND",
+    "GL_LOGIC_OP_MODE",
+    "GL_INDEX_LOGIC_OP",
+    "GL_COLOR_LOGIC_OP",
+    "GL_AUX_BUFFERS",
+    "GL_DRAW_BUFFER",
+    "GL_READ_BUFFER",
+    "GL_SCISSOR_BOX",
+    "GL_SCISSOR_TEST",
+    "GL_INDEX_CLEAR_VALUE",
+    "GL_INDEX_WRITEMASK",
+    "GL_COLOR_CLEAR_VALUE",
+    "GL_COLOR_WRITEMASK",
+    "GL_INDEX_MODE",
+    "GL_RGBA_MODE",
+    "GL_DOUBLEBUFFER",
+    "GL_STEREO",
+    "GL_RENDER_MODE",
+    "GL_PERSPECTIVE_CORRECTION_HINT",
+    "GL_POINT_SMOOTH_HINT",
+    "GL_LINE_SMOOTH_HINT",
+    "GL_POLYGON_SMOOTH_HINT",
+    "GL_FOG_HINT",
+    "GL_TEXTURE_GEN_S",
+    "GL_TEXTURE_GEN_T",
+    "GL_TEXTURE_GEN_R",
+    "GL_TEXTURE_GEN_Q",
+    "GL_PIXEL_MAP_I_TO_I",
+    "GL_PIXEL_MAP_S_TO_S",
+    "GL_PIXEL_MAP_I_TO_R",
+    "GL_PIXEL_MAP_I_TO_G",
+    "GL_PIXEL_MAP_I_TO_B",
+    "GL_PIXEL_MAP_I_TO_A",
+    "GL_PIXEL_MAP_R_TO_R",
+    "GL_PIXEL_MAP_G_TO_G",
+    "GL_PIXEL_MAP_B_TO_B",
+    "GL_PIXEL_MAP_A_TO_A",
+    "GL_PIXEL_MAP_I_TO_I_SIZE",
+    "GL_PIXEL_MAP_S_TO_S_SIZE",
+    "GL_PIXEL_MAP_I_TO_R_SIZE",
+    "GL_PIXEL_MAP_I_TO_G_SIZE",
+    "GL_PIXEL_MAP_I_TO_B_SIZE",
+    "GL_PIXEL_MAP_I_TO_A_SIZE",
+    "GL_PIXEL_MAP_R_TO_R_SIZE",
+    "GL_PIXEL_MAP_G_TO_G_SIZE",
+    "GL_PIXEL_MAP_B_TO_B_SIZE",
+    "GL_PIXEL_MAP_A_TO_A_SIZE",
+    "GL_UNPACK_SWAP_BYTES",
+    "GL_UNPACK_LSB_FIRST",
+    "GL_UNPACK_ROW_LENGTH",
+    "GL_UNPACK_SKIP_ROWS",
+    "GL_UNPACK_SKIP_PIXELS",
+    "GL_UNPACK_ALIGNMENT",
+    "GL_PACK_SWAP_BYTES",
+    "GL_PACK_LSB_FIRST",
+    "GL_PACK_ROW_LENGTH",
+    "GL_PACK_SKIP_ROWS",
+    "GL_PACK_SKIP_PIXELS",
+    "GL_PACK_ALIGNMENT",
+    "GL_MAP_COLOR",
+    "GL_MAP_STENCIL",
+    "GL_INDEX_SHIFT",
+    "GL_INDEX_OFFSET",
+    "GL_RED_SCALE",
+    "GL_RED_BIAS",
+    "GL_ZOOM_X",
+    "GL_ZOOM_Y",
+    "GL_GREEN_SCALE",
+    "GL_GREEN_BIAS",
+    "GL_BLUE_SCALE",
+    "GL_BLUE_BIAS",
+    "GL_ALPHA_SCALE",
+    "GL_ALPHA_BIAS",
+    "GL_DEPTH_SCALE",
+    "GL_DEPTH_BIAS",
+    "GL_MAX_EVAL_ORDER",
+    "GL_MAX_LIGHTS",
+    "GL_MAX_CLIP_PLANES",
+    "GL_MAX_TEXTURE_SIZE",
+    "GL_MAX_PIXEL_MAP_TABLE",
+    "GL_MAX_ATTRIB_STACK_DEPTH",
+    "GL_MAX_MODELVIEW_STACK_DEPTH",
+    "GL_MAX_NAME_STACK_DEPTH",
+    "GL_MAX_PROJECTION_STACK_DEPTH",
+    "GL_MAX_TEXTURE_STACK_DEPTH",
+    "GL_MAX_VIEWPORT_DIMS",
+    "GL_MAX_CLIENT_ATTRIB_STACK_DEPTH",
+    "GL_SUBPIXEL_BITS",
+    "GL_INDEX_BITS",
+    "GL_RED_BITS",
+    "GL_GREEN_BITS",
+    "GL_BLUE_BITS",
+    "GL_ALPHA_BITS",
+    "GL_DEPTH_BITS",
+    "GL_STENCIL_BITS",
+    "GL_ACCUM_RED_BITS",
+    "GL_ACCUM_GREEN_BITS",
+    "GL_ACCUM_BLUE_BITS",
+    "GL_ACCUM_ALPHA_BITS",
+    "GL_NAME_STACK_DEPTH",
+    "GL_AUTO_NORMAL",
+    "GL_MAP1_COLOR_4",
+    "GL_MAP1_INDEX",
+    "GL_MAP1_NORMAL",
+    "GL_MAP1_TEXTURE_COORD_1",
+    "GL_MAP1_TEXTURE_COORD_2",
+    "GL_MAP1_TEXTURE_COORD_3",
+    "GL_MAP1_TEXTURE_COORD_4",
+    "GL_MAP1_VERTEX_3",
+    "GL_MAP1_VERTEX_4",
+    "GL_MAP2_COLOR_4",
+    "GL_MAP2_INDEX",
+    "GL_MAP2_NORMAL",
+    "GL_MAP2_TEXTURE_COORD_1",
+    "GL_MAP2_TEXTURE_COORD_2",
+    "GL_MAP2_TEXTURE_COORD_3",
+    "GL_MAP2_TEXTURE_COORD_4",
+    "GL_MAP2_VERTEX_3",
+    "GL_MAP2_VERTEX_4",
+    "GL_MAP1_GRID_DOMAIN",
+    "GL_MAP1_GRID_SEGMENTS",
+    "GL_MAP2_GRID_DOMAIN",
+    "GL_MAP2_GRID_SEGMENTS",
+    "GL_TEXTURE_1D",
+    "GL_TEXTURE_2D",
+    "GL_FEEDBACK_BUFFER_POINTER",
+    "GL_FEEDBACK_BUFFER_SIZE",
+    "GL_FEEDBACK_BUFFER_TYPE",
+    "GL_SELECTION_BUFFER_POINTER",
+    "GL_SELECTION_BUFFER_SIZE",
+    "GL_TEXTURE_WIDTH",
+    "GL_TEXTURE_HEIGHT",
+    "GL_TEXTURE_INTERNAL_FORMAT",
+    "GL_TEXTURE_BORDER_COLOR",
+    "GL_TEXTURE_BORDER",
+    "GL_DONT_CARE",
+    "GL_FASTEST",
+    "GL_NICEST",
+    "GL_AMBIENT",
+    "GL_DIFFUSE",
+    "GL_SPECULAR",
+    "GL_POSITION",
+    "GL_SPOT_DIRECTION",
+    "GL_SPOT_EXPONENT",
+    "GL_SPOT_CUTOFF",
+    "GL_CONSTANT_ATTENUATION",
+    "GL_LINEAR_ATTENUATION",
+    "GL_QUADRATIC_ATTENUATION",
+    "GL_COMPILE",
+    "GL_COMPILE_AND_EXECUTE",
+    "GL_BYTE",
+    "GL_UNSIGNED_BYTE",
+    "GL_SHORT",
+    "GL_UNSIGNED_SHORT",
+    "GL_INT",
+    "GL_UNSIGNED_INT",
+    "GL_FLOAT",
+    "GL_2_BYTES",
+    "GL_3_BYTES",
+    "GL_4_BYTES",
+    "GL_DOUBLE",
+    "GL_HALF_FLOAT",
+    "GL_FIXED",
+    "GL_INT64_NV",
+    "GL_UNSIGNED_INT64_ARB",
+    "GL_CLEAR",
+    "GL_AND",
+    "GL_AND_REVERSE",
+    "GL_COPY",
+    "GL_AND_INVERTED",
+    "GL_NOOP",
+    "GL_XOR",
+    "GL_OR",
+    "GL_NOR",
+    "GL_EQUIV",
+    "GL_INVERT",
+    "GL_OR_REVERSE",
+    "GL_COPY_INVERTED",
+    "GL_OR_INVERTED",
+    "GL_NAND",
+    "GL_SET",
+    "GL_EMISSION",
+    "GL_SHININESS",
+    "GL_AMBIENT_AND_DIFFUSE",
+    "GL_COLOR_INDEXES",
+    "GL_MODELVIEW",
+    "GL_PROJECTION",
+    "GL_TEXTURE",
+    "GL_COLOR",
+    "GL_DEPTH",
+    "GL_STENCIL",
+    "GL_COLOR_INDEX",
+    "GL_STENCIL_INDEX",
+    "GL_DEPTH_COMPONENT",
+    "GL_RED",
+    "GL_GREEN",
+    "GL_BLUE",
+    "GL_ALPHA",
+    "GL_RGB",
+    "GL_RGBA",
+    "GL_LUMINANCE",
+    "GL_LUMINANCE_ALPHA",
+    "GL_BITMAP",
+    "GL_POINT",
+    "GL_LINE",
+    "GL_FILL",
+    "GL_RENDER",
+    "GL_FEEDBACK",
+    "GL_SELECT",
+    "GL_FLAT",
+    "GL_SMOOTH",
+    "GL_KEEP",
+    "GL_REPLACE",
+    "GL_INCR",
+    "GL_DECR",
+    "GL_VENDOR",
+    "GL_RENDERER",
+    "GL_VERSION",
+    "GL_EXTENSIONS",
+    "GL_S",
+    "GL_T",
+    "GL_R",
+    "GL_Q",
+    "GL_MODULATE",
+    "GL_DECAL",
+    "GL_TEXTURE_ENV_MODE",
+    "GL_TEXTURE_ENV_COLOR",
+    "GL_TEXTURE_ENV",
+    "GL_EYE_LINEAR",
+    "GL_OBJECT_LINEAR",
+    "GL_SPHERE_MAP",
+    "GL_TEXTURE_GEN_MODE",
+    "GL_OBJECT_PLANE",
+    "GL_EYE_PLANE",
+    "GL_NEAREST",
+    "GL_LINEAR",
+    "GL_NEAREST_MIPMAP_NEAREST",
+    "GL_LINEAR_MIPMAP_NEAREST",
+    "GL_NEAREST_MIPMAP_LINEAR",
+    "GL_LINEAR_MIPMAP_LINEAR",
+    "GL_TEXTURE_MAG_FILTER",
+    "GL_TEXTURE_MIN_FILTER",
+    "GL_TEXTURE_WRAP_S",
+    "GL_TEXTURE_WRAP_T",
+    "GL_CLAMP",
+    "GL_REPEAT",
+    "GL_POLYGON_OFFSET_UNITS",
+    "GL_POLYGON_OFFSET_POINT",
+    "GL_POLYGON_OFFSET_LINE",
+    "GL_R3_G3_B2",
+    "GL_V2F",
+    "GL_V3F",
+    "GL_C4UB_V2F",
+    "GL_C4UB_V3F",
+    "GL_C3F_V3F",
+    "GL_N3F_V3F",
+    "GL_C4F_N3F_V3F",
+    "GL_T2F_V3F",
+    "GL_T4F_V4F",
+    "GL_T2F_C4UB_V3F",
+    "GL_T2F_C3F_V3F",
+    "GL_T2F_N3F_V3F",
+    "GL_T2F_C4F_N3F_V3F",
+    "GL_T4F_C4F_N3F_V4F",
+    "GL_CLIP_PLANE0",
+    "GL_CLIP_PLANE1",
+    "GL_CLIP_PLANE2",
+    "GL_CLIP_PLANE3",
+    "GL_CLIP_PLANE4",
+    "GL_CLIP_PLANE5",
+    "GL_CLIP_PLANE6",
+    "GL_CLIP_PLANE7",
+    "GL_EGL_COVERAGE_BUFFERS_NV",
+    "GL_EGL_COVERAGE_SAMPLES_NV",
+    "GL_EGL_DEPTH_ENCODING_NV",
+    "GL_EGL_DEPTH_ENCODING_NONLINEAR_NV",
+    "GL_LIGHT0",
+    "GL_LIGHT1",
+    "GL_LIGHT2",
+    "GL_LIGHT3",
+    "GL_LIGHT4",
+    "GL_LIGHT5",
+    "GL_LIGHT6",
+    "GL_LIGHT7",
+    "GL_ABGR_EXT",
+    "GL_CONSTANT_COLOR",
+    "GL_ONE_MINUS_CONSTANT_COLOR",
+    "GL_CONSTANT_ALPHA",
+    "GL_ONE_MINUS_CONSTANT_ALPHA",
+    "GL_BLEND_COLOR",
+    "GL_FUNC_ADD",
+    "GL_MIN",
+    "GL_MAX",
+    "GL_BLEND_EQUATION",
+    "GL_FUNC_SUBTRACT",
+    "GL_FUNC_REVERSE_SUBTRACT",
+    "GL_CMYK_EXT",
+    "GL_CMYKA_EXT",
+    "GL_PACK_CMYK_HINT_EXT",
+    "GL_UNPACK_CMYK_HINT_EXT",
+    "GL_CONVOLUTION_1D",
+    "GL_CONVOLUTION_2D",
+    "GL_SEPARABLE_2D",
+    "GL_CONVOLUTION_BORDER_MODE",
+    "GL_CONVOLUTION_FILTER_SCALE",
+    "GL_CONVOLUTION_FILTER_BIAS",
+    "GL_REDUCE",
+    "GL_CONVOLUTION_FORMAT",
+    "GL_CONVOLUTION_WIDTH",
+    "GL_CONVOLUTION_HEIGHT",
+    "GL_MAX_CONVOLUTION_WIDTH",
+    "GL_MAX_CONVOLUTION_HEIGHT",
+    "GL_POST_CONVOLUTION_RED_SCALE",
+    "GL_POST_CONVOLUTION_GREEN_SCALE",
+    "GL_POST_CONVOLUTION_BLUE_SCALE",
+    "GL_POST_CONVOLUTION_ALPHA_SCALE",
+    "GL_POST_CONVOLUTION_RED_BIAS",
+    "GL_POST_CONVOLUTION_GREEN_BIAS",
+    "GL_POST_CONVOLUTION_BLUE_BIAS",
+    "GL_POST_CONVOLUTION_ALPHA_BIAS",
+    "GL_HISTOGRAM",
+    "GL_PROXY_HISTOGRAM",
+    "GL_HISTOGRAM_WIDTH",
+    "GL_HISTOGRAM_FORMAT",
+    "GL_HISTOGRAM_RED_SIZE",
+    "GL_HISTOGRAM_GREEN_SIZE",
+    "GL_HISTOGRAM_BLUE_SIZE",
+    "GL_HISTOGRAM_ALPHA_SIZE",
+    "GL_HISTOGRAM_LUMINANCE_SIZE",
+    "GL_HISTOGRAM_SINK",
+    "GL_MINMAX",
+    "GL_MINMAX_FORMAT",
+    "GL_MINMAX_SINK",
+    "GL_TABLE_TOO_LARGE",
+    "GL_UNSIGNED_BYTE_3_3_2",
+    "GL_UNSIGNED_SHORT_4_4_4_4",
+    "GL_UNSIGNED_SHORT_5_5_5_1",
+    "GL_UNSIGNED_INT_8_8_8_8",
+    "GL_UNSIGNED_INT_10_10_10_2",
+    "GL_POLYGON_OFFSET_FILL",
+    "GL_POLYGON_OFFSET_FACTOR",
+    "GL_POLYGON_OFFSET_BIAS_EXT",
+    "GL_RESCALE_NORMAL",
+    "GL_ALPHA4",
+    "GL_ALPHA8",
+    "GL_ALPHA12",
+    "GL_ALPHA16",
+    "GL_LUMINANCE4",
+    "GL_LUMINANCE8",
+    "GL_LUMINANCE12",
+    "GL_LUMINANCE16",
+    "GL_LUMINANCE4_ALPHA4",
+    "GL_LUMINANCE6_ALPHA2",
+    "GL_LUMINANCE8_ALPHA8",
+    "GL_LUMINANCE12_ALPHA4",
+    "GL_LUMINANCE12_ALPHA12",
+    "GL_LUMINANCE16_ALPHA16",
+    "GL_INTENSITY",
+    "GL_INTENSITY4",
+    "GL_INTENSITY8",
+    "GL_INTENSITY12",
+    "GL_INTENSITY16",
+    "GL_RGB2_EXT",
+    "GL_RGB4",
+    "GL_RGB5",
+    "GL_RGB8",
+    "GL_RGB10",
+    "GL_RGB12",
+    "GL_RGB16",
+    "GL_RGBA2",
+    "GL_RGBA4",
+    "GL_RGB5_A1",
+    "GL_RGBA8",
+    "GL_RGB10_A2",
+    "GL_RGBA12",
+    "GL_RGBA16",
+    "GL_TEXTURE_RED_SIZE",
+    "GL_TEXTURE_GREEN_SIZE",
+    "GL_TEXTURE_BLUE_SIZE",
+    "GL_TEXTURE_ALPHA_SIZE",
+    "GL_TEXTURE_LUMINANCE_SIZE",
+    "GL_TEXTURE_INTENSITY_SIZE",
+    "GL_REPLACE_EXT",
+    "GL_PROXY_TEXTURE_1D",
+    "GL_PROXY_TEXTURE_2D",
+    "GL_TEXTURE_PRIORITY",
+    "GL_TEXTURE_RESIDENT",
+    "GL_TEXTURE_BINDING_1D",
+    "GL_TEXTURE_BINDING_2D",
+    "GL_TEXTURE_BINDING_3D",
+    "GL_PACK_SKIP_IMAGES",
+    "GL_PACK_IMAGE_HEIGHT",
+    "GL_UNPACK_SKIP_IMAGES",
+    "GL_UNPACK_IMAGE_HEIGHT",
+    "GL_TEXTURE_3D",
+    "GL_PROXY_TEXTURE_3D",
+    "GL_TEXTURE_DEPTH",
+    "GL_TEXTURE_WRAP_R",
+    "GL_MAX_3D_TEXTURE_SIZE",
+    "GL_VERTEX_ARRAY",
+    "GL_NORMAL_ARRAY",
+    "GL_COLOR_ARRAY",
+    "GL_INDEX_ARRAY",
+    "GL_TEXTURE_COORD_ARRAY",
+    "GL_EDGE_FLAG_ARRAY",
+    "GL_VERTEX_ARRAY_SIZE",
+    "GL_VERTEX_ARRAY_TYPE",
+    "GL_VERTEX_ARRAY_STRIDE",
+    "GL_VERTEX_ARRAY_COUNT_EXT",
+    "GL_NORMAL_ARRAY_TYPE",
+    "GL_NORMAL_ARRAY_STRIDE",
+    "GL_NORMAL_ARRAY_COUNT_EXT",
+    "GL_COLOR_ARRAY_SIZE",
+    "GL_COLOR_ARRAY_TYPE",
+    "GL_COLOR_ARRAY_STRIDE",
+    "GL_COLOR_ARRAY_COUNT_EXT",
+    "GL_INDEX_ARRAY_TYPE",
+    "GL_INDEX_ARRAY_STRIDE",
+    "GL_INDEX_ARRAY_COUNT_EXT",
+    "GL_TEXTURE_COORD_ARRAY_SIZE",
+    "GL_TEXTURE_COORD_ARRAY_TYPE",
+    "GL_TEXTURE_COORD_ARRAY_STRIDE",
+    "GL_TEXTURE_COORD_ARRAY_COUNT_EXT",
+    "GL_EDGE_FLAG_ARRAY_STRIDE",
+    "GL_EDGE_FLAG_ARRAY_COUNT_EXT",
+    "GL_VERTEX_ARRAY_POINTER",
+    "GL_NORMAL_ARRAY_POINTER",
+    "GL_COLOR_ARRAY_POINTER",
+    "GL_INDEX_ARRAY_POINTER",
+    "GL_TEXTURE_COORD_ARRAY_POINTER",
+    "GL_EDGE_FLAG_ARRAY_POINTER",
+    "GL_INTERLACE_SGIX",
+    "GL_DETAIL_TEXTURE_2D_SGIS",
+    "GL_DETAIL_TEXTURE_2D_BINDING_SGIS",
+    "GL_LINEAR_DETAIL_SGIS",
+    "GL_LINEAR_DETAIL_ALPHA_SGIS",
+    "GL_LINEAR_DETAIL_COLOR_SGIS",
+    "GL_DETAIL_TEXTURE_LEVEL_SGIS",
+    "GL_DETAIL_TEXTURE_MODE_SGIS",
+    "GL_DETAIL_TEXTURE_FUNC_POINTS_SGIS",
+    "GL_MULTISAMPLE",
+    "GL_SAMPLE_ALPHA_TO_COVERAGE",
+    "GL_SAMPLE_ALPHA_TO_ONE",
+    "GL_SAMPLE_COVERAGE",
+    "GL_1PASS_EXT",
+    "GL_2PASS_0_EXT",
+    "GL_2PASS_1_EXT",
+    "GL_4PASS_0_EXT",
+    "GL_4PASS_1_EXT",
+    "GL_4PASS_2_EXT",
+    "GL_4PASS_3_EXT",
+    "GL_SAMPLE_BUFFERS",
+    "GL_SAMPLES",
+    "GL_SAMPLE_COVERAGE_VALUE",
+    "GL_SAMPLE_COVERAGE_INVERT",
+    "GL_SAMPLE_PATTERN_EXT",
+    "GL_COLOR_MATRIX",
+    "GL_COLOR_MATRIX_STACK_DEPTH",
+    "GL_MAX_COLOR_MATRIX_STACK_DEPTH",
+    "GL_POST_COLOR_MATRIX_RED_SCALE",
+    "GL_POST_COLOR_MATRIX_GREEN_SCALE",
+    "GL_POST_COLOR_MATRIX_BLUE_SCALE",
+    "GL_POST_COLOR_MATRIX_ALPHA_SCALE",
+    "GL_POST_COLOR_MATRIX_RED_BIAS",
+    "GL_POST_COLOR_MATRIX_GREEN_BIAS",
+    "GL_POST_COLOR_MATRIX_BLUE_BIAS",
+    "GL_POST_COLOR_MATRIX_ALPHA_BIAS",
+    "GL_TEXTURE_COLOR_TABLE_SGI",
+    "GL_PROXY_TEXTURE_COLOR_TABLE_SGI",
+    "GL_TEXTURE_COMPARE_FAIL_VALUE_ARB",
+    "GL_BLEND_DST_RGB",
+    "GL_BLEND_SRC_RGB",
+    "GL_BLEND_DST_ALPHA",
+    "GL_BLEND_SRC_ALPHA",
+    "GL_422_EXT",
+    "GL_422_REV_EXT",
+    "GL_422_AVERAGE_EXT",
+    "GL_422_REV_AVERAGE_EXT",
+    "GL_COLOR_TABLE",
+    "GL_POST_CONVOLUTION_COLOR_TABLE",
+    "GL_POST_COLOR_MATRIX_COLOR_TABLE",
+    "GL_PROXY_COLOR_TABLE",
+    "GL_PROXY_POST_CONVOLUTION_COLOR_TABLE",
+    "GL_PROXY_POST_COLOR_MATRIX_COLOR_TABLE",
+    "GL_COLOR_TABLE_SCALE",
+    "GL_COLOR_TABLE_BIAS",
+    "GL_COLOR_TABLE_FORMAT",
+    "GL_COLOR_TABLE_WIDTH",
+    "GL_COLOR_TABLE_RED_SIZE",
+    "GL_COLOR_TABLE_GREEN_SIZE",
+    "GL_COLOR_TABLE_BLUE_SIZE",
+    "GL_COLOR_TABLE_ALPHA_SIZE",
+    "GL_COLOR_TABLE_LUMINANCE_SIZE",
+    "GL_COLOR_TABLE_INTENSITY_SIZE",
+    "GL_BGR",
+    "GL_BGRA",
+    "GL_COLOR_INDEX1_EXT",
+    "GL_COLOR_INDEX2_EXT",
+    "GL_COLOR_INDEX4_EXT",
+    "GL_COLOR_INDEX8_EXT",
+    "GL_COLOR_INDEX12_EXT",
+    "GL_COLOR_INDEX16_EXT",
+    "GL_MAX_ELEMENTS_VERTICES",
+    "GL_MAX_ELEMENTS_INDICES",
+    "GL_PHONG_WIN",
+    "GL_PHONG_HINT_WIN",
+    "GL_FOG_SPECULAR_TEXTURE_WIN",
+    "GL_TEXTURE_INDEX_SIZE_EXT",
+    "GL_PARAMETER_BUFFER_ARB",
+    "GL_PARAMETER_BUFFER_BINDING_ARB",
+    "GL_CLIP_VOLUME_CLIPPING_HINT_EXT",
+    "GL_POINT_SIZE_MIN",
+    "GL_POINT_SIZE_MAX",
+    "GL_POINT_FADE_THRESHOLD_SIZE",
+    "GL_POINT_DISTANCE_ATTENUATION",
+    "GL_CLAMP_TO_BORDER",
+    "GL_TEXTURE_MULTI_BUFFER_HINT_SGIX",
+    "GL_CLAMP_TO_EDGE",
+    "GL_TEXTURE_MIN_LOD",
+    "GL_TEXTURE_MAX_LOD",
+    "GL_TEXTURE_BASE_LEVEL",
+    "GL_TEXTURE_MAX_LEVEL",
+    "GL_IGNORE_BORDER",
+    "GL_CONSTANT_BORDER",
+    "GL_WRAP_BORDER",
+    "GL_REPLICATE_BORDER",
+    "GL_CONVOLUTION_BORDER_COLOR",
+    "GL_IMAGE_SCALE_X_HP",
+    "GL_IMAGE_SCALE_Y_HP",
+    "GL_IMAGE_TRANSLATE_X_HP",
+    "GL_IMAGE_TRANSLATE_Y_HP",
+    "GL_IMAGE_ROTATE_ANGLE_HP",
+    "GL_IMAGE_ROTATE_ORIGIN_X_HP",
+    "GL_IMAGE_ROTATE_ORIGIN_Y_HP",
+    "GL_IMAGE_MAG_FILTER_HP",
+    "GL_IMAGE_MIN_FILTER_HP",
+    "GL_IMAGE_CUBIC_WEIGHT_HP",
+    "GL_CUBIC_HP",
+    "GL_AVERAGE_HP",
+    "GL_IMAGE_TRANSFORM_2D_HP",
+    "GL_POST_IMAGE_TRANSFORM_COLOR_TABLE_HP",
+    "GL_PROXY_POST_IMAGE_TRANSFORM_COLOR_TABLE_HP",
+    "GL_OCCLUSION_TEST_HP",
+    "GL_OCCLUSION_TEST_RESULT_HP",
+    "GL_POST_TEXTURE_FILTER_BIAS_SGIX",
+    "GL_POST_TEXTURE_FILTER_SCALE_SGIX",
+    "GL_POST_TEXTURE_FILTER_BIAS_RANGE_SGIX",
+    "GL_POST_TEXTURE_FILTER_SCALE_RANGE_SGIX",
+    "GL_GENERATE_MIPMAP",
+    "GL_GENERATE_MIPMAP_HINT",
+    "GL_FOG_OFFSET_SGIX",
+    "GL_FOG_OFFSET_VALUE_SGIX",
+    "GL_TEXTURE_COMPARE_SGIX",
+    "GL_TEXTURE_COMPARE_OPERATOR_SGIX",
+    "GL_TEXTURE_LEQUAL_R_SGIX",
+    "GL_TEXTURE_GEQUAL_R_SGIX",
+    "GL_DEPTH_COMPONENT16",
+    "GL_DEPTH_COMPONENT24",
+    "GL_DEPTH_COMPONENT32",
+    "GL_ARRAY_ELEMENT_LOCK_FIRST_EXT",
+    "GL_ARRAY_ELEMENT_LOCK_COUNT_EXT",
+    "GL_CULL_VERTEX_EXT",
+    "GL_CULL_VERTEX_EYE_POSITION_EXT",
+    "GL_CULL_VERTEX_OBJECT_POSITION_EXT",
+    "GL_YCRCB_422_SGIX",
+    "GL_YCRCB_444_SGIX",
+    "GL_WRAP_BORDER_SUN",
+    "GL_UNPACK_CONSTANT_DATA_SUNX",
+    "GL_TEXTURE_CONSTANT_DATA_SUNX",
+    "GL_TRIANGLE_LIST_SUN",
+    "GL_REPLACEMENT_CODE_SUN",
+    "GL_GLOBAL_ALPHA_SUN",
+    "GL_GLOBAL_ALPHA_FACTOR_SUN",
+    "GL_EYE_DISTANCE_TO_POINT_SGIS",
+    "GL_OBJECT_DISTANCE_TO_POINT_SGIS",
+    "GL_EYE_DISTANCE_TO_LINE_SGIS",
+    "GL_OBJECT_DISTANCE_TO_LINE_SGIS",
+    "GL_EYE_POINT_SGIS",
+    "GL_OBJECT_POINT_SGIS",
+    "GL_EYE_LINE_SGIS",
+    "GL_OBJECT_LINE_SGIS",
+    "GL_LIGHT_MODEL_COLOR_CONTROL",
+    "GL_SINGLE_COLOR",
+    "GL_SEPARATE_SPECULAR_COLOR",
+    "GL_SHARED_TEXTURE_PALETTE_EXT",
+    "GL_TEXT_FRAGMENT_SHADER_ATI",
+    "GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING",
+    "GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE",
+    "GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE",
+    "GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE",
+    "GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE",
+    "GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE",
+    "GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE",
+    "GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE",
+    "GL_FRAMEBUFFER_DEFAULT",
+    "GL_FRAMEBUFFER_UNDEFINED",
+    "GL_DEPTH_STENCIL_ATTACHMENT",
+    "GL_MAJOR_VERSION",
+    "GL_MINOR_VERSION",
+    "GL_NUM_EXTENSIONS",
+    "GL_CONTEXT_FLAGS",
+    "GL_BUFFER_IMMUTABLE_STORAGE",
+    "GL_BUFFER_STORAGE_FLAGS",
+    "GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED",
+    "GL_INDEX",
+    "GL_DEPTH_BUFFER",
+    "GL_STENCIL_BUFFER",
+    "GL_COMPRESSED_RED",
+    "GL_COMPRESSED_RG",
+    "GL_RG",
+    "GL_RG_INTEGER",
+    "GL_R8",
+    "GL_R16",
+    "GL_RG8",
+    "GL_RG16",
+    "GL_R16F",
+    "GL_R32F",
+    "GL_RG16F",
+    "GL_RG32F",
+    "GL_R8I",
+    "GL_R8UI",
+    "GL_R16I",
+    "GL_R16UI",
+    "GL_R32I",
+    "GL_R32UI",
+    "GL_RG8I",
+    "GL_RG8UI",
+    "GL_RG16I",
+    "GL_RG16UI",
+    "GL_RG32I",
+    "GL_RG32UI",
+    "GL_SYNC_CL_EVENT_ARB",
+    "GL_SYNC_CL_EVENT_COMPLETE_ARB",
+    "GL_DEBUG_OUTPUT_SYNCHRONOUS",
+    "GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH",
+    "GL_DEBUG_CALLBACK_FUNCTION",
+    "GL_DEBUG_CALLBACK_USER_PARAM",
+    "GL_DEBUG_SOURCE_API",
+    "GL_DEBUG_SOURCE_WINDOW_SYSTEM",
+    "GL_DEBUG_SOURCE_SHADER_COMPILER",
+    "GL_DEBUG_SOURCE_THIRD_PARTY",
+    "GL_DEBUG_SOURCE_APPLICATION",
+    "GL_DEBUG_SOURCE_OTHER",
+    "GL_DEBUG_TYPE_ERROR",
+    "GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR",
+    "GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR",
+    "GL_DEBUG_TYPE_PORTABILITY",
+    "GL_DEBUG_TYPE_PERFORMANCE",
+    "GL_DEBUG_TYPE_OTHER",
+    "GL_LOSE_CONTEXT_ON_RESET_ARB",
+    "GL_GUILTY_CONTEXT_RESET_ARB",
+    "GL_INNOCENT_CONTEXT_RESET_ARB",
+    "GL_UNKNOWN_CONTEXT_RESET_ARB",
+    "GL_RESET_NOTIFICATION_STRATEGY_ARB",
+    "GL_PROGRAM_BINARY_RETRIEVABLE_HINT",
+    "GL_PROGRAM_SEPARABLE",
+    "GL_ACTIVE_PROGRAM",
+    "GL_PROGRAM_PIPELINE_BINDING",
+    "GL_MAX_VIEWPORTS",
+    "GL_VIEWPORT_SUBPIXEL_BITS",
+    "GL_VIEWPORT_BOUNDS_RANGE",
+    "GL_LAYER_PROVOKING_VERTEX",
+    "GL_VIEWPORT_INDEX_PROVOKING_VERTEX",
+    "GL_UNDEFINED_VERTEX",
+    "GL_NO_RESET_NOTIFICATION_ARB",
+    "GL_MAX_COMPUTE_SHARED_MEMORY_SIZE",
+    "GL_MAX_COMPUTE_UNIFORM_COMPONENTS",
+    "GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS",
+    "GL_MAX_COMPUTE_ATOMIC_COUNTERS",
+    "GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS",
+    "GL_COMPUTE_WORK_GROUP_SIZE",
+    "GL_DEBUG_TYPE_MARKER",
+    "GL_DEBUG_TYPE_PUSH_GROUP",
+    "GL_DEBUG_TYPE_POP_GROUP",
+    "GL_DEBUG_SEVERITY_NOTIFICATION",
+    "GL_MAX_DEBUG_GROUP_STACK_DEPTH",
+    "GL_DEBUG_GROUP_STACK_DEPTH",
+    "GL_MAX_UNIFORM_LOCATIONS",
+    "GL_INTERNALFORMAT_SUPPORTED",
+    "GL_INTERNALFORMAT_PREFERRED",
+    "GL_INTERNALFORMAT_RED_SIZE",
+    "GL_INTERNALFORMAT_GREEN_SIZE",
+    "GL_INTERNALFORMAT_BLUE_SIZE",
+    "GL_INTERNALFORMAT_ALPHA_SIZE",
+    "GL_INTERNALFORMAT_DEPTH_SIZE",
+    "GL_INTERNALFORMAT_STENCIL_SIZE",
+    "GL_INTERNALFORMAT_SHARED_SIZE",
+    "GL_INTERNALFORMAT_RED_TYPE",
+    "GL_INTERNALFORMAT_GREEN_TYPE",
+    "GL_INTERNALFORMAT_BLUE_TYPE",
+    "GL_INTERNALFORMAT_ALPHA_TYPE",
+    "GL_INTERNALFORMAT_DEPTH_TYPE",
+    "GL_INTERNALFORMAT_STENCIL_TYPE",
+    "GL_MAX_WIDTH",
+    "GL_MAX_HEIGHT",
+    "GL_MAX_DEPTH",
+    "GL_MAX_LAYERS",
+    "GL_MAX_COMBINED_DIMENSIONS",
+    "GL_COLOR_COMPONENTS",
+    "GL_DEPTH_COMPONENTS",
+    "GL_STENCIL_COMPONENTS",
+    "GL_COLOR_RENDERABLE",
+    "GL_DEPTH_RENDERABLE",
+    "GL_STENCIL_RENDERABLE",
+    "GL_FRAMEBUFFER_RENDERABLE",
+    "GL_FRAMEBUFFER_RENDERABLE_LAYERED",
+    "GL_FRAMEBUFFER_BLEND",
+    "GL_READ_PIXELS",
+    "GL_READ_PIXELS_FORMAT",
+    "GL_READ_PIXELS_TYPE",
+    "GL_TEXTURE_IMAGE_FORMAT",
+    "GL_TEXTURE_IMAGE_TYPE",
+    "GL_GET_TEXTURE_IMAGE_FORMAT",
+    "GL_GET_TEXTURE_IMAGE_TYPE",
+    "GL_MIPMAP",
+    "GL_MANUAL_GENERATE_MIPMAP",
+    "GL_AUTO_GENERATE_MIPMAP",
+    "GL_COLOR_ENCODING",
+    "GL_SRGB_READ",
+    "GL_SRGB_WRITE",
+    "GL_SRGB_DECODE_ARB",
+    "GL_FILTER",
+    "GL_VERTEX_TEXTURE",
+    "GL_TESS_CONTROL_TEXTURE",
+    "GL_TESS_EVALUATION_TEXTURE",
+    "GL_GEOMETRY_TEXTURE",
+    "GL_FRAGMENT_TEXTURE",
+    "GL_COMPUTE_TEXTURE",
+    "GL_TEXTURE_SHADOW",
+    "GL_TEXTURE_GATHER",
+    "GL_TEXTURE_GATHER_SHADOW",
+    "GL_SHADER_IMAGE_LOAD",
+    "GL_SHADER_IMAGE_STORE",
+    "GL_SHADER_IMAGE_ATOMIC",
+    "GL_IMAGE_TEXEL_SIZE",
+    "GL_IMAGE_COMPATIBILITY_CLASS",
+    "GL_IMAGE_PIXEL_FORMAT",
+    "GL_IMAGE_PIXEL_TYPE",
+    "GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_TEST",
+    "GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_TEST",
+    "GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_WRITE",
+    "GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_WRITE",
+    "GL_TEXTURE_COMPRESSED_BLOCK_WIDTH",
+    "GL_TEXTURE_COMPRESSED_BLOCK_HEIGHT",
+    "GL_TEXTURE_COMPRESSED_BLOCK_SIZE",
+    "GL_CLEAR_BUFFER",
+    "GL_TEXTURE_VIEW",
+    "GL_VIEW_COMPATIBILITY_CLASS",
+    "GL_FULL_SUPPORT",
+    "GL_CAVEAT_SUPPORT",
+    "GL_IMAGE_CLASS_4_X_32",
+    "GL_IMAGE_CLASS_2_X_32",
+    "GL_IMAGE_CLASS_1_X_32",
+    "GL_IMAGE_CLASS_4_X_16",
+    "GL_IMAGE_CLASS_2_X_16",
+    "GL_IMAGE_CLASS_1_X_16",
+    "GL_IMAGE_CLASS_4_X_8",
+    "GL_IMAGE_CLASS_2_X_8",
+    "GL_IMAGE_CLASS_1_X_8",
+    "GL_IMAGE_CLASS_11_11_10",
+    "GL_IMAGE_CLASS_10_10_10_2",
+    "GL_VIEW_CLASS_128_BITS",
+    "GL_VIEW_CLASS_96_BITS",
+    "GL_VIEW_CLASS_64_BITS",
+    "GL_VIEW_CLASS_48_BITS",
+    "GL_VIEW_CLASS_32_BITS",
+    "GL_VIEW_CLASS_24_BITS",
+    "GL_VIEW_CLASS_16_BITS",
+    "GL_VIEW_CLASS_8_BITS",
+    "GL_VIEW_CLASS_S3TC_DXT1_RGB",
+    "GL_VIEW_CLASS_S3TC_DXT1_RGBA",
+    "GL_VIEW_CLASS_S3TC_DXT3_RGBA",
+    "GL_VIEW_CLASS_S3TC_DXT5_RGBA",
+    "GL_VIEW_CLASS_RGTC1_RED",
+    "GL_VIEW_CLASS_RGTC2_RG",
+    "GL_VIEW_CLASS_BPTC_UNORM",
+    "GL_VIEW_CLASS_BPTC_FLOAT",
+    "GL_VERTEX_ATTRIB_BINDING",
+    "GL_VERTEX_ATTRIB_RELATIVE_OFFSET",
+    "GL_VERTEX_BINDING_DIVISOR",
+    "GL_VERTEX_BINDING_OFFSET",
+    "GL_VERTEX_BINDING_STRIDE",
+    "GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET",
+    "GL_MAX_VERTEX_ATTRIB_BINDINGS",
+    "GL_TEXTURE_VIEW_MIN_LEVEL",
+    "GL_TEXTURE_VIEW_NUM_LEVELS",
+    "GL_TEXTURE_VIEW_MIN_LAYER",
+    "GL_TEXTURE_VIEW_NUM_LAYERS",
+    "GL_TEXTURE_IMMUTABLE_LEVELS",
+    "GL_BUFFER",
+    "GL_SHADER",
+    "GL_PROGRAM",
+    "GL_QUERY",
+    "GL_PROGRAM_PIPELINE",
+    "GL_MAX_VERTEX_ATTRIB_STRIDE",
+    "GL_SAMPLER",
+    "GL_DISPLAY_LIST",
+    "GL_MAX_LABEL_LENGTH",
+    "GL_NUM_SHADING_LANGUAGE_VERSIONS",
+    "GL_CONVOLUTION_HINT_SGIX",
+    "GL_ALPHA_MIN_SGIX",
+    "GL_ALPHA_MAX_SGIX",
+    "GL_ASYNC_MARKER_SGIX",
+    "GL_ASYNC_HISTOGRAM_SGIX",
+    "GL_MAX_ASYNC_HISTOGRAM_SGIX",
+    "GL_PIXEL_TRANSFORM_2D_EXT",
+    "GL_PIXEL_MAG_FILTER_EXT",
+    "GL_PIXEL_MIN_FILTER_EXT",
+    "GL_PIXEL_CUBIC_WEIGHT_EXT",
+    "GL_CUBIC_EXT",
+    "GL_AVERAGE_EXT",
+    "GL_PIXEL_TRANSFORM_2D_STACK_DEPTH_EXT",
+    "GL_MAX_PIXEL_TRANSFORM_2D_STACK_DEPTH_EXT",
+    "GL_PIXEL_TRANSFORM_2D_MATRIX_EXT",
+    "GL_FRAGMENT_MATERIAL_EXT",
+    "GL_FRAGMENT_NORMAL_EXT",
+    "GL_FRAGMENT_COLOR_EXT",
+    "GL_ATTENUATION_EXT",
+    "GL_SHADOW_ATTENUATION_EXT",
+    "GL_TEXTURE_APPLICATION_MODE_EXT",
+    "GL_TEXTURE_LIGHT_EXT",
+    "GL_TEXTURE_MATERIAL_FACE_EXT",
+    "GL_TEXTURE_MATERIAL_PARAMETER_EXT",
+    "GL_ASYNC_TEX_IMAGE_SGIX",
+    "GL_ASYNC_DRAW_PIXELS_SGIX",
+    "GL_ASYNC_READ_PIXELS_SGIX",
+    "GL_MAX_ASYNC_TEX_IMAGE_SGIX",
+    "GL_MAX_ASYNC_DRAW_PIXELS_SGIX",
+    "GL_MAX_ASYNC_READ_PIXELS_SGIX",
+    "GL_UNSIGNED_BYTE_2_3_3_REV",
+    "GL_UNSIGNED_SHORT_5_6_5",
+    "GL_UNSIGNED_SHORT_5_6_5_REV",
+    "GL_UNSIGNED_SHORT_4_4_4_4_REV",
+    "GL_UNSIGNED_SHORT_1_5_5_5_REV",
+    "GL_UNSIGNED_INT_8_8_8_8_REV",
+    "GL_UNSIGNED_INT_2_10_10_10_REV",
+    "GL_TEXTURE_MAX_CLAMP_S_SGIX",
+    "GL_TEXTURE_MAX_CLAMP_T_SGIX",
+    "GL_TEXTURE_MAX_CLAMP_R_SGIX",
+    "GL_MIRRORED_REPEAT",
+    "GL_RGB_S3TC",
+    "GL_RGB4_S3TC",
+    "GL_RGBA_S3TC",
+    "GL_RGBA4_S3TC",
+    "GL_RGBA_DXT5_S3TC",
+    "GL_RGBA4_DXT5_S3TC",
+    "GL_VERTEX_PRECLIP_SGIX",
+    "GL_VERTEX_PRECLIP_HINT_SGIX",
+    "GL_COMPRESSED_RGB_S3TC_DXT1_EXT",
+    "GL_COMPRESSED_RGBA_S3TC_DXT1_EXT",
+    "GL_COMPRESSED_RGBA_S3TC_DXT3_EXT",
+    "GL_COMPRESSED_RGBA_S3TC_DXT5_EXT",
+    "GL_PARALLEL_ARRAYS_INTEL",
+    "GL_VERTEX_ARRAY_PARALLEL_POINTERS_INTEL",
+    "GL_NORMAL_ARRAY_PARALLEL_POINTERS_INTEL",
+    "GL_COLOR_ARRAY_PARALLEL_POINTERS_INTEL",
+    "GL_TEXTURE_COORD_ARRAY_PARALLEL_POINTERS_INTEL",
+    "GL_TEXTURE_MEMORY_LAYOUT_INTEL",
+    "GL_FRAGMENT_LIGHTING_EXT",
+    "GL_FRAGMENT_COLOR_MATERIAL_EXT",
+    "GL_FRAGMENT_COLOR_MATERIAL_FACE_EXT",
+    "GL_FRAGMENT_COLOR_MATERIAL_PARAMETER_EXT",
+    "GL_MAX_FRAGMENT_LIGHTS_EXT",
+    "GL_MAX_ACTIVE_LIGHTS_EXT",
+    "GL_CURRENT_RASTER_NORMAL_EXT",
+    "GL_LIGHT_ENV_MODE_EXT",
+    "GL_FRAGMENT_LIGHT_MODEL_LOCAL_VIEWER_EXT",
+    "GL_FRAGMENT_LIGHT_MODEL_TWO_SIDE_EXT",
+    "GL_FRAGMENT_LIGHT_MODEL_AMBIENT_EXT",
+    "GL_FRAGMENT_LIGHT_MODEL_NORMAL_INTERPOLATION_EXT",
+    "GL_FRAGMENT_LIGHT0_EXT",
+    "GL_FRAGMENT_LIGHT1_EXT",
+    "GL_FRAGMENT_LIGHT2_EXT",
+    "GL_FRAGMENT_LIGHT3_EXT",
+    "GL_FRAGMENT_LIGHT4_EXT",
+    "GL_FRAGMENT_LIGHT5_EXT",
+    "GL_FRAGMENT_LIGHT6_EXT",
+    "GL_FRAGMENT_LIGHT7_EXT",
+    "GL_PACK_RESAMPLE_SGIX",
+    "GL_UNPACK_RESAMPLE_SGIX",
+    "GL_RESAMPLE_DECIMATE_SGIX",
+    "GL_RESAMPLE_REPLICATE_SGIX",
+    "GL_RESAMPLE_ZERO_FILL_SGIX",
+    "GL_TANGENT_ARRAY_EXT",
+    "GL_BINORMAL_ARRAY_EXT",
+    "GL_CURRENT_TANGENT_EXT",
+    "GL_CURRENT_BINORMAL_EXT",
+    "GL_TANGENT_ARRAY_TYPE_EXT",
+    "GL_TANGENT_ARRAY_STRIDE_EXT",
+    "GL_BINORMAL_ARRAY_TYPE_EXT",
+    "GL_BINORMAL_ARRAY_STRIDE_EXT",
+    "GL_TANGENT_ARRAY_POINTER_EXT",
+    "GL_BINORMAL_ARRAY_POINTER_EXT",
+    "GL_MAP1_TANGENT_EXT",
+    "GL_MAP2_TANGENT_EXT",
+    "GL_MAP1_BINORMAL_EXT",
+    "GL_MAP2_BINORMAL_EXT",
+    "GL_FOG_COORDINATE_SOURCE",
+    "GL_FOG_COORDINATE",
+    "GL_FRAGMENT_DEPTH",
+    "GL_CURRENT_FOG_COORDINATE",
+    "GL_FOG_COORDINATE_ARRAY_TYPE",
+    "GL_FOG_COORDINATE_ARRAY_STRIDE",
+    "GL_FOG_COORDINATE_ARRAY_POINTER",
+    "GL_FOG_COORDINATE_ARRAY",
+    "GL_COLOR_SUM",
+    "GL_CURRENT_SECONDARY_COLOR",
+    "GL_SECONDARY_COLOR_ARRAY_SIZE",
+    "GL_SECONDARY_COLOR_ARRAY_TYPE",
+    "GL_SECONDARY_COLOR_ARRAY_STRIDE",
+    "GL_SECONDARY_COLOR_ARRAY_POINTER",
+    "GL_SECONDARY_COLOR_ARRAY",
+    "GL_CURRENT_RASTER_SECONDARY_COLOR",
+    "GL_ALIASED_POINT_SIZE_RANGE",
+    "GL_ALIASED_LINE_WIDTH_RANGE",
+    "GL_SCREEN_COORDINATES_REND",
+    "GL_INVERTED_SCREEN_W_REND",
+    "GL_TEXTURE0",
+    "GL_TEXTURE1",
+    "GL_TEXTURE2",
+    "GL_TEXTURE3",
+    "GL_TEXTURE4",
+    "GL_TEXTURE5",
+    "GL_TEXTURE6",
+    "GL_TEXTURE7",
+    "GL_TEXTURE8",
+    "GL_TEXTURE9",
+    "GL_TEXTURE10",
+    "GL_TEXTURE11",
+    "GL_TEXTURE12",
+    "GL_TEXTURE13",
+    "GL_TEXTURE14",
+    "GL_TEXTURE15",
+    "GL_TEXTURE16",
+    "GL_TEXTURE17",
+    "GL_TEXTURE18",
+    "GL_TEXTURE19",
+    "GL_TEXTURE20",
+    "GL_TEXTURE21",
+    "GL_TEXTURE22",
+    "GL_TEXTURE23",
+    "GL_TEXTURE24",
+    "GL_TEXTURE25",
+    "GL_TEXTURE26",
+    "GL_TEXTURE27",
+    "GL_TEXTURE28",
+    "GL_TEXTURE29",
+    "GL_TEXTURE30",
+    "GL_TEXTURE31",
+    "GL_ACTIVE_TEXTURE",
+    "GL_CLIENT_ACTIVE_TEXTURE",
+    "GL_MAX_TEXTURE_UNITS",
+    "GL_TRANSPOSE_MODELVIEW_MATRIX",
+    "GL_TRANSPOSE_PROJECTION_MATRIX",
+    "GL_TRANSPOSE_TEXTURE_MATRIX",
+    "GL_TRANSPOSE_COLOR_MATRIX",
+    "GL_SUBTRACT",
+    "GL_MAX_RENDERBUFFER_SIZE",
+    "GL_COMPRESSED_ALPHA",
+    "GL_COMPRESSED_LUMINANCE",
+    "GL_COMPRESSED_LUMINANCE_ALPHA",
+    "GL_COMPRESSED_INTENSITY",
+    "GL_COMPRESSED_RGB",
+    "GL_COMPRESSED_RGBA",
+    "GL_TEXTURE_COMPRESSION_HINT",
+    "GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_CONTROL_SHADER",
+    "GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_EVALUATION_SHADER",
+    "GL_ALL_COMPLETED_NV",
+    "GL_FENCE_STATUS_NV",
+    "GL_FENCE_CONDITION_NV",
+    "GL_TEXTURE_RECTANGLE",
+    "GL_TEXTURE_BINDING_RECTANGLE",
+    "GL_PROXY_TEXTURE_RECTANGLE",
+    "GL_MAX_RECTANGLE_TEXTURE_SIZE",
+    "GL_DEPTH_STENCIL",
+    "GL_UNSIGNED_INT_24_8",
+    "GL_MAX_TEXTURE_LOD_BIAS",
+    "GL_TEXTURE_MAX_ANISOTROPY_EXT",
+    "GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT",
+    "GL_TEXTURE_FILTER_CONTROL",
+    "GL_TEXTURE_LOD_BIAS",
+    "GL_MODELVIEW1_STACK_DEPTH_EXT",
+    "GL_COMBINE4_NV",
+    "GL_MAX_SHININESS_NV",
+    "GL_MAX_SPOT_EXPONENT_NV",
+    "GL_MODELVIEW1_MATRIX_EXT",
+    "GL_INCR_WRAP",
+    "GL_DECR_WRAP",
+    "GL_VERTEX_WEIGHTING_EXT",
+    "GL_MODELVIEW1_ARB",
+    "GL_CURRENT_VERTEX_WEIGHT_EXT",
+    "GL_VERTEX_WEIGHT_ARRAY_EXT",
+    "GL_VERTEX_WEIGHT_ARRAY_SIZE_EXT",
+    "GL_VERTEX_WEIGHT_ARRAY_TYPE_EXT",
+    "GL_VERTEX_WEIGHT_ARRAY_STRIDE_EXT",
+    "GL_VERTEX_WEIGHT_ARRAY_POINTER_EXT",
+    "GL_NORMAL_MAP",
+    "GL_REFLECTION_MAP",
+    "GL_TEXTURE_CUBE_MAP",
+    "GL_TEXTURE_BINDING_CUBE_MAP",
+    "GL_TEXTURE_CUBE_MAP_POSITIVE_X",
+    "GL_TEXTURE_CUBE_MAP_NEGATIVE_X",
+    "GL_TEXTURE_CUBE_MAP_POSITIVE_Y",
+    "GL_TEXTURE_CUBE_MAP_NEGATIVE_Y",
+    "GL_TEXTURE_CUBE_MAP_POSITIVE_Z",
+    "GL_TEXTURE_CUBE_MAP_NEGATIVE_Z",
+    "GL_PROXY_TEXTURE_CUBE_MAP",
+    "GL_MAX_CUBE_MAP_TEXTURE_SIZE",
+    "GL_VERTEX_ARRAY_RANGE_NV",
+    "GL_VERTEX_ARRAY_RANGE_LENGTH_NV",
+    "GL_VERTEX_ARRAY_RANGE_VALID_NV",
+    "GL_MAX_VERTEX_ARRAY_RANGE_ELEMENT_NV",
+    "GL_VERTEX_ARRAY_RANGE_POINTER_NV",
+    "GL_REGISTER_COMBINERS_NV",
+    "GL_VARIABLE_A_NV",
+    "GL_VARIABLE_B_NV",
+    "GL_VARIABLE_C_NV",
+    "GL_VARIABLE_D_NV",
+    "GL_VARIABLE_E_NV",
+    "GL_VARIABLE_F_NV",
+    "GL_VARIABLE_G_NV",
+    "GL_CONSTANT_COLOR0_NV",
+    "GL_CONSTANT_COLOR1_NV",
+    "GL_PRIMARY_COLOR_NV",
+    "GL_SECONDARY_COLOR_NV",
+    "GL_SPARE0_NV",
+    "GL_SPARE1_NV",
+    "GL_DISCARD_NV",
+    "GL_E_TIMES_F_NV",
+    "GL_SPARE0_PLUS_SECONDARY_COLOR_NV",
+    "GL_VERTEX_ARRAY_RANGE_WITHOUT_FLUSH_NV",
+    "GL_MULTISAMPLE_FILTER_HINT_NV",
+    "GL_PER_STAGE_CONSTANTS_NV",
+    "GL_UNSIGNED_IDENTITY_NV",
+    "GL_UNSIGNED_INVERT_NV",
+    "GL_EXPAND_NORMAL_NV",
+    "GL_EXPAND_NEGATE_NV",
+    "GL_HALF_BIAS_NORMAL_NV",
+    "GL_HALF_BIAS_NEGATE_NV",
+    "GL_SIGNED_IDENTITY_NV",
+    "GL_SIGNED_NEGATE_NV",
+    "GL_SCALE_BY_TWO_NV",
+    "GL_SCALE_BY_FOUR_NV",
+    "GL_SCALE_BY_ONE_HALF_NV",
+    "GL_BIAS_BY_NEGATIVE_ONE_HALF_NV",
+    "GL_COMBINER_INPUT_NV",
+    "GL_COMBINER_MAPPING_NV",
+    "GL_COMBINER_COMPONENT_USAGE_NV",
+    "GL_COMBINER_AB_DOT_PRODUCT_NV",
+    "GL_COMBINER_CD_DOT_PRODUCT_NV",
+    "GL_COMBINER_MUX_SUM_NV",
+    "GL_COMBINER_SCALE_NV",
+    "GL_COMBINER_BIAS_NV",
+    "GL_COMBINER_AB_OUTPUT_NV",
+    "GL_COMBINER_CD_OUTPUT_NV",
+    "GL_COMBINER_SUM_OUTPUT_NV",
+    "GL_MAX_GENERAL_COMBINERS_NV",
+    "GL_NUM_GENERAL_COMBINERS_NV",
+    "GL_COLOR_SUM_CLAMP_NV",
+    "GL_COMBINER0_NV",
+    "GL_COMBINER1_NV",
+    "GL_COMBINER2_NV",
+    "GL_COMBINER3_NV",
+    "GL_COMBINER4_NV",
+    "GL_COMBINER5_NV",
+    "GL_COMBINER6_NV",
+    "GL_COMBINER7_NV",
+    "GL_PRIMITIVE_RESTART_NV",
+    "GL_PRIMITIVE_RESTART_INDEX_NV",
+    "GL_FOG_DISTANCE_MODE_NV",
+    "GL_EYE_RADIAL_NV",
+    "GL_EYE_PLANE_ABSOLUTE_NV",
+    "GL_EMBOSS_LIGHT_NV",
+    "GL_EMBOSS_CONSTANT_NV",
+    "GL_EMBOSS_MAP_NV",
+    "GL_RED_MIN_CLAMP_INGR",
+    "GL_GREEN_MIN_CLAMP_INGR",
+    "GL_BLUE_MIN_CLAMP_INGR",
+    "GL_ALPHA_MIN_CLAMP_INGR",
+    "GL_RED_MAX_CLAMP_INGR",
+    "GL_GREEN_MAX_CLAMP_INGR",
+    "GL_BLUE_MAX_CLAMP_INGR",
+    "GL_ALPHA_MAX_CLAMP_INGR",
+    "GL_INTERLACE_READ_INGR",
+    "GL_COMBINE",
+    "GL_COMBINE_RGB",
+    "GL_COMBINE_ALPHA",
+    "GL_RGB_SCALE",
+    "GL_ADD_SIGNED",
+    "GL_INTERPOLATE",
+    "GL_CONSTANT",
+    "GL_PRIMARY_COLOR",
+    "GL_PREVIOUS",
+    "GL_SOURCE0_RGB",
+    "GL_SOURCE1_RGB",
+    "GL_SOURCE2_RGB",
+    "GL_SOURCE3_RGB_NV",
+    "GL_SOURCE0_ALPHA",
+    "GL_SOURCE1_ALPHA",
+    "GL_SOURCE2_ALPHA",
+    "GL_SOURCE3_ALPHA_NV",
+    "GL_OPERAND0_RGB",
+    "GL_OPERAND1_RGB",
+    "GL_OPERAND2_RGB",
+    "GL_OPERAND3_RGB_NV",
+    "GL_OPERAND0_ALPHA",
+    "GL_OPERAND1_ALPHA",
+    "GL_OPERAND2_ALPHA",
+    "GL_OPERAND3_ALPHA_NV",
+    "GL_EXTENDED_RANGE_SGIS",
+    "GL_MIN_RED_SGIS",
+    "GL_MAX_RED_SGIS",
+    "GL_MIN_GREEN_SGIS",
+    "GL_MAX_GREEN_SGIS",
+    "GL_MIN_BLUE_SGIS",
+    "GL_MAX_BLUE_SGIS",
+    "GL_MIN_ALPHA_SGIS",
+    "GL_MAX_ALPHA_SGIS",
+    "GL_PERTURB_EXT",
+    "GL_TEXTURE_NORMAL_EXT",
+    "GL_LIGHT_MODEL_SPECULAR_VECTOR_APPLE",
+    "GL_TRANSFORM_HINT_APPLE",
+    "GL_UNPACK_CLIENT_STORAGE_APPLE",
+    "GL_BUFFER_OBJECT_APPLE",
+    "GL_STORAGE_CLIENT_APPLE",
+    "GL_VERTEX_ARRAY_BINDING",
+    "GL_TEXTURE_RANGE_LENGTH_APPLE",
+    "GL_TEXTURE_RANGE_POINTER_APPLE",
+    "GL_YCBCR_422_APPLE",
+    "GL_UNSIGNED_SHORT_8_8_MESA",
+    "GL_UNSIGNED_SHORT_8_8_REV_MESA",
+    "GL_TEXTURE_STORAGE_HINT_APPLE",
+    "GL_STORAGE_PRIVATE_APPLE",
+    "GL_STORAGE_CACHED_APPLE",
+    "GL_STORAGE_SHARED_APPLE",
+    "GL_REPLACEMENT_CODE_ARRAY_SUN",
+    "GL_REPLACEMENT_CODE_ARRAY_TYPE_SUN",
+    "GL_REPLACEMENT_CODE_ARRAY_STRIDE_SUN",
+    "GL_REPLACEMENT_CODE_ARRAY_POINTER_SUN",
+    "GL_R1UI_V3F_SUN",
+    "GL_R1UI_C4UB_V3F_SUN",
+    "GL_R1UI_C3F_V3F_SUN",
+    "GL_R1UI_N3F_V3F_SUN",
+    "GL_R1UI_C4F_N3F_V3F_SUN",
+    "GL_R1UI_T2F_V3F_SUN",
+    "GL_R1UI_T2F_N3F_V3F_SUN",
+    "GL_R1UI_T2F_C4F_N3F_V3F_SUN",
+    "GL_SLICE_ACCUM_SUN",
+    "GL_RGB_SIGNED_SGIX",
+    "GL_RGBA_SIGNED_SGIX",
+    "GL_ALPHA_SIGNED_SGIX",
+    "GL_LUMINANCE_SIGNED_SGIX",
+    "GL_INTENSITY_SIGNED_SGIX",
+    "GL_LUMINANCE_ALPHA_SIGNED_SGIX",
+    "GL_RGB16_SIGNED_SGIX",
+    "GL_RGBA16_SIGNED_SGIX",
+    "GL_ALPHA16_SIGNED_SGIX",
+    "GL_LUMINANCE16_SIGNED_SGIX",
+    "GL_INTENSITY16_SIGNED_SGIX",
+    "GL_LUMINANCE16_ALPHA16_SIGNED_SGIX",
+    "GL_RGB_EXTENDED_RANGE_SGIX",
+    "GL_RGBA_EXTENDED_RANGE_SGIX",
+    "GL_ALPHA_EXTENDED_RANGE_SGIX",
+    "GL_LUMINANCE_EXTENDED_RANGE_SGIX",
+    "GL_INTENSITY_EXTENDED_RANGE_SGIX",
+    "GL_LUMINANCE_ALPHA_EXTENDED_RANGE_SGIX",
+    "GL_RGB16_EXTENDED_RANGE_SGIX",
+    "GL_RGBA16_EXTENDED_RANGE_SGIX",
+    "GL_ALPHA16_EXTENDED_RANGE_SGIX",
+    "GL_LUMINANCE16_EXTENDED_RANGE_SGIX",
+    "GL_INTENSITY16_EXTENDED_RANGE_SGIX",
+    "GL_LUMINANCE16_ALPHA16_EXTENDED_RANGE_SGIX",
+    "GL_MIN_LUMINANCE_SGIS",
+    "GL_MAX_LUMINANCE_SGIS",
+    "GL_MIN_INTENSITY_SGIS",
+    "GL_MAX_INTENSITY_SGIS",
+    "GL_QUAD_MESH_SUN",
+    "GL_TRIANGLE_MESH_SUN",
+    "GL_VERTEX_PROGRAM_ARB",
+    "GL_VERTEX_STATE_PROGRAM_NV",
+    "GL_VERTEX_ATTRIB_ARRAY_ENABLED",
+    "GL_VERTEX_ATTRIB_ARRAY_SIZE",
+    "GL_VERTEX_ATTRIB_ARRAY_STRIDE",
+    "GL_VERTEX_ATTRIB_ARRAY_TYPE",
+    "GL_CURRENT_VERTEX_ATTRIB",
+    "GL_PROGRAM_LENGTH_ARB",
+    "GL_PROGRAM_STRING_ARB",
+    "GL_MODELVIEW_PROJECTION_NV",
+    "GL_IDENTITY_NV",
+    "GL_INVERSE_NV",
+    "GL_TRANSPOSE_NV",
+    "GL_INVERSE_TRANSPOSE_NV",
+    "GL_MAX_PROGRAM_MATRIX_STACK_DEPTH_ARB",
+    "GL_MAX_PROGRAM_MATRICES_ARB",
+    "GL_MATRIX0_NV",
+    "GL_MATRIX1_NV",
+    "GL_MATRIX2_NV",
+    "GL_MATRIX3_NV",
+    "GL_MATRIX4_NV",
+    "GL_MATRIX5_NV",
+    "GL_MATRIX6_NV",
+    "GL_MATRIX7_NV",
+    "GL_CURRENT_MATRIX_STACK_DEPTH_ARB",
+    "GL_CURRENT_MATRIX_ARB",
+    "GL_PROGRAM_POINT_SIZE",
+    "GL_VERTEX_PROGRAM_TWO_SIDE",
+    "GL_PROGRAM_PARAMETER_NV",
+    "GL_VERTEX_ATTRIB_ARRAY_POINTER",
+    "GL_PROGRAM_TARGET_NV",
+    "GL_PROGRAM_RESIDENT_NV",
+    "GL_TRACK_MATRIX_NV",
+    "GL_TRACK_MATRIX_TRANSFORM_NV",
+    "GL_VERTEX_PROGRAM_BINDING_NV",
+    "GL_PROGRAM_ERROR_POSITION_ARB",
+    "GL_OFFSET_TEXTURE_RECTANGLE_NV",
+    "GL_OFFSET_TEXTURE_RECTANGLE_SCALE_NV",
+    "GL_DOT_PRODUCT_TEXTURE_RECTANGLE_NV",
+    "GL_DEPTH_CLAMP",
+    "GL_VERTEX_ATTRIB_ARRAY0_NV",
+    "GL_VERTEX_ATTRIB_ARRAY1_NV",
+    "GL_VERTEX_ATTRIB_ARRAY2_NV",
+    "GL_VERTEX_ATTRIB_ARRAY3_NV",
+    "GL_VERTEX_ATTRIB_ARRAY4_NV",
+    "GL_VERTEX_ATTRIB_ARRAY5_NV",
+    "GL_VERTEX_ATTRIB_ARRAY6_NV",
+    "GL_VERTEX_ATTRIB_ARRAY7_NV",
+    "GL_VERTEX_ATTRIB_ARRAY8_NV",
+    "GL_VERTEX_ATTRIB_ARRAY9_NV",
+    "GL_VERTEX_ATTRIB_ARRAY10_NV",
+    "GL_VERTEX_ATTRIB_ARRAY11_NV",
+    "GL_VERTEX_ATTRIB_ARRAY12_NV",
+    "GL_VERTEX_ATTRIB_ARRAY13_NV",
+    "GL_VERTEX_ATTRIB_ARRAY14_NV",
+    "GL_VERTEX_ATTRIB_ARRAY15_NV",
+    "GL_MAP1_VERTEX_ATTRIB0_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB1_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB2_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB3_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB4_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB5_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB6_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB7_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB8_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB9_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB10_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB11_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB12_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB13_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB14_4_NV",
+    "GL_MAP1_VERTEX_ATTRIB15_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB0_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB1_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB2_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB3_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB4_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB5_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB6_4_NV",
+    "GL_PROGRAM_BINDING_ARB",
+    "GL_MAP2_VERTEX_ATTRIB8_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB9_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB10_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB11_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB12_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB13_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB14_4_NV",
+    "GL_MAP2_VERTEX_ATTRIB15_4_NV",
+    "GL_TEXTURE_COMPRESSED_IMAGE_SIZE",
+    "GL_TEXTURE_COMPRESSED",
+    "GL_NUM_COMPRESSED_TEXTURE_FORMATS",
+    "GL_COMPRESSED_TEXTURE_FORMATS",
+    "GL_MAX_VERTEX_UNITS_ARB",
+    "GL_ACTIVE_VERTEX_UNITS_ARB",
+    "GL_WEIGHT_SUM_UNITY_ARB",
+    "GL_VERTEX_BLEND_ARB",
+    "GL_CURRENT_WEIGHT_ARB",
+    "GL_WEIGHT_ARRAY_TYPE_ARB",
+    "GL_WEIGHT_ARRAY_STRIDE_ARB",
+    "GL_WEIGHT_ARRAY_SIZE_ARB",
+    "GL_WEIGHT_ARRAY_POINTER_ARB",
+    "GL_WEIGHT_ARRAY_ARB",
+    "GL_DOT3_RGB",
+    "GL_DOT3_RGBA",
+    "GL_COMPRESSED_RGB_FXT1_3DFX",
+    "GL_COMPRESSED_RGBA_FXT1_3DFX",
+    "GL_MULTISAMPLE_3DFX",
+    "GL_SAMPLE_BUFFERS_3DFX",
+    "GL_SAMPLES_3DFX",
+    "GL_EVAL_2D_NV",
+    "GL_EVAL_TRIANGULAR_2D_NV",
+    "GL_MAP_TESSELLATION_NV",
+    "GL_MAP_ATTRIB_U_ORDER_NV",
+    "GL_MAP_ATTRIB_V_ORDER_NV",
+    "GL_EVAL_FRACTIONAL_TESSELLATION_NV",
+    "GL_EVAL_VERTEX_ATTRIB0_NV",
+    "GL_EVAL_VERTEX_ATTRIB1_NV",
+    "GL_EVAL_VERTEX_ATTRIB2_NV",
+    "GL_EVAL_VERTEX_ATTRIB3_NV",
+    "GL_EVAL_VERTEX_ATTRIB4_NV",
+    "GL_EVAL_VERTEX_ATTRIB5_NV",
+    "GL_EVAL_VERTEX_ATTRIB6_NV",
+    "GL_EVAL_VERTEX_ATTRIB7_NV",
+    "GL_EVAL_VERTEX_ATTRIB8_NV",
+    "GL_EVAL_VERTEX_ATTRIB9_NV",
+    "GL_EVAL_VERTEX_ATTRIB10_NV",
+    "GL_EVAL_VERTEX_ATTRIB11_NV",
+    "GL_EVAL_VERTEX_ATTRIB12_NV",
+    "GL_EVAL_VERTEX_ATTRIB13_NV",
+    "GL_EVAL_VERTEX_ATTRIB14_NV",
+    "GL_EVAL_VERTEX_ATTRIB15_NV",
+    "GL_MAX_MAP_TESSELLATION_NV",
+    "GL_MAX_RATIONAL_EVAL_ORDER_NV",
+    "GL_MAX_PROGRAM_PATCH_ATTRIBS_NV",
+    "GL_RGBA_UNSIGNED_DOT_PRODUCT_MAPPING_NV",
+    "GL_UNSIGNED_INT_S8_S8_8_8_NV",
+    "GL_UNSIGNED_INT_8_8_S8_S8_REV_NV",
+    "GL_DSDT_MAG_INTENSITY_NV",
+    "GL_SHADER_CONSISTENT_NV",
+    "GL_TEXTURE_SHADER_NV",
+    "GL_SHADER_OPERATION_NV",
+    "GL_CULL_MODES_NV",
+    "GL_OFFSET_TEXTURE_2D_MATRIX_NV",
+    "GL_OFFSET_TEXTURE_2D_SCALE_NV",
+    "GL_OFFSET_TEXTURE_2D_BIAS_NV",
+    "GL_PREVIOUS_TEXTURE_INPUT_NV",
+    "GL_CONST_EYE_NV",
+    "GL_PASS_THROUGH_NV",
+    "GL_CULL_FRAGMENT_NV",
+    "GL_OFFSET_TEXTURE_2D_NV",
+    "GL_DEPENDENT_AR_TEXTURE_2D_NV",
+    "GL_DEPENDENT_GB_TEXTURE_2D_NV",
+    "GL_SURFACE_STATE_NV",
+    "GL_DOT_PRODUCT_NV",
+    "GL_DOT_PRODUCT_DEPTH_REPLACE_NV",
+    "GL_DOT_PRODUCT_TEXTURE_2D_NV",
+    "GL_DOT_PRODUCT_TEXTURE_3D_NV",
+    "GL_DOT_PRODUCT_TEXTURE_CUBE_MAP_NV",
+    "GL_DOT_PRODUCT_DIFFUSE_CUBE_MAP_NV",
+    "GL_DOT_PRODUCT_REFLECT_CUBE_MAP_NV",
+    "GL_DOT_PRODUCT_CONST_EYE_REFLECT_CUBE_MAP_NV",
+    "GL_HILO_NV",
+    "GL_DSDT_NV",
+    "GL_DSDT_MAG_NV",
+    "GL_DSDT_MAG_VIB_NV",
+    "GL_HILO16_NV",
+    "GL_SIGNED_HILO_NV",
+    "GL_SIGNED_HILO16_NV",
+    "GL_SIGNED_RGBA_NV",
+    "GL_SIGNED_RGBA8_NV",
+    "GL_SURFACE_REGISTERED_NV",
+    "GL_SIGNED_RGB_NV",
+    "GL_SIGNED_RGB8_NV",
+    "GL_SURFACE_MAPPED_NV",
+    "GL_SIGNED_LUMINANCE_NV",
+    "GL_SIGNED_LUMINANCE8_NV",
+    "GL_SIGNED_LUMINANCE_ALPHA_NV",
+    "GL_SIGNED_LUMINANCE8_ALPHA8_NV",
+    "GL_SIGNED_ALPHA_NV",
+    "GL_SIGNED_ALPHA8_NV",
+    "GL_SIGNED_INTENSITY_NV",
+    "GL_SIGNED_INTENSITY8_NV",
+    "GL_DSDT8_NV",
+    "GL_DSDT8_MAG8_NV",
+    "GL_DSDT8_MAG8_INTENSITY8_NV",
+    "GL_SIGNED_RGB_UNSIGNED_ALPHA_NV",
+    "GL_SIGNED_RGB8_UNSIGNED_ALPHA8_NV",
+    "GL_HI_SCALE_NV",
+    "GL_LO_SCALE_NV",
+    "GL_DS_SCALE_NV",
+    "GL_DT_SCALE_NV",
+    "GL_MAGNITUDE_SCALE_NV",
+    "GL_VIBRANCE_SCALE_NV",
+    "GL_HI_BIAS_NV",
+    "GL_LO_BIAS_NV",
+    "GL_DS_BIAS_NV",
+    "GL_DT_BIAS_NV",
+    "GL_MAGNITUDE_BIAS_NV",
+    "GL_VIBRANCE_BIAS_NV",
+    "GL_TEXTURE_BORDER_VALUES_NV",
+    "GL_TEXTURE_HI_SIZE_NV",
+    "GL_TEXTURE_LO_SIZE_NV",
+    "GL_TEXTURE_DS_SIZE_NV",
+    "GL_TEXTURE_DT_SIZE_NV",
+    "GL_TEXTURE_MAG_SIZE_NV",
+    "GL_MODELVIEW2_ARB",
+    "GL_MODELVIEW3_ARB",
+    "GL_MODELVIEW4_ARB",
+    "GL_MODELVIEW5_ARB",
+    "GL_MODELVIEW6_ARB",
+    "GL_MODELVIEW7_ARB",
+    "GL_MODELVIEW8_ARB",
+    "GL_MODELVIEW9_ARB",
+    "GL_MODELVIEW10_ARB",
+    "GL_MODELVIEW11_ARB",
+    "GL_MODELVIEW12_ARB",
+    "GL_MODELVIEW13_ARB",
+    "GL_MODELVIEW14_ARB",
+    "GL_MODELVIEW15_ARB",
+    "GL_MODELVIEW16_ARB",
+    "GL_MODELVIEW17_ARB",
+    "GL_MODELVIEW18_ARB",
+    "GL_MODELVIEW19_ARB",
+    "GL_MODELVIEW20_ARB",
+    "GL_MODELVIEW21_ARB",
+    "GL_MODELVIEW22_ARB",
+    "GL_MODELVIEW23_ARB",
+    "GL_MODELVIEW24_ARB",
+    "GL_MODELVIEW25_ARB",
+    "GL_MODELVIEW26_ARB",
+    "GL_MODELVIEW27_ARB",
+    "GL_MODELVIEW28_ARB",
+    "GL_MODELVIEW29_ARB",
+    "GL_MODELVIEW30_ARB",
+    "GL_MODELVIEW31_ARB",
+    "GL_Z400_BINARY_AMD",
+    "GL_PROGRAM_BINARY_LENGTH",
+    "GL_MIRROR_CLAMP_EXT",
+    "GL_MIRROR_CLAMP_TO_EDGE",
+    "GL_MODULATE_ADD_ATI",
+    "GL_MODULATE_SIGNED_ADD_ATI",
+    "GL_MODULATE_SUBTRACT_ATI",
+    "GL_SET_AMD",
+    "GL_REPLACE_VALUE_AMD",
+    "GL_STENCIL_OP_VALUE_AMD",
+    "GL_STENCIL_BACK_OP_VALUE_AMD",
+    "GL_VERTEX_ATTRIB_ARRAY_LONG",
+    "GL_YCBCR_MESA",
+    "GL_PACK_INVERT_MESA",
+    "GL_TEXTURE_1D_STACK_MESAX",
+    "GL_TEXTURE_2D_STACK_MESAX",
+    "GL_PROXY_TEXTURE_1D_STACK_MESAX",
+    "GL_PROXY_TEXTURE_2D_STACK_MESAX",
+    "GL_TEXTURE_1D_STACK_BINDING_MESAX",
+    "GL_TEXTURE_2D_STACK_BINDING_MESAX",
+    "GL_STATIC_ATI",
+    "GL_DYNAMIC_ATI",
+    "GL_PRESERVE_ATI",
+    "GL_DISCARD_ATI",
+    "GL_BUFFER_SIZE",
+    "GL_BUFFER_USAGE",
+    "GL_ARRAY_OBJECT_BUFFER_ATI",
+    "GL_ARRAY_OBJECT_OFFSET_ATI",
+    "GL_ELEMENT_ARRAY_ATI",
+    "GL_ELEMENT_ARRAY_TYPE_ATI",
+    "GL_ELEMENT_ARRAY_POINTER_ATI",
+    "GL_MAX_VERTEX_STREAMS_ATI",
+    "GL_VERTEX_SOURCE_ATI",
+    "GL_VERTEX_STREAM0_ATI",
+    "GL_VERTEX_STREAM1_ATI",
+    "GL_VERTEX_STREAM2_ATI",
+    "GL_VERTEX_STREAM3_ATI",
+    "GL_VERTEX_STREAM4_ATI",
+    "GL_VERTEX_STREAM5_ATI",
+    "GL_VERTEX_STREAM6_ATI",
+    "GL_VERTEX_STREAM7_ATI",
+    "GL_BUMP_ROT_MATRIX_ATI",
+    "GL_BUMP_ROT_MATRIX_SIZE_ATI",
+    "GL_BUMP_NUM_TEX_UNITS_ATI",
+    "GL_BUMP_TEX_UNITS_ATI",
+    "GL_DUDV_ATI",
+    "GL_DU8DV8_ATI",
+    "GL_BUMP_ENVMAP_ATI",
+    "GL_BUMP_TARGET_ATI",
+    "GL_VERTEX_SHADER_EXT",
+    "GL_VERTEX_SHADER_BINDING_EXT",
+    "GL_OP_INDEX_EXT",
+    "GL_OP_NEGATE_EXT",
+    "GL_OP_DOT3_EXT",
+    "GL_OP_DOT4_EXT",
+    "GL_OP_MUL_EXT",
+    "GL_OP_ADD_EXT",
+    "GL_OP_MADD_EXT",
+    "GL_OP_FRAC_EXT",
+    "GL_OP_MAX_EXT",
+    "GL_OP_MIN_EXT",
+    "GL_OP_SET_GE_EXT",
+    "GL_OP_SET_LT_EXT",
+    "GL_OP_CLAMP_EXT",
+    "GL_OP_FLOOR_EXT",
+    "GL_OP_ROUND_EXT",
+    "GL_OP_EXP_BASE_2_EXT",
+    "GL_OP_LOG_BASE_2_EXT",
+    "GL_OP_POWER_EXT",
+    "GL_OP_RECIP_EXT",
+    "GL_OP_RECIP_SQRT_EXT",
+    "GL_OP_SUB_EXT",
+    "GL_OP_CROSS_PRODUCT_EXT",
+    "GL_OP_MULTIPLY_MATRIX_EXT",
+    "GL_OP_MOV_EXT",
+    "GL_OUTPUT_VERTEX_EXT",
+    "GL_OUTPUT_COLOR0_EXT",
+    "GL_OUTPUT_COLOR1_EXT",
+    "GL_OUTPUT_TEXTURE_COORD0_EXT",
+    "GL_OUTPUT_TEXTURE_COORD1_EXT",
+    "GL_OUTPUT_TEXTURE_COORD2_EXT",
+    "GL_OUTPUT_TEXTURE_COORD3_EXT",
+    "GL_OUTPUT_TEXTURE_COORD4_EXT",
+    "GL_OUTPUT_TEXTURE_COORD5_EXT",
+    "GL_OUTPUT_TEXTURE_COORD6_EXT",
+    "GL_OUTPUT_TEXTURE_COORD7_EXT",
+    "GL_OUTPUT_TEXTURE_COORD8_EXT",
+    "GL_OUTPUT_TEXTURE_COORD9_EXT",
+    "GL_OUTPUT_TEXTURE_COORD10_EXT",
+    "GL_OUTPUT_TEXTURE_COORD11_EXT",
+    "GL_OUTPUT_TEXTURE_COORD12_EXT",
+    "GL_OUTPUT_TEXTURE_COORD13_EXT",
+    "GL_OUTPUT_TEXTURE_COORD14_EXT",
+    "GL_OUTPUT_TEXTURE_COORD15_EXT",
+    "GL_OUTPUT_TEXTURE_COORD16_EXT",
+    "GL_OUTPUT_TEXTURE_COORD17_EXT",
+    "GL_OUTPUT_TEXTURE_COORD18_EXT",
+    "GL_OUTPUT_TEXTURE_COORD19_EXT",
+    "GL_OUTPUT_TEXTURE_COORD20_EXT",
+    "GL_OUTPUT_TEXTURE_COORD21_EXT",
+    "GL_OUTPUT_TEXTURE_COORD22_EXT",
+    "GL_OUTPUT_TEXTURE_COORD23_EXT",
+    "GL_OUTPUT_TEXTURE_COORD24_EXT",
+    "GL_OUTPUT_TEXTURE_COORD25_EXT",
+    "GL_OUTPUT_TEXTURE_COORD26_EXT",
+    "GL_OUTPUT_TEXTURE_COORD27_EXT",
+    "GL_OUTPUT_TEXTURE_COORD28_EXT",
+    "GL_OUTPUT_TEXTURE_COORD29_EXT",
+    "GL_OUTPUT_TEXTURE_COORD30_EXT",
+    "GL_OUTPUT_TEXTURE_COORD31_EXT",
+    "GL_OUTPUT_FOG_EXT",
+    "GL_SCALAR_EXT",
+    "GL_VECTOR_EXT",
+    "GL_MATRIX_EXT",
+    "GL_VARIANT_EXT",
+    "GL_INVARIANT_EXT",
+    "GL_LOCAL_CONSTANT_EXT",
+    "GL_LOCAL_EXT",
+    "GL_MAX_VERTEX_SHADER_INSTRUCTIONS_EXT",
+    "GL_MAX_VERTEX_SHADER_VARIANTS_EXT",
+    "GL_MAX_VERTEX_SHADER_INVARIANTS_EXT",
+    "GL_MAX_VERTEX_SHADER_LOCAL_CONSTANTS_EXT",
+    "GL_MAX_VERTEX_SHADER_LOCALS_EXT",
+    "GL_MAX_OPTIMIZED_VERTEX_SHADER_INSTRUCTIONS_EXT",
+    "GL_MAX_OPTIMIZED_VERTEX_SHADER_VARIANTS_EXT",
+    "GL_MAX_OPTIMIZED_VERTEX_SHADER_INVARIANTS_EXT",
+    "GL_MAX_OPTIMIZED_VERTEX_SHADER_LOCAL_CONSTANTS_EXT",
+    "GL_MAX_OPTIMIZED_VERTEX_SHADER_LOCALS_EXT",
+    "GL_VERTEX_SHADER_INSTRUCTIONS_EXT",
+    "GL_VERTEX_SHADER_VARIANTS_EXT",
+    "GL_VERTEX_SHADER_INVARIANTS_EXT",
+    "GL_VERTEX_SHADER_LOCAL_CONSTANTS_EXT",
+    "GL_VERTEX_SHADER_LOCALS_EXT",
+    "GL_VERTEX_SHADER_OPTIMIZED_EXT",
+    "GL_X_EXT",
+    "GL_Y_EXT",
+    "GL_Z_EXT",
+    "GL_W_EXT",
+    "GL_NEGATIVE_X_EXT",
+    "GL_NEGATIVE_Y_EXT",
+    "GL_NEGATIVE_Z_EXT",
+    "GL_NEGATIVE_W_EXT",
+    "GL_ZERO_EXT",
+    "GL_ONE_EXT",
+    "GL_NEGATIVE_ONE_EXT",
+    "GL_NORMALIZED_RANGE_EXT",
+    "GL_FULL_RANGE_EXT",
+    "GL_CURRENT_VERTEX_EXT",
+    "GL_MVP_MATRIX_EXT",
+    "GL_VARIANT_VALUE_EXT",
+    "GL_VARIANT_DATATYPE_EXT",
+    "GL_VARIANT_ARRAY_STRIDE_EXT",
+    "GL_VARIANT_ARRAY_TYPE_EXT",
+    "GL_VARIANT_ARRAY_EXT",
+    "GL_VARIANT_ARRAY_POINTER_EXT",
+    "GL_INVARIANT_VALUE_EXT",
+    "GL_INVARIANT_DATATYPE_EXT",
+    "GL_LOCAL_CONSTANT_VALUE_EXT",
+    "GL_LOCAL_CONSTANT_DATATYPE_EXT",
+    "GL_ATC_RGBA_INTERPOLATED_ALPHA_AMD",
+    "GL_PN_TRIANGLES_ATI",
+    "GL_MAX_PN_TRIANGLES_TESSELATION_LEVEL_ATI",
+    "GL_PN_TRIANGLES_POINT_MODE_ATI",
+    "GL_PN_TRIANGLES_NORMAL_MODE_ATI",
+    "GL_PN_TRIANGLES_TESSELATION_LEVEL_ATI",
+    "GL_PN_TRIANGLES_POINT_MODE_LINEAR_ATI",
+    "GL_PN_TRIANGLES_POINT_MODE_CUBIC_ATI",
+    "GL_PN_TRIANGLES_NORMAL_MODE_LINEAR_ATI",
+    "GL_PN_TRIANGLES_NORMAL_MODE_QUADRATIC_ATI",
+    "GL_3DC_X_AMD",
+    "GL_3DC_XY_AMD",
+    "GL_VBO_FREE_MEMORY_ATI",
+    "GL_TEXTURE_FREE_MEMORY_ATI",
+    "GL_RENDERBUFFER_FREE_MEMORY_ATI",
+    "GL_NUM_PROGRAM_BINARY_FORMATS",
+    "GL_PROGRAM_BINARY_FORMATS",
+    "GL_STENCIL_BACK_FUNC",
+    "GL_STENCIL_BACK_FAIL",
+    "GL_STENCIL_BACK_PASS_DEPTH_FAIL",
+    "GL_STENCIL_BACK_PASS_DEPTH_PASS",
+    "GL_FRAGMENT_PROGRAM_ARB",
+    "GL_PROGRAM_ALU_INSTRUCTIONS_ARB",
+    "GL_PROGRAM_TEX_INSTRUCTIONS_ARB",
+    "GL_PROGRAM_TEX_INDIRECTIONS_ARB",
+    "GL_PROGRAM_NATIVE_ALU_INSTRUCTIONS_ARB",
+    "GL_PROGRAM_NATIVE_TEX_INSTRUCTIONS_ARB",
+    "GL_PROGRAM_NATIVE_TEX_INDIRECTIONS_ARB",
+    "GL_MAX_PROGRAM_ALU_INSTRUCTIONS_ARB",
+    "GL_MAX_PROGRAM_TEX_INSTRUCTIONS_ARB",
+    "GL_MAX_PROGRAM_TEX_INDIRECTIONS_ARB",
+    "GL_MAX_PROGRAM_NATIVE_ALU_INSTRUCTIONS_ARB",
+    "GL_MAX_PROGRAM_NATIVE_TEX_INSTRUCTIONS_ARB",
+    "GL_MAX_PROGRAM_NATIVE_TEX_INDIRECTIONS_ARB",
+    "GL_RGBA32F",
+    "GL_RGB32F",
+    "GL_ALPHA32F_ARB",
+    "GL_INTENSITY32F_ARB",
+    "GL_LUMINANCE32F_ARB",
+    "GL_LUMINANCE_ALPHA32F_ARB",
+    "GL_RGBA16F",
+    "GL_RGB16F",
+    "GL_ALPHA16F_ARB",
+    "GL_INTENSITY16F_ARB",
+    "GL_LUMINANCE16F_ARB",
+    "GL_LUMINANCE_ALPHA16F_ARB",
+    "GL_RGBA_FLOAT_MODE_ARB",
+    "GL_WRITEONLY_RENDERING_QCOM",
+    "GL_MAX_DRAW_BUFFERS",
+    "GL_DRAW_BUFFER0",
+    "GL_DRAW_BUFFER1",
+    "GL_DRAW_BUFFER2",
+    "GL_DRAW_BUFFER3",
+    "GL_DRAW_BUFFER4",
+    "GL_DRAW_BUFFER5",
+    "GL_DRAW_BUFFER6",
+    "GL_DRAW_BUFFER7",
+    "GL_DRAW_BUFFER8",
+    "GL_DRAW_BUFFER9",
+    "GL_DRAW_BUFFER10",
+    "GL_DRAW_BUFFER11",
+    "GL_DRAW_BUFFER12",
+    "GL_DRAW_BUFFER13",
+    "GL_DRAW_BUFFER14",
+    "GL_DRAW_BUFFER15",
+    "GL_COMPRESSED_LUMINANCE_ALPHA_3DC_ATI",
+    "GL_BLEND_EQUATION_ALPHA",
+    "GL_SUBSAMPLE_DISTANCE_AMD",
+    "GL_MATRIX_PALETTE_ARB",
+    "GL_MAX_MATRIX_PALETTE_STACK_DEPTH_ARB",
+    "GL_MAX_PALETTE_MATRICES_ARB",
+    "GL_CURRENT_PALETTE_MATRIX_ARB",
+    "GL_MATRIX_INDEX_ARRAY_ARB",
+    "GL_CURRENT_MATRIX_INDEX_ARB",
+    "GL_MATRIX_INDEX_ARRAY_SIZE_ARB",
+    "GL_MATRIX_INDEX_ARRAY_TYPE_ARB",
+    "GL_MATRIX_INDEX_ARRAY_STRIDE_ARB",
+    "GL_MATRIX_INDEX_ARRAY_POINTER_ARB",
+    "GL_TEXTURE_DEPTH_SIZE",
+    "GL_DEPTH_TEXTURE_MODE",
+    "GL_TEXTURE_COMPARE_MODE",
+    "GL_TEXTURE_COMPARE_FUNC",
+    "GL_COMPARE_R_TO_TEXTURE",
+    "GL_TEXTURE_CUBE_MAP_SEAMLESS",
+    "GL_OFFSET_PROJECTIVE_TEXTURE_2D_NV",
+    "GL_OFFSET_PROJECTIVE_TEXTURE_2D_SCALE_NV",
+    "GL_OFFSET_PROJECTIVE_TEXTURE_RECTANGLE_NV",
+    "GL_OFFSET_PROJECTIVE_TEXTURE_RECTANGLE_SCALE_NV",
+    "GL_OFFSET_HILO_TEXTURE_2D_NV",
+    "GL_OFFSET_HILO_TEXTURE_RECTANGLE_NV",
+    "GL_OFFSET_HILO_PROJECTIVE_TEXTURE_2D_NV",
+    "GL_OFFSET_HILO_PROJECTIVE_TEXTURE_RECTANGLE_NV",
+    "GL_DEPENDENT_HILO_TEXTURE_2D_NV",
+    "GL_DEPENDENT_RGB_TEXTURE_3D_NV",
+    "GL_DEPENDENT_RGB_TEXTURE_CUBE_MAP_NV",
+    "GL_DOT_PRODUCT_PASS_THROUGH_NV",
+    "GL_DOT_PRODUCT_TEXTURE_1D_NV",
+    "GL_DOT_PRODUCT_AFFINE_DEPTH_REPLACE_NV",
+    "GL_HILO8_NV",
+    "GL_SIGNED_HILO8_NV",
+    "GL_FORCE_BLUE_TO_ONE_NV",
+    "GL_POINT_SPRITE",
+    "GL_COORD_REPLACE",
+    "GL_POINT_SPRITE_R_MODE_NV",
+    "GL_QUERY_COUNTER_BITS_ARB",
+    "GL_CURRENT_QUERY",
+    "GL_QUERY_RESULT",
+    "GL_QUERY_RESULT_AVAILABLE",
+    "GL_MAX_FRAGMENT_PROGRAM_LOCAL_PARAMETERS_NV",
+    "GL_MAX_VERTEX_ATTRIBS",
+    "GL_VERTEX_ATTRIB_ARRAY_NORMALIZED",
+    "GL_MAX_TESS_CONTROL_INPUT_COMPONENTS",
+    "GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS",
+    "GL_DEPTH_STENCIL_TO_RGBA_NV",
+    "GL_DEPTH_STENCIL_TO_BGRA_NV",
+    "GL_FRAGMENT_PROGRAM_NV",
+    "GL_MAX_TEXTURE_COORDS",
+    "GL_MAX_TEXTURE_IMAGE_UNITS",
+    "GL_FRAGMENT_PROGRAM_BINDING_NV",
+    "GL_PROGRAM_ERROR_STRING_ARB",
+    "GL_PROGRAM_FORMAT_ASCII_ARB",
+    "GL_PROGRAM_FORMAT_ARB",
+    "GL_WRITE_PIXEL_DATA_RANGE_NV",
+    "GL_READ_PIXEL_DATA_RANGE_NV",
+    "GL_WRITE_PIXEL_DATA_RANGE_LENGTH_NV",
+    "GL_READ_PIXEL_DATA_RANGE_LENGTH_NV",
+    "GL_WRITE_PIXEL_DATA_RANGE_POINTER_NV",
+    "GL_READ_PIXEL_DATA_RANGE_POINTER_NV",
+    "GL_GEOMETRY_SHADER_INVOCATIONS",
+    "GL_FLOAT_R_NV",
+    "GL_FLOAT_RG_NV",
+    "GL_FLOAT_RGB_NV",
+    "GL_FLOAT_RGBA_NV",
+    "GL_FLOAT_R16_NV",
+    "GL_FLOAT_R32_NV",
+    "GL_FLOAT_RG16_NV",
+    "GL_FLOAT_RG32_NV",
+    "GL_FLOAT_RGB16_NV",
+    "GL_FLOAT_RGB32_NV",
+    "GL_FLOAT_RGBA16_NV",
+    "GL_FLOAT_RGBA32_NV",
+    "GL_TEXTURE_FLOAT_COMPONENTS_NV",
+    "GL_FLOAT_CLEAR_COLOR_VALUE_NV",
+    "GL_FLOAT_RGBA_MODE_NV",
+    "GL_TEXTURE_UNSIGNED_REMAP_MODE_NV",
+    "GL_DEPTH_BOUNDS_TEST_EXT",
+    "GL_DEPTH_BOUNDS_EXT",
+    "GL_ARRAY_BUFFER",
+    "GL_ELEMENT_ARRAY_BUFFER",
+    "GL_ARRAY_BUFFER_BINDING",
+    "GL_ELEMENT_ARRAY_BUFFER_BINDING",
+    "GL_VERTEX_ARRAY_BUFFER_BINDING",
+    "GL_NORMAL_ARRAY_BUFFER_BINDING",
+    "GL_COLOR_ARRAY_BUFFER_BINDING",
+    "GL_INDEX_ARRAY_BUFFER_BINDING",
+    "GL_TEXTURE_COORD_ARRAY_BUFFER_BINDING",
+    "GL_EDGE_FLAG_ARRAY_BUFFER_BINDING",
+    "GL_SECONDARY_COLOR_ARRAY_BUFFER_BINDING",
+    "GL_FOG_COORDINATE_ARRAY_BUFFER_BINDING",
+    "GL_WEIGHT_ARRAY_BUFFER_BINDING",
+    "GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING",
+    "GL_PROGRAM_INSTRUCTIONS_ARB",
+    "GL_MAX_PROGRAM_INSTRUCTIONS_ARB",
+    "GL_PROGRAM_NATIVE_INSTRUCTIONS_ARB",
+    "GL_MAX_PROGRAM_NATIVE_INSTRUCTIONS_ARB",
+    "GL_PROGRAM_TEMPORARIES_ARB",
+    "GL_MAX_PROGRAM_TEMPORARIES_ARB",
+    "GL_PROGRAM_NATIVE_TEMPORARIES_ARB",
+    "GL_MAX_PROGRAM_NATIVE_TEMPORARIES_ARB",
+    "GL_PROGRAM_PARAMETERS_ARB",
+    "GL_MAX_PROGRAM_PARAMETERS_ARB",
+    "GL_PROGRAM_NATIVE_PARAMETERS_ARB",
+    "GL_MAX_PROGRAM_NATIVE_PARAMETERS_ARB",
+    "GL_PROGRAM_ATTRIBS_ARB",
+    "GL_MAX_PROGRAM_ATTRIBS_ARB",
+    "GL_PROGRAM_NATIVE_ATTRIBS_ARB",
+    "GL_MAX_PROGRAM_NATIVE_ATTRIBS_ARB",
+    "GL_PROGRAM_ADDRESS_REGISTERS_ARB",
+    "GL_MAX_PROGRAM_ADDRESS_REGISTERS_ARB",
+    "GL_PROGRAM_NATIVE_ADDRESS_REGISTERS_ARB",
+    "GL_MAX_PROGRAM_NATIVE_ADDRESS_REGISTERS_ARB",
+    "GL_MAX_PROGRAM_LOCAL_PARAMETERS_ARB",
+    "GL_MAX_PROGRAM_ENV_PARAMETERS_ARB",
+    "GL_PROGRAM_UNDER_NATIVE_LIMITS_ARB",
+    "GL_TRANSPOSE_CURRENT_MATRIX_ARB",
+    "GL_READ_ONLY",
+    "GL_WRITE_ONLY",
+    "GL_READ_WRITE",
+    "GL_BUFFER_ACCESS",
+    "GL_BUFFER_MAPPED",
+    "GL_BUFFER_MAP_POINTER",
+    "GL_WRITE_DISCARD_NV",
+    "GL_TIME_ELAPSED",
+    "GL_MATRIX0_ARB",
+    "GL_MATRIX1_ARB",
+    "GL_MATRIX2_ARB",
+    "GL_MATRIX3_ARB",
+    "GL_MATRIX4_ARB",
+    "GL_MATRIX5_ARB",
+    "GL_MATRIX6_ARB",
+    "GL_MATRIX7_ARB",
+    "GL_MATRIX8_ARB",
+    "GL_MATRIX9_ARB",
+    "GL_MATRIX10_ARB",
+    "GL_MATRIX11_ARB",
+    "GL_MATRIX12_ARB",
+    "GL_MATRIX13_ARB",
+    "GL_MATRIX14_ARB",
+    "GL_MATRIX15_ARB",
+    "GL_MATRIX16_ARB",
+    "GL_MATRIX17_ARB",
+    "GL_MATRIX18_ARB",
+    "GL_MATRIX19_ARB",
+    "GL_MATRIX20_ARB",
+    "GL_MATRIX21_ARB",
+    "GL_MATRIX22_ARB",
+    "GL_MATRIX23_ARB",
+    "GL_MATRIX24_ARB",
+    "GL_MATRIX25_ARB",
+    "GL_MATRIX26_ARB",
+    "GL_MATRIX27_ARB",
+    "GL_MATRIX28_ARB",
+    "GL_MATRIX29_ARB",
+    "GL_MATRIX30_ARB",
+    "GL_MATRIX31_ARB",
+    "GL_STREAM_DRAW",
+    "GL_STREAM_READ",
+    "GL_STREAM_COPY",
+    "GL_STATIC_DRAW",
+    "GL_STATIC_READ",
+    "GL_STATIC_COPY",
+    "GL_DYNAMIC_DRAW",
+    "GL_DYNAMIC_READ",
+    "GL_DYNAMIC_COPY",
+    "GL_PIXEL_PACK_BUFFER",
+    "GL_PIXEL_UNPACK_BUFFER",
+    "GL_PIXEL_PACK_BUFFER_BINDING",
+    "GL_ETC1_SRGB8_NV",
+    "GL_PIXEL_UNPACK_BUFFER_BINDING",
+    "GL_DEPTH24_STENCIL8",
+    "GL_TEXTURE_STENCIL_SIZE",
+    "GL_STENCIL_TAG_BITS_EXT",
+    "GL_STENCIL_CLEAR_TAG_VALUE_EXT",
+    "GL_MAX_PROGRAM_EXEC_INSTRUCTIONS_NV",
+    "GL_MAX_PROGRAM_CALL_DEPTH_NV",
+    "GL_MAX_PROGRAM_IF_DEPTH_NV",
+    "GL_MAX_PROGRAM_LOOP_DEPTH_NV",
+    "GL_MAX_PROGRAM_LOOP_COUNT_NV",
+    "GL_SRC1_COLOR",
+    "GL_ONE_MINUS_SRC1_COLOR",
+    "GL_ONE_MINUS_SRC1_ALPHA",
+    "GL_MAX_DUAL_SOURCE_DRAW_BUFFERS",
+    "GL_VERTEX_ATTRIB_ARRAY_INTEGER",
+    "GL_VERTEX_ATTRIB_ARRAY_DIVISOR",
+    "GL_MAX_ARRAY_TEXTURE_LAYERS",
+    "GL_MIN_PROGRAM_TEXEL_OFFSET",
+    "GL_MAX_PROGRAM_TEXEL_OFFSET",
+    "GL_PROGRAM_ATTRIB_COMPONENTS_NV",
+    "GL_PROGRAM_RESULT_COMPONENTS_NV",
+    "GL_MAX_PROGRAM_ATTRIB_COMPONENTS_NV",
+    "GL_MAX_PROGRAM_RESULT_COMPONENTS_NV",
+    "GL_NVIDIA_PLATFORM_BINARY_NV",
+    "GL_CG_VERTEX_SHADER_EXT",
+    "GL_CG_FRAGMENT_SHADER_EXT",
+    "GL_STENCIL_TEST_TWO_SIDE_EXT",
+    "GL_ACTIVE_STENCIL_FACE_EXT",
+    "GL_MIRROR_CLAMP_TO_BORDER_EXT",
+    "GL_SAMPLES_PASSED",
+    "GL_GEOMETRY_VERTICES_OUT",
+    "GL_GEOMETRY_INPUT_TYPE",
+    "GL_GEOMETRY_OUTPUT_TYPE",
+    "GL_SAMPLER_BINDING",
+    "GL_CLAMP_VERTEX_COLOR",
+    "GL_CLAMP_FRAGMENT_COLOR",
+    "GL_CLAMP_READ_COLOR",
+    "GL_FIXED_ONLY",
+    "GL_TESS_CONTROL_PROGRAM_NV",
+    "GL_TESS_EVALUATION_PROGRAM_NV",
+    "GL_FRAGMENT_SHADER_ATI",
+    "GL_REG_0_ATI",
+    "GL_REG_1_ATI",
+    "GL_REG_2_ATI",
+    "GL_REG_3_ATI",
+    "GL_REG_4_ATI",
+    "GL_REG_5_ATI",
+    "GL_CON_0_ATI",
+    "GL_CON_1_ATI",
+    "GL_CON_2_ATI",
+    "GL_CON_3_ATI",
+    "GL_CON_4_ATI",
+    "GL_CON_5_ATI",
+    "GL_CON_6_ATI",
+    "GL_CON_7_ATI",
+    "GL_MOV_ATI",
+    "GL_ADD_ATI",
+    "GL_MUL_ATI",
+    "GL_SUB_ATI",
+    "GL_DOT3_ATI",
+    "GL_DOT4_ATI",
+    "GL_MAD_ATI",
+    "GL_LERP_ATI",
+    "GL_CND_ATI",
+    "GL_CND0_ATI",
+    "GL_DOT2_ADD_ATI",
+    "GL_SECONDARY_INTERPOLATOR_ATI",
+    "GL_NUM_FRAGMENT_REGISTERS_ATI",
+    "GL_NUM_FRAGMENT_CONSTANTS_ATI",
+    "GL_NUM_PASSES_ATI",
+    "GL_NUM_INSTRUCTIONS_PER_PASS_ATI",
+    "GL_NUM_INSTRUCTIONS_TOTAL_ATI",
+    "GL_NUM_INPUT_INTERPOLATOR_COMPONENTS_ATI",
+    "GL_NUM_LOOPBACK_COMPONENTS_ATI",
+    "GL_COLOR_ALPHA_PAIRING_ATI",
+    "GL_SWIZZLE_STR_ATI",
+    "GL_SWIZZLE_STQ_ATI",
+    "GL_SWIZZLE_STR_DR_ATI",
+    "GL_SWIZZLE_STQ_DQ_ATI",
+    "GL_SWIZZLE_STRQ_ATI",
+    "GL_SWIZZLE_STRQ_DQ_ATI",
+    "GL_INTERLACE_OML",
+    "GL_INTERLACE_READ_OML",
+    "GL_FORMAT_SUBSAMPLE_24_24_OML",
+    "GL_FORMAT_SUBSAMPLE_244_244_OML",
+    "GL_PACK_RESAMPLE_OML",
+    "GL_UNPACK_RESAMPLE_OML",
+    "GL_RESAMPLE_REPLICATE_OML",
+    "GL_RESAMPLE_ZERO_FILL_OML",
+    "GL_RESAMPLE_AVERAGE_OML",
+    "GL_RESAMPLE_DECIMATE_OML",
+    "GL_POINT_SIZE_ARRAY_TYPE_OES",
+    "GL_POINT_SIZE_ARRAY_STRIDE_OES",
+    "GL_POINT_SIZE_ARRAY_POINTER_OES",
+    "GL_VERTEX_ATTRIB_MAP1_APPLE",
+    "GL_VERTEX_ATTRIB_MAP2_APPLE",
+    "GL_VERTEX_ATTRIB_MAP1_SIZE_APPLE",
+    "GL_VERTEX_ATTRIB_MAP1_COEFF_APPLE",
+    "GL_VERTEX_ATTRIB_MAP1_ORDER_APPLE",
+    "GL_VERTEX_ATTRIB_MAP1_DOMAIN_APPLE",
+    "GL_VERTEX_ATTRIB_MAP2_SIZE_APPLE",
+    "GL_VERTEX_ATTRIB_MAP2_COEFF_APPLE",
+    "GL_VERTEX_ATTRIB_MAP2_ORDER_APPLE",
+    "GL_VERTEX_ATTRIB_MAP2_DOMAIN_APPLE",
+    "GL_DRAW_PIXELS_APPLE",
+    "GL_FENCE_APPLE",
+    "GL_ELEMENT_ARRAY_APPLE",
+    "GL_ELEMENT_ARRAY_TYPE_APPLE",
+    "GL_ELEMENT_ARRAY_POINTER_APPLE",
+    "GL_COLOR_FLOAT_APPLE",
+    "GL_MIN_PBUFFER_VIEWPORT_DIMS_APPLE",
+    "GL_UNIFORM_BUFFER",
+    "GL_BUFFER_SERIALIZED_MODIFY_APPLE",
+    "GL_BUFFER_FLUSHING_UNMAP_APPLE",
+    "GL_AUX_DEPTH_STENCIL_APPLE",
+    "GL_PACK_ROW_BYTES_APPLE",
+    "GL_UNPACK_ROW_BYTES_APPLE",
+    "GL_RELEASED_APPLE",
+    "GL_VOLATILE_APPLE",
+    "GL_RETAINED_APPLE",
+    "GL_UNDEFINED_APPLE",
+    "GL_PURGEABLE_APPLE",
+    "GL_RGB_422_APPLE",
+    "GL_UNIFORM_BUFFER_BINDING",
+    "GL_UNIFORM_BUFFER_START",
+    "GL_UNIFORM_BUFFER_SIZE",
+    "GL_MAX_VERTEX_UNIFORM_BLOCKS",
+    "GL_MAX_GEOMETRY_UNIFORM_BLOCKS",
+    "GL_MAX_FRAGMENT_UNIFORM_BLOCKS",
+    "GL_MAX_COMBINED_UNIFORM_BLOCKS",
+    "GL_MAX_UNIFORM_BUFFER_BINDINGS",
+    "GL_MAX_UNIFORM_BLOCK_SIZE",
+    "GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS",
+    "GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS",
+    "GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS",
+    "GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT",
+    "GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH",
+    "GL_ACTIVE_UNIFORM_BLOCKS",
+    "GL_UNIFORM_TYPE",
+    "GL_UNIFORM_SIZE",
+    "GL_UNIFORM_NAME_LENGTH",
+    "GL_UNIFORM_BLOCK_INDEX",
+    "GL_UNIFORM_OFFSET",
+    "GL_UNIFORM_ARRAY_STRIDE",
+    "GL_UNIFORM_MATRIX_STRIDE",
+    "GL_UNIFORM_IS_ROW_MAJOR",
+    "GL_UNIFORM_BLOCK_BINDING",
+    "GL_UNIFORM_BLOCK_DATA_SIZE",
+    "GL_UNIFORM_BLOCK_NAME_LENGTH",
+    "GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS",
+    "GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES",
+    "GL_UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER",
+    "GL_UNIFORM_BLOCK_REFERENCED_BY_GEOMETRY_SHADER",
+    "GL_UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER",
+    "GL_TEXTURE_SRGB_DECODE_EXT",
+    "GL_DECODE_EXT",
+    "GL_SKIP_DECODE_EXT",
+    "GL_PROGRAM_PIPELINE_OBJECT_EXT",
+    "GL_FRAGMENT_SHADER_DISCARDS_SAMPLES_EXT",
+    "GL_SYNC_OBJECT_APPLE",
+    "GL_FRAGMENT_SHADER",
+    "GL_VERTEX_SHADER",
+    "GL_PROGRAM_OBJECT_ARB",
+    "GL_SHADER_OBJECT_ARB",
+    "GL_MAX_FRAGMENT_UNIFORM_COMPONENTS",
+    "GL_MAX_VERTEX_UNIFORM_COMPONENTS",
+    "GL_MAX_VARYING_FLOATS",
+    "GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS",
+    "GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS",
+    "GL_OBJECT_TYPE_ARB",
+    "GL_SHADER_TYPE",
+    "GL_FLOAT_VEC2",
+    "GL_FLOAT_VEC3",
+    "GL_FLOAT_VEC4",
+    "GL_INT_VEC2",
+    "GL_INT_VEC3",
+    "GL_INT_VEC4",
+    "GL_BOOL",
+    "GL_BOOL_VEC2",
+    "GL_BOOL_VEC3",
+    "GL_BOOL_VEC4",
+    "GL_FLOAT_MAT2",
+    "GL_FLOAT_MAT3",
+    "GL_FLOAT_MAT4",
+    "GL_SAMPLER_1D",
+    "GL_SAMPLER_2D",
+    "GL_SAMPLER_3D",
+    "GL_SAMPLER_CUBE",
+    "GL_SAMPLER_1D_SHADOW",
+    "GL_SAMPLER_2D_SHADOW",
+    "GL_SAMPLER_2D_RECT",
+    "GL_SAMPLER_2D_RECT_SHADOW",
+    "GL_FLOAT_MAT2x3",
+    "GL_FLOAT_MAT2x4",
+    "GL_FLOAT_MAT3x2",
+    "GL_FLOAT_MAT3x4",
+    "GL_FLOAT_MAT4x2",
+    "GL_FLOAT_MAT4x3",
+    "GL_DELETE_STATUS",
+    "GL_COMPILE_STATUS",
+    "GL_LINK_STATUS",
+    "GL_VALIDATE_STATUS",
+    "GL_INFO_LOG_LENGTH",
+    "GL_ATTACHED_SHADERS",
+    "GL_ACTIVE_UNIFORMS",
+    "GL_ACTIVE_UNIFORM_MAX_LENGTH",
+    "GL_SHADER_SOURCE_LENGTH",
+    "GL_ACTIVE_ATTRIBUTES",
+    "GL_ACTIVE_ATTRIBUTE_MAX_LENGTH",
+    "GL_FRAGMENT_SHADER_DERIVATIVE_HINT",
+    "GL_SHADING_LANGUAGE_VERSION",
+    "GL_CURRENT_PROGRAM",
+    "GL_PALETTE4_RGB8_OES",
+    "GL_PALETTE4_RGBA8_OES",
+    "GL_PALETTE4_R5_G6_B5_OES",
+    "GL_PALETTE4_RGBA4_OES",
+    "GL_PALETTE4_RGB5_A1_OES",
+    "GL_PALETTE8_RGB8_OES",
+    "GL_PALETTE8_RGBA8_OES",
+    "GL_PALETTE8_R5_G6_B5_OES",
+    "GL_PALETTE8_RGBA4_OES",
+    "GL_PALETTE8_RGB5_A1_OES",
+    "GL_IMPLEMENTATION_COLOR_READ_TYPE",
+    "GL_IMPLEMENTATION_COLOR_READ_FORMAT",
+    "GL_POINT_SIZE_ARRAY_OES",
+    "GL_TEXTURE_CROP_RECT_OES",
+    "GL_MATRIX_INDEX_ARRAY_BUFFER_BINDING_OES",
+    "GL_POINT_SIZE_ARRAY_BUFFER_BINDING_OES",
+    "GL_COUNTER_TYPE_AMD",
+    "GL_COUNTER_RANGE_AMD",
+    "GL_UNSIGNED_INT64_AMD",
+    "GL_PERCENTAGE_AMD",
+    "GL_PERFMON_RESULT_AVAILABLE_AMD",
+    "GL_PERFMON_RESULT_SIZE_AMD",
+    "GL_PERFMON_RESULT_AMD",
+    "GL_TEXTURE_WIDTH_QCOM",
+    "GL_TEXTURE_HEIGHT_QCOM",
+    "GL_TEXTURE_DEPTH_QCOM",
+    "GL_TEXTURE_INTERNAL_FORMAT_QCOM",
+    "GL_TEXTURE_FORMAT_QCOM",
+    "GL_TEXTURE_TYPE_QCOM",
+    "GL_TEXTURE_IMAGE_VALID_QCOM",
+    "GL_TEXTURE_NUM_LEVELS_QCOM",
+    "GL_TEXTURE_TARGET_QCOM",
+    "GL_TEXTURE_OBJECT_VALID_QCOM",
+    "GL_STATE_RESTORE",
+    "GL_COMPRESSED_RGB_PVRTC_4BPPV1_IMG",
+    "GL_COMPRESSED_RGB_PVRTC_2BPPV1_IMG",
+    "GL_COMPRESSED_RGBA_PVRTC_4BPPV1_IMG",
+    "GL_COMPRESSED_RGBA_PVRTC_2BPPV1_IMG",
+    "GL_MODULATE_COLOR_IMG",
+    "GL_RECIP_ADD_SIGNED_ALPHA_IMG",
+    "GL_TEXTURE_ALPHA_MODULATE_IMG",
+    "GL_FACTOR_ALPHA_MODULATE_IMG",
+    "GL_FRAGMENT_ALPHA_MODULATE_IMG",
+    "GL_ADD_BLEND_IMG",
+    "GL_SGX_BINARY_IMG",
+    "GL_TEXTURE_RED_TYPE",
+    "GL_TEXTURE_GREEN_TYPE",
+    "GL_TEXTURE_BLUE_TYPE",
+    "GL_TEXTURE_ALPHA_TYPE",
+    "GL_TEXTURE_LUMINANCE_TYPE",
+    "GL_TEXTURE_INTENSITY_TYPE",
+    "GL_TEXTURE_DEPTH_TYPE",
+    "GL_UNSIGNED_NORMALIZED",
+    "GL_TEXTURE_1D_ARRAY",
+    "GL_PROXY_TEXTURE_1D_ARRAY",
+    "GL_TEXTURE_2D_ARRAY",
+    "GL_PROXY_TEXTURE_2D_ARRAY",
+    "GL_TEXTURE_BINDING_1D_ARRAY",
+    "GL_TEXTURE_BINDING_2D_ARRAY",
+    "GL_GEOMETRY_PROGRAM_NV",
+    "GL_MAX_PROGRAM_OUTPUT_VERTICES_NV",
+    "GL_MAX_PROGRAM_TOTAL_OUTPUT_COMPONENTS_NV",
+    "GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS",
+    "GL_TEXTURE_BUFFER",
+    "GL_MAX_TEXTURE_BUFFER_SIZE",
+    "GL_TEXTURE_BINDING_BUFFER",
+    "GL_TEXTURE_BUFFER_DATA_STORE_BINDING",
+    "GL_TEXTURE_BUFFER_FORMAT",
+    "GL_ANY_SAMPLES_PASSED",
+    "GL_SAMPLE_SHADING",
+    "GL_MIN_SAMPLE_SHADING_VALUE",
+    "GL_R11F_G11F_B10F",
+    "GL_UNSIGNED_INT_10F_11F_11F_REV",
+    "GL_RGBA_SIGNED_COMPONENTS_EXT",
+    "GL_RGB9_E5",
+    "GL_UNSIGNED_INT_5_9_9_9_REV",
+    "GL_TEXTURE_SHARED_SIZE",
+    "GL_SRGB",
+    "GL_SRGB8",
+    "GL_SRGB_ALPHA",
+    "GL_SRGB8_ALPHA8",
+    "GL_SLUMINANCE_ALPHA",
+    "GL_SLUMINANCE8_ALPHA8",
+    "GL_SLUMINANCE",
+    "GL_SLUMINANCE8",
+    "GL_COMPRESSED_SRGB",
+    "GL_COMPRESSED_SRGB_ALPHA",
+    "GL_COMPRESSED_SLUMINANCE",
+    "GL_COMPRESSED_SLUMINANCE_ALPHA",
+    "GL_COMPRESSED_SRGB_S3TC_DXT1_EXT",
+    "GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT",
+    "GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT",
+    "GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT",
+    "GL_COMPRESSED_LUMINANCE_LATC1_EXT",
+    "GL_COMPRESSED_SIGNED_LUMINANCE_LATC1_EXT",
+    "GL_COMPRESSED_LUMINANCE_ALPHA_LATC2_EXT",
+    "GL_COMPRESSED_SIGNED_LUMINANCE_ALPHA_LATC2_EXT",
+    "GL_TESS_CONTROL_PROGRAM_PARAMETER_BUFFER_NV",
+    "GL_TESS_EVALUATION_PROGRAM_PARAMETER_BUFFER_NV",
+    "GL_TRANSFORM_FEEDBACK_VARYING_MAX_LENGTH",
+    "GL_BACK_PRIMARY_COLOR_NV",
+    "GL_BACK_SECONDARY_COLOR_NV",
+    "GL_TEXTURE_COORD_NV",
+    "GL_CLIP_DISTANCE_NV",
+    "GL_VERTEX_ID_NV",
+    "GL_PRIMITIVE_ID_NV",
+    "GL_GENERIC_ATTRIB_NV",
+    "GL_TRANSFORM_FEEDBACK_ATTRIBS_NV",
+    "GL_TRANSFORM_FEEDBACK_BUFFER_MODE",
+    "GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS",
+    "GL_ACTIVE_VARYINGS_NV",
+    "GL_ACTIVE_VARYING_MAX_LENGTH_NV",
+    "GL_TRANSFORM_FEEDBACK_VARYINGS",
+    "GL_TRANSFORM_FEEDBACK_BUFFER_START",
+    "GL_TRANSFORM_FEEDBACK_BUFFER_SIZE",
+    "GL_TRANSFORM_FEEDBACK_RECORD_NV",
+    "GL_PRIMITIVES_GENERATED",
+    "GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN",
+    "GL_RASTERIZER_DISCARD",
+    "GL_MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS",
+    "GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS",
+    "GL_INTERLEAVED_ATTRIBS",
+    "GL_SEPARATE_ATTRIBS",
+    "GL_TRANSFORM_FEEDBACK_BUFFER",
+    "GL_TRANSFORM_FEEDBACK_BUFFER_BINDING",
+    "GL_ATC_RGB_AMD",
+    "GL_ATC_RGBA_EXPLICIT_ALPHA_AMD",
+    "GL_POINT_SPRITE_COORD_ORIGIN",
+    "GL_LOWER_LEFT",
+    "GL_UPPER_LEFT",
+    "GL_STENCIL_BACK_REF",
+    "GL_STENCIL_BACK_VALUE_MASK",
+    "GL_STENCIL_BACK_WRITEMASK",
+    "GL_DRAW_FRAMEBUFFER_BINDING",
+    "GL_RENDERBUFFER_BINDING",
+    "GL_READ_FRAMEBUFFER",
+    "GL_DRAW_FRAMEBUFFER",
+    "GL_READ_FRAMEBUFFER_BINDING",
+    "GL_RENDERBUFFER_SAMPLES",
+    "GL_DEPTH_COMPONENT32F",
+    "GL_DEPTH32F_STENCIL8",
+    "GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE",
+    "GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME",
+    "GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL",
+    "GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE",
+    "GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER",
+    "GL_FRAMEBUFFER_COMPLETE",
+    "GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT",
+    "GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT",
+    "GL_FRAMEBUFFER_INCOMPLETE_DIMENSIONS_EXT",
+    "GL_FRAMEBUFFER_INCOMPLETE_FORMATS_EXT",
+    "GL_FRAMEBUFFER_INCOMPLETE_DRAW_BUFFER",
+    "GL_FRAMEBUFFER_INCOMPLETE_READ_BUFFER",
+    "GL_FRAMEBUFFER_UNSUPPORTED",
+    "GL_MAX_COLOR_ATTACHMENTS",
+    "GL_COLOR_ATTACHMENT0",
+    "GL_COLOR_ATTACHMENT1",
+    "GL_COLOR_ATTACHMENT2",
+    "GL_COLOR_ATTACHMENT3",
+    "GL_COLOR_ATTACHMENT4",
+    "GL_COLOR_ATTACHMENT5",
+    "GL_COLOR_ATTACHMENT6",
+    "GL_COLOR_ATTACHMENT7",
+    "GL_COLOR_ATTACHMENT8",
+    "GL_COLOR_ATTACHMENT9",
+    "GL_COLOR_ATTACHMENT10",
+    "GL_COLOR_ATTACHMENT11",
+    "GL_COLOR_ATTACHMENT12",
+    "GL_COLOR_ATTACHMENT13",
+    "GL_COLOR_ATTACHMENT14",
+    "GL_COLOR_ATTACHMENT15",
+    "GL_DEPTH_ATTACHMENT",
+    "GL_STENCIL_ATTACHMENT",
+    "GL_FRAMEBUFFER",
+    "GL_RENDERBUFFER",
+    "GL_RENDERBUFFER_WIDTH",
+    "GL_RENDERBUFFER_HEIGHT",
+    "GL_RENDERBUFFER_INTERNAL_FORMAT",
+    "GL_STENCIL_INDEX1",
+    "GL_STENCIL_INDEX4",
+    "GL_STENCIL_INDEX8",
+    "GL_STENCIL_INDEX16",
+    "GL_RENDERBUFFER_RED_SIZE",
+    "GL_RENDERBUFFER_GREEN_SIZE",
+    "GL_RENDERBUFFER_BLUE_SIZE",
+    "GL_RENDERBUFFER_ALPHA_SIZE",
+    "GL_RENDERBUFFER_DEPTH_SIZE",
+    "GL_RENDERBUFFER_STENCIL_SIZE",
+    "GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE",
+    "GL_MAX_SAMPLES",
+    "GL_TEXTURE_GEN_STR_OES",
+    "GL_HALF_FLOAT_OES",
+    "GL_RGB565",
+    "GL_ETC1_RGB8_OES",
+    "GL_TEXTURE_EXTERNAL_OES",
+    "GL_SAMPLER_EXTERNAL_OES",
+    "GL_TEXTURE_BINDING_EXTERNAL_OES",
+    "GL_REQUIRED_TEXTURE_IMAGE_UNITS_OES",
+    "GL_PRIMITIVE_RESTART_FIXED_INDEX",
+    "GL_ANY_SAMPLES_PASSED_CONSERVATIVE",
+    "GL_MAX_ELEMENT_INDEX",
+    "GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SAMPLES_EXT",
+    "GL_RGBA32UI",
+    "GL_RGB32UI",
+    "GL_ALPHA32UI_EXT",
+    "GL_INTENSITY32UI_EXT",
+    "GL_LUMINANCE32UI_EXT",
+    "GL_LUMINANCE_ALPHA32UI_EXT",
+    "GL_RGBA16UI",
+    "GL_RGB16UI",
+    "GL_ALPHA16UI_EXT",
+    "GL_INTENSITY16UI_EXT",
+    "GL_LUMINANCE16UI_EXT",
+    "GL_LUMINANCE_ALPHA16UI_EXT",
+    "GL_RGBA8UI",
+    "GL_RGB8UI",
+    "GL_ALPHA8UI_EXT",
+    "GL_INTENSITY8UI_EXT",
+    "GL_LUMINANCE8UI_EXT",
+    "GL_LUMINANCE_ALPHA8UI_EXT",
+    "GL_RGBA32I",
+    "GL_RGB32I",
+    "GL_ALPHA32I_EXT",
+    "GL_INTENSITY32I_EXT",
+    "GL_LUMINANCE32I_EXT",
+    "GL_LUMINANCE_ALPHA32I_EXT",
+    "GL_RGBA16I",
+    "GL_RGB16I",
+    "GL_ALPHA16I_EXT",
+    "GL_INTENSITY16I_EXT",
+    "GL_LUMINANCE16I_EXT",
+    "GL_LUMINANCE_ALPHA16I_EXT",
+    "GL_RGBA8I",
+    "GL_RGB8I",
+    "GL_ALPHA8I_EXT",
+    "GL_INTENSITY8I_EXT",
+    "GL_LUMINANCE8I_EXT",
+    "GL_LUMINANCE_ALPHA8I_EXT",
+    "GL_RED_INTEGER",
+    "GL_GREEN_INTEGER",
+    "GL_BLUE_INTEGER",
+    "GL_ALPHA_INTEGER",
+    "GL_RGB_INTEGER",
+    "GL_RGBA_INTEGER",
+    "GL_BGR_INTEGER",
+    "GL_BGRA_INTEGER",
+    "GL_LUMINANCE_INTEGER_EXT",
+    "GL_LUMINANCE_ALPHA_INTEGER_EXT",
+    "GL_RGBA_INTEGER_MODE_EXT",
+    "GL_INT_2_10_10_10_REV",
+    "GL_MAX_PROGRAM_PARAMETER_BUFFER_BINDINGS_NV",
+    "GL_MAX_PROGRAM_PARAMETER_BUFFER_SIZE_NV",
+    "GL_VERTEX_PROGRAM_PARAMETER_BUFFER_NV",
+    "GL_GEOMETRY_PROGRAM_PARAMETER_BUFFER_NV",
+    "GL_FRAGMENT_PROGRAM_PARAMETER_BUFFER_NV",
+    "GL_MAX_PROGRAM_GENERIC_ATTRIBS_NV",
+    "GL_MAX_PROGRAM_GENERIC_RESULTS_NV",
+    "GL_FRAMEBUFFER_ATTACHMENT_LAYERED",
+    "GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS",
+    "GL_FRAMEBUFFER_INCOMPLETE_LAYER_COUNT_ARB",
+    "GL_DEPTH_COMPONENT32F_NV",
+    "GL_DEPTH32F_STENCIL8_NV",
+    "GL_FLOAT_32_UNSIGNED_INT_24_8_REV",
+    "GL_SHADER_INCLUDE_ARB",
+    "GL_DEPTH_BUFFER_FLOAT_MODE_NV",
+    "GL_FRAMEBUFFER_SRGB",
+    "GL_FRAMEBUFFER_SRGB_CAPABLE_EXT",
+    "GL_COMPRESSED_RED_RGTC1",
+    "GL_COMPRESSED_SIGNED_RED_RGTC1",
+    "GL_COMPRESSED_RG_RGTC2",
+    "GL_COMPRESSED_SIGNED_RG_RGTC2",
+    "GL_SAMPLER_1D_ARRAY",
+    "GL_SAMPLER_2D_ARRAY",
+    "GL_SAMPLER_BUFFER",
+    "GL_SAMPLER_1D_ARRAY_SHADOW",
+    "GL_SAMPLER_2D_ARRAY_SHADOW",
+    "GL_SAMPLER_CUBE_SHADOW",
+    "GL_UNSIGNED_INT_VEC2",
+    "GL_UNSIGNED_INT_VEC3",
+    "GL_UNSIGNED_INT_VEC4",
+    "GL_INT_SAMPLER_1D",
+    "GL_INT_SAMPLER_2D",
+    "GL_INT_SAMPLER_3D",
+    "GL_INT_SAMPLER_CUBE",
+    "GL_INT_SAMPLER_2D_RECT",
+    "GL_INT_SAMPLER_1D_ARRAY",
+    "GL_INT_SAMPLER_2D_ARRAY",
+    "GL_INT_SAMPLER_BUFFER",
+    "GL_UNSIGNED_INT_SAMPLER_1D",
+    "GL_UNSIGNED_INT_SAMPLER_2D",
+    "GL_UNSIGNED_INT_SAMPLER_3D",
+    "GL_UNSIGNED_INT_SAMPLER_CUBE",
+    "GL_UNSIGNED_INT_SAMPLER_2D_RECT",
+    "GL_UNSIGNED_INT_SAMPLER_1D_ARRAY",
+    "GL_UNSIGNED_INT_SAMPLER_2D_ARRAY",
+    "GL_UNSIGNED_INT_SAMPLER_BUFFER",
+    "GL_GEOMETRY_SHADER",
+    "GL_GEOMETRY_VERTICES_OUT_ARB",
+    "GL_GEOMETRY_INPUT_TYPE_ARB",
+    "GL_GEOMETRY_OUTPUT_TYPE_ARB",
+    "GL_MAX_GEOMETRY_VARYING_COMPONENTS_ARB",
+    "GL_MAX_VERTEX_VARYING_COMPONENTS_ARB",
+    "GL_MAX_GEOMETRY_UNIFORM_COMPONENTS",
+    "GL_MAX_GEOMETRY_OUTPUT_VERTICES",
+    "GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS",
+    "GL_MAX_VERTEX_BINDABLE_UNIFORMS_EXT",
+    "GL_MAX_FRAGMENT_BINDABLE_UNIFORMS_EXT",
+    "GL_MAX_GEOMETRY_BINDABLE_UNIFORMS_EXT",
+    "GL_ACTIVE_SUBROUTINES",
+    "GL_ACTIVE_SUBROUTINE_UNIFORMS",
+    "GL_MAX_SUBROUTINES",
+    "GL_MAX_SUBROUTINE_UNIFORM_LOCATIONS",
+    "GL_NAMED_STRING_LENGTH_ARB",
+    "GL_NAMED_STRING_TYPE_ARB",
+    "GL_MAX_BINDABLE_UNIFORM_SIZE_EXT",
+    "GL_UNIFORM_BUFFER_EXT",
+    "GL_UNIFORM_BUFFER_BINDING_EXT",
+    "GL_LOW_FLOAT",
+    "GL_MEDIUM_FLOAT",
+    "GL_HIGH_FLOAT",
+    "GL_LOW_INT",
+    "GL_MEDIUM_INT",
+    "GL_HIGH_INT",
+    "GL_UNSIGNED_INT_10_10_10_2_OES",
+    "GL_INT_10_10_10_2_OES",
+    "GL_SHADER_BINARY_FORMATS",
+    "GL_NUM_SHADER_BINARY_FORMATS",
+    "GL_SHADER_COMPILER",
+    "GL_MAX_VERTEX_UNIFORM_VECTORS",
+    "GL_MAX_VARYING_VECTORS",
+    "GL_MAX_FRAGMENT_UNIFORM_VECTORS",
+    "GL_RENDERBUFFER_COLOR_SAMPLES_NV",
+    "GL_MAX_MULTISAMPLE_COVERAGE_MODES_NV",
+    "GL_MULTISAMPLE_COVERAGE_MODES_NV",
+    "GL_QUERY_WAIT",
+    "GL_QUERY_NO_WAIT",
+    "GL_QUERY_BY_REGION_WAIT",
+    "GL_QUERY_BY_REGION_NO_WAIT",
+    "GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS",
+    "GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS",
+    "GL_COLOR_SAMPLES_NV",
+    "GL_TRANSFORM_FEEDBACK",
+    "GL_TRANSFORM_FEEDBACK_BUFFER_PAUSED",
+    "GL_TRANSFORM_FEEDBACK_BUFFER_ACTIVE",
+    "GL_TRANSFORM_FEEDBACK_BINDING",
+    "GL_FRAME_NV",
+    "GL_FIELDS_NV",
+    "GL_TIMESTAMP",
+    "GL_NUM_FILL_STREAMS_NV",
+    "GL_PRESENT_TIME_NV",
+    "GL_PRESENT_DURATION_NV",
+    "GL_DEPTH_COMPONENT16_NONLINEAR_NV",
+    "GL_PROGRAM_MATRIX_EXT",
+    "GL_TRANSPOSE_PROGRAM_MATRIX_EXT",
+    "GL_PROGRAM_MATRIX_STACK_DEPTH_EXT",
+    "GL_TEXTURE_SWIZZLE_R",
+    "GL_TEXTURE_SWIZZLE_G",
+    "GL_TEXTURE_SWIZZLE_B",
+    "GL_TEXTURE_SWIZZLE_A",
+    "GL_TEXTURE_SWIZZLE_RGBA",
+    "GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS",
+    "GL_ACTIVE_SUBROUTINE_MAX_LENGTH",
+    "GL_ACTIVE_SUBROUTINE_UNIFORM_MAX_LENGTH",
+    "GL_NUM_COMPATIBLE_SUBROUTINES",
+    "GL_COMPATIBLE_SUBROUTINES",
+    "GL_QUADS_FOLLOW_PROVOKING_VERTEX_CONVENTION",
+    "GL_FIRST_VERTEX_CONVENTION",
+    "GL_LAST_VERTEX_CONVENTION",
+    "GL_PROVOKING_VERTEX",
+    "GL_SAMPLE_POSITION",
+    "GL_SAMPLE_MASK",
+    "GL_SAMPLE_MASK_VALUE",
+    "GL_TEXTURE_BINDING_RENDERBUFFER_NV",
+    "GL_TEXTURE_RENDERBUFFER_DATA_STORE_BINDING_NV",
+    "GL_TEXTURE_RENDERBUFFER_NV",
+    "GL_SAMPLER_RENDERBUFFER_NV",
+    "GL_INT_SAMPLER_RENDERBUFFER_NV",
+    "GL_UNSIGNED_INT_SAMPLER_RENDERBUFFER_NV",
+    "GL_MAX_SAMPLE_MASK_WORDS",
+    "GL_MAX_GEOMETRY_SHADER_INVOCATIONS",
+    "GL_MIN_FRAGMENT_INTERPOLATION_OFFSET",
+    "GL_MAX_FRAGMENT_INTERPOLATION_OFFSET",
+    "GL_FRAGMENT_INTERPOLATION_OFFSET_BITS",
+    "GL_MIN_PROGRAM_TEXTURE_GATHER_OFFSET",
+    "GL_MAX_PROGRAM_TEXTURE_GATHER_OFFSET",
+    "GL_MAX_TRANSFORM_FEEDBACK_BUFFERS",
+    "GL_MAX_VERTEX_STREAMS",
+    "GL_PATCH_VERTICES",
+    "GL_PATCH_DEFAULT_INNER_LEVEL",
+    "GL_PATCH_DEFAULT_OUTER_LEVEL",
+    "GL_TESS_CONTROL_OUTPUT_VERTICES",
+    "GL_TESS_GEN_MODE",
+    "GL_TESS_GEN_SPACING",
+    "GL_TESS_GEN_VERTEX_ORDER",
+    "GL_TESS_GEN_POINT_MODE",
+    "GL_ISOLINES",
+    "GL_FRACTIONAL_ODD",
+    "GL_FRACTIONAL_EVEN",
+    "GL_MAX_PATCH_VERTICES",
+    "GL_MAX_TESS_GEN_LEVEL",
+    "GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS",
+    "GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS",
+    "GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS",
+    "GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS",
+    "GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS",
+    "GL_MAX_TESS_PATCH_COMPONENTS",
+    "GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS",
+    "GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS",
+    "GL_TESS_EVALUATION_SHADER",
+    "GL_TESS_CONTROL_SHADER",
+    "GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS",
+    "GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS",
+    "GL_COMPRESSED_RGBA_BPTC_UNORM",
+    "GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM",
+    "GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT",
+    "GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT",
+    "GL_COVERAGE_COMPONENT_NV",
+    "GL_COVERAGE_COMPONENT4_NV",
+    "GL_COVERAGE_ATTACHMENT_NV",
+    "GL_COVERAGE_BUFFERS_NV",
+    "GL_COVERAGE_ALL_FRAGMENTS_NV",
+    "GL_COVERAGE_EDGE_FRAGMENTS_NV",
+    "GL_COVERAGE_AUTOMATIC_NV",
+    "GL_BUFFER_GPU_ADDRESS_NV",
+    "GL_VERTEX_ATTRIB_ARRAY_UNIFIED_NV",
+    "GL_ELEMENT_ARRAY_UNIFIED_NV",
+    "GL_VERTEX_ATTRIB_ARRAY_ADDRESS_NV",
+    "GL_VERTEX_ARRAY_ADDRESS_NV",
+    "GL_NORMAL_ARRAY_ADDRESS_NV",
+    "GL_COLOR_ARRAY_ADDRESS_NV",
+    "GL_INDEX_ARRAY_ADDRESS_NV",
+    "GL_TEXTURE_COORD_ARRAY_ADDRESS_NV",
+    "GL_EDGE_FLAG_ARRAY_ADDRESS_NV",
+    "GL_SECONDARY_COLOR_ARRAY_ADDRESS_NV",
+    "GL_FOG_COORD_ARRAY_ADDRESS_NV",
+    "GL_ELEMENT_ARRAY_ADDRESS_NV",
+    "GL_VERTEX_ATTRIB_ARRAY_LENGTH_NV",
+    "GL_VERTEX_ARRAY_LENGTH_NV",
+    "GL_NORMAL_ARRAY_LENGTH_NV",
+    "GL_COLOR_ARRAY_LENGTH_NV",
+    "GL_INDEX_ARRAY_LENGTH_NV",
+    "GL_TEXTURE_COORD_ARRAY_LENGTH_NV",
+    "GL_EDGE_FLAG_ARRAY_LENGTH_NV",
+    "GL_SECONDARY_COLOR_ARRAY_LENGTH_NV",
+    "GL_FOG_COORD_ARRAY_LENGTH_NV",
+    "GL_ELEMENT_ARRAY_LENGTH_NV",
+    "GL_GPU_ADDRESS_NV",
+    "GL_MAX_SHADER_BUFFER_ADDRESS_NV",
+    "GL_COPY_READ_BUFFER",
+    "GL_COPY_WRITE_BUFFER",
+    "GL_MAX_IMAGE_UNITS",
+    "GL_MAX_COMBINED_IMAGE_UNITS_AND_FRAGMENT_OUTPUTS",
+    "GL_IMAGE_BINDING_NAME",
+    "GL_IMAGE_BINDING_LEVEL",
+    "GL_IMAGE_BINDING_LAYERED",
+    "GL_IMAGE_BINDING_LAYER",
+    "GL_IMAGE_BINDING_ACCESS",
+    "GL_DRAW_INDIRECT_BUFFER",
+    "GL_DRAW_INDIRECT_UNIFIED_NV",
+    "GL_DRAW_INDIRECT_ADDRESS_NV",
+    "GL_DRAW_INDIRECT_LENGTH_NV",
+    "GL_DRAW_INDIRECT_BUFFER_BINDING",
+    "GL_DOUBLE_MAT2",
+    "GL_DOUBLE_MAT3",
+    "GL_DOUBLE_MAT4",
+    "GL_DOUBLE_MAT2x3",
+    "GL_DOUBLE_MAT2x4",
+    "GL_DOUBLE_MAT3x2",
+    "GL_DOUBLE_MAT3x4",
+    "GL_DOUBLE_MAT4x2",
+    "GL_DOUBLE_MAT4x3",
+    "GL_MALI_SHADER_BINARY_ARM",
+    "GL_MALI_PROGRAM_BINARY_ARM",
+    "GL_RED_SNORM",
+    "GL_RG_SNORM",
+    "GL_RGB_SNORM",
+    "GL_RGBA_SNORM",
+    "GL_R8_SNORM",
+    "GL_RG8_SNORM",
+    "GL_RGB8_SNORM",
+    "GL_RGBA8_SNORM",
+    "GL_R16_SNORM",
+    "GL_RG16_SNORM",
+    "GL_RGB16_SNORM",
+    "GL_RGBA16_SNORM",
+    "GL_SIGNED_NORMALIZED",
+    "GL_PRIMITIVE_RESTART",
+    "GL_PRIMITIVE_RESTART_INDEX",
+    "GL_MAX_PROGRAM_TEXTURE_GATHER_COMPONENTS",
+    "GL_PERFMON_GLOBAL_MODE_QCOM",
+    "GL_BINNING_CONTROL_HINT_QCOM",
+    "GL_CPU_OPTIMIZED_QCOM",
+    "GL_GPU_OPTIMIZED_QCOM",
+    "GL_RENDER_DIRECT_TO_FRAMEBUFFER_QCOM",
+    "GL_GPU_DISJOINT_EXT",
+    "GL_SHADER_BINARY_VIV",
+    "GL_INT8_NV",
+    "GL_INT8_VEC2_NV",
+    "GL_INT8_VEC3_NV",
+    "GL_INT8_VEC4_NV",
+    "GL_INT16_NV",
+    "GL_INT16_VEC2_NV",
+    "GL_INT16_VEC3_NV",
+    "GL_INT16_VEC4_NV",
+    "GL_INT64_VEC2_NV",
+    "GL_INT64_VEC3_NV",
+    "GL_INT64_VEC4_NV",
+    "GL_UNSIGNED_INT8_NV",
+    "GL_UNSIGNED_INT8_VEC2_NV",
+    "GL_UNSIGNED_INT8_VEC3_NV",
+    "GL_UNSIGNED_INT8_VEC4_NV",
+    "GL_UNSIGNED_INT16_NV",
+    "GL_UNSIGNED_INT16_VEC2_NV",
+    "GL_UNSIGNED_INT16_VEC3_NV",
+    "GL_UNSIGNED_INT16_VEC4_NV",
+    "GL_UNSIGNED_INT64_VEC2_NV",
+    "GL_UNSIGNED_INT64_VEC3_NV",
+    "GL_UNSIGNED_INT64_VEC4_NV",
+    "GL_FLOAT16_NV",
+    "GL_FLOAT16_VEC2_NV",
+    "GL_FLOAT16_VEC3_NV",
+    "GL_FLOAT16_VEC4_NV",
+    "GL_DOUBLE_VEC2",
+    "GL_DOUBLE_VEC3",
+    "GL_DOUBLE_VEC4",
+    "GL_SAMPLER_BUFFER_AMD",
+    "GL_INT_SAMPLER_BUFFER_AMD",
+    "GL_UNSIGNED_INT_SAMPLER_BUFFER_AMD",
+    "GL_TESSELLATION_MODE_AMD",
+    "GL_TESSELLATION_FACTOR_AMD",
+    "GL_DISCRETE_AMD",
+    "GL_CONTINUOUS_AMD",
+    "GL_TEXTURE_CUBE_MAP_ARRAY",
+    "GL_TEXTURE_BINDING_CUBE_MAP_ARRAY",
+    "GL_PROXY_TEXTURE_CUBE_MAP_ARRAY",
+    "GL_SAMPLER_CUBE_MAP_ARRAY",
+    "GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW",
+    "GL_INT_SAMPLER_CUBE_MAP_ARRAY",
+    "GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY",
+    "GL_ALPHA_SNORM",
+    "GL_LUMINANCE_SNORM",
+    "GL_LUMINANCE_ALPHA_SNORM",
+    "GL_INTENSITY_SNORM",
+    "GL_ALPHA8_SNORM",
+    "GL_LUMINANCE8_SNORM",
+    "GL_LUMINANCE8_ALPHA8_SNORM",
+    "GL_INTENSITY8_SNORM",
+    "GL_ALPHA16_SNORM",
+    "GL_LUMINANCE16_SNORM",
+    "GL_LUMINANCE16_ALPHA16_SNORM",
+    "GL_INTENSITY16_SNORM",
+    "GL_FACTOR_MIN_AMD",
+    "GL_FACTOR_MAX_AMD",
+    "GL_DEPTH_CLAMP_NEAR_AMD",
+    "GL_DEPTH_CLAMP_FAR_AMD",
+    "GL_VIDEO_BUFFER_NV",
+    "GL_VIDEO_BUFFER_BINDING_NV",
+    "GL_FIELD_UPPER_NV",
+    "GL_FIELD_LOWER_NV",
+    "GL_NUM_VIDEO_CAPTURE_STREAMS_NV",
+    "GL_NEXT_VIDEO_CAPTURE_BUFFER_STATUS_NV",
+    "GL_VIDEO_CAPTURE_TO_422_SUPPORTED_NV",
+    "GL_LAST_VIDEO_CAPTURE_STATUS_NV",
+    "GL_VIDEO_BUFFER_PITCH_NV",
+    "GL_VIDEO_COLOR_CONVERSION_MATRIX_NV",
+    "GL_VIDEO_COLOR_CONVERSION_MAX_NV",
+    "GL_VIDEO_COLOR_CONVERSION_MIN_NV",
+    "GL_VIDEO_COLOR_CONVERSION_OFFSET_NV",
+    "GL_VIDEO_BUFFER_INTERNAL_FORMAT_NV",
+    "GL_PARTIAL_SUCCESS_NV",
+    "GL_SUCCESS_NV",
+    "GL_FAILURE_NV",
+    "GL_YCBYCR8_422_NV",
+    "GL_YCBAYCR8A_4224_NV",
+    "GL_Z6Y10Z6CB10Z6Y10Z6CR10_422_NV",
+    "GL_Z6Y10Z6CB10Z6A10Z6Y10Z6CR10Z6A10_4224_NV",
+    "GL_Z4Y12Z4CB12Z4Y12Z4CR12_422_NV",
+    "GL_Z4Y12Z4CB12Z4A12Z4Y12Z4CR12Z4A12_4224_NV",
+    "GL_Z4Y12Z4CB12Z4CR12_444_NV",
+    "GL_VIDEO_CAPTURE_FRAME_WIDTH_NV",
+    "GL_VIDEO_CAPTURE_FRAME_HEIGHT_NV",
+    "GL_VIDEO_CAPTURE_FIELD_UPPER_HEIGHT_NV",
+    "GL_VIDEO_CAPTURE_FIELD_LOWER_HEIGHT_NV",
+    "GL_VIDEO_CAPTURE_SURFACE_ORIGIN_NV",
+    "GL_TEXTURE_COVERAGE_SAMPLES_NV",
+    "GL_TEXTURE_COLOR_SAMPLES_NV",
+    "GL_GPU_MEMORY_INFO_DEDICATED_VIDMEM_NVX",
+    "GL_GPU_MEMORY_INFO_TOTAL_AVAILABLE_MEMORY_NVX",
+    "GL_GPU_MEMORY_INFO_CURRENT_AVAILABLE_VIDMEM_NVX",
+    "GL_GPU_MEMORY_INFO_EVICTION_COUNT_NVX",
+    "GL_GPU_MEMORY_INFO_EVICTED_MEMORY_NVX",
+    "GL_IMAGE_1D",
+    "GL_IMAGE_2D",
+    "GL_IMAGE_3D",
+    "GL_IMAGE_2D_RECT",
+    "GL_IMAGE_CUBE",
+    "GL_IMAGE_BUFFER",
+    "GL_IMAGE_1D_ARRAY",
+    "GL_IMAGE_2D_ARRAY",
+    "GL_IMAGE_CUBE_MAP_ARRAY",
+    "GL_IMAGE_2D_MULTISAMPLE",
+    "GL_IMAGE_2D_MULTISAMPLE_ARRAY",
+    "GL_INT_IMAGE_1D",
+    "GL_INT_IMAGE_2D",
+    "GL_INT_IMAGE_3D",
+    "GL_INT_IMAGE_2D_RECT",
+    "GL_INT_IMAGE_CUBE",
+    "GL_INT_IMAGE_BUFFER",
+    "GL_INT_IMAGE_1D_ARRAY",
+    "GL_INT_IMAGE_2D_ARRAY",
+    "GL_INT_IMAGE_CUBE_MAP_ARRAY",
+    "GL_INT_IMAGE_2D_MULTISAMPLE",
+    "GL_INT_IMAGE_2D_MULTISAMPLE_ARRAY",
+    "GL_UNSIGNED_INT_IMAGE_1D",
+    "GL_UNSIGNED_INT_IMAGE_2D",
+    "GL_UNSIGNED_INT_IMAGE_3D",
+    "GL_UNSIGNED_INT_IMAGE_2D_RECT",
+    "GL_UNSIGNED_INT_IMAGE_CUBE",
+    "GL_UNSIGNED_INT_IMAGE_BUFFER",
+    "GL_UNSIGNED_INT_IMAGE_1D_ARRAY",
+    "GL_UNSIGNED_INT_IMAGE_2D_ARRAY",
+    "GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY",
+    "GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE",
+    "GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE_ARRAY",
+    "GL_MAX_IMAGE_SAMPLES",
+    "GL_IMAGE_BINDING_FORMAT",
+    "GL_RGB10_A2UI",
+    "GL_PATH_FORMAT_SVG_NV",
+    "GL_PATH_FORMAT_PS_NV",
+    "GL_STANDARD_FONT_NAME_NV",
+    "GL_SYSTEM_FONT_NAME_NV",
+    "GL_FILE_NAME_NV",
+    "GL_PATH_STROKE_WIDTH_NV",
+    "GL_PATH_END_CAPS_NV",
+    "GL_PATH_INITIAL_END_CAP_NV",
+    "GL_PATH_TERMINAL_END_CAP_NV",
+    "GL_PATH_JOIN_STYLE_NV",
+    "GL_PATH_MITER_LIMIT_NV",
+    "GL_PATH_DASH_CAPS_NV",
+    "GL_PATH_INITIAL_DASH_CAP_NV",
+    "GL_PATH_TERMINAL_DASH_CAP_NV",
+    "GL_PATH_DASH_OFFSET_NV",
+    "GL_PATH_CLIENT_LENGTH_NV",
+    "GL_PATH_FILL_MODE_NV",
+    "GL_PATH_FILL_MASK_NV",
+    "GL_PATH_FILL_COVER_MODE_NV",
+    "GL_PATH_STROKE_COVER_MODE_NV",
+    "GL_PATH_STROKE_MASK_NV",
+    "GL_COUNT_UP_NV",
+    "GL_COUNT_DOWN_NV",
+    "GL_PATH_OBJECT_BOUNDING_BOX_NV",
+    "GL_CONVEX_HULL_NV",
+    "GL_BOUNDING_BOX_NV",
+    "GL_TRANSLATE_X_NV",
+    "GL_TRANSLATE_Y_NV",
+    "GL_TRANSLATE_2D_NV",
+    "GL_TRANSLATE_3D_NV",
+    "GL_AFFINE_2D_NV",
+    "GL_AFFINE_3D_NV",
+    "GL_TRANSPOSE_AFFINE_2D_NV",
+    "GL_TRANSPOSE_AFFINE_3D_NV",
+    "GL_UTF8_NV",
+    "GL_UTF16_NV",
+    "GL_BOUNDING_BOX_OF_BOUNDING_BOXES_NV",
+    "GL_PATH_COMMAND_COUNT_NV",
+    "GL_PATH_COORD_COUNT_NV",
+    "GL_PATH_DASH_ARRAY_COUNT_NV",
+    "GL_PATH_COMPUTED_LENGTH_NV",
+    "GL_PATH_FILL_BOUNDING_BOX_NV",
+    "GL_PATH_STROKE_BOUNDING_BOX_NV",
+    "GL_SQUARE_NV",
+    "GL_ROUND_NV",
+    "GL_TRIANGULAR_NV",
+    "GL_BEVEL_NV",
+    "GL_MITER_REVERT_NV",
+    "GL_MITER_TRUNCATE_NV",
+    "GL_SKIP_MISSING_GLYPH_NV",
+    "GL_USE_MISSING_GLYPH_NV",
+    "GL_PATH_ERROR_POSITION_NV",
+    "GL_PATH_FOG_GEN_MODE_NV",
+    "GL_ACCUM_ADJACENT_PAIRS_NV",
+    "GL_ADJACENT_PAIRS_NV",
+    "GL_FIRST_TO_REST_NV",
+    "GL_PATH_GEN_MODE_NV",
+    "GL_PATH_GEN_COEFF_NV",
+    "GL_PATH_GEN_COLOR_FORMAT_NV",
+    "GL_PATH_GEN_COMPONENTS_NV",
+    "GL_PATH_DASH_OFFSET_RESET_NV",
+    "GL_MOVE_TO_RESETS_NV",
+    "GL_MOVE_TO_CONTINUES_NV",
+    "GL_PATH_STENCIL_FUNC_NV",
+    "GL_PATH_STENCIL_REF_NV",
+    "GL_PATH_STENCIL_VALUE_MASK_NV",
+    "GL_SCALED_RESOLVE_FASTEST_EXT",
+    "GL_SCALED_RESOLVE_NICEST_EXT",
+    "GL_MIN_MAP_BUFFER_ALIGNMENT",
+    "GL_PATH_STENCIL_DEPTH_OFFSET_FACTOR_NV",
+    "GL_PATH_STENCIL_DEPTH_OFFSET_UNITS_NV",
+    "GL_PATH_COVER_DEPTH_FUNC_NV",
+    "GL_IMAGE_FORMAT_COMPATIBILITY_TYPE",
+    "GL_IMAGE_FORMAT_COMPATIBILITY_BY_SIZE",
+    "GL_IMAGE_FORMAT_COMPATIBILITY_BY_CLASS",
+    "GL_MAX_VERTEX_IMAGE_UNIFORMS",
+    "GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS",
+    "GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS",
+    "GL_MAX_GEOMETRY_IMAGE_UNIFORMS",
+    "GL_MAX_FRAGMENT_IMAGE_UNIFORMS",
+    "GL_MAX_COMBINED_IMAGE_UNIFORMS",
+    "GL_MAX_DEEP_3D_TEXTURE_WIDTH_HEIGHT_NV",
+    "GL_MAX_DEEP_3D_TEXTURE_DEPTH_NV",
+    "GL_SHADER_STORAGE_BUFFER",
+    "GL_SHADER_STORAGE_BUFFER_BINDING",
+    "GL_SHADER_STORAGE_BUFFER_START",
+    "GL_SHADER_STORAGE_BUFFER_SIZE",
+    "GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS",
+    "GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS",
+    "GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS",
+    "GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS",
+    "GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS",
+    "GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS",
+    "GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS",
+    "GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS",
+    "GL_MAX_SHADER_STORAGE_BLOCK_SIZE",
+    "GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT",
+    "GL_SYNC_X11_FENCE_EXT",
+    "GL_DEPTH_STENCIL_TEXTURE_MODE",
+    "GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS",
+    "GL_UNIFORM_BLOCK_REFERENCED_BY_COMPUTE_SHADER",
+    "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_COMPUTE_SHADER",
+    "GL_DISPATCH_INDIRECT_BUFFER",
+    "GL_DISPATCH_INDIRECT_BUFFER_BINDING",
+    "GL_COLOR_ATTACHMENT_EXT",
+    "GL_MULTIVIEW_EXT",
+    "GL_MAX_MULTIVIEW_BUFFERS_EXT",
+    "GL_CONTEXT_ROBUST_ACCESS_EXT",
+    "GL_3DVISION_STEREO_NV",
+    "GL_STEREO_SEPARATION_NV",
+    "GL_STEREO_CONVERGENCE_NV",
+    "GL_STEREO_CUTOFF_NV",
+    "GL_STEREO_PROJECTION_NV",
+    "GL_STEREO_PROJECTION_PERSPECTIVE_NV",
+    "GL_STEREO_PROJECTION_ORTHO_NV",
+    "GL_COMPUTE_PROGRAM_NV",
+    "GL_COMPUTE_PROGRAM_PARAMETER_BUFFER_NV",
+    "GL_TEXTURE_2D_MULTISAMPLE",
+    "GL_PROXY_TEXTURE_2D_MULTISAMPLE",
+    "GL_TEXTURE_2D_MULTISAMPLE_ARRAY",
+    "GL_PROXY_TEXTURE_2D_MULTISAMPLE_ARRAY",
+    "GL_TEXTURE_BINDING_2D_MULTISAMPLE",
+    "GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY",
+    "GL_TEXTURE_SAMPLES",
+    "GL_TEXTURE_FIXED_SAMPLE_LOCATIONS",
+    "GL_SAMPLER_2D_MULTISAMPLE",
+    "GL_INT_SAMPLER_2D_MULTISAMPLE",
+    "GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE",
+    "GL_SAMPLER_2D_MULTISAMPLE_ARRAY",
+    "GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY",
+    "GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY",
+    "GL_MAX_COLOR_TEXTURE_SAMPLES",
+    "GL_MAX_DEPTH_TEXTURE_SAMPLES",
+    "GL_MAX_INTEGER_SAMPLES",
+    "GL_MAX_SERVER_WAIT_TIMEOUT",
+    "GL_OBJECT_TYPE",
+    "GL_SYNC_CONDITION",
+    "GL_SYNC_STATUS",
+    "GL_SYNC_FLAGS",
+    "GL_SYNC_FENCE",
+    "GL_SYNC_GPU_COMMANDS_COMPLETE",
+    "GL_UNSIGNALED",
+    "GL_SIGNALED",
+    "GL_ALREADY_SIGNALED",
+    "GL_TIMEOUT_EXPIRED",
+    "GL_CONDITION_SATISFIED",
+    "GL_WAIT_FAILED",
+    "GL_BUFFER_ACCESS_FLAGS",
+    "GL_BUFFER_MAP_LENGTH",
+    "GL_BUFFER_MAP_OFFSET",
+    "GL_MAX_VERTEX_OUTPUT_COMPONENTS",
+    "GL_MAX_GEOMETRY_INPUT_COMPONENTS",
+    "GL_MAX_GEOMETRY_OUTPUT_COMPONENTS",
+    "GL_MAX_FRAGMENT_INPUT_COMPONENTS",
+    "GL_CONTEXT_PROFILE_MASK",
+    "GL_UNPACK_COMPRESSED_BLOCK_WIDTH",
+    "GL_UNPACK_COMPRESSED_BLOCK_HEIGHT",
+    "GL_UNPACK_COMPRESSED_BLOCK_DEPTH",
+    "GL_UNPACK_COMPRESSED_BLOCK_SIZE",
+    "GL_PACK_COMPRESSED_BLOCK_WIDTH",
+    "GL_PACK_COMPRESSED_BLOCK_HEIGHT",
+    "GL_PACK_COMPRESSED_BLOCK_DEPTH",
+    "GL_PACK_COMPRESSED_BLOCK_SIZE",
+    "GL_TEXTURE_IMMUTABLE_FORMAT",
+    "GL_SGX_PROGRAM_BINARY_IMG",
+    "GL_RENDERBUFFER_SAMPLES_IMG",
+    "GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_IMG",
+    "GL_MAX_SAMPLES_IMG",
+    "GL_TEXTURE_SAMPLES_IMG",
+    "GL_COMPRESSED_RGBA_PVRTC_2BPPV2_IMG",
+    "GL_COMPRESSED_RGBA_PVRTC_4BPPV2_IMG",
+    "GL_MAX_DEBUG_MESSAGE_LENGTH",
+    "GL_MAX_DEBUG_LOGGED_MESSAGES",
+    "GL_DEBUG_LOGGED_MESSAGES",
+    "GL_DEBUG_SEVERITY_HIGH",
+    "GL_DEBUG_SEVERITY_MEDIUM",
+    "GL_DEBUG_SEVERITY_LOW",
+    "GL_DEBUG_CATEGORY_API_ERROR_AMD",
+    "GL_DEBUG_CATEGORY_WINDOW_SYSTEM_AMD",
+    "GL_DEBUG_CATEGORY_DEPRECATION_AMD",
+    "GL_DEBUG_CATEGORY_UNDEFINED_BEHAVIOR_AMD",
+    "GL_DEBUG_CATEGORY_PERFORMANCE_AMD",
+    "GL_DEBUG_CATEGORY_SHADER_COMPILER_AMD",
+    "GL_DEBUG_CATEGORY_APPLICATION_AMD",
+    "GL_DEBUG_CATEGORY_OTHER_AMD",
+    "GL_DATA_BUFFER_AMD",
+    "GL_PERFORMANCE_MONITOR_AMD",
+    "GL_QUERY_OBJECT_AMD",
+    "GL_VERTEX_ARRAY_OBJECT_AMD",
+    "GL_SAMPLER_OBJECT_AMD",
+    "GL_EXTERNAL_VIRTUAL_MEMORY_BUFFER_AMD",
+    "GL_QUERY_BUFFER",
+    "GL_QUERY_BUFFER_BINDING",
+    "GL_QUERY_RESULT_NO_WAIT",
+    "GL_VIRTUAL_PAGE_SIZE_X_AMD",
+    "GL_VIRTUAL_PAGE_SIZE_Y_AMD",
+    "GL_VIRTUAL_PAGE_SIZE_Z_AMD",
+    "GL_MAX_SPARSE_TEXTURE_SIZE_AMD",
+    "GL_MAX_SPARSE_3D_TEXTURE_SIZE_AMD",
+    "GL_MAX_SPARSE_ARRAY_TEXTURE_LAYERS",
+    "GL_MIN_SPARSE_LEVEL_AMD",
+    "GL_MIN_LOD_WARNING_AMD",
+    "GL_TEXTURE_BUFFER_OFFSET",
+    "GL_TEXTURE_BUFFER_SIZE",
+    "GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT",
+    "GL_VERTEX_ELEMENT_SWIZZLE_AMD",
+    "GL_VERTEX_ID_SWIZZLE_AMD",
+    "GL_TEXTURE_SPARSE_ARB",
+    "GL_VIRTUAL_PAGE_SIZE_INDEX_ARB",
+    "GL_NUM_VIRTUAL_PAGE_SIZES_ARB",
+    "GL_SPARSE_TEXTURE_FULL_ARRAY_CUBE_MIPMAPS_ARB",
+    "GL_NUM_SPARSE_LEVELS_ARB",
+    "GL_COMPUTE_SHADER",
+    "GL_MAX_COMPUTE_UNIFORM_BLOCKS",
+    "GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS",
+    "GL_MAX_COMPUTE_IMAGE_UNIFORMS",
+    "GL_MAX_COMPUTE_WORK_GROUP_COUNT",
+    "GL_MAX_COMPUTE_WORK_GROUP_SIZE",
+    "GL_SHADER_BINARY_DMP",
+    "GL_GCCSO_SHADER_BINARY_FJ",
+    "GL_COMPRESSED_R11_EAC",
+    "GL_COMPRESSED_SIGNED_R11_EAC",
+    "GL_COMPRESSED_RG11_EAC",
+    "GL_COMPRESSED_SIGNED_RG11_EAC",
+    "GL_COMPRESSED_RGB8_ETC2",
+    "GL_COMPRESSED_SRGB8_ETC2",
+    "GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2",
+    "GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2",
+    "GL_COMPRESSED_RGBA8_ETC2_EAC",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC",
+    "GL_BLEND_PREMULTIPLIED_SRC_NV",
+    "GL_BLEND_OVERLAP_NV",
+    "GL_UNCORRELATED_NV",
+    "GL_DISJOINT_NV",
+    "GL_CONJOINT_NV",
+    "GL_BLEND_ADVANCED_COHERENT_NV",
+    "GL_SRC_NV",
+    "GL_DST_NV",
+    "GL_SRC_OVER_NV",
+    "GL_DST_OVER_NV",
+    "GL_SRC_IN_NV",
+    "GL_DST_IN_NV",
+    "GL_SRC_OUT_NV",
+    "GL_DST_OUT_NV",
+    "GL_SRC_ATOP_NV",
+    "GL_DST_ATOP_NV",
+    "GL_PLUS_NV",
+    "GL_PLUS_DARKER_NV",
+    "GL_MULTIPLY_NV",
+    "GL_SCREEN_NV",
+    "GL_OVERLAY_NV",
+    "GL_DARKEN_NV",
+    "GL_LIGHTEN_NV",
+    "GL_COLORDODGE_NV",
+    "GL_COLORBURN_NV",
+    "GL_HARDLIGHT_NV",
+    "GL_SOFTLIGHT_NV",
+    "GL_DIFFERENCE_NV",
+    "GL_MINUS_NV",
+    "GL_EXCLUSION_NV",
+    "GL_CONTRAST_NV",
+    "GL_INVERT_RGB_NV",
+    "GL_LINEARDODGE_NV",
+    "GL_LINEARBURN_NV",
+    "GL_VIVIDLIGHT_NV",
+    "GL_LINEARLIGHT_NV",
+    "GL_PINLIGHT_NV",
+    "GL_HARDMIX_NV",
+    "GL_HSL_HUE_NV",
+    "GL_HSL_SATURATION_NV",
+    "GL_HSL_COLOR_NV",
+    "GL_HSL_LUMINOSITY_NV",
+    "GL_PLUS_CLAMPED_NV",
+    "GL_PLUS_CLAMPED_ALPHA_NV",
+    "GL_MINUS_CLAMPED_NV",
+    "GL_INVERT_OVG_NV",
+    "GL_ATOMIC_COUNTER_BUFFER",
+    "GL_ATOMIC_COUNTER_BUFFER_BINDING",
+    "GL_ATOMIC_COUNTER_BUFFER_START",
+    "GL_ATOMIC_COUNTER_BUFFER_SIZE",
+    "GL_ATOMIC_COUNTER_BUFFER_DATA_SIZE",
+    "GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTERS",
+    "GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTER_INDICES",
+    "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_VERTEX_SHADER",
+    "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_CONTROL_SHADER",
+    "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_EVALUATION_SHADER",
+    "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_GEOMETRY_SHADER",
+    "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_FRAGMENT_SHADER",
+    "GL_MAX_VERTEX_ATOMIC_COUNTER_BUFFERS",
+    "GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS",
+    "GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS",
+    "GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS",
+    "GL_MAX_FRAGMENT_ATOMIC_COUNTER_BUFFERS",
+    "GL_MAX_COMBINED_ATOMIC_COUNTER_BUFFERS",
+    "GL_MAX_VERTEX_ATOMIC_COUNTERS",
+    "GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS",
+    "GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS",
+    "GL_MAX_GEOMETRY_ATOMIC_COUNTERS",
+    "GL_MAX_FRAGMENT_ATOMIC_COUNTERS",
+    "GL_MAX_COMBINED_ATOMIC_COUNTERS",
+    "GL_MAX_ATOMIC_COUNTER_BUFFER_SIZE",
+    "GL_ACTIVE_ATOMIC_COUNTER_BUFFERS",
+    "GL_UNIFORM_ATOMIC_COUNTER_BUFFER_INDEX",
+    "GL_UNSIGNED_INT_ATOMIC_COUNTER",
+    "GL_MAX_ATOMIC_COUNTER_BUFFER_BINDINGS",
+    "GL_DEBUG_OUTPUT",
+    "GL_UNIFORM",
+    "GL_UNIFORM_BLOCK",
+    "GL_PROGRAM_INPUT",
+    "GL_PROGRAM_OUTPUT",
+    "GL_BUFFER_VARIABLE",
+    "GL_SHADER_STORAGE_BLOCK",
+    "GL_IS_PER_PATCH",
+    "GL_VERTEX_SUBROUTINE",
+    "GL_TESS_CONTROL_SUBROUTINE",
+    "GL_TESS_EVALUATION_SUBROUTINE",
+    "GL_GEOMETRY_SUBROUTINE",
+    "GL_FRAGMENT_SUBROUTINE",
+    "GL_COMPUTE_SUBROUTINE",
+    "GL_VERTEX_SUBROUTINE_UNIFORM",
+    "GL_TESS_CONTROL_SUBROUTINE_UNIFORM",
+    "GL_TESS_EVALUATION_SUBROUTINE_UNIFORM",
+    "GL_GEOMETRY_SUBROUTINE_UNIFORM",
+    "GL_FRAGMENT_SUBROUTINE_UNIFORM",
+    "GL_COMPUTE_SUBROUTINE_UNIFORM",
+    "GL_TRANSFORM_FEEDBACK_VARYING",
+    "GL_ACTIVE_RESOURCES",
+    "GL_MAX_NAME_LENGTH",
+    "GL_MAX_NUM_ACTIVE_VARIABLES",
+    "GL_MAX_NUM_COMPATIBLE_SUBROUTINES",
+    "GL_NAME_LENGTH",
+    "GL_TYPE",
+    "GL_ARRAY_SIZE",
+    "GL_OFFSET",
+    "GL_BLOCK_INDEX",
+    "GL_ARRAY_STRIDE",
+    "GL_MATRIX_STRIDE",
+    "GL_IS_ROW_MAJOR",
+    "GL_ATOMIC_COUNTER_BUFFER_INDEX",
+    "GL_BUFFER_BINDING",
+    "GL_BUFFER_DATA_SIZE",
+    "GL_NUM_ACTIVE_VARIABLES",
+    "GL_ACTIVE_VARIABLES",
+    "GL_REFERENCED_BY_VERTEX_SHADER",
+    "GL_REFERENCED_BY_TESS_CONTROL_SHADER",
+    "GL_REFERENCED_BY_TESS_EVALUATION_SHADER",
+    "GL_REFERENCED_BY_GEOMETRY_SHADER",
+    "GL_REFERENCED_BY_FRAGMENT_SHADER",
+    "GL_REFERENCED_BY_COMPUTE_SHADER",
+    "GL_TOP_LEVEL_ARRAY_SIZE",
+    "GL_TOP_LEVEL_ARRAY_STRIDE",
+    "GL_LOCATION",
+    "GL_LOCATION_INDEX",
+    "GL_FRAMEBUFFER_DEFAULT_WIDTH",
+    "GL_FRAMEBUFFER_DEFAULT_HEIGHT",
+    "GL_FRAMEBUFFER_DEFAULT_LAYERS",
+    "GL_FRAMEBUFFER_DEFAULT_SAMPLES",
+    "GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS",
+    "GL_MAX_FRAMEBUFFER_WIDTH",
+    "GL_MAX_FRAMEBUFFER_HEIGHT",
+    "GL_MAX_FRAMEBUFFER_LAYERS",
+    "GL_MAX_FRAMEBUFFER_SAMPLES",
+    "GL_LOG_ERROR_REGAL",
+    "GL_LOG_WARNING_REGAL",
+    "GL_LOG_INFO_REGAL",
+    "GL_LOG_APP_REGAL",
+    "GL_LOG_DRIVER_REGAL",
+    "GL_LOG_INTERNAL_REGAL",
+    "GL_LOG_DEBUG_REGAL",
+    "GL_LOG_STATUS_REGAL",
+    "GL_LOG_HTTP_REGAL",
+    "GL_ERROR_REGAL",
+    "GL_DEBUG_REGAL",
+    "GL_LOG_REGAL",
+    "GL_EMULATION_REGAL",
+    "GL_DRIVER_REGAL",
+    "GL_MAX_COMPUTE_VARIABLE_GROUP_INVOCATIONS_ARB",
+    "GL_MAX_COMPUTE_VARIABLE_GROUP_SIZE_ARB",
+    "GL_LOCATION_COMPONENT",
+    "GL_TRANSFORM_FEEDBACK_BUFFER_INDEX",
+    "GL_TRANSFORM_FEEDBACK_BUFFER_STRIDE",
+    "GL_MISSING_REGAL",
+    "GL_TRACE_REGAL",
+    "GL_CACHE_REGAL",
+    "GL_CODE_REGAL",
+    "GL_STATISTICS_REGAL",
+    "GL_CLEAR_TEXTURE",
+    "GL_NUM_SAMPLE_COUNTS",
+    "GL_TRANSLATED_SHADER_SOURCE_LENGTH_ANGLE",
+    "GL_BGRA8_EXT",
+    "GL_TEXTURE_USAGE_ANGLE",
+    "GL_FRAMEBUFFER_ATTACHMENT_ANGLE",
+    "GL_PACK_REVERSE_ROW_ORDER_ANGLE",
+    "GL_PROGRAM_BINARY_ANGLE",
+    "GL_COMPRESSED_RGBA_ASTC_4x4_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_5x4_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_5x5_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_6x5_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_6x6_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_8x5_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_8x6_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_8x8_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_10x5_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_10x6_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_10x8_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_10x10_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_12x10_KHR",
+    "GL_COMPRESSED_RGBA_ASTC_12x12_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10_KHR",
+    "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12_KHR",
+    "GL_STENCIL_BUFFER_BIT0_QCOM",
+    "GL_RASTER_POSITION_UNCLIPPED_IBM",
+    "GL_CULL_VERTEX_IBM",
+    "GL_ALL_STATIC_DATA_IBM",
+    "GL_STATIC_VERTEX_ARRAY_IBM",
+    "GL_VERTEX_ARRAY_LIST_IBM",
+    "GL_NORMAL_ARRAY_LIST_IBM",
+    "GL_COLOR_ARRAY_LIST_IBM",
+    "GL_INDEX_ARRAY_LIST_IBM",
+    "GL_TEXTURE_COORD_ARRAY_LIST_IBM",
+    "GL_EDGE_FLAG_ARRAY_LIST_IBM",
+    "GL_FOG_COORDINATE_ARRAY_LIST_IBM",
+    "GL_SECONDARY_COLOR_ARRAY_LIST_IBM",
+    "GL_VERTEX_ARRAY_LIST_STRIDE_IBM",
+    "GL_NORMAL_ARRAY_LIST_STRIDE_IBM",
+    "GL_COLOR_ARRAY_LIST_STRIDE_IBM",
+    "GL_INDEX_ARRAY_LIST_STRIDE_IBM",
+    "GL_TEXTURE_COORD_ARRAY_LIST_STRIDE_IBM",
+    "GL_EDGE_FLAG_ARRAY_LIST_STRIDE_IBM",
+    "GL_FOG_COORDINATE_ARRAY_LIST_STRIDE_IBM",
+    "GL_SECONDARY_COLOR_ARRAY_LIST_STRIDE_IBM",
+    "GL_PREFER_DOUBLEBUFFER_HINT_PGI",
+    "GL_CONSERVE_MEMORY_HINT_PGI",
+    "GL_RECLAIM_MEMORY_HINT_PGI",
+    "GL_NATIVE_GRAPHICS_HANDLE_PGI",
+    "GL_NATIVE_GRAPHICS_BEGIN_HINT_PGI",
+    "GL_NATIVE_GRAPHICS_END_HINT_PGI",
+    "GL_ALWAYS_FAST_HINT_PGI",
+    "GL_ALWAYS_SOFT_HINT_PGI",
+    "GL_ALLOW_DRAW_OBJ_HINT_PGI",
+    "GL_ALLOW_DRAW_WIN_HINT_PGI",
+    "GL_ALLOW_DRAW_FRG_HINT_PGI",
+    "GL_ALLOW_DRAW_MEM_HINT_PGI",
+    "GL_STRICT_DEPTHFUNC_HINT_PGI",
+    "GL_STRICT_LIGHTING_HINT_PGI",
+    "GL_STRICT_SCISSOR_HINT_PGI",
+    "GL_FULL_STIPPLE_HINT_PGI",
+    "GL_CLIP_NEAR_HINT_PGI",
+    "GL_CLIP_FAR_HINT_PGI",
+    "GL_WIDE_LINE_HINT_PGI",
+    "GL_BACK_NORMALS_HINT_PGI",
+    "GL_VERTEX_DATA_HINT_PGI",
+    "GL_VERTEX_CONSISTENT_HINT_PGI",
+    "GL_MATERIAL_SIDE_HINT_PGI",
+    "GL_MAX_VERTEX_HINT_PGI",
+    "GL_STENCIL_BUFFER_BIT1_QCOM",
+    "GL_STENCIL_BUFFER_BIT2_QCOM",
+    "GL_STENCIL_BUFFER_BIT3_QCOM",
+    "GL_ALL_ATTRIB_BITS",
+    "GL_STENCIL_BUFFER_BIT4_QCOM",
+    "GL_STENCIL_BUFFER_BIT5_QCOM",
+    "GL_STENCIL_BUFFER_BIT6_QCOM",
+    "GL_STENCIL_BUFFER_BIT7_QCOM",
+    "GL_MULTISAMPLE_BUFFER_BIT0_QCOM",
+    "GL_MULTISAMPLE_BUFFER_BIT1_QCOM",
+    "GL_MULTISAMPLE_BUFFER_BIT2_QCOM",
+    "GL_MULTISAMPLE_BUFFER_BIT3_QCOM",
+    "GL_MULTISAMPLE_BUFFER_BIT4_QCOM",
+    "GL_MULTISAMPLE_BIT_3DFX",
+    "GL_MULTISAMPLE_BUFFER_BIT6_QCOM",
+    "GL_MULTISAMPLE_BUFFER_BIT7_QCOM",
+    "GL_INVALID_INDEX"
+  };
+
+  const GLuint glEnumValue[3313] = {
+    0x00000000, 0x00000001, 0x00000002, 0x00000003, 0x00000004, 0x00000005, 0x00000006, 0x00000007,
+    0x00000008, 0x00000009, 0x0000000a, 0x0000000b, 0x0000000c, 0x0000000d, 0x0000000e, 0x0000000f,
+    0x00000010, 0x00000011, 0x00000012, 0x00000013, 0x00000014, 0x00000015, 0x00000016, 0x00000017,
+    0x00000018, 0x00000019, 0x00000020, 0x00000040, 0x00000080, 0x000000f0, 0x000000f2, 0x000000f4,
+    0x000000f6, 0x000000f8, 0x000000fa, 0x000000fc, 0x000000fe, 0x000000ff, 0x00000100, 0x00000101,
+    0x00000102, 0x00000103, 0x00000104, 0x00000200, 0x00000201, 0x00000202, 0x00000203, 0x00000204,
+    0x00000205, 0x00000206, 0x00000207, 0x00000300, 0x00000301, 0x00000302, 0x00000303, 0x00000304,
+    0x00000305, 0x00000306, 0x00000307, 0x00000308, 0x00000400, 0x00000401, 0x00000402, 0x00000403,
+    0x00000404, 0x00000405, 0x00000406, 0x00000407, 0x00000408, 0x00000409, 0x0000040a, 0x0000040b,
+    0x0000040c, 0x00000500, 0x00000501, 0x00000502, 0x00000503, 0x00000504, 0x00000505, 0x00000506,
+    0x00000600, 0x00000601, 0x00000602, 0x00000603, 0x00000604, 0x00000700, 0x00000701, 0x00000702,
+    0x00000703, 0x00000704, 0x00000705, 0x00000706, 0x00000707, 0x00000800, 0x00000801, 0x00000898,
+    0x00000900, 0x00000901, 0x00000a00, 0x00000a01, 0x00000a02, 0x00000b00, 0x00000b01, 0x00000b02,
+    0x00000b03, 0x00000b04, 0x00000b05, 0x00000b06, 0x00000b07, 0x00000b08, 0x00000b09, 0x00000b10,
+    0x00000b11, 0x00000b12, 0x00000b13, 0x00000b20, 0x00000b21, 0x00000b22, 0x00000b23, 0x00000b24,
+    0x00000b25, 0x00000b26, 0x00000b30, 0x00000b31, 0x00000b32, 0x00000b33, 0x00000b40, 0x00000b41,
+    0x00000b42, 0x00000b43, 0x00000b44, 0x00000b45, 0x00000b46, 0x00000b50, 0x00000b51, 0x00000b52,
+    0x00000b53, 0x00000b54, 0x00000b55, 0x00000b56, 0x00000b57, 0x00000b60, 0x00000b61, 0x00000b62,
+    0x00000b63, 0x00000b64, 0x00000b65, 0x00000b66, 0x00000b70, 0x00000b71, 0x00000b72, 0x00000b73,
+    0x00000b74, 0x00000b80, 0x00000b90, 0x00000b91, 0x00000b92, 0x00000b93, 0x00000b94, 0x00000b95,
+    0x00000b96, 0x00000b97, 0x00000b98, 0x00000ba0, 0x00000ba1, 0x00000ba2, 0x00000ba3, 0x00000ba4,
+    0x00000ba5, 0x00000ba6, 0x00000ba7, 0x00000ba8, 0x00000bb0, 0x00000bb1, 0x00000bc0, 0x00000bc1,
+    0x00000bc2, 0x00000bd0, 0x00000be0, 0x00000be1, 0x00000be2, 0x00000bf0, 0x00000bf1, 0x00000bf2,
+    0x00000c00, 0x00000c01, 0x00000c02, 0x00000c10, 0x00000c11, 0x00000c20, 0x00000c21, 0x00000c22,
+    0x00000c23, 0x00000c30, 0x00000c31, 0x00000c32, 0x00000c33, 0x00000c40, 0x00000c50, 0x00000c51,
+    0x00000c52, 0x00000c53, 0x00000c54, 0x00000c60, 0x00000c61, 0x00000c62, 0x00000c63, 0x00000c70,
+    0x00000c71, 0x00000c72, 0x00000c73, 0x00000c74, 0x00000c75, 0x00000c76, 0x00000c77, 0x00000c78,
+    0x00000c79, 0x00000cb0, 0x00000cb1, 0x00000cb2, 0x00000cb3, 0x00000cb4, 0x00000cb5, 0x00000cb6,
+    0x00000cb7, 0x00000cb8, 0x00000cb9, 0x00000cf0, 0x00000cf1, 0x00000cf2, 0x00000cf3, 0x00000cf4,
+    0x00000cf5, 0x00000d00, 0x00000d01, 0x00000d02, 0x00000d03, 0x00000d04, 0x00000d05, 0x00000d10,
+    0x00000d11, 0x00000d12, 0x00000d13, 0x00000d14, 0x00000d15, 0x00000d16, 0x00000d17, 0x00000d18,
+    0x00000d19, 0x00000d1a, 0x00000d1b, 0x00000d1c, 0x00000d1d, 0x00000d1e, 0x00000d1f, 0x00000d30,
+    0x00000d31, 0x00000d32, 0x00000d33, 0x00000d34, 0x00000d35, 0x00000d36, 0x00000d37, 0x00000d38,
+    0x00000d39, 0x00000d3a, 0x00000d3b, 0x00000d50, 0x00000d51, 0x00000d52, 0x00000d53, 0x00000d54,
+    0x00000d55, 0x00000d56, 0x00000d57, 0x00000d58, 0x00000d59, 0x00000d5a, 0x00000d5b, 0x00000d70,
+    0x00000d80, 0x00000d90, 0x00000d91, 0x00000d92, 0x00000d93, 0x00000d94, 0x00000d95, 0x00000d96,
+    0x00000d97, 0x00000d98, 0x00000db0, 0x00000db1, 0x00000db2, 0x00000db3, 0x00000db4, 0x00000db5,
+    0x00000db6, 0x00000db7, 0x00000db8, 0x00000dd0, 0x00000dd1, 0x00000dd2, 0x00000dd3, 0x00000de0,
+    0x00000de1, 0x00000df0, 0x00000df1, 0x00000df2, 0x00000df3, 0x00000df4, 0x00001000, 0x00001001,
+    0x00001003, 0x00001004, 0x00001005, 0x00001100, 0x00001101, 0x00001102, 0x00001200, 0x00001201,
+    0x00001202, 0x00001203, 0x00001204, 0x00001205, 0x00001206, 0x00001207, 0x00001208, 0x00001209,
+    0x00001300, 0x00001301, 0x00001400, 0x00001401, 0x00001402, 0x00001403, 0x00001404, 0x00001405,
+    0x00001406, 0x00001407, 0x00001408, 0x00001409, 0x0000140a, 0x0000140b, 0x0000140c, 0x0000140e,
+    0x0000140f, 0x00001500, 0x00001501, 0x00001502, 0x00001503, 0x00001504, 0x00001505, 0x00001506,
+    0x00001507, 0x00001508, 0x00001509, 0x0000150a, 0x0000150b, 0x0000150c, 0x0000150d, 0x0000150e,
+    0x0000150f, 0x00001600, 0x00001601, 0x00001602, 0x00001603, 0x00001700, 0x00001701, 0x00001702,
+    0x00001800, 0x00001801, 0x00001802, 0x00001900, 0x00001901, 0x00001902, 0x00001903, 0x00001904,
+    0x00001905, 0x00001906, 0x00001907, 0x00001908, 0x00001909, 0x0000190a, 0x00001a00, 0x00001b00,
+    0x00001b01, 0x00001b02, 0x00001c00, 0x00001c01, 0x00001c02, 0x00001d00, 0x00001d01, 0x00001e00,
+    0x00001e01, 0x00001e02, 0x00001e03, 0x00001f00, 0x00001f01, 0x00001f02, 0x00001f03, 0x00002000,
+    0x00002001, 0x00002002, 0x00002003, 0x00002100, 0x00002101, 0x00002200, 0x00002201, 0x00002300,
+    0x00002400, 0x00002401, 0x00002402, 0x00002500, 0x00002501, 0x00002502, 0x00002600, 0x00002601,
+    0x00002700, 0x00002701, 0x00002702, 0x00002703, 0x00002800, 0x00002801, 0x00002802, 0x00002803,
+    0x00002900, 0x00002901, 0x00002a00, 0x00002a01, 0x00002a02, 0x00002a10, 0x00002a20, 0x00002a21,
+    0x00002a22, 0x00002a23, 0x00002a24, 0x00002a25, 0x00002a26, 0x00002a27, 0x00002a28, 0x00002a29,
+    0x00002a2a, 0x00002a2b, 0x00002a2c, 0x00002a2d, 0x00003000, 0x00003001, 0x00003002, 0x00003003,
+    0x00003004, 0x00003005, 0x00003006, 0x00003007, 0x000030e0, 0x000030e1, 0x000030e2, 0x000030e3,
+    0x00004000, 0x00004001, 0x00004002, 0x00004003, 0x00004004, 0x00004005, 0x00004006, 0x00004007,
+    0x00008000, 0x00008001, 0x00008002, 0x00008003, 0x00008004, 0x00008005, 0x00008006, 0x00008007,
+    0x00008008, 0x00008009, 0x0000800a, 0x0000800b, 0x0000800c, 0x0000800d, 0x0000800e, 0x0000800f,
+    0x00008010, 0x00008011, 0x00008012, 0x00008013, 0x00008014, 0x00008015, 0x00008016, 0x00008017,
+    0x00008018, 0x00008019, 0x0000801a, 0x0000801b, 0x0000801c, 0x0000801d, 0x0000801e, 0x0000801f,
+    0x00008020, 0x00008021, 0x00008022, 0x00008023, 0x00008024, 0x00008025, 0x00008026, 0x00008027,
+    0x00008028, 0x00008029, 0x0000802a, 0x0000802b, 0x0000802c, 0x0000802d, 0x0000802e, 0x0000802f,
+    0x00008030, 0x00008031, 0x00008032, 0x00008033, 0x00008034, 0x00008035, 0x00008036, 0x00008037,
+    0x00008038, 0x00008039, 0x0000803a, 0x0000803b, 0x0000803c, 0x0000803d, 0x0000803e, 0x0000803f,
+    0x00008040, 0x00008041, 0x00008042, 0x00008043, 0x00008044, 0x00008045, 0x00008046, 0x00008047,
+    0x00008048, 0x00008049, 0x0000804a, 0x0000804b, 0x0000804c, 0x0000804d, 0x0000804e, 0x0000804f,
+    0x00008050, 0x00008051, 0x00008052, 0x00008053, 0x00008054, 0x00008055, 0x00008056, 0x00008057,
+    0x00008058, 0x00008059, 0x0000805a, 0x0000805b, 0x0000805c, 0x0000805d, 0x0000805e, 0x0000805f,
+    0x00008060, 0x00008061, 0x00008062, 0x00008063, 0x00008064, 0x00008066, 0x00008067, 0x00008068,
+    0x00008069, 0x0000806a, 0x0000806b, 0x0000806c, 0x0000806d, 0x0000806e, 0x0000806f, 0x00008070,
+    0x00008071, 0x00008072, 0x00008073, 0x00008074, 0x00008075, 0x00008076, 0x00008077, 0x00008078,
+    0x00008079, 0x0000807a, 0x0000807b, 0x0000807c, 0x0000807d, 0x0000807e, 0x0000807f, 0x00008080,
+    0x00008081, 0x00008082, 0x00008083, 0x00008084, 0x00008085, 0x00008086, 0x00008087, 0x00008088,
+    0x00008089, 0x0000808a, 0x0000808b, 0x0000808c, 0x0000808d, 0x0000808e, 0x0000808f, 0x00008090,
+    0x00008091, 0x00008092, 0x00008093, 0x00008094, 0x00008095, 0x00008096, 0x00008097, 0x00008098,
+    0x00008099, 0x0000809a, 0x0000809b, 0x0000809c, 0x0000809d, 0x0000809e, 0x0000809f, 0x000080a0,
+    0x000080a1, 0x000080a2, 0x000080a3, 0x000080a4, 0x000080a5, 0x000080a6, 0x000080a7, 0x000080a8,
+    0x000080a9, 0x000080aa, 0x000080ab, 0x000080ac, 0x000080b1, 0x000080b2, 0x000080b3, 0x000080b4,
+    0x000080b5, 0x000080b6, 0x000080b7, 0x000080b8, 0x000080b9, 0x000080ba, 0x000080bb, 0x000080bc,
+    0x000080bd, 0x000080bf, 0x000080c8, 0x000080c9, 0x000080ca, 0x000080cb, 0x000080cc, 0x000080cd,
+    0x000080ce, 0x000080cf, 0x000080d0, 0x000080d1, 0x000080d2, 0x000080d3, 0x000080d4, 0x000080d5,
+    0x000080d6, 0x000080d7, 0x000080d8, 0x000080d9, 0x000080da, 0x000080db, 0x000080dc, 0x000080dd,
+    0x000080de, 0x000080df, 0x000080e0, 0x000080e1, 0x000080e2, 0x000080e3, 0x000080e4, 0x000080e5,
+    0x000080e6, 0x000080e7, 0x000080e8, 0x000080e9, 0x000080ea, 0x000080eb, 0x000080ec, 0x000080ed,
+    0x000080ee, 0x000080ef, 0x000080f0, 0x00008126, 0x00008127, 0x00008128, 0x00008129, 0x0000812d,
+    0x0000812e, 0x0000812f, 0x0000813a, 0x0000813b, 0x0000813c, 0x0000813d, 0x00008150, 0x00008151,
+    0x00008152, 0x00008153, 0x00008154, 0x00008155, 0x00008156, 0x00008157, 0x00008158, 0x00008159,
+    0x0000815a, 0x0000815b, 0x0000815c, 0x0000815d, 0x0000815e, 0x0000815f, 0x00008160, 0x00008161,
+    0x00008162, 0x00008163, 0x00008165, 0x00008166, 0x00008179, 0x0000817a, 0x0000817b, 0x0000817c,
+    0x00008191, 0x00008192, 0x00008198, 0x00008199, 0x0000819a, 0x0000819b, 0x0000819c, 0x0000819d,
+    0x000081a5, 0x000081a6, 0x000081a7, 0x000081a8, 0x000081a9, 0x000081aa, 0x000081ab, 0x000081ac,
+    0x000081bb, 0x000081bc, 0x000081d4, 0x000081d5, 0x000081d6, 0x000081d7, 0x000081d8, 0x000081d9,
+    0x000081da, 0x000081f0, 0x000081f1, 0x000081f2, 0x000081f3, 0x000081f4, 0x000081f5, 0x000081f6,
+    0x000081f7, 0x000081f8, 0x000081f9, 0x000081fa, 0x000081fb, 0x00008200, 0x00008210, 0x00008211,
+    0x00008212, 0x00008213, 0x00008214, 0x00008215, 0x00008216, 0x00008217, 0x00008218, 0x00008219,
+    0x0000821a, 0x0000821b, 0x0000821c, 0x0000821d, 0x0000821e, 0x0000821f, 0x00008220, 0x00008221,
+    0x00008222, 0x00008223, 0x00008224, 0x00008225, 0x00008226, 0x00008227, 0x00008228, 0x00008229,
+    0x0000822a, 0x0000822b, 0x0000822c, 0x0000822d, 0x0000822e, 0x0000822f, 0x00008230, 0x00008231,
+    0x00008232, 0x00008233, 0x00008234, 0x00008235, 0x00008236, 0x00008237, 0x00008238, 0x00008239,
+    0x0000823a, 0x0000823b, 0x0000823c, 0x00008240, 0x00008241, 0x00008242, 0x00008243, 0x00008244,
+    0x00008245, 0x00008246, 0x00008247, 0x00008248, 0x00008249, 0x0000824a, 0x0000824b, 0x0000824c,
+    0x0000824d, 0x0000824e, 0x0000824f, 0x00008250, 0x00008251, 0x00008252, 0x00008253, 0x00008254,
+    0x00008255, 0x00008256, 0x00008257, 0x00008258, 0x00008259, 0x0000825a, 0x0000825b, 0x0000825c,
+    0x0000825d, 0x0000825e, 0x0000825f, 0x00008260, 0x00008261, 0x00008262, 0x00008263, 0x00008264,
+    0x00008265, 0x00008266, 0x00008267, 0x00008268, 0x00008269, 0x0000826a, 0x0000826b, 0x0000826c,
+    0x0000826d, 0x0000826e, 0x0000826f, 0x00008270, 0x00008271, 0x00008272, 0x00008273, 0x00008274,
+    0x00008275, 0x00008276, 0x00008277, 0x00008278, 0x00008279, 0x0000827a, 0x0000827b, 0x0000827c,
+    0x0000827d, 0x0000827e, 0x0000827f, 0x00008280, 0x00008281, 0x00008282, 0x00008283, 0x00008284,
+    0x00008285, 0x00008286, 0x00008287, 0x00008288, 0x00008289, 0x0000828a, 0x0000828b, 0x0000828c,
+    0x0000828d, 0x0000828e, 0x0000828f, 0x00008290, 0x00008291, 0x00008292, 0x00008293, 0x00008294,
+    0x00008295, 0x00008296, 0x00008297, 0x00008298, 0x00008299, 0x0000829a, 0x0000829b, 0x0000829c,
+    0x0000829d, 0x0000829e, 0x0000829f, 0x000082a0, 0x000082a1, 0x000082a2, 0x000082a3, 0x000082a4,
+    0x000082a5, 0x000082a6, 0x000082a7, 0x000082a8, 0x000082a9, 0x000082aa, 0x000082ac, 0x000082ad,
+    0x000082ae, 0x000082af, 0x000082b1, 0x000082b2, 0x000082b3, 0x000082b4, 0x000082b5, 0x000082b6,
+    0x000082b7, 0x000082b8, 0x000082b9, 0x000082ba, 0x000082bb, 0x000082bc, 0x000082bd, 0x000082be,
+    0x000082bf, 0x000082c0, 0x000082c1, 0x000082c2, 0x000082c3, 0x000082c4, 0x000082c5, 0x000082c6,
+    0x000082c7, 0x000082c8, 0x000082c9, 0x000082ca, 0x000082cb, 0x000082cc, 0x000082cd, 0x000082ce,
+    0x000082cf, 0x000082d0, 0x000082d1, 0x000082d2, 0x000082d3, 0x000082d4, 0x000082d5, 0x000082d6,
+    0x000082d7, 0x000082d8, 0x000082d9, 0x000082da, 0x000082db, 0x000082dc, 0x000082dd, 0x000082de,
+    0x000082df, 0x000082e0, 0x000082e1, 0x000082e2, 0x000082e3, 0x000082e4, 0x000082e5, 0x000082e6,
+    0x000082e7, 0x000082e8, 0x000082e9, 0x00008316, 0x00008320, 0x00008321, 0x00008329, 0x0000832c,
+    0x0000832d, 0x00008330, 0x00008331, 0x00008332, 0x00008333, 0x00008334, 0x00008335, 0x00008336,
+    0x00008337, 0x00008338, 0x00008349, 0x0000834a, 0x0000834c, 0x0000834d, 0x0000834e, 0x0000834f,
+    0x00008350, 0x00008351, 0x00008352, 0x0000835c, 0x0000835d, 0x0000835e, 0x0000835f, 0x00008360,
+    0x00008361, 0x00008362, 0x00008363, 0x00008364, 0x00008365, 0x00008366, 0x00008367, 0x00008368,
+    0x00008369, 0x0000836a, 0x0000836b, 0x00008370, 0x000083a0, 0x000083a1, 0x000083a2, 0x000083a3,
+    0x000083a4, 0x000083a5, 0x000083ee, 0x000083ef, 0x000083f0, 0x000083f1, 0x000083f2, 0x000083f3,
+    0x000083f4, 0x000083f5, 0x000083f6, 0x000083f7, 0x000083f8, 0x000083ff, 0x00008400, 0x00008401,
+    0x00008402, 0x00008403, 0x00008404, 0x00008405, 0x00008406, 0x00008407, 0x00008408, 0x00008409,
+    0x0000840a, 0x0000840b, 0x0000840c, 0x0000840d, 0x0000840e, 0x0000840f, 0x00008410, 0x00008411,
+    0x00008412, 0x00008413, 0x0000842e, 0x0000842f, 0x00008430, 0x00008433, 0x00008434, 0x00008439,
+    0x0000843a, 0x0000843b, 0x0000843c, 0x0000843e, 0x0000843f, 0x00008440, 0x00008441, 0x00008442,
+    0x00008443, 0x00008444, 0x00008445, 0x00008446, 0x00008447, 0x00008450, 0x00008451, 0x00008452,
+    0x00008453, 0x00008454, 0x00008455, 0x00008456, 0x00008457, 0x00008458, 0x00008459, 0x0000845a,
+    0x0000845b, 0x0000845c, 0x0000845d, 0x0000845e, 0x0000845f, 0x0000846d, 0x0000846e, 0x00008490,
+    0x00008491, 0x000084c0, 0x000084c1, 0x000084c2, 0x000084c3, 0x000084c4, 0x000084c5, 0x000084c6,
+    0x000084c7, 0x000084c8, 0x000084c9, 0x000084ca, 0x000084cb, 0x000084cc, 0x000084cd, 0x000084ce,
+    0x000084cf, 0x000084d0, 0x000084d1, 0x000084d2, 0x000084d3, 0x000084d4, 0x000084d5, 0x000084d6,
+    0x000084d7, 0x000084d8, 0x000084d9, 0x000084da, 0x000084db, 0x000084dc, 0x000084dd, 0x000084de,
+    0x000084df, 0x000084e0, 0x000084e1, 0x000084e2, 0x000084e3, 0x000084e4, 0x000084e5, 0x000084e6,
+    0x000084e7, 0x000084e8, 0x000084e9, 0x000084ea, 0x000084eb, 0x000084ec, 0x000084ed, 0x000084ee,
+    0x000084ef, 0x000084f0, 0x000084f1, 0x000084f2, 0x000084f3, 0x000084f4, 0x000084f5, 0x000084f6,
+    0x000084f7, 0x000084f8, 0x000084f9, 0x000084fa, 0x000084fd, 0x000084fe, 0x000084ff, 0x00008500,
+    0x00008501, 0x00008502, 0x00008503, 0x00008504, 0x00008505, 0x00008506, 0x00008507, 0x00008508,
+    0x00008509, 0x0000850a, 0x0000850b, 0x0000850c, 0x0000850d, 0x0000850e, 0x0000850f, 0x00008510,
+    0x00008511, 0x00008512, 0x00008513, 0x00008514, 0x00008515, 0x00008516, 0x00008517, 0x00008518,
+    0x00008519, 0x0000851a, 0x0000851b, 0x0000851c, 0x0000851d, 0x0000851e, 0x0000851f, 0x00008520,
+    0x00008521, 0x00008522, 0x00008523, 0x00008524, 0x00008525, 0x00008526, 0x00008527, 0x00008528,
+    0x00008529, 0x0000852a, 0x0000852b, 0x0000852c, 0x0000852d, 0x0000852e, 0x0000852f, 0x00008530,
+    0x00008531, 0x00008532, 0x00008533, 0x00008534, 0x00008535, 0x00008536, 0x00008537, 0x00008538,
+    0x00008539, 0x0000853a, 0x0000853b, 0x0000853c, 0x0000853d, 0x0000853e, 0x0000853f, 0x00008540,
+    0x00008541, 0x00008542, 0x00008543, 0x00008544, 0x00008545, 0x00008546, 0x00008547, 0x00008548,
+    0x00008549, 0x0000854a, 0x0000854b, 0x0000854c, 0x0000854d, 0x0000854e, 0x0000854f, 0x00008550,
+    0x00008551, 0x00008552, 0x00008553, 0x00008554, 0x00008555, 0x00008556, 0x00008557, 0x00008558,
+    0x00008559, 0x0000855a, 0x0000855b, 0x0000855c, 0x0000855d, 0x0000855e, 0x0000855f, 0x00008560,
+    0x00008561, 0x00008562, 0x00008563, 0x00008564, 0x00008565, 0x00008566, 0x00008567, 0x00008568,
+    0x00008570, 0x00008571, 0x00008572, 0x00008573, 0x00008574, 0x00008575, 0x00008576, 0x00008577,
+    0x00008578, 0x00008580, 0x00008581, 0x00008582, 0x00008583, 0x00008588, 0x00008589, 0x0000858a,
+    0x0000858b, 0x00008590, 0x00008591, 0x00008592, 0x00008593, 0x00008598, 0x00008599, 0x0000859a,
+    0x0000859b, 0x000085a5, 0x000085a6, 0x000085a7, 0x000085a8, 0x000085a9, 0x000085aa, 0x000085ab,
+    0x000085ac, 0x000085ad, 0x000085ae, 0x000085af, 0x000085b0, 0x000085b1, 0x000085b2, 0x000085b3,
+    0x000085b4, 0x000085b5, 0x000085b7, 0x000085b8, 0x000085b9, 0x000085ba, 0x000085bb, 0x000085bc,
+    0x000085bd, 0x000085be, 0x000085bf, 0x000085c0, 0x000085c1, 0x000085c2, 0x000085c3, 0x000085c4,
+    0x000085c5, 0x000085c6, 0x000085c7, 0x000085c8, 0x000085c9, 0x000085ca, 0x000085cb, 0x000085cc,
+    0x000085e0, 0x000085e1, 0x000085e2, 0x000085e3, 0x000085e4, 0x000085e5, 0x000085e6, 0x000085e7,
+    0x000085e8, 0x000085e9, 0x000085ea, 0x000085eb, 0x000085ec, 0x000085ed, 0x000085ee, 0x000085ef,
+    0x000085f0, 0x000085f1, 0x000085f2, 0x000085f3, 0x000085f4, 0x000085f5, 0x000085f6, 0x000085f7,
+    0x000085f8, 0x000085f9, 0x000085fa, 0x000085fb, 0x00008614, 0x00008615, 0x00008620, 0x00008621,
+    0x00008622, 0x00008623, 0x00008624, 0x00008625, 0x00008626, 0x00008627, 0x00008628, 0x00008629,
+    0x0000862a, 0x0000862b, 0x0000862c, 0x0000862d, 0x0000862e, 0x0000862f, 0x00008630, 0x00008631,
+    0x00008632, 0x00008633, 0x00008634, 0x00008635, 0x00008636, 0x00008637, 0x00008640, 0x00008641,
+    0x00008642, 0x00008643, 0x00008644, 0x00008645, 0x00008646, 0x00008647, 0x00008648, 0x00008649,
+    0x0000864a, 0x0000864b, 0x0000864c, 0x0000864d, 0x0000864e, 0x0000864f, 0x00008650, 0x00008651,
+    0x00008652, 0x00008653, 0x00008654, 0x00008655, 0x00008656, 0x00008657, 0x00008658, 0x00008659,
+    0x0000865a, 0x0000865b, 0x0000865c, 0x0000865d, 0x0000865e, 0x0000865f, 0x00008660, 0x00008661,
+    0x00008662, 0x00008663, 0x00008664, 0x00008665, 0x00008666, 0x00008667, 0x00008668, 0x00008669,
+    0x0000866a, 0x0000866b, 0x0000866c, 0x0000866d, 0x0000866e, 0x0000866f, 0x00008670, 0x00008671,
+    0x00008672, 0x00008673, 0x00008674, 0x00008675, 0x00008676, 0x00008677, 0x00008678, 0x00008679,
+    0x0000867a, 0x0000867b, 0x0000867c, 0x0000867d, 0x0000867e, 0x0000867f, 0x000086a0, 0x000086a1,
+    0x000086a2, 0x000086a3, 0x000086a4, 0x000086a5, 0x000086a6, 0x000086a7, 0x000086a8, 0x000086a9,
+    0x000086aa, 0x000086ab, 0x000086ac, 0x000086ad, 0x000086ae, 0x000086af, 0x000086b0, 0x000086b1,
+    0x000086b2, 0x000086b3, 0x000086b4, 0x000086c0, 0x000086c1, 0x000086c2, 0x000086c3, 0x000086c4,
+    0x000086c5, 0x000086c6, 0x000086c7, 0x000086c8, 0x000086c9, 0x000086ca, 0x000086cb, 0x000086cc,
+    0x000086cd, 0x000086ce, 0x000086cf, 0x000086d0, 0x000086d1, 0x000086d2, 0x000086d3, 0x000086d4,
+    0x000086d5, 0x000086d6, 0x000086d7, 0x000086d8, 0x000086d9, 0x000086da, 0x000086db, 0x000086dc,
+    0x000086dd, 0x000086de, 0x000086df, 0x000086e0, 0x000086e1, 0x000086e2, 0x000086e3, 0x000086e4,
+    0x000086e5, 0x000086e6, 0x000086e7, 0x000086e8, 0x000086e9, 0x000086ea, 0x000086eb, 0x000086ec,
+    0x000086ed, 0x000086ee, 0x000086ef, 0x000086f0, 0x000086f1, 0x000086f2, 0x000086f3, 0x000086f4,
+    0x000086f5, 0x000086f6, 0x000086f7, 0x000086f8, 0x000086f9, 0x000086fa, 0x000086fb, 0x000086fc,
+    0x000086fd, 0x000086fe, 0x000086ff, 0x00008700, 0x00008701, 0x00008702, 0x00008703, 0x00008704,
+    0x00008705, 0x00008706, 0x00008707, 0x00008708, 0x00008709, 0x0000870a, 0x0000870b, 0x0000870c,
+    0x0000870d, 0x0000870e, 0x0000870f, 0x00008710, 0x00008711, 0x00008712, 0x00008713, 0x00008714,
+    0x00008715, 0x00008716, 0x00008717, 0x00008718, 0x00008719, 0x0000871a, 0x0000871b, 0x0000871c,
+    0x0000871d, 0x0000871e, 0x0000871f, 0x00008722, 0x00008723, 0x00008724, 0x00008725, 0x00008726,
+    0x00008727, 0x00008728, 0x00008729, 0x0000872a, 0x0000872b, 0x0000872c, 0x0000872d, 0x0000872e,
+    0x0000872f, 0x00008730, 0x00008731, 0x00008732, 0x00008733, 0x00008734, 0x00008735, 0x00008736,
+    0x00008737, 0x00008738, 0x00008739, 0x0000873a, 0x0000873b, 0x0000873c, 0x0000873d, 0x0000873e,
+    0x0000873f, 0x00008740, 0x00008741, 0x00008742, 0x00008743, 0x00008744, 0x00008745, 0x00008746,
+    0x0000874a, 0x0000874b, 0x0000874c, 0x0000874d, 0x0000874e, 0x00008757, 0x00008758, 0x00008759,
+    0x0000875a, 0x0000875b, 0x0000875c, 0x0000875d, 0x0000875e, 0x00008760, 0x00008761, 0x00008762,
+    0x00008763, 0x00008764, 0x00008765, 0x00008766, 0x00008767, 0x00008768, 0x00008769, 0x0000876a,
+    0x0000876b, 0x0000876c, 0x0000876d, 0x0000876e, 0x0000876f, 0x00008770, 0x00008771, 0x00008772,
+    0x00008773, 0x00008774, 0x00008775, 0x00008776, 0x00008777, 0x00008778, 0x00008779, 0x0000877a,
+    0x0000877b, 0x0000877c, 0x00008780, 0x00008781, 0x00008782, 0x00008783, 0x00008784, 0x00008785,
+    0x00008786, 0x00008787, 0x00008788, 0x00008789, 0x0000878a, 0x0000878b, 0x0000878c, 0x0000878d,
+    0x0000878e, 0x0000878f, 0x00008790, 0x00008791, 0x00008792, 0x00008793, 0x00008794, 0x00008795,
+    0x00008796, 0x00008797, 0x00008798, 0x00008799, 0x0000879a, 0x0000879b, 0x0000879c, 0x0000879d,
+    0x0000879e, 0x0000879f, 0x000087a0, 0x000087a1, 0x000087a2, 0x000087a3, 0x000087a4, 0x000087a5,
+    0x000087a6, 0x000087a7, 0x000087a8, 0x000087a9, 0x000087aa, 0x000087ab, 0x000087ac, 0x000087ad,
+    0x000087ae, 0x000087af, 0x000087b0, 0x000087b1, 0x000087b2, 0x000087b3, 0x000087b4, 0x000087b5,
+    0x000087b6, 0x000087b7, 0x000087b8, 0x000087b9, 0x000087ba, 0x000087bb, 0x000087bc, 0x000087bd,
+    0x000087be, 0x000087bf, 0x000087c0, 0x000087c1, 0x000087c2, 0x000087c3, 0x000087c4, 0x000087c5,
+    0x000087c6, 0x000087c7, 0x000087c8, 0x000087c9, 0x000087ca, 0x000087cb, 0x000087cc, 0x000087cd,
+    0x000087ce, 0x000087cf, 0x000087d0, 0x000087d1, 0x000087d2, 0x000087d3, 0x000087d4, 0x000087d5,
+    0x000087d6, 0x000087d7, 0x000087d8, 0x000087d9, 0x000087da, 0x000087db, 0x000087dc, 0x000087dd,
+    0x000087de, 0x000087df, 0x000087e0, 0x000087e1, 0x000087e2, 0x000087e3, 0x000087e4, 0x000087e5,
+    0x000087e6, 0x000087e7, 0x000087e8, 0x000087e9, 0x000087ea, 0x000087eb, 0x000087ec, 0x000087ed,
+    0x000087ee, 0x000087f0, 0x000087f1, 0x000087f2, 0x000087f3, 0x000087f4, 0x000087f5, 0x000087f6,
+    0x000087f7, 0x000087f8, 0x000087f9, 0x000087fa, 0x000087fb, 0x000087fc, 0x000087fd, 0x000087fe,
+    0x000087ff, 0x00008800, 0x00008801, 0x00008802, 0x00008803, 0x00008804, 0x00008805, 0x00008806,
+    0x00008807, 0x00008808, 0x00008809, 0x0000880a, 0x0000880b, 0x0000880c, 0x0000880d, 0x0000880e,
+    0x0000880f, 0x00008810, 0x00008814, 0x00008815, 0x00008816, 0x00008817, 0x00008818, 0x00008819,
+    0x0000881a, 0x0000881b, 0x0000881c, 0x0000881d, 0x0000881e, 0x0000881f, 0x00008820, 0x00008823,
+    0x00008824, 0x00008825, 0x00008826, 0x00008827, 0x00008828, 0x00008829, 0x0000882a, 0x0000882b,
+    0x0000882c, 0x0000882d, 0x0000882e, 0x0000882f, 0x00008830, 0x00008831, 0x00008832, 0x00008833,
+    0x00008834, 0x00008837, 0x0000883d, 0x0000883f, 0x00008840, 0x00008841, 0x00008842, 0x00008843,
+    0x00008844, 0x00008845, 0x00008846, 0x00008847, 0x00008848, 0x00008849, 0x0000884a, 0x0000884b,
+    0x0000884c, 0x0000884d, 0x0000884e, 0x0000884f, 0x00008850, 0x00008851, 0x00008852, 0x00008853,
+    0x00008854, 0x00008855, 0x00008856, 0x00008857, 0x00008858, 0x00008859, 0x0000885a, 0x0000885b,
+    0x0000885c, 0x0000885d, 0x0000885e, 0x0000885f, 0x00008860, 0x00008861, 0x00008862, 0x00008863,
+    0x00008864, 0x00008865, 0x00008866, 0x00008867, 0x00008868, 0x00008869, 0x0000886a, 0x0000886c,
+    0x0000886d, 0x0000886e, 0x0000886f, 0x00008870, 0x00008871, 0x00008872, 0x00008873, 0x00008874,
+    0x00008875, 0x00008876, 0x00008878, 0x00008879, 0x0000887a, 0x0000887b, 0x0000887c, 0x0000887d,
+    0x0000887f, 0x00008880, 0x00008881, 0x00008882, 0x00008883, 0x00008884, 0x00008885, 0x00008886,
+    0x00008887, 0x00008888, 0x00008889, 0x0000888a, 0x0000888b, 0x0000888c, 0x0000888d, 0x0000888e,
+    0x0000888f, 0x00008890, 0x00008891, 0x00008892, 0x00008893, 0x00008894, 0x00008895, 0x00008896,
+    0x00008897, 0x00008898, 0x00008899, 0x0000889a, 0x0000889b, 0x0000889c, 0x0000889d, 0x0000889e,
+    0x0000889f, 0x000088a0, 0x000088a1, 0x000088a2, 0x000088a3, 0x000088a4, 0x000088a5, 0x000088a6,
+    0x000088a7, 0x000088a8, 0x000088a9, 0x000088aa, 0x000088ab, 0x000088ac, 0x000088ad, 0x000088ae,
+    0x000088af, 0x000088b0, 0x000088b1, 0x000088b2, 0x000088b3, 0x000088b4, 0x000088b5, 0x000088b6,
+    0x000088b7, 0x000088b8, 0x000088b9, 0x000088ba, 0x000088bb, 0x000088bc, 0x000088bd, 0x000088be,
+    0x000088bf, 0x000088c0, 0x000088c1, 0x000088c2, 0x000088c3, 0x000088c4, 0x000088c5, 0x000088c6,
+    0x000088c7, 0x000088c8, 0x000088c9, 0x000088ca, 0x000088cb, 0x000088cc, 0x000088cd, 0x000088ce,
+    0x000088cf, 0x000088d0, 0x000088d1, 0x000088d2, 0x000088d3, 0x000088d4, 0x000088d5, 0x000088d6,
+    0x000088d7, 0x000088d8, 0x000088d9, 0x000088da, 0x000088db, 0x000088dc, 0x000088dd, 0x000088de,
+    0x000088df, 0x000088e0, 0x000088e1, 0x000088e2, 0x000088e4, 0x000088e5, 0x000088e6, 0x000088e8,
+    0x000088e9, 0x000088ea, 0x000088eb, 0x000088ec, 0x000088ed, 0x000088ee, 0x000088ef, 0x000088f0,
+    0x000088f1, 0x000088f2, 0x000088f3, 0x000088f4, 0x000088f5, 0x000088f6, 0x000088f7, 0x000088f8,
+    0x000088f9, 0x000088fa, 0x000088fb, 0x000088fc, 0x000088fd, 0x000088fe, 0x000088ff, 0x00008904,
+    0x00008905, 0x00008906, 0x00008907, 0x00008908, 0x00008909, 0x0000890b, 0x0000890e, 0x0000890f,
+    0x00008910, 0x00008911, 0x00008912, 0x00008914, 0x00008916, 0x00008917, 0x00008918, 0x00008919,
+    0x0000891a, 0x0000891b, 0x0000891c, 0x0000891d, 0x0000891e, 0x0000891f, 0x00008920, 0x00008921,
+    0x00008922, 0x00008923, 0x00008924, 0x00008925, 0x00008926, 0x00008941, 0x00008942, 0x00008943,
+    0x00008944, 0x00008945, 0x00008946, 0x00008947, 0x00008948, 0x00008961, 0x00008963, 0x00008964,
+    0x00008965, 0x00008966, 0x00008967, 0x00008968, 0x00008969, 0x0000896a, 0x0000896b, 0x0000896c,
+    0x0000896d, 0x0000896e, 0x0000896f, 0x00008970, 0x00008971, 0x00008972, 0x00008973, 0x00008974,
+    0x00008975, 0x00008976, 0x00008977, 0x00008978, 0x00008979, 0x0000897a, 0x0000897b, 0x00008980,
+    0x00008981, 0x00008982, 0x00008983, 0x00008984, 0x00008985, 0x00008986, 0x00008987, 0x00008988,
+    0x00008989, 0x0000898a, 0x0000898b, 0x0000898c, 0x00008a00, 0x00008a01, 0x00008a02, 0x00008a03,
+    0x00008a04, 0x00008a05, 0x00008a06, 0x00008a07, 0x00008a08, 0x00008a09, 0x00008a0a, 0x00008a0b,
+    0x00008a0c, 0x00008a0d, 0x00008a0e, 0x00008a0f, 0x00008a10, 0x00008a11, 0x00008a12, 0x00008a13,
+    0x00008a14, 0x00008a15, 0x00008a16, 0x00008a19, 0x00008a1a, 0x00008a1b, 0x00008a1c, 0x00008a1d,
+    0x00008a1f, 0x00008a28, 0x00008a29, 0x00008a2a, 0x00008a2b, 0x00008a2c, 0x00008a2d, 0x00008a2e,
+    0x00008a2f, 0x00008a30, 0x00008a31, 0x00008a32, 0x00008a33, 0x00008a34, 0x00008a35, 0x00008a36,
+    0x00008a37, 0x00008a38, 0x00008a39, 0x00008a3a, 0x00008a3b, 0x00008a3c, 0x00008a3d, 0x00008a3e,
+    0x00008a3f, 0x00008a40, 0x00008a41, 0x00008a42, 0x00008a43, 0x00008a44, 0x00008a45, 0x00008a46,
+    0x00008a48, 0x00008a49, 0x00008a4a, 0x00008a4f, 0x00008a52, 0x00008a53, 0x00008b30, 0x00008b31,
+    0x00008b40, 0x00008b48, 0x00008b49, 0x00008b4a, 0x00008b4b, 0x00008b4c, 0x00008b4d, 0x00008b4e,
+    0x00008b4f, 0x00008b50, 0x00008b51, 0x00008b52, 0x00008b53, 0x00008b54, 0x00008b55, 0x00008b56,
+    0x00008b57, 0x00008b58, 0x00008b59, 0x00008b5a, 0x00008b5b, 0x00008b5c, 0x00008b5d, 0x00008b5e,
+    0x00008b5f, 0x00008b60, 0x00008b61, 0x00008b62, 0x00008b63, 0x00008b64, 0x00008b65, 0x00008b66,
+    0x00008b67, 0x00008b68, 0x00008b69, 0x00008b6a, 0x00008b80, 0x00008b81, 0x00008b82, 0x00008b83,
+    0x00008b84, 0x00008b85, 0x00008b86, 0x00008b87, 0x00008b88, 0x00008b89, 0x00008b8a, 0x00008b8b,
+    0x00008b8c, 0x00008b8d, 0x00008b90, 0x00008b91, 0x00008b92, 0x00008b93, 0x00008b94, 0x00008b95,
+    0x00008b96, 0x00008b97, 0x00008b98, 0x00008b99, 0x00008b9a, 0x00008b9b, 0x00008b9c, 0x00008b9d,
+    0x00008b9e, 0x00008b9f, 0x00008bc0, 0x00008bc1, 0x00008bc2, 0x00008bc3, 0x00008bc4, 0x00008bc5,
+    0x00008bc6, 0x00008bd2, 0x00008bd3, 0x00008bd4, 0x00008bd5, 0x00008bd6, 0x00008bd7, 0x00008bd8,
+    0x00008bd9, 0x00008bda, 0x00008bdb, 0x00008bdc, 0x00008c00, 0x00008c01, 0x00008c02, 0x00008c03,
+    0x00008c04, 0x00008c05, 0x00008c06, 0x00008c07, 0x00008c08, 0x00008c09, 0x00008c0a, 0x00008c10,
+    0x00008c11, 0x00008c12, 0x00008c13, 0x00008c14, 0x00008c15, 0x00008c16, 0x00008c17, 0x00008c18,
+    0x00008c19, 0x00008c1a, 0x00008c1b, 0x00008c1c, 0x00008c1d, 0x00008c26, 0x00008c27, 0x00008c28,
+    0x00008c29, 0x00008c2a, 0x00008c2b, 0x00008c2c, 0x00008c2d, 0x00008c2e, 0x00008c2f, 0x00008c36,
+    0x00008c37, 0x00008c3a, 0x00008c3b, 0x00008c3c, 0x00008c3d, 0x00008c3e, 0x00008c3f, 0x00008c40,
+    0x00008c41, 0x00008c42, 0x00008c43, 0x00008c44, 0x00008c45, 0x00008c46, 0x00008c47, 0x00008c48,
+    0x00008c49, 0x00008c4a, 0x00008c4b, 0x00008c4c, 0x00008c4d, 0x00008c4e, 0x00008c4f, 0x00008c70,
+    0x00008c71, 0x00008c72, 0x00008c73, 0x00008c74, 0x00008c75, 0x00008c76, 0x00008c77, 0x00008c78,
+    0x00008c79, 0x00008c7a, 0x00008c7b, 0x00008c7c, 0x00008c7d, 0x00008c7e, 0x00008c7f, 0x00008c80,
+    0x00008c81, 0x00008c82, 0x00008c83, 0x00008c84, 0x00008c85, 0x00008c86, 0x00008c87, 0x00008c88,
+    0x00008c89, 0x00008c8a, 0x00008c8b, 0x00008c8c, 0x00008c8d, 0x00008c8e, 0x00008c8f, 0x00008c92,
+    0x00008c93, 0x00008ca0, 0x00008ca1, 0x00008ca2, 0x00008ca3, 0x00008ca4, 0x00008ca5, 0x00008ca6,
+    0x00008ca7, 0x00008ca8, 0x00008ca9, 0x00008caa, 0x00008cab, 0x00008cac, 0x00008cad, 0x00008cd0,
+    0x00008cd1, 0x00008cd2, 0x00008cd3, 0x00008cd4, 0x00008cd5, 0x00008cd6, 0x00008cd7, 0x00008cd9,
+    0x00008cda, 0x00008cdb, 0x00008cdc, 0x00008cdd, 0x00008cdf, 0x00008ce0, 0x00008ce1, 0x00008ce2,
+    0x00008ce3, 0x00008ce4, 0x00008ce5, 0x00008ce6, 0x00008ce7, 0x00008ce8, 0x00008ce9, 0x00008cea,
+    0x00008ceb, 0x00008cec, 0x00008ced, 0x00008cee, 0x00008cef, 0x00008d00, 0x00008d20, 0x00008d40,
+    0x00008d41, 0x00008d42, 0x00008d43, 0x00008d44, 0x00008d46, 0x00008d47, 0x00008d48, 0x00008d49,
+    0x00008d50, 0x00008d51, 0x00008d52, 0x00008d53, 0x00008d54, 0x00008d55, 0x00008d56, 0x00008d57,
+    0x00008d60, 0x00008d61, 0x00008d62, 0x00008d64, 0x00008d65, 0x00008d66, 0x00008d67, 0x00008d68,
+    0x00008d69, 0x00008d6a, 0x00008d6b, 0x00008d6c, 0x00008d70, 0x00008d71, 0x00008d72, 0x00008d73,
+    0x00008d74, 0x00008d75, 0x00008d76, 0x00008d77, 0x00008d78, 0x00008d79, 0x00008d7a, 0x00008d7b,
+    0x00008d7c, 0x00008d7d, 0x00008d7e, 0x00008d7f, 0x00008d80, 0x00008d81, 0x00008d82, 0x00008d83,
+    0x00008d84, 0x00008d85, 0x00008d86, 0x00008d87, 0x00008d88, 0x00008d89, 0x00008d8a, 0x00008d8b,
+    0x00008d8c, 0x00008d8d, 0x00008d8e, 0x00008d8f, 0x00008d90, 0x00008d91, 0x00008d92, 0x00008d93,
+    0x00008d94, 0x00008d95, 0x00008d96, 0x00008d97, 0x00008d98, 0x00008d99, 0x00008d9a, 0x00008d9b,
+    0x00008d9c, 0x00008d9d, 0x00008d9e, 0x00008d9f, 0x00008da0, 0x00008da1, 0x00008da2, 0x00008da3,
+    0x00008da4, 0x00008da5, 0x00008da6, 0x00008da7, 0x00008da8, 0x00008da9, 0x00008dab, 0x00008dac,
+    0x00008dad, 0x00008dae, 0x00008daf, 0x00008db9, 0x00008dba, 0x00008dbb, 0x00008dbc, 0x00008dbd,
+    0x00008dbe, 0x00008dc0, 0x00008dc1, 0x00008dc2, 0x00008dc3, 0x00008dc4, 0x00008dc5, 0x00008dc6,
+    0x00008dc7, 0x00008dc8, 0x00008dc9, 0x00008dca, 0x00008dcb, 0x00008dcc, 0x00008dcd, 0x00008dce,
+    0x00008dcf, 0x00008dd0, 0x00008dd1, 0x00008dd2, 0x00008dd3, 0x00008dd4, 0x00008dd5, 0x00008dd6,
+    0x00008dd7, 0x00008dd8, 0x00008dd9, 0x00008dda, 0x00008ddb, 0x00008ddc, 0x00008ddd, 0x00008dde,
+    0x00008ddf, 0x00008de0, 0x00008de1, 0x00008de2, 0x00008de3, 0x00008de4, 0x00008de5, 0x00008de6,
+    0x00008de7, 0x00008de8, 0x00008de9, 0x00008dea, 0x00008ded, 0x00008dee, 0x00008def, 0x00008df0,
+    0x00008df1, 0x00008df2, 0x00008df3, 0x00008df4, 0x00008df5, 0x00008df6, 0x00008df7, 0x00008df8,
+    0x00008df9, 0x00008dfa, 0x00008dfb, 0x00008dfc, 0x00008dfd, 0x00008e10, 0x00008e11, 0x00008e12,
+    0x00008e13, 0x00008e14, 0x00008e15, 0x00008e16, 0x00008e1e, 0x00008e1f, 0x00008e20, 0x00008e22,
+    0x00008e23, 0x00008e24, 0x00008e25, 0x00008e26, 0x00008e27, 0x00008e28, 0x00008e29, 0x00008e2a,
+    0x00008e2b, 0x00008e2c, 0x00008e2d, 0x00008e2e, 0x00008e2f, 0x00008e42, 0x00008e43, 0x00008e44,
+    0x00008e45, 0x00008e46, 0x00008e47, 0x00008e48, 0x00008e49, 0x00008e4a, 0x00008e4b, 0x00008e4c,
+    0x00008e4d, 0x00008e4e, 0x00008e4f, 0x00008e50, 0x00008e51, 0x00008e52, 0x00008e53, 0x00008e54,
+    0x00008e55, 0x00008e56, 0x00008e57, 0x00008e58, 0x00008e59, 0x00008e5a, 0x00008e5b, 0x00008e5c,
+    0x00008e5d, 0x00008e5e, 0x00008e5f, 0x00008e70, 0x00008e71, 0x00008e72, 0x00008e73, 0x00008e74,
+    0x00008e75, 0x00008e76, 0x00008e77, 0x00008e78, 0x00008e79, 0x00008e7a, 0x00008e7b, 0x00008e7c,
+    0x00008e7d, 0x00008e7e, 0x00008e7f, 0x00008e80, 0x00008e81, 0x00008e82, 0x00008e83, 0x00008e84,
+    0x00008e85, 0x00008e86, 0x00008e87, 0x00008e88, 0x00008e89, 0x00008e8a, 0x00008e8c, 0x00008e8d,
+    0x00008e8e, 0x00008e8f, 0x00008ed0, 0x00008ed1, 0x00008ed2, 0x00008ed3, 0x00008ed5, 0x00008ed6,
+    0x00008ed7, 0x00008f1d, 0x00008f1e, 0x00008f1f, 0x00008f20, 0x00008f21, 0x00008f22, 0x00008f23,
+    0x00008f24, 0x00008f25, 0x00008f26, 0x00008f27, 0x00008f28, 0x00008f29, 0x00008f2a, 0x00008f2b,
+    0x00008f2c, 0x00008f2d, 0x00008f2e, 0x00008f2f, 0x00008f30, 0x00008f31, 0x00008f32, 0x00008f33,
+    0x00008f34, 0x00008f35, 0x00008f36, 0x00008f37, 0x00008f38, 0x00008f39, 0x00008f3a, 0x00008f3b,
+    0x00008f3c, 0x00008f3d, 0x00008f3e, 0x00008f3f, 0x00008f40, 0x00008f41, 0x00008f42, 0x00008f43,
+    0x00008f46, 0x00008f47, 0x00008f48, 0x00008f49, 0x00008f4a, 0x00008f4b, 0x00008f4c, 0x00008f4d,
+    0x00008f4e, 0x00008f60, 0x00008f61, 0x00008f90, 0x00008f91, 0x00008f92, 0x00008f93, 0x00008f94,
+    0x00008f95, 0x00008f96, 0x00008f97, 0x00008f98, 0x00008f99, 0x00008f9a, 0x00008f9b, 0x00008f9c,
+    0x00008f9d, 0x00008f9e, 0x00008f9f, 0x00008fa0, 0x00008fb0, 0x00008fb1, 0x00008fb2, 0x00008fb3,
+    0x00008fbb, 0x00008fc4, 0x00008fe0, 0x00008fe1, 0x00008fe2, 0x00008fe3, 0x00008fe4, 0x00008fe5,
+    0x00008fe6, 0x00008fe7, 0x00008fe9, 0x00008fea, 0x00008feb, 0x00008fec, 0x00008fed, 0x00008fee,
+    0x00008fef, 0x00008ff0, 0x00008ff1, 0x00008ff2, 0x00008ff3, 0x00008ff5, 0x00008ff6, 0x00008ff7,
+    0x00008ff8, 0x00008ff9, 0x00008ffa, 0x00008ffb, 0x00008ffc, 0x00008ffd, 0x00008ffe, 0x00009001,
+    0x00009002, 0x00009003, 0x00009004, 0x00009005, 0x00009006, 0x00009007, 0x00009009, 0x0000900a,
+    0x0000900b, 0x0000900c, 0x0000900d, 0x0000900e, 0x0000900f, 0x00009010, 0x00009011, 0x00009012,
+    0x00009013, 0x00009014, 0x00009015, 0x00009016, 0x00009017, 0x00009018, 0x00009019, 0x0000901a,
+    0x0000901b, 0x0000901c, 0x0000901d, 0x0000901e, 0x0000901f, 0x00009020, 0x00009021, 0x00009022,
+    0x00009023, 0x00009024, 0x00009025, 0x00009026, 0x00009027, 0x00009028, 0x00009029, 0x0000902a,
+    0x0000902b, 0x0000902c, 0x0000902d, 0x0000902e, 0x0000902f, 0x00009030, 0x00009031, 0x00009032,
+    0x00009033, 0x00009034, 0x00009035, 0x00009036, 0x00009037, 0x00009038, 0x00009039, 0x0000903a,
+    0x0000903b, 0x0000903c, 0x00009045, 0x00009046, 0x00009047, 0x00009048, 0x00009049, 0x0000904a,
+    0x0000904b, 0x0000904c, 0x0000904d, 0x0000904e, 0x0000904f, 0x00009050, 0x00009051, 0x00009052,
+    0x00009053, 0x00009054, 0x00009055, 0x00009056, 0x00009057, 0x00009058, 0x00009059, 0x0000905a,
+    0x0000905b, 0x0000905c, 0x0000905d, 0x0000905e, 0x0000905f, 0x00009060, 0x00009061, 0x00009062,
+    0x00009063, 0x00009064, 0x00009065, 0x00009066, 0x00009067, 0x00009068, 0x00009069, 0x0000906a,
+    0x0000906b, 0x0000906c, 0x0000906d, 0x0000906e, 0x0000906f, 0x00009070, 0x00009071, 0x00009072,
+    0x00009073, 0x00009074, 0x00009075, 0x00009076, 0x00009077, 0x00009078, 0x00009079, 0x0000907a,
+    0x0000907b, 0x0000907c, 0x0000907d, 0x0000907e, 0x0000907f, 0x00009080, 0x00009081, 0x00009082,
+    0x00009083, 0x00009084, 0x00009088, 0x00009089, 0x0000908a, 0x0000908b, 0x0000908d, 0x0000908e,
+    0x0000908f, 0x00009090, 0x00009091, 0x00009092, 0x00009094, 0x00009096, 0x00009098, 0x0000909a,
+    0x0000909b, 0x0000909c, 0x0000909d, 0x0000909e, 0x0000909f, 0x000090a0, 0x000090a1, 0x000090a2,
+    0x000090a3, 0x000090a4, 0x000090a5, 0x000090a6, 0x000090a7, 0x000090a8, 0x000090a9, 0x000090aa,
+    0x000090ab, 0x000090ac, 0x000090ad, 0x000090ae, 0x000090af, 0x000090b0, 0x000090b1, 0x000090b2,
+    0x000090b3, 0x000090b4, 0x000090b5, 0x000090b6, 0x000090b7, 0x000090b8, 0x000090b9, 0x000090ba,
+    0x000090bb, 0x000090bc, 0x000090bd, 0x000090be, 0x000090bf, 0x000090c7, 0x000090c8, 0x000090c9,
+    0x000090ca, 0x000090cb, 0x000090cc, 0x000090cd, 0x000090ce, 0x000090cf, 0x000090d0, 0x000090d1,
+    0x000090d2, 0x000090d3, 0x000090d4, 0x000090d5, 0x000090d6, 0x000090d7, 0x000090d8, 0x000090d9,
+    0x000090da, 0x000090db, 0x000090dc, 0x000090dd, 0x000090de, 0x000090df, 0x000090e1, 0x000090ea,
+    0x000090eb, 0x000090ec, 0x000090ed, 0x000090ee, 0x000090ef, 0x000090f0, 0x000090f1, 0x000090f2,
+    0x000090f3, 0x000090f4, 0x000090f5, 0x000090f6, 0x000090f7, 0x000090f8, 0x000090f9, 0x000090fa,
+    0x000090fb, 0x000090fc, 0x00009100, 0x00009101, 0x00009102, 0x00009103, 0x00009104, 0x00009105,
+    0x00009106, 0x00009107, 0x00009108, 0x00009109, 0x0000910a, 0x0000910b, 0x0000910c, 0x0000910d,
+    0x0000910e, 0x0000910f, 0x00009110, 0x00009111, 0x00009112, 0x00009113, 0x00009114, 0x00009115,
+    0x00009116, 0x00009117, 0x00009118, 0x00009119, 0x0000911a, 0x0000911b, 0x0000911c, 0x0000911d,
+    0x0000911f, 0x00009120, 0x00009121, 0x00009122, 0x00009123, 0x00009124, 0x00009125, 0x00009126,
+    0x00009127, 0x00009128, 0x00009129, 0x0000912a, 0x0000912b, 0x0000912c, 0x0000912d, 0x0000912e,
+    0x0000912f, 0x00009130, 0x00009133, 0x00009134, 0x00009135, 0x00009136, 0x00009137, 0x00009138,
+    0x00009143, 0x00009144, 0x00009145, 0x00009146, 0x00009147, 0x00009148, 0x00009149, 0x0000914a,
+    0x0000914b, 0x0000914c, 0x0000914d, 0x0000914e, 0x0000914f, 0x00009150, 0x00009151, 0x00009152,
+    0x00009153, 0x00009154, 0x00009155, 0x00009160, 0x00009192, 0x00009193, 0x00009194, 0x00009195,
+    0x00009196, 0x00009197, 0x00009198, 0x00009199, 0x0000919a, 0x0000919b, 0x0000919c, 0x0000919d,
+    0x0000919e, 0x0000919f, 0x000091a4, 0x000091a5, 0x000091a6, 0x000091a7, 0x000091a8, 0x000091a9,
+    0x000091aa, 0x000091b9, 0x000091bb, 0x000091bc, 0x000091bd, 0x000091be, 0x000091bf, 0x00009250,
+    0x00009260, 0x00009270, 0x00009271, 0x00009272, 0x00009273, 0x00009274, 0x00009275, 0x00009276,
+    0x00009277, 0x00009278, 0x00009279, 0x00009280, 0x00009281, 0x00009282, 0x00009283, 0x00009284,
+    0x00009285, 0x00009286, 0x00009287, 0x00009288, 0x00009289, 0x0000928a, 0x0000928b, 0x0000928c,
+    0x0000928d, 0x0000928e, 0x0000928f, 0x00009291, 0x00009292, 0x00009294, 0x00009295, 0x00009296,
+    0x00009297, 0x00009298, 0x00009299, 0x0000929a, 0x0000929b, 0x0000929c, 0x0000929e, 0x0000929f,
+    0x000092a0, 0x000092a1, 0x000092a3, 0x000092a4, 0x000092a5, 0x000092a6, 0x000092a7, 0x000092a8,
+    0x000092a9, 0x000092ad, 0x000092ae, 0x000092af, 0x000092b0, 0x000092b1, 0x000092b2, 0x000092b3,
+    0x000092b4, 0x000092c0, 0x000092c1, 0x000092c2, 0x000092c3, 0x000092c4, 0x000092c5, 0x000092c6,
+    0x000092c7, 0x000092c8, 0x000092c9, 0x000092ca, 0x000092cb, 0x000092cc, 0x000092cd, 0x000092ce,
+    0x000092cf, 0x000092d0, 0x000092d1, 0x000092d2, 0x000092d3, 0x000092d4, 0x000092d5, 0x000092d6,
+    0x000092d7, 0x000092d8, 0x000092d9, 0x000092da, 0x000092db, 0x000092dc, 0x000092e0, 0x000092e1,
+    0x000092e2, 0x000092e3, 0x000092e4, 0x000092e5, 0x000092e6, 0x000092e7, 0x000092e8, 0x000092e9,
+    0x000092ea, 0x000092eb, 0x000092ec, 0x000092ed, 0x000092ee, 0x000092ef, 0x000092f0, 0x000092f1,
+    0x000092f2, 0x000092f3, 0x000092f4, 0x000092f5, 0x000092f6, 0x000092f7, 0x000092f8, 0x000092f9,
+    0x000092fa, 0x000092fb, 0x000092fc, 0x000092fd, 0x000092fe, 0x000092ff, 0x00009300, 0x00009301,
+    0x00009302, 0x00009303, 0x00009304, 0x00009305, 0x00009306, 0x00009307, 0x00009308, 0x00009309,
+    0x0000930a, 0x0000930b, 0x0000930c, 0x0000930d, 0x0000930e, 0x0000930f, 0x00009310, 0x00009311,
+    0x00009312, 0x00009313, 0x00009314, 0x00009315, 0x00009316, 0x00009317, 0x00009318, 0x00009319,
+    0x0000931a, 0x0000931b, 0x0000931c, 0x0000931d, 0x0000931e, 0x0000931f, 0x00009320, 0x00009321,
+    0x00009322, 0x00009323, 0x00009324, 0x00009325, 0x00009326, 0x00009344, 0x00009345, 0x0000934a,
+    0x0000934b, 0x0000934c, 0x00009360, 0x00009361, 0x00009362, 0x00009363, 0x00009364, 0x00009365,
+    0x00009380, 0x000093a0, 0x000093a1, 0x000093a2, 0x000093a3, 0x000093a4, 0x000093a6, 0x000093b0,
+    0x000093b1, 0x000093b2, 0x000093b3, 0x000093b4, 0x000093b5, 0x000093b6, 0x000093b7, 0x000093b8,
+    0x000093b9, 0x000093ba, 0x000093bb, 0x000093bc, 0x000093bd, 0x000093d0, 0x000093d1, 0x000093d2,
+    0x000093d3, 0x000093d4, 0x000093d5, 0x000093d6, 0x000093d7, 0x000093d8, 0x000093d9, 0x000093da,
+    0x000093db, 0x000093dc, 0x000093dd, 0x00010000, 0x00019262, 0x0001928a, 0x00019294, 0x00019295,
+    0x0001929e, 0x0001929f, 0x000192a0, 0x000192a1, 0x000192a2, 0x000192a3, 0x000192a4, 0x000192a5,
+    0x000192a8, 0x000192a9, 0x000192aa, 0x000192ab, 0x000192ac, 0x000192ad, 0x000192ae, 0x000192af,
+    0x0001a1f8, 0x0001a1fd, 0x0001a1fe, 0x0001a202, 0x0001a203, 0x0001a204, 0x0001a20c, 0x0001a20d,
+    0x0001a20e, 0x0001a20f, 0x0001a210, 0x0001a211, 0x0001a216, 0x0001a217, 0x0001a218, 0x0001a219,
+    0x0001a220, 0x0001a221, 0x0001a222, 0x0001a223, 0x0001a22a, 0x0001a22b, 0x0001a22c, 0x0001a22d,
+    0x00020000, 0x00040000, 0x00080000, 0x000fffff, 0x00100000, 0x00200000, 0x00400000, 0x00800000,
+    0x01000000, 0x02000000, 0x04000000, 0x08000000, 0x10000000, 0x20000000, 0x40000000, 0x80000000,
+    0xffffffff
+  };
+
+  const unsigned int glEnumName[3313] = {
+    offsetof(GLEnumPool,n_GL_ZERO),
+    offsetof(GLEnumPool,n_GL_ONE),
+    offsetof(GLEnumPool,n_GL_LINE_LOOP),
+    offsetof(GLEnumPool,n_GL_LINE_STRIP),
+    offsetof(GLEnumPool,n_GL_TRIANGLES),
+    offsetof(GLEnumPool,n_GL_TRIANGLE_STRIP),
+    offsetof(GLEnumPool,n_GL_TRIANGLE_FAN),
+    offsetof(GLEnumPool,n_GL_QUADS),
+    offsetof(GLEnumPool,n_GL_QUAD_STRIP),
+    offsetof(GLEnumPool,n_GL_POLYGON),
+    offsetof(GLEnumPool,n_GL_LINES_ADJACENCY),
+    offsetof(GLEnumPool,n_GL_LINE_STRIP_ADJACENCY),
+    offsetof(GLEnumPool,n_GL_TRIANGLES_ADJACENCY),
+    offsetof(GLEnumPool,n_GL_TRIANGLE_STRIP_ADJACENCY),
+    offsetof(GLEnumPool,n_GL_PATCHES),
+    offsetof(GLEnumPool,n_GL_RELATIVE_SMOOTH_QUADRATIC_CURVE_TO_NV),
+    offsetof(GLEnumPool,n_GL_SMOOTH_CUBIC_CURVE_TO_NV),
+    offsetof(GLEnumPool,n_GL_RELATIVE_SMOOTH_CUBIC_CURVE_TO_NV),
+    offsetof(GLEnumPool,n_GL_SMALL_CCW_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_RELATIVE_SMALL_CCW_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_SMALL_CW_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_RELATIVE_SMALL_CW_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_LARGE_CCW_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_RELATIVE_LARGE_CCW_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_LARGE_CW_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_RELATIVE_LARGE_CW_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_EIGHTH_BIT_ATI),
+    offsetof(GLEnumPool,n_GL_SATURATE_BIT_ATI),
+    offsetof(GLEnumPool,n_GL_COLOR_BUFFER_BIT7_QCOM),
+    offsetof(GLEnumPool,n_GL_RESTART_PATH_NV),
+    offsetof(GLEnumPool,n_GL_DUP_FIRST_CUBIC_CURVE_TO_NV),
+    offsetof(GLEnumPool,n_GL_DUP_LAST_CUBIC_CURVE_TO_NV),
+    offsetof(GLEnumPool,n_GL_RECT_NV),
+    offsetof(GLEnumPool,n_GL_CIRCULAR_CCW_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_CIRCULAR_CW_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_CIRCULAR_TANGENT_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_RELATIVE_ARC_TO_NV),
+    offsetof(GLEnumPool,n_GL_ACCUM),
+    offsetof(GLEnumPool,n_GL_LOAD),
+    offsetof(GLEnumPool,n_GL_RETURN),
+    offsetof(GLEnumPool,n_GL_MULT),
+    offsetof(GLEnumPool,n_GL_ADD),
+    offsetof(GLEnumPool,n_GL_NEVER),
+    offsetof(GLEnumPool,n_GL_LESS),
+    offsetof(GLEnumPool,n_GL_EQUAL),
+    offsetof(GLEnumPool,n_GL_LEQUAL),
+    offsetof(GLEnumPool,n_GL_GREATER),
+    offsetof(GLEnumPool,n_GL_NOTEQUAL),
+    offsetof(GLEnumPool,n_GL_GEQUAL),
+    offsetof(GLEnumPool,n_GL_ALWAYS),
+    offsetof(GLEnumPool,n_GL_SRC_COLOR),
+    offsetof(GLEnumPool,n_GL_ONE_MINUS_SRC_COLOR),
+    offsetof(GLEnumPool,n_GL_SRC_ALPHA),
+    offsetof(GLEnumPool,n_GL_ONE_MINUS_SRC_ALPHA),
+    offsetof(GLEnumPool,n_GL_DST_ALPHA),
+    offsetof(GLEnumPool,n_GL_ONE_MINUS_DST_ALPHA),
+    offsetof(GLEnumPool,n_GL_DST_COLOR),
+    offsetof(GLEnumPool,n_GL_ONE_MINUS_DST_COLOR),
+    offsetof(GLEnumPool,n_GL_SRC_ALPHA_SATURATE),
+    offsetof(GLEnumPool,n_GL_FRONT_LEFT),
+    offsetof(GLEnumPool,n_GL_FRONT_RIGHT),
+    offsetof(GLEnumPool,n_GL_BACK_LEFT),
+    offsetof(GLEnumPool,n_GL_BACK_RIGHT),
+    offsetof(GLEnumPool,n_GL_FRONT),
+    offsetof(GLEnumPool,n_GL_BACK),
+    offsetof(GLEnumPool,n_GL_LEFT),
+    offsetof(GLEnumPool,n_GL_RIGHT),
+    offsetof(GLEnumPool,n_GL_FRONT_AND_BACK),
+    offsetof(GLEnumPool,n_GL_AUX0),
+    offsetof(GLEnumPool,n_GL_AUX1),
+    offsetof(GLEnumPool,n_GL_AUX2),
+    offsetof(GLEnumPool,n_GL_AUX3),
+    offsetof(GLEnumPool,n_GL_INVALID_ENUM),
+    offsetof(GLEnumPool,n_GL_INVALID_VALUE),
+    offsetof(GLEnumPool,n_GL_INVALID_OPERATION),
+    offsetof(GLEnumPool,n_GL_STACK_OVERFLOW),
+    offsetof(GLEnumPool,n_GL_STACK_UNDERFLOW),
+    offsetof(GLEnumPool,n_GL_OUT_OF_MEMORY),
+    offsetof(GLEnumPool,n_GL_INVALID_FRAMEBUFFER_OPERATION),
+    offsetof(GLEnumPool,n_GL_2D),
+    offsetof(GLEnumPool,n_GL_3D),
+    offsetof(GLEnumPool,n_GL_3D_COLOR),
+    offsetof(GLEnumPool,n_GL_3D_COLOR_TEXTURE),
+    offsetof(GLEnumPool,n_GL_4D_COLOR_TEXTURE),
+    offsetof(GLEnumPool,n_GL_PASS_THROUGH_TOKEN),
+    offsetof(GLEnumPool,n_GL_POINT_TOKEN),
+    offsetof(GLEnumPool,n_GL_LINE_TOKEN),
+    offsetof(GLEnumPool,n_GL_POLYGON_TOKEN),
+    offsetof(GLEnumPool,n_GL_BITMAP_TOKEN),
+    offsetof(GLEnumPool,n_GL_DRAW_PIXEL_TOKEN),
+    offsetof(GLEnumPool,n_GL_COPY_PIXEL_TOKEN),
+    offsetof(GLEnumPool,n_GL_LINE_RESET_TOKEN),
+    offsetof(GLEnumPool,n_GL_EXP),
+    offsetof(GLEnumPool,n_GL_EXP2),
+    offsetof(GLEnumPool,n_GL_MODELVIEW_MATRIX_FLOAT_AS_INT_BITS_OES),
+    offsetof(GLEnumPool,n_GL_CW),
+    offsetof(GLEnumPool,n_GL_CCW),
+    offsetof(GLEnumPool,n_GL_COEFF),
+    offsetof(GLEnumPool,n_GL_ORDER),
+    offsetof(GLEnumPool,n_GL_DOMAIN),
+    offsetof(GLEnumPool,n_GL_CURRENT_COLOR),
+    offsetof(GLEnumPool,n_GL_CURRENT_INDEX),
+    offsetof(GLEnumPool,n_GL_CURRENT_NORMAL),
+    offsetof(GLEnumPool,n_GL_CURRENT_TEXTURE_COORDS),
+    offsetof(GLEnumPool,n_GL_CURRENT_RASTER_COLOR),
+    offsetof(GLEnumPool,n_GL_CURRENT_RASTER_INDEX),
+    offsetof(GLEnumPool,n_GL_CURRENT_RASTER_TEXTURE_COORDS),
+    offsetof(GLEnumPool,n_GL_CURRENT_RASTER_POSITION),
+    offsetof(GLEnumPool,n_GL_CURRENT_RASTER_POSITION_VALID),
+    offsetof(GLEnumPool,n_GL_CURRENT_RASTER_DISTANCE),
+    offsetof(GLEnumPool,n_GL_POINT_SMOOTH),
+    offsetof(GLEnumPool,n_GL_POINT_SIZE),
+    offsetof(GLEnumPool,n_GL_POINT_SIZE_RANGE),
+    offsetof(GLEnumPool,n_GL_POINT_SIZE_GRANULARITY),
+    offsetof(GLEnumPool,n_GL_LINE_SMOOTH),
+    offsetof(GLEnumPool,n_GL_LINE_WIDTH),
+    offsetof(GLEnumPool,n_GL_LINE_WIDTH_RANGE),
+    offsetof(GLEnumPool,n_GL_LINE_WIDTH_GRANULARITY),
+    offsetof(GLEnumPool,n_GL_LINE_STIPPLE),
+    offsetof(GLEnumPool,n_GL_LINE_STIPPLE_PATTERN),
+    offsetof(GLEnumPool,n_GL_LINE_STIPPLE_REPEAT),
+    offsetof(GLEnumPool,n_GL_LIST_MODE),
+    offsetof(GLEnumPool,n_GL_MAX_LIST_NESTING),
+    offsetof(GLEnumPool,n_GL_LIST_BASE),
+    offsetof(GLEnumPool,n_GL_LIST_INDEX),
+    offsetof(GLEnumPool,n_GL_POLYGON_MODE),
+    offsetof(GLEnumPool,n_GL_POLYGON_SMOOTH),
+    offsetof(GLEnumPool,n_GL_POLYGON_STIPPLE),
+    offsetof(GLEnumPool,n_GL_EDGE_FLAG),
+    offsetof(GLEnumPool,n_GL_CULL_FACE),
+    offsetof(GLEnumPool,n_GL_CULL_FACE_MODE),
+    offsetof(GLEnumPool,n_GL_FRONT_FACE),
+    offsetof(GLEnumPool,n_GL_LIGHTING),
+    offsetof(GLEnumPool,n_GL_LIGHT_MODEL_LOCAL_VIEWER),
+    offsetof(GLEnumPool,n_GL_LIGHT_MODEL_TWO_SIDE),
+    offsetof(GLEnumPool,n_GL_LIGHT_MODEL_AMBIENT),
+    offsetof(GLEnumPool,n_GL_SHADE_MODEL),
+    offsetof(GLEnumPool,n_GL_COLOR_MATERIAL_FACE),
+    offsetof(GLEnumPool,n_GL_COLOR_MATERIAL_PARAMETER),
+    offsetof(GLEnumPool,n_GL_COLOR_MATERIAL),
+    offsetof(GLEnumPool,n_GL_FOG),
+    offsetof(GLEnumPool,n_GL_FOG_INDEX),
+    offsetof(GLEnumPool,n_GL_FOG_DENSITY),
+    offsetof(GLEnumPool,n_GL_FOG_START),
+    offsetof(GLEnumPool,n_GL_FOG_END),
+    offsetof(GLEnumPool,n_GL_FOG_MODE),
+    offsetof(GLEnumPool,n_GL_FOG_COLOR),
+    offsetof(GLEnumPool,n_GL_DEPTH_RANGE),
+    offsetof(GLEnumPool,n_GL_DEPTH_TEST),
+    offsetof(GLEnumPool,n_GL_DEPTH_WRITEMASK),
+    offsetof(GLEnumPool,n_GL_DEPTH_CLEAR_VALUE),
+    offsetof(GLEnumPool,n_GL_DEPTH_FUNC),
+    offsetof(GLEnumPool,n_GL_ACCUM_CLEAR_VALUE),
+    offsetof(GLEnumPool,n_GL_STENCIL_TEST),
+    offsetof(GLEnumPool,n_GL_STENCIL_CLEAR_VALUE),
+    offsetof(GLEnumPool,n_GL_STENCIL_FUNC),
+    offsetof(GLEnumPool,n_GL_STENCIL_VALUE_MASK),
+    offsetof(GLEnumPool,n_GL_STENCIL_FAIL),
+    offsetof(GLEnumPool,n_GL_STENCIL_PASS_DEPTH_FAIL),
+    offsetof(GLEnumPool,n_GL_STENCIL_PASS_DEPTH_PASS),
+    offsetof(GLEnumPool,n_GL_STENCIL_REF),
+    offsetof(GLEnumPool,n_GL_STENCIL_WRITEMASK),
+    offsetof(GLEnumPool,n_GL_MATRIX_MODE),
+    offsetof(GLEnumPool,n_GL_NORMALIZE),
+    offsetof(GLEnumPool,n_GL_VIEWPORT),
+    offsetof(GLEnumPool,n_GL_MODELVIEW_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_PROJECTION_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_TEXTURE_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_MODELVIEW_MATRIX),
+    offsetof(GLEnumPool,n_GL_PROJECTION_MATRIX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MATRIX),
+    offsetof(GLEnumPool,n_GL_ATTRIB_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_CLIENT_ATTRIB_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_ALPHA_TEST),
+    offsetof(GLEnumPool,n_GL_ALPHA_TEST_FUNC),
+    offsetof(GLEnumPool,n_GL_ALPHA_TEST_REF),
+    offsetof(GLEnumPool,n_GL_DITHER),
+    offsetof(GLEnumPool,n_GL_BLEND_DST),
+    offsetof(GLEnumPool,n_GL_BLEND_SRC),
+    offsetof(GLEnumPool,n_GL_BLEND),
+    offsetof(GLEnumPool,n_GL_LOGIC_OP_MODE),
+    offsetof(GLEnumPool,n_GL_INDEX_LOGIC_OP),
+    offsetof(GLEnumPool,n_GL_COLOR_LOGIC_OP),
+    offsetof(GLEnumPool,n_GL_AUX_BUFFERS),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER),
+    offsetof(GLEnumPool,n_GL_READ_BUFFER),
+    offsetof(GLEnumPool,n_GL_SCISSOR_BOX),
+    offsetof(GLEnumPool,n_GL_SCISSOR_TEST),
+    offsetof(GLEnumPool,n_GL_INDEX_CLEAR_VALUE),
+    offsetof(GLEnumPool,n_GL_INDEX_WRITEMASK),
+    offsetof(GLEnumPool,n_GL_COLOR_CLEAR_VALUE),
+    offsetof(GLEnumPool,n_GL_COLOR_WRITEMASK),
+    offsetof(GLEnumPool,n_GL_INDEX_MODE),
+    offsetof(GLEnumPool,n_GL_RGBA_MODE),
+    offsetof(GLEnumPool,n_GL_DOUBLEBUFFER),
+    offsetof(GLEnumPool,n_GL_STEREO),
+    offsetof(GLEnumPool,n_GL_RENDER_MODE),
+    offsetof(GLEnumPool,n_GL_PERSPECTIVE_CORRECTION_HINT),
+    offsetof(GLEnumPool,n_GL_POINT_SMOOTH_HINT),
+    offsetof(GLEnumPool,n_GL_LINE_SMOOTH_HINT),
+    offsetof(GLEnumPool,n_GL_POLYGON_SMOOTH_HINT),
+    offsetof(GLEnumPool,n_GL_FOG_HINT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GEN_S),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GEN_T),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GEN_R),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GEN_Q),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_I_TO_I),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_S_TO_S),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_I_TO_R),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_I_TO_G),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_I_TO_B),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_I_TO_A),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_R_TO_R),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_G_TO_G),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_B_TO_B),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_A_TO_A),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_I_TO_I_SIZE),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_S_TO_S_SIZE),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_I_TO_R_SIZE),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_I_TO_G_SIZE),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_I_TO_B_SIZE),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_I_TO_A_SIZE),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_R_TO_R_SIZE),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_G_TO_G_SIZE),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_B_TO_B_SIZE),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAP_A_TO_A_SIZE),
+    offsetof(GLEnumPool,n_GL_UNPACK_SWAP_BYTES),
+    offsetof(GLEnumPool,n_GL_UNPACK_LSB_FIRST),
+    offsetof(GLEnumPool,n_GL_UNPACK_ROW_LENGTH),
+    offsetof(GLEnumPool,n_GL_UNPACK_SKIP_ROWS),
+    offsetof(GLEnumPool,n_GL_UNPACK_SKIP_PIXELS),
+    offsetof(GLEnumPool,n_GL_UNPACK_ALIGNMENT),
+    offsetof(GLEnumPool,n_GL_PACK_SWAP_BYTES),
+    offsetof(GLEnumPool,n_GL_PACK_LSB_FIRST),
+    offsetof(GLEnumPool,n_GL_PACK_ROW_LENGTH),
+    offsetof(GLEnumPool,n_GL_PACK_SKIP_ROWS),
+    offsetof(GLEnumPool,n_GL_PACK_SKIP_PIXELS),
+    offsetof(GLEnumPool,n_GL_PACK_ALIGNMENT),
+    offsetof(GLEnumPool,n_GL_MAP_COLOR),
+    offsetof(GLEnumPool,n_GL_MAP_STENCIL),
+    offsetof(GLEnumPool,n_GL_INDEX_SHIFT),
+    offsetof(GLEnumPool,n_GL_INDEX_OFFSET),
+    offsetof(GLEnumPool,n_GL_RED_SCALE),
+    offsetof(GLEnumPool,n_GL_RED_BIAS),
+    offsetof(GLEnumPool,n_GL_ZOOM_X),
+    offsetof(GLEnumPool,n_GL_ZOOM_Y),
+    offsetof(GLEnumPool,n_GL_GREEN_SCALE),
+    offsetof(GLEnumPool,n_GL_GREEN_BIAS),
+    offsetof(GLEnumPool,n_GL_BLUE_SCALE),
+    offsetof(GLEnumPool,n_GL_BLUE_BIAS),
+    offsetof(GLEnumPool,n_GL_ALPHA_SCALE),
+    offsetof(GLEnumPool,n_GL_ALPHA_BIAS),
+    offsetof(GLEnumPool,n_GL_DEPTH_SCALE),
+    offsetof(GLEnumPool,n_GL_DEPTH_BIAS),
+    offsetof(GLEnumPool,n_GL_MAX_EVAL_ORDER),
+    offsetof(GLEnumPool,n_GL_MAX_LIGHTS),
+    offsetof(GLEnumPool,n_GL_MAX_CLIP_PLANES),
+    offsetof(GLEnumPool,n_GL_MAX_TEXTURE_SIZE),
+    offsetof(GLEnumPool,n_GL_MAX_PIXEL_MAP_TABLE),
+    offsetof(GLEnumPool,n_GL_MAX_ATTRIB_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_MAX_MODELVIEW_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_MAX_NAME_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_MAX_PROJECTION_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_MAX_TEXTURE_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_MAX_VIEWPORT_DIMS),
+    offsetof(GLEnumPool,n_GL_MAX_CLIENT_ATTRIB_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_SUBPIXEL_BITS),
+    offsetof(GLEnumPool,n_GL_INDEX_BITS),
+    offsetof(GLEnumPool,n_GL_RED_BITS),
+    offsetof(GLEnumPool,n_GL_GREEN_BITS),
+    offsetof(GLEnumPool,n_GL_BLUE_BITS),
+    offsetof(GLEnumPool,n_GL_ALPHA_BITS),
+    offsetof(GLEnumPool,n_GL_DEPTH_BITS),
+    offsetof(GLEnumPool,n_GL_STENCIL_BITS),
+    offsetof(GLEnumPool,n_GL_ACCUM_RED_BITS),
+    offsetof(GLEnumPool,n_GL_ACCUM_GREEN_BITS),
+    offsetof(GLEnumPool,n_GL_ACCUM_BLUE_BITS),
+    offsetof(GLEnumPool,n_GL_ACCUM_ALPHA_BITS),
+    offsetof(GLEnumPool,n_GL_NAME_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_AUTO_NORMAL),
+    offsetof(GLEnumPool,n_GL_MAP1_COLOR_4),
+    offsetof(GLEnumPool,n_GL_MAP1_INDEX),
+    offsetof(GLEnumPool,n_GL_MAP1_NORMAL),
+    offsetof(GLEnumPool,n_GL_MAP1_TEXTURE_COORD_1),
+    offsetof(GLEnumPool,n_GL_MAP1_TEXTURE_COORD_2),
+    offsetof(GLEnumPool,n_GL_MAP1_TEXTURE_COORD_3),
+    offsetof(GLEnumPool,n_GL_MAP1_TEXTURE_COORD_4),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_3),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_4),
+    offsetof(GLEnumPool,n_GL_MAP2_COLOR_4),
+    offsetof(GLEnumPool,n_GL_MAP2_INDEX),
+    offsetof(GLEnumPool,n_GL_MAP2_NORMAL),
+    offsetof(GLEnumPool,n_GL_MAP2_TEXTURE_COORD_1),
+    offsetof(GLEnumPool,n_GL_MAP2_TEXTURE_COORD_2),
+    offsetof(GLEnumPool,n_GL_MAP2_TEXTURE_COORD_3),
+    offsetof(GLEnumPool,n_GL_MAP2_TEXTURE_COORD_4),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_3),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_4),
+    offsetof(GLEnumPool,n_GL_MAP1_GRID_DOMAIN),
+    offsetof(GLEnumPool,n_GL_MAP1_GRID_SEGMENTS),
+    offsetof(GLEnumPool,n_GL_MAP2_GRID_DOMAIN),
+    offsetof(GLEnumPool,n_GL_MAP2_GRID_SEGMENTS),
+    offsetof(GLEnumPool,n_GL_TEXTURE_1D),
+    offsetof(GLEnumPool,n_GL_TEXTURE_2D),
+    offsetof(GLEnumPool,n_GL_FEEDBACK_BUFFER_POINTER),
+    offsetof(GLEnumPool,n_GL_FEEDBACK_BUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_FEEDBACK_BUFFER_TYPE),
+    offsetof(GLEnumPool,n_GL_SELECTION_BUFFER_POINTER),
+    offsetof(GLEnumPool,n_GL_SELECTION_BUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_WIDTH),
+    offsetof(GLEnumPool,n_GL_TEXTURE_HEIGHT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_INTERNAL_FORMAT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BORDER_COLOR),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BORDER),
+    offsetof(GLEnumPool,n_GL_DONT_CARE),
+    offsetof(GLEnumPool,n_GL_FASTEST),
+    offsetof(GLEnumPool,n_GL_NICEST),
+    offsetof(GLEnumPool,n_GL_AMBIENT),
+    offsetof(GLEnumPool,n_GL_DIFFUSE),
+    offsetof(GLEnumPool,n_GL_SPECULAR),
+    offsetof(GLEnumPool,n_GL_POSITION),
+    offsetof(GLEnumPool,n_GL_SPOT_DIRECTION),
+    offsetof(GLEnumPool,n_GL_SPOT_EXPONENT),
+    offsetof(GLEnumPool,n_GL_SPOT_CUTOFF),
+    offsetof(GLEnumPool,n_GL_CONSTANT_ATTENUATION),
+    offsetof(GLEnumPool,n_GL_LINEAR_ATTENUATION),
+    offsetof(GLEnumPool,n_GL_QUADRATIC_ATTENUATION),
+    offsetof(GLEnumPool,n_GL_COMPILE),
+    offsetof(GLEnumPool,n_GL_COMPILE_AND_EXECUTE),
+    offsetof(GLEnumPool,n_GL_BYTE),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_BYTE),
+    offsetof(GLEnumPool,n_GL_SHORT),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_SHORT),
+    offsetof(GLEnumPool,n_GL_INT),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT),
+    offsetof(GLEnumPool,n_GL_FLOAT),
+    offsetof(GLEnumPool,n_GL_2_BYTES),
+    offsetof(GLEnumPool,n_GL_3_BYTES),
+    offsetof(GLEnumPool,n_GL_4_BYTES),
+    offsetof(GLEnumPool,n_GL_DOUBLE),
+    offsetof(GLEnumPool,n_GL_HALF_FLOAT),
+    offsetof(GLEnumPool,n_GL_FIXED),
+    offsetof(GLEnumPool,n_GL_INT64_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT64_ARB),
+    offsetof(GLEnumPool,n_GL_CLEAR),
+    offsetof(GLEnumPool,n_GL_AND),
+    offsetof(GLEnumPool,n_GL_AND_REVERSE),
+    offsetof(GLEnumPool,n_GL_COPY),
+    offsetof(GLEnumPool,n_GL_AND_INVERTED),
+    offsetof(GLEnumPool,n_GL_NOOP),
+    offsetof(GLEnumPool,n_GL_XOR),
+    offsetof(GLEnumPool,n_GL_OR),
+    offsetof(GLEnumPool,n_GL_NOR),
+    offsetof(GLEnumPool,n_GL_EQUIV),
+    offsetof(GLEnumPool,n_GL_INVERT),
+    offsetof(GLEnumPool,n_GL_OR_REVERSE),
+    offsetof(GLEnumPool,n_GL_COPY_INVERTED),
+    offsetof(GLEnumPool,n_GL_OR_INVERTED),
+    offsetof(GLEnumPool,n_GL_NAND),
+    offsetof(GLEnumPool,n_GL_SET),
+    offsetof(GLEnumPool,n_GL_EMISSION),
+    offsetof(GLEnumPool,n_GL_SHININESS),
+    offsetof(GLEnumPool,n_GL_AMBIENT_AND_DIFFUSE),
+    offsetof(GLEnumPool,n_GL_COLOR_INDEXES),
+    offsetof(GLEnumPool,n_GL_MODELVIEW),
+    offsetof(GLEnumPool,n_GL_PROJECTION),
+    offsetof(GLEnumPool,n_GL_TEXTURE),
+    offsetof(GLEnumPool,n_GL_COLOR),
+    offsetof(GLEnumPool,n_GL_DEPTH),
+    offsetof(GLEnumPool,n_GL_STENCIL),
+    offsetof(GLEnumPool,n_GL_COLOR_INDEX),
+    offsetof(GLEnumPool,n_GL_STENCIL_INDEX),
+    offsetof(GLEnumPool,n_GL_DEPTH_COMPONENT),
+    offsetof(GLEnumPool,n_GL_RED),
+    offsetof(GLEnumPool,n_GL_GREEN),
+    offsetof(GLEnumPool,n_GL_BLUE),
+    offsetof(GLEnumPool,n_GL_ALPHA),
+    offsetof(GLEnumPool,n_GL_RGB),
+    offsetof(GLEnumPool,n_GL_RGBA),
+    offsetof(GLEnumPool,n_GL_LUMINANCE),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA),
+    offsetof(GLEnumPool,n_GL_BITMAP),
+    offsetof(GLEnumPool,n_GL_POINT),
+    offsetof(GLEnumPool,n_GL_LINE),
+    offsetof(GLEnumPool,n_GL_FILL),
+    offsetof(GLEnumPool,n_GL_RENDER),
+    offsetof(GLEnumPool,n_GL_FEEDBACK),
+    offsetof(GLEnumPool,n_GL_SELECT),
+    offsetof(GLEnumPool,n_GL_FLAT),
+    offsetof(GLEnumPool,n_GL_SMOOTH),
+    offsetof(GLEnumPool,n_GL_KEEP),
+    offsetof(GLEnumPool,n_GL_REPLACE),
+    offsetof(GLEnumPool,n_GL_INCR),
+    offsetof(GLEnumPool,n_GL_DECR),
+    offsetof(GLEnumPool,n_GL_VENDOR),
+    offsetof(GLEnumPool,n_GL_RENDERER),
+    offsetof(GLEnumPool,n_GL_VERSION),
+    offsetof(GLEnumPool,n_GL_EXTENSIONS),
+    offsetof(GLEnumPool,n_GL_S),
+    offsetof(GLEnumPool,n_GL_T),
+    offsetof(GLEnumPool,n_GL_R),
+    offsetof(GLEnumPool,n_GL_Q),
+    offsetof(GLEnumPool,n_GL_MODULATE),
+    offsetof(GLEnumPool,n_GL_DECAL),
+    offsetof(GLEnumPool,n_GL_TEXTURE_ENV_MODE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_ENV_COLOR),
+    offsetof(GLEnumPool,n_GL_TEXTURE_ENV),
+    offsetof(GLEnumPool,n_GL_EYE_LINEAR),
+    offsetof(GLEnumPool,n_GL_OBJECT_LINEAR),
+    offsetof(GLEnumPool,n_GL_SPHERE_MAP),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GEN_MODE),
+    offsetof(GLEnumPool,n_GL_OBJECT_PLANE),
+    offsetof(GLEnumPool,n_GL_EYE_PLANE),
+    offsetof(GLEnumPool,n_GL_NEAREST),
+    offsetof(GLEnumPool,n_GL_LINEAR),
+    offsetof(GLEnumPool,n_GL_NEAREST_MIPMAP_NEAREST),
+    offsetof(GLEnumPool,n_GL_LINEAR_MIPMAP_NEAREST),
+    offsetof(GLEnumPool,n_GL_NEAREST_MIPMAP_LINEAR),
+    offsetof(GLEnumPool,n_GL_LINEAR_MIPMAP_LINEAR),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MAG_FILTER),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MIN_FILTER),
+    offsetof(GLEnumPool,n_GL_TEXTURE_WRAP_S),
+    offsetof(GLEnumPool,n_GL_TEXTURE_WRAP_T),
+    offsetof(GLEnumPool,n_GL_CLAMP),
+    offsetof(GLEnumPool,n_GL_REPEAT),
+    offsetof(GLEnumPool,n_GL_POLYGON_OFFSET_UNITS),
+    offsetof(GLEnumPool,n_GL_POLYGON_OFFSET_POINT),
+    offsetof(GLEnumPool,n_GL_POLYGON_OFFSET_LINE),
+    offsetof(GLEnumPool,n_GL_R3_G3_B2),
+    offsetof(GLEnumPool,n_GL_V2F),
+    offsetof(GLEnumPool,n_GL_V3F),
+    offsetof(GLEnumPool,n_GL_C4UB_V2F),
+    offsetof(GLEnumPool,n_GL_C4UB_V3F),
+    offsetof(GLEnumPool,n_GL_C3F_V3F),
+    offsetof(GLEnumPool,n_GL_N3F_V3F),
+    offsetof(GLEnumPool,n_GL_C4F_N3F_V3F),
+    offsetof(GLEnumPool,n_GL_T2F_V3F),
+    offsetof(GLEnumPool,n_GL_T4F_V4F),
+    offsetof(GLEnumPool,n_GL_T2F_C4UB_V3F),
+    offsetof(GLEnumPool,n_GL_T2F_C3F_V3F),
+    offsetof(GLEnumPool,n_GL_T2F_N3F_V3F),
+    offsetof(GLEnumPool,n_GL_T2F_C4F_N3F_V3F),
+    offsetof(GLEnumPool,n_GL_T4F_C4F_N3F_V4F),
+    offsetof(GLEnumPool,n_GL_CLIP_PLANE0),
+    offsetof(GLEnumPool,n_GL_CLIP_PLANE1),
+    offsetof(GLEnumPool,n_GL_CLIP_PLANE2),
+    offsetof(GLEnumPool,n_GL_CLIP_PLANE3),
+    offsetof(GLEnumPool,n_GL_CLIP_PLANE4),
+    offsetof(GLEnumPool,n_GL_CLIP_PLANE5),
+    offsetof(GLEnumPool,n_GL_CLIP_PLANE6),
+    offsetof(GLEnumPool,n_GL_CLIP_PLANE7),
+    offsetof(GLEnumPool,n_GL_EGL_COVERAGE_BUFFERS_NV),
+    offsetof(GLEnumPool,n_GL_EGL_COVERAGE_SAMPLES_NV),
+    offsetof(GLEnumPool,n_GL_EGL_DEPTH_ENCODING_NV),
+    offsetof(GLEnumPool,n_GL_EGL_DEPTH_ENCODING_NONLINEAR_NV),
+    offsetof(GLEnumPool,n_GL_LIGHT0),
+    offsetof(GLEnumPool,n_GL_LIGHT1),
+    offsetof(GLEnumPool,n_GL_LIGHT2),
+    offsetof(GLEnumPool,n_GL_LIGHT3),
+    offsetof(GLEnumPool,n_GL_LIGHT4),
+    offsetof(GLEnumPool,n_GL_LIGHT5),
+    offsetof(GLEnumPool,n_GL_LIGHT6),
+    offsetof(GLEnumPool,n_GL_LIGHT7),
+    offsetof(GLEnumPool,n_GL_ABGR_EXT),
+    offsetof(GLEnumPool,n_GL_CONSTANT_COLOR),
+    offsetof(GLEnumPool,n_GL_ONE_MINUS_CONSTANT_COLOR),
+    offsetof(GLEnumPool,n_GL_CONSTANT_ALPHA),
+    offsetof(GLEnumPool,n_GL_ONE_MINUS_CONSTANT_ALPHA),
+    offsetof(GLEnumPool,n_GL_BLEND_COLOR),
+    offsetof(GLEnumPool,n_GL_FUNC_ADD),
+    offsetof(GLEnumPool,n_GL_MIN),
+    offsetof(GLEnumPool,n_GL_MAX),
+    offsetof(GLEnumPool,n_GL_BLEND_EQUATION),
+    offsetof(GLEnumPool,n_GL_FUNC_SUBTRACT),
+    offsetof(GLEnumPool,n_GL_FUNC_REVERSE_SUBTRACT),
+    offsetof(GLEnumPool,n_GL_CMYK_EXT),
+    offsetof(GLEnumPool,n_GL_CMYKA_EXT),
+    offsetof(GLEnumPool,n_GL_PACK_CMYK_HINT_EXT),
+    offsetof(GLEnumPool,n_GL_UNPACK_CMYK_HINT_EXT),
+    offsetof(GLEnumPool,n_GL_CONVOLUTION_1D),
+    offsetof(GLEnumPool,n_GL_CONVOLUTION_2D),
+    offsetof(GLEnumPool,n_GL_SEPARABLE_2D),
+    offsetof(GLEnumPool,n_GL_CONVOLUTION_BORDER_MODE),
+    offsetof(GLEnumPool,n_GL_CONVOLUTION_FILTER_SCALE),
+    offsetof(GLEnumPool,n_GL_CONVOLUTION_FILTER_BIAS),
+    offsetof(GLEnumPool,n_GL_REDUCE),
+    offsetof(GLEnumPool,n_GL_CONVOLUTION_FORMAT),
+    offsetof(GLEnumPool,n_GL_CONVOLUTION_WIDTH),
+    offsetof(GLEnumPool,n_GL_CONVOLUTION_HEIGHT),
+    offsetof(GLEnumPool,n_GL_MAX_CONVOLUTION_WIDTH),
+    offsetof(GLEnumPool,n_GL_MAX_CONVOLUTION_HEIGHT),
+    offsetof(GLEnumPool,n_GL_POST_CONVOLUTION_RED_SCALE),
+    offsetof(GLEnumPool,n_GL_POST_CONVOLUTION_GREEN_SCALE),
+    offsetof(GLEnumPool,n_GL_POST_CONVOLUTION_BLUE_SCALE),
+    offsetof(GLEnumPool,n_GL_POST_CONVOLUTION_ALPHA_SCALE),
+    offsetof(GLEnumPool,n_GL_POST_CONVOLUTION_RED_BIAS),
+    offsetof(GLEnumPool,n_GL_POST_CONVOLUTION_GREEN_BIAS),
+    offsetof(GLEnumPool,n_GL_POST_CONVOLUTION_BLUE_BIAS),
+    offsetof(GLEnumPool,n_GL_POST_CONVOLUTION_ALPHA_BIAS),
+    offsetof(GLEnumPool,n_GL_HISTOGRAM),
+    offsetof(GLEnumPool,n_GL_PROXY_HISTOGRAM),
+    offsetof(GLEnumPool,n_GL_HISTOGRAM_WIDTH),
+    offsetof(GLEnumPool,n_GL_HISTOGRAM_FORMAT),
+    offsetof(GLEnumPool,n_GL_HISTOGRAM_RED_SIZE),
+    offsetof(GLEnumPool,n_GL_HISTOGRAM_GREEN_SIZE),
+    offsetof(GLEnumPool,n_GL_HISTOGRAM_BLUE_SIZE),
+    offsetof(GLEnumPool,n_GL_HISTOGRAM_ALPHA_SIZE),
+    offsetof(GLEnumPool,n_GL_HISTOGRAM_LUMINANCE_SIZE),
+    offsetof(GLEnumPool,n_GL_HISTOGRAM_SINK),
+    offsetof(GLEnumPool,n_GL_MINMAX),
+    offsetof(GLEnumPool,n_GL_MINMAX_FORMAT),
+    offsetof(GLEnumPool,n_GL_MINMAX_SINK),
+    offsetof(GLEnumPool,n_GL_TABLE_TOO_LARGE),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_BYTE_3_3_2),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_SHORT_4_4_4_4),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_SHORT_5_5_5_1),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_8_8_8_8),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_10_10_10_2),
+    offsetof(GLEnumPool,n_GL_POLYGON_OFFSET_FILL),
+    offsetof(GLEnumPool,n_GL_POLYGON_OFFSET_FACTOR),
+    offsetof(GLEnumPool,n_GL_POLYGON_OFFSET_BIAS_EXT),
+    offsetof(GLEnumPool,n_GL_RESCALE_NORMAL),
+    offsetof(GLEnumPool,n_GL_ALPHA4),
+    offsetof(GLEnumPool,n_GL_ALPHA8),
+    offsetof(GLEnumPool,n_GL_ALPHA12),
+    offsetof(GLEnumPool,n_GL_ALPHA16),
+    offsetof(GLEnumPool,n_GL_LUMINANCE4),
+    offsetof(GLEnumPool,n_GL_LUMINANCE8),
+    offsetof(GLEnumPool,n_GL_LUMINANCE12),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16),
+    offsetof(GLEnumPool,n_GL_LUMINANCE4_ALPHA4),
+    offsetof(GLEnumPool,n_GL_LUMINANCE6_ALPHA2),
+    offsetof(GLEnumPool,n_GL_LUMINANCE8_ALPHA8),
+    offsetof(GLEnumPool,n_GL_LUMINANCE12_ALPHA4),
+    offsetof(GLEnumPool,n_GL_LUMINANCE12_ALPHA12),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16_ALPHA16),
+    offsetof(GLEnumPool,n_GL_INTENSITY),
+    offsetof(GLEnumPool,n_GL_INTENSITY4),
+    offsetof(GLEnumPool,n_GL_INTENSITY8),
+    offsetof(GLEnumPool,n_GL_INTENSITY12),
+    offsetof(GLEnumPool,n_GL_INTENSITY16),
+    offsetof(GLEnumPool,n_GL_RGB2_EXT),
+    offsetof(GLEnumPool,n_GL_RGB4),
+    offsetof(GLEnumPool,n_GL_RGB5),
+    offsetof(GLEnumPool,n_GL_RGB8),
+    offsetof(GLEnumPool,n_GL_RGB10),
+    offsetof(GLEnumPool,n_GL_RGB12),
+    offsetof(GLEnumPool,n_GL_RGB16),
+    offsetof(GLEnumPool,n_GL_RGBA2),
+    offsetof(GLEnumPool,n_GL_RGBA4),
+    offsetof(GLEnumPool,n_GL_RGB5_A1),
+    offsetof(GLEnumPool,n_GL_RGBA8),
+    offsetof(GLEnumPool,n_GL_RGB10_A2),
+    offsetof(GLEnumPool,n_GL_RGBA12),
+    offsetof(GLEnumPool,n_GL_RGBA16),
+    offsetof(GLEnumPool,n_GL_TEXTURE_RED_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GREEN_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BLUE_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_ALPHA_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_LUMINANCE_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_INTENSITY_SIZE),
+    offsetof(GLEnumPool,n_GL_REPLACE_EXT),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_1D),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_2D),
+    offsetof(GLEnumPool,n_GL_TEXTURE_PRIORITY),
+    offsetof(GLEnumPool,n_GL_TEXTURE_RESIDENT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_1D),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_2D),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_3D),
+    offsetof(GLEnumPool,n_GL_PACK_SKIP_IMAGES),
+    offsetof(GLEnumPool,n_GL_PACK_IMAGE_HEIGHT),
+    offsetof(GLEnumPool,n_GL_UNPACK_SKIP_IMAGES),
+    offsetof(GLEnumPool,n_GL_UNPACK_IMAGE_HEIGHT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_3D),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_3D),
+    offsetof(GLEnumPool,n_GL_TEXTURE_DEPTH),
+    offsetof(GLEnumPool,n_GL_TEXTURE_WRAP_R),
+    offsetof(GLEnumPool,n_GL_MAX_3D_TEXTURE_SIZE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY),
+    offsetof(GLEnumPool,n_GL_INDEX_ARRAY),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY),
+    offsetof(GLEnumPool,n_GL_EDGE_FLAG_ARRAY),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_SIZE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_TYPE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_COUNT_EXT),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY_TYPE),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY_COUNT_EXT),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_SIZE),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_TYPE),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_COUNT_EXT),
+    offsetof(GLEnumPool,n_GL_INDEX_ARRAY_TYPE),
+    offsetof(GLEnumPool,n_GL_INDEX_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_INDEX_ARRAY_COUNT_EXT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_TYPE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_COUNT_EXT),
+    offsetof(GLEnumPool,n_GL_EDGE_FLAG_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_EDGE_FLAG_ARRAY_COUNT_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_POINTER),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY_POINTER),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_POINTER),
+    offsetof(GLEnumPool,n_GL_INDEX_ARRAY_POINTER),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_POINTER),
+    offsetof(GLEnumPool,n_GL_EDGE_FLAG_ARRAY_POINTER),
+    offsetof(GLEnumPool,n_GL_INTERLACE_SGIX),
+    offsetof(GLEnumPool,n_GL_DETAIL_TEXTURE_2D_SGIS),
+    offsetof(GLEnumPool,n_GL_DETAIL_TEXTURE_2D_BINDING_SGIS),
+    offsetof(GLEnumPool,n_GL_LINEAR_DETAIL_SGIS),
+    offsetof(GLEnumPool,n_GL_LINEAR_DETAIL_ALPHA_SGIS),
+    offsetof(GLEnumPool,n_GL_LINEAR_DETAIL_COLOR_SGIS),
+    offsetof(GLEnumPool,n_GL_DETAIL_TEXTURE_LEVEL_SGIS),
+    offsetof(GLEnumPool,n_GL_DETAIL_TEXTURE_MODE_SGIS),
+    offsetof(GLEnumPool,n_GL_DETAIL_TEXTURE_FUNC_POINTS_SGIS),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_SAMPLE_ALPHA_TO_COVERAGE),
+    offsetof(GLEnumPool,n_GL_SAMPLE_ALPHA_TO_ONE),
+    offsetof(GLEnumPool,n_GL_SAMPLE_COVERAGE),
+    offsetof(GLEnumPool,n_GL_1PASS_EXT),
+    offsetof(GLEnumPool,n_GL_2PASS_0_EXT),
+    offsetof(GLEnumPool,n_GL_2PASS_1_EXT),
+    offsetof(GLEnumPool,n_GL_4PASS_0_EXT),
+    offsetof(GLEnumPool,n_GL_4PASS_1_EXT),
+    offsetof(GLEnumPool,n_GL_4PASS_2_EXT),
+    offsetof(GLEnumPool,n_GL_4PASS_3_EXT),
+    offsetof(GLEnumPool,n_GL_SAMPLE_BUFFERS),
+    offsetof(GLEnumPool,n_GL_SAMPLES),
+    offsetof(GLEnumPool,n_GL_SAMPLE_COVERAGE_VALUE),
+    offsetof(GLEnumPool,n_GL_SAMPLE_COVERAGE_INVERT),
+    offsetof(GLEnumPool,n_GL_SAMPLE_PATTERN_EXT),
+    offsetof(GLEnumPool,n_GL_COLOR_MATRIX),
+    offsetof(GLEnumPool,n_GL_COLOR_MATRIX_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_MAX_COLOR_MATRIX_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_POST_COLOR_MATRIX_RED_SCALE),
+    offsetof(GLEnumPool,n_GL_POST_COLOR_MATRIX_GREEN_SCALE),
+    offsetof(GLEnumPool,n_GL_POST_COLOR_MATRIX_BLUE_SCALE),
+    offsetof(GLEnumPool,n_GL_POST_COLOR_MATRIX_ALPHA_SCALE),
+    offsetof(GLEnumPool,n_GL_POST_COLOR_MATRIX_RED_BIAS),
+    offsetof(GLEnumPool,n_GL_POST_COLOR_MATRIX_GREEN_BIAS),
+    offsetof(GLEnumPool,n_GL_POST_COLOR_MATRIX_BLUE_BIAS),
+    offsetof(GLEnumPool,n_GL_POST_COLOR_MATRIX_ALPHA_BIAS),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COLOR_TABLE_SGI),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_COLOR_TABLE_SGI),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPARE_FAIL_VALUE_ARB),
+    offsetof(GLEnumPool,n_GL_BLEND_DST_RGB),
+    offsetof(GLEnumPool,n_GL_BLEND_SRC_RGB),
+    offsetof(GLEnumPool,n_GL_BLEND_DST_ALPHA),
+    offsetof(GLEnumPool,n_GL_BLEND_SRC_ALPHA),
+    offsetof(GLEnumPool,n_GL_422_EXT),
+    offsetof(GLEnumPool,n_GL_422_REV_EXT),
+    offsetof(GLEnumPool,n_GL_422_AVERAGE_EXT),
+    offsetof(GLEnumPool,n_GL_422_REV_AVERAGE_EXT),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE),
+    offsetof(GLEnumPool,n_GL_POST_CONVOLUTION_COLOR_TABLE),
+    offsetof(GLEnumPool,n_GL_POST_COLOR_MATRIX_COLOR_TABLE),
+    offsetof(GLEnumPool,n_GL_PROXY_COLOR_TABLE),
+    offsetof(GLEnumPool,n_GL_PROXY_POST_CONVOLUTION_COLOR_TABLE),
+    offsetof(GLEnumPool,n_GL_PROXY_POST_COLOR_MATRIX_COLOR_TABLE),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE_SCALE),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE_BIAS),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE_FORMAT),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE_WIDTH),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE_RED_SIZE),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE_GREEN_SIZE),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE_BLUE_SIZE),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE_ALPHA_SIZE),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE_LUMINANCE_SIZE),
+    offsetof(GLEnumPool,n_GL_COLOR_TABLE_INTENSITY_SIZE),
+    offsetof(GLEnumPool,n_GL_BGR),
+    offsetof(GLEnumPool,n_GL_BGRA),
+    offsetof(GLEnumPool,n_GL_COLOR_INDEX1_EXT),
+    offsetof(GLEnumPool,n_GL_COLOR_INDEX2_EXT),
+    offsetof(GLEnumPool,n_GL_COLOR_INDEX4_EXT),
+    offsetof(GLEnumPool,n_GL_COLOR_INDEX8_EXT),
+    offsetof(GLEnumPool,n_GL_COLOR_INDEX12_EXT),
+    offsetof(GLEnumPool,n_GL_COLOR_INDEX16_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_ELEMENTS_VERTICES),
+    offsetof(GLEnumPool,n_GL_MAX_ELEMENTS_INDICES),
+    offsetof(GLEnumPool,n_GL_PHONG_WIN),
+    offsetof(GLEnumPool,n_GL_PHONG_HINT_WIN),
+    offsetof(GLEnumPool,n_GL_FOG_SPECULAR_TEXTURE_WIN),
+    offsetof(GLEnumPool,n_GL_TEXTURE_INDEX_SIZE_EXT),
+    offsetof(GLEnumPool,n_GL_PARAMETER_BUFFER_ARB),
+    offsetof(GLEnumPool,n_GL_PARAMETER_BUFFER_BINDING_ARB),
+    offsetof(GLEnumPool,n_GL_CLIP_VOLUME_CLIPPING_HINT_EXT),
+    offsetof(GLEnumPool,n_GL_POINT_SIZE_MIN),
+    offsetof(GLEnumPool,n_GL_POINT_SIZE_MAX),
+    offsetof(GLEnumPool,n_GL_POINT_FADE_THRESHOLD_SIZE),
+    offsetof(GLEnumPool,n_GL_POINT_DISTANCE_ATTENUATION),
+    offsetof(GLEnumPool,n_GL_CLAMP_TO_BORDER),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MULTI_BUFFER_HINT_SGIX),
+    offsetof(GLEnumPool,n_GL_CLAMP_TO_EDGE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MIN_LOD),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MAX_LOD),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BASE_LEVEL),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MAX_LEVEL),
+    offsetof(GLEnumPool,n_GL_IGNORE_BORDER),
+    offsetof(GLEnumPool,n_GL_CONSTANT_BORDER),
+    offsetof(GLEnumPool,n_GL_WRAP_BORDER),
+    offsetof(GLEnumPool,n_GL_REPLICATE_BORDER),
+    offsetof(GLEnumPool,n_GL_CONVOLUTION_BORDER_COLOR),
+    offsetof(GLEnumPool,n_GL_IMAGE_SCALE_X_HP),
+    offsetof(GLEnumPool,n_GL_IMAGE_SCALE_Y_HP),
+    offsetof(GLEnumPool,n_GL_IMAGE_TRANSLATE_X_HP),
+    offsetof(GLEnumPool,n_GL_IMAGE_TRANSLATE_Y_HP),
+    offsetof(GLEnumPool,n_GL_IMAGE_ROTATE_ANGLE_HP),
+    offsetof(GLEnumPool,n_GL_IMAGE_ROTATE_ORIGIN_X_HP),
+    offsetof(GLEnumPool,n_GL_IMAGE_ROTATE_ORIGIN_Y_HP),
+    offsetof(GLEnumPool,n_GL_IMAGE_MAG_FILTER_HP),
+    offsetof(GLEnumPool,n_GL_IMAGE_MIN_FILTER_HP),
+    offsetof(GLEnumPool,n_GL_IMAGE_CUBIC_WEIGHT_HP),
+    offsetof(GLEnumPool,n_GL_CUBIC_HP),
+    offsetof(GLEnumPool,n_GL_AVERAGE_HP),
+    offsetof(GLEnumPool,n_GL_IMAGE_TRANSFORM_2D_HP),
+    offsetof(GLEnumPool,n_GL_POST_IMAGE_TRANSFORM_COLOR_TABLE_HP),
+    offsetof(GLEnumPool,n_GL_PROXY_POST_IMAGE_TRANSFORM_COLOR_TABLE_HP),
+    offsetof(GLEnumPool,n_GL_OCCLUSION_TEST_HP),
+    offsetof(GLEnumPool,n_GL_OCCLUSION_TEST_RESULT_HP),
+    offsetof(GLEnumPool,n_GL_POST_TEXTURE_FILTER_BIAS_SGIX),
+    offsetof(GLEnumPool,n_GL_POST_TEXTURE_FILTER_SCALE_SGIX),
+    offsetof(GLEnumPool,n_GL_POST_TEXTURE_FILTER_BIAS_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_POST_TEXTURE_FILTER_SCALE_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_GENERATE_MIPMAP),
+    offsetof(GLEnumPool,n_GL_GENERATE_MIPMAP_HINT),
+    offsetof(GLEnumPool,n_GL_FOG_OFFSET_SGIX),
+    offsetof(GLEnumPool,n_GL_FOG_OFFSET_VALUE_SGIX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPARE_SGIX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPARE_OPERATOR_SGIX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_LEQUAL_R_SGIX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GEQUAL_R_SGIX),
+    offsetof(GLEnumPool,n_GL_DEPTH_COMPONENT16),
+    offsetof(GLEnumPool,n_GL_DEPTH_COMPONENT24),
+    offsetof(GLEnumPool,n_GL_DEPTH_COMPONENT32),
+    offsetof(GLEnumPool,n_GL_ARRAY_ELEMENT_LOCK_FIRST_EXT),
+    offsetof(GLEnumPool,n_GL_ARRAY_ELEMENT_LOCK_COUNT_EXT),
+    offsetof(GLEnumPool,n_GL_CULL_VERTEX_EXT),
+    offsetof(GLEnumPool,n_GL_CULL_VERTEX_EYE_POSITION_EXT),
+    offsetof(GLEnumPool,n_GL_CULL_VERTEX_OBJECT_POSITION_EXT),
+    offsetof(GLEnumPool,n_GL_YCRCB_422_SGIX),
+    offsetof(GLEnumPool,n_GL_YCRCB_444_SGIX),
+    offsetof(GLEnumPool,n_GL_WRAP_BORDER_SUN),
+    offsetof(GLEnumPool,n_GL_UNPACK_CONSTANT_DATA_SUNX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CONSTANT_DATA_SUNX),
+    offsetof(GLEnumPool,n_GL_TRIANGLE_LIST_SUN),
+    offsetof(GLEnumPool,n_GL_REPLACEMENT_CODE_SUN),
+    offsetof(GLEnumPool,n_GL_GLOBAL_ALPHA_SUN),
+    offsetof(GLEnumPool,n_GL_GLOBAL_ALPHA_FACTOR_SUN),
+    offsetof(GLEnumPool,n_GL_EYE_DISTANCE_TO_POINT_SGIS),
+    offsetof(GLEnumPool,n_GL_OBJECT_DISTANCE_TO_POINT_SGIS),
+    offsetof(GLEnumPool,n_GL_EYE_DISTANCE_TO_LINE_SGIS),
+    offsetof(GLEnumPool,n_GL_OBJECT_DISTANCE_TO_LINE_SGIS),
+    offsetof(GLEnumPool,n_GL_EYE_POINT_SGIS),
+    offsetof(GLEnumPool,n_GL_OBJECT_POINT_SGIS),
+    offsetof(GLEnumPool,n_GL_EYE_LINE_SGIS),
+    offsetof(GLEnumPool,n_GL_OBJECT_LINE_SGIS),
+    offsetof(GLEnumPool,n_GL_LIGHT_MODEL_COLOR_CONTROL),
+    offsetof(GLEnumPool,n_GL_SINGLE_COLOR),
+    offsetof(GLEnumPool,n_GL_SEPARATE_SPECULAR_COLOR),
+    offsetof(GLEnumPool,n_GL_SHARED_TEXTURE_PALETTE_EXT),
+    offsetof(GLEnumPool,n_GL_TEXT_FRAGMENT_SHADER_ATI),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_DEFAULT),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_UNDEFINED),
+    offsetof(GLEnumPool,n_GL_DEPTH_STENCIL_ATTACHMENT),
+    offsetof(GLEnumPool,n_GL_MAJOR_VERSION),
+    offsetof(GLEnumPool,n_GL_MINOR_VERSION),
+    offsetof(GLEnumPool,n_GL_NUM_EXTENSIONS),
+    offsetof(GLEnumPool,n_GL_CONTEXT_FLAGS),
+    offsetof(GLEnumPool,n_GL_BUFFER_IMMUTABLE_STORAGE),
+    offsetof(GLEnumPool,n_GL_BUFFER_STORAGE_FLAGS),
+    offsetof(GLEnumPool,n_GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED),
+    offsetof(GLEnumPool,n_GL_INDEX),
+    offsetof(GLEnumPool,n_GL_DEPTH_BUFFER),
+    offsetof(GLEnumPool,n_GL_STENCIL_BUFFER),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RED),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RG),
+    offsetof(GLEnumPool,n_GL_RG),
+    offsetof(GLEnumPool,n_GL_RG_INTEGER),
+    offsetof(GLEnumPool,n_GL_R8),
+    offsetof(GLEnumPool,n_GL_R16),
+    offsetof(GLEnumPool,n_GL_RG8),
+    offsetof(GLEnumPool,n_GL_RG16),
+    offsetof(GLEnumPool,n_GL_R16F),
+    offsetof(GLEnumPool,n_GL_R32F),
+    offsetof(GLEnumPool,n_GL_RG16F),
+    offsetof(GLEnumPool,n_GL_RG32F),
+    offsetof(GLEnumPool,n_GL_R8I),
+    offsetof(GLEnumPool,n_GL_R8UI),
+    offsetof(GLEnumPool,n_GL_R16I),
+    offsetof(GLEnumPool,n_GL_R16UI),
+    offsetof(GLEnumPool,n_GL_R32I),
+    offsetof(GLEnumPool,n_GL_R32UI),
+    offsetof(GLEnumPool,n_GL_RG8I),
+    offsetof(GLEnumPool,n_GL_RG8UI),
+    offsetof(GLEnumPool,n_GL_RG16I),
+    offsetof(GLEnumPool,n_GL_RG16UI),
+    offsetof(GLEnumPool,n_GL_RG32I),
+    offsetof(GLEnumPool,n_GL_RG32UI),
+    offsetof(GLEnumPool,n_GL_SYNC_CL_EVENT_ARB),
+    offsetof(GLEnumPool,n_GL_SYNC_CL_EVENT_COMPLETE_ARB),
+    offsetof(GLEnumPool,n_GL_DEBUG_OUTPUT_SYNCHRONOUS),
+    offsetof(GLEnumPool,n_GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH),
+    offsetof(GLEnumPool,n_GL_DEBUG_CALLBACK_FUNCTION),
+    offsetof(GLEnumPool,n_GL_DEBUG_CALLBACK_USER_PARAM),
+    offsetof(GLEnumPool,n_GL_DEBUG_SOURCE_API),
+    offsetof(GLEnumPool,n_GL_DEBUG_SOURCE_WINDOW_SYSTEM),
+    offsetof(GLEnumPool,n_GL_DEBUG_SOURCE_SHADER_COMPILER),
+    offsetof(GLEnumPool,n_GL_DEBUG_SOURCE_THIRD_PARTY),
+    offsetof(GLEnumPool,n_GL_DEBUG_SOURCE_APPLICATION),
+    offsetof(GLEnumPool,n_GL_DEBUG_SOURCE_OTHER),
+    offsetof(GLEnumPool,n_GL_DEBUG_TYPE_ERROR),
+    offsetof(GLEnumPool,n_GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR),
+    offsetof(GLEnumPool,n_GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR),
+    offsetof(GLEnumPool,n_GL_DEBUG_TYPE_PORTABILITY),
+    offsetof(GLEnumPool,n_GL_DEBUG_TYPE_PERFORMANCE),
+    offsetof(GLEnumPool,n_GL_DEBUG_TYPE_OTHER),
+    offsetof(GLEnumPool,n_GL_LOSE_CONTEXT_ON_RESET_ARB),
+    offsetof(GLEnumPool,n_GL_GUILTY_CONTEXT_RESET_ARB),
+    offsetof(GLEnumPool,n_GL_INNOCENT_CONTEXT_RESET_ARB),
+    offsetof(GLEnumPool,n_GL_UNKNOWN_CONTEXT_RESET_ARB),
+    offsetof(GLEnumPool,n_GL_RESET_NOTIFICATION_STRATEGY_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_BINARY_RETRIEVABLE_HINT),
+    offsetof(GLEnumPool,n_GL_PROGRAM_SEPARABLE),
+    offsetof(GLEnumPool,n_GL_ACTIVE_PROGRAM),
+    offsetof(GLEnumPool,n_GL_PROGRAM_PIPELINE_BINDING),
+    offsetof(GLEnumPool,n_GL_MAX_VIEWPORTS),
+    offsetof(GLEnumPool,n_GL_VIEWPORT_SUBPIXEL_BITS),
+    offsetof(GLEnumPool,n_GL_VIEWPORT_BOUNDS_RANGE),
+    offsetof(GLEnumPool,n_GL_LAYER_PROVOKING_VERTEX),
+    offsetof(GLEnumPool,n_GL_VIEWPORT_INDEX_PROVOKING_VERTEX),
+    offsetof(GLEnumPool,n_GL_UNDEFINED_VERTEX),
+    offsetof(GLEnumPool,n_GL_NO_RESET_NOTIFICATION_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_SHARED_MEMORY_SIZE),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_ATOMIC_COUNTERS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_COMPUTE_WORK_GROUP_SIZE),
+    offsetof(GLEnumPool,n_GL_DEBUG_TYPE_MARKER),
+    offsetof(GLEnumPool,n_GL_DEBUG_TYPE_PUSH_GROUP),
+    offsetof(GLEnumPool,n_GL_DEBUG_TYPE_POP_GROUP),
+    offsetof(GLEnumPool,n_GL_DEBUG_SEVERITY_NOTIFICATION),
+    offsetof(GLEnumPool,n_GL_MAX_DEBUG_GROUP_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_DEBUG_GROUP_STACK_DEPTH),
+    offsetof(GLEnumPool,n_GL_MAX_UNIFORM_LOCATIONS),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_SUPPORTED),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_PREFERRED),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_RED_SIZE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_GREEN_SIZE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_BLUE_SIZE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_ALPHA_SIZE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_DEPTH_SIZE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_STENCIL_SIZE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_SHARED_SIZE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_RED_TYPE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_GREEN_TYPE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_BLUE_TYPE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_ALPHA_TYPE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_DEPTH_TYPE),
+    offsetof(GLEnumPool,n_GL_INTERNALFORMAT_STENCIL_TYPE),
+    offsetof(GLEnumPool,n_GL_MAX_WIDTH),
+    offsetof(GLEnumPool,n_GL_MAX_HEIGHT),
+    offsetof(GLEnumPool,n_GL_MAX_DEPTH),
+    offsetof(GLEnumPool,n_GL_MAX_LAYERS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_DIMENSIONS),
+    offsetof(GLEnumPool,n_GL_COLOR_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_DEPTH_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_STENCIL_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_COLOR_RENDERABLE),
+    offsetof(GLEnumPool,n_GL_DEPTH_RENDERABLE),
+    offsetof(GLEnumPool,n_GL_STENCIL_RENDERABLE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_RENDERABLE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_RENDERABLE_LAYERED),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_BLEND),
+    offsetof(GLEnumPool,n_GL_READ_PIXELS),
+    offsetof(GLEnumPool,n_GL_READ_PIXELS_FORMAT),
+    offsetof(GLEnumPool,n_GL_READ_PIXELS_TYPE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_IMAGE_FORMAT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_IMAGE_TYPE),
+    offsetof(GLEnumPool,n_GL_GET_TEXTURE_IMAGE_FORMAT),
+    offsetof(GLEnumPool,n_GL_GET_TEXTURE_IMAGE_TYPE),
+    offsetof(GLEnumPool,n_GL_MIPMAP),
+    offsetof(GLEnumPool,n_GL_MANUAL_GENERATE_MIPMAP),
+    offsetof(GLEnumPool,n_GL_AUTO_GENERATE_MIPMAP),
+    offsetof(GLEnumPool,n_GL_COLOR_ENCODING),
+    offsetof(GLEnumPool,n_GL_SRGB_READ),
+    offsetof(GLEnumPool,n_GL_SRGB_WRITE),
+    offsetof(GLEnumPool,n_GL_SRGB_DECODE_ARB),
+    offsetof(GLEnumPool,n_GL_FILTER),
+    offsetof(GLEnumPool,n_GL_VERTEX_TEXTURE),
+    offsetof(GLEnumPool,n_GL_TESS_CONTROL_TEXTURE),
+    offsetof(GLEnumPool,n_GL_TESS_EVALUATION_TEXTURE),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_TEXTURE),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_TEXTURE),
+    offsetof(GLEnumPool,n_GL_COMPUTE_TEXTURE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SHADOW),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GATHER),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GATHER_SHADOW),
+    offsetof(GLEnumPool,n_GL_SHADER_IMAGE_LOAD),
+    offsetof(GLEnumPool,n_GL_SHADER_IMAGE_STORE),
+    offsetof(GLEnumPool,n_GL_SHADER_IMAGE_ATOMIC),
+    offsetof(GLEnumPool,n_GL_IMAGE_TEXEL_SIZE),
+    offsetof(GLEnumPool,n_GL_IMAGE_COMPATIBILITY_CLASS),
+    offsetof(GLEnumPool,n_GL_IMAGE_PIXEL_FORMAT),
+    offsetof(GLEnumPool,n_GL_IMAGE_PIXEL_TYPE),
+    offsetof(GLEnumPool,n_GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_TEST),
+    offsetof(GLEnumPool,n_GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_TEST),
+    offsetof(GLEnumPool,n_GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_WRITE),
+    offsetof(GLEnumPool,n_GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_WRITE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPRESSED_BLOCK_WIDTH),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPRESSED_BLOCK_HEIGHT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPRESSED_BLOCK_SIZE),
+    offsetof(GLEnumPool,n_GL_CLEAR_BUFFER),
+    offsetof(GLEnumPool,n_GL_TEXTURE_VIEW),
+    offsetof(GLEnumPool,n_GL_VIEW_COMPATIBILITY_CLASS),
+    offsetof(GLEnumPool,n_GL_FULL_SUPPORT),
+    offsetof(GLEnumPool,n_GL_CAVEAT_SUPPORT),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_4_X_32),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_2_X_32),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_1_X_32),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_4_X_16),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_2_X_16),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_1_X_16),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_4_X_8),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_2_X_8),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_1_X_8),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_11_11_10),
+    offsetof(GLEnumPool,n_GL_IMAGE_CLASS_10_10_10_2),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_128_BITS),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_96_BITS),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_64_BITS),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_48_BITS),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_32_BITS),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_24_BITS),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_16_BITS),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_8_BITS),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_S3TC_DXT1_RGB),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_S3TC_DXT1_RGBA),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_S3TC_DXT3_RGBA),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_S3TC_DXT5_RGBA),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_RGTC1_RED),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_RGTC2_RG),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_BPTC_UNORM),
+    offsetof(GLEnumPool,n_GL_VIEW_CLASS_BPTC_FLOAT),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_BINDING),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_RELATIVE_OFFSET),
+    offsetof(GLEnumPool,n_GL_VERTEX_BINDING_DIVISOR),
+    offsetof(GLEnumPool,n_GL_VERTEX_BINDING_OFFSET),
+    offsetof(GLEnumPool,n_GL_VERTEX_BINDING_STRIDE),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_ATTRIB_BINDINGS),
+    offsetof(GLEnumPool,n_GL_TEXTURE_VIEW_MIN_LEVEL),
+    offsetof(GLEnumPool,n_GL_TEXTURE_VIEW_NUM_LEVELS),
+    offsetof(GLEnumPool,n_GL_TEXTURE_VIEW_MIN_LAYER),
+    offsetof(GLEnumPool,n_GL_TEXTURE_VIEW_NUM_LAYERS),
+    offsetof(GLEnumPool,n_GL_TEXTURE_IMMUTABLE_LEVELS),
+    offsetof(GLEnumPool,n_GL_BUFFER),
+    offsetof(GLEnumPool,n_GL_SHADER),
+    offsetof(GLEnumPool,n_GL_PROGRAM),
+    offsetof(GLEnumPool,n_GL_QUERY),
+    offsetof(GLEnumPool,n_GL_PROGRAM_PIPELINE),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_ATTRIB_STRIDE),
+    offsetof(GLEnumPool,n_GL_SAMPLER),
+    offsetof(GLEnumPool,n_GL_DISPLAY_LIST),
+    offsetof(GLEnumPool,n_GL_MAX_LABEL_LENGTH),
+    offsetof(GLEnumPool,n_GL_NUM_SHADING_LANGUAGE_VERSIONS),
+    offsetof(GLEnumPool,n_GL_CONVOLUTION_HINT_SGIX),
+    offsetof(GLEnumPool,n_GL_ALPHA_MIN_SGIX),
+    offsetof(GLEnumPool,n_GL_ALPHA_MAX_SGIX),
+    offsetof(GLEnumPool,n_GL_ASYNC_MARKER_SGIX),
+    offsetof(GLEnumPool,n_GL_ASYNC_HISTOGRAM_SGIX),
+    offsetof(GLEnumPool,n_GL_MAX_ASYNC_HISTOGRAM_SGIX),
+    offsetof(GLEnumPool,n_GL_PIXEL_TRANSFORM_2D_EXT),
+    offsetof(GLEnumPool,n_GL_PIXEL_MAG_FILTER_EXT),
+    offsetof(GLEnumPool,n_GL_PIXEL_MIN_FILTER_EXT),
+    offsetof(GLEnumPool,n_GL_PIXEL_CUBIC_WEIGHT_EXT),
+    offsetof(GLEnumPool,n_GL_CUBIC_EXT),
+    offsetof(GLEnumPool,n_GL_AVERAGE_EXT),
+    offsetof(GLEnumPool,n_GL_PIXEL_TRANSFORM_2D_STACK_DEPTH_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_PIXEL_TRANSFORM_2D_STACK_DEPTH_EXT),
+    offsetof(GLEnumPool,n_GL_PIXEL_TRANSFORM_2D_MATRIX_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_MATERIAL_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_NORMAL_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_COLOR_EXT),
+    offsetof(GLEnumPool,n_GL_ATTENUATION_EXT),
+    offsetof(GLEnumPool,n_GL_SHADOW_ATTENUATION_EXT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_APPLICATION_MODE_EXT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_LIGHT_EXT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MATERIAL_FACE_EXT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MATERIAL_PARAMETER_EXT),
+    offsetof(GLEnumPool,n_GL_ASYNC_TEX_IMAGE_SGIX),
+    offsetof(GLEnumPool,n_GL_ASYNC_DRAW_PIXELS_SGIX),
+    offsetof(GLEnumPool,n_GL_ASYNC_READ_PIXELS_SGIX),
+    offsetof(GLEnumPool,n_GL_MAX_ASYNC_TEX_IMAGE_SGIX),
+    offsetof(GLEnumPool,n_GL_MAX_ASYNC_DRAW_PIXELS_SGIX),
+    offsetof(GLEnumPool,n_GL_MAX_ASYNC_READ_PIXELS_SGIX),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_BYTE_2_3_3_REV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_SHORT_5_6_5),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_SHORT_5_6_5_REV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_SHORT_4_4_4_4_REV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_SHORT_1_5_5_5_REV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_8_8_8_8_REV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_2_10_10_10_REV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MAX_CLAMP_S_SGIX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MAX_CLAMP_T_SGIX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MAX_CLAMP_R_SGIX),
+    offsetof(GLEnumPool,n_GL_MIRRORED_REPEAT),
+    offsetof(GLEnumPool,n_GL_RGB_S3TC),
+    offsetof(GLEnumPool,n_GL_RGB4_S3TC),
+    offsetof(GLEnumPool,n_GL_RGBA_S3TC),
+    offsetof(GLEnumPool,n_GL_RGBA4_S3TC),
+    offsetof(GLEnumPool,n_GL_RGBA_DXT5_S3TC),
+    offsetof(GLEnumPool,n_GL_RGBA4_DXT5_S3TC),
+    offsetof(GLEnumPool,n_GL_VERTEX_PRECLIP_SGIX),
+    offsetof(GLEnumPool,n_GL_VERTEX_PRECLIP_HINT_SGIX),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGB_S3TC_DXT1_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_S3TC_DXT1_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_S3TC_DXT3_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_S3TC_DXT5_EXT),
+    offsetof(GLEnumPool,n_GL_PARALLEL_ARRAYS_INTEL),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_PARALLEL_POINTERS_INTEL),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY_PARALLEL_POINTERS_INTEL),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_PARALLEL_POINTERS_INTEL),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_PARALLEL_POINTERS_INTEL),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MEMORY_LAYOUT_INTEL),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHTING_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_COLOR_MATERIAL_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_COLOR_MATERIAL_FACE_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_COLOR_MATERIAL_PARAMETER_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_LIGHTS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_ACTIVE_LIGHTS_EXT),
+    offsetof(GLEnumPool,n_GL_CURRENT_RASTER_NORMAL_EXT),
+    offsetof(GLEnumPool,n_GL_LIGHT_ENV_MODE_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT_MODEL_LOCAL_VIEWER_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT_MODEL_TWO_SIDE_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT_MODEL_AMBIENT_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT_MODEL_NORMAL_INTERPOLATION_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT0_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT1_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT2_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT3_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT4_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT5_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT6_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_LIGHT7_EXT),
+    offsetof(GLEnumPool,n_GL_PACK_RESAMPLE_SGIX),
+    offsetof(GLEnumPool,n_GL_UNPACK_RESAMPLE_SGIX),
+    offsetof(GLEnumPool,n_GL_RESAMPLE_DECIMATE_SGIX),
+    offsetof(GLEnumPool,n_GL_RESAMPLE_REPLICATE_SGIX),
+    offsetof(GLEnumPool,n_GL_RESAMPLE_ZERO_FILL_SGIX),
+    offsetof(GLEnumPool,n_GL_TANGENT_ARRAY_EXT),
+    offsetof(GLEnumPool,n_GL_BINORMAL_ARRAY_EXT),
+    offsetof(GLEnumPool,n_GL_CURRENT_TANGENT_EXT),
+    offsetof(GLEnumPool,n_GL_CURRENT_BINORMAL_EXT),
+    offsetof(GLEnumPool,n_GL_TANGENT_ARRAY_TYPE_EXT),
+    offsetof(GLEnumPool,n_GL_TANGENT_ARRAY_STRIDE_EXT),
+    offsetof(GLEnumPool,n_GL_BINORMAL_ARRAY_TYPE_EXT),
+    offsetof(GLEnumPool,n_GL_BINORMAL_ARRAY_STRIDE_EXT),
+    offsetof(GLEnumPool,n_GL_TANGENT_ARRAY_POINTER_EXT),
+    offsetof(GLEnumPool,n_GL_BINORMAL_ARRAY_POINTER_EXT),
+    offsetof(GLEnumPool,n_GL_MAP1_TANGENT_EXT),
+    offsetof(GLEnumPool,n_GL_MAP2_TANGENT_EXT),
+    offsetof(GLEnumPool,n_GL_MAP1_BINORMAL_EXT),
+    offsetof(GLEnumPool,n_GL_MAP2_BINORMAL_EXT),
+    offsetof(GLEnumPool,n_GL_FOG_COORDINATE_SOURCE),
+    offsetof(GLEnumPool,n_GL_FOG_COORDINATE),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_DEPTH),
+    offsetof(GLEnumPool,n_GL_CURRENT_FOG_COORDINATE),
+    offsetof(GLEnumPool,n_GL_FOG_COORDINATE_ARRAY_TYPE),
+    offsetof(GLEnumPool,n_GL_FOG_COORDINATE_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_FOG_COORDINATE_ARRAY_POINTER),
+    offsetof(GLEnumPool,n_GL_FOG_COORDINATE_ARRAY),
+    offsetof(GLEnumPool,n_GL_COLOR_SUM),
+    offsetof(GLEnumPool,n_GL_CURRENT_SECONDARY_COLOR),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_ARRAY_SIZE),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_ARRAY_TYPE),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_ARRAY_POINTER),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_ARRAY),
+    offsetof(GLEnumPool,n_GL_CURRENT_RASTER_SECONDARY_COLOR),
+    offsetof(GLEnumPool,n_GL_ALIASED_POINT_SIZE_RANGE),
+    offsetof(GLEnumPool,n_GL_ALIASED_LINE_WIDTH_RANGE),
+    offsetof(GLEnumPool,n_GL_SCREEN_COORDINATES_REND),
+    offsetof(GLEnumPool,n_GL_INVERTED_SCREEN_W_REND),
+    offsetof(GLEnumPool,n_GL_TEXTURE0),
+    offsetof(GLEnumPool,n_GL_TEXTURE1),
+    offsetof(GLEnumPool,n_GL_TEXTURE2),
+    offsetof(GLEnumPool,n_GL_TEXTURE3),
+    offsetof(GLEnumPool,n_GL_TEXTURE4),
+    offsetof(GLEnumPool,n_GL_TEXTURE5),
+    offsetof(GLEnumPool,n_GL_TEXTURE6),
+    offsetof(GLEnumPool,n_GL_TEXTURE7),
+    offsetof(GLEnumPool,n_GL_TEXTURE8),
+    offsetof(GLEnumPool,n_GL_TEXTURE9),
+    offsetof(GLEnumPool,n_GL_TEXTURE10),
+    offsetof(GLEnumPool,n_GL_TEXTURE11),
+    offsetof(GLEnumPool,n_GL_TEXTURE12),
+    offsetof(GLEnumPool,n_GL_TEXTURE13),
+    offsetof(GLEnumPool,n_GL_TEXTURE14),
+    offsetof(GLEnumPool,n_GL_TEXTURE15),
+    offsetof(GLEnumPool,n_GL_TEXTURE16),
+    offsetof(GLEnumPool,n_GL_TEXTURE17),
+    offsetof(GLEnumPool,n_GL_TEXTURE18),
+    offsetof(GLEnumPool,n_GL_TEXTURE19),
+    offsetof(GLEnumPool,n_GL_TEXTURE20),
+    offsetof(GLEnumPool,n_GL_TEXTURE21),
+    offsetof(GLEnumPool,n_GL_TEXTURE22),
+    offsetof(GLEnumPool,n_GL_TEXTURE23),
+    offsetof(GLEnumPool,n_GL_TEXTURE24),
+    offsetof(GLEnumPool,n_GL_TEXTURE25),
+    offsetof(GLEnumPool,n_GL_TEXTURE26),
+    offsetof(GLEnumPool,n_GL_TEXTURE27),
+    offsetof(GLEnumPool,n_GL_TEXTURE28),
+    offsetof(GLEnumPool,n_GL_TEXTURE29),
+    offsetof(GLEnumPool,n_GL_TEXTURE30),
+    offsetof(GLEnumPool,n_GL_TEXTURE31),
+    offsetof(GLEnumPool,n_GL_ACTIVE_TEXTURE),
+    offsetof(GLEnumPool,n_GL_CLIENT_ACTIVE_TEXTURE),
+    offsetof(GLEnumPool,n_GL_MAX_TEXTURE_UNITS),
+    offsetof(GLEnumPool,n_GL_TRANSPOSE_MODELVIEW_MATRIX),
+    offsetof(GLEnumPool,n_GL_TRANSPOSE_PROJECTION_MATRIX),
+    offsetof(GLEnumPool,n_GL_TRANSPOSE_TEXTURE_MATRIX),
+    offsetof(GLEnumPool,n_GL_TRANSPOSE_COLOR_MATRIX),
+    offsetof(GLEnumPool,n_GL_SUBTRACT),
+    offsetof(GLEnumPool,n_GL_MAX_RENDERBUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_ALPHA),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_LUMINANCE),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_LUMINANCE_ALPHA),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_INTENSITY),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGB),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPRESSION_HINT),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_CONTROL_SHADER),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_EVALUATION_SHADER),
+    offsetof(GLEnumPool,n_GL_ALL_COMPLETED_NV),
+    offsetof(GLEnumPool,n_GL_FENCE_STATUS_NV),
+    offsetof(GLEnumPool,n_GL_FENCE_CONDITION_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_RECTANGLE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_RECTANGLE),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_RECTANGLE),
+    offsetof(GLEnumPool,n_GL_MAX_RECTANGLE_TEXTURE_SIZE),
+    offsetof(GLEnumPool,n_GL_DEPTH_STENCIL),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_24_8),
+    offsetof(GLEnumPool,n_GL_MAX_TEXTURE_LOD_BIAS),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MAX_ANISOTROPY_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_FILTER_CONTROL),
+    offsetof(GLEnumPool,n_GL_TEXTURE_LOD_BIAS),
+    offsetof(GLEnumPool,n_GL_MODELVIEW1_STACK_DEPTH_EXT),
+    offsetof(GLEnumPool,n_GL_COMBINE4_NV),
+    offsetof(GLEnumPool,n_GL_MAX_SHININESS_NV),
+    offsetof(GLEnumPool,n_GL_MAX_SPOT_EXPONENT_NV),
+    offsetof(GLEnumPool,n_GL_MODELVIEW1_MATRIX_EXT),
+    offsetof(GLEnumPool,n_GL_INCR_WRAP),
+    offsetof(GLEnumPool,n_GL_DECR_WRAP),
+    offsetof(GLEnumPool,n_GL_VERTEX_WEIGHTING_EXT),
+    offsetof(GLEnumPool,n_GL_MODELVIEW1_ARB),
+    offsetof(GLEnumPool,n_GL_CURRENT_VERTEX_WEIGHT_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_WEIGHT_ARRAY_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_WEIGHT_ARRAY_SIZE_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_WEIGHT_ARRAY_TYPE_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_WEIGHT_ARRAY_STRIDE_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_WEIGHT_ARRAY_POINTER_EXT),
+    offsetof(GLEnumPool,n_GL_NORMAL_MAP),
+    offsetof(GLEnumPool,n_GL_REFLECTION_MAP),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CUBE_MAP),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_CUBE_MAP),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CUBE_MAP_POSITIVE_X),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CUBE_MAP_NEGATIVE_X),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CUBE_MAP_POSITIVE_Y),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CUBE_MAP_NEGATIVE_Y),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CUBE_MAP_POSITIVE_Z),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CUBE_MAP_NEGATIVE_Z),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_CUBE_MAP),
+    offsetof(GLEnumPool,n_GL_MAX_CUBE_MAP_TEXTURE_SIZE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_RANGE_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_RANGE_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_RANGE_VALID_NV),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_ARRAY_RANGE_ELEMENT_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_RANGE_POINTER_NV),
+    offsetof(GLEnumPool,n_GL_REGISTER_COMBINERS_NV),
+    offsetof(GLEnumPool,n_GL_VARIABLE_A_NV),
+    offsetof(GLEnumPool,n_GL_VARIABLE_B_NV),
+    offsetof(GLEnumPool,n_GL_VARIABLE_C_NV),
+    offsetof(GLEnumPool,n_GL_VARIABLE_D_NV),
+    offsetof(GLEnumPool,n_GL_VARIABLE_E_NV),
+    offsetof(GLEnumPool,n_GL_VARIABLE_F_NV),
+    offsetof(GLEnumPool,n_GL_VARIABLE_G_NV),
+    offsetof(GLEnumPool,n_GL_CONSTANT_COLOR0_NV),
+    offsetof(GLEnumPool,n_GL_CONSTANT_COLOR1_NV),
+    offsetof(GLEnumPool,n_GL_PRIMARY_COLOR_NV),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_NV),
+    offsetof(GLEnumPool,n_GL_SPARE0_NV),
+    offsetof(GLEnumPool,n_GL_SPARE1_NV),
+    offsetof(GLEnumPool,n_GL_DISCARD_NV),
+    offsetof(GLEnumPool,n_GL_E_TIMES_F_NV),
+    offsetof(GLEnumPool,n_GL_SPARE0_PLUS_SECONDARY_COLOR_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_RANGE_WITHOUT_FLUSH_NV),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_FILTER_HINT_NV),
+    offsetof(GLEnumPool,n_GL_PER_STAGE_CONSTANTS_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_IDENTITY_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INVERT_NV),
+    offsetof(GLEnumPool,n_GL_EXPAND_NORMAL_NV),
+    offsetof(GLEnumPool,n_GL_EXPAND_NEGATE_NV),
+    offsetof(GLEnumPool,n_GL_HALF_BIAS_NORMAL_NV),
+    offsetof(GLEnumPool,n_GL_HALF_BIAS_NEGATE_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_IDENTITY_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_NEGATE_NV),
+    offsetof(GLEnumPool,n_GL_SCALE_BY_TWO_NV),
+    offsetof(GLEnumPool,n_GL_SCALE_BY_FOUR_NV),
+    offsetof(GLEnumPool,n_GL_SCALE_BY_ONE_HALF_NV),
+    offsetof(GLEnumPool,n_GL_BIAS_BY_NEGATIVE_ONE_HALF_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_INPUT_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_MAPPING_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_COMPONENT_USAGE_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_AB_DOT_PRODUCT_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_CD_DOT_PRODUCT_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_MUX_SUM_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_BIAS_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_AB_OUTPUT_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_CD_OUTPUT_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER_SUM_OUTPUT_NV),
+    offsetof(GLEnumPool,n_GL_MAX_GENERAL_COMBINERS_NV),
+    offsetof(GLEnumPool,n_GL_NUM_GENERAL_COMBINERS_NV),
+    offsetof(GLEnumPool,n_GL_COLOR_SUM_CLAMP_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER0_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER1_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER2_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER3_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER4_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER5_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER6_NV),
+    offsetof(GLEnumPool,n_GL_COMBINER7_NV),
+    offsetof(GLEnumPool,n_GL_PRIMITIVE_RESTART_NV),
+    offsetof(GLEnumPool,n_GL_PRIMITIVE_RESTART_INDEX_NV),
+    offsetof(GLEnumPool,n_GL_FOG_DISTANCE_MODE_NV),
+    offsetof(GLEnumPool,n_GL_EYE_RADIAL_NV),
+    offsetof(GLEnumPool,n_GL_EYE_PLANE_ABSOLUTE_NV),
+    offsetof(GLEnumPool,n_GL_EMBOSS_LIGHT_NV),
+    offsetof(GLEnumPool,n_GL_EMBOSS_CONSTANT_NV),
+    offsetof(GLEnumPool,n_GL_EMBOSS_MAP_NV),
+    offsetof(GLEnumPool,n_GL_RED_MIN_CLAMP_INGR),
+    offsetof(GLEnumPool,n_GL_GREEN_MIN_CLAMP_INGR),
+    offsetof(GLEnumPool,n_GL_BLUE_MIN_CLAMP_INGR),
+    offsetof(GLEnumPool,n_GL_ALPHA_MIN_CLAMP_INGR),
+    offsetof(GLEnumPool,n_GL_RED_MAX_CLAMP_INGR),
+    offsetof(GLEnumPool,n_GL_GREEN_MAX_CLAMP_INGR),
+    offsetof(GLEnumPool,n_GL_BLUE_MAX_CLAMP_INGR),
+    offsetof(GLEnumPool,n_GL_ALPHA_MAX_CLAMP_INGR),
+    offsetof(GLEnumPool,n_GL_INTERLACE_READ_INGR),
+    offsetof(GLEnumPool,n_GL_COMBINE),
+    offsetof(GLEnumPool,n_GL_COMBINE_RGB),
+    offsetof(GLEnumPool,n_GL_COMBINE_ALPHA),
+    offsetof(GLEnumPool,n_GL_RGB_SCALE),
+    offsetof(GLEnumPool,n_GL_ADD_SIGNED),
+    offsetof(GLEnumPool,n_GL_INTERPOLATE),
+    offsetof(GLEnumPool,n_GL_CONSTANT),
+    offsetof(GLEnumPool,n_GL_PRIMARY_COLOR),
+    offsetof(GLEnumPool,n_GL_PREVIOUS),
+    offsetof(GLEnumPool,n_GL_SOURCE0_RGB),
+    offsetof(GLEnumPool,n_GL_SOURCE1_RGB),
+    offsetof(GLEnumPool,n_GL_SOURCE2_RGB),
+    offsetof(GLEnumPool,n_GL_SOURCE3_RGB_NV),
+    offsetof(GLEnumPool,n_GL_SOURCE0_ALPHA),
+    offsetof(GLEnumPool,n_GL_SOURCE1_ALPHA),
+    offsetof(GLEnumPool,n_GL_SOURCE2_ALPHA),
+    offsetof(GLEnumPool,n_GL_SOURCE3_ALPHA_NV),
+    offsetof(GLEnumPool,n_GL_OPERAND0_RGB),
+    offsetof(GLEnumPool,n_GL_OPERAND1_RGB),
+    offsetof(GLEnumPool,n_GL_OPERAND2_RGB),
+    offsetof(GLEnumPool,n_GL_OPERAND3_RGB_NV),
+    offsetof(GLEnumPool,n_GL_OPERAND0_ALPHA),
+    offsetof(GLEnumPool,n_GL_OPERAND1_ALPHA),
+    offsetof(GLEnumPool,n_GL_OPERAND2_ALPHA),
+    offsetof(GLEnumPool,n_GL_OPERAND3_ALPHA_NV),
+    offsetof(GLEnumPool,n_GL_EXTENDED_RANGE_SGIS),
+    offsetof(GLEnumPool,n_GL_MIN_RED_SGIS),
+    offsetof(GLEnumPool,n_GL_MAX_RED_SGIS),
+    offsetof(GLEnumPool,n_GL_MIN_GREEN_SGIS),
+    offsetof(GLEnumPool,n_GL_MAX_GREEN_SGIS),
+    offsetof(GLEnumPool,n_GL_MIN_BLUE_SGIS),
+    offsetof(GLEnumPool,n_GL_MAX_BLUE_SGIS),
+    offsetof(GLEnumPool,n_GL_MIN_ALPHA_SGIS),
+    offsetof(GLEnumPool,n_GL_MAX_ALPHA_SGIS),
+    offsetof(GLEnumPool,n_GL_PERTURB_EXT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_NORMAL_EXT),
+    offsetof(GLEnumPool,n_GL_LIGHT_MODEL_SPECULAR_VECTOR_APPLE),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_HINT_APPLE),
+    offsetof(GLEnumPool,n_GL_UNPACK_CLIENT_STORAGE_APPLE),
+    offsetof(GLEnumPool,n_GL_BUFFER_OBJECT_APPLE),
+    offsetof(GLEnumPool,n_GL_STORAGE_CLIENT_APPLE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_BINDING),
+    offsetof(GLEnumPool,n_GL_TEXTURE_RANGE_LENGTH_APPLE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_RANGE_POINTER_APPLE),
+    offsetof(GLEnumPool,n_GL_YCBCR_422_APPLE),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_SHORT_8_8_MESA),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_SHORT_8_8_REV_MESA),
+    offsetof(GLEnumPool,n_GL_TEXTURE_STORAGE_HINT_APPLE),
+    offsetof(GLEnumPool,n_GL_STORAGE_PRIVATE_APPLE),
+    offsetof(GLEnumPool,n_GL_STORAGE_CACHED_APPLE),
+    offsetof(GLEnumPool,n_GL_STORAGE_SHARED_APPLE),
+    offsetof(GLEnumPool,n_GL_REPLACEMENT_CODE_ARRAY_SUN),
+    offsetof(GLEnumPool,n_GL_REPLACEMENT_CODE_ARRAY_TYPE_SUN),
+    offsetof(GLEnumPool,n_GL_REPLACEMENT_CODE_ARRAY_STRIDE_SUN),
+    offsetof(GLEnumPool,n_GL_REPLACEMENT_CODE_ARRAY_POINTER_SUN),
+    offsetof(GLEnumPool,n_GL_R1UI_V3F_SUN),
+    offsetof(GLEnumPool,n_GL_R1UI_C4UB_V3F_SUN),
+    offsetof(GLEnumPool,n_GL_R1UI_C3F_V3F_SUN),
+    offsetof(GLEnumPool,n_GL_R1UI_N3F_V3F_SUN),
+    offsetof(GLEnumPool,n_GL_R1UI_C4F_N3F_V3F_SUN),
+    offsetof(GLEnumPool,n_GL_R1UI_T2F_V3F_SUN),
+    offsetof(GLEnumPool,n_GL_R1UI_T2F_N3F_V3F_SUN),
+    offsetof(GLEnumPool,n_GL_R1UI_T2F_C4F_N3F_V3F_SUN),
+    offsetof(GLEnumPool,n_GL_SLICE_ACCUM_SUN),
+    offsetof(GLEnumPool,n_GL_RGB_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_RGBA_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_ALPHA_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_INTENSITY_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_RGB16_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_RGBA16_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_ALPHA16_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_INTENSITY16_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16_ALPHA16_SIGNED_SGIX),
+    offsetof(GLEnumPool,n_GL_RGB_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_RGBA_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_ALPHA_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_INTENSITY_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_RGB16_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_RGBA16_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_ALPHA16_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_INTENSITY16_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16_ALPHA16_EXTENDED_RANGE_SGIX),
+    offsetof(GLEnumPool,n_GL_MIN_LUMINANCE_SGIS),
+    offsetof(GLEnumPool,n_GL_MAX_LUMINANCE_SGIS),
+    offsetof(GLEnumPool,n_GL_MIN_INTENSITY_SGIS),
+    offsetof(GLEnumPool,n_GL_MAX_INTENSITY_SGIS),
+    offsetof(GLEnumPool,n_GL_QUAD_MESH_SUN),
+    offsetof(GLEnumPool,n_GL_TRIANGLE_MESH_SUN),
+    offsetof(GLEnumPool,n_GL_VERTEX_PROGRAM_ARB),
+    offsetof(GLEnumPool,n_GL_VERTEX_STATE_PROGRAM_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_ENABLED),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_SIZE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_TYPE),
+    offsetof(GLEnumPool,n_GL_CURRENT_VERTEX_ATTRIB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_LENGTH_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_STRING_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW_PROJECTION_NV),
+    offsetof(GLEnumPool,n_GL_IDENTITY_NV),
+    offsetof(GLEnumPool,n_GL_INVERSE_NV),
+    offsetof(GLEnumPool,n_GL_TRANSPOSE_NV),
+    offsetof(GLEnumPool,n_GL_INVERSE_TRANSPOSE_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_MATRIX_STACK_DEPTH_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_MATRICES_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX0_NV),
+    offsetof(GLEnumPool,n_GL_MATRIX1_NV),
+    offsetof(GLEnumPool,n_GL_MATRIX2_NV),
+    offsetof(GLEnumPool,n_GL_MATRIX3_NV),
+    offsetof(GLEnumPool,n_GL_MATRIX4_NV),
+    offsetof(GLEnumPool,n_GL_MATRIX5_NV),
+    offsetof(GLEnumPool,n_GL_MATRIX6_NV),
+    offsetof(GLEnumPool,n_GL_MATRIX7_NV),
+    offsetof(GLEnumPool,n_GL_CURRENT_MATRIX_STACK_DEPTH_ARB),
+    offsetof(GLEnumPool,n_GL_CURRENT_MATRIX_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_POINT_SIZE),
+    offsetof(GLEnumPool,n_GL_VERTEX_PROGRAM_TWO_SIDE),
+    offsetof(GLEnumPool,n_GL_PROGRAM_PARAMETER_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_POINTER),
+    offsetof(GLEnumPool,n_GL_PROGRAM_TARGET_NV),
+    offsetof(GLEnumPool,n_GL_PROGRAM_RESIDENT_NV),
+    offsetof(GLEnumPool,n_GL_TRACK_MATRIX_NV),
+    offsetof(GLEnumPool,n_GL_TRACK_MATRIX_TRANSFORM_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_PROGRAM_BINDING_NV),
+    offsetof(GLEnumPool,n_GL_PROGRAM_ERROR_POSITION_ARB),
+    offsetof(GLEnumPool,n_GL_OFFSET_TEXTURE_RECTANGLE_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_TEXTURE_RECTANGLE_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_TEXTURE_RECTANGLE_NV),
+    offsetof(GLEnumPool,n_GL_DEPTH_CLAMP),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY0_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY1_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY2_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY3_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY4_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY5_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY6_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY7_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY8_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY9_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY10_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY11_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY12_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY13_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY14_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY15_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB0_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB1_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB2_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB3_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB4_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB5_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB6_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB7_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB8_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB9_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB10_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB11_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB12_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB13_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB14_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP1_VERTEX_ATTRIB15_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB0_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB1_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB2_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB3_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB4_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB5_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB6_4_NV),
+    offsetof(GLEnumPool,n_GL_PROGRAM_BINDING_ARB),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB8_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB9_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB10_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB11_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB12_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB13_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB14_4_NV),
+    offsetof(GLEnumPool,n_GL_MAP2_VERTEX_ATTRIB15_4_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPRESSED_IMAGE_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPRESSED),
+    offsetof(GLEnumPool,n_GL_NUM_COMPRESSED_TEXTURE_FORMATS),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_TEXTURE_FORMATS),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_UNITS_ARB),
+    offsetof(GLEnumPool,n_GL_ACTIVE_VERTEX_UNITS_ARB),
+    offsetof(GLEnumPool,n_GL_WEIGHT_SUM_UNITY_ARB),
+    offsetof(GLEnumPool,n_GL_VERTEX_BLEND_ARB),
+    offsetof(GLEnumPool,n_GL_CURRENT_WEIGHT_ARB),
+    offsetof(GLEnumPool,n_GL_WEIGHT_ARRAY_TYPE_ARB),
+    offsetof(GLEnumPool,n_GL_WEIGHT_ARRAY_STRIDE_ARB),
+    offsetof(GLEnumPool,n_GL_WEIGHT_ARRAY_SIZE_ARB),
+    offsetof(GLEnumPool,n_GL_WEIGHT_ARRAY_POINTER_ARB),
+    offsetof(GLEnumPool,n_GL_WEIGHT_ARRAY_ARB),
+    offsetof(GLEnumPool,n_GL_DOT3_RGB),
+    offsetof(GLEnumPool,n_GL_DOT3_RGBA),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGB_FXT1_3DFX),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_FXT1_3DFX),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_3DFX),
+    offsetof(GLEnumPool,n_GL_SAMPLE_BUFFERS_3DFX),
+    offsetof(GLEnumPool,n_GL_SAMPLES_3DFX),
+    offsetof(GLEnumPool,n_GL_EVAL_2D_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_TRIANGULAR_2D_NV),
+    offsetof(GLEnumPool,n_GL_MAP_TESSELLATION_NV),
+    offsetof(GLEnumPool,n_GL_MAP_ATTRIB_U_ORDER_NV),
+    offsetof(GLEnumPool,n_GL_MAP_ATTRIB_V_ORDER_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_FRACTIONAL_TESSELLATION_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB0_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB1_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB2_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB3_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB4_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB5_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB6_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB7_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB8_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB9_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB10_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB11_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB12_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB13_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB14_NV),
+    offsetof(GLEnumPool,n_GL_EVAL_VERTEX_ATTRIB15_NV),
+    offsetof(GLEnumPool,n_GL_MAX_MAP_TESSELLATION_NV),
+    offsetof(GLEnumPool,n_GL_MAX_RATIONAL_EVAL_ORDER_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_PATCH_ATTRIBS_NV),
+    offsetof(GLEnumPool,n_GL_RGBA_UNSIGNED_DOT_PRODUCT_MAPPING_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_S8_S8_8_8_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_8_8_S8_S8_REV_NV),
+    offsetof(GLEnumPool,n_GL_DSDT_MAG_INTENSITY_NV),
+    offsetof(GLEnumPool,n_GL_SHADER_CONSISTENT_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SHADER_NV),
+    offsetof(GLEnumPool,n_GL_SHADER_OPERATION_NV),
+    offsetof(GLEnumPool,n_GL_CULL_MODES_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_TEXTURE_2D_MATRIX_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_TEXTURE_2D_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_TEXTURE_2D_BIAS_NV),
+    offsetof(GLEnumPool,n_GL_PREVIOUS_TEXTURE_INPUT_NV),
+    offsetof(GLEnumPool,n_GL_CONST_EYE_NV),
+    offsetof(GLEnumPool,n_GL_PASS_THROUGH_NV),
+    offsetof(GLEnumPool,n_GL_CULL_FRAGMENT_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_TEXTURE_2D_NV),
+    offsetof(GLEnumPool,n_GL_DEPENDENT_AR_TEXTURE_2D_NV),
+    offsetof(GLEnumPool,n_GL_DEPENDENT_GB_TEXTURE_2D_NV),
+    offsetof(GLEnumPool,n_GL_SURFACE_STATE_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_DEPTH_REPLACE_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_TEXTURE_2D_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_TEXTURE_3D_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_TEXTURE_CUBE_MAP_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_DIFFUSE_CUBE_MAP_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_REFLECT_CUBE_MAP_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_CONST_EYE_REFLECT_CUBE_MAP_NV),
+    offsetof(GLEnumPool,n_GL_HILO_NV),
+    offsetof(GLEnumPool,n_GL_DSDT_NV),
+    offsetof(GLEnumPool,n_GL_DSDT_MAG_NV),
+    offsetof(GLEnumPool,n_GL_DSDT_MAG_VIB_NV),
+    offsetof(GLEnumPool,n_GL_HILO16_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_HILO_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_HILO16_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_RGBA_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_RGBA8_NV),
+    offsetof(GLEnumPool,n_GL_SURFACE_REGISTERED_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_RGB_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_RGB8_NV),
+    offsetof(GLEnumPool,n_GL_SURFACE_MAPPED_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_LUMINANCE_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_LUMINANCE8_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_LUMINANCE_ALPHA_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_LUMINANCE8_ALPHA8_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_ALPHA_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_ALPHA8_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_INTENSITY_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_INTENSITY8_NV),
+    offsetof(GLEnumPool,n_GL_DSDT8_NV),
+    offsetof(GLEnumPool,n_GL_DSDT8_MAG8_NV),
+    offsetof(GLEnumPool,n_GL_DSDT8_MAG8_INTENSITY8_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_RGB_UNSIGNED_ALPHA_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_RGB8_UNSIGNED_ALPHA8_NV),
+    offsetof(GLEnumPool,n_GL_HI_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_LO_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_DS_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_DT_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_MAGNITUDE_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_VIBRANCE_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_HI_BIAS_NV),
+    offsetof(GLEnumPool,n_GL_LO_BIAS_NV),
+    offsetof(GLEnumPool,n_GL_DS_BIAS_NV),
+    offsetof(GLEnumPool,n_GL_DT_BIAS_NV),
+    offsetof(GLEnumPool,n_GL_MAGNITUDE_BIAS_NV),
+    offsetof(GLEnumPool,n_GL_VIBRANCE_BIAS_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BORDER_VALUES_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_HI_SIZE_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_LO_SIZE_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_DS_SIZE_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_DT_SIZE_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_MAG_SIZE_NV),
+    offsetof(GLEnumPool,n_GL_MODELVIEW2_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW3_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW4_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW5_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW6_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW7_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW8_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW9_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW10_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW11_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW12_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW13_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW14_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW15_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW16_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW17_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW18_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW19_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW20_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW21_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW22_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW23_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW24_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW25_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW26_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW27_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW28_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW29_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW30_ARB),
+    offsetof(GLEnumPool,n_GL_MODELVIEW31_ARB),
+    offsetof(GLEnumPool,n_GL_Z400_BINARY_AMD),
+    offsetof(GLEnumPool,n_GL_PROGRAM_BINARY_LENGTH),
+    offsetof(GLEnumPool,n_GL_MIRROR_CLAMP_EXT),
+    offsetof(GLEnumPool,n_GL_MIRROR_CLAMP_TO_EDGE),
+    offsetof(GLEnumPool,n_GL_MODULATE_ADD_ATI),
+    offsetof(GLEnumPool,n_GL_MODULATE_SIGNED_ADD_ATI),
+    offsetof(GLEnumPool,n_GL_MODULATE_SUBTRACT_ATI),
+    offsetof(GLEnumPool,n_GL_SET_AMD),
+    offsetof(GLEnumPool,n_GL_REPLACE_VALUE_AMD),
+    offsetof(GLEnumPool,n_GL_STENCIL_OP_VALUE_AMD),
+    offsetof(GLEnumPool,n_GL_STENCIL_BACK_OP_VALUE_AMD),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_LONG),
+    offsetof(GLEnumPool,n_GL_YCBCR_MESA),
+    offsetof(GLEnumPool,n_GL_PACK_INVERT_MESA),
+    offsetof(GLEnumPool,n_GL_TEXTURE_1D_STACK_MESAX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_2D_STACK_MESAX),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_1D_STACK_MESAX),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_2D_STACK_MESAX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_1D_STACK_BINDING_MESAX),
+    offsetof(GLEnumPool,n_GL_TEXTURE_2D_STACK_BINDING_MESAX),
+    offsetof(GLEnumPool,n_GL_STATIC_ATI),
+    offsetof(GLEnumPool,n_GL_DYNAMIC_ATI),
+    offsetof(GLEnumPool,n_GL_PRESERVE_ATI),
+    offsetof(GLEnumPool,n_GL_DISCARD_ATI),
+    offsetof(GLEnumPool,n_GL_BUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_BUFFER_USAGE),
+    offsetof(GLEnumPool,n_GL_ARRAY_OBJECT_BUFFER_ATI),
+    offsetof(GLEnumPool,n_GL_ARRAY_OBJECT_OFFSET_ATI),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_ATI),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_TYPE_ATI),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_POINTER_ATI),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_STREAMS_ATI),
+    offsetof(GLEnumPool,n_GL_VERTEX_SOURCE_ATI),
+    offsetof(GLEnumPool,n_GL_VERTEX_STREAM0_ATI),
+    offsetof(GLEnumPool,n_GL_VERTEX_STREAM1_ATI),
+    offsetof(GLEnumPool,n_GL_VERTEX_STREAM2_ATI),
+    offsetof(GLEnumPool,n_GL_VERTEX_STREAM3_ATI),
+    offsetof(GLEnumPool,n_GL_VERTEX_STREAM4_ATI),
+    offsetof(GLEnumPool,n_GL_VERTEX_STREAM5_ATI),
+    offsetof(GLEnumPool,n_GL_VERTEX_STREAM6_ATI),
+    offsetof(GLEnumPool,n_GL_VERTEX_STREAM7_ATI),
+    offsetof(GLEnumPool,n_GL_BUMP_ROT_MATRIX_ATI),
+    offsetof(GLEnumPool,n_GL_BUMP_ROT_MATRIX_SIZE_ATI),
+    offsetof(GLEnumPool,n_GL_BUMP_NUM_TEX_UNITS_ATI),
+    offsetof(GLEnumPool,n_GL_BUMP_TEX_UNITS_ATI),
+    offsetof(GLEnumPool,n_GL_DUDV_ATI),
+    offsetof(GLEnumPool,n_GL_DU8DV8_ATI),
+    offsetof(GLEnumPool,n_GL_BUMP_ENVMAP_ATI),
+    offsetof(GLEnumPool,n_GL_BUMP_TARGET_ATI),
+    offsetof(GLEnumPool,n_GL_VERTEX_SHADER_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_SHADER_BINDING_EXT),
+    offsetof(GLEnumPool,n_GL_OP_INDEX_EXT),
+    offsetof(GLEnumPool,n_GL_OP_NEGATE_EXT),
+    offsetof(GLEnumPool,n_GL_OP_DOT3_EXT),
+    offsetof(GLEnumPool,n_GL_OP_DOT4_EXT),
+    offsetof(GLEnumPool,n_GL_OP_MUL_EXT),
+    offsetof(GLEnumPool,n_GL_OP_ADD_EXT),
+    offsetof(GLEnumPool,n_GL_OP_MADD_EXT),
+    offsetof(GLEnumPool,n_GL_OP_FRAC_EXT),
+    offsetof(GLEnumPool,n_GL_OP_MAX_EXT),
+    offsetof(GLEnumPool,n_GL_OP_MIN_EXT),
+    offsetof(GLEnumPool,n_GL_OP_SET_GE_EXT),
+    offsetof(GLEnumPool,n_GL_OP_SET_LT_EXT),
+    offsetof(GLEnumPool,n_GL_OP_CLAMP_EXT),
+    offsetof(GLEnumPool,n_GL_OP_FLOOR_EXT),
+    offsetof(GLEnumPool,n_GL_OP_ROUND_EXT),
+    offsetof(GLEnumPool,n_GL_OP_EXP_BASE_2_EXT),
+    offsetof(GLEnumPool,n_GL_OP_LOG_BASE_2_EXT),
+    offsetof(GLEnumPool,n_GL_OP_POWER_EXT),
+    offsetof(GLEnumPool,n_GL_OP_RECIP_EXT),
+    offsetof(GLEnumPool,n_GL_OP_RECIP_SQRT_EXT),
+    offsetof(GLEnumPool,n_GL_OP_SUB_EXT),
+    offsetof(GLEnumPool,n_GL_OP_CROSS_PRODUCT_EXT),
+    offsetof(GLEnumPool,n_GL_OP_MULTIPLY_MATRIX_EXT),
+    offsetof(GLEnumPool,n_GL_OP_MOV_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_VERTEX_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_COLOR0_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_COLOR1_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD0_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD1_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD2_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD3_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD4_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD5_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD6_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD7_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD8_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD9_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD10_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD11_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD12_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD13_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD14_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD15_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD16_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD17_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD18_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD19_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD20_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD21_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD22_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD23_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD24_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD25_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD26_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD27_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD28_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD29_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD30_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_TEXTURE_COORD31_EXT),
+    offsetof(GLEnumPool,n_GL_OUTPUT_FOG_EXT),
+    offsetof(GLEnumPool,n_GL_SCALAR_EXT),
+    offsetof(GLEnumPool,n_GL_VECTOR_EXT),
+    offsetof(GLEnumPool,n_GL_MATRIX_EXT),
+    offsetof(GLEnumPool,n_GL_VARIANT_EXT),
+    offsetof(GLEnumPool,n_GL_INVARIANT_EXT),
+    offsetof(GLEnumPool,n_GL_LOCAL_CONSTANT_EXT),
+    offsetof(GLEnumPool,n_GL_LOCAL_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_SHADER_INSTRUCTIONS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_SHADER_VARIANTS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_SHADER_INVARIANTS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_SHADER_LOCAL_CONSTANTS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_SHADER_LOCALS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_OPTIMIZED_VERTEX_SHADER_INSTRUCTIONS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_OPTIMIZED_VERTEX_SHADER_VARIANTS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_OPTIMIZED_VERTEX_SHADER_INVARIANTS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_OPTIMIZED_VERTEX_SHADER_LOCAL_CONSTANTS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_OPTIMIZED_VERTEX_SHADER_LOCALS_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_SHADER_INSTRUCTIONS_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_SHADER_VARIANTS_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_SHADER_INVARIANTS_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_SHADER_LOCAL_CONSTANTS_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_SHADER_LOCALS_EXT),
+    offsetof(GLEnumPool,n_GL_VERTEX_SHADER_OPTIMIZED_EXT),
+    offsetof(GLEnumPool,n_GL_X_EXT),
+    offsetof(GLEnumPool,n_GL_Y_EXT),
+    offsetof(GLEnumPool,n_GL_Z_EXT),
+    offsetof(GLEnumPool,n_GL_W_EXT),
+    offsetof(GLEnumPool,n_GL_NEGATIVE_X_EXT),
+    offsetof(GLEnumPool,n_GL_NEGATIVE_Y_EXT),
+    offsetof(GLEnumPool,n_GL_NEGATIVE_Z_EXT),
+    offsetof(GLEnumPool,n_GL_NEGATIVE_W_EXT),
+    offsetof(GLEnumPool,n_GL_ZERO_EXT),
+    offsetof(GLEnumPool,n_GL_ONE_EXT),
+    offsetof(GLEnumPool,n_GL_NEGATIVE_ONE_EXT),
+    offsetof(GLEnumPool,n_GL_NORMALIZED_RANGE_EXT),
+    offsetof(GLEnumPool,n_GL_FULL_RANGE_EXT),
+    offsetof(GLEnumPool,n_GL_CURRENT_VERTEX_EXT),
+    offsetof(GLEnumPool,n_GL_MVP_MATRIX_EXT),
+    offsetof(GLEnumPool,n_GL_VARIANT_VALUE_EXT),
+    offsetof(GLEnumPool,n_GL_VARIANT_DATATYPE_EXT),
+    offsetof(GLEnumPool,n_GL_VARIANT_ARRAY_STRIDE_EXT),
+    offsetof(GLEnumPool,n_GL_VARIANT_ARRAY_TYPE_EXT),
+    offsetof(GLEnumPool,n_GL_VARIANT_ARRAY_EXT),
+    offsetof(GLEnumPool,n_GL_VARIANT_ARRAY_POINTER_EXT),
+    offsetof(GLEnumPool,n_GL_INVARIANT_VALUE_EXT),
+    offsetof(GLEnumPool,n_GL_INVARIANT_DATATYPE_EXT),
+    offsetof(GLEnumPool,n_GL_LOCAL_CONSTANT_VALUE_EXT),
+    offsetof(GLEnumPool,n_GL_LOCAL_CONSTANT_DATATYPE_EXT),
+    offsetof(GLEnumPool,n_GL_ATC_RGBA_INTERPOLATED_ALPHA_AMD),
+    offsetof(GLEnumPool,n_GL_PN_TRIANGLES_ATI),
+    offsetof(GLEnumPool,n_GL_MAX_PN_TRIANGLES_TESSELATION_LEVEL_ATI),
+    offsetof(GLEnumPool,n_GL_PN_TRIANGLES_POINT_MODE_ATI),
+    offsetof(GLEnumPool,n_GL_PN_TRIANGLES_NORMAL_MODE_ATI),
+    offsetof(GLEnumPool,n_GL_PN_TRIANGLES_TESSELATION_LEVEL_ATI),
+    offsetof(GLEnumPool,n_GL_PN_TRIANGLES_POINT_MODE_LINEAR_ATI),
+    offsetof(GLEnumPool,n_GL_PN_TRIANGLES_POINT_MODE_CUBIC_ATI),
+    offsetof(GLEnumPool,n_GL_PN_TRIANGLES_NORMAL_MODE_LINEAR_ATI),
+    offsetof(GLEnumPool,n_GL_PN_TRIANGLES_NORMAL_MODE_QUADRATIC_ATI),
+    offsetof(GLEnumPool,n_GL_3DC_X_AMD),
+    offsetof(GLEnumPool,n_GL_3DC_XY_AMD),
+    offsetof(GLEnumPool,n_GL_VBO_FREE_MEMORY_ATI),
+    offsetof(GLEnumPool,n_GL_TEXTURE_FREE_MEMORY_ATI),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_FREE_MEMORY_ATI),
+    offsetof(GLEnumPool,n_GL_NUM_PROGRAM_BINARY_FORMATS),
+    offsetof(GLEnumPool,n_GL_PROGRAM_BINARY_FORMATS),
+    offsetof(GLEnumPool,n_GL_STENCIL_BACK_FUNC),
+    offsetof(GLEnumPool,n_GL_STENCIL_BACK_FAIL),
+    offsetof(GLEnumPool,n_GL_STENCIL_BACK_PASS_DEPTH_FAIL),
+    offsetof(GLEnumPool,n_GL_STENCIL_BACK_PASS_DEPTH_PASS),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_PROGRAM_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_ALU_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_TEX_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_TEX_INDIRECTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_NATIVE_ALU_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_NATIVE_TEX_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_NATIVE_TEX_INDIRECTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_ALU_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_TEX_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_TEX_INDIRECTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_NATIVE_ALU_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_NATIVE_TEX_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_NATIVE_TEX_INDIRECTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_RGBA32F),
+    offsetof(GLEnumPool,n_GL_RGB32F),
+    offsetof(GLEnumPool,n_GL_ALPHA32F_ARB),
+    offsetof(GLEnumPool,n_GL_INTENSITY32F_ARB),
+    offsetof(GLEnumPool,n_GL_LUMINANCE32F_ARB),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA32F_ARB),
+    offsetof(GLEnumPool,n_GL_RGBA16F),
+    offsetof(GLEnumPool,n_GL_RGB16F),
+    offsetof(GLEnumPool,n_GL_ALPHA16F_ARB),
+    offsetof(GLEnumPool,n_GL_INTENSITY16F_ARB),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16F_ARB),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA16F_ARB),
+    offsetof(GLEnumPool,n_GL_RGBA_FLOAT_MODE_ARB),
+    offsetof(GLEnumPool,n_GL_WRITEONLY_RENDERING_QCOM),
+    offsetof(GLEnumPool,n_GL_MAX_DRAW_BUFFERS),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER0),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER1),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER2),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER3),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER4),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER5),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER6),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER7),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER8),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER9),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER10),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER11),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER12),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER13),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER14),
+    offsetof(GLEnumPool,n_GL_DRAW_BUFFER15),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_LUMINANCE_ALPHA_3DC_ATI),
+    offsetof(GLEnumPool,n_GL_BLEND_EQUATION_ALPHA),
+    offsetof(GLEnumPool,n_GL_SUBSAMPLE_DISTANCE_AMD),
+    offsetof(GLEnumPool,n_GL_MATRIX_PALETTE_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_MATRIX_PALETTE_STACK_DEPTH_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PALETTE_MATRICES_ARB),
+    offsetof(GLEnumPool,n_GL_CURRENT_PALETTE_MATRIX_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX_INDEX_ARRAY_ARB),
+    offsetof(GLEnumPool,n_GL_CURRENT_MATRIX_INDEX_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX_INDEX_ARRAY_SIZE_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX_INDEX_ARRAY_TYPE_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX_INDEX_ARRAY_STRIDE_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX_INDEX_ARRAY_POINTER_ARB),
+    offsetof(GLEnumPool,n_GL_TEXTURE_DEPTH_SIZE),
+    offsetof(GLEnumPool,n_GL_DEPTH_TEXTURE_MODE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPARE_MODE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COMPARE_FUNC),
+    offsetof(GLEnumPool,n_GL_COMPARE_R_TO_TEXTURE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CUBE_MAP_SEAMLESS),
+    offsetof(GLEnumPool,n_GL_OFFSET_PROJECTIVE_TEXTURE_2D_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_PROJECTIVE_TEXTURE_2D_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_PROJECTIVE_TEXTURE_RECTANGLE_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_PROJECTIVE_TEXTURE_RECTANGLE_SCALE_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_HILO_TEXTURE_2D_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_HILO_TEXTURE_RECTANGLE_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_HILO_PROJECTIVE_TEXTURE_2D_NV),
+    offsetof(GLEnumPool,n_GL_OFFSET_HILO_PROJECTIVE_TEXTURE_RECTANGLE_NV),
+    offsetof(GLEnumPool,n_GL_DEPENDENT_HILO_TEXTURE_2D_NV),
+    offsetof(GLEnumPool,n_GL_DEPENDENT_RGB_TEXTURE_3D_NV),
+    offsetof(GLEnumPool,n_GL_DEPENDENT_RGB_TEXTURE_CUBE_MAP_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_PASS_THROUGH_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_TEXTURE_1D_NV),
+    offsetof(GLEnumPool,n_GL_DOT_PRODUCT_AFFINE_DEPTH_REPLACE_NV),
+    offsetof(GLEnumPool,n_GL_HILO8_NV),
+    offsetof(GLEnumPool,n_GL_SIGNED_HILO8_NV),
+    offsetof(GLEnumPool,n_GL_FORCE_BLUE_TO_ONE_NV),
+    offsetof(GLEnumPool,n_GL_POINT_SPRITE),
+    offsetof(GLEnumPool,n_GL_COORD_REPLACE),
+    offsetof(GLEnumPool,n_GL_POINT_SPRITE_R_MODE_NV),
+    offsetof(GLEnumPool,n_GL_QUERY_COUNTER_BITS_ARB),
+    offsetof(GLEnumPool,n_GL_CURRENT_QUERY),
+    offsetof(GLEnumPool,n_GL_QUERY_RESULT),
+    offsetof(GLEnumPool,n_GL_QUERY_RESULT_AVAILABLE),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_PROGRAM_LOCAL_PARAMETERS_NV),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_ATTRIBS),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_NORMALIZED),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_CONTROL_INPUT_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_DEPTH_STENCIL_TO_RGBA_NV),
+    offsetof(GLEnumPool,n_GL_DEPTH_STENCIL_TO_BGRA_NV),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_PROGRAM_NV),
+    offsetof(GLEnumPool,n_GL_MAX_TEXTURE_COORDS),
+    offsetof(GLEnumPool,n_GL_MAX_TEXTURE_IMAGE_UNITS),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_PROGRAM_BINDING_NV),
+    offsetof(GLEnumPool,n_GL_PROGRAM_ERROR_STRING_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_FORMAT_ASCII_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_FORMAT_ARB),
+    offsetof(GLEnumPool,n_GL_WRITE_PIXEL_DATA_RANGE_NV),
+    offsetof(GLEnumPool,n_GL_READ_PIXEL_DATA_RANGE_NV),
+    offsetof(GLEnumPool,n_GL_WRITE_PIXEL_DATA_RANGE_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_READ_PIXEL_DATA_RANGE_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_WRITE_PIXEL_DATA_RANGE_POINTER_NV),
+    offsetof(GLEnumPool,n_GL_READ_PIXEL_DATA_RANGE_POINTER_NV),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_SHADER_INVOCATIONS),
+    offsetof(GLEnumPool,n_GL_FLOAT_R_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_RG_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_RGB_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_RGBA_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_R16_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_R32_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_RG16_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_RG32_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_RGB16_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_RGB32_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_RGBA16_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_RGBA32_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_FLOAT_COMPONENTS_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_CLEAR_COLOR_VALUE_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_RGBA_MODE_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_UNSIGNED_REMAP_MODE_NV),
+    offsetof(GLEnumPool,n_GL_DEPTH_BOUNDS_TEST_EXT),
+    offsetof(GLEnumPool,n_GL_DEPTH_BOUNDS_EXT),
+    offsetof(GLEnumPool,n_GL_ARRAY_BUFFER),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_BUFFER),
+    offsetof(GLEnumPool,n_GL_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_INDEX_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_EDGE_FLAG_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_FOG_COORDINATE_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_WEIGHT_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_PROGRAM_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_NATIVE_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_NATIVE_INSTRUCTIONS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_TEMPORARIES_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_TEMPORARIES_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_NATIVE_TEMPORARIES_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_NATIVE_TEMPORARIES_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_PARAMETERS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_PARAMETERS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_NATIVE_PARAMETERS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_NATIVE_PARAMETERS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_ATTRIBS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_ATTRIBS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_NATIVE_ATTRIBS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_NATIVE_ATTRIBS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_ADDRESS_REGISTERS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_ADDRESS_REGISTERS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_NATIVE_ADDRESS_REGISTERS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_NATIVE_ADDRESS_REGISTERS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_LOCAL_PARAMETERS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_ENV_PARAMETERS_ARB),
+    offsetof(GLEnumPool,n_GL_PROGRAM_UNDER_NATIVE_LIMITS_ARB),
+    offsetof(GLEnumPool,n_GL_TRANSPOSE_CURRENT_MATRIX_ARB),
+    offsetof(GLEnumPool,n_GL_READ_ONLY),
+    offsetof(GLEnumPool,n_GL_WRITE_ONLY),
+    offsetof(GLEnumPool,n_GL_READ_WRITE),
+    offsetof(GLEnumPool,n_GL_BUFFER_ACCESS),
+    offsetof(GLEnumPool,n_GL_BUFFER_MAPPED),
+    offsetof(GLEnumPool,n_GL_BUFFER_MAP_POINTER),
+    offsetof(GLEnumPool,n_GL_WRITE_DISCARD_NV),
+    offsetof(GLEnumPool,n_GL_TIME_ELAPSED),
+    offsetof(GLEnumPool,n_GL_MATRIX0_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX1_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX2_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX3_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX4_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX5_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX6_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX7_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX8_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX9_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX10_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX11_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX12_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX13_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX14_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX15_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX16_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX17_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX18_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX19_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX20_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX21_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX22_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX23_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX24_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX25_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX26_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX27_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX28_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX29_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX30_ARB),
+    offsetof(GLEnumPool,n_GL_MATRIX31_ARB),
+    offsetof(GLEnumPool,n_GL_STREAM_DRAW),
+    offsetof(GLEnumPool,n_GL_STREAM_READ),
+    offsetof(GLEnumPool,n_GL_STREAM_COPY),
+    offsetof(GLEnumPool,n_GL_STATIC_DRAW),
+    offsetof(GLEnumPool,n_GL_STATIC_READ),
+    offsetof(GLEnumPool,n_GL_STATIC_COPY),
+    offsetof(GLEnumPool,n_GL_DYNAMIC_DRAW),
+    offsetof(GLEnumPool,n_GL_DYNAMIC_READ),
+    offsetof(GLEnumPool,n_GL_DYNAMIC_COPY),
+    offsetof(GLEnumPool,n_GL_PIXEL_PACK_BUFFER),
+    offsetof(GLEnumPool,n_GL_PIXEL_UNPACK_BUFFER),
+    offsetof(GLEnumPool,n_GL_PIXEL_PACK_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_ETC1_SRGB8_NV),
+    offsetof(GLEnumPool,n_GL_PIXEL_UNPACK_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_DEPTH24_STENCIL8),
+    offsetof(GLEnumPool,n_GL_TEXTURE_STENCIL_SIZE),
+    offsetof(GLEnumPool,n_GL_STENCIL_TAG_BITS_EXT),
+    offsetof(GLEnumPool,n_GL_STENCIL_CLEAR_TAG_VALUE_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_EXEC_INSTRUCTIONS_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_CALL_DEPTH_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_IF_DEPTH_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_LOOP_DEPTH_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_LOOP_COUNT_NV),
+    offsetof(GLEnumPool,n_GL_SRC1_COLOR),
+    offsetof(GLEnumPool,n_GL_ONE_MINUS_SRC1_COLOR),
+    offsetof(GLEnumPool,n_GL_ONE_MINUS_SRC1_ALPHA),
+    offsetof(GLEnumPool,n_GL_MAX_DUAL_SOURCE_DRAW_BUFFERS),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_INTEGER),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_DIVISOR),
+    offsetof(GLEnumPool,n_GL_MAX_ARRAY_TEXTURE_LAYERS),
+    offsetof(GLEnumPool,n_GL_MIN_PROGRAM_TEXEL_OFFSET),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_TEXEL_OFFSET),
+    offsetof(GLEnumPool,n_GL_PROGRAM_ATTRIB_COMPONENTS_NV),
+    offsetof(GLEnumPool,n_GL_PROGRAM_RESULT_COMPONENTS_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_ATTRIB_COMPONENTS_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_RESULT_COMPONENTS_NV),
+    offsetof(GLEnumPool,n_GL_NVIDIA_PLATFORM_BINARY_NV),
+    offsetof(GLEnumPool,n_GL_CG_VERTEX_SHADER_EXT),
+    offsetof(GLEnumPool,n_GL_CG_FRAGMENT_SHADER_EXT),
+    offsetof(GLEnumPool,n_GL_STENCIL_TEST_TWO_SIDE_EXT),
+    offsetof(GLEnumPool,n_GL_ACTIVE_STENCIL_FACE_EXT),
+    offsetof(GLEnumPool,n_GL_MIRROR_CLAMP_TO_BORDER_EXT),
+    offsetof(GLEnumPool,n_GL_SAMPLES_PASSED),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_VERTICES_OUT),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_INPUT_TYPE),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_OUTPUT_TYPE),
+    offsetof(GLEnumPool,n_GL_SAMPLER_BINDING),
+    offsetof(GLEnumPool,n_GL_CLAMP_VERTEX_COLOR),
+    offsetof(GLEnumPool,n_GL_CLAMP_FRAGMENT_COLOR),
+    offsetof(GLEnumPool,n_GL_CLAMP_READ_COLOR),
+    offsetof(GLEnumPool,n_GL_FIXED_ONLY),
+    offsetof(GLEnumPool,n_GL_TESS_CONTROL_PROGRAM_NV),
+    offsetof(GLEnumPool,n_GL_TESS_EVALUATION_PROGRAM_NV),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_SHADER_ATI),
+    offsetof(GLEnumPool,n_GL_REG_0_ATI),
+    offsetof(GLEnumPool,n_GL_REG_1_ATI),
+    offsetof(GLEnumPool,n_GL_REG_2_ATI),
+    offsetof(GLEnumPool,n_GL_REG_3_ATI),
+    offsetof(GLEnumPool,n_GL_REG_4_ATI),
+    offsetof(GLEnumPool,n_GL_REG_5_ATI),
+    offsetof(GLEnumPool,n_GL_CON_0_ATI),
+    offsetof(GLEnumPool,n_GL_CON_1_ATI),
+    offsetof(GLEnumPool,n_GL_CON_2_ATI),
+    offsetof(GLEnumPool,n_GL_CON_3_ATI),
+    offsetof(GLEnumPool,n_GL_CON_4_ATI),
+    offsetof(GLEnumPool,n_GL_CON_5_ATI),
+    offsetof(GLEnumPool,n_GL_CON_6_ATI),
+    offsetof(GLEnumPool,n_GL_CON_7_ATI),
+    offsetof(GLEnumPool,n_GL_MOV_ATI),
+    offsetof(GLEnumPool,n_GL_ADD_ATI),
+    offsetof(GLEnumPool,n_GL_MUL_ATI),
+    offsetof(GLEnumPool,n_GL_SUB_ATI),
+    offsetof(GLEnumPool,n_GL_DOT3_ATI),
+    offsetof(GLEnumPool,n_GL_DOT4_ATI),
+    offsetof(GLEnumPool,n_GL_MAD_ATI),
+    offsetof(GLEnumPool,n_GL_LERP_ATI),
+    offsetof(GLEnumPool,n_GL_CND_ATI),
+    offsetof(GLEnumPool,n_GL_CND0_ATI),
+    offsetof(GLEnumPool,n_GL_DOT2_ADD_ATI),
+    offsetof(GLEnumPool,n_GL_SECONDARY_INTERPOLATOR_ATI),
+    offsetof(GLEnumPool,n_GL_NUM_FRAGMENT_REGISTERS_ATI),
+    offsetof(GLEnumPool,n_GL_NUM_FRAGMENT_CONSTANTS_ATI),
+    offsetof(GLEnumPool,n_GL_NUM_PASSES_ATI),
+    offsetof(GLEnumPool,n_GL_NUM_INSTRUCTIONS_PER_PASS_ATI),
+    offsetof(GLEnumPool,n_GL_NUM_INSTRUCTIONS_TOTAL_ATI),
+    offsetof(GLEnumPool,n_GL_NUM_INPUT_INTERPOLATOR_COMPONENTS_ATI),
+    offsetof(GLEnumPool,n_GL_NUM_LOOPBACK_COMPONENTS_ATI),
+    offsetof(GLEnumPool,n_GL_COLOR_ALPHA_PAIRING_ATI),
+    offsetof(GLEnumPool,n_GL_SWIZZLE_STR_ATI),
+    offsetof(GLEnumPool,n_GL_SWIZZLE_STQ_ATI),
+    offsetof(GLEnumPool,n_GL_SWIZZLE_STR_DR_ATI),
+    offsetof(GLEnumPool,n_GL_SWIZZLE_STQ_DQ_ATI),
+    offsetof(GLEnumPool,n_GL_SWIZZLE_STRQ_ATI),
+    offsetof(GLEnumPool,n_GL_SWIZZLE_STRQ_DQ_ATI),
+    offsetof(GLEnumPool,n_GL_INTERLACE_OML),
+    offsetof(GLEnumPool,n_GL_INTERLACE_READ_OML),
+    offsetof(GLEnumPool,n_GL_FORMAT_SUBSAMPLE_24_24_OML),
+    offsetof(GLEnumPool,n_GL_FORMAT_SUBSAMPLE_244_244_OML),
+    offsetof(GLEnumPool,n_GL_PACK_RESAMPLE_OML),
+    offsetof(GLEnumPool,n_GL_UNPACK_RESAMPLE_OML),
+    offsetof(GLEnumPool,n_GL_RESAMPLE_REPLICATE_OML),
+    offsetof(GLEnumPool,n_GL_RESAMPLE_ZERO_FILL_OML),
+    offsetof(GLEnumPool,n_GL_RESAMPLE_AVERAGE_OML),
+    offsetof(GLEnumPool,n_GL_RESAMPLE_DECIMATE_OML),
+    offsetof(GLEnumPool,n_GL_POINT_SIZE_ARRAY_TYPE_OES),
+    offsetof(GLEnumPool,n_GL_POINT_SIZE_ARRAY_STRIDE_OES),
+    offsetof(GLEnumPool,n_GL_POINT_SIZE_ARRAY_POINTER_OES),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_MAP1_APPLE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_MAP2_APPLE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_MAP1_SIZE_APPLE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_MAP1_COEFF_APPLE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_MAP1_ORDER_APPLE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_MAP1_DOMAIN_APPLE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_MAP2_SIZE_APPLE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_MAP2_COEFF_APPLE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_MAP2_ORDER_APPLE),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_MAP2_DOMAIN_APPLE),
+    offsetof(GLEnumPool,n_GL_DRAW_PIXELS_APPLE),
+    offsetof(GLEnumPool,n_GL_FENCE_APPLE),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_APPLE),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_TYPE_APPLE),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_POINTER_APPLE),
+    offsetof(GLEnumPool,n_GL_COLOR_FLOAT_APPLE),
+    offsetof(GLEnumPool,n_GL_MIN_PBUFFER_VIEWPORT_DIMS_APPLE),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BUFFER),
+    offsetof(GLEnumPool,n_GL_BUFFER_SERIALIZED_MODIFY_APPLE),
+    offsetof(GLEnumPool,n_GL_BUFFER_FLUSHING_UNMAP_APPLE),
+    offsetof(GLEnumPool,n_GL_AUX_DEPTH_STENCIL_APPLE),
+    offsetof(GLEnumPool,n_GL_PACK_ROW_BYTES_APPLE),
+    offsetof(GLEnumPool,n_GL_UNPACK_ROW_BYTES_APPLE),
+    offsetof(GLEnumPool,n_GL_RELEASED_APPLE),
+    offsetof(GLEnumPool,n_GL_VOLATILE_APPLE),
+    offsetof(GLEnumPool,n_GL_RETAINED_APPLE),
+    offsetof(GLEnumPool,n_GL_UNDEFINED_APPLE),
+    offsetof(GLEnumPool,n_GL_PURGEABLE_APPLE),
+    offsetof(GLEnumPool,n_GL_RGB_422_APPLE),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BUFFER_START),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_UNIFORM_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_UNIFORM_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_UNIFORM_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_UNIFORM_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_UNIFORM_BUFFER_BINDINGS),
+    offsetof(GLEnumPool,n_GL_MAX_UNIFORM_BLOCK_SIZE),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT),
+    offsetof(GLEnumPool,n_GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH),
+    offsetof(GLEnumPool,n_GL_ACTIVE_UNIFORM_BLOCKS),
+    offsetof(GLEnumPool,n_GL_UNIFORM_TYPE),
+    offsetof(GLEnumPool,n_GL_UNIFORM_SIZE),
+    offsetof(GLEnumPool,n_GL_UNIFORM_NAME_LENGTH),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_INDEX),
+    offsetof(GLEnumPool,n_GL_UNIFORM_OFFSET),
+    offsetof(GLEnumPool,n_GL_UNIFORM_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_UNIFORM_MATRIX_STRIDE),
+    offsetof(GLEnumPool,n_GL_UNIFORM_IS_ROW_MAJOR),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_BINDING),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_DATA_SIZE),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_NAME_LENGTH),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_REFERENCED_BY_GEOMETRY_SHADER),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SRGB_DECODE_EXT),
+    offsetof(GLEnumPool,n_GL_DECODE_EXT),
+    offsetof(GLEnumPool,n_GL_SKIP_DECODE_EXT),
+    offsetof(GLEnumPool,n_GL_PROGRAM_PIPELINE_OBJECT_EXT),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_SHADER_DISCARDS_SAMPLES_EXT),
+    offsetof(GLEnumPool,n_GL_SYNC_OBJECT_APPLE),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_SHADER),
+    offsetof(GLEnumPool,n_GL_VERTEX_SHADER),
+    offsetof(GLEnumPool,n_GL_PROGRAM_OBJECT_ARB),
+    offsetof(GLEnumPool,n_GL_SHADER_OBJECT_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_VARYING_FLOATS),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS),
+    offsetof(GLEnumPool,n_GL_OBJECT_TYPE_ARB),
+    offsetof(GLEnumPool,n_GL_SHADER_TYPE),
+    offsetof(GLEnumPool,n_GL_FLOAT_VEC2),
+    offsetof(GLEnumPool,n_GL_FLOAT_VEC3),
+    offsetof(GLEnumPool,n_GL_FLOAT_VEC4),
+    offsetof(GLEnumPool,n_GL_INT_VEC2),
+    offsetof(GLEnumPool,n_GL_INT_VEC3),
+    offsetof(GLEnumPool,n_GL_INT_VEC4),
+    offsetof(GLEnumPool,n_GL_BOOL),
+    offsetof(GLEnumPool,n_GL_BOOL_VEC2),
+    offsetof(GLEnumPool,n_GL_BOOL_VEC3),
+    offsetof(GLEnumPool,n_GL_BOOL_VEC4),
+    offsetof(GLEnumPool,n_GL_FLOAT_MAT2),
+    offsetof(GLEnumPool,n_GL_FLOAT_MAT3),
+    offsetof(GLEnumPool,n_GL_FLOAT_MAT4),
+    offsetof(GLEnumPool,n_GL_SAMPLER_1D),
+    offsetof(GLEnumPool,n_GL_SAMPLER_2D),
+    offsetof(GLEnumPool,n_GL_SAMPLER_3D),
+    offsetof(GLEnumPool,n_GL_SAMPLER_CUBE),
+    offsetof(GLEnumPool,n_GL_SAMPLER_1D_SHADOW),
+    offsetof(GLEnumPool,n_GL_SAMPLER_2D_SHADOW),
+    offsetof(GLEnumPool,n_GL_SAMPLER_2D_RECT),
+    offsetof(GLEnumPool,n_GL_SAMPLER_2D_RECT_SHADOW),
+    offsetof(GLEnumPool,n_GL_FLOAT_MAT2x3),
+    offsetof(GLEnumPool,n_GL_FLOAT_MAT2x4),
+    offsetof(GLEnumPool,n_GL_FLOAT_MAT3x2),
+    offsetof(GLEnumPool,n_GL_FLOAT_MAT3x4),
+    offsetof(GLEnumPool,n_GL_FLOAT_MAT4x2),
+    offsetof(GLEnumPool,n_GL_FLOAT_MAT4x3),
+    offsetof(GLEnumPool,n_GL_DELETE_STATUS),
+    offsetof(GLEnumPool,n_GL_COMPILE_STATUS),
+    offsetof(GLEnumPool,n_GL_LINK_STATUS),
+    offsetof(GLEnumPool,n_GL_VALIDATE_STATUS),
+    offsetof(GLEnumPool,n_GL_INFO_LOG_LENGTH),
+    offsetof(GLEnumPool,n_GL_ATTACHED_SHADERS),
+    offsetof(GLEnumPool,n_GL_ACTIVE_UNIFORMS),
+    offsetof(GLEnumPool,n_GL_ACTIVE_UNIFORM_MAX_LENGTH),
+    offsetof(GLEnumPool,n_GL_SHADER_SOURCE_LENGTH),
+    offsetof(GLEnumPool,n_GL_ACTIVE_ATTRIBUTES),
+    offsetof(GLEnumPool,n_GL_ACTIVE_ATTRIBUTE_MAX_LENGTH),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_SHADER_DERIVATIVE_HINT),
+    offsetof(GLEnumPool,n_GL_SHADING_LANGUAGE_VERSION),
+    offsetof(GLEnumPool,n_GL_CURRENT_PROGRAM),
+    offsetof(GLEnumPool,n_GL_PALETTE4_RGB8_OES),
+    offsetof(GLEnumPool,n_GL_PALETTE4_RGBA8_OES),
+    offsetof(GLEnumPool,n_GL_PALETTE4_R5_G6_B5_OES),
+    offsetof(GLEnumPool,n_GL_PALETTE4_RGBA4_OES),
+    offsetof(GLEnumPool,n_GL_PALETTE4_RGB5_A1_OES),
+    offsetof(GLEnumPool,n_GL_PALETTE8_RGB8_OES),
+    offsetof(GLEnumPool,n_GL_PALETTE8_RGBA8_OES),
+    offsetof(GLEnumPool,n_GL_PALETTE8_R5_G6_B5_OES),
+    offsetof(GLEnumPool,n_GL_PALETTE8_RGBA4_OES),
+    offsetof(GLEnumPool,n_GL_PALETTE8_RGB5_A1_OES),
+    offsetof(GLEnumPool,n_GL_IMPLEMENTATION_COLOR_READ_TYPE),
+    offsetof(GLEnumPool,n_GL_IMPLEMENTATION_COLOR_READ_FORMAT),
+    offsetof(GLEnumPool,n_GL_POINT_SIZE_ARRAY_OES),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CROP_RECT_OES),
+    offsetof(GLEnumPool,n_GL_MATRIX_INDEX_ARRAY_BUFFER_BINDING_OES),
+    offsetof(GLEnumPool,n_GL_POINT_SIZE_ARRAY_BUFFER_BINDING_OES),
+    offsetof(GLEnumPool,n_GL_COUNTER_TYPE_AMD),
+    offsetof(GLEnumPool,n_GL_COUNTER_RANGE_AMD),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT64_AMD),
+    offsetof(GLEnumPool,n_GL_PERCENTAGE_AMD),
+    offsetof(GLEnumPool,n_GL_PERFMON_RESULT_AVAILABLE_AMD),
+    offsetof(GLEnumPool,n_GL_PERFMON_RESULT_SIZE_AMD),
+    offsetof(GLEnumPool,n_GL_PERFMON_RESULT_AMD),
+    offsetof(GLEnumPool,n_GL_TEXTURE_WIDTH_QCOM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_HEIGHT_QCOM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_DEPTH_QCOM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_INTERNAL_FORMAT_QCOM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_FORMAT_QCOM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_TYPE_QCOM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_IMAGE_VALID_QCOM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_NUM_LEVELS_QCOM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_TARGET_QCOM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_OBJECT_VALID_QCOM),
+    offsetof(GLEnumPool,n_GL_STATE_RESTORE),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGB_PVRTC_4BPPV1_IMG),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGB_PVRTC_2BPPV1_IMG),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_PVRTC_4BPPV1_IMG),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_PVRTC_2BPPV1_IMG),
+    offsetof(GLEnumPool,n_GL_MODULATE_COLOR_IMG),
+    offsetof(GLEnumPool,n_GL_RECIP_ADD_SIGNED_ALPHA_IMG),
+    offsetof(GLEnumPool,n_GL_TEXTURE_ALPHA_MODULATE_IMG),
+    offsetof(GLEnumPool,n_GL_FACTOR_ALPHA_MODULATE_IMG),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_ALPHA_MODULATE_IMG),
+    offsetof(GLEnumPool,n_GL_ADD_BLEND_IMG),
+    offsetof(GLEnumPool,n_GL_SGX_BINARY_IMG),
+    offsetof(GLEnumPool,n_GL_TEXTURE_RED_TYPE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GREEN_TYPE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BLUE_TYPE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_ALPHA_TYPE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_LUMINANCE_TYPE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_INTENSITY_TYPE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_DEPTH_TYPE),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_NORMALIZED),
+    offsetof(GLEnumPool,n_GL_TEXTURE_1D_ARRAY),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_1D_ARRAY),
+    offsetof(GLEnumPool,n_GL_TEXTURE_2D_ARRAY),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_2D_ARRAY),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_1D_ARRAY),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_2D_ARRAY),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_PROGRAM_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_OUTPUT_VERTICES_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_TOTAL_OUTPUT_COMPONENTS_NV),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BUFFER),
+    offsetof(GLEnumPool,n_GL_MAX_TEXTURE_BUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_BUFFER),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BUFFER_DATA_STORE_BINDING),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BUFFER_FORMAT),
+    offsetof(GLEnumPool,n_GL_ANY_SAMPLES_PASSED),
+    offsetof(GLEnumPool,n_GL_SAMPLE_SHADING),
+    offsetof(GLEnumPool,n_GL_MIN_SAMPLE_SHADING_VALUE),
+    offsetof(GLEnumPool,n_GL_R11F_G11F_B10F),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_10F_11F_11F_REV),
+    offsetof(GLEnumPool,n_GL_RGBA_SIGNED_COMPONENTS_EXT),
+    offsetof(GLEnumPool,n_GL_RGB9_E5),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_5_9_9_9_REV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SHARED_SIZE),
+    offsetof(GLEnumPool,n_GL_SRGB),
+    offsetof(GLEnumPool,n_GL_SRGB8),
+    offsetof(GLEnumPool,n_GL_SRGB_ALPHA),
+    offsetof(GLEnumPool,n_GL_SRGB8_ALPHA8),
+    offsetof(GLEnumPool,n_GL_SLUMINANCE_ALPHA),
+    offsetof(GLEnumPool,n_GL_SLUMINANCE8_ALPHA8),
+    offsetof(GLEnumPool,n_GL_SLUMINANCE),
+    offsetof(GLEnumPool,n_GL_SLUMINANCE8),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB_ALPHA),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SLUMINANCE),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SLUMINANCE_ALPHA),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB_S3TC_DXT1_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_LUMINANCE_LATC1_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SIGNED_LUMINANCE_LATC1_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_LUMINANCE_ALPHA_LATC2_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SIGNED_LUMINANCE_ALPHA_LATC2_EXT),
+    offsetof(GLEnumPool,n_GL_TESS_CONTROL_PROGRAM_PARAMETER_BUFFER_NV),
+    offsetof(GLEnumPool,n_GL_TESS_EVALUATION_PROGRAM_PARAMETER_BUFFER_NV),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_VARYING_MAX_LENGTH),
+    offsetof(GLEnumPool,n_GL_BACK_PRIMARY_COLOR_NV),
+    offsetof(GLEnumPool,n_GL_BACK_SECONDARY_COLOR_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_NV),
+    offsetof(GLEnumPool,n_GL_CLIP_DISTANCE_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ID_NV),
+    offsetof(GLEnumPool,n_GL_PRIMITIVE_ID_NV),
+    offsetof(GLEnumPool,n_GL_GENERIC_ATTRIB_NV),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_ATTRIBS_NV),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_BUFFER_MODE),
+    offsetof(GLEnumPool,n_GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_ACTIVE_VARYINGS_NV),
+    offsetof(GLEnumPool,n_GL_ACTIVE_VARYING_MAX_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_VARYINGS),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_BUFFER_START),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_BUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_RECORD_NV),
+    offsetof(GLEnumPool,n_GL_PRIMITIVES_GENERATED),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN),
+    offsetof(GLEnumPool,n_GL_RASTERIZER_DISCARD),
+    offsetof(GLEnumPool,n_GL_MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS),
+    offsetof(GLEnumPool,n_GL_INTERLEAVED_ATTRIBS),
+    offsetof(GLEnumPool,n_GL_SEPARATE_ATTRIBS),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_BUFFER),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_ATC_RGB_AMD),
+    offsetof(GLEnumPool,n_GL_ATC_RGBA_EXPLICIT_ALPHA_AMD),
+    offsetof(GLEnumPool,n_GL_POINT_SPRITE_COORD_ORIGIN),
+    offsetof(GLEnumPool,n_GL_LOWER_LEFT),
+    offsetof(GLEnumPool,n_GL_UPPER_LEFT),
+    offsetof(GLEnumPool,n_GL_STENCIL_BACK_REF),
+    offsetof(GLEnumPool,n_GL_STENCIL_BACK_VALUE_MASK),
+    offsetof(GLEnumPool,n_GL_STENCIL_BACK_WRITEMASK),
+    offsetof(GLEnumPool,n_GL_DRAW_FRAMEBUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_READ_FRAMEBUFFER),
+    offsetof(GLEnumPool,n_GL_DRAW_FRAMEBUFFER),
+    offsetof(GLEnumPool,n_GL_READ_FRAMEBUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_SAMPLES),
+    offsetof(GLEnumPool,n_GL_DEPTH_COMPONENT32F),
+    offsetof(GLEnumPool,n_GL_DEPTH32F_STENCIL8),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_COMPLETE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_INCOMPLETE_DIMENSIONS_EXT),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_INCOMPLETE_FORMATS_EXT),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_INCOMPLETE_DRAW_BUFFER),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_INCOMPLETE_READ_BUFFER),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_UNSUPPORTED),
+    offsetof(GLEnumPool,n_GL_MAX_COLOR_ATTACHMENTS),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT0),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT1),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT2),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT3),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT4),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT5),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT6),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT7),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT8),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT9),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT10),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT11),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT12),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT13),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT14),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT15),
+    offsetof(GLEnumPool,n_GL_DEPTH_ATTACHMENT),
+    offsetof(GLEnumPool,n_GL_STENCIL_ATTACHMENT),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_WIDTH),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_HEIGHT),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_INTERNAL_FORMAT),
+    offsetof(GLEnumPool,n_GL_STENCIL_INDEX1),
+    offsetof(GLEnumPool,n_GL_STENCIL_INDEX4),
+    offsetof(GLEnumPool,n_GL_STENCIL_INDEX8),
+    offsetof(GLEnumPool,n_GL_STENCIL_INDEX16),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_RED_SIZE),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_GREEN_SIZE),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_BLUE_SIZE),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_ALPHA_SIZE),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_DEPTH_SIZE),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_STENCIL_SIZE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_MAX_SAMPLES),
+    offsetof(GLEnumPool,n_GL_TEXTURE_GEN_STR_OES),
+    offsetof(GLEnumPool,n_GL_HALF_FLOAT_OES),
+    offsetof(GLEnumPool,n_GL_RGB565),
+    offsetof(GLEnumPool,n_GL_ETC1_RGB8_OES),
+    offsetof(GLEnumPool,n_GL_TEXTURE_EXTERNAL_OES),
+    offsetof(GLEnumPool,n_GL_SAMPLER_EXTERNAL_OES),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_EXTERNAL_OES),
+    offsetof(GLEnumPool,n_GL_REQUIRED_TEXTURE_IMAGE_UNITS_OES),
+    offsetof(GLEnumPool,n_GL_PRIMITIVE_RESTART_FIXED_INDEX),
+    offsetof(GLEnumPool,n_GL_ANY_SAMPLES_PASSED_CONSERVATIVE),
+    offsetof(GLEnumPool,n_GL_MAX_ELEMENT_INDEX),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SAMPLES_EXT),
+    offsetof(GLEnumPool,n_GL_RGBA32UI),
+    offsetof(GLEnumPool,n_GL_RGB32UI),
+    offsetof(GLEnumPool,n_GL_ALPHA32UI_EXT),
+    offsetof(GLEnumPool,n_GL_INTENSITY32UI_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE32UI_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA32UI_EXT),
+    offsetof(GLEnumPool,n_GL_RGBA16UI),
+    offsetof(GLEnumPool,n_GL_RGB16UI),
+    offsetof(GLEnumPool,n_GL_ALPHA16UI_EXT),
+    offsetof(GLEnumPool,n_GL_INTENSITY16UI_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16UI_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA16UI_EXT),
+    offsetof(GLEnumPool,n_GL_RGBA8UI),
+    offsetof(GLEnumPool,n_GL_RGB8UI),
+    offsetof(GLEnumPool,n_GL_ALPHA8UI_EXT),
+    offsetof(GLEnumPool,n_GL_INTENSITY8UI_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE8UI_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA8UI_EXT),
+    offsetof(GLEnumPool,n_GL_RGBA32I),
+    offsetof(GLEnumPool,n_GL_RGB32I),
+    offsetof(GLEnumPool,n_GL_ALPHA32I_EXT),
+    offsetof(GLEnumPool,n_GL_INTENSITY32I_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE32I_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA32I_EXT),
+    offsetof(GLEnumPool,n_GL_RGBA16I),
+    offsetof(GLEnumPool,n_GL_RGB16I),
+    offsetof(GLEnumPool,n_GL_ALPHA16I_EXT),
+    offsetof(GLEnumPool,n_GL_INTENSITY16I_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16I_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA16I_EXT),
+    offsetof(GLEnumPool,n_GL_RGBA8I),
+    offsetof(GLEnumPool,n_GL_RGB8I),
+    offsetof(GLEnumPool,n_GL_ALPHA8I_EXT),
+    offsetof(GLEnumPool,n_GL_INTENSITY8I_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE8I_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA8I_EXT),
+    offsetof(GLEnumPool,n_GL_RED_INTEGER),
+    offsetof(GLEnumPool,n_GL_GREEN_INTEGER),
+    offsetof(GLEnumPool,n_GL_BLUE_INTEGER),
+    offsetof(GLEnumPool,n_GL_ALPHA_INTEGER),
+    offsetof(GLEnumPool,n_GL_RGB_INTEGER),
+    offsetof(GLEnumPool,n_GL_RGBA_INTEGER),
+    offsetof(GLEnumPool,n_GL_BGR_INTEGER),
+    offsetof(GLEnumPool,n_GL_BGRA_INTEGER),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_INTEGER_EXT),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA_INTEGER_EXT),
+    offsetof(GLEnumPool,n_GL_RGBA_INTEGER_MODE_EXT),
+    offsetof(GLEnumPool,n_GL_INT_2_10_10_10_REV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_PARAMETER_BUFFER_BINDINGS_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_PARAMETER_BUFFER_SIZE_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_PROGRAM_PARAMETER_BUFFER_NV),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_PROGRAM_PARAMETER_BUFFER_NV),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_PROGRAM_PARAMETER_BUFFER_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_GENERIC_ATTRIBS_NV),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_GENERIC_RESULTS_NV),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_LAYERED),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_INCOMPLETE_LAYER_COUNT_ARB),
+    offsetof(GLEnumPool,n_GL_DEPTH_COMPONENT32F_NV),
+    offsetof(GLEnumPool,n_GL_DEPTH32F_STENCIL8_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT_32_UNSIGNED_INT_24_8_REV),
+    offsetof(GLEnumPool,n_GL_SHADER_INCLUDE_ARB),
+    offsetof(GLEnumPool,n_GL_DEPTH_BUFFER_FLOAT_MODE_NV),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_SRGB),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_SRGB_CAPABLE_EXT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RED_RGTC1),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SIGNED_RED_RGTC1),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RG_RGTC2),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SIGNED_RG_RGTC2),
+    offsetof(GLEnumPool,n_GL_SAMPLER_1D_ARRAY),
+    offsetof(GLEnumPool,n_GL_SAMPLER_2D_ARRAY),
+    offsetof(GLEnumPool,n_GL_SAMPLER_BUFFER),
+    offsetof(GLEnumPool,n_GL_SAMPLER_1D_ARRAY_SHADOW),
+    offsetof(GLEnumPool,n_GL_SAMPLER_2D_ARRAY_SHADOW),
+    offsetof(GLEnumPool,n_GL_SAMPLER_CUBE_SHADOW),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_VEC2),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_VEC3),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_VEC4),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_1D),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_2D),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_3D),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_CUBE),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_2D_RECT),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_1D_ARRAY),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_2D_ARRAY),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_BUFFER),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_1D),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_2D),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_3D),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_CUBE),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_2D_RECT),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_1D_ARRAY),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_2D_ARRAY),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_BUFFER),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_SHADER),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_VERTICES_OUT_ARB),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_INPUT_TYPE_ARB),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_OUTPUT_TYPE_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_VARYING_COMPONENTS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_VARYING_COMPONENTS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_OUTPUT_VERTICES),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_BINDABLE_UNIFORMS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_BINDABLE_UNIFORMS_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_BINDABLE_UNIFORMS_EXT),
+    offsetof(GLEnumPool,n_GL_ACTIVE_SUBROUTINES),
+    offsetof(GLEnumPool,n_GL_ACTIVE_SUBROUTINE_UNIFORMS),
+    offsetof(GLEnumPool,n_GL_MAX_SUBROUTINES),
+    offsetof(GLEnumPool,n_GL_MAX_SUBROUTINE_UNIFORM_LOCATIONS),
+    offsetof(GLEnumPool,n_GL_NAMED_STRING_LENGTH_ARB),
+    offsetof(GLEnumPool,n_GL_NAMED_STRING_TYPE_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_BINDABLE_UNIFORM_SIZE_EXT),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BUFFER_EXT),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BUFFER_BINDING_EXT),
+    offsetof(GLEnumPool,n_GL_LOW_FLOAT),
+    offsetof(GLEnumPool,n_GL_MEDIUM_FLOAT),
+    offsetof(GLEnumPool,n_GL_HIGH_FLOAT),
+    offsetof(GLEnumPool,n_GL_LOW_INT),
+    offsetof(GLEnumPool,n_GL_MEDIUM_INT),
+    offsetof(GLEnumPool,n_GL_HIGH_INT),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_10_10_10_2_OES),
+    offsetof(GLEnumPool,n_GL_INT_10_10_10_2_OES),
+    offsetof(GLEnumPool,n_GL_SHADER_BINARY_FORMATS),
+    offsetof(GLEnumPool,n_GL_NUM_SHADER_BINARY_FORMATS),
+    offsetof(GLEnumPool,n_GL_SHADER_COMPILER),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_UNIFORM_VECTORS),
+    offsetof(GLEnumPool,n_GL_MAX_VARYING_VECTORS),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_UNIFORM_VECTORS),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_COLOR_SAMPLES_NV),
+    offsetof(GLEnumPool,n_GL_MAX_MULTISAMPLE_COVERAGE_MODES_NV),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_COVERAGE_MODES_NV),
+    offsetof(GLEnumPool,n_GL_QUERY_WAIT),
+    offsetof(GLEnumPool,n_GL_QUERY_NO_WAIT),
+    offsetof(GLEnumPool,n_GL_QUERY_BY_REGION_WAIT),
+    offsetof(GLEnumPool,n_GL_QUERY_BY_REGION_NO_WAIT),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_COLOR_SAMPLES_NV),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_BUFFER_PAUSED),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_BUFFER_ACTIVE),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_BINDING),
+    offsetof(GLEnumPool,n_GL_FRAME_NV),
+    offsetof(GLEnumPool,n_GL_FIELDS_NV),
+    offsetof(GLEnumPool,n_GL_TIMESTAMP),
+    offsetof(GLEnumPool,n_GL_NUM_FILL_STREAMS_NV),
+    offsetof(GLEnumPool,n_GL_PRESENT_TIME_NV),
+    offsetof(GLEnumPool,n_GL_PRESENT_DURATION_NV),
+    offsetof(GLEnumPool,n_GL_DEPTH_COMPONENT16_NONLINEAR_NV),
+    offsetof(GLEnumPool,n_GL_PROGRAM_MATRIX_EXT),
+    offsetof(GLEnumPool,n_GL_TRANSPOSE_PROGRAM_MATRIX_EXT),
+    offsetof(GLEnumPool,n_GL_PROGRAM_MATRIX_STACK_DEPTH_EXT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SWIZZLE_R),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SWIZZLE_G),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SWIZZLE_B),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SWIZZLE_A),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SWIZZLE_RGBA),
+    offsetof(GLEnumPool,n_GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS),
+    offsetof(GLEnumPool,n_GL_ACTIVE_SUBROUTINE_MAX_LENGTH),
+    offsetof(GLEnumPool,n_GL_ACTIVE_SUBROUTINE_UNIFORM_MAX_LENGTH),
+    offsetof(GLEnumPool,n_GL_NUM_COMPATIBLE_SUBROUTINES),
+    offsetof(GLEnumPool,n_GL_COMPATIBLE_SUBROUTINES),
+    offsetof(GLEnumPool,n_GL_QUADS_FOLLOW_PROVOKING_VERTEX_CONVENTION),
+    offsetof(GLEnumPool,n_GL_FIRST_VERTEX_CONVENTION),
+    offsetof(GLEnumPool,n_GL_LAST_VERTEX_CONVENTION),
+    offsetof(GLEnumPool,n_GL_PROVOKING_VERTEX),
+    offsetof(GLEnumPool,n_GL_SAMPLE_POSITION),
+    offsetof(GLEnumPool,n_GL_SAMPLE_MASK),
+    offsetof(GLEnumPool,n_GL_SAMPLE_MASK_VALUE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_RENDERBUFFER_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_RENDERBUFFER_DATA_STORE_BINDING_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_RENDERBUFFER_NV),
+    offsetof(GLEnumPool,n_GL_SAMPLER_RENDERBUFFER_NV),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_RENDERBUFFER_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_RENDERBUFFER_NV),
+    offsetof(GLEnumPool,n_GL_MAX_SAMPLE_MASK_WORDS),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_SHADER_INVOCATIONS),
+    offsetof(GLEnumPool,n_GL_MIN_FRAGMENT_INTERPOLATION_OFFSET),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_INTERPOLATION_OFFSET),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_INTERPOLATION_OFFSET_BITS),
+    offsetof(GLEnumPool,n_GL_MIN_PROGRAM_TEXTURE_GATHER_OFFSET),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_TEXTURE_GATHER_OFFSET),
+    offsetof(GLEnumPool,n_GL_MAX_TRANSFORM_FEEDBACK_BUFFERS),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_STREAMS),
+    offsetof(GLEnumPool,n_GL_PATCH_VERTICES),
+    offsetof(GLEnumPool,n_GL_PATCH_DEFAULT_INNER_LEVEL),
+    offsetof(GLEnumPool,n_GL_PATCH_DEFAULT_OUTER_LEVEL),
+    offsetof(GLEnumPool,n_GL_TESS_CONTROL_OUTPUT_VERTICES),
+    offsetof(GLEnumPool,n_GL_TESS_GEN_MODE),
+    offsetof(GLEnumPool,n_GL_TESS_GEN_SPACING),
+    offsetof(GLEnumPool,n_GL_TESS_GEN_VERTEX_ORDER),
+    offsetof(GLEnumPool,n_GL_TESS_GEN_POINT_MODE),
+    offsetof(GLEnumPool,n_GL_ISOLINES),
+    offsetof(GLEnumPool,n_GL_FRACTIONAL_ODD),
+    offsetof(GLEnumPool,n_GL_FRACTIONAL_EVEN),
+    offsetof(GLEnumPool,n_GL_MAX_PATCH_VERTICES),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_GEN_LEVEL),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_PATCH_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_TESS_EVALUATION_SHADER),
+    offsetof(GLEnumPool,n_GL_TESS_CONTROL_SHADER),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_BPTC_UNORM),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT),
+    offsetof(GLEnumPool,n_GL_COVERAGE_COMPONENT_NV),
+    offsetof(GLEnumPool,n_GL_COVERAGE_COMPONENT4_NV),
+    offsetof(GLEnumPool,n_GL_COVERAGE_ATTACHMENT_NV),
+    offsetof(GLEnumPool,n_GL_COVERAGE_BUFFERS_NV),
+    offsetof(GLEnumPool,n_GL_COVERAGE_ALL_FRAGMENTS_NV),
+    offsetof(GLEnumPool,n_GL_COVERAGE_EDGE_FRAGMENTS_NV),
+    offsetof(GLEnumPool,n_GL_COVERAGE_AUTOMATIC_NV),
+    offsetof(GLEnumPool,n_GL_BUFFER_GPU_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_UNIFIED_NV),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_UNIFIED_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_INDEX_ARRAY_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_EDGE_FLAG_ARRAY_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_ARRAY_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_FOG_COORD_ARRAY_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ATTRIB_ARRAY_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_INDEX_ARRAY_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_EDGE_FLAG_ARRAY_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_ARRAY_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_FOG_COORD_ARRAY_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_ELEMENT_ARRAY_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_GPU_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_MAX_SHADER_BUFFER_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_COPY_READ_BUFFER),
+    offsetof(GLEnumPool,n_GL_COPY_WRITE_BUFFER),
+    offsetof(GLEnumPool,n_GL_MAX_IMAGE_UNITS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_IMAGE_UNITS_AND_FRAGMENT_OUTPUTS),
+    offsetof(GLEnumPool,n_GL_IMAGE_BINDING_NAME),
+    offsetof(GLEnumPool,n_GL_IMAGE_BINDING_LEVEL),
+    offsetof(GLEnumPool,n_GL_IMAGE_BINDING_LAYERED),
+    offsetof(GLEnumPool,n_GL_IMAGE_BINDING_LAYER),
+    offsetof(GLEnumPool,n_GL_IMAGE_BINDING_ACCESS),
+    offsetof(GLEnumPool,n_GL_DRAW_INDIRECT_BUFFER),
+    offsetof(GLEnumPool,n_GL_DRAW_INDIRECT_UNIFIED_NV),
+    offsetof(GLEnumPool,n_GL_DRAW_INDIRECT_ADDRESS_NV),
+    offsetof(GLEnumPool,n_GL_DRAW_INDIRECT_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_DRAW_INDIRECT_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_DOUBLE_MAT2),
+    offsetof(GLEnumPool,n_GL_DOUBLE_MAT3),
+    offsetof(GLEnumPool,n_GL_DOUBLE_MAT4),
+    offsetof(GLEnumPool,n_GL_DOUBLE_MAT2x3),
+    offsetof(GLEnumPool,n_GL_DOUBLE_MAT2x4),
+    offsetof(GLEnumPool,n_GL_DOUBLE_MAT3x2),
+    offsetof(GLEnumPool,n_GL_DOUBLE_MAT3x4),
+    offsetof(GLEnumPool,n_GL_DOUBLE_MAT4x2),
+    offsetof(GLEnumPool,n_GL_DOUBLE_MAT4x3),
+    offsetof(GLEnumPool,n_GL_MALI_SHADER_BINARY_ARM),
+    offsetof(GLEnumPool,n_GL_MALI_PROGRAM_BINARY_ARM),
+    offsetof(GLEnumPool,n_GL_RED_SNORM),
+    offsetof(GLEnumPool,n_GL_RG_SNORM),
+    offsetof(GLEnumPool,n_GL_RGB_SNORM),
+    offsetof(GLEnumPool,n_GL_RGBA_SNORM),
+    offsetof(GLEnumPool,n_GL_R8_SNORM),
+    offsetof(GLEnumPool,n_GL_RG8_SNORM),
+    offsetof(GLEnumPool,n_GL_RGB8_SNORM),
+    offsetof(GLEnumPool,n_GL_RGBA8_SNORM),
+    offsetof(GLEnumPool,n_GL_R16_SNORM),
+    offsetof(GLEnumPool,n_GL_RG16_SNORM),
+    offsetof(GLEnumPool,n_GL_RGB16_SNORM),
+    offsetof(GLEnumPool,n_GL_RGBA16_SNORM),
+    offsetof(GLEnumPool,n_GL_SIGNED_NORMALIZED),
+    offsetof(GLEnumPool,n_GL_PRIMITIVE_RESTART),
+    offsetof(GLEnumPool,n_GL_PRIMITIVE_RESTART_INDEX),
+    offsetof(GLEnumPool,n_GL_MAX_PROGRAM_TEXTURE_GATHER_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_PERFMON_GLOBAL_MODE_QCOM),
+    offsetof(GLEnumPool,n_GL_BINNING_CONTROL_HINT_QCOM),
+    offsetof(GLEnumPool,n_GL_CPU_OPTIMIZED_QCOM),
+    offsetof(GLEnumPool,n_GL_GPU_OPTIMIZED_QCOM),
+    offsetof(GLEnumPool,n_GL_RENDER_DIRECT_TO_FRAMEBUFFER_QCOM),
+    offsetof(GLEnumPool,n_GL_GPU_DISJOINT_EXT),
+    offsetof(GLEnumPool,n_GL_SHADER_BINARY_VIV),
+    offsetof(GLEnumPool,n_GL_INT8_NV),
+    offsetof(GLEnumPool,n_GL_INT8_VEC2_NV),
+    offsetof(GLEnumPool,n_GL_INT8_VEC3_NV),
+    offsetof(GLEnumPool,n_GL_INT8_VEC4_NV),
+    offsetof(GLEnumPool,n_GL_INT16_NV),
+    offsetof(GLEnumPool,n_GL_INT16_VEC2_NV),
+    offsetof(GLEnumPool,n_GL_INT16_VEC3_NV),
+    offsetof(GLEnumPool,n_GL_INT16_VEC4_NV),
+    offsetof(GLEnumPool,n_GL_INT64_VEC2_NV),
+    offsetof(GLEnumPool,n_GL_INT64_VEC3_NV),
+    offsetof(GLEnumPool,n_GL_INT64_VEC4_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT8_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT8_VEC2_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT8_VEC3_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT8_VEC4_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT16_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT16_VEC2_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT16_VEC3_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT16_VEC4_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT64_VEC2_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT64_VEC3_NV),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT64_VEC4_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT16_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT16_VEC2_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT16_VEC3_NV),
+    offsetof(GLEnumPool,n_GL_FLOAT16_VEC4_NV),
+    offsetof(GLEnumPool,n_GL_DOUBLE_VEC2),
+    offsetof(GLEnumPool,n_GL_DOUBLE_VEC3),
+    offsetof(GLEnumPool,n_GL_DOUBLE_VEC4),
+    offsetof(GLEnumPool,n_GL_SAMPLER_BUFFER_AMD),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_BUFFER_AMD),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_BUFFER_AMD),
+    offsetof(GLEnumPool,n_GL_TESSELLATION_MODE_AMD),
+    offsetof(GLEnumPool,n_GL_TESSELLATION_FACTOR_AMD),
+    offsetof(GLEnumPool,n_GL_DISCRETE_AMD),
+    offsetof(GLEnumPool,n_GL_CONTINUOUS_AMD),
+    offsetof(GLEnumPool,n_GL_TEXTURE_CUBE_MAP_ARRAY),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_CUBE_MAP_ARRAY),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_CUBE_MAP_ARRAY),
+    offsetof(GLEnumPool,n_GL_SAMPLER_CUBE_MAP_ARRAY),
+    offsetof(GLEnumPool,n_GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_CUBE_MAP_ARRAY),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY),
+    offsetof(GLEnumPool,n_GL_ALPHA_SNORM),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_SNORM),
+    offsetof(GLEnumPool,n_GL_LUMINANCE_ALPHA_SNORM),
+    offsetof(GLEnumPool,n_GL_INTENSITY_SNORM),
+    offsetof(GLEnumPool,n_GL_ALPHA8_SNORM),
+    offsetof(GLEnumPool,n_GL_LUMINANCE8_SNORM),
+    offsetof(GLEnumPool,n_GL_LUMINANCE8_ALPHA8_SNORM),
+    offsetof(GLEnumPool,n_GL_INTENSITY8_SNORM),
+    offsetof(GLEnumPool,n_GL_ALPHA16_SNORM),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16_SNORM),
+    offsetof(GLEnumPool,n_GL_LUMINANCE16_ALPHA16_SNORM),
+    offsetof(GLEnumPool,n_GL_INTENSITY16_SNORM),
+    offsetof(GLEnumPool,n_GL_FACTOR_MIN_AMD),
+    offsetof(GLEnumPool,n_GL_FACTOR_MAX_AMD),
+    offsetof(GLEnumPool,n_GL_DEPTH_CLAMP_NEAR_AMD),
+    offsetof(GLEnumPool,n_GL_DEPTH_CLAMP_FAR_AMD),
+    offsetof(GLEnumPool,n_GL_VIDEO_BUFFER_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_BUFFER_BINDING_NV),
+    offsetof(GLEnumPool,n_GL_FIELD_UPPER_NV),
+    offsetof(GLEnumPool,n_GL_FIELD_LOWER_NV),
+    offsetof(GLEnumPool,n_GL_NUM_VIDEO_CAPTURE_STREAMS_NV),
+    offsetof(GLEnumPool,n_GL_NEXT_VIDEO_CAPTURE_BUFFER_STATUS_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_CAPTURE_TO_422_SUPPORTED_NV),
+    offsetof(GLEnumPool,n_GL_LAST_VIDEO_CAPTURE_STATUS_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_BUFFER_PITCH_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_COLOR_CONVERSION_MATRIX_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_COLOR_CONVERSION_MAX_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_COLOR_CONVERSION_MIN_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_COLOR_CONVERSION_OFFSET_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_BUFFER_INTERNAL_FORMAT_NV),
+    offsetof(GLEnumPool,n_GL_PARTIAL_SUCCESS_NV),
+    offsetof(GLEnumPool,n_GL_SUCCESS_NV),
+    offsetof(GLEnumPool,n_GL_FAILURE_NV),
+    offsetof(GLEnumPool,n_GL_YCBYCR8_422_NV),
+    offsetof(GLEnumPool,n_GL_YCBAYCR8A_4224_NV),
+    offsetof(GLEnumPool,n_GL_Z6Y10Z6CB10Z6Y10Z6CR10_422_NV),
+    offsetof(GLEnumPool,n_GL_Z6Y10Z6CB10Z6A10Z6Y10Z6CR10Z6A10_4224_NV),
+    offsetof(GLEnumPool,n_GL_Z4Y12Z4CB12Z4Y12Z4CR12_422_NV),
+    offsetof(GLEnumPool,n_GL_Z4Y12Z4CB12Z4A12Z4Y12Z4CR12Z4A12_4224_NV),
+    offsetof(GLEnumPool,n_GL_Z4Y12Z4CB12Z4CR12_444_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_CAPTURE_FRAME_WIDTH_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_CAPTURE_FRAME_HEIGHT_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_CAPTURE_FIELD_UPPER_HEIGHT_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_CAPTURE_FIELD_LOWER_HEIGHT_NV),
+    offsetof(GLEnumPool,n_GL_VIDEO_CAPTURE_SURFACE_ORIGIN_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COVERAGE_SAMPLES_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COLOR_SAMPLES_NV),
+    offsetof(GLEnumPool,n_GL_GPU_MEMORY_INFO_DEDICATED_VIDMEM_NVX),
+    offsetof(GLEnumPool,n_GL_GPU_MEMORY_INFO_TOTAL_AVAILABLE_MEMORY_NVX),
+    offsetof(GLEnumPool,n_GL_GPU_MEMORY_INFO_CURRENT_AVAILABLE_VIDMEM_NVX),
+    offsetof(GLEnumPool,n_GL_GPU_MEMORY_INFO_EVICTION_COUNT_NVX),
+    offsetof(GLEnumPool,n_GL_GPU_MEMORY_INFO_EVICTED_MEMORY_NVX),
+    offsetof(GLEnumPool,n_GL_IMAGE_1D),
+    offsetof(GLEnumPool,n_GL_IMAGE_2D),
+    offsetof(GLEnumPool,n_GL_IMAGE_3D),
+    offsetof(GLEnumPool,n_GL_IMAGE_2D_RECT),
+    offsetof(GLEnumPool,n_GL_IMAGE_CUBE),
+    offsetof(GLEnumPool,n_GL_IMAGE_BUFFER),
+    offsetof(GLEnumPool,n_GL_IMAGE_1D_ARRAY),
+    offsetof(GLEnumPool,n_GL_IMAGE_2D_ARRAY),
+    offsetof(GLEnumPool,n_GL_IMAGE_CUBE_MAP_ARRAY),
+    offsetof(GLEnumPool,n_GL_IMAGE_2D_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_IMAGE_2D_MULTISAMPLE_ARRAY),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_1D),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_2D),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_3D),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_2D_RECT),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_CUBE),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_BUFFER),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_1D_ARRAY),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_2D_ARRAY),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_CUBE_MAP_ARRAY),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_2D_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_INT_IMAGE_2D_MULTISAMPLE_ARRAY),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_1D),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_2D),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_3D),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_2D_RECT),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_CUBE),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_BUFFER),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_1D_ARRAY),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_2D_ARRAY),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE_ARRAY),
+    offsetof(GLEnumPool,n_GL_MAX_IMAGE_SAMPLES),
+    offsetof(GLEnumPool,n_GL_IMAGE_BINDING_FORMAT),
+    offsetof(GLEnumPool,n_GL_RGB10_A2UI),
+    offsetof(GLEnumPool,n_GL_PATH_FORMAT_SVG_NV),
+    offsetof(GLEnumPool,n_GL_PATH_FORMAT_PS_NV),
+    offsetof(GLEnumPool,n_GL_STANDARD_FONT_NAME_NV),
+    offsetof(GLEnumPool,n_GL_SYSTEM_FONT_NAME_NV),
+    offsetof(GLEnumPool,n_GL_FILE_NAME_NV),
+    offsetof(GLEnumPool,n_GL_PATH_STROKE_WIDTH_NV),
+    offsetof(GLEnumPool,n_GL_PATH_END_CAPS_NV),
+    offsetof(GLEnumPool,n_GL_PATH_INITIAL_END_CAP_NV),
+    offsetof(GLEnumPool,n_GL_PATH_TERMINAL_END_CAP_NV),
+    offsetof(GLEnumPool,n_GL_PATH_JOIN_STYLE_NV),
+    offsetof(GLEnumPool,n_GL_PATH_MITER_LIMIT_NV),
+    offsetof(GLEnumPool,n_GL_PATH_DASH_CAPS_NV),
+    offsetof(GLEnumPool,n_GL_PATH_INITIAL_DASH_CAP_NV),
+    offsetof(GLEnumPool,n_GL_PATH_TERMINAL_DASH_CAP_NV),
+    offsetof(GLEnumPool,n_GL_PATH_DASH_OFFSET_NV),
+    offsetof(GLEnumPool,n_GL_PATH_CLIENT_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_PATH_FILL_MODE_NV),
+    offsetof(GLEnumPool,n_GL_PATH_FILL_MASK_NV),
+    offsetof(GLEnumPool,n_GL_PATH_FILL_COVER_MODE_NV),
+    offsetof(GLEnumPool,n_GL_PATH_STROKE_COVER_MODE_NV),
+    offsetof(GLEnumPool,n_GL_PATH_STROKE_MASK_NV),
+    offsetof(GLEnumPool,n_GL_COUNT_UP_NV),
+    offsetof(GLEnumPool,n_GL_COUNT_DOWN_NV),
+    offsetof(GLEnumPool,n_GL_PATH_OBJECT_BOUNDING_BOX_NV),
+    offsetof(GLEnumPool,n_GL_CONVEX_HULL_NV),
+    offsetof(GLEnumPool,n_GL_BOUNDING_BOX_NV),
+    offsetof(GLEnumPool,n_GL_TRANSLATE_X_NV),
+    offsetof(GLEnumPool,n_GL_TRANSLATE_Y_NV),
+    offsetof(GLEnumPool,n_GL_TRANSLATE_2D_NV),
+    offsetof(GLEnumPool,n_GL_TRANSLATE_3D_NV),
+    offsetof(GLEnumPool,n_GL_AFFINE_2D_NV),
+    offsetof(GLEnumPool,n_GL_AFFINE_3D_NV),
+    offsetof(GLEnumPool,n_GL_TRANSPOSE_AFFINE_2D_NV),
+    offsetof(GLEnumPool,n_GL_TRANSPOSE_AFFINE_3D_NV),
+    offsetof(GLEnumPool,n_GL_UTF8_NV),
+    offsetof(GLEnumPool,n_GL_UTF16_NV),
+    offsetof(GLEnumPool,n_GL_BOUNDING_BOX_OF_BOUNDING_BOXES_NV),
+    offsetof(GLEnumPool,n_GL_PATH_COMMAND_COUNT_NV),
+    offsetof(GLEnumPool,n_GL_PATH_COORD_COUNT_NV),
+    offsetof(GLEnumPool,n_GL_PATH_DASH_ARRAY_COUNT_NV),
+    offsetof(GLEnumPool,n_GL_PATH_COMPUTED_LENGTH_NV),
+    offsetof(GLEnumPool,n_GL_PATH_FILL_BOUNDING_BOX_NV),
+    offsetof(GLEnumPool,n_GL_PATH_STROKE_BOUNDING_BOX_NV),
+    offsetof(GLEnumPool,n_GL_SQUARE_NV),
+    offsetof(GLEnumPool,n_GL_ROUND_NV),
+    offsetof(GLEnumPool,n_GL_TRIANGULAR_NV),
+    offsetof(GLEnumPool,n_GL_BEVEL_NV),
+    offsetof(GLEnumPool,n_GL_MITER_REVERT_NV),
+    offsetof(GLEnumPool,n_GL_MITER_TRUNCATE_NV),
+    offsetof(GLEnumPool,n_GL_SKIP_MISSING_GLYPH_NV),
+    offsetof(GLEnumPool,n_GL_USE_MISSING_GLYPH_NV),
+    offsetof(GLEnumPool,n_GL_PATH_ERROR_POSITION_NV),
+    offsetof(GLEnumPool,n_GL_PATH_FOG_GEN_MODE_NV),
+    offsetof(GLEnumPool,n_GL_ACCUM_ADJACENT_PAIRS_NV),
+    offsetof(GLEnumPool,n_GL_ADJACENT_PAIRS_NV),
+    offsetof(GLEnumPool,n_GL_FIRST_TO_REST_NV),
+    offsetof(GLEnumPool,n_GL_PATH_GEN_MODE_NV),
+    offsetof(GLEnumPool,n_GL_PATH_GEN_COEFF_NV),
+    offsetof(GLEnumPool,n_GL_PATH_GEN_COLOR_FORMAT_NV),
+    offsetof(GLEnumPool,n_GL_PATH_GEN_COMPONENTS_NV),
+    offsetof(GLEnumPool,n_GL_PATH_DASH_OFFSET_RESET_NV),
+    offsetof(GLEnumPool,n_GL_MOVE_TO_RESETS_NV),
+    offsetof(GLEnumPool,n_GL_MOVE_TO_CONTINUES_NV),
+    offsetof(GLEnumPool,n_GL_PATH_STENCIL_FUNC_NV),
+    offsetof(GLEnumPool,n_GL_PATH_STENCIL_REF_NV),
+    offsetof(GLEnumPool,n_GL_PATH_STENCIL_VALUE_MASK_NV),
+    offsetof(GLEnumPool,n_GL_SCALED_RESOLVE_FASTEST_EXT),
+    offsetof(GLEnumPool,n_GL_SCALED_RESOLVE_NICEST_EXT),
+    offsetof(GLEnumPool,n_GL_MIN_MAP_BUFFER_ALIGNMENT),
+    offsetof(GLEnumPool,n_GL_PATH_STENCIL_DEPTH_OFFSET_FACTOR_NV),
+    offsetof(GLEnumPool,n_GL_PATH_STENCIL_DEPTH_OFFSET_UNITS_NV),
+    offsetof(GLEnumPool,n_GL_PATH_COVER_DEPTH_FUNC_NV),
+    offsetof(GLEnumPool,n_GL_IMAGE_FORMAT_COMPATIBILITY_TYPE),
+    offsetof(GLEnumPool,n_GL_IMAGE_FORMAT_COMPATIBILITY_BY_SIZE),
+    offsetof(GLEnumPool,n_GL_IMAGE_FORMAT_COMPATIBILITY_BY_CLASS),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_IMAGE_UNIFORMS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_IMAGE_UNIFORMS),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_IMAGE_UNIFORMS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_IMAGE_UNIFORMS),
+    offsetof(GLEnumPool,n_GL_MAX_DEEP_3D_TEXTURE_WIDTH_HEIGHT_NV),
+    offsetof(GLEnumPool,n_GL_MAX_DEEP_3D_TEXTURE_DEPTH_NV),
+    offsetof(GLEnumPool,n_GL_SHADER_STORAGE_BUFFER),
+    offsetof(GLEnumPool,n_GL_SHADER_STORAGE_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_SHADER_STORAGE_BUFFER_START),
+    offsetof(GLEnumPool,n_GL_SHADER_STORAGE_BUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS),
+    offsetof(GLEnumPool,n_GL_MAX_SHADER_STORAGE_BLOCK_SIZE),
+    offsetof(GLEnumPool,n_GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT),
+    offsetof(GLEnumPool,n_GL_SYNC_X11_FENCE_EXT),
+    offsetof(GLEnumPool,n_GL_DEPTH_STENCIL_TEXTURE_MODE),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK_REFERENCED_BY_COMPUTE_SHADER),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_COMPUTE_SHADER),
+    offsetof(GLEnumPool,n_GL_DISPATCH_INDIRECT_BUFFER),
+    offsetof(GLEnumPool,n_GL_DISPATCH_INDIRECT_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_COLOR_ATTACHMENT_EXT),
+    offsetof(GLEnumPool,n_GL_MULTIVIEW_EXT),
+    offsetof(GLEnumPool,n_GL_MAX_MULTIVIEW_BUFFERS_EXT),
+    offsetof(GLEnumPool,n_GL_CONTEXT_ROBUST_ACCESS_EXT),
+    offsetof(GLEnumPool,n_GL_3DVISION_STEREO_NV),
+    offsetof(GLEnumPool,n_GL_STEREO_SEPARATION_NV),
+    offsetof(GLEnumPool,n_GL_STEREO_CONVERGENCE_NV),
+    offsetof(GLEnumPool,n_GL_STEREO_CUTOFF_NV),
+    offsetof(GLEnumPool,n_GL_STEREO_PROJECTION_NV),
+    offsetof(GLEnumPool,n_GL_STEREO_PROJECTION_PERSPECTIVE_NV),
+    offsetof(GLEnumPool,n_GL_STEREO_PROJECTION_ORTHO_NV),
+    offsetof(GLEnumPool,n_GL_COMPUTE_PROGRAM_NV),
+    offsetof(GLEnumPool,n_GL_COMPUTE_PROGRAM_PARAMETER_BUFFER_NV),
+    offsetof(GLEnumPool,n_GL_TEXTURE_2D_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_2D_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_2D_MULTISAMPLE_ARRAY),
+    offsetof(GLEnumPool,n_GL_PROXY_TEXTURE_2D_MULTISAMPLE_ARRAY),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_2D_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SAMPLES),
+    offsetof(GLEnumPool,n_GL_TEXTURE_FIXED_SAMPLE_LOCATIONS),
+    offsetof(GLEnumPool,n_GL_SAMPLER_2D_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_2D_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE),
+    offsetof(GLEnumPool,n_GL_SAMPLER_2D_MULTISAMPLE_ARRAY),
+    offsetof(GLEnumPool,n_GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY),
+    offsetof(GLEnumPool,n_GL_MAX_COLOR_TEXTURE_SAMPLES),
+    offsetof(GLEnumPool,n_GL_MAX_DEPTH_TEXTURE_SAMPLES),
+    offsetof(GLEnumPool,n_GL_MAX_INTEGER_SAMPLES),
+    offsetof(GLEnumPool,n_GL_MAX_SERVER_WAIT_TIMEOUT),
+    offsetof(GLEnumPool,n_GL_OBJECT_TYPE),
+    offsetof(GLEnumPool,n_GL_SYNC_CONDITION),
+    offsetof(GLEnumPool,n_GL_SYNC_STATUS),
+    offsetof(GLEnumPool,n_GL_SYNC_FLAGS),
+    offsetof(GLEnumPool,n_GL_SYNC_FENCE),
+    offsetof(GLEnumPool,n_GL_SYNC_GPU_COMMANDS_COMPLETE),
+    offsetof(GLEnumPool,n_GL_UNSIGNALED),
+    offsetof(GLEnumPool,n_GL_SIGNALED),
+    offsetof(GLEnumPool,n_GL_ALREADY_SIGNALED),
+    offsetof(GLEnumPool,n_GL_TIMEOUT_EXPIRED),
+    offsetof(GLEnumPool,n_GL_CONDITION_SATISFIED),
+    offsetof(GLEnumPool,n_GL_WAIT_FAILED),
+    offsetof(GLEnumPool,n_GL_BUFFER_ACCESS_FLAGS),
+    offsetof(GLEnumPool,n_GL_BUFFER_MAP_LENGTH),
+    offsetof(GLEnumPool,n_GL_BUFFER_MAP_OFFSET),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_OUTPUT_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_INPUT_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_OUTPUT_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_INPUT_COMPONENTS),
+    offsetof(GLEnumPool,n_GL_CONTEXT_PROFILE_MASK),
+    offsetof(GLEnumPool,n_GL_UNPACK_COMPRESSED_BLOCK_WIDTH),
+    offsetof(GLEnumPool,n_GL_UNPACK_COMPRESSED_BLOCK_HEIGHT),
+    offsetof(GLEnumPool,n_GL_UNPACK_COMPRESSED_BLOCK_DEPTH),
+    offsetof(GLEnumPool,n_GL_UNPACK_COMPRESSED_BLOCK_SIZE),
+    offsetof(GLEnumPool,n_GL_PACK_COMPRESSED_BLOCK_WIDTH),
+    offsetof(GLEnumPool,n_GL_PACK_COMPRESSED_BLOCK_HEIGHT),
+    offsetof(GLEnumPool,n_GL_PACK_COMPRESSED_BLOCK_DEPTH),
+    offsetof(GLEnumPool,n_GL_PACK_COMPRESSED_BLOCK_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_IMMUTABLE_FORMAT),
+    offsetof(GLEnumPool,n_GL_SGX_PROGRAM_BINARY_IMG),
+    offsetof(GLEnumPool,n_GL_RENDERBUFFER_SAMPLES_IMG),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_IMG),
+    offsetof(GLEnumPool,n_GL_MAX_SAMPLES_IMG),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SAMPLES_IMG),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_PVRTC_2BPPV2_IMG),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_PVRTC_4BPPV2_IMG),
+    offsetof(GLEnumPool,n_GL_MAX_DEBUG_MESSAGE_LENGTH),
+    offsetof(GLEnumPool,n_GL_MAX_DEBUG_LOGGED_MESSAGES),
+    offsetof(GLEnumPool,n_GL_DEBUG_LOGGED_MESSAGES),
+    offsetof(GLEnumPool,n_GL_DEBUG_SEVERITY_HIGH),
+    offsetof(GLEnumPool,n_GL_DEBUG_SEVERITY_MEDIUM),
+    offsetof(GLEnumPool,n_GL_DEBUG_SEVERITY_LOW),
+    offsetof(GLEnumPool,n_GL_DEBUG_CATEGORY_API_ERROR_AMD),
+    offsetof(GLEnumPool,n_GL_DEBUG_CATEGORY_WINDOW_SYSTEM_AMD),
+    offsetof(GLEnumPool,n_GL_DEBUG_CATEGORY_DEPRECATION_AMD),
+    offsetof(GLEnumPool,n_GL_DEBUG_CATEGORY_UNDEFINED_BEHAVIOR_AMD),
+    offsetof(GLEnumPool,n_GL_DEBUG_CATEGORY_PERFORMANCE_AMD),
+    offsetof(GLEnumPool,n_GL_DEBUG_CATEGORY_SHADER_COMPILER_AMD),
+    offsetof(GLEnumPool,n_GL_DEBUG_CATEGORY_APPLICATION_AMD),
+    offsetof(GLEnumPool,n_GL_DEBUG_CATEGORY_OTHER_AMD),
+    offsetof(GLEnumPool,n_GL_DATA_BUFFER_AMD),
+    offsetof(GLEnumPool,n_GL_PERFORMANCE_MONITOR_AMD),
+    offsetof(GLEnumPool,n_GL_QUERY_OBJECT_AMD),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_OBJECT_AMD),
+    offsetof(GLEnumPool,n_GL_SAMPLER_OBJECT_AMD),
+    offsetof(GLEnumPool,n_GL_EXTERNAL_VIRTUAL_MEMORY_BUFFER_AMD),
+    offsetof(GLEnumPool,n_GL_QUERY_BUFFER),
+    offsetof(GLEnumPool,n_GL_QUERY_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_QUERY_RESULT_NO_WAIT),
+    offsetof(GLEnumPool,n_GL_VIRTUAL_PAGE_SIZE_X_AMD),
+    offsetof(GLEnumPool,n_GL_VIRTUAL_PAGE_SIZE_Y_AMD),
+    offsetof(GLEnumPool,n_GL_VIRTUAL_PAGE_SIZE_Z_AMD),
+    offsetof(GLEnumPool,n_GL_MAX_SPARSE_TEXTURE_SIZE_AMD),
+    offsetof(GLEnumPool,n_GL_MAX_SPARSE_3D_TEXTURE_SIZE_AMD),
+    offsetof(GLEnumPool,n_GL_MAX_SPARSE_ARRAY_TEXTURE_LAYERS),
+    offsetof(GLEnumPool,n_GL_MIN_SPARSE_LEVEL_AMD),
+    offsetof(GLEnumPool,n_GL_MIN_LOD_WARNING_AMD),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BUFFER_OFFSET),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT),
+    offsetof(GLEnumPool,n_GL_VERTEX_ELEMENT_SWIZZLE_AMD),
+    offsetof(GLEnumPool,n_GL_VERTEX_ID_SWIZZLE_AMD),
+    offsetof(GLEnumPool,n_GL_TEXTURE_SPARSE_ARB),
+    offsetof(GLEnumPool,n_GL_VIRTUAL_PAGE_SIZE_INDEX_ARB),
+    offsetof(GLEnumPool,n_GL_NUM_VIRTUAL_PAGE_SIZES_ARB),
+    offsetof(GLEnumPool,n_GL_SPARSE_TEXTURE_FULL_ARRAY_CUBE_MIPMAPS_ARB),
+    offsetof(GLEnumPool,n_GL_NUM_SPARSE_LEVELS_ARB),
+    offsetof(GLEnumPool,n_GL_COMPUTE_SHADER),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_UNIFORM_BLOCKS),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_IMAGE_UNIFORMS),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_WORK_GROUP_COUNT),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_WORK_GROUP_SIZE),
+    offsetof(GLEnumPool,n_GL_SHADER_BINARY_DMP),
+    offsetof(GLEnumPool,n_GL_GCCSO_SHADER_BINARY_FJ),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_R11_EAC),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SIGNED_R11_EAC),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RG11_EAC),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SIGNED_RG11_EAC),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGB8_ETC2),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ETC2),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA8_ETC2_EAC),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC),
+    offsetof(GLEnumPool,n_GL_BLEND_PREMULTIPLIED_SRC_NV),
+    offsetof(GLEnumPool,n_GL_BLEND_OVERLAP_NV),
+    offsetof(GLEnumPool,n_GL_UNCORRELATED_NV),
+    offsetof(GLEnumPool,n_GL_DISJOINT_NV),
+    offsetof(GLEnumPool,n_GL_CONJOINT_NV),
+    offsetof(GLEnumPool,n_GL_BLEND_ADVANCED_COHERENT_NV),
+    offsetof(GLEnumPool,n_GL_SRC_NV),
+    offsetof(GLEnumPool,n_GL_DST_NV),
+    offsetof(GLEnumPool,n_GL_SRC_OVER_NV),
+    offsetof(GLEnumPool,n_GL_DST_OVER_NV),
+    offsetof(GLEnumPool,n_GL_SRC_IN_NV),
+    offsetof(GLEnumPool,n_GL_DST_IN_NV),
+    offsetof(GLEnumPool,n_GL_SRC_OUT_NV),
+    offsetof(GLEnumPool,n_GL_DST_OUT_NV),
+    offsetof(GLEnumPool,n_GL_SRC_ATOP_NV),
+    offsetof(GLEnumPool,n_GL_DST_ATOP_NV),
+    offsetof(GLEnumPool,n_GL_PLUS_NV),
+    offsetof(GLEnumPool,n_GL_PLUS_DARKER_NV),
+    offsetof(GLEnumPool,n_GL_MULTIPLY_NV),
+    offsetof(GLEnumPool,n_GL_SCREEN_NV),
+    offsetof(GLEnumPool,n_GL_OVERLAY_NV),
+    offsetof(GLEnumPool,n_GL_DARKEN_NV),
+    offsetof(GLEnumPool,n_GL_LIGHTEN_NV),
+    offsetof(GLEnumPool,n_GL_COLORDODGE_NV),
+    offsetof(GLEnumPool,n_GL_COLORBURN_NV),
+    offsetof(GLEnumPool,n_GL_HARDLIGHT_NV),
+    offsetof(GLEnumPool,n_GL_SOFTLIGHT_NV),
+    offsetof(GLEnumPool,n_GL_DIFFERENCE_NV),
+    offsetof(GLEnumPool,n_GL_MINUS_NV),
+    offsetof(GLEnumPool,n_GL_EXCLUSION_NV),
+    offsetof(GLEnumPool,n_GL_CONTRAST_NV),
+    offsetof(GLEnumPool,n_GL_INVERT_RGB_NV),
+    offsetof(GLEnumPool,n_GL_LINEARDODGE_NV),
+    offsetof(GLEnumPool,n_GL_LINEARBURN_NV),
+    offsetof(GLEnumPool,n_GL_VIVIDLIGHT_NV),
+    offsetof(GLEnumPool,n_GL_LINEARLIGHT_NV),
+    offsetof(GLEnumPool,n_GL_PINLIGHT_NV),
+    offsetof(GLEnumPool,n_GL_HARDMIX_NV),
+    offsetof(GLEnumPool,n_GL_HSL_HUE_NV),
+    offsetof(GLEnumPool,n_GL_HSL_SATURATION_NV),
+    offsetof(GLEnumPool,n_GL_HSL_COLOR_NV),
+    offsetof(GLEnumPool,n_GL_HSL_LUMINOSITY_NV),
+    offsetof(GLEnumPool,n_GL_PLUS_CLAMPED_NV),
+    offsetof(GLEnumPool,n_GL_PLUS_CLAMPED_ALPHA_NV),
+    offsetof(GLEnumPool,n_GL_MINUS_CLAMPED_NV),
+    offsetof(GLEnumPool,n_GL_INVERT_OVG_NV),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_START),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_DATA_SIZE),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTERS),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTER_INDICES),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_VERTEX_SHADER),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_CONTROL_SHADER),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_EVALUATION_SHADER),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_GEOMETRY_SHADER),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_FRAGMENT_SHADER),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_ATOMIC_COUNTER_BUFFERS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_ATOMIC_COUNTER_BUFFERS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_ATOMIC_COUNTER_BUFFERS),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_ATOMIC_COUNTERS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS),
+    offsetof(GLEnumPool,n_GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS),
+    offsetof(GLEnumPool,n_GL_MAX_GEOMETRY_ATOMIC_COUNTERS),
+    offsetof(GLEnumPool,n_GL_MAX_FRAGMENT_ATOMIC_COUNTERS),
+    offsetof(GLEnumPool,n_GL_MAX_COMBINED_ATOMIC_COUNTERS),
+    offsetof(GLEnumPool,n_GL_MAX_ATOMIC_COUNTER_BUFFER_SIZE),
+    offsetof(GLEnumPool,n_GL_ACTIVE_ATOMIC_COUNTER_BUFFERS),
+    offsetof(GLEnumPool,n_GL_UNIFORM_ATOMIC_COUNTER_BUFFER_INDEX),
+    offsetof(GLEnumPool,n_GL_UNSIGNED_INT_ATOMIC_COUNTER),
+    offsetof(GLEnumPool,n_GL_MAX_ATOMIC_COUNTER_BUFFER_BINDINGS),
+    offsetof(GLEnumPool,n_GL_DEBUG_OUTPUT),
+    offsetof(GLEnumPool,n_GL_UNIFORM),
+    offsetof(GLEnumPool,n_GL_UNIFORM_BLOCK),
+    offsetof(GLEnumPool,n_GL_PROGRAM_INPUT),
+    offsetof(GLEnumPool,n_GL_PROGRAM_OUTPUT),
+    offsetof(GLEnumPool,n_GL_BUFFER_VARIABLE),
+    offsetof(GLEnumPool,n_GL_SHADER_STORAGE_BLOCK),
+    offsetof(GLEnumPool,n_GL_IS_PER_PATCH),
+    offsetof(GLEnumPool,n_GL_VERTEX_SUBROUTINE),
+    offsetof(GLEnumPool,n_GL_TESS_CONTROL_SUBROUTINE),
+    offsetof(GLEnumPool,n_GL_TESS_EVALUATION_SUBROUTINE),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_SUBROUTINE),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_SUBROUTINE),
+    offsetof(GLEnumPool,n_GL_COMPUTE_SUBROUTINE),
+    offsetof(GLEnumPool,n_GL_VERTEX_SUBROUTINE_UNIFORM),
+    offsetof(GLEnumPool,n_GL_TESS_CONTROL_SUBROUTINE_UNIFORM),
+    offsetof(GLEnumPool,n_GL_TESS_EVALUATION_SUBROUTINE_UNIFORM),
+    offsetof(GLEnumPool,n_GL_GEOMETRY_SUBROUTINE_UNIFORM),
+    offsetof(GLEnumPool,n_GL_FRAGMENT_SUBROUTINE_UNIFORM),
+    offsetof(GLEnumPool,n_GL_COMPUTE_SUBROUTINE_UNIFORM),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_VARYING),
+    offsetof(GLEnumPool,n_GL_ACTIVE_RESOURCES),
+    offsetof(GLEnumPool,n_GL_MAX_NAME_LENGTH),
+    offsetof(GLEnumPool,n_GL_MAX_NUM_ACTIVE_VARIABLES),
+    offsetof(GLEnumPool,n_GL_MAX_NUM_COMPATIBLE_SUBROUTINES),
+    offsetof(GLEnumPool,n_GL_NAME_LENGTH),
+    offsetof(GLEnumPool,n_GL_TYPE),
+    offsetof(GLEnumPool,n_GL_ARRAY_SIZE),
+    offsetof(GLEnumPool,n_GL_OFFSET),
+    offsetof(GLEnumPool,n_GL_BLOCK_INDEX),
+    offsetof(GLEnumPool,n_GL_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_MATRIX_STRIDE),
+    offsetof(GLEnumPool,n_GL_IS_ROW_MAJOR),
+    offsetof(GLEnumPool,n_GL_ATOMIC_COUNTER_BUFFER_INDEX),
+    offsetof(GLEnumPool,n_GL_BUFFER_BINDING),
+    offsetof(GLEnumPool,n_GL_BUFFER_DATA_SIZE),
+    offsetof(GLEnumPool,n_GL_NUM_ACTIVE_VARIABLES),
+    offsetof(GLEnumPool,n_GL_ACTIVE_VARIABLES),
+    offsetof(GLEnumPool,n_GL_REFERENCED_BY_VERTEX_SHADER),
+    offsetof(GLEnumPool,n_GL_REFERENCED_BY_TESS_CONTROL_SHADER),
+    offsetof(GLEnumPool,n_GL_REFERENCED_BY_TESS_EVALUATION_SHADER),
+    offsetof(GLEnumPool,n_GL_REFERENCED_BY_GEOMETRY_SHADER),
+    offsetof(GLEnumPool,n_GL_REFERENCED_BY_FRAGMENT_SHADER),
+    offsetof(GLEnumPool,n_GL_REFERENCED_BY_COMPUTE_SHADER),
+    offsetof(GLEnumPool,n_GL_TOP_LEVEL_ARRAY_SIZE),
+    offsetof(GLEnumPool,n_GL_TOP_LEVEL_ARRAY_STRIDE),
+    offsetof(GLEnumPool,n_GL_LOCATION),
+    offsetof(GLEnumPool,n_GL_LOCATION_INDEX),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_DEFAULT_WIDTH),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_DEFAULT_HEIGHT),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_DEFAULT_LAYERS),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_DEFAULT_SAMPLES),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS),
+    offsetof(GLEnumPool,n_GL_MAX_FRAMEBUFFER_WIDTH),
+    offsetof(GLEnumPool,n_GL_MAX_FRAMEBUFFER_HEIGHT),
+    offsetof(GLEnumPool,n_GL_MAX_FRAMEBUFFER_LAYERS),
+    offsetof(GLEnumPool,n_GL_MAX_FRAMEBUFFER_SAMPLES),
+    offsetof(GLEnumPool,n_GL_LOG_ERROR_REGAL),
+    offsetof(GLEnumPool,n_GL_LOG_WARNING_REGAL),
+    offsetof(GLEnumPool,n_GL_LOG_INFO_REGAL),
+    offsetof(GLEnumPool,n_GL_LOG_APP_REGAL),
+    offsetof(GLEnumPool,n_GL_LOG_DRIVER_REGAL),
+    offsetof(GLEnumPool,n_GL_LOG_INTERNAL_REGAL),
+    offsetof(GLEnumPool,n_GL_LOG_DEBUG_REGAL),
+    offsetof(GLEnumPool,n_GL_LOG_STATUS_REGAL),
+    offsetof(GLEnumPool,n_GL_LOG_HTTP_REGAL),
+    offsetof(GLEnumPool,n_GL_ERROR_REGAL),
+    offsetof(GLEnumPool,n_GL_DEBUG_REGAL),
+    offsetof(GLEnumPool,n_GL_LOG_REGAL),
+    offsetof(GLEnumPool,n_GL_EMULATION_REGAL),
+    offsetof(GLEnumPool,n_GL_DRIVER_REGAL),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_VARIABLE_GROUP_INVOCATIONS_ARB),
+    offsetof(GLEnumPool,n_GL_MAX_COMPUTE_VARIABLE_GROUP_SIZE_ARB),
+    offsetof(GLEnumPool,n_GL_LOCATION_COMPONENT),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_BUFFER_INDEX),
+    offsetof(GLEnumPool,n_GL_TRANSFORM_FEEDBACK_BUFFER_STRIDE),
+    offsetof(GLEnumPool,n_GL_MISSING_REGAL),
+    offsetof(GLEnumPool,n_GL_TRACE_REGAL),
+    offsetof(GLEnumPool,n_GL_CACHE_REGAL),
+    offsetof(GLEnumPool,n_GL_CODE_REGAL),
+    offsetof(GLEnumPool,n_GL_STATISTICS_REGAL),
+    offsetof(GLEnumPool,n_GL_CLEAR_TEXTURE),
+    offsetof(GLEnumPool,n_GL_NUM_SAMPLE_COUNTS),
+    offsetof(GLEnumPool,n_GL_TRANSLATED_SHADER_SOURCE_LENGTH_ANGLE),
+    offsetof(GLEnumPool,n_GL_BGRA8_EXT),
+    offsetof(GLEnumPool,n_GL_TEXTURE_USAGE_ANGLE),
+    offsetof(GLEnumPool,n_GL_FRAMEBUFFER_ATTACHMENT_ANGLE),
+    offsetof(GLEnumPool,n_GL_PACK_REVERSE_ROW_ORDER_ANGLE),
+    offsetof(GLEnumPool,n_GL_PROGRAM_BINARY_ANGLE),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_4x4_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_5x4_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_5x5_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_6x5_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_6x6_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_8x5_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_8x6_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_8x8_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_10x5_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_10x6_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_10x8_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_10x10_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_12x10_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_RGBA_ASTC_12x12_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10_KHR),
+    offsetof(GLEnumPool,n_GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12_KHR),
+    offsetof(GLEnumPool,n_GL_STENCIL_BUFFER_BIT0_QCOM),
+    offsetof(GLEnumPool,n_GL_RASTER_POSITION_UNCLIPPED_IBM),
+    offsetof(GLEnumPool,n_GL_CULL_VERTEX_IBM),
+    offsetof(GLEnumPool,n_GL_ALL_STATIC_DATA_IBM),
+    offsetof(GLEnumPool,n_GL_STATIC_VERTEX_ARRAY_IBM),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_LIST_IBM),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY_LIST_IBM),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_LIST_IBM),
+    offsetof(GLEnumPool,n_GL_INDEX_ARRAY_LIST_IBM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_LIST_IBM),
+    offsetof(GLEnumPool,n_GL_EDGE_FLAG_ARRAY_LIST_IBM),
+    offsetof(GLEnumPool,n_GL_FOG_COORDINATE_ARRAY_LIST_IBM),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_ARRAY_LIST_IBM),
+    offsetof(GLEnumPool,n_GL_VERTEX_ARRAY_LIST_STRIDE_IBM),
+    offsetof(GLEnumPool,n_GL_NORMAL_ARRAY_LIST_STRIDE_IBM),
+    offsetof(GLEnumPool,n_GL_COLOR_ARRAY_LIST_STRIDE_IBM),
+    offsetof(GLEnumPool,n_GL_INDEX_ARRAY_LIST_STRIDE_IBM),
+    offsetof(GLEnumPool,n_GL_TEXTURE_COORD_ARRAY_LIST_STRIDE_IBM),
+    offsetof(GLEnumPool,n_GL_EDGE_FLAG_ARRAY_LIST_STRIDE_IBM),
+    offsetof(GLEnumPool,n_GL_FOG_COORDINATE_ARRAY_LIST_STRIDE_IBM),
+    offsetof(GLEnumPool,n_GL_SECONDARY_COLOR_ARRAY_LIST_STRIDE_IBM),
+    offsetof(GLEnumPool,n_GL_PREFER_DOUBLEBUFFER_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_CONSERVE_MEMORY_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_RECLAIM_MEMORY_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_NATIVE_GRAPHICS_HANDLE_PGI),
+    offsetof(GLEnumPool,n_GL_NATIVE_GRAPHICS_BEGIN_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_NATIVE_GRAPHICS_END_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_ALWAYS_FAST_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_ALWAYS_SOFT_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_ALLOW_DRAW_OBJ_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_ALLOW_DRAW_WIN_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_ALLOW_DRAW_FRG_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_ALLOW_DRAW_MEM_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_STRICT_DEPTHFUNC_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_STRICT_LIGHTING_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_STRICT_SCISSOR_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_FULL_STIPPLE_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_CLIP_NEAR_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_CLIP_FAR_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_WIDE_LINE_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_BACK_NORMALS_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_VERTEX_DATA_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_VERTEX_CONSISTENT_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_MATERIAL_SIDE_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_MAX_VERTEX_HINT_PGI),
+    offsetof(GLEnumPool,n_GL_STENCIL_BUFFER_BIT1_QCOM),
+    offsetof(GLEnumPool,n_GL_STENCIL_BUFFER_BIT2_QCOM),
+    offsetof(GLEnumPool,n_GL_STENCIL_BUFFER_BIT3_QCOM),
+    offsetof(GLEnumPool,n_GL_ALL_ATTRIB_BITS),
+    offsetof(GLEnumPool,n_GL_STENCIL_BUFFER_BIT4_QCOM),
+    offsetof(GLEnumPool,n_GL_STENCIL_BUFFER_BIT5_QCOM),
+    offsetof(GLEnumPool,n_GL_STENCIL_BUFFER_BIT6_QCOM),
+    offsetof(GLEnumPool,n_GL_STENCIL_BUFFER_BIT7_QCOM),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_BUFFER_BIT0_QCOM),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_BUFFER_BIT1_QCOM),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_BUFFER_BIT2_QCOM),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_BUFFER_BIT3_QCOM),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_BUFFER_BIT4_QCOM),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_BIT_3DFX),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_BUFFER_BIT6_QCOM),
+    offsetof(GLEnumPool,n_GL_MULTISAMPLE_BUFFER_BIT7_QCOM),
+    offsetof(GLEnumPool,n_GL_INVALID_INDEX)
+  };
+
+  const short glEnumSeed[3313] = {
+    -5, 3, -8, 1, 0, -12, -15, 0, -16, 0, 4, 0, -17, -19, 0, 0,
+    0, -22, -27, 1, 6, -28, -29, 0, -34, 1, 0, 0, 0, 1, 1, 3,
+    8, 0, 0, -37, 0, -39, 0, -42, -45, 0, 1, -46, 0, 0, -49, -53,
+    0, 1, 1, 1, 0, 5, -58, -59, 0, 0, 0, -61, 0, 0, -62, -66,
+    0, 0, -69, -71, 0, 13, -73, -74, -81, 0, -82, -89, 1, 5, -93, 1,
+    0, 0, 4, -96, -97, -103, -105, 3, 0, 4, -107, 1, 0, -108, -109, -117,
+    0, 0, 1, -119, 10, 1, -120, 9, 0, 0, 0, 0, 0, 4, 0, -121,
+    -123, 1, 0, -124, 0, 1, 0, -126, 0, 2, 0, 0, 1, 0, -128, 0,
+    1, 14, -134, -136, -138, 0, -141, 0, 1, 0, 1, -142, 0, 0, 0, -147,
+    5, -149, 0, 6, 0, -151, 0, -154, 1, 0, 0, 0, 0, -155, -156, 0,
+    8, -157, -159, 1, 0, 0, 4, 1, -160, -166, -167, 7, 0, 1, -173, 0,
+    -175, 4, -176, 9, 0, 5, -181, 0, 0, 4, 0, 1, 0, -185, 0, -187,
+    -189, -190, -191, 2, -197, -205, -206, 0, -207, 0, 0, 0, 0, -208, 7, 0,
+    0, 5, 0, -209, 9, -211, 0, 1, 0, -215, -220, 0, -227, -231, 11, 0,
+    0, -236, 0, -243, 2, 0, -244, 0, -245, 0, -249, 0, 0, -250, -261, 0,
+    1, -263, 0, 0, 0, -264, 1, 3, 0, -267, -271, -272, -274, 0, 2, 1,
+    4, 3, -278, -279, 0, 4, 0, 0, -288, 1, 0, -296, 1, -302, 0, 0,
+    -309, -313, -315, -318, -321, 0, -326, 0, -331, 4, 0, -337, -346, -349, -352, 0,
+    -353, 1, -354, 7, 15, -355, 1, -356, -358, -359, -360, -362, 1, 0, 0, 7,
+    -364, 17, -371, 1, 0, 26, 0, 1, 0, -381, 0, 17, -383, 0, 2, 1,
+    -384, -386, 10, 3, -387, 0, 2, -390, -391, 0, 1, 3, -392, 16, -394, 1,
+    0, 2, -396, 2, -403, 0, 2, 0, 8, -405, -407, -416, 0, -422, 1, 0,
+    0, 0, 0, 0, -428, 0, 0, 0, 2, 0, -429, -430, -431, 3, 1, -435,
+    -438, -440, 0, 21, -441, 8, -446, 1, -447, -449, -452, 3, 0, 1, 0, 0,
+    1, 0, 0, 4, -461, 0, 0, 0, 3, 0, -462, 0, 0, 15, -463, 1,
+    -466, 1, 0, -468, 0, 18, 0, -471, 1, -475, 4, 0, 16, -476, 1, 0,
+    -477, -478, -481, 4, 1, 0, 0, -482, 25, -484, -486, 0, 0, 0, -488, 1,
+    3, -489, 0, 0, 2, -490, 1, 0, 0, -494, 1, 3, -496, 0, 0, -499,
+    0, -500, 1, 0, 5, -504, -506, 6, -508, 2, -511, 1, 0, 0, 0, 0,
+    -512, 0, 2, 0, -513, 1, -515, -516, -517, -520, 0, 0, -524, 0, -525, 0,
+    0, 0, 0, 0, -529, -530, 14, 1, 0, 0, 0, -532, -533, 0, 13, 0,
+    10, -538, 0, 0, 8, -539, -540, 0, 0, 0, -541, 0, -543, -544, 0, 0,
+    -545, -546, 0, 0, 0, -547, -553, -555, -561, -563, 0, 0, 0, 2, 1, 2,
+    0, -565, -566, 0, 0, 0, -568, 2, -569, 0, -570, 0, 0, 3, 0, 0,
+    0, 0, 1, 2, -571, -572, 2, 8, 0, -580, 0, -581, -582, -584, -586, -590,
+    0, 5, -596, -597, 0, -598, 1, 0, 0, 0, 0, 0, -600, -602, 0, -603,
+    1, -607, -610, 0, 0, 0, -614, 0, 1, 0, 2, -615, 0, -616, 6, -619,
+    -622, -624, 7, 0, 0, 0, 1, 0, 27, 0, 0, -626, 0, 0, 0, 9,
+    -630, 0, -631, -636, -642, 0, 0, 0, 1, 0, -643, -644, 8, 0, -645, -646,
+    4, 0, -648, 8, 0, -650, 0, 0, 1, 1, -651, 0, 0, -655, 0, -658,
+    0, 0, 0, 0, 0, -660, -663, 0, -664, -667, 0, -671, 3, -675, 0, -683,
+    3, 0, 1, -685, -689, 1, 0, 0, -695, 0, 0, -697, -698, -700, 0, -701,
+    6, -702, 0, 0, 9, 1, 0, 2, 2, 9, 0, 5, -703, -705, 15, -708,
+    0, 4, 0, -711, 1, -712, 0, 8, 0, 0, -717, 0, 0, 0, 0, 1,
+    0, 33, -718, 0, 1, -722, 0, 0, -724, -725, 7, -727, 0, 0, 2, 5,
+    -728, -729, 1, 0, 0, 3, 0, 0, 0, -731, -733, -734, 0, 6, 0, 5,
+    0, 10, -735, 0, 0, 0, 1, 1, 0, 0, 0, -740, -741, -742, 3, 1,
+    -745, 0, 0, -746, 4, 0, -747, 0, 1, 0, -749, 0, -750, 0, 0, 2,
+    -753, -754, -755, 0, -758, 0, 3, -762, 0, -764, 0, -765, -766, 7, -767, 0,
+    15, 1, -772, 0, -773, 1, 0, -774, 0, -777, 0, -778, 0, 0, -784, 1,
+    -793, 4, -796, 1, 0, 0, -797, 0, -798, 3, -801, 0, 0, 0, 3, 0,
+    2, -806, -812, 0, 0, 0, -813, 0, -816, 1, -820, -821, -822, -824, 0, -825,
+    -829, -831, 0, 3, 0, 2, 0, -832, 2, 12, -833, 0, 0, 14, 0, -835,
+    0, 1, -839, 4, -844, 17, 0, 3, 0, 21, 4, 0, 0, 0, -847, 6,
+    1, 9, 0, 3, 0, 23, 2, 0, 1, -849, 0, 0, 5, 1, 2, 2,
+    0, 1, 3, 0, -857, -860, 1, 1, -861, -867, -869, -872, -876, 1, -881, -884,
+    1, 1, 0, 2, 0, 0, 0, 0, 1, -885, -886, 0, -889, -892, 0, 0,
+    0, 0, 0, -899, 5, 0, 0, 0, 1, -900, -902, -903, 0, -904, 0, 0,
+    1, -908, 5, 0, 3, -911, -912, -913, 0, 4, -914, -915, 0, -918, -919, 14,
+    3, -920, -922, 20, -924, 4, -925, 0, 0, -928, 0, 0, 8, 6, 2, 0,
+    2, 0, 15, -930, 0, 0, 1, -937, 4, 1, 1, 15, -941, 0, 1, -942,
+    1, 5, 0, 0, -953, 0, 1, -955, -956, 1, -962, 0, -964, -965, -968, 1,
+    0, -973, 2, 1, 1, 0, -974, 0, -979, 0, -980, 0, -982, -986, -988, -1000,
+    -1002, 0, 0, 2, 0, 0, -1004, 0, -1013, 0, 0, -1016, 0, -1018, -1019, 3,
+    0, -1021, -1030, 0, -1031, -1033, 0, 1, 4, 0, 0, 0, 0, -1034, -1036, 0,
+    9, 0, -1040, -1042, 5, 0, -1043, 0, 0, 1, -1046, 9, 1, 0, 1, -1048,
+    -1049, 10, 3, 10, 2, 7, 0, 0, 0, -1054, -1064, 0, 2, -1065, 24, -1068,
+    0, -1073, 4, 1, -1074, 0, 0, 0, -1075, 2, 0, 0, 0, 0, -1078, 0,
+    0, 8, -1079, -1083, 0, 0, -1086, 0, 1, 0, -1088, 0, -1093, 0, 0, -1096,
+    0, -1099, -1100, 0, -1102, -1103, -1105, 21, 0, 0, 0, 4, -1106, 0, -1108, -1113,
+    0, -1118, 1, 0, -1121, 7, -1122, -1124, -1129, 5, 1, -1140, 1, 4, 1, 13,
+    16, 4, 0, 0, 0, 17, -1141, 44, 0, -1148, -1149, 0, -1152, 1, -1153, -1164,
+    0, -1167, 14, -1171, 3, -1174, -1180, 24, -1182, -1185, -1186, 0, -1190, 2, 0, 0,
+    16, 3, 0, 0, 3, -1191, -1193, 1, -1197, 9, -1198, 3, 0, 0, 0, 0,
+    0, 0, -1199, 4, -1200, 0, 0, -1201, 0, -1204, -1211, -1214, 0, -1215, 0, -1217,
+    0, 2, 0, 0, 1, 4, -1219, -1220, -1224, 2, 0, 7, -1229, 0, 0, 0,
+    0, 3, 0, 0, 5, -1235, 10, 0, -1236, 31, -1248, 3, 0, -1252, -1253, -1254,
+    -1260, 0, -1267, 0, 2, -1271, 2, 0, -1275, 0, 1, 0, 10, -1281, -1283, -1284,
+    4, 3, -1286, -1289, 0, -1294, 8, 3, 0, 0, -1295, 0, -1296, 6, 1, -1298,
+    1, 0, 0, 7, 1, 5, 0, -1303, -1304, 12, 0, 0, -1308, -1310, 0, 27,
+    0, -1320, 0, 0, 0, -1322, 84, -1324, 0, 4, -1327, -1329, 1, 0, 0, 0,
+    -1331, 0, 3, 17, 1, 42, 0, 0, 1, 21, 17, 0, 1, 0, -1333, -1336,
+    -1340, -1346, 9, 1, 0, 1, 1, 0, 0, 0, -1349, 0, 1, -1350, 0, -1351,
+    0, -1352, 0, -1354, 0, -1355, 0, 1, 11, -1357, -1360, 0, 28, -1361, -1362, -1364,
+    0, 0, -1365, -1366, -1367, 0, 0, 0, -1370, 0, 0, -1378, 0, -1381, -1384, 0,
+    0, 0, -1388, -1395, 0, -1396, 0, -1397, -1399, 0, 1, 0, -1401, -1404, -1405, 5,
+    -1406, -1408, -1413, 8, 0, 33, 5, 0, -1415, 2, 2, -1424, -1426, 41, -1428, 0,
+    5, 1, 0, 0, 0, 0, 0, -1434, 0, 0, 1, 0, 0, 0, 14, 0,
+    -1435, 1, -1437, -1439, -1440, -1444, -1446, -1447, -1448, 0, -1449, 10, -1450, -1459, 0, 0,
+    -1465, 0, 3, 0, -1468, -1470, 0, -1471, -1473, 0, -1481, 0, 1, -1487, 39, 0,
+    -1488, 2, 2, 0, -1496, 0, 0, 0, 0, -1499, -1501, 5, -1503, -1504, 9, -1505,
+    -1508, 1, -1514, 35, 1, 0, 7, 4, 0, -1516, 1, 0, 1, 1, 0, -1518,
+    -1519, -1520, -1522, 0, 8, -1523, -1524, 0, -1526, 0, 19, -1529, -1531, -1535, 1, -1539,
+    2, 7, 7, 1, -1543, -1544, -1545, -1549, -1551, 12, 0, -1554, 0, 2, 0, 0,
+    0, 0, -1558, -1561, -1563, -1566, 6, -1567, -1568, 0, 8, 0, 10, 0, 0, 0,
+    -1570, 0, 0, 0, 0, -1574, -1577, -1578, -1579, -1586, 0, -1588, -1595, 0, -1600, 4,
+    -1603, 1, 0, -1607, -1611, -1613, 0, 0, -1614, -1615, 22, -1618, -1619, 0, 2, 1,
+    1, 0, 2, 0, -1621, 0, -1628, -1632, 0, -1636, 0, 13, 1, 0, 0, 0,
+    0, 0, -1639, 31, -1643, 0, 1, 49, 0, 0, 0, -1649, -1652, -1654, 1, -1655,
+    1, 0, -1658, 0, 10, -1660, -1667, 3, -1668, 0, 0, 12, 1, 36, 0, 0,
+    8, -1672, -1673, -1677, -1680, -1684, 0, 0, 2, -1685, 0, 22, 0, 0, 0, 0,
+    -1687, 0, 0, 7, 42, -1692, -1694, 0, -1703, 19, -1707, 0, 2, 23, 9, 0,
+    -1711, 17, 24, 0, 4, -1714, 0, -1715, 2, -1716, -1718, 1, -1722, 15, 9, 33,
+    0, 0, -1724, 0, 9, 0, 0, 0, 29, 0, 8, -1733, -1734, 1, -1738, -1739,
+    -1740, 1, 0, -1743, -1745, 0, 36, 0, -1749, 6, 70, 1, 0, 0, -1752, 0,
+    -1753, 4, 128, -1755, 0, -1756, 0, -1757, -1764, -1767, -1768, 0, 0, 0, 1, 0,
+    0, 0, -1770, -1775, 0, 6, 0, -1778, -1782, 1, 0, -1785, -1792, -1793, 0, 47,
+    -1796, 0, 0, -1802, -1803, 0, 6, 2, 4, 0, 0, 0, 3, -1804, 33, -1805,
+    -1806, -1808, -1811, -1813, 0, 0, 7, -1815, 19, -1816, 0, 0, 0, 3, 0, 0,
+    0, 11, 0, 5, 0, -1821, 0, 0, 0, -1823, 0, -1824, -1825, -1826, 2, -1827,
+    -1829, -1831, -1833, 0, 17, -1841, -1842, 0, -1843, 0, 1, 68, -1848, 4, 0, -1850,
+    -1851, 0, -1853, -1854, 0, 0, -1856, -1859, 0, 0, -1860, 1, 0, -1863, 1, 0,
+    0, 2, -1867, 0, 0, 14, 69, 25, -1870, 0, 0, 0, -1872, 0, -1876, -1879,
+    -1882, -1883, 0, 15, 0, 4, 0, 0, -1887, 48, 16, -1890, 0, 7, 0, 0,
+    0, 0, 0, -1891, 0, 0, 0, 0, 0, -1898, -1899, 0, 0, 0, -1900, 5,
+    0, 0, 0, -1903, 5, -1907, 7, 0, 0, 0, 0, 24, 0, 0, -1909, 0,
+    -1911, -1912, 0, -1918, 0, 0, 0, 1, -1920, 121, 0, 59, 1, 0, 0, 0,
+    0, 6, 0, 0, -1924, 1, 0, -1926, -1936, 0, 0, 0, 0, 1, -1939, -1940,
+    3, 0, 0, 0, 3, -1941, 0, -1943, 6, 0, 0, 0, 6, -1945, 0, 1,
+    1, -1947, 0, -1950, 0, -1951, 0, -1954, -1955, -1959, -1961, 18, 5, 0, -1965, 0,
+    -1968, -1969, -1970, 0, -1973, 0, -1975, -1976, 0, 9, -1979, 68, -1980, 8, 12, 0,
+    4, -1984, 0, -1996, 0, -2002, 0, 117, 0, -2006, 0, -2008, 33, 0, 0, 2,
+    -2010, 0, 0, 29, -2013, 2, 0, 0, 0, -2015, 0, 0, 0, 67, 0, 40,
+    0, 0, -2017, 6, 0, -2021, 0, 0, 5, 0, 0, 0, 6, -2024, -2028, 0,
+    23, 1, 3, -2030, 0, 10, -2031, -2033, 10, -2036, -2038, 0, 27, 10, -2041, -2042,
+    11, 0, -2043, 35, 26, 0, 0, 0, 8, 0, -2048, 2, 0, 0, 0, 1,
+    0, -2052, -2053, -2055, -2056, -2058, 11, 0, -2059, 0, -2060, 0, -2061, 0, -2063, -2068,
+    0, 0, 33, 0, -2069, 0, 1, -2073, -2075, 0, 0, 3, 7, 4, -2080, 0,
+    0, 95, -2081, 0, 0, -2085, 0, 0, 69, 0, 0, 0, 0, 1, 0, 1,
+    5, -2086, 0, 0, 0, 12, -2088, 20, 0, 2, 0, 0, -2089, 9, -2090, 0,
+    0, 20, 4, -2095, 0, 0, -2096, 0, -2107, 0, -2110, -2112, 1, 15, 0, -2116,
+    -2118, -2122, -2127, 0, 1, 1, 1, 8, -2128, -2135, 0, 2, -2137, 0, 0, 0,
+    -2138, -2143, -2144, 0, -2147, 0, 74, 25, -2149, 0, 0, 36, -2151, 1, 82, 0,
+    -2158, -2159, 1, 2, 74, 20, 0, -2160, 0, 0, 0, 12, -2165, 0, 0, 0,
+    -2166, -2169, 0, -2174, 0, -2177, 0, 33, 8, -2181, 1, -2187, -2188, 0, 0, 0,
+    8, 17, 120, -2191, 0, -2196, 5, 24, 0, 9, -2198, -2200, 7, 0, -2201, 3,
+    -2202, -2203, 1, 35, 0, -2205, 2, 31, 5, 76, 0, 0, -2207, 4, -2208, 34,
+    -2209, 0, -2210, -2211, -2213, 0, 0, 0, -2215, 0, 0, 20, -2216, -2217, 0, 0,
+    0, -2220, 0, -2222, 0, 0, -2224, 0, 0, -2226, 0, 0, 1, 0, 10, 0,
+    -2228, 0, -2230, -2244, -2246, 0, 12, -2250, -2252, -2254, 75, 22, 1, 25, 1, 4,
+    0, 9, 0, 0, 16, 0, -2255, 1, -2260, 0, 0, 0, 2, 0, 0, -2264,
+    129, 9, -2265, 0, -2268, -2275, -2276, 0, -2277, -2281, -2282, 0, 2, -2290, 15, -2293,
+    -2294, -2295, 0, 0, -2301, -2305, 0, -2308, 0, -2312, 0, -2314, 1, 6, 0, 11,
+    26, -2316, 76, -2319, -2321, 0, 0, 10, 1, -2322, 2, 109, 0, -2324, 19, 6,
+    0, 130, -2325, 0, -2328, 0, -2331, 0, -2332, 0, 18, 0, 11, 7, 0, 10,
+    0, 0, -2333, 0, 0, -2334, 30, 0, -2336, 28, 0, 0, 0, 0, -2344, 0,
+    98, -2354, 7, 1, -2362, 0, -2364, 0, 14, 45, 12, -2366, -2367, -2369, -2376, 20,
+    0, 0, 14, 44, 43, -2383, 0, 0, 1, 0, -2384, 0, -2385, 0, 0, -2387,
+    0, -2388, 0, -2391, 6, 20, -2394, 0, -2395, 17, 0, 0, 28, 122, -2399, 0,
+    0, 12, 0, 0, -2401, 1, -2402, -2403, 100, 0, -2404, 12, -2405, -2406, -2407, -2413,
+    0, 0, -2420, 0, 0, 0, -2422, 0, 66, 1, -2424, 11, 0, 13, 0, 1,
+    0, -2427, 14, 0, 2, 0, 29, 0, 18, -2436, 0, 84, -2437, -2439, -2440, -2441,
+    1, 44, 0, 0, 0, 18, 0, 0, 0, 3, 0, -2443, -2445, 16, 21, 47,
+    22, -2451, 0, 0, 5, 0, -2452, 0, 0, -2456, -2457, 1, 0, 0, 0, -2461,
+    0, 0, 0, 21, -2465, 8, 0, -2466, 130, -2467, 0, 17, -2474, 0, -2475, -2478,
+    -2483, 45, 0, 0, -2484, 0, -2486, -2487, 48, 78, 0, 0, 0, -2491, -2492, 0,
+    5, 1, 0, -2494, 5, 0, 0, 4, -2496, 0, 1, -2499, 29, -2502, -2503, 15,
+    -2506, 3, 0, 29, -2511, -2513, -2515, -2521, 0, -2528, 18, 10, 40, 1, -2532, 0,
+    0, 10, 1, 0, 15, -2535, 0, 0, -2536, -2539, 0, 2, -2546, -2549, 16, -2550,
+    -2551, 0, 0, 3, -2555, 0, -2557, 19, -2561, -2562, 0, -2564, 0, 2, 18, 85,
+    0, -2566, 2, -2577, -2580, 0, 39, 16, 0, 38, -2588, -2594, -2601, 9, 18, 0,
+    0, 14, -2606, 0, -2612, -2617, -2618, -2621, -2625, -2632, 2, 0, -2639, -2641, -2644, 0,
+    -2646, 0, -2653, -2659, 32, -2660, 8, -2664, 0, -2667, -2669, 78, 24, 0, 3, 1,
+    -2670, -2671, 52, -2679, 1, -2680, -2686, 3, 0, 0, 97, -2688, -2691, -2696, -2697, 7,
+    0, 0, -2698, -2699, 39, -2701, -2702, 0, -2703, 4, 0, 2, 0, 9, -2705, -2708,
+    0, -2714, 37, 0, 16, -2717, 0, 0, 66, 8, -2718, -2720, 0, -2721, -2722, -2725,
+    -2727, 55, 0, 0, 8, -2729, -2731, 0, 68, -2733, 0, -2735, 0, 0, 0, -2747,
+    1, -2748, 49, -2751, -2755, -2756, 0, 0, 180, 5, -2757, -2758, 0, 0, 54, 0,
+    87, 0, 0, -2759, -2763, 0, 1, 0, 0, 0, 0, 24, 0, 0, 0, 387,
+    0, 49, -2764, 0, -2765, 0, -2766, -2775, 0, 0, -2781, -2784, 0, 0, -2786, 0,
+    -2789, 0, 19, -2790, 0, 4, 0, -2791, 0, 10, 0, -2794, 0, -2796, 0, -2802,
+    8, 0, 36, 5, -2808, 112, 8, -2814, 320, -2818, 0, -2820, 104, 0, 0, -2823,
+    66, -2826, -2827, 0, 0, 0, -2828, -2830, 0, 42, 0, 0, 0, 0, -2839, 44,
+    -2840, 1, 0, 1, -2841, -2842, 1, -2843, 145, 139, -2849, 1, 0, 1, -2850, -2854,
+    -2855, 0, 1, 0, 0, 0, -2856, 24, 26, 0, 0, 0, -2859, -2860, -2861, -2867,
+    91, 0, 39, -2869, -2872, -2875, 0, 0, 6, -2876, 64, 14, 4, 0, 194, 0,
+    -2879, 0, -2884, 0, -2885, -2886, -2887, -2891, -2895, -2899, 0, 85, -2901, 0, -2902, 5,
+    14, 0, 0, 125, -2903, -2904, 0, 0, 0, 0, 0, -2907, 4, -2909, -2910, -2911,
+    0, 0, -2913, -2914, 6, 0, 0, 0, -2916, 1, 0, 0, 0, 0, -2918, 0,
+    -2930, 0, 0, -2932, -2936, 77, 37, 0, 17, 16, 0, 24, -2941, 1, -2942, 138,
+    0, 1, -2945, 0, 0, 0, 0, 0, 1, -2947, 0, -2948, -2949, 2, 0, -2951,
+    76, 1, 0, 33, 0, 0, -2954, 0, -2955, 198, 0, 0, -2958, 0, 58, 1,
+    0, 0, 11, 0, -2962, -2966, 0, 9, -2967, 0, -2971, 1, -2973, -2975, -2976, 226,
+    21, 0, -2979, 0, 16, 20, 0, 0, 2, -2990, 38, 28, -2991, 0, 0, -2993,
+    0, 1, 0, 0, 0, 0, 0, 1, -2996, 0, 0, -2998, 18, 0, 0, -3000,
+    -3001, 0, -3003, 0, -3006, -3008, 0, 0, 1, 76, 0, -3014, 0, -3015, 0, 0,
+    -3016, 1, 0, -3017, -3018, -3019, 3, -3022, -3024, 0, 67, -3025, 68, -3027, 0, -3028,
+    0, -3029, -3032, 0, 86, 0, 372, 0, -3040, 1, 0, 0, -3043, 0, -3045, 0,
+    236, -3048, 0, 244, -3050, 0, 0, 0, 0, -3056, -3059, 169, -3062, 0, -3063, 76,
+    0, 3, 0, 0, 0, -3065, 0, -3066, 5, 5, -3068, 0, -3069, 0, 0, 0,
+    -3070, 21, 0, 36, 0, -3072, 188, -3077, 5, 0, -3078, 23, -3080, -3081, -3082, 0,
+    20, -3083, 0, 15, -3085, 0, 0, -3086, 0, 0, -3087, 0, 0, 0, 94, 0,
+    -3091, 0, 109, -3096, 0, 0, 0, 0, 0, 0, 0, 144, 0, 0, 0, 40,
+    0, -3098, 0, -3103, 6, -3109, -3115, 0, -3116, 0, 0, 7, 199, -3119, 0, 0,
+    -3122, -3129, -3131, 3, 56, 0, 22, 18, 34, 1, 0, 0, 78, 492, 0, 70,
+    0, -3133, -3135, 39, -3136, 2, -3141, 131, 0, 28, 0, -3142, 0, 3, 0, 0,
+    -3149, -3151, -3154, 0, 0, 0, 24, 0, 5, 2, 0, -3158, 0, 129, 0, 294,
+    -3160, 0, -3162, 0, 46, 0, 0, -3166, 39, 0, 98, -3170, 0, 0, -3171, -3173,
+    0, 0, 0, 18, 0, 0, 0, 0, 0, 0, 0, 0, 13, -3174, 18, 141,
+    0, 0, 24, 0, -3175, 3, 267, 0, -3176, 0, 0, -3177, -3178, -3179, 0, 0,
+    90, -3180, -3185, -3188, 0, 0, -3192, -3193, -3195, 211, -3196, 0, -3197, 0, 0, 157,
+    0, 3, 159, 534, 0, 0, 0, 34, -3199, 67, -3200, -3204, -3205, 0, -3206, 61,
+    61, -3208, 12, -3212, -3214, -3215, 0, 0, 9, -3221, 149, -3222, -3225, 0, 4, 110,
+    -3227, -3228, 0, 0, 168, -3230, -3234, 237, 0, -3238, 0, -3240, 0, 164, 0, -3246,
+    83, -3249, 103, 1, 44, 0, -3251, 0, 0, 14, -3252, 222, -3258, 1, 10, 7,
+    42, 46, 301, 7, -3259, 238, -3263, 0, 0, 0, -3270, 0, -3273, -3281, -3286, -3287,
+    132, 0, -3290, -3292, 0, -3298, 0, 4, -3300, 115, 0, -3301, 0, -3302, -3303, 0,
+    -3312
+  };
+
+  const unsigned short glEnumSlot[3313] = {
+    3, 1150, 1830, 342, 0, 1172, 1708, 1831, 2002, 2318, 2612, 1171, 707, 2982, 1707, 2005,
+    706, 2869, 2989, 1406, 404, 2883, 2555, 2134, 905, 2265, 883, 43, 1342, 1625, 1370, 895,
+    1748, 976, 3168, 2205, 2214, 855, 868, 1851, 468, 1859, 49, 3138, 555, 3146, 968, 3077,
+    967, 531, 1275, 2853, 3103, 1384, 3092, 3052, 255, 3094, 943, 2414, 2406, 1616, 1613, 1294,
+    345, 1299, 773, 791, 856, 2793, 790, 53, 2185, 59, 2385, 958, 1609, 778, 1475, 686,
+    2377, 2387, 2578, 2335, 767, 526, 103, 2, 960, 2113, 2687, 1940, 1469, 2174, 1562, 1038,
+    766, 128, 2611, 2376, 136, 241, 527, 285, 101, 1372, 2686, 2173, 1561, 1414, 724, 1676,
+    1518, 210, 1600, 698, 3080, 2966, 66, 3306, 1677, 1411, 1517, 693, 1119, 2025, 1330, 1334,
+    1719, 439, 1409, 137, 65, 1382, 782, 133, 2328, 63, 1196, 2272, 810, 2271, 3208, 2928,
+    2236, 821, 2936, 1578, 841, 974, 2823, 1159, 793, 1165, 1712, 1022, 2973, 1713, 2253, 2831,
+    2467, 2970, 2249, 3060, 2235, 1942, 325, 715, 2829, 1925, 322, 2330, 134, 3126, 6, 1477,
+    7, 2359, 1481, 1209, 2911, 1680, 2918, 2923, 3263, 1472, 843, 1490, 461, 2837, 1904, 845,
+    457, 2790, 1903, 487, 1457, 2325, 965, 3196, 2362, 731, 2533, 3190, 2326, 966, 878, 1303,
+    745, 1290, 3258, 1817, 1901, 700, 3102, 1581, 742, 3088, 2884, 2881, 221, 583, 2634, 3203,
+    2581, 238, 218, 2358, 846, 334, 581, 1070, 1968, 2070, 607, 1664, 3033, 1899, 2433, 3205,
+    2733, 2563, 2357, 1798, 1966, 2509, 3109, 3154, 477, 1898, 2786, 1091, 2832, 1383, 1730, 2071,
+    660, 2653, 1658, 17, 2432, 1953, 2564, 2518, 2482, 57, 301, 1412, 2139, 2262, 2876, 1085,
+    500, 2868, 1004, 1454, 1921, 1659, 19, 3285, 2114, 2735, 969, 363, 193, 982, 2411, 2488,
+    2276, 2954, 1945, 1598, 1424, 1656, 1951, 1413, 2117, 55, 639, 567, 1582, 2261, 2230, 619,
+    2425, 246, 3163, 1939, 510, 1902, 3299, 1149, 153, 245, 1006, 2291, 204, 1456, 1506, 2756,
+    1922, 509, 1167, 1501, 2498, 919, 1029, 483, 1807, 2566, 2118, 3034, 444, 1542, 1083, 1463,
+    621, 951, 1576, 3019, 1127, 1055, 2465, 254, 347, 195, 3251, 2297, 989, 1268, 666, 2410,
+    2922, 1955, 1653, 87, 2980, 2088, 54, 640, 2429, 569, 1645, 2424, 2004, 1500, 336, 2013,
+    312, 2147, 3165, 1131, 1759, 2568, 673, 2344, 2976, 2211, 3008, 1863, 495, 952, 203, 172,
+    77, 501, 2497, 2364, 2833, 481, 1801, 250, 2852, 1046, 913, 1622, 152, 798, 2018, 3264,
+    1522, 1161, 1114, 2009, 95, 3113, 2137, 1792, 2770, 1310, 1856, 1493, 832, 657, 3177, 2306,
+    2614, 1884, 2799, 2806, 802, 1270, 1488, 3017, 3048, 2736, 614, 2977, 1642, 1782, 1970, 676,
+    844, 1875, 425, 3056, 799, 314, 3156, 2067, 1760, 97, 1879, 648, 1917, 653, 2972, 659,
+    2210, 3085, 1315, 3007, 898, 1225, 1244, 2741, 1349, 159, 1724, 2418, 2835, 911, 1317, 1232,
+    346, 1521, 73, 2011, 2920, 2470, 1786, 1854, 896, 2065, 2394, 656, 2615, 1883, 2724, 237,
+    2798, 1023, 413, 2740, 281, 642, 2446, 1265, 1874, 2346, 378, 939, 2810, 3197, 3260, 1954,
+    51, 2091, 672, 3081, 1446, 2809, 3014, 1260, 2172, 1252, 751, 1348, 1837, 3129, 1725, 357,
+    3028, 2632, 2695, 1857, 893, 1682, 603, 2066, 704, 1920, 917, 618, 2681, 2102, 2719, 3035,
+    287, 176, 2892, 937, 2797, 1605, 1010, 985, 1277, 2090, 2811, 3013, 1788, 170, 1845, 3131,
+    2083, 2633, 1667, 18, 1585, 3064, 2296, 1544, 600, 752, 2405, 562, 875, 3032, 2189, 2783,
+    702, 2089, 1913, 2644, 3222, 2893, 28, 1009, 1278, 1034, 1586, 1338, 1785, 605, 2927, 2234,
+    1121, 2731, 643, 1459, 563, 891, 1756, 3029, 489, 2204, 1045, 3144, 1410, 2784, 2131, 1124,
+    3153, 1814, 2072, 34, 2654, 2546, 970, 1043, 1407, 604, 2231, 2136, 79, 3201, 2732, 1152,
+    2580, 646, 2035, 2020, 2567, 1727, 3148, 703, 1678, 2226, 1108, 2196, 234, 3162, 1919, 3236,
+    3147, 2121, 1132, 328, 2068, 2584, 2034, 2338, 2458, 1399, 539, 2921, 329, 1466, 1012, 932,
+    2194, 2559, 1453, 2197, 1800, 2706, 2819, 1140, 957, 167, 548, 2737, 836, 1327, 2691, 3066,
+    837, 930, 634, 3278, 632, 1871, 2820, 962, 786, 2044, 2181, 1671, 199, 2252, 2761, 511,
+    873, 658, 1321, 2229, 2757, 1661, 1326, 3155, 352, 3041, 3067, 2413, 3282, 1185, 2510, 2926,
+    611, 430, 110, 35, 3296, 826, 783, 842, 1670, 1307, 1995, 2256, 497, 3038, 2461, 230,
+    1166, 1737, 2844, 3134, 2384, 1524, 36, 818, 2978, 1895, 696, 2095, 1882, 2858, 597, 2525,
+    225, 1523, 721, 2985, 1781, 1853, 2094, 223, 705, 1049, 1040, 2426, 224, 2463, 852, 861,
+    3125, 1946, 854, 1238, 2898, 226, 3212, 1086, 610, 278, 227, 459, 1799, 722, 273, 2487,
+    129, 1305, 2889, 270, 3199, 1842, 228, 2140, 1972, 3182, 2061, 392, 938, 554, 2504, 2037,
+    2311, 1304, 2890, 1452, 2382, 421, 2354, 3183, 2324, 944, 2353, 933, 557, 1422, 2527, 2223,
+    1128, 2001, 1447, 1189, 2496, 530, 2438, 420, 396, 2322, 3093, 542, 1918, 2342, 2224, 1698,
+    2702, 1402, 543, 3059, 2696, 972, 163, 2560, 2340, 3049, 188, 113, 2906, 90, 1478, 272,
+    572, 975, 114, 2363, 2553, 3309, 2907, 1618, 3104, 3025, 2361, 2545, 912, 1614, 252, 62,
+    1696, 251, 2698, 1617, 1068, 533, 2684, 2537, 2776, 2153, 1583, 235, 406, 1657, 1360, 2699,
+    617, 2440, 2683, 1620, 236, 2758, 689, 1368, 2606, 876, 2422, 2713, 1850, 3291, 1361, 1356,
+    1120, 2010, 98, 68, 2216, 1210, 1615, 367, 3058, 620, 2964, 2371, 664, 633, 2752, 1596,
+    2665, 2576, 323, 1115, 1073, 661, 1812, 1741, 308, 99, 713, 2649, 2365, 1683, 2669, 1100,
+    2327, 3217, 518, 1355, 3253, 2299, 1754, 2599, 1958, 1074, 665, 1794, 306, 2645, 2389, 1779,
+    1139, 3247, 2396, 519, 796, 3221, 157, 2027, 2815, 1723, 2301, 1687, 1079, 2587, 3298, 2697,
+    337, 3227, 344, 275, 1569, 2391, 1957, 1109, 92, 901, 695, 2392, 2664, 222, 156, 1300,
+    2765, 2029, 3312, 1750, 1686, 1551, 1080, 1192, 2863, 1001, 1783, 124, 1248, 2494, 2830, 685,
+    1053, 2506, 663, 2685, 2948, 2474, 2459, 2666, 2942, 3231, 1912, 3152, 571, 2935, 2598, 418,
+    922, 986, 2109, 1564, 2914, 1062, 419, 1777, 125, 2157, 2522, 3225, 3308, 2949, 2073, 2896,
+    1346, 574, 1689, 2047, 714, 105, 2939, 1283, 2085, 1214, 1532, 379, 122, 2158, 3223, 1281,
+    1220, 760, 1076, 2538, 2900, 2287, 380, 1516, 2899, 882, 412, 1515, 2894, 888, 3275, 3216,
+    3015, 2886, 616, 1638, 1050, 615, 279, 2534, 761, 168, 1157, 1747, 1495, 169, 1749, 1527,
+    2283, 3110, 1061, 3127, 1864, 376, 1064, 2708, 1218, 503, 375, 2640, 2965, 2583, 1635, 2712,
+    720, 2206, 739, 2517, 507, 514, 313, 1019, 3237, 249, 2381, 299, 1089, 3239, 2745, 307,
+    29, 1847, 1309, 2208, 2561, 2419, 559, 1691, 1313, 2390, 2077, 2556, 350, 3273, 2415, 67,
+    3084, 1646, 556, 2078, 591, 179, 175, 2947, 1104, 3274, 298, 2845, 1790, 1358, 1208, 2154,
+    2961, 2968, 2847, 470, 1359, 1221, 2958, 2284, 2582, 177, 257, 1425, 2971, 31, 469, 2541,
+    1071, 748, 85, 2692, 1072, 1630, 746, 2693, 24, 950, 2453, 770, 1971, 649, 2203, 1734,
+    1371, 1106, 3269, 771, 644, 3176, 641, 1386, 759, 194, 1887, 910, 1885, 1389, 2006, 1082,
+    1818, 3074, 80, 1158, 2937, 2742, 1566, 2281, 1182, 1752, 2873, 132, 464, 2141, 3083, 1787,
+    1126, 701, 1123, 184, 8, 2748, 1824, 3174, 1821, 2423, 261, 1655, 138, 1179, 1374, 2227,
+    1491, 2874, 3200, 2957, 310, 465, 2373, 3292, 1823, 180, 2041, 1077, 1820, 262, 3204, 311,
+    3293, 2805, 3255, 123, 488, 2716, 1897, 2843, 351, 3172, 2012, 56, 1485, 1081, 909, 1176,
+    302, 1365, 1933, 2739, 3286, 1329, 1028, 349, 2082, 460, 20, 71, 1470, 3305, 1907, 709,
+    1471, 3290, 1333, 2081, 2659, 1057, 2701, 2680, 3242, 3189, 1016, 2032, 1449, 1556, 1652, 21,
+    847, 1450, 2167, 2130, 1908, 710, 2138, 2764, 3280, 2626, 892, 1504, 2569, 577, 2015, 2979,
+    671, 3213, 859, 2689, 1033, 364, 1056, 1417, 2673, 945, 3241, 1094, 732, 870, 2105, 2878,
+    1662, 2393, 1650, 2125, 144, 2170, 1990, 900, 383, 2660, 2152, 595, 2895, 390, 894, 2586,
+    3101, 2984, 2800, 2658, 288, 1173, 1118, 2674, 2718, 775, 2753, 733, 2079, 860, 553, 1944,
+    505, 817, 3230, 1740, 1519, 3024, 1097, 2395, 116, 1520, 3143, 899, 601, 1927, 2168, 2812,
+    608, 589, 3100, 2182, 552, 3111, 781, 1943, 207, 2135, 1135, 521, 2129, 568, 267, 3046,
+    736, 813, 60, 921, 3142, 1915, 2828, 585, 1207, 2186, 3105, 1231, 2619, 3198, 2879, 1188,
+    586, 271, 2460, 3045, 61, 889, 280, 2370, 2774, 1213, 374, 2974, 1144, 2577, 2544, 964,
+    74, 1223, 37, 2771, 3202, 662, 2399, 2870, 1757, 2751, 52, 3047, 2436, 2156, 1156, 45,
+    2369, 1141, 2348, 2924, 2372, 2998, 2781, 2201, 1143, 2177, 1206, 2573, 2547, 76, 3030, 993,
+    2802, 3310, 593, 570, 33, 3043, 1758, 1694, 1378, 282, 1279, 1199, 2603, 3012, 384, 2351,
+    3120, 423, 147, 2572, 684, 2240, 3288, 442, 2441, 2200, 2804, 5, 613, 1771, 561, 185,
+    814, 862, 2028, 2462, 2821, 2148, 1695, 1379, 1322, 2604, 1793, 1443, 887, 2437, 1911, 1852,
+    318, 1251, 3011, 2023, 2785, 2294, 491, 1627, 3118, 788, 753, 683, 1584, 2237, 443, 239,
+    2490, 1088, 1217, 3234, 850, 2682, 3171, 1067, 219, 3170, 2188, 164, 462, 1647, 1789, 839,
+    1649, 558, 2274, 2648, 1637, 1509, 2787, 2891, 348, 566, 25, 3195, 1797, 2629, 884, 2443,
+    1855, 96, 1267, 324, 3160, 1291, 1160, 1932, 3062, 2270, 1396, 804, 1476, 240, 130, 1087,
+    1059, 1295, 2675, 3173, 2151, 2300, 2111, 3135, 109, 1876, 2343, 2877, 1644, 294, 1654, 1795,
+    1007, 2727, 2143, 293, 524, 2524, 1640, 1510, 867, 1503, 1201, 2990, 174, 3180, 356, 1301,
+    2042, 3194, 2055, 734, 3246, 777, 414, 625, 1767, 1612, 3161, 954, 242, 1335, 1815, 3070,
+    264, 217, 2688, 2746, 1956, 58, 1979, 2360, 2127, 3097, 1155, 2054, 674, 3069, 2053, 295,
+    2014, 1880, 286, 2888, 961, 1113, 1722, 3166, 2865, 1000, 1729, 274, 1216, 183, 2036, 187,
+    1545, 3256, 1011, 1403, 2266, 400, 292, 1287, 309, 2608, 520, 2290, 2523, 389, 1499, 776,
+    2726, 2407, 2946, 942, 3245, 2190, 256, 737, 2175, 3128, 2930, 415, 835, 988, 2636, 624,
+    2056, 1486, 2404, 1634, 117, 253, 2690, 2349, 2841, 436, 1886, 803, 154, 490, 3054, 2445,
+    2069, 2163, 1272, 3018, 2919, 3061, 296, 213, 3157, 1688, 2225, 1125, 1666, 1746, 2987, 2486,
+    2934, 2967, 1565, 2849, 1867, 233, 2439, 115, 369, 1130, 2579, 2247, 3044, 3262, 1610, 2269,
+    2431, 1505, 1577, 399, 2607, 2630, 2715, 936, 1916, 2904, 1705, 2191, 2468, 260, 1032, 200,
+    3284, 388, 1259, 1169, 2472, 135, 2176, 2826, 2336, 1693, 2929, 1247, 981, 3087, 2058, 1377,
+    1320, 2596, 2345, 438, 2427, 1350, 2481, 3114, 1950, 162, 269, 1175, 2048, 2801, 2993, 182,
+    1243, 2298, 1440, 2457, 1005, 1668, 3140, 1184, 2610, 2951, 2485, 2933, 3193, 1341, 422, 335,
+    1868, 2064, 1048, 1808, 916, 886, 3249, 1611, 2435, 1435, 1819, 2628, 935, 1742, 758, 2822,
+    2451, 512, 1257, 1890, 717, 2520, 2905, 1703, 2872, 1261, 2309, 1398, 3108, 1328, 1191, 2647,
+    3016, 2825, 1312, 2777, 723, 2329, 874, 682, 1239, 2051, 2264, 2248, 2859, 1762, 2195, 980,
+    3086, 2183, 1492, 1332, 987, 1806, 1098, 502, 1959, 851, 2434, 2803, 181, 1245, 1529, 2302,
+    2551, 2120, 1444, 2897, 2456, 2840, 1193, 3238, 1164, 995, 1604, 1873, 885, 1286, 1428, 694,
+    2901, 1753, 2824, 811, 2492, 1025, 513, 652, 1263, 2178, 801, 2722, 994, 789, 1296, 1988,
+    2519, 712, 2871, 1353, 2943, 277, 2676, 3107, 2589, 2651, 70, 667, 1311, 330, 584, 871,
+    1975, 432, 690, 2305, 2386, 1401, 1766, 2310, 1938, 904, 1484, 1183, 1494, 1778, 401, 915,
+    1415, 1204, 3283, 1530, 371, 1122, 1031, 1906, 1003, 2552, 1451, 2860, 3023, 1579, 1163, 1736,
+    119, 1796, 816, 2597, 1692, 1116, 2142, 1093, 229, 2179, 806, 1297, 3167, 111, 1352, 807,
+    1228, 2286, 276, 1271, 590, 523, 1973, 441, 1809, 145, 1101, 2293, 3179, 708, 1249, 1941,
+    1560, 1546, 2243, 373, 289, 1905, 764, 1420, 69, 1665, 13, 1999, 2499, 2017, 2184, 1978,
+    1078, 537, 2917, 1768, 1117, 387, 1526, 1996, 112, 243, 2657, 2807, 1791, 1269, 522, 3250,
+    2149, 14, 1804, 1186, 3115, 1909, 146, 433, 2931, 627, 2625, 186, 1250, 2380, 3289, 1170,
+    1538, 1555, 106, 949, 283, 3065, 763, 1421, 1595, 3287, 15, 2489, 823, 120, 1710, 541,
+    688, 534, 2220, 247, 2709, 2838, 1211, 1531, 2026, 1728, 2219, 4, 1052, 1467, 1866, 3005,
+    3141, 205, 1200, 1936, 1633, 244, 2539, 2808, 1536, 93, 496, 711, 3116, 391, 628, 1316,
+    108, 2940, 2476, 675, 3073, 2228, 3294, 121, 2763, 931, 623, 1711, 365, 248, 1212, 142,
+    1574, 1340, 1375, 1726, 631, 2150, 2202, 2867, 1862, 3003, 1194, 647, 1468, 525, 407, 478,
+    3226, 475, 787, 946, 2500, 918, 680, 197, 405, 2232, 2882, 626, 366, 431, 2187, 1865,
+    1373, 2622, 984, 143, 645, 266, 1629, 2754, 2864, 2575, 2043, 2024, 1769, 1241, 2721, 2668,
+    765, 1599, 1568, 3175, 920, 2624, 1961, 1636, 1770, 2720, 2155, 2768, 86, 2164, 3191, 1962,
+    1540, 2087, 455, 2031, 792, 677, 448, 508, 630, 3082, 2108, 1273, 3026, 2180, 3021, 2760,
+    2909, 1112, 1601, 265, 1537, 1543, 198, 3063, 1479, 2086, 3243, 1347, 1828, 3132, 453, 629,
+    3057, 2198, 2093, 12, 2007, 1362, 3091, 2671, 3027, 2908, 2049, 2588, 741, 2285, 1105, 1714,
+    1628, 2729, 1535, 2950, 1482, 3124, 1832, 1474, 1041, 259, 1181, 691, 1514, 744, 2199, 2667,
+    1256, 2045, 1981, 1427, 1, 1624, 827, 141, 2728, 2292, 934, 2165, 1285, 2952, 2557, 697,
+    3106, 1826, 1813, 784, 263, 161, 747, 538, 2772, 1498, 692, 1508, 3122, 2938, 1423, 305,
+    2060, 11, 978, 3272, 1464, 929, 2710, 2166, 2558, 2341, 1833, 360, 1455, 853, 3121, 171,
+    1178, 977, 2846, 1442, 1460, 699, 3279, 2171, 857, 1891, 3300, 88, 1246, 1439, 1202, 560,
+    1641, 1780, 2379, 1619, 476, 2503, 2251, 1776, 2258, 332, 927, 535, 3036, 2714, 1308, 2521,
+    2062, 139, 82, 3257, 343, 473, 2479, 3302, 1607, 1775, 2944, 2257, 2848, 333, 2480, 2986,
+    3079, 1926, 353, 1606, 990, 1553, 355, 2988, 354, 1548, 2278, 992, 2601, 48, 2112, 1391,
+    907, 1848, 1549, 979, 2590, 2444, 1266, 2955, 1765, 2275, 118, 417, 1103, 231, 3181, 2512,
+    1699, 47, 2040, 104, 1390, 908, 1877, 155, 2759, 2778, 914, 1923, 2574, 1840, 1215, 1092,
+    2442, 1928, 2505, 3004, 315, 3186, 290, 2875, 730, 416, 3089, 726, 3281, 1110, 102, 450,
+    411, 2780, 2471, 1836, 2508, 3164, 2515, 903, 1236, 3224, 291, 2263, 2528, 3133, 361, 1258,
+    959, 941, 449, 687, 3112, 1436, 725, 362, 549, 46, 2116, 2493, 669, 516, 2106, 284,
+    2959, 940, 3117, 1292, 1623, 107, 2046, 437, 1090, 3076, 1445, 727, 2128, 2491, 668, 2915,
+    517, 2383, 2932, 2352, 451, 2507, 1014, 2104, 2773, 402, 2670, 319, 1465, 2562, 1318, 1437,
+    2126, 1827, 2814, 2378, 1274, 1805, 1017, 594, 3192, 1013, 2775, 2627, 1138, 2400, 75, 1738,
+    1276, 32, 592, 424, 1137, 2403, 1069, 2246, 3220, 829, 2738, 1982, 1739, 2084, 1497, 2953,
+    1376, 1952, 2447, 2478, 996, 1784, 3151, 2743, 2638, 2193, 1843, 2132, 2600, 327, 1716, 828,
+    3232, 955, 1289, 612, 2595, 670, 326, 1717, 831, 1896, 3158, 3159, 3276, 3178, 2792, 2983,
+    2288, 2159, 2160, 377, 466, 756, 2694, 1429, 1992, 1387, 1993, 191, 1432, 220, 84, 1434,
+    2549, 1844, 1858, 3022, 2550, 2646, 3214, 1846, 1894, 1337, 2703, 1881, 1343, 304, 2705, 303,
+    655, 551, 654, 91, 89, 27, 906, 902, 650, 1388, 1744, 536, 3009, 1483, 540, 2836,
+    740, 1015, 2408, 341, 3267, 1811, 636, 3119, 2842, 2501, 192, 3187, 2855, 1810, 1839, 2133,
+    3270, 1512, 2591, 1203, 1838, 3261, 2592, 1934, 1931, 3266, 971, 872, 2050, 1822, 2003, 3271,
+    1054, 963, 953, 1937, 1264, 2511, 2514, 2307, 2308, 1674, 1675, 1145, 1567, 550, 398, 493,
+    2319, 1563, 2530, 1589, 532, 482, 2321, 2652, 3218, 1364, 3037, 3265, 452, 1448, 3123, 2242,
+    3229, 1363, 754, 3268, 2096, 3297, 1849, 2678, 2473, 3188, 2635, 1597, 1663, 2412, 2526, 3040,
+    427, 3006, 1430, 2098, 528, 166, 638, 2913, 579, 2254, 3053, 2642, 2350, 768, 1998, 2643,
+    2617, 785, 2656, 2356, 2279, 1405, 1357, 1733, 1697, 2945, 1234, 2916, 2862, 1431, 735, 515,
+    2277, 808, 635, 529, 681, 2880, 2244, 1473, 165, 637, 3184, 2535, 2912, 2215, 2268, 1935,
+    588, 2038, 1997, 1367, 3072, 1974, 866, 2238, 2192, 1314, 382, 2039, 1408, 83, 2347, 2259,
+    173, 64, 1151, 1977, 2212, 2613, 2700, 409, 1168, 2887, 338, 1547, 2641, 3136, 140, 774,
+    2995, 2795, 1573, 2355, 3139, 458, 1282, 1731, 1129, 2956, 2941, 2449, 1233, 2273, 809, 1550,
+    2495, 1825, 2789, 1397, 2207, 1021, 3209, 2903, 1557, 973, 386, 1136, 1142, 2245, 830, 2536,
+    1487, 2221, 2618, 216, 923, 403, 2339, 2217, 2267, 1991, 1366, 651, 1967, 812, 2057, 2782,
+    2144, 1559, 2637, 2260, 2747, 2146, 1660, 1969, 2620, 72, 1393, 1816, 890, 339, 38, 1709,
+    3145, 131, 599, 1700, 779, 2816, 2994, 2162, 463, 797, 1284, 1400, 2960, 9, 2448, 2320,
+    769, 3169, 2222, 2796, 2531, 2839, 408, 547, 1603, 1197, 1539, 1829, 1872, 3303, 1395, 2110,
+    2059, 1507, 2213, 1020, 2717, 1147, 215, 2316, 1351, 1914, 924, 2655, 2755, 1669, 2981, 1888,
+    2529, 2209, 991, 1706, 1339, 2454, 1965, 2241, 1949, 2788, 3211, 622, 1392, 565, 1111, 1513,
+    1458, 42, 1324, 750, 3215, 1701, 2161, 2076, 3219, 1489, 100, 10, 2218, 1133, 1227, 2854,
+    1419, 2323, 2331, 2663, 2280, 397, 3206, 2513, 1331, 2677, 749, 1590, 2856, 546, 2000, 2609,
+    1416, 1198, 3307, 393, 1861, 2075, 2103, 1994, 2337, 1502, 2621, 317, 41, 2312, 772, 316,
+    2997, 206, 381, 3150, 1293, 189, 2999, 2532, 1336, 2455, 2250, 2548, 3233, 881, 820, 1253,
+    3210, 1107, 1441, 1042, 1511, 268, 1461, 2672, 1947, 1878, 1051, 1134, 1226, 1063, 2744, 1462,
+    2734, 3295, 2857, 2769, 2662, 576, 897, 23, 1099, 1325, 2585, 454, 1230, 3055, 1426, 498,
+    2794, 762, 474, 429, 1860, 2169, 2255, 2594, 78, 815, 1892, 486, 3252, 2750, 3149, 1288,
+    1496, 3259, 370, 1319, 39, 780, 1298, 190, 1764, 1177, 2554, 2516, 877, 819, 1254, 1525,
+    1438, 1044, 410, 1948, 2420, 2813, 1608, 2779, 728, 340, 1035, 1323, 1721, 1381, 2428, 2791,
+    596, 2749, 2991, 2762, 3020, 2314, 679, 3244, 232, 1306, 1755, 2725, 1229, 1002, 1026, 1835,
+    472, 208, 840, 480, 1008, 3031, 1280, 1205, 1751, 445, 1761, 506, 320, 2502, 1910, 800,
+    479, 2421, 1702, 395, 602, 3207, 2605, 2409, 582, 2450, 385, 947, 1720, 1533, 1380, 2430,
+    545, 50, 2992, 983, 578, 1541, 2885, 865, 1162, 956, 575, 3099, 2317, 1302, 394, 178,
+    1834, 1685, 149, 1743, 2052, 504, 1394, 805, 471, 1187, 1715, 81, 2902, 598, 2542, 864,
+    2834, 1418, 1027, 1735, 2484, 948, 1534, 1704, 1745, 580, 1575, 544, 2631, 863, 2417, 1224,
+    3098, 869, 1075, 3254, 1684, 494, 440, 148, 2602, 2366, 2100, 331, 1039, 1060, 1580, 16,
+    3240, 2570, 2910, 1102, 2543, 209, 838, 1433, 2616, 2483, 1983, 755, 2707, 997, 2289, 3090,
+    757, 484, 2122, 2074, 928, 2639, 2416, 2368, 492, 3042, 1980, 2101, 1047, 3248, 1084, 214,
+    1802, 3078, 743, 2963, 359, 1984, 30, 2711, 999, 2282, 485, 1986, 1174, 2367, 1985, 2119,
+    2679, 833, 1803, 1591, 2115, 435, 2097, 2962, 1154, 834, 428, 372, 1960, 2123, 1592, 1262,
+    1964, 1195, 2466, 998, 434, 297, 3010, 606, 3137, 1369, 2092, 1180, 2593, 1153, 2124, 738,
+    729, 1976, 1763, 2565, 2850, 3130, 1593, 1602, 1354, 2571, 2464, 1672, 3185, 1639, 1718, 2851,
+    1219, 1148, 201, 1037, 1594, 1673, 2475, 2661, 1648, 40, 2021, 2766, 1222, 2019, 1146, 1190,
+    2452, 202, 211, 2969, 150, 2767, 1963, 2477, 2704, 212, 1528, 1242, 2063, 426, 3301, 3096,
+    2827, 1240, 2996, 258, 3095, 1651, 3235, 1732, 1018, 196, 1900, 1772, 358, 1643, 573, 2033,
+    822, 151, 678, 2099, 3228, 2233, 1690, 446, 2866, 2145, 858, 1989, 456, 1929, 2540, 3277,
+    1058, 1841, 824, 825, 719, 3051, 447, 2080, 849, 1554, 1987, 2303, 2374, 2315, 2623, 609,
+    1480, 2730, 1065, 1558, 1095, 126, 368, 1385, 880, 2375, 2107, 2401, 718, 1345, 3050, 499,
+    3068, 2022, 1681, 2304, 2332, 300, 2861, 1889, 848, 1096, 1237, 127, 879, 3002, 1632, 1679,
+    1572, 2402, 160, 1774, 1024, 1344, 2016, 1552, 321, 564, 1924, 1893, 3304, 2975, 94, 3001,
+    2469, 1588, 2239, 44, 1066, 3075, 158, 3039, 795, 467, 1773, 26, 587, 2030, 1255, 2295,
+    1621, 1235, 1587, 1631, 1930, 2397, 1869, 2388, 2925, 2818, 3071, 22, 794, 1626, 2398, 1870,
+    1404, 2723, 2817, 1571, 925, 2333, 1036, 2650, 1570, 2008, 2313, 926, 716, 2334, 1030, 3311,
+    3000
+  };
+
+  #endif // REGAL_ENUM_TO_STRING
+
+  const char * GLenumToString( GLenum v ) {
     #if REGAL_ENUM_TO_STRING
-    switch( e ) {
-      case 0x00000000: return "GL_ZERO";
-      case 0x00000001: return "GL_ONE";
-      case 0x00000002: return "GL_LINE_LOOP";
-      case 0x00000003: return "GL_LINE_STRIP";
-      case 0x00000004: return "GL_TRIANGLES";
-      case 0x00000005: return "GL_TRIANGLE_STRIP";
-      case 0x00000006: return "GL_TRIANGLE_FAN";
-      case 0x00000007: return "GL_QUADS";
-      case 0x00000008: return "GL_QUAD_STRIP";
-      case 0x00000009: return "GL_POLYGON";
-      case 0x0000000a: return "GL_LINES_ADJACENCY";
-      case 0x0000000b: return "GL_LINE_STRIP_ADJACENCY";
-      case 0x0000000c: return "GL_TRIANGLES_ADJACENCY";
-      case 0x0000000d: return "GL_TRIANGLE_STRIP_ADJACENCY";
-      case 0x0000000e: return "GL_PATCHES";
-      case 0x0000000f: return "GL_RELATIVE_SMOOTH_QUADRATIC_CURVE_TO_NV";
-      case 0x00000010: return "GL_SMOOTH_CUBIC_CURVE_TO_NV";
-      case 0x00000011: return "GL_RELATIVE_SMOOTH_CUBIC_CURVE_TO_NV";
-      case 0x00000012: return "GL_SMALL_CCW_ARC_TO_NV";
-      case 0x00000013: return "GL_RELATIVE_SMALL_CCW_ARC_TO_NV";
-      case 0x00000014: return "GL_SMALL_CW_ARC_TO_NV";
-      case 0x00000015: return "GL_RELATIVE_SMALL_CW_ARC_TO_NV";
-      case 0x00000016: return "GL_LARGE_CCW_ARC_TO_NV";
-      case 0x00000017: return "GL_RELATIVE_LARGE_CCW_ARC_TO_NV";
-      case 0x00000018: return "GL_LARGE_CW_ARC_TO_NV";
-      case 0x00000019: return "GL_RELATIVE_LARGE_CW_ARC_TO_NV";
-      case 0x00000020: return "GL_EIGHTH_BIT_ATI";
-      case 0x00000040: return "GL_SATURATE_BIT_ATI";
-      case 0x00000080: return "GL_COLOR_BUFFER_BIT7_QCOM";
-      case 0x000000f0: return "GL_RESTART_PATH_NV";
-      case 0x000000f2: return "GL_DUP_FIRST_CUBIC_CURVE_TO_NV";
-      case 0x000000f4: return "GL_DUP_LAST_CUBIC_CURVE_TO_NV";
-      case 0x000000f6: return "GL_RECT_NV";
-      case 0x000000f8: return "GL_CIRCULAR_CCW_ARC_TO_NV";
-      case 0x000000fa: return "GL_CIRCULAR_CW_ARC_TO_NV";
-      case 0x000000fc: return "GL_CIRCULAR_TANGENT_ARC_TO_NV";
-      case 0x000000fe: return "GL_ARC_TO_NV";
-      case 0x000000ff: return "GL_RELATIVE_ARC_TO_NV";
-      case 0x00000100: return "GL_ACCUM";
-      case 0x00000101: return "GL_LOAD";
-      case 0x00000102: return "GL_RETURN";
-      case 0x00000103: return "GL_MULT";
-      case 0x00000104: return "GL_ADD";
-      case 0x00000200: return "GL_NEVER";
-      case 0x00000201: return "GL_LESS";
-      case 0x00000202: return "GL_EQUAL";
-      case 0x00000203: return "GL_LEQUAL";
-      case 0x00000204: return "GL_GREATER";
-      case 0x00000205: return "GL_NOTEQUAL";
-      case 0x00000206: return "GL_GEQUAL";
-      case 0x00000207: return "GL_ALWAYS";
-      case 0x00000300: return "GL_SRC_COLOR";
-      case 0x00000301: return "GL_ONE_MINUS_SRC_COLOR";
-      case 0x00000302: return "GL_SRC_ALPHA";
-      case 0x00000303: return "GL_ONE_MINUS_SRC_ALPHA";
-      case 0x00000304: return "GL_DST_ALPHA";
-      case 0x00000305: return "GL_ONE_MINUS_DST_ALPHA";
-      case 0x00000306: return "GL_DST_COLOR";
-      case 0x00000307: return "GL_ONE_MINUS_DST_COLOR";
-      case 0x00000308: return "GL_SRC_ALPHA_SATURATE";
-      case 0x00000400: return "GL_FRONT_LEFT";
-      case 0x00000401: return "GL_FRONT_RIGHT";
-      case 0x00000402: return "GL_BACK_LEFT";
-      case 0x00000403: return "GL_BACK_RIGHT";
-      case 0x00000404: return "GL_FRONT";
-      case 0x00000405: return "GL_BACK";
-      case 0x00000406: return "GL_LEFT";
-      case 0x00000407: return "GL_RIGHT";
-      case 0x00000408: return "GL_FRONT_AND_BACK";
-      case 0x00000409: return "GL_AUX0";
-      case 0x0000040a: return "GL_AUX1";
-      case 0x0000040b: return "GL_AUX2";
-      case 0x0000040c: return "GL_AUX3";
-      case 0x00000500: return "GL_INVALID_ENUM";
-      case 0x00000501: return "GL_INVALID_VALUE";
-      case 0x00000502: return "GL_INVALID_OPERATION";
-      case 0x00000503: return "GL_STACK_OVERFLOW";
-      case 0x00000504: return "GL_STACK_UNDERFLOW";
-      case 0x00000505: return "GL_OUT_OF_MEMORY";
-      case 0x00000506: return "GL_INVALID_FRAMEBUFFER_OPERATION";
-      case 0x00000600: return "GL_2D";
-      case 0x00000601: return "GL_3D";
-      case 0x00000602: return "GL_3D_COLOR";
-      case 0x00000603: return "GL_3D_COLOR_TEXTURE";
-      case 0x00000604: return "GL_4D_COLOR_TEXTURE";
-      case 0x00000700: return "GL_PASS_THROUGH_TOKEN";
-      case 0x00000701: return "GL_POINT_TOKEN";
-      case 0x00000702: return "GL_LINE_TOKEN";
-      case 0x00000703: return "GL_POLYGON_TOKEN";
-      case 0x00000704: return "GL_BITMAP_TOKEN";
-      case 0x00000705: return "GL_DRAW_PIXEL_TOKEN";
-      case 0x00000706: return "GL_COPY_PIXEL_TOKEN";
-      case 0x00000707: return "GL_LINE_RESET_TOKEN";
-      case 0x00000800: return "GL_EXP";
-      case 0x00000801: return "GL_EXP2";
-      case 0x00000898: return "GL_MODELVIEW_MATRIX_FLOAT_AS_INT_BITS_OES";
-      case 0x00000900: return "GL_CW";
-      case 0x00000901: return "GL_CCW";
-      case 0x00000a00: return "GL_COEFF";
-      case 0x00000a01: return "GL_ORDER";
-      case 0x00000a02: return "GL_DOMAIN";
-      case 0x00000b00: return "GL_CURRENT_COLOR";
-      case 0x00000b01: return "GL_CURRENT_INDEX";
-      case 0x00000b02: return "GL_CURRENT_NORMAL";
-      case 0x00000b03: return "GL_CURRENT_TEXTURE_COORDS";
-      case 0x00000b04: return "GL_CURRENT_RASTER_COLOR";
-      case 0x00000b05: return "GL_CURRENT_RASTER_INDEX";
-      case 0x00000b06: return "GL_CURRENT_RASTER_TEXTURE_COORDS";
-      case 0x00000b07: return "GL_CURRENT_RASTER_POSITION";
-      case 0x00000b08: return "GL_CURRENT_RASTER_POSITION_VALID";
-      case 0x00000b09: return "GL_CURRENT_RASTER_DISTANCE";
-      case 0x00000b10: return "GL_POINT_SMOOTH";
-      case 0x00000b11: return "GL_POINT_SIZE";
-      case 0x00000b12: return "GL_POINT_SIZE_RANGE";
-      case 0x00000b13: return "GL_POINT_SIZE_GRANULARITY";
-      case 0x00000b20: return "GL_LINE_SMOOTH";
-      case 0x00000b21: return "GL_LINE_WIDTH";
-      case 0x00000b22: return "GL_LINE_WIDTH_RANGE";
-      case 0x00000b23: return "GL_LINE_WIDTH_GRANULARITY";
-      case 0x00000b24: return "GL_LINE_STIPPLE";
-      case 0x00000b25: return "GL_LINE_STIPPLE_PATTERN";
-      case 0x00000b26: return "GL_LINE_STIPPLE_REPEAT";
-      case 0x00000b30: return "GL_LIST_MODE";
-      case 0x00000b31: return "GL_MAX_LIST_NESTING";
-      case 0x00000b32: return "GL_LIST_BASE";
-      case 0x00000b33: return "GL_LIST_INDEX";
-      case 0x00000b40: return "GL_POLYGON_MODE";
-      case 0x00000b41: return "GL_POLYGON_SMOOTH";
-      case 0x00000b42: return "GL_POLYGON_STIPPLE";
-      case 0x00000b43: return "GL_EDGE_FLAG";
-      case 0x00000b44: return "GL_CULL_FACE";
-      case 0x00000b45: return "GL_CULL_FACE_MODE";
-      case 0x00000b46: return "GL_FRONT_FACE";
-      case 0x00000b50: return "GL_LIGHTING";
-      case 0x00000b51: return "GL_LIGHT_MODEL_LOCAL_VIEWER";
-      case 0x00000b52: return "GL_LIGHT_MODEL_TWO_SIDE";
-      case 0x00000b53: return "GL_LIGHT_MODEL_AMBIENT";
-      case 0x00000b54: return "GL_SHADE_MODEL";
-      case 0x00000b55: return "GL_COLOR_MATERIAL_FACE";
-      case 0x00000b56: return "GL_COLOR_MATERIAL_PARAMETER";
-      case 0x00000b57: return "GL_COLOR_MATERIAL";
-      case 0x00000b60: return "GL_FOG";
-      case 0x00000b61: return "GL_FOG_INDEX";
-      case 0x00000b62: return "GL_FOG_DENSITY";
-      case 0x00000b63: return "GL_FOG_START";
-      case 0x00000b64: return "GL_FOG_END";
-      case 0x00000b65: return "GL_FOG_MODE";
-      case 0x00000b66: return "GL_FOG_COLOR";
-      case 0x00000b70: return "GL_DEPTH_RANGE";
-      case 0x00000b71: return "GL_DEPTH_TEST";
-      case 0x00000b72: return "GL_DEPTH_WRITEMASK";
-      case 0x00000b73: return "GL_DEPTH_CLEAR_VALUE";
-      case 0x00000b74: return "GL_DEPTH_FUNC";
-      case 0x00000b80: return "GL_ACCUM_CLEAR_VALUE";
-      case 0x00000b90: return "GL_STENCIL_TEST";
-      case 0x00000b91: return "GL_STENCIL_CLEAR_VALUE";
-      case 0x00000b92: return "GL_STENCIL_FUNC";
-      case 0x00000b93: return "GL_STENCIL_VALUE_MASK";
-      case 0x00000b94: return "GL_STENCIL_FAIL";
-      case 0x00000b95: return "GL_STENCIL_PASS_DEPTH_FAIL";
-      case 0x00000b96: return "GL_STENCIL_PASS_DEPTH_PASS";
-      case 0x00000b97: return "GL_STENCIL_REF";
-      case 0x00000b98: return "GL_STENCIL_WRITEMASK";
-      case 0x00000ba0: return "GL_MATRIX_MODE";
-      case 0x00000ba1: return "GL_NORMALIZE";
-      case 0x00000ba2: return "GL_VIEWPORT";
-      case 0x00000ba3: return "GL_MODELVIEW_STACK_DEPTH";
-      case 0x00000ba4: return "GL_PROJECTION_STACK_DEPTH";
-      case 0x00000ba5: return "GL_TEXTURE_STACK_DEPTH";
-      case 0x00000ba6: return "GL_MODELVIEW_MATRIX";
-      case 0x00000ba7: return "GL_PROJECTION_MATRIX";
-      case 0x00000ba8: return "GL_TEXTURE_MATRIX";
-      case 0x00000bb0: return "GL_ATTRIB_STACK_DEPTH";
-      case 0x00000bb1: return "GL_CLIENT_ATTRIB_STACK_DEPTH";
-      case 0x00000bc0: return "GL_ALPHA_TEST";
-      case 0x00000bc1: return "GL_ALPHA_TEST_FUNC";
-      case 0x00000bc2: return "GL_ALPHA_TEST_REF";
-      case 0x00000bd0: return "GL_DITHER";
-      case 0x00000be0: return "GL_BLEND_DST";
-      case 0x00000be1: return "GL_BLEND_SRC";
-      case 0x00000be2: return "GL_BLEND";
-      case 0x00000bf0: return "GL_LOGIC_OP_MODE";
-      case 0x00000bf1: return "GL_INDEX_LOGIC_OP";
-      case 0x00000bf2: return "GL_COLOR_LOGIC_OP";
-      case 0x00000c00: return "GL_AUX_BUFFERS";
-      case 0x00000c01: return "GL_DRAW_BUFFER";
-      case 0x00000c02: return "GL_READ_BUFFER";
-      case 0x00000c10: return "GL_SCISSOR_BOX";
-      case 0x00000c11: return "GL_SCISSOR_TEST";
-      case 0x00000c20: return "GL_INDEX_CLEAR_VALUE";
-      case 0x00000c21: return "GL_INDEX_WRITEMASK";
-      case 0x00000c22: return "GL_COLOR_CLEAR_VALUE";
-      case 0x00000c23: return "GL_COLOR_WRITEMASK";
-      case 0x00000c30: return "GL_INDEX_MODE";
-      case 0x00000c31: return "GL_RGBA_MODE";
-      case 0x00000c32: return "GL_DOUBLEBUFFER";
-      case 0x00000c33: return "GL_STEREO";
-      case 0x00000c40: return "GL_RENDER_MODE";
-      case 0x00000c50: return "GL_PERSPECTIVE_CORRECTION_HINT";
-      case 0x00000c51: return "GL_POINT_SMOOTH_HINT";
-      case 0x00000c52: return "GL_LINE_SMOOTH_HINT";
-      case 0x00000c53: return "GL_POLYGON_SMOOTH_HINT";
-      case 0x00000c54: return "GL_FOG_HINT";
-      case 0x00000c60: return "GL_TEXTURE_GEN_S";
-      case 0x00000c61: return "GL_TEXTURE_GEN_T";
-      case 0x00000c62: return "GL_TEXTURE_GEN_R";
-      case 0x00000c63: return "GL_TEXTURE_GEN_Q";
-      case 0x00000c70: return "GL_PIXEL_MAP_I_TO_I";
-      case 0x00000c71: return "GL_PIXEL_MAP_S_TO_S";
-      case 0x00000c72: return "GL_PIXEL_MAP_I_TO_R";
-      case 0x00000c73: return "GL_PIXEL_MAP_I_TO_G";
-      case 0x00000c74: return "GL_PIXEL_MAP_I_TO_B";
-      case 0x00000c75: return "GL_PIXEL_MAP_I_TO_A";
-      case 0x00000c76: return "GL_PIXEL_MAP_R_TO_R";
-      case 0x00000c77: return "GL_PIXEL_MAP_G_TO_G";
-      case 0x00000c78: return "GL_PIXEL_MAP_B_TO_B";
-      case 0x00000c79: return "GL_PIXEL_MAP_A_TO_A";
-      case 0x00000cb0: return "GL_PIXEL_MAP_I_TO_I_SIZE";
-      case 0x00000cb1: return "GL_PIXEL_MAP_S_TO_S_SIZE";
-      case 0x00000cb2: return "GL_PIXEL_MAP_I_TO_R_SIZE";
-      case 0x00000cb3: return "GL_PIXEL_MAP_I_TO_G_SIZE";
-      case 0x00000cb4: return "GL_PIXEL_MAP_I_TO_B_SIZE";
-      case 0x00000cb5: return "GL_PIXEL_MAP_I_TO_A_SIZE";
-      case 0x00000cb6: return "GL_PIXEL_MAP_R_TO_R_SIZE";
-      case 0x00000cb7: return "GL_PIXEL_MAP_G_TO_G_SIZE";
-      case 0x00000cb8: return "GL_PIXEL_MAP_B_TO_B_SIZE";
-      case 0x00000cb9: return "GL_PIXEL_MAP_A_TO_A_SIZE";
-      case 0x00000cf0: return "GL_UNPACK_SWAP_BYTES";
-      case 0x00000cf1: return "GL_UNPACK_LSB_FIRST";
-      case 0x00000cf2: return "GL_UNPACK_ROW_LENGTH";
-      case 0x00000cf3: return "GL_UNPACK_SKIP_ROWS";
-      case 0x00000cf4: return "GL_UNPACK_SKIP_PIXELS";
-      case 0x00000cf5: return "GL_UNPACK_ALIGNMENT";
-      case 0x00000d00: return "GL_PACK_SWAP_BYTES";
-      case 0x00000d01: return "GL_PACK_LSB_FIRST";
-      case 0x00000d02: return "GL_PACK_ROW_LENGTH";
-      case 0x00000d03: return "GL_PACK_SKIP_ROWS";
-      case 0x00000d04: return "GL_PACK_SKIP_PIXELS";
-      case 0x00000d05: return "GL_PACK_ALIGNMENT";
-      case 0x00000d10: return "GL_MAP_COLOR";
-      case 0x00000d11: return "GL_MAP_STENCIL";
-      case 0x00000d12: return "GL_INDEX_SHIFT";
-      case 0x00000d13: return "GL_INDEX_OFFSET";
-      case 0x00000d14: return "GL_RED_SCALE";
-      case 0x00000d15: return "GL_RED_BIAS";
-      case 0x00000d16: return "GL_ZOOM_X";
-      case 0x00000d17: return "GL_ZOOM_Y";
-      case 0x00000d18: return "GL_GREEN_SCALE";
-      case 0x00000d19: return "GL_GREEN_BIAS";
-      case 0x00000d1a: return "GL_BLUE_SCALE";
-      case 0x00000d1b: return "GL_BLUE_BIAS";
-      case 0x00000d1c: return "GL_ALPHA_SCALE";
-      case 0x00000d1d: return "GL_ALPHA_BIAS";
-      case 0x00000d1e: return "GL_DEPTH_SCALE";
-      case 0x00000d1f: return "GL_DEPTH_BIAS";
-      case 0x00000d30: return "GL_MAX_EVAL_ORDER";
-      case 0x00000d31: return "GL_MAX_LIGHTS";
-      case 0x00000d32: return "GL_MAX_CLIP_PLANES";
-      case 0x00000d33: return "GL_MAX_TEXTURE_SIZE";
-      case 0x00000d34: return "GL_MAX_PIXEL_MAP_TABLE";
-      case 0x00000d35: return "GL_MAX_ATTRIB_STACK_DEPTH";
-      case 0x00000d36: return "GL_MAX_MODELVIEW_STACK_DEPTH";
-      case 0x00000d37: return "GL_MAX_NAME_STACK_DEPTH";
-      case 0x00000d38: return "GL_MAX_PROJECTION_STACK_DEPTH";
-      case 0x00000d39: return "GL_MAX_TEXTURE_STACK_DEPTH";
-      case 0x00000d3a: return "GL_MAX_VIEWPORT_DIMS";
-      case 0x00000d3b: return "GL_MAX_CLIENT_ATTRIB_STACK_DEPTH";
-      case 0x00000d50: return "GL_SUBPIXEL_BITS";
-      case 0x00000d51: return "GL_INDEX_BITS";
-      case 0x00000d52: return "GL_RED_BITS";
-      case 0x00000d53: return "GL_GREEN_BITS";
-      case 0x00000d54: return "GL_BLUE_BITS";
-      case 0x00000d55: return "GL_ALPHA_BITS";
-      case 0x00000d56: return "GL_DEPTH_BITS";
-      case 0x00000d57: return "GL_STENCIL_BITS";
-      case 0x00000d58: return "GL_ACCUM_RED_BITS";
-      case 0x00000d59: return "GL_ACCUM_GREEN_BITS";
-      case 0x00000d5a: return "GL_ACCUM_BLUE_BITS";
-      case 0x00000d5b: return "GL_ACCUM_ALPHA_BITS";
-      case 0x00000d70: return "GL_NAME_STACK_DEPTH";
-      case 0x00000d80: return "GL_AUTO_NORMAL";
-      case 0x00000d90: return "GL_MAP1_COLOR_4";
-      case 0x00000d91: return "GL_MAP1_INDEX";
-      case 0x00000d92: return "GL_MAP1_NORMAL";
-      case 0x00000d93: return "GL_MAP1_TEXTURE_COORD_1";
-      case 0x00000d94: return "GL_MAP1_TEXTURE_COORD_2";
-      case 0x00000d95: return "GL_MAP1_TEXTURE_COORD_3";
-      case 0x00000d96: return "GL_MAP1_TEXTURE_COORD_4";
-      case 0x00000d97: return "GL_MAP1_VERTEX_3";
-      case 0x00000d98: return "GL_MAP1_VERTEX_4";
-      case 0x00000db0: return "GL_MAP2_COLOR_4";
-      case 0x00000db1: return "GL_MAP2_INDEX";
-      case 0x00000db2: return "GL_MAP2_NORMAL";
-      case 0x00000db3: return "GL_MAP2_TEXTURE_COORD_1";
-      case 0x00000db4: return "GL_MAP2_TEXTURE_COORD_2";
-      case 0x00000db5: return "GL_MAP2_TEXTURE_COORD_3";
-      case 0x00000db6: return "GL_MAP2_TEXTURE_COORD_4";
-      case 0x00000db7: return "GL_MAP2_VERTEX_3";
-      case 0x00000db8: return "GL_MAP2_VERTEX_4";
-      case 0x00000dd0: return "GL_MAP1_GRID_DOMAIN";
-      case 0x00000dd1: return "GL_MAP1_GRID_SEGMENTS";
-      case 0x00000dd2: return "GL_MAP2_GRID_DOMAIN";
-      case 0x00000dd3: return "GL_MAP2_GRID_SEGMENTS";
-      case 0x00000de0: return "GL_TEXTURE_1D";
-      case 0x00000de1: return "GL_TEXTURE_2D";
-      case 0x00000df0: return "GL_FEEDBACK_BUFFER_POINTER";
-      case 0x00000df1: return "GL_FEEDBACK_BUFFER_SIZE";
-      case 0x00000df2: return "GL_FEEDBACK_BUFFER_TYPE";
-      case 0x00000df3: return "GL_SELECTION_BUFFER_POINTER";
-      case 0x00000df4: return "GL_SELECTION_BUFFER_SIZE";
-      case 0x00001000: return "GL_TEXTURE_WIDTH";
-      case 0x00001001: return "GL_TEXTURE_HEIGHT";
-      case 0x00001003: return "GL_TEXTURE_INTERNAL_FORMAT";
-      case 0x00001004: return "GL_TEXTURE_BORDER_COLOR";
-      case 0x00001005: return "GL_TEXTURE_BORDER";
-      case 0x00001100: return "GL_DONT_CARE";
-      case 0x00001101: return "GL_FASTEST";
-      case 0x00001102: return "GL_NICEST";
-      case 0x00001200: return "GL_AMBIENT";
-      case 0x00001201: return "GL_DIFFUSE";
-      case 0x00001202: return "GL_SPECULAR";
-      case 0x00001203: return "GL_POSITION";
-      case 0x00001204: return "GL_SPOT_DIRECTION";
-      case 0x00001205: return "GL_SPOT_EXPONENT";
-      case 0x00001206: return "GL_SPOT_CUTOFF";
-      case 0x00001207: return "GL_CONSTANT_ATTENUATION";
-      case 0x00001208: return "GL_LINEAR_ATTENUATION";
-      case 0x00001209: return "GL_QUADRATIC_ATTENUATION";
-      case 0x00001300: return "GL_COMPILE";
-      case 0x00001301: return "GL_COMPILE_AND_EXECUTE";
-      case 0x00001400: return "GL_BYTE";
-      case 0x00001401: return "GL_UNSIGNED_BYTE";
-      case 0x00001402: return "GL_SHORT";
-      case 0x00001403: return "GL_UNSIGNED_SHORT";
-      case 0x00001404: return "GL_INT";
-      case 0x00001405: return "GL_UNSIGNED_INT";
-      case 0x00001406: return "GL_FLOAT";
-      case 0x00001407: return "GL_2_BYTES";
-      case 0x00001408: return "GL_3_BYTES";
-      case 0x00001409: return "GL_4_BYTES";
-      case 0x0000140a: return "GL_DOUBLE";
-      case 0x0000140b: return "GL_HALF_FLOAT";
-      case 0x0000140c: return "GL_FIXED";
-      case 0x0000140e: return "GL_INT64_NV";
-      case 0x0000140f: return "GL_UNSIGNED_INT64_ARB";
-      case 0x00001500: return "GL_CLEAR";
-      case 0x00001501: return "GL_AND";
-      case 0x00001502: return "GL_AND_REVERSE";
-      case 0x00001503: return "GL_COPY";
-      case 0x00001504: return "GL_AND_INVERTED";
-      case 0x00001505: return "GL_NOOP";
-      case 0x00001506: return "GL_XOR";
-      case 0x00001507: return "GL_OR";
-      case 0x00001508: return "GL_NOR";
-      case 0x00001509: return "GL_EQUIV";
-      case 0x0000150a: return "GL_INVERT";
-      case 0x0000150b: return "GL_OR_REVERSE";
-      case 0x0000150c: return "GL_COPY_INVERTED";
-      case 0x0000150d: return "GL_OR_INVERTED";
-      case 0x0000150e: return "GL_NAND";
-      case 0x0000150f: return "GL_SET";
-      case 0x00001600: return "GL_EMISSION";
-      case 0x00001601: return "GL_SHININESS";
-      case 0x00001602: return "GL_AMBIENT_AND_DIFFUSE";
-      case 0x00001603: return "GL_COLOR_INDEXES";
-      case 0x00001700: return "GL_MODELVIEW";
-      case 0x00001701: return "GL_PROJECTION";
-      case 0x00001702: return "GL_TEXTURE";
-      case 0x00001800: return "GL_COLOR";
-      case 0x00001801: return "GL_DEPTH";
-      case 0x00001802: return "GL_STENCIL";
-      case 0x00001900: return "GL_COLOR_INDEX";
-      case 0x00001901: return "GL_STENCIL_INDEX";
-      case 0x00001902: return "GL_DEPTH_COMPONENT";
-      case 0x00001903: return "GL_RED";
-      case 0x00001904: return "GL_GREEN";
-      case 0x00001905: return "GL_BLUE";
-      case 0x00001906: return "GL_ALPHA";
-      case 0x00001907: return "GL_RGB";
-      case 0x00001908: return "GL_RGBA";
-      case 0x00001909: return "GL_LUMINANCE";
-      case 0x0000190a: return "GL_LUMINANCE_ALPHA";
-      case 0x00001a00: return "GL_BITMAP";
-      case 0x00001b00: return "GL_POINT";
-      case 0x00001b01: return "GL_LINE";
-      case 0x00001b02: return "GL_FILL";
-      case 0x00001c00: return "GL_RENDER";
-      case 0x00001c01: return "GL_FEEDBACK";
-      case 0x00001c02: return "GL_SELECT";
-      case 0x00001d00: return "GL_FLAT";
-      case 0x00001d01: return "GL_SMOOTH";
-      case 0x00001e00: return "GL_KEEP";
-      case 0x00001e01: return "GL_REPLACE";
-      case 0x00001e02: return "GL_INCR";
-      case 0x00001e03: return "GL_DECR";
-      case 0x00001f00: return "GL_VENDOR";
-      case 0x00001f01: return "GL_RENDERER";
-      case 0x00001f02: return "GL_VERSION";
-      case 0x00001f03: return "GL_EXTENSIONS";
-      case 0x00002000: return "GL_S";
-      case 0x00002001: return "GL_T";
-      case 0x00002002: return "GL_R";
-      case 0x00002003: return "GL_Q";
-      case 0x00002100: return "GL_MODULATE";
-      case 0x00002101: return "GL_DECAL";
-      case 0x00002200: return "GL_TEXTURE_ENV_MODE";
-      case 0x00002201: return "GL_TEXTURE_ENV_COLOR";
-      case 0x00002300: return "GL_TEXTURE_ENV";
-      case 0x00002400: return "GL_EYE_LINEAR";
-      case 0x00002401: return "GL_OBJECT_LINEAR";
-      case 0x00002402: return "GL_SPHERE_MAP";
-      case 0x00002500: return "GL_TEXTURE_GEN_MODE";
-      case 0x00002501: return "GL_OBJECT_PLANE";
-      case 0x00002502: return "GL_EYE_PLANE";
-      case 0x00002600: return "GL_NEAREST";
-      case 0x00002601: return "GL_LINEAR";
-      case 0x00002700: return "GL_NEAREST_MIPMAP_NEAREST";
-      case 0x00002701: return "GL_LINEAR_MIPMAP_NEAREST";
-      case 0x00002702: return "GL_NEAREST_MIPMAP_LINEAR";
-      case 0x00002703: return "GL_LINEAR_MIPMAP_LINEAR";
-      case 0x00002800: return "GL_TEXTURE_MAG_FILTER";
-      case 0x00002801: return "GL_TEXTURE_MIN_FILTER";
-      case 0x00002802: return "GL_TEXTURE_WRAP_S";
-      case 0x00002803: return "GL_TEXTURE_WRAP_T";
-      case 0x00002900: return "GL_CLAMP";
-      case 0x00002901: return "GL_REPEAT";
-      case 0x00002a00: return "GL_POLYGON_OFFSET_UNITS";
-      case 0x00002a01: return "GL_POLYGON_OFFSET_POINT";
-      case 0x00002a02: return "GL_POLYGON_OFFSET_LINE";
-      case 0x00002a10: return "GL_R3_G3_B2";
-      case 0x00002a20: return "GL_V2F";
-      case 0x00002a21: return "GL_V3F";
-      case 0x00002a22: return "GL_C4UB_V2F";
-      case 0x00002a23: return "GL_C4UB_V3F";
-      case 0x00002a24: return "GL_C3F_V3F";
-      case 0x00002a25: return "GL_N3F_V3F";
-      case 0x00002a26: return "GL_C4F_N3F_V3F";
-      case 0x00002a27: return "GL_T2F_V3F";
-      case 0x00002a28: return "GL_T4F_V4F";
-      case 0x00002a29: return "GL_T2F_C4UB_V3F";
-      case 0x00002a2a: return "GL_T2F_C3F_V3F";
-      case 0x00002a2b: return "GL_T2F_N3F_V3F";
-      case 0x00002a2c: return "GL_T2F_C4F_N3F_V3F";
-      case 0x00002a2d: return "GL_T4F_C4F_N3F_V4F";
-      case 0x00003000: return "GL_CLIP_PLANE0";
-      case 0x00003001: return "GL_CLIP_PLANE1";
-      case 0x00003002: return "GL_CLIP_PLANE2";
-      case 0x00003003: return "GL_CLIP_PLANE3";
-      case 0x00003004: return "GL_CLIP_PLANE4";
-      case 0x00003005: return "GL_CLIP_PLANE5";
-      case 0x00003006: return "GL_CLIP_PLANE6";
-      case 0x00003007: return "GL_CLIP_PLANE7";
-      case 0x000030e0: return "GL_EGL_COVERAGE_BUFFERS_NV";
-      case 0x000030e1: return "GL_EGL_COVERAGE_SAMPLES_NV";
-      case 0x000030e2: return "GL_EGL_DEPTH_ENCODING_NV";
-      case 0x000030e3: return "GL_EGL_DEPTH_ENCODING_NONLINEAR_NV";
-      case 0x00004000: return "GL_LIGHT0";
-      case 0x00004001: return "GL_LIGHT1";
-      case 0x00004002: return "GL_LIGHT2";
-      case 0x00004003: return "GL_LIGHT3";
-      case 0x00004004: return "GL_LIGHT4";
-      case 0x00004005: return "GL_LIGHT5";
-      case 0x00004006: return "GL_LIGHT6";
-      case 0x00004007: return "GL_LIGHT7";
-      case 0x00008000: return "GL_ABGR_EXT";
-      case 0x00008001: return "GL_CONSTANT_COLOR";
-      case 0x00008002: return "GL_ONE_MINUS_CONSTANT_COLOR";
-      case 0x00008003: return "GL_CONSTANT_ALPHA";
-      case 0x00008004: return "GL_ONE_MINUS_CONSTANT_ALPHA";
-      case 0x00008005: return "GL_BLEND_COLOR";
-      case 0x00008006: return "GL_FUNC_ADD";
-      case 0x00008007: return "GL_MIN";
-      case 0x00008008: return "GL_MAX";
-      case 0x00008009: return "GL_BLEND_EQUATION";
-      case 0x0000800a: return "GL_FUNC_SUBTRACT";
-      case 0x0000800b: return "GL_FUNC_REVERSE_SUBTRACT";
-      case 0x0000800c: return "GL_CMYK_EXT";
-      case 0x0000800d: return "GL_CMYKA_EXT";
-      case 0x0000800e: return "GL_PACK_CMYK_HINT_EXT";
-      case 0x0000800f: return "GL_UNPACK_CMYK_HINT_EXT";
-      case 0x00008010: return "GL_CONVOLUTION_1D";
-      case 0x00008011: return "GL_CONVOLUTION_2D";
-      case 0x00008012: return "GL_SEPARABLE_2D";
-      case 0x00008013: return "GL_CONVOLUTION_BORDER_MODE";
-      case 0x00008014: return "GL_CONVOLUTION_FILTER_SCALE";
-      case 0x00008015: return "GL_CONVOLUTION_FILTER_BIAS";
-      case 0x00008016: return "GL_REDUCE";
-      case 0x00008017: return "GL_CONVOLUTION_FORMAT";
-      case 0x00008018: return "GL_CONVOLUTION_WIDTH";
-      case 0x00008019: return "GL_CONVOLUTION_HEIGHT";
-      case 0x0000801a: return "GL_MAX_CONVOLUTION_WIDTH";
-      case 0x0000801b: return "GL_MAX_CONVOLUTION_HEIGHT";
-      case 0x0000801c: return "GL_POST_CONVOLUTION_RED_SCALE";
-      case 0x0000801d: return "GL_POST_CONVOLUTION_GREEN_SCALE";
-      case 0x0000801e: return "GL_POST_CONVOLUTION_BLUE_SCALE";
-      case 0x0000801f: return "GL_POST_CONVOLUTION_ALPHA_SCALE";
-      case 0x00008020: return "GL_POST_CONVOLUTION_RED_BIAS";
-      case 0x00008021: return "GL_POST_CONVOLUTION_GREEN_BIAS";
-      case 0x00008022: return "GL_POST_CONVOLUTION_BLUE_BIAS";
-      case 0x00008023: return "GL_POST_CONVOLUTION_ALPHA_BIAS";
-      case 0x00008024: return "GL_HISTOGRAM";
-      case 0x00008025: return "GL_PROXY_HISTOGRAM";
-      case 0x00008026: return "GL_HISTOGRAM_WIDTH";
-      case 0x00008027: return "GL_HISTOGRAM_FORMAT";
-      case 0x00008028: return "GL_HISTOGRAM_RED_SIZE";
-      case 0x00008029: return "GL_HISTOGRAM_GREEN_SIZE";
-      case 0x0000802a: return "GL_HISTOGRAM_BLUE_SIZE";
-      case 0x0000802b: return "GL_HISTOGRAM_ALPHA_SIZE";
-      case 0x0000802c: return "GL_HISTOGRAM_LUMINANCE_SIZE";
-      case 0x0000802d: return "GL_HISTOGRAM_SINK";
-      case 0x0000802e: return "GL_MINMAX";
-      case 0x0000802f: return "GL_MINMAX_FORMAT";
-      case 0x00008030: return "GL_MINMAX_SINK";
-      case 0x00008031: return "GL_TABLE_TOO_LARGE";
-      case 0x00008032: return "GL_UNSIGNED_BYTE_3_3_2";
-      case 0x00008033: return "GL_UNSIGNED_SHORT_4_4_4_4";
-      case 0x00008034: return "GL_UNSIGNED_SHORT_5_5_5_1";
-      case 0x00008035: return "GL_UNSIGNED_INT_8_8_8_8";
-      case 0x00008036: return "GL_UNSIGNED_INT_10_10_10_2";
-      case 0x00008037: return "GL_POLYGON_OFFSET_FILL";
-      case 0x00008038: return "GL_POLYGON_OFFSET_FACTOR";
-      case 0x00008039: return "GL_POLYGON_OFFSET_BIAS_EXT";
-      case 0x0000803a: return "GL_RESCALE_NORMAL";
-      case 0x0000803b: return "GL_ALPHA4";
-      case 0x0000803c: return "GL_ALPHA8";
-      case 0x0000803d: return "GL_ALPHA12";
-      case 0x0000803e: return "GL_ALPHA16";
-      case 0x0000803f: return "GL_LUMINANCE4";
-      case 0x00008040: return "GL_LUMINANCE8";
-      case 0x00008041: return "GL_LUMINANCE12";
-      case 0x00008042: return "GL_LUMINANCE16";
-      case 0x00008043: return "GL_LUMINANCE4_ALPHA4";
-      case 0x00008044: return "GL_LUMINANCE6_ALPHA2";
-      case 0x00008045: return "GL_LUMINANCE8_ALPHA8";
-      case 0x00008046: return "GL_LUMINANCE12_ALPHA4";
-      case 0x00008047: return "GL_LUMINANCE12_ALPHA12";
-      case 0x00008048: return "GL_LUMINANCE16_ALPHA16";
-      case 0x00008049: return "GL_INTENSITY";
-      case 0x0000804a: return "GL_INTENSITY4";
-      case 0x0000804b: return "GL_INTENSITY8";
-      case 0x0000804c: return "GL_INTENSITY12";
-      case 0x0000804d: return "GL_INTENSITY16";
-      case 0x0000804e: return "GL_RGB2_EXT";
-      case 0x0000804f: return "GL_RGB4";
-      case 0x00008050: return "GL_RGB5";
-      case 0x00008051: return "GL_RGB8";
-      case 0x00008052: return "GL_RGB10";
-      case 0x00008053: return "GL_RGB12";
-      case 0x00008054: return "GL_RGB16";
-      case 0x00008055: return "GL_RGBA2";
-      case 0x00008056: return "GL_RGBA4";
-      case 0x00008057: return "GL_RGB5_A1";
-      case 0x00008058: return "GL_RGBA8";
-      case 0x00008059: return "GL_RGB10_A2";
-      case 0x0000805a: return "GL_RGBA12";
-      case 0x0000805b: return "GL_RGBA16";
-      case 0x0000805c: return "GL_TEXTURE_RED_SIZE";
-      case 0x0000805d: return "GL_TEXTURE_GREEN_SIZE";
-      case 0x0000805e: return "GL_TEXTURE_BLUE_SIZE";
-      case 0x0000805f: return "GL_TEXTURE_ALPHA_SIZE";
-      case 0x00008060: return "GL_TEXTURE_LUMINANCE_SIZE";
-      case 0x00008061: return "GL_TEXTURE_INTENSITY_SIZE";
-      case 0x00008062: return "GL_REPLACE_EXT";
-      case 0x00008063: return "GL_PROXY_TEXTURE_1D";
-      case 0x00008064: return "GL_PROXY_TEXTURE_2D";
-      case 0x00008066: return "GL_TEXTURE_PRIORITY";
-      case 0x00008067: return "GL_TEXTURE_RESIDENT";
-      case 0x00008068: return "GL_TEXTURE_BINDING_1D";
-      case 0x00008069: return "GL_TEXTURE_BINDING_2D";
-      case 0x0000806a: return "GL_TEXTURE_BINDING_3D";
-      case 0x0000806b: return "GL_PACK_SKIP_IMAGES";
-      case 0x0000806c: return "GL_PACK_IMAGE_HEIGHT";
-      case 0x0000806d: return "GL_UNPACK_SKIP_IMAGES";
-      case 0x0000806e: return "GL_UNPACK_IMAGE_HEIGHT";
-      case 0x0000806f: return "GL_TEXTURE_3D";
-      case 0x00008070: return "GL_PROXY_TEXTURE_3D";
-      case 0x00008071: return "GL_TEXTURE_DEPTH";
-      case 0x00008072: return "GL_TEXTURE_WRAP_R";
-      case 0x00008073: return "GL_MAX_3D_TEXTURE_SIZE";
-      case 0x00008074: return "GL_VERTEX_ARRAY";
-      case 0x00008075: return "GL_NORMAL_ARRAY";
-      case 0x00008076: return "GL_COLOR_ARRAY";
-      case 0x00008077: return "GL_INDEX_ARRAY";
-      case 0x00008078: return "GL_TEXTURE_COORD_ARRAY";
-      case 0x00008079: return "GL_EDGE_FLAG_ARRAY";
-      case 0x0000807a: return "GL_VERTEX_ARRAY_SIZE";
-      case 0x0000807b: return "GL_VERTEX_ARRAY_TYPE";
-      case 0x0000807c: return "GL_VERTEX_ARRAY_STRIDE";
-      case 0x0000807d: return "GL_VERTEX_ARRAY_COUNT_EXT";
-      case 0x0000807e: return "GL_NORMAL_ARRAY_TYPE";
-      case 0x0000807f: return "GL_NORMAL_ARRAY_STRIDE";
-      case 0x00008080: return "GL_NORMAL_ARRAY_COUNT_EXT";
-      case 0x00008081: return "GL_COLOR_ARRAY_SIZE";
-      case 0x00008082: return "GL_COLOR_ARRAY_TYPE";
-      case 0x00008083: return "GL_COLOR_ARRAY_STRIDE";
-      case 0x00008084: return "GL_COLOR_ARRAY_COUNT_EXT";
-      case 0x00008085: return "GL_INDEX_ARRAY_TYPE";
-      case 0x00008086: return "GL_INDEX_ARRAY_STRIDE";
-      case 0x00008087: return "GL_INDEX_ARRAY_COUNT_EXT";
-      case 0x00008088: return "GL_TEXTURE_COORD_ARRAY_SIZE";
-      case 0x00008089: return "GL_TEXTURE_COORD_ARRAY_TYPE";
-      case 0x0000808a: return "GL_TEXTURE_COORD_ARRAY_STRIDE";
-      case 0x0000808b: return "GL_TEXTURE_COORD_ARRAY_COUNT_EXT";
-      case 0x0000808c: return "GL_EDGE_FLAG_ARRAY_STRIDE";
-      case 0x0000808d: return "GL_EDGE_FLAG_ARRAY_COUNT_EXT";
-      case 0x0000808e: return "GL_VERTEX_ARRAY_POINTER";
-      case 0x0000808f: return "GL_NORMAL_ARRAY_POINTER";
-      case 0x00008090: return "GL_COLOR_ARRAY_POINTER";
-      case 0x00008091: return "GL_INDEX_ARRAY_POINTER";
-      case 0x00008092: return "GL_TEXTURE_COORD_ARRAY_POINTER";
-      case 0x00008093: return "GL_EDGE_FLAG_ARRAY_POINTER";
-      case 0x00008094: return "GL_INTERLACE_SGIX";
-      case 0x00008095: return "GL_DETAIL_TEXTURE_2D_SGIS";
-      case 0x00008096: return "GL_DETAIL_TEXTURE_2D_BINDING_SGIS";
-      case 0x00008097: return "GL_LINEAR_DETAIL_SGIS";
-      case 0x00008098: return "GL_LINEAR_DETAIL_ALPHA_SGIS";
-      case 0x00008099: return "GL_LINEAR_DETAIL_COLOR_SGIS";
-      case 0x0000809a: return "GL_DETAIL_TEXTURE_LEVEL_SGIS";
-      case 0x0000809b: return "GL_DETAIL_TEXTURE_MODE_SGIS";
-      case 0x0000809c: return "GL_DETAIL_TEXTURE_FUNC_POINTS_SGIS";
-      case 0x0000809d: return "GL_MULTISAMPLE";
-      case 0x0000809e: return "GL_SAMPLE_ALPHA_TO_COVERAGE";
-      case 0x0000809f: return "GL_SAMPLE_ALPHA_TO_ONE";
-      case 0x000080a0: return "GL_SAMPLE_COVERAGE";
-      case 0x000080a1: return "GL_1PASS_EXT";
-      case 0x000080a2: return "GL_2PASS_0_EXT";
-      case 0x000080a3: return "GL_2PASS_1_EXT";
-      case 0x000080a4: return "GL_4PASS_0_EXT";
-      case 0x000080a5: return "GL_4PASS_1_EXT";
-      case 0x000080a6: return "GL_4PASS_2_EXT";
-      case 0x000080a7: return "GL_4PASS_3_EXT";
-      case 0x000080a8: return "GL_SAMPLE_BUFFERS";
-      case 0x000080a9: return "GL_SAMPLES";
-      case 0x000080aa: return "GL_SAMPLE_COVERAGE_VALUE";
-      case 0x000080ab: return "GL_SAMPLE_COVERAGE_INVERT";
-      case 0x000080ac: return "GL_SAMPLE_PATTERN_EXT";
-      case 0x000080b1: return "GL_COLOR_MATRIX";
-      case 0x000080b2: return "GL_COLOR_MATRIX_STACK_DEPTH";
-      case 0x000080b3: return "GL_MAX_COLOR_MATRIX_STACK_DEPTH";
-      case 0x000080b4: return "GL_POST_COLOR_MATRIX_RED_SCALE";
-      case 0x000080b5: return "GL_POST_COLOR_MATRIX_GREEN_SCALE";
-      case 0x000080b6: return "GL_POST_COLOR_MATRIX_BLUE_SCALE";
-      case 0x000080b7: return "GL_POST_COLOR_MATRIX_ALPHA_SCALE";
-      case 0x000080b8: return "GL_POST_COLOR_MATRIX_RED_BIAS";
-      case 0x000080b9: return "GL_POST_COLOR_MATRIX_GREEN_BIAS";
-      case 0x000080ba: return "GL_POST_COLOR_MATRIX_BLUE_BIAS";
-      case 0x000080bb: return "GL_POST_COLOR_MATRIX_ALPHA_BIAS";
-      case 0x000080bc: return "GL_TEXTURE_COLOR_TABLE_SGI";
-      case 0x000080bd: return "GL_PROXY_TEXTURE_COLOR_TABLE_SGI";
-      case 0x000080bf: return "GL_TEXTURE_COMPARE_FAIL_VALUE_ARB";
-      case 0x000080c8: return "GL_BLEND_DST_RGB";
-      case 0x000080c9: return "GL_BLEND_SRC_RGB";
-      case 0x000080ca: return "GL_BLEND_DST_ALPHA";
-      case 0x000080cb: return "GL_BLEND_SRC_ALPHA";
-      case 0x000080cc: return "GL_422_EXT";
-      case 0x000080cd: return "GL_422_REV_EXT";
-      case 0x000080ce: return "GL_422_AVERAGE_EXT";
-      case 0x000080cf: return "GL_422_REV_AVERAGE_EXT";
-      case 0x000080d0: return "GL_COLOR_TABLE";
-      case 0x000080d1: return "GL_POST_CONVOLUTION_COLOR_TABLE";
-      case 0x000080d2: return "GL_POST_COLOR_MATRIX_COLOR_TABLE";
-      case 0x000080d3: return "GL_PROXY_COLOR_TABLE";
-      case 0x000080d4: return "GL_PROXY_POST_CONVOLUTION_COLOR_TABLE";
-      case 0x000080d5: return "GL_PROXY_POST_COLOR_MATRIX_COLOR_TABLE";
-      case 0x000080d6: return "GL_COLOR_TABLE_SCALE";
-      case 0x000080d7: return "GL_COLOR_TABLE_BIAS";
-      case 0x000080d8: return "GL_COLOR_TABLE_FORMAT";
-      case 0x000080d9: return "GL_COLOR_TABLE_WIDTH";
-      case 0x000080da: return "GL_COLOR_TABLE_RED_SIZE";
-      case 0x000080db: return "GL_COLOR_TABLE_GREEN_SIZE";
-      case 0x000080dc: return "GL_COLOR_TABLE_BLUE_SIZE";
-      case 0x000080dd: return "GL_COLOR_TABLE_ALPHA_SIZE";
-      case 0x000080de: return "GL_COLOR_TABLE_LUMINANCE_SIZE";
-      case 0x000080df: return "GL_COLOR_TABLE_INTENSITY_SIZE";
-      case 0x000080e0: return "GL_BGR";
-      case 0x000080e1: return "GL_BGRA";
-      case 0x000080e2: return "GL_COLOR_INDEX1_EXT";
-      case 0x000080e3: return "GL_COLOR_INDEX2_EXT";
-      case 0x000080e4: return "GL_COLOR_INDEX4_EXT";
-      case 0x000080e5: return "GL_COLOR_INDEX8_EXT";
-      case 0x000080e6: return "GL_COLOR_INDEX12_EXT";
-      case 0x000080e7: return "GL_COLOR_INDEX16_EXT";
-      case 0x000080e8: return "GL_MAX_ELEMENTS_VERTICES";
-      case 0x000080e9: return "GL_MAX_ELEMENTS_INDICES";
-      case 0x000080ea: return "GL_PHONG_WIN";
-      case 0x000080eb: return "GL_PHONG_HINT_WIN";
-      case 0x000080ec: return "GL_FOG_SPECULAR_TEXTURE_WIN";
-      case 0x000080ed: return "GL_TEXTURE_INDEX_SIZE_EXT";
-      case 0x000080ee: return "GL_PARAMETER_BUFFER_ARB";
-      case 0x000080ef: return "GL_PARAMETER_BUFFER_BINDING_ARB";
-      case 0x000080f0: return "GL_CLIP_VOLUME_CLIPPING_HINT_EXT";
-      case 0x00008126: return "GL_POINT_SIZE_MIN";
-      case 0x00008127: return "GL_POINT_SIZE_MAX";
-      case 0x00008128: return "GL_POINT_FADE_THRESHOLD_SIZE";
-      case 0x00008129: return "GL_POINT_DISTANCE_ATTENUATION";
-      case 0x0000812d: return "GL_CLAMP_TO_BORDER";
-      case 0x0000812e: return "GL_TEXTURE_MULTI_BUFFER_HINT_SGIX";
-      case 0x0000812f: return "GL_CLAMP_TO_EDGE";
-      case 0x0000813a: return "GL_TEXTURE_MIN_LOD";
-      case 0x0000813b: return "GL_TEXTURE_MAX_LOD";
-      case 0x0000813c: return "GL_TEXTURE_BASE_LEVEL";
-      case 0x0000813d: return "GL_TEXTURE_MAX_LEVEL";
-      case 0x00008150: return "GL_IGNORE_BORDER";
-      case 0x00008151: return "GL_CONSTANT_BORDER";
-      case 0x00008152: return "GL_WRAP_BORDER";
-      case 0x00008153: return "GL_REPLICATE_BORDER";
-      case 0x00008154: return "GL_CONVOLUTION_BORDER_COLOR";
-      case 0x00008155: return "GL_IMAGE_SCALE_X_HP";
-      case 0x00008156: return "GL_IMAGE_SCALE_Y_HP";
-      case 0x00008157: return "GL_IMAGE_TRANSLATE_X_HP";
-      case 0x00008158: return "GL_IMAGE_TRANSLATE_Y_HP";
-      case 0x00008159: return "GL_IMAGE_ROTATE_ANGLE_HP";
-      case 0x0000815a: return "GL_IMAGE_ROTATE_ORIGIN_X_HP";
-      case 0x0000815b: return "GL_IMAGE_ROTATE_ORIGIN_Y_HP";
-      case 0x0000815c: return "GL_IMAGE_MAG_FILTER_HP";
-      case 0x0000815d: return "GL_IMAGE_MIN_FILTER_HP";
-      case 0x0000815e: return "GL_IMAGE_CUBIC_WEIGHT_HP";
-      case 0x0000815f: return "GL_CUBIC_HP";
-      case 0x00008160: return "GL_AVERAGE_HP";
-      case 0x00008161: return "GL_IMAGE_TRANSFORM_2D_HP";
-      case 0x00008162: return "GL_POST_IMAGE_TRANSFORM_COLOR_TABLE_HP";
-      case 0x00008163: return "GL_PROXY_POST_IMAGE_TRANSFORM_COLOR_TABLE_HP";
-      case 0x00008165: return "GL_OCCLUSION_TEST_HP";
-      case 0x00008166: return "GL_OCCLUSION_TEST_RESULT_HP";
-      case 0x00008179: return "GL_POST_TEXTURE_FILTER_BIAS_SGIX";
-      case 0x0000817a: return "GL_POST_TEXTURE_FILTER_SCALE_SGIX";
-      case 0x0000817b: return "GL_POST_TEXTURE_FILTER_BIAS_RANGE_SGIX";
-      case 0x0000817c: return "GL_POST_TEXTURE_FILTER_SCALE_RANGE_SGIX";
-      case 0x00008191: return "GL_GENERATE_MIPMAP";
-      case 0x00008192: return "GL_GENERATE_MIPMAP_HINT";
-      case 0x00008198: return "GL_FOG_OFFSET_SGIX";
-      case 0x00008199: return "GL_FOG_OFFSET_VALUE_SGIX";
-      case 0x0000819a: return "GL_TEXTURE_COMPARE_SGIX";
-      case 0x0000819b: return "GL_TEXTURE_COMPARE_OPERATOR_SGIX";
-      case 0x0000819c: return "GL_TEXTURE_LEQUAL_R_SGIX";
-      case 0x0000819d: return "GL_TEXTURE_GEQUAL_R_SGIX";
-      case 0x000081a5: return "GL_DEPTH_COMPONENT16";
-      case 0x000081a6: return "GL_DEPTH_COMPONENT24";
-      case 0x000081a7: return "GL_DEPTH_COMPONENT32";
-      case 0x000081a8: return "GL_ARRAY_ELEMENT_LOCK_FIRST_EXT";
-      case 0x000081a9: return "GL_ARRAY_ELEMENT_LOCK_COUNT_EXT";
-      case 0x000081aa: return "GL_CULL_VERTEX_EXT";
-      case 0x000081ab: return "GL_CULL_VERTEX_EYE_POSITION_EXT";
-      case 0x000081ac: return "GL_CULL_VERTEX_OBJECT_POSITION_EXT";
-      case 0x000081bb: return "GL_YCRCB_422_SGIX";
-      case 0x000081bc: return "GL_YCRCB_444_SGIX";
-      case 0x000081d4: return "GL_WRAP_BORDER_SUN";
-      case 0x000081d5: return "GL_UNPACK_CONSTANT_DATA_SUNX";
-      case 0x000081d6: return "GL_TEXTURE_CONSTANT_DATA_SUNX";
-      case 0x000081d7: return "GL_TRIANGLE_LIST_SUN";
-      case 0x000081d8: return "GL_REPLACEMENT_CODE_SUN";
-      case 0x000081d9: return "GL_GLOBAL_ALPHA_SUN";
-      case 0x000081da: return "GL_GLOBAL_ALPHA_FACTOR_SUN";
-      case 0x000081f0: return "GL_EYE_DISTANCE_TO_POINT_SGIS";
-      case 0x000081f1: return "GL_OBJECT_DISTANCE_TO_POINT_SGIS";
-      case 0x000081f2: return "GL_EYE_DISTANCE_TO_LINE_SGIS";
-      case 0x000081f3: return "GL_OBJECT_DISTANCE_TO_LINE_SGIS";
-      case 0x000081f4: return "GL_EYE_POINT_SGIS";
-      case 0x000081f5: return "GL_OBJECT_POINT_SGIS";
-      case 0x000081f6: return "GL_EYE_LINE_SGIS";
-      case 0x000081f7: return "GL_OBJECT_LINE_SGIS";
-      case 0x000081f8: return "GL_LIGHT_MODEL_COLOR_CONTROL";
-      case 0x000081f9: return "GL_SINGLE_COLOR";
-      case 0x000081fa: return "GL_SEPARATE_SPECULAR_COLOR";
-      case 0x000081fb: return "GL_SHARED_TEXTURE_PALETTE_EXT";
-      case 0x00008200: return "GL_TEXT_FRAGMENT_SHADER_ATI";
-      case 0x00008210: return "GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING";
-      case 0x00008211: return "GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE";
-      case 0x00008212: return "GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE";
-      case 0x00008213: return "GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE";
-      case 0x00008214: return "GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE";
-      case 0x00008215: return "GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE";
-      case 0x00008216: return "GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE";
-      case 0x00008217: return "GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE";
-      case 0x00008218: return "GL_FRAMEBUFFER_DEFAULT";
-      case 0x00008219: return "GL_FRAMEBUFFER_UNDEFINED";
-      case 0x0000821a: return "GL_DEPTH_STENCIL_ATTACHMENT";
-      case 0x0000821b: return "GL_MAJOR_VERSION";
-      case 0x0000821c: return "GL_MINOR_VERSION";
-      case 0x0000821d: return "GL_NUM_EXTENSIONS";
-      case 0x0000821e: return "GL_CONTEXT_FLAGS";
-      case 0x0000821f: return "GL_BUFFER_IMMUTABLE_STORAGE";
-      case 0x00008220: return "GL_BUFFER_STORAGE_FLAGS";
-      case 0x00008221: return "GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED";
-      case 0x00008222: return "GL_INDEX";
-      case 0x00008223: return "GL_DEPTH_BUFFER";
-      case 0x00008224: return "GL_STENCIL_BUFFER";
-      case 0x00008225: return "GL_COMPRESSED_RED";
-      case 0x00008226: return "GL_COMPRESSED_RG";
-      case 0x00008227: return "GL_RG";
-      case 0x00008228: return "GL_RG_INTEGER";
-      case 0x00008229: return "GL_R8";
-      case 0x0000822a: return "GL_R16";
-      case 0x0000822b: return "GL_RG8";
-      case 0x0000822c: return "GL_RG16";
-      case 0x0000822d: return "GL_R16F";
-      case 0x0000822e: return "GL_R32F";
-      case 0x0000822f: return "GL_RG16F";
-      case 0x00008230: return "GL_RG32F";
-      case 0x00008231: return "GL_R8I";
-      case 0x00008232: return "GL_R8UI";
-      case 0x00008233: return "GL_R16I";
-      case 0x00008234: return "GL_R16UI";
-      case 0x00008235: return "GL_R32I";
-      case 0x00008236: return "GL_R32UI";
-      case 0x00008237: return "GL_RG8I";
-      case 0x00008238: return "GL_RG8UI";
-      case 0x00008239: return "GL_RG16I";
-      case 0x0000823a: return "GL_RG16UI";
-      case 0x0000823b: return "GL_RG32I";
-      case 0x0000823c: return "GL_RG32UI";
-      case 0x00008240: return "GL_SYNC_CL_EVENT_ARB";
-      case 0x00008241: return "GL_SYNC_CL_EVENT_COMPLETE_ARB";
-      case 0x00008242: return "GL_DEBUG_OUTPUT_SYNCHRONOUS";
-      case 0x00008243: return "GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH";
-      case 0x00008244: return "GL_DEBUG_CALLBACK_FUNCTION";
-      case 0x00008245: return "GL_DEBUG_CALLBACK_USER_PARAM";
-      case 0x00008246: return "GL_DEBUG_SOURCE_API";
-      case 0x00008247: return "GL_DEBUG_SOURCE_WINDOW_SYSTEM";
-      case 0x00008248: return "GL_DEBUG_SOURCE_SHADER_COMPILER";
-      case 0x00008249: return "GL_DEBUG_SOURCE_THIRD_PARTY";
-      case 0x0000824a: return "GL_DEBUG_SOURCE_APPLICATION";
-      case 0x0000824b: return "GL_DEBUG_SOURCE_OTHER";
-      case 0x0000824c: return "GL_DEBUG_TYPE_ERROR";
-      case 0x0000824d: return "GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR";
-      case 0x0000824e: return "GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR";
-      case 0x0000824f: return "GL_DEBUG_TYPE_PORTABILITY";
-      case 0x00008250: return "GL_DEBUG_TYPE_PERFORMANCE";
-      case 0x00008251: return "GL_DEBUG_TYPE_OTHER";
-      case 0x00008252: return "GL_LOSE_CONTEXT_ON_RESET_ARB";
-      case 0x00008253: return "GL_GUILTY_CONTEXT_RESET_ARB";
-      case 0x00008254: return "GL_INNOCENT_CONTEXT_RESET_ARB";
-      case 0x00008255: return "GL_UNKNOWN_CONTEXT_RESET_ARB";
-      case 0x00008256: return "GL_RESET_NOTIFICATION_STRATEGY_ARB";
-      case 0x00008257: return "GL_PROGRAM_BINARY_RETRIEVABLE_HINT";
-      case 0x00008258: return "GL_PROGRAM_SEPARABLE";
-      case 0x00008259: return "GL_ACTIVE_PROGRAM";
-      case 0x0000825a: return "GL_PROGRAM_PIPELINE_BINDING";
-      case 0x0000825b: return "GL_MAX_VIEWPORTS";
-      case 0x0000825c: return "GL_VIEWPORT_SUBPIXEL_BITS";
-      case 0x0000825d: return "GL_VIEWPORT_BOUNDS_RANGE";
-      case 0x0000825e: return "GL_LAYER_PROVOKING_VERTEX";
-      case 0x0000825f: return "GL_VIEWPORT_INDEX_PROVOKING_VERTEX";
-      case 0x00008260: return "GL_UNDEFINED_VERTEX";
-      case 0x00008261: return "GL_NO_RESET_NOTIFICATION_ARB";
-      case 0x00008262: return "GL_MAX_COMPUTE_SHARED_MEMORY_SIZE";
-      case 0x00008263: return "GL_MAX_COMPUTE_UNIFORM_COMPONENTS";
-      case 0x00008264: return "GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS";
-      case 0x00008265: return "GL_MAX_COMPUTE_ATOMIC_COUNTERS";
-      case 0x00008266: return "GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS";
-      case 0x00008267: return "GL_COMPUTE_WORK_GROUP_SIZE";
-      case 0x00008268: return "GL_DEBUG_TYPE_MARKER";
-      case 0x00008269: return "GL_DEBUG_TYPE_PUSH_GROUP";
-      case 0x0000826a: return "GL_DEBUG_TYPE_POP_GROUP";
-      case 0x0000826b: return "GL_DEBUG_SEVERITY_NOTIFICATION";
-      case 0x0000826c: return "GL_MAX_DEBUG_GROUP_STACK_DEPTH";
-      case 0x0000826d: return "GL_DEBUG_GROUP_STACK_DEPTH";
-      case 0x0000826e: return "GL_MAX_UNIFORM_LOCATIONS";
-      case 0x0000826f: return "GL_INTERNALFORMAT_SUPPORTED";
-      case 0x00008270: return "GL_INTERNALFORMAT_PREFERRED";
-      case 0x00008271: return "GL_INTERNALFORMAT_RED_SIZE";
-      case 0x00008272: return "GL_INTERNALFORMAT_GREEN_SIZE";
-      case 0x00008273: return "GL_INTERNALFORMAT_BLUE_SIZE";
-      case 0x00008274: return "GL_INTERNALFORMAT_ALPHA_SIZE";
-      case 0x00008275: return "GL_INTERNALFORMAT_DEPTH_SIZE";
-      case 0x00008276: return "GL_INTERNALFORMAT_STENCIL_SIZE";
-      case 0x00008277: return "GL_INTERNALFORMAT_SHARED_SIZE";
-      case 0x00008278: return "GL_INTERNALFORMAT_RED_TYPE";
-      case 0x00008279: return "GL_INTERNALFORMAT_GREEN_TYPE";
-      case 0x0000827a: return "GL_INTERNALFORMAT_BLUE_TYPE";
-      case 0x0000827b: return "GL_INTERNALFORMAT_ALPHA_TYPE";
-      case 0x0000827c: return "GL_INTERNALFORMAT_DEPTH_TYPE";
-      case 0x0000827d: return "GL_INTERNALFORMAT_STENCIL_TYPE";
-      case 0x0000827e: return "GL_MAX_WIDTH";
-      case 0x0000827f: return "GL_MAX_HEIGHT";
-      case 0x00008280: return "GL_MAX_DEPTH";
-      case 0x00008281: return "GL_MAX_LAYERS";
-      case 0x00008282: return "GL_MAX_COMBINED_DIMENSIONS";
-      case 0x00008283: return "GL_COLOR_COMPONENTS";
-      case 0x00008284: return "GL_DEPTH_COMPONENTS";
-      case 0x00008285: return "GL_STENCIL_COMPONENTS";
-      case 0x00008286: return "GL_COLOR_RENDERABLE";
-      case 0x00008287: return "GL_DEPTH_RENDERABLE";
-      case 0x00008288: return "GL_STENCIL_RENDERABLE";
-      case 0x00008289: return "GL_FRAMEBUFFER_RENDERABLE";
-      case 0x0000828a: return "GL_FRAMEBUFFER_RENDERABLE_LAYERED";
-      case 0x0000828b: return "GL_FRAMEBUFFER_BLEND";
-      case 0x0000828c: return "GL_READ_PIXELS";
-      case 0x0000828d: return "GL_READ_PIXELS_FORMAT";
-      case 0x0000828e: return "GL_READ_PIXELS_TYPE";
-      case 0x0000828f: return "GL_TEXTURE_IMAGE_FORMAT";
-      case 0x00008290: return "GL_TEXTURE_IMAGE_TYPE";
-      case 0x00008291: return "GL_GET_TEXTURE_IMAGE_FORMAT";
-      case 0x00008292: return "GL_GET_TEXTURE_IMAGE_TYPE";
-      case 0x00008293: return "GL_MIPMAP";
-      case 0x00008294: return "GL_MANUAL_GENERATE_MIPMAP";
-      case 0x00008295: return "GL_AUTO_GENERATE_MIPMAP";
-      case 0x00008296: return "GL_COLOR_ENCODING";
-      case 0x00008297: return "GL_SRGB_READ";
-      case 0x00008298: return "GL_SRGB_WRITE";
-      case 0x00008299: return "GL_SRGB_DECODE_ARB";
-      case 0x0000829a: return "GL_FILTER";
-      case 0x0000829b: return "GL_VERTEX_TEXTURE";
-      case 0x0000829c: return "GL_TESS_CONTROL_TEXTURE";
-      case 0x0000829d: return "GL_TESS_EVALUATION_TEXTURE";
-      case 0x0000829e: return "GL_GEOMETRY_TEXTURE";
-      case 0x0000829f: return "GL_FRAGMENT_TEXTURE";
-      case 0x000082a0: return "GL_COMPUTE_TEXTURE";
-      case 0x000082a1: return "GL_TEXTURE_SHADOW";
-      case 0x000082a2: return "GL_TEXTURE_GATHER";
-      case 0x000082a3: return "GL_TEXTURE_GATHER_SHADOW";
-      case 0x000082a4: return "GL_SHADER_IMAGE_LOAD";
-      case 0x000082a5: return "GL_SHADER_IMAGE_STORE";
-      case 0x000082a6: return "GL_SHADER_IMAGE_ATOMIC";
-      case 0x000082a7: return "GL_IMAGE_TEXEL_SIZE";
-      case 0x000082a8: return "GL_IMAGE_COMPATIBILITY_CLASS";
-      case 0x000082a9: return "GL_IMAGE_PIXEL_FORMAT";
-      case 0x000082aa: return "GL_IMAGE_PIXEL_TYPE";
-      case 0x000082ac: return "GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_TEST";
-      case 0x000082ad: return "GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_TEST";
-      case 0x000082ae: return "GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_WRITE";
-      case 0x000082af: return "GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_WRITE";
-      case 0x000082b1: return "GL_TEXTURE_COMPRESSED_BLOCK_WIDTH";
-      case 0x000082b2: return "GL_TEXTURE_COMPRESSED_BLOCK_HEIGHT";
-      case 0x000082b3: return "GL_TEXTURE_COMPRESSED_BLOCK_SIZE";
-      case 0x000082b4: return "GL_CLEAR_BUFFER";
-      case 0x000082b5: return "GL_TEXTURE_VIEW";
-      case 0x000082b6: return "GL_VIEW_COMPATIBILITY_CLASS";
-      case 0x000082b7: return "GL_FULL_SUPPORT";
-      case 0x000082b8: return "GL_CAVEAT_SUPPORT";
-      case 0x000082b9: return "GL_IMAGE_CLASS_4_X_32";
-      case 0x000082ba: return "GL_IMAGE_CLASS_2_X_32";
-      case 0x000082bb: return "GL_IMAGE_CLASS_1_X_32";
-      case 0x000082bc: return "GL_IMAGE_CLASS_4_X_16";
-      case 0x000082bd: return "GL_IMAGE_CLASS_2_X_16";
-      case 0x000082be: return "GL_IMAGE_CLASS_1_X_16";
-      case 0x000082bf: return "GL_IMAGE_CLASS_4_X_8";
-      case 0x000082c0: return "GL_IMAGE_CLASS_2_X_8";
-      case 0x000082c1: return "GL_IMAGE_CLASS_1_X_8";
-      case 0x000082c2: return "GL_IMAGE_CLASS_11_11_10";
-      case 0x000082c3: return "GL_IMAGE_CLASS_10_10_10_2";
-      case 0x000082c4: return "GL_VIEW_CLASS_128_BITS";
-      case 0x000082c5: return "GL_VIEW_CLASS_96_BITS";
-      case 0x000082c6: return "GL_VIEW_CLASS_64_BITS";
-      case 0x000082c7: return "GL_VIEW_CLASS_48_BITS";
-      case 0x000082c8: return "GL_VIEW_CLASS_32_BITS";
-      case 0x000082c9: return "GL_VIEW_CLASS_24_BITS";
-      case 0x000082ca: return "GL_VIEW_CLASS_16_BITS";
-      case 0x000082cb: return "GL_VIEW_CLASS_8_BITS";
-      case 0x000082cc: return "GL_VIEW_CLASS_S3TC_DXT1_RGB";
-      case 0x000082cd: return "GL_VIEW_CLASS_S3TC_DXT1_RGBA";
-      case 0x000082ce: return "GL_VIEW_CLASS_S3TC_DXT3_RGBA";
-      case 0x000082cf: return "GL_VIEW_CLASS_S3TC_DXT5_RGBA";
-      case 0x000082d0: return "GL_VIEW_CLASS_RGTC1_RED";
-      case 0x000082d1: return "GL_VIEW_CLASS_RGTC2_RG";
-      case 0x000082d2: return "GL_VIEW_CLASS_BPTC_UNORM";
-      case 0x000082d3: return "GL_VIEW_CLASS_BPTC_FLOAT";
-      case 0x000082d4: return "GL_VERTEX_ATTRIB_BINDING";
-      case 0x000082d5: return "GL_VERTEX_ATTRIB_RELATIVE_OFFSET";
-      case 0x000082d6: return "GL_VERTEX_BINDING_DIVISOR";
-      case 0x000082d7: return "GL_VERTEX_BINDING_OFFSET";
-      case 0x000082d8: return "GL_VERTEX_BINDING_STRIDE";
-      case 0x000082d9: return "GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET";
-      case 0x000082da: return "GL_MAX_VERTEX_ATTRIB_BINDINGS";
-      case 0x000082db: return "GL_TEXTURE_VIEW_MIN_LEVEL";
-      case 0x000082dc: return "GL_TEXTURE_VIEW_NUM_LEVELS";
-      case 0x000082dd: return "GL_TEXTURE_VIEW_MIN_LAYER";
-      case 0x000082de: return "GL_TEXTURE_VIEW_NUM_LAYERS";
-      case 0x000082df: return "GL_TEXTURE_IMMUTABLE_LEVELS";
-      case 0x000082e0: return "GL_BUFFER";
-      case 0x000082e1: return "GL_SHADER";
-      case 0x000082e2: return "GL_PROGRAM";
-      case 0x000082e3: return "GL_QUERY";
-      case 0x000082e4: return "GL_PROGRAM_PIPELINE";
-      case 0x000082e5: return "GL_MAX_VERTEX_ATTRIB_STRIDE";
-      case 0x000082e6: return "GL_SAMPLER";
-      case 0x000082e7: return "GL_DISPLAY_LIST";
-      case 0x000082e8: return "GL_MAX_LABEL_LENGTH";
-      case 0x000082e9: return "GL_NUM_SHADING_LANGUAGE_VERSIONS";
-      case 0x00008316: return "GL_CONVOLUTION_HINT_SGIX";
-      case 0x00008320: return "GL_ALPHA_MIN_SGIX";
-      case 0x00008321: return "GL_ALPHA_MAX_SGIX";
-      case 0x00008329: return "GL_ASYNC_MARKER_SGIX";
-      case 0x0000832c: return "GL_ASYNC_HISTOGRAM_SGIX";
-      case 0x0000832d: return "GL_MAX_ASYNC_HISTOGRAM_SGIX";
-      case 0x00008330: return "GL_PIXEL_TRANSFORM_2D_EXT";
-      case 0x00008331: return "GL_PIXEL_MAG_FILTER_EXT";
-      case 0x00008332: return "GL_PIXEL_MIN_FILTER_EXT";
-      case 0x00008333: return "GL_PIXEL_CUBIC_WEIGHT_EXT";
-      case 0x00008334: return "GL_CUBIC_EXT";
-      case 0x00008335: return "GL_AVERAGE_EXT";
-      case 0x00008336: return "GL_PIXEL_TRANSFORM_2D_STACK_DEPTH_EXT";
-      case 0x00008337: return "GL_MAX_PIXEL_TRANSFORM_2D_STACK_DEPTH_EXT";
-      case 0x00008338: return "GL_PIXEL_TRANSFORM_2D_MATRIX_EXT";
-      case 0x00008349: return "GL_FRAGMENT_MATERIAL_EXT";
-      case 0x0000834a: return "GL_FRAGMENT_NORMAL_EXT";
-      case 0x0000834c: return "GL_FRAGMENT_COLOR_EXT";
-      case 0x0000834d: return "GL_ATTENUATION_EXT";
-      case 0x0000834e: return "GL_SHADOW_ATTENUATION_EXT";
-      case 0x0000834f: return "GL_TEXTURE_APPLICATION_MODE_EXT";
-      case 0x00008350: return "GL_TEXTURE_LIGHT_EXT";
-      case 0x00008351: return "GL_TEXTURE_MATERIAL_FACE_EXT";
-      case 0x00008352: return "GL_TEXTURE_MATERIAL_PARAMETER_EXT";
-      case 0x0000835c: return "GL_ASYNC_TEX_IMAGE_SGIX";
-      case 0x0000835d: return "GL_ASYNC_DRAW_PIXELS_SGIX";
-      case 0x0000835e: return "GL_ASYNC_READ_PIXELS_SGIX";
-      case 0x0000835f: return "GL_MAX_ASYNC_TEX_IMAGE_SGIX";
-      case 0x00008360: return "GL_MAX_ASYNC_DRAW_PIXELS_SGIX";
-      case 0x00008361: return "GL_MAX_ASYNC_READ_PIXELS_SGIX";
-      case 0x00008362: return "GL_UNSIGNED_BYTE_2_3_3_REV";
-      case 0x00008363: return "GL_UNSIGNED_SHORT_5_6_5";
-      case 0x00008364: return "GL_UNSIGNED_SHORT_5_6_5_REV";
-      case 0x00008365: return "GL_UNSIGNED_SHORT_4_4_4_4_REV";
-      case 0x00008366: return "GL_UNSIGNED_SHORT_1_5_5_5_REV";
-      case 0x00008367: return "GL_UNSIGNED_INT_8_8_8_8_REV";
-      case 0x00008368: return "GL_UNSIGNED_INT_2_10_10_10_REV";
-      case 0x00008369: return "GL_TEXTURE_MAX_CLAMP_S_SGIX";
-      case 0x0000836a: return "GL_TEXTURE_MAX_CLAMP_T_SGIX";
-      case 0x0000836b: return "GL_TEXTURE_MAX_CLAMP_R_SGIX";
-      case 0x00008370: return "GL_MIRRORED_REPEAT";
-      case 0x000083a0: return "GL_RGB_S3TC";
-      case 0x000083a1: return "GL_RGB4_S3TC";
-      case 0x000083a2: return "GL_RGBA_S3TC";
-      case 0x000083a3: return "GL_RGBA4_S3TC";
-      case 0x000083a4: return "GL_RGBA_DXT5_S3TC";
-      case 0x000083a5: return "GL_RGBA4_DXT5_S3TC";
-      case 0x000083ee: return "GL_VERTEX_PRECLIP_SGIX";
-      case 0x000083ef: return "GL_VERTEX_PRECLIP_HINT_SGIX";
-      case 0x000083f0: return "GL_COMPRESSED_RGB_S3TC_DXT1_EXT";
-      case 0x000083f1: return "GL_COMPRESSED_RGBA_S3TC_DXT1_EXT";
-      case 0x000083f2: return "GL_COMPRESSED_RGBA_S3TC_DXT3_EXT";
-      case 0x000083f3: return "GL_COMPRESSED_RGBA_S3TC_DXT5_EXT";
-      case 0x000083f4: return "GL_PARALLEL_ARRAYS_INTEL";
-      case 0x000083f5: return "GL_VERTEX_ARRAY_PARALLEL_POINTERS_INTEL";
-      case 0x000083f6: return "GL_NORMAL_ARRAY_PARALLEL_POINTERS_INTEL";
-      case 0x000083f7: return "GL_COLOR_ARRAY_PARALLEL_POINTERS_INTEL";
-      case 0x000083f8: return "GL_TEXTURE_COORD_ARRAY_PARALLEL_POINTERS_INTEL";
-      case 0x000083ff: return "GL_TEXTURE_MEMORY_LAYOUT_INTEL";
-      case 0x00008400: return "GL_FRAGMENT_LIGHTING_EXT";
-      case 0x00008401: return "GL_FRAGMENT_COLOR_MATERIAL_EXT";
-      case 0x00008402: return "GL_FRAGMENT_COLOR_MATERIAL_FACE_EXT";
-      case 0x00008403: return "GL_FRAGMENT_COLOR_MATERIAL_PARAMETER_EXT";
-      case 0x00008404: return "GL_MAX_FRAGMENT_LIGHTS_EXT";
-      case 0x00008405: return "GL_MAX_ACTIVE_LIGHTS_EXT";
-      case 0x00008406: return "GL_CURRENT_RASTER_NORMAL_EXT";
-      case 0x00008407: return "GL_LIGHT_ENV_MODE_EXT";
-      case 0x00008408: return "GL_FRAGMENT_LIGHT_MODEL_LOCAL_VIEWER_EXT";
-      case 0x00008409: return "GL_FRAGMENT_LIGHT_MODEL_TWO_SIDE_EXT";
-      case 0x0000840a: return "GL_FRAGMENT_LIGHT_MODEL_AMBIENT_EXT";
-      case 0x0000840b: return "GL_FRAGMENT_LIGHT_MODEL_NORMAL_INTERPOLATION_EXT";
-      case 0x0000840c: return "GL_FRAGMENT_LIGHT0_EXT";
-      case 0x0000840d: return "GL_FRAGMENT_LIGHT1_EXT";
-      case 0x0000840e: return "GL_FRAGMENT_LIGHT2_EXT";
-      case 0x0000840f: return "GL_FRAGMENT_LIGHT3_EXT";
-      case 0x00008410: return "GL_FRAGMENT_LIGHT4_EXT";
-      case 0x00008411: return "GL_FRAGMENT_LIGHT5_EXT";
-      case 0x00008412: return "GL_FRAGMENT_LIGHT6_EXT";
-      case 0x00008413: return "GL_FRAGMENT_LIGHT7_EXT";
-      case 0x0000842e: return "GL_PACK_RESAMPLE_SGIX";
-      case 0x0000842f: return "GL_UNPACK_RESAMPLE_SGIX";
-      case 0x00008430: return "GL_RESAMPLE_DECIMATE_SGIX";
-      case 0x00008433: return "GL_RESAMPLE_REPLICATE_SGIX";
-      case 0x00008434: return "GL_RESAMPLE_ZERO_FILL_SGIX";
-      case 0x00008439: return "GL_TANGENT_ARRAY_EXT";
-      case 0x0000843a: return "GL_BINORMAL_ARRAY_EXT";
-      case 0x0000843b: return "GL_CURRENT_TANGENT_EXT";
-      case 0x0000843c: return "GL_CURRENT_BINORMAL_EXT";
-      case 0x0000843e: return "GL_TANGENT_ARRAY_TYPE_EXT";
-      case 0x0000843f: return "GL_TANGENT_ARRAY_STRIDE_EXT";
-      case 0x00008440: return "GL_BINORMAL_ARRAY_TYPE_EXT";
-      case 0x00008441: return "GL_BINORMAL_ARRAY_STRIDE_EXT";
-      case 0x00008442: return "GL_TANGENT_ARRAY_POINTER_EXT";
-      case 0x00008443: return "GL_BINORMAL_ARRAY_POINTER_EXT";
-      case 0x00008444: return "GL_MAP1_TANGENT_EXT";
-      case 0x00008445: return "GL_MAP2_TANGENT_EXT";
-      case 0x00008446: return "GL_MAP1_BINORMAL_EXT";
-      case 0x00008447: return "GL_MAP2_BINORMAL_EXT";
-      case 0x00008450: return "GL_FOG_COORDINATE_SOURCE";
-      case 0x00008451: return "GL_FOG_COORDINATE";
-      case 0x00008452: return "GL_FRAGMENT_DEPTH";
-      case 0x00008453: return "GL_CURRENT_FOG_COORDINATE";
-      case 0x00008454: return "GL_FOG_COORDINATE_ARRAY_TYPE";
-      case 0x00008455: return "GL_FOG_COORDINATE_ARRAY_STRIDE";
-      case 0x00008456: return "GL_FOG_COORDINATE_ARRAY_POINTER";
-      case 0x00008457: return "GL_FOG_COORDINATE_ARRAY";
-      case 0x00008458: return "GL_COLOR_SUM";
-      case 0x00008459: return "GL_CURRENT_SECONDARY_COLOR";
-      case 0x0000845a: return "GL_SECONDARY_COLOR_ARRAY_SIZE";
-      case 0x0000845b: return "GL_SECONDARY_COLOR_ARRAY_TYPE";
-      case 0x0000845c: return "GL_SECONDARY_COLOR_ARRAY_STRIDE";
-      case 0x0000845d: return "GL_SECONDARY_COLOR_ARRAY_POINTER";
-      case 0x0000845e: return "GL_SECONDARY_COLOR_ARRAY";
-      case 0x0000845f: return "GL_CURRENT_RASTER_SECONDARY_COLOR";
-      case 0x0000846d: return "GL_ALIASED_POINT_SIZE_RANGE";
-      case 0x0000846e: return "GL_ALIASED_LINE_WIDTH_RANGE";
-      case 0x00008490: return "GL_SCREEN_COORDINATES_REND";
-      case 0x00008491: return "GL_INVERTED_SCREEN_W_REND";
-      case 0x000084c0: return "GL_TEXTURE0";
-      case 0x000084c1: return "GL_TEXTURE1";
-      case 0x000084c2: return "GL_TEXTURE2";
-      case 0x000084c3: return "GL_TEXTURE3";
-      case 0x000084c4: return "GL_TEXTURE4";
-      case 0x000084c5: return "GL_TEXTURE5";
-      case 0x000084c6: return "GL_TEXTURE6";
-      case 0x000084c7: return "GL_TEXTURE7";
-      case 0x000084c8: return "GL_TEXTURE8";
-      case 0x000084c9: return "GL_TEXTURE9";
-      case 0x000084ca: return "GL_TEXTURE10";
-      case 0x000084cb: return "GL_TEXTURE11";
-      case 0x000084cc: return "GL_TEXTURE12";
-      case 0x000084cd: return "GL_TEXTURE13";
-      case 0x000084ce: return "GL_TEXTURE14";
-      case 0x000084cf: return "GL_TEXTURE15";
-      case 0x000084d0: return "GL_TEXTURE16";
-      case 0x000084d1: return "GL_TEXTURE17";
-      case 0x000084d2: return "GL_TEXTURE18";
-      case 0x000084d3: return "GL_TEXTURE19";
-      case 0x000084d4: return "GL_TEXTURE20";
-      case 0x000084d5: return "GL_TEXTURE21";
-      case 0x000084d6: return "GL_TEXTURE22";
-      case 0x000084d7: return "GL_TEXTURE23";
-      case 0x000084d8: return "GL_TEXTURE24";
-      case 0x000084d9: return "GL_TEXTURE25";
-      case 0x000084da: return "GL_TEXTURE26";
-      case 0x000084db: return "GL_TEXTURE27";
-      case 0x000084dc: return "GL_TEXTURE28";
-      case 0x000084dd: return "GL_TEXTURE29";
-      case 0x000084de: return "GL_TEXTURE30";
-      case 0x000084df: return "GL_TEXTURE31";
-      case 0x000084e0: return "GL_ACTIVE_TEXTURE";
-      case 0x000084e1: return "GL_CLIENT_ACTIVE_TEXTURE";
-      case 0x000084e2: return "GL_MAX_TEXTURE_UNITS";
-      case 0x000084e3: return "GL_TRANSPOSE_MODELVIEW_MATRIX";
-      case 0x000084e4: return "GL_TRANSPOSE_PROJECTION_MATRIX";
-      case 0x000084e5: return "GL_TRANSPOSE_TEXTURE_MATRIX";
-      case 0x000084e6: return "GL_TRANSPOSE_COLOR_MATRIX";
-      case 0x000084e7: return "GL_SUBTRACT";
-      case 0x000084e8: return "GL_MAX_RENDERBUFFER_SIZE";
-      case 0x000084e9: return "GL_COMPRESSED_ALPHA";
-      case 0x000084ea: return "GL_COMPRESSED_LUMINANCE";
-      case 0x000084eb: return "GL_COMPRESSED_LUMINANCE_ALPHA";
-      case 0x000084ec: return "GL_COMPRESSED_INTENSITY";
-      case 0x000084ed: return "GL_COMPRESSED_RGB";
-      case 0x000084ee: return "GL_COMPRESSED_RGBA";
-      case 0x000084ef: return "GL_TEXTURE_COMPRESSION_HINT";
-      case 0x000084f0: return "GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_CONTROL_SHADER";
-      case 0x000084f1: return "GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_EVALUATION_SHADER";
-      case 0x000084f2: return "GL_ALL_COMPLETED_NV";
-      case 0x000084f3: return "GL_FENCE_STATUS_NV";
-      case 0x000084f4: return "GL_FENCE_CONDITION_NV";
-      case 0x000084f5: return "GL_TEXTURE_RECTANGLE";
-      case 0x000084f6: return "GL_TEXTURE_BINDING_RECTANGLE";
-      case 0x000084f7: return "GL_PROXY_TEXTURE_RECTANGLE";
-      case 0x000084f8: return "GL_MAX_RECTANGLE_TEXTURE_SIZE";
-      case 0x000084f9: return "GL_DEPTH_STENCIL";
-      case 0x000084fa: return "GL_UNSIGNED_INT_24_8";
-      case 0x000084fd: return "GL_MAX_TEXTURE_LOD_BIAS";
-      case 0x000084fe: return "GL_TEXTURE_MAX_ANISOTROPY_EXT";
-      case 0x000084ff: return "GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT";
-      case 0x00008500: return "GL_TEXTURE_FILTER_CONTROL";
-      case 0x00008501: return "GL_TEXTURE_LOD_BIAS";
-      case 0x00008502: return "GL_MODELVIEW1_STACK_DEPTH_EXT";
-      case 0x00008503: return "GL_COMBINE4_NV";
-      case 0x00008504: return "GL_MAX_SHININESS_NV";
-      case 0x00008505: return "GL_MAX_SPOT_EXPONENT_NV";
-      case 0x00008506: return "GL_MODELVIEW1_MATRIX_EXT";
-      case 0x00008507: return "GL_INCR_WRAP";
-      case 0x00008508: return "GL_DECR_WRAP";
-      case 0x00008509: return "GL_VERTEX_WEIGHTING_EXT";
-      case 0x0000850a: return "GL_MODELVIEW1_ARB";
-      case 0x0000850b: return "GL_CURRENT_VERTEX_WEIGHT_EXT";
-      case 0x0000850c: return "GL_VERTEX_WEIGHT_ARRAY_EXT";
-      case 0x0000850d: return "GL_VERTEX_WEIGHT_ARRAY_SIZE_EXT";
-      case 0x0000850e: return "GL_VERTEX_WEIGHT_ARRAY_TYPE_EXT";
-      case 0x0000850f: return "GL_VERTEX_WEIGHT_ARRAY_STRIDE_EXT";
-      case 0x00008510: return "GL_VERTEX_WEIGHT_ARRAY_POINTER_EXT";
-      case 0x00008511: return "GL_NORMAL_MAP";
-      case 0x00008512: return "GL_REFLECTION_MAP";
-      case 0x00008513: return "GL_TEXTURE_CUBE_MAP";
-      case 0x00008514: return "GL_TEXTURE_BINDING_CUBE_MAP";
-      case 0x00008515: return "GL_TEXTURE_CUBE_MAP_POSITIVE_X";
-      case 0x00008516: return "GL_TEXTURE_CUBE_MAP_NEGATIVE_X";
-      case 0x00008517: return "GL_TEXTURE_CUBE_MAP_POSITIVE_Y";
-      case 0x00008518: return "GL_TEXTURE_CUBE_MAP_NEGATIVE_Y";
-      case 0x00008519: return "GL_TEXTURE_CUBE_MAP_POSITIVE_Z";
-      case 0x0000851a: return "GL_TEXTURE_CUBE_MAP_NEGATIVE_Z";
-      case 0x0000851b: return "GL_PROXY_TEXTURE_CUBE_MAP";
-      case 0x0000851c: return "GL_MAX_CUBE_MAP_TEXTURE_SIZE";
-      case 0x0000851d: return "GL_VERTEX_ARRAY_RANGE_NV";
-      case 0x0000851e: return "GL_VERTEX_ARRAY_RANGE_LENGTH_NV";
-      case 0x0000851f: return "GL_VERTEX_ARRAY_RANGE_VALID_NV";
-      case 0x00008520: return "GL_MAX_VERTEX_ARRAY_RANGE_ELEMENT_NV";
-      case 0x00008521: return "GL_VERTEX_ARRAY_RANGE_POINTER_NV";
-      case 0x00008522: return "GL_REGISTER_COMBINERS_NV";
-      case 0x00008523: return "GL_VARIABLE_A_NV";
-      case 0x00008524: return "GL_VARIABLE_B_NV";
-      case 0x00008525: return "GL_VARIABLE_C_NV";
-      case 0x00008526: return "GL_VARIABLE_D_NV";
-      case 0x00008527: return "GL_VARIABLE_E_NV";
-      case 0x00008528: return "GL_VARIABLE_F_NV";
-      case 0x00008529: return "GL_VARIABLE_G_NV";
-      case 0x0000852a: return "GL_CONSTANT_COLOR0_NV";
-      case 0x0000852b: return "GL_CONSTANT_COLOR1_NV";
-      case 0x0000852c: return "GL_PRIMARY_COLOR_NV";
-      case 0x0000852d: return "GL_SECONDARY_COLOR_NV";
-      case 0x0000852e: return "GL_SPARE0_NV";
-      case 0x0000852f: return "GL_SPARE1_NV";
-      case 0x00008530: return "GL_DISCARD_NV";
-      case 0x00008531: return "GL_E_TIMES_F_NV";
-      case 0x00008532: return "GL_SPARE0_PLUS_SECONDARY_COLOR_NV";
-      case 0x00008533: return "GL_VERTEX_ARRAY_RANGE_WITHOUT_FLUSH_NV";
-      case 0x00008534: return "GL_MULTISAMPLE_FILTER_HINT_NV";
-      case 0x00008535: return "GL_PER_STAGE_CONSTANTS_NV";
-      case 0x00008536: return "GL_UNSIGNED_IDENTITY_NV";
-      case 0x00008537: return "GL_UNSIGNED_INVERT_NV";
-      case 0x00008538: return "GL_EXPAND_NORMAL_NV";
-      case 0x00008539: return "GL_EXPAND_NEGATE_NV";
-      case 0x0000853a: return "GL_HALF_BIAS_NORMAL_NV";
-      case 0x0000853b: return "GL_HALF_BIAS_NEGATE_NV";
-      case 0x0000853c: return "GL_SIGNED_IDENTITY_NV";
-      case 0x0000853d: return "GL_SIGNED_NEGATE_NV";
-      case 0x0000853e: return "GL_SCALE_BY_TWO_NV";
-      case 0x0000853f: return "GL_SCALE_BY_FOUR_NV";
-      case 0x00008540: return "GL_SCALE_BY_ONE_HALF_NV";
-      case 0x00008541: return "GL_BIAS_BY_NEGATIVE_ONE_HALF_NV";
-      case 0x00008542: return "GL_COMBINER_INPUT_NV";
-      case 0x00008543: return "GL_COMBINER_MAPPING_NV";
-      case 0x00008544: return "GL_COMBINER_COMPONENT_USAGE_NV";
-      case 0x00008545: return "GL_COMBINER_AB_DOT_PRODUCT_NV";
-      case 0x00008546: return "GL_COMBINER_CD_DOT_PRODUCT_NV";
-      case 0x00008547: return "GL_COMBINER_MUX_SUM_NV";
-      case 0x00008548: return "GL_COMBINER_SCALE_NV";
-      case 0x00008549: return "GL_COMBINER_BIAS_NV";
-      case 0x0000854a: return "GL_COMBINER_AB_OUTPUT_NV";
-      case 0x0000854b: return "GL_COMBINER_CD_OUTPUT_NV";
-      case 0x0000854c: return "GL_COMBINER_SUM_OUTPUT_NV";
-      case 0x0000854d: return "GL_MAX_GENERAL_COMBINERS_NV";
-      case 0x0000854e: return "GL_NUM_GENERAL_COMBINERS_NV";
-      case 0x0000854f: return "GL_COLOR_SUM_CLAMP_NV";
-      case 0x00008550: return "GL_COMBINER0_NV";
-      case 0x00008551: return "GL_COMBINER1_NV";
-      case 0x00008552: return "GL_COMBINER2_NV";
-      case 0x00008553: return "GL_COMBINER3_NV";
-      case 0x00008554: return "GL_COMBINER4_NV";
-      case 0x00008555: return "GL_COMBINER5_NV";
-      case 0x00008556: return "GL_COMBINER6_NV";
-      case 0x00008557: return "GL_COMBINER7_NV";
-      case 0x00008558: return "GL_PRIMITIVE_RESTART_NV";
-      case 0x00008559: return "GL_PRIMITIVE_RESTART_INDEX_NV";
-      case 0x0000855a: return "GL_FOG_DISTANCE_MODE_NV";
-      case 0x0000855b: return "GL_EYE_RADIAL_NV";
-      case 0x0000855c: return "GL_EYE_PLANE_ABSOLUTE_NV";
-      case 0x0000855d: return "GL_EMBOSS_LIGHT_NV";
-      case 0x0000855e: return "GL_EMBOSS_CONSTANT_NV";
-      case 0x0000855f: return "GL_EMBOSS_MAP_NV";
-      case 0x00008560: return "GL_RED_MIN_CLAMP_INGR";
-      case 0x00008561: return "GL_GREEN_MIN_CLAMP_INGR";
-      case 0x00008562: return "GL_BLUE_MIN_CLAMP_INGR";
-      case 0x00008563: return "GL_ALPHA_MIN_CLAMP_INGR";
-      case 0x00008564: return "GL_RED_MAX_CLAMP_INGR";
-      case 0x00008565: return "GL_GREEN_MAX_CLAMP_INGR";
-      case 0x00008566: return "GL_BLUE_MAX_CLAMP_INGR";
-      case 0x00008567: return "GL_ALPHA_MAX_CLAMP_INGR";
-      case 0x00008568: return "GL_INTERLACE_READ_INGR";
-      case 0x00008570: return "GL_COMBINE";
-      case 0x00008571: return "GL_COMBINE_RGB";
-      case 0x00008572: return "GL_COMBINE_ALPHA";
-      case 0x00008573: return "GL_RGB_SCALE";
-      case 0x00008574: return "GL_ADD_SIGNED";
-      case 0x00008575: return "GL_INTERPOLATE";
-      case 0x00008576: return "GL_CONSTANT";
-      case 0x00008577: return "GL_PRIMARY_COLOR";
-      case 0x00008578: return "GL_PREVIOUS";
-      case 0x00008580: return "GL_SOURCE0_RGB";
-      case 0x00008581: return "GL_SOURCE1_RGB";
-      case 0x00008582: return "GL_SOURCE2_RGB";
-      case 0x00008583: return "GL_SOURCE3_RGB_NV";
-      case 0x00008588: return "GL_SOURCE0_ALPHA";
-      case 0x00008589: return "GL_SOURCE1_ALPHA";
-      case 0x0000858a: return "GL_SOURCE2_ALPHA";
-      case 0x0000858b: return "GL_SOURCE3_ALPHA_NV";
-      case 0x00008590: return "GL_OPERAND0_RGB";
-      case 0x00008591: return "GL_OPERAND1_RGB";
-      case 0x00008592: return "GL_OPERAND2_RGB";
-      case 0x00008593: return "GL_OPERAND3_RGB_NV";
-      case 0x00008598: return "GL_OPERAND0_ALPHA";
-      case 0x00008599: return "GL_OPERAND1_ALPHA";
-      case 0x0000859a: return "GL_OPERAND2_ALPHA";
-      case 0x0000859b: return "GL_OPERAND3_ALPHA_NV";
-      case 0x000085a5: return "GL_EXTENDED_RANGE_SGIS";
-      case 0x000085a6: return "GL_MIN_RED_SGIS";
-      case 0x000085a7: return "GL_MAX_RED_SGIS";
-      case 0x000085a8: return "GL_MIN_GREEN_SGIS";
-      case 0x000085a9: return "GL_MAX_GREEN_SGIS";
-      case 0x000085aa: return "GL_MIN_BLUE_SGIS";
-      case 0x000085ab: return "GL_MAX_BLUE_SGIS";
-      case 0x000085ac: return "GL_MIN_ALPHA_SGIS";
-      case 0x000085ad: return "GL_MAX_ALPHA_SGIS";
-      case 0x000085ae: return "GL_PERTURB_EXT";
-      case 0x000085af: return "GL_TEXTURE_NORMAL_EXT";
-      case 0x000085b0: return "GL_LIGHT_MODEL_SPECULAR_VECTOR_APPLE";
-      case 0x000085b1: return "GL_TRANSFORM_HINT_APPLE";
-      case 0x000085b2: return "GL_UNPACK_CLIENT_STORAGE_APPLE";
-      case 0x000085b3: return "GL_BUFFER_OBJECT_APPLE";
-      case 0x000085b4: return "GL_STORAGE_CLIENT_APPLE";
-      case 0x000085b5: return "GL_VERTEX_ARRAY_BINDING";
-      case 0x000085b7: return "GL_TEXTURE_RANGE_LENGTH_APPLE";
-      case 0x000085b8: return "GL_TEXTURE_RANGE_POINTER_APPLE";
-      case 0x000085b9: return "GL_YCBCR_422_APPLE";
-      case 0x000085ba: return "GL_UNSIGNED_SHORT_8_8_MESA";
-      case 0x000085bb: return "GL_UNSIGNED_SHORT_8_8_REV_MESA";
-      case 0x000085bc: return "GL_TEXTURE_STORAGE_HINT_APPLE";
-      case 0x000085bd: return "GL_STORAGE_PRIVATE_APPLE";
-      case 0x000085be: return "GL_STORAGE_CACHED_APPLE";
-      case 0x000085bf: return "GL_STORAGE_SHARED_APPLE";
-      case 0x000085c0: return "GL_REPLACEMENT_CODE_ARRAY_SUN";
-      case 0x000085c1: return "GL_REPLACEMENT_CODE_ARRAY_TYPE_SUN";
-      case 0x000085c2: return "GL_REPLACEMENT_CODE_ARRAY_STRIDE_SUN";
-      case 0x000085c3: return "GL_REPLACEMENT_CODE_ARRAY_POINTER_SUN";
-      case 0x000085c4: return "GL_R1UI_V3F_SUN";
-      case 0x000085c5: return "GL_R1UI_C4UB_V3F_SUN";
-      case 0x000085c6: return "GL_R1UI_C3F_V3F_SUN";
-      case 0x000085c7: return "GL_R1UI_N3F_V3F_SUN";
-      case 0x000085c8: return "GL_R1UI_C4F_N3F_V3F_SUN";
-      case 0x000085c9: return "GL_R1UI_T2F_V3F_SUN";
-      case 0x000085ca: return "GL_R1UI_T2F_N3F_V3F_SUN";
-      case 0x000085cb: return "GL_R1UI_T2F_C4F_N3F_V3F_SUN";
-      case 0x000085cc: return "GL_SLICE_ACCUM_SUN";
-      case 0x000085e0: return "GL_RGB_SIGNED_SGIX";
-      case 0x000085e1: return "GL_RGBA_SIGNED_SGIX";
-      case 0x000085e2: return "GL_ALPHA_SIGNED_SGIX";
-      case 0x000085e3: return "GL_LUMINANCE_SIGNED_SGIX";
-      case 0x000085e4: return "GL_INTENSITY_SIGNED_SGIX";
-      case 0x000085e5: return "GL_LUMINANCE_ALPHA_SIGNED_SGIX";
-      case 0x000085e6: return "GL_RGB16_SIGNED_SGIX";
-      case 0x000085e7: return "GL_RGBA16_SIGNED_SGIX";
-      case 0x000085e8: return "GL_ALPHA16_SIGNED_SGIX";
-      case 0x000085e9: return "GL_LUMINANCE16_SIGNED_SGIX";
-      case 0x000085ea: return "GL_INTENSITY16_SIGNED_SGIX";
-      case 0x000085eb: return "GL_LUMINANCE16_ALPHA16_SIGNED_SGIX";
-      case 0x000085ec: return "GL_RGB_EXTENDED_RANGE_SGIX";
-      case 0x000085ed: return "GL_RGBA_EXTENDED_RANGE_SGIX";
-      case 0x000085ee: return "GL_ALPHA_EXTENDED_RANGE_SGIX";
-      case 0x000085ef: return "GL_LUMINANCE_EXTENDED_RANGE_SGIX";
-      case 0x000085f0: return "GL_INTENSITY_EXTENDED_RANGE_SGIX";
-      case 0x000085f1: return "GL_LUMINANCE_ALPHA_EXTENDED_RANGE_SGIX";
-      case 0x000085f2: return "GL_RGB16_EXTENDED_RANGE_SGIX";
-      case 0x000085f3: return "GL_RGBA16_EXTENDED_RANGE_SGIX";
-      case 0x000085f4: return "GL_ALPHA16_EXTENDED_RANGE_SGIX";
-      case 0x000085f5: return "GL_LUMINANCE16_EXTENDED_RANGE_SGIX";
-      case 0x000085f6: return "GL_INTENSITY16_EXTENDED_RANGE_SGIX";
-      case 0x000085f7: return "GL_LUMINANCE16_ALPHA16_EXTENDED_RANGE_SGIX";
-      case 0x000085f8: return "GL_MIN_LUMINANCE_SGIS";
-      case 0x000085f9: return "GL_MAX_LUMINANCE_SGIS";
-      case 0x000085fa: return "GL_MIN_INTENSITY_SGIS";
-      case 0x000085fb: return "GL_MAX_INTENSITY_SGIS";
-      case 0x00008614: return "GL_QUAD_MESH_SUN";
-      case 0x00008615: return "GL_TRIANGLE_MESH_SUN";
-      case 0x00008620: return "GL_VERTEX_PROGRAM_ARB";
-      case 0x00008621: return "GL_VERTEX_STATE_PROGRAM_NV";
-      case 0x00008622: return "GL_VERTEX_ATTRIB_ARRAY_ENABLED";
-      case 0x00008623: return "GL_VERTEX_ATTRIB_ARRAY_SIZE";
-      case 0x00008624: return "GL_VERTEX_ATTRIB_ARRAY_STRIDE";
-      case 0x00008625: return "GL_VERTEX_ATTRIB_ARRAY_TYPE";
-      case 0x00008626: return "GL_CURRENT_VERTEX_ATTRIB";
-      case 0x00008627: return "GL_PROGRAM_LENGTH_ARB";
-      case 0x00008628: return "GL_PROGRAM_STRING_ARB";
-      case 0x00008629: return "GL_MODELVIEW_PROJECTION_NV";
-      case 0x0000862a: return "GL_IDENTITY_NV";
-      case 0x0000862b: return "GL_INVERSE_NV";
-      case 0x0000862c: return "GL_TRANSPOSE_NV";
-      case 0x0000862d: return "GL_INVERSE_TRANSPOSE_NV";
-      case 0x0000862e: return "GL_MAX_PROGRAM_MATRIX_STACK_DEPTH_ARB";
-      case 0x0000862f: return "GL_MAX_PROGRAM_MATRICES_ARB";
-      case 0x00008630: return "GL_MATRIX0_NV";
-      case 0x00008631: return "GL_MATRIX1_NV";
-      case 0x00008632: return "GL_MATRIX2_NV";
-      case 0x00008633: return "GL_MATRIX3_NV";
-      case 0x00008634: return "GL_MATRIX4_NV";
-      case 0x00008635: return "GL_MATRIX5_NV";
-      case 0x00008636: return "GL_MATRIX6_NV";
-      case 0x00008637: return "GL_MATRIX7_NV";
-      case 0x00008640: return "GL_CURRENT_MATRIX_STACK_DEPTH_ARB";
-      case 0x00008641: return "GL_CURRENT_MATRIX_ARB";
-      case 0x00008642: return "GL_PROGRAM_POINT_SIZE";
-      case 0x00008643: return "GL_VERTEX_PROGRAM_TWO_SIDE";
-      case 0x00008644: return "GL_PROGRAM_PARAMETER_NV";
-      case 0x00008645: return "GL_VERTEX_ATTRIB_ARRAY_POINTER";
-      case 0x00008646: return "GL_PROGRAM_TARGET_NV";
-      case 0x00008647: return "GL_PROGRAM_RESIDENT_NV";
-      case 0x00008648: return "GL_TRACK_MATRIX_NV";
-      case 0x00008649: return "GL_TRACK_MATRIX_TRANSFORM_NV";
-      case 0x0000864a: return "GL_VERTEX_PROGRAM_BINDING_NV";
-      case 0x0000864b: return "GL_PROGRAM_ERROR_POSITION_ARB";
-      case 0x0000864c: return "GL_OFFSET_TEXTURE_RECTANGLE_NV";
-      case 0x0000864d: return "GL_OFFSET_TEXTURE_RECTANGLE_SCALE_NV";
-      case 0x0000864e: return "GL_DOT_PRODUCT_TEXTURE_RECTANGLE_NV";
-      case 0x0000864f: return "GL_DEPTH_CLAMP";
-      case 0x00008650: return "GL_VERTEX_ATTRIB_ARRAY0_NV";
-      case 0x00008651: return "GL_VERTEX_ATTRIB_ARRAY1_NV";
-      case 0x00008652: return "GL_VERTEX_ATTRIB_ARRAY2_NV";
-      case 0x00008653: return "GL_VERTEX_ATTRIB_ARRAY3_NV";
-      case 0x00008654: return "GL_VERTEX_ATTRIB_ARRAY4_NV";
-      case 0x00008655: return "GL_VERTEX_ATTRIB_ARRAY5_NV";
-      case 0x00008656: return "GL_VERTEX_ATTRIB_ARRAY6_NV";
-      case 0x00008657: return "GL_VERTEX_ATTRIB_ARRAY7_NV";
-      case 0x00008658: return "GL_VERTEX_ATTRIB_ARRAY8_NV";
-      case 0x00008659: return "GL_VERTEX_ATTRIB_ARRAY9_NV";
-      case 0x0000865a: return "GL_VERTEX_ATTRIB_ARRAY10_NV";
-      case 0x0000865b: return "GL_VERTEX_ATTRIB_ARRAY11_NV";
-      case 0x0000865c: return "GL_VERTEX_ATTRIB_ARRAY12_NV";
-      case 0x0000865d: return "GL_VERTEX_ATTRIB_ARRAY13_NV";
-      case 0x0000865e: return "GL_VERTEX_ATTRIB_ARRAY14_NV";
-      case 0x0000865f: return "GL_VERTEX_ATTRIB_ARRAY15_NV";
-      case 0x00008660: return "GL_MAP1_VERTEX_ATTRIB0_4_NV";
-      case 0x00008661: return "GL_MAP1_VERTEX_ATTRIB1_4_NV";
-      case 0x00008662: return "GL_MAP1_VERTEX_ATTRIB2_4_NV";
-      case 0x00008663: return "GL_MAP1_VERTEX_ATTRIB3_4_NV";
-      case 0x00008664: return "GL_MAP1_VERTEX_ATTRIB4_4_NV";
-      case 0x00008665: return "GL_MAP1_VERTEX_ATTRIB5_4_NV";
-      case 0x00008666: return "GL_MAP1_VERTEX_ATTRIB6_4_NV";
-      case 0x00008667: return "GL_MAP1_VERTEX_ATTRIB7_4_NV";
-      case 0x00008668: return "GL_MAP1_VERTEX_ATTRIB8_4_NV";
-      case 0x00008669: return "GL_MAP1_VERTEX_ATTRIB9_4_NV";
-      case 0x0000866a: return "GL_MAP1_VERTEX_ATTRIB10_4_NV";
-      case 0x0000866b: return "GL_MAP1_VERTEX_ATTRIB11_4_NV";
-      case 0x0000866c: return "GL_MAP1_VERTEX_ATTRIB12_4_NV";
-      case 0x0000866d: return "GL_MAP1_VERTEX_ATTRIB13_4_NV";
-      case 0x0000866e: return "GL_MAP1_VERTEX_ATTRIB14_4_NV";
-      case 0x0000866f: return "GL_MAP1_VERTEX_ATTRIB15_4_NV";
-      case 0x00008670: return "GL_MAP2_VERTEX_ATTRIB0_4_NV";
-      case 0x00008671: return "GL_MAP2_VERTEX_ATTRIB1_4_NV";
-      case 0x00008672: return "GL_MAP2_VERTEX_ATTRIB2_4_NV";
-      case 0x00008673: return "GL_MAP2_VERTEX_ATTRIB3_4_NV";
-      case 0x00008674: return "GL_MAP2_VERTEX_ATTRIB4_4_NV";
-      case 0x00008675: return "GL_MAP2_VERTEX_ATTRIB5_4_NV";
-      case 0x00008676: return "GL_MAP2_VERTEX_ATTRIB6_4_NV";
-      case 0x00008677: return "GL_PROGRAM_BINDING_ARB";
-      case 0x00008678: return "GL_MAP2_VERTEX_ATTRIB8_4_NV";
-      case 0x00008679: return "GL_MAP2_VERTEX_ATTRIB9_4_NV";
-      case 0x0000867a: return "GL_MAP2_VERTEX_ATTRIB10_4_NV";
-      case 0x0000867b: return "GL_MAP2_VERTEX_ATTRIB11_4_NV";
-      case 0x0000867c: return "GL_MAP2_VERTEX_ATTRIB12_4_NV";
-      case 0x0000867d: return "GL_MAP2_VERTEX_ATTRIB13_4_NV";
-      case 0x0000867e: return "GL_MAP2_VERTEX_ATTRIB14_4_NV";
-      case 0x0000867f: return "GL_MAP2_VERTEX_ATTRIB15_4_NV";
-      case 0x000086a0: return "GL_TEXTURE_COMPRESSED_IMAGE_SIZE";
-      case 0x000086a1: return "GL_TEXTURE_COMPRESSED";
-      case 0x000086a2: return "GL_NUM_COMPRESSED_TEXTURE_FORMATS";
-      case 0x000086a3: return "GL_COMPRESSED_TEXTURE_FORMATS";
-      case 0x000086a4: return "GL_MAX_VERTEX_UNITS_ARB";
-      case 0x000086a5: return "GL_ACTIVE_VERTEX_UNITS_ARB";
-      case 0x000086a6: return "GL_WEIGHT_SUM_UNITY_ARB";
-      case 0x000086a7: return "GL_VERTEX_BLEND_ARB";
-      case 0x000086a8: return "GL_CURRENT_WEIGHT_ARB";
-      case 0x000086a9: return "GL_WEIGHT_ARRAY_TYPE_ARB";
-      case 0x000086aa: return "GL_WEIGHT_ARRAY_STRIDE_ARB";
-      case 0x000086ab: return "GL_WEIGHT_ARRAY_SIZE_ARB";
-      case 0x000086ac: return "GL_WEIGHT_ARRAY_POINTER_ARB";
-      case 0x000086ad: return "GL_WEIGHT_ARRAY_ARB";
-      case 0x000086ae: return "GL_DOT3_RGB";
-      case 0x000086af: return "GL_DOT3_RGBA";
-      case 0x000086b0: return "GL_COMPRESSED_RGB_FXT1_3DFX";
-      case 0x000086b1: return "GL_COMPRESSED_RGBA_FXT1_3DFX";
-      case 0x000086b2: return "GL_MULTISAMPLE_3DFX";
-      case 0x000086b3: return "GL_SAMPLE_BUFFERS_3DFX";
-      case 0x000086b4: return "GL_SAMPLES_3DFX";
-      case 0x000086c0: return "GL_EVAL_2D_NV";
-      case 0x000086c1: return "GL_EVAL_TRIANGULAR_2D_NV";
-      case 0x000086c2: return "GL_MAP_TESSELLATION_NV";
-      case 0x000086c3: return "GL_MAP_ATTRIB_U_ORDER_NV";
-      case 0x000086c4: return "GL_MAP_ATTRIB_V_ORDER_NV";
-      case 0x000086c5: return "GL_EVAL_FRACTIONAL_TESSELLATION_NV";
-      case 0x000086c6: return "GL_EVAL_VERTEX_ATTRIB0_NV";
-      case 0x000086c7: return "GL_EVAL_VERTEX_ATTRIB1_NV";
-      case 0x000086c8: return "GL_EVAL_VERTEX_ATTRIB2_NV";
-      case 0x000086c9: return "GL_EVAL_VERTEX_ATTRIB3_NV";
-      case 0x000086ca: return "GL_EVAL_VERTEX_ATTRIB4_NV";
-      case 0x000086cb: return "GL_EVAL_VERTEX_ATTRIB5_NV";
-      case 0x000086cc: return "GL_EVAL_VERTEX_ATTRIB6_NV";
-      case 0x000086cd: return "GL_EVAL_VERTEX_ATTRIB7_NV";
-      case 0x000086ce: return "GL_EVAL_VERTEX_ATTRIB8_NV";
-      case 0x000086cf: return "GL_EVAL_VERTEX_ATTRIB9_NV";
-      case 0x000086d0: return "GL_EVAL_VERTEX_ATTRIB10_NV";
-      case 0x000086d1: return "GL_EVAL_VERTEX_ATTRIB11_NV";
-      case 0x000086d2: return "GL_EVAL_VERTEX_ATTRIB12_NV";
-      case 0x000086d3: return "GL_EVAL_VERTEX_ATTRIB13_NV";
-      case 0x000086d4: return "GL_EVAL_VERTEX_ATTRIB14_NV";
-      case 0x000086d5: return "GL_EVAL_VERTEX_ATTRIB15_NV";
-      case 0x000086d6: return "GL_MAX_MAP_TESSELLATION_NV";
-      case 0x000086d7: return "GL_MAX_RATIONAL_EVAL_ORDER_NV";
-      case 0x000086d8: return "GL_MAX_PROGRAM_PATCH_ATTRIBS_NV";
-      case 0x000086d9: return "GL_RGBA_UNSIGNED_DOT_PRODUCT_MAPPING_NV";
-      case 0x000086da: return "GL_UNSIGNED_INT_S8_S8_8_8_NV";
-      case 0x000086db: return "GL_UNSIGNED_INT_8_8_S8_S8_REV_NV";
-      case 0x000086dc: return "GL_DSDT_MAG_INTENSITY_NV";
-      case 0x000086dd: return "GL_SHADER_CONSISTENT_NV";
-      case 0x000086de: return "GL_TEXTURE_SHADER_NV";
-      case 0x000086df: return "GL_SHADER_OPERATION_NV";
-      case 0x000086e0: return "GL_CULL_MODES_NV";
-      case 0x000086e1: return "GL_OFFSET_TEXTURE_2D_MATRIX_NV";
-      case 0x000086e2: return "GL_OFFSET_TEXTURE_2D_SCALE_NV";
-      case 0x000086e3: return "GL_OFFSET_TEXTURE_2D_BIAS_NV";
-      case 0x000086e4: return "GL_PREVIOUS_TEXTURE_INPUT_NV";
-      case 0x000086e5: return "GL_CONST_EYE_NV";
-      case 0x000086e6: return "GL_PASS_THROUGH_NV";
-      case 0x000086e7: return "GL_CULL_FRAGMENT_NV";
-      case 0x000086e8: return "GL_OFFSET_TEXTURE_2D_NV";
-      case 0x000086e9: return "GL_DEPENDENT_AR_TEXTURE_2D_NV";
-      case 0x000086ea: return "GL_DEPENDENT_GB_TEXTURE_2D_NV";
-      case 0x000086eb: return "GL_SURFACE_STATE_NV";
-      case 0x000086ec: return "GL_DOT_PRODUCT_NV";
-      case 0x000086ed: return "GL_DOT_PRODUCT_DEPTH_REPLACE_NV";
-      case 0x000086ee: return "GL_DOT_PRODUCT_TEXTURE_2D_NV";
-      case 0x000086ef: return "GL_DOT_PRODUCT_TEXTURE_3D_NV";
-      case 0x000086f0: return "GL_DOT_PRODUCT_TEXTURE_CUBE_MAP_NV";
-      case 0x000086f1: return "GL_DOT_PRODUCT_DIFFUSE_CUBE_MAP_NV";
-      case 0x000086f2: return "GL_DOT_PRODUCT_REFLECT_CUBE_MAP_NV";
-      case 0x000086f3: return "GL_DOT_PRODUCT_CONST_EYE_REFLECT_CUBE_MAP_NV";
-      case 0x000086f4: return "GL_HILO_NV";
-      case 0x000086f5: return "GL_DSDT_NV";
-      case 0x000086f6: return "GL_DSDT_MAG_NV";
-      case 0x000086f7: return "GL_DSDT_MAG_VIB_NV";
-      case 0x000086f8: return "GL_HILO16_NV";
-      case 0x000086f9: return "GL_SIGNED_HILO_NV";
-      case 0x000086fa: return "GL_SIGNED_HILO16_NV";
-      case 0x000086fb: return "GL_SIGNED_RGBA_NV";
-      case 0x000086fc: return "GL_SIGNED_RGBA8_NV";
-      case 0x000086fd: return "GL_SURFACE_REGISTERED_NV";
-      case 0x000086fe: return "GL_SIGNED_RGB_NV";
-      case 0x000086ff: return "GL_SIGNED_RGB8_NV";
-      case 0x00008700: return "GL_SURFACE_MAPPED_NV";
-      case 0x00008701: return "GL_SIGNED_LUMINANCE_NV";
-      case 0x00008702: return "GL_SIGNED_LUMINANCE8_NV";
-      case 0x00008703: return "GL_SIGNED_LUMINANCE_ALPHA_NV";
-      case 0x00008704: return "GL_SIGNED_LUMINANCE8_ALPHA8_NV";
-      case 0x00008705: return "GL_SIGNED_ALPHA_NV";
-      case 0x00008706: return "GL_SIGNED_ALPHA8_NV";
-      case 0x00008707: return "GL_SIGNED_INTENSITY_NV";
-      case 0x00008708: return "GL_SIGNED_INTENSITY8_NV";
-      case 0x00008709: return "GL_DSDT8_NV";
-      case 0x0000870a: return "GL_DSDT8_MAG8_NV";
-      case 0x0000870b: return "GL_DSDT8_MAG8_INTENSITY8_NV";
-      case 0x0000870c: return "GL_SIGNED_RGB_UNSIGNED_ALPHA_NV";
-      case 0x0000870d: return "GL_SIGNED_RGB8_UNSIGNED_ALPHA8_NV";
-      case 0x0000870e: return "GL_HI_SCALE_NV";
-      case 0x0000870f: return "GL_LO_SCALE_NV";
-      case 0x00008710: return "GL_DS_SCALE_NV";
-      case 0x00008711: return "GL_DT_SCALE_NV";
-      case 0x00008712: return "GL_MAGNITUDE_SCALE_NV";
-      case 0x00008713: return "GL_VIBRANCE_SCALE_NV";
-      case 0x00008714: return "GL_HI_BIAS_NV";
-      case 0x00008715: return "GL_LO_BIAS_NV";
-      case 0x00008716: return "GL_DS_BIAS_NV";
-      case 0x00008717: return "GL_DT_BIAS_NV";
-      case 0x00008718: return "GL_MAGNITUDE_BIAS_NV";
-      case 0x00008719: return "GL_VIBRANCE_BIAS_NV";
-      case 0x0000871a: return "GL_TEXTURE_BORDER_VALUES_NV";
-      case 0x0000871b: return "GL_TEXTURE_HI_SIZE_NV";
-      case 0x0000871c: return "GL_TEXTURE_LO_SIZE_NV";
-      case 0x0000871d: return "GL_TEXTURE_DS_SIZE_NV";
-      case 0x0000871e: return "GL_TEXTURE_DT_SIZE_NV";
-      case 0x0000871f: return "GL_TEXTURE_MAG_SIZE_NV";
-      case 0x00008722: return "GL_MODELVIEW2_ARB";
-      case 0x00008723: return "GL_MODELVIEW3_ARB";
-      case 0x00008724: return "GL_MODELVIEW4_ARB";
-      case 0x00008725: return "GL_MODELVIEW5_ARB";
-      case 0x00008726: return "GL_MODELVIEW6_ARB";
-      case 0x00008727: return "GL_MODELVIEW7_ARB";
-      case 0x00008728: return "GL_MODELVIEW8_ARB";
-      case 0x00008729: return "GL_MODELVIEW9_ARB";
-      case 0x0000872a: return "GL_MODELVIEW10_ARB";
-      case 0x0000872b: return "GL_MODELVIEW11_ARB";
-      case 0x0000872c: return "GL_MODELVIEW12_ARB";
-      case 0x0000872d: return "GL_MODELVIEW13_ARB";
-      case 0x0000872e: return "GL_MODELVIEW14_ARB";
-      case 0x0000872f: return "GL_MODELVIEW15_ARB";
-      case 0x00008730: return "GL_MODELVIEW16_ARB";
-      case 0x00008731: return "GL_MODELVIEW17_ARB";
-      case 0x00008732: return "GL_MODELVIEW18_ARB";
-      case 0x00008733: return "GL_MODELVIEW19_ARB";
-      case 0x00008734: return "GL_MODELVIEW20_ARB";
-      case 0x00008735: return "GL_MODELVIEW21_ARB";
-      case 0x00008736: return "GL_MODELVIEW22_ARB";
-      case 0x00008737: return "GL_MODELVIEW23_ARB";
-      case 0x00008738: return "GL_MODELVIEW24_ARB";
-      case 0x00008739: return "GL_MODELVIEW25_ARB";
-      case 0x0000873a: return "GL_MODELVIEW26_ARB";
-      case 0x0000873b: return "GL_MODELVIEW27_ARB";
-      case 0x0000873c: return "GL_MODELVIEW28_ARB";
-      case 0x0000873d: return "GL_MODELVIEW29_ARB";
-      case 0x0000873e: return "GL_MODELVIEW30_ARB";
-      case 0x0000873f: return "GL_MODELVIEW31_ARB";
-      case 0x00008740: return "GL_Z400_BINARY_AMD";
-      case 0x00008741: return "GL_PROGRAM_BINARY_LENGTH";
-      case 0x00008742: return "GL_MIRROR_CLAMP_EXT";
-      case 0x00008743: return "GL_MIRROR_CLAMP_TO_EDGE";
-      case 0x00008744: return "GL_MODULATE_ADD_ATI";
-      case 0x00008745: return "GL_MODULATE_SIGNED_ADD_ATI";
-      case 0x00008746: return "GL_MODULATE_SUBTRACT_ATI";
-      case 0x0000874a: return "GL_SET_AMD";
-      case 0x0000874b: return "GL_REPLACE_VALUE_AMD";
-      case 0x0000874c: return "GL_STENCIL_OP_VALUE_AMD";
-      case 0x0000874d: return "GL_STENCIL_BACK_OP_VALUE_AMD";
-      case 0x0000874e: return "GL_VERTEX_ATTRIB_ARRAY_LONG";
-      case 0x00008757: return "GL_YCBCR_MESA";
-      case 0x00008758: return "GL_PACK_INVERT_MESA";
-      case 0x00008759: return "GL_TEXTURE_1D_STACK_MESAX";
-      case 0x0000875a: return "GL_TEXTURE_2D_STACK_MESAX";
-      case 0x0000875b: return "GL_PROXY_TEXTURE_1D_STACK_MESAX";
-      case 0x0000875c: return "GL_PROXY_TEXTURE_2D_STACK_MESAX";
-      case 0x0000875d: return "GL_TEXTURE_1D_STACK_BINDING_MESAX";
-      case 0x0000875e: return "GL_TEXTURE_2D_STACK_BINDING_MESAX";
-      case 0x00008760: return "GL_STATIC_ATI";
-      case 0x00008761: return "GL_DYNAMIC_ATI";
-      case 0x00008762: return "GL_PRESERVE_ATI";
-      case 0x00008763: return "GL_DISCARD_ATI";
-      case 0x00008764: return "GL_BUFFER_SIZE";
-      case 0x00008765: return "GL_BUFFER_USAGE";
-      case 0x00008766: return "GL_ARRAY_OBJECT_BUFFER_ATI";
-      case 0x00008767: return "GL_ARRAY_OBJECT_OFFSET_ATI";
-      case 0x00008768: return "GL_ELEMENT_ARRAY_ATI";
-      case 0x00008769: return "GL_ELEMENT_ARRAY_TYPE_ATI";
-      case 0x0000876a: return "GL_ELEMENT_ARRAY_POINTER_ATI";
-      case 0x0000876b: return "GL_MAX_VERTEX_STREAMS_ATI";
-      case 0x0000876c: return "GL_VERTEX_SOURCE_ATI";
-      case 0x0000876d: return "GL_VERTEX_STREAM0_ATI";
-      case 0x0000876e: return "GL_VERTEX_STREAM1_ATI";
-      case 0x0000876f: return "GL_VERTEX_STREAM2_ATI";
-      case 0x00008770: return "GL_VERTEX_STREAM3_ATI";
-      case 0x00008771: return "GL_VERTEX_STREAM4_ATI";
-      case 0x00008772: return "GL_VERTEX_STREAM5_ATI";
-      case 0x00008773: return "GL_VERTEX_STREAM6_ATI";
-      case 0x00008774: return "GL_VERTEX_STREAM7_ATI";
-      case 0x00008775: return "GL_BUMP_ROT_MATRIX_ATI";
-      case 0x00008776: return "GL_BUMP_ROT_MATRIX_SIZE_ATI";
-      case 0x00008777: return "GL_BUMP_NUM_TEX_UNITS_ATI";
-      case 0x00008778: return "GL_BUMP_TEX_UNITS_ATI";
-      case 0x00008779: return "GL_DUDV_ATI";
-      case 0x0000877a: return "GL_DU8DV8_ATI";
-      case 0x0000877b: return "GL_BUMP_ENVMAP_ATI";
-      case 0x0000877c: return "GL_BUMP_TARGET_ATI";
-      case 0x00008780: return "GL_VERTEX_SHADER_EXT";
-      case 0x00008781: return "GL_VERTEX_SHADER_BINDING_EXT";
-      case 0x00008782: return "GL_OP_INDEX_EXT";
-      case 0x00008783: return "GL_OP_NEGATE_EXT";
-      case 0x00008784: return "GL_OP_DOT3_EXT";
-      case 0x00008785: return "GL_OP_DOT4_EXT";
-      case 0x00008786: return "GL_OP_MUL_EXT";
-      case 0x00008787: return "GL_OP_ADD_EXT";
-      case 0x00008788: return "GL_OP_MADD_EXT";
-      case 0x00008789: return "GL_OP_FRAC_EXT";
-      case 0x0000878a: return "GL_OP_MAX_EXT";
-      case 0x0000878b: return "GL_OP_MIN_EXT";
-      case 0x0000878c: return "GL_OP_SET_GE_EXT";
-      case 0x0000878d: return "GL_OP_SET_LT_EXT";
-      case 0x0000878e: return "GL_OP_CLAMP_EXT";
-      case 0x0000878f: return "GL_OP_FLOOR_EXT";
-      case 0x00008790: return "GL_OP_ROUND_EXT";
-      case 0x00008791: return "GL_OP_EXP_BASE_2_EXT";
-      case 0x00008792: return "GL_OP_LOG_BASE_2_EXT";
-      case 0x00008793: return "GL_OP_POWER_EXT";
-      case 0x00008794: return "GL_OP_RECIP_EXT";
-      case 0x00008795: return "GL_OP_RECIP_SQRT_EXT";
-      case 0x00008796: return "GL_OP_SUB_EXT";
-      case 0x00008797: return "GL_OP_CROSS_PRODUCT_EXT";
-      case 0x00008798: return "GL_OP_MULTIPLY_MATRIX_EXT";
-      case 0x00008799: return "GL_OP_MOV_EXT";
-      case 0x0000879a: return "GL_OUTPUT_VERTEX_EXT";
-      case 0x0000879b: return "GL_OUTPUT_COLOR0_EXT";
-      case 0x0000879c: return "GL_OUTPUT_COLOR1_EXT";
-      case 0x0000879d: return "GL_OUTPUT_TEXTURE_COORD0_EXT";
-      case 0x0000879e: return "GL_OUTPUT_TEXTURE_COORD1_EXT";
-      case 0x0000879f: return "GL_OUTPUT_TEXTURE_COORD2_EXT";
-      case 0x000087a0: return "GL_OUTPUT_TEXTURE_COORD3_EXT";
-      case 0x000087a1: return "GL_OUTPUT_TEXTURE_COORD4_EXT";
-      case 0x000087a2: return "GL_OUTPUT_TEXTURE_COORD5_EXT";
-      case 0x000087a3: return "GL_OUTPUT_TEXTURE_COORD6_EXT";
-      case 0x000087a4: return "GL_OUTPUT_TEXTURE_COORD7_EXT";
-      case 0x000087a5: return "GL_OUTPUT_TEXTURE_COORD8_EXT";
-      case 0x000087a6: return "GL_OUTPUT_TEXTURE_COORD9_EXT";
-      case 0x000087a7: return "GL_OUTPUT_TEXTURE_COORD10_EXT";
-      case 0x000087a8: return "GL_OUTPUT_TEXTURE_COORD11_EXT";
-      case 0x000087a9: return "GL_OUTPUT_TEXTURE_COORD12_EXT";
-      case 0x000087aa: return "GL_OUTPUT_TEXTURE_COORD13_EXT";
-      case 0x000087ab: return "GL_OUTPUT_TEXTURE_COORD14_EXT";
-      case 0x000087ac: return "GL_OUTPUT_TEXTURE_COORD15_EXT";
-      case 0x000087ad: return "GL_OUTPUT_TEXTURE_COORD16_EXT";
-      case 0x000087ae: return "GL_OUTPUT_TEXTURE_COORD17_EXT";
-      case 0x000087af: return "GL_OUTPUT_TEXTURE_COORD18_EXT";
-      case 0x000087b0: return "GL_OUTPUT_TEXTURE_COORD19_EXT";
-      case 0x000087b1: return "GL_OUTPUT_TEXTURE_COORD20_EXT";
-      case 0x000087b2: return "GL_OUTPUT_TEXTURE_COORD21_EXT";
-      case 0x000087b3: return "GL_OUTPUT_TEXTURE_COORD22_EXT";
-      case 0x000087b4: return "GL_OUTPUT_TEXTURE_COORD23_EXT";
-      case 0x000087b5: return "GL_OUTPUT_TEXTURE_COORD24_EXT";
-      case 0x000087b6: return "GL_OUTPUT_TEXTURE_COORD25_EXT";
-      case 0x000087b7: return "GL_OUTPUT_TEXTURE_COORD26_EXT";
-      case 0x000087b8: return "GL_OUTPUT_TEXTURE_COORD27_EXT";
-      case 0x000087b9: return "GL_OUTPUT_TEXTURE_COORD28_EXT";
-      case 0x000087ba: return "GL_OUTPUT_TEXTURE_COORD29_EXT";
-      case 0x000087bb: return "GL_OUTPUT_TEXTURE_COORD30_EXT";
-      case 0x000087bc: return "GL_OUTPUT_TEXTURE_COORD31_EXT";
-      case 0x000087bd: return "GL_OUTPUT_FOG_EXT";
-      case 0x000087be: return "GL_SCALAR_EXT";
-      case 0x000087bf: return "GL_VECTOR_EXT";
-      case 0x000087c0: return "GL_MATRIX_EXT";
-      case 0x000087c1: return "GL_VARIANT_EXT";
-      case 0x000087c2: return "GL_INVARIANT_EXT";
-      case 0x000087c3: return "GL_LOCAL_CONSTANT_EXT";
-      case 0x000087c4: return "GL_LOCAL_EXT";
-      case 0x000087c5: return "GL_MAX_VERTEX_SHADER_INSTRUCTIONS_EXT";
-      case 0x000087c6: return "GL_MAX_VERTEX_SHADER_VARIANTS_EXT";
-      case 0x000087c7: return "GL_MAX_VERTEX_SHADER_INVARIANTS_EXT";
-      case 0x000087c8: return "GL_MAX_VERTEX_SHADER_LOCAL_CONSTANTS_EXT";
-      case 0x000087c9: return "GL_MAX_VERTEX_SHADER_LOCALS_EXT";
-      case 0x000087ca: return "GL_MAX_OPTIMIZED_VERTEX_SHADER_INSTRUCTIONS_EXT";
-      case 0x000087cb: return "GL_MAX_OPTIMIZED_VERTEX_SHADER_VARIANTS_EXT";
-      case 0x000087cc: return "GL_MAX_OPTIMIZED_VERTEX_SHADER_INVARIANTS_EXT";
-      case 0x000087cd: return "GL_MAX_OPTIMIZED_VERTEX_SHADER_LOCAL_CONSTANTS_EXT";
-      case 0x000087ce: return "GL_MAX_OPTIMIZED_VERTEX_SHADER_LOCALS_EXT";
-      case 0x000087cf: return "GL_VERTEX_SHADER_INSTRUCTIONS_EXT";
-      case 0x000087d0: return "GL_VERTEX_SHADER_VARIANTS_EXT";
-      case 0x000087d1: return "GL_VERTEX_SHADER_INVARIANTS_EXT";
-      case 0x000087d2: return "GL_VERTEX_SHADER_LOCAL_CONSTANTS_EXT";
-      case 0x000087d3: return "GL_VERTEX_SHADER_LOCALS_EXT";
-      case 0x000087d4: return "GL_VERTEX_SHADER_OPTIMIZED_EXT";
-      case 0x000087d5: return "GL_X_EXT";
-      case 0x000087d6: return "GL_Y_EXT";
-      case 0x000087d7: return "GL_Z_EXT";
-      case 0x000087d8: return "GL_W_EXT";
-      case 0x000087d9: return "GL_NEGATIVE_X_EXT";
-      case 0x000087da: return "GL_NEGATIVE_Y_EXT";
-      case 0x000087db: return "GL_NEGATIVE_Z_EXT";
-      case 0x000087dc: return "GL_NEGATIVE_W_EXT";
-      case 0x000087dd: return "GL_ZERO_EXT";
-      case 0x000087de: return "GL_ONE_EXT";
-      case 0x000087df: return "GL_NEGATIVE_ONE_EXT";
-      case 0x000087e0: return "GL_NORMALIZED_RANGE_EXT";
-      case 0x000087e1: return "GL_FULL_RANGE_EXT";
-      case 0x000087e2: return "GL_CURRENT_VERTEX_EXT";
-      case 0x000087e3: return "GL_MVP_MATRIX_EXT";
-      case 0x000087e4: return "GL_VARIANT_VALUE_EXT";
-      case 0x000087e5: return "GL_VARIANT_DATATYPE_EXT";
-      case 0x000087e6: return "GL_VARIANT_ARRAY_STRIDE_EXT";
-      case 0x000087e7: return "GL_VARIANT_ARRAY_TYPE_EXT";
-      case 0x000087e8: return "GL_VARIANT_ARRAY_EXT";
-      case 0x000087e9: return "GL_VARIANT_ARRAY_POINTER_EXT";
-      case 0x000087ea: return "GL_INVARIANT_VALUE_EXT";
-      case 0x000087eb: return "GL_INVARIANT_DATATYPE_EXT";
-      case 0x000087ec: return "GL_LOCAL_CONSTANT_VALUE_EXT";
-      case 0x000087ed: return "GL_LOCAL_CONSTANT_DATATYPE_EXT";
-      case 0x000087ee: return "GL_ATC_RGBA_INTERPOLATED_ALPHA_AMD";
-      case 0x000087f0: return "GL_PN_TRIANGLES_ATI";
-      case 0x000087f1: return "GL_MAX_PN_TRIANGLES_TESSELATION_LEVEL_ATI";
-      case 0x000087f2: return "GL_PN_TRIANGLES_POINT_MODE_ATI";
-      case 0x000087f3: return "GL_PN_TRIANGLES_NORMAL_MODE_ATI";
-      case 0x000087f4: return "GL_PN_TRIANGLES_TESSELATION_LEVEL_ATI";
-      case 0x000087f5: return "GL_PN_TRIANGLES_POINT_MODE_LINEAR_ATI";
-      case 0x000087f6: return "GL_PN_TRIANGLES_POINT_MODE_CUBIC_ATI";
-      case 0x000087f7: return "GL_PN_TRIANGLES_NORMAL_MODE_LINEAR_ATI";
-      case 0x000087f8: return "GL_PN_TRIANGLES_NORMAL_MODE_QUADRATIC_ATI";
-      case 0x000087f9: return "GL_3DC_X_AMD";
-      case 0x000087fa: return "GL_3DC_XY_AMD";
-      case 0x000087fb: return "GL_VBO_FREE_MEMORY_ATI";
-      case 0x000087fc: return "GL_TEXTURE_FREE_MEMORY_ATI";
-      case 0x000087fd: return "GL_RENDERBUFFER_FREE_MEMORY_ATI";
-      case 0x000087fe: return "GL_NUM_PROGRAM_BINARY_FORMATS";
-      case 0x000087ff: return "GL_PROGRAM_BINARY_FORMATS";
-      case 0x00008800: return "GL_STENCIL_BACK_FUNC";
-      case 0x00008801: return "GL_STENCIL_BACK_FAIL";
-      case 0x00008802: return "GL_STENCIL_BACK_PASS_DEPTH_FAIL";
-      case 0x00008803: return "GL_STENCIL_BACK_PASS_DEPTH_PASS";
-      case 0x00008804: return "GL_FRAGMENT_PROGRAM_ARB";
-      case 0x00008805: return "GL_PROGRAM_ALU_INSTRUCTIONS_ARB";
-      case 0x00008806: return "GL_PROGRAM_TEX_INSTRUCTIONS_ARB";
-      case 0x00008807: return "GL_PROGRAM_TEX_INDIRECTIONS_ARB";
-      case 0x00008808: return "GL_PROGRAM_NATIVE_ALU_INSTRUCTIONS_ARB";
-      case 0x00008809: return "GL_PROGRAM_NATIVE_TEX_INSTRUCTIONS_ARB";
-      case 0x0000880a: return "GL_PROGRAM_NATIVE_TEX_INDIRECTIONS_ARB";
-      case 0x0000880b: return "GL_MAX_PROGRAM_ALU_INSTRUCTIONS_ARB";
-      case 0x0000880c: return "GL_MAX_PROGRAM_TEX_INSTRUCTIONS_ARB";
-      case 0x0000880d: return "GL_MAX_PROGRAM_TEX_INDIRECTIONS_ARB";
-      case 0x0000880e: return "GL_MAX_PROGRAM_NATIVE_ALU_INSTRUCTIONS_ARB";
-      case 0x0000880f: return "GL_MAX_PROGRAM_NATIVE_TEX_INSTRUCTIONS_ARB";
-      case 0x00008810: return "GL_MAX_PROGRAM_NATIVE_TEX_INDIRECTIONS_ARB";
-      case 0x00008814: return "GL_RGBA32F";
-      case 0x00008815: return "GL_RGB32F";
-      case 0x00008816: return "GL_ALPHA32F_ARB";
-      case 0x00008817: return "GL_INTENSITY32F_ARB";
-      case 0x00008818: return "GL_LUMINANCE32F_ARB";
-      case 0x00008819: return "GL_LUMINANCE_ALPHA32F_ARB";
-      case 0x0000881a: return "GL_RGBA16F";
-      case 0x0000881b: return "GL_RGB16F";
-      case 0x0000881c: return "GL_ALPHA16F_ARB";
-      case 0x0000881d: return "GL_INTENSITY16F_ARB";
-      case 0x0000881e: return "GL_LUMINANCE16F_ARB";
-      case 0x0000881f: return "GL_LUMINANCE_ALPHA16F_ARB";
-      case 0x00008820: return "GL_RGBA_FLOAT_MODE_ARB";
-      case 0x00008823: return "GL_WRITEONLY_RENDERING_QCOM";
-      case 0x00008824: return "GL_MAX_DRAW_BUFFERS";
-      case 0x00008825: return "GL_DRAW_BUFFER0";
-      case 0x00008826: return "GL_DRAW_BUFFER1";
-      case 0x00008827: return "GL_DRAW_BUFFER2";
-      case 0x00008828: return "GL_DRAW_BUFFER3";
-      case 0x00008829: return "GL_DRAW_BUFFER4";
-      case 0x0000882a: return "GL_DRAW_BUFFER5";
-      case 0x0000882b: return "GL_DRAW_BUFFER6";
-      case 0x0000882c: return "GL_DRAW_BUFFER7";
-      case 0x0000882d: return "GL_DRAW_BUFFER8";
-      case 0x0000882e: return "GL_DRAW_BUFFER9";
-      case 0x0000882f: return "GL_DRAW_BUFFER10";
-      case 0x00008830: return "GL_DRAW_BUFFER11";
-      case 0x00008831: return "GL_DRAW_BUFFER12";
-      case 0x00008832: return "GL_DRAW_BUFFER13";
-      case 0x00008833: return "GL_DRAW_BUFFER14";
-      case 0x00008834: return "GL_DRAW_BUFFER15";
-      case 0x00008837: return "GL_COMPRESSED_LUMINANCE_ALPHA_3DC_ATI";
-      case 0x0000883d: return "GL_BLEND_EQUATION_ALPHA";
-      case 0x0000883f: return "GL_SUBSAMPLE_DISTANCE_AMD";
-      case 0x00008840: return "GL_MATRIX_PALETTE_ARB";
-      case 0x00008841: return "GL_MAX_MATRIX_PALETTE_STACK_DEPTH_ARB";
-      case 0x00008842: return "GL_MAX_PALETTE_MATRICES_ARB";
-      case 0x00008843: return "GL_CURRENT_PALETTE_MATRIX_ARB";
-      case 0x00008844: return "GL_MATRIX_INDEX_ARRAY_ARB";
-      case 0x00008845: return "GL_CURRENT_MATRIX_INDEX_ARB";
-      case 0x00008846: return "GL_MATRIX_INDEX_ARRAY_SIZE_ARB";
-      case 0x00008847: return "GL_MATRIX_INDEX_ARRAY_TYPE_ARB";
-      case 0x00008848: return "GL_MATRIX_INDEX_ARRAY_STRIDE_ARB";
-      case 0x00008849: return "GL_MATRIX_INDEX_ARRAY_POINTER_ARB";
-      case 0x0000884a: return "GL_TEXTURE_DEPTH_SIZE";
-      case 0x0000884b: return "GL_DEPTH_TEXTURE_MODE";
-      case 0x0000884c: return "GL_TEXTURE_COMPARE_MODE";
-      case 0x0000884d: return "GL_TEXTURE_COMPARE_FUNC";
-      case 0x0000884e: return "GL_COMPARE_R_TO_TEXTURE";
-      case 0x0000884f: return "GL_TEXTURE_CUBE_MAP_SEAMLESS";
-      case 0x00008850: return "GL_OFFSET_PROJECTIVE_TEXTURE_2D_NV";
-      case 0x00008851: return "GL_OFFSET_PROJECTIVE_TEXTURE_2D_SCALE_NV";
-      case 0x00008852: return "GL_OFFSET_PROJECTIVE_TEXTURE_RECTANGLE_NV";
-      case 0x00008853: return "GL_OFFSET_PROJECTIVE_TEXTURE_RECTANGLE_SCALE_NV";
-      case 0x00008854: return "GL_OFFSET_HILO_TEXTURE_2D_NV";
-      case 0x00008855: return "GL_OFFSET_HILO_TEXTURE_RECTANGLE_NV";
-      case 0x00008856: return "GL_OFFSET_HILO_PROJECTIVE_TEXTURE_2D_NV";
-      case 0x00008857: return "GL_OFFSET_HILO_PROJECTIVE_TEXTURE_RECTANGLE_NV";
-      case 0x00008858: return "GL_DEPENDENT_HILO_TEXTURE_2D_NV";
-      case 0x00008859: return "GL_DEPENDENT_RGB_TEXTURE_3D_NV";
-      case 0x0000885a: return "GL_DEPENDENT_RGB_TEXTURE_CUBE_MAP_NV";
-      case 0x0000885b: return "GL_DOT_PRODUCT_PASS_THROUGH_NV";
-      case 0x0000885c: return "GL_DOT_PRODUCT_TEXTURE_1D_NV";
-      case 0x0000885d: return "GL_DOT_PRODUCT_AFFINE_DEPTH_REPLACE_NV";
-      case 0x0000885e: return "GL_HILO8_NV";
-      case 0x0000885f: return "GL_SIGNED_HILO8_NV";
-      case 0x00008860: return "GL_FORCE_BLUE_TO_ONE_NV";
-      case 0x00008861: return "GL_POINT_SPRITE";
-      case 0x00008862: return "GL_COORD_REPLACE";
-      case 0x00008863: return "GL_POINT_SPRITE_R_MODE_NV";
-      case 0x00008864: return "GL_QUERY_COUNTER_BITS_ARB";
-      case 0x00008865: return "GL_CURRENT_QUERY";
-      case 0x00008866: return "GL_QUERY_RESULT";
-      case 0x00008867: return "GL_QUERY_RESULT_AVAILABLE";
-      case 0x00008868: return "GL_MAX_FRAGMENT_PROGRAM_LOCAL_PARAMETERS_NV";
-      case 0x00008869: return "GL_MAX_VERTEX_ATTRIBS";
-      case 0x0000886a: return "GL_VERTEX_ATTRIB_ARRAY_NORMALIZED";
-      case 0x0000886c: return "GL_MAX_TESS_CONTROL_INPUT_COMPONENTS";
-      case 0x0000886d: return "GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS";
-      case 0x0000886e: return "GL_DEPTH_STENCIL_TO_RGBA_NV";
-      case 0x0000886f: return "GL_DEPTH_STENCIL_TO_BGRA_NV";
-      case 0x00008870: return "GL_FRAGMENT_PROGRAM_NV";
-      case 0x00008871: return "GL_MAX_TEXTURE_COORDS";
-      case 0x00008872: return "GL_MAX_TEXTURE_IMAGE_UNITS";
-      case 0x00008873: return "GL_FRAGMENT_PROGRAM_BINDING_NV";
-      case 0x00008874: return "GL_PROGRAM_ERROR_STRING_ARB";
-      case 0x00008875: return "GL_PROGRAM_FORMAT_ASCII_ARB";
-      case 0x00008876: return "GL_PROGRAM_FORMAT_ARB";
-      case 0x00008878: return "GL_WRITE_PIXEL_DATA_RANGE_NV";
-      case 0x00008879: return "GL_READ_PIXEL_DATA_RANGE_NV";
-      case 0x0000887a: return "GL_WRITE_PIXEL_DATA_RANGE_LENGTH_NV";
-      case 0x0000887b: return "GL_READ_PIXEL_DATA_RANGE_LENGTH_NV";
-      case 0x0000887c: return "GL_WRITE_PIXEL_DATA_RANGE_POINTER_NV";
-      case 0x0000887d: return "GL_READ_PIXEL_DATA_RANGE_POINTER_NV";
-      case 0x0000887f: return "GL_GEOMETRY_SHADER_INVOCATIONS";
-      case 0x00008880: return "GL_FLOAT_R_NV";
-      case 0x00008881: return "GL_FLOAT_RG_NV";
-      case 0x00008882: return "GL_FLOAT_RGB_NV";
-      case 0x00008883: return "GL_FLOAT_RGBA_NV";
-      case 0x00008884: return "GL_FLOAT_R16_NV";
-      case 0x00008885: return "GL_FLOAT_R32_NV";
-      case 0x00008886: return "GL_FLOAT_RG16_NV";
-      case 0x00008887: return "GL_FLOAT_RG32_NV";
-      case 0x00008888: return "GL_FLOAT_RGB16_NV";
-      case 0x00008889: return "GL_FLOAT_RGB32_NV";
-      case 0x0000888a: return "GL_FLOAT_RGBA16_NV";
-      case 0x0000888b: return "GL_FLOAT_RGBA32_NV";
-      case 0x0000888c: return "GL_TEXTURE_FLOAT_COMPONENTS_NV";
-      case 0x0000888d: return "GL_FLOAT_CLEAR_COLOR_VALUE_NV";
-      case 0x0000888e: return "GL_FLOAT_RGBA_MODE_NV";
-      case 0x0000888f: return "GL_TEXTURE_UNSIGNED_REMAP_MODE_NV";
-      case 0x00008890: return "GL_DEPTH_BOUNDS_TEST_EXT";
-      case 0x00008891: return "GL_DEPTH_BOUNDS_EXT";
-      case 0x00008892: return "GL_ARRAY_BUFFER";
-      case 0x00008893: return "GL_ELEMENT_ARRAY_BUFFER";
-      case 0x00008894: return "GL_ARRAY_BUFFER_BINDING";
-      case 0x00008895: return "GL_ELEMENT_ARRAY_BUFFER_BINDING";
-      case 0x00008896: return "GL_VERTEX_ARRAY_BUFFER_BINDING";
-      case 0x00008897: return "GL_NORMAL_ARRAY_BUFFER_BINDING";
-      case 0x00008898: return "GL_COLOR_ARRAY_BUFFER_BINDING";
-      case 0x00008899: return "GL_INDEX_ARRAY_BUFFER_BINDING";
-      case 0x0000889a: return "GL_TEXTURE_COORD_ARRAY_BUFFER_BINDING";
-      case 0x0000889b: return "GL_EDGE_FLAG_ARRAY_BUFFER_BINDING";
-      case 0x0000889c: return "GL_SECONDARY_COLOR_ARRAY_BUFFER_BINDING";
-      case 0x0000889d: return "GL_FOG_COORDINATE_ARRAY_BUFFER_BINDING";
-      case 0x0000889e: return "GL_WEIGHT_ARRAY_BUFFER_BINDING";
-      case 0x0000889f: return "GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING";
-      case 0x000088a0: return "GL_PROGRAM_INSTRUCTIONS_ARB";
-      case 0x000088a1: return "GL_MAX_PROGRAM_INSTRUCTIONS_ARB";
-      case 0x000088a2: return "GL_PROGRAM_NATIVE_INSTRUCTIONS_ARB";
-      case 0x000088a3: return "GL_MAX_PROGRAM_NATIVE_INSTRUCTIONS_ARB";
-      case 0x000088a4: return "GL_PROGRAM_TEMPORARIES_ARB";
-      case 0x000088a5: return "GL_MAX_PROGRAM_TEMPORARIES_ARB";
-      case 0x000088a6: return "GL_PROGRAM_NATIVE_TEMPORARIES_ARB";
-      case 0x000088a7: return "GL_MAX_PROGRAM_NATIVE_TEMPORARIES_ARB";
-      case 0x000088a8: return "GL_PROGRAM_PARAMETERS_ARB";
-      case 0x000088a9: return "GL_MAX_PROGRAM_PARAMETERS_ARB";
-      case 0x000088aa: return "GL_PROGRAM_NATIVE_PARAMETERS_ARB";
-      case 0x000088ab: return "GL_MAX_PROGRAM_NATIVE_PARAMETERS_ARB";
-      case 0x000088ac: return "GL_PROGRAM_ATTRIBS_ARB";
-      case 0x000088ad: return "GL_MAX_PROGRAM_ATTRIBS_ARB";
-      case 0x000088ae: return "GL_PROGRAM_NATIVE_ATTRIBS_ARB";
-      case 0x000088af: return "GL_MAX_PROGRAM_NATIVE_ATTRIBS_ARB";
-      case 0x000088b0: return "GL_PROGRAM_ADDRESS_REGISTERS_ARB";
-      case 0x000088b1: return "GL_MAX_PROGRAM_ADDRESS_REGISTERS_ARB";
-      case 0x000088b2: return "GL_PROGRAM_NATIVE_ADDRESS_REGISTERS_ARB";
-      case 0x000088b3: return "GL_MAX_PROGRAM_NATIVE_ADDRESS_REGISTERS_ARB";
-      case 0x000088b4: return "GL_MAX_PROGRAM_LOCAL_PARAMETERS_ARB";
-      case 0x000088b5: return "GL_MAX_PROGRAM_ENV_PARAMETERS_ARB";
-      case 0x000088b6: return "GL_PROGRAM_UNDER_NATIVE_LIMITS_ARB";
-      case 0x000088b7: return "GL_TRANSPOSE_CURRENT_MATRIX_ARB";
-      case 0x000088b8: return "GL_READ_ONLY";
-      case 0x000088b9: return "GL_WRITE_ONLY";
-      case 0x000088ba: return "GL_READ_WRITE";
-      case 0x000088bb: return "GL_BUFFER_ACCESS";
-      case 0x000088bc: return "GL_BUFFER_MAPPED";
-      case 0x000088bd: return "GL_BUFFER_MAP_POINTER";
-      case 0x000088be: return "GL_WRITE_DISCARD_NV";
-      case 0x000088bf: return "GL_TIME_ELAPSED";
-      case 0x000088c0: return "GL_MATRIX0_ARB";
-      case 0x000088c1: return "GL_MATRIX1_ARB";
-      case 0x000088c2: return "GL_MATRIX2_ARB";
-      case 0x000088c3: return "GL_MATRIX3_ARB";
-      case 0x000088c4: return "GL_MATRIX4_ARB";
-      case 0x000088c5: return "GL_MATRIX5_ARB";
-      case 0x000088c6: return "GL_MATRIX6_ARB";
-      case 0x000088c7: return "GL_MATRIX7_ARB";
-      case 0x000088c8: return "GL_MATRIX8_ARB";
-      case 0x000088c9: return "GL_MATRIX9_ARB";
-      case 0x000088ca: return "GL_MATRIX10_ARB";
-      case 0x000088cb: return "GL_MATRIX11_ARB";
-      case 0x000088cc: return "GL_MATRIX12_ARB";
-      case 0x000088cd: return "GL_MATRIX13_ARB";
-      case 0x000088ce: return "GL_MATRIX14_ARB";
-      case 0x000088cf: return "GL_MATRIX15_ARB";
-      case 0x000088d0: return "GL_MATRIX16_ARB";
-      case 0x000088d1: return "GL_MATRIX17_ARB";
-      case 0x000088d2: return "GL_MATRIX18_ARB";
-      case 0x000088d3: return "GL_MATRIX19_ARB";
-      case 0x000088d4: return "GL_MATRIX20_ARB";
-      case 0x000088d5: return "GL_MATRIX21_ARB";
-      case 0x000088d6: return "GL_MATRIX22_ARB";
-      case 0x000088d7: return "GL_MATRIX23_ARB";
-      case 0x000088d8: return "GL_MATRIX24_ARB";
-      case 0x000088d9: return "GL_MATRIX25_ARB";
-      case 0x000088da: return "GL_MATRIX26_ARB";
-      case 0x000088db: return "GL_MATRIX27_ARB";
-      case 0x000088dc: return "GL_MATRIX28_ARB";
-      case 0x000088dd: return "GL_MATRIX29_ARB";
-      case 0x000088de: return "GL_MATRIX30_ARB";
-      case 0x000088df: return "GL_MATRIX31_ARB";
-      case 0x000088e0: return "GL_STREAM_DRAW";
-      case 0x000088e1: return "GL_STREAM_READ";
-      case 0x000088e2: return "GL_STREAM_COPY";
-      case 0x000088e4: return "GL_STATIC_DRAW";
-      case 0x000088e5: return "GL_STATIC_READ";
-      case 0x000088e6: return "GL_STATIC_COPY";
-      case 0x000088e8: return "GL_DYNAMIC_DRAW";
-      case 0x000088e9: return "GL_DYNAMIC_READ";
-      case 0x000088ea: return "GL_DYNAMIC_COPY";
-      case 0x000088eb: return "GL_PIXEL_PACK_BUFFER";
-      case 0x000088ec: return "GL_PIXEL_UNPACK_BUFFER";
-      case 0x000088ed: return "GL_PIXEL_PACK_BUFFER_BINDING";
-      case 0x000088ee: return "GL_ETC1_SRGB8_NV";
-      case 0x000088ef: return "GL_PIXEL_UNPACK_BUFFER_BINDING";
-      case 0x000088f0: return "GL_DEPTH24_STENCIL8";
-      case 0x000088f1: return "GL_TEXTURE_STENCIL_SIZE";
-      case 0x000088f2: return "GL_STENCIL_TAG_BITS_EXT";
-      case 0x000088f3: return "GL_STENCIL_CLEAR_TAG_VALUE_EXT";
-      case 0x000088f4: return "GL_MAX_PROGRAM_EXEC_INSTRUCTIONS_NV";
-      case 0x000088f5: return "GL_MAX_PROGRAM_CALL_DEPTH_NV";
-      case 0x000088f6: return "GL_MAX_PROGRAM_IF_DEPTH_NV";
-      case 0x000088f7: return "GL_MAX_PROGRAM_LOOP_DEPTH_NV";
-      case 0x000088f8: return "GL_MAX_PROGRAM_LOOP_COUNT_NV";
-      case 0x000088f9: return "GL_SRC1_COLOR";
-      case 0x000088fa: return "GL_ONE_MINUS_SRC1_COLOR";
-      case 0x000088fb: return "GL_ONE_MINUS_SRC1_ALPHA";
-      case 0x000088fc: return "GL_MAX_DUAL_SOURCE_DRAW_BUFFERS";
-      case 0x000088fd: return "GL_VERTEX_ATTRIB_ARRAY_INTEGER";
-      case 0x000088fe: return "GL_VERTEX_ATTRIB_ARRAY_DIVISOR";
-      case 0x000088ff: return "GL_MAX_ARRAY_TEXTURE_LAYERS";
-      case 0x00008904: return "GL_MIN_PROGRAM_TEXEL_OFFSET";
-      case 0x00008905: return "GL_MAX_PROGRAM_TEXEL_OFFSET";
-      case 0x00008906: return "GL_PROGRAM_ATTRIB_COMPONENTS_NV";
-      case 0x00008907: return "GL_PROGRAM_RESULT_COMPONENTS_NV";
-      case 0x00008908: return "GL_MAX_PROGRAM_ATTRIB_COMPONENTS_NV";
-      case 0x00008909: return "GL_MAX_PROGRAM_RESULT_COMPONENTS_NV";
-      case 0x0000890b: return "GL_NVIDIA_PLATFORM_BINARY_NV";
-      case 0x0000890e: return "GL_CG_VERTEX_SHADER_EXT";
-      case 0x0000890f: return "GL_CG_FRAGMENT_SHADER_EXT";
-      case 0x00008910: return "GL_STENCIL_TEST_TWO_SIDE_EXT";
-      case 0x00008911: return "GL_ACTIVE_STENCIL_FACE_EXT";
-      case 0x00008912: return "GL_MIRROR_CLAMP_TO_BORDER_EXT";
-      case 0x00008914: return "GL_SAMPLES_PASSED";
-      case 0x00008916: return "GL_GEOMETRY_VERTICES_OUT";
-      case 0x00008917: return "GL_GEOMETRY_INPUT_TYPE";
-      case 0x00008918: return "GL_GEOMETRY_OUTPUT_TYPE";
-      case 0x00008919: return "GL_SAMPLER_BINDING";
-      case 0x0000891a: return "GL_CLAMP_VERTEX_COLOR";
-      case 0x0000891b: return "GL_CLAMP_FRAGMENT_COLOR";
-      case 0x0000891c: return "GL_CLAMP_READ_COLOR";
-      case 0x0000891d: return "GL_FIXED_ONLY";
-      case 0x0000891e: return "GL_TESS_CONTROL_PROGRAM_NV";
-      case 0x0000891f: return "GL_TESS_EVALUATION_PROGRAM_NV";
-      case 0x00008920: return "GL_FRAGMENT_SHADER_ATI";
-      case 0x00008921: return "GL_REG_0_ATI";
-      case 0x00008922: return "GL_REG_1_ATI";
-      case 0x00008923: return "GL_REG_2_ATI";
-      case 0x00008924: return "GL_REG_3_ATI";
-      case 0x00008925: return "GL_REG_4_ATI";
-      case 0x00008926: return "GL_REG_5_ATI";
-      case 0x00008941: return "GL_CON_0_ATI";
-      case 0x00008942: return "GL_CON_1_ATI";
-      case 0x00008943: return "GL_CON_2_ATI";
-      case 0x00008944: return "GL_CON_3_ATI";
-      case 0x00008945: return "GL_CON_4_ATI";
-      case 0x00008946: return "GL_CON_5_ATI";
-      case 0x00008947: return "GL_CON_6_ATI";
-      case 0x00008948: return "GL_CON_7_ATI";
-      case 0x00008961: return "GL_MOV_ATI";
-      case 0x00008963: return "GL_ADD_ATI";
-      case 0x00008964: return "GL_MUL_ATI";
-      case 0x00008965: return "GL_SUB_ATI";
-      case 0x00008966: return "GL_DOT3_ATI";
-      case 0x00008967: return "GL_DOT4_ATI";
-      case 0x00008968: return "GL_MAD_ATI";
-      case 0x00008969: return "GL_LERP_ATI";
-      case 0x0000896a: return "GL_CND_ATI";
-      case 0x0000896b: return "GL_CND0_ATI";
-      case 0x0000896c: return "GL_DOT2_ADD_ATI";
-      case 0x0000896d: return "GL_SECONDARY_INTERPOLATOR_ATI";
-      case 0x0000896e: return "GL_NUM_FRAGMENT_REGISTERS_ATI";
-      case 0x0000896f: return "GL_NUM_FRAGMENT_CONSTANTS_ATI";
-      case 0x00008970: return "GL_NUM_PASSES_ATI";
-      case 0x00008971: return "GL_NUM_INSTRUCTIONS_PER_PASS_ATI";
-      case 0x00008972: return "GL_NUM_INSTRUCTIONS_TOTAL_ATI";
-      case 0x00008973: return "GL_NUM_INPUT_INTERPOLATOR_COMPONENTS_ATI";
-      case 0x00008974: return "GL_NUM_LOOPBACK_COMPONENTS_ATI";
-      case 0x00008975: return "GL_COLOR_ALPHA_PAIRING_ATI";
-      case 0x00008976: return "GL_SWIZZLE_STR_ATI";
-      case 0x00008977: return "GL_SWIZZLE_STQ_ATI";
-      case 0x00008978: return "GL_SWIZZLE_STR_DR_ATI";
-      case 0x00008979: return "GL_SWIZZLE_STQ_DQ_ATI";
-      case 0x0000897a: return "GL_SWIZZLE_STRQ_ATI";
-      case 0x0000897b: return "GL_SWIZZLE_STRQ_DQ_ATI";
-      case 0x00008980: return "GL_INTERLACE_OML";
-      case 0x00008981: return "GL_INTERLACE_READ_OML";
-      case 0x00008982: return "GL_FORMAT_SUBSAMPLE_24_24_OML";
-      case 0x00008983: return "GL_FORMAT_SUBSAMPLE_244_244_OML";
-      case 0x00008984: return "GL_PACK_RESAMPLE_OML";
-      case 0x00008985: return "GL_UNPACK_RESAMPLE_OML";
-      case 0x00008986: return "GL_RESAMPLE_REPLICATE_OML";
-      case 0x00008987: return "GL_RESAMPLE_ZERO_FILL_OML";
-      case 0x00008988: return "GL_RESAMPLE_AVERAGE_OML";
-      case 0x00008989: return "GL_RESAMPLE_DECIMATE_OML";
-      case 0x0000898a: return "GL_POINT_SIZE_ARRAY_TYPE_OES";
-      case 0x0000898b: return "GL_POINT_SIZE_ARRAY_STRIDE_OES";
-      case 0x0000898c: return "GL_POINT_SIZE_ARRAY_POINTER_OES";
-      case 0x00008a00: return "GL_VERTEX_ATTRIB_MAP1_APPLE";
-      case 0x00008a01: return "GL_VERTEX_ATTRIB_MAP2_APPLE";
-      case 0x00008a02: return "GL_VERTEX_ATTRIB_MAP1_SIZE_APPLE";
-      case 0x00008a03: return "GL_VERTEX_ATTRIB_MAP1_COEFF_APPLE";
-      case 0x00008a04: return "GL_VERTEX_ATTRIB_MAP1_ORDER_APPLE";
-      case 0x00008a05: return "GL_VERTEX_ATTRIB_MAP1_DOMAIN_APPLE";
-      case 0x00008a06: return "GL_VERTEX_ATTRIB_MAP2_SIZE_APPLE";
-      case 0x00008a07: return "GL_VERTEX_ATTRIB_MAP2_COEFF_APPLE";
-      case 0x00008a08: return "GL_VERTEX_ATTRIB_MAP2_ORDER_APPLE";
-      case 0x00008a09: return "GL_VERTEX_ATTRIB_MAP2_DOMAIN_APPLE";
-      case 0x00008a0a: return "GL_DRAW_PIXELS_APPLE";
-      case 0x00008a0b: return "GL_FENCE_APPLE";
-      case 0x00008a0c: return "GL_ELEMENT_ARRAY_APPLE";
-      case 0x00008a0d: return "GL_ELEMENT_ARRAY_TYPE_APPLE";
-      case 0x00008a0e: return "GL_ELEMENT_ARRAY_POINTER_APPLE";
-      case 0x00008a0f: return "GL_COLOR_FLOAT_APPLE";
-      case 0x00008a10: return "GL_MIN_PBUFFER_VIEWPORT_DIMS_APPLE";
-      case 0x00008a11: return "GL_UNIFORM_BUFFER";
-      case 0x00008a12: return "GL_BUFFER_SERIALIZED_MODIFY_APPLE";
-      case 0x00008a13: return "GL_BUFFER_FLUSHING_UNMAP_APPLE";
-      case 0x00008a14: return "GL_AUX_DEPTH_STENCIL_APPLE";
-      case 0x00008a15: return "GL_PACK_ROW_BYTES_APPLE";
-      case 0x00008a16: return "GL_UNPACK_ROW_BYTES_APPLE";
-      case 0x00008a19: return "GL_RELEASED_APPLE";
-      case 0x00008a1a: return "GL_VOLATILE_APPLE";
-      case 0x00008a1b: return "GL_RETAINED_APPLE";
-      case 0x00008a1c: return "GL_UNDEFINED_APPLE";
-      case 0x00008a1d: return "GL_PURGEABLE_APPLE";
-      case 0x00008a1f: return "GL_RGB_422_APPLE";
-      case 0x00008a28: return "GL_UNIFORM_BUFFER_BINDING";
-      case 0x00008a29: return "GL_UNIFORM_BUFFER_START";
-      case 0x00008a2a: return "GL_UNIFORM_BUFFER_SIZE";
-      case 0x00008a2b: return "GL_MAX_VERTEX_UNIFORM_BLOCKS";
-      case 0x00008a2c: return "GL_MAX_GEOMETRY_UNIFORM_BLOCKS";
-      case 0x00008a2d: return "GL_MAX_FRAGMENT_UNIFORM_BLOCKS";
-      case 0x00008a2e: return "GL_MAX_COMBINED_UNIFORM_BLOCKS";
-      case 0x00008a2f: return "GL_MAX_UNIFORM_BUFFER_BINDINGS";
-      case 0x00008a30: return "GL_MAX_UNIFORM_BLOCK_SIZE";
-      case 0x00008a31: return "GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS";
-      case 0x00008a32: return "GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS";
-      case 0x00008a33: return "GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS";
-      case 0x00008a34: return "GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT";
-      case 0x00008a35: return "GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH";
-      case 0x00008a36: return "GL_ACTIVE_UNIFORM_BLOCKS";
-      case 0x00008a37: return "GL_UNIFORM_TYPE";
-      case 0x00008a38: return "GL_UNIFORM_SIZE";
-      case 0x00008a39: return "GL_UNIFORM_NAME_LENGTH";
-      case 0x00008a3a: return "GL_UNIFORM_BLOCK_INDEX";
-      case 0x00008a3b: return "GL_UNIFORM_OFFSET";
-      case 0x00008a3c: return "GL_UNIFORM_ARRAY_STRIDE";
-      case 0x00008a3d: return "GL_UNIFORM_MATRIX_STRIDE";
-      case 0x00008a3e: return "GL_UNIFORM_IS_ROW_MAJOR";
-      case 0x00008a3f: return "GL_UNIFORM_BLOCK_BINDING";
-      case 0x00008a40: return "GL_UNIFORM_BLOCK_DATA_SIZE";
-      case 0x00008a41: return "GL_UNIFORM_BLOCK_NAME_LENGTH";
-      case 0x00008a42: return "GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS";
-      case 0x00008a43: return "GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES";
-      case 0x00008a44: return "GL_UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER";
-      case 0x00008a45: return "GL_UNIFORM_BLOCK_REFERENCED_BY_GEOMETRY_SHADER";
-      case 0x00008a46: return "GL_UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER";
-      case 0x00008a48: return "GL_TEXTURE_SRGB_DECODE_EXT";
-      case 0x00008a49: return "GL_DECODE_EXT";
-      case 0x00008a4a: return "GL_SKIP_DECODE_EXT";
-      case 0x00008a4f: return "GL_PROGRAM_PIPELINE_OBJECT_EXT";
-      case 0x00008a52: return "GL_FRAGMENT_SHADER_DISCARDS_SAMPLES_EXT";
-      case 0x00008a53: return "GL_SYNC_OBJECT_APPLE";
-      case 0x00008b30: return "GL_FRAGMENT_SHADER";
-      case 0x00008b31: return "GL_VERTEX_SHADER";
-      case 0x00008b40: return "GL_PROGRAM_OBJECT_ARB";
-      case 0x00008b48: return "GL_SHADER_OBJECT_ARB";
-      case 0x00008b49: return "GL_MAX_FRAGMENT_UNIFORM_COMPONENTS";
-      case 0x00008b4a: return "GL_MAX_VERTEX_UNIFORM_COMPONENTS";
-      case 0x00008b4b: return "GL_MAX_VARYING_FLOATS";
-      case 0x00008b4c: return "GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS";
-      case 0x00008b4d: return "GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS";
-      case 0x00008b4e: return "GL_OBJECT_TYPE_ARB";
-      case 0x00008b4f: return "GL_SHADER_TYPE";
-      case 0x00008b50: return "GL_FLOAT_VEC2";
-      case 0x00008b51: return "GL_FLOAT_VEC3";
-      case 0x00008b52: return "GL_FLOAT_VEC4";
-      case 0x00008b53: return "GL_INT_VEC2";
-      case 0x00008b54: return "GL_INT_VEC3";
-      case 0x00008b55: return "GL_INT_VEC4";
-      case 0x00008b56: return "GL_BOOL";
-      case 0x00008b57: return "GL_BOOL_VEC2";
-      case 0x00008b58: return "GL_BOOL_VEC3";
-      case 0x00008b59: return "GL_BOOL_VEC4";
-      case 0x00008b5a: return "GL_FLOAT_MAT2";
-      case 0x00008b5b: return "GL_FLOAT_MAT3";
-      case 0x00008b5c: return "GL_FLOAT_MAT4";
-      case 0x00008b5d: return "GL_SAMPLER_1D";
-      case 0x00008b5e: return "GL_SAMPLER_2D";
-      case 0x00008b5f: return "GL_SAMPLER_3D";
-      case 0x00008b60: return "GL_SAMPLER_CUBE";
-      case 0x00008b61: return "GL_SAMPLER_1D_SHADOW";
-      case 0x00008b62: return "GL_SAMPLER_2D_SHADOW";
-      case 0x00008b63: return "GL_SAMPLER_2D_RECT";
-      case 0x00008b64: return "GL_SAMPLER_2D_RECT_SHADOW";
-      case 0x00008b65: return "GL_FLOAT_MAT2x3";
-      case 0x00008b66: return "GL_FLOAT_MAT2x4";
-      case 0x00008b67: return "GL_FLOAT_MAT3x2";
-      case 0x00008b68: return "GL_FLOAT_MAT3x4";
-      case 0x00008b69: return "GL_FLOAT_MAT4x2";
-      case 0x00008b6a: return "GL_FLOAT_MAT4x3";
-      case 0x00008b80: return "GL_DELETE_STATUS";
-      case 0x00008b81: return "GL_COMPILE_STATUS";
-      case 0x00008b82: return "GL_LINK_STATUS";
-      case 0x00008b83: return "GL_VALIDATE_STATUS";
-      case 0x00008b84: return "GL_INFO_LOG_LENGTH";
-      case 0x00008b85: return "GL_ATTACHED_SHADERS";
-      case 0x00008b86: return "GL_ACTIVE_UNIFORMS";
-      case 0x00008b87: return "GL_ACTIVE_UNIFORM_MAX_LENGTH";
-      case 0x00008b88: return "GL_SHADER_SOURCE_LENGTH";
-      case 0x00008b89: return "GL_ACTIVE_ATTRIBUTES";
-      case 0x00008b8a: return "GL_ACTIVE_ATTRIBUTE_MAX_LENGTH";
-      case 0x00008b8b: return "GL_FRAGMENT_SHADER_DERIVATIVE_HINT";
-      case 0x00008b8c: return "GL_SHADING_LANGUAGE_VERSION";
-      case 0x00008b8d: return "GL_CURRENT_PROGRAM";
-      case 0x00008b90: return "GL_PALETTE4_RGB8_OES";
-      case 0x00008b91: return "GL_PALETTE4_RGBA8_OES";
-      case 0x00008b92: return "GL_PALETTE4_R5_G6_B5_OES";
-      case 0x00008b93: return "GL_PALETTE4_RGBA4_OES";
-      case 0x00008b94: return "GL_PALETTE4_RGB5_A1_OES";
-      case 0x00008b95: return "GL_PALETTE8_RGB8_OES";
-      case 0x00008b96: return "GL_PALETTE8_RGBA8_OES";
-      case 0x00008b97: return "GL_PALETTE8_R5_G6_B5_OES";
-      case 0x00008b98: return "GL_PALETTE8_RGBA4_OES";
-      case 0x00008b99: return "GL_PALETTE8_RGB5_A1_OES";
-      case 0x00008b9a: return "GL_IMPLEMENTATION_COLOR_READ_TYPE";
-      case 0x00008b9b: return "GL_IMPLEMENTATION_COLOR_READ_FORMAT";
-      case 0x00008b9c: return "GL_POINT_SIZE_ARRAY_OES";
-      case 0x00008b9d: return "GL_TEXTURE_CROP_RECT_OES";
-      case 0x00008b9e: return "GL_MATRIX_INDEX_ARRAY_BUFFER_BINDING_OES";
-      case 0x00008b9f: return "GL_POINT_SIZE_ARRAY_BUFFER_BINDING_OES";
-      case 0x00008bc0: return "GL_COUNTER_TYPE_AMD";
-      case 0x00008bc1: return "GL_COUNTER_RANGE_AMD";
-      case 0x00008bc2: return "GL_UNSIGNED_INT64_AMD";
-      case 0x00008bc3: return "GL_PERCENTAGE_AMD";
-      case 0x00008bc4: return "GL_PERFMON_RESULT_AVAILABLE_AMD";
-      case 0x00008bc5: return "GL_PERFMON_RESULT_SIZE_AMD";
-      case 0x00008bc6: return "GL_PERFMON_RESULT_AMD";
-      case 0x00008bd2: return "GL_TEXTURE_WIDTH_QCOM";
-      case 0x00008bd3: return "GL_TEXTURE_HEIGHT_QCOM";
-      case 0x00008bd4: return "GL_TEXTURE_DEPTH_QCOM";
-      case 0x00008bd5: return "GL_TEXTURE_INTERNAL_FORMAT_QCOM";
-      case 0x00008bd6: return "GL_TEXTURE_FORMAT_QCOM";
-      case 0x00008bd7: return "GL_TEXTURE_TYPE_QCOM";
-      case 0x00008bd8: return "GL_TEXTURE_IMAGE_VALID_QCOM";
-      case 0x00008bd9: return "GL_TEXTURE_NUM_LEVELS_QCOM";
-      case 0x00008bda: return "GL_TEXTURE_TARGET_QCOM";
-      case 0x00008bdb: return "GL_TEXTURE_OBJECT_VALID_QCOM";
-      case 0x00008bdc: return "GL_STATE_RESTORE";
-      case 0x00008c00: return "GL_COMPRESSED_RGB_PVRTC_4BPPV1_IMG";
-      case 0x00008c01: return "GL_COMPRESSED_RGB_PVRTC_2BPPV1_IMG";
-      case 0x00008c02: return "GL_COMPRESSED_RGBA_PVRTC_4BPPV1_IMG";
-      case 0x00008c03: return "GL_COMPRESSED_RGBA_PVRTC_2BPPV1_IMG";
-      case 0x00008c04: return "GL_MODULATE_COLOR_IMG";
-      case 0x00008c05: return "GL_RECIP_ADD_SIGNED_ALPHA_IMG";
-      case 0x00008c06: return "GL_TEXTURE_ALPHA_MODULATE_IMG";
-      case 0x00008c07: return "GL_FACTOR_ALPHA_MODULATE_IMG";
-      case 0x00008c08: return "GL_FRAGMENT_ALPHA_MODULATE_IMG";
-      case 0x00008c09: return "GL_ADD_BLEND_IMG";
-      case 0x00008c0a: return "GL_SGX_BINARY_IMG";
-      case 0x00008c10: return "GL_TEXTURE_RED_TYPE";
-      case 0x00008c11: return "GL_TEXTURE_GREEN_TYPE";
-      case 0x00008c12: return "GL_TEXTURE_BLUE_TYPE";
-      case 0x00008c13: return "GL_TEXTURE_ALPHA_TYPE";
-      case 0x00008c14: return "GL_TEXTURE_LUMINANCE_TYPE";
-      case 0x00008c15: return "GL_TEXTURE_INTENSITY_TYPE";
-      case 0x00008c16: return "GL_TEXTURE_DEPTH_TYPE";
-      case 0x00008c17: return "GL_UNSIGNED_NORMALIZED";
-      case 0x00008c18: return "GL_TEXTURE_1D_ARRAY";
-      case 0x00008c19: return "GL_PROXY_TEXTURE_1D_ARRAY";
-      case 0x00008c1a: return "GL_TEXTURE_2D_ARRAY";
-      case 0x00008c1b: return "GL_PROXY_TEXTURE_2D_ARRAY";
-      case 0x00008c1c: return "GL_TEXTURE_BINDING_1D_ARRAY";
-      case 0x00008c1d: return "GL_TEXTURE_BINDING_2D_ARRAY";
-      case 0x00008c26: return "GL_GEOMETRY_PROGRAM_NV";
-      case 0x00008c27: return "GL_MAX_PROGRAM_OUTPUT_VERTICES_NV";
-      case 0x00008c28: return "GL_MAX_PROGRAM_TOTAL_OUTPUT_COMPONENTS_NV";
-      case 0x00008c29: return "GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS";
-      case 0x00008c2a: return "GL_TEXTURE_BUFFER";
-      case 0x00008c2b: return "GL_MAX_TEXTURE_BUFFER_SIZE";
-      case 0x00008c2c: return "GL_TEXTURE_BINDING_BUFFER";
-      case 0x00008c2d: return "GL_TEXTURE_BUFFER_DATA_STORE_BINDING";
-      case 0x00008c2e: return "GL_TEXTURE_BUFFER_FORMAT";
-      case 0x00008c2f: return "GL_ANY_SAMPLES_PASSED";
-      case 0x00008c36: return "GL_SAMPLE_SHADING";
-      case 0x00008c37: return "GL_MIN_SAMPLE_SHADING_VALUE";
-      case 0x00008c3a: return "GL_R11F_G11F_B10F";
-      case 0x00008c3b: return "GL_UNSIGNED_INT_10F_11F_11F_REV";
-      case 0x00008c3c: return "GL_RGBA_SIGNED_COMPONENTS_EXT";
-      case 0x00008c3d: return "GL_RGB9_E5";
-      case 0x00008c3e: return "GL_UNSIGNED_INT_5_9_9_9_REV";
-      case 0x00008c3f: return "GL_TEXTURE_SHARED_SIZE";
-      case 0x00008c40: return "GL_SRGB";
-      case 0x00008c41: return "GL_SRGB8";
-      case 0x00008c42: return "GL_SRGB_ALPHA";
-      case 0x00008c43: return "GL_SRGB8_ALPHA8";
-      case 0x00008c44: return "GL_SLUMINANCE_ALPHA";
-      case 0x00008c45: return "GL_SLUMINANCE8_ALPHA8";
-      case 0x00008c46: return "GL_SLUMINANCE";
-      case 0x00008c47: return "GL_SLUMINANCE8";
-      case 0x00008c48: return "GL_COMPRESSED_SRGB";
-      case 0x00008c49: return "GL_COMPRESSED_SRGB_ALPHA";
-      case 0x00008c4a: return "GL_COMPRESSED_SLUMINANCE";
-      case 0x00008c4b: return "GL_COMPRESSED_SLUMINANCE_ALPHA";
-      case 0x00008c4c: return "GL_COMPRESSED_SRGB_S3TC_DXT1_EXT";
-      case 0x00008c4d: return "GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT";
-      case 0x00008c4e: return "GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT";
-      case 0x00008c4f: return "GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT";
-      case 0x00008c70: return "GL_COMPRESSED_LUMINANCE_LATC1_EXT";
-      case 0x00008c71: return "GL_COMPRESSED_SIGNED_LUMINANCE_LATC1_EXT";
-      case 0x00008c72: return "GL_COMPRESSED_LUMINANCE_ALPHA_LATC2_EXT";
-      case 0x00008c73: return "GL_COMPRESSED_SIGNED_LUMINANCE_ALPHA_LATC2_EXT";
-      case 0x00008c74: return "GL_TESS_CONTROL_PROGRAM_PARAMETER_BUFFER_NV";
-      case 0x00008c75: return "GL_TESS_EVALUATION_PROGRAM_PARAMETER_BUFFER_NV";
-      case 0x00008c76: return "GL_TRANSFORM_FEEDBACK_VARYING_MAX_LENGTH";
-      case 0x00008c77: return "GL_BACK_PRIMARY_COLOR_NV";
-      case 0x00008c78: return "GL_BACK_SECONDARY_COLOR_NV";
-      case 0x00008c79: return "GL_TEXTURE_COORD_NV";
-      case 0x00008c7a: return "GL_CLIP_DISTANCE_NV";
-      case 0x00008c7b: return "GL_VERTEX_ID_NV";
-      case 0x00008c7c: return "GL_PRIMITIVE_ID_NV";
-      case 0x00008c7d: return "GL_GENERIC_ATTRIB_NV";
-      case 0x00008c7e: return "GL_TRANSFORM_FEEDBACK_ATTRIBS_NV";
-      case 0x00008c7f: return "GL_TRANSFORM_FEEDBACK_BUFFER_MODE";
-      case 0x00008c80: return "GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS";
-      case 0x00008c81: return "GL_ACTIVE_VARYINGS_NV";
-      case 0x00008c82: return "GL_ACTIVE_VARYING_MAX_LENGTH_NV";
-      case 0x00008c83: return "GL_TRANSFORM_FEEDBACK_VARYINGS";
-      case 0x00008c84: return "GL_TRANSFORM_FEEDBACK_BUFFER_START";
-      case 0x00008c85: return "GL_TRANSFORM_FEEDBACK_BUFFER_SIZE";
-      case 0x00008c86: return "GL_TRANSFORM_FEEDBACK_RECORD_NV";
-      case 0x00008c87: return "GL_PRIMITIVES_GENERATED";
-      case 0x00008c88: return "GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN";
-      case 0x00008c89: return "GL_RASTERIZER_DISCARD";
-      case 0x00008c8a: return "GL_MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS";
-      case 0x00008c8b: return "GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS";
-      case 0x00008c8c: return "GL_INTERLEAVED_ATTRIBS";
-      case 0x00008c8d: return "GL_SEPARATE_ATTRIBS";
-      case 0x00008c8e: return "GL_TRANSFORM_FEEDBACK_BUFFER";
-      case 0x00008c8f: return "GL_TRANSFORM_FEEDBACK_BUFFER_BINDING";
-      case 0x00008c92: return "GL_ATC_RGB_AMD";
-      case 0x00008c93: return "GL_ATC_RGBA_EXPLICIT_ALPHA_AMD";
-      case 0x00008ca0: return "GL_POINT_SPRITE_COORD_ORIGIN";
-      case 0x00008ca1: return "GL_LOWER_LEFT";
-      case 0x00008ca2: return "GL_UPPER_LEFT";
-      case 0x00008ca3: return "GL_STENCIL_BACK_REF";
-      case 0x00008ca4: return "GL_STENCIL_BACK_VALUE_MASK";
-      case 0x00008ca5: return "GL_STENCIL_BACK_WRITEMASK";
-      case 0x00008ca6: return "GL_DRAW_FRAMEBUFFER_BINDING";
-      case 0x00008ca7: return "GL_RENDERBUFFER_BINDING";
-      case 0x00008ca8: return "GL_READ_FRAMEBUFFER";
-      case 0x00008ca9: return "GL_DRAW_FRAMEBUFFER";
-      case 0x00008caa: return "GL_READ_FRAMEBUFFER_BINDING";
-      case 0x00008cab: return "GL_RENDERBUFFER_SAMPLES";
-      case 0x00008cac: return "GL_DEPTH_COMPONENT32F";
-      case 0x00008cad: return "GL_DEPTH32F_STENCIL8";
-      case 0x00008cd0: return "GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE";
-      case 0x00008cd1: return "GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME";
-      case 0x00008cd2: return "GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL";
-      case 0x00008cd3: return "GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE";
-      case 0x00008cd4: return "GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER";
-      case 0x00008cd5: return "GL_FRAMEBUFFER_COMPLETE";
-      case 0x00008cd6: return "GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT";
-      case 0x00008cd7: return "GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT";
-      case 0x00008cd9: return "GL_FRAMEBUFFER_INCOMPLETE_DIMENSIONS_EXT";
-      case 0x00008cda: return "GL_FRAMEBUFFER_INCOMPLETE_FORMATS_EXT";
-      case 0x00008cdb: return "GL_FRAMEBUFFER_INCOMPLETE_DRAW_BUFFER";
-      case 0x00008cdc: return "GL_FRAMEBUFFER_INCOMPLETE_READ_BUFFER";
-      case 0x00008cdd: return "GL_FRAMEBUFFER_UNSUPPORTED";
-      case 0x00008cdf: return "GL_MAX_COLOR_ATTACHMENTS";
-      case 0x00008ce0: return "GL_COLOR_ATTACHMENT0";
-      case 0x00008ce1: return "GL_COLOR_ATTACHMENT1";
-      case 0x00008ce2: return "GL_COLOR_ATTACHMENT2";
-      case 0x00008ce3: return "GL_COLOR_ATTACHMENT3";
-      case 0x00008ce4: return "GL_COLOR_ATTACHMENT4";
-      case 0x00008ce5: return "GL_COLOR_ATTACHMENT5";
-      case 0x00008ce6: return "GL_COLOR_ATTACHMENT6";
-      case 0x00008ce7: return "GL_COLOR_ATTACHMENT7";
-      case 0x00008ce8: return "GL_COLOR_ATTACHMENT8";
-      case 0x00008ce9: return "GL_COLOR_ATTACHMENT9";
-      case 0x00008cea: return "GL_COLOR_ATTACHMENT10";
-      case 0x00008ceb: return "GL_COLOR_ATTACHMENT11";
-      case 0x00008cec: return "GL_COLOR_ATTACHMENT12";
-      case 0x00008ced: return "GL_COLOR_ATTACHMENT13";
-      case 0x00008cee: return "GL_COLOR_ATTACHMENT14";
-      case 0x00008cef: return "GL_COLOR_ATTACHMENT15";
-      case 0x00008d00: return "GL_DEPTH_ATTACHMENT";
-      case 0x00008d20: return "GL_STENCIL_ATTACHMENT";
-      case 0x00008d40: return "GL_FRAMEBUFFER";
-      case 0x00008d41: return "GL_RENDERBUFFER";
-      case 0x00008d42: return "GL_RENDERBUFFER_WIDTH";
-      case 0x00008d43: return "GL_RENDERBUFFER_HEIGHT";
-      case 0x00008d44: return "GL_RENDERBUFFER_INTERNAL_FORMAT";
-      case 0x00008d46: return "GL_STENCIL_INDEX1";
-      case 0x00008d47: return "GL_STENCIL_INDEX4";
-      case 0x00008d48: return "GL_STENCIL_INDEX8";
-      case 0x00008d49: return "GL_STENCIL_INDEX16";
-      case 0x00008d50: return "GL_RENDERBUFFER_RED_SIZE";
-      case 0x00008d51: return "GL_RENDERBUFFER_GREEN_SIZE";
-      case 0x00008d52: return "GL_RENDERBUFFER_BLUE_SIZE";
-      case 0x00008d53: return "GL_RENDERBUFFER_ALPHA_SIZE";
-      case 0x00008d54: return "GL_RENDERBUFFER_DEPTH_SIZE";
-      case 0x00008d55: return "GL_RENDERBUFFER_STENCIL_SIZE";
-      case 0x00008d56: return "GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE";
-      case 0x00008d57: return "GL_MAX_SAMPLES";
-      case 0x00008d60: return "GL_TEXTURE_GEN_STR_OES";
-      case 0x00008d61: return "GL_HALF_FLOAT_OES";
-      case 0x00008d62: return "GL_RGB565";
-      case 0x00008d64: return "GL_ETC1_RGB8_OES";
-      case 0x00008d65: return "GL_TEXTURE_EXTERNAL_OES";
-      case 0x00008d66: return "GL_SAMPLER_EXTERNAL_OES";
-      case 0x00008d67: return "GL_TEXTURE_BINDING_EXTERNAL_OES";
-      case 0x00008d68: return "GL_REQUIRED_TEXTURE_IMAGE_UNITS_OES";
-      case 0x00008d69: return "GL_PRIMITIVE_RESTART_FIXED_INDEX";
-      case 0x00008d6a: return "GL_ANY_SAMPLES_PASSED_CONSERVATIVE";
-      case 0x00008d6b: return "GL_MAX_ELEMENT_INDEX";
-      case 0x00008d6c: return "GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SAMPLES_EXT";
-      case 0x00008d70: return "GL_RGBA32UI";
-      case 0x00008d71: return "GL_RGB32UI";
-      case 0x00008d72: return "GL_ALPHA32UI_EXT";
-      case 0x00008d73: return "GL_INTENSITY32UI_EXT";
-      case 0x00008d74: return "GL_LUMINANCE32UI_EXT";
-      case 0x00008d75: return "GL_LUMINANCE_ALPHA32UI_EXT";
-      case 0x00008d76: return "GL_RGBA16UI";
-      case 0x00008d77: return "GL_RGB16UI";
-      case 0x00008d78: return "GL_ALPHA16UI_EXT";
-      case 0x00008d79: return "GL_INTENSITY16UI_EXT";
-      case 0x00008d7a: return "GL_LUMINANCE16UI_EXT";
-      case 0x00008d7b: return "GL_LUMINANCE_ALPHA16UI_EXT";
-      case 0x00008d7c: return "GL_RGBA8UI";
-      case 0x00008d7d: return "GL_RGB8UI";
-      case 0x00008d7e: return "GL_ALPHA8UI_EXT";
-      case 0x00008d7f: return "GL_INTENSITY8UI_EXT";
-      case 0x00008d80: return "GL_LUMINANCE8UI_EXT";
-      case 0x00008d81: return "GL_LUMINANCE_ALPHA8UI_EXT";
-      case 0x00008d82: return "GL_RGBA32I";
-      case 0x00008d83: return "GL_RGB32I";
-      case 0x00008d84: return "GL_ALPHA32I_EXT";
-      case 0x00008d85: return "GL_INTENSITY32I_EXT";
-      case 0x00008d86: return "GL_LUMINANCE32I_EXT";
-      case 0x00008d87: return "GL_LUMINANCE_ALPHA32I_EXT";
-      case 0x00008d88: return "GL_RGBA16I";
-      case 0x00008d89: return "GL_RGB16I";
-      case 0x00008d8a: return "GL_ALPHA16I_EXT";
-      case 0x00008d8b: return "GL_INTENSITY16I_EXT";
-      case 0x00008d8c: return "GL_LUMINANCE16I_EXT";
-      case 0x00008d8d: return "GL_LUMINANCE_ALPHA16I_EXT";
-      case 0x00008d8e: return "GL_RGBA8I";
-      case 0x00008d8f: return "GL_RGB8I";
-      case 0x00008d90: return "GL_ALPHA8I_EXT";
-      case 0x00008d91: return "GL_INTENSITY8I_EXT";
-      case 0x00008d92: return "GL_LUMINANCE8I_EXT";
-      case 0x00008d93: return "GL_LUMINANCE_ALPHA8I_EXT";
-      case 0x00008d94: return "GL_RED_INTEGER";
-      case 0x00008d95: return "GL_GREEN_INTEGER";
-      case 0x00008d96: return "GL_BLUE_INTEGER";
-      case 0x00008d97: return "GL_ALPHA_INTEGER";
-      case 0x00008d98: return "GL_RGB_INTEGER";
-      case 0x00008d99: return "GL_RGBA_INTEGER";
-      case 0x00008d9a: return "GL_BGR_INTEGER";
-      case 0x00008d9b: return "GL_BGRA_INTEGER";
-      case 0x00008d9c: return "GL_LUMINANCE_INTEGER_EXT";
-      case 0x00008d9d: return "GL_LUMINANCE_ALPHA_INTEGER_EXT";
-      case 0x00008d9e: return "GL_RGBA_INTEGER_MODE_EXT";
-      case 0x00008d9f: return "GL_INT_2_10_10_10_REV";
-      case 0x00008da0: return "GL_MAX_PROGRAM_PARAMETER_BUFFER_BINDINGS_NV";
-      case 0x00008da1: return "GL_MAX_PROGRAM_PARAMETER_BUFFER_SIZE_NV";
-      case 0x00008da2: return "GL_VERTEX_PROGRAM_PARAMETER_BUFFER_NV";
-      case 0x00008da3: return "GL_GEOMETRY_PROGRAM_PARAMETER_BUFFER_NV";
-      case 0x00008da4: return "GL_FRAGMENT_PROGRAM_PARAMETER_BUFFER_NV";
-      case 0x00008da5: return "GL_MAX_PROGRAM_GENERIC_ATTRIBS_NV";
-      case 0x00008da6: return "GL_MAX_PROGRAM_GENERIC_RESULTS_NV";
-      case 0x00008da7: return "GL_FRAMEBUFFER_ATTACHMENT_LAYERED";
-      case 0x00008da8: return "GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS";
-      case 0x00008da9: return "GL_FRAMEBUFFER_INCOMPLETE_LAYER_COUNT_ARB";
-      case 0x00008dab: return "GL_DEPTH_COMPONENT32F_NV";
-      case 0x00008dac: return "GL_DEPTH32F_STENCIL8_NV";
-      case 0x00008dad: return "GL_FLOAT_32_UNSIGNED_INT_24_8_REV";
-      case 0x00008dae: return "GL_SHADER_INCLUDE_ARB";
-      case 0x00008daf: return "GL_DEPTH_BUFFER_FLOAT_MODE_NV";
-      case 0x00008db9: return "GL_FRAMEBUFFER_SRGB";
-      case 0x00008dba: return "GL_FRAMEBUFFER_SRGB_CAPABLE_EXT";
-      case 0x00008dbb: return "GL_COMPRESSED_RED_RGTC1";
-      case 0x00008dbc: return "GL_COMPRESSED_SIGNED_RED_RGTC1";
-      case 0x00008dbd: return "GL_COMPRESSED_RG_RGTC2";
-      case 0x00008dbe: return "GL_COMPRESSED_SIGNED_RG_RGTC2";
-      case 0x00008dc0: return "GL_SAMPLER_1D_ARRAY";
-      case 0x00008dc1: return "GL_SAMPLER_2D_ARRAY";
-      case 0x00008dc2: return "GL_SAMPLER_BUFFER";
-      case 0x00008dc3: return "GL_SAMPLER_1D_ARRAY_SHADOW";
-      case 0x00008dc4: return "GL_SAMPLER_2D_ARRAY_SHADOW";
-      case 0x00008dc5: return "GL_SAMPLER_CUBE_SHADOW";
-      case 0x00008dc6: return "GL_UNSIGNED_INT_VEC2";
-      case 0x00008dc7: return "GL_UNSIGNED_INT_VEC3";
-      case 0x00008dc8: return "GL_UNSIGNED_INT_VEC4";
-      case 0x00008dc9: return "GL_INT_SAMPLER_1D";
-      case 0x00008dca: return "GL_INT_SAMPLER_2D";
-      case 0x00008dcb: return "GL_INT_SAMPLER_3D";
-      case 0x00008dcc: return "GL_INT_SAMPLER_CUBE";
-      case 0x00008dcd: return "GL_INT_SAMPLER_2D_RECT";
-      case 0x00008dce: return "GL_INT_SAMPLER_1D_ARRAY";
-      case 0x00008dcf: return "GL_INT_SAMPLER_2D_ARRAY";
-      case 0x00008dd0: return "GL_INT_SAMPLER_BUFFER";
-      case 0x00008dd1: return "GL_UNSIGNED_INT_SAMPLER_1D";
-      case 0x00008dd2: return "GL_UNSIGNED_INT_SAMPLER_2D";
-      case 0x00008dd3: return "GL_UNSIGNED_INT_SAMPLER_3D";
-      case 0x00008dd4: return "GL_UNSIGNED_INT_SAMPLER_CUBE";
-      case 0x00008dd5: return "GL_UNSIGNED_INT_SAMPLER_2D_RECT";
-      case 0x00008dd6: return "GL_UNSIGNED_INT_SAMPLER_1D_ARRAY";
-      case 0x00008dd7: return "GL_UNSIGNED_INT_SAMPLER_2D_ARRAY";
-      case 0x00008dd8: return "GL_UNSIGNED_INT_SAMPLER_BUFFER";
-      case 0x00008dd9: return "GL_GEOMETRY_SHADER";
-      case 0x00008dda: return "GL_GEOMETRY_VERTICES_OUT_ARB";
-      case 0x00008ddb: return "GL_GEOMETRY_INPUT_TYPE_ARB";
-      case 0x00008ddc: return "GL_GEOMETRY_OUTPUT_TYPE_ARB";
-      case 0x00008ddd: return "GL_MAX_GEOMETRY_VARYING_COMPONENTS_ARB";
-      case 0x00008dde: return "GL_MAX_VERTEX_VARYING_COMPONENTS_ARB";
-      case 0x00008ddf: return "GL_MAX_GEOMETRY_UNIFORM_COMPONENTS";
-      case 0x00008de0: return "GL_MAX_GEOMETRY_OUTPUT_VERTICES";
-      case 0x00008de1: return "GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS";
-      case 0x00008de2: return "GL_MAX_VERTEX_BINDABLE_UNIFORMS_EXT";
-      case 0x00008de3: return "GL_MAX_FRAGMENT_BINDABLE_UNIFORMS_EXT";
-      case 0x00008de4: return "GL_MAX_GEOMETRY_BINDABLE_UNIFORMS_EXT";
-      case 0x00008de5: return "GL_ACTIVE_SUBROUTINES";
-      case 0x00008de6: return "GL_ACTIVE_SUBROUTINE_UNIFORMS";
-      case 0x00008de7: return "GL_MAX_SUBROUTINES";
-      case 0x00008de8: return "GL_MAX_SUBROUTINE_UNIFORM_LOCATIONS";
-      case 0x00008de9: return "GL_NAMED_STRING_LENGTH_ARB";
-      case 0x00008dea: return "GL_NAMED_STRING_TYPE_ARB";
-      case 0x00008ded: return "GL_MAX_BINDABLE_UNIFORM_SIZE_EXT";
-      case 0x00008dee: return "GL_UNIFORM_BUFFER_EXT";
-      case 0x00008def: return "GL_UNIFORM_BUFFER_BINDING_EXT";
-      case 0x00008df0: return "GL_LOW_FLOAT";
-      case 0x00008df1: return "GL_MEDIUM_FLOAT";
-      case 0x00008df2: return "GL_HIGH_FLOAT";
-      case 0x00008df3: return "GL_LOW_INT";
-      case 0x00008df4: return "GL_MEDIUM_INT";
-      case 0x00008df5: return "GL_HIGH_INT";
-      case 0x00008df6: return "GL_UNSIGNED_INT_10_10_10_2_OES";
-      case 0x00008df7: return "GL_INT_10_10_10_2_OES";
-      case 0x00008df8: return "GL_SHADER_BINARY_FORMATS";
-      case 0x00008df9: return "GL_NUM_SHADER_BINARY_FORMATS";
-      case 0x00008dfa: return "GL_SHADER_COMPILER";
-      case 0x00008dfb: return "GL_MAX_VERTEX_UNIFORM_VECTORS";
-      case 0x00008dfc: return "GL_MAX_VARYING_VECTORS";
-      case 0x00008dfd: return "GL_MAX_FRAGMENT_UNIFORM_VECTORS";
-      case 0x00008e10: return "GL_RENDERBUFFER_COLOR_SAMPLES_NV";
-      case 0x00008e11: return "GL_MAX_MULTISAMPLE_COVERAGE_MODES_NV";
-      case 0x00008e12: return "GL_MULTISAMPLE_COVERAGE_MODES_NV";
-      case 0x00008e13: return "GL_QUERY_WAIT";
-      case 0x00008e14: return "GL_QUERY_NO_WAIT";
-      case 0x00008e15: return "GL_QUERY_BY_REGION_WAIT";
-      case 0x00008e16: return "GL_QUERY_BY_REGION_NO_WAIT";
-      case 0x00008e1e: return "GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS";
-      case 0x00008e1f: return "GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS";
-      case 0x00008e20: return "GL_COLOR_SAMPLES_NV";
-      case 0x00008e22: return "GL_TRANSFORM_FEEDBACK";
-      case 0x00008e23: return "GL_TRANSFORM_FEEDBACK_BUFFER_PAUSED";
-      case 0x00008e24: return "GL_TRANSFORM_FEEDBACK_BUFFER_ACTIVE";
-      case 0x00008e25: return "GL_TRANSFORM_FEEDBACK_BINDING";
-      case 0x00008e26: return "GL_FRAME_NV";
-      case 0x00008e27: return "GL_FIELDS_NV";
-      case 0x00008e28: return "GL_TIMESTAMP";
-      case 0x00008e29: return "GL_NUM_FILL_STREAMS_NV";
-      case 0x00008e2a: return "GL_PRESENT_TIME_NV";
-      case 0x00008e2b: return "GL_PRESENT_DURATION_NV";
-      case 0x00008e2c: return "GL_DEPTH_COMPONENT16_NONLINEAR_NV";
-      case 0x00008e2d: return "GL_PROGRAM_MATRIX_EXT";
-      case 0x00008e2e: return "GL_TRANSPOSE_PROGRAM_MATRIX_EXT";
-      case 0x00008e2f: return "GL_PROGRAM_MATRIX_STACK_DEPTH_EXT";
-      case 0x00008e42: return "GL_TEXTURE_SWIZZLE_R";
-      case 0x00008e43: return "GL_TEXTURE_SWIZZLE_G";
-      case 0x00008e44: return "GL_TEXTURE_SWIZZLE_B";
-      case 0x00008e45: return "GL_TEXTURE_SWIZZLE_A";
-      case 0x00008e46: return "GL_TEXTURE_SWIZZLE_RGBA";
-      case 0x00008e47: return "GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS";
-      case 0x00008e48: return "GL_ACTIVE_SUBROUTINE_MAX_LENGTH";
-      case 0x00008e49: return "GL_ACTIVE_SUBROUTINE_UNIFORM_MAX_LENGTH";
-      case 0x00008e4a: return "GL_NUM_COMPATIBLE_SUBROUTINES";
-      case 0x00008e4b: return "GL_COMPATIBLE_SUBROUTINES";
-      case 0x00008e4c: return "GL_QUADS_FOLLOW_PROVOKING_VERTEX_CONVENTION";
-      case 0x00008e4d: return "GL_FIRST_VERTEX_CONVENTION";
-      case 0x00008e4e: return "GL_LAST_VERTEX_CONVENTION";
-      case 0x00008e4f: return "GL_PROVOKING_VERTEX";
-      case 0x00008e50: return "GL_SAMPLE_POSITION";
-      case 0x00008e51: return "GL_SAMPLE_MASK";
-      case 0x00008e52: return "GL_SAMPLE_MASK_VALUE";
-      case 0x00008e53: return "GL_TEXTURE_BINDING_RENDERBUFFER_NV";
-      case 0x00008e54: return "GL_TEXTURE_RENDERBUFFER_DATA_STORE_BINDING_NV";
-      case 0x00008e55: return "GL_TEXTURE_RENDERBUFFER_NV";
-      case 0x00008e56: return "GL_SAMPLER_RENDERBUFFER_NV";
-      case 0x00008e57: return "GL_INT_SAMPLER_RENDERBUFFER_NV";
-      case 0x00008e58: return "GL_UNSIGNED_INT_SAMPLER_RENDERBUFFER_NV";
-      case 0x00008e59: return "GL_MAX_SAMPLE_MASK_WORDS";
-      case 0x00008e5a: return "GL_MAX_GEOMETRY_SHADER_INVOCATIONS";
-      case 0x00008e5b: return "GL_MIN_FRAGMENT_INTERPOLATION_OFFSET";
-      case 0x00008e5c: return "GL_MAX_FRAGMENT_INTERPOLATION_OFFSET";
-      case 0x00008e5d: return "GL_FRAGMENT_INTERPOLATION_OFFSET_BITS";
-      case 0x00008e5e: return "GL_MIN_PROGRAM_TEXTURE_GATHER_OFFSET";
-      case 0x00008e5f: return "GL_MAX_PROGRAM_TEXTURE_GATHER_OFFSET";
-      case 0x00008e70: return "GL_MAX_TRANSFORM_FEEDBACK_BUFFERS";
-      case 0x00008e71: return "GL_MAX_VERTEX_STREAMS";
-      case 0x00008e72: return "GL_PATCH_VERTICES";
-      case 0x00008e73: return "GL_PATCH_DEFAULT_INNER_LEVEL";
-      case 0x00008e74: return "GL_PATCH_DEFAULT_OUTER_LEVEL";
-      case 0x00008e75: return "GL_TESS_CONTROL_OUTPUT_VERTICES";
-      case 0x00008e76: return "GL_TESS_GEN_MODE";
-      case 0x00008e77: return "GL_TESS_GEN_SPACING";
-      case 0x00008e78: return "GL_TESS_GEN_VERTEX_ORDER";
-      case 0x00008e79: return "GL_TESS_GEN_POINT_MODE";
-      case 0x00008e7a: return "GL_ISOLINES";
-      case 0x00008e7b: return "GL_FRACTIONAL_ODD";
-      case 0x00008e7c: return "GL_FRACTIONAL_EVEN";
-      case 0x00008e7d: return "GL_MAX_PATCH_VERTICES";
-      case 0x00008e7e: return "GL_MAX_TESS_GEN_LEVEL";
-      case 0x00008e7f: return "GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS";
-      case 0x00008e80: return "GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS";
-      case 0x00008e81: return "GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS";
-      case 0x00008e82: return "GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS";
-      case 0x00008e83: return "GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS";
-      case 0x00008e84: return "GL_MAX_TESS_PATCH_COMPONENTS";
-      case 0x00008e85: return "GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS";
-      case 0x00008e86: return "GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS";
-      case 0x00008e87: return "GL_TESS_EVALUATION_SHADER";
-      case 0x00008e88: return "GL_TESS_CONTROL_SHADER";
-      case 0x00008e89: return "GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS";
-      case 0x00008e8a: return "GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS";
-      case 0x00008e8c: return "GL_COMPRESSED_RGBA_BPTC_UNORM";
-      case 0x00008e8d: return "GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM";
-      case 0x00008e8e: return "GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT";
-      case 0x00008e8f: return "GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT";
-      case 0x00008ed0: return "GL_COVERAGE_COMPONENT_NV";
-      case 0x00008ed1: return "GL_COVERAGE_COMPONENT4_NV";
-      case 0x00008ed2: return "GL_COVERAGE_ATTACHMENT_NV";
-      case 0x00008ed3: return "GL_COVERAGE_BUFFERS_NV";
-      case 0x00008ed5: return "GL_COVERAGE_ALL_FRAGMENTS_NV";
-      case 0x00008ed6: return "GL_COVERAGE_EDGE_FRAGMENTS_NV";
-      case 0x00008ed7: return "GL_COVERAGE_AUTOMATIC_NV";
-      case 0x00008f1d: return "GL_BUFFER_GPU_ADDRESS_NV";
-      case 0x00008f1e: return "GL_VERTEX_ATTRIB_ARRAY_UNIFIED_NV";
-      case 0x00008f1f: return "GL_ELEMENT_ARRAY_UNIFIED_NV";
-      case 0x00008f20: return "GL_VERTEX_ATTRIB_ARRAY_ADDRESS_NV";
-      case 0x00008f21: return "GL_VERTEX_ARRAY_ADDRESS_NV";
-      case 0x00008f22: return "GL_NORMAL_ARRAY_ADDRESS_NV";
-      case 0x00008f23: return "GL_COLOR_ARRAY_ADDRESS_NV";
-      case 0x00008f24: return "GL_INDEX_ARRAY_ADDRESS_NV";
-      case 0x00008f25: return "GL_TEXTURE_COORD_ARRAY_ADDRESS_NV";
-      case 0x00008f26: return "GL_EDGE_FLAG_ARRAY_ADDRESS_NV";
-      case 0x00008f27: return "GL_SECONDARY_COLOR_ARRAY_ADDRESS_NV";
-      case 0x00008f28: return "GL_FOG_COORD_ARRAY_ADDRESS_NV";
-      case 0x00008f29: return "GL_ELEMENT_ARRAY_ADDRESS_NV";
-      case 0x00008f2a: return "GL_VERTEX_ATTRIB_ARRAY_LENGTH_NV";
-      case 0x00008f2b: return "GL_VERTEX_ARRAY_LENGTH_NV";
-      case 0x00008f2c: return "GL_NORMAL_ARRAY_LENGTH_NV";
-      case 0x00008f2d: return "GL_COLOR_ARRAY_LENGTH_NV";
-      case 0x00008f2e: return "GL_INDEX_ARRAY_LENGTH_NV";
-      case 0x00008f2f: return "GL_TEXTURE_COORD_ARRAY_LENGTH_NV";
-      case 0x00008f30: return "GL_EDGE_FLAG_ARRAY_LENGTH_NV";
-      case 0x00008f31: return "GL_SECONDARY_COLOR_ARRAY_LENGTH_NV";
-      case 0x00008f32: return "GL_FOG_COORD_ARRAY_LENGTH_NV";
-      case 0x00008f33: return "GL_ELEMENT_ARRAY_LENGTH_NV";
-      case 0x00008f34: return "GL_GPU_ADDRESS_NV";
-      case 0x00008f35: return "GL_MAX_SHADER_BUFFER_ADDRESS_NV";
-      case 0x00008f36: return "GL_COPY_READ_BUFFER";
-      case 0x00008f37: return "GL_COPY_WRITE_BUFFER";
-      case 0x00008f38: return "GL_MAX_IMAGE_UNITS";
-      case 0x00008f39: return "GL_MAX_COMBINED_IMAGE_UNITS_AND_FRAGMENT_OUTPUTS";
-      case 0x00008f3a: return "GL_IMAGE_BINDING_NAME";
-      case 0x00008f3b: return "GL_IMAGE_BINDING_LEVEL";
-      case 0x00008f3c: return "GL_IMAGE_BINDING_LAYERED";
-      case 0x00008f3d: return "GL_IMAGE_BINDING_LAYER";
-      case 0x00008f3e: return "GL_IMAGE_BINDING_ACCESS";
-      case 0x00008f3f: return "GL_DRAW_INDIRECT_BUFFER";
-      case 0x00008f40: return "GL_DRAW_INDIRECT_UNIFIED_NV";
-      case 0x00008f41: return "GL_DRAW_INDIRECT_ADDRESS_NV";
-      case 0x00008f42: return "GL_DRAW_INDIRECT_LENGTH_NV";
-      case 0x00008f43: return "GL_DRAW_INDIRECT_BUFFER_BINDING";
-      case 0x00008f46: return "GL_DOUBLE_MAT2";
-      case 0x00008f47: return "GL_DOUBLE_MAT3";
-      case 0x00008f48: return "GL_DOUBLE_MAT4";
-      case 0x00008f49: return "GL_DOUBLE_MAT2x3";
-      case 0x00008f4a: return "GL_DOUBLE_MAT2x4";
-      case 0x00008f4b: return "GL_DOUBLE_MAT3x2";
-      case 0x00008f4c: return "GL_DOUBLE_MAT3x4";
-      case 0x00008f4d: return "GL_DOUBLE_MAT4x2";
-      case 0x00008f4e: return "GL_DOUBLE_MAT4x3";
-      case 0x00008f60: return "GL_MALI_SHADER_BINARY_ARM";
-      case 0x00008f61: return "GL_MALI_PROGRAM_BINARY_ARM";
-      case 0x00008f90: return "GL_RED_SNORM";
-      case 0x00008f91: return "GL_RG_SNORM";
-      case 0x00008f92: return "GL_RGB_SNORM";
-      case 0x00008f93: return "GL_RGBA_SNORM";
-      case 0x00008f94: return "GL_R8_SNORM";
-      case 0x00008f95: return "GL_RG8_SNORM";
-      case 0x00008f96: return "GL_RGB8_SNORM";
-      case 0x00008f97: return "GL_RGBA8_SNORM";
-      case 0x00008f98: return "GL_R16_SNORM";
-      case 0x00008f99: return "GL_RG16_SNORM";
-      case 0x00008f9a: return "GL_RGB16_SNORM";
-      case 0x00008f9b: return "GL_RGBA16_SNORM";
-      case 0x00008f9c: return "GL_SIGNED_NORMALIZED";
-      case 0x00008f9d: return "GL_PRIMITIVE_RESTART";
-      case 0x00008f9e: return "GL_PRIMITIVE_RESTART_INDEX";
-      case 0x00008f9f: return "GL_MAX_PROGRAM_TEXTURE_GATHER_COMPONENTS";
-      case 0x00008fa0: return "GL_PERFMON_GLOBAL_MODE_QCOM";
-      case 0x00008fb0: return "GL_BINNING_CONTROL_HINT_QCOM";
-      case 0x00008fb1: return "GL_CPU_OPTIMIZED_QCOM";
-      case 0x00008fb2: return "GL_GPU_OPTIMIZED_QCOM";
-      case 0x00008fb3: return "GL_RENDER_DIRECT_TO_FRAMEBUFFER_QCOM";
-      case 0x00008fbb: return "GL_GPU_DISJOINT_EXT";
-      case 0x00008fc4: return "GL_SHADER_BINARY_VIV";
-      case 0x00008fe0: return "GL_INT8_NV";
-      case 0x00008fe1: return "GL_INT8_VEC2_NV";
-      case 0x00008fe2: return "GL_INT8_VEC3_NV";
-      case 0x00008fe3: return "GL_INT8_VEC4_NV";
-      case 0x00008fe4: return "GL_INT16_NV";
-      case 0x00008fe5: return "GL_INT16_VEC2_NV";
-      case 0x00008fe6: return "GL_INT16_VEC3_NV";
-      case 0x00008fe7: return "GL_INT16_VEC4_NV";
-      case 0x00008fe9: return "GL_INT64_VEC2_NV";
-      case 0x00008fea: return "GL_INT64_VEC3_NV";
-      case 0x00008feb: return "GL_INT64_VEC4_NV";
-      case 0x00008fec: return "GL_UNSIGNED_INT8_NV";
-      case 0x00008fed: return "GL_UNSIGNED_INT8_VEC2_NV";
-      case 0x00008fee: return "GL_UNSIGNED_INT8_VEC3_NV";
-      case 0x00008fef: return "GL_UNSIGNED_INT8_VEC4_NV";
-      case 0x00008ff0: return "GL_UNSIGNED_INT16_NV";
-      case 0x00008ff1: return "GL_UNSIGNED_INT16_VEC2_NV";
-      case 0x00008ff2: return "GL_UNSIGNED_INT16_VEC3_NV";
-      case 0x00008ff3: return "GL_UNSIGNED_INT16_VEC4_NV";
-      case 0x00008ff5: return "GL_UNSIGNED_INT64_VEC2_NV";
-      case 0x00008ff6: return "GL_UNSIGNED_INT64_VEC3_NV";
-      case 0x00008ff7: return "GL_UNSIGNED_INT64_VEC4_NV";
-      case 0x00008ff8: return "GL_FLOAT16_NV";
-      case 0x00008ff9: return "GL_FLOAT16_VEC2_NV";
-      case 0x00008ffa: return "GL_FLOAT16_VEC3_NV";
-      case 0x00008ffb: return "GL_FLOAT16_VEC4_NV";
-      case 0x00008ffc: return "GL_DOUBLE_VEC2";
-      case 0x00008ffd: return "GL_DOUBLE_VEC3";
-      case 0x00008ffe: return "GL_DOUBLE_VEC4";
-      case 0x00009001: return "GL_SAMPLER_BUFFER_AMD";
-      case 0x00009002: return "GL_INT_SAMPLER_BUFFER_AMD";
-      case 0x00009003: return "GL_UNSIGNED_INT_SAMPLER_BUFFER_AMD";
-      case 0x00009004: return "GL_TESSELLATION_MODE_AMD";
-      case 0x00009005: return "GL_TESSELLATION_FACTOR_AMD";
-      case 0x00009006: return "GL_DISCRETE_AMD";
-      case 0x00009007: return "GL_CONTINUOUS_AMD";
-      case 0x00009009: return "GL_TEXTURE_CUBE_MAP_ARRAY";
-      case 0x0000900a: return "GL_TEXTURE_BINDING_CUBE_MAP_ARRAY";
-      case 0x0000900b: return "GL_PROXY_TEXTURE_CUBE_MAP_ARRAY";
-      case 0x0000900c: return "GL_SAMPLER_CUBE_MAP_ARRAY";
-      case 0x0000900d: return "GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW";
-      case 0x0000900e: return "GL_INT_SAMPLER_CUBE_MAP_ARRAY";
-      case 0x0000900f: return "GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY";
-      case 0x00009010: return "GL_ALPHA_SNORM";
-      case 0x00009011: return "GL_LUMINANCE_SNORM";
-      case 0x00009012: return "GL_LUMINANCE_ALPHA_SNORM";
-      case 0x00009013: return "GL_INTENSITY_SNORM";
-      case 0x00009014: return "GL_ALPHA8_SNORM";
-      case 0x00009015: return "GL_LUMINANCE8_SNORM";
-      case 0x00009016: return "GL_LUMINANCE8_ALPHA8_SNORM";
-      case 0x00009017: return "GL_INTENSITY8_SNORM";
-      case 0x00009018: return "GL_ALPHA16_SNORM";
-      case 0x00009019: return "GL_LUMINANCE16_SNORM";
-      case 0x0000901a: return "GL_LUMINANCE16_ALPHA16_SNORM";
-      case 0x0000901b: return "GL_INTENSITY16_SNORM";
-      case 0x0000901c: return "GL_FACTOR_MIN_AMD";
-      case 0x0000901d: return "GL_FACTOR_MAX_AMD";
-      case 0x0000901e: return "GL_DEPTH_CLAMP_NEAR_AMD";
-      case 0x0000901f: return "GL_DEPTH_CLAMP_FAR_AMD";
-      case 0x00009020: return "GL_VIDEO_BUFFER_NV";
-      case 0x00009021: return "GL_VIDEO_BUFFER_BINDING_NV";
-      case 0x00009022: return "GL_FIELD_UPPER_NV";
-      case 0x00009023: return "GL_FIELD_LOWER_NV";
-      case 0x00009024: return "GL_NUM_VIDEO_CAPTURE_STREAMS_NV";
-      case 0x00009025: return "GL_NEXT_VIDEO_CAPTURE_BUFFER_STATUS_NV";
-      case 0x00009026: return "GL_VIDEO_CAPTURE_TO_422_SUPPORTED_NV";
-      case 0x00009027: return "GL_LAST_VIDEO_CAPTURE_STATUS_NV";
-      case 0x00009028: return "GL_VIDEO_BUFFER_PITCH_NV";
-      case 0x00009029: return "GL_VIDEO_COLOR_CONVERSION_MATRIX_NV";
-      case 0x0000902a: return "GL_VIDEO_COLOR_CONVERSION_MAX_NV";
-      case 0x0000902b: return "GL_VIDEO_COLOR_CONVERSION_MIN_NV";
-      case 0x0000902c: return "GL_VIDEO_COLOR_CONVERSION_OFFSET_NV";
-      case 0x0000902d: return "GL_VIDEO_BUFFER_INTERNAL_FORMAT_NV";
-      case 0x0000902e: return "GL_PARTIAL_SUCCESS_NV";
-      case 0x0000902f: return "GL_SUCCESS_NV";
-      case 0x00009030: return "GL_FAILURE_NV";
-      case 0x00009031: return "GL_YCBYCR8_422_NV";
-      case 0x00009032: return "GL_YCBAYCR8A_4224_NV";
-      case 0x00009033: return "GL_Z6Y10Z6CB10Z6Y10Z6CR10_422_NV";
-      case 0x00009034: return "GL_Z6Y10Z6CB10Z6A10Z6Y10Z6CR10Z6A10_4224_NV";
-      case 0x00009035: return "GL_Z4Y12Z4CB12Z4Y12Z4CR12_422_NV";
-      case 0x00009036: return "GL_Z4Y12Z4CB12Z4A12Z4Y12Z4CR12Z4A12_4224_NV";
-      case 0x00009037: return "GL_Z4Y12Z4CB12Z4CR12_444_NV";
-      case 0x00009038: return "GL_VIDEO_CAPTURE_FRAME_WIDTH_NV";
-      case 0x00009039: return "GL_VIDEO_CAPTURE_FRAME_HEIGHT_NV";
-      case 0x0000903a: return "GL_VIDEO_CAPTURE_FIELD_UPPER_HEIGHT_NV";
-      case 0x0000903b: return "GL_VIDEO_CAPTURE_FIELD_LOWER_HEIGHT_NV";
-      case 0x0000903c: return "GL_VIDEO_CAPTURE_SURFACE_ORIGIN_NV";
-      case 0x00009045: return "GL_TEXTURE_COVERAGE_SAMPLES_NV";
-      case 0x00009046: return "GL_TEXTURE_COLOR_SAMPLES_NV";
-      case 0x00009047: return "GL_GPU_MEMORY_INFO_DEDICATED_VIDMEM_NVX";
-      case 0x00009048: return "GL_GPU_MEMORY_INFO_TOTAL_AVAILABLE_MEMORY_NVX";
-      case 0x00009049: return "GL_GPU_MEMORY_INFO_CURRENT_AVAILABLE_VIDMEM_NVX";
-      case 0x0000904a: return "GL_GPU_MEMORY_INFO_EVICTION_COUNT_NVX";
-      case 0x0000904b: return "GL_GPU_MEMORY_INFO_EVICTED_MEMORY_NVX";
-      case 0x0000904c: return "GL_IMAGE_1D";
-      case 0x0000904d: return "GL_IMAGE_2D";
-      case 0x0000904e: return "GL_IMAGE_3D";
-      case 0x0000904f: return "GL_IMAGE_2D_RECT";
-      case 0x00009050: return "GL_IMAGE_CUBE";
-      case 0x00009051: return "GL_IMAGE_BUFFER";
-      case 0x00009052: return "GL_IMAGE_1D_ARRAY";
-      case 0x00009053: return "GL_IMAGE_2D_ARRAY";
-      case 0x00009054: return "GL_IMAGE_CUBE_MAP_ARRAY";
-      case 0x00009055: return "GL_IMAGE_2D_MULTISAMPLE";
-      case 0x00009056: return "GL_IMAGE_2D_MULTISAMPLE_ARRAY";
-      case 0x00009057: return "GL_INT_IMAGE_1D";
-      case 0x00009058: return "GL_INT_IMAGE_2D";
-      case 0x00009059: return "GL_INT_IMAGE_3D";
-      case 0x0000905a: return "GL_INT_IMAGE_2D_RECT";
-      case 0x0000905b: return "GL_INT_IMAGE_CUBE";
-      case 0x0000905c: return "GL_INT_IMAGE_BUFFER";
-      case 0x0000905d: return "GL_INT_IMAGE_1D_ARRAY";
-      case 0x0000905e: return "GL_INT_IMAGE_2D_ARRAY";
-      case 0x0000905f: return "GL_INT_IMAGE_CUBE_MAP_ARRAY";
-      case 0x00009060: return "GL_INT_IMAGE_2D_MULTISAMPLE";
-      case 0x00009061: return "GL_INT_IMAGE_2D_MULTISAMPLE_ARRAY";
-      case 0x00009062: return "GL_UNSIGNED_INT_IMAGE_1D";
-      case 0x00009063: return "GL_UNSIGNED_INT_IMAGE_2D";
-      case 0x00009064: return "GL_UNSIGNED_INT_IMAGE_3D";
-      case 0x00009065: return "GL_UNSIGNED_INT_IMAGE_2D_RECT";
-      case 0x00009066: return "GL_UNSIGNED_INT_IMAGE_CUBE";
-      case 0x00009067: return "GL_UNSIGNED_INT_IMAGE_BUFFER";
-      case 0x00009068: return "GL_UNSIGNED_INT_IMAGE_1D_ARRAY";
-      case 0x00009069: return "GL_UNSIGNED_INT_IMAGE_2D_ARRAY";
-      case 0x0000906a: return "GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY";
-      case 0x0000906b: return "GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE";
-      case 0x0000906c: return "GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE_ARRAY";
-      case 0x0000906d: return "GL_MAX_IMAGE_SAMPLES";
-      case 0x0000906e: return "GL_IMAGE_BINDING_FORMAT";
-      case 0x0000906f: return "GL_RGB10_A2UI";
-      case 0x00009070: return "GL_PATH_FORMAT_SVG_NV";
-      case 0x00009071: return "GL_PATH_FORMAT_PS_NV";
-      case 0x00009072: return "GL_STANDARD_FONT_NAME_NV";
-      case 0x00009073: return "GL_SYSTEM_FONT_NAME_NV";
-      case 0x00009074: return "GL_FILE_NAME_NV";
-      case 0x00009075: return "GL_PATH_STROKE_WIDTH_NV";
-      case 0x00009076: return "GL_PATH_END_CAPS_NV";
-      case 0x00009077: return "GL_PATH_INITIAL_END_CAP_NV";
-      case 0x00009078: return "GL_PATH_TERMINAL_END_CAP_NV";
-      case 0x00009079: return "GL_PATH_JOIN_STYLE_NV";
-      case 0x0000907a: return "GL_PATH_MITER_LIMIT_NV";
-      case 0x0000907b: return "GL_PATH_DASH_CAPS_NV";
-      case 0x0000907c: return "GL_PATH_INITIAL_DASH_CAP_NV";
-      case 0x0000907d: return "GL_PATH_TERMINAL_DASH_CAP_NV";
-      case 0x0000907e: return "GL_PATH_DASH_OFFSET_NV";
-      case 0x0000907f: return "GL_PATH_CLIENT_LENGTH_NV";
-      case 0x00009080: return "GL_PATH_FILL_MODE_NV";
-      case 0x00009081: return "GL_PATH_FILL_MASK_NV";
-      case 0x00009082: return "GL_PATH_FILL_COVER_MODE_NV";
-      case 0x00009083: return "GL_PATH_STROKE_COVER_MODE_NV";
-      case 0x00009084: return "GL_PATH_STROKE_MASK_NV";
-      case 0x00009088: return "GL_COUNT_UP_NV";
-      case 0x00009089: return "GL_COUNT_DOWN_NV";
-      case 0x0000908a: return "GL_PATH_OBJECT_BOUNDING_BOX_NV";
-      case 0x0000908b: return "GL_CONVEX_HULL_NV";
-      case 0x0000908d: return "GL_BOUNDING_BOX_NV";
-      case 0x0000908e: return "GL_TRANSLATE_X_NV";
-      case 0x0000908f: return "GL_TRANSLATE_Y_NV";
-      case 0x00009090: return "GL_TRANSLATE_2D_NV";
-      case 0x00009091: return "GL_TRANSLATE_3D_NV";
-      case 0x00009092: return "GL_AFFINE_2D_NV";
-      case 0x00009094: return "GL_AFFINE_3D_NV";
-      case 0x00009096: return "GL_TRANSPOSE_AFFINE_2D_NV";
-      case 0x00009098: return "GL_TRANSPOSE_AFFINE_3D_NV";
-      case 0x0000909a: return "GL_UTF8_NV";
-      case 0x0000909b: return "GL_UTF16_NV";
-      case 0x0000909c: return "GL_BOUNDING_BOX_OF_BOUNDING_BOXES_NV";
-      case 0x0000909d: return "GL_PATH_COMMAND_COUNT_NV";
-      case 0x0000909e: return "GL_PATH_COORD_COUNT_NV";
-      case 0x0000909f: return "GL_PATH_DASH_ARRAY_COUNT_NV";
-      case 0x000090a0: return "GL_PATH_COMPUTED_LENGTH_NV";
-      case 0x000090a1: return "GL_PATH_FILL_BOUNDING_BOX_NV";
-      case 0x000090a2: return "GL_PATH_STROKE_BOUNDING_BOX_NV";
-      case 0x000090a3: return "GL_SQUARE_NV";
-      case 0x000090a4: return "GL_ROUND_NV";
-      case 0x000090a5: return "GL_TRIANGULAR_NV";
-      case 0x000090a6: return "GL_BEVEL_NV";
-      case 0x000090a7: return "GL_MITER_REVERT_NV";
-      case 0x000090a8: return "GL_MITER_TRUNCATE_NV";
-      case 0x000090a9: return "GL_SKIP_MISSING_GLYPH_NV";
-      case 0x000090aa: return "GL_USE_MISSING_GLYPH_NV";
-      case 0x000090ab: return "GL_PATH_ERROR_POSITION_NV";
-      case 0x000090ac: return "GL_PATH_FOG_GEN_MODE_NV";
-      case 0x000090ad: return "GL_ACCUM_ADJACENT_PAIRS_NV";
-      case 0x000090ae: return "GL_ADJACENT_PAIRS_NV";
-      case 0x000090af: return "GL_FIRST_TO_REST_NV";
-      case 0x000090b0: return "GL_PATH_GEN_MODE_NV";
-      case 0x000090b1: return "GL_PATH_GEN_COEFF_NV";
-      case 0x000090b2: return "GL_PATH_GEN_COLOR_FORMAT_NV";
-      case 0x000090b3: return "GL_PATH_GEN_COMPONENTS_NV";
-      case 0x000090b4: return "GL_PATH_DASH_OFFSET_RESET_NV";
-      case 0x000090b5: return "GL_MOVE_TO_RESETS_NV";
-      case 0x000090b6: return "GL_MOVE_TO_CONTINUES_NV";
-      case 0x000090b7: return "GL_PATH_STENCIL_FUNC_NV";
-      case 0x000090b8: return "GL_PATH_STENCIL_REF_NV";
-      case 0x000090b9: return "GL_PATH_STENCIL_VALUE_MASK_NV";
-      case 0x000090ba: return "GL_SCALED_RESOLVE_FASTEST_EXT";
-      case 0x000090bb: return "GL_SCALED_RESOLVE_NICEST_EXT";
-      case 0x000090bc: return "GL_MIN_MAP_BUFFER_ALIGNMENT";
-      case 0x000090bd: return "GL_PATH_STENCIL_DEPTH_OFFSET_FACTOR_NV";
-      case 0x000090be: return "GL_PATH_STENCIL_DEPTH_OFFSET_UNITS_NV";
-      case 0x000090bf: return "GL_PATH_COVER_DEPTH_FUNC_NV";
-      case 0x000090c7: return "GL_IMAGE_FORMAT_COMPATIBILITY_TYPE";
-      case 0x000090c8: return "GL_IMAGE_FORMAT_COMPATIBILITY_BY_SIZE";
-      case 0x000090c9: return "GL_IMAGE_FORMAT_COMPATIBILITY_BY_CLASS";
-      case 0x000090ca: return "GL_MAX_VERTEX_IMAGE_UNIFORMS";
-      case 0x000090cb: return "GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS";
-      case 0x000090cc: return "GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS";
-      case 0x000090cd: return "GL_MAX_GEOMETRY_IMAGE_UNIFORMS";
-      case 0x000090ce: return "GL_MAX_FRAGMENT_IMAGE_UNIFORMS";
-      case 0x000090cf: return "GL_MAX_COMBINED_IMAGE_UNIFORMS";
-      case 0x000090d0: return "GL_MAX_DEEP_3D_TEXTURE_WIDTH_HEIGHT_NV";
-      case 0x000090d1: return "GL_MAX_DEEP_3D_TEXTURE_DEPTH_NV";
-      case 0x000090d2: return "GL_SHADER_STORAGE_BUFFER";
-      case 0x000090d3: return "GL_SHADER_STORAGE_BUFFER_BINDING";
-      case 0x000090d4: return "GL_SHADER_STORAGE_BUFFER_START";
-      case 0x000090d5: return "GL_SHADER_STORAGE_BUFFER_SIZE";
-      case 0x000090d6: return "GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS";
-      case 0x000090d7: return "GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS";
-      case 0x000090d8: return "GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS";
-      case 0x000090d9: return "GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS";
-      case 0x000090da: return "GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS";
-      case 0x000090db: return "GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS";
-      case 0x000090dc: return "GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS";
-      case 0x000090dd: return "GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS";
-      case 0x000090de: return "GL_MAX_SHADER_STORAGE_BLOCK_SIZE";
-      case 0x000090df: return "GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT";
-      case 0x000090e1: return "GL_SYNC_X11_FENCE_EXT";
-      case 0x000090ea: return "GL_DEPTH_STENCIL_TEXTURE_MODE";
-      case 0x000090eb: return "GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS";
-      case 0x000090ec: return "GL_UNIFORM_BLOCK_REFERENCED_BY_COMPUTE_SHADER";
-      case 0x000090ed: return "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_COMPUTE_SHADER";
-      case 0x000090ee: return "GL_DISPATCH_INDIRECT_BUFFER";
-      case 0x000090ef: return "GL_DISPATCH_INDIRECT_BUFFER_BINDING";
-      case 0x000090f0: return "GL_COLOR_ATTACHMENT_EXT";
-      case 0x000090f1: return "GL_MULTIVIEW_EXT";
-      case 0x000090f2: return "GL_MAX_MULTIVIEW_BUFFERS_EXT";
-      case 0x000090f3: return "GL_CONTEXT_ROBUST_ACCESS_EXT";
-      case 0x000090f4: return "GL_3DVISION_STEREO_NV";
-      case 0x000090f5: return "GL_STEREO_SEPARATION_NV";
-      case 0x000090f6: return "GL_STEREO_CONVERGENCE_NV";
-      case 0x000090f7: return "GL_STEREO_CUTOFF_NV";
-      case 0x000090f8: return "GL_STEREO_PROJECTION_NV";
-      case 0x000090f9: return "GL_STEREO_PROJECTION_PERSPECTIVE_NV";
-      case 0x000090fa: return "GL_STEREO_PROJECTION_ORTHO_NV";
-      case 0x000090fb: return "GL_COMPUTE_PROGRAM_NV";
-      case 0x000090fc: return "GL_COMPUTE_PROGRAM_PARAMETER_BUFFER_NV";
-      case 0x00009100: return "GL_TEXTURE_2D_MULTISAMPLE";
-      case 0x00009101: return "GL_PROXY_TEXTURE_2D_MULTISAMPLE";
-      case 0x00009102: return "GL_TEXTURE_2D_MULTISAMPLE_ARRAY";
-      case 0x00009103: return "GL_PROXY_TEXTURE_2D_MULTISAMPLE_ARRAY";
-      case 0x00009104: return "GL_TEXTURE_BINDING_2D_MULTISAMPLE";
-      case 0x00009105: return "GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY";
-      case 0x00009106: return "GL_TEXTURE_SAMPLES";
-      case 0x00009107: return "GL_TEXTURE_FIXED_SAMPLE_LOCATIONS";
-      case 0x00009108: return "GL_SAMPLER_2D_MULTISAMPLE";
-      case 0x00009109: return "GL_INT_SAMPLER_2D_MULTISAMPLE";
-      case 0x0000910a: return "GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE";
-      case 0x0000910b: return "GL_SAMPLER_2D_MULTISAMPLE_ARRAY";
-      case 0x0000910c: return "GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY";
-      case 0x0000910d: return "GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY";
-      case 0x0000910e: return "GL_MAX_COLOR_TEXTURE_SAMPLES";
-      case 0x0000910f: return "GL_MAX_DEPTH_TEXTURE_SAMPLES";
-      case 0x00009110: return "GL_MAX_INTEGER_SAMPLES";
-      case 0x00009111: return "GL_MAX_SERVER_WAIT_TIMEOUT";
-      case 0x00009112: return "GL_OBJECT_TYPE";
-      case 0x00009113: return "GL_SYNC_CONDITION";
-      case 0x00009114: return "GL_SYNC_STATUS";
-      case 0x00009115: return "GL_SYNC_FLAGS";
-      case 0x00009116: return "GL_SYNC_FENCE";
-      case 0x00009117: return "GL_SYNC_GPU_COMMANDS_COMPLETE";
-      case 0x00009118: return "GL_UNSIGNALED";
-      case 0x00009119: return "GL_SIGNALED";
-      case 0x0000911a: return "GL_ALREADY_SIGNALED";
-      case 0x0000911b: return "GL_TIMEOUT_EXPIRED";
-      case 0x0000911c: return "GL_CONDITION_SATISFIED";
-      case 0x0000911d: return "GL_WAIT_FAILED";
-      case 0x0000911f: return "GL_BUFFER_ACCESS_FLAGS";
-      case 0x00009120: return "GL_BUFFER_MAP_LENGTH";
-      case 0x00009121: return "GL_BUFFER_MAP_OFFSET";
-      case 0x00009122: return "GL_MAX_VERTEX_OUTPUT_COMPONENTS";
-      case 0x00009123: return "GL_MAX_GEOMETRY_INPUT_COMPONENTS";
-      case 0x00009124: return "GL_MAX_GEOMETRY_OUTPUT_COMPONENTS";
-      case 0x00009125: return "GL_MAX_FRAGMENT_INPUT_COMPONENTS";
-      case 0x00009126: return "GL_CONTEXT_PROFILE_MASK";
-      case 0x00009127: return "GL_UNPACK_COMPRESSED_BLOCK_WIDTH";
-      case 0x00009128: return "GL_UNPACK_COMPRESSED_BLOCK_HEIGHT";
-      case 0x00009129: return "GL_UNPACK_COMPRESSED_BLOCK_DEPTH";
-      case 0x0000912a: return "GL_UNPACK_COMPRESSED_BLOCK_SIZE";
-      case 0x0000912b: return "GL_PACK_COMPRESSED_BLOCK_WIDTH";
-      case 0x0000912c: return "GL_PACK_COMPRESSED_BLOCK_HEIGHT";
-      case 0x0000912d: return "GL_PACK_COMPRESSED_BLOCK_DEPTH";
-      case 0x0000912e: return "GL_PACK_COMPRESSED_BLOCK_SIZE";
-      case 0x0000912f: return "GL_TEXTURE_IMMUTABLE_FORMAT";
-      case 0x00009130: return "GL_SGX_PROGRAM_BINARY_IMG";
-      case 0x00009133: return "GL_RENDERBUFFER_SAMPLES_IMG";
-      case 0x00009134: return "GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_IMG";
-      case 0x00009135: return "GL_MAX_SAMPLES_IMG";
-      case 0x00009136: return "GL_TEXTURE_SAMPLES_IMG";
-      case 0x00009137: return "GL_COMPRESSED_RGBA_PVRTC_2BPPV2_IMG";
-      case 0x00009138: return "GL_COMPRESSED_RGBA_PVRTC_4BPPV2_IMG";
-      case 0x00009143: return "GL_MAX_DEBUG_MESSAGE_LENGTH";
-      case 0x00009144: return "GL_MAX_DEBUG_LOGGED_MESSAGES";
-      case 0x00009145: return "GL_DEBUG_LOGGED_MESSAGES";
-      case 0x00009146: return "GL_DEBUG_SEVERITY_HIGH";
-      case 0x00009147: return "GL_DEBUG_SEVERITY_MEDIUM";
-      case 0x00009148: return "GL_DEBUG_SEVERITY_LOW";
-      case 0x00009149: return "GL_DEBUG_CATEGORY_API_ERROR_AMD";
-      case 0x0000914a: return "GL_DEBUG_CATEGORY_WINDOW_SYSTEM_AMD";
-      case 0x0000914b: return "GL_DEBUG_CATEGORY_DEPRECATION_AMD";
-      case 0x0000914c: return "GL_DEBUG_CATEGORY_UNDEFINED_BEHAVIOR_AMD";
-      case 0x0000914d: return "GL_DEBUG_CATEGORY_PERFORMANCE_AMD";
-      case 0x0000914e: return "GL_DEBUG_CATEGORY_SHADER_COMPILER_AMD";
-      case 0x0000914f: return "GL_DEBUG_CATEGORY_APPLICATION_AMD";
-      case 0x00009150: return "GL_DEBUG_CATEGORY_OTHER_AMD";
-      case 0x00009151: return "GL_DATA_BUFFER_AMD";
-      case 0x00009152: return "GL_PERFORMANCE_MONITOR_AMD";
-      case 0x00009153: return "GL_QUERY_OBJECT_AMD";
-      case 0x00009154: return "GL_VERTEX_ARRAY_OBJECT_AMD";
-      case 0x00009155: return "GL_SAMPLER_OBJECT_AMD";
-      case 0x00009160: return "GL_EXTERNAL_VIRTUAL_MEMORY_BUFFER_AMD";
-      case 0x00009192: return "GL_QUERY_BUFFER";
-      case 0x00009193: return "GL_QUERY_BUFFER_BINDING";
-      case 0x00009194: return "GL_QUERY_RESULT_NO_WAIT";
-      case 0x00009195: return "GL_VIRTUAL_PAGE_SIZE_X_AMD";
-      case 0x00009196: return "GL_VIRTUAL_PAGE_SIZE_Y_AMD";
-      case 0x00009197: return "GL_VIRTUAL_PAGE_SIZE_Z_AMD";
-      case 0x00009198: return "GL_MAX_SPARSE_TEXTURE_SIZE_AMD";
-      case 0x00009199: return "GL_MAX_SPARSE_3D_TEXTURE_SIZE_AMD";
-      case 0x0000919a: return "GL_MAX_SPARSE_ARRAY_TEXTURE_LAYERS";
-      case 0x0000919b: return "GL_MIN_SPARSE_LEVEL_AMD";
-      case 0x0000919c: return "GL_MIN_LOD_WARNING_AMD";
-      case 0x0000919d: return "GL_TEXTURE_BUFFER_OFFSET";
-      case 0x0000919e: return "GL_TEXTURE_BUFFER_SIZE";
-      case 0x0000919f: return "GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT";
-      case 0x000091a4: return "GL_VERTEX_ELEMENT_SWIZZLE_AMD";
-      case 0x000091a5: return "GL_VERTEX_ID_SWIZZLE_AMD";
-      case 0x000091a6: return "GL_TEXTURE_SPARSE_ARB";
-      case 0x000091a7: return "GL_VIRTUAL_PAGE_SIZE_INDEX_ARB";
-      case 0x000091a8: return "GL_NUM_VIRTUAL_PAGE_SIZES_ARB";
-      case 0x000091a9: return "GL_SPARSE_TEXTURE_FULL_ARRAY_CUBE_MIPMAPS_ARB";
-      case 0x000091aa: return "GL_NUM_SPARSE_LEVELS_ARB";
-      case 0x000091b9: return "GL_COMPUTE_SHADER";
-      case 0x000091bb: return "GL_MAX_COMPUTE_UNIFORM_BLOCKS";
-      case 0x000091bc: return "GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS";
-      case 0x000091bd: return "GL_MAX_COMPUTE_IMAGE_UNIFORMS";
-      case 0x000091be: return "GL_MAX_COMPUTE_WORK_GROUP_COUNT";
-      case 0x000091bf: return "GL_MAX_COMPUTE_WORK_GROUP_SIZE";
-      case 0x00009250: return "GL_SHADER_BINARY_DMP";
-      case 0x00009260: return "GL_GCCSO_SHADER_BINARY_FJ";
-      case 0x00009270: return "GL_COMPRESSED_R11_EAC";
-      case 0x00009271: return "GL_COMPRESSED_SIGNED_R11_EAC";
-      case 0x00009272: return "GL_COMPRESSED_RG11_EAC";
-      case 0x00009273: return "GL_COMPRESSED_SIGNED_RG11_EAC";
-      case 0x00009274: return "GL_COMPRESSED_RGB8_ETC2";
-      case 0x00009275: return "GL_COMPRESSED_SRGB8_ETC2";
-      case 0x00009276: return "GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2";
-      case 0x00009277: return "GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2";
-      case 0x00009278: return "GL_COMPRESSED_RGBA8_ETC2_EAC";
-      case 0x00009279: return "GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC";
-      case 0x00009280: return "GL_BLEND_PREMULTIPLIED_SRC_NV";
-      case 0x00009281: return "GL_BLEND_OVERLAP_NV";
-      case 0x00009282: return "GL_UNCORRELATED_NV";
-      case 0x00009283: return "GL_DISJOINT_NV";
-      case 0x00009284: return "GL_CONJOINT_NV";
-      case 0x00009285: return "GL_BLEND_ADVANCED_COHERENT_NV";
-      case 0x00009286: return "GL_SRC_NV";
-      case 0x00009287: return "GL_DST_NV";
-      case 0x00009288: return "GL_SRC_OVER_NV";
-      case 0x00009289: return "GL_DST_OVER_NV";
-      case 0x0000928a: return "GL_SRC_IN_NV";
-      case 0x0000928b: return "GL_DST_IN_NV";
-      case 0x0000928c: return "GL_SRC_OUT_NV";
-      case 0x0000928d: return "GL_DST_OUT_NV";
-      case 0x0000928e: return "GL_SRC_ATOP_NV";
-      case 0x0000928f: return "GL_DST_ATOP_NV";
-      case 0x00009291: return "GL_PLUS_NV";
-      case 0x00009292: return "GL_PLUS_DARKER_NV";
-      case 0x00009294: return "GL_MULTIPLY_NV";
-      case 0x00009295: return "GL_SCREEN_NV";
-      case 0x00009296: return "GL_OVERLAY_NV";
-      case 0x00009297: return "GL_DARKEN_NV";
-      case 0x00009298: return "GL_LIGHTEN_NV";
-      case 0x00009299: return "GL_COLORDODGE_NV";
-      case 0x0000929a: return "GL_COLORBURN_NV";
-      case 0x0000929b: return "GL_HARDLIGHT_NV";
-      case 0x0000929c: return "GL_SOFTLIGHT_NV";
-      case 0x0000929e: return "GL_DIFFERENCE_NV";
-      case 0x0000929f: return "GL_MINUS_NV";
-      case 0x000092a0: return "GL_EXCLUSION_NV";
-      case 0x000092a1: return "GL_CONTRAST_NV";
-      case 0x000092a3: return "GL_INVERT_RGB_NV";
-      case 0x000092a4: return "GL_LINEARDODGE_NV";
-      case 0x000092a5: return "GL_LINEARBURN_NV";
-      case 0x000092a6: return "GL_VIVIDLIGHT_NV";
-      case 0x000092a7: return "GL_LINEARLIGHT_NV";
-      case 0x000092a8: return "GL_PINLIGHT_NV";
-      case 0x000092a9: return "GL_HARDMIX_NV";
-      case 0x000092ad: return "GL_HSL_HUE_NV";
-      case 0x000092ae: return "GL_HSL_SATURATION_NV";
-      case 0x000092af: return "GL_HSL_COLOR_NV";
-      case 0x000092b0: return "GL_HSL_LUMINOSITY_NV";
-      case 0x000092b1: return "GL_PLUS_CLAMPED_NV";
-      case 0x000092b2: return "GL_PLUS_CLAMPED_ALPHA_NV";
-      case 0x000092b3: return "GL_MINUS_CLAMPED_NV";
-      case 0x000092b4: return "GL_INVERT_OVG_NV";
-      case 0x000092c0: return "GL_ATOMIC_COUNTER_BUFFER";
-      case 0x000092c1: return "GL_ATOMIC_COUNTER_BUFFER_BINDING";
-      case 0x000092c2: return "GL_ATOMIC_COUNTER_BUFFER_START";
-      case 0x000092c3: return "GL_ATOMIC_COUNTER_BUFFER_SIZE";
-      case 0x000092c4: return "GL_ATOMIC_COUNTER_BUFFER_DATA_SIZE";
-      case 0x000092c5: return "GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTERS";
-      case 0x000092c6: return "GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTER_INDICES";
-      case 0x000092c7: return "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_VERTEX_SHADER";
-      case 0x000092c8: return "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_CONTROL_SHADER";
-      case 0x000092c9: return "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_EVALUATION_SHADER";
-      case 0x000092ca: return "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_GEOMETRY_SHADER";
-      case 0x000092cb: return "GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_FRAGMENT_SHADER";
-      case 0x000092cc: return "GL_MAX_VERTEX_ATOMIC_COUNTER_BUFFERS";
-      case 0x000092cd: return "GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS";
-      case 0x000092ce: return "GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS";
-      case 0x000092cf: return "GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS";
-      case 0x000092d0: return "GL_MAX_FRAGMENT_ATOMIC_COUNTER_BUFFERS";
-      case 0x000092d1: return "GL_MAX_COMBINED_ATOMIC_COUNTER_BUFFERS";
-      case 0x000092d2: return "GL_MAX_VERTEX_ATOMIC_COUNTERS";
-      case 0x000092d3: return "GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS";
-      case 0x000092d4: return "GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS";
-      case 0x000092d5: return "GL_MAX_GEOMETRY_ATOMIC_COUNTERS";
-      case 0x000092d6: return "GL_MAX_FRAGMENT_ATOMIC_COUNTERS";
-      case 0x000092d7: return "GL_MAX_COMBINED_ATOMIC_COUNTERS";
-      case 0x000092d8: return "GL_MAX_ATOMIC_COUNTER_BUFFER_SIZE";
-      case 0x000092d9: return "GL_ACTIVE_ATOMIC_COUNTER_BUFFERS";
-      case 0x000092da: return "GL_UNIFORM_ATOMIC_COUNTER_BUFFER_INDEX";
-      case 0x000092db: return "GL_UNSIGNED_INT_ATOMIC_COUNTER";
-      case 0x000092dc: return "GL_MAX_ATOMIC_COUNTER_BUFFER_BINDINGS";
-      case 0x000092e0: return "GL_DEBUG_OUTPUT";
-      case 0x000092e1: return "GL_UNIFORM";
-      case 0x000092e2: return "GL_UNIFORM_BLOCK";
-      case 0x000092e3: return "GL_PROGRAM_INPUT";
-      case 0x000092e4: return "GL_PROGRAM_OUTPUT";
-      case 0x000092e5: return "GL_BUFFER_VARIABLE";
-      case 0x000092e6: return "GL_SHADER_STORAGE_BLOCK";
-      case 0x000092e7: return "GL_IS_PER_PATCH";
-      case 0x000092e8: return "GL_VERTEX_SUBROUTINE";
-      case 0x000092e9: return "GL_TESS_CONTROL_SUBROUTINE";
-      case 0x000092ea: return "GL_TESS_EVALUATION_SUBROUTINE";
-      case 0x000092eb: return "GL_GEOMETRY_SUBROUTINE";
-      case 0x000092ec: return "GL_FRAGMENT_SUBROUTINE";
-      case 0x000092ed: return "GL_COMPUTE_SUBROUTINE";
-      case 0x000092ee: return "GL_VERTEX_SUBROUTINE_UNIFORM";
-      case 0x000092ef: return "GL_TESS_CONTROL_SUBROUTINE_UNIFORM";
-      case 0x000092f0: return "GL_TESS_EVALUATION_SUBROUTINE_UNIFORM";
-      case 0x000092f1: return "GL_GEOMETRY_SUBROUTINE_UNIFORM";
-      case 0x000092f2: return "GL_FRAGMENT_SUBROUTINE_UNIFORM";
-      case 0x000092f3: return "GL_COMPUTE_SUBROUTINE_UNIFORM";
-      case 0x000092f4: return "GL_TRANSFORM_FEEDBACK_VARYING";
-      case 0x000092f5: return "GL_ACTIVE_RESOURCES";
-      case 0x000092f6: return "GL_MAX_NAME_LENGTH";
-      case 0x000092f7: return "GL_MAX_NUM_ACTIVE_VARIABLES";
-      case 0x000092f8: return "GL_MAX_NUM_COMPATIBLE_SUBROUTINES";
-      case 0x000092f9: return "GL_NAME_LENGTH";
-      case 0x000092fa: return "GL_TYPE";
-      case 0x000092fb: return "GL_ARRAY_SIZE";
-      case 0x000092fc: return "GL_OFFSET";
-      case 0x000092fd: return "GL_BLOCK_INDEX";
-      case 0x000092fe: return "GL_ARRAY_STRIDE";
-      case 0x000092ff: return "GL_MATRIX_STRIDE";
-      case 0x00009300: return "GL_IS_ROW_MAJOR";
-      case 0x00009301: return "GL_ATOMIC_COUNTER_BUFFER_INDEX";
-      case 0x00009302: return "GL_BUFFER_BINDING";
-      case 0x00009303: return "GL_BUFFER_DATA_SIZE";
-      case 0x00009304: return "GL_NUM_ACTIVE_VARIABLES";
-      case 0x00009305: return "GL_ACTIVE_VARIABLES";
-      case 0x00009306: return "GL_REFERENCED_BY_VERTEX_SHADER";
-      case 0x00009307: return "GL_REFERENCED_BY_TESS_CONTROL_SHADER";
-      case 0x00009308: return "GL_REFERENCED_BY_TESS_EVALUATION_SHADER";
-      case 0x00009309: return "GL_REFERENCED_BY_GEOMETRY_SHADER";
-      case 0x0000930a: return "GL_REFERENCED_BY_FRAGMENT_SHADER";
-      case 0x0000930b: return "GL_REFERENCED_BY_COMPUTE_SHADER";
-      case 0x0000930c: return "GL_TOP_LEVEL_ARRAY_SIZE";
-      case 0x0000930d: return "GL_TOP_LEVEL_ARRAY_STRIDE";
-      case 0x0000930e: return "GL_LOCATION";
-      case 0x0000930f: return "GL_LOCATION_INDEX";
-      case 0x00009310: return "GL_FRAMEBUFFER_DEFAULT_WIDTH";
-      case 0x00009311: return "GL_FRAMEBUFFER_DEFAULT_HEIGHT";
-      case 0x00009312: return "GL_FRAMEBUFFER_DEFAULT_LAYERS";
-      case 0x00009313: return "GL_FRAMEBUFFER_DEFAULT_SAMPLES";
-      case 0x00009314: return "GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS";
-      case 0x00009315: return "GL_MAX_FRAMEBUFFER_WIDTH";
-      case 0x00009316: return "GL_MAX_FRAMEBUFFER_HEIGHT";
-      case 0x00009317: return "GL_MAX_FRAMEBUFFER_LAYERS";
-      case 0x00009318: return "GL_MAX_FRAMEBUFFER_SAMPLES";
-      case 0x00009319: return "GL_LOG_ERROR_REGAL";
-      case 0x0000931a: return "GL_LOG_WARNING_REGAL";
-      case 0x0000931b: return "GL_LOG_INFO_REGAL";
-      case 0x0000931c: return "GL_LOG_APP_REGAL";
-      case 0x0000931d: return "GL_LOG_DRIVER_REGAL";
-      case 0x0000931e: return "GL_LOG_INTERNAL_REGAL";
-      case 0x0000931f: return "GL_LOG_DEBUG_REGAL";
-      case 0x00009320: return "GL_LOG_STATUS_REGAL";
-      case 0x00009321: return "GL_LOG_HTTP_REGAL";
-      case 0x00009322: return "GL_ERROR_REGAL";
-      case 0x00009323: return "GL_DEBUG_REGAL";
-      case 0x00009324: return "GL_LOG_REGAL";
-      case 0x00009325: return "GL_EMULATION_REGAL";
-      case 0x00009326: return "GL_DRIVER_REGAL";
-      case 0x00009344: return "GL_MAX_COMPUTE_VARIABLE_GROUP_INVOCATIONS_ARB";
-      case 0x00009345: return "GL_MAX_COMPUTE_VARIABLE_GROUP_SIZE_ARB";
-      case 0x0000934a: return "GL_LOCATION_COMPONENT";
-      case 0x0000934b: return "GL_TRANSFORM_FEEDBACK_BUFFER_INDEX";
-      case 0x0000934c: return "GL_TRANSFORM_FEEDBACK_BUFFER_STRIDE";
-      case 0x00009360: return "GL_MISSING_REGAL";
-      case 0x00009361: return "GL_TRACE_REGAL";
-      case 0x00009362: return "GL_CACHE_REGAL";
-      case 0x00009363: return "GL_CODE_REGAL";
-      case 0x00009364: return "GL_STATISTICS_REGAL";
-      case 0x00009365: return "GL_CLEAR_TEXTURE";
-      case 0x00009380: return "GL_NUM_SAMPLE_COUNTS";
-      case 0x000093a0: return "GL_TRANSLATED_SHADER_SOURCE_LENGTH_ANGLE";
-      case 0x000093a1: return "GL_BGRA8_EXT";
-      case 0x000093a2: return "GL_TEXTURE_USAGE_ANGLE";
-      case 0x000093a3: return "GL_FRAMEBUFFER_ATTACHMENT_ANGLE";
-      case 0x000093a4: return "GL_PACK_REVERSE_ROW_ORDER_ANGLE";
-      case 0x000093a6: return "GL_PROGRAM_BINARY_ANGLE";
-      case 0x000093b0: return "GL_COMPRESSED_RGBA_ASTC_4x4_KHR";
-      case 0x000093b1: return "GL_COMPRESSED_RGBA_ASTC_5x4_KHR";
-      case 0x000093b2: return "GL_COMPRESSED_RGBA_ASTC_5x5_KHR";
-      case 0x000093b3: return "GL_COMPRESSED_RGBA_ASTC_6x5_KHR";
-      case 0x000093b4: return "GL_COMPRESSED_RGBA_ASTC_6x6_KHR";
-      case 0x000093b5: return "GL_COMPRESSED_RGBA_ASTC_8x5_KHR";
-      case 0x000093b6: return "GL_COMPRESSED_RGBA_ASTC_8x6_KHR";
-      case 0x000093b7: return "GL_COMPRESSED_RGBA_ASTC_8x8_KHR";
-      case 0x000093b8: return "GL_COMPRESSED_RGBA_ASTC_10x5_KHR";
-      case 0x000093b9: return "GL_COMPRESSED_RGBA_ASTC_10x6_KHR";
-      case 0x000093ba: return "GL_COMPRESSED_RGBA_ASTC_10x8_KHR";
-      case 0x000093bb: return "GL_COMPRESSED_RGBA_ASTC_10x10_KHR";
-      case 0x000093bc: return "GL_COMPRESSED_RGBA_ASTC_12x10_KHR";
-      case 0x000093bd: return "GL_COMPRESSED_RGBA_ASTC_12x12_KHR";
-      case 0x000093d0: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4_KHR";
-      case 0x000093d1: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4_KHR";
-      case 0x000093d2: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5_KHR";
-      case 0x000093d3: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5_KHR";
-      case 0x000093d4: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6_KHR";
-      case 0x000093d5: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5_KHR";
-      case 0x000093d6: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6_KHR";
-      case 0x000093d7: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8_KHR";
-      case 0x000093d8: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5_KHR";
-      case 0x000093d9: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6_KHR";
-      case 0x000093da: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8_KHR";
-      case 0x000093db: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10_KHR";
-      case 0x000093dc: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10_KHR";
-      case 0x000093dd: return "GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12_KHR";
-      case 0x00010000: return "GL_STENCIL_BUFFER_BIT0_QCOM";
-      case 0x00019262: return "GL_RASTER_POSITION_UNCLIPPED_IBM";
-      case 0x0001928a: return "GL_CULL_VERTEX_IBM";
-      case 0x00019294: return "GL_ALL_STATIC_DATA_IBM";
-      case 0x00019295: return "GL_STATIC_VERTEX_ARRAY_IBM";
-      case 0x0001929e: return "GL_VERTEX_ARRAY_LIST_IBM";
-      case 0x0001929f: return "GL_NORMAL_ARRAY_LIST_IBM";
-      case 0x000192a0: return "GL_COLOR_ARRAY_LIST_IBM";
-      case 0x000192a1: return "GL_INDEX_ARRAY_LIST_IBM";
-      case 0x000192a2: return "GL_TEXTURE_COORD_ARRAY_LIST_IBM";
-      case 0x000192a3: return "GL_EDGE_FLAG_ARRAY_LIST_IBM";
-      case 0x000192a4: return "GL_FOG_COORDINATE_ARRAY_LIST_IBM";
-      case 0x000192a5: return "GL_SECONDARY_COLOR_ARRAY_LIST_IBM";
-      case 0x000192a8: return "GL_VERTEX_ARRAY_LIST_STRIDE_IBM";
-      case 0x000192a9: return "GL_NORMAL_ARRAY_LIST_STRIDE_IBM";
-      case 0x000192aa: return "GL_COLOR_ARRAY_LIST_STRIDE_IBM";
-      case 0x000192ab: return "GL_INDEX_ARRAY_LIST_STRIDE_IBM";
-      case 0x000192ac: return "GL_TEXTURE_COORD_ARRAY_LIST_STRIDE_IBM";
-      case 0x000192ad: return "GL_EDGE_FLAG_ARRAY_LIST_STRIDE_IBM";
-      case 0x000192ae: return "GL_FOG_COORDINATE_ARRAY_LIST_STRIDE_IBM";
-      case 0x000192af: return "GL_SECONDARY_COLOR_ARRAY_LIST_STRIDE_IBM";
-      case 0x0001a1f8: return "GL_PREFER_DOUBLEBUFFER_HINT_PGI";
-      case 0x0001a1fd: return "GL_CONSERVE_MEMORY_HINT_PGI";
-      case 0x0001a1fe: return "GL_RECLAIM_MEMORY_HINT_PGI";
-      case 0x0001a202: return "GL_NATIVE_GRAPHICS_HANDLE_PGI";
-      case 0x0001a203: return "GL_NATIVE_GRAPHICS_BEGIN_HINT_PGI";
-      case 0x0001a204: return "GL_NATIVE_GRAPHICS_END_HINT_PGI";
-      case 0x0001a20c: return "GL_ALWAYS_FAST_HINT_PGI";
-      case 0x0001a20d: return "GL_ALWAYS_SOFT_HINT_PGI";
-      case 0x0001a20e: return "GL_ALLOW_DRAW_OBJ_HINT_PGI";
-      case 0x0001a20f: return "GL_ALLOW_DRAW_WIN_HINT_PGI";
-      case 0x0001a210: return "GL_ALLOW_DRAW_FRG_HINT_PGI";
-      case 0x0001a211: return "GL_ALLOW_DRAW_MEM_HINT_PGI";
-      case 0x0001a216: return "GL_STRICT_DEPTHFUNC_HINT_PGI";
-      case 0x0001a217: return "GL_STRICT_LIGHTING_HINT_PGI";
-      case 0x0001a218: return "GL_STRICT_SCISSOR_HINT_PGI";
-      case 0x0001a219: return "GL_FULL_STIPPLE_HINT_PGI";
-      case 0x0001a220: return "GL_CLIP_NEAR_HINT_PGI";
-      case 0x0001a221: return "GL_CLIP_FAR_HINT_PGI";
-      case 0x0001a222: return "GL_WIDE_LINE_HINT_PGI";
-      case 0x0001a223: return "GL_BACK_NORMALS_HINT_PGI";
-      case 0x0001a22a: return "GL_VERTEX_DATA_HINT_PGI";
-      case 0x0001a22b: return "GL_VERTEX_CONSISTENT_HINT_PGI";
-      case 0x0001a22c: return "GL_MATERIAL_SIDE_HINT_PGI";
-      case 0x0001a22d: return "GL_MAX_VERTEX_HINT_PGI";
-      case 0x00020000: return "GL_STENCIL_BUFFER_BIT1_QCOM";
-      case 0x00040000: return "GL_STENCIL_BUFFER_BIT2_QCOM";
-      case 0x00080000: return "GL_STENCIL_BUFFER_BIT3_QCOM";
-      case 0x000fffff: return "GL_ALL_ATTRIB_BITS";
-      case 0x00100000: return "GL_STENCIL_BUFFER_BIT4_QCOM";
-      case 0x00200000: return "GL_STENCIL_BUFFER_BIT5_QCOM";
-      case 0x00400000: return "GL_STENCIL_BUFFER_BIT6_QCOM";
-      case 0x00800000: return "GL_STENCIL_BUFFER_BIT7_QCOM";
-      case 0x01000000: return "GL_MULTISAMPLE_BUFFER_BIT0_QCOM";
-      case 0x02000000: return "GL_MULTISAMPLE_BUFFER_BIT1_QCOM";
-      case 0x04000000: return "GL_MULTISAMPLE_BUFFER_BIT2_QCOM";
-      case 0x08000000: return "GL_MULTISAMPLE_BUFFER_BIT3_QCOM";
-      case 0x10000000: return "GL_MULTISAMPLE_BUFFER_BIT4_QCOM";
-      case 0x20000000: return "GL_MULTISAMPLE_BIT_3DFX";
-      case 0x40000000: return "GL_MULTISAMPLE_BUFFER_BIT6_QCOM";
-      case 0x80000000: return "GL_MULTISAMPLE_BUFFER_BIT7_QCOM";
-      case 0xffffffff: return "GL_INVALID_INDEX";
-      default: break;
-    }
+    const char *name = enumToString(static_cast<GLuint>(v), glEnumValue, glEnumName, &glEnumPool, glEnumSeed, glEnumSlot, 3313);
+    if (name)
+      return name;
     #endif // REGAL_ENUM_TO_STRING
     return "unknown_gl_enum";
   }
@@ -4151,432 +11655,1400 @@ namespace Token {
   }
 
 #if REGAL_SYS_GLX
+  #if REGAL_ENUM_TO_STRING
+
+  struct GLXEnumPool {
+    char n_GLX_SYNC_FRAME_SGIX[20];
+    char n_GLX_3DFX_WINDOW_MODE_MESA[26];
+    char n_GLX_3DFX_FULLSCREEN_MODE_MESA[30];
+    char n_GLX_EXTENSIONS[15];
+    char n_GLX_BAD_VISUAL[15];
+    char n_GLX_BAD_CONTEXT[16];
+    char n_GLX_BAD_VALUE[14];
+    char n_GLX_AUX_BUFFERS[16];
+    char n_GLX_RED_SIZE[13];
+    char n_GLX_GREEN_SIZE[15];
+    char n_GLX_BLUE_SIZE[14];
+    char n_GLX_ALPHA_SIZE[15];
+    char n_GLX_DEPTH_SIZE[15];
+    char n_GLX_STENCIL_SIZE[17];
+    char n_GLX_ACCUM_RED_SIZE[19];
+    char n_GLX_ACCUM_GREEN_SIZE[21];
+    char n_GLX_ACCUM_BLUE_SIZE[20];
+    char n_GLX_ACCUM_ALPHA_SIZE[21];
+    char n_GLX_CONFIG_CAVEAT[18];
+    char n_GLX_X_VISUAL_TYPE[18];
+    char n_GLX_TRANSPARENT_TYPE[21];
+    char n_GLX_TRANSPARENT_INDEX_VALUE[28];
+    char n_GLX_TRANSPARENT_RED_VALUE[26];
+    char n_GLX_TRANSPARENT_GREEN_VALUE[28];
+    char n_GLX_TRANSPARENT_BLUE_VALUE[27];
+    char n_GLX_TRANSPARENT_ALPHA_VALUE[28];
+    char n_GLX_STENCIL_BUFFER_BIT[23];
+    char n_GLX_HYPERPIPE_PIPE_NAME_LENGTH_SGIX[36];
+    char n_GLX_BAD_HYPERPIPE_CONFIG_SGIX[30];
+    char n_GLX_BAD_HYPERPIPE_SGIX[23];
+    char n_GLX_ACCUM_BUFFER_BIT[21];
+    char n_GLX_RGBA_FLOAT_ATI_BIT[23];
+    char n_GLX_GPU_VENDOR_AMD[19];
+    char n_GLX_GPU_RENDERER_STRING_AMD[28];
+    char n_GLX_GPU_OPENGL_VERSION_STRING_AMD[34];
+    char n_GLX_CONTEXT_MAJOR_VERSION_ARB[30];
+    char n_GLX_CONTEXT_MINOR_VERSION_ARB[30];
+    char n_GLX_CONTEXT_FLAGS_ARB[22];
+    char n_GLX_CONTEXT_ALLOW_BUFFER_BYTE_ORDER_MISMATCH_ARB[49];
+    char n_GLX_FLOAT_COMPONENTS_NV[24];
+    char n_GLX_RGBA_UNSIGNED_FLOAT_TYPE_EXT[33];
+    char n_GLX_FRAMEBUFFER_SRGB_CAPABLE_ARB[33];
+    char n_GLX_COLOR_SAMPLES_NV[21];
+    char n_GLX_RGBA_FLOAT_TYPE[20];
+    char n_GLX_VIDEO_OUT_COLOR_NV[23];
+    char n_GLX_VIDEO_OUT_ALPHA_NV[23];
+    char n_GLX_VIDEO_OUT_DEPTH_NV[23];
+    char n_GLX_VIDEO_OUT_COLOR_AND_ALPHA_NV[33];
+    char n_GLX_VIDEO_OUT_COLOR_AND_DEPTH_NV[33];
+    char n_GLX_VIDEO_OUT_FRAME_NV[23];
+    char n_GLX_VIDEO_OUT_FIELD_1_NV[25];
+    char n_GLX_VIDEO_OUT_FIELD_2_NV[25];
+    char n_GLX_VIDEO_OUT_STACKED_FIELDS_1_2_NV[36];
+    char n_GLX_VIDEO_OUT_STACKED_FIELDS_2_1_NV[36];
+    char n_GLX_DEVICE_ID_NV[17];
+    char n_GLX_UNIQUE_ID_NV[17];
+    char n_GLX_NUM_VIDEO_CAPTURE_SLOTS_NV[31];
+    char n_GLX_BIND_TO_TEXTURE_RGB_EXT[28];
+    char n_GLX_BIND_TO_TEXTURE_RGBA_EXT[29];
+    char n_GLX_BIND_TO_MIPMAP_TEXTURE_EXT[31];
+    char n_GLX_BIND_TO_TEXTURE_TARGETS_EXT[32];
+    char n_GLX_Y_INVERTED_EXT[19];
+    char n_GLX_TEXTURE_FORMAT_EXT[23];
+    char n_GLX_TEXTURE_TARGET_EXT[23];
+    char n_GLX_MIPMAP_TEXTURE_EXT[23];
+    char n_GLX_TEXTURE_FORMAT_NONE_EXT[28];
+    char n_GLX_TEXTURE_FORMAT_RGB_EXT[27];
+    char n_GLX_TEXTURE_FORMAT_RGBA_EXT[28];
+    char n_GLX_TEXTURE_1D_EXT[19];
+    char n_GLX_TEXTURE_2D_EXT[19];
+    char n_GLX_TEXTURE_RECTANGLE_EXT[26];
+    char n_GLX_FRONT_LEFT_EXT[19];
+    char n_GLX_FRONT_RIGHT_EXT[20];
+    char n_GLX_BACK_LEFT_EXT[18];
+    char n_GLX_BACK_RIGHT_EXT[19];
+    char n_GLX_AUX0_EXT[13];
+    char n_GLX_AUX1_EXT[13];
+    char n_GLX_AUX2_EXT[13];
+    char n_GLX_AUX3_EXT[13];
+    char n_GLX_AUX4_EXT[13];
+    char n_GLX_AUX5_EXT[13];
+    char n_GLX_AUX6_EXT[13];
+    char n_GLX_AUX7_EXT[13];
+    char n_GLX_AUX8_EXT[13];
+    char n_GLX_AUX9_EXT[13];
+    char n_GLX_NUM_VIDEO_SLOTS_NV[23];
+    char n_GLX_SWAP_INTERVAL_EXT[22];
+    char n_GLX_MAX_SWAP_INTERVAL_EXT[26];
+    char n_GLX_LATE_SWAPS_TEAR_EXT[24];
+    char n_GLX_GPU_FASTEST_TARGET_GPUS_AMD[32];
+    char n_GLX_GPU_RAM_AMD[16];
+    char n_GLX_GPU_CLOCK_AMD[18];
+    char n_GLX_GPU_NUM_PIPES_AMD[22];
+    char n_GLX_GPU_NUM_SIMD_AMD[21];
+    char n_GLX_GPU_NUM_RB_AMD[19];
+    char n_GLX_GPU_NUM_SPI_AMD[20];
+    char n_GLX_NONE[9];
+    char n_GLX_SLOW_CONFIG[16];
+    char n_GLX_TRUE_COLOR[15];
+    char n_GLX_DIRECT_COLOR[17];
+    char n_GLX_PSEUDO_COLOR[17];
+    char n_GLX_STATIC_COLOR[17];
+    char n_GLX_GRAY_SCALE[15];
+    char n_GLX_STATIC_GRAY[16];
+    char n_GLX_TRANSPARENT_RGB[20];
+    char n_GLX_TRANSPARENT_INDEX[22];
+    char n_GLX_SHARE_CONTEXT_EXT[22];
+    char n_GLX_VISUAL_ID[14];
+    char n_GLX_SCREEN[11];
+    char n_GLX_NON_CONFORMANT_CONFIG[26];
+    char n_GLX_DRAWABLE_TYPE[18];
+    char n_GLX_RENDER_TYPE[16];
+    char n_GLX_X_RENDERABLE[17];
+    char n_GLX_FBCONFIG_ID[16];
+    char n_GLX_RGBA_TYPE[14];
+    char n_GLX_COLOR_INDEX_TYPE[21];
+    char n_GLX_MAX_PBUFFER_WIDTH[22];
+    char n_GLX_MAX_PBUFFER_HEIGHT[23];
+    char n_GLX_MAX_PBUFFER_PIXELS[23];
+    char n_GLX_OPTIMAL_PBUFFER_WIDTH_SGIX[31];
+    char n_GLX_OPTIMAL_PBUFFER_HEIGHT_SGIX[32];
+    char n_GLX_PRESERVED_CONTENTS[23];
+    char n_GLX_LARGEST_PBUFFER[20];
+    char n_GLX_WIDTH[10];
+    char n_GLX_HEIGHT[11];
+    char n_GLX_EVENT_MASK[15];
+    char n_GLX_DAMAGED[12];
+    char n_GLX_SAVED[10];
+    char n_GLX_WINDOW[11];
+    char n_GLX_PBUFFER[12];
+    char n_GLX_BLENDED_RGBA_SGIS[22];
+    char n_GLX_MULTISAMPLE_SUB_RECT_WIDTH_SGIS[36];
+    char n_GLX_MULTISAMPLE_SUB_RECT_HEIGHT_SGIS[37];
+    char n_GLX_VISUAL_SELECT_GROUP_SGIX[29];
+    char n_GLX_HYPERPIPE_ID_SGIX[22];
+    char n_GLX_PBUFFER_HEIGHT[19];
+    char n_GLX_PBUFFER_WIDTH[18];
+    char n_GLX_SAMPLE_BUFFERS_3DFX[24];
+    char n_GLX_SAMPLES_3DFX[17];
+    char n_GLX_SWAP_METHOD_OML[20];
+    char n_GLX_SWAP_EXCHANGE_OML[22];
+    char n_GLX_SWAP_COPY_OML[18];
+    char n_GLX_SWAP_UNDEFINED_OML[23];
+    char n_GLX_VIDEO_RESIZE_SUN[21];
+    char n_GLX_EXCHANGE_COMPLETE_INTEL[28];
+    char n_GLX_COPY_COMPLETE_INTEL[24];
+    char n_GLX_FLIP_COMPLETE_INTEL[24];
+    char n_GLX_LOSE_CONTEXT_ON_RESET_ARB[30];
+    char n_GLX_CONTEXT_RESET_NOTIFICATION_STRATEGY_ARB[44];
+    char n_GLX_NO_RESET_NOTIFICATION_ARB[30];
+    char n_GL_VIDEO_RESIZE_COMPENSATION_SUN[33];
+    char n_GLX_CONTEXT_PROFILE_MASK_ARB[29];
+    char n_GLX_BIND_TO_TEXTURE_RGB_ATI[28];
+    char n_GLX_BIND_TO_TEXTURE_RGBA_ATI[29];
+    char n_GLX_TEXTURE_FORMAT_ATI[23];
+    char n_GLX_TEXTURE_TARGET_ATI[23];
+    char n_GLX_MIPMAP_TEXTURE_ATI[23];
+    char n_GLX_TEXTURE_RGB_ATI[20];
+    char n_GLX_TEXTURE_RGBA_ATI[21];
+    char n_GLX_NO_TEXTURE_ATI[19];
+    char n_GLX_TEXTURE_CUBE_MAP_ATI[25];
+    char n_GLX_TEXTURE_1D_ATI[19];
+    char n_GLX_TEXTURE_2D_ATI[19];
+    char n_GLX_MIPMAP_LEVEL_ATI[21];
+    char n_GLX_CUBE_MAP_FACE_ATI[22];
+    char n_GLX_TEXTURE_CUBE_MAP_POSITIVE_X_ATI[36];
+    char n_GLX_TEXTURE_CUBE_MAP_NEGATIVE_X_ATI[36];
+    char n_GLX_TEXTURE_CUBE_MAP_POSITIVE_Y_ATI[36];
+    char n_GLX_TEXTURE_CUBE_MAP_NEGATIVE_Y_ATI[36];
+    char n_GLX_TEXTURE_CUBE_MAP_POSITIVE_Z_ATI[36];
+    char n_GLX_TEXTURE_CUBE_MAP_NEGATIVE_Z_ATI[36];
+    char n_GLX_FRONT_LEFT_ATI[19];
+    char n_GLX_FRONT_RIGHT_ATI[20];
+    char n_GLX_BACK_LEFT_ATI[18];
+    char n_GLX_BACK_RIGHT_ATI[19];
+    char n_GLX_AUX0_ATI[13];
+    char n_GLX_AUX1_ATI[13];
+    char n_GLX_AUX2_ATI[13];
+    char n_GLX_AUX3_ATI[13];
+    char n_GLX_AUX4_ATI[13];
+    char n_GLX_AUX5_ATI[13];
+    char n_GLX_AUX6_ATI[13];
+    char n_GLX_AUX7_ATI[13];
+    char n_GLX_AUX8_ATI[13];
+    char n_GLX_AUX9_ATI[13];
+    char n_GLX_BIND_TO_TEXTURE_LUMINANCE_ATI[34];
+    char n_GLX_BIND_TO_TEXTURE_INTENSITY_ATI[34];
+    char n_GLX_SAMPLE_BUFFERS[19];
+    char n_GLX_SAMPLES[12];
+    char n_GLX_BUFFER_SWAP_COMPLETE_INTEL_MASK[36];
+    char n_GLX_PBUFFER_CLOBBER_MASK[25];
+    char n_GLX_DONT_CARE[14];
+  };
+
+  const GLXEnumPool glxEnumPool = {
+    "GLX_SYNC_FRAME_SGIX",
+    "GLX_3DFX_WINDOW_MODE_MESA",
+    "GLX_3DFX_FULLSCREEN_MODE_MESA",
+    "GLX_EXTENSIONS",
+    "GLX_BAD_VISUAL",
+    "GLX_BAD_CONTEXT",
+    "GLX_BAD_VALUE",
+    "GLX_AUX_BUFFERS",
+    "GLX_RED_SIZE",
+    "GLX_GREEN_SIZE",
+    "GLX_BLUE_SIZE",
+    "GLX_ALPHA_SIZE",
+    "GLX_DEPTH_SIZE",
+    "GLX_STENCIL_SIZE",
+    "GLX_ACCUM_RED_SIZE",
+    "GLX_ACCUM_GREEN_SIZE",
+    "GLX_ACCUM_BLUE_SIZE",
+    "GLX_ACCUM_ALPHA_SIZE",
+    "GLX_CONFIG_CAVEAT",
+    "GLX_X_VISUAL_TYPE",
+    "GLX_TRANSPARENT_TYPE",
+    "GLX_TRANSPARENT_INDEX_VALUE",
+    "GLX_TRANSPARENT_RED_VALUE",
+    "GLX_TRANSPARENT_GREEN_VALUE",
+    "GLX_TRANSPARENT_BLUE_VALUE",
+    "GLX_TRANSPARENT_ALPHA_VALUE",
+    "GLX_STENCIL_BUFFER_BIT",
+    "GLX_HYPERPIPE_PIPE_NAME_LENGTH_SGIX",
+    "GLX_BAD_HYPERPIPE_CONFIG_SGIX",
+    "GLX_BAD_HYPERPIPE_SGIX",
+    "GLX_ACCUM_BUFFER_BIT",
+    "GLX_RGBA_FLOAT_ATI_BIT",
+    "GLX_GPU_VENDOR_AMD",
+    "GLX_GPU_RENDERER_STRING_AMD",
+    "GLX_GPU_OPENGL_VERSION_STRING_AMD",
+    "GLX_CONTEXT_MAJOR_VERSION_ARB",
+    "GLX_CONTEXT_MINOR_VERSION_ARB",
+    "GLX_CONTEXT_FLAGS_ARB",
+    "GLX_CONTEXT_ALLOW_BUFFER_BYTE_ORDER_MISMATCH_ARB",
+    "GLX_FLOAT_COMPONENTS_NV",
+    "GLX_RGBA_UNSIGNED_FLOAT_TYPE_EXT",
+    "GLX_FRAMEBUFFER_SRGB_CAPABLE_ARB",
+    "GLX_COLOR_SAMPLES_NV",
+    "GLX_RGBA_FLOAT_TYPE",
+    "GLX_VIDEO_OUT_COLOR_NV",
+    "GLX_VIDEO_OUT_ALPHA_NV",
+    "GLX_VIDEO_OUT_DEPTH_NV",
+    "GLX_VIDEO_OUT_COLOR_AND_ALPHA_NV",
+    "GLX_VIDEO_OUT_COLOR_AND_DEPTH_NV",
+    "GLX_VIDEO_OUT_FRAME_NV",
+    "GLX_VIDEO_OUT_FIELD_1_NV",
+    "GLX_VIDEO_OUT_FIELD_2_NV",
+    "GLX_VIDEO_OUT_STACKED_FIELDS_1_2_NV",
+    "GLX_VIDEO_OUT_STACKED_FIELDS_2_1_NV",
+    "GLX_DEVICE_ID_NV",
+    "GLX_UNIQUE_ID_NV",
+    "GLX_NUM_VIDEO_CAPTURE_SLOTS_NV",
+    "GLX_BIND_TO_TEXTURE_RGB_EXT",
+    "GLX_BIND_TO_TEXTURE_RGBA_EXT",
+    "GLX_BIND_TO_MIPMAP_TEXTURE_EXT",
+    "GLX_BIND_TO_TEXTURE_TARGETS_EXT",
+    "GLX_Y_INVERTED_EXT",
+    "GLX_TEXTURE_FORMAT_EXT",
+    "GLX_TEXTURE_TARGET_EXT",
+    "GLX_MIPMAP_TEXTURE_EXT",
+    "GLX_TEXTURE_FORMAT_NONE_EXT",
+    "GLX_TEXTURE_FORMAT_RGB_EXT",
+    "GLX_TEXTURE_FORMAT_RGBA_EXT",
+    "GLX_TEXTURE_1D_EXT",
+    "GLX_TEXTURE_2D_EXT",
+    "GLX_TEXTURE_RECTANGLE_EXT",
+    "GLX_FRONT_LEFT_EXT",
+    "GLX_FRONT_RIGHT_EXT",
+    "GLX_BACK_LEFT_EXT",
+    "GLX_BACK_RIGHT_EXT",
+    "GLX_AUX0_EXT",
+    "GLX_AUX1_EXT",
+    "GLX_AUX2_EXT",
+    "GLX_AUX3_EXT",
+    "GLX_AUX4_EXT",
+    "GLX_AUX5_EXT",
+    "GLX_AUX6_EXT",
+    "GLX_AUX7_EXT",
+    "GLX_AUX8_EXT",
+    "GLX_AUX9_EXT",
+    "GLX_NUM_VIDEO_SLOTS_NV",
+    "GLX_SWAP_INTERVAL_EXT",
+    "GLX_MAX_SWAP_INTERVAL_EXT",
+    "GLX_LATE_SWAPS_TEAR_EXT",
+    "GLX_GPU_FASTEST_TARGET_GPUS_AMD",
+    "GLX_GPU_RAM_AMD",
+    "GLX_GPU_CLOCK_AMD",
+    "GLX_GPU_NUM_PIPES_AMD",
+    "GLX_GPU_NUM_SIMD_AMD",
+    "GLX_GPU_NUM_RB_AMD",
+    "GLX_GPU_NUM_SPI_AMD",
+    "GLX_NONE",
+    "GLX_SLOW_CONFIG",
+    "GLX_TRUE_COLOR",
+    "GLX_DIRECT_COLOR",
+    "GLX_PSEUDO_COLOR",
+    "GLX_STATIC_COLOR",
+    "GLX_GRAY_SCALE",
+    "GLX_STATIC_GRAY",
+    "GLX_TRANSPARENT_RGB",
+    "GLX_TRANSPARENT_INDEX",
+    "GLX_SHARE_CONTEXT_EXT",
+    "GLX_VISUAL_ID",
+    "GLX_SCREEN",
+    "GLX_NON_CONFORMANT_CONFIG",
+    "GLX_DRAWABLE_TYPE",
+    "GLX_RENDER_TYPE",
+    "GLX_X_RENDERABLE",
+    "GLX_FBCONFIG_ID",
+    "GLX_RGBA_TYPE",
+    "GLX_COLOR_INDEX_TYPE",
+    "GLX_MAX_PBUFFER_WIDTH",
+    "GLX_MAX_PBUFFER_HEIGHT",
+    "GLX_MAX_PBUFFER_PIXELS",
+    "GLX_OPTIMAL_PBUFFER_WIDTH_SGIX",
+    "GLX_OPTIMAL_PBUFFER_HEIGHT_SGIX",
+    "GLX_PRESERVED_CONTENTS",
+    "GLX_LARGEST_PBUFFER",
+    "GLX_WIDTH",
+    "GLX_HEIGHT",
+    "GLX_EVENT_MASK",
+    "GLX_DAMAGED",
+    "GLX_SAVED",
+    "GLX_WINDOW",
+    "GLX_PBUFFER",
+    "GLX_BLENDED_RGBA_SGIS",
+    "GLX_MULTISAMPLE_SUB_RECT_WIDTH_SGIS",
+    "GLX_MULTISAMPLE_SUB_RECT_HEIGHT_SGIS",
+    "GLX_VISUAL_SELECT_GROUP_SGIX",
+    "GLX_HYPERPIPE_ID_SGIX",
+    "GLX_PBUFFER_HEIGHT",
+    "GLX_PBUFFER_WIDTH",
+    "GLX_SAMPLE_BUFFERS_3DFX",
+    "GLX_SAMPLES_3DFX",
+    "GLX_SWAP_METHOD_OML",
+    "GLX_SWAP_EXCHANGE_OML",
+    "GLX_SWAP_COPY_OML",
+    "GLX_SWAP_UNDEFINED_OML",
+    "GLX_VIDEO_RESIZE_SUN",
+    "GLX_EXCHANGE_COMPLETE_INTEL",
+    "GLX_COPY_COMPLETE_INTEL",
+    "GLX_FLIP_COMPLETE_INTEL",
+    "GLX_LOSE_CONTEXT_ON_RESET_ARB",
+    "GLX_CONTEXT_RESET_NOTIFICATION_STRATEGY_ARB",
+    "GLX_NO_RESET_NOTIFICATION_ARB",
+    "GL_VIDEO_RESIZE_COMPENSATION_SUN",
+    "GLX_CONTEXT_PROFILE_MASK_ARB",
+    "GLX_BIND_TO_TEXTURE_RGB_ATI",
+    "GLX_BIND_TO_TEXTURE_RGBA_ATI",
+    "GLX_TEXTURE_FORMAT_ATI",
+    "GLX_TEXTURE_TARGET_ATI",
+    "GLX_MIPMAP_TEXTURE_ATI",
+    "GLX_TEXTURE_RGB_ATI",
+    "GLX_TEXTURE_RGBA_ATI",
+    "GLX_NO_TEXTURE_ATI",
+    "GLX_TEXTURE_CUBE_MAP_ATI",
+    "GLX_TEXTURE_1D_ATI",
+    "GLX_TEXTURE_2D_ATI",
+    "GLX_MIPMAP_LEVEL_ATI",
+    "GLX_CUBE_MAP_FACE_ATI",
+    "GLX_TEXTURE_CUBE_MAP_POSITIVE_X_ATI",
+    "GLX_TEXTURE_CUBE_MAP_NEGATIVE_X_ATI",
+    "GLX_TEXTURE_CUBE_MAP_POSITIVE_Y_ATI",
+    "GLX_TEXTURE_CUBE_MAP_NEGATIVE_Y_ATI",
+    "GLX_TEXTURE_CUBE_MAP_POSITIVE_Z_ATI",
+    "GLX_TEXTURE_CUBE_MAP_NEGATIVE_Z_ATI",
+    "GLX_FRONT_LEFT_ATI",
+    "GLX_FRONT_RIGHT_ATI",
+    "GLX_BACK_LEFT_ATI",
+    "GLX_BACK_RIGHT_ATI",
+    "GLX_AUX0_ATI",
+    "GLX_AUX1_ATI",
+    "GLX_AUX2_ATI",
+    "GLX_AUX3_ATI",
+    "GLX_AUX4_ATI",
+    "GLX_AUX5_ATI",
+    "GLX_AUX6_ATI",
+    "GLX_AUX7_ATI",
+    "GLX_AUX8_ATI",
+    "GLX_AUX9_ATI",
+    "GLX_BIND_TO_TEXTURE_LUMINANCE_ATI",
+    "GLX_BIND_TO_TEXTURE_INTENSITY_ATI",
+    "GLX_SAMPLE_BUFFERS",
+    "GLX_SAMPLES",
+    "GLX_BUFFER_SWAP_COMPLETE_INTEL_MASK",
+    "GLX_PBUFFER_CLOBBER_MASK",
+    "GLX_DONT_CARE"
+  };
+
+  const GLuint glxEnumValue[192] = {
+    0x00000000, 0x00000001, 0x00000002, 0x00000003, 0x00000004, 0x00000005, 0x00000006, 0x00000007,
+    0x00000008, 0x00000009, 0x0000000a, 0x0000000b, 0x0000000c, 0x0000000d, 0x0000000e, 0x0000000f,
+    0x00000010, 0x00000011, 0x00000020, 0x00000022, 0x00000023, 0x00000024, 0x00000025, 0x00000026,
+    0x00000027, 0x00000028, 0x00000040, 0x00000050, 0x0000005b, 0x0000005c, 0x00000080, 0x00000100,
+    0x00001f00, 0x00001f01, 0x00001f02, 0x00002091, 0x00002092, 0x00002094, 0x00002095, 0x000020b0,
+    0x000020b1, 0x000020b2, 0x000020b3, 0x000020b9, 0x000020c3, 0x000020c4, 0x000020c5, 0x000020c6,
+    0x000020c7, 0x000020c8, 0x000020c9, 0x000020ca, 0x000020cb, 0x000020cc, 0x000020cd, 0x000020ce,
+    0x000020cf, 0x000020d0, 0x000020d1, 0x000020d2, 0x000020d3, 0x000020d4, 0x000020d5, 0x000020d6,
+    0x000020d7, 0x000020d8, 0x000020d9, 0x000020da, 0x000020db, 0x000020dc, 0x000020dd, 0x000020de,
+    0x000020df, 0x000020e0, 0x000020e1, 0x000020e2, 0x000020e3, 0x000020e4, 0x000020e5, 0x000020e6,
+    0x000020e7, 0x000020e8, 0x000020e9, 0x000020ea, 0x000020eb, 0x000020f0, 0x000020f1, 0x000020f2,
+    0x000020f3, 0x000021a2, 0x000021a3, 0x000021a4, 0x000021a5, 0x000021a6, 0x000021a7, 0x000021a8,
+    0x00008000, 0x00008001, 0x00008002, 0x00008003, 0x00008004, 0x00008005, 0x00008006, 0x00008007,
+    0x00008008, 0x00008009, 0x0000800a, 0x0000800b, 0x0000800c, 0x0000800d, 0x00008010, 0x00008011,
+    0x00008012, 0x00008013, 0x00008014, 0x00008015, 0x00008016, 0x00008017, 0x00008018, 0x00008019,
+    0x0000801a, 0x0000801b, 0x0000801c, 0x0000801d, 0x0000801e, 0x0000801f, 0x00008020, 0x00008021,
+    0x00008022, 0x00008023, 0x00008025, 0x00008026, 0x00008027, 0x00008028, 0x00008030, 0x00008040,
+    0x00008041, 0x00008050, 0x00008051, 0x00008060, 0x00008061, 0x00008062, 0x00008063, 0x00008171,
+    0x00008180, 0x00008181, 0x00008182, 0x00008252, 0x00008256, 0x00008261, 0x000085cd, 0x00009126,
+    0x00009800, 0x00009801, 0x00009802, 0x00009803, 0x00009804, 0x00009805, 0x00009806, 0x00009807,
+    0x00009808, 0x00009809, 0x0000980a, 0x0000980b, 0x0000980c, 0x0000980d, 0x0000980e, 0x0000980f,
+    0x00009810, 0x00009811, 0x00009812, 0x00009813, 0x00009814, 0x00009815, 0x00009816, 0x00009817,
+    0x00009818, 0x00009819, 0x0000981a, 0x0000981b, 0x0000981c, 0x0000981d, 0x0000981e, 0x0000981f,
+    0x00009820, 0x00009821, 0x00009822, 0x000186a0, 0x000186a1, 0x04000000, 0x08000000, 0xffffffff
+  };
+
+  const unsigned int glxEnumName[192] = {
+    offsetof(GLXEnumPool,n_GLX_SYNC_FRAME_SGIX),
+    offsetof(GLXEnumPool,n_GLX_3DFX_WINDOW_MODE_MESA),
+    offsetof(GLXEnumPool,n_GLX_3DFX_FULLSCREEN_MODE_MESA),
+    offsetof(GLXEnumPool,n_GLX_EXTENSIONS),
+    offsetof(GLXEnumPool,n_GLX_BAD_VISUAL),
+    offsetof(GLXEnumPool,n_GLX_BAD_CONTEXT),
+    offsetof(GLXEnumPool,n_GLX_BAD_VALUE),
+    offsetof(GLXEnumPool,n_GLX_AUX_BUFFERS),
+    offsetof(GLXEnumPool,n_GLX_RED_SIZE),
+    offsetof(GLXEnumPool,n_GLX_GREEN_SIZE),
+    offsetof(GLXEnumPool,n_GLX_BLUE_SIZE),
+    offsetof(GLXEnumPool,n_GLX_ALPHA_SIZE),
+    offsetof(GLXEnumPool,n_GLX_DEPTH_SIZE),
+    offsetof(GLXEnumPool,n_GLX_STENCIL_SIZE),
+    offsetof(GLXEnumPool,n_GLX_ACCUM_RED_SIZE),
+    offsetof(GLXEnumPool,n_GLX_ACCUM_GREEN_SIZE),
+    offsetof(GLXEnumPool,n_GLX_ACCUM_BLUE_SIZE),
+    offsetof(GLXEnumPool,n_GLX_ACCUM_ALPHA_SIZE),
+    offsetof(GLXEnumPool,n_GLX_CONFIG_CAVEAT),
+    offsetof(GLXEnumPool,n_GLX_X_VISUAL_TYPE),
+    offsetof(GLXEnumPool,n_GLX_TRANSPARENT_TYPE),
+    offsetof(GLXEnumPool,n_GLX_TRANSPARENT_INDEX_VALUE),
+    offsetof(GLXEnumPool,n_GLX_TRANSPARENT_RED_VALUE),
+    offsetof(GLXEnumPool,n_GLX_TRANSPARENT_GREEN_VALUE),
+    offsetof(GLXEnumPool,n_GLX_TRANSPARENT_BLUE_VALUE),
+    offsetof(GLXEnumPool,n_GLX_TRANSPARENT_ALPHA_VALUE),
+    offsetof(GLXEnumPool,n_GLX_STENCIL_BUFFER_BIT),
+    offsetof(GLXEnumPool,n_GLX_HYPERPIPE_PIPE_NAME_LENGTH_SGIX),
+    offsetof(GLXEnumPool,n_GLX_BAD_HYPERPIPE_CONFIG_SGIX),
+    offsetof(GLXEnumPool,n_GLX_BAD_HYPERPIPE_SGIX),
+    offsetof(GLXEnumPool,n_GLX_ACCUM_BUFFER_BIT),
+    offsetof(GLXEnumPool,n_GLX_RGBA_FLOAT_ATI_BIT),
+    offsetof(GLXEnumPool,n_GLX_GPU_VENDOR_AMD),
+    offsetof(GLXEnumPool,n_GLX_GPU_RENDERER_STRING_AMD),
+    offsetof(GLXEnumPool,n_GLX_GPU_OPENGL_VERSION_STRING_AMD),
+    offsetof(GLXEnumPool,n_GLX_CONTEXT_MAJOR_VERSION_ARB),
+    offsetof(GLXEnumPool,n_GLX_CONTEXT_MINOR_VERSION_ARB),
+    offsetof(GLXEnumPool,n_GLX_CONTEXT_FLAGS_ARB),
+    offsetof(GLXEnumPool,n_GLX_CONTEXT_ALLOW_BUFFER_BYTE_ORDER_MISMATCH_ARB),
+    offsetof(GLXEnumPool,n_GLX_FLOAT_COMPONENTS_NV),
+    offsetof(GLXEnumPool,n_GLX_RGBA_UNSIGNED_FLOAT_TYPE_EXT),
+    offsetof(GLXEnumPool,n_GLX_FRAMEBUFFER_SRGB_CAPABLE_ARB),
+    offsetof(GLXEnumPool,n_GLX_COLOR_SAMPLES_NV),
+    offsetof(GLXEnumPool,n_GLX_RGBA_FLOAT_TYPE),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_OUT_COLOR_NV),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_OUT_ALPHA_NV),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_OUT_DEPTH_NV),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_OUT_COLOR_AND_ALPHA_NV),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_OUT_COLOR_AND_DEPTH_NV),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_OUT_FRAME_NV),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_OUT_FIELD_1_NV),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_OUT_FIELD_2_NV),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_OUT_STACKED_FIELDS_1_2_NV),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_OUT_STACKED_FIELDS_2_1_NV),
+    offsetof(GLXEnumPool,n_GLX_DEVICE_ID_NV),
+    offsetof(GLXEnumPool,n_GLX_UNIQUE_ID_NV),
+    offsetof(GLXEnumPool,n_GLX_NUM_VIDEO_CAPTURE_SLOTS_NV),
+    offsetof(GLXEnumPool,n_GLX_BIND_TO_TEXTURE_RGB_EXT),
+    offsetof(GLXEnumPool,n_GLX_BIND_TO_TEXTURE_RGBA_EXT),
+    offsetof(GLXEnumPool,n_GLX_BIND_TO_MIPMAP_TEXTURE_EXT),
+    offsetof(GLXEnumPool,n_GLX_BIND_TO_TEXTURE_TARGETS_EXT),
+    offsetof(GLXEnumPool,n_GLX_Y_INVERTED_EXT),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_FORMAT_EXT),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_TARGET_EXT),
+    offsetof(GLXEnumPool,n_GLX_MIPMAP_TEXTURE_EXT),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_FORMAT_NONE_EXT),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_FORMAT_RGB_EXT),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_FORMAT_RGBA_EXT),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_1D_EXT),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_2D_EXT),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_RECTANGLE_EXT),
+    offsetof(GLXEnumPool,n_GLX_FRONT_LEFT_EXT),
+    offsetof(GLXEnumPool,n_GLX_FRONT_RIGHT_EXT),
+    offsetof(GLXEnumPool,n_GLX_BACK_LEFT_EXT),
+    offsetof(GLXEnumPool,n_GLX_BACK_RIGHT_EXT),
+    offsetof(GLXEnumPool,n_GLX_AUX0_EXT),
+    offsetof(GLXEnumPool,n_GLX_AUX1_EXT),
+    offsetof(GLXEnumPool,n_GLX_AUX2_EXT),
+    offsetof(GLXEnumPool,n_GLX_AUX3_EXT),
+    offsetof(GLXEnumPool,n_GLX_AUX4_EXT),
+    offsetof(GLXEnumPool,n_GLX_AUX5_EXT),
+    offsetof(GLXEnumPool,n_GLX_AUX6_EXT),
+    offsetof(GLXEnumPool,n_GLX_AUX7_EXT),
+    offsetof(GLXEnumPool,n_GLX_AUX8_EXT),
+    offsetof(GLXEnumPool,n_GLX_AUX9_EXT),
+    offsetof(GLXEnumPool,n_GLX_NUM_VIDEO_SLOTS_NV),
+    offsetof(GLXEnumPool,n_GLX_SWAP_INTERVAL_EXT),
+    offsetof(GLXEnumPool,n_GLX_MAX_SWAP_INTERVAL_EXT),
+    offsetof(GLXEnumPool,n_GLX_LATE_SWAPS_TEAR_EXT),
+    offsetof(GLXEnumPool,n_GLX_GPU_FASTEST_TARGET_GPUS_AMD),
+    offsetof(GLXEnumPool,n_GLX_GPU_RAM_AMD),
+    offsetof(GLXEnumPool,n_GLX_GPU_CLOCK_AMD),
+    offsetof(GLXEnumPool,n_GLX_GPU_NUM_PIPES_AMD),
+    offsetof(GLXEnumPool,n_GLX_GPU_NUM_SIMD_AMD),
+    offsetof(GLXEnumPool,n_GLX_GPU_NUM_RB_AMD),
+    offsetof(GLXEnumPool,n_GLX_GPU_NUM_SPI_AMD),
+    offsetof(GLXEnumPool,n_GLX_NONE),
+    offsetof(GLXEnumPool,n_GLX_SLOW_CONFIG),
+    offsetof(GLXEnumPool,n_GLX_TRUE_COLOR),
+    offsetof(GLXEnumPool,n_GLX_DIRECT_COLOR),
+    offsetof(GLXEnumPool,n_GLX_PSEUDO_COLOR),
+    offsetof(GLXEnumPool,n_GLX_STATIC_COLOR),
+    offsetof(GLXEnumPool,n_GLX_GRAY_SCALE),
+    offsetof(GLXEnumPool,n_GLX_STATIC_GRAY),
+    offsetof(GLXEnumPool,n_GLX_TRANSPARENT_RGB),
+    offsetof(GLXEnumPool,n_GLX_TRANSPARENT_INDEX),
+    offsetof(GLXEnumPool,n_GLX_SHARE_CONTEXT_EXT),
+    offsetof(GLXEnumPool,n_GLX_VISUAL_ID),
+    offsetof(GLXEnumPool,n_GLX_SCREEN),
+    offsetof(GLXEnumPool,n_GLX_NON_CONFORMANT_CONFIG),
+    offsetof(GLXEnumPool,n_GLX_DRAWABLE_TYPE),
+    offsetof(GLXEnumPool,n_GLX_RENDER_TYPE),
+    offsetof(GLXEnumPool,n_GLX_X_RENDERABLE),
+    offsetof(GLXEnumPool,n_GLX_FBCONFIG_ID),
+    offsetof(GLXEnumPool,n_GLX_RGBA_TYPE),
+    offsetof(GLXEnumPool,n_GLX_COLOR_INDEX_TYPE),
+    offsetof(GLXEnumPool,n_GLX_MAX_PBUFFER_WIDTH),
+    offsetof(GLXEnumPool,n_GLX_MAX_PBUFFER_HEIGHT),
+    offsetof(GLXEnumPool,n_GLX_MAX_PBUFFER_PIXELS),
+    offsetof(GLXEnumPool,n_GLX_OPTIMAL_PBUFFER_WIDTH_SGIX),
+    offsetof(GLXEnumPool,n_GLX_OPTIMAL_PBUFFER_HEIGHT_SGIX),
+    offsetof(GLXEnumPool,n_GLX_PRESERVED_CONTENTS),
+    offsetof(GLXEnumPool,n_GLX_LARGEST_PBUFFER),
+    offsetof(GLXEnumPool,n_GLX_WIDTH),
+    offsetof(GLXEnumPool,n_GLX_HEIGHT),
+    offsetof(GLXEnumPool,n_GLX_EVENT_MASK),
+    offsetof(GLXEnumPool,n_GLX_DAMAGED),
+    offsetof(GLXEnumPool,n_GLX_SAVED),
+    offsetof(GLXEnumPool,n_GLX_WINDOW),
+    offsetof(GLXEnumPool,n_GLX_PBUFFER),
+    offsetof(GLXEnumPool,n_GLX_BLENDED_RGBA_SGIS),
+    offsetof(GLXEnumPool,n_GLX_MULTISAMPLE_SUB_RECT_WIDTH_SGIS),
+    offsetof(GLXEnumPool,n_GLX_MULTISAMPLE_SUB_RECT_HEIGHT_SGIS),
+    offsetof(GLXEnumPool,n_GLX_VISUAL_SELECT_GROUP_SGIX),
+    offsetof(GLXEnumPool,n_GLX_HYPERPIPE_ID_SGIX),
+    offsetof(GLXEnumPool,n_GLX_PBUFFER_HEIGHT),
+    offsetof(GLXEnumPool,n_GLX_PBUFFER_WIDTH),
+    offsetof(GLXEnumPool,n_GLX_SAMPLE_BUFFERS_3DFX),
+    offsetof(GLXEnumPool,n_GLX_SAMPLES_3DFX),
+    offsetof(GLXEnumPool,n_GLX_SWAP_METHOD_OML),
+    offsetof(GLXEnumPool,n_GLX_SWAP_EXCHANGE_OML),
+    offsetof(GLXEnumPool,n_GLX_SWAP_COPY_OML),
+    offsetof(GLXEnumPool,n_GLX_SWAP_UNDEFINED_OML),
+    offsetof(GLXEnumPool,n_GLX_VIDEO_RESIZE_SUN),
+    offsetof(GLXEnumPool,n_GLX_EXCHANGE_COMPLETE_INTEL),
+    offsetof(GLXEnumPool,n_GLX_COPY_COMPLETE_INTEL),
+    offsetof(GLXEnumPool,n_GLX_FLIP_COMPLETE_INTEL),
+    offsetof(GLXEnumPool,n_GLX_LOSE_CONTEXT_ON_RESET_ARB),
+    offsetof(GLXEnumPool,n_GLX_CONTEXT_RESET_NOTIFICATION_STRATEGY_ARB),
+    offsetof(GLXEnumPool,n_GLX_NO_RESET_NOTIFICATION_ARB),
+    offsetof(GLXEnumPool,n_GL_VIDEO_RESIZE_COMPENSATION_SUN),
+    offsetof(GLXEnumPool,n_GLX_CONTEXT_PROFILE_MASK_ARB),
+    offsetof(GLXEnumPool,n_GLX_BIND_TO_TEXTURE_RGB_ATI),
+    offsetof(GLXEnumPool,n_GLX_BIND_TO_TEXTURE_RGBA_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_FORMAT_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_TARGET_ATI),
+    offsetof(GLXEnumPool,n_GLX_MIPMAP_TEXTURE_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_RGB_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_RGBA_ATI),
+    offsetof(GLXEnumPool,n_GLX_NO_TEXTURE_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_CUBE_MAP_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_1D_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_2D_ATI),
+    offsetof(GLXEnumPool,n_GLX_MIPMAP_LEVEL_ATI),
+    offsetof(GLXEnumPool,n_GLX_CUBE_MAP_FACE_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_CUBE_MAP_POSITIVE_X_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_CUBE_MAP_NEGATIVE_X_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_CUBE_MAP_POSITIVE_Y_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_CUBE_MAP_NEGATIVE_Y_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_CUBE_MAP_POSITIVE_Z_ATI),
+    offsetof(GLXEnumPool,n_GLX_TEXTURE_CUBE_MAP_NEGATIVE_Z_ATI),
+    offsetof(GLXEnumPool,n_GLX_FRONT_LEFT_ATI),
+    offsetof(GLXEnumPool,n_GLX_FRONT_RIGHT_ATI),
+    offsetof(GLXEnumPool,n_GLX_BACK_LEFT_ATI),
+    offsetof(GLXEnumPool,n_GLX_BACK_RIGHT_ATI),
+    offsetof(GLXEnumPool,n_GLX_AUX0_ATI),
+    offsetof(GLXEnumPool,n_GLX_AUX1_ATI),
+    offsetof(GLXEnumPool,n_GLX_AUX2_ATI),
+    offsetof(GLXEnumPool,n_GLX_AUX3_ATI),
+    offsetof(GLXEnumPool,n_GLX_AUX4_ATI),
+    offsetof(GLXEnumPool,n_GLX_AUX5_ATI),
+    offsetof(GLXEnumPool,n_GLX_AUX6_ATI),
+    offsetof(GLXEnumPool,n_GLX_AUX7_ATI),
+    offsetof(GLXEnumPool,n_GLX_AUX8_ATI),
+    offsetof(GLXEnumPool,n_GLX_AUX9_ATI),
+    offsetof(GLXEnumPool,n_GLX_BIND_TO_TEXTURE_LUMINANCE_ATI),
+    offsetof(GLXEnumPool,n_GLX_BIND_TO_TEXTURE_INTENSITY_ATI),
+    offsetof(GLXEnumPool,n_GLX_SAMPLE_BUFFERS),
+    offsetof(GLXEnumPool,n_GLX_SAMPLES),
+    offsetof(GLXEnumPool,n_GLX_BUFFER_SWAP_COMPLETE_INTEL_MASK),
+    offsetof(GLXEnumPool,n_GLX_PBUFFER_CLOBBER_MASK),
+    offsetof(GLXEnumPool,n_GLX_DONT_CARE)
+  };
+
+  const short glxEnumSeed[192] = {
+    1, -4, -10, 0, -11, -13, -17, 0, -19, -22, 0, -27, -28, -31, 1, 0,
+    -32, -36, 0, -37, -38, 0, 3, 4, -39, -41, 0, 0, 1, 6, 0, 0,
+    0, 0, 1, 0, 0, 0, -42, -45, 0, 3, -48, -49, -50, -53, -56, -59,
+    0, 0, 0, 7, 0, -61, -64, 0, 0, 0, 0, 0, 0, 0, -65, 3,
+    0, 1, 0, -67, 0, -68, 0, 0, 4, -69, -70, -71, 0, -76, 0, 1,
+    0, 0, 1, 4, -79, 5, -80, 12, -81, 1, 3, -82, -88, 1, 0, -89,
+    -93, 0, 0, -95, 0, 0, 7, 0, 39, 4, 9, 0, -96, -98, -99, -102,
+    -104, 10, 1, -106, -116, -118, 0, 0, 17, 0, -128, 0, 6, -130, 1, 0,
+    2, 0, 4, 1, -134, 0, 2, -136, 0, -137, -144, -145, 5, 0, -146, -147,
+    0, 0, 0, -148, -149, 0, 0, 0, 1, 0, 0, 0, -150, 0, 6, 2,
+    22, 4, 0, 17, 1, -154, -156, 1, 0, 0, -158, 11, -159, 0, -167, 1,
+    0, -170, 0, 48, 13, 8, -177, -179, 0, 13, 3, -183, -190, 0, 0, -191
+  };
+
+  const unsigned short glxEnumSlot[192] = {
+    121, 38, 63, 149, 182, 95, 142, 83, 129, 48, 181, 171, 59, 110, 54, 106,
+    139, 23, 130, 2, 108, 34, 187, 69, 100, 163, 173, 140, 105, 133, 112, 184,
+    141, 150, 85, 22, 7, 109, 101, 155, 178, 14, 11, 147, 166, 74, 89, 6,
+    45, 123, 35, 114, 75, 70, 52, 93, 87, 46, 151, 25, 66, 5, 96, 185,
+    97, 57, 42, 49, 67, 9, 79, 107, 86, 68, 12, 161, 190, 167, 81, 164,
+    148, 62, 156, 29, 36, 111, 165, 19, 146, 120, 170, 61, 73, 92, 157, 176,
+    82, 99, 17, 160, 33, 143, 71, 40, 172, 80, 113, 168, 177, 115, 16, 32,
+    41, 94, 104, 55, 56, 122, 27, 31, 162, 28, 78, 174, 183, 51, 138, 77,
+    117, 50, 175, 39, 21, 24, 0, 191, 153, 152, 124, 102, 189, 26, 136, 119,
+    103, 180, 18, 118, 76, 65, 90, 134, 58, 98, 8, 20, 72, 64, 13, 53,
+    4, 84, 44, 60, 91, 186, 127, 137, 88, 169, 47, 159, 15, 43, 126, 158,
+    135, 179, 145, 10, 154, 1, 132, 144, 128, 3, 37, 131, 188, 30, 125, 116
+  };
+
+  #endif // REGAL_ENUM_TO_STRING
+
   const char * GLXenumToString(int v) {
     #if REGAL_ENUM_TO_STRING
-    switch( v ) {
-      case 0x00000000: return "GLX_SYNC_FRAME_SGIX";
-      case 0x00000001: return "GLX_3DFX_WINDOW_MODE_MESA";
-      case 0x00000002: return "GLX_3DFX_FULLSCREEN_MODE_MESA";
-      case 0x00000003: return "GLX_EXTENSIONS";
-      case 0x00000004: return "GLX_BAD_VISUAL";
-      case 0x00000005: return "GLX_BAD_CONTEXT";
-      case 0x00000006: return "GLX_BAD_VALUE";
-      case 0x00000007: return "GLX_AUX_BUFFERS";
-      case 0x00000008: return "GLX_RED_SIZE";
-      case 0x00000009: return "GLX_GREEN_SIZE";
-      case 0x0000000a: return "GLX_BLUE_SIZE";
-      case 0x0000000b: return "GLX_ALPHA_SIZE";
-      case 0x0000000c: return "GLX_DEPTH_SIZE";
-      case 0x0000000d: return "GLX_STENCIL_SIZE";
-      case 0x0000000e: return "GLX_ACCUM_RED_SIZE";
-      case 0x0000000f: return "GLX_ACCUM_GREEN_SIZE";
-      case 0x00000010: return "GLX_ACCUM_BLUE_SIZE";
-      case 0x00000011: return "GLX_ACCUM_ALPHA_SIZE";
-      case 0x00000020: return "GLX_CONFIG_CAVEAT";
-      case 0x00000022: return "GLX_X_VISUAL_TYPE";
-      case 0x00000023: return "GLX_TRANSPARENT_TYPE";
-      case 0x00000024: return "GLX_TRANSPARENT_INDEX_VALUE";
-      case 0x00000025: return "GLX_TRANSPARENT_RED_VALUE";
-      case 0x00000026: return "GLX_TRANSPARENT_GREEN_VALUE";
-      case 0x00000027: return "GLX_TRANSPARENT_BLUE_VALUE";
-      case 0x00000028: return "GLX_TRANSPARENT_ALPHA_VALUE";
-      case 0x00000040: return "GLX_STENCIL_BUFFER_BIT";
-      case 0x00000050: return "GLX_HYPERPIPE_PIPE_NAME_LENGTH_SGIX";
-      case 0x0000005b: return "GLX_BAD_HYPERPIPE_CONFIG_SGIX";
-      case 0x0000005c: return "GLX_BAD_HYPERPIPE_SGIX";
-      case 0x00000080: return "GLX_ACCUM_BUFFER_BIT";
-      case 0x00000100: return "GLX_RGBA_FLOAT_ATI_BIT";
-      case 0x00001f00: return "GLX_GPU_VENDOR_AMD";
-      case 0x00001f01: return "GLX_GPU_RENDERER_STRING_AMD";
-      case 0x00001f02: return "GLX_GPU_OPENGL_VERSION_STRING_AMD";
-      case 0x00002091: return "GLX_CONTEXT_MAJOR_VERSION_ARB";
-      case 0x00002092: return "GLX_CONTEXT_MINOR_VERSION_ARB";
-      case 0x00002094: return "GLX_CONTEXT_FLAGS_ARB";
-      case 0x00002095: return "GLX_CONTEXT_ALLOW_BUFFER_BYTE_ORDER_MISMATCH_ARB";
-      case 0x000020b0: return "GLX_FLOAT_COMPONENTS_NV";
-      case 0x000020b1: return "GLX_RGBA_UNSIGNED_FLOAT_TYPE_EXT";
-      case 0x000020b2: return "GLX_FRAMEBUFFER_SRGB_CAPABLE_ARB";
-      case 0x000020b3: return "GLX_COLOR_SAMPLES_NV";
-      case 0x000020b9: return "GLX_RGBA_FLOAT_TYPE";
-      case 0x000020c3: return "GLX_VIDEO_OUT_COLOR_NV";
-      case 0x000020c4: return "GLX_VIDEO_OUT_ALPHA_NV";
-      case 0x000020c5: return "GLX_VIDEO_OUT_DEPTH_NV";
-      case 0x000020c6: return "GLX_VIDEO_OUT_COLOR_AND_ALPHA_NV";
-      case 0x000020c7: return "GLX_VIDEO_OUT_COLOR_AND_DEPTH_NV";
-      case 0x000020c8: return "GLX_VIDEO_OUT_FRAME_NV";
-      case 0x000020c9: return "GLX_VIDEO_OUT_FIELD_1_NV";
-      case 0x000020ca: return "GLX_VIDEO_OUT_FIELD_2_NV";
-      case 0x000020cb: return "GLX_VIDEO_OUT_STACKED_FIELDS_1_2_NV";
-      case 0x000020cc: return "GLX_VIDEO_OUT_STACKED_FIELDS_2_1_NV";
-      case 0x000020cd: return "GLX_DEVICE_ID_NV";
-      case 0x000020ce: return "GLX_UNIQUE_ID_NV";
-      case 0x000020cf: return "GLX_NUM_VIDEO_CAPTURE_SLOTS_NV";
-      case 0x000020d0: return "GLX_BIND_TO_TEXTURE_RGB_EXT";
-      case 0x000020d1: return "GLX_BIND_TO_TEXTURE_RGBA_EXT";
-      case 0x000020d2: return "GLX_BIND_TO_MIPMAP_TEXTURE_EXT";
-      case 0x000020d3: return "GLX_BIND_TO_TEXTURE_TARGETS_EXT";
-      case 0x000020d4: return "GLX_Y_INVERTED_EXT";
-      case 0x000020d5: return "GLX_TEXTURE_FORMAT_EXT";
-      case 0x000020d6: return "GLX_TEXTURE_TARGET_EXT";
-      case 0x000020d7: return "GLX_MIPMAP_TEXTURE_EXT";
-      case 0x000020d8: return "GLX_TEXTURE_FORMAT_NONE_EXT";
-      case 0x000020d9: return "GLX_TEXTURE_FORMAT_RGB_EXT";
-      case 0x000020da: return "GLX_TEXTURE_FORMAT_RGBA_EXT";
-      case 0x000020db: return "GLX_TEXTURE_1D_EXT";
-      case 0x000020dc: return "GLX_TEXTURE_2D_EXT";
-      case 0x000020dd: return "GLX_TEXTURE_RECTANGLE_EXT";
-      case 0x000020de: return "GLX_FRONT_LEFT_EXT";
-      case 0x000020df: return "GLX_FRONT_RIGHT_EXT";
-      case 0x000020e0: return "GLX_BACK_LEFT_EXT";
-      case 0x000020e1: return "GLX_BACK_RIGHT_EXT";
-      case 0x000020e2: return "GLX_AUX0_EXT";
-      case 0x000020e3: return "GLX_AUX1_EXT";
-      case 0x000020e4: return "GLX_AUX2_EXT";
-      case 0x000020e5: return "GLX_AUX3_EXT";
-      case 0x000020e6: return "GLX_AUX4_EXT";
-      case 0x000020e7: return "GLX_AUX5_EXT";
-      case 0x000020e8: return "GLX_AUX6_EXT";
-      case 0x000020e9: return "GLX_AUX7_EXT";
-      case 0x000020ea: return "GLX_AUX8_EXT";
-      case 0x000020eb: return "GLX_AUX9_EXT";
-      case 0x000020f0: return "GLX_NUM_VIDEO_SLOTS_NV";
-      case 0x000020f1: return "GLX_SWAP_INTERVAL_EXT";
-      case 0x000020f2: return "GLX_MAX_SWAP_INTERVAL_EXT";
-      case 0x000020f3: return "GLX_LATE_SWAPS_TEAR_EXT";
-      case 0x000021a2: return "GLX_GPU_FASTEST_TARGET_GPUS_AMD";
-      case 0x000021a3: return "GLX_GPU_RAM_AMD";
-      case 0x000021a4: return "GLX_GPU_CLOCK_AMD";
-      case 0x000021a5: return "GLX_GPU_NUM_PIPES_AMD";
-      case 0x000021a6: return "GLX_GPU_NUM_SIMD_AMD";
-      case 0x000021a7: return "GLX_GPU_NUM_RB_AMD";
-      case 0x000021a8: return "GLX_GPU_NUM_SPI_AMD";
-      case 0x00008000: return "GLX_NONE";
-      case 0x00008001: return "GLX_SLOW_CONFIG";
-      case 0x00008002: return "GLX_TRUE_COLOR";
-      case 0x00008003: return "GLX_DIRECT_COLOR";
-      case 0x00008004: return "GLX_PSEUDO_COLOR";
-      case 0x00008005: return "GLX_STATIC_COLOR";
-      case 0x00008006: return "GLX_GRAY_SCALE";
-      case 0x00008007: return "GLX_STATIC_GRAY";
-      case 0x00008008: return "GLX_TRANSPARENT_RGB";
-      case 0x00008009: return "GLX_TRANSPARENT_INDEX";
-      case 0x0000800a: return "GLX_SHARE_CONTEXT_EXT";
-      case 0x0000800b: return "GLX_VISUAL_ID";
-      case 0x0000800c: return "GLX_SCREEN";
-      case 0x0000800d: return "GLX_NON_CONFORMANT_CONFIG";
-      case 0x00008010: return "GLX_DRAWABLE_TYPE";
-      case 0x00008011: return "GLX_RENDER_TYPE";
-      case 0x00008012: return "GLX_X_RENDERABLE";
-      case 0x00008013: return "GLX_FBCONFIG_ID";
-      case 0x00008014: return "GLX_RGBA_TYPE";
-      case 0x00008015: return "GLX_COLOR_INDEX_TYPE";
-      case 0x00008016: return "GLX_MAX_PBUFFER_WIDTH";
-      case 0x00008017: return "GLX_MAX_PBUFFER_HEIGHT";
-      case 0x00008018: return "GLX_MAX_PBUFFER_PIXELS";
-      case 0x00008019: return "GLX_OPTIMAL_PBUFFER_WIDTH_SGIX";
-      case 0x0000801a: return "GLX_OPTIMAL_PBUFFER_HEIGHT_SGIX";
-      case 0x0000801b: return "GLX_PRESERVED_CONTENTS";
-      case 0x0000801c: return "GLX_LARGEST_PBUFFER";
-      case 0x0000801d: return "GLX_WIDTH";
-      case 0x0000801e: return "GLX_HEIGHT";
-      case 0x0000801f: return "GLX_EVENT_MASK";
-      case 0x00008020: return "GLX_DAMAGED";
-      case 0x00008021: return "GLX_SAVED";
-      case 0x00008022: return "GLX_WINDOW";
-      case 0x00008023: return "GLX_PBUFFER";
-      case 0x00008025: return "GLX_BLENDED_RGBA_SGIS";
-      case 0x00008026: return "GLX_MULTISAMPLE_SUB_RECT_WIDTH_SGIS";
-      case 0x00008027: return "GLX_MULTISAMPLE_SUB_RECT_HEIGHT_SGIS";
-      case 0x00008028: return "GLX_VISUAL_SELECT_GROUP_SGIX";
-      case 0x00008030: return "GLX_HYPERPIPE_ID_SGIX";
-      case 0x00008040: return "GLX_PBUFFER_HEIGHT";
-      case 0x00008041: return "GLX_PBUFFER_WIDTH";
-      case 0x00008050: return "GLX_SAMPLE_BUFFERS_3DFX";
-      case 0x00008051: return "GLX_SAMPLES_3DFX";
-      case 0x00008060: return "GLX_SWAP_METHOD_OML";
-      case 0x00008061: return "GLX_SWAP_EXCHANGE_OML";
-      case 0x00008062: return "GLX_SWAP_COPY_OML";
-      case 0x00008063: return "GLX_SWAP_UNDEFINED_OML";
-      case 0x00008171: return "GLX_VIDEO_RESIZE_SUN";
-      case 0x00008180: return "GLX_EXCHANGE_COMPLETE_INTEL";
-      case 0x00008181: return "GLX_COPY_COMPLETE_INTEL";
-      case 0x00008182: return "GLX_FLIP_COMPLETE_INTEL";
-      case 0x00008252: return "GLX_LOSE_CONTEXT_ON_RESET_ARB";
-      case 0x00008256: return "GLX_CONTEXT_RESET_NOTIFICATION_STRATEGY_ARB";
-      case 0x00008261: return "GLX_NO_RESET_NOTIFICATION_ARB";
-      case 0x000085cd: return "GL_VIDEO_RESIZE_COMPENSATION_SUN";
-      case 0x00009126: return "GLX_CONTEXT_PROFILE_MASK_ARB";
-      case 0x00009800: return "GLX_BIND_TO_TEXTURE_RGB_ATI";
-      case 0x00009801: return "GLX_BIND_TO_TEXTURE_RGBA_ATI";
-      case 0x00009802: return "GLX_TEXTURE_FORMAT_ATI";
-      case 0x00009803: return "GLX_TEXTURE_TARGET_ATI";
-      case 0x00009804: return "GLX_MIPMAP_TEXTURE_ATI";
-      case 0x00009805: return "GLX_TEXTURE_RGB_ATI";
-      case 0x00009806: return "GLX_TEXTURE_RGBA_ATI";
-      case 0x00009807: return "GLX_NO_TEXTURE_ATI";
-      case 0x00009808: return "GLX_TEXTURE_CUBE_MAP_ATI";
-      case 0x00009809: return "GLX_TEXTURE_1D_ATI";
-      case 0x0000980a: return "GLX_TEXTURE_2D_ATI";
-      case 0x0000980b: return "GLX_MIPMAP_LEVEL_ATI";
-      case 0x0000980c: return "GLX_CUBE_MAP_FACE_ATI";
-      case 0x0000980d: return "GLX_TEXTURE_CUBE_MAP_POSITIVE_X_ATI";
-      case 0x0000980e: return "GLX_TEXTURE_CUBE_MAP_NEGATIVE_X_ATI";
-      case 0x0000980f: return "GLX_TEXTURE_CUBE_MAP_POSITIVE_Y_ATI";
-      case 0x00009810: return "GLX_TEXTURE_CUBE_MAP_NEGATIVE_Y_ATI";
-      case 0x00009811: return "GLX_TEXTURE_CUBE_MAP_POSITIVE_Z_ATI";
-      case 0x00009812: return "GLX_TEXTURE_CUBE_MAP_NEGATIVE_Z_ATI";
-      case 0x00009813: return "GLX_FRONT_LEFT_ATI";
-      case 0x00009814: return "GLX_FRONT_RIGHT_ATI";
-      case 0x00009815: return "GLX_BACK_LEFT_ATI";
-      case 0x00009816: return "GLX_BACK_RIGHT_ATI";
-      case 0x00009817: return "GLX_AUX0_ATI";
-      case 0x00009818: return "GLX_AUX1_ATI";
-      case 0x00009819: return "GLX_AUX2_ATI";
-      case 0x0000981a: return "GLX_AUX3_ATI";
-      case 0x0000981b: return "GLX_AUX4_ATI";
-      case 0x0000981c: return "GLX_AUX5_ATI";
-      case 0x0000981d: return "GLX_AUX6_ATI";
-      case 0x0000981e: return "GLX_AUX7_ATI";
-      case 0x0000981f: return "GLX_AUX8_ATI";
-      case 0x00009820: return "GLX_AUX9_ATI";
-      case 0x00009821: return "GLX_BIND_TO_TEXTURE_LUMINANCE_ATI";
-      case 0x00009822: return "GLX_BIND_TO_TEXTURE_INTENSITY_ATI";
-      case 0x000186a0: return "GLX_SAMPLE_BUFFERS";
-      case 0x000186a1: return "GLX_SAMPLES";
-      case 0x04000000: return "GLX_BUFFER_SWAP_COMPLETE_INTEL_MASK";
-      case 0x08000000: return "GLX_PBUFFER_CLOBBER_MASK";
-      case 0xffffffff: return "GLX_DONT_CARE";
-      default: break;
-    }
+    const char *name = enumToString(static_cast<GLuint>(v), glxEnumValue, glxEnumName, &glxEnumPool, glxEnumSeed, glxEnumSlot, 192);
+    if (name)
+      return name;
     #endif // REGAL_ENUM_TO_STRING
     return "unknown_glx_enum";
   }
 #endif // REGAL_SYS_GLX
 
 #if REGAL_SYS_EGL
+  #if REGAL_ENUM_TO_STRING
+
+  struct EGLEnumPool {
+    char n_EGL_FALSE[10];
+    char n_EGL_TRUE[9];
+    char n_EGL_DRM_BUFFER_USE_SHARE_MESA[30];
+    char n_EGL_CONTEXT_OPENGL_ROBUST_ACCESS_BIT_KHR[41];
+    char n_EGL_OPENGL_BIT[15];
+    char n_EGL_VG_COLORSPACE_LINEAR_BIT_KHR[33];
+    char n_EGL_OPENGL_ES3_BIT_KHR[23];
+    char n_EGL_LOCK_SURFACE_BIT_KHR[25];
+    char n_EGL_OPTIMAL_FORMAT_BIT_KHR[27];
+    char n_EGL_MULTISAMPLE_RESOLVE_BOX_BIT[32];
+    char n_EGL_SWAP_BEHAVIOR_PRESERVED_BIT[32];
+    char n_EGL_STREAM_BIT_KHR[19];
+    char n_EGL_DISPLAY_SCALING[20];
+    char n_EGL_SUCCESS[12];
+    char n_EGL_NOT_INITIALIZED[20];
+    char n_EGL_BAD_ACCESS[15];
+    char n_EGL_BAD_ALLOC[14];
+    char n_EGL_BAD_ATTRIBUTE[18];
+    char n_EGL_BAD_CONFIG[15];
+    char n_EGL_BAD_CONTEXT[16];
+    char n_EGL_BAD_CURRENT_SURFACE[24];
+    char n_EGL_BAD_DISPLAY[16];
+    char n_EGL_BAD_MATCH[14];
+    char n_EGL_BAD_NATIVE_PIXMAP[22];
+    char n_EGL_BAD_NATIVE_WINDOW[22];
+    char n_EGL_BAD_PARAMETER[18];
+    char n_EGL_BAD_SURFACE[16];
+    char n_EGL_CONTEXT_LOST[17];
+    char n_EGL_BUFFER_SIZE[16];
+    char n_EGL_ALPHA_SIZE[15];
+    char n_EGL_BLUE_SIZE[14];
+    char n_EGL_GREEN_SIZE[15];
+    char n_EGL_RED_SIZE[13];
+    char n_EGL_DEPTH_SIZE[15];
+    char n_EGL_STENCIL_SIZE[17];
+    char n_EGL_CONFIG_CAVEAT[18];
+    char n_EGL_CONFIG_ID[14];
+    char n_EGL_LEVEL[10];
+    char n_EGL_MAX_PBUFFER_HEIGHT[23];
+    char n_EGL_MAX_PBUFFER_PIXELS[23];
+    char n_EGL_MAX_PBUFFER_WIDTH[22];
+    char n_EGL_NATIVE_RENDERABLE[22];
+    char n_EGL_NATIVE_VISUAL_ID[21];
+    char n_EGL_NATIVE_VISUAL_TYPE[23];
+    char n_EGL_SAMPLES[12];
+    char n_EGL_SAMPLE_BUFFERS[19];
+    char n_EGL_SURFACE_TYPE[17];
+    char n_EGL_TRANSPARENT_TYPE[21];
+    char n_EGL_TRANSPARENT_BLUE_VALUE[27];
+    char n_EGL_TRANSPARENT_GREEN_VALUE[28];
+    char n_EGL_TRANSPARENT_RED_VALUE[26];
+    char n_EGL_NONE[9];
+    char n_EGL_BIND_TO_TEXTURE_RGB[24];
+    char n_EGL_BIND_TO_TEXTURE_RGBA[25];
+    char n_EGL_MIN_SWAP_INTERVAL[22];
+    char n_EGL_MAX_SWAP_INTERVAL[22];
+    char n_EGL_LUMINANCE_SIZE[19];
+    char n_EGL_ALPHA_MASK_SIZE[20];
+    char n_EGL_COLOR_BUFFER_TYPE[22];
+    char n_EGL_RENDERABLE_TYPE[20];
+    char n_EGL_MATCH_NATIVE_PIXMAP[24];
+    char n_EGL_CONFORMANT[15];
+    char n_EGL_MATCH_FORMAT_KHR[21];
+    char n_EGL_SLOW_CONFIG[16];
+    char n_EGL_NON_CONFORMANT_CONFIG[26];
+    char n_EGL_TRANSPARENT_RGB[20];
+    char n_EGL_VENDOR[11];
+    char n_EGL_VERSION[12];
+    char n_EGL_EXTENSIONS[15];
+    char n_EGL_HEIGHT[11];
+    char n_EGL_WIDTH[10];
+    char n_EGL_LARGEST_PBUFFER[20];
+    char n_EGL_DRAW[9];
+    char n_EGL_READ[9];
+    char n_EGL_CORE_NATIVE_ENGINE[23];
+    char n_EGL_NO_TEXTURE[15];
+    char n_EGL_TEXTURE_RGB[16];
+    char n_EGL_TEXTURE_RGBA[17];
+    char n_EGL_TEXTURE_2D[15];
+    char n_EGL_TEXTURE_FORMAT[19];
+    char n_EGL_TEXTURE_TARGET[19];
+    char n_EGL_MIPMAP_TEXTURE[19];
+    char n_EGL_MIPMAP_LEVEL[17];
+    char n_EGL_BACK_BUFFER[16];
+    char n_EGL_SINGLE_BUFFER[18];
+    char n_EGL_RENDER_BUFFER[18];
+    char n_EGL_VG_COLORSPACE[18];
+    char n_EGL_VG_ALPHA_FORMAT[20];
+    char n_EGL_VG_COLORSPACE_sRGB[23];
+    char n_EGL_VG_COLORSPACE_LINEAR[25];
+    char n_EGL_VG_ALPHA_FORMAT_NONPRE[27];
+    char n_EGL_VG_ALPHA_FORMAT_PRE[24];
+    char n_EGL_CLIENT_APIS[16];
+    char n_EGL_RGB_BUFFER[15];
+    char n_EGL_LUMINANCE_BUFFER[21];
+    char n_EGL_HORIZONTAL_RESOLUTION[26];
+    char n_EGL_VERTICAL_RESOLUTION[24];
+    char n_EGL_PIXEL_ASPECT_RATIO[23];
+    char n_EGL_SWAP_BEHAVIOR[18];
+    char n_EGL_BUFFER_PRESERVED[21];
+    char n_EGL_BUFFER_DESTROYED[21];
+    char n_EGL_OPENVG_IMAGE[17];
+    char n_EGL_CONTEXT_CLIENT_TYPE[24];
+    char n_EGL_CONTEXT_CLIENT_VERSION[27];
+    char n_EGL_MULTISAMPLE_RESOLVE[24];
+    char n_EGL_MULTISAMPLE_RESOLVE_DEFAULT[32];
+    char n_EGL_MULTISAMPLE_RESOLVE_BOX[28];
+    char n_EGL_OPENGL_ES_API[18];
+    char n_EGL_OPENVG_API[15];
+    char n_EGL_OPENGL_API[15];
+    char n_EGL_NATIVE_PIXMAP_KHR[22];
+    char n_EGL_GL_TEXTURE_2D_KHR[22];
+    char n_EGL_GL_TEXTURE_3D_KHR[22];
+    char n_EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_X_KHR[39];
+    char n_EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_X_KHR[39];
+    char n_EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_Y_KHR[39];
+    char n_EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_Y_KHR[39];
+    char n_EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_Z_KHR[39];
+    char n_EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_Z_KHR[39];
+    char n_EGL_GL_RENDERBUFFER_KHR[24];
+    char n_EGL_VG_PARENT_IMAGE_KHR[24];
+    char n_EGL_GL_TEXTURE_LEVEL_KHR[25];
+    char n_EGL_GL_TEXTURE_ZOFFSET_KHR[27];
+    char n_EGL_POST_SUB_BUFFER_SUPPORTED_NV[33];
+    char n_EGL_CONTEXT_OPENGL_ROBUST_ACCESS_EXT[37];
+    char n_EGL_FORMAT_RGB_565_EXACT_KHR[29];
+    char n_EGL_FORMAT_RGB_565_KHR[23];
+    char n_EGL_FORMAT_RGBA_8888_EXACT_KHR[31];
+    char n_EGL_FORMAT_RGBA_8888_KHR[25];
+    char n_EGL_MAP_PRESERVE_PIXELS_KHR[28];
+    char n_EGL_LOCK_USAGE_HINT_KHR[24];
+    char n_EGL_BITMAP_POINTER_KHR[23];
+    char n_EGL_BITMAP_PITCH_KHR[21];
+    char n_EGL_BITMAP_ORIGIN_KHR[22];
+    char n_EGL_BITMAP_PIXEL_RED_OFFSET_KHR[32];
+    char n_EGL_BITMAP_PIXEL_GREEN_OFFSET_KHR[34];
+    char n_EGL_BITMAP_PIXEL_BLUE_OFFSET_KHR[33];
+    char n_EGL_BITMAP_PIXEL_ALPHA_OFFSET_KHR[34];
+    char n_EGL_BITMAP_PIXEL_LUMINANCE_OFFSET_KHR[38];
+    char n_EGL_LOWER_LEFT_KHR[19];
+    char n_EGL_UPPER_LEFT_KHR[19];
+    char n_EGL_IMAGE_PRESERVED_KHR[24];
+    char n_EGL_COVERAGE_BUFFERS_NV[24];
+    char n_EGL_COVERAGE_SAMPLES_NV[24];
+    char n_EGL_DEPTH_ENCODING_NV[22];
+    char n_EGL_DEPTH_ENCODING_NONLINEAR_NV[32];
+    char n_EGL_SYNC_PRIOR_COMMANDS_COMPLETE_NV[36];
+    char n_EGL_SYNC_STATUS_NV[19];
+    char n_EGL_SIGNALED_NV[16];
+    char n_EGL_UNSIGNALED_NV[18];
+    char n_EGL_ALREADY_SIGNALED_NV[24];
+    char n_EGL_TIMEOUT_EXPIRED_NV[23];
+    char n_EGL_CONDITION_SATISFIED_NV[27];
+    char n_EGL_SYNC_TYPE_NV[17];
+    char n_EGL_SYNC_CONDITION_NV[22];
+    char n_EGL_SYNC_FENCE_NV[18];
+    char n_EGL_SYNC_PRIOR_COMMANDS_COMPLETE_KHR[37];
+    char n_EGL_SYNC_STATUS_KHR[20];
+    char n_EGL_SIGNALED_KHR[17];
+    char n_EGL_UNSIGNALED_KHR[19];
+    char n_EGL_TIMEOUT_EXPIRED_KHR[24];
+    char n_EGL_CONDITION_SATISFIED_KHR[28];
+    char n_EGL_SYNC_TYPE_KHR[18];
+    char n_EGL_SYNC_CONDITION_KHR[23];
+    char n_EGL_SYNC_FENCE_KHR[19];
+    char n_EGL_SYNC_REUSABLE_KHR[22];
+    char n_EGL_CONTEXT_MINOR_VERSION_KHR[30];
+    char n_EGL_CONTEXT_FLAGS_KHR[22];
+    char n_EGL_CONTEXT_OPENGL_PROFILE_MASK_KHR[36];
+    char n_EGL_CONTEXT_PRIORITY_LEVEL_IMG[31];
+    char n_EGL_CONTEXT_PRIORITY_HIGH_IMG[30];
+    char n_EGL_CONTEXT_PRIORITY_MEDIUM_IMG[32];
+    char n_EGL_CONTEXT_PRIORITY_LOW_IMG[29];
+    char n_EGL_BITMAP_PIXEL_SIZE_KHR[26];
+    char n_EGL_COVERAGE_SAMPLE_RESOLVE_NV[31];
+    char n_EGL_COVERAGE_SAMPLE_RESOLVE_DEFAULT_NV[39];
+    char n_EGL_COVERAGE_SAMPLE_RESOLVE_NONE_NV[36];
+    char n_EGL_MULTIVIEW_VIEW_COUNT_EXT[29];
+    char n_EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_EXT[51];
+    char n_EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_KHR[51];
+    char n_EGL_NO_RESET_NOTIFICATION_KHR[30];
+    char n_EGL_LOSE_CONTEXT_ON_RESET_KHR[30];
+    char n_EGL_DRM_BUFFER_FORMAT_MESA[27];
+    char n_EGL_DRM_BUFFER_USE_MESA[24];
+    char n_EGL_DRM_BUFFER_FORMAT_ARGB32_MESA[34];
+    char n_EGL_DRM_BUFFER_MESA[20];
+    char n_EGL_DRM_BUFFER_STRIDE_MESA[27];
+    char n_EGL_STREAM_FIFO_LENGTH_KHR[27];
+    char n_EGL_STREAM_TIME_NOW_KHR[24];
+    char n_EGL_STREAM_TIME_CONSUMER_KHR[29];
+    char n_EGL_STREAM_TIME_PRODUCER_KHR[29];
+    char n_EGL_D3D_TEXTURE_2D_SHARE_HANDLE_ANGLE[38];
+    char n_EGL_CONSUMER_LATENCY_USEC_KHR[30];
+    char n_EGL_PRODUCER_FRAME_KHR[23];
+    char n_EGL_CONSUMER_FRAME_KHR[23];
+    char n_EGL_STREAM_STATE_KHR[21];
+    char n_EGL_STREAM_STATE_CREATED_KHR[29];
+    char n_EGL_STREAM_STATE_CONNECTING_KHR[32];
+    char n_EGL_STREAM_STATE_EMPTY_KHR[27];
+    char n_EGL_STREAM_STATE_NEW_FRAME_AVAILABLE_KHR[41];
+    char n_EGL_STREAM_STATE_OLD_FRAME_AVAILABLE_KHR[41];
+    char n_EGL_STREAM_STATE_DISCONNECTED_KHR[34];
+    char n_EGL_BAD_STREAM_KHR[19];
+    char n_EGL_BAD_STATE_KHR[18];
+    char n_EGL_CONSUMER_ACQUIRE_TIMEOUT_USEC_KHR[38];
+    char n_GL_COVERAGE_BUFFER_BIT_NV[26];
+    char n_GL_DEPTH_COMPONENT16_NONLINEAR_NV[34];
+    char n_GL_COVERAGE_COMPONENT_NV[25];
+    char n_GL_COVERAGE_COMPONENT4_NV[26];
+    char n_GL_COVERAGE_ATTACHMENT_NV[26];
+    char n_GL_COVERAGE_BUFFERS_NV[23];
+    char n_GL_COVERAGE_ALL_FRAGMENTS_NV[29];
+    char n_GL_COVERAGE_EDGE_FRAGMENTS_NV[30];
+    char n_GL_COVERAGE_AUTOMATIC_NV[25];
+    char n_EGL_COLOR_FORMAT_HI[20];
+    char n_EGL_COLOR_RGB_HI[17];
+    char n_EGL_COLOR_RGBA_HI[18];
+    char n_EGL_COLOR_ARGB_HI[18];
+  };
+
+  const EGLEnumPool eglEnumPool = {
+    "EGL_FALSE",
+    "EGL_TRUE",
+    "EGL_DRM_BUFFER_USE_SHARE_MESA",
+    "EGL_CONTEXT_OPENGL_ROBUST_ACCESS_BIT_KHR",
+    "EGL_OPENGL_BIT",
+    "EGL_VG_COLORSPACE_LINEAR_BIT_KHR",
+    "EGL_OPENGL_ES3_BIT_KHR",
+    "EGL_LOCK_SURFACE_BIT_KHR",
+    "EGL_OPTIMAL_FORMAT_BIT_KHR",
+    "EGL_MULTISAMPLE_RESOLVE_BOX_BIT",
+    "EGL_SWAP_BEHAVIOR_PRESERVED_BIT",
+    "EGL_STREAM_BIT_KHR",
+    "EGL_DISPLAY_SCALING",
+    "EGL_SUCCESS",
+    "EGL_NOT_INITIALIZED",
+    "EGL_BAD_ACCESS",
+    "EGL_BAD_ALLOC",
+    "EGL_BAD_ATTRIBUTE",
+    "EGL_BAD_CONFIG",
+    "EGL_BAD_CONTEXT",
+    "EGL_BAD_CURRENT_SURFACE",
+    "EGL_BAD_DISPLAY",
+    "EGL_BAD_MATCH",
+    "EGL_BAD_NATIVE_PIXMAP",
+    "EGL_BAD_NATIVE_WINDOW",
+    "EGL_BAD_PARAMETER",
+    "EGL_BAD_SURFACE",
+    "EGL_CONTEXT_LOST",
+    "EGL_BUFFER_SIZE",
+    "EGL_ALPHA_SIZE",
+    "EGL_BLUE_SIZE",
+    "EGL_GREEN_SIZE",
+    "EGL_RED_SIZE",
+    "EGL_DEPTH_SIZE",
+    "EGL_STENCIL_SIZE",
+    "EGL_CONFIG_CAVEAT",
+    "EGL_CONFIG_ID",
+    "EGL_LEVEL",
+    "EGL_MAX_PBUFFER_HEIGHT",
+    "EGL_MAX_PBUFFER_PIXELS",
+    "EGL_MAX_PBUFFER_WIDTH",
+    "EGL_NATIVE_RENDERABLE",
+    "EGL_NATIVE_VISUAL_ID",
+    "EGL_NATIVE_VISUAL_TYPE",
+    "EGL_SAMPLES",
+    "EGL_SAMPLE_BUFFERS",
+    "EGL_SURFACE_TYPE",
+    "EGL_TRANSPARENT_TYPE",
+    "EGL_TRANSPARENT_BLUE_VALUE",
+    "EGL_TRANSPARENT_GREEN_VALUE",
+    "EGL_TRANSPARENT_RED_VALUE",
+    "EGL_NONE",
+    "EGL_BIND_TO_TEXTURE_RGB",
+    "EGL_BIND_TO_TEXTURE_RGBA",
+    "EGL_MIN_SWAP_INTERVAL",
+    "EGL_MAX_SWAP_INTERVAL",
+    "EGL_LUMINANCE_SIZE",
+    "EGL_ALPHA_MASK_SIZE",
+    "EGL_COLOR_BUFFER_TYPE",
+    "EGL_RENDERABLE_TYPE",
+    "EGL_MATCH_NATIVE_PIXMAP",
+    "EGL_CONFORMANT",
+    "EGL_MATCH_FORMAT_KHR",
+    "EGL_SLOW_CONFIG",
+    "EGL_NON_CONFORMANT_CONFIG",
+    "EGL_TRANSPARENT_RGB",
+    "EGL_VENDOR",
+    "EGL_VERSION",
+    "EGL_EXTENSIONS",
+    "EGL_HEIGHT",
+    "EGL_WIDTH",
+    "EGL_LARGEST_PBUFFER",
+    "EGL_DRAW",
+    "EGL_READ",
+    "EGL_CORE_NATIVE_ENGINE",
+    "EGL_NO_TEXTURE",
+    "EGL_TEXTURE_RGB",
+    "EGL_TEXTURE_RGBA",
+    "EGL_TEXTURE_2D",
+    "EGL_TEXTURE_FORMAT",
+    "EGL_TEXTURE_TARGET",
+    "EGL_MIPMAP_TEXTURE",
+    "EGL_MIPMAP_LEVEL",
+    "EGL_BACK_BUFFER",
+    "EGL_SINGLE_BUFFER",
+    "EGL_RENDER_BUFFER",
+    "EGL_VG_COLORSPACE",
+    "EGL_VG_ALPHA_FORMAT",
+    "EGL_VG_COLORSPACE_sRGB",
+    "EGL_VG_COLORSPACE_LINEAR",
+    "EGL_VG_ALPHA_FORMAT_NONPRE",
+    "EGL_VG_ALPHA_FORMAT_PRE",
+    "EGL_CLIENT_APIS",
+    "EGL_RGB_BUFFER",
+    "EGL_LUMINANCE_BUFFER",
+    "EGL_HORIZONTAL_RESOLUTION",
+    "EGL_VERTICAL_RESOLUTION",
+    "EGL_PIXEL_ASPECT_RATIO",
+    "EGL_SWAP_BEHAVIOR",
+    "EGL_BUFFER_PRESERVED",
+    "EGL_BUFFER_DESTROYED",
+    "EGL_OPENVG_IMAGE",
+    "EGL_CONTEXT_CLIENT_TYPE",
+    "EGL_CONTEXT_CLIENT_VERSION",
+    "EGL_MULTISAMPLE_RESOLVE",
+    "EGL_MULTISAMPLE_RESOLVE_DEFAULT",
+    "EGL_MULTISAMPLE_RESOLVE_BOX",
+    "EGL_OPENGL_ES_API",
+    "EGL_OPENVG_API",
+    "EGL_OPENGL_API",
+    "EGL_NATIVE_PIXMAP_KHR",
+    "EGL_GL_TEXTURE_2D_KHR",
+    "EGL_GL_TEXTURE_3D_KHR",
+    "EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_X_KHR",
+    "EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_X_KHR",
+    "EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_Y_KHR",
+    "EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_Y_KHR",
+    "EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_Z_KHR",
+    "EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_Z_KHR",
+    "EGL_GL_RENDERBUFFER_KHR",
+    "EGL_VG_PARENT_IMAGE_KHR",
+    "EGL_GL_TEXTURE_LEVEL_KHR",
+    "EGL_GL_TEXTURE_ZOFFSET_KHR",
+    "EGL_POST_SUB_BUFFER_SUPPORTED_NV",
+    "EGL_CONTEXT_OPENGL_ROBUST_ACCESS_EXT",
+    "EGL_FORMAT_RGB_565_EXACT_KHR",
+    "EGL_FORMAT_RGB_565_KHR",
+    "EGL_FORMAT_RGBA_8888_EXACT_KHR",
+    "EGL_FORMAT_RGBA_8888_KHR",
+    "EGL_MAP_PRESERVE_PIXELS_KHR",
+    "EGL_LOCK_USAGE_HINT_KHR",
+    "EGL_BITMAP_POINTER_KHR",
+    "EGL_BITMAP_PITCH_KHR",
+    "EGL_BITMAP_ORIGIN_KHR",
+    "EGL_BITMAP_PIXEL_RED_OFFSET_KHR",
+    "EGL_BITMAP_PIXEL_GREEN_OFFSET_KHR",
+    "EGL_BITMAP_PIXEL_BLUE_OFFSET_KHR",
+    "EGL_BITMAP_PIXEL_ALPHA_OFFSET_KHR",
+    "EGL_BITMAP_PIXEL_LUMINANCE_OFFSET_KHR",
+    "EGL_LOWER_LEFT_KHR",
+    "EGL_UPPER_LEFT_KHR",
+    "EGL_IMAGE_PRESERVED_KHR",
+    "EGL_COVERAGE_BUFFERS_NV",
+    "EGL_COVERAGE_SAMPLES_NV",
+    "EGL_DEPTH_ENCODING_NV",
+    "EGL_DEPTH_ENCODING_NONLINEAR_NV",
+    "EGL_SYNC_PRIOR_COMMANDS_COMPLETE_NV",
+    "EGL_SYNC_STATUS_NV",
+    "EGL_SIGNALED_NV",
+    "EGL_UNSIGNALED_NV",
+    "EGL_ALREADY_SIGNALED_NV",
+    "EGL_TIMEOUT_EXPIRED_NV",
+    "EGL_CONDITION_SATISFIED_NV",
+    "EGL_SYNC_TYPE_NV",
+    "EGL_SYNC_CONDITION_NV",
+    "EGL_SYNC_FENCE_NV",
+    "EGL_SYNC_PRIOR_COMMANDS_COMPLETE_KHR",
+    "EGL_SYNC_STATUS_KHR",
+    "EGL_SIGNALED_KHR",
+    "EGL_UNSIGNALED_KHR",
+    "EGL_TIMEOUT_EXPIRED_KHR",
+    "EGL_CONDITION_SATISFIED_KHR",
+    "EGL_SYNC_TYPE_KHR",
+    "EGL_SYNC_CONDITION_KHR",
+    "EGL_SYNC_FENCE_KHR",
+    "EGL_SYNC_REUSABLE_KHR",
+    "EGL_CONTEXT_MINOR_VERSION_KHR",
+    "EGL_CONTEXT_FLAGS_KHR",
+    "EGL_CONTEXT_OPENGL_PROFILE_MASK_KHR",
+    "EGL_CONTEXT_PRIORITY_LEVEL_IMG",
+    "EGL_CONTEXT_PRIORITY_HIGH_IMG",
+    "EGL_CONTEXT_PRIORITY_MEDIUM_IMG",
+    "EGL_CONTEXT_PRIORITY_LOW_IMG",
+    "EGL_BITMAP_PIXEL_SIZE_KHR",
+    "EGL_COVERAGE_SAMPLE_RESOLVE_NV",
+    "EGL_COVERAGE_SAMPLE_RESOLVE_DEFAULT_NV",
+    "EGL_COVERAGE_SAMPLE_RESOLVE_NONE_NV",
+    "EGL_MULTIVIEW_VIEW_COUNT_EXT",
+    "EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_EXT",
+    "EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_KHR",
+    "EGL_NO_RESET_NOTIFICATION_KHR",
+    "EGL_LOSE_CONTEXT_ON_RESET_KHR",
+    "EGL_DRM_BUFFER_FORMAT_MESA",
+    "EGL_DRM_BUFFER_USE_MESA",
+    "EGL_DRM_BUFFER_FORMAT_ARGB32_MESA",
+    "EGL_DRM_BUFFER_MESA",
+    "EGL_DRM_BUFFER_STRIDE_MESA",
+    "EGL_STREAM_FIFO_LENGTH_KHR",
+    "EGL_STREAM_TIME_NOW_KHR",
+    "EGL_STREAM_TIME_CONSUMER_KHR",
+    "EGL_STREAM_TIME_PRODUCER_KHR",
+    "EGL_D3D_TEXTURE_2D_SHARE_HANDLE_ANGLE",
+    "EGL_CONSUMER_LATENCY_USEC_KHR",
+    "EGL_PRODUCER_FRAME_KHR",
+    "EGL_CONSUMER_FRAME_KHR",
+    "EGL_STREAM_STATE_KHR",
+    "EGL_STREAM_STATE_CREATED_KHR",
+    "EGL_STREAM_STATE_CONNECTING_KHR",
+    "EGL_STREAM_STATE_EMPTY_KHR",
+    "EGL_STREAM_STATE_NEW_FRAME_AVAILABLE_KHR",
+    "EGL_STREAM_STATE_OLD_FRAME_AVAILABLE_KHR",
+    "EGL_STREAM_STATE_DISCONNECTED_KHR",
+    "EGL_BAD_STREAM_KHR",
+    "EGL_BAD_STATE_KHR",
+    "EGL_CONSUMER_ACQUIRE_TIMEOUT_USEC_KHR",
+    "GL_COVERAGE_BUFFER_BIT_NV",
+    "GL_DEPTH_COMPONENT16_NONLINEAR_NV",
+    "GL_COVERAGE_COMPONENT_NV",
+    "GL_COVERAGE_COMPONENT4_NV",
+    "GL_COVERAGE_ATTACHMENT_NV",
+    "GL_COVERAGE_BUFFERS_NV",
+    "GL_COVERAGE_ALL_FRAGMENTS_NV",
+    "GL_COVERAGE_EDGE_FRAGMENTS_NV",
+    "GL_COVERAGE_AUTOMATIC_NV",
+    "EGL_COLOR_FORMAT_HI",
+    "EGL_COLOR_RGB_HI",
+    "EGL_COLOR_RGBA_HI",
+    "EGL_COLOR_ARGB_HI"
+  };
+
+  const GLuint eglEnumValue[218] = {
+    0x00000000, 0x00000001, 0x00000002, 0x00000004, 0x00000008, 0x00000020, 0x00000040, 0x00000080,
+    0x00000100, 0x00000200, 0x00000400, 0x00000800, 0x00002710, 0x00003000, 0x00003001, 0x00003002,
+    0x00003003, 0x00003004, 0x00003005, 0x00003006, 0x00003007, 0x00003008, 0x00003009, 0x0000300a,
+    0x0000300b, 0x0000300c, 0x0000300d, 0x0000300e, 0x00003020, 0x00003021, 0x00003022, 0x00003023,
+    0x00003024, 0x00003025, 0x00003026, 0x00003027, 0x00003028, 0x00003029, 0x0000302a, 0x0000302b,
+    0x0000302c, 0x0000302d, 0x0000302e, 0x0000302f, 0x00003031, 0x00003032, 0x00003033, 0x00003034,
+    0x00003035, 0x00003036, 0x00003037, 0x00003038, 0x00003039, 0x0000303a, 0x0000303b, 0x0000303c,
+    0x0000303d, 0x0000303e, 0x0000303f, 0x00003040, 0x00003041, 0x00003042, 0x00003043, 0x00003050,
+    0x00003051, 0x00003052, 0x00003053, 0x00003054, 0x00003055, 0x00003056, 0x00003057, 0x00003058,
+    0x00003059, 0x0000305a, 0x0000305b, 0x0000305c, 0x0000305d, 0x0000305e, 0x0000305f, 0x00003080,
+    0x00003081, 0x00003082, 0x00003083, 0x00003084, 0x00003085, 0x00003086, 0x00003087, 0x00003088,
+    0x00003089, 0x0000308a, 0x0000308b, 0x0000308c, 0x0000308d, 0x0000308e, 0x0000308f, 0x00003090,
+    0x00003091, 0x00003092, 0x00003093, 0x00003094, 0x00003095, 0x00003096, 0x00003097, 0x00003098,
+    0x00003099, 0x0000309a, 0x0000309b, 0x000030a0, 0x000030a1, 0x000030a2, 0x000030b0, 0x000030b1,
+    0x000030b2, 0x000030b3, 0x000030b4, 0x000030b5, 0x000030b6, 0x000030b7, 0x000030b8, 0x000030b9,
+    0x000030ba, 0x000030bc, 0x000030bd, 0x000030be, 0x000030bf, 0x000030c0, 0x000030c1, 0x000030c2,
+    0x000030c3, 0x000030c4, 0x000030c5, 0x000030c6, 0x000030c7, 0x000030c8, 0x000030c9, 0x000030ca,
+    0x000030cb, 0x000030cc, 0x000030cd, 0x000030ce, 0x000030cf, 0x000030d2, 0x000030e0, 0x000030e1,
+    0x000030e2, 0x000030e3, 0x000030e6, 0x000030e7, 0x000030e8, 0x000030e9, 0x000030ea, 0x000030eb,
+    0x000030ec, 0x000030ed, 0x000030ee, 0x000030ef, 0x000030f0, 0x000030f1, 0x000030f2, 0x000030f3,
+    0x000030f5, 0x000030f6, 0x000030f7, 0x000030f8, 0x000030f9, 0x000030fa, 0x000030fb, 0x000030fc,
+    0x000030fd, 0x00003100, 0x00003101, 0x00003102, 0x00003103, 0x00003110, 0x00003131, 0x00003132,
+    0x00003133, 0x00003134, 0x00003138, 0x000031bd, 0x000031be, 0x000031bf, 0x000031d0, 0x000031d1,
+    0x000031d2, 0x000031d3, 0x000031d4, 0x000031fc, 0x000031fd, 0x000031fe, 0x000031ff, 0x00003200,
+    0x00003210, 0x00003212, 0x00003213, 0x00003214, 0x00003215, 0x00003216, 0x00003217, 0x00003218,
+    0x00003219, 0x0000321a, 0x0000321b, 0x0000321c, 0x0000321e, 0x00008000, 0x00008e2c, 0x00008ed0,
+    0x00008ed1, 0x00008ed2, 0x00008ed3, 0x00008ed5, 0x00008ed6, 0x00008ed7, 0x00008f70, 0x00008f71,
+    0x00008f72, 0x00008f73
+  };
+
+  const unsigned int eglEnumName[218] = {
+    offsetof(EGLEnumPool,n_EGL_FALSE),
+    offsetof(EGLEnumPool,n_EGL_TRUE),
+    offsetof(EGLEnumPool,n_EGL_DRM_BUFFER_USE_SHARE_MESA),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_OPENGL_ROBUST_ACCESS_BIT_KHR),
+    offsetof(EGLEnumPool,n_EGL_OPENGL_BIT),
+    offsetof(EGLEnumPool,n_EGL_VG_COLORSPACE_LINEAR_BIT_KHR),
+    offsetof(EGLEnumPool,n_EGL_OPENGL_ES3_BIT_KHR),
+    offsetof(EGLEnumPool,n_EGL_LOCK_SURFACE_BIT_KHR),
+    offsetof(EGLEnumPool,n_EGL_OPTIMAL_FORMAT_BIT_KHR),
+    offsetof(EGLEnumPool,n_EGL_MULTISAMPLE_RESOLVE_BOX_BIT),
+    offsetof(EGLEnumPool,n_EGL_SWAP_BEHAVIOR_PRESERVED_BIT),
+    offsetof(EGLEnumPool,n_EGL_STREAM_BIT_KHR),
+    offsetof(EGLEnumPool,n_EGL_DISPLAY_SCALING),
+    offsetof(EGLEnumPool,n_EGL_SUCCESS),
+    offsetof(EGLEnumPool,n_EGL_NOT_INITIALIZED),
+    offsetof(EGLEnumPool,n_EGL_BAD_ACCESS),
+    offsetof(EGLEnumPool,n_EGL_BAD_ALLOC),
+    offsetof(EGLEnumPool,n_EGL_BAD_ATTRIBUTE),
+    offsetof(EGLEnumPool,n_EGL_BAD_CONFIG),
+    offsetof(EGLEnumPool,n_EGL_BAD_CONTEXT),
+    offsetof(EGLEnumPool,n_EGL_BAD_CURRENT_SURFACE),
+    offsetof(EGLEnumPool,n_EGL_BAD_DISPLAY),
+    offsetof(EGLEnumPool,n_EGL_BAD_MATCH),
+    offsetof(EGLEnumPool,n_EGL_BAD_NATIVE_PIXMAP),
+    offsetof(EGLEnumPool,n_EGL_BAD_NATIVE_WINDOW),
+    offsetof(EGLEnumPool,n_EGL_BAD_PARAMETER),
+    offsetof(EGLEnumPool,n_EGL_BAD_SURFACE),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_LOST),
+    offsetof(EGLEnumPool,n_EGL_BUFFER_SIZE),
+    offsetof(EGLEnumPool,n_EGL_ALPHA_SIZE),
+    offsetof(EGLEnumPool,n_EGL_BLUE_SIZE),
+    offsetof(EGLEnumPool,n_EGL_GREEN_SIZE),
+    offsetof(EGLEnumPool,n_EGL_RED_SIZE),
+    offsetof(EGLEnumPool,n_EGL_DEPTH_SIZE),
+    offsetof(EGLEnumPool,n_EGL_STENCIL_SIZE),
+    offsetof(EGLEnumPool,n_EGL_CONFIG_CAVEAT),
+    offsetof(EGLEnumPool,n_EGL_CONFIG_ID),
+    offsetof(EGLEnumPool,n_EGL_LEVEL),
+    offsetof(EGLEnumPool,n_EGL_MAX_PBUFFER_HEIGHT),
+    offsetof(EGLEnumPool,n_EGL_MAX_PBUFFER_PIXELS),
+    offsetof(EGLEnumPool,n_EGL_MAX_PBUFFER_WIDTH),
+    offsetof(EGLEnumPool,n_EGL_NATIVE_RENDERABLE),
+    offsetof(EGLEnumPool,n_EGL_NATIVE_VISUAL_ID),
+    offsetof(EGLEnumPool,n_EGL_NATIVE_VISUAL_TYPE),
+    offsetof(EGLEnumPool,n_EGL_SAMPLES),
+    offsetof(EGLEnumPool,n_EGL_SAMPLE_BUFFERS),
+    offsetof(EGLEnumPool,n_EGL_SURFACE_TYPE),
+    offsetof(EGLEnumPool,n_EGL_TRANSPARENT_TYPE),
+    offsetof(EGLEnumPool,n_EGL_TRANSPARENT_BLUE_VALUE),
+    offsetof(EGLEnumPool,n_EGL_TRANSPARENT_GREEN_VALUE),
+    offsetof(EGLEnumPool,n_EGL_TRANSPARENT_RED_VALUE),
+    offsetof(EGLEnumPool,n_EGL_NONE),
+    offsetof(EGLEnumPool,n_EGL_BIND_TO_TEXTURE_RGB),
+    offsetof(EGLEnumPool,n_EGL_BIND_TO_TEXTURE_RGBA),
+    offsetof(EGLEnumPool,n_EGL_MIN_SWAP_INTERVAL),
+    offsetof(EGLEnumPool,n_EGL_MAX_SWAP_INTERVAL),
+    offsetof(EGLEnumPool,n_EGL_LUMINANCE_SIZE),
+    offsetof(EGLEnumPool,n_EGL_ALPHA_MASK_SIZE),
+    offsetof(EGLEnumPool,n_EGL_COLOR_BUFFER_TYPE),
+    offsetof(EGLEnumPool,n_EGL_RENDERABLE_TYPE),
+    offsetof(EGLEnumPool,n_EGL_MATCH_NATIVE_PIXMAP),
+    offsetof(EGLEnumPool,n_EGL_CONFORMANT),
+    offsetof(EGLEnumPool,n_EGL_MATCH_FORMAT_KHR),
+    offsetof(EGLEnumPool,n_EGL_SLOW_CONFIG),
+    offsetof(EGLEnumPool,n_EGL_NON_CONFORMANT_CONFIG),
+    offsetof(EGLEnumPool,n_EGL_TRANSPARENT_RGB),
+    offsetof(EGLEnumPool,n_EGL_VENDOR),
+    offsetof(EGLEnumPool,n_EGL_VERSION),
+    offsetof(EGLEnumPool,n_EGL_EXTENSIONS),
+    offsetof(EGLEnumPool,n_EGL_HEIGHT),
+    offsetof(EGLEnumPool,n_EGL_WIDTH),
+    offsetof(EGLEnumPool,n_EGL_LARGEST_PBUFFER),
+    offsetof(EGLEnumPool,n_EGL_DRAW),
+    offsetof(EGLEnumPool,n_EGL_READ),
+    offsetof(EGLEnumPool,n_EGL_CORE_NATIVE_ENGINE),
+    offsetof(EGLEnumPool,n_EGL_NO_TEXTURE),
+    offsetof(EGLEnumPool,n_EGL_TEXTURE_RGB),
+    offsetof(EGLEnumPool,n_EGL_TEXTURE_RGBA),
+    offsetof(EGLEnumPool,n_EGL_TEXTURE_2D),
+    offsetof(EGLEnumPool,n_EGL_TEXTURE_FORMAT),
+    offsetof(EGLEnumPool,n_EGL_TEXTURE_TARGET),
+    offsetof(EGLEnumPool,n_EGL_MIPMAP_TEXTURE),
+    offsetof(EGLEnumPool,n_EGL_MIPMAP_LEVEL),
+    offsetof(EGLEnumPool,n_EGL_BACK_BUFFER),
+    offsetof(EGLEnumPool,n_EGL_SINGLE_BUFFER),
+    offsetof(EGLEnumPool,n_EGL_RENDER_BUFFER),
+    offsetof(EGLEnumPool,n_EGL_VG_COLORSPACE),
+    offsetof(EGLEnumPool,n_EGL_VG_ALPHA_FORMAT),
+    offsetof(EGLEnumPool,n_EGL_VG_COLORSPACE_sRGB),
+    offsetof(EGLEnumPool,n_EGL_VG_COLORSPACE_LINEAR),
+    offsetof(EGLEnumPool,n_EGL_VG_ALPHA_FORMAT_NONPRE),
+    offsetof(EGLEnumPool,n_EGL_VG_ALPHA_FORMAT_PRE),
+    offsetof(EGLEnumPool,n_EGL_CLIENT_APIS),
+    offsetof(EGLEnumPool,n_EGL_RGB_BUFFER),
+    offsetof(EGLEnumPool,n_EGL_LUMINANCE_BUFFER),
+    offsetof(EGLEnumPool,n_EGL_HORIZONTAL_RESOLUTION),
+    offsetof(EGLEnumPool,n_EGL_VERTICAL_RESOLUTION),
+    offsetof(EGLEnumPool,n_EGL_PIXEL_ASPECT_RATIO),
+    offsetof(EGLEnumPool,n_EGL_SWAP_BEHAVIOR),
+    offsetof(EGLEnumPool,n_EGL_BUFFER_PRESERVED),
+    offsetof(EGLEnumPool,n_EGL_BUFFER_DESTROYED),
+    offsetof(EGLEnumPool,n_EGL_OPENVG_IMAGE),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_CLIENT_TYPE),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_CLIENT_VERSION),
+    offsetof(EGLEnumPool,n_EGL_MULTISAMPLE_RESOLVE),
+    offsetof(EGLEnumPool,n_EGL_MULTISAMPLE_RESOLVE_DEFAULT),
+    offsetof(EGLEnumPool,n_EGL_MULTISAMPLE_RESOLVE_BOX),
+    offsetof(EGLEnumPool,n_EGL_OPENGL_ES_API),
+    offsetof(EGLEnumPool,n_EGL_OPENVG_API),
+    offsetof(EGLEnumPool,n_EGL_OPENGL_API),
+    offsetof(EGLEnumPool,n_EGL_NATIVE_PIXMAP_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_TEXTURE_2D_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_TEXTURE_3D_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_X_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_X_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_Y_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_Y_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_Z_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_Z_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_RENDERBUFFER_KHR),
+    offsetof(EGLEnumPool,n_EGL_VG_PARENT_IMAGE_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_TEXTURE_LEVEL_KHR),
+    offsetof(EGLEnumPool,n_EGL_GL_TEXTURE_ZOFFSET_KHR),
+    offsetof(EGLEnumPool,n_EGL_POST_SUB_BUFFER_SUPPORTED_NV),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_OPENGL_ROBUST_ACCESS_EXT),
+    offsetof(EGLEnumPool,n_EGL_FORMAT_RGB_565_EXACT_KHR),
+    offsetof(EGLEnumPool,n_EGL_FORMAT_RGB_565_KHR),
+    offsetof(EGLEnumPool,n_EGL_FORMAT_RGBA_8888_EXACT_KHR),
+    offsetof(EGLEnumPool,n_EGL_FORMAT_RGBA_8888_KHR),
+    offsetof(EGLEnumPool,n_EGL_MAP_PRESERVE_PIXELS_KHR),
+    offsetof(EGLEnumPool,n_EGL_LOCK_USAGE_HINT_KHR),
+    offsetof(EGLEnumPool,n_EGL_BITMAP_POINTER_KHR),
+    offsetof(EGLEnumPool,n_EGL_BITMAP_PITCH_KHR),
+    offsetof(EGLEnumPool,n_EGL_BITMAP_ORIGIN_KHR),
+    offsetof(EGLEnumPool,n_EGL_BITMAP_PIXEL_RED_OFFSET_KHR),
+    offsetof(EGLEnumPool,n_EGL_BITMAP_PIXEL_GREEN_OFFSET_KHR),
+    offsetof(EGLEnumPool,n_EGL_BITMAP_PIXEL_BLUE_OFFSET_KHR),
+    offsetof(EGLEnumPool,n_EGL_BITMAP_PIXEL_ALPHA_OFFSET_KHR),
+    offsetof(EGLEnumPool,n_EGL_BITMAP_PIXEL_LUMINANCE_OFFSET_KHR),
+    offsetof(EGLEnumPool,n_EGL_LOWER_LEFT_KHR),
+    offsetof(EGLEnumPool,n_EGL_UPPER_LEFT_KHR),
+    offsetof(EGLEnumPool,n_EGL_IMAGE_PRESERVED_KHR),
+    offsetof(EGLEnumPool,n_EGL_COVERAGE_BUFFERS_NV),
+    offsetof(EGLEnumPool,n_EGL_COVERAGE_SAMPLES_NV),
+    offsetof(EGLEnumPool,n_EGL_DEPTH_ENCODING_NV),
+    offsetof(EGLEnumPool,n_EGL_DEPTH_ENCODING_NONLINEAR_NV),
+    offsetof(EGLEnumPool,n_EGL_SYNC_PRIOR_COMMANDS_COMPLETE_NV),
+    offsetof(EGLEnumPool,n_EGL_SYNC_STATUS_NV),
+    offsetof(EGLEnumPool,n_EGL_SIGNALED_NV),
+    offsetof(EGLEnumPool,n_EGL_UNSIGNALED_NV),
+    offsetof(EGLEnumPool,n_EGL_ALREADY_SIGNALED_NV),
+    offsetof(EGLEnumPool,n_EGL_TIMEOUT_EXPIRED_NV),
+    offsetof(EGLEnumPool,n_EGL_CONDITION_SATISFIED_NV),
+    offsetof(EGLEnumPool,n_EGL_SYNC_TYPE_NV),
+    offsetof(EGLEnumPool,n_EGL_SYNC_CONDITION_NV),
+    offsetof(EGLEnumPool,n_EGL_SYNC_FENCE_NV),
+    offsetof(EGLEnumPool,n_EGL_SYNC_PRIOR_COMMANDS_COMPLETE_KHR),
+    offsetof(EGLEnumPool,n_EGL_SYNC_STATUS_KHR),
+    offsetof(EGLEnumPool,n_EGL_SIGNALED_KHR),
+    offsetof(EGLEnumPool,n_EGL_UNSIGNALED_KHR),
+    offsetof(EGLEnumPool,n_EGL_TIMEOUT_EXPIRED_KHR),
+    offsetof(EGLEnumPool,n_EGL_CONDITION_SATISFIED_KHR),
+    offsetof(EGLEnumPool,n_EGL_SYNC_TYPE_KHR),
+    offsetof(EGLEnumPool,n_EGL_SYNC_CONDITION_KHR),
+    offsetof(EGLEnumPool,n_EGL_SYNC_FENCE_KHR),
+    offsetof(EGLEnumPool,n_EGL_SYNC_REUSABLE_KHR),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_MINOR_VERSION_KHR),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_FLAGS_KHR),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_OPENGL_PROFILE_MASK_KHR),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_PRIORITY_LEVEL_IMG),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_PRIORITY_HIGH_IMG),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_PRIORITY_MEDIUM_IMG),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_PRIORITY_LOW_IMG),
+    offsetof(EGLEnumPool,n_EGL_BITMAP_PIXEL_SIZE_KHR),
+    offsetof(EGLEnumPool,n_EGL_COVERAGE_SAMPLE_RESOLVE_NV),
+    offsetof(EGLEnumPool,n_EGL_COVERAGE_SAMPLE_RESOLVE_DEFAULT_NV),
+    offsetof(EGLEnumPool,n_EGL_COVERAGE_SAMPLE_RESOLVE_NONE_NV),
+    offsetof(EGLEnumPool,n_EGL_MULTIVIEW_VIEW_COUNT_EXT),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_EXT),
+    offsetof(EGLEnumPool,n_EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_KHR),
+    offsetof(EGLEnumPool,n_EGL_NO_RESET_NOTIFICATION_KHR),
+    offsetof(EGLEnumPool,n_EGL_LOSE_CONTEXT_ON_RESET_KHR),
+    offsetof(EGLEnumPool,n_EGL_DRM_BUFFER_FORMAT_MESA),
+    offsetof(EGLEnumPool,n_EGL_DRM_BUFFER_USE_MESA),
+    offsetof(EGLEnumPool,n_EGL_DRM_BUFFER_FORMAT_ARGB32_MESA),
+    offsetof(EGLEnumPool,n_EGL_DRM_BUFFER_MESA),
+    offsetof(EGLEnumPool,n_EGL_DRM_BUFFER_STRIDE_MESA),
+    offsetof(EGLEnumPool,n_EGL_STREAM_FIFO_LENGTH_KHR),
+    offsetof(EGLEnumPool,n_EGL_STREAM_TIME_NOW_KHR),
+    offsetof(EGLEnumPool,n_EGL_STREAM_TIME_CONSUMER_KHR),
+    offsetof(EGLEnumPool,n_EGL_STREAM_TIME_PRODUCER_KHR),
+    offsetof(EGLEnumPool,n_EGL_D3D_TEXTURE_2D_SHARE_HANDLE_ANGLE),
+    offsetof(EGLEnumPool,n_EGL_CONSUMER_LATENCY_USEC_KHR),
+    offsetof(EGLEnumPool,n_EGL_PRODUCER_FRAME_KHR),
+    offsetof(EGLEnumPool,n_EGL_CONSUMER_FRAME_KHR),
+    offsetof(EGLEnumPool,n_EGL_STREAM_STATE_KHR),
+    offsetof(EGLEnumPool,n_EGL_STREAM_STATE_CREATED_KHR),
+    offsetof(EGLEnumPool,n_EGL_STREAM_STATE_CONNECTING_KHR),
+    offsetof(EGLEnumPool,n_EGL_STREAM_STATE_EMPTY_KHR),
+    offsetof(EGLEnumPool,n_EGL_STREAM_STATE_NEW_FRAME_AVAILABLE_KHR),
+    offsetof(EGLEnumPool,n_EGL_STREAM_STATE_OLD_FRAME_AVAILABLE_KHR),
+    offsetof(EGLEnumPool,n_EGL_STREAM_STATE_DISCONNECTED_KHR),
+    offsetof(EGLEnumPool,n_EGL_BAD_STREAM_KHR),
+    offsetof(EGLEnumPool,n_EGL_BAD_STATE_KHR),
+    offsetof(EGLEnumPool,n_EGL_CONSUMER_ACQUIRE_TIMEOUT_USEC_KHR),
+    offsetof(EGLEnumPool,n_GL_COVERAGE_BUFFER_BIT_NV),
+    offsetof(EGLEnumPool,n_GL_DEPTH_COMPONENT16_NONLINEAR_NV),
+    offsetof(EGLEnumPool,n_GL_COVERAGE_COMPONENT_NV),
+    offsetof(EGLEnumPool,n_GL_COVERAGE_COMPONENT4_NV),
+    offsetof(EGLEnumPool,n_GL_COVERAGE_ATTACHMENT_NV),
+    offsetof(EGLEnumPool,n_GL_COVERAGE_BUFFERS_NV),
+    offsetof(EGLEnumPool,n_GL_COVERAGE_ALL_FRAGMENTS_NV),
+    offsetof(EGLEnumPool,n_GL_COVERAGE_EDGE_FRAGMENTS_NV),
+    offsetof(EGLEnumPool,n_GL_COVERAGE_AUTOMATIC_NV),
+    offsetof(EGLEnumPool,n_EGL_COLOR_FORMAT_HI),
+    offsetof(EGLEnumPool,n_EGL_COLOR_RGB_HI),
+    offsetof(EGLEnumPool,n_EGL_COLOR_RGBA_HI),
+    offsetof(EGLEnumPool,n_EGL_COLOR_ARGB_HI)
+  };
+
+  const short eglEnumSeed[218] = {
+    2, -1, -2, 1, 1, 2, 0, 0, -3, -5, 2, -8, 2, -21, -23, 0,
+    -26, -34, -40, -43, 0, -45, -47, -48, -54, 0, -55, 3, -56, 1, -57, -67,
+    9, 0, -68, 2, -70, 3, 1, 0, 1, -73, 0, 1, 0, 8, 0, 0,
+    1, 1, -74, -76, 1, -77, 0, 1, -79, -81, -82, 0, 4, 0, 1, 2,
+    -84, 3, 0, -88, 3, 0, -89, 10, 0, 0, 0, 0, 0, 1, 0, 0,
+    0, 0, 21, 0, -90, -91, -93, 0, 0, -94, 0, 12, -97, 0, -99, 0,
+    -100, 0, 0, -101, 0, 0, 0, 0, -102, -103, 1, 0, -105, 2, 0, -108,
+    -109, 0, -111, -112, -114, 14, 1, -122, -126, -127, -130, 0, -132, 0, 0, -135,
+    19, 0, -137, -139, -146, -147, 0, -152, -153, 3, 0, 4, 9, 1, 5, 1,
+    -156, 0, 2, 0, -157, 0, -160, 0, 0, 3, 0, 0, 0, 0, -161, -162,
+    0, -163, 0, 0, -164, -165, 18, 3, 0, 1, 0, 0, 0, -166, 0, 0,
+    37, 0, 0, -169, 0, 0, 0, -171, -172, -173, 0, 4, 22, -178, -179, 10,
+    -180, -183, 0, 0, 1, 0, -196, -198, 0, -200, -201, -203, -206, -207, 0, -209,
+    -216, 0, 20, 3, 9, 29, 0, 8, -218, 0
+  };
+
+  const unsigned short eglEnumSlot[218] = {
+    182, 205, 130, 43, 112, 90, 194, 203, 137, 111, 36, 199, 94, 76, 141, 19,
+    147, 70, 176, 171, 77, 214, 106, 26, 211, 146, 196, 121, 23, 34, 155, 165,
+    0, 168, 55, 139, 144, 89, 87, 48, 38, 73, 108, 136, 215, 37, 179, 27,
+    145, 35, 116, 18, 207, 213, 192, 24, 154, 190, 63, 2, 160, 118, 173, 212,
+    54, 143, 163, 29, 124, 151, 120, 49, 67, 117, 8, 17, 131, 42, 169, 3,
+    189, 66, 104, 53, 50, 14, 185, 107, 110, 56, 13, 59, 183, 46, 41, 152,
+    57, 10, 40, 45, 115, 52, 103, 186, 129, 105, 150, 9, 210, 208, 166, 98,
+    209, 187, 158, 97, 188, 74, 100, 180, 86, 181, 12, 134, 170, 85, 153, 157,
+    69, 92, 113, 172, 175, 72, 164, 44, 81, 25, 4, 193, 161, 22, 195, 135,
+    82, 174, 71, 133, 64, 1, 68, 47, 7, 21, 184, 88, 65, 191, 125, 78,
+    126, 127, 119, 167, 5, 149, 201, 84, 11, 83, 198, 102, 31, 148, 178, 6,
+    95, 128, 33, 60, 16, 206, 30, 197, 80, 39, 109, 142, 79, 162, 32, 156,
+    61, 28, 62, 216, 140, 51, 217, 99, 159, 101, 123, 122, 96, 114, 132, 93,
+    91, 177, 15, 75, 138, 58, 204, 20, 202, 200
+  };
+
+  #endif // REGAL_ENUM_TO_STRING
+
   const char * EGLenumToString(int v) {
     #if REGAL_ENUM_TO_STRING
-    switch( v ) {
-      case 0x00000000: return "EGL_FALSE";
-      case 0x00000001: return "EGL_TRUE";
-      case 0x00000002: return "EGL_DRM_BUFFER_USE_SHARE_MESA";
-      case 0x00000004: return "EGL_CONTEXT_OPENGL_ROBUST_ACCESS_BIT_KHR";
-      case 0x00000008: return "EGL_OPENGL_BIT";
-      case 0x00000020: return "EGL_VG_COLORSPACE_LINEAR_BIT_KHR";
-      case 0x00000040: return "EGL_OPENGL_ES3_BIT_KHR";
-      case 0x00000080: return "EGL_LOCK_SURFACE_BIT_KHR";
-      case 0x00000100: return "EGL_OPTIMAL_FORMAT_BIT_KHR";
-      case 0x00000200: return "EGL_MULTISAMPLE_RESOLVE_BOX_BIT";
-      case 0x00000400: return "EGL_SWAP_BEHAVIOR_PRESERVED_BIT";
-      case 0x00000800: return "EGL_STREAM_BIT_KHR";
-      case 0x00002710: return "EGL_DISPLAY_SCALING";
-      case 0x00003000: return "EGL_SUCCESS";
-      case 0x00003001: return "EGL_NOT_INITIALIZED";
-      case 0x00003002: return "EGL_BAD_ACCESS";
-      case 0x00003003: return "EGL_BAD_ALLOC";
-      case 0x00003004: return "EGL_BAD_ATTRIBUTE";
-      case 0x00003005: return "EGL_BAD_CONFIG";
-      case 0x00003006: return "EGL_BAD_CONTEXT";
-      case 0x00003007: return "EGL_BAD_CURRENT_SURFACE";
-      case 0x00003008: return "EGL_BAD_DISPLAY";
-      case 0x00003009: return "EGL_BAD_MATCH";
-      case 0x0000300a: return "EGL_BAD_NATIVE_PIXMAP";
-      case 0x0000300b: return "EGL_BAD_NATIVE_WINDOW";
-      case 0x0000300c: return "EGL_BAD_PARAMETER";
-      case 0x0000300d: return "EGL_BAD_SURFACE";
-      case 0x0000300e: return "EGL_CONTEXT_LOST";
-      case 0x00003020: return "EGL_BUFFER_SIZE";
-      case 0x00003021: return "EGL_ALPHA_SIZE";
-      case 0x00003022: return "EGL_BLUE_SIZE";
-      case 0x00003023: return "EGL_GREEN_SIZE";
-      case 0x00003024: return "EGL_RED_SIZE";
-      case 0x00003025: return "EGL_DEPTH_SIZE";
-      case 0x00003026: return "EGL_STENCIL_SIZE";
-      case 0x00003027: return "EGL_CONFIG_CAVEAT";
-      case 0x00003028: return "EGL_CONFIG_ID";
-      case 0x00003029: return "EGL_LEVEL";
-      case 0x0000302a: return "EGL_MAX_PBUFFER_HEIGHT";
-      case 0x0000302b: return "EGL_MAX_PBUFFER_PIXELS";
-      case 0x0000302c: return "EGL_MAX_PBUFFER_WIDTH";
-      case 0x0000302d: return "EGL_NATIVE_RENDERABLE";
-      case 0x0000302e: return "EGL_NATIVE_VISUAL_ID";
-      case 0x0000302f: return "EGL_NATIVE_VISUAL_TYPE";
-      case 0x00003031: return "EGL_SAMPLES";
-      case 0x00003032: return "EGL_SAMPLE_BUFFERS";
-      case 0x00003033: return "EGL_SURFACE_TYPE";
-      case 0x00003034: return "EGL_TRANSPARENT_TYPE";
-      case 0x00003035: return "EGL_TRANSPARENT_BLUE_VALUE";
-      case 0x00003036: return "EGL_TRANSPARENT_GREEN_VALUE";
-      case 0x00003037: return "EGL_TRANSPARENT_RED_VALUE";
-      case 0x00003038: return "EGL_NONE";
-      case 0x00003039: return "EGL_BIND_TO_TEXTURE_RGB";
-      case 0x0000303a: return "EGL_BIND_TO_TEXTURE_RGBA";
-      case 0x0000303b: return "EGL_MIN_SWAP_INTERVAL";
-      case 0x0000303c: return "EGL_MAX_SWAP_INTERVAL";
-      case 0x0000303d: return "EGL_LUMINANCE_SIZE";
-      case 0x0000303e: return "EGL_ALPHA_MASK_SIZE";
-      case 0x0000303f: return "EGL_COLOR_BUFFER_TYPE";
-      case 0x00003040: return "EGL_RENDERABLE_TYPE";
-      case 0x00003041: return "EGL_MATCH_NATIVE_PIXMAP";
-      case 0x00003042: return "EGL_CONFORMANT";
-      case 0x00003043: return "EGL_MATCH_FORMAT_KHR";
-      case 0x00003050: return "EGL_SLOW_CONFIG";
-      case 0x00003051: return "EGL_NON_CONFORMANT_CONFIG";
-      case 0x00003052: return "EGL_TRANSPARENT_RGB";
-      case 0x00003053: return "EGL_VENDOR";
-      case 0x00003054: return "EGL_VERSION";
-      case 0x00003055: return "EGL_EXTENSIONS";
-      case 0x00003056: return "EGL_HEIGHT";
-      case 0x00003057: return "EGL_WIDTH";
-      case 0x00003058: return "EGL_LARGEST_PBUFFER";
-      case 0x00003059: return "EGL_DRAW";
-      case 0x0000305a: return "EGL_READ";
-      case 0x0000305b: return "EGL_CORE_NATIVE_ENGINE";
-      case 0x0000305c: return "EGL_NO_TEXTURE";
-      case 0x0000305d: return "EGL_TEXTURE_RGB";
-      case 0x0000305e: return "EGL_TEXTURE_RGBA";
-      case 0x0000305f: return "EGL_TEXTURE_2D";
-      case 0x00003080: return "EGL_TEXTURE_FORMAT";
-      case 0x00003081: return "EGL_TEXTURE_TARGET";
-      case 0x00003082: return "EGL_MIPMAP_TEXTURE";
-      case 0x00003083: return "EGL_MIPMAP_LEVEL";
-      case 0x00003084: return "EGL_BACK_BUFFER";
-      case 0x00003085: return "EGL_SINGLE_BUFFER";
-      case 0x00003086: return "EGL_RENDER_BUFFER";
-      case 0x00003087: return "EGL_VG_COLORSPACE";
-      case 0x00003088: return "EGL_VG_ALPHA_FORMAT";
-      case 0x00003089: return "EGL_VG_COLORSPACE_sRGB";
-      case 0x0000308a: return "EGL_VG_COLORSPACE_LINEAR";
-      case 0x0000308b: return "EGL_VG_ALPHA_FORMAT_NONPRE";
-      case 0x0000308c: return "EGL_VG_ALPHA_FORMAT_PRE";
-      case 0x0000308d: return "EGL_CLIENT_APIS";
-      case 0x0000308e: return "EGL_RGB_BUFFER";
-      case 0x0000308f: return "EGL_LUMINANCE_BUFFER";
-      case 0x00003090: return "EGL_HORIZONTAL_RESOLUTION";
-      case 0x00003091: return "EGL_VERTICAL_RESOLUTION";
-      case 0x00003092: return "EGL_PIXEL_ASPECT_RATIO";
-      case 0x00003093: return "EGL_SWAP_BEHAVIOR";
-      case 0x00003094: return "EGL_BUFFER_PRESERVED";
-      case 0x00003095: return "EGL_BUFFER_DESTROYED";
-      case 0x00003096: return "EGL_OPENVG_IMAGE";
-      case 0x00003097: return "EGL_CONTEXT_CLIENT_TYPE";
-      case 0x00003098: return "EGL_CONTEXT_CLIENT_VERSION";
-      case 0x00003099: return "EGL_MULTISAMPLE_RESOLVE";
-      case 0x0000309a: return "EGL_MULTISAMPLE_RESOLVE_DEFAULT";
-      case 0x0000309b: return "EGL_MULTISAMPLE_RESOLVE_BOX";
-      case 0x000030a0: return "EGL_OPENGL_ES_API";
-      case 0x000030a1: return "EGL_OPENVG_API";
-      case 0x000030a2: return "EGL_OPENGL_API";
-      case 0x000030b0: return "EGL_NATIVE_PIXMAP_KHR";
-      case 0x000030b1: return "EGL_GL_TEXTURE_2D_KHR";
-      case 0x000030b2: return "EGL_GL_TEXTURE_3D_KHR";
-      case 0x000030b3: return "EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_X_KHR";
-      case 0x000030b4: return "EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_X_KHR";
-      case 0x000030b5: return "EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_Y_KHR";
-      case 0x000030b6: return "EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_Y_KHR";
-      case 0x000030b7: return "EGL_GL_TEXTURE_CUBE_MAP_POSITIVE_Z_KHR";
-      case 0x000030b8: return "EGL_GL_TEXTURE_CUBE_MAP_NEGATIVE_Z_KHR";
-      case 0x000030b9: return "EGL_GL_RENDERBUFFER_KHR";
-      case 0x000030ba: return "EGL_VG_PARENT_IMAGE_KHR";
-      case 0x000030bc: return "EGL_GL_TEXTURE_LEVEL_KHR";
-      case 0x000030bd: return "EGL_GL_TEXTURE_ZOFFSET_KHR";
-      case 0x000030be: return "EGL_POST_SUB_BUFFER_SUPPORTED_NV";
-      case 0x000030bf: return "EGL_CONTEXT_OPENGL_ROBUST_ACCESS_EXT";
-      case 0x000030c0: return "EGL_FORMAT_RGB_565_EXACT_KHR";
-      case 0x000030c1: return "EGL_FORMAT_RGB_565_KHR";
-      case 0x000030c2: return "EGL_FORMAT_RGBA_8888_EXACT_KHR";
-      case 0x000030c3: return "EGL_FORMAT_RGBA_8888_KHR";
-      case 0x000030c4: return "EGL_MAP_PRESERVE_PIXELS_KHR";
-      case 0x000030c5: return "EGL_LOCK_USAGE_HINT_KHR";
-      case 0x000030c6: return "EGL_BITMAP_POINTER_KHR";
-      case 0x000030c7: return "EGL_BITMAP_PITCH_KHR";
-      case 0x000030c8: return "EGL_BITMAP_ORIGIN_KHR";
-      case 0x000030c9: return "EGL_BITMAP_PIXEL_RED_OFFSET_KHR";
-      case 0x000030ca: return "EGL_BITMAP_PIXEL_GREEN_OFFSET_KHR";
-      case 0x000030cb: return "EGL_BITMAP_PIXEL_BLUE_OFFSET_KHR";
-      case 0x000030cc: return "EGL_BITMAP_PIXEL_ALPHA_OFFSET_KHR";
-      case 0x000030cd: return "EGL_BITMAP_PIXEL_LUMINANCE_OFFSET_KHR";
-      case 0x000030ce: return "EGL_LOWER_LEFT_KHR";
-      case 0x000030cf: return "EGL_UPPER_LEFT_KHR";
-      case 0x000030d2: return "EGL_IMAGE_PRESERVED_KHR";
-      case 0x000030e0: return "EGL_COVERAGE_BUFFERS_NV";
-      case 0x000030e1: return "EGL_COVERAGE_SAMPLES_NV";
-      case 0x000030e2: return "EGL_DEPTH_ENCODING_NV";
-      case 0x000030e3: return "EGL_DEPTH_ENCODING_NONLINEAR_NV";
-      case 0x000030e6: return "EGL_SYNC_PRIOR_COMMANDS_COMPLETE_NV";
-      case 0x000030e7: return "EGL_SYNC_STATUS_NV";
-      case 0x000030e8: return "EGL_SIGNALED_NV";
-      case 0x000030e9: return "EGL_UNSIGNALED_NV";
-      case 0x000030ea: return "EGL_ALREADY_SIGNALED_NV";
-      case 0x000030eb: return "EGL_TIMEOUT_EXPIRED_NV";
-      case 0x000030ec: return "EGL_CONDITION_SATISFIED_NV";
-      case 0x000030ed: return "EGL_SYNC_TYPE_NV";
-      case 0x000030ee: return "EGL_SYNC_CONDITION_NV";
-      case 0x000030ef: return "EGL_SYNC_FENCE_NV";
-      case 0x000030f0: return "EGL_SYNC_PRIOR_COMMANDS_COMPLETE_KHR";
-      case 0x000030f1: return "EGL_SYNC_STATUS_KHR";
-      case 0x000030f2: return "EGL_SIGNALED_KHR";
-      case 0x000030f3: return "EGL_UNSIGNALED_KHR";
-      case 0x000030f5: return "EGL_TIMEOUT_EXPIRED_KHR";
-      case 0x000030f6: return "EGL_CONDITION_SATISFIED_KHR";
-      case 0x000030f7: return "EGL_SYNC_TYPE_KHR";
-      case 0x000030f8: return "EGL_SYNC_CONDITION_KHR";
-      case 0x000030f9: return "EGL_SYNC_FENCE_KHR";
-      case 0x000030fa: return "EGL_SYNC_REUSABLE_KHR";
-      case 0x000030fb: return "EGL_CONTEXT_MINOR_VERSION_KHR";
-      case 0x000030fc: return "EGL_CONTEXT_FLAGS_KHR";
-      case 0x000030fd: return "EGL_CONTEXT_OPENGL_PROFILE_MASK_KHR";
-      case 0x00003100: return "EGL_CONTEXT_PRIORITY_LEVEL_IMG";
-      case 0x00003101: return "EGL_CONTEXT_PRIORITY_HIGH_IMG";
-      case 0x00003102: return "EGL_CONTEXT_PRIORITY_MEDIUM_IMG";
-      case 0x00003103: return "EGL_CONTEXT_PRIORITY_LOW_IMG";
-      case 0x00003110: return "EGL_BITMAP_PIXEL_SIZE_KHR";
-      case 0x00003131: return "EGL_COVERAGE_SAMPLE_RESOLVE_NV";
-      case 0x00003132: return "EGL_COVERAGE_SAMPLE_RESOLVE_DEFAULT_NV";
-      case 0x00003133: return "EGL_COVERAGE_SAMPLE_RESOLVE_NONE_NV";
-      case 0x00003134: return "EGL_MULTIVIEW_VIEW_COUNT_EXT";
-      case 0x00003138: return "EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_EXT";
-      case 0x000031bd: return "EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_KHR";
-      case 0x000031be: return "EGL_NO_RESET_NOTIFICATION_KHR";
-      case 0x000031bf: return "EGL_LOSE_CONTEXT_ON_RESET_KHR";
-      case 0x000031d0: return "EGL_DRM_BUFFER_FORMAT_MESA";
-      case 0x000031d1: return "EGL_DRM_BUFFER_USE_MESA";
-      case 0x000031d2: return "EGL_DRM_BUFFER_FORMAT_ARGB32_MESA";
-      case 0x000031d3: return "EGL_DRM_BUFFER_MESA";
-      case 0x000031d4: return "EGL_DRM_BUFFER_STRIDE_MESA";
-      case 0x000031fc: return "EGL_STREAM_FIFO_LENGTH_KHR";
-      case 0x000031fd: return "EGL_STREAM_TIME_NOW_KHR";
-      case 0x000031fe: return "EGL_STREAM_TIME_CONSUMER_KHR";
-      case 0x000031ff: return "EGL_STREAM_TIME_PRODUCER_KHR";
-      case 0x00003200: return "EGL_D3D_TEXTURE_2D_SHARE_HANDLE_ANGLE";
-      case 0x00003210: return "EGL_CONSUMER_LATENCY_USEC_KHR";
-      case 0x00003212: return "EGL_PRODUCER_FRAME_KHR";
-      case 0x00003213: return "EGL_CONSUMER_FRAME_KHR";
-      case 0x00003214: return "EGL_STREAM_STATE_KHR";
-      case 0x00003215: return "EGL_STREAM_STATE_CREATED_KHR";
-      case 0x00003216: return "EGL_STREAM_STATE_CONNECTING_KHR";
-      case 0x00003217: return "EGL_STREAM_STATE_EMPTY_KHR";
-      case 0x00003218: return "EGL_STREAM_STATE_NEW_FRAME_AVAILABLE_KHR";
-      case 0x00003219: return "EGL_STREAM_STATE_OLD_FRAME_AVAILABLE_KHR";
-      case 0x0000321a: return "EGL_STREAM_STATE_DISCONNECTED_KHR";
-      case 0x0000321b: return "EGL_BAD_STREAM_KHR";
-      case 0x0000321c: return "EGL_BAD_STATE_KHR";
-      case 0x0000321e: return "EGL_CONSUMER_ACQUIRE_TIMEOUT_USEC_KHR";
-      case 0x00008000: return "GL_COVERAGE_BUFFER_BIT_NV";
-      case 0x00008e2c: return "GL_DEPTH_COMPONENT16_NONLINEAR_NV";
-      case 0x00008ed0: return "GL_COVERAGE_COMPONENT_NV";
-      case 0x00008ed1: return "GL_COVERAGE_COMPONENT4_NV";
-      case 0x00008ed2: return "GL_COVERAGE_ATTACHMENT_NV";
-      case 0x00008ed3: return "GL_COVERAGE_BUFFERS_NV";
-      case 0x00008ed5: return "GL_COVERAGE_ALL_FRAGMENTS_NV";
-      case 0x00008ed6: return "GL_COVERAGE_EDGE_FRAGMENTS_NV";
-      case 0x00008ed7: return "GL_COVERAGE_AUTOMATIC_NV";
-      case 0x00008f70: return "EGL_COLOR_FORMAT_HI";
-      case 0x00008f71: return "EGL_COLOR_RGB_HI";
-      case 0x00008f72: return "EGL_COLOR_RGBA_HI";
-      case 0x00008f73: return "EGL_COLOR_ARGB_HI";
-      default: break;
-    }
+    const char *name = enumToString(static_cast<GLuint>(v), eglEnumValue, eglEnumName, &eglEnumPool, eglEnumSeed, eglEnumSlot, 218);
+    if (name)
+      return name;
     #endif // REGAL_ENUM_TO_STRING
     return "unknown_egl_enum";
   }
@@ -522,6 +522,26 @@
 #  define REGAL_NO_TLS 0
 #endif
 
+// Compiler thread-local storage, rather than pthread_getspecific
+
+#ifndef REGAL_GCC_TLS
+#  if defined(__linux__) && defined(__GNUC__) && !REGAL_SYS_ANDROID
+#    define REGAL_GCC_TLS 1
+#  else
+#    define REGAL_GCC_TLS 0
+#  endif
+#endif
+
+// Compiler TLS uses the default model, so that Regal can be dlopen'd.
+// Builds that are never dlopen'd can opt in to another model,
+// -DREGAL_TLS_MODEL=initial-exec for example.
+
+#if REGAL_GCC_TLS && defined(REGAL_TLS_MODEL)
+#  define REGAL_TLS_ATTRIBUTE __attribute__((tls_model(REGAL_EQUOTE(REGAL_TLS_MODEL))))
+#else
+#  define REGAL_TLS_ATTRIBUTE
+#endif
+
 #ifndef REGAL_NO_JSON
 #  define REGAL_NO_JSON 0
 #endif
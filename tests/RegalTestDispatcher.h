@@ -0,0 +1,126 @@
+/*
+  Copyright (c) 2011-2013 NVIDIA Corporation
+  Copyright (c) 2013 Nigel Stewart
+  All rights reserved.
+
+  Redistribution and use in source and binary forms, with or without modification,
+  are permitted provided that the following conditions are met:
+
+    Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+  IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT,
+  INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+  DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE
+  OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
+  OF THE POSSIBILITY OF SUCH DAMAGE.
+*/
+
+
+#ifndef __REGAL_TEST_DISPATCHER_H__
+#define __REGAL_TEST_DISPATCHER_H__
+
+#include <GL/Regal.h>
+
+#include <cstring>
+
+#include "RegalDispatcher.h"
+
+// Shared by testRegalDispatch.cpp and benchRegal.cpp
+
+namespace {
+
+using namespace Regal;
+
+// ====================================
+// Regal::Dispatcher
+// ====================================
+
+const int layers = 8;
+
+struct TestDispatcher;
+
+TestDispatcher *dispatcher = NULL;
+int             driverCalls = 0;
+int             layerCalls  = 0;
+
+static void REGAL_CALL driverFlush() { ++driverCalls; }
+
+// Pass-through layer N, as generated for the debug and http layers
+
+template<int N> static void REGAL_CALL layerFlush();
+
+// As above, but stepping down the stack for each call
+
+template<int N> static void REGAL_CALL layerFlushWalk();
+
+typedef void (REGAL_CALL *FlushProc)(void);
+
+const FlushProc flatten[layers] = { layerFlush<0>,     layerFlush<1>,     layerFlush<2>,     layerFlush<3>,
+                                    layerFlush<4>,     layerFlush<5>,     layerFlush<6>,     layerFlush<7>     };
+const FlushProc walk[layers]    = { layerFlushWalk<0>, layerFlushWalk<1>, layerFlushWalk<2>, layerFlushWalk<3>,
+                                    layerFlushWalk<4>, layerFlushWalk<5>, layerFlushWalk<6>, layerFlushWalk<7> };
+
+// Eight disabled layers above the driver, implementing glFlush only
+
+struct TestDispatcher : public Dispatcher
+{
+  TestDispatcher(const FlushProc *layerProc)
+  : Dispatcher(sizeof(DispatchTableGL))
+  {
+    ::memset(&layer, 0,sizeof(layer));
+    ::memset(&driver,0,sizeof(driver));
+
+    for (int i=0; i<layers; ++i)
+    {
+      layer[i].glFlush = layerProc[i];
+      push_back(layer[i],false);
+    }
+
+    driver.glFlush = driverFlush;
+    push_back(driver,true);
+
+    dispatcher  = this;
+    driverCalls = 0;
+    layerCalls  = 0;
+  }
+
+  inline void push_back(DispatchTableGL &table, bool enable)             { Dispatcher::push_back(table,enable);   }
+  inline bool erase    (DispatchTableGL &table)                          { return Dispatcher::erase(table);       }
+  inline bool insert   (DispatchTableGL &other, DispatchTableGL &table)  { return Dispatcher::insert(other,table); }
+  inline void enable   (DispatchTableGL &table)                          { Dispatcher::enable (table);            }
+  inline void disable  (DispatchTableGL &table)                          { Dispatcher::disable(table);            }
+  inline DispatchTableGL &front()                                        { return reinterpret_cast<DispatchTableGL &>(Dispatcher::front()); }
+
+  DispatchTableGL layer[layers];
+  DispatchTableGL driver;
+};
+
+template<int N>
+static void REGAL_CALL layerFlush()
+{
+  ++layerCalls;
+  DispatchTableGL *_next = dispatcher->layer[N].next();
+  _next->call(&_next->glFlush)();
+}
+
+template<int N>
+static void REGAL_CALL layerFlushWalk()
+{
+  ++layerCalls;
+  DispatchTableGL *_next = dispatcher->layer[N].next();
+  Dispatch::call(*_next,&_next->glFlush)();
+}
+
+}
+
+#endif
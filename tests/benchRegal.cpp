@@ -0,0 +1,139 @@
+/*
+  Copyright (c) 2011-2013 NVIDIA Corporation
+  Copyright (c) 2013 Nigel Stewart
+  All rights reserved.
+
+  Redistribution and use in source and binary forms, with or without modification,
+  are permitted provided that the following conditions are met:
+
+    Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+  IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT,
+  INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+  DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE
+  OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
+  OF THE POSSIBILITY OF SUCH DAMAGE.
+*/
+
+
+#include "gtest/gtest.h"
+
+#include <GL/Regal.h>
+
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+
+#include "RegalLookup.h"
+#include "RegalTimer.h"
+#include "RegalTestDispatcher.h"
+
+// Timings for comparison, run by "make benchmark" rather than as
+// part of regaltest.
+
+namespace {
+
+using namespace Regal;
+using namespace Regal::Lookup;
+
+// ====================================
+// Regal::Dispatcher
+// ====================================
+
+// Per-call overhead with 0, 3 and 8 layers enabled, flattened
+// and stepping down the stack.
+
+TEST( RegalDispatcher, Benchmark )
+{
+  const int calls    = 1000000;
+  const int active[] = { 0, 3, 8 };
+
+  for (int i=0; i<3; ++i)
+  {
+    Timer::Value elapsed[2];
+
+    for (int j=0; j<2; ++j)
+    {
+      TestDispatcher d(j ? walk : flatten);
+      DispatchTableGL &front = d.front();
+
+      for (int k=0; k<active[i]; ++k)
+        d.enable(d.layer[k*layers/active[i]]);
+
+      Timer timer;
+      timer.restart();
+      for (int k=0; k<calls; ++k)
+      {
+        if (j)
+          Dispatch::call(front,&front.glFlush)();
+        else
+          front.call(&front.glFlush)();
+      }
+      elapsed[j] = timer.elapsed();
+
+      EXPECT_EQ(calls,           driverCalls);
+      EXPECT_EQ(calls*active[i], layerCalls);
+    }
+
+    std::printf("Dispatch with %d of %d layers enabled: %6.2f ns per call, %6.2f ns stepping down the stack\n",
+      active[i], layers, elapsed[0]*1000.0/calls, elapsed[1]*1000.0/calls);
+  }
+}
+
+// ====================================
+// Regal::Lookup
+// ====================================
+
+size_t glNames()
+{
+  size_t n = 0;
+  while (gl_Name[n])
+    ++n;
+  return n;
+}
+
+int NameCmp(const void *a, const void *b)
+{
+  return std::strcmp(*(const char **) a, *(const char **) b);
+}
+
+// Every name looked up, compared with std::bsearch.
+
+TEST( RegalLookup, Benchmark )
+{
+  const size_t n      = glNames();
+  const int    repeat = 100;
+
+  Timer::Value elapsed[2];
+  Timer timer;
+  size_t found = 0;
+
+  timer.restart();
+  for (int i=0; i<repeat; ++i)
+    for (size_t j=0; j<n; ++j)
+      found += NameIndex(gl_Name[j], gl_Name, gl_Seed, gl_Slot, n)<n;
+  elapsed[0] = timer.elapsed();
+
+  timer.restart();
+  for (int i=0; i<repeat; ++i)
+    for (size_t j=0; j<n; ++j)
+      found += std::bsearch(&gl_Name[j], gl_Name, n, sizeof(const char *), NameCmp)!=NULL;
+  elapsed[1] = timer.elapsed();
+
+  EXPECT_EQ(2*repeat*n, found);
+
+  std::printf("Lookup of %d names: %6.2f ns per name, %6.2f ns with std::bsearch\n",
+    int(n), elapsed[0]*1000.0/(repeat*n), elapsed[1]*1000.0/(repeat*n));
+}
+
+}
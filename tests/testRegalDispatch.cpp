@@ -0,0 +1,113 @@
+/*
+  Copyright (c) 2011-2013 NVIDIA Corporation
+  Copyright (c) 2013 Nigel Stewart
+  All rights reserved.
+
+  Redistribution and use in source and binary forms, with or without modification,
+  are permitted provided that the following conditions are met:
+
+    Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+  IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT,
+  INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+  DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE
+  OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
+  OF THE POSSIBILITY OF SUCH DAMAGE.
+*/
+
+
+#include "gtest/gtest.h"
+
+#include "RegalThread.h"
+#include "RegalTestDispatcher.h"
+
+namespace {
+
+using namespace Regal;
+
+// ====================================
+// Regal::Dispatcher
+// ====================================
+
+static void REGAL_CALL driverFinish() { ++driverCalls; }
+
+TEST( RegalDispatcher, Resolve )
+{
+  TestDispatcher d(flatten);
+  DispatchTableGL &front = d.front();
+
+  // All layers disabled, straight to the driver
+
+  EXPECT_TRUE(&front==&d.layer[0]);
+  EXPECT_TRUE(front.call(&front.glFlush)==driverFlush);
+
+  // The first enabled layer
+
+  d.enable(d.layer[3]);
+  EXPECT_TRUE(front.call(&front.glFlush)==flatten[3]);
+  d.enable(d.layer[1]);
+  EXPECT_TRUE(front.call(&front.glFlush)==flatten[1]);
+  EXPECT_TRUE(d.layer[2].call(&d.layer[2].glFlush)==flatten[3]);
+  d.disable(d.layer[1]);
+  EXPECT_TRUE(front.call(&front.glFlush)==flatten[3]);
+
+  front.call(&front.glFlush)();
+  EXPECT_EQ(1, layerCalls);
+  EXPECT_EQ(1, driverCalls);
+
+  // Set after push_back, as by the lazy loader
+
+  EXPECT_TRUE(front.call(&front.glFinish)==NULL);
+  d.driver.glFinish = driverFinish;
+  Dispatcher::refresh(d.driver,reinterpret_cast<void **>(&d.driver.glFinish));
+  EXPECT_TRUE(front.call(&front.glFinish)==driverFinish);
+
+  // Remove and insert
+
+  EXPECT_TRUE(d.erase(d.layer[3]));
+  EXPECT_TRUE(d.layer[3]._resolved==NULL);
+  EXPECT_TRUE(front.call(&front.glFlush)==driverFlush);
+  EXPECT_TRUE(d.insert(d.driver,d.layer[3]));
+  EXPECT_TRUE(front.call(&front.glFlush)==flatten[3]);
+
+  // Same as stepping down the stack
+
+  for (int i=0; i<layers; ++i)
+    EXPECT_TRUE(d.layer[i].call(&d.layer[i].glFlush)==Dispatch::call(d.layer[i],&d.layer[i].glFlush));
+}
+
+// ====================================
+// Regal::Thread::ThreadLocal
+// ====================================
+
+TEST( RegalThread, CurrentDispatchTable )
+{
+  TestDispatcher d(flatten);
+  for (int i=0; i<3; ++i)
+    d.enable(d.layer[i*layers/3]);
+
+  Thread::ThreadLocal &instance = Thread::ThreadLocal::instance();
+  instance.currentDispatchTable = &d.front();
+  EXPECT_TRUE(Thread::CurrentDispatchTable()==&d.layer[0]);
+
+  DispatchTableGL *_next = Thread::CurrentDispatchTable();
+  _next->call(&_next->glFlush)();
+
+  EXPECT_EQ(1, driverCalls);
+  EXPECT_EQ(3, layerCalls);
+
+  instance.currentDispatchTable = NULL;
+  EXPECT_TRUE(Thread::CurrentDispatchTable()==NULL);
+}
+
+}
@@ -0,0 +1,150 @@
+/*
+  Copyright (c) 2011-2013 NVIDIA Corporation
+  Copyright (c) 2013 Nigel Stewart
+  All rights reserved.
+
+  Redistribution and use in source and binary forms, with or without modification,
+  are permitted provided that the following conditions are met:
+
+    Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+  IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT,
+  INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+  DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE
+  OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
+  OF THE POSSIBILITY OF SUCH DAMAGE.
+*/
+
+
+#include "gtest/gtest.h"
+
+#include <GL/Regal.h>
+
+#include <cstring>
+#include <vector>
+
+#include "RegalDispatch.h"
+#include "RegalLoader.h"
+
+namespace {
+
+using namespace std;
+using namespace Regal;
+using namespace Regal::Loader;
+
+// ====================================
+// Regal::Loader
+// ====================================
+
+TEST( RegalLoader, ParseProfile )
+{
+  set<string> profile;
+  ParseProfile(profile,"glClear\nglFlush\r\n\r\n\nglFinish");
+
+  EXPECT_EQ(3u, profile.size());
+  EXPECT_EQ(1u, profile.count("glClear"));
+  EXPECT_EQ(1u, profile.count("glFlush"));
+  EXPECT_EQ(1u, profile.count("glFinish"));
+  EXPECT_EQ(0u, profile.count(""));
+  EXPECT_EQ(0u, profile.count("glFlush\r"));
+
+  profile.clear();
+  ParseProfile(profile,"");
+  EXPECT_EQ(0u, profile.size());
+}
+
+// A table of three entry points, with a lazy loader for each,
+// laid out as DispatchTableGL and Dispatch::GL
+
+struct TestFuncs
+{
+  void (*glClear)();
+  void (*glFlush)();
+  void (*glFinish)();
+};
+
+struct TestTable : public DispatchTable, TestFuncs
+{
+};
+
+static void lazyClear()  {}
+static void lazyFlush()  {}
+static void lazyFinish() {}
+static void driver()     {}
+
+const Entry entry[] =
+{
+  { "glClear",  offsetof(TestFuncs,glClear),  lazyClear  },
+  { "glFlush",  offsetof(TestFuncs,glFlush),  lazyFlush  },
+  { "glFinish", offsetof(TestFuncs,glFinish), lazyFinish },
+  { NULL, 0, NULL }
+};
+
+vector<string> resolved;
+
+static void testResolve(DispatchTable &, void (**func)(), void (*funcRegal)(), const char *name)
+{
+  EXPECT_TRUE(*func==funcRegal);
+  *func = driver;
+  resolved.push_back(name);
+}
+
+static void testInit(TestTable &table)
+{
+  ::memset(&table,0,sizeof(table));
+  table.glClear  = lazyClear;
+  table.glFlush  = lazyFlush;
+  table.glFinish = lazyFinish;
+  resolved.clear();
+}
+
+TEST( RegalLoader, Resolve )
+{
+  TestTable   table;
+  set<string> profile;
+
+  // Everything, without a profile
+
+  testInit(table);
+  EXPECT_EQ(3u, Resolve(table,static_cast<TestFuncs *>(&table),entry,profile,testResolve));
+  ASSERT_EQ(3u, resolved.size());
+  EXPECT_EQ("glClear",  resolved[0]);
+  EXPECT_EQ("glFinish", resolved[2]);
+  EXPECT_TRUE(table.glClear==driver && table.glFlush==driver && table.glFinish==driver);
+
+  // Already resolved entries are skipped
+
+  resolved.clear();
+  EXPECT_EQ(0u, Resolve(table,static_cast<TestFuncs *>(&table),entry,profile,testResolve));
+  EXPECT_EQ(0u, resolved.size());
+
+  testInit(table);
+  table.glFlush = driver;
+  EXPECT_EQ(2u, Resolve(table,static_cast<TestFuncs *>(&table),entry,profile,testResolve));
+  ASSERT_EQ(2u, resolved.size());
+  EXPECT_EQ("glClear",  resolved[0]);
+  EXPECT_EQ("glFinish", resolved[1]);
+
+  // Only those in the profile, others remain lazy
+
+  testInit(table);
+  ParseProfile(profile,"glFinish\r\nglNotAFunction\r\n");
+  EXPECT_EQ(1u, Resolve(table,static_cast<TestFuncs *>(&table),entry,profile,testResolve));
+  ASSERT_EQ(1u, resolved.size());
+  EXPECT_EQ("glFinish", resolved[0]);
+  EXPECT_TRUE(table.glClear==lazyClear);
+  EXPECT_TRUE(table.glFlush==lazyFlush);
+  EXPECT_TRUE(table.glFinish==driver);
+}
+
+}
@@ -0,0 +1,130 @@
+/*
+  Copyright (c) 2011-2013 NVIDIA Corporation
+  Copyright (c) 2013 Nigel Stewart
+  All rights reserved.
+
+  Redistribution and use in source and binary forms, with or without modification,
+  are permitted provided that the following conditions are met:
+
+    Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+  IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT,
+  INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+  DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE
+  OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
+  OF THE POSSIBILITY OF SUCH DAMAGE.
+*/
+
+
+#include "gtest/gtest.h"
+
+#include <GL/Regal.h>
+
+#include <cstddef>
+
+#include "RegalLookup.h"
+#include "RegalDispatch.h"
+#include "RegalContextInfo.h"
+#include "RegalEmuInfo.h"
+
+namespace {
+
+using namespace Regal;
+using namespace Regal::Lookup;
+
+// ====================================
+// Regal::Lookup
+// ====================================
+
+size_t glNames()
+{
+  size_t n = 0;
+  while (gl_Name[n])
+    ++n;
+  return n;
+}
+
+TEST( RegalLookup, NameIndex )
+{
+  const size_t n = glNames();
+
+  // Each name at its own index
+
+  for (size_t i=0; i<n; ++i)
+    EXPECT_EQ(i, NameIndex(gl_Name[i], gl_Name, gl_Seed, gl_Slot, n)) << gl_Name[i];
+
+  // Not found
+
+  EXPECT_EQ(n, NameIndex("",              gl_Name, gl_Seed, gl_Slot, n));
+  EXPECT_EQ(n, NameIndex("glaccum",       gl_Name, gl_Seed, gl_Slot, n));
+  EXPECT_EQ(n, NameIndex("glAccumulate",  gl_Name, gl_Seed, gl_Slot, n));
+  EXPECT_EQ(n, NameIndex("glXSwapBuffers",gl_Name, gl_Seed, gl_Slot, n));
+
+  EXPECT_TRUE(gl_Lookup<void *>("glNotAFunction")==NULL);
+  EXPECT_EQ(0u, gl_LookupOffset("glNotAFunction"));
+  EXPECT_EQ(offsetof(Dispatch::GL,glClear)/sizeof(void *), gl_LookupOffset("glClear"));
+}
+
+// ====================================
+// Regal::ContextInfo, Regal::EmuInfo
+// ====================================
+
+TEST( RegalLookup, Extension )
+{
+  ContextInfo info;
+  info.gl_arb_draw_buffers = true;
+
+  EXPECT_TRUE (info.getExtension("GL_ARB_draw_buffers"));
+  EXPECT_FALSE(info.getExtension("GL_ARB_multitexture"));
+  EXPECT_FALSE(info.getExtension("GL_ARB_not_an_extension"));
+  EXPECT_FALSE(info.getExtension(""));
+
+  EXPECT_NE(info.extensionIndex("GL_ARB_draw_buffers"), info.extensionIndex("GL_ARB_multitexture"));
+  EXPECT_TRUE (info.getExtension(info.extensionIndex("GL_ARB_draw_buffers")));
+
+  // Every name maps to its own index, unknown names to the table size
+
+  size_t n = 0;
+  for (; ContextInfo::extensionName(n); ++n)
+    EXPECT_EQ(n, ContextInfo::extensionIndex(ContextInfo::extensionName(n)));
+
+  EXPECT_LT(0u, n);
+  EXPECT_STREQ("GL_ARB_draw_buffers", ContextInfo::extensionName(ContextInfo::extensionIndex("GL_ARB_draw_buffers")));
+  EXPECT_EQ(n, ContextInfo::extensionIndex("GL_ARB_not_an_extension"));
+  EXPECT_EQ(n, ContextInfo::extensionIndex(""));
+
+  EmuInfo emuInfo;
+  emuInfo.gl_arb_multitexture = true;
+
+  EXPECT_TRUE (emuInfo.getExtension(info, "GL_ARB_draw_buffers"));
+  EXPECT_TRUE (emuInfo.getExtension(info, "GL_ARB_multitexture"));
+  EXPECT_TRUE (emuInfo.getExtension(info, "GL_REGAL_log"));
+  EXPECT_FALSE(emuInfo.getExtension(info, "GL_ARB_sampler_objects"));
+  EXPECT_FALSE(emuInfo.getExtension(info, "GL_ARB_not_an_extension"));
+
+  EXPECT_TRUE (emuInfo.isSupported(info, "GL_ARB_draw_buffers GL_ARB_multitexture GL_REGAL_log"));
+  EXPECT_FALSE(emuInfo.isSupported(info, "GL_ARB_draw_buffers GL_ARB_sampler_objects"));
+
+  // Set by index, as ContextInfo::init
+
+  info.setExtension(info.extensionIndex("GL_ARB_sampler_objects"), true);
+  info.setExtension(info.extensionIndex("GL_ARB_draw_buffers"), false);
+  info.setExtension(info.extensionIndex("GL_ARB_not_an_extension"), true);
+
+  EXPECT_TRUE (info.gl_arb_sampler_objects);
+  EXPECT_FALSE(info.gl_arb_draw_buffers);
+  EXPECT_TRUE (info.getExtension("GL_ARB_sampler_objects"));
+  EXPECT_FALSE(info.getExtension("GL_ARB_not_an_extension"));
+}
+
+}
@@ -2368,4 +2368,26 @@ TEST( RegalToken, GLenumToString )
   }
 #endif
 }
+
+// Preferred names, and values not in the table
+
+TEST( RegalToken, EnumToString )
+{
+  EXPECT_EQ(std::string("GL_ZERO"),          Regal::Token::GLenumToString(GL_ZERO));
+  EXPECT_EQ(std::string("GL_ONE"),           Regal::Token::GLenumToString(GL_ONE));
+  EXPECT_EQ(std::string("GL_TEXTURE_2D"),    Regal::Token::GLenumToString(GL_TEXTURE_2D));
+  EXPECT_EQ(std::string("GL_ACTIVE_TEXTURE"),Regal::Token::GLenumToString(GL_ACTIVE_TEXTURE_ARB));
+  EXPECT_EQ(std::string("GL_WRITE_ONLY"),    Regal::Token::GLenumToString(GL_WRITE_ONLY_ARB));
+
+  EXPECT_EQ(std::string("unknown_gl_enum"),  Regal::Token::GLenumToString(0x7fffffff));
+  EXPECT_EQ(std::string("unknown_gl_enum"),  Regal::Token::GLenumToString(0xdeadbeef));
+
+#if REGAL_SYS_GLX
+  EXPECT_EQ(std::string("GLX_RED_SIZE"),     Regal::Token::GLXenumToString(GLX_RED_SIZE));
+  EXPECT_EQ(std::string("GLX_X_RENDERABLE"), Regal::Token::GLXenumToString(GLX_X_RENDERABLE));
+  EXPECT_EQ(std::string("GLX_DONT_CARE"),    Regal::Token::GLXenumToString(-1));
+  EXPECT_EQ(std::string("unknown_glx_enum"), Regal::Token::GLXenumToString(0x7fffffff));
+#endif
+}
+
 }